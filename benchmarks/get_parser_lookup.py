@@ -0,0 +1,86 @@
+'''Benchmark of the command lookup done by get_parser
+
+Compares the cost per call of matching a search against every command in the
+parser data with the CommandIndex lookup, for a growing number of commands.
+
+    python get_parser_lookup.py [--calls 200] [--fuzzy]
+'''
+
+import re
+import time
+import random
+import argparse
+
+from genie.libs.parser.utils import common
+
+
+def linear_scan(data, tokens, fuzzy):
+    '''commands matching the search when scanning all of them'''
+    return [command for command in data
+            if _matches(tokens, command, fuzzy)]
+
+
+def indexed(index, tokens, fuzzy):
+    '''commands matching the search when using the command index'''
+    return [command for command in index.candidates(tokens, fuzzy)
+            if _matches(tokens, command, fuzzy)]
+
+
+def _matches(tokens, command, fuzzy):
+    return common._matches_fuzzy(0, 0, tokens.copy(), command, {}, fuzzy)
+
+
+def make_search(command):
+    '''abbreviate the keywords of a command and fill in its arguments'''
+    search = []
+    for token in command.split():
+        if '{' in token:
+            search.append(re.sub('{.*?}', 'argument', token))
+        else:
+            search.append(token[:max(len(token) // 2, 1)])
+    return search
+
+
+def timeit(func, source, searches, fuzzy):
+    start = time.perf_counter()
+    for tokens in searches:
+        func(source, tokens, fuzzy)
+    return (time.perf_counter() - start) / len(searches)
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--calls', type=int, default=200,
+                           help='Number of lookups per data size')
+    my_parser.add_argument('--fuzzy', action='store_true',
+                           help='Benchmark fuzzy lookups')
+    args = my_parser.parse_args()
+
+    random.seed(0)
+    commands = [command for command in common._load_parser_json()
+                if command != 'tokens']
+
+    print('{:>10}{:>16}{:>16}{:>10}'.format(
+        'commands', 'linear (us)', 'index (us)', 'speedup'))
+
+    size = 250
+    while True:
+        size = min(size, len(commands))
+        data = random.sample(commands, size)
+        index = common.CommandIndex(data)
+
+        searches = [make_search(command)
+                    for command in random.choices(data, k=args.calls)]
+
+        linear = timeit(linear_scan, data, searches, args.fuzzy)
+        lookup = timeit(indexed, index, searches, args.fuzzy)
+        print('{:>10}{:>16.1f}{:>16.1f}{:>9.1f}x'.format(
+            size, linear * 1e6, lookup * 1e6, linear / lookup))
+
+        if size == len(commands):
+            break
+        size *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+'''Benchmark of the LineDispatcher of the parsers
+
+Matches the lines of the golden outputs of the parsers twice, once by
+trying each pattern of the cascade in order as cli() used to do, and once
+with the dispatcher of the parser.
+
+    python line_dispatch.py [--repeat 20]
+'''
+
+import os
+import glob
+import time
+import argparse
+import importlib
+
+PARSERS = [
+    ('iosxe.show_interface', 'ShowInterfaces', 'ShowInterfaces'),
+    ('iosxe.show_interface', 'ShowPmPortInterface', 'ShowPmPortInterface'),
+    ('iosxe.show_bgp', 'ShowBgpNeighborSuperParser', 'ShowBgpAllNeighbors'),
+    ('iosxe.show_bgp', 'ShowBgpDetailSuperParser', 'ShowBgpAllDetail'),
+    ('junos.show_route', 'ShowRouteProtocolExtensive',
+     'ShowRouteProtocolExtensive'),
+]
+
+
+def golden_lines(module, name):
+    '''stripped lines of the golden outputs of a parser'''
+    pattern = os.path.join(os.path.dirname(module.__file__), 'tests', name,
+                           'cli', 'equal', '*_output.txt')
+    lines = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path) as f:
+            lines.extend(line.strip() for line in f.read().splitlines())
+    return lines
+
+
+def cascade(patterns, lines):
+    for line in lines:
+        for name, regex in patterns:
+            if regex.match(line):
+                break
+
+
+def dispatch(dispatcher, lines):
+    for line in lines:
+        dispatcher.match(line)
+
+
+def timeit(func, source, lines, repeat):
+    func(source, lines)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(source, lines)
+    return (time.perf_counter() - start) / (repeat * len(lines))
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--repeat', type=int, default=20,
+                           help='Number of times the lines are matched')
+    args = my_parser.parse_args()
+
+    print('{:<30}{:>9}{:>8}{:>16}{:>17}{:>10}'.format(
+        'parser', 'patterns', 'lines', 'cascade (ns)', 'dispatcher (ns)',
+        'speedup'))
+
+    for module_name, cls_name, golden in PARSERS:
+        module = importlib.import_module('genie.libs.parser.' + module_name)
+        cls = getattr(module, cls_name)
+        patterns = [(name, cls.patterns.get(name))
+                    for name in cls.dispatcher.names()]
+        lines = golden_lines(module, golden)
+
+        before = timeit(cascade, patterns, lines, args.repeat)
+        after = timeit(dispatch, cls.dispatcher, lines, args.repeat)
+        print('{:<30}{:>9}{:>8}{:>16.0f}{:>17.0f}{:>9.1f}x'.format(
+            cls_name, len(patterns), len(lines), before * 1e9, after * 1e9,
+            before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+'''Peak memory of cli() against parse_iter()
+
+Writes the golden outputs of ShowRouteProtocolExtensive repeated --scale
+times to a temporary file, then parses it once with cli() from the string
+and once with parse_iter() from the file, measuring the peak memory
+allocated by each with tracemalloc.
+
+    python parse_iter_memory.py [--scale 20]
+'''
+
+import os
+import glob
+import time
+import argparse
+import tempfile
+import tracemalloc
+from unittest.mock import Mock
+
+from genie.libs.parser.junos import show_route
+from genie.libs.parser.junos.show_route import ShowRouteProtocolExtensive
+
+
+def golden_output():
+    pattern = os.path.join(os.path.dirname(show_route.__file__), 'tests',
+                           'ShowRouteProtocolExtensive', 'cli', 'equal',
+                           '*_output.txt')
+    outputs = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path) as f:
+            outputs.append(f.read().rstrip('\n'))
+    return '\n'.join(outputs) + '\n'
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    routes = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return routes, elapsed, peak
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--scale', type=int, default=20,
+                           help='Number of times the golden outputs are repeated')
+    args = my_parser.parse_args()
+
+    output = golden_output()
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        for _ in range(args.scale):
+            f.write(output)
+        path = f.name
+
+    def parse_cli():
+        with open(path) as f:
+            parsed = ShowRouteProtocolExtensive(device=Mock()).cli(
+                output=f.read())
+        return sum(len(table.get('rt', []))
+                   for table in parsed['route-information']['route-table'])
+
+    def parse_iter():
+        with open(path) as f:
+            return sum(1 for _ in ShowRouteProtocolExtensive(
+                device=Mock()).parse_iter(f))
+
+    try:
+        print('{:<12}{:>10}{:>12}{:>14}'.format('mode', 'routes', 'time (s)',
+                                               'peak (MB)'))
+        for name, func in [('cli', parse_cli), ('parse_iter', parse_iter)]:
+            routes, elapsed, peak = measure(func)
+            print('{:<12}{:>10}{:>12.2f}{:>14.1f}'.format(name, routes, elapsed,
+                                                         peak / 2 ** 20))
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
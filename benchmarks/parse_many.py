@@ -0,0 +1,74 @@
+'''Benchmark of parse_many() against a parser created for each output
+
+Parses the golden outputs of ShowInterfaces repeated --scale times, once
+creating a parser for each output, once with parse_many() in this process
+and once with parse_many() over --processes worker processes.
+
+    python parse_many.py [--scale 20] [--processes 4]
+'''
+
+import os
+import glob
+import time
+import argparse
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.batch import parse_many
+from genie.libs.parser.iosxe import show_interface
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+
+def golden_outputs():
+    pattern = os.path.join(os.path.dirname(show_interface.__file__), 'tests',
+                           'ShowInterfaces', 'cli', 'equal', '*_output.txt')
+    outputs = []
+    for path in sorted(glob.glob(pattern)):
+        # outputs parsed with arguments are skipped
+        if os.path.exists(path.replace('_output.txt', '_arguments.json')):
+            continue
+        with open(path) as f:
+            outputs.append(f.read())
+    return outputs
+
+
+def per_call(outputs, processes):
+    device = Mock()
+    return [ShowInterfaces(device=device).parse(output=output)
+            for output in outputs]
+
+
+def batch(outputs, processes):
+    return parse_many(ShowInterfaces, outputs, processes=processes)
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--scale', type=int, default=20,
+                           help='Number of times the golden outputs are repeated')
+    my_parser.add_argument('--processes', type=int, default=os.cpu_count(),
+                           help='Number of worker processes')
+    args = my_parser.parse_args()
+
+    outputs = golden_outputs() * args.scale
+    size = sum(len(output) for output in outputs)
+    print('{} outputs, {:.1f} MB'.format(len(outputs), size / 2 ** 20))
+    print('{:<24}{:>10}{:>16}'.format('mode', 'time (s)', 'outputs/sec'))
+
+    expected = None
+    for name, func, processes in [
+            ('parser per output', per_call, None),
+            ('parse_many', batch, None),
+            ('parse_many {} procs'.format(args.processes), batch,
+             args.processes)]:
+        start = time.perf_counter()
+        results = func(outputs, processes)
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected = results
+        assert results == expected, name
+        print('{:<24}{:>10.2f}{:>16.0f}'.format(name, elapsed,
+                                               len(outputs) / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+'''Benchmark of full against lazy loading of the parser data
+
+Each mode runs in its own process, which loads the parser data and looks up
+a few commands for a single OS, then reports the startup time and peak RSS.
+
+    python parser_data_memory.py [--os nxos]
+
+Build the parser index first, lazy loading only decodes the section of the
+OS with it, without it all of parsers.json is decoded for each OS:
+
+    python -m genie.libs.parser.utils.parser_index
+'''
+
+import sys
+import time
+import resource
+import argparse
+import subprocess
+
+COMMANDS = ['show version', 'show interface', 'show ip route',
+            'show bgp all summary']
+
+
+def child(lazy, operating_system):
+    from pyats.topology import Device
+    from genie.libs.parser.utils import common
+
+    device = Device('R1', os=operating_system)
+
+    start = time.perf_counter()
+    common._load_parser_json(lazy=lazy)
+    for command in COMMANDS:
+        try:
+            common.get_parser(command, device)
+        except common.ParserNotFound:
+            pass
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on linux
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print('{:<10}{:>14.1f}{:>16.1f}'.format(
+        'lazy' if lazy else 'full', elapsed * 1e3, rss))
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--os', type=str, default='nxos',
+                           help='OS of the device used for the lookups')
+    my_parser.add_argument('--child', choices=['full', 'lazy'],
+                           help=argparse.SUPPRESS)
+    args = my_parser.parse_args()
+
+    if args.child:
+        child(args.child == 'lazy', args.os)
+        return
+
+    print('{:<10}{:>14}{:>16}'.format('mode', 'startup (ms)', 'peak RSS (MB)'))
+    for mode in ('full', 'lazy'):
+        subprocess.run([sys.executable, __file__, '--os', args.os,
+                        '--child', mode], check=True)
+
+
+if __name__ == '__main__':
+    main()
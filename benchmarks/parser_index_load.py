@@ -0,0 +1,51 @@
+'''Benchmark of loading parsers.json against its binary index
+
+Build the index first with:
+
+    python -m genie.libs.parser.utils.parser_index
+    python parser_index_load.py [--repeat 10]
+'''
+
+import os
+import json
+import time
+import argparse
+import importlib
+
+from genie.abstract.package import DEFAULT_ABSTRACT_ORDER
+
+from genie.libs.parser.utils.parser_index import load_parser_index,\
+                                                 PARSER_MODULE_NAME
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('--repeat', type=int, default=10,
+                           help='Number of loads to average')
+    args = my_parser.parse_args()
+
+    mod = importlib.import_module(PARSER_MODULE_NAME)
+    token_order = getattr(getattr(mod, '__abstract_pkg'), 'order',
+                          DEFAULT_ABSTRACT_ORDER)
+    json_path = os.path.join(mod.__path__[0], 'parsers.json')
+
+    if load_parser_index(json_path, token_order) is None:
+        raise SystemExit('Parser index is missing or stale, build it first')
+
+    def load_json():
+        with open(json_path) as f:
+            return json.load(f)
+
+    def load_index():
+        return load_parser_index(json_path, token_order)
+
+    for name, func in (('parsers.json', load_json), ('index', load_index)):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            func()
+        elapsed = (time.perf_counter() - start) / args.repeat
+        print('{:<20}{:>10.1f} ms'.format(name, elapsed * 1e3))
+
+
+if __name__ == '__main__':
+    main()
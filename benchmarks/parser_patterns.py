@@ -0,0 +1,127 @@
+'''Benchmark of the class level regex tables of the parsers
+
+Parses the golden outputs of a few parsers and compares the time per parse
+when the patterns are compiled on every call, as cli() used to do, with the
+Patterns table of the class which compiles them once.
+
+    before (cache)   every pattern compiled on each call, the re module
+                     cache holds them all
+    before (purged)  every pattern compiled on each call, the re module
+                     cache is full of other patterns, as when many parser
+                     modules are used in the same process
+    after            Patterns table of the class
+
+    python parser_patterns.py [--repeat 20] [iosxe.show_interface.ShowInterfaces ...]
+'''
+
+import os
+import re
+import glob
+import json
+import time
+import argparse
+import importlib
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.patterns import Patterns
+
+PARSERS = [
+    'iosxe.show_interface.ShowInterfaces',
+    'iosxe.show_interface.ShowIpInterface',
+    'iosxe.show_bgp.ShowBgpAllNeighbors',
+    'iosxe.show_ospf.ShowIpOspf',
+    'iosxe.show_platform.ShowVersion',
+    'nxos.show_bgp.ShowBgpProcessVrfAll',
+    'iosxr.show_bgp.ShowBgpInstanceNeighborsDetail',
+]
+
+
+def load_parser(name):
+    module, cls = name.rsplit('.', 1)
+    module = importlib.import_module('genie.libs.parser.' + module)
+    return getattr(module, cls), os.path.dirname(module.__file__)
+
+
+def golden_outputs(cls, folder):
+    '''(output, arguments) of the golden tests of a parser'''
+    outputs = []
+    pattern = os.path.join(folder, 'tests', cls.__name__, 'cli', 'equal',
+                           '*_output.txt')
+    for path in sorted(glob.glob(pattern)):
+        with open(path) as f:
+            output = f.read()
+        arguments = {}
+        arguments_file = path.replace('_output.txt', '_arguments.json')
+        if os.path.exists(arguments_file):
+            with open(arguments_file) as f:
+                arguments = json.load(f)
+        outputs.append((output, arguments))
+    return outputs
+
+
+def class_patterns(cls):
+    '''Patterns tables used by a parser, including its super parsers'''
+    return [klass.__dict__['patterns'] for klass in cls.__mro__
+            if isinstance(klass.__dict__.get('patterns'), Patterns)]
+
+
+def parse_all(cls, outputs, before=None):
+    for output, arguments in outputs:
+        if before:
+            before()
+        device = Mock(**{'execute.return_value': output})
+        try:
+            cls(device=device).parse(**arguments)
+        except Exception:
+            pass
+
+
+def timeit(cls, outputs, repeat, before=None):
+    parse_all(cls, outputs, before)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        parse_all(cls, outputs, before)
+    return (time.perf_counter() - start) / (repeat * len(outputs))
+
+
+def main():
+    my_parser = argparse.ArgumentParser(description=__doc__)
+    my_parser.add_argument('parsers', nargs='*', default=PARSERS,
+                           help='Parsers to benchmark, as os.module.Class')
+    my_parser.add_argument('--repeat', type=int, default=20,
+                           help='Number of times the golden outputs are '
+                                'parsed')
+    args = my_parser.parse_args()
+
+    print('{:<50}{:>9}{:>16}{:>16}{:>12}{:>10}'.format(
+        'parser', 'patterns', 'before (cache)', 'before (purged)',
+        'after', 'speedup'))
+
+    for name in args.parsers:
+        cls, folder = load_parser(name)
+        outputs = golden_outputs(cls, folder)
+        tables = class_patterns(cls)
+        if not outputs or not tables:
+            print(f'{name:<50} skipped, no golden outputs or patterns')
+            continue
+
+        def recompile():
+            for table in tables:
+                table.clear()
+                table.compile_all()
+
+        def recompile_purged():
+            re.purge()
+            recompile()
+
+        cached = timeit(cls, outputs, args.repeat, recompile)
+        purged = timeit(cls, outputs, args.repeat, recompile_purged)
+        after = timeit(cls, outputs, args.repeat)
+
+        print('{:<50}{:>9}{:>13.1f} us{:>13.1f} us{:>9.1f} us{:>9.1f}x'.format(
+            name, sum(len(table) for table in tables), cached * 1e6,
+            purged * 1e6, after * 1e6, purged / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -107,11 +107,14 @@ setup(
 
     # additional package data files that goes into the package itself
     package_data = {
-            '': ['*.json'],
+            '': ['*.json', '*.idx'],
     },
 
     # console entry point
     entry_points = {
+        'console_scripts': [
+            'genieparser-bulk = genie.libs.parser.utils.bulk:main',
+        ],
     },
 
     # package dependencies
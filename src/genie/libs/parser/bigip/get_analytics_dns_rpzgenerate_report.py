@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/analytics/dns-rpz/generate-report' resources
-# =============================================
-
-
-class AnalyticsDnsrpzGeneratereportSchema(MetaParser):
-
-    schema = {}
-
-
-class AnalyticsDnsrpzGeneratereport(AnalyticsDnsrpzGeneratereportSchema):
-    """ To F5 resource for /mgmt/tm/analytics/dns-rpz/generate-report
-    """
-
-    cli_command = "/mgmt/tm/analytics/dns-rpz/generate-report"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
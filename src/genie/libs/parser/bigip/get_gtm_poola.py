@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/gtm/pool/a' resources
-# =============================================
-
-
-class GtmPoolASchema(MetaParser):
-
-    schema = {}
-
-
-class GtmPoolA(GtmPoolASchema):
-    """ To F5 resource for /mgmt/tm/gtm/pool/a
-    """
-
-    cli_command = "/mgmt/tm/gtm/pool/a"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
@@ -1,33 +0,0 @@
-# Global Imports
-import json
-from collections import defaultdict
-
-# Metaparser
-from genie.metaparser import MetaParser
-
-# =============================================
-# Collection for '/mgmt/tm/ltm/persistence/hash' resources
-# =============================================
-
-
-class LtmPersistenceHashSchema(MetaParser):
-
-    schema = {}
-
-
-class LtmPersistenceHash(LtmPersistenceHashSchema):
-    """ To F5 resource for /mgmt/tm/ltm/persistence/hash
-    """
-
-    cli_command = "/mgmt/tm/ltm/persistence/hash"
-
-    def rest(self):
-
-        response = self.device.get(self.cli_command)
-
-        response_json = response.json()
-
-        if not response_json:
-            return {}
-
-        return response_json
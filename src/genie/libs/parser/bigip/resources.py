@@ -0,0 +1,4481 @@
+'''F5 BIG-IP iControl REST resources
+
+The parser of each resource executes a GET of its path and returns the json
+of the resource as is, {} when it is empty. The resources only differ by
+the name of their class and their path, they are defined in this module
+instead of one module each:
+
+    from genie.libs.parser.bigip.resources import NetWccp
+
+    NetWccp(device=device).parse()
+
+They are found through get_parser() with their path, as '/mgmt/tm/net/wccp',
+once the json files are built with `make json`.
+'''
+
+# Metaparser
+from genie.metaparser import MetaParser
+
+
+class RestResourceSchema(MetaParser):
+    '''Schema for the F5 iControl REST resources'''
+
+    schema = {}
+
+
+class RestResource(RestResourceSchema):
+    '''RestResource
+
+    Parser of an F5 iControl REST resource, cli_command is the path of the
+    resource
+    '''
+
+    def rest(self):
+
+        response = self.device.get(self.cli_command)
+
+        response_json = response.json()
+
+        if not response_json:
+            return {}
+
+        return response_json
+
+
+class AccessAclstats(RestResource):
+    '''To F5 resource for /mgmt/tm/access/acl-stats'''
+
+    cli_command = '/mgmt/tm/access/acl-stats'
+
+
+class AccessBundleinstalltasks(RestResource):
+    '''To F5 resource for /mgmt/tm/access/bundle-install-tasks'''
+
+    cli_command = '/mgmt/tm/access/bundle-install-tasks'
+
+
+class AccessProfileaccessmiscstats(RestResource):
+    '''To F5 resource for /mgmt/tm/access/profile-access-misc-stats'''
+
+    cli_command = '/mgmt/tm/access/profile-access-misc-stats'
+
+
+class AccessProfilerewritestats(RestResource):
+    '''To F5 resource for /mgmt/tm/access/profile-rewrite-stats'''
+
+    cli_command = '/mgmt/tm/access/profile-rewrite-stats'
+
+
+class AccessProfilerewriteStats(RestResource):
+    '''To F5 resource for /mgmt/tm/access/profile-rewrite/stats'''
+
+    cli_command = '/mgmt/tm/access/profile-rewrite/stats'
+
+
+class AccessRedeployiapptasks(RestResource):
+    '''To F5 resource for /mgmt/tm/access/redeploy-iapp-tasks'''
+
+    cli_command = '/mgmt/tm/access/redeploy-iapp-tasks'
+
+
+class AccessSessionKillsessions(RestResource):
+    '''To F5 resource for /mgmt/tm/access/session/kill-sessions'''
+
+    cli_command = '/mgmt/tm/access/session/kill-sessions'
+
+
+class AccessUsecasepackinfo(RestResource):
+    '''To F5 resource for /mgmt/tm/access/usecase-pack-info'''
+
+    cli_command = '/mgmt/tm/access/usecase-pack-info'
+
+
+class AdcFileobjectSslcert(RestResource):
+    '''To F5 resource for /mgmt/tm/adc/fileobject/ssl-cert'''
+
+    cli_command = '/mgmt/tm/adc/fileobject/ssl-cert'
+
+
+class AdcFileobjectSslcrl(RestResource):
+    '''To F5 resource for /mgmt/tm/adc/fileobject/ssl-crl'''
+
+    cli_command = '/mgmt/tm/adc/fileobject/ssl-crl'
+
+
+class AdcFileobjectSslcsr(RestResource):
+    '''To F5 resource for /mgmt/tm/adc/fileobject/ssl-csr'''
+
+    cli_command = '/mgmt/tm/adc/fileobject/ssl-csr'
+
+
+class AdcFileobjectSslkey(RestResource):
+    '''To F5 resource for /mgmt/tm/adc/fileobject/ssl-key'''
+
+    cli_command = '/mgmt/tm/adc/fileobject/ssl-key'
+
+
+class AnalyticsAfmsweeperGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/afm-sweeper/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/afm-sweeper/generate-report'
+
+
+class AnalyticsAfmsweeperReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/afm-sweeper/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/afm-sweeper/report-results'
+
+
+class AnalyticsApplicationsecurityanomaliesGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/application-security-anomalies/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/application-security-anomalies/generate-report'
+
+
+class AnalyticsApplicationsecurityanomaliesReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/application-security-anomalies/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/application-security-anomalies/report-results'
+
+
+class AnalyticsApplicationsecurityincidentsGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/application-security-incidents/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/application-security-incidents/generate-report'
+
+
+class AnalyticsApplicationsecurityincidentsReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/application-security-incidents/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/application-security-incidents/report-results'
+
+
+class AnalyticsApplicationsecuritynetworkGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/application-security-network/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/application-security-network/generate-report'
+
+
+class AnalyticsApplicationsecuritynetworkReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/application-security-network/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/application-security-network/report-results'
+
+
+class AnalyticsApplicationsecurityGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/application-security/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/application-security/generate-report'
+
+
+class AnalyticsApplicationsecurityReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/application-security/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/application-security/report-results'
+
+
+class AnalyticsAsmbypassGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-bypass/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/asm-bypass/generate-report'
+
+
+class AnalyticsAsmbypassReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-bypass/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/asm-bypass/report-results'
+
+
+class AnalyticsAsmcpuGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-cpu/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/asm-cpu/generate-report'
+
+
+class AnalyticsAsmcpuReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-cpu/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/asm-cpu/report-results'
+
+
+class AnalyticsAsmenforcedentitiesGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-enforced-entities/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/asm-enforced-entities/generate-report'
+
+
+class AnalyticsAsmenforcedentitiesReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-enforced-entities/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/asm-enforced-entities/report-results'
+
+
+class AnalyticsAsmlearningsuggestionsGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-learning-suggestions/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/asm-learning-suggestions/generate-report'
+
+
+class AnalyticsAsmlearningsuggestionsReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-learning-suggestions/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/asm-learning-suggestions/report-results'
+
+
+class AnalyticsAsmmemoryGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-memory/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/asm-memory/generate-report'
+
+
+class AnalyticsAsmmemoryReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-memory/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/asm-memory/report-results'
+
+
+class AnalyticsAsmpolicychangesGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-policy-changes/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/asm-policy-changes/generate-report'
+
+
+class AnalyticsAsmpolicychangesReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/asm-policy-changes/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/asm-policy-changes/report-results'
+
+
+class AnalyticsBotdefenseeventGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/bot-defense-event/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/bot-defense-event/generate-report'
+
+
+class AnalyticsBotdefenseeventReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/bot-defense-event/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/bot-defense-event/report-results'
+
+
+class AnalyticsCpupervipGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/cpu-per-vip/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/cpu-per-vip/generate-report'
+
+
+class AnalyticsCpupervipReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/cpu-per-vip/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/cpu-per-vip/report-results'
+
+
+class AnalyticsCpuGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/cpu/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/cpu/generate-report'
+
+
+class AnalyticsCpuReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/cpu/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/cpu/report-results'
+
+
+class AnalyticsDiskinfoGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/disk-info/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/disk-info/generate-report'
+
+
+class AnalyticsDiskinfoReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/disk-info/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/disk-info/report-results'
+
+
+class AnalyticsDnsrpzGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dns-rpz/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/dns-rpz/generate-report'
+
+
+class AnalyticsDnsrpzReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dns-rpz/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/dns-rpz/report-results'
+
+
+class AnalyticsDnsGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dns/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/dns/generate-report'
+
+
+class AnalyticsDnsReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dns/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/dns/report-results'
+
+
+class AnalyticsDosl3Generatereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dos-l3/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/dos-l3/generate-report'
+
+
+class AnalyticsDosl3Reportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dos-l3/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/dos-l3/report-results'
+
+
+class AnalyticsDosvisattacksGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dos-vis-attacks/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/dos-vis-attacks/generate-report'
+
+
+class AnalyticsDosvisattacksReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dos-vis-attacks/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/dos-vis-attacks/report-results'
+
+
+class AnalyticsDosviscommonGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dos-vis-common/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/dos-vis-common/generate-report'
+
+
+class AnalyticsDosviscommonReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dos-vis-common/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/dos-vis-common/report-results'
+
+
+class AnalyticsDosvisvipsGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dos-vis-vips/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/dos-vis-vips/generate-report'
+
+
+class AnalyticsDosvisvipsReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/dos-vis-vips/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/dos-vis-vips/report-results'
+
+
+class AnalyticsFwnatGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/fw-nat/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/fw-nat/generate-report'
+
+
+class AnalyticsFwnatReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/fw-nat/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/fw-nat/report-results'
+
+
+class AnalyticsGenericGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/generic/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/generic/generate-report'
+
+
+class AnalyticsGenericReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/generic/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/generic/report-results'
+
+
+class AnalyticsHttpGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/http/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/http/generate-report'
+
+
+class AnalyticsHttpReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/http/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/http/report-results'
+
+
+class AnalyticsIpintelligenceGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/ip-intelligence/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/ip-intelligence/generate-report'
+
+
+class AnalyticsIpintelligenceReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/ip-intelligence/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/ip-intelligence/report-results'
+
+
+class AnalyticsIplayerGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/ip-layer/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/ip-layer/generate-report'
+
+
+class AnalyticsIplayerReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/ip-layer/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/ip-layer/report-results'
+
+
+class AnalyticsLsnpoolGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/lsn-pool/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/lsn-pool/generate-report'
+
+
+class AnalyticsLsnpoolReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/lsn-pool/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/lsn-pool/report-results'
+
+
+class AnalyticsMemoryperprocessGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/memory-per-process/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/memory-per-process/generate-report'
+
+
+class AnalyticsMemoryperprocessReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/memory-per-process/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/memory-per-process/report-results'
+
+
+class AnalyticsMemoryGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/memory/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/memory/generate-report'
+
+
+class AnalyticsMemoryReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/memory/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/memory/report-results'
+
+
+class AnalyticsNetworkGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/network/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/network/generate-report'
+
+
+class AnalyticsNetworkReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/network/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/network/report-results'
+
+
+class AnalyticsPemGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/pem/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/pem/generate-report'
+
+
+class AnalyticsPemReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/pem/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/pem/report-results'
+
+
+class AnalyticsProccpuGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/proc-cpu/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/proc-cpu/generate-report'
+
+
+class AnalyticsProccpuReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/proc-cpu/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/proc-cpu/report-results'
+
+
+class AnalyticsProtocolinspectionGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/protocol-inspection/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/protocol-inspection/generate-report'
+
+
+class AnalyticsProtocolinspectionReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/protocol-inspection/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/protocol-inspection/report-results'
+
+
+class AnalyticsProtocolsecurityhttpGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/protocol-security-http/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/protocol-security-http/generate-report'
+
+
+class AnalyticsProtocolsecurityhttpReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/protocol-security-http/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/protocol-security-http/report-results'
+
+
+class AnalyticsProtocolsecurityGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/protocol-security/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/protocol-security/generate-report'
+
+
+class AnalyticsProtocolsecurityReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/protocol-security/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/protocol-security/report-results'
+
+
+class AnalyticsSipGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/sip/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/sip/generate-report'
+
+
+class AnalyticsSipReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/sip/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/sip/report-results'
+
+
+class AnalyticsSslorchestratorservicevirtualGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/ssl-orchestrator-service-virtual/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/ssl-orchestrator-service-virtual/generate-report'
+
+
+class AnalyticsSslorchestratorservicevirtualReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/ssl-orchestrator-service-virtual/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/ssl-orchestrator-service-virtual/report-results'
+
+
+class AnalyticsSslorchestratorGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/ssl-orchestrator/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/ssl-orchestrator/generate-report'
+
+
+class AnalyticsSslorchestratorReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/ssl-orchestrator/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/ssl-orchestrator/report-results'
+
+
+class AnalyticsSwgblockedGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/swg-blocked/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/swg-blocked/generate-report'
+
+
+class AnalyticsSwgblockedReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/swg-blocked/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/swg-blocked/report-results'
+
+
+class AnalyticsSwgGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/swg/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/swg/generate-report'
+
+
+class AnalyticsSwgReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/swg/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/swg/report-results'
+
+
+class AnalyticsSystemmonitorGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/system-monitor/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/system-monitor/generate-report'
+
+
+class AnalyticsSystemmonitorReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/system-monitor/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/system-monitor/report-results'
+
+
+class AnalyticsTcpanalyticsGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/tcp-analytics/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/tcp-analytics/generate-report'
+
+
+class AnalyticsTcpanalyticsReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/tcp-analytics/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/tcp-analytics/report-results'
+
+
+class AnalyticsTcpGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/tcp/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/tcp/generate-report'
+
+
+class AnalyticsTcpReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/tcp/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/tcp/report-results'
+
+
+class AnalyticsTrafficclassificationGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/traffic-classification/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/traffic-classification/generate-report'
+
+
+class AnalyticsTrafficclassificationReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/traffic-classification/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/traffic-classification/report-results'
+
+
+class AnalyticsUdpGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/udp/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/udp/generate-report'
+
+
+class AnalyticsUdpReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/udp/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/udp/report-results'
+
+
+class AnalyticsVcmpGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/vcmp/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/vcmp/generate-report'
+
+
+class AnalyticsVcmpReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/vcmp/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/vcmp/report-results'
+
+
+class AnalyticsVirtualGeneratereport(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/virtual/generate-report'''
+
+    cli_command = '/mgmt/tm/analytics/virtual/generate-report'
+
+
+class AnalyticsVirtualReportresults(RestResource):
+    '''To F5 resource for /mgmt/tm/analytics/virtual/report-results'''
+
+    cli_command = '/mgmt/tm/analytics/virtual/report-results'
+
+
+class AuthCertldap(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/cert-ldap'''
+
+    cli_command = '/mgmt/tm/auth/cert-ldap'
+
+
+class AuthLdap(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/ldap'''
+
+    cli_command = '/mgmt/tm/auth/ldap'
+
+
+class AuthLoginfailures(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/login-failures'''
+
+    cli_command = '/mgmt/tm/auth/login-failures'
+
+
+class AuthPartition(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/partition'''
+
+    cli_command = '/mgmt/tm/auth/partition'
+
+
+class AuthPasswordpolicy(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/password-policy'''
+
+    cli_command = '/mgmt/tm/auth/password-policy'
+
+
+class AuthRadius(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/radius'''
+
+    cli_command = '/mgmt/tm/auth/radius'
+
+
+class AuthRadiusserver(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/radius-server'''
+
+    cli_command = '/mgmt/tm/auth/radius-server'
+
+
+class AuthRemoterole(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/remote-role'''
+
+    cli_command = '/mgmt/tm/auth/remote-role'
+
+
+class AuthRemoteuser(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/remote-user'''
+
+    cli_command = '/mgmt/tm/auth/remote-user'
+
+
+class AuthSource(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/source'''
+
+    cli_command = '/mgmt/tm/auth/source'
+
+
+class AuthTacacs(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/tacacs'''
+
+    cli_command = '/mgmt/tm/auth/tacacs'
+
+
+class AuthUser(RestResource):
+    '''To F5 resource for /mgmt/tm/auth/user'''
+
+    cli_command = '/mgmt/tm/auth/user'
+
+
+class CliAlias(RestResource):
+    '''To F5 resource for /mgmt/tm/cli/alias'''
+
+    cli_command = '/mgmt/tm/cli/alias'
+
+
+class CliAliasPrivate(RestResource):
+    '''To F5 resource for /mgmt/tm/cli/alias/private'''
+
+    cli_command = '/mgmt/tm/cli/alias/private'
+
+
+class CliAliasShared(RestResource):
+    '''To F5 resource for /mgmt/tm/cli/alias/shared'''
+
+    cli_command = '/mgmt/tm/cli/alias/shared'
+
+
+class CliGlobalsettings(RestResource):
+    '''To F5 resource for /mgmt/tm/cli/global-settings'''
+
+    cli_command = '/mgmt/tm/cli/global-settings'
+
+
+class CliHistory(RestResource):
+    '''To F5 resource for /mgmt/tm/cli/history'''
+
+    cli_command = '/mgmt/tm/cli/history'
+
+
+class CliPreference(RestResource):
+    '''To F5 resource for /mgmt/tm/cli/preference'''
+
+    cli_command = '/mgmt/tm/cli/preference'
+
+
+class CliScript(RestResource):
+    '''To F5 resource for /mgmt/tm/cli/script'''
+
+    cli_command = '/mgmt/tm/cli/script'
+
+
+class CliVersion(RestResource):
+    '''To F5 resource for /mgmt/tm/cli/version'''
+
+    cli_command = '/mgmt/tm/cli/version'
+
+
+class CloudCmDevicegroup(RestResource):
+    '''To F5 resource for /mgmt/tm/cloud/cm/device-group'''
+
+    cli_command = '/mgmt/tm/cloud/cm/device-group'
+
+
+class CloudLtmNodeaddresses(RestResource):
+    '''To F5 resource for /mgmt/tm/cloud/ltm/node-addresses'''
+
+    cli_command = '/mgmt/tm/cloud/ltm/node-addresses'
+
+
+class CloudLtmPoolmembers(RestResource):
+    '''To F5 resource for /mgmt/tm/cloud/ltm/pool-members'''
+
+    cli_command = '/mgmt/tm/cloud/ltm/pool-members'
+
+
+class CloudLtmPools(RestResource):
+    '''To F5 resource for /mgmt/tm/cloud/ltm/pools'''
+
+    cli_command = '/mgmt/tm/cloud/ltm/pools'
+
+
+class CloudLtmVirtualservers(RestResource):
+    '''To F5 resource for /mgmt/tm/cloud/ltm/virtual-servers'''
+
+    cli_command = '/mgmt/tm/cloud/ltm/virtual-servers'
+
+
+class CloudServicesIapp(RestResource):
+    '''To F5 resource for /mgmt/tm/cloud/services/iapp'''
+
+    cli_command = '/mgmt/tm/cloud/services/iapp'
+
+
+class CloudTemplatesIapp(RestResource):
+    '''To F5 resource for /mgmt/tm/cloud/templates/iapp'''
+
+    cli_command = '/mgmt/tm/cloud/templates/iapp'
+
+
+class CmCert(RestResource):
+    '''To F5 resource for /mgmt/tm/cm/cert'''
+
+    cli_command = '/mgmt/tm/cm/cert'
+
+
+class CmDevice(RestResource):
+    '''To F5 resource for /mgmt/tm/cm/device'''
+
+    cli_command = '/mgmt/tm/cm/device'
+
+
+class CmDevicegroup(RestResource):
+    '''To F5 resource for /mgmt/tm/cm/device-group'''
+
+    cli_command = '/mgmt/tm/cm/device-group'
+
+
+class CmFailoverstatus(RestResource):
+    '''To F5 resource for /mgmt/tm/cm/failover-status'''
+
+    cli_command = '/mgmt/tm/cm/failover-status'
+
+
+class CmKey(RestResource):
+    '''To F5 resource for /mgmt/tm/cm/key'''
+
+    cli_command = '/mgmt/tm/cm/key'
+
+
+class CmSha1fingerprint(RestResource):
+    '''To F5 resource for /mgmt/tm/cm/sha1-fingerprint'''
+
+    cli_command = '/mgmt/tm/cm/sha1-fingerprint'
+
+
+class CmSyncstatus(RestResource):
+    '''To F5 resource for /mgmt/tm/cm/sync-status'''
+
+    cli_command = '/mgmt/tm/cm/sync-status'
+
+
+class CmTrafficgroup(RestResource):
+    '''To F5 resource for /mgmt/tm/cm/traffic-group'''
+
+    cli_command = '/mgmt/tm/cm/traffic-group'
+
+
+class CmTrustdomain(RestResource):
+    '''To F5 resource for /mgmt/tm/cm/trust-domain'''
+
+    cli_command = '/mgmt/tm/cm/trust-domain'
+
+
+class FileApmKerberoskeytabfile(RestResource):
+    '''To F5 resource for /mgmt/tm/file/apm/aaa/kerberos-keytab-file'''
+
+    cli_command = '/mgmt/tm/file/apm/aaa/kerberos-keytab-file'
+
+
+class FileApmPingaccesspropertiesfiles(RestResource):
+    '''To F5 resource for /mgmt/tm/file/apm/aaa/ping-access-properties-files'''
+
+    cli_command = '/mgmt/tm/file/apm/aaa/ping-access-properties-files'
+
+
+class FileApmSecuridconfigfiles(RestResource):
+    '''To F5 resource for /mgmt/tm/file/apm/aaa/securid-config-files'''
+
+    cli_command = '/mgmt/tm/file/apm/aaa/securid-config-files'
+
+
+class FileApmEpsecfileobject(RestResource):
+    '''To F5 resource for /mgmt/tm/file/apm/epsec/epsec-file-object'''
+
+    cli_command = '/mgmt/tm/file/apm/epsec/epsec-file-object'
+
+
+class FileApmCustomizationgroup(RestResource):
+    '''To F5 resource for /mgmt/tm/file/apm/policy/customization-group'''
+
+    cli_command = '/mgmt/tm/file/apm/policy/customization-group'
+
+
+class FileApmCustomizationimagefile(RestResource):
+    '''To F5 resource for /mgmt/tm/file/apm/policy/customization-image-file'''
+
+    cli_command = '/mgmt/tm/file/apm/policy/customization-image-file'
+
+
+class FileApmCustomizationtemplatefile(RestResource):
+    '''To F5 resource for /mgmt/tm/file/apm/policy/customization-template-file'''
+
+    cli_command = '/mgmt/tm/file/apm/policy/customization-template-file'
+
+
+class FileApmSandboxfile(RestResource):
+    '''To F5 resource for /mgmt/tm/file/apm/resource/sandbox-file'''
+
+    cli_command = '/mgmt/tm/file/apm/resource/sandbox-file'
+
+
+class GtmDatacenter(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/datacenter'''
+
+    cli_command = '/mgmt/tm/gtm/datacenter'
+
+
+class GtmDistributedapp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/distributed-app'''
+
+    cli_command = '/mgmt/tm/gtm/distributed-app'
+
+
+class GtmGlobalsettings(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/global-settings'''
+
+    cli_command = '/mgmt/tm/gtm/global-settings'
+
+
+class GtmGlobalsettingsGeneral(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/global-settings/general'''
+
+    cli_command = '/mgmt/tm/gtm/global-settings/general'
+
+
+class GtmGlobalsettingsLoadbalancing(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/global-settings/load-balancing'''
+
+    cli_command = '/mgmt/tm/gtm/global-settings/load-balancing'
+
+
+class GtmGlobalsettingsMetrics(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/global-settings/metrics'''
+
+    cli_command = '/mgmt/tm/gtm/global-settings/metrics'
+
+
+class GtmGlobalsettingsMetricsexclusions(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/global-settings/metrics-exclusions'''
+
+    cli_command = '/mgmt/tm/gtm/global-settings/metrics-exclusions'
+
+
+class GtmIquery(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/iquery'''
+
+    cli_command = '/mgmt/tm/gtm/iquery'
+
+
+class GtmLdns(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/ldns'''
+
+    cli_command = '/mgmt/tm/gtm/ldns'
+
+
+class GtmLink(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/link'''
+
+    cli_command = '/mgmt/tm/gtm/link'
+
+
+class GtmListener(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/listener'''
+
+    cli_command = '/mgmt/tm/gtm/listener'
+
+
+class GtmMonitor(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor'''
+
+    cli_command = '/mgmt/tm/gtm/monitor'
+
+
+class GtmMonitorBigip(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/bigip'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/bigip'
+
+
+class GtmMonitorBigiplink(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/bigip-link'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/bigip-link'
+
+
+class GtmMonitorExternal(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/external'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/external'
+
+
+class GtmMonitorFirepass(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/firepass'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/firepass'
+
+
+class GtmMonitorFtp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/ftp'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/ftp'
+
+
+class GtmMonitorGatewayicmp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/gateway-icmp'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/gateway-icmp'
+
+
+class GtmMonitorGtp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/gtp'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/gtp'
+
+
+class GtmMonitorHttp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/http'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/http'
+
+
+class GtmMonitorHttps(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/https'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/https'
+
+
+class GtmMonitorImap(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/imap'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/imap'
+
+
+class GtmMonitorLdap(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/ldap'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/ldap'
+
+
+class GtmMonitorMssql(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/mssql'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/mssql'
+
+
+class GtmMonitorMysql(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/mysql'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/mysql'
+
+
+class GtmMonitorNntp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/nntp'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/nntp'
+
+
+class GtmMonitorNone(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/none'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/none'
+
+
+class GtmMonitorOracle(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/oracle'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/oracle'
+
+
+class GtmMonitorPop3(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/pop3'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/pop3'
+
+
+class GtmMonitorPostgresql(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/postgresql'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/postgresql'
+
+
+class GtmMonitorRadius(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/radius'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/radius'
+
+
+class GtmMonitorRadiusaccounting(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/radius-accounting'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/radius-accounting'
+
+
+class GtmMonitorRealserver(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/real-server'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/real-server'
+
+
+class GtmMonitorScripted(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/scripted'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/scripted'
+
+
+class GtmMonitorSip(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/sip'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/sip'
+
+
+class GtmMonitorSmtp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/smtp'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/smtp'
+
+
+class GtmMonitorSnmp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/snmp'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/snmp'
+
+
+class GtmMonitorSnmplink(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/snmp-link'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/snmp-link'
+
+
+class GtmMonitorSoap(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/soap'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/soap'
+
+
+class GtmMonitorTcp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/tcp'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/tcp'
+
+
+class GtmMonitorTcphalfopen(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/tcp-half-open'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/tcp-half-open'
+
+
+class GtmMonitorUdp(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/udp'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/udp'
+
+
+class GtmMonitorWap(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/wap'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/wap'
+
+
+class GtmMonitorWmi(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/monitor/wmi'''
+
+    cli_command = '/mgmt/tm/gtm/monitor/wmi'
+
+
+class GtmPath(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/path'''
+
+    cli_command = '/mgmt/tm/gtm/path'
+
+
+class GtmPersist(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/persist'''
+
+    cli_command = '/mgmt/tm/gtm/persist'
+
+
+class GtmPool(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/pool'''
+
+    cli_command = '/mgmt/tm/gtm/pool'
+
+
+class GtmPoolA(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/pool/a'''
+
+    cli_command = '/mgmt/tm/gtm/pool/a'
+
+
+class GtmPoolAaaa(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/pool/aaaa'''
+
+    cli_command = '/mgmt/tm/gtm/pool/aaaa'
+
+
+class GtmPoolCname(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/pool/cname'''
+
+    cli_command = '/mgmt/tm/gtm/pool/cname'
+
+
+class GtmPoolMx(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/pool/mx'''
+
+    cli_command = '/mgmt/tm/gtm/pool/mx'
+
+
+class GtmPoolNaptr(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/pool/naptr'''
+
+    cli_command = '/mgmt/tm/gtm/pool/naptr'
+
+
+class GtmPoolSrv(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/pool/srv'''
+
+    cli_command = '/mgmt/tm/gtm/pool/srv'
+
+
+class GtmProberpool(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/prober-pool'''
+
+    cli_command = '/mgmt/tm/gtm/prober-pool'
+
+
+class GtmRegion(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/region'''
+
+    cli_command = '/mgmt/tm/gtm/region'
+
+
+class GtmRule(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/rule'''
+
+    cli_command = '/mgmt/tm/gtm/rule'
+
+
+class GtmServer(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/server'''
+
+    cli_command = '/mgmt/tm/gtm/server'
+
+
+class GtmSyncstatus(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/sync-status'''
+
+    cli_command = '/mgmt/tm/gtm/sync-status'
+
+
+class GtmTopology(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/topology'''
+
+    cli_command = '/mgmt/tm/gtm/topology'
+
+
+class GtmTraffic(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/traffic'''
+
+    cli_command = '/mgmt/tm/gtm/traffic'
+
+
+class GtmWideip(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/wideip'''
+
+    cli_command = '/mgmt/tm/gtm/wideip'
+
+
+class GtmWideipA(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/wideip/a'''
+
+    cli_command = '/mgmt/tm/gtm/wideip/a'
+
+
+class GtmWideipAaaa(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/wideip/aaaa'''
+
+    cli_command = '/mgmt/tm/gtm/wideip/aaaa'
+
+
+class GtmWideipCname(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/wideip/cname'''
+
+    cli_command = '/mgmt/tm/gtm/wideip/cname'
+
+
+class GtmWideipMx(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/wideip/mx'''
+
+    cli_command = '/mgmt/tm/gtm/wideip/mx'
+
+
+class GtmWideipNaptr(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/wideip/naptr'''
+
+    cli_command = '/mgmt/tm/gtm/wideip/naptr'
+
+
+class GtmWideipSrv(RestResource):
+    '''To F5 resource for /mgmt/tm/gtm/wideip/srv'''
+
+    cli_command = '/mgmt/tm/gtm/wideip/srv'
+
+
+class Live_updateAsmattacksignatures(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/asm-attack-signatures'''
+
+    cli_command = '/mgmt/tm/live-update/asm-attack-signatures'
+
+
+class Live_updateAsmattacksignaturesAvailability(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/asm-attack-signatures/availability'''
+
+    cli_command = '/mgmt/tm/live-update/asm-attack-signatures/availability'
+
+
+class Live_updateAsmattacksignaturesInstallschedule(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/asm-attack-signatures/install-schedule'''
+
+    cli_command = '/mgmt/tm/live-update/asm-attack-signatures/install-schedule'
+
+
+class Live_updateAsmattacksignaturesInstallations(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/asm-attack-signatures/installations'''
+
+    cli_command = '/mgmt/tm/live-update/asm-attack-signatures/installations'
+
+
+class Live_updateAsmattacksignaturesUpdatefiles(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/asm-attack-signatures/update-files'''
+
+    cli_command = '/mgmt/tm/live-update/asm-attack-signatures/update-files'
+
+
+class Live_updateBotsignatures(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/bot-signatures'''
+
+    cli_command = '/mgmt/tm/live-update/bot-signatures'
+
+
+class Live_updateBotsignaturesAvailability(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/bot-signatures/availability'''
+
+    cli_command = '/mgmt/tm/live-update/bot-signatures/availability'
+
+
+class Live_updateBotsignaturesInstallschedule(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/bot-signatures/install-schedule'''
+
+    cli_command = '/mgmt/tm/live-update/bot-signatures/install-schedule'
+
+
+class Live_updateBotsignaturesInstallations(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/bot-signatures/installations'''
+
+    cli_command = '/mgmt/tm/live-update/bot-signatures/installations'
+
+
+class Live_updateBotsignaturesUpdatefiles(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/bot-signatures/update-files'''
+
+    cli_command = '/mgmt/tm/live-update/bot-signatures/update-files'
+
+
+class Live_updateBrowserchallenges(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/browser-challenges'''
+
+    cli_command = '/mgmt/tm/live-update/browser-challenges'
+
+
+class Live_updateBrowserchallengesAvailability(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/browser-challenges/availability'''
+
+    cli_command = '/mgmt/tm/live-update/browser-challenges/availability'
+
+
+class Live_updateBrowserchallengesInstallschedule(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/browser-challenges/install-schedule'''
+
+    cli_command = '/mgmt/tm/live-update/browser-challenges/install-schedule'
+
+
+class Live_updateBrowserchallengesInstallations(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/browser-challenges/installations'''
+
+    cli_command = '/mgmt/tm/live-update/browser-challenges/installations'
+
+
+class Live_updateBrowserchallengesUpdatefiles(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/browser-challenges/update-files'''
+
+    cli_command = '/mgmt/tm/live-update/browser-challenges/update-files'
+
+
+class Live_updateServertechnologies(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/server-technologies'''
+
+    cli_command = '/mgmt/tm/live-update/server-technologies'
+
+
+class Live_updateServertechnologiesAvailability(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/server-technologies/availability'''
+
+    cli_command = '/mgmt/tm/live-update/server-technologies/availability'
+
+
+class Live_updateServertechnologiesInstallschedule(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/server-technologies/install-schedule'''
+
+    cli_command = '/mgmt/tm/live-update/server-technologies/install-schedule'
+
+
+class Live_updateServertechnologiesInstallations(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/server-technologies/installations'''
+
+    cli_command = '/mgmt/tm/live-update/server-technologies/installations'
+
+
+class Live_updateServertechnologiesUpdatefiles(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/server-technologies/update-files'''
+
+    cli_command = '/mgmt/tm/live-update/server-technologies/update-files'
+
+
+class Live_updateThreatcampaigns(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/threat-campaigns'''
+
+    cli_command = '/mgmt/tm/live-update/threat-campaigns'
+
+
+class Live_updateThreatcampaignsAvailability(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/threat-campaigns/availability'''
+
+    cli_command = '/mgmt/tm/live-update/threat-campaigns/availability'
+
+
+class Live_updateThreatcampaignsInstallschedule(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/threat-campaigns/install-schedule'''
+
+    cli_command = '/mgmt/tm/live-update/threat-campaigns/install-schedule'
+
+
+class Live_updateThreatcampaignsInstallations(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/threat-campaigns/installations'''
+
+    cli_command = '/mgmt/tm/live-update/threat-campaigns/installations'
+
+
+class Live_updateThreatcampaignsUpdatefiles(RestResource):
+    '''To F5 resource for /mgmt/tm/live-update/threat-campaigns/update-files'''
+
+    cli_command = '/mgmt/tm/live-update/threat-campaigns/update-files'
+
+
+class LtmAuth(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth'''
+
+    cli_command = '/mgmt/tm/ltm/auth'
+
+
+class LtmAuthCrldpserver(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/crldp-server'''
+
+    cli_command = '/mgmt/tm/ltm/auth/crldp-server'
+
+
+class LtmAuthKerberosdelegation(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/kerberos-delegation'''
+
+    cli_command = '/mgmt/tm/ltm/auth/kerberos-delegation'
+
+
+class LtmAuthLdap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/ldap'''
+
+    cli_command = '/mgmt/tm/ltm/auth/ldap'
+
+
+class LtmAuthOcspresponder(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/ocsp-responder'''
+
+    cli_command = '/mgmt/tm/ltm/auth/ocsp-responder'
+
+
+class LtmAuthProfile(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/profile'''
+
+    cli_command = '/mgmt/tm/ltm/auth/profile'
+
+
+class LtmAuthRadius(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/radius'''
+
+    cli_command = '/mgmt/tm/ltm/auth/radius'
+
+
+class LtmAuthRadiusserver(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/radius-server'''
+
+    cli_command = '/mgmt/tm/ltm/auth/radius-server'
+
+
+class LtmAuthSslccldap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/ssl-cc-ldap'''
+
+    cli_command = '/mgmt/tm/ltm/auth/ssl-cc-ldap'
+
+
+class LtmAuthSslcrldp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/ssl-crldp'''
+
+    cli_command = '/mgmt/tm/ltm/auth/ssl-crldp'
+
+
+class LtmAuthSslocsp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/ssl-ocsp'''
+
+    cli_command = '/mgmt/tm/ltm/auth/ssl-ocsp'
+
+
+class LtmAuthTacacs(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/auth/tacacs'''
+
+    cli_command = '/mgmt/tm/ltm/auth/tacacs'
+
+
+class LtmCipher(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/cipher'''
+
+    cli_command = '/mgmt/tm/ltm/cipher'
+
+
+class LtmCipherGroup(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/cipher/group'''
+
+    cli_command = '/mgmt/tm/ltm/cipher/group'
+
+
+class LtmCipherRule(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/cipher/rule'''
+
+    cli_command = '/mgmt/tm/ltm/cipher/rule'
+
+
+class LtmDatagroup(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/data-group'''
+
+    cli_command = '/mgmt/tm/ltm/data-group'
+
+
+class LtmDatagroupExternal(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/data-group/external'''
+
+    cli_command = '/mgmt/tm/ltm/data-group/external'
+
+
+class LtmDatagroupInternal(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/data-group/internal'''
+
+    cli_command = '/mgmt/tm/ltm/data-group/internal'
+
+
+class LtmDefaultnodemonitor(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/default-node-monitor'''
+
+    cli_command = '/mgmt/tm/ltm/default-node-monitor'
+
+
+class LtmDns(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns'''
+
+    cli_command = '/mgmt/tm/ltm/dns'
+
+
+class LtmDnsAnalytics(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/analytics'''
+
+    cli_command = '/mgmt/tm/ltm/dns/analytics'
+
+
+class LtmDnsGlobalsettings(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/analytics/global-settings'''
+
+    cli_command = '/mgmt/tm/ltm/dns/analytics/global-settings'
+
+
+class LtmDnsCache(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/cache'''
+
+    cli_command = '/mgmt/tm/ltm/dns/cache'
+
+
+class LtmDnsResolver(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/cache/resolver'''
+
+    cli_command = '/mgmt/tm/ltm/dns/cache/resolver'
+
+
+class LtmDnsTransparent(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/cache/transparent'''
+
+    cli_command = '/mgmt/tm/ltm/dns/cache/transparent'
+
+
+class LtmDnsValidatingresolver(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/cache/validating-resolver'''
+
+    cli_command = '/mgmt/tm/ltm/dns/cache/validating-resolver'
+
+
+class LtmDnsDnssec(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/dnssec'''
+
+    cli_command = '/mgmt/tm/ltm/dns/dnssec'
+
+
+class LtmDnsKey(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/dnssec/key'''
+
+    cli_command = '/mgmt/tm/ltm/dns/dnssec/key'
+
+
+class LtmDnsNameserver(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/nameserver'''
+
+    cli_command = '/mgmt/tm/ltm/dns/nameserver'
+
+
+class LtmDnsTsigkey(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/tsig-key'''
+
+    cli_command = '/mgmt/tm/ltm/dns/tsig-key'
+
+
+class LtmDnsZone(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/dns/zone'''
+
+    cli_command = '/mgmt/tm/ltm/dns/zone'
+
+
+class LtmEvictionpolicy(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/eviction-policy'''
+
+    cli_command = '/mgmt/tm/ltm/eviction-policy'
+
+
+class LtmGlobalsettings(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/global-settings'''
+
+    cli_command = '/mgmt/tm/ltm/global-settings'
+
+
+class LtmGlobalsettingsConnection(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/global-settings/connection'''
+
+    cli_command = '/mgmt/tm/ltm/global-settings/connection'
+
+
+class LtmGlobalsettingsGeneral(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/global-settings/general'''
+
+    cli_command = '/mgmt/tm/ltm/global-settings/general'
+
+
+class LtmGlobalsettingsRule(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/global-settings/rule'''
+
+    cli_command = '/mgmt/tm/ltm/global-settings/rule'
+
+
+class LtmGlobalsettingsTrafficcontrol(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/global-settings/traffic-control'''
+
+    cli_command = '/mgmt/tm/ltm/global-settings/traffic-control'
+
+
+class LtmHtmlrule(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/html-rule'''
+
+    cli_command = '/mgmt/tm/ltm/html-rule'
+
+
+class LtmHtmlruleCommentraiseevent(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/html-rule/comment-raise-event'''
+
+    cli_command = '/mgmt/tm/ltm/html-rule/comment-raise-event'
+
+
+class LtmHtmlruleCommentremove(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/html-rule/comment-remove'''
+
+    cli_command = '/mgmt/tm/ltm/html-rule/comment-remove'
+
+
+class LtmHtmlruleTagappendhtml(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/html-rule/tag-append-html'''
+
+    cli_command = '/mgmt/tm/ltm/html-rule/tag-append-html'
+
+
+class LtmHtmlruleTagprependhtml(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/html-rule/tag-prepend-html'''
+
+    cli_command = '/mgmt/tm/ltm/html-rule/tag-prepend-html'
+
+
+class LtmHtmlruleTagraiseevent(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/html-rule/tag-raise-event'''
+
+    cli_command = '/mgmt/tm/ltm/html-rule/tag-raise-event'
+
+
+class LtmHtmlruleTagremove(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/html-rule/tag-remove'''
+
+    cli_command = '/mgmt/tm/ltm/html-rule/tag-remove'
+
+
+class LtmHtmlruleTagremoveattribute(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/html-rule/tag-remove-attribute'''
+
+    cli_command = '/mgmt/tm/ltm/html-rule/tag-remove-attribute'
+
+
+class LtmIfile(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/ifile'''
+
+    cli_command = '/mgmt/tm/ltm/ifile'
+
+
+class LtmMessagerouting(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing'
+
+
+class LtmMessageroutingDiameter(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/diameter'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/diameter'
+
+
+class LtmMessageroutingPeer(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/diameter/peer'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/diameter/peer'
+
+
+class LtmMessageroutingProfile(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/diameter/profile'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/diameter/profile'
+
+
+class LtmMessageroutingGeneric(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/generic'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/generic'
+
+
+class LtmMessageroutingProtocol(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/generic/protocol'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/generic/protocol'
+
+
+class LtmMessageroutingRoute(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/generic/route'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/generic/route'
+
+
+class LtmMessageroutingTransportconfig(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/generic/transport-config'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/generic/transport-config'
+
+
+class LtmMessageroutingMqtt(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/mqtt'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/mqtt'
+
+
+class LtmMessageroutingRouter(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/mqtt/profile/router'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/mqtt/profile/router'
+
+
+class LtmMessageroutingSession(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/mqtt/profile/session'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/mqtt/profile/session'
+
+
+class LtmMessageroutingSip(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/message-routing/sip'''
+
+    cli_command = '/mgmt/tm/ltm/message-routing/sip'
+
+
+class LtmMonitor(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor'''
+
+    cli_command = '/mgmt/tm/ltm/monitor'
+
+
+class LtmMonitorDiameter(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/diameter'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/diameter'
+
+
+class LtmMonitorDns(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/dns'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/dns'
+
+
+class LtmMonitorExternal(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/external'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/external'
+
+
+class LtmMonitorFirepass(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/firepass'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/firepass'
+
+
+class LtmMonitorFtp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/ftp'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/ftp'
+
+
+class LtmMonitorGatewayicmp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/gateway-icmp'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/gateway-icmp'
+
+
+class LtmMonitorHttp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/http'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/http'
+
+
+class LtmMonitorHttps(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/https'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/https'
+
+
+class LtmMonitorIcmp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/icmp'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/icmp'
+
+
+class LtmMonitorImap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/imap'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/imap'
+
+
+class LtmMonitorInband(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/inband'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/inband'
+
+
+class LtmMonitorLdap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/ldap'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/ldap'
+
+
+class LtmMonitorModulescore(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/module-score'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/module-score'
+
+
+class LtmMonitorMqtt(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/mqtt'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/mqtt'
+
+
+class LtmMonitorMssql(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/mssql'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/mssql'
+
+
+class LtmMonitorMysql(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/mysql'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/mysql'
+
+
+class LtmMonitorNntp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/nntp'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/nntp'
+
+
+class LtmMonitorNone(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/none'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/none'
+
+
+class LtmMonitorOracle(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/oracle'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/oracle'
+
+
+class LtmMonitorPop3(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/pop3'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/pop3'
+
+
+class LtmMonitorPostgresql(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/postgresql'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/postgresql'
+
+
+class LtmMonitorRadius(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/radius'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/radius'
+
+
+class LtmMonitorRadiusaccounting(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/radius-accounting'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/radius-accounting'
+
+
+class LtmMonitorRealserver(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/real-server'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/real-server'
+
+
+class LtmMonitorRpc(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/rpc'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/rpc'
+
+
+class LtmMonitorSasp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/sasp'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/sasp'
+
+
+class LtmMonitorScripted(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/scripted'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/scripted'
+
+
+class LtmMonitorSip(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/sip'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/sip'
+
+
+class LtmMonitorSmb(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/smb'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/smb'
+
+
+class LtmMonitorSmtp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/smtp'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/smtp'
+
+
+class LtmMonitorSnmpdca(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/snmp-dca'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/snmp-dca'
+
+
+class LtmMonitorSnmpdcabase(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/snmp-dca-base'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/snmp-dca-base'
+
+
+class LtmMonitorSoap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/soap'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/soap'
+
+
+class LtmMonitorTcp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/tcp'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/tcp'
+
+
+class LtmMonitorTcpecho(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/tcp-echo'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/tcp-echo'
+
+
+class LtmMonitorTcphalfopen(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/tcp-half-open'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/tcp-half-open'
+
+
+class LtmMonitorUdp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/udp'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/udp'
+
+
+class LtmMonitorVirtuallocation(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/virtual-location'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/virtual-location'
+
+
+class LtmMonitorWap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/wap'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/wap'
+
+
+class LtmMonitorWmi(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/monitor/wmi'''
+
+    cli_command = '/mgmt/tm/ltm/monitor/wmi'
+
+
+class LtmNat(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/nat'''
+
+    cli_command = '/mgmt/tm/ltm/nat'
+
+
+class LtmNode(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/node'''
+
+    cli_command = '/mgmt/tm/ltm/node'
+
+
+class LtmPersistence(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence'''
+
+    cli_command = '/mgmt/tm/ltm/persistence'
+
+
+class LtmPersistenceCookie(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/cookie'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/cookie'
+
+
+class LtmPersistenceDestaddr(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/dest-addr'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/dest-addr'
+
+
+class LtmPersistenceGlobalsettings(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/global-settings'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/global-settings'
+
+
+class LtmPersistenceHash(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/hash'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/hash'
+
+
+class LtmPersistenceHost(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/host'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/host'
+
+
+class LtmPersistenceMsrdp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/msrdp'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/msrdp'
+
+
+class LtmPersistencePersistrecords(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/persist-records'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/persist-records'
+
+
+class LtmPersistenceSip(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/sip'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/sip'
+
+
+class LtmPersistenceSourceaddr(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/source-addr'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/source-addr'
+
+
+class LtmPersistenceSsl(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/ssl'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/ssl'
+
+
+class LtmPersistenceUniversal(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/persistence/universal'''
+
+    cli_command = '/mgmt/tm/ltm/persistence/universal'
+
+
+class LtmPolicy(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/policy'''
+
+    cli_command = '/mgmt/tm/ltm/policy'
+
+
+class LtmPolicystrategy(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/policy-strategy'''
+
+    cli_command = '/mgmt/tm/ltm/policy-strategy'
+
+
+class LtmPool(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/pool'''
+
+    cli_command = '/mgmt/tm/ltm/pool'
+
+
+class LtmProfile(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile'''
+
+    cli_command = '/mgmt/tm/ltm/profile'
+
+
+class LtmProfileCertificateauthority(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/certificate-authority'''
+
+    cli_command = '/mgmt/tm/ltm/profile/certificate-authority'
+
+
+class LtmProfileClientldap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/client-ldap'''
+
+    cli_command = '/mgmt/tm/ltm/profile/client-ldap'
+
+
+class LtmProfileClientssl(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/client-ssl'''
+
+    cli_command = '/mgmt/tm/ltm/profile/client-ssl'
+
+
+class LtmProfileConnector(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/connector'''
+
+    cli_command = '/mgmt/tm/ltm/profile/connector'
+
+
+class LtmProfileDhcpv4(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/dhcpv4'''
+
+    cli_command = '/mgmt/tm/ltm/profile/dhcpv4'
+
+
+class LtmProfileDhcpv6(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/dhcpv6'''
+
+    cli_command = '/mgmt/tm/ltm/profile/dhcpv6'
+
+
+class LtmProfileDiameter(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/diameter'''
+
+    cli_command = '/mgmt/tm/ltm/profile/diameter'
+
+
+class LtmProfileDns(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/dns'''
+
+    cli_command = '/mgmt/tm/ltm/profile/dns'
+
+
+class LtmProfileDnslogging(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/dns-logging'''
+
+    cli_command = '/mgmt/tm/ltm/profile/dns-logging'
+
+
+class LtmProfileFasthttp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/fasthttp'''
+
+    cli_command = '/mgmt/tm/ltm/profile/fasthttp'
+
+
+class LtmProfileFastl4(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/fastl4'''
+
+    cli_command = '/mgmt/tm/ltm/profile/fastl4'
+
+
+class LtmProfileFix(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/fix'''
+
+    cli_command = '/mgmt/tm/ltm/profile/fix'
+
+
+class LtmProfileFtp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/ftp'''
+
+    cli_command = '/mgmt/tm/ltm/profile/ftp'
+
+
+class LtmProfileGtp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/gtp'''
+
+    cli_command = '/mgmt/tm/ltm/profile/gtp'
+
+
+class LtmProfileHtml(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/html'''
+
+    cli_command = '/mgmt/tm/ltm/profile/html'
+
+
+class LtmProfileHttp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/http'''
+
+    cli_command = '/mgmt/tm/ltm/profile/http'
+
+
+class LtmProfileHttpcompression(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/http-compression'''
+
+    cli_command = '/mgmt/tm/ltm/profile/http-compression'
+
+
+class LtmProfileHttpproxyconnect(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/http-proxy-connect'''
+
+    cli_command = '/mgmt/tm/ltm/profile/http-proxy-connect'
+
+
+class LtmProfileHttp2(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/http2'''
+
+    cli_command = '/mgmt/tm/ltm/profile/http2'
+
+
+class LtmProfileHttprouter(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/httprouter'''
+
+    cli_command = '/mgmt/tm/ltm/profile/httprouter'
+
+
+class LtmProfileIcap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/icap'''
+
+    cli_command = '/mgmt/tm/ltm/profile/icap'
+
+
+class LtmProfileImap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/imap'''
+
+    cli_command = '/mgmt/tm/ltm/profile/imap'
+
+
+class LtmProfileIpother(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/ipother'''
+
+    cli_command = '/mgmt/tm/ltm/profile/ipother'
+
+
+class LtmProfileIpsecalg(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/ipsecalg'''
+
+    cli_command = '/mgmt/tm/ltm/profile/ipsecalg'
+
+
+class LtmProfileMblb(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/mblb'''
+
+    cli_command = '/mgmt/tm/ltm/profile/mblb'
+
+
+class LtmProfileMqtt(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/mqtt'''
+
+    cli_command = '/mgmt/tm/ltm/profile/mqtt'
+
+
+class LtmProfileNetflow(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/netflow'''
+
+    cli_command = '/mgmt/tm/ltm/profile/netflow'
+
+
+class LtmProfileNtlm(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/ntlm'''
+
+    cli_command = '/mgmt/tm/ltm/profile/ntlm'
+
+
+class LtmProfileOcspstaplingparams(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/ocsp-stapling-params'''
+
+    cli_command = '/mgmt/tm/ltm/profile/ocsp-stapling-params'
+
+
+class LtmProfileOneconnect(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/one-connect'''
+
+    cli_command = '/mgmt/tm/ltm/profile/one-connect'
+
+
+class LtmProfilePop3(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/pop3'''
+
+    cli_command = '/mgmt/tm/ltm/profile/pop3'
+
+
+class LtmProfilePptp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/pptp'''
+
+    cli_command = '/mgmt/tm/ltm/profile/pptp'
+
+
+class LtmProfileQoe(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/qoe'''
+
+    cli_command = '/mgmt/tm/ltm/profile/qoe'
+
+
+class LtmProfileRadius(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/radius'''
+
+    cli_command = '/mgmt/tm/ltm/profile/radius'
+
+
+class LtmProfileRequestadapt(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/request-adapt'''
+
+    cli_command = '/mgmt/tm/ltm/profile/request-adapt'
+
+
+class LtmProfileRequestlog(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/request-log'''
+
+    cli_command = '/mgmt/tm/ltm/profile/request-log'
+
+
+class LtmProfileResponseadapt(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/response-adapt'''
+
+    cli_command = '/mgmt/tm/ltm/profile/response-adapt'
+
+
+class LtmProfileRewrite(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/rewrite'''
+
+    cli_command = '/mgmt/tm/ltm/profile/rewrite'
+
+
+class LtmProfileRtsp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/rtsp'''
+
+    cli_command = '/mgmt/tm/ltm/profile/rtsp'
+
+
+class LtmProfileSctp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/sctp'''
+
+    cli_command = '/mgmt/tm/ltm/profile/sctp'
+
+
+class LtmProfileServerldap(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/server-ldap'''
+
+    cli_command = '/mgmt/tm/ltm/profile/server-ldap'
+
+
+class LtmProfileServerssl(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/server-ssl'''
+
+    cli_command = '/mgmt/tm/ltm/profile/server-ssl'
+
+
+class LtmProfileService(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/service'''
+
+    cli_command = '/mgmt/tm/ltm/profile/service'
+
+
+class LtmProfileSip(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/sip'''
+
+    cli_command = '/mgmt/tm/ltm/profile/sip'
+
+
+class LtmProfileSmtps(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/smtps'''
+
+    cli_command = '/mgmt/tm/ltm/profile/smtps'
+
+
+class LtmProfileSocks(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/socks'''
+
+    cli_command = '/mgmt/tm/ltm/profile/socks'
+
+
+class LtmProfileSplitsessionclient(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/splitsessionclient'''
+
+    cli_command = '/mgmt/tm/ltm/profile/splitsessionclient'
+
+
+class LtmProfileSplitsessionserver(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/splitsessionserver'''
+
+    cli_command = '/mgmt/tm/ltm/profile/splitsessionserver'
+
+
+class LtmProfileStatistics(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/statistics'''
+
+    cli_command = '/mgmt/tm/ltm/profile/statistics'
+
+
+class LtmProfileStream(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/stream'''
+
+    cli_command = '/mgmt/tm/ltm/profile/stream'
+
+
+class LtmProfileTcp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/tcp'''
+
+    cli_command = '/mgmt/tm/ltm/profile/tcp'
+
+
+class LtmProfileTcpanalytics(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/tcp-analytics'''
+
+    cli_command = '/mgmt/tm/ltm/profile/tcp-analytics'
+
+
+class LtmProfileTftp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/tftp'''
+
+    cli_command = '/mgmt/tm/ltm/profile/tftp'
+
+
+class LtmProfileUdp(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/udp'''
+
+    cli_command = '/mgmt/tm/ltm/profile/udp'
+
+
+class LtmProfileWebacceleration(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/web-acceleration'''
+
+    cli_command = '/mgmt/tm/ltm/profile/web-acceleration'
+
+
+class LtmProfileWebsocket(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/websocket'''
+
+    cli_command = '/mgmt/tm/ltm/profile/websocket'
+
+
+class LtmProfileXml(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/profile/xml'''
+
+    cli_command = '/mgmt/tm/ltm/profile/xml'
+
+
+class LtmRule(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/rule'''
+
+    cli_command = '/mgmt/tm/ltm/rule'
+
+
+class LtmRuleprofiler(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/rule-profiler'''
+
+    cli_command = '/mgmt/tm/ltm/rule-profiler'
+
+
+class LtmSnat(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/snat'''
+
+    cli_command = '/mgmt/tm/ltm/snat'
+
+
+class LtmSnattranslation(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/snat-translation'''
+
+    cli_command = '/mgmt/tm/ltm/snat-translation'
+
+
+class LtmSnatpool(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/snatpool'''
+
+    cli_command = '/mgmt/tm/ltm/snatpool'
+
+
+class LtmTacdb(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/tacdb'''
+
+    cli_command = '/mgmt/tm/ltm/tacdb'
+
+
+class LtmTacdbCustomdb(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/tacdb/customdb'''
+
+    cli_command = '/mgmt/tm/ltm/tacdb/customdb'
+
+
+class LtmTacdbCustomdbfile(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/tacdb/customdb-file'''
+
+    cli_command = '/mgmt/tm/ltm/tacdb/customdb-file'
+
+
+class LtmTacdbLicenseddb(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/tacdb/licenseddb'''
+
+    cli_command = '/mgmt/tm/ltm/tacdb/licenseddb'
+
+
+class LtmTacdbLicenseddbfile(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/tacdb/licenseddb-file'''
+
+    cli_command = '/mgmt/tm/ltm/tacdb/licenseddb-file'
+
+
+class LtmTacdbQuery(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/tacdb/query'''
+
+    cli_command = '/mgmt/tm/ltm/tacdb/query'
+
+
+class LtmTrafficclass(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/traffic-class'''
+
+    cli_command = '/mgmt/tm/ltm/traffic-class'
+
+
+class LtmTrafficmatchingcriteria(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/traffic-matching-criteria'''
+
+    cli_command = '/mgmt/tm/ltm/traffic-matching-criteria'
+
+
+class LtmUrlcatquery(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/urlcat-query'''
+
+    cli_command = '/mgmt/tm/ltm/urlcat-query'
+
+
+class LtmVirtual(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/virtual'''
+
+    cli_command = '/mgmt/tm/ltm/virtual'
+
+
+class LtmVirtualaddress(RestResource):
+    '''To F5 resource for /mgmt/tm/ltm/virtual-address'''
+
+    cli_command = '/mgmt/tm/ltm/virtual-address'
+
+
+class NetAddresslist(RestResource):
+    '''To F5 resource for /mgmt/tm/net/address-list'''
+
+    cli_command = '/mgmt/tm/net/address-list'
+
+
+class NetArp(RestResource):
+    '''To F5 resource for /mgmt/tm/net/arp'''
+
+    cli_command = '/mgmt/tm/net/arp'
+
+
+class NetBwc(RestResource):
+    '''To F5 resource for /mgmt/tm/net/bwc'''
+
+    cli_command = '/mgmt/tm/net/bwc'
+
+
+class NetBwcPolicy(RestResource):
+    '''To F5 resource for /mgmt/tm/net/bwc/policy'''
+
+    cli_command = '/mgmt/tm/net/bwc/policy'
+
+
+class NetBwcPrioritygroup(RestResource):
+    '''To F5 resource for /mgmt/tm/net/bwc/priority-group'''
+
+    cli_command = '/mgmt/tm/net/bwc/priority-group'
+
+
+class NetBwcProbe(RestResource):
+    '''To F5 resource for /mgmt/tm/net/bwc/probe'''
+
+    cli_command = '/mgmt/tm/net/bwc/probe'
+
+
+class NetClonestats(RestResource):
+    '''To F5 resource for /mgmt/tm/net/clone-stats'''
+
+    cli_command = '/mgmt/tm/net/clone-stats'
+
+
+class NetCmetrics(RestResource):
+    '''To F5 resource for /mgmt/tm/net/cmetrics'''
+
+    cli_command = '/mgmt/tm/net/cmetrics'
+
+
+class NetCos(RestResource):
+    '''To F5 resource for /mgmt/tm/net/cos'''
+
+    cli_command = '/mgmt/tm/net/cos'
+
+
+class NetCosGlobalsettings(RestResource):
+    '''To F5 resource for /mgmt/tm/net/cos/global-settings'''
+
+    cli_command = '/mgmt/tm/net/cos/global-settings'
+
+
+class NetCosMap8021p(RestResource):
+    '''To F5 resource for /mgmt/tm/net/cos/map-8021p'''
+
+    cli_command = '/mgmt/tm/net/cos/map-8021p'
+
+
+class NetCosMapdscp(RestResource):
+    '''To F5 resource for /mgmt/tm/net/cos/map-dscp'''
+
+    cli_command = '/mgmt/tm/net/cos/map-dscp'
+
+
+class NetCosTrafficpriority(RestResource):
+    '''To F5 resource for /mgmt/tm/net/cos/traffic-priority'''
+
+    cli_command = '/mgmt/tm/net/cos/traffic-priority'
+
+
+class NetDagglobals(RestResource):
+    '''To F5 resource for /mgmt/tm/net/dag-globals'''
+
+    cli_command = '/mgmt/tm/net/dag-globals'
+
+
+class NetDnsresolver(RestResource):
+    '''To F5 resource for /mgmt/tm/net/dns-resolver'''
+
+    cli_command = '/mgmt/tm/net/dns-resolver'
+
+
+class NetFdb(RestResource):
+    '''To F5 resource for /mgmt/tm/net/fdb'''
+
+    cli_command = '/mgmt/tm/net/fdb'
+
+
+class NetFdbTunnel(RestResource):
+    '''To F5 resource for /mgmt/tm/net/fdb/tunnel'''
+
+    cli_command = '/mgmt/tm/net/fdb/tunnel'
+
+
+class NetFdbVlan(RestResource):
+    '''To F5 resource for /mgmt/tm/net/fdb/vlan'''
+
+    cli_command = '/mgmt/tm/net/fdb/vlan'
+
+
+class NetIkeevtstat(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ike-evt-stat'''
+
+    cli_command = '/mgmt/tm/net/ike-evt-stat'
+
+
+class NetIkemsgstat(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ike-msg-stat'''
+
+    cli_command = '/mgmt/tm/net/ike-msg-stat'
+
+
+class NetInterface(RestResource):
+    '''To F5 resource for /mgmt/tm/net/interface'''
+
+    cli_command = '/mgmt/tm/net/interface'
+
+
+class NetInterfacecos(RestResource):
+    '''To F5 resource for /mgmt/tm/net/interface-cos'''
+
+    cli_command = '/mgmt/tm/net/interface-cos'
+
+
+class NetInterfaceddm(RestResource):
+    '''To F5 resource for /mgmt/tm/net/interface-ddm'''
+
+    cli_command = '/mgmt/tm/net/interface-ddm'
+
+
+class NetIpsec(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ipsec'''
+
+    cli_command = '/mgmt/tm/net/ipsec'
+
+
+class NetIpsecstat(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ipsec-stat'''
+
+    cli_command = '/mgmt/tm/net/ipsec-stat'
+
+
+class NetIpsecIkedaemon(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ipsec/ike-daemon'''
+
+    cli_command = '/mgmt/tm/net/ipsec/ike-daemon'
+
+
+class NetIpsecIkepeer(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ipsec/ike-peer'''
+
+    cli_command = '/mgmt/tm/net/ipsec/ike-peer'
+
+
+class NetIpsecIkesa(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ipsec/ike-sa'''
+
+    cli_command = '/mgmt/tm/net/ipsec/ike-sa'
+
+
+class NetIpsecIpsecpolicy(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ipsec/ipsec-policy'''
+
+    cli_command = '/mgmt/tm/net/ipsec/ipsec-policy'
+
+
+class NetIpsecIpsecsa(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ipsec/ipsec-sa'''
+
+    cli_command = '/mgmt/tm/net/ipsec/ipsec-sa'
+
+
+class NetIpsecManualsecurityassociation(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ipsec/manual-security-association'''
+
+    cli_command = '/mgmt/tm/net/ipsec/manual-security-association'
+
+
+class NetIpsecTrafficselector(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ipsec/traffic-selector'''
+
+    cli_command = '/mgmt/tm/net/ipsec/traffic-selector'
+
+
+class NetLldpglobals(RestResource):
+    '''To F5 resource for /mgmt/tm/net/lldp-globals'''
+
+    cli_command = '/mgmt/tm/net/lldp-globals'
+
+
+class NetLldpneighbors(RestResource):
+    '''To F5 resource for /mgmt/tm/net/lldp-neighbors'''
+
+    cli_command = '/mgmt/tm/net/lldp-neighbors'
+
+
+class NetMroute(RestResource):
+    '''To F5 resource for /mgmt/tm/net/mroute'''
+
+    cli_command = '/mgmt/tm/net/mroute'
+
+
+class NetMulticastglobals(RestResource):
+    '''To F5 resource for /mgmt/tm/net/multicast-globals'''
+
+    cli_command = '/mgmt/tm/net/multicast-globals'
+
+
+class NetNdp(RestResource):
+    '''To F5 resource for /mgmt/tm/net/ndp'''
+
+    cli_command = '/mgmt/tm/net/ndp'
+
+
+class NetPacketfilter(RestResource):
+    '''To F5 resource for /mgmt/tm/net/packet-filter'''
+
+    cli_command = '/mgmt/tm/net/packet-filter'
+
+
+class NetPacketfiltertrusted(RestResource):
+    '''To F5 resource for /mgmt/tm/net/packet-filter-trusted'''
+
+    cli_command = '/mgmt/tm/net/packet-filter-trusted'
+
+
+class NetPackettester(RestResource):
+    '''To F5 resource for /mgmt/tm/net/packet-tester'''
+
+    cli_command = '/mgmt/tm/net/packet-tester'
+
+
+class NetPackettesterSecurity(RestResource):
+    '''To F5 resource for /mgmt/tm/net/packet-tester/security'''
+
+    cli_command = '/mgmt/tm/net/packet-tester/security'
+
+
+class NetPortlist(RestResource):
+    '''To F5 resource for /mgmt/tm/net/port-list'''
+
+    cli_command = '/mgmt/tm/net/port-list'
+
+
+class NetPortmirror(RestResource):
+    '''To F5 resource for /mgmt/tm/net/port-mirror'''
+
+    cli_command = '/mgmt/tm/net/port-mirror'
+
+
+class NetRateshaping(RestResource):
+    '''To F5 resource for /mgmt/tm/net/rate-shaping'''
+
+    cli_command = '/mgmt/tm/net/rate-shaping'
+
+
+class NetRateshapingClass(RestResource):
+    '''To F5 resource for /mgmt/tm/net/rate-shaping/class'''
+
+    cli_command = '/mgmt/tm/net/rate-shaping/class'
+
+
+class NetRateshapingColorpolicer(RestResource):
+    '''To F5 resource for /mgmt/tm/net/rate-shaping/color-policer'''
+
+    cli_command = '/mgmt/tm/net/rate-shaping/color-policer'
+
+
+class NetRateshapingDroppolicy(RestResource):
+    '''To F5 resource for /mgmt/tm/net/rate-shaping/drop-policy'''
+
+    cli_command = '/mgmt/tm/net/rate-shaping/drop-policy'
+
+
+class NetRateshapingQueue(RestResource):
+    '''To F5 resource for /mgmt/tm/net/rate-shaping/queue'''
+
+    cli_command = '/mgmt/tm/net/rate-shaping/queue'
+
+
+class NetRateshapingShapingpolicy(RestResource):
+    '''To F5 resource for /mgmt/tm/net/rate-shaping/shaping-policy'''
+
+    cli_command = '/mgmt/tm/net/rate-shaping/shaping-policy'
+
+
+class NetRoute(RestResource):
+    '''To F5 resource for /mgmt/tm/net/route'''
+
+    cli_command = '/mgmt/tm/net/route'
+
+
+class NetRoutedomain(RestResource):
+    '''To F5 resource for /mgmt/tm/net/route-domain'''
+
+    cli_command = '/mgmt/tm/net/route-domain'
+
+
+class NetRouteradvertisement(RestResource):
+    '''To F5 resource for /mgmt/tm/net/router-advertisement'''
+
+    cli_command = '/mgmt/tm/net/router-advertisement'
+
+
+class NetRouting(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing'''
+
+    cli_command = '/mgmt/tm/net/routing'
+
+
+class NetRoutingAccesslist(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/access-list'''
+
+    cli_command = '/mgmt/tm/net/routing/access-list'
+
+
+class NetRoutingAspath(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/as-path'''
+
+    cli_command = '/mgmt/tm/net/routing/as-path'
+
+
+class NetRoutingBfd(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/bfd'''
+
+    cli_command = '/mgmt/tm/net/routing/bfd'
+
+
+class NetRoutingBgp(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/bgp'''
+
+    cli_command = '/mgmt/tm/net/routing/bgp'
+
+
+class NetRoutingCommunitylist(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/community-list'''
+
+    cli_command = '/mgmt/tm/net/routing/community-list'
+
+
+class NetRoutingDebug(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/debug'''
+
+    cli_command = '/mgmt/tm/net/routing/debug'
+
+
+class NetRoutingExtcommunitylist(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/extcommunity-list'''
+
+    cli_command = '/mgmt/tm/net/routing/extcommunity-list'
+
+
+class NetRoutingPrefixlist(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/prefix-list'''
+
+    cli_command = '/mgmt/tm/net/routing/prefix-list'
+
+
+class NetRoutingProfile(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/profile'''
+
+    cli_command = '/mgmt/tm/net/routing/profile'
+
+
+class NetRoutingRoutemap(RestResource):
+    '''To F5 resource for /mgmt/tm/net/routing/route-map'''
+
+    cli_command = '/mgmt/tm/net/routing/route-map'
+
+
+class NetRstcause(RestResource):
+    '''To F5 resource for /mgmt/tm/net/rst-cause'''
+
+    cli_command = '/mgmt/tm/net/rst-cause'
+
+
+class NetSelf(RestResource):
+    '''To F5 resource for /mgmt/tm/net/self'''
+
+    cli_command = '/mgmt/tm/net/self'
+
+
+class NetSelfallow(RestResource):
+    '''To F5 resource for /mgmt/tm/net/self-allow'''
+
+    cli_command = '/mgmt/tm/net/self-allow'
+
+
+class NetServicepolicy(RestResource):
+    '''To F5 resource for /mgmt/tm/net/service-policy'''
+
+    cli_command = '/mgmt/tm/net/service-policy'
+
+
+class NetSfc(RestResource):
+    '''To F5 resource for /mgmt/tm/net/sfc'''
+
+    cli_command = '/mgmt/tm/net/sfc'
+
+
+class NetSfcChain(RestResource):
+    '''To F5 resource for /mgmt/tm/net/sfc/chain'''
+
+    cli_command = '/mgmt/tm/net/sfc/chain'
+
+
+class NetSfcHop(RestResource):
+    '''To F5 resource for /mgmt/tm/net/sfc/hop'''
+
+    cli_command = '/mgmt/tm/net/sfc/hop'
+
+
+class NetSfcSf(RestResource):
+    '''To F5 resource for /mgmt/tm/net/sfc/sf'''
+
+    cli_command = '/mgmt/tm/net/sfc/sf'
+
+
+class NetStp(RestResource):
+    '''To F5 resource for /mgmt/tm/net/stp'''
+
+    cli_command = '/mgmt/tm/net/stp'
+
+
+class NetStpglobals(RestResource):
+    '''To F5 resource for /mgmt/tm/net/stp-globals'''
+
+    cli_command = '/mgmt/tm/net/stp-globals'
+
+
+class NetTimerpolicy(RestResource):
+    '''To F5 resource for /mgmt/tm/net/timer-policy'''
+
+    cli_command = '/mgmt/tm/net/timer-policy'
+
+
+class NetTrunk(RestResource):
+    '''To F5 resource for /mgmt/tm/net/trunk'''
+
+    cli_command = '/mgmt/tm/net/trunk'
+
+
+class NetTunnels(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels'''
+
+    cli_command = '/mgmt/tm/net/tunnels'
+
+
+class NetTunnelsEtherip(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/etherip'''
+
+    cli_command = '/mgmt/tm/net/tunnels/etherip'
+
+
+class NetTunnelsFec(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/fec'''
+
+    cli_command = '/mgmt/tm/net/tunnels/fec'
+
+
+class NetTunnelsFecstat(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/fec-stat'''
+
+    cli_command = '/mgmt/tm/net/tunnels/fec-stat'
+
+
+class NetTunnelsGeneve(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/geneve'''
+
+    cli_command = '/mgmt/tm/net/tunnels/geneve'
+
+
+class NetTunnelsGre(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/gre'''
+
+    cli_command = '/mgmt/tm/net/tunnels/gre'
+
+
+class NetTunnelsIpip(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/ipip'''
+
+    cli_command = '/mgmt/tm/net/tunnels/ipip'
+
+
+class NetTunnelsIpsec(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/ipsec'''
+
+    cli_command = '/mgmt/tm/net/tunnels/ipsec'
+
+
+class NetTunnelsLw4o6(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/lw4o6'''
+
+    cli_command = '/mgmt/tm/net/tunnels/lw4o6'
+
+
+class NetTunnelsMap(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/map'''
+
+    cli_command = '/mgmt/tm/net/tunnels/map'
+
+
+class NetTunnelsPpp(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/ppp'''
+
+    cli_command = '/mgmt/tm/net/tunnels/ppp'
+
+
+class NetTunnelsTcpforward(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/tcp-forward'''
+
+    cli_command = '/mgmt/tm/net/tunnels/tcp-forward'
+
+
+class NetTunnelsTunnel(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/tunnel'''
+
+    cli_command = '/mgmt/tm/net/tunnels/tunnel'
+
+
+class NetTunnelsV6rd(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/v6rd'''
+
+    cli_command = '/mgmt/tm/net/tunnels/v6rd'
+
+
+class NetTunnelsVxlan(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/vxlan'''
+
+    cli_command = '/mgmt/tm/net/tunnels/vxlan'
+
+
+class NetTunnelsWccp(RestResource):
+    '''To F5 resource for /mgmt/tm/net/tunnels/wccp'''
+
+    cli_command = '/mgmt/tm/net/tunnels/wccp'
+
+
+class NetVlan(RestResource):
+    '''To F5 resource for /mgmt/tm/net/vlan'''
+
+    cli_command = '/mgmt/tm/net/vlan'
+
+
+class NetVlanallowed(RestResource):
+    '''To F5 resource for /mgmt/tm/net/vlan-allowed'''
+
+    cli_command = '/mgmt/tm/net/vlan-allowed'
+
+
+class NetVlangroup(RestResource):
+    '''To F5 resource for /mgmt/tm/net/vlan-group'''
+
+    cli_command = '/mgmt/tm/net/vlan-group'
+
+
+class NetWccp(RestResource):
+    '''To F5 resource for /mgmt/tm/net/wccp'''
+
+    cli_command = '/mgmt/tm/net/wccp'
+
+
+class SecurityFirewall(RestResource):
+    '''To F5 resource for /mgmt/tm/security/firewall'''
+
+    cli_command = '/mgmt/tm/security/firewall'
+
+
+class SecurityFirewallManagementiprules(RestResource):
+    '''To F5 resource for /mgmt/tm/security/firewall/management-ip-rules'''
+
+    cli_command = '/mgmt/tm/security/firewall/management-ip-rules'
+
+
+class SecurityFirewallUuiddefaultautogenerate(RestResource):
+    '''To F5 resource for /mgmt/tm/security/firewall/uuid-default-autogenerate'''
+
+    cli_command = '/mgmt/tm/security/firewall/uuid-default-autogenerate'
+
+
+class SharedBigipfailoverstate(RestResource):
+    '''To F5 resource for /mgmt/tm/shared/bigip-failover-state'''
+
+    cli_command = '/mgmt/tm/shared/bigip-failover-state'
+
+
+class SharedLicensingActivation(RestResource):
+    '''To F5 resource for /mgmt/tm/shared/licensing/activation'''
+
+    cli_command = '/mgmt/tm/shared/licensing/activation'
+
+
+class SharedLicensingRegistration(RestResource):
+    '''To F5 resource for /mgmt/tm/shared/licensing/registration'''
+
+    cli_command = '/mgmt/tm/shared/licensing/registration'
+
+
+class SharedSysBackup(RestResource):
+    '''To F5 resource for /mgmt/tm/shared/sys/backup'''
+
+    cli_command = '/mgmt/tm/shared/sys/backup'
+
+
+class SysAlert(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/alert'''
+
+    cli_command = '/mgmt/tm/sys/alert'
+
+
+class SysAlertLcd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/alert/lcd'''
+
+    cli_command = '/mgmt/tm/sys/alert/lcd'
+
+
+class SysAom(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/aom'''
+
+    cli_command = '/mgmt/tm/sys/aom'
+
+
+class SysApplication(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/application'''
+
+    cli_command = '/mgmt/tm/sys/application'
+
+
+class SysApplicationAplscript(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/application/apl-script'''
+
+    cli_command = '/mgmt/tm/sys/application/apl-script'
+
+
+class SysApplicationCustomstat(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/application/custom-stat'''
+
+    cli_command = '/mgmt/tm/sys/application/custom-stat'
+
+
+class SysApplicationService(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/application/service'''
+
+    cli_command = '/mgmt/tm/sys/application/service'
+
+
+class SysApplicationTemplate(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/application/template'''
+
+    cli_command = '/mgmt/tm/sys/application/template'
+
+
+class SysApplicationTemplatemodeltasks(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/application/template-model-tasks'''
+
+    cli_command = '/mgmt/tm/sys/application/template-model-tasks'
+
+
+class SysAutoscalegroup(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/autoscale-group'''
+
+    cli_command = '/mgmt/tm/sys/autoscale-group'
+
+
+class SysClock(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/clock'''
+
+    cli_command = '/mgmt/tm/sys/clock'
+
+
+class SysCluster(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/cluster'''
+
+    cli_command = '/mgmt/tm/sys/cluster'
+
+
+class SysConnection(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/connection'''
+
+    cli_command = '/mgmt/tm/sys/connection'
+
+
+class SysConsole(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/console'''
+
+    cli_command = '/mgmt/tm/sys/console'
+
+
+class SysCpu(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/cpu'''
+
+    cli_command = '/mgmt/tm/sys/cpu'
+
+
+class SysCrypto(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto'''
+
+    cli_command = '/mgmt/tm/sys/crypto'
+
+
+class SysCryptoAllowkeyexport(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/allow-key-export'''
+
+    cli_command = '/mgmt/tm/sys/crypto/allow-key-export'
+
+
+class SysCryptoCabundlemanager(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/ca-bundle-manager'''
+
+    cli_command = '/mgmt/tm/sys/crypto/ca-bundle-manager'
+
+
+class SysCryptoCert(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/cert'''
+
+    cli_command = '/mgmt/tm/sys/crypto/cert'
+
+
+class SysCryptoCertordermanager(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/cert-order-manager'''
+
+    cli_command = '/mgmt/tm/sys/crypto/cert-order-manager'
+
+
+class SysCryptoCertvalidator(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/cert-validator'''
+
+    cli_command = '/mgmt/tm/sys/crypto/cert-validator'
+
+
+class SysCryptoCrl(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/cert-validator/crl'''
+
+    cli_command = '/mgmt/tm/sys/crypto/cert-validator/crl'
+
+
+class SysCryptoOcsp(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/cert-validator/ocsp'''
+
+    cli_command = '/mgmt/tm/sys/crypto/cert-validator/ocsp'
+
+
+class SysCryptoClient(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/client'''
+
+    cli_command = '/mgmt/tm/sys/crypto/client'
+
+
+class SysCryptoCsr(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/csr'''
+
+    cli_command = '/mgmt/tm/sys/crypto/csr'
+
+
+class SysCryptoEncryptedattributes(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/encrypted-attributes'''
+
+    cli_command = '/mgmt/tm/sys/crypto/encrypted-attributes'
+
+
+class SysCryptoFips(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/fips'''
+
+    cli_command = '/mgmt/tm/sys/crypto/fips'
+
+
+class SysCryptoExternalhsm(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/fips/external-hsm'''
+
+    cli_command = '/mgmt/tm/sys/crypto/fips/external-hsm'
+
+
+class SysCryptoNethsmpartition(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/fips/nethsm-partition'''
+
+    cli_command = '/mgmt/tm/sys/crypto/fips/nethsm-partition'
+
+
+class SysCryptoKey(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/key'''
+
+    cli_command = '/mgmt/tm/sys/crypto/key'
+
+
+class SysCryptoMasterkey(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/master-key'''
+
+    cli_command = '/mgmt/tm/sys/crypto/master-key'
+
+
+class SysCryptoServer(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/crypto/server'''
+
+    cli_command = '/mgmt/tm/sys/crypto/server'
+
+
+class SysDaemonha(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/daemon-ha'''
+
+    cli_command = '/mgmt/tm/sys/daemon-ha'
+
+
+class SysDaemonlogsettings(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/daemon-log-settings'''
+
+    cli_command = '/mgmt/tm/sys/daemon-log-settings'
+
+
+class SysDaemonlogsettingsClusterd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/daemon-log-settings/clusterd'''
+
+    cli_command = '/mgmt/tm/sys/daemon-log-settings/clusterd'
+
+
+class SysDaemonlogsettingsCsyncd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/daemon-log-settings/csyncd'''
+
+    cli_command = '/mgmt/tm/sys/daemon-log-settings/csyncd'
+
+
+class SysDaemonlogsettingsIcreventd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/daemon-log-settings/icr-eventd'''
+
+    cli_command = '/mgmt/tm/sys/daemon-log-settings/icr-eventd'
+
+
+class SysDaemonlogsettingsIcrd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/daemon-log-settings/icrd'''
+
+    cli_command = '/mgmt/tm/sys/daemon-log-settings/icrd'
+
+
+class SysDaemonlogsettingsLind(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/daemon-log-settings/lind'''
+
+    cli_command = '/mgmt/tm/sys/daemon-log-settings/lind'
+
+
+class SysDaemonlogsettingsMcpd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/daemon-log-settings/mcpd'''
+
+    cli_command = '/mgmt/tm/sys/daemon-log-settings/mcpd'
+
+
+class SysDaemonlogsettingsTmm(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/daemon-log-settings/tmm'''
+
+    cli_command = '/mgmt/tm/sys/daemon-log-settings/tmm'
+
+
+class SysDatastor(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/datastor'''
+
+    cli_command = '/mgmt/tm/sys/datastor'
+
+
+class SysDb(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/db'''
+
+    cli_command = '/mgmt/tm/sys/db'
+
+
+class SysDiags(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/diags'''
+
+    cli_command = '/mgmt/tm/sys/diags'
+
+
+class SysDiagsIhealth(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/diags/ihealth'''
+
+    cli_command = '/mgmt/tm/sys/diags/ihealth'
+
+
+class SysDiagsIhealthrequest(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/diags/ihealth-request'''
+
+    cli_command = '/mgmt/tm/sys/diags/ihealth-request'
+
+
+class SysDiagsIhealthresult(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/diags/ihealth-result'''
+
+    cli_command = '/mgmt/tm/sys/diags/ihealth-result'
+
+
+class SysDisk(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/disk'''
+
+    cli_command = '/mgmt/tm/sys/disk'
+
+
+class SysDiskApplicationvolume(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/disk/application-volume'''
+
+    cli_command = '/mgmt/tm/sys/disk/application-volume'
+
+
+class SysDiskDirectory(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/disk/directory'''
+
+    cli_command = '/mgmt/tm/sys/disk/directory'
+
+
+class SysDiskLogicaldisk(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/disk/logical-disk'''
+
+    cli_command = '/mgmt/tm/sys/disk/logical-disk'
+
+
+class SysDns(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/dns'''
+
+    cli_command = '/mgmt/tm/sys/dns'
+
+
+class SysDynad(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/dynad'''
+
+    cli_command = '/mgmt/tm/sys/dynad'
+
+
+class SysDynadInstrumentation(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/dynad/instrumentation'''
+
+    cli_command = '/mgmt/tm/sys/dynad/instrumentation'
+
+
+class SysDynadKey(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/dynad/key'''
+
+    cli_command = '/mgmt/tm/sys/dynad/key'
+
+
+class SysDynadRpm(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/dynad/rpm'''
+
+    cli_command = '/mgmt/tm/sys/dynad/rpm'
+
+
+class SysDynadSettings(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/dynad/settings'''
+
+    cli_command = '/mgmt/tm/sys/dynad/settings'
+
+
+class SysDynadStatus(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/dynad/status'''
+
+    cli_command = '/mgmt/tm/sys/dynad/status'
+
+
+class SysEcm(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ecm'''
+
+    cli_command = '/mgmt/tm/sys/ecm'
+
+
+class SysEcmCloudprovider(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ecm/cloud-provider'''
+
+    cli_command = '/mgmt/tm/sys/ecm/cloud-provider'
+
+
+class SysEcmConfig(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ecm/config'''
+
+    cli_command = '/mgmt/tm/sys/ecm/config'
+
+
+class SysFailover(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/failover'''
+
+    cli_command = '/mgmt/tm/sys/failover'
+
+
+class SysFeaturemodule(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/feature-module'''
+
+    cli_command = '/mgmt/tm/sys/feature-module'
+
+
+class SysFile(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file'''
+
+    cli_command = '/mgmt/tm/sys/file'
+
+
+class SysFileApachesslcert(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/apache-ssl-cert'''
+
+    cli_command = '/mgmt/tm/sys/file/apache-ssl-cert'
+
+
+class SysFileBrowsercapabilitiesdb(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/browser-capabilities-db'''
+
+    cli_command = '/mgmt/tm/sys/file/browser-capabilities-db'
+
+
+class SysFileDashboardviewset(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/dashboard-viewset'''
+
+    cli_command = '/mgmt/tm/sys/file/dashboard-viewset'
+
+
+class SysFileDatagroup(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/data-group'''
+
+    cli_command = '/mgmt/tm/sys/file/data-group'
+
+
+class SysFileDevicecapabilitiesdb(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/device-capabilities-db'''
+
+    cli_command = '/mgmt/tm/sys/file/device-capabilities-db'
+
+
+class SysFileExternalmonitor(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/external-monitor'''
+
+    cli_command = '/mgmt/tm/sys/file/external-monitor'
+
+
+class SysFileIfile(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/ifile'''
+
+    cli_command = '/mgmt/tm/sys/file/ifile'
+
+
+class SysFileLwtunneltbl(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/lwtunneltbl'''
+
+    cli_command = '/mgmt/tm/sys/file/lwtunneltbl'
+
+
+class SysFileSslcert(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/ssl-cert'''
+
+    cli_command = '/mgmt/tm/sys/file/ssl-cert'
+
+
+class SysFileSslcrl(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/ssl-crl'''
+
+    cli_command = '/mgmt/tm/sys/file/ssl-crl'
+
+
+class SysFileSslcsr(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/ssl-csr'''
+
+    cli_command = '/mgmt/tm/sys/file/ssl-csr'
+
+
+class SysFileSslkey(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/ssl-key'''
+
+    cli_command = '/mgmt/tm/sys/file/ssl-key'
+
+
+class SysFileSystemsslcert(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/system-ssl-cert'''
+
+    cli_command = '/mgmt/tm/sys/file/system-ssl-cert'
+
+
+class SysFileSystemsslkey(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/file/system-ssl-key'''
+
+    cli_command = '/mgmt/tm/sys/file/system-ssl-key'
+
+
+class SysFixconnection(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/fix-connection'''
+
+    cli_command = '/mgmt/tm/sys/fix-connection'
+
+
+class SysFolder(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/folder'''
+
+    cli_command = '/mgmt/tm/sys/folder'
+
+
+class SysFpga(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/fpga'''
+
+    cli_command = '/mgmt/tm/sys/fpga'
+
+
+class SysFpgaFirmwareconfig(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/fpga/firmware-config'''
+
+    cli_command = '/mgmt/tm/sys/fpga/firmware-config'
+
+
+class SysFpgaInfo(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/fpga/info'''
+
+    cli_command = '/mgmt/tm/sys/fpga/info'
+
+
+class SysFpgaTurboflexprofile(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/fpga/turboflex-profile'''
+
+    cli_command = '/mgmt/tm/sys/fpga/turboflex-profile'
+
+
+class SysGlobalsettings(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/global-settings'''
+
+    cli_command = '/mgmt/tm/sys/global-settings'
+
+
+class SysHagroup(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ha-group'''
+
+    cli_command = '/mgmt/tm/sys/ha-group'
+
+
+class SysHamirror(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ha-mirror'''
+
+    cli_command = '/mgmt/tm/sys/ha-mirror'
+
+
+class SysHastatus(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ha-status'''
+
+    cli_command = '/mgmt/tm/sys/ha-status'
+
+
+class SysHardware(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/hardware'''
+
+    cli_command = '/mgmt/tm/sys/hardware'
+
+
+class SysHostinfo(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/host-info'''
+
+    cli_command = '/mgmt/tm/sys/host-info'
+
+
+class SysHttpd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/httpd'''
+
+    cli_command = '/mgmt/tm/sys/httpd'
+
+
+class SysHypervisorinfo(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/hypervisor-info'''
+
+    cli_command = '/mgmt/tm/sys/hypervisor-info'
+
+
+class SysIcall(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icall'''
+
+    cli_command = '/mgmt/tm/sys/icall'
+
+
+class SysIcallHandler(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icall/handler'''
+
+    cli_command = '/mgmt/tm/sys/icall/handler'
+
+
+class SysIcallPeriodic(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icall/handler/periodic'''
+
+    cli_command = '/mgmt/tm/sys/icall/handler/periodic'
+
+
+class SysIcallPerpetual(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icall/handler/perpetual'''
+
+    cli_command = '/mgmt/tm/sys/icall/handler/perpetual'
+
+
+class SysIcallTriggered(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icall/handler/triggered'''
+
+    cli_command = '/mgmt/tm/sys/icall/handler/triggered'
+
+
+class SysIcallIstatstrigger(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icall/istats-trigger'''
+
+    cli_command = '/mgmt/tm/sys/icall/istats-trigger'
+
+
+class SysIcallPublisher(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icall/publisher'''
+
+    cli_command = '/mgmt/tm/sys/icall/publisher'
+
+
+class SysIcallScript(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icall/script'''
+
+    cli_command = '/mgmt/tm/sys/icall/script'
+
+
+class SysIcmpstat(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icmp-stat'''
+
+    cli_command = '/mgmt/tm/sys/icmp-stat'
+
+
+class SysIcontrolsoap(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/icontrol-soap'''
+
+    cli_command = '/mgmt/tm/sys/icontrol-soap'
+
+
+class SysInternalproxy(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/internal-proxy'''
+
+    cli_command = '/mgmt/tm/sys/internal-proxy'
+
+
+class SysIpaddress(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ip-address'''
+
+    cli_command = '/mgmt/tm/sys/ip-address'
+
+
+class SysIpstat(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ip-stat'''
+
+    cli_command = '/mgmt/tm/sys/ip-stat'
+
+
+class SysIpfix(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ipfix'''
+
+    cli_command = '/mgmt/tm/sys/ipfix'
+
+
+class SysIpfixDestination(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ipfix/destination'''
+
+    cli_command = '/mgmt/tm/sys/ipfix/destination'
+
+
+class SysIpfixElement(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ipfix/element'''
+
+    cli_command = '/mgmt/tm/sys/ipfix/element'
+
+
+class SysIpfixIrules(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ipfix/irules'''
+
+    cli_command = '/mgmt/tm/sys/ipfix/irules'
+
+
+class SysIprepstatus(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/iprep-status'''
+
+    cli_command = '/mgmt/tm/sys/iprep-status'
+
+
+class SysLicense(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/license'''
+
+    cli_command = '/mgmt/tm/sys/license'
+
+
+class SysLog(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log'''
+
+    cli_command = '/mgmt/tm/sys/log'
+
+
+class SysLogconfig(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config'''
+
+    cli_command = '/mgmt/tm/sys/log-config'
+
+
+class SysLogconfigDestination(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination'
+
+
+class SysLogconfigAlertd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination/alertd'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination/alertd'
+
+
+class SysLogconfigArcsight(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination/arcsight'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination/arcsight'
+
+
+class SysLogconfigIpfix(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination/ipfix'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination/ipfix'
+
+
+class SysLogconfigLocaldatabase(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination/local-database'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination/local-database'
+
+
+class SysLogconfigLocalsyslog(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination/local-syslog'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination/local-syslog'
+
+
+class SysLogconfigManagementport(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination/management-port'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination/management-port'
+
+
+class SysLogconfigRemotehighspeedlog(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination/remote-high-speed-log'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination/remote-high-speed-log'
+
+
+class SysLogconfigRemotesyslog(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination/remote-syslog'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination/remote-syslog'
+
+
+class SysLogconfigSplunk(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/destination/splunk'''
+
+    cli_command = '/mgmt/tm/sys/log-config/destination/splunk'
+
+
+class SysLogconfigFilter(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/filter'''
+
+    cli_command = '/mgmt/tm/sys/log-config/filter'
+
+
+class SysLogconfigPublisher(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-config/publisher'''
+
+    cli_command = '/mgmt/tm/sys/log-config/publisher'
+
+
+class SysLogrotate(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/log-rotate'''
+
+    cli_command = '/mgmt/tm/sys/log-rotate'
+
+
+class SysMacaddress(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/mac-address'''
+
+    cli_command = '/mgmt/tm/sys/mac-address'
+
+
+class SysManagementdhcp(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/management-dhcp'''
+
+    cli_command = '/mgmt/tm/sys/management-dhcp'
+
+
+class SysManagementip(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/management-ip'''
+
+    cli_command = '/mgmt/tm/sys/management-ip'
+
+
+class SysManagementovsdb(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/management-ovsdb'''
+
+    cli_command = '/mgmt/tm/sys/management-ovsdb'
+
+
+class SysManagementproxyconfig(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/management-proxy-config'''
+
+    cli_command = '/mgmt/tm/sys/management-proxy-config'
+
+
+class SysManagementroute(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/management-route'''
+
+    cli_command = '/mgmt/tm/sys/management-route'
+
+
+class SysMcpstate(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/mcp-state'''
+
+    cli_command = '/mgmt/tm/sys/mcp-state'
+
+
+class SysMemory(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/memory'''
+
+    cli_command = '/mgmt/tm/sys/memory'
+
+
+class SysNethsm(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/nethsm'''
+
+    cli_command = '/mgmt/tm/sys/nethsm'
+
+
+class SysNethsmAsyncqueuestat(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/nethsm/async-queue-stat'''
+
+    cli_command = '/mgmt/tm/sys/nethsm/async-queue-stat'
+
+
+class SysNethsmPkcs11dstat(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/nethsm/pkcs11d-stat'''
+
+    cli_command = '/mgmt/tm/sys/nethsm/pkcs11d-stat'
+
+
+class SysNethsmSyncqueuestat(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/nethsm/sync-queue-stat'''
+
+    cli_command = '/mgmt/tm/sys/nethsm/sync-queue-stat'
+
+
+class SysNtp(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ntp'''
+
+    cli_command = '/mgmt/tm/sys/ntp'
+
+
+class SysOutboundsmtp(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/outbound-smtp'''
+
+    cli_command = '/mgmt/tm/sys/outbound-smtp'
+
+
+class SysPerformance(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/performance'''
+
+    cli_command = '/mgmt/tm/sys/performance'
+
+
+class SysPerformanceAllstats(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/performance/all-stats'''
+
+    cli_command = '/mgmt/tm/sys/performance/all-stats'
+
+
+class SysPerformanceConnections(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/performance/connections'''
+
+    cli_command = '/mgmt/tm/sys/performance/connections'
+
+
+class SysPerformanceDnsexpress(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/performance/dnsexpress'''
+
+    cli_command = '/mgmt/tm/sys/performance/dnsexpress'
+
+
+class SysPerformanceDnssec(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/performance/dnssec'''
+
+    cli_command = '/mgmt/tm/sys/performance/dnssec'
+
+
+class SysPerformanceGtm(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/performance/gtm'''
+
+    cli_command = '/mgmt/tm/sys/performance/gtm'
+
+
+class SysPerformanceRamcache(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/performance/ramcache'''
+
+    cli_command = '/mgmt/tm/sys/performance/ramcache'
+
+
+class SysPerformanceSystem(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/performance/system'''
+
+    cli_command = '/mgmt/tm/sys/performance/system'
+
+
+class SysPerformanceThroughput(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/performance/throughput'''
+
+    cli_command = '/mgmt/tm/sys/performance/throughput'
+
+
+class SysPfman(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/pfman'''
+
+    cli_command = '/mgmt/tm/sys/pfman'
+
+
+class SysPfmanConsumer(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/pfman/consumer'''
+
+    cli_command = '/mgmt/tm/sys/pfman/consumer'
+
+
+class SysPfmanDevice(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/pfman/device'''
+
+    cli_command = '/mgmt/tm/sys/pfman/device'
+
+
+class SysPptpcallinfo(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/pptp-call-info'''
+
+    cli_command = '/mgmt/tm/sys/pptp-call-info'
+
+
+class SysProcinfo(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/proc-info'''
+
+    cli_command = '/mgmt/tm/sys/proc-info'
+
+
+class SysProvision(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/provision'''
+
+    cli_command = '/mgmt/tm/sys/provision'
+
+
+class SysPvatraffic(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/pva-traffic'''
+
+    cli_command = '/mgmt/tm/sys/pva-traffic'
+
+
+class SysRaid(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/raid'''
+
+    cli_command = '/mgmt/tm/sys/raid'
+
+
+class SysRaidArray(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/raid/array'''
+
+    cli_command = '/mgmt/tm/sys/raid/array'
+
+
+class SysRaidBay(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/raid/bay'''
+
+    cli_command = '/mgmt/tm/sys/raid/bay'
+
+
+class SysRaidDisk(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/raid/disk'''
+
+    cli_command = '/mgmt/tm/sys/raid/disk'
+
+
+class SysReady(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ready'''
+
+    cli_command = '/mgmt/tm/sys/ready'
+
+
+class SysScriptd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/scriptd'''
+
+    cli_command = '/mgmt/tm/sys/scriptd'
+
+
+class SysService(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/service'''
+
+    cli_command = '/mgmt/tm/sys/service'
+
+
+class SysSflow(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sflow'''
+
+    cli_command = '/mgmt/tm/sys/sflow'
+
+
+class SysSflowDatasource(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sflow/data-source'''
+
+    cli_command = '/mgmt/tm/sys/sflow/data-source'
+
+
+class SysSflowHttp(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sflow/data-source/http'''
+
+    cli_command = '/mgmt/tm/sys/sflow/data-source/http'
+
+
+class SysSflowInterface(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sflow/data-source/interface'''
+
+    cli_command = '/mgmt/tm/sys/sflow/data-source/interface'
+
+
+class SysSflowSystem(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sflow/data-source/system'''
+
+    cli_command = '/mgmt/tm/sys/sflow/data-source/system'
+
+
+class SysSflowGlobalsettings(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sflow/global-settings'''
+
+    cli_command = '/mgmt/tm/sys/sflow/global-settings'
+
+
+class SysSflowVlan(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sflow/global-settings/vlan'''
+
+    cli_command = '/mgmt/tm/sys/sflow/global-settings/vlan'
+
+
+class SysSflowReceiver(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sflow/receiver'''
+
+    cli_command = '/mgmt/tm/sys/sflow/receiver'
+
+
+class SysSmtpserver(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/smtp-server'''
+
+    cli_command = '/mgmt/tm/sys/smtp-server'
+
+
+class SysSnmp(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/snmp'''
+
+    cli_command = '/mgmt/tm/sys/snmp'
+
+
+class SysSoftware(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software'''
+
+    cli_command = '/mgmt/tm/sys/software'
+
+
+class SysSoftwareBlockdevicehotfix(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software/block-device-hotfix'''
+
+    cli_command = '/mgmt/tm/sys/software/block-device-hotfix'
+
+
+class SysSoftwareBlockdeviceimage(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software/block-device-image'''
+
+    cli_command = '/mgmt/tm/sys/software/block-device-image'
+
+
+class SysSoftwareHotfix(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software/hotfix'''
+
+    cli_command = '/mgmt/tm/sys/software/hotfix'
+
+
+class SysSoftwareImage(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software/image'''
+
+    cli_command = '/mgmt/tm/sys/software/image'
+
+
+class SysSoftwareSignature(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software/signature'''
+
+    cli_command = '/mgmt/tm/sys/software/signature'
+
+
+class SysSoftwareStatus(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software/status'''
+
+    cli_command = '/mgmt/tm/sys/software/status'
+
+
+class SysSoftwareUpdate(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software/update'''
+
+    cli_command = '/mgmt/tm/sys/software/update'
+
+
+class SysSoftwareUpdatestatus(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software/update-status'''
+
+    cli_command = '/mgmt/tm/sys/software/update-status'
+
+
+class SysSoftwareVolume(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/software/volume'''
+
+    cli_command = '/mgmt/tm/sys/software/volume'
+
+
+class SysSshd(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sshd'''
+
+    cli_command = '/mgmt/tm/sys/sshd'
+
+
+class SysStatemirroring(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/state-mirroring'''
+
+    cli_command = '/mgmt/tm/sys/state-mirroring'
+
+
+class SysSyncsysfiles(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/sync-sys-files'''
+
+    cli_command = '/mgmt/tm/sys/sync-sys-files'
+
+
+class SysSyslog(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/syslog'''
+
+    cli_command = '/mgmt/tm/sys/syslog'
+
+
+class SysTmminfo(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/tmm-info'''
+
+    cli_command = '/mgmt/tm/sys/tmm-info'
+
+
+class SysTmmtraffic(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/tmm-traffic'''
+
+    cli_command = '/mgmt/tm/sys/tmm-traffic'
+
+
+class SysTraffic(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/traffic'''
+
+    cli_command = '/mgmt/tm/sys/traffic'
+
+
+class SysTurboflex(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/turboflex'''
+
+    cli_command = '/mgmt/tm/sys/turboflex'
+
+
+class SysTurboflexFeatures(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/turboflex/features'''
+
+    cli_command = '/mgmt/tm/sys/turboflex/features'
+
+
+class SysTurboflexProfile(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/turboflex/profile'''
+
+    cli_command = '/mgmt/tm/sys/turboflex/profile'
+
+
+class SysTurboflexProfileconfig(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/turboflex/profile-config'''
+
+    cli_command = '/mgmt/tm/sys/turboflex/profile-config'
+
+
+class SysTurboflexAll(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/turboflex/profile/all'''
+
+    cli_command = '/mgmt/tm/sys/turboflex/profile/all'
+
+
+class SysTurboflexFeature(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/turboflex/profile/feature'''
+
+    cli_command = '/mgmt/tm/sys/turboflex/profile/feature'
+
+
+class SysTurboflexWarning(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/turboflex/warning'''
+
+    cli_command = '/mgmt/tm/sys/turboflex/warning'
+
+
+class SysUcs(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/ucs'''
+
+    cli_command = '/mgmt/tm/sys/ucs'
+
+
+class SysUrldb(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/url-db'''
+
+    cli_command = '/mgmt/tm/sys/url-db'
+
+
+class SysUrldbDownloadresult(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/url-db/download-result'''
+
+    cli_command = '/mgmt/tm/sys/url-db/download-result'
+
+
+class SysUrldbDownloadschedule(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/url-db/download-schedule'''
+
+    cli_command = '/mgmt/tm/sys/url-db/download-schedule'
+
+
+class SysUrldbUrlcategory(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/url-db/url-category'''
+
+    cli_command = '/mgmt/tm/sys/url-db/url-category'
+
+
+class SysVersion(RestResource):
+    '''To F5 resource for /mgmt/tm/sys/version'''
+
+    cli_command = '/mgmt/tm/sys/version'
+
+
+class WomProfile(RestResource):
+    '''To F5 resource for /mgmt/tm/wom/profile'''
+
+    cli_command = '/mgmt/tm/wom/profile'
+
+
+class WomProfileIsession(RestResource):
+    '''To F5 resource for /mgmt/tm/wom/profile/isession'''
+
+    cli_command = '/mgmt/tm/wom/profile/isession'
+
+
+# name of the parser class: path of the resource
+RESOURCES = {cls.__name__: cls.cli_command
+             for cls in RestResource.__subclasses__()}
@@ -69,6 +69,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.dispatcher import LineDispatcher
+from genie.libs.parser.utils.subcommands import execute_many
 
 
 # ============================================
@@ -162,40 +165,25 @@ class ShowBgpSuperParser(ShowBgpSchema):
         * 'show ip bgp {address_family} vrf {vrf}'
     '''
 
-    def cli(self, address_family='', vrf='', output=None):
-
-        # Init dictionary
-        route_dict = {}
-        af_dict = {}
-        if not vrf:
-            vrf = 'default'
-        if address_family:
-            original_address_family = address_family
-        index = 1
-        bgp_table_version = local_router_id = ''
-        metric = localpref = weight = ''
-        status_codes = ''
-        prefix = ""
-        origin_codes_info = origin_codes_data = ""
-
+    patterns = Patterns(
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^\s*For +address +family:'
-                        r' +(?P<address_family>[\S\s]+)$')
+        p1=r'^\s*For +address +family:'
+           r' +(?P<address_family>[\S\s]+)$',
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                        r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                        r' +ID +is +(?P<local_router_id>(\S+))$')
+        p2=r'^\s*BGP +table +version +is'
+           r' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+           r' +ID +is +(?P<local_router_id>(\S+))$',
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # *>   [5][65535:1][0][24][10.1.1.0]/17
         # *>  100:2051:VEID-2:Blk-1/136
         #  *>   [3][3001:1][*][*][1.1.1.1]/14
         # *m   [2][2.2.2.2:1][0][48][000C293B2157][0][*]/20
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
-                          r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-\*]+)'
-                          r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|\s)+)?'
+             r'(?P<path_type>(i|e|c|l|a|r|I))?\s*'
+             r'(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,\-\*]+)'
+             r'(?: *(?P<param>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
 
         #     Network          Next Hop            Metric LocPrf Weight Path
         # * i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
@@ -204,11 +192,11 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # r>                    0.0.0.0                 0         32768 ?
         # *m                    0.0.0.0                 0         32768 ?
         # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
-                          r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
-                          r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                          r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
-                          r'(?P<termination>[\s\S]+)$')
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|m|r|\s)+)?'
+             r'(?P<path_type>(i|e|c|l|a|r|I))?\s{10,20}'
+             r'(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             r' +(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +(?P<weight>\d+)'
+             r'(?P<termination>[\s\S]+)$',
 
         # Network            Next Hop            Metric     LocPrf     Weight Path
         # *    10.36.3.0/24       10.36.3.254                0             0 65530 ?
@@ -218,39 +206,58 @@ class ShowBgpSuperParser(ShowBgpSchema):
         # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
         # *>  100:2051:VEID-2:Blk-1/136
         # *>i10.1.1.0/24   0.0.0.0                   0    100      0 1234 60000 ?
-        p4 = re.compile(r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
-                        r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
-                        r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
-                        r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
-                        r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
-                        r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
-                        r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$')
+        p4=r'^\s*(?P<status_codes>(?:s|x|S|d|h|m|r|\*|\>|\s)+)?'
+           r'(?P<path_type>(?:i|e|c|l|a|r|I))? *'
+           r'(?P<prefix>[a-zA-Z0-9\.\:\/\-\[\]]+) +'
+           r'(?P<next_hop>[a-zA-Z0-9\.\:]+) +'
+           r'(?P<metric>(?:\d+(?=[ \d]{13}\d ))?) +'
+           r'(?P<local_prf>(?:\d+(?=[ \d]{6}\d ))?) +'
+           r'(?P<weight>\d+)(?P<path>[0-9 \S\{\}]+)$',
 
         # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-        p5 = re.compile(r'^\s*AF-Private +Import +to +Address-Family:'
-                        r' +(?P<af_private_import_to_address_family>[\s\S]+),'
-                        r' +Pfx +Count/Limit:'
-                        r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$')
+        p5=r'^\s*AF-Private +Import +to +Address-Family:'
+           r' +(?P<af_private_import_to_address_family>[\s\S]+),'
+           r' +Pfx +Count/Limit:'
+           r' +(?P<pfx_count>[\d]+)\/+(?P<pfx_limit>[\d]+)$',
 
         # Route Distinguisher: 200:1
         # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-        p6 = re.compile(r'^\s*Route +Distinguisher *: '
-                        r'+(?P<route_distinguisher>(\S+))'
-                        r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                        r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p6=r'^\s*Route +Distinguisher *: '
+           r'+(?P<route_distinguisher>(\S+))'
+           r'( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+           r'( +VRF Router ID (?P<vrf_router_id>(\S+)))?$',
+    )
+
+    def cli(self, address_family='', vrf='', output=None):
+
+        # Init dictionary
+        route_dict = {}
+        af_dict = {}
+        if not vrf:
+            vrf = 'default'
+        if address_family:
+            original_address_family = address_family
+        index = 1
+        bgp_table_version = local_router_id = ''
+        metric = localpref = weight = ''
+        status_codes = ''
+        prefix = ""
+        origin_codes_info = origin_codes_data = ""
+
+        p = ShowBgpSuperParser.patterns
 
         for line in output.splitlines():
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
                 original_address_family = address_family
                 continue
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -259,7 +266,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             #     Network          Next Hop            Metric LocPrf Weight Path
             # *>   [5][65535:1][0][24][10.1.1.0]/17
             # *>  100:2051:VEID-2:Blk-1/136
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 # Get keys
                 if m.groupdict()['status_codes']:
@@ -282,7 +289,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             #                      0.0.0.0                  0         32768 ?
             # *>                    0.0.0.0                 0         32768 ?
             # * i                  ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 # Get keys
                 path_type = ""
@@ -368,7 +375,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
             # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
             # *>i 2001:db8:cdc9:121::/64   ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
             # *>  100:2051:VEID-2:Blk-1/136
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 path_type = ""
                 path_data = ""
@@ -446,7 +453,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
                 continue
 
             # AF-Private Import to Address-Family: L2VPN E-VPN, Pfx Count/Limit: 2/1000
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 af_private_import_to_address_family = m.groupdict()['af_private_import_to_address_family']
                 pfx_count = int(m.groupdict()['pfx_count'])
@@ -475,7 +482,7 @@ class ShowBgpSuperParser(ShowBgpSchema):
 
             # Route Distinguisher: 200:1
             # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -770,45 +777,27 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         * 'show ip bgp {address_family} rd {rd} detail'
     '''
 
-    def cli(self, address_family='', vrf='', rd='', evi='', rt='', output=None):
-        # Init dictionary
-        ret_dict = {}
-        subdict = ''
-        next_line_update_group = False
-        route_distinguisher = ''
-        new_address_family = ''
-        original_address_family = address_family
-        refresh_epoch_flag = False
-        route_info = ''
-        route_status = ''
-        aggregated_by_as = ''
-        aggregated_by_address = ''
-        imported_path_from = ''
-        imported_safety_path = False
-        refresh_epoch = None
-        cmd_vrf = vrf if vrf else None
-        default_vrf = None
-        nlri_data = {}
+    patterns = Patterns(
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family:'
-                        r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$')
+        p1=r'^For +address +family:'
+           r' +(?P<address_family>[a-zA-Z0-9\-\s]+)$',
 
         # Paths: (1 available, best #1, table default)
         # Paths: (1 available, best #1, table VRF1)
         # Paths: (1 available, best #1, no table)
         # Paths: (1 available, best #1, table default, RIB-failure(17))
-        p2 = re.compile(r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
-                        r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
-                        r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)')
+        p2=r'^Paths: +\((?P<paths>(?P<available_path>[0-9]+) +available\, '
+           r'+(no +best +path|best +\#(?P<best_path>[0-9]+))\,?(?: +(table +('
+           r'?P<vrf_id>\S+?)|no +table))?,?(?: +(.*))?)\)',
 
         # Route Distinguisher: 100:100 (default for vrf VRF1)
         # Route Distinguisher: 65535:1 (default for vrf evpn1)
         # Route Distinguisher: 65109:3051
         # Route Distinguisher: 10.100.1.1:3014 (default for vrf vrf1)
-        p2_1 = re.compile(r'^Route +Distinguisher:'
-                          r' +(?P<route_distinguisher>[0-9.\:]+)'
-                          r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$')
+        p2_1=r'^Route +Distinguisher:'
+             r' +(?P<route_distinguisher>[0-9.\:]+)'
+             r'(?: +\(default +for +vrf +(?P<vrf_id>(\S+))\))?$',
 
         # BGP routing table entry for 10.4.1.1/32, version 4
         # BGP routing table entry for [100:100]2001:11:11::11/128, version 2
@@ -817,136 +806,134 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # BGP routing table entry for 2001:2:2:2::2/128, version 2
         # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
         # BGP routing table entry for 10.100.1.1:3014:0.0.0.0/0, version 74438
-        p3_1 = re.compile(r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
-                        r'((?P<route_distinguisher>((\[[0-9]+[\:][0-9]+\])'
-                        r'|[0-9]+])|([0-9.]+[:][0-9]+[:])))?(\[[0-9]+\])?'
-                        r'(\[[0-9]+\])?(?P<router_id>((\[[0-9]+[\.][0-9]+[\.]'
-                        r'[0-9]+[\.][0-9]+\][\/][0-9]+)|([0-9]+[\.][0-9]+[\.]'
-                        r'[0-9]+[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9]+'
-                        r'[\/][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                        r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                        r'[a-zA-Z0-9]+[\:][\:][0-9]+[\/][0-9]+)))\, +version '
-                        r'+(?P<prefix_table_version>[0-9]+)$')
+        p3_1=r'^BGP +routing +table +entry +for +(\[[0-9]+\])?'
+             r'((?P<route_distinguisher>((\[[0-9]+[\:][0-9]+\])'
+             r'|[0-9]+])|([0-9.]+[:][0-9]+[:])))?(\[[0-9]+\])?'
+             r'(\[[0-9]+\])?(?P<router_id>((\[[0-9]+[\.][0-9]+[\.]'
+             r'[0-9]+[\.][0-9]+\][\/][0-9]+)|([0-9]+[\.][0-9]+[\.]'
+             r'[0-9]+[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+             r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9]+'
+             r'[\/][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+             r'[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+             r'([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+             r'[a-zA-Z0-9]+[\:][\:][0-9]+[\/][0-9]+)))\, +version '
+             r'+(?P<prefix_table_version>[0-9]+)$',
 
         # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-        p3_2 = re.compile(r'^BGP +routing +table +entry +for'
-                          r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
-                          r' +version +(?P<version>(\d+))$')
+        p3_2=r'^BGP +routing +table +entry +for'
+             r' +(?:(?P<rd>([0-9\:\[\]]+)))?:(?P<router_id>(\S+)),?'
+             r' +version +(?P<version>(\d+))$',
 
         # BGP routing table entry for [route_type][rd][...][...][...], version 48
-        p3_3 = re.compile(r'^BGP +routing +table +entry +for'
-                          r' +(?P<router_id>(\[[0-9]\]\[[0-9\.]+[\:][0-9]+\](\[.+\])+[\/][0-9]+))\, +version '
-                          r'+(?P<prefix_table_version>[0-9]+)$')
+        p3_3=r'^BGP +routing +table +entry +for'
+             r' +(?P<router_id>(\[[0-9]\]\[[0-9\.]+[\:][0-9]+\](\[.+\])+[\/][0-9]+))\, +version '
+             r'+(?P<prefix_table_version>[0-9]+)$',
 
         # 10.1.1.2 from 10.1.1.2 (10.1.1.2)
         # 10.16.2.2 (metric 11) (via default) from 10.16.2.2 (10.16.2.2)
         # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
         # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
         # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-        p4 = re.compile(r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                        r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
-                        r'( +\((?P<inaccessible>inaccessible)\)))?'
-                        r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
-                        r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
-                        r' +\((?P<originator>[0-9\.]+)\))$')
+        p4=r'^((?P<next_hop>[a-zA-Z0-9\.\:]+)'
+           r'(( +\(metric +(?P<next_hop_igp_metric>[0-9]+)\))|'
+           r'( +\((?P<inaccessible>inaccessible)\)))?'
+           r'( +\(via +(?P<next_hop_via>[\S\s]+)\))? +'
+           r'from +(?P<gateway>[a-zA-Z0-9\.\:]+)'
+           r' +\((?P<originator>[0-9\.]+)\))$',
 
         # Origin incomplete, metric 0, localpref 100, valid, internal
         # Origin incomplete, metric 0, localpref 100, valid, internal, best
         # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
         # Origin IGP, localpref 100, valid, external, atomic-aggregate
         # Origin IGP, localpref 100, valid, external, atomic-aggregate, best
-        p5 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
-                        r'+(?P<metric>[0-9]+),?)?(?: +localpref '
-                        r'+(?P<locprf>[0-9]+),?)?(?: +weight '
-                        r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
-                        r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
-                        r'external|local)\,?))?(?: '
-                        r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
-                        r'+(?P<best>best))?$')
+        p5=r'^Origin +(?P<origin>[a-zA-Z]+),(?: +metric '
+           r'+(?P<metric>[0-9]+),?)?(?: +localpref '
+           r'+(?P<locprf>[0-9]+),?)?(?: +weight '
+           r'+(?P<weight>[0-9]+),?)?(?: +(?P<valid>valid?,))?(?: '
+           r'+(?P<sourced>sourced?,))?(?: +(?P<state>(internal|'
+           r'external|local)\,?))?(?: '
+           r'+(?P<aggregate>atomic-aggregate?))?(\,)?(?: '
+           r'+(?P<best>best))?$',
 
         # Advertised to update-groups:
-        p6_1 = re.compile(r'^Advertised +to +update-groups *:$')
+        p6_1=r'^Advertised +to +update-groups *:$',
 
         # Not advertised to any peer
-        p6_2 = re.compile(r'^Not +advertised +to +any +peer$')
+        p6_2=r'^Not +advertised +to +any +peer$',
 
         # 3
         # 38         44         45
-        p6_3 = re.compile(r'(?P<group1>(\d+))'
-                          r'(?: +(?P<group2>(\d+)))?(?: +(?P<group3>(\d+)))?')
+        p6_3=r'(?P<group1>(\d+))'
+             r'(?: +(?P<group2>(\d+)))?(?: +(?P<group3>(\d+)))?',
 
         # Refresh Epoch 1
-        p7 = re.compile(r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$')
+        p7=r'^Refresh +Epoch +(?P<refresh_epoch>[0-9]+)$',
 
         # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7AFF.FCD2
-        p8 = re.compile(r'^Extended +Community\:'
-                        r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
-                        r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$')
+        p8=r'^Extended +Community\:'
+           r' +(?P<ext_community>([a-zA-Z0-9\-\:]+)) +ENCAP *:'
+           r'(?P<encap>(\d+)) +Router +(?P<router_mac>(\S+))$',
 
         # Extended Community: SoO:65109:999 RT:65109:50
         # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
         # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
         # Extended Community: RT:1:1 RT:100:101 MVPN AS:100:0.0.0.0
-        p8_2 = re.compile(r'^Extended +Community *:'
-                          r' +(?P<ext_community>([a-zA-Z0-9\-\:\s\.]+))'
-                          r'(?: *, +(?P<recursive>(recursive-via-connected)))?$')
-
-        p8_21 = re.compile(r'^(RT|Color|0x88|So0|Cost:pre-bestpath).*$')
+        p8_2=r'^Extended +Community *:'
+             r' +(?P<ext_community>([a-zA-Z0-9\-\:\s\.]+))'
+             r'(?: *, +(?P<recursive>(recursive-via-connected)))?$',
+        p8_21=r'^(RT|Color|0x88|So0|Cost:pre-bestpath).*$',
 
         # Community: 62000:1
         # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
-        p8_3 = re.compile(r'^Community: +(?P<community>[\S+\s]+)$')
+        p8_3=r'^Community: +(?P<community>[\S+\s]+)$',
 
         # AGI version(0), VE Block Size(10) Label Base(16)
-        p8_4 = re.compile(r'^AGI +version\((?P<agi_version>(\d+))\),'
-                          r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
-                          r' +Label +Base\((?P<label_base>(\d+))\)$')
+        p8_4=r'^AGI +version\((?P<agi_version>(\d+))\),'
+             r' +VE +Block +Size\((?P<ve_block_size>(\d+))\)'
+             r' +Label +Base\((?P<label_base>(\d+))\)$',
 
         # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-        p8_5 = re.compile(r'^\s*Originator: +(?P<originator>(\S+)),'
-                          r' +Cluster +list: +(?P<cluster_list>(\S+))$')
-        
-        p8_6 = re.compile(r'^\s*PMSI Attribute: Flags.*'
-                          r'Tunnel type:(?P<tun_type>.+),'
-                          r' length.+vni:(?P<vni>.+)'
-                          r' tunnel identifier: ((< Tunnel Endpoint: (?P<tun_endpoint>.+) >)|(?P<local>0000 0000))$')
+        p8_5=r'^\s*Originator: +(?P<originator>(\S+)),'
+             r' +Cluster +list: +(?P<cluster_list>(\S+))$',
+        p8_6=r'^\s*PMSI Attribute: Flags.*'
+             r'Tunnel type:(?P<tun_type>.+),'
+             r' length.+vni:(?P<vni>.+)'
+             r' tunnel identifier: ((< Tunnel Endpoint: (?P<tun_endpoint>.+) >)|(?P<local>0000 0000))$',
 
         # rx pathid: 0, tx pathid: 0
-        p9 = re.compile(r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
-                        r' +tx +pathid\:'
-                        r' +(?P<transfer_pathid>[0-9x]+)$')
+        p9=r'^rx +pathid\: +(?P<recipient_pathid>[0-9x]+)\,'
+           r' +tx +pathid\:'
+           r' +(?P<transfer_pathid>[0-9x]+)$',
 
         # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
         # EVPN ESI: 00000000000000000000, Label1 2000101
-        p10 = re.compile(r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,\s+'
-                         r'(Gateway +Address\:\s+(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,\s+)?'
-                         r'(local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)\,\s+)?'
-                         r'[L|l]abel\d* +(?P<label>[0-9]+)$')
+        p10=r'^EVPN +ESI\: +(?P<evpn_esi>[0-9]+)\,\s+'
+            r'(Gateway +Address\:\s+(?P<gateway_address>[a-zA-Z0-9\.\:]+)\,\s+)?'
+            r'(local vtep\: +(?P<local_vtep>[a-zA-Z0-9\.\:]+)\,\s+)?'
+            r'[L|l]abel\d* +(?P<label>[0-9]+)$',
 
         # Local vxlan vtep:
         # Local irb vxlan vtep
-        p11 = re.compile(r'^Local\s+(irb\s+)?vxlan\s+vtep\:$')
+        p11=r'^Local\s+(irb\s+)?vxlan\s+vtep\:$',
 
         # bdi:BDI200
         # core-bdi:BDI200
-        p12 = re.compile(r'^(core-)?bdi\:(?P<bdi>[A-Z0-9]+)$')
+        p12=r'^(core-)?bdi\:(?P<bdi>[A-Z0-9]+)$',
 
         # vrf:evpn1, vni:30000
         # vrf:evpn1, l3-vni:30000
-        p13 = re.compile(r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
-                         r'\s+(.+-)?vni\:(?P<vni>[0-9]+)$')
+        p13=r'^vrf\:(?P<vrf>[a-zA-Z0-9]+)\,'
+            r'\s+(.+-)?vni\:(?P<vni>[0-9]+)$',
 
         # local router mac:001E.7AFF.FCD2
-        p14 = re.compile(r'^local +router +mac\:'
-                         r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$')
+        p14=r'^local +router +mac\:'
+            r'(?P<local_router_mac>[a-zA-Z0-9\.]+)$',
 
         # encap:8
-        p15 = re.compile(r'^encap\:(?P<encap>[0-9]+)$')
+        p15=r'^encap\:(?P<encap>[0-9]+)$',
 
         # vtep-ip:10.21.33.33
-        p16 = re.compile(r'^vtep-ip\:(?P<vtep_ip>[a-zA-Z0-9\.\:]+)$')
+        p16=r'^vtep-ip\:(?P<vtep_ip>[a-zA-Z0-9\.\:]+)$',
 
         # Local
         # 65530
@@ -959,28 +946,138 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 10.160.0.61), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 2001:db8:4::1), (received & used)
         # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 FE80:CD00:0:CDE:1257:0:211E:729C), (received & used)
-        p17 = re.compile(r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
-                       r'(\,)?(?: +\(aggregated +by +(?P<aggregated_by>[\w\s\.\:]'
-                       r'+)\)(\,))?(?: +(?P<route_status>[A-Za-z0-9\.\:\/\(\)\s'
-                       r'\[\]\-\&]+))?$')
-        
+        p17=r'^(?P<route_info>[a-zA-Z0-9\-\.\{\}\s\(\)\/\:\[\]]+)'
+            r'(\,)?(?: +\(aggregated +by +(?P<aggregated_by>[\w\s\.\:]'
+            r'+)\)(\,))?(?: +(?P<route_status>[A-Za-z0-9\.\:\/\(\)\s'
+            r'\[\]\-\&]+))?$',
+
         # mpls labels in/out nolabel/64402
-        p18 = re.compile(r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$')
+        p18=r'^mpls +labels +in\/out +(?P<in>\w+)\/(?P<out>\w+)$',
 
         # IGMP/MLD v1/v2/v3, exclude, max response time:
-        p19 = re.compile(r'^IGMP/MLD\s+(?P<version>v\d|v\d,\s*v\d)(,\s+(?P<filter_mode>\w+))?$')
+        p19=r'^IGMP/MLD\s+(?P<version>v\d|v\d,\s*v\d)(,\s+(?P<filter_mode>\w+))?$',
 
         # binding SID: 28 (color - 7) (state - UP)
-        p20 = re.compile(r'^binding +SID\:' r' +(?P<sid>([a-zA-Z0-9]+))'
-                 r'( +\(color[ ]{0,1}[-][ ]{0,1}(?P<color>[0-9]+)\))'
-                 r'(( +\(state +\- +(?P<state>[A-Za-z]+)\)))?$')
+        p20=r'^binding +SID\:' r' +(?P<sid>([a-zA-Z0-9]+))'
+            r'( +\(color[ ]{0,1}[-][ ]{0,1}(?P<color>[0-9]+)\))'
+            r'(( +\(state +\- +(?P<state>[A-Za-z]+)\)))?$',
+
+        # BGP routing table entry for [6][7.7.7.7:11][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/27, version 27
+        # BGP routing table entry for [6][117901063:11][0][128][A0A:A0A:A0A:A0A:A0A:A0A:A0A:A0A][128][1300:6501:1300:6501:1300:6501:1300:6501][128][E000:1:E000:1:E000:1:E000:1]/63, version 33
+        rt6_prefix_re=r'\[(?P<rt>[0-9])\]'
+                       '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                       '\[(?P<eti>[0-9]+)\]'
+                       '\[(?P<mcast_src_len>[0-9]+)\]'
+                       '(\[(?P<mcast_src>.+)\])?'
+                       '\[(?P<mcast_group_len>[0-9]+)\]'
+                       '\[(?P<mcast_group_addr>.+)\]'
+                       '\[(?P<orig_rtr_len>[0-9]+)\]'
+                       '\[(?P<orig_rtr_id>.+)\]'
+                       '\/(?P<subnet>[0-9]+)',
+
+        # BGP routing table entry for [3][40.0.0.3:164][0][32][40.0.0.3]/17, version 30
+        rt3_prefix_re=r'\[(?P<rt>[0-9])\]'
+                       '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                       '\[(?P<eti>[0-9]+)\]'
+                       '\[(?P<ip_len>[0-9]+)\]'
+                       '(\[(?P<orig_rtr_id>.+)\])?'
+                       '\/(?P<subnet>[0-9]+)',
+
+        # BGP routing table entry for [1][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][10000]/23, version 26
+        rt1_prefix_re=r'\[(?P<rt>[0-9])\]'
+                       '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                       '\[(?P<esi>.+)\]'
+                       '\[(?P<eti>[0-9]+)\]'
+                       '\/(?P<subnet>[0-9]+)',
+
+        # BGP routing table entry for [2][2.2.2.2:1000][10000][48][022651BDC81C][32][0.0.0.0]/24, version 28
+        # BGP routing table entry for [2][22.2.2.2:1000][10000][48][022651BDC81C][128][1000::1]/36, version 36
+        rt2_prefix_re=r'\[(?P<rt>[0-9])\]'
+                       '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                       '\[(?P<eti>[0-9]+)\]'
+                       '\[(?P<mac_len>[0-9]+)\]'
+                       '\[(?P<mac>.+)\]'
+                       '\[(?P<ip_len>[0-9]+)\]'
+                       '(\[(?P<ip_prefix>.+)\])?'
+                       '\/(?P<subnet>[0-9]+)',
+
+        # BGP routing table entry for [4][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][32]/23, version 32
+        rt4_prefix_re=r'\[(?P<rt>[0-9])\]'
+                       '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                       '\[(?P<esi>.+)\]'
+                       '\[(?P<ip_len>[0-9]+)\]'
+                       '(\[(?P<orig_rtr_id>.+)\])?'
+                       '\/(?P<subnet>[0-9]+)',
+
+        # BGP routing table entry for [5][100:100][4231][32][1.1.1.1]/17, version 37
+        # BGP routing table entry for [5][20.0.0.1:31000][0][32][250.250.250.22]/17, version 34
+        rt5_prefix_re=r'\[(?P<rt>[0-9])\]'
+                       '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                       '\[(?P<eti>[0-9]+)\]'
+                       '\[(?P<ip_len>[0-9]+)\]'
+                       '(\[(?P<ip_prefix>.+)\])?'
+                       '\/(?P<subnet>[0-9]+)',
+
+        # BGP routing table entry for [7][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/37, version 29
+        rt7_prefix_re=r'\[(?P<rt>[0-9])\]'
+                       '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                       '\[(?P<esi>.+)\]'
+                       '\[(?P<eti>[0-9]+)\]'
+                       '\[(?P<mcast_src_len>[0-9]+)\]'
+                       '(\[(?P<mcast_src>.+)\])?'
+                       '\[(?P<mcast_group_len>[0-9]+)\]'
+                       '\[(?P<mcast_group_addr>.+)\]'
+                       '\[(?P<orig_rtr_len>[0-9]+)\]'
+                       '\[(?P<orig_rtr_id>.+)\]'
+                       '\/(?P<subnet>[0-9]+)',
+
+        # BGP routing table entry for [8][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1][4112]/41, version 31
+        rt8_prefix_re=r'\[(?P<rt>[0-9])\]'
+                       '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
+                       '\[(?P<esi>.+)\]'
+                       '\[(?P<eti>[0-9]+)\]'
+                       '\[(?P<mcast_src_len>[0-9]+)\]'
+                       '(\[(?P<mcast_src>.+)\])?'
+                       '\[(?P<mcast_group_len>[0-9]+)\]'
+                       '\[(?P<mcast_group_addr>.+)\]'
+                       '\[(?P<orig_rtr_len>[0-9]+)\]'
+                       '\[(?P<orig_rtr_id>.+)\]'
+                       '\[(?P<max_resp_time>[0-9]+)\]'
+                       '\/(?P<subnet>[0-9]+)',
+    )
+    dispatcher = LineDispatcher(patterns, order=[
+        'p1', 'p2', 'p2_1', 'p3_1', 'p3_2', 'p3_3', 'p4', 'p5', 'p6_1', 'p6_2',
+        'p7', 'p8', 'p8_2', 'p8_21', 'p8_3', 'p8_4', 'p8_5', 'p8_6', 'p9',
+        'p18', 'p19', 'p20', 'p10', 'p11'])
+
+    def cli(self, address_family='', vrf='', rd='', evi='', rt='', output=None):
+        # Init dictionary
+        ret_dict = {}
+        subdict = ''
+        next_line_update_group = False
+        route_distinguisher = ''
+        new_address_family = ''
+        original_address_family = address_family
+        refresh_epoch_flag = False
+        route_info = ''
+        route_status = ''
+        aggregated_by_as = ''
+        aggregated_by_address = ''
+        imported_path_from = ''
+        imported_safety_path = False
+        refresh_epoch = None
+        cmd_vrf = vrf if vrf else None
+        default_vrf = None
+        nlri_data = {}
+
+        p = ShowBgpDetailSuperParser.patterns
 
         for line in output.splitlines():
             line = line.strip()
+            name, m = ShowBgpDetailSuperParser.dispatcher.match(line)
             # For address family: IPv4 Unicast
             # For address family: L2VPN E-VPN
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 index = 0
                 address_family = m.groupdict()['address_family'].lower()
                 original_address_family = address_family
@@ -996,8 +1093,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Paths: (1 available, best #1, table VRF1)
             # Paths: (1 available, best #1, no table)
             # Paths: (1 available, best #1, table default, RIB-failure(17))
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 group = m.groupdict()
                 original_address_family = address_family.lower()
 
@@ -1078,12 +1174,12 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         [prefixes]['available_path'] = available_path
                     address_family_dict[address_family]['prefixes'][prefixes]['best_path'] = best_path
                     address_family_dict[address_family]['prefixes'][prefixes]['paths'] = paths
+                name, m = ShowBgpDetailSuperParser.dispatcher.match(line, after='p2')
 
             # Route Distinguisher: 100:100 (default for vrf VRF1)
             # Route Distinguisher: 65535:1 (default for vrf evpn1)
             # Route Distinguisher: 10.100.1.1:3014 (default for vrf vrf1)
-            m = p2_1.match(line)
-            if m:
+            if name == 'p2_1':
                 route_distinguisher = m.groupdict()['route_distinguisher']
                 default_vrf = m.groupdict()['vrf_id']
 
@@ -1106,8 +1202,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # BGP routing table entry for 2001:2:2:2::2/128, version 2
             # BGP routing table entry for [5][65535:1][0][24][10.36.3.0]/17, version 3
             # BGP routing table entry for 10.100.1.1:3014:0.0.0.0/0, version 74438
-            m = p3_1.match(line)
-            if m:
+            if name == 'p3_1':
                 update_group = 0
                 index = 0
                 prefixes = m.groupdict()['router_id']
@@ -1117,8 +1212,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # BGP routing table entry for 65109:3051:VEID-1:Blk-1/136, version 2
-            m = p3_2.match(line)
-            if m:
+            if name == 'p3_2':
                 update_group = 0
                 index = 0
                 prefixes = m.groupdict()['router_id']
@@ -1140,26 +1234,13 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # BGP routing table entry for [6][117901063:11][0][128][A0A:A0A:A0A:A0A:A0A:A0A:A0A:A0A][128][1300:6501:1300:6501:1300:6501:1300:6501][128][E000:1:E000:1:E000:1:E000:1]/63, version 33
             # BGP routing table entry for [7][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/37, version 29
             # BGP routing table entry for [8][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1][4112]/41, version 31
-            m = p3_3.match(line)
-            if m:
+            if name == 'p3_3':
                 nlri_data = {}
                 update_group = 0
                 index = 0
                 prefixes = m.groupdict()['router_id']
                 if prefixes.startswith('[6]'):
-                    # BGP routing table entry for [6][7.7.7.7:11][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/27, version 27
-                    # BGP routing table entry for [6][117901063:11][0][128][A0A:A0A:A0A:A0A:A0A:A0A:A0A:A0A][128][1300:6501:1300:6501:1300:6501:1300:6501][128][E000:1:E000:1:E000:1:E000:1]/63, version 33
-                    rt6_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                '\[(?P<eti>[0-9]+)\]'
-                                                '\[(?P<mcast_src_len>[0-9]+)\]'
-                                                '(\[(?P<mcast_src>.+)\])?'
-                                                '\[(?P<mcast_group_len>[0-9]+)\]'
-                                                '\[(?P<mcast_group_addr>.+)\]'
-                                                '\[(?P<orig_rtr_len>[0-9]+)\]'
-                                                '\[(?P<orig_rtr_id>.+)\]'
-                                                '\/(?P<subnet>[0-9]+)')
-                    rt6_mo = rt6_prefix_re.match(prefixes)
+                    rt6_mo = p.rt6_prefix_re.match(prefixes)
                     if rt6_mo:
                         rt6_dict = rt6_mo.groupdict()
                         nlri_data['route-type'] = '6'
@@ -1174,14 +1255,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         nlri_data['subnet'] = rt6_dict['subnet']
 
                 elif prefixes.startswith('[3]'):
-                    # BGP routing table entry for [3][40.0.0.3:164][0][32][40.0.0.3]/17, version 30
-                    rt3_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                '\[(?P<eti>[0-9]+)\]'
-                                                '\[(?P<ip_len>[0-9]+)\]'
-                                                '(\[(?P<orig_rtr_id>.+)\])?'
-                                                '\/(?P<subnet>[0-9]+)')
-                    rt3_mo = rt3_prefix_re.match(prefixes)
+                    rt3_mo = p.rt3_prefix_re.match(prefixes)
                     if rt3_mo:
                         rt3_dict = rt3_mo.groupdict()
                         nlri_data['route-type'] = '3'
@@ -1193,13 +1267,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         nlri_data['subnet'] = rt3_dict['subnet']
                         
                 elif prefixes.startswith('[1]'):
-                    # BGP routing table entry for [1][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][10000]/23, version 26
-                    rt1_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                '\[(?P<esi>.+)\]'
-                                                '\[(?P<eti>[0-9]+)\]'
-                                                '\/(?P<subnet>[0-9]+)')
-                    rt1_mo = rt1_prefix_re.match(prefixes)
+                    rt1_mo = p.rt1_prefix_re.match(prefixes)
                     if rt1_mo:
                         rt1_dict = rt1_mo.groupdict()
                         nlri_data['route-type'] = '1'
@@ -1209,18 +1277,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         nlri_data['subnet'] = rt1_dict['subnet']
 
                 elif prefixes.startswith('[2]'):
-                    # BGP routing table entry for [2][2.2.2.2:1000][10000][48][022651BDC81C][32][0.0.0.0]/24, version 28
-                    # BGP routing table entry for [2][22.2.2.2:1000][10000][48][022651BDC81C][128][1000::1]/36, version 36
-                    rt2_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                '\[(?P<eti>[0-9]+)\]'
-                                                '\[(?P<mac_len>[0-9]+)\]'
-                                                '\[(?P<mac>.+)\]'
-                                                '\[(?P<ip_len>[0-9]+)\]'
-                                                '(\[(?P<ip_prefix>.+)\])?'
-                                                '\/(?P<subnet>[0-9]+)')
-                    
-                    rt2_mo = rt2_prefix_re.match(prefixes)
+                    rt2_mo = p.rt2_prefix_re.match(prefixes)
                     if rt2_mo:
                         rt2_dict = rt2_mo.groupdict()
                         nlri_data['route-type'] = '2'
@@ -1235,15 +1292,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         nlri_data['subnet'] = rt2_dict['subnet']
 
                 elif prefixes.startswith('[4]'):
-                    # BGP routing table entry for [4][2.2.2.2:1000][AAAABBBBCCCCDDDDEEEE][32]/23, version 32
-                    rt4_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                '\[(?P<esi>.+)\]'
-                                                '\[(?P<ip_len>[0-9]+)\]'
-                                                '(\[(?P<orig_rtr_id>.+)\])?'
-                                                '\/(?P<subnet>[0-9]+)')
-                    
-                    rt4_mo = rt4_prefix_re.match(prefixes)
+                    rt4_mo = p.rt4_prefix_re.match(prefixes)
                     if rt4_mo:
                         rt4_dict = rt4_mo.groupdict()
                         nlri_data['route-type'] = '4'
@@ -1255,16 +1304,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         nlri_data['subnet'] = rt4_dict['subnet']
 
                 elif prefixes.startswith('[5]'):
-                    # BGP routing table entry for [5][100:100][4231][32][1.1.1.1]/17, version 37
-                    # BGP routing table entry for [5][20.0.0.1:31000][0][32][250.250.250.22]/17, version 34
-                    rt5_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                '\[(?P<eti>[0-9]+)\]'
-                                                '\[(?P<ip_len>[0-9]+)\]'
-                                                '(\[(?P<ip_prefix>.+)\])?'
-                                                '\/(?P<subnet>[0-9]+)')
-                    
-                    rt5_mo = rt5_prefix_re.match(prefixes)
+                    rt5_mo = p.rt5_prefix_re.match(prefixes)
                     if rt5_mo:
                         rt5_dict = rt5_mo.groupdict()
                         nlri_data['route-type'] = '5'
@@ -1277,20 +1317,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         nlri_data['subnet'] = rt5_dict['subnet']
 
                 elif prefixes.startswith('[7]'):
-                    # BGP routing table entry for [7][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1]/37, version 29
-                    rt7_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                '\[(?P<esi>.+)\]'
-                                                '\[(?P<eti>[0-9]+)\]'
-                                                '\[(?P<mcast_src_len>[0-9]+)\]'
-                                                '(\[(?P<mcast_src>.+)\])?'
-                                                '\[(?P<mcast_group_len>[0-9]+)\]'
-                                                '\[(?P<mcast_group_addr>.+)\]'
-                                                '\[(?P<orig_rtr_len>[0-9]+)\]'
-                                                '\[(?P<orig_rtr_id>.+)\]'
-                                                '\/(?P<subnet>[0-9]+)')
-
-                    rt7_mo = rt7_prefix_re.match(prefixes)
+                    rt7_mo = p.rt7_prefix_re.match(prefixes)
                     if rt7_mo:
                         rt7_dict = rt7_mo.groupdict()
                         nlri_data['route-type'] = '7'
@@ -1308,21 +1335,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         nlri_data['subnet'] = rt7_dict['subnet']
 
                 elif prefixes.startswith('[8]'):
-                    # BGP routing table entry for [8][7.7.7.7:11][0000000000AABBCCDDEE][0][32][10.10.10.10][32][19.0.101.1][32][224.0.0.1][4112]/41, version 31
-                    rt8_prefix_re = re.compile(r'\[(?P<rt>[0-9])\]'
-                                                '\[(?P<rd>[0-9\.]+[\:][0-9]+)\]'
-                                                '\[(?P<esi>.+)\]'
-                                                '\[(?P<eti>[0-9]+)\]'
-                                                '\[(?P<mcast_src_len>[0-9]+)\]'
-                                                '(\[(?P<mcast_src>.+)\])?'
-                                                '\[(?P<mcast_group_len>[0-9]+)\]'
-                                                '\[(?P<mcast_group_addr>.+)\]'
-                                                '\[(?P<orig_rtr_len>[0-9]+)\]'
-                                                '\[(?P<orig_rtr_id>.+)\]'
-                                                '\[(?P<max_resp_time>[0-9]+)\]'
-                                                '\/(?P<subnet>[0-9]+)')
-
-                    rt8_mo = rt8_prefix_re.match(prefixes)
+                    rt8_mo = p.rt8_prefix_re.match(prefixes)
                     if rt8_mo:
                         rt8_dict = rt8_mo.groupdict()
                         nlri_data['route-type'] = '8'
@@ -1349,8 +1362,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # :: (via vrf VRF1) from 0.0.0.0 (10.1.1.1)
             # 192.168.0.1 (inaccessible) from 192.168.0.9 (192.168.0.9)
             # 172.17.111.1 (via vrf SH_BGP_VRF100) from 172.17.111.1 (10.5.5.5)
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 index += 1
                 group = m.groupdict()
 
@@ -1404,8 +1416,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Origin incomplete, metric 0, localpref 100, weight 32768, valid, sourced, best
             # Origin IGP, localpref 100, valid, external, atomic-aggregate
             # Origin IGP, localpref 100, valid, external, atomic-aggregate, best
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
                 group = m.groupdict()
                 status_codes = ''
 
@@ -1469,22 +1480,20 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Advertised to update-groups:
-            m = p6_1.match(line)
-            if m:
+            if name == 'p6_1':
                 next_line_update_group = True
                 continue
 
             # Not advertised to any peer
-            m = p6_2.match(line)
-            if m:
+            if name == 'p6_2':
                 next_line_update_group = False
                 continue
 
             # 3
             # # 38         44         45
-            m = p6_3.match(line)
-            if m and next_line_update_group:
-                group = m.groupdict()
+            m6_3 = p.p6_3.match(line)
+            if m6_3 and next_line_update_group:
+                group = m6_3.groupdict()
                 if group['group2'] or group['group3']:
                     update_group = []
                     for item in group:
@@ -1498,15 +1507,13 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Refresh Epoch 1
-            m = p7.match(line)
-            if m:
+            if name == 'p7':
                 refresh_epoch_flag = True
                 refresh_epoch = int(m.groupdict()['refresh_epoch'])
                 continue
 
             # Extended Community: RT:65535:1 ENCAP:8 Router MAC:001E.7AFF.FCD2
-            m = p8.match(line)
-            if m:
+            if name == 'p8':
                 group = m.groupdict()
 
                 if 'evpn' not in subdict:
@@ -1524,8 +1531,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # Extended Community: SoO:65109:999 RT:65109:50
             # Extended Community: RT:0:3051 RT:65109:3051 L2VPN L2:0x0:MTU-1500
             # Extended Community: RT:65109:50 RT:65109:51 , recursive-via-connected
-            m = p8_2.match(line)
-            if m:
+            if name == 'p8_2':
                 group = m.groupdict()
                 ext_community = group['ext_community']
 
@@ -1539,8 +1545,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                         subdict['recursive_via_connected'] = True
                 continue
 
-            m = p8_21.match(line)
-            if m:
+            if name == 'p8_21':
                 group = m.group()
                 if 'evpn' in subdict:
                     subdict['evpn']['ext_community'] = f"{subdict['evpn']['ext_community']} {group}"
@@ -1550,14 +1555,12 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
             # Community: 62000:1
             # Community: 1:1 65100:101 65100:175 65100:500 65100:601 65151:65000 65351:1
-            m = p8_3.match(line)
-            if m:
+            if name == 'p8_3':
                 subdict['community'] = m.groupdict()['community']
                 continue
 
             # AGI version(0), VE Block Size(10) Label Base(16)
-            m = p8_4.match(line)
-            if m:
+            if name == 'p8_4':
                 group = m.groupdict()
 
                 for i in ['agi_version', 've_block_size', 'label_base']:
@@ -1566,13 +1569,11 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Originator: 192.168.165.220, Cluster list: 0.0.0.61
-            m = p8_5.match(line)
-            if m:
+            if name == 'p8_5':
                 subdict['cluster_list'] = m.groupdict()['cluster_list']
                 continue
 
-            m = p8_6.match(line)
-            if m:
+            if name == 'p8_6':
                 subdict['pmsi'] = {}
                 subdict['pmsi']['tun_type'] = m.groupdict()['tun_type']
                 subdict['pmsi']['vni'] = m.groupdict()['vni']
@@ -1581,17 +1582,16 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                     subdict['pmsi']['tun_id']['tun_endpoint'] = m.groupdict()['tun_endpoint']
                 if m.groupdict()['local'] is not None:
                     subdict['pmsi']['tun_id']['local'] = True
+                name, m = ShowBgpDetailSuperParser.dispatcher.match(line, after='p8_6')
 
             # rx pathid: 0, tx pathid: 0
-            m = p9.match(line)
-            if m:
+            if name == 'p9':
                 subdict['recipient_pathid'] = m.groupdict()['recipient_pathid']
                 subdict['transfer_pathid'] = m.groupdict()['transfer_pathid']
                 continue
             
             # mpls labels in/out nolabel/64402
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 group = m.groupdict()
 
                 mpls_labels_dict = subdict.setdefault('mpls_labels', {})
@@ -1604,8 +1604,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # IGMP/MLD v2
             # IGMP/MLD v1
             # IGMP/MLD v2, v3, exclude
-            m = p19.match(line)
-            if m:
+            if name == 'p19':
                 subdict['igmpmld'] = {}
                 group = m.groupdict()
                 subdict['igmpmld']['version'] = group['version']
@@ -1614,8 +1613,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # binding SID: 28 (color - 7) (state - UP)
-            m = p20.match(line)
-            if m:
+            if name == 'p20':
                 group = m.groupdict()
                 if 'binding_sid' not in subdict:
                     subdict['binding_sid'] = {}
@@ -1627,8 +1625,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
 
             # EVPN ESI: 00000000000000000000, Gateway Address: 0.0.0.0, local vtep: 10.21.33.33, Label 30000
             # EVPN ESI: 00000000000000000000, Label1 2000101
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 group = m.groupdict()
                 if 'evpn' not in subdict:
                     subdict['evpn'] = {}
@@ -1641,8 +1638,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # Local vxlan vtep:
-            m = p11.match(line)
-            if m:
+            if name == 'p11':
                 if 'local_vxlan_vtep' not in subdict:
                     subdict['local_vxlan_vtep'] = {}
 
@@ -1653,8 +1649,8 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # local router mac:001E.7AFF.FCD2
             # encap:8
             # vtep-ip:10.21.33.33
-            m = p12.match(line) or p14.match(line)\
-                or p15.match(line) or p16.match(line)
+            m = p.p12.match(line) or p.p14.match(line)\
+                or p.p15.match(line) or p.p16.match(line)
             if m and local_vxlan_vtep:
                 group = m.groupdict()
                 k = list(group)[0]
@@ -1662,7 +1658,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
                 continue
 
             # vrf:evpn1, vni:30000
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m and local_vxlan_vtep:
                 subdict['local_vxlan_vtep']['vrf'] = m.groupdict()['vrf']
                 subdict['local_vxlan_vtep']['vni'] = m.groupdict()['vni']
@@ -1678,7 +1674,7 @@ class ShowBgpDetailSuperParser(ShowBgpAllDetailSchema):
             # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 10.160.0.61), (received & used)
             # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 2001:db8:4::1), (received & used)
             # 4210105002 4210105502 4210105001 4210105507 4210105007 4210105220 65000 65151 65501, (aggregated by 65251 FE80:CD00:0:CDE:1257:0:211E:729C), (received & used)
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m and refresh_epoch_flag or m and m.groupdict()['route_info']:
                 group = m.groupdict()
                 route_info = group['route_info']
@@ -1920,6 +1916,91 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         * 'show ip bgp {address_family} all summary'
     '''
 
+    patterns = Patterns(
+        rc1=r'address\-family\s+(?P<address_family>'
+             'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)',
+        rc2=r'neighbor\s+(?P<neighbor_address>\S+)\s+'
+             'remote\-as\s+(?P<remote_as>\S+)',
+
+        # For address family: IPv4 Unicast
+        p1=r'^For address family: +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$',
+
+        # BGP router identifier 192.168.111.1, local AS number 100
+        # BGP router identifier 30.1.107.78, local AS number 304.304
+        p2=r'^BGP +router +identifier'
+            ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
+            ' +number +(?P<local_as>[0-9\.]+)$',
+
+        # BGP table version is 28, main routing table version 28
+        p3=r'^BGP +table +version +is'
+            ' +(?P<bgp_table_version>[0-9]+),'
+            ' +main +routing +table +version'
+            ' +(?P<routing_table_version>[0-9]+)$',
+
+        # 27 network entries using 6696 bytes of memory
+        p4=r'^(?P<networks>[0-9]+) +network +entries +using'
+            ' +(?P<bytes>[0-9]+) +bytes +of +memory$',
+
+        # 27 path entries using 3672 bytes of memory
+        p5=r'^(?P<path>[0-9]+) +path +entries +using'
+            ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$',
+
+        # 2 BGP rrinfo entries using 48 bytes of memory
+        # 201 BGP AS-PATH entries using 4824 bytes of memory
+        p5_1=r'^(?P<num_entries>([0-9]+)) +BGP'
+              ' +(?P<entries_type>(\S+)) +entries +using'
+              ' +(?P<entries_byte>[0-9]+) +bytes +of +memory$',
+
+        # 4 BGP extended community entries using 96 bytes of memory
+        p5_2=r'^(?P<num_community_entries>[0-9]+) +BGP +extended'
+              ' +community +entries +using'
+              ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$',
+
+        # 1/1 BGP path/bestpath attribute entries using 280 bytes of memory
+        p6=r'^(?P<attribute_entries>(\S+)) +BGP'
+            ' +(?P<attribute_type>(\S+)) +attribute +entries'
+            ' +using +(?P<bytes>[0-9]+) +bytes +of +memory$',
+
+        # 0 BGP route-map cache entries using 0 bytes of memory
+        # 0 BGP filter-list cache entries using 0 bytes of memory
+        p6_1=r'^(?P<num_cache_entries>([0-9]+)) +BGP'
+              ' +(?P<cache_type>(\S+)) +cache +entries +using'
+              ' +(?P<cache_byte>[0-9]+) +bytes +of +memory$',
+
+        # BGP using 10648 total bytes of memory
+        p7=r'^BGP +using +(?P<total_memory>[0-9]+) +total +bytes'
+            ' +of +memory$',
+
+        # BGP activity 47/20 prefixes, 66/39 paths, scan interval 60 secs
+        p8=r'^BGP +activity +(?P<activity_prefixes>(\S+))'
+            ' +prefixes, +(?P<activity_paths>(\S+)) +paths, +scan'
+            ' +interval +(?P<scan_interval>[0-9]+) +secs$',
+
+        # Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+        # 192.168.111.1       4          100       0       0        1    0    0 01:07:38 Idle
+        # 192.168.4.1       4          100       0       0        1    0    0 never    Idle
+        # 192.168.51.1       4          100       0       0        1    0    0 01:07:38 Idle
+        p9=r'^ *(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<version>[0-9]+)'
+            ' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
+            ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+            ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+            ' +(?P<up_down>[a-zA-Z0-9\:]+)'
+            ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$',
+
+        #  Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+        #  2001:DB8:20:4:6::6
+        #           4          400      67      73       66    0    0 01:03:11        5
+        #  *2001::100:1:2:1
+        #                  4        65001       7       7      198    0    0 00:00:02        1
+        p10=r'^(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+)$',
+        p11=r'^(?P<version>[0-9]+)'
+             ' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
+             ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
+             ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
+             ' +(?P<up_down>[a-zA-Z0-9\:]+)'
+             ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$',
+    )
+
     def cli(self, address_family='', vrf='', rd='',  cmd='', output=None):
 
         # Init vars
@@ -1942,6 +2023,8 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
             # except Exception:
             #     pass
 
+        p = ShowBgpSummarySuperParser.patterns
+
         if address_family.lower() not in ['ipv4 unicast', 'ipv6 unicast']:
            
             if ('all summary' in cmd and 
@@ -1955,21 +2038,14 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                     commands_list = ['show run | sec address-family ipv4 vrf',
                                      'show run | sec address-family ipv6 vrf']
                 
-                for command in commands_list:
-                    out_vrf = self.device.execute(command)
-
-                    rc1 = re.compile(r'address\-family\s+(?P<address_family>'
-                                      'ipv4|ipv6)\s+vrf\s+(?P<vrf>\S+)')
-
-                    rc2 = re.compile(r'neighbor\s+(?P<neighbor_address>\S+)\s+'
-                                'remote\-as\s+(?P<remote_as>\S+)')
+                for out_vrf in execute_many(self.device, commands_list):
 
                     flag_address_family = False            
 
                     for line in out_vrf.splitlines():
                         line = line.strip()
 
-                        result = rc1.match(line)
+                        result = p.rc1.match(line)
                         if result:
                             groupdict = result.groupdict()
                             address_family_d = bgp_config_dict.setdefault(groupdict['address_family'], {})
@@ -1979,98 +2055,19 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                             continue
 
                         if flag_address_family:
-                            result = rc2.match(line)
+                            result = p.rc2.match(line)
                             if result:
                                 groupdict = result.groupdict()
                                 neighbor_dict = vrf_dict.setdefault(groupdict['neighbor_address'], {})
                                 neighbor_dict['remote_as'] = groupdict['remote_as']
                             continue
 
-        # For address family: IPv4 Unicast
-        p1 = re.compile(r'^For address family: +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-
-        # BGP router identifier 192.168.111.1, local AS number 100
-        # BGP router identifier 30.1.107.78, local AS number 304.304
-        p2 = re.compile(r'^BGP +router +identifier'
-                         ' +(?P<route_identifier>[0-9\.\:]+), +local +AS'
-                         ' +number +(?P<local_as>[0-9\.]+)$')
-
-        # BGP table version is 28, main routing table version 28
-        p3 = re.compile(r'^BGP +table +version +is'
-                         ' +(?P<bgp_table_version>[0-9]+),'
-                         ' +main +routing +table +version'
-                         ' +(?P<routing_table_version>[0-9]+)$')
-
-        # 27 network entries using 6696 bytes of memory
-        p4 = re.compile(r'^(?P<networks>[0-9]+) +network +entries +using'
-                         ' +(?P<bytes>[0-9]+) +bytes +of +memory$')
-
-        # 27 path entries using 3672 bytes of memory
-        p5 = re.compile(r'^(?P<path>[0-9]+) +path +entries +using'
-                         ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
-
-        # 2 BGP rrinfo entries using 48 bytes of memory
-        # 201 BGP AS-PATH entries using 4824 bytes of memory
-        p5_1 = re.compile(r'^(?P<num_entries>([0-9]+)) +BGP'
-                           ' +(?P<entries_type>(\S+)) +entries +using'
-                           ' +(?P<entries_byte>[0-9]+) +bytes +of +memory$')
-
-        # 4 BGP extended community entries using 96 bytes of memory
-        p5_2 = re.compile(r'^(?P<num_community_entries>[0-9]+) +BGP +extended'
-                           ' +community +entries +using'
-                           ' +(?P<memory_usage>[0-9]+) +bytes +of +memory$')
-
-        # 1/1 BGP path/bestpath attribute entries using 280 bytes of memory
-        p6 = re.compile(r'^(?P<attribute_entries>(\S+)) +BGP'
-                         ' +(?P<attribute_type>(\S+)) +attribute +entries'
-                         ' +using +(?P<bytes>[0-9]+) +bytes +of +memory$')
-
-        # 0 BGP route-map cache entries using 0 bytes of memory
-        # 0 BGP filter-list cache entries using 0 bytes of memory
-        p6_1 = re.compile(r'^(?P<num_cache_entries>([0-9]+)) +BGP'
-                           ' +(?P<cache_type>(\S+)) +cache +entries +using'
-                           ' +(?P<cache_byte>[0-9]+) +bytes +of +memory$')
-
-        # BGP using 10648 total bytes of memory
-        p7 = re.compile(r'^BGP +using +(?P<total_memory>[0-9]+) +total +bytes'
-                         ' +of +memory$')
-
-        # BGP activity 47/20 prefixes, 66/39 paths, scan interval 60 secs
-        p8 = re.compile(r'^BGP +activity +(?P<activity_prefixes>(\S+))'
-                         ' +prefixes, +(?P<activity_paths>(\S+)) +paths, +scan'
-                         ' +interval +(?P<scan_interval>[0-9]+) +secs$')
-
-        # Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
-        # 192.168.111.1       4          100       0       0        1    0    0 01:07:38 Idle
-        # 192.168.4.1       4          100       0       0        1    0    0 never    Idle
-        # 192.168.51.1       4          100       0       0        1    0    0 01:07:38 Idle
-        p9 = re.compile(r'^ *(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<version>[0-9]+)'
-                         ' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
-                         ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                         ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                         ' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                         ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
-
-        #  Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
-        #  2001:DB8:20:4:6::6
-        #           4          400      67      73       66    0    0 01:03:11        5
-        #  *2001::100:1:2:1
-        #                  4        65001       7       7      198    0    0 00:00:02        1
-        p10 = re.compile(r'^(?P<our_entry>\*)?(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-
-        p11 = re.compile(r'^(?P<version>[0-9]+)'
-                          ' +(?P<as>[0-9]+(\.\d+)?) +(?P<msg_rcvd>[0-9]+)'
-                          ' +(?P<msg_sent>[0-9]+) +(?P<tbl_ver>[0-9]+)'
-                          ' +(?P<inq>[0-9]+) +(?P<outq>[0-9]+)'
-                          ' +(?P<up_down>[a-zA-Z0-9\:]+)'
-                         ' +(?P<state>[a-zA-Z0-9\(\)\s]+)$')
-
         for line in output.splitlines():
 
             line = line.strip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # Save variables for use later
                 address_family = m.groupdict()['address_family'].lower()
@@ -2090,7 +2087,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
 
             # BGP router identifier 192.168.111.1, local AS number 100
             # BGP router identifier 30.1.107.78, local AS number 304.304
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 route_identifier = m.groupdict()['route_identifier']
                 try:
@@ -2102,28 +2099,28 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # BGP table version is 28, main routing table version 28
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 routing_table_version = int(m.groupdict()['routing_table_version'])
                 continue
 
             # 27 network entries using 6696 bytes of memory
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 num_prefix_entries = int(m.groupdict()['networks'])
                 num_memory_usage = int(m.groupdict()['bytes'])
                 continue
 
             # 27 path entries using 3672 bytes of memory
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 path_total_entries = int(m.groupdict()['path'])
                 path_memory_usage = int(m.groupdict()['memory_usage'])
                 continue
 
             # 2 BGP rrinfo entries using 48 bytes of memory
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 num_entries = int(m.groupdict()['num_entries'])
                 entries_type = str(m.groupdict()['entries_type'])
@@ -2134,14 +2131,14 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # 4 BGP extended community entries using 96 bytes of memory
-            m = p5_2.match(line)
+            m = p.p5_2.match(line)
             if m:
                 num_community_entries = int(m.groupdict()['num_community_entries'])
                 community_memory_usage = int(m.groupdict()['memory_usage'])
                 continue
 
             # 1/1 BGP path/bestpath attribute entries using 280 bytes of memory
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 attribute_entries = str(m.groupdict()['attribute_entries'])
                 attribute_type = str(m.groupdict()['attribute_type'])
@@ -2149,7 +2146,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # 0 BGP route-map cache entries using 0 bytes of memory
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 num_cache_entries = int(m.groupdict()['num_cache_entries'])
                 cache_type = str(m.groupdict()['cache_type'])
@@ -2161,13 +2158,13 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 continue
 
             # BGP using 10648 total bytes of memory
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 total_memory = int(m.groupdict()['total_memory'])
                 continue
 
             # BGP activity 47/20 prefixes, 66/39 paths, scan interval 60 secs
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 activity_prefixes = str(m.groupdict()['activity_prefixes'])
                 activity_paths = str(m.groupdict()['activity_paths'])
@@ -2181,7 +2178,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
             # 30.1.10.1       4      304.304    6953   38119   136088    0    0 00:50:14     2540
             # 30.2.10.1       4      304.304    6347   38120   136088    0    0 00:50:13     2580
             # 30.3.10.1       4      301.301    7722   38113   136088    0    0 00:50:14     4439
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 # Add neighbor to dictionary
                 neighbor = str(m.groupdict()['neighbor'])
@@ -2284,7 +2281,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                 #  Neighbor        V           AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
                 #  2001:DB8:20:4:6::6
                 #           4          400      67      73       66    0    0 01:03:11        5
-                m = p10.match(line)
+                m = p.p10.match(line)
                 if m :
                     # Add neighbor to dictionary
                     neighbor = str(m.groupdict()['neighbor'])
@@ -2302,7 +2299,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
                         nbr_dict['address_family'][address_family] = {}
                     nbr_af_dict = nbr_dict['address_family'][address_family]
 
-                m = p11.match(line)
+                m = p.p11.match(line)
                 if m:
                     # Add keys for this address_family
                     nbr_af_dict['version'] = int(m.groupdict()['version'])
@@ -2811,142 +2808,128 @@ class ShowBgpNeighborSuperParser(MetaParser):
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor}'
     '''
 
-    def cli(self, neighbor='', address_family='', vrf='', output=None):
-
-        # Init vars
-        ret_dict = {}
-        list_of_neighbors = []
-        af_name = None ; af_dict = {} ; nbr_dict = {}
-        message_statistics = False
-        prefix_activity = True
-        local_prefix = False
-        refresh_activity = False
-
+    patterns = Patterns(
         # For address family: IPv4 Unicast
         # For address family: L2VPN E-VPN
-        p1 = re.compile(r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$')
+        p1=r'^For +address +family: +(?P<af>[a-zA-Z0-9\-\s]+)$',
 
         # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-        p2_1 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
-                         ' +(?P<remote_as>([\d\.]+)), +(?P<link>[a-zA-Z]+) +link$')
+        p2_1=r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +remote +AS'
+              ' +(?P<remote_as>([\d\.]+)), +(?P<link>[a-zA-Z]+) +link$',
 
         # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
         # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-        p2_2 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
-                           ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>([\d\.]+)),'
-                           ' +(?P<link>[a-zA-Z]+) +link$')
+        p2_2=r'^BGP +neighbor +is +(?P<neighbor>(\S+)), +vrf'
+              ' +(?P<vrf>(\S+)), +remote +AS +(?P<remote_as>([\d\.]+)),'
+              ' +(?P<link>[a-zA-Z]+) +link$',
 
         # IOS output
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101, external link
         # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
         # BGP neighbor is 10.4.11.2, remote AS 101.101, external link
         # BGP neighbor is 10.10.11.1, vrf CustA-VPN1, remote AS 4200000001, local AS 4200000101 no-prepend replace-as, external link
-        p2_3 = re.compile(r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
-                           '(?: +vrf +(?P<vrf>(\S+)),)?'
-                           ' +remote +AS +(?P<remote_as>([\d\.]+)),'
-                           '( +local +AS +(?P<local_as>[\d\.]+))?(?P<no_prepend> no-prepend)?'
-                           '(?P<replace_as> replace-as)?,? +(?P<link>(\S+)) +link$')
+        p2_3=r'^BGP +neighbor +is +(?P<neighbor>(\S+)),'
+              '(?: +vrf +(?P<vrf>(\S+)),)?'
+              ' +remote +AS +(?P<remote_as>([\d\.]+)),'
+              '( +local +AS +(?P<local_as>[\d\.]+))?(?P<no_prepend> no-prepend)?'
+              '(?P<replace_as> replace-as)?,? +(?P<link>(\S+)) +link$',
 
         # Description: router22222222
-        p3 = re.compile(r'^Description: +(?P<description>(\S+))$')
+        p3=r'^Description: +(?P<description>(\S+))$',
 
         # Administratively shut down
-        p4 = re.compile(r'^Administratively shut down$')
+        p4=r'^Administratively shut down$',
 
         # BGP version 4, remote router ID 10.16.2.2
-        p5 = re.compile(r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
-                         ' +router +ID +(?P<router_id>(\S+))$')
+        p5=r'^BGP +version +(?P<bgp_version>(\d+)), +remote'
+            ' +router +ID +(?P<router_id>(\S+))$',
 
         # BGP state = Established, up for 01:10:35
         # BGP state = Idle, down for 01:10:35
         # BGP state = Idle
         # BGP state = Established, up for 1w2d
         # Session state = Closing
-        p6 = re.compile(r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
-                         '(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$')
+        p6=r'^(BGP|Session) +state += +(?P<session_state>(\S+))'
+            '(?:, +(?P<state>(up|down)) +for +(?P<time>(\S+)))?$',
 
         # Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
-        p7_1 = re.compile(r'^Last +read +(?P<last_read>(\S+)), +last +write'
-                           ' +(?P<last_write>(\S+)), +hold +time +is'
-                           ' +(?P<hold_time>(\d+)), +keepalive +interval +is'
-                           ' +(?P<keepalive>(\d+)) +seconds$')
+        p7_1=r'^Last +read +(?P<last_read>(\S+)), +last +write'
+              ' +(?P<last_write>(\S+)), +hold +time +is'
+              ' +(?P<hold_time>(\d+)), +keepalive +interval +is'
+              ' +(?P<keepalive>(\d+)) +seconds$',
 
         # Configured hold time is 90, keepalive interval is 30 seconds
-        p7_2 = re.compile(r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
-                           ' +keepalive +interval +is +(?P<keepalive>(\d+))'
-                           ' +seconds$')
+        p7_2=r'^Configured +hold +time +is (?P<holdtime>(\d+)),'
+              ' +keepalive +interval +is +(?P<keepalive>(\d+))'
+              ' +seconds$',
 
         # Minimum holdtime from neighbor is 0 seconds
-        p7_3 = re.compile(r'^Minimum +holdtime +from +neighbor +is'
-                           ' +(?P<min_holdtime>(\d+)) +seconds$')
+        p7_3=r'^Minimum +holdtime +from +neighbor +is'
+              ' +(?P<min_holdtime>(\d+)) +seconds$',
 
         # Neighbor sessions:
-        p7_4 = re.compile(r'^Neighbor +sessions:+$')
+        p7_4=r'^Neighbor +sessions:+$',
 
         # Neighbor sessions:
         #  1 active, is not multisession capable (disabled)
-        p8 = re.compile(r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
-                         ' +capable( +\(disabled\))?)?$')
+        p8=r'^(?P<sessions>(\d+)) active,(?: +is +not +multisession'
+            ' +capable( +\(disabled\))?)?$',
 
         # Neighbor capabilities:
-        p9 = re.compile(r'^Neighbor +capabilities:$')
+        p9=r'^Neighbor +capabilities:$',
 
         #  Route refresh: advertised and received(new)
-        p10 = re.compile(r'^Route +refresh: +(?P<route_refresh>(.*))$')
+        p10=r'^Route +refresh: +(?P<route_refresh>(.*))$',
 
         #  Four-octets ASN Capability: advertised and received
-        p11 = re.compile(r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$')
+        p11=r'^Four-octets +ASN +Capability: +(?P<cap>(.*))$',
 
         # Address family VPNv4 Unicast: advertised and received
         # Address family VPNv6 Unicast: advertised and received
         # Address family link-state link-state: advertised
-        p12 = re.compile(r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
-                          ' +(?P<val>(.*))$')
+        p12=r'^Address +family +(?P<af_type>([a-zA-Z0-9\s\-]+)) *:'
+             ' +(?P<val>(.*))$',
 
         #  Graceful Restart Capability: received
-        p13 = re.compile(r'^Graceful +Restart +Capability: +(?P<gr>(.*))$')
+        p13=r'^Graceful +Restart +Capability: +(?P<gr>(.*))$',
 
         #   Remote Restart timer is 120 seconds
-        p14 = re.compile(r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
-                          ' +seconds$')
+        p14=r'^Remote +Restart +timer +is +(?P<timer>(\d+))'
+             ' +seconds$',
 
         #   Address families advertised by peer:
         #    VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
-        p15 = re.compile(r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
-                          ' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
-                          ' +\(was +not +preserved$')
-
-        # Address families advertised by peer before restart:
-        #   IPv4 Unicast, VPNv4 Unicast, L2VPN Vpls
+        p15=r'^(?P<af_type1>([a-zA-Z0-9\s]+)) +\(was +not'
+             ' +preserved, +(?P<af_type2>([a-zA-Z0-9\s]+))'
+             ' +\(was +not +preserved$',
 
         #  Enhanced Refresh Capability: advertised
-        p16 = re.compile(r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$')
-
+        p16=r'^Enhanced +Refresh +Capability: +(?P<erc>(.*))$',
 
         #  Multisession Capability:
         #  Multisession Capability: advertised
-        p17 = re.compile(r'^Multisession +Capability: +(?P<multisession>(.*))$')
+        p17=r'^Multisession +Capability: +(?P<multisession>(.*))$',
 
         #  Stateful switchover support enabled: NO for session 1
-        p18 = re.compile(r'^Stateful +switchover +support +(?P<state>(\S+)):'
-                         ' +(?P<value>(.*))$')
+        p18=r'^Stateful +switchover +support +(?P<state>(\S+)):'
+             ' +(?P<value>(.*))$',
 
         # Message statistics:
         # Message statistics for 192.168.10.253 active:
         # Message statistics, state Established:
-        p19 = re.compile(r'^Message +statistics(( +for +(?P<state>[\w. ]+))|'
-                         r'(, +state +Established))?:$')
+        p19=r'^Message +statistics(( +for +(?P<state>[\w. ]+))|'
+            r'(, +state +Established))?:$',
 
         #  InQ depth is 0
         #  OutQ depth is 0
-        p20 = re.compile(r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$')
+        p20=r'^(?P<qtype>(InQ|OutQ)) +depth +is +(?P<val>(\d+))$',
 
         # Prefix activity:               ----       ----
         # Local Policy Denied Prefixes:    --------    -------
         # Refresh activity:          ----   ----
-        p21 = re.compile(r'^(?P<table_type>(Prefix activity|'
-                          'Local Policy Denied Prefixes|Refresh activity)) *:'
-                          ' +(.*)$')
+        p21=r'^(?P<table_type>(Prefix activity|'
+             'Local Policy Denied Prefixes|Refresh activity)) *:'
+             ' +(.*)$',
 
         #  Opens:                  1          1
         #  Notifications:          0          0
@@ -2957,74 +2940,72 @@ class ShowBgpNeighborSuperParser(MetaParser):
         #  Prefixes Current:     403        201 (Consumes 27336 bytes)
         #  Used as bestpath:     n/a          0
         #  Used as multipath:    n/a          0
-        p22 = re.compile('^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
-                         ' +(?P<recv>(n/a|\d+))(?:\s+\(Consumes +(?P<bytes>(\d+))'
-                         ' +bytes\))?$')
-
-        # Do log neighbor state changes (via global configuration)
+        p22='^(?P<item>([a-zA-Z\s\-]+)):? +(?P<sent>(n/a|\d+))'
+            ' +(?P<recv>(n/a|\d+))(?:\s+\(Consumes +(?P<bytes>(\d+))'
+            ' +bytes\))?$',
 
         # Default minimum time between advertisement runs is 0 seconds
-        p23 = re.compile(r'^Default +minimum +time +between +advertisement'
-                          ' +runs +is +(?P<time>(\d+)) +seconds$')
+        p23=r'^Default +minimum +time +between +advertisement'
+             ' +runs +is +(?P<time>(\d+)) +seconds$',
 
         # Address tracking is enabled, the RIB does have a route to 10.16.2.2
         # Address tracking is enabled, the RIB does not have a route to 10.16.2.2
-        p24 = re.compile(r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
-                          ' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$')
+        p24=r'^Address +tracking +is +(?P<status>(\S+)), +the +RIB'
+             ' +does( +(?P<rip_has_route>(not)+))? +have +a +route +to +(?P<route>(\S+))$',
 
         # Connections established 1; dropped 0
-        p25 = re.compile(r'^Connections +established +(?P<established>(\d+));'
-                          ' +dropped +(?P<dropped>(\d+))$')
+        p25=r'^Connections +established +(?P<established>(\d+));'
+             ' +dropped +(?P<dropped>(\d+))$',
 
         # Last reset never
         # Last reset 01:05:09, due to Active open failed
-        p26 = re.compile(r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
-                          ' +(?P<reason>(.*)))?$')
+        p26=r'^Last +reset +(?P<reset>(\S+))(?:, +due +to'
+             ' +(?P<reason>(.*)))?$',
 
         # Transport(tcp) path-mtu-discovery is enabled
-        p27 = re.compile(r'^Transport\(tcp\) +path-mtu-discovery +is'
-                          ' +(?P<status>(\S+))$')
+        p27=r'^Transport\(tcp\) +path-mtu-discovery +is'
+             ' +(?P<status>(\S+))$',
 
         # Graceful-Restart is disabled
         # Graceful-Restart is enabled, restart-time 120 seconds, stalepath-time 360 seconds
-        p28 = re.compile(r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
-                          '(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
-                          ' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$')
+        p28=r'^Graceful-Restart +is +(?P<gr>(enabled|disabled))'
+             '(?:, +restart-time +(?P<restart>(\d+)) +seconds,'
+             ' +stalepath-time +(?P<stalepath>(\d+)) +seconds)?$',
 
         # Connection state is ESTAB, I/O status: 1, unread input bytes: 0
-        p29 = re.compile(r'^Connection +state +is +(?P<state>(\S+)), +I/O'
-                          ' +status: (?P<io>(\d+)), +unread +input +bytes:'
-                          ' +(?P<bytes>(\d+))$')
+        p29=r'^Connection +state +is +(?P<state>(\S+)), +I/O'
+             ' +status: (?P<io>(\d+)), +unread +input +bytes:'
+             ' +(?P<bytes>(\d+))$',
 
         # Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
-        p30 = re.compile(r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
-                          ' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
-                          ' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$')
+        p30=r'^Connection +is +ECN +(?P<ecn_state>(\S+)),'
+             ' +Mininum +incoming +TTL +(?P<incoming_ttl>(\d+)),'
+             ' +Outgoing +TTL +(?P<outgoing_ttl>(\d+))$',
 
         # Local host: 10.64.4.4, Local port: 35281
-        p31 = re.compile(r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
-                          ' +(?P<local_port>(\d+))$')
+        p31=r'^Local +host: +(?P<local_host>(\S+)), +Local +port:'
+             ' +(?P<local_port>(\d+))$',
 
         # Foreign host: 10.16.2.2, Foreign port: 179
-        p32 = re.compile(r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
-                          ' +port: +(?P<foreign_port>(\d+))$')
+        p32=r'^Foreign +host: +(?P<foreign_host>(\S+)), +Foreign'
+             ' +port: +(?P<foreign_port>(\d+))$',
 
         # Connection tableid (VRF): 0
-        p33 = re.compile(r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$')
+        p33=r'^Connection +tableid +\(VRF\): +(?P<val>(\d+))$',
 
         # Maximum output segment queue size: 50
-        p34 = re.compile(r'^Maximum +output +segment +queue +size:'
-                          ' +(?P<size>(\d+))$')
+        p34=r'^Maximum +output +segment +queue +size:'
+             ' +(?P<size>(\d+))$',
 
         # Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
-        p35 = re.compile(r'^Enqueued +packets +for +retransmit:'
-                          ' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
-                          ' +mis-ordered: +(?P<misordered>(\d+))'
-                          ' +\((?P<bytes>(\d+)) +bytes+\)$')
+        p35=r'^Enqueued +packets +for +retransmit:'
+             ' +(?P<retransmit>(\d+)), +input: +(?P<input>(\d+))'
+             ' +mis-ordered: +(?P<misordered>(\d+))'
+             ' +\((?P<bytes>(\d+)) +bytes+\)$',
 
         # Event Timers (current time is 0x530449):
-        p36 = re.compile(r'^Event +Timers +\(+current +time +is'
-                          ' +(?P<time>(\S+))+\):$')
+        p36=r'^Event +Timers +\(+current +time +is'
+             ' +(?P<time>(\S+))+\):$',
 
         # Timer          Starts    Wakeups            Next
         # Retrans            86          0             0x0
@@ -3037,161 +3018,175 @@ class ShowBgpNeighborSuperParser(MetaParser):
         # DeadWait            0          0             0x0
         # Linger              0          0             0x0
         # ProcessQ            0          0             0x0
-        p37 = re.compile(r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
-                          ' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$')
+        p37=r'^(?P<item>(\S+)) +(?P<starts>(\d+))'
+             ' +(?P<wakeups>(\d+)) +(?P<next>0x[0-9a-f]+)$',
 
         # iss:   55023811  snduna:   55027115  sndnxt:   55027115
-        p38 = re.compile(r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
-                          ' +sndnxt: +(?P<sndnxt>(\d+))$')
+        p38=r'^iss: +(?P<iss>(\d+)) +snduna: +(?P<snduna>(\d+))'
+             ' +sndnxt: +(?P<sndnxt>(\d+))$',
 
         # irs:  109992783  rcvnxt:  109995158
-        p39 = re.compile(r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$')
-
+        p39=r'^irs: +(?P<irs>(\d+)) +rcvnxt: +(?P<rcvnxt>(\d+))$',
 
         # sndwnd:  16616  scale:      0  maxrcvwnd:  16384
-        p40 = re.compile(r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          ' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$')
+        p40=r'^sndwnd: +(?P<sndwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+             ' +maxrcvwnd: +(?P<maxrcvwnd>(\d+))$',
 
         # rcvwnd:  16327  scale:      0  delrcvwnd:     57
-        p41 = re.compile(r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
-                          ' +delrcvwnd: +(?P<delrcvwnd>(\d+))$')
+        p41=r'^rcvwnd: +(?P<rcvwnd>(\d+)) +scale: +(?P<scale>(\d+))'
+             ' +delrcvwnd: +(?P<delrcvwnd>(\d+))$',
 
         # SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
-        p42 = re.compile(r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
-                          ' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
-                          ' +(?P<krtt>(\d+)) +ms$')
+        p42=r'^SRTT: +(?P<srtt>(\d+)) +ms, +RTTO: +(?P<rtto>(\d+))'
+             ' +ms, +RTV: +(?P<rtv>(\d+)) +ms, +KRTT:'
+             ' +(?P<krtt>(\d+)) +ms$',
 
         # minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
-        p43 = re.compile(r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
-                          ' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
-                          ' +(?P<ack_hold>(\d+)) +ms$')
-
+        p43=r'^minRTT: +(?P<min_rtt>(\d+)) +ms, +maxRTT:'
+             ' +(?P<max_rtt>(\d+)) +ms, +ACK +hold:'
+             ' +(?P<ack_hold>(\d+)) +ms$',
 
         # uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
-        p44 = re.compile(r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
-                          ' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
-                          ' +(?P<receive>(\d+)) +ms$')
+        p44=r'^uptime: +(?P<uptime>(\d+)) +ms, +Sent +idletime:'
+             ' +(?P<sent>(\d+)) +ms, +Receive +idletime:'
+             ' +(?P<receive>(\d+)) +ms$',
 
         # Status Flags: active open
-        p45 = re.compile(r'^Status +Flags: +(?P<flags>(.*))$')
+        p45=r'^Status +Flags: +(?P<flags>(.*))$',
 
         # Option Flags: nagle, path mtu capable
-        p46 = re.compile(r'^Option +Flags: +(?P<flags>(.*))$')
+        p46=r'^Option +Flags: +(?P<flags>(.*))$',
 
         # IP Precedence value : 6
-        p47 = re.compile(r'^IP +Precedence +value : +(?P<value>(\d+))$')
+        p47=r'^IP +Precedence +value : +(?P<value>(\d+))$',
 
         # Datagrams (max data segment is 536 bytes):
-        p48 = re.compile(r'^Datagrams +\(max +data +segment +is'
-                          ' +(?P<bytes>(\d+)) +bytes\):$')
+        p48=r'^Datagrams +\(max +data +segment +is'
+             ' +(?P<bytes>(\d+)) +bytes\):$',
 
         # Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
-        p49 = re.compile(r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
-                          ' +(?P<out_of_order>(\d+))\), +with +data:'
-                          ' (?P<with_data>(\d+)), +total +data +bytes:'
-                          ' (?P<total_data>(\d+))$')
+        p49=r'^Rcvd: +(?P<received>(\d+)) +\(out +of +order:'
+             ' +(?P<out_of_order>(\d+))\), +with +data:'
+             ' (?P<with_data>(\d+)), +total +data +bytes:'
+             ' (?P<total_data>(\d+))$',
 
         # Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0), with data: 87, total data bytes: 3303
-        p50 = re.compile(r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
-                          ' +(?P<retransmit>(\d+)), +fastretransmit:'
-                          ' +(?P<fastretransmit>(\d+)), +partialack:'
-                          ' +(?P<partialack>(\d+)), +Second +Congestion:'
-                          ' +(?P<second_congestion>(\d+))\), +with +data:'
-                          ' (?P<sent_with_data>(\d+)), +total +data +bytes:'
-                          ' +(?P<sent_total_data>(\d+))$')
-
+        p50=r'^Sent: (?P<sent>(\d+)) +\(retransmit:'
+             ' +(?P<retransmit>(\d+)), +fastretransmit:'
+             ' +(?P<fastretransmit>(\d+)), +partialack:'
+             ' +(?P<partialack>(\d+)), +Second +Congestion:'
+             ' +(?P<second_congestion>(\d+))\), +with +data:'
+             ' (?P<sent_with_data>(\d+)), +total +data +bytes:'
+             ' +(?P<sent_total_data>(\d+))$',
 
         # Packets received in fast path: 0, fast processed: 0, slow path: 0
-        p51 = re.compile(r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
-                          ' +fast +processed: +(?P<processed>(\d+)),'
-                          ' +slow +path: +(?P<path>(\d+))$')
+        p51=r'^Packets +received +in +fast +path: +(?P<rcv>(\d+)),'
+             ' +fast +processed: +(?P<processed>(\d+)),'
+             ' +slow +path: +(?P<path>(\d+))$',
 
         # fast lock acquisition failures: 0, slow path: 0
-        p52 = re.compile(r'^fast +lock +acquisition +failures:'
-                          ' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$')
-
+        p52=r'^fast +lock +acquisition +failures:'
+             ' +(?P<failures>(\d+)), +slow +path: +(?P<path>(\d+))$',
 
         # TCP Semaphore      0x1286E7EC  FREE
-        p53 = re.compile(r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
-                          ' +(?P<status>(\S+))$')
+        p53=r'^TCP +Semaphore +(?P<semaphore>0x[0-9a-fA-F]+)'
+             ' +(?P<status>(\S+))$',
 
         # BGP table version 9431, neighbor version 9431/0
-        p54 = re.compile(r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
-                          ' +neighbor +version +(?P<nbr_version>(\S+))$')
+        p54=r'^BGP +table +version +(?P<bgp_table_version>(\d+)),'
+             ' +neighbor +version +(?P<nbr_version>(\S+))$',
 
         # Output queue size : 0
-        p55 = re.compile(r'^Output +queue +size *: +(?P<size>(\d+))$')
+        p55=r'^Output +queue +size *: +(?P<size>(\d+))$',
 
         # Index 38, Advertise bit 1
-        p56 = re.compile(r'^Index +(?P<index>(\d+)), +Advertise +bit'
-                        ' +(?P<adv_bit>(\d+))$')
+        p56=r'^Index +(?P<index>(\d+)), +Advertise +bit'
+             ' +(?P<adv_bit>(\d+))$',
 
         # Route-Reflector Client
-        p57 = re.compile(r'^Route-Reflector +Client$')
+        p57=r'^Route-Reflector +Client$',
 
         # 38 update-group member
-        p58 = re.compile(r'^(?P<num>(\d+)) +update-group +member$')
+        p58=r'^(?P<num>(\d+)) +update-group +member$',
 
         # Community attribute sent to this neighbor
-        p59 = re.compile(r'^Community +attribute +sent +to +this +neighbor$')
+        p59=r'^Community +attribute +sent +to +this +neighbor$',
 
         # Extended-community attribute sent to this neighbor
-        p60 = re.compile(r'^Extended-community +attribute +sent +to +this'
-                        ' +neighbor$')
+        p60=r'^Extended-community +attribute +sent +to +this'
+             ' +neighbor$',
 
         # Suppress LDP signaling protocol
-        p61 = re.compile(r'^Suppress +LDP +signaling +protocol$')
+        p61=r'^Suppress +LDP +signaling +protocol$',
 
         # Slow-peer detection is disabled
-        p62 = re.compile(r'^Slow-peer +detection +is'
-                          ' +(?P<state>(enabled|disabled))$')
+        p62=r'^Slow-peer +detection +is'
+             ' +(?P<state>(enabled|disabled))$',
 
         # Slow-peer split-update-group dynamic is disabled
-        p63 = re.compile(r'^Slow-peer +split-update-group +dynamic +is'
-                          ' +(?P<state>(enabled|disabled))$')
+        p63=r'^Slow-peer +split-update-group +dynamic +is'
+             ' +(?P<state>(enabled|disabled))$',
 
         # Number of NLRIs in the update sent: max 199, min 0
-        p64 = re.compile(r'^Number +of +NLRIs +in +the +update +sent: +max'
-                        ' +(?P<max>(\d+)), +min +(?P<min>(\d+))$')
+        p64=r'^Number +of +NLRIs +in +the +update +sent: +max'
+             ' +(?P<max>(\d+)), +min +(?P<min>(\d+))$',
 
         # Last detected as dynamic slow peer: never
-        p65 = re.compile(r'^Last +detected +as +dynamic +slow +peer:'
-                          ' +(?P<val>(\S+))$')
+        p65=r'^Last +detected +as +dynamic +slow +peer:'
+             ' +(?P<val>(\S+))$',
 
         # Dynamic slow peer recovered: never
-        p66 = re.compile(r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$')
+        p66=r'^Dynamic +slow +peer +recovered: +(?P<val>(\S+))$',
 
         # Refresh Epoch: 3
-        p67 = re.compile(r'^Refresh +Epoch: +(?P<num>(\d+))$')
+        p67=r'^Refresh +Epoch: +(?P<num>(\d+))$',
 
         # Last Sent Refresh Start-of-rib: 02:41:38
         # Last Received Refresh Start-of-rib: 02:01:36
-        p68 = re.compile(r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
-                          ' +(?P<val>(\S+))$')
+        p68=r'^Last +(Sent|Received) +Refresh +Start-of-rib:'
+             ' +(?P<val>(\S+))$',
 
         # Last Sent Refresh End-of-rib: 02:41:38
         # Last Received Refresh End-of-rib: 02:01:32
-        p69 = re.compile(r'^Last +(Sent|Received) +Refresh +End-of-rib:'
-                          ' +(?P<val>(\S+))$')
+        p69=r'^Last +(Sent|Received) +Refresh +End-of-rib:'
+             ' +(?P<val>(\S+))$',
 
         # Refresh-Out took 0 seconds
         # Refresh-In took 4 seconds
-        p70 = re.compile(r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
-                          ' +seconds$')
+        p70=r'^Refresh-(?P<type>(In|Out)) +took +(?P<val>(\d+))'
+             ' +seconds$',
 
         # SSO is disabled
-        p71 = re.compile(r'^SSO +is +(?P<state>(enabled|disabled))$')
+        p71=r'^SSO +is +(?P<state>(enabled|disabled))$',
 
         # No active TCP connection
-        p72 = re.compile(r'^No +active +TCP +connection$')
+        p72=r'^No +active +TCP +connection$',
+    )
+    dispatcher = LineDispatcher(patterns)
+
+    def cli(self, neighbor='', address_family='', vrf='', output=None):
+
+        # Init vars
+        ret_dict = {}
+        list_of_neighbors = []
+        af_name = None ; af_dict = {} ; nbr_dict = {}
+        message_statistics = False
+        prefix_activity = True
+        local_prefix = False
+        refresh_activity = False
+
+        # Address families advertised by peer before restart:
+        #   IPv4 Unicast, VPNv4 Unicast, L2VPN Vpls
+
+        # Do log neighbor state changes (via global configuration)
 
         for line in output.splitlines():
 
             line = line.strip()
+            name, m = ShowBgpNeighborSuperParser.dispatcher.match(line)
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 af_name = m.groupdict()['af'].lower().replace("-", "")
                 # af_dict
                 if nbr_dict:
@@ -3200,8 +3195,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-            m = p2_1.match(line)
-            if m:
+            if name == 'p2_1':
                 group = m.groupdict()
                 neighbor = group['neighbor']
                 vrf = 'default'
@@ -3231,8 +3225,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # BGP neighbor is 10.66.6.6,  vrf VRF2,  remote AS 400, external link
             # BGP neighbor is 172.17.111.1,  vrf SH_BGP_VRF100,  remote AS 65000, external link
-            m = p2_2.match(line)
-            if m:
+            if name == 'p2_2':
                 group = m.groupdict()
                 neighbor = group['neighbor']
                 vrf = group['vrf']
@@ -3263,8 +3256,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # BGP neighbor is 10.51.1.101,  remote AS 300,  local AS 101 no-prepend replace-as, external link
             # BGP neighbor is 10.4.11.2, remote AS 101.101, external link
             # BGP neighbor is 10.10.11.1, vrf CustA-VPN1, remote AS 4200000001, local AS 4200000101 no-prepend replace-as, external link
-            m = p2_3.match(line)
-            if m:
+            if name == 'p2_3':
                 group = m.groupdict()
                 neighbor = group['neighbor']
                 vrf = group['vrf']
@@ -3308,20 +3300,17 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Description: router22222222
-            m = p3.match(line)
-            if m:
+            if name == 'p3':
                 nbr_dict['description'] = m.groupdict()['description']
                 continue
 
             # Administratively shut down
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 nbr_dict['shutdown'] = True
                 continue
 
             # BGP version 4, remote router ID 10.16.2.2
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
                 group = m.groupdict()
                 nbr_dict['bgp_version'] = int(group['bgp_version'])
                 nbr_dict['router_id'] = group['router_id']
@@ -3331,8 +3320,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # BGP state = Idle, down for 01:10:35
             # BGP state = Idle
             # BGP state = Established, up for 1w2d
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 group = m.groupdict()
                 nbr_dict['session_state'] = group['session_state']
                 if af_name:
@@ -3345,8 +3333,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Last read 00:00:04, last write 00:00:09, hold time is 180, keepalive interval is 60 seconds
-            m = p7_1.match(line)
-            if m:
+            if name == 'p7_1':
                 group = m.groupdict()
                 timers_dict = nbr_dict.\
                                 setdefault('bgp_negotiated_keepalive_timers', {})
@@ -3358,8 +3345,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Configured hold time is 90, keepalive interval is 30 seconds
-            m = p7_2.match(line)
-            if m:
+            if name == 'p7_2':
                 group = m.groupdict()
                 timers_dict = nbr_dict.\
                                 setdefault('bgp_negotiated_keepalive_timers', {})
@@ -3368,22 +3354,19 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Minimum holdtime from neighbor is 0 seconds
-            m = p7_3.match(line)
-            if m:
+            if name == 'p7_3':
                 timers_dict['min_holdtime'] = int(m.groupdict()['min_holdtime'])
                 continue
 
             # Neighbor sessions:
-            m = p7_4.match(line)
-            if m:
+            if name == 'p7_4':
                 neighbor_type = 'neighbor_session'
                 nbr_session_dict = nbr_dict.\
                                 setdefault('bgp_neighbor_session', {})
                 continue
 
             #  1 active, is not multisession capable (disabled)
-            m = p8.match(line)
-            if m:
+            if name == 'p8':
                 neighbor_active_sessions = int(m.groupdict()['sessions'])
                 if neighbor_type == 'neighbor_session':
                     nbr_session_dict.update({'sessions': neighbor_active_sessions})
@@ -3391,22 +3374,19 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
 
             # Neighbor capabilities:
-            m = p9.match(line)
-            if m:
+            if name == 'p9':
                 neighbor_type = 'neighbor_capabilities'
                 nbr_cap_dict = nbr_dict.\
                                 setdefault('bgp_negotiated_capabilities', {})
                 continue
 
             #  Route refresh: advertised and received(new)
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 nbr_cap_dict['route_refresh'] = m.groupdict()['route_refresh']
                 continue
 
             #  Four-octets ASN Capability: advertised and received
-            m = p11.match(line)
-            if m:
+            if name == 'p11':
                 nbr_cap_dict['four_octets_asn'] = m.groupdict()['cap']
                 continue
 
@@ -3415,29 +3395,25 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # Address family IPv4 Unicast: advertised and received
             # Address family IPv6 Unicast: advertised and received
             # Address family link-state link-state: advertised
-            m = p12.match(line)
-            if m:
+            if name == 'p12':
                 group = m.groupdict()
                 af_type = group['af_type'].lower().replace(" ", "_")
                 nbr_cap_dict[af_type] = group['val']
                 continue
 
             #  Graceful Restart Capability: received
-            m = p13.match(line)
-            if m:
+            if name == 'p13':
                 nbr_cap_dict['graceful_restart'] = m.groupdict()['gr']
                 continue
 
             #   Remote Restart timer is 120 seconds
-            m = p14.match(line)
-            if m:
+            if name == 'p14':
                 nbr_cap_dict['remote_restart_timer'] = int(m.groupdict()['timer'])
                 continue
 
             #   Address families advertised by peer:
             #    VPNv4 Unicast (was not preserved, VPNv6 Unicast (was not preserved
-            m = p15.match(line)
-            if m:
+            if name == 'p15':
                 af_list = []
                 group = m.groupdict()
                 af_list.append(group['af_type1'].lower())
@@ -3446,21 +3422,18 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             #  Enhanced Refresh Capability: advertised
-            m = p16.match(line)
-            if m:
+            if name == 'p16':
                 nbr_cap_dict['enhanced_refresh'] = m.groupdict()['erc']
                 continue
 
             #  Multisession Capability:
             #  Multisession Capability: advertised
-            m = p17.match(line)
-            if m:
+            if name == 'p17':
                 nbr_cap_dict['multisession'] = m.groupdict()['multisession']
                 continue
 
             # Stateful switchover support enabled: NO for session 1
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 if neighbor_type == 'neighbor_session':
                     nbr_session_dict['stateful_switchover'] = m.groupdict()['value']
                 else:
@@ -3470,8 +3443,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # Message statistics:
             # Message statistics for 192.168.10.253 active:
             # Message statistics, state Established:
-            m = p19.match(line)
-            if m:
+            if name == 'p19':
                 message_statistics = True
                 prefix_activity = False
                 local_prefix = False
@@ -3494,8 +3466,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             #  InQ depth is 0
             #  OutQ depth is 0
-            m = p20.match(line)
-            if m:
+            if name == 'p20':
                 group = m.groupdict()
                 key = '{}_depth'.format(group['qtype'].lower().\
                                         replace("q", "_queue"))
@@ -3505,8 +3476,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # Prefix activity:               ----       ----
             # Local Policy Denied Prefixes:    --------    -------
             # Refresh activity:          ----   ----
-            m = p21.match(line)
-            if m:
+            if name == 'p21':
                 table_type = m.groupdict()['table_type'].lower()
                 if table_type == 'prefix activity':
                     message_statistics = False
@@ -3546,8 +3516,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             #  Route Refresh:          0          0
             #  Total:                 87         81
             #  Prefixes Current:     403        201 (Consumes 27336 bytes)
-            m = p22.match(line)
-            if m:
+            if name == 'p22':
                 group = m.groupdict()
                 item = group['item'].strip().lower().replace(" ", "_").\
                                                      replace("-", "_")
@@ -3576,8 +3545,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Default minimum time between advertisement runs is 0 seconds
-            m = p23.match(line)
-            if m:
+            if name == 'p23':
                 session_transport_dict = nbr_dict.\
                                         setdefault('bgp_session_transport', {})
                 session_transport_dict['min_time_between_advertisement_runs'] =\
@@ -3586,8 +3554,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Address tracking is enabled, the RIB does have a route to 10.16.2.2
             # Address tracking is enabled, the RIB does not have a route to 10.16.2.2
-            m = p24.match(line)
-            if m:
+            if name == 'p24':
                 group = m.groupdict()
                 session_transport_dict['address_tracking_status'] = group['status']
                 if not group['rip_has_route']:
@@ -3595,8 +3562,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connections established 1; dropped 0
-            m = p25.match(line)
-            if m:
+            if name == 'p25':
                 group = m.groupdict()
                 conn_dict = session_transport_dict.setdefault('connection', {})
                 conn_dict['established'] = int(group['established'])
@@ -3604,8 +3570,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Last reset never
-            m = p26.match(line)
-            if m:
+            if name == 'p26':
                 group = m.groupdict()
                 conn_dict['last_reset'] = group['reset']
                 if group['reason']:
@@ -3613,16 +3578,14 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Transport(tcp) path-mtu-discovery is enabled
-            m = p27.match(line)
-            if m:
+            if name == 'p27':
                 session_transport_dict['tcp_path_mtu_discovery'] = \
                                                         m.groupdict()['status']
                 continue
 
             # Graceful-Restart is disabled
             # Graceful-Restart is enabled, restart-time 120 seconds, stalepath-time 360 seconds
-            m = p28.match(line)
-            if m:
+            if name == 'p28':
                 group = m.groupdict()
                 session_transport_dict['graceful_restart'] = group['gr']
                 if group['restart']:
@@ -3634,8 +3597,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connection state is ESTAB, I/O status: 1, unread input bytes: 0
-            m = p29.match(line)
-            if m:
+            if name == 'p29':
                 group = m.groupdict()
                 session_transport_dict['connection_state'] = \
                                                         group['state'].lower()
@@ -3644,8 +3606,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Connection is ECN Disabled, Mininum incoming TTL 0, Outgoing TTL 255
-            m = p30.match(line)
-            if m:
+            if name == 'p30':
                 group = m.groupdict()
                 session_transport_dict['ecn_connection'] = \
                                                     group['ecn_state'].lower()
@@ -3656,8 +3617,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Local host: 10.64.4.4, Local port: 35281
-            m = p31.match(line)
-            if m:
+            if name == 'p31':
                 group = m.groupdict()
                 transport_dict = session_transport_dict.\
                                                     setdefault('transport', {})
@@ -3666,30 +3626,26 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Foreign host: 10.16.2.2, Foreign port: 179
-            m = p32.match(line)
-            if m:
+            if name == 'p32':
                 group = m.groupdict()
                 transport_dict['foreign_host'] = group['foreign_host']
                 transport_dict['foreign_port'] = group['foreign_port']
                 continue
 
             # Connection tableid (VRF): 0
-            m = p33.match(line)
-            if m:
+            if name == 'p33':
                 session_transport_dict['connection_tableid'] = \
                                                     int(m.groupdict()['val'])
                 continue
 
             # Maximum output segment queue size: 50
-            m = p34.match(line)
-            if m:
+            if name == 'p34':
                 session_transport_dict['maximum_output_segment_queue_size'] = \
                                                     int(m.groupdict()['size'])
                 continue
 
             # Enqueued packets for retransmit: 0, input: 0  mis-ordered: 0 (0 bytes)
-            m = p35.match(line)
-            if m:
+            if name == 'p35':
                 group = m.groupdict()
                 enq_dict = session_transport_dict.setdefault('enqueued_packets', {})
                 enq_dict['retransmit_packet'] = int(group['retransmit'])
@@ -3698,8 +3654,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Event Timers (current time is 0x530449):
-            m = p36.match(line)
-            if m:
+            if name == 'p36':
                 af_dict['current_time'] = m.groupdict()['time']
                 event_timers_dict = nbr_dict.setdefault('bgp_event_timer', {})
                 starts_dict = event_timers_dict.setdefault('starts', {})
@@ -3718,8 +3673,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
             # DeadWait            0          0             0x0
             # Linger              0          0             0x0
             # ProcessQ            0          0             0x0
-            m = p37.match(line)
-            if m:
+            if name == 'p37':
                 group = m.groupdict()
                 item = group['item'].lower()
                 starts_dict[item] = int(group['starts'])
@@ -3728,8 +3682,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # iss:   55023811  snduna:   55027115  sndnxt:   55027115
-            m = p38.match(line)
-            if m:
+            if name == 'p38':
                 group = m.groupdict()
                 session_transport_dict['iss'] = int(group['iss'])
                 session_transport_dict['snduna'] = int(group['snduna'])
@@ -3737,16 +3690,14 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # irs:  109992783  rcvnxt:  109995158
-            m = p39.match(line)
-            if m:
+            if name == 'p39':
                 group = m.groupdict()
                 session_transport_dict['irs'] = int(group['irs'])
                 session_transport_dict['rcvnxt'] = int(group['rcvnxt'])
                 continue
 
             # sndwnd:  16616  scale:      0  maxrcvwnd:  16384
-            m = p40.match(line)
-            if m:
+            if name == 'p40':
                 group = m.groupdict()
                 session_transport_dict['sndwnd'] = int(group['sndwnd'])
                 session_transport_dict['snd_scale'] = int(group['scale'])
@@ -3754,8 +3705,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # rcvwnd:  16327  scale:      0  delrcvwnd:     57
-            m = p41.match(line)
-            if m:
+            if name == 'p41':
                 group = m.groupdict()
                 session_transport_dict['rcvwnd'] = int(group['rcvwnd'])
                 session_transport_dict['rcv_scale'] = int(group['scale'])
@@ -3763,8 +3713,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # SRTT: 1000 ms, RTTO: 1003 ms, RTV: 3 ms, KRTT: 0 ms
-            m = p42.match(line)
-            if m:
+            if name == 'p42':
                 group = m.groupdict()
                 session_transport_dict['srtt'] = int(group['srtt'])
                 session_transport_dict['rtto'] = int(group['rtto'])
@@ -3773,8 +3722,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # minRTT: 4 ms, maxRTT: 1000 ms, ACK hold: 200 ms
-            m = p43.match(line)
-            if m:
+            if name == 'p43':
                 group = m.groupdict()
                 session_transport_dict['min_rtt'] = int(group['min_rtt'])
                 session_transport_dict['max_rtt'] = int(group['max_rtt'])
@@ -3782,8 +3730,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # uptime: 4236258 ms, Sent idletime: 4349 ms, Receive idletime: 4549 ms
-            m = p44.match(line)
-            if m:
+            if name == 'p44':
                 group = m.groupdict()
                 session_transport_dict['uptime'] = int(group['uptime'])
                 session_transport_dict['sent_idletime'] = int(group['sent'])
@@ -3791,35 +3738,30 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Status Flags: active open
-            m = p45.match(line)
-            if m:
+            if name == 'p45':
                 session_transport_dict['status_flags'] = m.groupdict()['flags']
                 continue
 
             # Option Flags: nagle, path mtu capable
-            m = p46.match(line)
-            if m:
+            if name == 'p46':
                 session_transport_dict['option_flags'] = m.groupdict()['flags']
                 continue
 
             # IP Precedence value : 6
-            m = p47.match(line)
-            if m:
+            if name == 'p47':
                 session_transport_dict['ip_precedence_value'] = \
                                                     int(m.groupdict()['value'])
                 continue
 
             # Datagrams (max data segment is 536 bytes):
-            m = p48.match(line)
-            if m:
+            if name == 'p48':
                 session_transport_dict['transport']['mss'] = \
                                                     int(m.groupdict()['bytes'])
                 datagram_dict = session_transport_dict.setdefault('datagram', {})
                 continue
 
             # Rcvd: 164 (out of order: 0), with data: 80, total data bytes: 2374
-            m = p49.match(line)
-            if m:
+            if name == 'p49':
                 group = m.groupdict()
                 datagram_rcv_dict = datagram_dict.\
                                             setdefault('datagram_received', {})
@@ -3831,8 +3773,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Sent: 166 (retransmit: 0, fastretransmit: 0, partialack: 0, Second Congestion: 0),
             #       with data: 87, total data bytes: 3303
-            m = p50.match(line)
-            if m:
+            if name == 'p50':
                 group = m.groupdict()
                 datagram_sent_dict = datagram_dict.\
                                             setdefault('datagram_sent', {})
@@ -3846,8 +3787,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Packets received in fast path: 0, fast processed: 0, slow path: 0
-            m = p51.match(line)
-            if m:
+            if name == 'p51':
                 group = m.groupdict()
                 session_transport_dict['packet_fast_path'] = int(group['rcv'])
                 session_transport_dict['packet_fast_processed'] = \
@@ -3856,8 +3796,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # fast lock acquisition failures: 0, slow path: 0
-            m = p52.match(line)
-            if m:
+            if name == 'p52':
                 group = m.groupdict()
                 session_transport_dict['fast_lock_acquisition_failures'] = \
                                                         int(group['failures'])
@@ -3865,8 +3804,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # TCP Semaphore      0x1286E7EC  FREE
-            m = p53.match(line)
-            if m:
+            if name == 'p53':
                 group = m.groupdict()
                 session_transport_dict['tcp_semaphore'] = group['semaphore']
                 session_transport_dict['tcp_semaphore_status'] = group['status']
@@ -3874,60 +3812,51 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Session: 192.168.197.254
             # BGP table version 9431, neighbor version 9431/0
-            m = p54.match(line)
-            if m:
+            if name == 'p54':
                 group = m.groupdict()
                 af_dict['bgp_table_version'] = int(group['bgp_table_version'])
                 af_dict['neighbor_version'] = group['nbr_version']
                 continue
 
             # Output queue size : 0
-            m = p55.match(line)
-            if m:
+            if name == 'p55':
                 af_dict['output_queue_size'] = int(m.groupdict()['size'])
                 continue
 
             # Index 38, Advertise bit 1
-            m = p56.match(line)
-            if m:
+            if name == 'p56':
                 group = m.groupdict()
                 af_dict['index'] = int(group['index'])
                 af_dict['advertise_bit'] = int(group['adv_bit'])
                 continue
 
             # Route-Reflector Client
-            m = p57.match(line)
-            if m:
+            if name == 'p57':
                 af_dict['route_reflector_client'] = True
                 continue
 
             # 38 update-group member
-            m = p58.match(line)
-            if m:
+            if name == 'p58':
                 af_dict['update_group_member'] = int(m.groupdict()['num'])
                 continue
 
             # Community attribute sent to this neighbor
-            m = p59.match(line)
-            if m:
+            if name == 'p59':
                 af_dict['community_attribute_sent'] = True
                 continue
 
             # Extended-community attribute sent to this neighbor
-            m = p60.match(line)
-            if m:
+            if name == 'p60':
                 af_dict['extended_community_attribute_sent'] = True
                 continue
 
             # Suppress LDP signaling protocol
-            m = p61.match(line)
-            if m:
+            if name == 'p61':
                 af_dict['suppress_ldp_signaling'] = True
                 continue
 
             # Slow-peer detection is disabled
-            m = p62.match(line)
-            if m:
+            if name == 'p62':
                 if m.groupdict()['state'] == 'disabled':
                     af_dict['slow_peer_detection'] = False
                 else:
@@ -3935,8 +3864,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Slow-peer split-update-group dynamic is disabled
-            m = p63.match(line)
-            if m:
+            if name == 'p63':
                 if m.groupdict()['state'] == 'disabled':
                     af_dict['slow_peer_split_update_group_dynamic'] = False
                 else:
@@ -3944,35 +3872,30 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # Number of NLRIs in the update sent: max 199, min 0
-            m = p64.match(line)
-            if m:
+            if name == 'p64':
                 group = m.groupdict()
                 af_dict['max_nlri'] = int(group['max'])
                 af_dict['min_nlri'] = int(group['min'])
                 continue
 
             # Last detected as dynamic slow peer: never
-            m = p65.match(line)
-            if m:
+            if name == 'p65':
                 af_dict['last_detected_dynamic_slow_peer'] = m.groupdict()['val']
                 continue
 
             # Dynamic slow peer recovered: never
-            m = p66.match(line)
-            if m:
+            if name == 'p66':
                 af_dict['dynamic_slow_peer_recovered'] = m.groupdict()['val']
                 continue
 
             # Refresh Epoch: 3
-            m = p67.match(line)
-            if m:
+            if name == 'p67':
                 af_dict['refresh_epoch'] = int(m.groupdict()['num'])
                 continue
 
             # Last Sent Refresh Start-of-rib: 02:41:38
             # Last Received Refresh Start-of-rib: 02:01:36
-            m = p68.match(line)
-            if m:
+            if name == 'p68':
                 if 'Sent' in line:
                     af_dict['last_sent_refresh_start_of_rib'] = \
                                                             m.groupdict()['val']
@@ -3983,8 +3906,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Last Sent Refresh End-of-rib: 02:41:38
             # Last Received Refresh End-of-rib: 02:01:32
-            m = p69.match(line)
-            if m:
+            if name == 'p69':
                 if 'Sent' in line:
                     af_dict['last_sent_refresh_end_of_rib'] = \
                                                             m.groupdict()['val']
@@ -3995,8 +3917,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
 
             # Refresh-Out took 0 seconds
             # Refresh-In took 4 seconds
-            m = p70.match(line)
-            if m:
+            if name == 'p70':
                 if m.groupdict()['type'] == 'Out':
                     af_dict['refresh_out'] = int(m.groupdict()['val'])
                 else:
@@ -4004,8 +3925,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # SSO is disabled
-            m = p71.match(line)
-            if m:
+            if name == 'p71':
                 if m.groupdict()['state'] == 'disabled':
                     session_transport_dict['sso'] = False
                 else:
@@ -4013,8 +3933,7 @@ class ShowBgpNeighborSuperParser(MetaParser):
                 continue
 
             # No active TCP connection
-            m = p72.match(line)
-            if m:
+            if name == 'p72':
                 session_transport_dict['tcp_connection'] = False
                 continue
 
@@ -4257,15 +4176,45 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
         * 'show ip bgp {address_family} vrf {vrf} neighbors {neighbor} advertised-routes'
     '''
 
-    def cli(self, neighbor, address_family='', vrf='', output=None):
+    # finds the vrf of the neighbor
+    vrf_command = 'show bgp all neighbors | i BGP neighbor'
+
+    patterns = Patterns(
+        p1=r'^\s*For +address +family:'
+            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$',
+        p3_1=r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?(?=[\d|\[])'
+              '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
+              '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+              '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
+        p3_3=r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?'
+              '(?P<path_type>(i|e|c|l|a|r|I))?'
+              ' +(?P<next_hop>(([0-9]+[\.][0-9]+[\.][0-9]'
+              '+[\.][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
+              '[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+              '[a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])|'
+              '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
+              '[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])))?'
+              '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\.]+))?'
+              ' +(?P<origin_codes>(i|e|\?|\|))$',
+        p4=r'^\s*Route +Distinguisher *: '
+            '+(?P<route_distinguisher>(\S+))'
+            '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+            '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$',
+        bgp_neighbor_re=r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
+                         '(, +vrf +(?P<vrf>\S+))?, +remote AS '
+                         '+(?P<remote_as_id>[0-9]+), '
+                         '+(?P<internal_external_link>[a-z\s]+)$',
 
-        p1 = re.compile(r'^\s*For +address +family:'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        # BGP table version is 25, Local Router ID is 10.186.101.1
+        p2=r'^\s*BGP +table +version +is'
+            ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+            ' +ID +is +(?P<local_router_id>(\S+))$',
+    )
 
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?(?=[\d|\[])'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+    def cli(self, neighbor, address_family='', vrf='', output=None,
+            vrf_output=None):
+
+        p = ShowBgpNeighborsAdvertisedRoutesSuperParser.patterns
 
         p3_2 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)'
                             '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
@@ -4279,36 +4228,18 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
                             ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
                             ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
 
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|d|h|\*|\>|i|r|S|m|b|f|x|a|c|t|L|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' +(?P<next_hop>(([0-9]+[\.][0-9]+[\.][0-9]'
-                            '+[\.][0-9]+)|([a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
-                            '[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])|'
-                            '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:][a-zA-Z0-9]+'
-                            '[\:][a-zA-Z0-9]+[\:][\:][a-zA-Z0-9])))?'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\.]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-
-        p4 = re.compile(r'^\s*Route +Distinguisher *: '
-                            '+(?P<route_distinguisher>(\S+))'
-                            '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                            '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
-
         if not vrf:
             vrf = 'default'
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-        out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
-        bgp_neighbor_re = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
-                            '(, +vrf +(?P<vrf>\S+))?, +remote AS '
-                            '+(?P<remote_as_id>[0-9]+), '
-                            '+(?P<internal_external_link>[a-z\s]+)$')
+        out_vrf = vrf_output
+        if out_vrf is None:
+            out_vrf = self.device.execute(self.vrf_command)
         for line in out_vrf.splitlines():
             line = line.strip()
             # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
             # BGP neighbor is 10.225.10.253,  vrf CE1test,  remote AS 60000, external link
             # BGP neighbor is 192.168.0.254,  vrf L3VPN_1001,  remote AS 60001, external link
-            m = bgp_neighbor_re.match(line)
+            m = p.bgp_neighbor_re.match(line)
             if m:
                 if m.groupdict()['bgp_neighbor'] == neighbor:
                     if m.groupdict()['vrf']:
@@ -4329,11 +4260,6 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
 
         # For address family: IPv4 Unicast
 
-        # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                         ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                         ' +ID +is +(?P<local_router_id>(\S+))$')
-
         # Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
         # Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist, I-injected
         # Origin codes: i - IGP, e - EGP, ? - incomplete, | - multipath, & - backup
@@ -4372,14 +4298,14 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 original_address_family = address_family
                 continue
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -4426,7 +4352,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
             # *>  2001:db8:a69:484::/64   2001:DB8:20:4:6::6
             # *>i 10.100.248.128/26
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 # New prefix, reset index count
                 index = 1
@@ -4570,7 +4496,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
             #*>i                  10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
             #                                           2219             0 400 33299 51178 47751 {27016} e
             #                                           2219             0 400 33299 51178 47751 27016.1 e
-            m = p3_3.match(line)
+            m = p.p3_3.match(line)
             if m:
                 # Get keys
                 if m.groupdict()['next_hop']:
@@ -4656,7 +4582,7 @@ class ShowBgpNeighborsAdvertisedRoutesSuperParser(ShowBgpNeighborsAdvertisedRout
 
             # Route Distinguisher: 200:1
             # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -4714,6 +4640,7 @@ class ShowBgpAllNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSuperP
 
     def cli(self, neighbor, address_family='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and neighbor:
@@ -4721,14 +4648,16 @@ class ShowBgpAllNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSuperP
                                                  neighbor=neighbor)
             else:
                 cmd = self.cli_command[1].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family,
+                           vrf_output=vrf_output)
 
 
 # ===========================================================================
@@ -4749,6 +4678,7 @@ class ShowBgpNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSuperPars
                    ]
 
     def cli(self, neighbor, address_family='', vrf='',output=None):
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and vrf and neighbor:
@@ -4760,13 +4690,15 @@ class ShowBgpNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSuperPars
                                                  neighbor=neighbor)
             elif neighbor:
                 cmd = self.cli_command[2].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             show_output = output
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family,vrf=vrf)
+                           address_family=address_family,vrf=vrf,
+                           vrf_output=vrf_output)
 
 
 # ===========================================================================
@@ -4853,41 +4785,52 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
         * 'show ip bgp {address_family} neighbors {neighbor} received-routes'
     '''
 
-    def cli(self, neighbor, address_family='', output=None):
+    # finds the vrf of the neighbor
+    vrf_command = 'show bgp all neighbors | i BGP neighbor'
+
+    patterns = Patterns(
+        p1=r'^\s*For +address +family:'
+            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$',
+        p2=r'^\s*BGP +table +version +is'
+            ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+            ' +ID +is +(?P<local_router_id>(\S+))$',
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+              '(?P<path_type>(i|e|c|l|a|r|I))?'
+              '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+              '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+              '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
+              '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
+              '[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+              '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+              '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+              '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+              '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
+              ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+              ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+              ' +(?P<origin_codes>(i|e|\?|\&|\|))$',
+        p3_3=r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+              '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+              ' +(?P<origin_codes>(i|e|\?|\|))$',
+        p4=r'^\s*Route +Distinguisher *: '
+            '+(?P<route_distinguisher>(\S+))'
+            '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+            '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$',
+    )
+
+    def cli(self, neighbor, address_family='', output=None,
+            vrf_output=None):
         p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
                         '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
                         '+(?P<remote_as_id>[0-9]+), '
                         '+(?P<internal_external_link>[a-z\s]+)$')
-        p1 = re.compile(r'^\s*For +address +family:'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                            ' +ID +is +(?P<local_router_id>(\S+))$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                        '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?(\s)?'
-                            '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
-                            '[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                            '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)))'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_3 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *: '
-                            '+(?P<route_distinguisher>(\S+))'
-                            '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                            '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+
+        patterns = ShowBgpNeighborsReceivedRoutesSuperParser.patterns
 
         # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-        out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
+        out_vrf = vrf_output
+        if out_vrf is None:
+            out_vrf = self.device.execute(self.vrf_command)
         vrf = 'default'
         for line in out_vrf.splitlines():
             line = line.strip()
@@ -4916,14 +4859,14 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
                 original_address_family = address_family
                 continue
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
+            m = patterns.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -4971,7 +4914,7 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
             # *>  2001:db8:a69:484::/64   2001:DB8:20:4:6::6
-            m = p3_1.match(line)
+            m = patterns.p3_1.match(line)
             if m:
                 # New prefix, reset index count
                 index = 1
@@ -5014,7 +4957,7 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
             # Condition placed to handle the situation of a long line that is
             # divided nto two lines while actually it is not another index.
             if not data_on_nextline:
-                m = p3_2.match(line)
+                m = patterns.p3_2.match(line)
                 if m:
                     # New prefix, reset index count
                     index = 1
@@ -5104,7 +5047,7 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
 
             #                     0.0.0.0               100      32768 i
             #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
-            m = p3_3.match(line)
+            m = patterns.p3_3.match(line)
             if m:
                 # Get keys
                 next_hop = str(m.groupdict()['next_hop'])
@@ -5186,7 +5129,7 @@ class ShowBgpNeighborsReceivedRoutesSuperParser(ShowBgpNeighborsReceivedRoutesSc
 
             # Route Distinguisher: 200:1
             # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -5244,6 +5187,7 @@ class ShowBgpAllNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperParse
 
     def cli(self, neighbor, address_family='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and neighbor:
@@ -5251,14 +5195,16 @@ class ShowBgpAllNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperParse
                                                  neighbor=neighbor)
             else:
                 cmd = self.cli_command[1].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family,
+                           vrf_output=vrf_output)
 
 
 # ====================================================================
@@ -5283,6 +5229,7 @@ class ShowBgpNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperParser,
 
     def cli(self, neighbor, address_family='', vrf='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and vrf and neighbor:
@@ -5294,14 +5241,16 @@ class ShowBgpNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperParser,
                                                  neighbor=neighbor)
             elif neighbor:
                 cmd = self.cli_command[0].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family,
+                           vrf_output=vrf_output)
 
 
 
@@ -5390,68 +5339,40 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
         * 'show ip bgp {address_family} neighbors {neighbor} routes'
     '''
 
-    def cli(self, neighbor, address_family='', vrf='', output=None):
-
-        if not vrf:
-            # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
-            out_vrf = self.device.execute('show bgp all neighbors | i BGP neighbor')
-            vrf='default'
-            p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
-                            '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
-                            '+(?P<remote_as_id>[0-9]+), '
-                            '+(?P<internal_external_link>[a-z\s]+)$')
-            for line in out_vrf.splitlines():
-                line = line.strip()
-                # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
-                m = p.match(line)
-                if m:
-                    if m.groupdict()['bgp_neighbor'] == neighbor:
-                        if m.groupdict()['vrf']:
-                            vrf = str(m.groupdict()['vrf'])
-                            break
-                    else:
-                        continue
-
-        # Init dictionary
-        route_dict = {}
-        af_dict = {}
-        data_on_nextline = False
-        index = 1
-        bgp_table_version = local_router_id = ''
-        neighbor_id = neighbor
-        if address_family:
-            original_address_family = address_family
+    # finds the vrf of the neighbor
+    vrf_command = 'show bgp all neighbors | i BGP neighbor'
 
+    patterns = Patterns(
         # For address family: IPv4 Unicast
-        p1 = re.compile(r'^\s*For +address +family:'
-                         ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
+        p1=r'^\s*For +address +family:'
+            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$',
 
         # BGP table version is 25, Local Router ID is 10.186.101.1
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                         ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
-                         ' +ID +is +(?P<local_router_id>(\S+))$')
+        p2=r'^\s*BGP +table +version +is'
+            ' +(?P<bgp_table_version>[0-9]+), +[Ll]ocal +[Rr]outer'
+            ' +ID +is +(?P<local_router_id>(\S+))$',
 
         # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
         # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
         # *>i  2001:db8:400::/64          ::FFFF:192.168.51.1
         # r>i  2001:2:2:2::2/128
-        p3 = re.compile(r'^\s*(?P<status_codes>(b|s|x|S|d|h|r|\*|\>|\s)+)?'
-                         '(?P<path_type>(i|e|c|l|a|r|I))? *'
-                         '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                         '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
+        p3=r'^\s*(?P<status_codes>(b|s|x|S|d|h|r|\*|\>|\s)+)?'
+            '(?P<path_type>(i|e|c|l|a|r|I))? *'
+            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
 
         # 4444        100          0 i
-        p4 = re.compile(r'^(?P<metric>(\d+)) +(?P<locprf>(\d+))'
-                         ' +(?P<weight>(\d+)) +(?P<origin_codes>(i|e|\?|\|))$')
+        p4=r'^(?P<metric>(\d+)) +(?P<locprf>(\d+))'
+            ' +(?P<weight>(\d+)) +(?P<origin_codes>(i|e|\?|\|))$',
 
         #                     0.0.0.0               100     32768 i
         #                     10.106.101.1            4444    100 0 3 10 20 30 40 50 60 70 80 90 i
         # *>i                 10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
-        p5 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                         '(?P<path_type>(i|e|c|l|a|r|I))?'
-                         ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                         '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))? +'
-                         '(?P<origin_codes>(i|e|\?|\|))$')
+        p5=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+            '(?P<path_type>(i|e|c|l|a|r|I))?'
+            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))? +'
+            '(?P<origin_codes>(i|e|\?|\|))$',
 
         # Network            Next Hop            Metric     LocPrf     Weight Path
         # *>i 10.1.2.0/24      10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
@@ -5463,41 +5384,79 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
         # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
         # Condition placed to handle the situation of a long line that is
         # divided nto two lines while actually it is not another index.
-        p6 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|r|h|\*|\>|\s)+)'
-                         '(?P<path_type>(i|e|c|l|a|r|I))? *'
-                         '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
-                         '[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
-                         '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                         '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                         '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
-                         '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
-                         '([a-zA-Z0-9\.\:]+)))'
-                         ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                         ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                         ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
+        p6=r'^\s*(?P<status_codes>(s|x|S|d|r|h|\*|\>|\s)+)'
+            '(?P<path_type>(i|e|c|l|a|r|I))? *'
+            '(?P<prefix>(([0-9]+[\.][0-9]+[\.][0-9]+'
+            '[\.][0-9]+[\/][0-9]+)|([a-zA-Z0-9]+[\:]'
+            '[a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+            '([a-zA-Z0-9]+[\:][a-zA-Z0-9]+[\:]'
+            '[a-zA-Z0-9]+[\:][\:][\/][0-9]+)|'
+            '([a-zA-Z0-9\.\:]+)))'
+            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+            ' +(?P<origin_codes>(i|e|\?|\&|\|))$',
 
         # Route Distinguisher: 200:1
         # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-        p7 = re.compile(r'^\s*Route +Distinguisher *: '
-                         '+(?P<route_distinguisher>(\S+))'
-                         '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
-                         '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$')
+        p7=r'^\s*Route +Distinguisher *: '
+            '+(?P<route_distinguisher>(\S+))'
+            '( +\(default for vrf +(?P<default_vrf>(\S+))\))?'
+            '( +VRF Router ID (?P<vrf_router_id>(\S+)))?$',
 
         # Total number of prefixes 32
-        p8 = re.compile(r'^Total number of prefixes (?P<total_num_of_prefixes>\d+)$')
+        p8=r'^Total number of prefixes (?P<total_num_of_prefixes>\d+)$',
+    )
+
+    def cli(self, neighbor, address_family='', vrf='', output=None,
+            vrf_output=None):
+
+        if not vrf:
+            # Get VRF name by executing 'show bgp all neighbors | i BGP neighbor'
+            out_vrf = vrf_output
+            if out_vrf is None:
+                out_vrf = self.device.execute(self.vrf_command)
+            vrf='default'
+            p = re.compile(r'^BGP +neighbor +is +(?P<bgp_neighbor>[0-9A-Z\:\.]+)'
+                            '(, +vrf +(?P<vrf>[0-9A-Za-z]+))?, +remote AS '
+                            '+(?P<remote_as_id>[0-9]+), '
+                            '+(?P<internal_external_link>[a-z\s]+)$')
+            for line in out_vrf.splitlines():
+                line = line.strip()
+                # BGP neighbor is 10.16.2.2,  remote AS 100, internal link
+                m = p.match(line)
+                if m:
+                    if m.groupdict()['bgp_neighbor'] == neighbor:
+                        if m.groupdict()['vrf']:
+                            vrf = str(m.groupdict()['vrf'])
+                            break
+                    else:
+                        continue
+
+        # Init dictionary
+        route_dict = {}
+        af_dict = {}
+        data_on_nextline = False
+        index = 1
+        bgp_table_version = local_router_id = ''
+        neighbor_id = neighbor
+        if address_family:
+            original_address_family = address_family
+
+        patterns = ShowBgpAllNeighborsRoutesSuperParser.patterns
 
         for line in output.splitlines():
             line = line.rstrip()
 
             # For address family: IPv4 Unicast
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
                 original_address_family = address_family
                 continue
 
             # BGP table version is 25, Local Router ID is 10.186.101.1
-            m = p2.match(line)
+            m = patterns.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = str(m.groupdict()['local_router_id'])
@@ -5539,7 +5498,7 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
             # *>i  2001:db8:400::/64          ::FFFF:192.168.51.1
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 # New prefix, reset index count
                 index = 1
@@ -5573,7 +5532,7 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
                 continue
 
             # 4444        100          0 i
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['routes'][prefix]['index'][index]['metric'] = int(group['metric'])
@@ -5586,7 +5545,7 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
             #                     10.81.101.1            4444     100 0 3 10 20 30 40 50 60 70 80 90 i
             # *>i                 10.4.1.1               2219    100      0 200 33299 51178 47751 {27016} e
             # *>i                 ::FFFF:10.4.1.1        2219    100      0 200 33299 51178 47751 {27016} e
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 # Get keys
                 next_hop = str(m.groupdict()['next_hop'])
@@ -5674,7 +5633,7 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
             # *>i  10.145.0.0/24      192.168.51.1                1    100      0 ?
             # *>i10.49.0.0/16         10.106.101.1                        100          0 10 20 30 40 50 60 70 80 90 i
             # *>i10.4.2.0/24         10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m and not data_on_nextline:
                 # New prefix, reset index count
                 index = 1
@@ -5764,7 +5723,7 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
 
             # Route Distinguisher: 200:1
             # Route Distinguisher: 300:1 (default for vrf VRF1) VRF Router ID 10.94.44.44
-            m = p7.match(line)
+            m = patterns.p7.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -5802,7 +5761,7 @@ class ShowBgpAllNeighborsRoutesSuperParser(ShowBgpAllNeighborsRoutesSchema):
                     continue
 
             # Total number of prefixes 32
-            m = p8.match(line.strip())
+            m = patterns.p8.match(line.strip())
             if m:
                 if 'total_num_of_prefixes' in route_dict:
                     # key already exists, add to it
@@ -5833,6 +5792,7 @@ class ShowBgpAllNeighborsRoutes(ShowBgpAllNeighborsRoutesSuperParser, ShowBgpAll
 
     def cli(self, neighbor, address_family='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and neighbor:
@@ -5840,14 +5800,16 @@ class ShowBgpAllNeighborsRoutes(ShowBgpAllNeighborsRoutesSuperParser, ShowBgpAll
                                                  neighbor=neighbor)
             else:
                 cmd = self.cli_command[1].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family,
+                           vrf_output=vrf_output)
 
 
 # ===========================================================
@@ -5871,6 +5833,7 @@ class ShowBgpNeighborsRoutes(ShowBgpAllNeighborsRoutesSuperParser, ShowBgpAllNei
 
     def cli(self, neighbor, address_family='', vrf='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and neighbor and vrf:
@@ -5882,14 +5845,20 @@ class ShowBgpNeighborsRoutes(ShowBgpAllNeighborsRoutesSuperParser, ShowBgpAllNei
                                                  neighbor=neighbor)
             elif neighbor:
                 cmd = self.cli_command[2].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the
+            # neighbor when it is not given
+            if vrf:
+                show_output = self.device.execute(cmd)
+            else:
+                show_output, vrf_output = execute_many(
+                    self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family, vrf=vrf)
+                           address_family=address_family, vrf=vrf,
+                           vrf_output=vrf_output)
 
 
 
@@ -5932,25 +5901,32 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
 
     cli_command = 'show bgp all cluster-ids'
 
+    patterns = Patterns(
+        p1=r'^\s*Global +cluster-id: +(?P<cluster_id>[0-9\.]+)'
+            ' +\(+configured: +(?P<configured>[0-9\.]+)+\)$',
+        p3=r'^\s*all +\(+inter-cluster +and +intra-cluster+\):'
+            ' +(?P<all_configured>[a-zA-Z]+)$',
+        p4=r'^\s*intra-cluster:\s+(?P<intra_cluster_configured>[a-zA-Z]+)'
+            ' +(?P<intra_cluster_used>[a-zA-Z]+)$',
+        p5=r'^\s*(?P<cluster_ids>[0-9\.]+)'
+            ' +(?P<num_neighbors>[0-9]+)'
+            ' +(?P<client_to_client_ref_configured>[a-zA-Z]+)'
+            ' +(?P<client_to_client_ref_used>[a-zA-Z]+)$',
+    )
+
     def cli(self, output=None):
         # find vrf names
         # show vrf detail | inc \(VRF
         cmd_vrfs = 'show vrf detail | inc \(VRF'
-        out_vrf = self.device.execute(cmd_vrfs)
+        # show bgp all cluster-ids
+        cmd = self.cli_command
+        out_vrf, out = execute_many(self.device, [cmd_vrfs, cmd])
         vrf_dict = {'0':'default'}
         p = re.compile(r'^\s*VRF +(?P<vrf_name>[0-9a-zA-Z]+)'
                         ' +\(+VRF +Id += +(?P<vrf_id>[0-9]+)+\)+;'
                         ' +default +(?P<other_data>.+)$')
-        p1 = re.compile(r'^\s*Global +cluster-id: +(?P<cluster_id>[0-9\.]+)'
-                        ' +\(+configured: +(?P<configured>[0-9\.]+)+\)$')
-        p3 = re.compile(r'^\s*all +\(+inter-cluster +and +intra-cluster+\):'
-                        ' +(?P<all_configured>[a-zA-Z]+)$')
-        p4 = re.compile(r'^\s*intra-cluster:\s+(?P<intra_cluster_configured>[a-zA-Z]+)'
-                        ' +(?P<intra_cluster_used>[a-zA-Z]+)$')
-        p5 = re.compile(r'^\s*(?P<cluster_ids>[0-9\.]+)'
-                    ' +(?P<num_neighbors>[0-9]+)'
-                    ' +(?P<client_to_client_ref_configured>[a-zA-Z]+)'
-                    ' +(?P<client_to_client_ref_used>[a-zA-Z]+)$')
+
+        patterns = ShowBgpAllClusterIds.patterns
 
         for line in out_vrf.splitlines():
             if not line:
@@ -5968,10 +5944,6 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
                 continue
 
 
-        # show bgp all cluster-ids
-        cmd = self.cli_command
-        out = self.device.execute(cmd)
-
         # Init vars
         sum_dict = {}
         cluster_id = None
@@ -5989,7 +5961,7 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
                 continue
 
             # Global cluster-id: 10.64.4.4 (configured: 0.0.0.0)
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 # Save variables for use later
                 cluster_id = str(m.groupdict()['cluster_id'])
@@ -6001,13 +5973,13 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
                 continue
 
             #   all (inter-cluster and intra-cluster): ENABLED
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 reflection_all_configured = m.groupdict()['all_configured'].lower()
                 continue
 
             # intra-cluster:                         ENABLED       ENABLED
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 reflection_intra_cluster_configured = m.groupdict()['intra_cluster_configured'].lower()
                 reflection_intra_cluster_used = m.groupdict()['intra_cluster_used'].lower()
@@ -6016,7 +5988,7 @@ class ShowBgpAllClusterIds(ShowBgpAllClusterIdsSchema):
             # List of cluster-ids
             # Cluster-id  #-neighbors C2C-rfl-CFG C2C-rfl-USE
             # 192.168.1.1                2 DISABLED    DISABLED
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 cluster_ids = m.groupdict()['cluster_ids']
                 list_of_cluster_ids[cluster_ids] = cluster_ids
@@ -6094,21 +6066,25 @@ class ShowBgpAllNeighborsPolicy(ShowBgpAllNeighborsPolicySchema):
 
     cli_command = 'show bgp all neighbors {neighbor} policy'
 
+    patterns = Patterns(
+        # Neighbor: 10.4.6.6, Address-Family: VPNv4 Unicast (VRF1)
+        # Neighbor: 10.251.15.5, Address-Family: VPNv4 Unicast (LABDR_HoC_AZS_Transit)
+        p1=r'^\s*Neighbor: +(?P<neighbor>[\S]+),'
+           r' +Address-Family: +(?P<address_family>[\w\s\-\_]+)'
+           r'( +\((?P<vrf>[\S]+)\))?$',
+
+        # route-map test in
+        p2=r'^\s*route-map +(?P<route_map_name>\S+)'
+            ' +(?P<route_map_direction>[a-zA-Z]+)$',
+    )
+
     def cli(self, neighbor, output=None):
         if output is None:
             out = self.device.execute(self.cli_command.format(neighbor=neighbor))
         else:
             out = output
 
-        # Neighbor: 10.4.6.6, Address-Family: VPNv4 Unicast (VRF1)
-        # Neighbor: 10.251.15.5, Address-Family: VPNv4 Unicast (LABDR_HoC_AZS_Transit)
-        p1 = re.compile(r'^\s*Neighbor: +(?P<neighbor>[\S]+),'
-                        r' +Address-Family: +(?P<address_family>[\w\s\-\_]+)'
-                        r'( +\((?P<vrf>[\S]+)\))?$')
-
-        # route-map test in
-        p2 = re.compile(r'^\s*route-map +(?P<route_map_name>\S+)'
-                            ' +(?P<route_map_direction>[a-zA-Z]+)$')
+        p = ShowBgpAllNeighborsPolicy.patterns
 
         # Init dictionary
         policy_dict = {}
@@ -6117,7 +6093,7 @@ class ShowBgpAllNeighborsPolicy(ShowBgpAllNeighborsPolicySchema):
             line = line.rstrip()
 
             # Neighbor: 10.4.6.6, Address-Family: VPNv4 Unicast (VRF1)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 neighbor_id = str(m.groupdict()['neighbor'])
                 address_family = str(m.groupdict()['address_family']).lower()
@@ -6129,7 +6105,7 @@ class ShowBgpAllNeighborsPolicy(ShowBgpAllNeighborsPolicySchema):
 
             # route-map test in
             # route-map test out
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 route_map_name = str(m.groupdict()['route_map_name'])
                 route_map_direction = str(m.groupdict()['route_map_direction'])
@@ -6199,73 +6175,73 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
 
     cli_command = 'show bgp l2vpn evpn evi {evi_id} route-type {route_type}'
 
-    def cli(self, evi_id, route_type, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command.format(evi_id=evi_id, route_type=route_type))
-
+    patterns = Patterns(
         # BGP routing table entry for [3][172.11.1.22:99][0][32][172.11.1.1]/17, version 264
-        p1 = re.compile(r"^BGP\s+routing\s+table\s+entry\s+for\s+\[+\d+\]+\[+(?P<bgp_routing_table>(\d{1,3}\.){3}\d{1,3}\:\d+)+\]+\S+\s+version+\s(?P<version>\S+)$")
+        p1=r"^BGP\s+routing\s+table\s+entry\s+for\s+\[+\d+\]+\[+(?P<bgp_routing_table>(\d{1,3}\.){3}\d{1,3}\:\d+)+\]+\S+\s+version+\s(?P<version>\S+)$",
 
         # Paths: (1 available, best #1, table evi_99)
-        p2 = re.compile(r"^Paths:\s+\(1\s+available,\s+best\s+#1,\s+table\s+(?P<evi_num>\S+)\)$")
+        p2=r"^Paths:\s+\(1\s+available,\s+best\s+#1,\s+table\s+(?P<evi_num>\S+)\)$",
 
         # Not advertised to any peer
-        p3_1 = re.compile(r"^(?P<advertise>\S+\s+\S+)\s+to\s+any\s+peer$")
+        p3_1=r"^(?P<advertise>\S+\s+\S+)\s+to\s+any\s+peer$",
 
         # Advertised to update-groups:
-        p3_2 = re.compile(r"^(?P<advertise>\S+)\s+to\s+update-+groups:$")
+        p3_2=r"^(?P<advertise>\S+)\s+to\s+update-+groups:$",
 
         # Refresh Epoch 1
-        p4 = re.compile(r"^Refresh\s+(?P<refresh>\S+\s+\d+)$")
+        p4=r"^Refresh\s+(?P<refresh>\S+\s+\d+)$",
 
         # Local, imported path from [3][172.11.1.2:99][0][32][172.11.1.2]/17 (global)
-        p5 = re.compile(r"^Local,+\s+imported\s+path\s+from\s+(?P<import_path>\S+)+\s+\(+global\)$")
+        p5=r"^Local,+\s+imported\s+path\s+from\s+(?P<import_path>\S+)+\s+\(+global\)$",
 
         # 172.11.1.2 (metric 30) (via default) from 172.11.1.11 (172.11.1.11)
-        p6 = re.compile(
-            r"^(?P<vtep_loopback>\S+)\s+\(+metric\s+\d+\)+\s+\(via\s+default+\)+\s+from+\s+(?P<dist_loopback>\S+)\s+\S+$")
+        p6=r"^(?P<vtep_loopback>\S+)\s+\(+metric\s+\d+\)+\s+\(via\s+default+\)+\s+from+\s+(?P<dist_loopback>\S+)\s+\S+$",
 
         # 0.0.0.0 (via default) from 0.0.0.0 (172.11.1.22)
-        p6_1 = re.compile(r"^(?P<vtep_loopback>(\d{1,3}\.){3}\d{1,3})+\s+\(+via\s+default\)+\s+from\s+(?P<dist_loopback>(\d{1,3}\.){3}\d{1,3})\s+\S+$")
+        p6_1=r"^(?P<vtep_loopback>(\d{1,3}\.){3}\d{1,3})+\s+\(+via\s+default\)+\s+from\s+(?P<dist_loopback>(\d{1,3}\.){3}\d{1,3})\s+\S+$",
 
         #      Origin incomplete, metric 0, localpref 100, valid, internal, best
-        p7 = re.compile(
-            r"^Origin\s+(?P<origin>\w+),\s+metric\s+(?P<metric>\d+),\s+localpref\s+(?P<local_pref>\d+),\s+valid,\s+internal,\s+best$")
+        p7=r"^Origin\s+(?P<origin>\w+),\s+metric\s+(?P<metric>\d+),\s+localpref\s+(?P<local_pref>\d+),\s+valid,\s+internal,\s+best$",
 
         # Community: 999:999
-        p7_1 = re.compile(r"^Community:\s+(?P<community>\S+)$")
+        p7_1=r"^Community:\s+(?P<community>\S+)$",
 
         #      Extended Community: RT:9999:99 ENCAP:8
-        p8 = re.compile(r"^Extended\s+Community:\s+(?P<extended_community>\S+)\s+ENCAP:(?P<encap>\d+)$")
+        p8=r"^Extended\s+Community:\s+(?P<extended_community>\S+)\s+ENCAP:(?P<encap>\d+)$",
 
         #      Originator: 172.11.2.1, Cluster list: 172.11.1.11
-        p9 = re.compile(
-            r"^Originator:\s+(?P<originator>(\d{1,3}\.){3}\d{1,3}),\s+Cluster\s+list:\s+(?P<cluster_list>(\d{1,3}\.){3}\d{1,3})$")
+        p9=r"^Originator:\s+(?P<originator>(\d{1,3}\.){3}\d{1,3}),\s+Cluster\s+list:\s+(?P<cluster_list>(\d{1,3}\.){3}\d{1,3})$",
 
         #      PMSI Attribute: Flags:0x0, Tunnel type:IR, length 4, vni:200199, tunnel identifier: < Tunnel Endpoint: 172.11.1.1 >
-        p10 = re.compile(
-            r"PMSI\s+Attribute:\s+Flags:(?P<pmsi_flags>\S+),\s+Tunnel\s+type:+(?P<tunnel_type>\w+),\s+length\s+(?P<length>\d+),\s+vni:+(?P<vni_id>\d+),\s+tunnel\s+identifier:\s+(?P<tunnel_id>.*)$")
+        p10=r"PMSI\s+Attribute:\s+Flags:(?P<pmsi_flags>\S+),\s+Tunnel\s+type:+(?P<tunnel_type>\w+),\s+length\s+(?P<length>\d+),\s+vni:+(?P<vni_id>\d+),\s+tunnel\s+identifier:\s+(?P<tunnel_id>.*)$",
 
         # Local irb vxlan vtep:
-        p11 = re.compile(r"^Local\s+irb\s+(?P<vxlan_vtep>\w+\s+\w+)$")
+        p11=r"^Local\s+irb\s+(?P<vxlan_vtep>\w+\s+\w+)$",
 
         #        vrf:not found, l3-vni:0
-        p12 = re.compile(r"^vrf:+(?P<vrf>\w+\s+\w+),\s+l3-vni:+(?P<l3_vni>\d+)$")
+        p12=r"^vrf:+(?P<vrf>\w+\s+\w+),\s+l3-vni:+(?P<l3_vni>\d+)$",
 
         #        local router mac:0000.0000.0000
-        p13 = re.compile(r"^local\s+router\s+mac:+(?P<local_router_mac>\S+)$")
+        p13=r"^local\s+router\s+mac:+(?P<local_router_mac>\S+)$",
 
         #        core-irb interface:(not found)
-        p14 = re.compile(r"^core-irb\s+interface:+(?P<core_irb_intf>\S+\s+\S+)$")
+        p14=r"^core-irb\s+interface:+(?P<core_irb_intf>\S+\s+\S+)$",
 
         #        vtep-ip:172.11.1.22
-        p15 = re.compile(r"^vtep-ip:+(?P<vtep_ip>\S+)$")
+        p15=r"^vtep-ip:+(?P<vtep_ip>\S+)$",
 
         #      rx pathid: 0, tx pathid: 0x0
-        p16 = re.compile(r"^rx\s+pathid:\s+(?P<rx_path_id>\S+),\s+tx\s+pathid:\s+(?P<tx_path_id>\S+)$")
+        p16=r"^rx\s+pathid:\s+(?P<rx_path_id>\S+),\s+tx\s+pathid:\s+(?P<tx_path_id>\S+)$",
 
         #      Updated on Jan 22 2023 07:59:46 UTC
-        p17 = re.compile(r"^Updated\s+on\s+(?P<date_time>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
+        p17=r"^Updated\s+on\s+(?P<date_time>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$",
+    )
+
+    def cli(self, evi_id, route_type, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(evi_id=evi_id, route_type=route_type))
+
+        p = ShowBgpL2vpnEvpnEviRouteType.patterns
 
         ret_dict = {}
 
@@ -6273,7 +6249,7 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
             line = line.strip()
 
             # BGP routing table entry for [3][172.11.1.22:99][0][32][172.11.1.1]/17, version 264
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.update({'bgp_routing_table': group['bgp_routing_table']})
@@ -6283,42 +6259,42 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
                 continue
 
             # Paths: (1 available, best #1, table evi_99)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 version_dict.update({'evi_num': group['evi_num']})
                 continue
 
             # Not advertised to any peer
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['advertise'] = group['advertise']
                 continue
 
             # Advertised to update-groups:
-            m = p3_2.match(line)
+            m = p.p3_2.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['advertise'] = group['advertise']
                 continue
 
             # Refresh Epoch 1
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['refresh'] = group['refresh']
                 continue
 
             # Local, imported path from [3][172.11.1.2:99][0][32][172.11.1.2]/17 (global)
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['import_path'] = group['import_path']
                 continue
 
             # 172.11.1.2 (metric 30) (via default) from 172.11.1.11 (172.11.1.11)
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['vtep_loopback'] = group['vtep_loopback']
@@ -6326,7 +6302,7 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
                 continue
 
             # 0.0.0.0 (via default) from 0.0.0.0 (172.11.1.22)
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['vtep_loopback'] = group['vtep_loopback']
@@ -6334,7 +6310,7 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
                 continue
 
             #      Origin incomplete, metric 0, localpref 100, valid, internal, best
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['origin'] = group['origin']
@@ -6343,14 +6319,14 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
                 continue
 
             #  Community: 999:999
-            m = p7_1.match(line)
+            m = p.p7_1.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['community'] = group['community']
                 continue
 
             #      Extended Community: RT:9999:99 ENCAP:8
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['extended_community'] = group['extended_community']
@@ -6358,7 +6334,7 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
                 continue
 
             #      Originator: 172.11.2.1, Cluster list: 172.11.1.11
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['originator'] = group['originator']
@@ -6366,7 +6342,7 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
                 continue
 
             #      PMSI Attribute: Flags:0x0, Tunnel type:IR, length 4, vni:200199, tunnel identifier: < Tunnel Endpoint: 172.11.1.1 >
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['pmsi_flags'] = group['pmsi_flags']
@@ -6377,7 +6353,7 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
                 continue
 
             #        vrf:not found, l3-vni:0
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['vrf'] = group['vrf']
@@ -6385,28 +6361,28 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
                 continue
 
             #        local router mac:0000.0000.0000
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['local_router_mac'] = group['local_router_mac']
                 continue
 
             #        core-irb interface:(not found)
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['core_irb_intf'] = group['core_irb_intf']
                 continue
 
             #        vtep-ip:172.11.1.22
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['vtep_ip'] = group['vtep_ip']
                 continue
 
             #      rx pathid: 0, tx pathid: 0x0
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['rx_path_id'] = group['rx_path_id']
@@ -6414,7 +6390,7 @@ class ShowBgpL2vpnEvpnEviRouteType(ShowBgpL2vpnEvpnEviRouteTypeSchema):
                 continue
 
             #      Updated on Jan 22 2023 07:59:46 UTC
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 version_dict['date_time'] = group['date_time']
@@ -69,6 +69,8 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Use
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.dispatcher import LineDispatcher
 
 logger = logging.getLogger(__name__)
 
@@ -244,66 +246,56 @@ class ShowInterfaces(ShowInterfacesSchema):
                'out_lost_carrier', '(Tunnel.*)', 'input_queue_flushes',
                'reliability', 'out_broadcast_pkts']
 
-    def cli(self, interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
+    patterns = Patterns(
         # GigabitEthernet1 is up, line protocol is up
         # Port-channel12 is up, line protocol is up (connected)
         # Vlan1 is administratively down, line protocol is down , Autostate Enabled
         # Dialer1 is up (spoofing), line protocol is up (spoofing)
         # FastEthernet1 is down, line protocol is down (err-disabled)
         # GigabitEthernet1/0/2 is up, line protocol is down (suspended)
-
-        p1 = re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is +(?P<enabled>[\w\s]+)(?: '
-                        r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
-                        r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$')
-        p1_1 = re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
-                          r' +(?P<enabled>[\w\s]+),'
-                          r' +line +protocol +is +(?P<line_protocol>\w+)'
-                          r'( *, *(?P<attribute>[\w\s]+))?$')
+        p1=r'^(?P<interface>[\w\/\.\-\:]+) +is +(?P<enabled>[\w\s]+)(?: '
+           r'+\S+)?, +line +protocol +is +(?P<line_protocol>\w+)(?: '
+           r'*\((?P<attribute>\S+)\)|( +\, +Autostate +(?P<autostate>\S+)))?.*$',
+        p1_1=r'^(?P<interface>[\w\/\.\-\:]+) +is'
+             r' +(?P<enabled>[\w\s]+),'
+             r' +line +protocol +is +(?P<line_protocol>\w+)'
+             r'( *, *(?P<attribute>[\w\s]+))?$',
 
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
         # Hardware is Loopback
-        p2 = re.compile(r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
-                        r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
-                        r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$')
+        p2=r'^Hardware +is +(?P<type>[a-zA-Z0-9\-\/\s\+]+)'
+           r'(, *address +is +(?P<mac_address>[a-z0-9\.]+)'
+           r' *\(bia *(?P<phys_address>[a-z0-9\.]+)\))?$',
 
         # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
-        p2_2 = re.compile(r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
-                          r'(?P<mac_address>.*)(?P<phys_address>.*)')
+        p2_2=r'Hardware +is +(?P<type>[a-zA-Z0-9\-\/\+ ]+)'
+             r'(?P<mac_address>.*)(?P<phys_address>.*)',
 
         # Description: desc
         # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p3 = re.compile(r'^Description: *(?P<description>.*)$')
+        p3=r'^Description: *(?P<description>.*)$',
 
         # Secondary address 10.2.2.2/24
-        p4 = re.compile(r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p4=r'^Secondary +Address +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
 
         # Internet address is 10.4.4.4/24
-        p5 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
-                        r'\/(?P<prefix_length>[0-9]+))$')
+        p5=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.x]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
 
         # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
         # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
         # MTU 1600 bytes, sub MTU 1600, BW 3584 Kbit/sec, DLY 410 usec,
         # MTU 1500 bytes, BW 5200 Kbit/sec, RxBW 25000 Kbit/sec, DLY 100 usec,
-        p6 = re.compile(r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
-                        r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
-                        r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
-                        r'DLY +(?P<delay>[0-9]+) +usec,$')
+        p6=r'^MTU +(?P<mtu>\d+) +bytes(, +sub +MTU +'
+           r'(?P<sub_mtu>\d+))?, +BW +(?P<bandwidth>[0-9]+) +Kbit(\/sec)?'
+           r'(, +RxBW +[0-9]+ +Kbit(\/sec)?)?, +'
+           r'DLY +(?P<delay>[0-9]+) +usec,$',
 
         # reliability 255/255, txload 1/255, rxload 1/255
-        p7 = re.compile(r'^reliability +(?P<reliability>[\d\/]+),'
-                        r' +txload +(?P<txload>[\d\/]+), +rxload'
-                        r' +(?P<rxload>[\d\/]+)$')
+        p7=r'^reliability +(?P<reliability>[\d\/]+),'
+           r' +txload +(?P<txload>[\d\/]+), +rxload'
+           r' +(?P<rxload>[\d\/]+)$',
 
         # Encapsulation LOOPBACK, loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID 20, medium is p2p
@@ -312,13 +304,12 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
         # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
         # Encapsulation(s): AAL5
-        p8 = re.compile(r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
-                r'(, +(?P<rest>.*))?$')
+        p8=r'^Encapsulation(\(s\):)? +(?P<encapsulation>[\w\s\.]+)'
+           r'(, +(?P<rest>.*))?$',
 
         # Keepalive set (10 sec)
-        p10 = re.compile(r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
-                        r' +sec\)$')
-
+        p10=r'^Keepalive +set +\((?P<keepalive>[0-9]+)'
+            r' +sec\)$',
 
         # Auto-duplex, 1000Mb/s, media type is 10/100/1000BaseTX
         # Full-duplex, 1000Mb/s, link type is auto, media type is
@@ -332,181 +323,181 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
         # Full-duplex, 10Gb/s, media type is 100/1000/2.5G/5G/10GBaseTX
         # Full-duplex, 10Gb/s, link type is auto, media type is CVR QSFP SFP10G(SFP-10GBase-SR)
-        p11 = re.compile(r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
-                         r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
-                         r'(S|s)peed)(?:(?:\, +link +type +is '
-                         r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
-                         r'*(?P<media_type>[\w\/\-\.() ]+)?)(?: +media +type)?)?$')
+        p11=r'^(?P<duplex_mode>\w+)[\-\s]+[d|D]uplex\, '
+            r'+(?P<port_speed>[\w\s\/]+|[a|A]uto-[S|s]peed|Auto '
+            r'(S|s)peed)(?:(?:\, +link +type +is '
+            r'+(?P<link_type>\S+))?(?:\, *(media +type +is| )'
+            r'*(?P<media_type>[\w\/\-\.() ]+)?)(?: +media +type)?)?$',
 
         # input flow-control is off, output flow-control is unsupported
-        p12 = re.compile(r'^(?P<first>input|output) +flow-control +is +(?P<receive>\w+), +'
-                          '(?P<second>output|input) +flow-control +is +(?P<send>\w+)$')
+        p12=r'^(?P<first>input|output) +flow-control +is +(?P<receive>\w+), +'
+             '(?P<second>output|input) +flow-control +is +(?P<send>\w+)$',
 
         # ARP type: ARPA, ARP Timeout 04:00:00
-        p13 = re.compile(r'^ARP +type: +(?P<arp_type>\w+), +'
-                          'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$')
+        p13=r'^ARP +type: +(?P<arp_type>\w+), +'
+             'ARP +Timeout +(?P<arp_timeout>[\w\:\.]+)$',
 
         # Last input never, output 00:01:05, output hang never
-        p14 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+), '
-                          'output +hang +(?P<output_hang>[\w\.\:]+)$')
+        p14=r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+             'output +(?P<last_output>[\w\.\:]+), '
+             'output +hang +(?P<output_hang>[\w\.\:]+)$',
 
         # Members in this channel: Gi1/0/2
         # Members in this channel: Fo1/0/2 Fo1/0/4
-        p15 = re.compile(r'^Members +in +this +channel: +'
-                          '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$')
+        p15=r'^Members +in +this +channel: +'
+             '(?P<port_channel_member_intfs>[\w\/\.\s\,]+)$',
 
         # No. of active members in this channel: 12
-        p15_1 = re.compile(r'^No\. +of +active +members +in +this +'
-                            'channel: +(?P<active_members>\d+)$')
+        p15_1=r'^No\. +of +active +members +in +this +'
+               'channel: +(?P<active_members>\d+)$',
 
         # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-        p15_2 = re.compile(r'^Member +\d+ +: +(?P<interface>\S+) +,'
-                            ' +\S+, +\S+$')
+        p15_2=r'^Member +\d+ +: +(?P<interface>\S+) +,'
+               ' +\S+, +\S+$',
 
         # No. of PF_JUMBO supported members in this channel : 0
-        p15_3 = re.compile(r'^No\. +of +PF_JUMBO +supported +members +'
-                            'in +this +channel +: +(?P<number>\d+)$')
+        p15_3=r'^No\. +of +PF_JUMBO +supported +members +'
+               'in +this +channel +: +(?P<number>\d+)$',
 
         # Last clearing of "show interface" counters 1d02h
-        p16 = re.compile(r'^Last +clearing +of +\"show +interface\" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
+        p16=r'^Last +clearing +of +\"show +interface\" +counters +'
+             '(?P<last_clear>[\w\:\.]+)$',
 
         # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-        p17 = re.compile(r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
-                          '(?P<drops>\d+)\/(?P<flushes>\d+) +'
-                          '\(size\/max\/drops\/flushes\); +'
-                          'Total +output +drops: +(?P<output_drop>\d+)$')
+        p17=r'^Input +queue: +(?P<size>\d+)\/(?P<max>\d+)\/'
+             '(?P<drops>\d+)\/(?P<flushes>\d+) +'
+             '\(size\/max\/drops\/flushes\); +'
+             'Total +output +drops: +(?P<output_drop>\d+)$',
 
         # Queueing strategy: fifo
         # Queueing strategy: Class-based queueing
-        p18 = re.compile(r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$')
+        p18=r'^Queueing +strategy: +(?P<queue_strategy>\S+).*$',
 
         # Output queue: 0/0 (size/max)
         # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-        p19 = re.compile(r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
-                          '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
-                          '+\(size\/max(?: +total\/threshold\/drops\))?.*$')
+        p19=r'^Output +queue: +(?P<size>\d+)\/(?P<max>\d+)'
+             '(?:\/(?P<threshold>\d+)\/(?P<drops>\d+))? '
+             '+\(size\/max(?: +total\/threshold\/drops\))?.*$',
 
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p20 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
-                          ' *(?P<in_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$')
+        p20=r'^(?P<load_interval>[0-9\#]+)'
+             ' *(?P<unit>(minute|second|minutes|seconds)) *input *rate'
+             ' *(?P<in_rate>[0-9]+) *bits/sec,'
+             ' *(?P<in_rate_pkts>[0-9]+) *packets/sec$',
 
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p21 = re.compile(r'^(?P<load_interval>[0-9\#]+)'
-                          ' *(minute|second|minutes|seconds) *output *rate'
-                          ' *(?P<out_rate>[0-9]+) *bits/sec,'
-                          ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$')
+        p21=r'^(?P<load_interval>[0-9\#]+)'
+             ' *(minute|second|minutes|seconds) *output *rate'
+             ' *(?P<out_rate>[0-9]+) *bits/sec,'
+             ' *(?P<out_rate_pkts>[0-9]+) *packets/sec$',
 
         # 0 packets input, 0 bytes, 0 no buffer
         # 13350 packets input, 2513375 bytes
-        p22 = re.compile(r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
-                          '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$')
+        p22=r'^(?P<in_pkts>[0-9]+) +packets +input, +(?P<in_octets>[0-9]+) '
+             '+bytes(?:, +(?P<in_no_buffer>[0-9]+) +no +buffer)?$',
 
         # Received 4173 broadcasts (0 IP multicasts)
         # Received 535996 broadcasts (535961 multicasts)
-        p23 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
-                          '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p23=r'^Received +(?P<in_broadcast_pkts>\d+) +broadcasts +'
+             '\((?P<in_multicast_pkts>\d+) *(IP)? *multicasts\)$',
 
         # 0 runts, 0 giants, 0 throttles
-        p24 = re.compile(r'^(?P<in_runts>[0-9]+) *runts,'
-                          ' *(?P<in_giants>[0-9]+) *giants,'
-                          ' *(?P<in_throttles>[0-9]+) *throttles$')
+        p24=r'^(?P<in_runts>[0-9]+) *runts,'
+             ' *(?P<in_giants>[0-9]+) *giants,'
+             ' *(?P<in_throttles>[0-9]+) *throttles$',
 
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p25 = re.compile(r'^(?P<in_errors>[0-9]+) +input +errors, +'
-                          '(?P<in_crc_errors>[0-9]+) +CRC, +'
-                          '(?P<in_frame>[0-9]+) +frame, +'
-                          '(?P<in_overrun>[0-9]+) +overrun, +'
-                          '(?P<in_ignored>[0-9]+) +ignored'
-                          '(, *(?P<in_abort>[0-9]+) +abort)?$')
+        p25=r'^(?P<in_errors>[0-9]+) +input +errors, +'
+             '(?P<in_crc_errors>[0-9]+) +CRC, +'
+             '(?P<in_frame>[0-9]+) +frame, +'
+             '(?P<in_overrun>[0-9]+) +overrun, +'
+             '(?P<in_ignored>[0-9]+) +ignored'
+             '(, *(?P<in_abort>[0-9]+) +abort)?$',
 
         # 0 watchdog, 535961 multicast, 0 pause input
-        p26 = re.compile(r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
-                          '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
-                          '(?P<in_pause_input>[0-9]+) +pause +input$')
+        p26=r'^(?P<in_watchdog>[0-9]+) +watchdog, +'
+             '(?P<in_multicast_pkts>[0-9]+) +multicast, +'
+             '(?P<in_pause_input>[0-9]+) +pause +input$',
 
         # 0 input packets with dribble condition detected
-        p27 = re.compile(r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
-                          'dribble +condition +detected$')
+        p27=r'^(?P<in_with_dribble>[0-9]+) +input +packets +with +'
+             'dribble +condition +detected$',
 
         # 23376 packets output, 3642296 bytes, 0 underruns
         # 13781 packets output, 2169851 bytes
-        p28 = re.compile(r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
-                          r'+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$')
+        p28=r'^(?P<out_pkts>[0-9]+) +packets +output, +(?P<out_octets>[0-9]+) '
+            r'+bytes(?:\, +(?P<out_underruns>[0-9]+) +underruns)?$',
 
         # Output 0 broadcasts (55 multicasts)
-        p29 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcasts +'
-                          r'\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$')
+        p29=r'^Output +(?P<out_broadcast_pkts>\d+) +broadcasts +'
+            r'\((?P<out_multicast_pkts>\d+) *(IP)? *multicasts\)$',
 
         # 0 output errors, 0 collisions, 2 interface resets
         # 0 output errors, 0 interface resets
-        p30 = re.compile(r'^(?P<out_errors>[0-9]+) +output +errors,'
-                          r'( *(?P<out_collision>[0-9]+) +collisions,)? +'
-                          r'(?P<out_interface_resets>[0-9]+) +interface +resets$')
+        p30=r'^(?P<out_errors>[0-9]+) +output +errors,'
+            r'( *(?P<out_collision>[0-9]+) +collisions,)? +'
+            r'(?P<out_interface_resets>[0-9]+) +interface +resets$',
 
         # 0 unknown protocol drops
-        p31 = re.compile(r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
-                          'unknown +protocol +drops$')
+        p31=r'^(?P<out_unknown_protocl_drops>[0-9]+) +'
+             'unknown +protocol +drops$',
 
         # 0 babbles, 0 late collision, 0 deferred
-        p32 = re.compile(r'^(?P<out_babble>[0-9]+) +babbles, +'
-                         r'(?P<out_late_collision>[0-9]+) +late +collision, +'
-                         r'(?P<out_deferred>[0-9]+) +deferred$')
+        p32=r'^(?P<out_babble>[0-9]+) +babbles, +'
+            r'(?P<out_late_collision>[0-9]+) +late +collision, +'
+            r'(?P<out_deferred>[0-9]+) +deferred$',
 
         # 0 lost carrier, 0 no carrier, 0 pause output
         # 0 lost carrier, 0 no carrier
-        p33 = re.compile(r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
-                r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
-                r'pause +output)?$')
+        p33=r'^(?P<out_lost_carrier>\d+) +lost +carrier, +'
+            r'(?P<out_no_carrier>\d+) +no +carrier(, +(?P<out_pause_output>\d+) +'
+            r'pause +output)?$',
 
         # 0 output buffer failures, 0 output buffers swapped out
-        p34 = re.compile(r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
-                          '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$')
+        p34=r'^(?P<out_buffer_failure>[0-9]+) +output +buffer +failures, +'
+             '(?P<out_buffers_swapped>[0-9]+) +output +buffers +swapped +out$',
 
         # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
         # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-        p35 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                          '(?P<unnumbered_intf>[\w\/\.]+) +'
-                          '\((?P<unnumbered_ip>[\w\.\:]+)\)$')
+        p35=r'^Interface +is +unnumbered. +Using +address +of +'
+             '(?P<unnumbered_intf>[\w\/\.]+) +'
+             '\((?P<unnumbered_ip>[\w\.\:]+)\)$',
 
         # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-        p36 = re.compile(r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
-                r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$')
+        p36=r'^(?P<maximum_active_vcs>\d+) +maximum +active +VCs, +'
+            r'(?P<vcs_per_vp>\d+) +VCs +per +VP, +(?P<current_vccs>\d+) +current +VCCs$',
 
         # VC Auto Creation Disabled.
-        p37 = re.compile(r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$')
+        p37=r'^VC +Auto +Creation +(?P<vc_auto_creation>\S+)\.$',
 
         # VC idle disconnect time: 300 seconds
-        p38 = re.compile(r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
-                r'seconds$')
+        p38=r'^VC +idle +disconnect +time: +(?P<vc_idle_disconnect_time>\d+) +'
+            r'seconds$',
 
         # AAL5 CRC errors : 0
-        p39 = re.compile(r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$')
+        p39=r'^(?P<key>\S+ +CRC +errors) +: +(?P<val>\d+)$',
 
         # AAL5 SAR Timeouts : 0
-        p40 = re.compile(r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$')
+        p40=r'^(?P<key>\S+ +SAR +Timeouts) +: +(?P<val>\d+)$',
 
         # AAL5 Oversized SDUs : 0
-        p41 = re.compile(r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$')
+        p41=r'^(?P<key>\S+ +Oversized +SDUs) +: +(?P<val>\d+)$',
 
         # LCP Closed
         # LCP Closed, loopback not set
-        p42 = re.compile(r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$')
+        p42=r'^LCP\s+(?P<state>\S+)(,\s+loopback\s+(?P<loopback>[\S\s]+))?$',
 
         # Base PPPoATM vaccess
-        p43 = re.compile(r'^Base PPPoATM +(?P<base_pppoatm>\S+)$')
+        p43=r'^Base PPPoATM +(?P<base_pppoatm>\S+)$',
 
         # Vaccess status 0x44, loopback not set
-        p44 = re.compile(r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
-                r'loopback\s+(?P<loopback>[\S\s]+)$')
+        p44=r'^Vaccess\s+status\s+(?P<status>\S+),\s+'
+            r'loopback\s+(?P<loopback>[\S\s]+)$',
 
         # DTR is pulsed for 5 seconds on reset
-        p45 = re.compile(r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
-                r'seconds +on +reset$')
+        p45=r'^DTR +is +pulsed +for +(?P<dtr_pulsed>\d+) +'
+            r'seconds +on +reset$',
 
         # Tunnel source 1.1.10.11
         # Tunnel source 1.1.1.1 (Loopback1)
@@ -514,35 +505,62 @@ class ShowInterfaces(ShowInterfacesSchema):
         # Tunnel source 172.16.121.201 (GigabitEthernet0/0/1.91), destination 172.16.64.36
         # Tunnel source UNKNOWN, destination 1.2.3.4
         #
-        p46 = re.compile(r'^Tunnel +source +(?P<tunnel_source_ip>([a-fA-F\d\:UNKNOWN|0-9\.]+)?),?\s?'
-                        r'(?P<tunnel_source_interface>\([\w\d.\/]+\))?,?\s?'
-                        r'(destination +)?(?P<tunnel_destination_ip>([a-fA-F\d\:0-9\.]+)?)')
+        p46=r'^Tunnel +source +(?P<tunnel_source_ip>([a-fA-F\d\:UNKNOWN|0-9\.]+)?),?\s?'
+            r'(?P<tunnel_source_interface>\([\w\d.\/]+\))?,?\s?'
+            r'(destination +)?(?P<tunnel_destination_ip>([a-fA-F\d\:0-9\.]+)?)',
 
         # Tunnel protocol/transport AURP
-        p47 = re.compile(r'^Tunnel +protocol/transport +(?P<tunnel_protocol>[\w\/]+)')
+        p47=r'^Tunnel +protocol/transport +(?P<tunnel_protocol>[\w\/]+)',
 
         # Tunnel TTL 255
-        p48 = re.compile(r'^Tunnel +TTL +(?P<tunnel_ttl>\d+)')
+        p48=r'^Tunnel +TTL +(?P<tunnel_ttl>\d+)',
 
         # Tunnel transport MTU 1480 bytes
-        p49 = re.compile(r'^Tunnel +transport +MTU +(?P<tunnel_transport_mtu>\d+)')
+        p49=r'^Tunnel +transport +MTU +(?P<tunnel_transport_mtu>\d+)',
 
         # Tunnel transmit bandwidth 10000000 (kbps)
-        p50 = re.compile(r'^Tunnel +transmit +bandwidth +(?P<tunnel_transmit_bandwidth>\d+)')
+        p50=r'^Tunnel +transmit +bandwidth +(?P<tunnel_transmit_bandwidth>\d+)',
 
         # Tunnel receive bandwidth 10000000 (kbps)
-        p51 = re.compile(r'^Tunnel +receive +bandwidth +(?P<tunnel_receive_bandwidth>\d+)')
+        p51=r'^Tunnel +receive +bandwidth +(?P<tunnel_receive_bandwidth>\d+)',
 
         # Tunnel Protection profile
-        p52 = re.compile(r'^Tunnel +protection +via +(?P<tunnel_protection>[\w]+) +\(profile \"(?P<tunnel_profile>[\w]+)\"\)')
+        p52=r'^Tunnel +protection +via +(?P<tunnel_protection>[\w]+) +\(profile \"(?P<tunnel_profile>[\w]+)\"\)',
 
         # 3 carrier transitions
-        p53 = re.compile(r'^(?P<carrier_transitions>\d+)\s+carrier transitions$')
+        p53=r'^(?P<carrier_transitions>\d+)\s+carrier transitions$',
+
+        # Carrier delay is 10 sec
+        p_cd=r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$',
+
+        # Asymmetric Carrier-Delay Up Timer is 2 sec
+        # Asymmetric Carrier-Delay Down Timer is 10 sec
+        p_cd_2=r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
+                ' +Timer +is +(?P<carrier_delay>\d+).*$',
+    )
+    dispatcher = LineDispatcher(patterns, order=[
+        'p1', 'p1_1', 'p2', 'p2_2', 'p3', 'p4', 'p5', 'p6', 'p7', 'p8', 'p10',
+        'p11', 'p12', 'p_cd', 'p_cd_2', 'p13', 'p14', 'p15', 'p15_1', 'p15_2',
+        'p15_3', 'p16', 'p17', 'p18', 'p19', 'p20', 'p21', 'p22', 'p23', 'p24',
+        'p25', 'p26', 'p27', 'p28', 'p29', 'p30', 'p31', 'p32', 'p33', 'p34',
+        'p35', 'p36', 'p37', 'p38', 'p39', 'p40', 'p41', 'p42', 'p43', 'p44',
+        'p45', 'p46', 'p47', 'p48', 'p49', 'p50', 'p51', 'p52', 'p53'])
+
+    def cli(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
 
         interface_dict = {}
         unnumbered_dict = {}
         for line in out.splitlines():
             line = line.strip()
+            name, m = ShowInterfaces.dispatcher.match(line)
 
             # GigabitEthernet1 is up, line protocol is up
             # Port-channel12 is up, line protocol is up (connected)
@@ -550,11 +568,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Dialer1 is up (spoofing), line protocol is up (spoofing)
             # FastEthernet1 is down, line protocol is down (err-disabled)
             # GigabitEthernet1/0/2 is up, line protocol is down (suspended)
-
-            m = p1.match(line)
-            m1 = p1_1.match(line)
-            m = m if m else m1
-            if m:
+            if name in ('p1', 'p1_1'):
                 interface = m.groupdict()['interface']
                 interface = Common.convert_intf_name(interface)
                 enabled = m.groupdict()['enabled']
@@ -599,12 +613,8 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
             # Hardware is Loopback
-            m = p2.match(line)
-
             # Hardware is LTE Adv CAT6 - Multimode LTE/DC-HSPA+/HSPA+/HSPA/UMTS/EDGE/GPRS
-            m1 = p2_2.match(line)
-            m = m if m else m1
-            if m:
+            if name in ('p2', 'p2_2'):
                 types = m.groupdict()['type']
                 mac_address = m.groupdict()['mac_address']
                 phys_address = m.groupdict()['phys_address']
@@ -616,16 +626,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             # Description: desc
             # Description: Pim Register Tunnel (Encap) for RP 10.186.1.1
-            m = p3.match(line)
-            if m:
+            if name == 'p3':
                 description = m.groupdict()['description']
 
                 interface_dict[interface]['description'] = description
                 continue
 
             # Secondary address 10.2.2.2/24
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 ip_sec = m.groupdict()['ip']
                 prefix_length_sec = m.groupdict()['prefix_length']
                 address_sec = m.groupdict()['ipv4']
@@ -644,8 +652,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Internet Address is 10.4.4.4/24
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
                 address = m.groupdict()['ipv4']
@@ -663,8 +670,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # MTU 1500 bytes, BW 768 Kbit/sec, DLY 3330 usec,
             # MTU 1500 bytes, BW 10000 Kbit, DLY 1000 usec,
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 mtu = m.groupdict()['mtu']
                 sub_mtu = m.groupdict().get('sub_mtu', None)
                 bandwidth = m.groupdict()['bandwidth']
@@ -679,8 +685,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p7.match(line)
-            if m:
+            if name == 'p7':
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
                 rxload = m.groupdict()['rxload']
@@ -695,8 +700,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation QinQ Virtual LAN, outer ID  10, inner ID 20
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  1., loopback not set
             # Encapsulation 802.1Q Virtual LAN, Vlan ID  105.
-            m = p8.match(line)
-            if m:
+            if name == 'p8':
                 encapsulation = m.groupdict()['encapsulation']
                 encapsulation = m.groupdict()['encapsulation'].lower()
                 encapsulation = encapsulation.replace("802.1q virtual lan","dot1q")
@@ -746,8 +750,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Keepalive set (10 sec)
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 keepalive = m.groupdict()['keepalive']
                 if keepalive:
                     interface_dict[interface]['keepalive'] = int(keepalive)
@@ -764,8 +767,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Full Duplex, 10000Mbps, link type is force-up, media type is SFP-LR
             # Full-duplex, 100Gb/s, link type is force-up, media type is QSFP 100G SR4
             # Full-duplex, 10Gb/s, link type is auto, media type is CVR QSFP SFP10G(SFP-10GBase-SR)
-            m = p11.match(line)
-            if m:
+            if name == 'p11':
                 duplex_mode = m.groupdict()['duplex_mode'].lower()
                 port_speed = m.groupdict()['port_speed'].lower().replace('-speed', '')
                 link_type = m.groupdict()['link_type']
@@ -788,8 +790,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # input flow-control is off, output flow-control is unsupported
-            m = p12.match(line)
-            if m:
+            if name == 'p12':
                 groups = m.groupdict()
                 receive = groups['receive'].lower() if groups['first'] == 'input' else groups['send'].lower()
                 send = groups['send'].lower() if groups['second'] == 'output' else groups['receive'].lower()
@@ -806,21 +807,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                     interface_dict[interface]['flow_control']['send'] = False
                 continue
 
-            # Carrier delay is 10 sec
-            p_cd = re.compile(r'^Carrier +delay +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd.match(line)
-            if m:
+            if name == 'p_cd':
                 group = m.groupdict()
                 sub_dict = interface_dict.setdefault(interface, {})
                 sub_dict['carrier_delay'] = int(group['carrier_delay'])
                 continue
 
-            # Asymmetric Carrier-Delay Up Timer is 2 sec
-            # Asymmetric Carrier-Delay Down Timer is 10 sec
-            p_cd_2 = re.compile(r'^Asymmetric +Carrier-Delay +(?P<type>Down|Up)'
-                                 ' +Timer +is +(?P<carrier_delay>\d+).*$')
-            m = p_cd_2.match(line)
-            if m:
+            if name == 'p_cd_2':
                 group = m.groupdict()
                 tp = group['type'].lower()
                 sub_dict = interface_dict.setdefault(interface, {})
@@ -831,8 +824,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # ARP type: ARPA, ARP Timeout 04:00:00
-            m = p13.match(line)
-            if m:
+            if name == 'p13':
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
                 interface_dict[interface]['arp_type'] = arp_type
@@ -840,8 +832,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05, output hang never
-            m = p14.match(line)
-            if m:
+            if name == 'p14':
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
                 output_hang = m.groupdict()['output_hang']
@@ -852,8 +843,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Members in this channel: Gi1/0/2
             # Members in this channel: Fo1/0/2 Fo1/0/4
-            m = p15.match(line)
-            if m:
+            if name == 'p15':
                 interface_dict[interface]['port_channel']\
                     ['port_channel_member'] = True
                 intfs = m.groupdict()['port_channel_member_intfs'].split(' ')
@@ -872,8 +862,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of active members in this channel: 12
-            m = p15_1.match(line)
-            if m:
+            if name == 'p15_1':
                 group = m.groupdict()
                 active_members = int(group['active_members'])
                 interface_dict[interface]['port_channel']\
@@ -883,8 +872,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Member 2 : GigabitEthernet0/0/10 , Full-duplex, 900Mb/s
-            m = p15_2.match(line)
-            if m:
+            if name == 'p15_2':
                 group = m.groupdict()
                 intf = group['interface']
                 if 'port_channel_member_intfs' not in interface_dict[interface]['port_channel']:
@@ -897,8 +885,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of PF_JUMBO supported members in this channel : 0
-            m = p15_3.match(line)
-            if m:
+            if name == 'p15_3':
                 group = m.groupdict()
                 number = int(group['number'])
                 interface_dict[interface]['port_channel']\
@@ -906,14 +893,12 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p16.match(line)
-            if m:
+            if name == 'p16':
                 last_clear = m.groupdict()['last_clear']
                 continue
 
             # Input queue: 0/375/0/0 (size/max/drops/flushes); Total output drops: 0
-            m = p17.match(line)
-            if m:
+            if name == 'p17':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
 
@@ -931,8 +916,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Queueing strategy: fifo
             # Queueing strategy: Class-based queueing
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['queue_strategy'] = \
@@ -941,8 +925,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Output queue: 0/0 (size/max)
             # Output queue: 0/1000/64/0 (size/max total/threshold/drops)
-            m = p19.match(line)
-            if m:
+            if name == 'p19':
                 if 'queues' not in interface_dict[interface]:
                     interface_dict[interface]['queues'] = {}
                 interface_dict[interface]['queues']['output_queue_size'] = \
@@ -957,8 +940,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p20.match(line)
-            if m:
+            if name == 'p20':
                 load_interval = int(m.groupdict()['load_interval'])
                 in_rate = int(m.groupdict()['in_rate'])
                 in_rate_pkts = int(m.groupdict()['in_rate_pkts'])
@@ -991,8 +973,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p21.match(line)
-            if m:
+            if name == 'p21':
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
                     interface_dict[interface]['counters']['rate'] = {}
@@ -1007,8 +988,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 packets input, 0 bytes, 0 no buffer
-            m = p22.match(line)
-            if m:
+            if name == 'p22':
                 if 'counters' not in interface_dict[interface]:
                     interface_dict[interface]['counters'] = {}
 
@@ -1023,8 +1003,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Received 4173 broadcasts (0 IP multicasts)
             # Received 535996 broadcasts (535961 multicasts)
-            m = p23.match(line)
-            if m:
+            if name == 'p23':
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
                     int(m.groupdict()['in_multicast_pkts'])
                 interface_dict[interface]['counters']['in_broadcast_pkts'] = \
@@ -1032,8 +1011,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 runts, 0 giants, 0 throttles
-            m = p24.match(line)
-            if m:
+            if name == 'p24':
                 interface_dict[interface]['counters']['in_runts'] = \
                     int(m.groupdict()['in_runts'])
                 interface_dict[interface]['counters']['in_giants'] = \
@@ -1044,8 +1022,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p25.match(line)
-            if m:
+            if name == 'p25':
                 interface_dict[interface]['counters']['in_errors'] = \
                     int(m.groupdict()['in_errors'])
                 interface_dict[interface]['counters']['in_crc_errors'] = \
@@ -1062,8 +1039,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 watchdog, 535961 multicast, 0 pause input
-            m = p26.match(line)
-            if m:
+            if name == 'p26':
                 interface_dict[interface]['counters']['in_watchdog'] = \
                     int(m.groupdict()['in_watchdog'])
                 interface_dict[interface]['counters']['in_multicast_pkts'] = \
@@ -1073,15 +1049,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 input packets with dribble condition detected
-            m = p27.match(line)
-            if m:
+            if name == 'p27':
                 interface_dict[interface]['counters']['in_with_dribble'] = \
                     int(m.groupdict()['in_with_dribble'])
                 continue
 
             # 23376 packets output, 3642296 bytes, 0 underruns
-            m = p28.match(line)
-            if m:
+            if name == 'p28':
                 interface_dict[interface]['counters']['out_pkts'] = \
                     int(m.groupdict()['out_pkts'])
                 interface_dict[interface]['counters']['out_octets'] = \
@@ -1092,8 +1066,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Output 0 broadcasts (55 multicasts)
-            m = p29.match(line)
-            if m:
+            if name == 'p29':
                 interface_dict[interface]['counters']['out_broadcast_pkts'] = \
                     int(m.groupdict()['out_broadcast_pkts'])
                 interface_dict[interface]['counters']['out_multicast_pkts'] = \
@@ -1102,8 +1075,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 output errors, 0 collisions, 2 interface resets
             # 0 output errors, 0 interface resets
-            m = p30.match(line)
-            if m:
+            if name == 'p30':
                 interface_dict[interface]['counters']['out_errors'] = \
                     int(m.groupdict()['out_errors'])
                 interface_dict[interface]['counters']['out_interface_resets'] = \
@@ -1114,15 +1086,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 unknown protocol drops
-            m = p31.match(line)
-            if m:
+            if name == 'p31':
                 interface_dict[interface]['counters']['out_unknown_protocl_drops'] = \
                     int(m.groupdict()['out_unknown_protocl_drops'])
                 continue
 
             # 0 babbles, 0 late collision, 0 deferred
-            m = p32.match(line)
-            if m:
+            if name == 'p32':
                 interface_dict[interface]['counters']['out_babble'] = \
                     int(m.groupdict()['out_babble'])
                 interface_dict[interface]['counters']['out_late_collision'] = \
@@ -1132,8 +1102,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 lost carrier, 0 no carrier, 0 pause output
-            m = p33.match(line)
-            if m:
+            if name == 'p33':
                 interface_dict[interface]['counters']['out_lost_carrier'] = \
                     int(m.groupdict()['out_lost_carrier'])
                 interface_dict[interface]['counters']['out_no_carrier'] = \
@@ -1145,8 +1114,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p34.match(line)
-            if m:
+            if name == 'p34':
                 interface_dict[interface]['counters']['out_buffer_failure'] = \
                     int(m.groupdict()['out_buffer_failure'])
                 interface_dict[interface]['counters']['out_buffers_swapped'] = \
@@ -1155,16 +1123,14 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Interface is unnumbered. Using address of Loopback0 (10.4.1.1)
             # Interface is unnumbered. Using address of GigabitEthernet0/2.1 (192.168.154.1)
-            m = p35.match(line)
-            if m:
+            if name == 'p35':
                 unnumbered_dict[interface] = {}
                 unnumbered_dict[interface]['unnumbered_intf'] = m.groupdict()['unnumbered_intf']
                 unnumbered_dict[interface]['unnumbered_ip'] = m.groupdict()['unnumbered_ip']
                 continue
 
             # 8 maximum active VCs, 1024 VCs per VP, 1 current VCCs
-            m = p36.match(line)
-            if m:
+            if name == 'p36':
                 group = m.groupdict()
                 maximum_active_vcs = group['maximum_active_vcs']
                 vcs_per_vp = group['vcs_per_vp']
@@ -1175,45 +1141,39 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # VC Auto Creation Disabled.
-            m = p37.match(line)
-            if m:
+            if name == 'p37':
                 group = m.groupdict()
                 vc_auto_creation = group['vc_auto_creation']
                 interface_dict[interface].update({'vc_auto_creation': vc_auto_creation})
                 continue
 
             # VC idle disconnect time: 300 seconds
-            m = p38.match(line)
-            if m:
+            if name == 'p38':
                 group = m.groupdict()
                 vc_idle_disconnect_time = group['vc_idle_disconnect_time']
                 interface_dict[interface].update({'vc_idle_disconnect_time': vc_idle_disconnect_time})
                 continue
 
             # AAL5 CRC errors : 0
-            m = p39.match(line)
-            if m:
+            if name == 'p39':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_crc_errors': int(group['val'])})
                 continue
 
             # AAL5 SAR Timeouts : 0
-            m = p40.match(line)
-            if m:
+            if name == 'p40':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_oversized_sdus': int(group['val'])})
                 continue
 
             # AAL5 Oversized SDUs : 0
-            m = p41.match(line)
-            if m:
+            if name == 'p41':
                 group = m.groupdict()
                 interface_dict[interface].update({'aal5_sar_timeouts': int(group['val'])})
                 continue
 
             # LCP Closed
-            m = p42.match(line)
-            if m:
+            if name == 'p42':
                 group = m.groupdict()
                 interface_dict[interface].update({'lcp_state': group['state']})
                 loopback = group.get('loopback', None)
@@ -1222,23 +1182,20 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Base PPPoATM vaccess
-            m = p43.match(line)
-            if m:
+            if name == 'p43':
                 group = m.groupdict()
                 interface_dict[interface].update({'base_pppoatm': group['base_pppoatm']})
                 continue
 
             # Vaccess status 0x44, loopback not set
-            m = p44.match(line)
-            if m:
+            if name == 'p44':
                 group = m.groupdict()
                 interface_dict[interface].update({'vaccess_status': group['status']})
                 interface_dict[interface].update({'vaccess_loopback': group['loopback']})
                 continue
 
             # DTR is pulsed for 5 seconds on reset
-            m = p45.match(line)
-            if m:
+            if name == 'p45':
                 group = m.groupdict()
                 interface_dict[interface].update({'dtr_pulsed': group['dtr_pulsed']})
                 continue
@@ -1248,8 +1205,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Tunnel source 1.1.10.11, destination 1.1.10.10
             # Tunnel source 172.16.121.201 (GigabitEthernet0/0/1.91), destination 172.16.64.36
             # Tunnel source UNKNOWN, destination 1.2.3.4
-            m = p46.match(line)
-            if m:
+            if name == 'p46':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_source_ip': group['tunnel_source_ip']})
                 if group['tunnel_source_interface']:
@@ -1259,42 +1215,36 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Tunnel protocol/transport AURP
-            m = p47.match(line)
-            if m:
+            if name == 'p47':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_protocol': group['tunnel_protocol']})
                 continue
 
             # Tunnel TTL 255
-            m = p48.match(line)
-            if m:
+            if name == 'p48':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_ttl': int(group['tunnel_ttl'])})
                 continue
 
             # Tunnel transport MTU 1480 bytes
-            m = p49.match(line)
-            if m:
+            if name == 'p49':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_transport_mtu': int(group['tunnel_transport_mtu'])})
                 continue
 
             # Tunnel transmit bandwidth 10000000 (kbps)
-            m = p50.match(line)
-            if m:
+            if name == 'p50':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_transmit_bandwidth': int(group['tunnel_transmit_bandwidth'])})
                 continue
 
             # Tunnel receive bandwidth 10000000 (kbps)
-            m = p51.match(line)
-            if m:
+            if name == 'p51':
                 group = m.groupdict()
                 interface_dict[interface].update({'tunnel_receive_bandwidth': int(group['tunnel_receive_bandwidth'])})
                 continue
 
-            m = p52.match(line)
-            if m:
+            if name == 'p52':
                 group = m.groupdict()
                 if group['tunnel_protection']:
                     interface_dict[interface].update({'tunnel_protection': group['tunnel_protection']})
@@ -1303,8 +1253,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 3 carrier transitions
-            m = p53.match(line)
-            if m:
+            if name == 'p53':
                 group = m.groupdict()
                 interface_dict[interface]['carrier_transitions'] = int(group['carrier_transitions'])
                 continue
@@ -1657,131 +1606,137 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
     cli_command = ['show interfaces switchport', 'show interfaces {interface} switchport']
 
-    def cli(self, interface='', output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
+    patterns = Patterns(
         # Name: Gi1/0/2
-        p1 = re.compile(r'^Name: +(?P<intf>[\w\/\.\-]+)$')
+        p1=r'^Name: +(?P<intf>[\w\/\.\-]+)$',
 
         # Switchport: Enabled
-        p2 = re.compile(r'^Switchport: +(?P<switchport_enable>\w+)$')
+        p2=r'^Switchport: +(?P<switchport_enable>\w+)$',
 
         # Administrative Mode: trunk
-        p3 = re.compile(r'^Administrative +Mode: +(?P<switchport_mode>[\w\s]+)$')
+        p3=r'^Administrative +Mode: +(?P<switchport_mode>[\w\s]+)$',
 
         # Operational Mode: trunk (member of bundle Po12)
         # Operational Mode: down (suspended member of bundle Po12)
-        p4 = re.compile(r'^Operational +Mode: +(?P<operational_mode>[\w\s]+)'
-                        r'( +\((?P<dummy>[\w\s]+)? *member +of +bundle '
-                        r'+(?P<port_channel_int>[\w\/\.\-]+)\))?$')
+        p4=r'^Operational +Mode: +(?P<operational_mode>[\w\s]+)'
+           r'( +\((?P<dummy>[\w\s]+)? *member +of +bundle '
+           r'+(?P<port_channel_int>[\w\/\.\-]+)\))?$',
 
         # Administrative Trunking Encapsulation: dot1q
-        p5 = re.compile(r'^Administrative +Trunking +Encapsulation: +'
-                        r'(?P<encapsulation>\w+)$')
+        p5=r'^Administrative +Trunking +Encapsulation: +'
+           r'(?P<encapsulation>\w+)$',
 
         # Operational Trunking Encapsulation: dot1q
-        p6 = re.compile(r'^Operational +Trunking +Encapsulation: +'
-                        r'(?P<encapsulation>\w+)$')
+        p6=r'^Operational +Trunking +Encapsulation: +'
+           r'(?P<encapsulation>\w+)$',
 
         # Negotiation of Trunking: On
-        p7 = re.compile(r'^Negotiation +of +Trunking: +(?P<negotiation_of_trunk>\w+)$')
+        p7=r'^Negotiation +of +Trunking: +(?P<negotiation_of_trunk>\w+)$',
 
         # Access Mode VLAN: 1 (default)
         # Access Mode VLAN: 100 (Falback-Data)
-        p8 = re.compile(r'^Access +Mode +VLAN: +(?P<access_vlan>[\d\-]+)'
-                        r'( *\((?P<access_vlan_name>.+)\))?$')
+        p8=r'^Access +Mode +VLAN: +(?P<access_vlan>[\d\-]+)'
+           r'( *\((?P<access_vlan_name>.+)\))?$',
 
         # Trunking Native Mode VLAN: 1 (default)
-        p9 = re.compile(r'^Trunking +Native +Mode +VLAN: +(?P<native_vlan>[\d\-]+)'
-                        r'( *\((?P<native_vlan_name>.+)\))?$')
+        p9=r'^Trunking +Native +Mode +VLAN: +(?P<native_vlan>[\d\-]+)'
+           r'( *\((?P<native_vlan_name>.+)\))?$',
 
         # Administrative Native VLAN tagging: enabled
-        p10 = re.compile(r'^Administrative +Native +VLAN +tagging: +'
-                         r'(?P<tagging>\w+)$')
+        p10=r'^Administrative +Native +VLAN +tagging: +'
+            r'(?P<tagging>\w+)$',
 
         # Voice VLAN: none
         # Voice VLAN: 100 (Fallback-Voice)
-        p11 = re.compile(r'^Voice +VLAN: +(?P<vlan>[\d\-]+)'
-                         r'( *\((?P<voice_vlan_name>.+)\))?$')
+        p11=r'^Voice +VLAN: +(?P<vlan>[\d\-]+)'
+            r'( *\((?P<voice_vlan_name>.+)\))?$',
 
         # Administrative private-vlan host-association: none
-        p12 = re.compile(r'^Administrative +private-vlan +'
-                         r'host-association: +(?P<ret>[\w\-]+)$')
+        p12=r'^Administrative +private-vlan +'
+            r'host-association: +(?P<ret>[\w\-]+)$',
 
         # Administrative private-vlan mapping: none
-        p13 = re.compile(r'^Administrative +private-vlan +'
-                         r'mapping: +(?P<ret>[\w\-]+)$')
+        p13=r'^Administrative +private-vlan +'
+            r'mapping: +(?P<ret>[\w\-]+)$',
 
         # Administrative private-vlan trunk native VLAN: none
-        p14 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +native +VLAN: +(?P<ret>[\w\-]+)$')
+        p14=r'^Administrative +private-vlan +'
+            r'trunk +native +VLAN: +(?P<ret>[\w\-]+)$',
 
         # Administrative private-vlan trunk Native VLAN tagging: enabled
-        p15 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +Native +VLAN +tagging: +(?P<ret>[\w\-]+)$')
+        p15=r'^Administrative +private-vlan +'
+            r'trunk +Native +VLAN +tagging: +(?P<ret>[\w\-]+)$',
 
         # Administrative private-vlan trunk encapsulation: dot1q
-        p16 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +encapsulation: +(?P<ret>[\w\-]+)$')
+        p16=r'^Administrative +private-vlan +'
+            r'trunk +encapsulation: +(?P<ret>[\w\-]+)$',
 
         # Administrative private-vlan trunk normal VLANs: none
-        p17 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +normal +VLANs: +(?P<ret>[\w\-]+)$')
+        p17=r'^Administrative +private-vlan +'
+            r'trunk +normal +VLANs: +(?P<ret>[\w\-]+)$',
 
         # Administrative private-vlan trunk associations: none
-        p18 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +associations: +(?P<ret>[\w\-]+)$')
+        p18=r'^Administrative +private-vlan +'
+            r'trunk +associations: +(?P<ret>[\w\-]+)$',
 
         # Administrative private-vlan trunk mappings: none
         # Administrative private-vlan trunk mappings:
-        p19 = re.compile(r'^Administrative +private-vlan +'
-                         r'trunk +mappings:( *(?P<ret>[\w\-]+))?$')
+        p19=r'^Administrative +private-vlan +'
+            r'trunk +mappings:( *(?P<ret>[\w\-]+))?$',
 
         # Operational private-vlan: none
         # Operational private-vlan:
-        p20 = re.compile(r'^Operational +private-vlan:'
-                         r'( *(?P<private_operational>[\w\-]+))?$')
+        p20=r'^Operational +private-vlan:'
+            r'( *(?P<private_operational>[\w\-]+))?$',
 
         # Trunking VLANs Enabled: 200-211
         # Trunking VLANs Enabled: 100,101,110-120,121,130,170,180,
-        p21 = re.compile(r'^Trunking +VLANs +Enabled: +(?P<trunk_vlans>[\w\-\,\s]+)$')
+        p21=r'^Trunking +VLANs +Enabled: +(?P<trunk_vlans>[\w\-\,\s]+)$',
 
         # 1111,2222,3333, 500-55,
-        p21_1 = re.compile(r'^(?P<trunk_vlans>[\d\,\-]+)$')
+        p21_1=r'^(?P<trunk_vlans>[\d\,\-]+)$',
 
         # Pruning VLANs Enabled: 2-1001
-        p22 = re.compile(r'^Pruning +VLANs +Enabled: +(?P<pruning_vlans>[\w\-]+)$')
+        p22=r'^Pruning +VLANs +Enabled: +(?P<pruning_vlans>[\w\-]+)$',
 
         # Capture Mode Disabled
-        p23 = re.compile(r'^Capture +Mode +(?P<mode>\w+)$')
+        p23=r'^Capture +Mode +(?P<mode>\w+)$',
 
         # Capture VLANs Allowed: ALL
-        p24 = re.compile(r'^Capture +VLANs +Allowed: +(?P<capture_vlans>[\w\-]+)$')
+        p24=r'^Capture +VLANs +Allowed: +(?P<capture_vlans>[\w\-]+)$',
 
         # Protected: false
-        p25 = re.compile(r'^Protected: +(?P<protected>\w+)$')
+        p25=r'^Protected: +(?P<protected>\w+)$',
 
         # Unknown unicast blocked: disabled
-        p26 = re.compile(r'^Unknown +unicast +blocked: +(?P<block>\w+)$')
+        p26=r'^Unknown +unicast +blocked: +(?P<block>\w+)$',
 
         # Unknown multicast blocked: disabled
-        p27 = re.compile(r'^Unknown +multicast +blocked: +(?P<block>\w+)$')
+        p27=r'^Unknown +multicast +blocked: +(?P<block>\w+)$',
 
         # Appliance trust: none
-        p28 = re.compile(r'^Appliance +trust: +(?P<trust>[\w\-]+)$')
+        p28=r'^Appliance +trust: +(?P<trust>[\w\-]+)$',
 
         #Administrative Dot1q Ethertype: 0x9100
-        p29 = re.compile(r'^Administrative +Dot1q +Ethertype: +(?P<admin_ethertype>\w+)$')
+        p29=r'^Administrative +Dot1q +Ethertype: +(?P<admin_ethertype>\w+)$',
 
         #Operational Dot1q Ethertype: 0x9100
-        p30 = re.compile(r'^Operational +Dot1q +Ethertype: +(?P<oper_ethertype>\w+)$')        
+        p30=r'^Operational +Dot1q +Ethertype: +(?P<oper_ethertype>\w+)$',
+        p19_1=r'^(?P<mappings>[\w\(\)\s]+)$',
+        p20_1=r'^(?P<private_operational>[\w\(\)\s]+)$',
+    )
+
+    def cli(self, interface='', output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        p = ShowInterfacesSwitchport.patterns
 
         ret_dict = {}
         private_trunk_mappings = None
@@ -1790,7 +1745,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
             line = line.strip()
 
             # Name: Gi1/0/2
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 intf = Common.convert_intf_name(m.groupdict()['intf'])
                 if intf not in ret_dict:
@@ -1798,7 +1753,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Switchport: Enabled
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if m.groupdict()['switchport_enable'].lower() == 'enabled':
                     ret_dict[intf]['switchport_enable'] = True
@@ -1808,14 +1763,14 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative Mode: trunk
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict[intf]['switchport_mode'] = m.groupdict()['switchport_mode']
                 continue
 
             # Operational Mode: trunk (member of bundle Po12)
             # Operational Mode: down (suspended member of bundle Po12)
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 if interface:
                     ret_dict[intf]['operational_mode'] = m.groupdict()['operational_mode']
@@ -1859,7 +1814,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative Trunking Encapsulation: dot1q
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 if 'encapsulation' not in ret_dict[intf]:
                     ret_dict[intf]['encapsulation'] = {}
@@ -1868,7 +1823,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Operational Trunking Encapsulation: dot1q
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 if 'encapsulation' not in ret_dict[intf]:
                     ret_dict[intf]['encapsulation'] = {}
@@ -1877,7 +1832,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Negotiation of Trunking: On
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 negotiation_of_trunk = m.groupdict()['negotiation_of_trunk'].lower()
                 if 'on' in negotiation_of_trunk:
@@ -1888,7 +1843,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Access Mode VLAN: 1 (default)
             # Access Mode VLAN: 100 (Falback-Data)
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 ret_dict[intf]['access_vlan'] = m.groupdict()['access_vlan']
                 if m.groupdict()['access_vlan_name']:
@@ -1896,7 +1851,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Trunking Native Mode VLAN: 1 (default)
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'encapsulation' not in ret_dict[intf]:
                     ret_dict[intf]['encapsulation'] = {}
@@ -1906,7 +1861,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative Native VLAN tagging: enabled
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 if 'enable' in m.groupdict()['tagging'].lower():
                     ret_dict[intf]['native_vlan_tagging'] = True
@@ -1916,7 +1871,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Voice VLAN: none
             # Voice VLAN: 100 (Fallback-Voice)
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 ret_dict[intf]['voice_vlan'] = m.groupdict()['vlan']
                 if m.groupdict()['voice_vlan_name']:
@@ -1924,7 +1879,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan host-association: none
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
                     ret_dict[intf]['private_vlan'] = {}
@@ -1934,7 +1889,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan mapping: none
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
                     ret_dict[intf]['private_vlan'] = {}
@@ -1944,7 +1899,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk native VLAN: none
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
                     ret_dict[intf]['private_vlan'] = {}
@@ -1954,7 +1909,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk Native VLAN tagging: enabled
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
                     ret_dict[intf]['private_vlan'] = {}
@@ -1966,7 +1921,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk encapsulation: dot1q
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
                     ret_dict[intf]['private_vlan'] = {}
@@ -1976,7 +1931,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk normal VLANs: none
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
                     ret_dict[intf]['private_vlan'] = {}
@@ -1986,7 +1941,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Administrative private-vlan trunk associations: none
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
                     ret_dict[intf]['private_vlan'] = {}
@@ -1997,7 +1952,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Administrative private-vlan trunk mappings: none
             # Administrative private-vlan trunk mappings:
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
                     ret_dict[intf]['private_vlan'] = {}
@@ -2009,8 +1964,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # 10 (VLAN0010) 100 (VLAN0100)
             if isinstance(private_trunk_mappings, str):
-                p19_1 = re.compile(r'^(?P<mappings>[\w\(\)\s]+)$')
-                m = p19_1.match(line)
+                m = p.p19_1.match(line)
                 if m:
                     ret = m.groupdict()['mappings']
                     private_trunk_mappings += ' {}'.format(ret)
@@ -2021,7 +1975,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Operational private-vlan: none
             # Operational private-vlan:
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 if 'private_vlan' not in ret_dict[intf]:
                     ret_dict[intf]['private_vlan'] = {}
@@ -2033,7 +1987,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # Trunking VLANs Enabled: 200-211
             # Trunking VLANs Enabled: 100,101,110-120,121,130,170,180,
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 ret_dict[intf]['trunk_vlans'] = m.groupdict()['trunk_vlans'].lower()
                 private_operational = None
@@ -2041,8 +1995,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
 
             # 10 (VLAN0010) 100 (VLAN0100)
             if isinstance(private_operational, str):
-                p20_1 = re.compile(r'^(?P<private_operational>[\w\(\)\s]+)$')
-                m = p20_1.match(line)
+                m = p.p20_1.match(line)
                 if m:
                     ret = m.groupdict()['private_operational']
                     private_operational += ' {}'.format(ret)
@@ -2052,19 +2005,19 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # 1111,2222,3333, 500-55,
-            m = p21_1.match(line)
+            m = p.p21_1.match(line)
             if m:
                 ret_dict[intf]['trunk_vlans'] += m.groupdict()['trunk_vlans'].lower()
                 continue
 
             # Pruning VLANs Enabled: 2-1001
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 ret_dict[intf]['pruning_vlans'] = m.groupdict()['pruning_vlans'].lower()
                 continue
 
             # Capture Mode Disabled
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 mode = m.groupdict()['mode'].lower()
                 if 'disabled' in mode:
@@ -2074,13 +2027,13 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Capture VLANs Allowed: ALL
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 ret_dict[intf]['capture_vlans'] = m.groupdict()['capture_vlans'].lower()
                 continue
 
             # Protected: false
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 if 'false' in m.groupdict()['protected'].lower():
                     ret_dict[intf]['protected'] = False
@@ -2089,7 +2042,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Unknown unicast blocked: disabled
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 if 'disabled' in m.groupdict()['block'].lower():
                     ret_dict[intf]['unknown_unicast_blocked'] = False
@@ -2098,7 +2051,7 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Unknown multicast blocked: disabled
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'disabled' in m.groupdict()['block'].lower():
                     ret_dict[intf]['unknown_multicast_blocked'] = False
@@ -2107,20 +2060,20 @@ class ShowInterfacesSwitchport(ShowInterfacesSwitchportSchema):
                 continue
 
             # Appliance trust: none
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 if m.groupdict()['trust'] != 'none':
                     ret_dict[intf]['appliance_trust'] = m.groupdict()['trust']
                 continue
 
             # Administrative Dot1q Ethertype: 0x9100    
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 admin_ethertype = m.groupdict()['admin_ethertype']
                 ret_dict[intf]['admin_ethertype'] = admin_ethertype
 
             # Operational Dot1q Ethertype: 0x9100
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 oper_ethertype = m.groupdict()['oper_ethertype']
                 ret_dict[intf]['oper_ethertype'] = oper_ethertype
@@ -2203,6 +2156,180 @@ class ShowIpInterface(ShowIpInterfaceSchema):
     cli_command = ['show ip interface','show ip interface {interface}']
     exclude = ['unnumbered', 'address_determined_by', '(Tunnel.*)', 'joins', 'leaves']
 
+    patterns = Patterns(
+        # Vlan211 is up, line protocol is up
+        # GigabitEthernet2 is administratively down, line protocol is down
+        p1=r'^(?P<interface>[\w\/\.\-\:]+) +is'
+           r' +(?P<enabled>[\w\s]+),'
+           r' +line +protocol +is +(?P<oper_status>\w+)$',
+
+        # Internet address is 192.168.76.1/24
+        p2=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
+           r'\/(?P<prefix_length>[0-9]+))$',
+
+        # Interface is unnumbered. Using address of GigabitEthernet0/0.101 (10.1.98.10)
+        p2_0=r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
+             r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$',
+
+        # Secondary address 10.2.2.2/24
+        p2_1=r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
+             r'\/(?P<prefix_length>[0-9]+))$',
+
+        # Internet address will be negotiated using DHCP
+        # Internet address will be negotiated using IPCP
+        p2_2=r'^Internet +[A|a]ddress +will +be +negotiated '
+             r'+using +(?P<negotiated>DHCP|IPCP)$',
+
+        # Broadcast address is 255.255.255.255
+        p3=r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$',
+
+        # MTU is 1500 bytes
+        p4=r'^MTU +is +(?P<mtu>\d+) +bytes$',
+
+        # Helper address is not set
+        p5=r'^Helper +address +is +not +set$',
+
+        # Helper address is 10.1.1.1
+        p5_0=r'^Helper +address +is +(?P<address>[\d\.]+)$',
+
+        # Helper addresses are 10.1.1.1
+        p5_1=r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$',
+
+        # 10.2.2.2
+        p5_2=r'^(?P<address>[\d\.]+)$',
+
+        # Directed broadcast forwarding is disabled
+        p6=r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$',
+
+        # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
+        p41=r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$',
+        p41_1=r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)',
+
+        # Outgoing Common access list is not set
+        p7=r'^Outgoing +Common +access +list +is +'
+           r'(?P<access_list>.+)$',
+
+        # Outgoing access list is not set
+        p8=r'^Outgoing +access +list +is +'
+           r'(?P<access_list>.+)$',
+
+        # Inbound Common access list is not set
+        p9=r'^Inbound +Common +access +list +is +'
+           r'(?P<access_list>.+)$',
+
+        # Inbound  access list is not set
+        p10=r'^Inbound +access +list +is +'
+            r'(?P<access_list>.+)$',
+
+        # Proxy ARP is enabled
+        p11=r'^Proxy +ARP +is +'
+            r'(?P<status>\w+)$',
+
+        # Local Proxy ARP is disabled
+        p12=r'^Local +Proxy +ARP +is +'
+            r'(?P<status>\w+)$',
+
+        # Security level is default
+        p13=r'^Security +level +is +'
+            r'(?P<level>\w+)$',
+
+        # Split horizon is enabled
+        p14=r'^Split +horizon +is +'
+            r'(?P<status>\w+)$',
+
+        # ICMP redirects are always sent
+        p15=r'^ICMP +redirects +are +'
+            r'(?P<sent>[\w\s]+)$',
+
+        # ICMP unreachables are always sent
+        p16=r'^ICMP +unreachables +are +'
+            r'(?P<sent>[\w\s]+)$',
+
+        # ICMP mask replies are never sent
+        p17=r'^ICMP +mask +replies +are +'
+            r'(?P<sent>[\w\s]+)$',
+
+        # IP fast switching is enabled
+        p18=r'^IP +fast +switching +is +'
+            r'(?P<status>\w+)$',
+
+        # IP Flow switching is disabled
+        p19=r'^IP +Flow +switching +is +'
+            r'(?P<status>\w+)$',
+
+        # IP CEF switching is enabled
+        p20=r'^IP +CEF +switching +is +'
+            r'(?P<status>\w+)$',
+
+        # IP CEF switching turbo vector
+        p21=r'^IP +CEF +switching +turbo +vector$',
+
+        # IP Null turbo vector
+        p22=r'^IP +Null +turbo +vector$',
+
+        # VPN Routing/Forwarding "Mgmt-vrf"
+        p23=r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$',
+
+        # Associated unicast routing topologies:
+        #     Topology "base", operation state is UP
+        p24=r'^Associated +unicast +routing +topologies:$',
+        p24_1=r'^Topology +\"(?P<topo>\w+)\", +'
+              r'operation +state +is +(?P<topo_status>\w+)$',
+
+        # IP route-cache flags are Fast, CEF
+        p26=r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$',
+
+        # Router Discovery is disabled
+        p27=r'^Router +Discovery +is +'
+            r'(?P<status>\w+)$',
+
+        # IP output packet accounting is disabled
+        p28=r'^IP +output +packet +accounting +is +'
+            r'(?P<status>\w+)$',
+
+        # IP access violation accounting is disabled
+        p29=r'^IP +access +violation +accounting +is +'
+            r'(?P<status>\w+)$',
+
+        # TCP/IP header compression is disabled
+        p30=r'^TCP\/IP +header +compression +is +'
+            r'(?P<status>\w+)$',
+
+        # RTP/IP header compression is disabled
+        p31=r'^RTP\/IP +header +compression +is +'
+            r'(?P<status>\w+)$',
+
+        # Probe proxy name replies are disabled
+        p32=r'^Probe +proxy +name +replies +are +'
+            r'(?P<status>\w+)$',
+
+        # Policy routing is disabled
+        p33=r'^Policy +routing +is +'
+            r'(?P<status>\w+)$',
+
+        # Network address translation is disabled
+        p34=r'^Network +address +translation +is +'
+            r'(?P<status>\w+)$',
+
+        # BGP Policy Mapping is disabled
+        p35=r'^BGP +Policy +Mapping +is +'
+            r'(?P<status>\w+)$',
+
+        # IPv4 WCCP Redirect outbound is disable
+        p37=r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$',
+
+        # IPv4 WCCP Redirect inbound is disabled
+        p38=r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$',
+
+        # IPv4 WCCP Redirect exclude is disabled
+        p39=r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$',
+
+        # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
+        p40=r'^Interface +is +unnumbered. +Using +address +of +'
+            r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
+            r'\((?P<unnumbered_ip>[\w\.\:]+)\)$',
+    )
+
     def cli(self,interface="",output=None):
         if output is None:
             if interface:
@@ -2217,15 +2344,13 @@ class ShowIpInterface(ShowIpInterfaceSchema):
         multicast_groups = []
         interface_dict = {}
         unnumbered_dict = {}
+
+        p = ShowIpInterface.patterns
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Vlan211 is up, line protocol is up
-            # GigabitEthernet2 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
-                            r' +(?P<enabled>[\w\s]+),'
-                            r' +line +protocol +is +(?P<oper_status>\w+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled'].lower()
@@ -2240,10 +2365,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
 
                 continue
 
-            # Internet address is 192.168.76.1/24
-            p2 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                            r'\/(?P<prefix_length>[0-9]+))$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -2262,10 +2384,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     ['secondary'] = False
                 continue
 
-            # Interface is unnumbered. Using address of GigabitEthernet0/0.101 (10.1.98.10)
-            p2_0 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +(\S+)'
-                              r' +\((?P<ipv4>(?P<ip>[0-9\.]+))\)$')
-            m = p2_0.match(line)
+            m = p.p2_0.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 address = m.groupdict()['ipv4']
@@ -2281,10 +2400,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     ['secondary'] = False
                 continue
 
-            # Secondary address 10.2.2.2/24
-            p2_1 = re.compile(r'^Secondary +address +(?P<ipv4>(?P<ip>[0-9\.]+)'
-                              r'\/(?P<prefix_length>[0-9]+))$')
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 ip = m.groupdict()['ip']
                 prefix_length = m.groupdict()['prefix_length']
@@ -2302,11 +2418,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 interface_dict[interface]['ipv4'][address]\
                     ['secondary'] = True
                 continue
-            # Internet address will be negotiated using DHCP
-            # Internet address will be negotiated using IPCP
-            p2_2 = re.compile(r'^Internet +[A|a]ddress +will +be +negotiated '
-                              r'+using +(?P<negotiated>DHCP|IPCP)$')
-            m = p2_2.match(line)
+            m = p.p2_2.match(line)
             if m:
                 negotiated_holder = m.groupdict()
                 if 'DHCP' in negotiated_holder.get('negotiated'):
@@ -2318,9 +2430,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 ipv4_dict[address]['ip'] = address
                 continue
 
-            # Broadcast address is 255.255.255.255
-            p3 = re.compile(r'^Broadcast +address +is +(?P<address>[\w\.\:]+)$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 if 'ipv4' in interface_dict[interface]:
                     if address in interface_dict[interface]['ipv4']:
@@ -2337,31 +2447,23 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     m.groupdict()['file']
                 continue
 
-            # MTU is 1500 bytes
-            p4 = re.compile(r'^MTU +is +(?P<mtu>\d+) +bytes$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 interface_dict[interface]['mtu'] = \
                     int(m.groupdict()['mtu'])
                 continue
 
-            # Helper address is not set
-            p5 = re.compile(r'^Helper +address +is +not +set$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 continue
 
-            # Helper address is 10.1.1.1
-            p5_0 = re.compile(r'^Helper +address +is +(?P<address>[\d\.]+)$')
-            m = p5_0.match(line)
+            m = p.p5_0.match(line)
             if m:
                 interface_dict[interface]['helper_address'] = \
                     [m.groupdict()['address']]
                 continue
 
-            # Helper addresses are 10.1.1.1
-            p5_1 = re.compile(r'^Helper +addresses +are +(?P<address>[\w\.\:\s]+)$')
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 helper_flag = True
                 if 'not set' not in m.groupdict()['address']:
@@ -2371,9 +2473,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         helper_list
                 continue
 
-            # 10.2.2.2
-            p5_2 = re.compile(r'^(?P<address>[\d\.]+)$')
-            m = p5_2.match(line)
+            m = p.p5_2.match(line)
             if m:
                 if helper_flag:
                     helper_list.append(m.groupdict()['address'])
@@ -2381,9 +2481,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
             else:
                 helper_flag = False
 
-            # Directed broadcast forwarding is disabled
-            p6 = re.compile(r'^Directed +broadcast +forwarding +is +(?P<status>\w+)$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['directed_broadcast_forwarding'] = False
@@ -2391,9 +2489,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['directed_broadcast_forwarding'] = True
                 continue
 
-            # Multicast reserved groups joined: 224.0.0.1 224.0.0.2 224.0.0.22 224.0.0.13
-            p41 = re.compile(r'^Multicast +reserved +groups +joined: +(?P<multicast_groups>[\w\s\.]+)$')
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 multicast_groups_address = str(m.groupdict()['multicast_groups'])
 
@@ -2408,8 +2504,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
             #       224.0.0.5  <----- this extra line
             if read_multicast_reserved_lines:
                 if not re.match(r"[^\d. ]", line):
-                    p41_1 = re.compile(r'(?P<multicast_groups>\d+\.\d+\.\d+\.\d+)')
-                    m = p41_1.findall(line)
+                    m = p.p41_1.findall(line)
                     multicast_groups.extend(m)
                     continue
                 else:
@@ -2417,50 +2512,35 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         = sorted(interface_dict[interface]['multicast_groups'])
                     read_multicast_reserved_lines = False
 
-            # Outgoing Common access list is not set
-            p7 = re.compile(r'^Outgoing +Common +access +list +is +'
-                            r'(?P<access_list>.+)$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['outbound_common_access_list'] = \
                         m.groupdict()['access_list']
                 continue
 
-            # Outgoing access list is not set
-            p8 = re.compile(r'^Outgoing +access +list +is +'
-                            r'(?P<access_list>.+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['outbound_access_list'] = \
                         m.groupdict()['access_list']
                 continue
 
-            # Inbound Common access list is not set
-            p9 = re.compile(r'^Inbound +Common +access +list +is +'
-                            r'(?P<access_list>.+)$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['inbound_common_access_list'] = \
                         m.groupdict()['access_list']
                 continue
 
-            # Inbound  access list is not set
-            p10 = re.compile(r'^Inbound +access +list +is +'
-                            r'(?P<access_list>.+)$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 if 'not set' not in m.groupdict()['access_list']:
                     interface_dict[interface]['inbound_access_list'] = \
                         m.groupdict()['access_list']
                 continue
 
-            # Proxy ARP is enabled
-            p11 = re.compile(r'^Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['proxy_arp'] = False
@@ -2468,10 +2548,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['proxy_arp'] = True
                 continue
 
-            # Local Proxy ARP is disabled
-            p12 = re.compile(r'^Local +Proxy +ARP +is +'
-                            r'(?P<status>\w+)$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['local_proxy_arp'] = False
@@ -2479,18 +2556,12 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['local_proxy_arp'] = True
                 continue
 
-            # Security level is default
-            p13 = re.compile(r'^Security +level +is +'
-                            r'(?P<level>\w+)$')
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 interface_dict[interface]['security_level'] = m.groupdict()['level']
                 continue
 
-            # Split horizon is enabled
-            p14 = re.compile(r'^Split +horizon +is +'
-                            r'(?P<status>\w+)$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['split_horizon'] = False
@@ -2498,10 +2569,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['split_horizon'] = True
                 continue
 
-            # ICMP redirects are always sent
-            p15 = re.compile(r'^ICMP +redirects +are +'
-                            r'(?P<sent>[\w\s]+)$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2510,10 +2578,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['sent']
                 continue
 
-            # ICMP unreachables are always sent
-            p16 = re.compile(r'^ICMP +unreachables +are +'
-                             r'(?P<sent>[\w\s]+)$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2522,10 +2587,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['sent']
                 continue
 
-            # ICMP mask replies are never sent
-            p17 = re.compile(r'^ICMP +mask +replies +are +'
-                             r'(?P<sent>[\w\s]+)$')
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if 'icmp' not in interface_dict[interface]:
                     interface_dict[interface]['icmp'] = {}
@@ -2534,10 +2596,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         m.groupdict()['sent']
                 continue
 
-            # IP fast switching is enabled
-            p18 = re.compile(r'^IP +fast +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_fast_switching'] = False
@@ -2545,10 +2604,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_fast_switching'] = True
                 continue
 
-            # IP Flow switching is disabled
-            p19 = re.compile(r'^IP +Flow +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_flow_switching'] = False
@@ -2556,10 +2612,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_flow_switching'] = True
                 continue
 
-            # IP CEF switching is enabled
-            p20 = re.compile(r'^IP +CEF +switching +is +'
-                             r'(?P<status>\w+)$')
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_cef_switching'] = False
@@ -2567,39 +2620,28 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_cef_switching'] = True
                 continue
 
-            # IP CEF switching turbo vector
-            p21 = re.compile(r'^IP +CEF +switching +turbo +vector$')
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 interface_dict[interface]['ip_cef_switching_turbo_vector'] = True
                 continue
 
-            # IP Null turbo vector
-            p22 = re.compile(r'^IP +Null +turbo +vector$')
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 interface_dict[interface]['ip_null_turbo_vector'] = True
                 continue
 
-            # VPN Routing/Forwarding "Mgmt-vrf"
-            p23 = re.compile(r'^VPN +Routing\/Forwarding +\"(?P<vrf>[\w\-]+)\"$')
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 interface_dict[interface]['vrf'] = m.groupdict()['vrf']
                 continue
 
-            # Associated unicast routing topologies:
-            #     Topology "base", operation state is UP
-            p24 = re.compile(r'^Associated +unicast +routing +topologies:$')
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 if 'unicast_routing_topologies' not in interface_dict[interface]:
                     interface_dict[interface]['unicast_routing_topologies'] = {}
                 continue
 
-            p24_1 = re.compile(r'^Topology +\"(?P<topo>\w+)\", +'
-                            r'operation +state +is +(?P<topo_status>\w+)$')
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 if 'unicast_routing_topologies' in interface_dict[interface]:
                     if 'topology' not in interface_dict[interface]\
@@ -2636,19 +2678,14 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_multicast_distributed_fast_switching'] = True
                 continue
 
-            # IP route-cache flags are Fast, CEF
-            p26 = re.compile(r'^IP +route\-cache +flags +are +(?P<flags>[\w\s\,]+)$')
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 ret = m.groupdict()['flags'].split(',')
                 ret = [i.strip() for i in ret]
                 interface_dict[interface]['ip_route_cache_flags'] = sorted(ret)
                 continue
 
-            # Router Discovery is disabled
-            p27 = re.compile(r'^Router +Discovery +is +'
-                             r'(?P<status>\w+)$')
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['router_discovery'] = False
@@ -2656,10 +2693,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['router_discovery'] = True
                 continue
 
-            # IP output packet accounting is disabled
-            p28 = re.compile(r'^IP +output +packet +accounting +is +'
-                             r'(?P<status>\w+)$')
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_output_packet_accounting'] = False
@@ -2667,10 +2701,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_output_packet_accounting'] = True
                 continue
 
-            # IP access violation accounting is disabled
-            p29 = re.compile(r'^IP +access +violation +accounting +is +'
-                             r'(?P<status>\w+)$')
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['ip_access_violation_accounting'] = False
@@ -2678,10 +2709,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['ip_access_violation_accounting'] = True
                 continue
 
-            # TCP/IP header compression is disabled
-            p30 = re.compile(r'^TCP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['tcp_ip_header_compression'] = False
@@ -2689,10 +2717,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['tcp_ip_header_compression'] = True
                 continue
 
-            # RTP/IP header compression is disabled
-            p31 = re.compile(r'^RTP\/IP +header +compression +is +'
-                             r'(?P<status>\w+)$')
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['rtp_ip_header_compression'] = False
@@ -2700,10 +2725,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['rtp_ip_header_compression'] = True
                 continue
 
-            # Probe proxy name replies are disabled
-            p32 = re.compile(r'^Probe +proxy +name +replies +are +'
-                             r'(?P<status>\w+)$')
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['probe_proxy_name_replies'] = False
@@ -2711,10 +2733,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['probe_proxy_name_replies'] = True
                 continue
 
-            # Policy routing is disabled
-            p33 = re.compile(r'^Policy +routing +is +'
-                             r'(?P<status>\w+)$')
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['policy_routing'] = False
@@ -2722,10 +2741,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['policy_routing'] = True
                 continue
 
-            # Network address translation is disabled
-            p34 = re.compile(r'^Network +address +translation +is +'
-                             r'(?P<status>\w+)$')
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['network_address_translation'] = False
@@ -2733,10 +2749,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['network_address_translation'] = True
                 continue
 
-            # BGP Policy Mapping is disabled
-            p35 = re.compile(r'^BGP +Policy +Mapping +is +'
-                             r'(?P<status>\w+)$')
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 if 'disabled' in m.groupdict()['status']:
                     interface_dict[interface]['bgp_policy_mapping'] = False
@@ -2754,9 +2767,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                 interface_dict[interface]['input_features'] = sorted(features)
                 continue
 
-            # IPv4 WCCP Redirect outbound is disable
-            p37 = re.compile(r'^IPv4 +WCCP +Redirect +outbound +is +(?P<status>\w+)$')
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2768,9 +2779,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                         ['redirect_outbound'] = True
                 continue
 
-            # IPv4 WCCP Redirect inbound is disabled
-            p38 = re.compile(r'^IPv4 +WCCP +Redirect +inbound +is +(?P<status>\w+)$')
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2781,9 +2790,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['wccp']\
                         ['redirect_inbound'] = True
 
-            # IPv4 WCCP Redirect exclude is disabled
-            p39 = re.compile(r'^IPv4 +WCCP +Redirect +exclude +is +(?P<status>\w+)$')
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 if 'wccp' not in interface_dict[interface]:
                     interface_dict[interface]['wccp'] = {}
@@ -2794,11 +2801,7 @@ class ShowIpInterface(ShowIpInterfaceSchema):
                     interface_dict[interface]['wccp']\
                         ['redirect_exclude'] = True
 
-            # Interface is unnumbered. Using address of Loopback11 (192.168.151.1)
-            p40 = re.compile(r'^Interface +is +unnumbered. +Using +address +of +'
-                             r'(?P<unnumbered_intf>[\w\/\-\.]+) +'
-                             r'\((?P<unnumbered_ip>[\w\.\:]+)\)$')
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 unnumbered_dict[interface] = {}
                 unnumbered_intf = m.groupdict()['unnumbered_intf']
@@ -2887,6 +2890,108 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
     """Parser for show ipv6 interface"""
     cli_command = ['show ipv6 interface {interface}','show ipv6 interface']
 
+    patterns = Patterns(
+        # Vlan211 is up, line protocol is up
+        # GigabitEthernet1/0/1 is administratively down, line protocol is down
+        p1=r'^(?P<interface>[\w\/\.\-\:]+) +is'
+           r' +(?P<enabled>[\w\s]+),'
+           r' +line +protocol +is +(?P<oper_status>\w+)$',
+
+        # IPv6 is enabled, link-local address is FE80::257:D2FF:FE28:
+        # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [TEN]
+        # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [UNA/TEN]
+        p2=r'^IPv6 +is +(?P<status>\w+), +'
+            'link-local +address +is +(?P<link_local>[\w\:]+)'
+            '( *\[(?P<type>[\w\/]+)\])?$',
+
+        # No Virtual link-local address(es):
+        # Virtual link-local address(es):
+        # FE80::5:73FF:FEA0:16 [UNA/OOD]
+        p21=r'^Virtual +link\-local +address\(es\)\:$',
+        p21_1=r'^(?P<ipv6>[\w\:]+)'
+               '( *\[(?P<type>[\w\/]+)\])?$',
+
+        # Stateless address autoconfig enabled
+        p3=r'^Stateless +address +autoconfig +enabled$',
+
+        # Global unicast address(es):
+        #   2001:10::14:1, subnet is 2001:10::14:0/112
+        #   2001:DB8:3:3::3, subnet is 2001:DB8:3:3::/64 [ANY/TEN]
+        p4=r'^Global +unicast +address\(es\):$',
+        p4_1=r'^(?P<ipv6>[\w\:]+), +subnet +is +(?P<dum1>(?P<dum2>[\w\:]+)'
+              '\/(?P<prefix_length>[0-9]+))'
+              '( *\[(?P<type>[\w\/]+)\])?$',
+
+        #     valid lifetime 2591911 preferred lifetime 604711
+        p4_2=r'^valid +lifetime +(?P<valid>\d+) +'
+              'preferred +lifetime +(?P<preferred>\d+)$',
+
+        # Joined group address(es):
+        #   FF02::1
+        #   FF02::1:FF14:1
+        #   FF02::1:FF28:1A71
+        p5=r'^Joined +group +address\(es\):$',
+        p5_1=r'^(?P<address>[\w\:]+)$',
+
+        # ICMP error messages limited to one every 100 milliseconds
+        p7=r'^ICMP +error +messages +limited +to +one +'
+            'every +(?P<limited>\d+) +milliseconds$',
+
+        # ICMP redirects are enabled
+        p8=r'^ICMP +redirects +are +(?P<status>\w+)$',
+
+        # ICMP unreachables are sent
+        p9=r'^ICMP +unreachables +are +(?P<status>[\w\s]+)$',
+
+        # ND DAD is enabled, number of DAD attempts: 1
+        p10=r'^ND +DAD +is +(?P<status>\w+), +'
+             'number +of +DAD +attempts: +(?P<attempts>\d+)$',
+
+        # ND reachable time is 30000 milliseconds (using 30000)
+        p11=r'^ND +reachable +time +is (?P<time>\d+) +milliseconds'
+             ' +\(using +(?P<use>\d+)\)$',
+
+        # ND NS retransmit interval is 1000 milliseconds
+        p12=r'^ND +NS +retransmit +interval +is'
+             ' +(?P<interval>\d+) +milliseconds$',
+
+        # ND advertised reachable time is 0 (unspecified)
+        p13=r'^ND +advertised +reachable +time +is +(?P<time>\d+)'
+             ' +\((?P<dummy>\S+)\)$',
+
+        # ND advertised retransmit interval is 0 (unspecified)
+        p14=r'^ND +advertised +retransmit +interval +is +(?P<time>\d+)'
+             ' +\((?P<dummy>\S+)\)$',
+
+        # ND router advertisements are sent every 200 seconds
+        p15=r'^ND +router +advertisements +are +sent +'
+             'every +(?P<time>\d+) +seconds$',
+
+        # ND router advertisements live for 1800 seconds
+        p16=r'^ND +router +advertisements +live +for +'
+             '(?P<time>\d+) +seconds$',
+
+        # ND advertised default router preference is Medium
+        p17=r'^ND +advertised +default +router +preference +'
+             'is +(?P<prefer>\w+)$',
+
+        # ND RAs are suppressed (periodic)
+        p17_1=r'^ND +RAs +are +suppressed.*$',
+
+        # Hosts use stateless autoconfig for addresses.
+        p18=r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +for +addresses.$',
+
+        # Hosts use DHCP to obtain routable addresses.
+        p18_1=r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +to +obtain +routable +addresses.$',
+
+        # Interface is unnumbered. Using address of Loopback0
+        p19=r'^Interface +is +unnumbered. +Using +address +of'
+             ' +(?P<unnumbered_intf>[\w\/\.]+)$',
+
+        # No global unicast address is configured
+        p20=r'^No +global +unicast +address +is +configured$',
+    )
+
     def cli(self, interface='',output=None):
         if output is None:
             if not interface:
@@ -2904,15 +3009,13 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
         status_code = {'ten': 'tentative',
                        'dep': 'duplicate',
                        'pre': 'preferre'}
+
+        p = ShowIpv6Interface.patterns
+
         for line in out.splitlines():
             line = line.strip()
 
-            # Vlan211 is up, line protocol is up
-            # GigabitEthernet1/0/1 is administratively down, line protocol is down
-            p1 =  re.compile(r'^(?P<interface>[\w\/\.\-\:]+) +is'
-                             r' +(?P<enabled>[\w\s]+),'
-                             r' +line +protocol +is +(?P<oper_status>\w+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 intf = m.groupdict()['interface']
                 enabled = m.groupdict()['enabled'].lower()
@@ -2930,13 +3033,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 joined_group = []
                 continue
 
-            # IPv6 is enabled, link-local address is FE80::257:D2FF:FE28:
-            # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [TEN]
-            # IPv6 is tentative, link-local address is FE80::257:D2FF:FEFF:428C [UNA/TEN]
-            p2 = re.compile(r'^IPv6 +is +(?P<status>\w+), +'
-                             'link-local +address +is +(?P<link_local>[\w\:]+)'
-                             '( *\[(?P<type>[\w\/]+)\])?$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 status = m.groupdict()['status']
                 link_addr = m.groupdict()['link_local']
@@ -2958,18 +3055,12 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     ret_dict[intf]['ipv6'][link_addr]['status'] = 'valid'
                 continue
 
-            # No Virtual link-local address(es):
-            # Virtual link-local address(es):
-            # FE80::5:73FF:FEA0:16 [UNA/OOD]
-            p21 = re.compile(r'^Virtual +link\-local +address\(es\)\:$')
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 ipv6 = True
                 continue
 
-            p21_1 = re.compile(r'^(?P<ipv6>[\w\:]+)'
-                                '( *\[(?P<type>[\w\/]+)\])?$')
-            m = p21_1.match(line)
+            m = p.p21_1.match(line)
             if m and ipv6:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -2992,26 +3083,17 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                             ret_dict[intf]['ipv6'][address]['status'] = 'valid'
                 continue
 
-            # Stateless address autoconfig enabled
-            p3 = re.compile(r'^Stateless +address +autoconfig +enabled$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict[intf]['autoconf'] = True
                 continue
 
-            # Global unicast address(es):
-            #   2001:10::14:1, subnet is 2001:10::14:0/112
-            #   2001:DB8:3:3::3, subnet is 2001:DB8:3:3::/64 [ANY/TEN]
-            p4 = re.compile(r'^Global +unicast +address\(es\):$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ipv6 = True
                 continue
 
-            p4_1 = re.compile(r'^(?P<ipv6>[\w\:]+), +subnet +is +(?P<dum1>(?P<dum2>[\w\:]+)'
-                               '\/(?P<prefix_length>[0-9]+))'
-                               '( *\[(?P<type>[\w\/]+)\])?$')
-            m = p4_1.match(line)
+            m = p.p4_1.match(line)
             if m and ipv6:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -3050,10 +3132,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                             ret_dict[intf]['ipv6'][address]['status'] = 'valid'
                 continue
 
-            #     valid lifetime 2591911 preferred lifetime 604711
-            p4_2 = re.compile(r'^valid +lifetime +(?P<valid>\d+) +'
-                               'preferred +lifetime +(?P<preferred>\d+)$')
-            m = p4_2.match(line)
+            m = p.p4_2.match(line)
             if m and ipv6:
                 try:
                     address
@@ -3068,18 +3147,12 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                         ['preferred_lifetime'] = int(m.groupdict()['preferred'])
                 continue
 
-            # Joined group address(es):
-            #   FF02::1
-            #   FF02::1:FF14:1
-            #   FF02::1:FF28:1A71
-            p5 = re.compile(r'^Joined +group +address\(es\):$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ipv6 = False
                 continue
 
-            p5_1 = re.compile(r'^(?P<address>[\w\:]+)$')
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m and not ipv6:
                 joined_group.append(m.groupdict()['address'])
                 ret_dict[intf]['joined_group_addresses'] = sorted(joined_group)
@@ -3099,10 +3172,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 ret_dict[intf]['vrf'] = m.groupdict()['vrf']
                 continue
 
-            # ICMP error messages limited to one every 100 milliseconds
-            p7 = re.compile(r'^ICMP +error +messages +limited +to +one +'
-                             'every +(?P<limited>\d+) +milliseconds$')
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -3112,9 +3182,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     int(m.groupdict()['limited'])
                 continue
 
-            # ICMP redirects are enabled
-            p8 = re.compile(r'^ICMP +redirects +are +(?P<status>\w+)$')
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -3126,9 +3194,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     ret_dict[intf]['ipv6']['icmp']['redirects'] = False
                 continue
 
-            # ICMP unreachables are sent
-            p9 = re.compile(r'^ICMP +unreachables +are +(?P<status>[\w\s]+)$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -3138,10 +3204,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     ret_dict[intf]['ipv6']['icmp']['unreachables'] = m.groupdict()['status']
                 continue
 
-            # ND DAD is enabled, number of DAD attempts: 1
-            p10 = re.compile(r'^ND +DAD +is +(?P<status>\w+), +'
-                              'number +of +DAD +attempts: +(?P<attempts>\d+)$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -3154,10 +3217,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 nd_dict['dad_attempts'] = int(m.groupdict()['attempts'])
                 continue
 
-            # ND reachable time is 30000 milliseconds (using 30000)
-            p11 = re.compile(r'^ND +reachable +time +is (?P<time>\d+) +milliseconds'
-                              ' +\(using +(?P<use>\d+)\)$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -3165,20 +3225,14 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                 nd_dict['using_time'] = int(m.groupdict()['use'])
                 continue
 
-            # ND NS retransmit interval is 1000 milliseconds
-            p12 = re.compile(r'^ND +NS +retransmit +interval +is'
-                              ' +(?P<interval>\d+) +milliseconds$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
                 nd_dict['ns_retransmit_interval'] = int(m.groupdict()['interval'])
                 continue
 
-            # ND advertised reachable time is 0 (unspecified)
-            p13 = re.compile(r'^ND +advertised +reachable +time +is +(?P<time>\d+)'
-                              ' +\((?P<dummy>\S+)\)$')
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -3189,10 +3243,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     nd_dict['advertised_reachable_time_unspecified'] = False
                 continue
 
-            # ND advertised retransmit interval is 0 (unspecified)
-            p14 = re.compile(r'^ND +advertised +retransmit +interval +is +(?P<time>\d+)'
-                              ' +\((?P<dummy>\S+)\)$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
@@ -3203,64 +3254,46 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     nd_dict['advertised_retransmit_interval_unspecified'] = False
                 continue
 
-            # ND router advertisements are sent every 200 seconds
-            p15 = re.compile(r'^ND +router +advertisements +are +sent +'
-                              'every +(?P<time>\d+) +seconds$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
                 nd_dict['router_advertisements_interval'] = int(m.groupdict()['time'])
                 continue
 
-            # ND router advertisements live for 1800 seconds
-            p16 = re.compile(r'^ND +router +advertisements +live +for +'
-                              '(?P<time>\d+) +seconds$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
                 nd_dict['router_advertisements_live'] = int(m.groupdict()['time'])
                 continue
 
-            # ND advertised default router preference is Medium
-            p17 = re.compile(r'^ND +advertised +default +router +preference +'
-                              'is +(?P<prefer>\w+)$')
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.setdefault('suppress', False)
                 nd_dict['advertised_default_router_preference'] = m.groupdict()['prefer']
                 continue
 
-            # ND RAs are suppressed (periodic)
-            p17_1 = re.compile(r'^ND +RAs +are +suppressed.*$')
-            m = p17_1.match(line)
+            m = p.p17_1.match(line)
             if m:
                 nd_dict = ret_dict.setdefault(intf, {}).setdefault('ipv6', {}).setdefault('nd', {})
                 nd_dict.update({'suppress': True})
                 continue
 
-            # Hosts use stateless autoconfig for addresses.
-            p18 = re.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +for +addresses.$')
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 ret_dict[intf]['addresses_config_method'] = \
                     m.groupdict()['addr_conf_method']
                 continue
             
-            # Hosts use DHCP to obtain routable addresses.
-            p18_1 = re.compile(r'^Hosts +use +(?P<addr_conf_method>[\w\s]+) +to +obtain +routable +addresses.$')
-            m = p18_1.match(line)
+            m = p.p18_1.match(line)
             if m:
                 ret_dict[intf]['addresses_config_method'] = \
                     m.groupdict()['addr_conf_method']
                 continue
 
-            # Interface is unnumbered. Using address of Loopback0
-            p19 = re.compile(r'^Interface +is +unnumbered. +Using +address +of'
-                              ' +(?P<unnumbered_intf>[\w\/\.]+)$')
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -3270,9 +3303,7 @@ class ShowIpv6Interface(ShowIpv6InterfaceSchema):
                     Common.convert_intf_name(m.groupdict()['unnumbered_intf'])
                 continue
 
-            # No global unicast address is configured
-            p20 = re.compile(r'^No +global +unicast +address +is +configured$')
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 if 'ipv6' not in ret_dict[intf]:
                     ret_dict[intf]['ipv6'] = {}
@@ -3304,19 +3335,24 @@ class ShowInterfacesTrunk(ShowInterfacesTrunkSchema):
     """parser for show interfaces trunk"""
     cli_command = 'show interfaces trunk'
 
+    patterns = Patterns(
+        # initial regexp pattern
+        p1=r'^(?P<name>[\w\-\/\.]+) +(?P<mode>\w+) +(?P<encapsulation>\S+) +'
+            '(?P<status>\w+) +(?P<native_vlan>\d+)$',
+        p2='^Port +Vlans +allowed +on +trunk$',
+        p3='^Port +Vlans +allowed +and +active +in +management +domain$',
+        p4='^Port +Vlans +in +spanning +tree +forwarding +state +and +not +pruned$',
+        p5='^(?P<name>[\w\-\/\.]+) +(?P<vlans>none\s*|[\d\-\,\s]+)$',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        # initial regexp pattern
-        p1 = re.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<mode>\w+) +(?P<encapsulation>\S+) +'
-                         '(?P<status>\w+) +(?P<native_vlan>\d+)$')
-        p2 = re.compile('^Port +Vlans +allowed +on +trunk$')
-        p3 = re.compile('^Port +Vlans +allowed +and +active +in +management +domain$')
-        p4 = re.compile('^Port +Vlans +in +spanning +tree +forwarding +state +and +not +pruned$')
-        p5 = re.compile('^(?P<name>[\w\-\/\.]+) +(?P<vlans>none\s*|[\d\-\,\s]+)$')
+        p = ShowInterfacesTrunk.patterns
+
         # initial variables
         ret_dict = {}
         vlan_list_type = None
@@ -3329,7 +3365,7 @@ class ShowInterfacesTrunk(ShowInterfacesTrunkSchema):
             # Gi1/0/23    on               isl            trunking      1
             # Gi1/0/24    on               802.1q         trunking      1
             # Po12        auto             n-802.1q       trunking      1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 intf = Common.convert_intf_name(group.pop('name'))
@@ -3339,22 +3375,22 @@ class ShowInterfacesTrunk(ShowInterfacesTrunkSchema):
                 continue
 
             # Port        Vlans allowed on trunk
-            if p2.match(line):
+            if p.p2.match(line):
                 vlan_list_type = 'vlans_allowed_on_trunk'
                 continue
 
             # Port        Vlans allowed and active in management domain
-            if p3.match(line):
+            if p.p3.match(line):
                 vlan_list_type = 'vlans_allowed_active_in_mgmt_domain'
                 continue
 
             # Port        Vlans in spanning tree forwarding state and not pruned
-            if p4.match(line):
+            if p.p4.match(line):
                 vlan_list_type = 'vlans_in_stp_forwarding_not_pruned'
                 continue
 
             # Gi1/0/4     200-211
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 intf = Common.convert_intf_name(group['name'])
@@ -3386,17 +3422,21 @@ class ShowInterfacesCounters(ShowInterfacesCountersSchema):
 
     cli_command = 'show interfaces {interface} counters'
 
+    patterns = Patterns(
+        # initial regexp pattern
+        p1=r'^(?P<name>[\w\-\/\.]+) +(?P<octets>\d+) +(?P<ucast_pkts>\d+) +'
+            '(?P<mcast_pkts>\d+) +(?P<bcast_pkts>\d+)$',
+        p2=r'Port +InOctets +InUcastPkts +InMcastPkts +InBcastPkts',
+        p2_1=r'Port +OutOctets +OutUcastPkts +OutMcastPkts +OutBcastPkts',
+    )
+
     def cli(self, interface,output=None):
         if output is None:
             out = self.device.execute(self.cli_command.format(interface=interface))
         else:
             out = output
 
-        # initial regexp pattern
-        p1 = re.compile(r'^(?P<name>[\w\-\/\.]+) +(?P<octets>\d+) +(?P<ucast_pkts>\d+) +'
-                         '(?P<mcast_pkts>\d+) +(?P<bcast_pkts>\d+)$')
-        p2 = re.compile(r'Port +InOctets +InUcastPkts +InMcastPkts +InBcastPkts')
-        p2_1 = re.compile(r'Port +OutOctets +OutUcastPkts +OutMcastPkts +OutBcastPkts')
+        p = ShowInterfacesCounters.patterns
 
         # initial variables
         ret_dict = {}
@@ -3405,16 +3445,16 @@ class ShowInterfacesCounters(ShowInterfacesCountersSchema):
             line = line.strip()
 
             # decide the in or out packets
-            if p2.match(line):
+            if p.p2.match(line):
                 in_out = 'in'
                 continue
 
-            if p2_1.match(line):
+            if p.p2_1.match(line):
                 in_out = 'out'
                 continue
 
             # Gi1/0/4     on               802.1q         trunking      1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 intf = Common.convert_intf_name(group.pop('name'))
@@ -3469,43 +3509,40 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
         'txps'
     ]
 
-    def cli(self, interface=None, output=None):
-        if output is None:
-            if not interface:
-                cmd = self.cli_command[1]
-            else:
-                cmd = self.cli_command[0].format(interface=interface)
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # initial return disctionary
-        ret_dict = {}
-
+    patterns = Patterns(
         # initial regexp pattern
         # GigabitEthernet0/0/0/0
         # GigabitEthernet11 OOB Net
         # (need to exclude below line)
         # -------------------------------------------------------------------------------------------------------------------------
-        p1 = re.compile(
-            r'^(?!-)(?P<interface>[a-zA-Z\-\d\/\.]+)(?P<description>( (\S)+)*)$'
-        )
+        p1=r'^(?!-)(?P<interface>[a-zA-Z\-\d\/\.]+)(?P<description>( (\S)+)*)$',
 
         # Tunnel0 Pim Register Tunnel (Encap) for RP 10.186.1.1
-        p1_1 = re.compile(
-            r'^(?P<interface>Tunnel\d+) +Pim +Register +Tunnel +\(Encap\) +for +RP +(?P<rp>[\w\.]+)$'
-        )
+        p1_1=r'^(?P<interface>Tunnel\d+) +Pim +Register +Tunnel +\(Encap\) +for +RP +(?P<rp>[\w\.]+)$',
 
         #   IPV4_UNICAST             9943           797492           50             3568
         #   DEC MOP          2        154          2        154
         #   Other           15          900          861       370708           0            0            0            0
-        p2 = re.compile(
-            r'^(?P<protocol>\S+(\s\S+)?)\s+(?P<pkts_in>\d+)\s+(?P<chars_in>\d+)\s+(?P<pkts_out>\d+)\s+(?P<chars_out>\d+)(\s+(?P<rxbs>\d+)\s+(?P<rxps>\d+)\s+(?P<txbs>\d+)\s+(?P<txps>\d+))?'
-        )
+        p2=r'^(?P<protocol>\S+(\s\S+)?)\s+(?P<pkts_in>\d+)\s+(?P<chars_in>\d+)\s+(?P<pkts_out>\d+)\s+(?P<chars_out>\d+)(\s+(?P<rxbs>\d+)\s+(?P<rxps>\d+)\s+(?P<txbs>\d+)\s+(?P<txps>\d+))?',
 
         # No traffic sent or received on this interface.
-        p3 = re.compile(
-            r'^No +traffic +sent +or +received +on +this +interface\.$')
+        p3=r'^No +traffic +sent +or +received +on +this +interface\.$',
+    )
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            if not interface:
+                cmd = self.cli_command[1]
+            else:
+                cmd = self.cli_command[0].format(interface=interface)
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # initial return disctionary
+        ret_dict = {}
+
+        p = ShowInterfacesAccounting.patterns
 
         for line in out.splitlines():
             if line:
@@ -3513,7 +3550,7 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
             else:
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 continue
 
@@ -3521,7 +3558,7 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
             # GigabitEthernet11 OOB Net
             # (need to exclude below line)
             # -------------------------------------------------------------------------------------------------------------------------
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 intf = m.groupdict()['interface']
                 description = m.groupdict()['description']
@@ -3530,7 +3567,7 @@ class ShowInterfacesAccounting(ShowInterfacesAccountingSchema):
             #   IPV4_UNICAST             9943           797492           50             3568
             #   DEC MOP          2        154          2        154
             #   Other           15          900          861       370708           0            0            0            0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 protocol_dict = m.groupdict()
                 protocol = protocol_dict.pop('protocol').lower().strip()
@@ -3576,6 +3613,16 @@ class ShowInterfacesLink(ShowInterfacesLinkSchema):
     cli_command = ['show interfaces link',
                    'show interfaces {interface} link']
 
+    patterns = Patterns(
+        # Port           Name               Down Time      Up Time
+        # Gi1/0/1        Foo                 00:00:00       4w5d
+        # Gi1/0/2        foo bar             00:07:00
+        p1=r'^(?P<interface>\S+)'
+           r'(?:(?P<name>.+?(?=(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))))?'
+           r'(?P<down_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))'
+           r'(?:\s+(?P<up_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2})))?$',
+    )
+
     def cli(self, interface=None, output=None):
         if output is None:
             if interface:
@@ -3587,19 +3634,12 @@ class ShowInterfacesLink(ShowInterfacesLinkSchema):
 
         result_dict = {}
 
-        # Port           Name               Down Time      Up Time
-        # Gi1/0/1        Foo                 00:00:00       4w5d
-        # Gi1/0/2        foo bar             00:07:00
-
-        p1 = re.compile(r'^(?P<interface>\S+)'
-                        r'(?:(?P<name>.+?(?=(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))))?'
-                        r'(?P<down_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2}))'
-                        r'(?:\s+(?P<up_time>(\d+[dw]\d+[dh])|(\d{2}:\d{2}:\d{2})))?$')
+        p = ShowInterfacesLink.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
 
             if m:
                 group = m.groupdict()
@@ -3655,6 +3695,16 @@ class ShowInterfacesStats(ShowInterfacesStatsSchema):
     cli_command = ['show interfaces stats' ,'show interfaces {interface} stats']
     exclude = ['chars_in' , 'chars_out', 'pkts_in', 'pkts_out']
 
+    patterns = Patterns(
+        # GigabitEthernet0/0/0
+        p1=r'^\s*(?P<interface>[\w./]+)$',
+
+        #    Switching path    Pkts In   Chars In   Pkts Out  Chars Out
+        #         Processor         33       2507         33       2490
+        p2=r'^\s*(?P<path>[\w\- ]*?) +(?P<pkts_in>[\d]+) +(?P<chars_in>[\d]+)'
+            ' +(?P<pkts_out>[\d]+) +(?P<chars_out>[\d]+)$',
+    )
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -3668,24 +3718,18 @@ class ShowInterfacesStats(ShowInterfacesStatsSchema):
         # initialize result dict
         result_dict = {}
 
-        # GigabitEthernet0/0/0
-        p1 = re.compile(r'^\s*(?P<interface>[\w./]+)$')
-
-        #    Switching path    Pkts In   Chars In   Pkts Out  Chars Out
-        #         Processor         33       2507         33       2490
-        p2 = re.compile(r'^\s*(?P<path>[\w\- ]*?) +(?P<pkts_in>[\d]+) +(?P<chars_in>[\d]+)'
-                        ' +(?P<pkts_out>[\d]+) +(?P<chars_out>[\d]+)$')
+        p = ShowInterfacesStats.patterns
 
         for line in out.splitlines():
             line = line.rstrip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 path_dict = result_dict.setdefault(interface, {}).setdefault('switching_path', {})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 path = group.pop('path').replace(" ", "_").replace("-", "_").lower()
@@ -3720,6 +3764,13 @@ class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
 
     cli_command = ['show interfaces description', 'show interfaces {interface} description']
 
+    patterns = Patterns(
+        #Interface                      Status         Protocol Description
+        #Gi0/0                          up             up
+        #Gi0/1                          admin down     down     to router2
+        p1=r'(?P<interface>(\S+)) +(?P<status>(\S+)([\s+](\S+))?) +(?P<protocol>(\S+))(?: +(?P<description>(.*)))?$',
+    )
+
     def cli(self, interface="", output=None):
         if output is None:
             if interface:
@@ -3733,17 +3784,14 @@ class ShowInterfacesDescription(ShowInterfacesDescriptionSchema):
         result_dict = {}
         index = 1
 
-        #Interface                      Status         Protocol Description
-        #Gi0/0                          up             up
-        #Gi0/1                          admin down     down     to router2
-        p1 = re.compile(r'(?P<interface>(\S+)) +(?P<status>(\S+)([\s+](\S+))?) +(?P<protocol>(\S+))(?: +(?P<description>(.*)))?$')
+        p = ShowInterfacesDescription.patterns
 
         for line in out.splitlines():
             line = line.strip()
             #Interface                      Status         Protocol Description
             #Gi0/0                          up             up
             #Gi0/1                          admin down     down     to router2
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m and m.groupdict()['protocol'] != 'Protocol':
                 group = m.groupdict()
                 interface = Common.convert_intf_name(group['interface'])
@@ -3795,16 +3843,7 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
     cli_command = ['show interfaces status',
                    'show interfaces {interface} status']
 
-    def cli(self, interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            output = self.device.execute(cmd)
-
-        result_dict = {}
-
+    patterns = Patterns(
         # Port      Name               Status       Vlan       Duplex  Speed Type
         # Gi1/2     TelenlqPOIU        notconnect   125          full    100 10/100/1000-TX
         # Gi1/3     SE                 connected    132        a-full a-1000 10/100/1000-TX
@@ -3815,15 +3854,27 @@ class ShowInterfacesStatus(ShowInterfacesStatusSchema):
         # Te2/1/20                     disabled     1            full   auto No XCVR
         # Te2/1/21  VSL LINK1          disabled     1            full   auto No XCVR
         # Po10      VSL LINK2          connected    trunk      a-full  a-10G
+        p1=r'^(?P<interfaces>\S+)(?:\s+(?P<name>([\S\s]+)))?'
+           r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
+           r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$',
+    )
+
+    def cli(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            output = self.device.execute(cmd)
+
+        result_dict = {}
 
-        p1 = re.compile(r'^(?P<interfaces>\S+)(?:\s+(?P<name>([\S\s]+)))?'
-                        r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
-                        r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
+        p = ShowInterfacesStatus.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
 
                 group = m.groupdict()
@@ -3876,6 +3927,12 @@ class ShowInterfacesStatusErrDisabled(ShowInterfacesStatusErrDisabledSchema):
 
     cli_command = 'show interfaces status err-disabled'
 
+    patterns = Patterns(
+        # Fi1/7/0/13     Hello World  err-disabled loopdetect
+        # Fi1/7/0/14                  err-disabled loopdetect
+        p1=r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<status>err-disabled)\s+(?P<reason>\S+)\s*(?P<err_disabled_vlans>.*)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -3884,14 +3941,12 @@ class ShowInterfacesStatusErrDisabled(ShowInterfacesStatusErrDisabledSchema):
 
         ret_dict = {}
 
-        # Fi1/7/0/13     Hello World  err-disabled loopdetect
-        # Fi1/7/0/14                  err-disabled loopdetect
-        p1= re.compile(r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<status>err-disabled)\s+(?P<reason>\S+)\s*(?P<err_disabled_vlans>.*)$')
+        p = ShowInterfacesStatusErrDisabled.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 intf_dict = ret_dict.setdefault('interfaces', {}).\
@@ -3970,29 +4025,33 @@ class ShowInterfacesTransceiverDetail(ShowInterfacesTransceiverDetailSchema):
     cli_command = ['show interfaces {interface} transceiver detail',
                    'show interfaces transceiver detail']
 
-    def cli(self, interface=None, output=None):
-        if output is None:
-            if interface:
-                out = self.device.execute(self.cli_command[0].format(interface=interface))
-            else:
-                out = self.device.execute(self.cli_command[1])
-        else:
-            out = output
-
+    patterns = Patterns(
         # transceiver is present
         # type is 10Gbase-LR
         # name is CISCO-FINISAR
         # part number is FTLX1474D3BCL-CS
-        p1 = re.compile(r'^(?P<key>[Tt]ransceiver|[Tt]ype|[Nn]ame|[Pp]art +[Nn]umber) +is +(?P<value>[\S\s]+)$')
+        p1=r'^(?P<key>[Tt]ransceiver|[Tt]ype|[Nn]ame|[Pp]art +[Nn]umber) +is +(?P<value>[\S\s]+)$',
 
         # Voltage            Threshold   Threshold  Threshold  Threshold
-        p3_0 = re.compile(r'(?P<statistic>(Temperature|Voltage|Current|Transmit Power|Receive Power)) +Threshold +Threshold +Threshold +Threshold$')
+        p3_0=r'(?P<statistic>(Temperature|Voltage|Current|Transmit Power|Receive Power)) +Threshold +Threshold +Threshold +Threshold$',
 
         # Twe2/1/1     25.5                   90.0       85.0       -5.0      -10.0
         # Twe2/1/1   N/A    5.7                 50.0       40.0        2.0        1.0
         # Twe2/1/1   N/A    N/A                 50.0       40.0        2.0        1.0
-        p3_1 = re.compile(r'^(?P<port>(\S+)) +(?P<lane>(\S+))? +(?P<value>(\S+)) '
-                          r'+(?P<HAT>(-?[\d\.]+)) +(?P<HWT>(-?[\d\.]+)) +(?P<LWT>(-?[\d\.]+)) +(?P<LAT>(-?[\d\.]+))$')
+        p3_1=r'^(?P<port>(\S+)) +(?P<lane>(\S+))? +(?P<value>(\S+)) '
+             r'+(?P<HAT>(-?[\d\.]+)) +(?P<HWT>(-?[\d\.]+)) +(?P<LWT>(-?[\d\.]+)) +(?P<LAT>(-?[\d\.]+))$',
+    )
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            if interface:
+                out = self.device.execute(self.cli_command[0].format(interface=interface))
+            else:
+                out = self.device.execute(self.cli_command[1])
+        else:
+            out = output
+
+        p = ShowInterfacesTransceiverDetail.patterns
 
         result_dict = {}
         is_dict = {}
@@ -4002,7 +4061,7 @@ class ShowInterfacesTransceiverDetail(ShowInterfacesTransceiverDetailSchema):
 
             # transceiver is present
             # type is 10Gbase-LR
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 key = group['key'].lower().replace('the', '').strip()
@@ -4011,7 +4070,7 @@ class ShowInterfacesTransceiverDetail(ShowInterfacesTransceiverDetailSchema):
                 is_dict[key] = value
                 continue
 
-            m = p3_0.match(line)
+            m = p.p3_0.match(line)
             if m:
                 stat = m.groupdict()['statistic']
                 if stat == 'Transmit Power':
@@ -4021,7 +4080,7 @@ class ShowInterfacesTransceiverDetail(ShowInterfacesTransceiverDetailSchema):
                 continue
 
             if stat:
-                m = p3_1.match(line)
+                m = p.p3_1.match(line)
                 if m:
                     interface = m.groupdict()['port']
                     interface = Common.convert_intf_name(interface)
@@ -4146,6 +4205,17 @@ class ShowMacroAutoInterface(ShowMacroAutoInterfaceSchema):
 
     cli_command = 'show macro auto interface'
 
+    patterns = Patterns(
+        # Auto Smart Ports Enabled
+        p1=r'^Auto Smart Ports+\s(?P<asp_status>\S+)',
+
+        # Fallback : CDP  Disabled
+        p2=r'Fallback :\s+(?P<type>\S+)\s+(?P<status>\S+)',
+
+        # Gi2/0/21      TRUE              None        CISCO_IPVSC_EVENT
+        p3=r'^(?P<interface>\S+\d+\/\d+\/\d+|\S+)\s+(?P<asp>\w+)\s\s+(?P<fallback>\w+)\s+(?P<macro>\S+|\S+(?:\s+)?\S+(?:\s+)?\S+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -4154,23 +4224,17 @@ class ShowMacroAutoInterface(ShowMacroAutoInterfaceSchema):
 
         ret_dict = {}
 
-        # Auto Smart Ports Enabled
-        p1 = re.compile(r'^Auto Smart Ports+\s(?P<asp_status>\S+)')
-        # Fallback : CDP  Disabled
-        p2 = re.compile(r'Fallback :\s+(?P<type>\S+)\s+(?P<status>\S+)')
-        # Gi2/0/21      TRUE              None        CISCO_IPVSC_EVENT
-        p3 = re.compile(
-            r'^(?P<interface>\S+\d+\/\d+\/\d+|\S+)\s+(?P<asp>\w+)\s\s+(?P<fallback>\w+)\s+(?P<macro>\S+|\S+(?:\s+)?\S+(?:\s+)?\S+)$')
+        p = ShowMacroAutoInterface.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['asp_status'] = group['asp_status']
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 fallback_dict = ret_dict.setdefault('fallback',{})
@@ -4178,7 +4242,7 @@ class ShowMacroAutoInterface(ShowMacroAutoInterfaceSchema):
                 fallback_dict['status'] = group['status']
 
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 interface = Common.convert_intf_name\
@@ -4211,14 +4275,18 @@ class ShowInterfaceSummaryVlan(ShowInterfaceSummaryVlanSchema):
 
     cli_command = 'show interface summary vlan'
 
+    patterns = Patterns(
+        #Total number of Vlan interfaces: 256
+        p1=r'Total\s+number\s+of\s+Vlan\s+interfaces:\s+(?P<total_number>\d+)',
+    )
+
     def cli(self, output=None):
         if output is None:
             output = self.device.execute(self.cli_command)
 
         ret_dict = {}
 
-        #Total number of Vlan interfaces: 256
-        p1 = re.compile(r'Total\s+number\s+of\s+Vlan\s+interfaces:\s+(?P<total_number>\d+)')
+        p = ShowInterfaceSummaryVlan.patterns
 
         #Vlan interfaces configured:
         #1,10-264
@@ -4227,7 +4295,7 @@ class ShowInterfaceSummaryVlan(ShowInterfaceSummaryVlanSchema):
         #p2 = re.compile(r'Vlan\s+interfaces\s+configured:\n(?P<vlan_int>\S+)')
         for line in output.splitlines():
             line = line.strip()
-            m1 = p1.match(line)
+            m1 = p.p1.match(line)
             if m1:
                 group = m1.groupdict()
                 ret_dict["Total_vlan_interface"] = int(group["total_number"])
@@ -4344,6 +4412,13 @@ class ShowInterfacesMtu(ShowInterfacesMtuSchema):
                    'show interfaces {interface} mtu',
                    'show interfaces mtu module {mod}']
 
+    patterns = Patterns(
+        #Port          Name                        MTU
+        #Fo1/0/1       Interface1                  1500
+        #Fo1/0/2       Interface2                  1500
+        p1=r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<mtu>\d+)$',
+    )
+
     def cli(self, interface=None, mod=None, output=None):
 
         if output is None:
@@ -4356,16 +4431,12 @@ class ShowInterfacesMtu(ShowInterfacesMtuSchema):
 
         result_dict = {}
 
-        #Port          Name                        MTU
-        #Fo1/0/1       Interface1                  1500
-        #Fo1/0/2       Interface2                  1500
-
-        p1 = re.compile(r'^(?P<interfaces>\S+)\s+(?P<name>.+?)?\s+(?P<mtu>\d+)$')
+        p = ShowInterfacesMtu.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
 
@@ -4413,25 +4484,28 @@ class ShowInterfacesStatusModule(ShowInterfacesStatusModuleSchema):
         'show interfaces status module {mod}'
     '''
     cli_command = ['show interfaces status module {mod}']
+    patterns = Patterns(
+        p0=r'(?P<var>%.*)',
+
+        # Port         Name               Status       Vlan       Duplex  Speed Type
+        # Hu1/0/1                         connected    1            full    40G QSFP 40G AOC5M
+        # Twe4/0/2                        connected    routed       full    10G SFP-10GBase-CX1
+        p1=r'^(?P<interfaces>\S+)(?:\s+(?P<name>(.+)))?'
+           r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
+           r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$',
+    )
+
     def cli(self, mod="", output = None):
 
         output = self.device.execute(self.cli_command[0].format(mod=mod))
 
         result_dict = {}
         
-        p0 = re.compile(r'(?P<var>%.*)')
-
-            # Port         Name               Status       Vlan       Duplex  Speed Type
-            # Hu1/0/1                         connected    1            full    40G QSFP 40G AOC5M 
-            # Twe4/0/2                        connected    routed       full    10G SFP-10GBase-CX1
-        p1 = re.compile(r'^(?P<interfaces>\S+)(?:\s+(?P<name>(.+)))?'
-                r'\s+(?P<status>(connected|notconnect|suspended|inactive|disabled|err-disabled|monitoring))'
-                r'\s+(?P<vlan>\S+)\s+(?P<duplex_code>[\S\-]+)\s+(?P<port_speed>[\S\-]+)(\s+(?P<type>.+))?$')
+        p = ShowInterfacesStatusModule.patterns
 
-        
         # %Module1 is not Present
         
-        m = p0.match(output)
+        m = p.p0.match(output)
         if m:
             
             var = m.groupdict()['var']
@@ -4444,7 +4518,7 @@ class ShowInterfacesStatusModule(ShowInterfacesStatusModuleSchema):
             # Port         Name               Status       Vlan       Duplex  Speed Type
             # Hu1/0/1                         connected    1            full    40G QSFP 40G AOC5M 
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
 
@@ -4494,25 +4568,30 @@ class ShowPmVpInterfaceVlan(ShowPmVpInterfaceVlanSchema):
 
     cli_command = 'show pm vp interface {interface} {vlan}'
 
+    patterns = Patterns(
+        # vp: 0x50823F64: 3/3(1001) es: 0, stp forwarding, link up, fwd yes
+        p1=r"^vp:\s+(?P<vp>\S+\s+\S+)\s+es:\s+(?P<es>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$",
+
+        # sm(pm_vp 3/3(1001)), running yes, state forwarding
+        p1_1=r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+(?P<running>\w+),\s+state\s+(?P<state>\w+)$",
+
+        # Last transition recorded: (linkup)-> authentication (linkup)-> authentication (authen_enable)-> authen_fail (authen_success)-> notforwarding (forward_notnotify)-> forwarding
+        p1_2=r"^Last\s+transition\s+recorded:\s+(?P<last_transition>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$",
+    )
+
     def cli(self, interface=None, vlan=None, output=None):
         if output is None:
             cmd = self.cli_command.format(interface=interface, vlan=vlan)
             output = self.device.execute(cmd)
 
-        # vp: 0x50823F64: 3/3(1001) es: 0, stp forwarding, link up, fwd yes
-        p1 = re.compile(r"^vp:\s+(?P<vp>\S+\s+\S+)\s+es:\s+(?P<es>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
-        # sm(pm_vp 3/3(1001)), running yes, state forwarding
-        p1_1 = re.compile(r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+(?P<running>\w+),\s+state\s+(?P<state>\w+)$")
-        # Last transition recorded: (linkup)-> authentication (linkup)-> authentication (authen_enable)-> authen_fail (authen_success)-> notforwarding (forward_notnotify)-> forwarding 
-        p1_2 = re.compile(r"^Last\s+transition\s+recorded:\s+(?P<last_transition>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
-
+        p = ShowPmVpInterfaceVlan.patterns
 
         ret_dict = {}
 
         for line in output.splitlines():
 
             # vp: 0x50823F64: 3/3(1001) es: 0, stp forwarding, link up, fwd yes
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_vp_info' not in ret_dict:
@@ -4522,7 +4601,7 @@ class ShowPmVpInterfaceVlan(ShowPmVpInterfaceVlanSchema):
                 continue
 
             # sm(pm_vp 3/3(1001)), running yes, state forwarding
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_vp_info' not in ret_dict:
@@ -4533,7 +4612,7 @@ class ShowPmVpInterfaceVlan(ShowPmVpInterfaceVlanSchema):
                 continue
 
             # Last transition recorded: (linkup)-> authentication (linkup)-> authentication (authen_enable)-> authen_fail (authen_success)-> notforwarding (forward_notnotify)-> forwarding 
-            m = p1_2.match(line)
+            m = p.p1_2.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_vp_info' not in ret_dict:
@@ -4570,6 +4649,16 @@ class ShowInterfacesTransceiverSupportedlist(ShowInterfacesTransceiverSupportedl
 
     cli_command = 'show interfaces transceiver supported-list'
 
+    patterns = Patterns(
+        #------------------       -------------------------
+        #p1 will match dashes pattern used to create dict that to start adiing the transceiver types
+        p1=r"\-+\s+\-+",
+
+        #   GLC-FE-100FX-RGD         ALL
+        #   GLC-SX-MM                NONE
+        p2=r"^(?P<transceiver>[\w-]+)\s+(?P<pin_version>(ALL|NONE))",
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -4579,25 +4668,19 @@ class ShowInterfacesTransceiverSupportedlist(ShowInterfacesTransceiverSupportedl
         
         transceivers_supported_list = {}
         
-        #------------------       ------------------------- 
-        #p1 will match dashes pattern used to create dict that to start adiing the transceiver types
-        p1 = re.compile(r"\-+\s+\-+")
-
-        #   GLC-FE-100FX-RGD         ALL
-        #   GLC-SX-MM                NONE
-        p2 = re.compile(r"^(?P<transceiver>[\w-]+)\s+(?P<pin_version>(ALL|NONE))")
+        p = ShowInterfacesTransceiverSupportedlist.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             #------------------       -------------------------
-            m1 = p1.match(line)
+            m1 = p.p1.match(line)
             if m1:
                 transceiver_dict = transceivers_supported_list.setdefault('transceiver_type',{})
 
             #   GLC-FE-100FX-RGD         ALL
             #   GLC-SX-MM                NONE
-            m2 = p2.match(line)
+            m2 = p.p2.match(line)
             if m2:
                 transceiver_dict.update({m2.groupdict()['transceiver'] :
                                         { "cisco_pin_min_version_supporting_dom" :
@@ -4705,125 +4788,163 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
 
     cli_command = 'show pm port interface {interface}'
 
-    def cli(self, interface=None, output=None):
-        if output is None:
-            cmd = self.cli_command.format(interface=interface)
-            output = self.device.execute(cmd)
+    patterns = Patterns(
+        # port 1/24  pd 0x7F837FEABD78 swidb 0x7F837EBFA020(switch)  sb 0x7F837EBFCA40
+        p1=r"^port\s+(?P<port>\S+)\s+pd\s+(?P<pd>\S+)\s+swidb\s+"
+            "(?P<sw_idb>\S+)\s+sb\s+(?P<sb>\S+)$",
 
-        # port 1/24  pd 0x7F837FEABD78 swidb 0x7F837EBFA020(switch)  sb 0x7F837EBFCA40 
-        p1 = re.compile(r"^port\s+(?P<port>\S+)\s+pd\s+(?P<pd>\S+)\s+swidb\s+"
-             "(?P<sw_idb>\S+)\s+sb\s+(?P<sb>\S+)$")
         #  hwidb 0x7F837EBF8C38
-        p1_1 = re.compile(r"^hwidb\s+(?P<hw_idb>\S+)$")
+        p1_1=r"^hwidb\s+(?P<hw_idb>\S+)$",
+
         # if_number = 32 hw_if_index = 31 snmp_if_index = 32(32) ptrunkgroup = 0(port)
-        p1_2 = re.compile(r"^if_number\s+=\s+(?P<if_num>\d+)\s+hw_if_index\s+="
-               "\s+(?P<hw_if_index>\d+)\s+snmp_if_index\s+=\s+(?P<snmp_if_index>\S+)"
-               "\s+ptrunkgroup\s+=\s+(?P<ptrunk_group>\S+)$")
+        p1_2=r"^if_number\s+=\s+(?P<if_num>\d+)\s+hw_if_index\s+="
+              "\s+(?P<hw_if_index>\d+)\s+snmp_if_index\s+=\s+(?P<snmp_if_index>\S+)"
+              "\s+ptrunkgroup\s+=\s+(?P<ptrunk_group>\S+)$",
+
         # admin up(up)  line up(up)  operErr none
-        p1_3 = re.compile(r"^admin\s+(?P<admin>\S+)\s+line\s+(?P<line>\S+)\s+"
-               "operErr\s+(?P<oper_err>\w+)$")
+        p1_3=r"^admin\s+(?P<admin>\S+)\s+line\s+(?P<line>\S+)\s+"
+              "operErr\s+(?P<oper_err>\w+)$",
+
         # port assigned mac address 683b.78f3.3118
-        p1_4 = re.compile(r"^port\s+assigned\s+mac\s+address\s+(?P<port_mac>\S+)$")
+        p1_4=r"^port\s+assigned\s+mac\s+address\s+(?P<port_mac>\S+)$",
+
         # idb port vlan id 1  default vlan id 1
-        p1_5 = re.compile(r"^idb\s+port\s+vlan\s+id\s+(?P<idb_port_vlan>\d+)\s+"
-               "default\s+vlan\s+id\s+(?P<def_vlan_id>\d+)$")
+        p1_5=r"^idb\s+port\s+vlan\s+id\s+(?P<idb_port_vlan>\d+)\s+"
+              "default\s+vlan\s+id\s+(?P<def_vlan_id>\d+)$",
+
         # internalVlan 0x0  remapVlan 0x0
-        p1_6 = re.compile(r"^internalVlan\s+(?P<internal_vlan>\S+)\s+remapVlan\s+0x0$")
+        p1_6=r"^internalVlan\s+(?P<internal_vlan>\S+)\s+remapVlan\s+0x0$",
+
         # dtp special no  pagp special no
-        p1_7 = re.compile(r"^dtp\s+special\s+(?P<dtp_special>\w+)\s+pagp\s+"
-               "special\s+(?P<pagp_special>\w+)$")
-        # speed: 100M   duplex: full   mode: access   encap: native 
-        p1_8 = re.compile(r"^speed:\s+(?P<speed>\S+)\s+duplex:\s+(?P<duplex>\w+)"
-               "\s+mode:\s+(?P<mode>\w+)\s+encap:\s+(?P<encap>\w+)$")
-        # dtp nonegotiate: FALSE 
-        p1_9 = re.compile(r"^dtp\s+nonegotiate:\s+(?P<dtp_nonego>\w+)$")
-        # flowcontrol receive: on   flowcontrol send: off 
-        p1_10 = re.compile(r"^flowcontrol\s+receive:\s+(?P<flow_ctrl_receive>\w+)"
-                "\s+flowcontrol\s+send:\s+(?P<flow_ctrl_send>\w+)$")
+        p1_7=r"^dtp\s+special\s+(?P<dtp_special>\w+)\s+pagp\s+"
+              "special\s+(?P<pagp_special>\w+)$",
+
+        # speed: 100M   duplex: full   mode: access   encap: native
+        p1_8=r"^speed:\s+(?P<speed>\S+)\s+duplex:\s+(?P<duplex>\w+)"
+              "\s+mode:\s+(?P<mode>\w+)\s+encap:\s+(?P<encap>\w+)$",
+
+        # dtp nonegotiate: FALSE
+        p1_9=r"^dtp\s+nonegotiate:\s+(?P<dtp_nonego>\w+)$",
+
+        # flowcontrol receive: on   flowcontrol send: off
+        p1_10=r"^flowcontrol\s+receive:\s+(?P<flow_ctrl_receive>\w+)"
+               "\s+flowcontrol\s+send:\s+(?P<flow_ctrl_send>\w+)$",
+
         # linkflapcnt: 0  dtpflapcnt: 0  pagpflapcnt: 0
-        p1_11 = re.compile(r"^linkflapcnt:\s+(?P<link_flap_cnt>\d+)\s+dtpflapcnt:"
-                "\s+(?P<dtp_flap_cnt>\d+)\s+pagpflapcnt:\s+(?P<pagp_flap_cnt>\d+)$")
-        # unidirectional: off 
-        p1_12 = re.compile(r"^unidirectional:\s+(?P<unidirectional>\w+)$")
-        # operVlan: 0 
-        p1_13 = re.compile(r"^operVlan:\s+(?P<oper_vlan>\d+)$")
-        # flag:     0 
-        p1_14 = re.compile(r"^flag:\s+(?P<flag>\d+)$")
+        p1_11=r"^linkflapcnt:\s+(?P<link_flap_cnt>\d+)\s+dtpflapcnt:"
+               "\s+(?P<dtp_flap_cnt>\d+)\s+pagpflapcnt:\s+(?P<pagp_flap_cnt>\d+)$",
+
+        # unidirectional: off
+        p1_12=r"^unidirectional:\s+(?P<unidirectional>\w+)$",
+
+        # operVlan: 0
+        p1_13=r"^operVlan:\s+(?P<oper_vlan>\d+)$",
+
+        # flag:     0
+        p1_14=r"^flag:\s+(?P<flag>\d+)$",
+
         # sm(pm_port 1/24), running yes, state access_multi
-        p1_15 = re.compile(r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+"
-                "(?P<running>\w+),\s+state\s+(?P<state>\S+)$")
-        # Last transition recorded: (cfg_access_vvlanid)-> pagp_port_cleanup (cfg_access_vvlanid)-> pagp (cfg_access_vvlanid)-> pre_pagp_may_suspend (cfg_access_vvlanid)-> pagp_may_suspend (pagp_continue)-> start_pagp (pagp_continue)-> pagp (dont_bundle)-> pre_post_pagp (dont_bundle)-> post_pagp (dtp_access_multi)-> access_multi (bulk_sync)-> access_multi 
-        p1_16 = re.compile(r"^Last\s+transition\s+recorded:\s+"
-                "(?P<last_transition>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+"
-                "\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+"
-                "\s+\S+\s+\S+)$")
+        p1_15=r"^sm\((?P<sm>\S+\s+\S+)\),\s+running\s+"
+               "(?P<running>\w+),\s+state\s+(?P<state>\S+)$",
+
+        # Last transition recorded: (cfg_access_vvlanid)-> pagp_port_cleanup (cfg_access_vvlanid)-> pagp (cfg_access_vvlanid)-> pre_pagp_may_suspend (cfg_access_vvlanid)-> pagp_may_suspend (pagp_continue)-> start_pagp (pagp_continue)-> pagp (dont_bundle)-> pre_post_pagp (dont_bundle)-> post_pagp (dtp_access_multi)-> access_multi (bulk_sync)-> access_multi
+        p1_16=r"^Last\s+transition\s+recorded:\s+"
+               "(?P<last_transition>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+"
+               "\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+"
+               "\s+\S+\s+\S+)$",
+
         # vp:  1 100
-        p1_17 = re.compile(r"^vp:\s+(?P<vp>\S+\s+\S+)$")
+        p1_17=r"^vp:\s+(?P<vp>\S+\s+\S+)$",
+
         # vlans:  1 100
-        p1_18 = re.compile(r"^vlans:\s+(?P<vlans>\S+\s+\S+)$")
+        p1_18=r"^vlans:\s+(?P<vlans>\S+\s+\S+)$",
+
         # trunkVlans:  1 100
-        p1_19 = re.compile(r"^trunkVlans:\s+(?P<trunk_vlans>\S+\s+\S+)$")
+        p1_19=r"^trunkVlans:\s+(?P<trunk_vlans>\S+\s+\S+)$",
+
         # fwdVlans:  100
-        p1_20 = re.compile(r"^fwdVlans:\s+(?P<fwd_vlans>\d+)$")
+        p1_20=r"^fwdVlans:\s+(?P<fwd_vlans>\d+)$",
+
         # currentlyPrunedVlans:  none
-        p1_21 = re.compile(r"^currentlyPrunedVlans:\s+(?P<current_pruned_vlans>\w+)$")
+        p1_21=r"^currentlyPrunedVlans:\s+(?P<current_pruned_vlans>\w+)$",
+
         # previouslyPrunedVlans:  none
-        p1_22 = re.compile(r"^previouslyPrunedVlans:\s+(?P<previous_pruned_vlans>\w+)$")
-        # protocols: ip=on ipx=on misc=on other=on 
-        p1_23 = re.compile(r"^protocols:\s+(?P<protocols>\S+\s+\S+\s+\S+\s+\S+)$")
-        # access mode: unknown   access vlanid: 1   native vlanid: 1 
-        p2 = re.compile(r"^access\s+mode:\s+(?P<access_mode>\w+)\s+"
-             "access\s+vlanid:\s+(?P<access_vlan_id>\d+)\s+native\s+vlanid:\s+"
-             "(?P<native_vlan_id>\d+)$")
+        p1_22=r"^previouslyPrunedVlans:\s+(?P<previous_pruned_vlans>\w+)$",
+
+        # protocols: ip=on ipx=on misc=on other=on
+        p1_23=r"^protocols:\s+(?P<protocols>\S+\s+\S+\s+\S+\s+\S+)$",
+
+        # access mode: unknown   access vlanid: 1   native vlanid: 1
+        p2=r"^access\s+mode:\s+(?P<access_mode>\w+)\s+"
+            "access\s+vlanid:\s+(?P<access_vlan_id>\d+)\s+native\s+vlanid:\s+"
+            "(?P<native_vlan_id>\d+)$",
+
         # trunkVlans:  1-4094
-        p2_1 = re.compile(r"^trunkVlans:\s+(?P<trunk_vlans>\S+)$")
+        p2_1=r"^trunkVlans:\s+(?P<trunk_vlans>\S+)$",
+
         # pruneVlans:  2-1001primary host vlanid: 32767    secondary host vlanid: 32767
-        p2_2 = re.compile(r"^pruneVlans:\s+(?P<prune_vlans>\S+)primary\s+host\s+"
-               "vlanid:\s+(?P<primary_host_vlan>\d+)\s+secondary\s+host\s+"
-               "vlanid:\s+(?P<sec_host_vlan>\d+)$")
+        p2_2=r"^pruneVlans:\s+(?P<prune_vlans>\S+)primary\s+host\s+"
+              "vlanid:\s+(?P<primary_host_vlan>\d+)\s+secondary\s+host\s+"
+              "vlanid:\s+(?P<sec_host_vlan>\d+)$",
+
         # primary promiscuous vlanid: 32767
-        p2_3 = re.compile(r"^primary\s+promiscuous\s+vlanid:\s+"
-               "(?P<pri_promiscuous_vlan>\d+)$")
+        p2_3=r"^primary\s+promiscuous\s+vlanid:\s+"
+              "(?P<pri_promiscuous_vlan>\d+)$",
+
         # secondary prom vlans:  none
-        p2_4 = re.compile(r"^secondary\s+prom\s+vlans:\s+(?P<sec_prom_vlan>\w+)$")
-        # speed: auto speedauto: auto-default   duplex: auto   mode: access 
-        p2_5 = re.compile(r"^speed:\s+(?P<speed>\w+)\s+speedauto:\s+"
-               "(?P<speed_auto>\S+)\s+duplex:\s+(?P<duplex>\w+)\s+"
-               "mode:\s+(?P<mode>\w+)$")
-        # encap: dot1q   nonegotiate: false 
-        p2_6 = re.compile(r"^encap:\s+(?P<encap>\S+)\s+nonegotiate:\s+"
-               "(?P<nonego>\w+)$")
+        p2_4=r"^secondary\s+prom\s+vlans:\s+(?P<sec_prom_vlan>\w+)$",
+
+        # speed: auto speedauto: auto-default   duplex: auto   mode: access
+        p2_5=r"^speed:\s+(?P<speed>\w+)\s+speedauto:\s+"
+              "(?P<speed_auto>\S+)\s+duplex:\s+(?P<duplex>\w+)\s+"
+              "mode:\s+(?P<mode>\w+)$",
+
+        # encap: dot1q   nonegotiate: false
+        p2_6=r"^encap:\s+(?P<encap>\S+)\s+nonegotiate:\s+"
+              "(?P<nonego>\w+)$",
+
         # jumbo cap: true   jumbo: false  mtu: 1500  sync-delay: 210  HOL: Enable
-        p2_7 = re.compile(r"^jumbo\s+cap:\s+(?P<jumbo_cap>\w+)\s+jumbo:\s+"
-               "(?P<jumbo>\w+)\s+mtu:\s+(?P<mtu>\d+)\s+sync-delay:\s+"
-               "(?P<sync_delay>\d+)\s+HOL:\s+(?P<hol>\w+)$")
-        # bcast-supp-level: 10000   mcast-supp-level: 10000   ucast-supp-level: 10000 
-        p2_8 = re.compile(r"^bcast-supp-level:\s+(?P<bcast_sup_level>\d+)\s+"
-               "mcast-supp-level:\s+(?P<mcast_sup_level>\d+)\s+ucast-supp-level:"
-               "\s+(?P<ucast_sup_level>\d+)$")
-        # disl: off   dtp nonegotiate: FALSE   media: unknown   dualmode 0 
-        p2_9 = re.compile(r"^disl:\s+(?P<disl>\w+)\s+dtp\s+nonegotiate:\s+"
-               "(?P<dtp_nonego>\w+)\s+media:\s+(?P<media>\w+)\s+dualmode\s+"
-               "(?P<dualmode>\d+)$")
+        p2_7=r"^jumbo\s+cap:\s+(?P<jumbo_cap>\w+)\s+jumbo:\s+"
+              "(?P<jumbo>\w+)\s+mtu:\s+(?P<mtu>\d+)\s+sync-delay:\s+"
+              "(?P<sync_delay>\d+)\s+HOL:\s+(?P<hol>\w+)$",
+
+        # bcast-supp-level: 10000   mcast-supp-level: 10000   ucast-supp-level: 10000
+        p2_8=r"^bcast-supp-level:\s+(?P<bcast_sup_level>\d+)\s+"
+              "mcast-supp-level:\s+(?P<mcast_sup_level>\d+)\s+ucast-supp-level:"
+              "\s+(?P<ucast_sup_level>\d+)$",
+
+        # disl: off   dtp nonegotiate: FALSE   media: unknown   dualmode 0
+        p2_9=r"^disl:\s+(?P<disl>\w+)\s+dtp\s+nonegotiate:\s+"
+              "(?P<dtp_nonego>\w+)\s+media:\s+(?P<media>\w+)\s+dualmode\s+"
+              "(?P<dualmode>\d+)$",
+
         # tdr_ever_run: FALSE tdr_in_progress: FALSE tdr_result_valid: FALSE
-        p2_10 = re.compile(r"^tdr_ever_run:\s+(?P<tdr_ever_run>\w+)\s+"
-                "tdr_in_progress:\s+(?P<tdr_in_progress>\w+)\s+tdr_result_valid:"
-                "\s+(?P<tdr_result_valid>\w+)$")
+        p2_10=r"^tdr_ever_run:\s+(?P<tdr_ever_run>\w+)\s+"
+               "tdr_in_progress:\s+(?P<tdr_in_progress>\w+)\s+tdr_result_valid:"
+               "\s+(?P<tdr_result_valid>\w+)$",
+
         # tdr_err_code: 0, prbs_err_code: 0
-        p2_11 = re.compile(r"^tdr_err_code:\s+(?P<tdr_error_code>\d+),\s+"
-                "prbs_err_code:\s+(?P<prbs_err_code>\d+)$")
+        p2_11=r"^tdr_err_code:\s+(?P<tdr_error_code>\d+),\s+"
+               "prbs_err_code:\s+(?P<prbs_err_code>\d+)$",
+
         # PRBS: Stopped PRBS - port was admin down
-        p2_12 = re.compile(r"^PRBS:\s+(?P<prbs>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
-        
+        p2_12=r"^PRBS:\s+(?P<prbs>\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+\s+\S+)$",
+    )
+    dispatcher = LineDispatcher(patterns)
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            cmd = self.cli_command.format(interface=interface)
+            output = self.device.execute(cmd)
 
         ret_dict = {}
 
         for line in output.splitlines():
             line = line.strip()
+            name, m = ShowPmPortInterface.dispatcher.match(line)
 
             # port 1/24  pd 0x7F837FEABD78 swidb 0x7F837EBFA020(switch)  sb 0x7F837EBFCA40 
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4834,8 +4955,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             #  hwidb 0x7F837EBF8C38
-            m = p1_1.match(line)
-            if m:
+            if name == 'p1_1':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4843,8 +4963,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # if_number = 32 hw_if_index = 31 snmp_if_index = 32(32) ptrunkgroup = 0(port)
-            m = p1_2.match(line)
-            if m:
+            if name == 'p1_2':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4855,8 +4974,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # admin up(up)  line up(up)  operErr none
-            m = p1_3.match(line)
-            if m:
+            if name == 'p1_3':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4866,8 +4984,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # port assigned mac address 683b.78f3.3118
-            m = p1_4.match(line)
-            if m:
+            if name == 'p1_4':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4875,8 +4992,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # idb port vlan id 1  default vlan id 1
-            m = p1_5.match(line)
-            if m:
+            if name == 'p1_5':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4885,8 +5001,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # internalVlan 0x0  remapVlan 0x0
-            m = p1_6.match(line)
-            if m:
+            if name == 'p1_6':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4894,8 +5009,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # dtp special no  pagp special no
-            m = p1_7.match(line)
-            if m:
+            if name == 'p1_7':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4904,8 +5018,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # speed: 100M   duplex: full   mode: access   encap: native 
-            m = p1_8.match(line)
-            if m:
+            if name == 'p1_8':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4916,8 +5029,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # dtp nonegotiate: FALSE 
-            m = p1_9.match(line)
-            if m:
+            if name == 'p1_9':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4925,8 +5037,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # flowcontrol receive: on   flowcontrol send: off 
-            m = p1_10.match(line)
-            if m:
+            if name == 'p1_10':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4935,8 +5046,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # linkflapcnt: 0  dtpflapcnt: 0  pagpflapcnt: 0
-            m = p1_11.match(line)
-            if m:
+            if name == 'p1_11':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4946,8 +5056,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # unidirectional: off 
-            m = p1_12.match(line)
-            if m:
+            if name == 'p1_12':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4955,8 +5064,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # operVlan: 0 
-            m = p1_13.match(line)
-            if m:
+            if name == 'p1_13':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4964,8 +5072,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # flag:     0 
-            m = p1_14.match(line)
-            if m:
+            if name == 'p1_14':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4973,8 +5080,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # sm(pm_port 1/24), running yes, state access_multi
-            m = p1_15.match(line)
-            if m:
+            if name == 'p1_15':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4984,8 +5090,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # Last transition recorded: (cfg_access_vvlanid)-> pagp_port_cleanup (cfg_access_vvlanid)-> pagp (cfg_access_vvlanid)-> pre_pagp_may_suspend (cfg_access_vvlanid)-> pagp_may_suspend (pagp_continue)-> start_pagp (pagp_continue)-> pagp (dont_bundle)-> pre_post_pagp (dont_bundle)-> post_pagp (dtp_access_multi)-> access_multi (bulk_sync)-> access_multi 
-            m = p1_16.match(line)
-            if m:
+            if name == 'p1_16':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -4993,8 +5098,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # vp:  1 100
-            m = p1_17.match(line)
-            if m:
+            if name == 'p1_17':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -5002,8 +5106,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # vlans:  1 100
-            m = p1_18.match(line)
-            if m:
+            if name == 'p1_18':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -5011,8 +5114,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # trunkVlans:  1 100
-            m = p1_19.match(line)
-            if m:
+            if name == 'p1_19':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -5020,8 +5122,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # fwdVlans:  100
-            m = p1_20.match(line)
-            if m:
+            if name == 'p1_20':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -5029,8 +5130,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # currentlyPrunedVlans:  none
-            m = p1_21.match(line)
-            if m:
+            if name == 'p1_21':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -5038,8 +5138,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # previouslyPrunedVlans:  none
-            m = p1_22.match(line)
-            if m:
+            if name == 'p1_22':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -5047,8 +5146,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # protocols: ip=on ipx=on misc=on other=on 
-            m = p1_23.match(line)
-            if m:
+            if name == 'p1_23':
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
                     pm_port_info = ret_dict.setdefault('pm_port_info', {})
@@ -5056,8 +5154,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # access mode: unknown   access vlanid: 1   native vlanid: 1 
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5067,8 +5164,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # trunkVlans:  1-4094
-            m = p2_1.match(line)
-            if m:
+            if name == 'p2_1':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5076,8 +5172,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # pruneVlans:  2-1001primary host vlanid: 32767    secondary host vlanid: 32767
-            m = p2_2.match(line)
-            if m:
+            if name == 'p2_2':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5087,8 +5182,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # primary promiscuous vlanid: 32767
-            m = p2_3.match(line)
-            if m:
+            if name == 'p2_3':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5096,8 +5190,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # secondary prom vlans:  none
-            m = p2_4.match(line)
-            if m:
+            if name == 'p2_4':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5105,8 +5198,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # speed: auto speedauto: auto-default   duplex: auto   mode: access 
-            m = p2_5.match(line)
-            if m:
+            if name == 'p2_5':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5117,8 +5209,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # encap: dot1q   nonegotiate: false 
-            m = p2_6.match(line)
-            if m:
+            if name == 'p2_6':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5128,8 +5219,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 
              
             # jumbo cap: true   jumbo: false  mtu: 1500  sync-delay: 210  HOL: Enable
-            m = p2_7.match(line)
-            if m:
+            if name == 'p2_7':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5141,8 +5231,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # bcast-supp-level: 10000   mcast-supp-level: 10000   ucast-supp-level: 10000 
-            m = p2_8.match(line)
-            if m:
+            if name == 'p2_8':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5152,8 +5241,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue            
 
             # disl: off   dtp nonegotiate: FALSE   media: unknown   dualmode 0 
-            m = p2_9.match(line)
-            if m:
+            if name == 'p2_9':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5164,8 +5252,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue            
 
             # tdr_ever_run: FALSE tdr_in_progress: FALSE tdr_result_valid: FALSE
-            m = p2_10.match(line)
-            if m:
+            if name == 'p2_10':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5175,8 +5262,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # tdr_err_code: 0, prbs_err_code: 0
-            m = p2_11.match(line)
-            if m:
+            if name == 'p2_11':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5185,8 +5271,7 @@ class ShowPmPortInterface(ShowPmPortInterfaceSchema):
                 continue
 
             # PRBS: Stopped PRBS - port was admin down
-            m = p2_12.match(line)
-            if m:
+            if name == 'p2_12':
                 dict_val = m.groupdict()
                 if 'config_values' not in ret_dict:
                     config_values = ret_dict.setdefault('config_values', {})
@@ -5215,18 +5300,22 @@ class ShowInterfacesPrivateVlanMapping(ShowInterfacesPrivateVlanMappingSchema):
 
     cli_command = 'show interfaces private-vlan mapping'
 
+    patterns = Patterns(
+        # vlan70    71             community
+        p1=r'^(?P<interface>\w+)\s+(?P<secondary_vlan>\d+)\s+(?P<type>\w+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             output = self.device.execute(self.cli_command)
 
-        # vlan70    71             community   
-        p1 = re.compile(r'^(?P<interface>\w+)\s+(?P<secondary_vlan>\d+)\s+(?P<type>\w+)$')
+        p = ShowInterfacesPrivateVlanMapping.patterns
 
         result_dict = {}
         for line in output.splitlines():
             line = line.strip()
             # vlan70    71             community        
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 intf_dict = result_dict.setdefault('secondary_vlan', {}).setdefault(int(group['secondary_vlan']), {})                
@@ -5280,47 +5369,58 @@ class ShowInterfaceEtherchannel(ShowInterfaceEtherchannelSchema):
 
     cli_command = 'show interface {interface_id} etherchannel'
 
-    def cli(self, interface_id, output=None):
-
-        if output is None:
-            cmd = self.cli_command.format(interface_id=interface_id)
-            output = self.device.execute(cmd)
-
+    patterns = Patterns(
         #Port state    = Up Mstr In-Bndl
-        p1 = re.compile(r'^Port state\s+=\s+(?P<port_state>[\w -]+)$')
+        p1=r'^Port state\s+=\s+(?P<port_state>[\w -]+)$',
+
         #Channel group = 2           Mode = On              Gcchange = -
-        p2 = re.compile(r'^Channel group\s+=\s+(?P<channel_group>\d+)\s+Mode\s+=\s+(?P<mode>\w+)\s+Gcchange\s+=\s+(?P<gcchange>\S+)$')
+        p2=r'^Channel group\s+=\s+(?P<channel_group>\d+)\s+Mode\s+=\s+(?P<mode>\w+)\s+Gcchange\s+=\s+(?P<gcchange>\S+)$',
+
         #Port-channel  = Po2         GC   =   -             Pseudo port-channel = Po2
-        p3 = re.compile(r'^Port-channel\s+=\s+(?P<port_channel>\w+)\s+GC\s+=\s+(?P<gc>\S+)\s+Pseudo port-channel\s+=\s+(?P<pseudo_port_channel>\S+)$')
+        p3=r'^Port-channel\s+=\s+(?P<port_channel>\w+)\s+GC\s+=\s+(?P<gc>\S+)\s+Pseudo port-channel\s+=\s+(?P<pseudo_port_channel>\S+)$',
+
         #Port index    = 0           Load = 0x00            Protocol =    -
-        p4 = re.compile(r'^Port index\s+=\s+(?P<port_index>\d+)\s+Load\s+=\s+(?P<load>\S+)\s+Protocol\s+=\s+(?P<protocol>\S+)$')
+        p4=r'^Port index\s+=\s+(?P<port_index>\d+)\s+Load\s+=\s+(?P<load>\S+)\s+Protocol\s+=\s+(?P<protocol>\S+)$',
+
         #Flags:  S - Device is sending Slow LACPDUs   F - Device is sending fast LACPDUs.
-        p5 = re.compile(r'^Flags:\s+(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\s+(?P<flag2>\w+)\s-\s(?P<flag_value2>[\S\s]+)\.$')
+        p5=r'^Flags:\s+(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\s+(?P<flag2>\w+)\s-\s(?P<flag_value2>[\S\s]+)\.$',
+
         #A - Device is in active mode.        P - Device is in passive mode.
-        p5_1 = re.compile(r'^(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\.\s+(?P<flag2>\S+)\s-\s(?P<flag_value2>[\S\s]+)\.$')
+        p5_1=r'^(?P<flag>\S+)\s-\s(?P<flag_value>[\S\s]+)\.\s+(?P<flag2>\S+)\s-\s(?P<flag_value2>[\S\s]+)\.$',
+
         #Local information:
         #                                 LACP port    Admin     Oper    Port        Port
         # Port          Flags   State     Priority     Key       Key     Number      State
-        # Gi2/0/13      SA      down      32768        0xA       0x0     0x20E       0x4D 
-        p6 = re.compile(r'^(?P<port>Gi[\w\/\d]+)\s+(?P<flags>\w+)\s+(?P<state>\w+)\s+(?P<priority>\d+)'
-                        r'\s+(?P<admin_key>\w+)\s+(?P<oper_key>\w+)\s+(?P<port_number>\w+)\s+(?P<port_state>\w+)$')
+        # Gi2/0/13      SA      down      32768        0xA       0x0     0x20E       0x4D
+        p6=r'^(?P<port>Gi[\w\/\d]+)\s+(?P<flags>\w+)\s+(?P<state>\w+)\s+(?P<priority>\d+)'
+           r'\s+(?P<admin_key>\w+)\s+(?P<oper_key>\w+)\s+(?P<port_number>\w+)\s+(?P<port_state>\w+)$',
+
         #Age of the port in the current state: 0d:00h:00m:29s
-        p7 = re.compile(r'^Age of the port in the current state:\s+(?P<age_of_port>\S+)$')
-        
+        p7=r'^Age of the port in the current state:\s+(?P<age_of_port>\S+)$',
+    )
+
+    def cli(self, interface_id, output=None):
+
+        if output is None:
+            cmd = self.cli_command.format(interface_id=interface_id)
+            output = self.device.execute(cmd)
+
+        p = ShowInterfaceEtherchannel.patterns
+
         ret_dict = {}
 
         for line in output.splitlines():
             line = line.strip()
 
             #Port state    = Up Mstr In-Bndl
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['port_state'] = group['port_state']
                 continue
 
             #Channel group = 2           Mode = On              Gcchange = -            
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['channel_group'] = int(group['channel_group'])
@@ -5329,7 +5429,7 @@ class ShowInterfaceEtherchannel(ShowInterfaceEtherchannelSchema):
                 continue
 
             #Port-channel  = Po2         GC   =   -             Pseudo port-channel = Po2
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['port_channel'] = group['port_channel']
@@ -5338,7 +5438,7 @@ class ShowInterfaceEtherchannel(ShowInterfaceEtherchannelSchema):
                 continue
 
             #Port index    = 0           Load = 0x00            Protocol =    -
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['port_index'] = int(group['port_index'])
@@ -5347,7 +5447,7 @@ class ShowInterfaceEtherchannel(ShowInterfaceEtherchannelSchema):
                 continue
 
             #Flags:  S - Device is sending Slow LACPDUs   F - Device is sending fast LACPDUs.            
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 flag_dict = ret_dict.setdefault('flags',{})
@@ -5356,7 +5456,7 @@ class ShowInterfaceEtherchannel(ShowInterfaceEtherchannelSchema):
                 continue
 
             #A - Device is in active mode.        P - Device is in passive mode.
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 group = m.groupdict()
                 flag_dict = ret_dict.setdefault('flags',{})
@@ -5368,7 +5468,7 @@ class ShowInterfaceEtherchannel(ShowInterfaceEtherchannelSchema):
             #                                 LACP port    Admin     Oper    Port        Port
             # Port          Flags   State     Priority     Key       Key     Number      State
             # Gi2/0/13      SA      down      32768        0xA       0x0     0x20E       0x4D             
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 info_dict = ret_dict.setdefault('local_information',{})
@@ -5383,7 +5483,7 @@ class ShowInterfaceEtherchannel(ShowInterfaceEtherchannelSchema):
                 continue
 
             #Age of the port in the current state: 0d:00h:00m:29s
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['port_age'] = group['age_of_port']
@@ -5413,6 +5513,20 @@ class ShowInterfacesCapabilities(ShowInterfacesCapabilitiesSchema):
 
     cli_command = ['show interfaces capabilities', 'show interfaces {interface} capabilities']
 
+    patterns = Patterns(
+        # TenGigabitEthernet3/1/3
+        p1=r'^(?P<interface>[\w\/\d\.]+)$',
+
+        # Model:                 WS-C3650-48PD
+        # Type:                  SFP-10G-ACTIVE-CABLE
+        # Speed:                 10000
+        # Duplex:                full
+        p2=r'^(?P<key_name>[\w\s\.]+):\s+(?P<value>.+)$',
+
+        # tx-(2p6q3t)
+        p3=r'^(?P<qos_tx>tx-.+)$',
+    )
+
     def cli(self, interface=None, output=None):
         if output is None:
             if interface:
@@ -5422,25 +5536,15 @@ class ShowInterfacesCapabilities(ShowInterfacesCapabilitiesSchema):
             
             output = self.device.execute(cmd)
 
-        # TenGigabitEthernet3/1/3
-        p1 = re.compile(r'^(?P<interface>[\w\/\d\.]+)$')
-
-        # Model:                 WS-C3650-48PD
-        # Type:                  SFP-10G-ACTIVE-CABLE
-        # Speed:                 10000
-        # Duplex:                full
-        p2 = re.compile(r'^(?P<key_name>[\w\s\.]+):\s+(?P<value>.+)$')
+        p = ShowInterfacesCapabilities.patterns
 
-        # tx-(2p6q3t)
-        p3 = re.compile(r'^(?P<qos_tx>tx-.+)$')
-        
         ret_dict = {}
 
         for line in output.splitlines():
             line = line.strip()
 
             # TenGigabitEthernet3/1/3
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 int_dict = ret_dict.setdefault('interface', {}).setdefault(Common.convert_intf_name(m.groupdict()['interface']), {})
                 continue
@@ -5449,14 +5553,14 @@ class ShowInterfacesCapabilities(ShowInterfacesCapabilitiesSchema):
             # Type:                  SFP-10G-ACTIVE-CABLE
             # Speed:                 10000
             # Duplex:                full
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 key = m.groupdict()['key_name'].strip().lower().replace(' ', '_').replace('.', '')
                 int_dict[key] = m.groupdict()['value']
                 continue
             
             # tx-(2p6q3t)
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 int_dict[key] = f"{int_dict[key]} {m.groupdict()['qos_tx']}"
         
@@ -5485,17 +5589,21 @@ class ShowInterfaceFlowControl(ShowInterfaceFlowControlSchema):
 
     cli_command = 'show interfaces {interface_id} flowcontrol'
 
+    patterns = Patterns(
+        # Port            Send FlowControl  Receive FlowControl  RxPause TxPause
+        #                 admin    oper     admin    oper
+        # ------------    -------- -------- -------- --------    ------- -------
+        # Fo2/1/0/10      Unsupp.  Unsupp.  on       on          0       0
+        p1=r'^(?P<port>[\w\/\d]+)\s+(?P<send_fc_admin>[\.\w]+)\s+(?P<send_fc_oper>[\.\w]+)\s+(?P<receive_fc_admin>\w+)\s+(?P<receive_fc_oper>\w+)\s+(?P<rx_pause>\d+)\s+(?P<tx_pause>\d+)$',
+    )
+
     def cli(self, interface_id, output=None):
 
         if output is None:
             cmd = self.cli_command.format(interface_id=interface_id)
             output = self.device.execute(cmd)
 
-        # Port            Send FlowControl  Receive FlowControl  RxPause TxPause
-        #                 admin    oper     admin    oper
-        # ------------    -------- -------- -------- --------    ------- -------
-        # Fo2/1/0/10      Unsupp.  Unsupp.  on       on          0       0
-        p1 = re.compile(r'^(?P<port>[\w\/\d]+)\s+(?P<send_fc_admin>[\.\w]+)\s+(?P<send_fc_oper>[\.\w]+)\s+(?P<receive_fc_admin>\w+)\s+(?P<receive_fc_oper>\w+)\s+(?P<rx_pause>\d+)\s+(?P<tx_pause>\d+)$')
+        p = ShowInterfaceFlowControl.patterns
 
         ret_dict = {}
 
@@ -5506,7 +5614,7 @@ class ShowInterfaceFlowControl(ShowInterfaceFlowControlSchema):
             #                 admin    oper     admin    oper
             # ------------    -------- -------- -------- --------    ------- -------
             # Fo2/1/0/10      Unsupp.  Unsupp.  on       on          0       0        
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 info_dict = ret_dict.setdefault('interface',{})
@@ -5540,19 +5648,23 @@ class ShowInterfacesVlanMapping(ShowInterfacesVlanMappingSchema):
 
     cli_command = 'show interface {interface} vlan mapping'
 
+    patterns = Patterns(
+        # 20                                    30             1-to-1
+        p1=r"^(?P<vlan_on_wire>\d+)\s+(?P<trans_vlan>\d+)\s+(?P<operation>\S+)$",
+    )
+
     def cli(self, interface, output=None):
         if output is None:
             output = self.device.execute(self.cli_command)
 
-        # 20                                    30             1-to-1
-        p1 = re.compile(r"^(?P<vlan_on_wire>\d+)\s+(?P<trans_vlan>\d+)\s+(?P<operation>\S+)$")
+        p = ShowInterfacesVlanMapping.patterns
 
         ret_dict = {}
 
         for line in output.splitlines():
 
             # 20                                    30             1-to-1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 vlan_dict = ret_dict.setdefault('vlan_on_wire', {}).setdefault(dict_val['vlan_on_wire'], {})
@@ -5582,16 +5694,19 @@ class ShowInterfaceHumanReadableIncludeDrops(ShowInterfaceHumanReadableIncludeDr
 
     cli_command = 'show interface {interface} human-readable | i drops'
 
+    patterns = Patterns(
+        #   Input queue: 0/2000/0/0 (size/max/drops/flushes); Total output drops: 0
+        p1=r"^Input queue: (?P<size>\d+)/(?P<max>\d+)/(?P<drops>\d+)/(?P<flushes>\d+)\s+\(size/max/drops/flushes\); Total output drops:\s+(?P<total_output_drops>\d+)$",
+
+        # 0 unknown protocol drops
+        p2=r"^(?P<unknown_protocol_drops>\d+)\s+unknown protocol drops$",
+    )
+
     def cli(self, interface, output=None):
         if output is None:
             output = self.device.execute(self.cli_command.format(interface=interface))
             
-        #   Input queue: 0/2000/0/0 (size/max/drops/flushes); Total output drops: 0
-
-        p1 = re.compile(r"^Input queue: (?P<size>\d+)/(?P<max>\d+)/(?P<drops>\d+)/(?P<flushes>\d+)\s+\(size/max/drops/flushes\); Total output drops:\s+(?P<total_output_drops>\d+)$")
-
-        # 0 unknown protocol drops
-        p2 = re.compile(r"^(?P<unknown_protocol_drops>\d+)\s+unknown protocol drops$")
+        p = ShowInterfaceHumanReadableIncludeDrops.patterns
 
         ret_dict = {}
 
@@ -5599,7 +5714,7 @@ class ShowInterfaceHumanReadableIncludeDrops(ShowInterfaceHumanReadableIncludeDr
             line = line.strip()
 
             #   Input queue: 0/2000/0/0 (size/max/drops/flushes); Total output drops: 0
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 ret_dict['size'] = int(dict_val['size'])
@@ -5610,7 +5725,7 @@ class ShowInterfaceHumanReadableIncludeDrops(ShowInterfaceHumanReadableIncludeDr
                 continue
 
             # 0 unknown protocol drops
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 dict_val = m.groupdict()
                 ret_dict['unknown_protocol_drops'] = int(dict_val['unknown_protocol_drops'])
@@ -5635,13 +5750,17 @@ class ShowInterfaceHumanReadable(ShowInterfaceHumanReadableSchema):
 
     cli_command = 'show interface {interface} human-readable'
 
+    patterns = Patterns(
+        # 5 minute input rate 0 bits/sec, 0 packets/sec
+        # 5 minute output rate 0 bits/sec, 0 packets/sec
+        p1=r'^\d+\s+(minute|seconds)\s+(?P<dir>(input|output))\s+rate\s+(?P<rate>[\S\s]+)\s*,[\S\s\d]+$',
+    )
+
     def cli(self, interface, output=None):
         if output is None:
             output = self.device.execute(self.cli_command.format(interface=interface))
             
-        # 5 minute input rate 0 bits/sec, 0 packets/sec
-        # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p1 = re.compile(r'^\d+\s+(minute|seconds)\s+(?P<dir>(input|output))\s+rate\s+(?P<rate>[\S\s]+)\s*,[\S\s\d]+$')
+        p = ShowInterfaceHumanReadable.patterns
 
         ret_dict = {}
 
@@ -5650,7 +5769,7 @@ class ShowInterfaceHumanReadable(ShowInterfaceHumanReadableSchema):
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.update({
@@ -60,6 +60,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
 from genie.libs.parser.iosxe.show_bgp import *
+from genie.libs.parser.utils.subcommands import execute_many
 
 
 # ======================================
@@ -620,6 +621,7 @@ class ShowIpBgpAllNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSupe
 
     def cli(self, neighbor, address_family='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and neighbor:
@@ -627,8 +629,9 @@ class ShowIpBgpAllNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSupe
                                                  neighbor=neighbor)
             else:
                 cmd = self.cli_command[1].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             if self.check_number_of_prefixes(output) == 0:
                 return {}
@@ -636,7 +639,8 @@ class ShowIpBgpAllNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSupe
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family,
+                           vrf_output=vrf_output)
 
     def check_number_of_prefixes(self, output):
         number_of_prefixes = re.compile(r'Total\s+number\s+of\s+prefixes\s+(?P<number_of_prefixes>\d+)\s*')
@@ -670,6 +674,7 @@ class ShowIpBgpNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSuperPa
 
     def cli(self, neighbor='', rd='', vrf='', address_family='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and neighbor and rd:
@@ -683,14 +688,16 @@ class ShowIpBgpNeighborsAdvertisedRoutes(ShowBgpNeighborsAdvertisedRoutesSuperPa
                                                  neighbor=neighbor)
             elif neighbor:
                 cmd = self.cli_command[1].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family,
+                           vrf_output=vrf_output)
 
 
 
@@ -716,6 +723,7 @@ class ShowIpBgpAllNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperPar
 
     def cli(self, neighbor, address_family='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and neighbor:
@@ -723,14 +731,16 @@ class ShowIpBgpAllNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperPar
                                                  neighbor=neighbor)
             else:
                 cmd = self.cli_command[1].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family,
+                           vrf_output=vrf_output)
 
 
 # =======================================================================
@@ -751,6 +761,7 @@ class ShowIpBgpNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperParser
 
     def cli(self, neighbor, address_family='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and neighbor:
@@ -758,14 +769,16 @@ class ShowIpBgpNeighborsReceivedRoutes(ShowBgpNeighborsReceivedRoutesSuperParser
                                                  neighbor=neighbor)
             elif neighbor:
                 cmd = self.cli_command[1].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family,
+                           vrf_output=vrf_output)
 
 
 #-------------------------------------------------------------------------------
@@ -789,6 +802,7 @@ class ShowIpBgpAllNeighborsRoutes(ShowBgpAllNeighborsRoutesSuperParser, ShowBgpA
 
     def cli(self, neighbor, address_family='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
             if address_family and neighbor:
@@ -796,14 +810,16 @@ class ShowIpBgpAllNeighborsRoutes(ShowBgpAllNeighborsRoutesSuperParser, ShowBgpA
                                                  neighbor=neighbor)
             else:
                 cmd = self.cli_command[1].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the neighbor
+            show_output, vrf_output = execute_many(
+                self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family)
+                           address_family=address_family,
+                           vrf_output=vrf_output)
 
 
 # ==============================================================
@@ -827,6 +843,7 @@ class ShowIpBgpNeighborsRoutes(ShowBgpAllNeighborsRoutesSuperParser, ShowBgpAllN
 
     def cli(self, neighbor, address_family='', vrf='', output=None):
 
+        vrf_output = None
         if output is None:
             # Build command
 
@@ -839,14 +856,20 @@ class ShowIpBgpNeighborsRoutes(ShowBgpAllNeighborsRoutesSuperParser, ShowBgpAllN
                                                  address_family=address_family)
             else:
                 cmd = self.cli_command[2].format(neighbor=neighbor)
-            # Execute command
-            show_output = self.device.execute(cmd)
+            # Execute command, and the one finding the vrf of the
+            # neighbor when it is not given
+            if vrf:
+                show_output = self.device.execute(cmd)
+            else:
+                show_output, vrf_output = execute_many(
+                    self.device, [cmd, self.vrf_command])
         else:
             show_output = output
 
         # Call super
         return super().cli(output=show_output, neighbor=neighbor,
-                           address_family=address_family, vrf=vrf)
+                           address_family=address_family, vrf=vrf,
+                           vrf_output=vrf_output)
 
 
 #-------------------------------------------------------------------------------
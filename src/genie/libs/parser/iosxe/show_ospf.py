@@ -37,6 +37,7 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
 
 # ===========================================================
 # Schema for:
@@ -81,6 +82,24 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
     cli_command = ['show ip ospf segment-routing local-block',
                    'show ip ospf {process_id} segment-routing local-block']
 
+    patterns = Patterns(
+        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+            ' +\(Process +ID +(?P<pid>(\S+))\)$',
+
+        # OSPF Segment Routing Local Blocks in Area 8
+        p2=r'^OSPF +Segment +Routing +Local +Blocks +in +Area'
+            ' +(?P<area>(\d+))$',
+
+        # Router ID        SR Capable   SRLB Base   SRLB Range
+        # --------------------------------------------------------
+        # *10.4.1.1          Yes          15000       1000
+        # 10.16.2.2          Yes          15000       1000
+        # 10.169.197.252    No
+        p3=r'^(?P<value>\*)?(?P<router_id>\S+) +(?P<sr_capable>Yes|No)'
+            '( +(?P<srlb_base>\d+) +(?P<srlb_range>\d+))?$',
+    )
+
     def cli(self, process_id=None, output=None):
         if output is None:
             if process_id:
@@ -95,27 +114,13 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
         # Init vars
         ret_dict = {}
 
-        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<pid>(\S+))\)$')
-
-        # OSPF Segment Routing Local Blocks in Area 8
-        p2 = re.compile(r'^OSPF +Segment +Routing +Local +Blocks +in +Area'
-                         ' +(?P<area>(\d+))$')
-
-        # Router ID        SR Capable   SRLB Base   SRLB Range
-        # --------------------------------------------------------
-        # *10.4.1.1          Yes          15000       1000
-        # 10.16.2.2          Yes          15000       1000
-        # 10.169.197.252    No 
-        p3 = re.compile(r'^(?P<value>\*)?(?P<router_id>\S+) +(?P<sr_capable>Yes|No)'
-                         '( +(?P<srlb_base>\d+) +(?P<srlb_range>\d+))?$')
+        p = ShowIpOspfSegmentRoutingLocalBlock.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 inst_dict = ret_dict.setdefault('instance', {}).\
@@ -124,7 +129,7 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
                 continue
 
             # OSPF Segment Routing Local Blocks in Area 8
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 area_dict = inst_dict.setdefault('areas', {}).\
                     setdefault(str(IPAddress(str(m.groupdict()['area']))), {})
@@ -134,7 +139,7 @@ class ShowIpOspfSegmentRoutingLocalBlock(ShowIpOspfSegmentRoutingLocalBlockSchem
             # --------------------------------------------------------
             # *10.4.1.1          Yes          15000       1000
             # 10.16.2.2          Yes          15000       1000
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 smgt_dict = area_dict.setdefault('router_id', {}).\
@@ -336,6 +341,143 @@ class ShowIpOspf(ShowIpOspfSchema):
     cli_command = 'show ip ospf'
     exclude = ['area_scope_lsa_cksum_sum' , ]
 
+    patterns = Patterns(
+        p1=r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
+            ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
+            ' +with +ID +(?P<router_id>(\S+))$',
+        p1_1=r'^Routing +Process +is +shutdown$',
+        p2=r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
+            ' +(?P<value>(\S+))$',
+        p3=r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
+            ' +elapsed: +(?P<elapsed>(\S+))$',
+        p4=r'^Supports +only +single +TOS(TOS0) routes$',
+        p5=r'^Supports +opaque +LSA$',
+        p6=r'^Supports +Link-local +Signaling +\(LLS\)$',
+        p7=r'^Supports +area +transit +capability$',
+        p8=r'^Supports +NSSA +\(compatible +with +RFC +3101\)$',
+        p9=r'^Supports +Database +Exchange +Summary +List'
+            ' +Optimization +\(RFC +5243\)$',
+        p10=r'^Event-log +(?P<event_log>(enabled|disabled)),'
+             '(?: +Maximum +number +of +events:'
+             ' +(?P<max_events>(\d+)),'
+             ' +Mode: +(?P<mode>(\S+)))?$',
+        p11=r'^It +is +an'
+             '(?: +(?P<abr>(area border)))?'
+             '(?: +and)?'
+             '(?: +(?P<asbr>(autonomous system boundary)))?'
+             ' +router$',
+        p12_1=r'^Redistributing +External +Routes +from,$',
+        p12_2=r'^(?P<type>(connected|static))(?: +with +metric'
+               ' +mapped +to +(?P<metric>(\d+)))?$',
+        p12_2_1=r'^(?P<type>(connected|static|isis))'
+                 ', +includes +(?P<redist>(subnets)) +in +redistribution',
+        p12_3=r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
+               '(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
+               '(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
+               '(?:, +(?P<nssa>(nssa areas only)))?$',
+        p12_4=r'^Maximum +limit +of +redistributed +prefixes'
+               ' +(?P<num_prefix>(\d+))'
+               '(?: +\((?P<warn>(warning-only))\))?',
+        p12_5=r'^Threshold +for +warning +message'
+               ' +(?P<thld>(\d+))\%$',
+        p13=r'^Router +is +not +originating +router-LSAs'
+             ' +with +maximum +metric$',
+        p14_1=r'^Originating +router-LSAs +with +maximum'
+               ' +metric$',
+        p14_3=r'^Advertise +stub +links +with +maximum +metric'
+               ' +in +router\-LSAs$',
+        p14_4=r'^Advertise +summary\-LSAs +with +metric'
+               ' +(?P<metric>(\d+))$',
+        p14_5=r'^^Advertise +external\-LSAs +with +metric'
+               ' +(?P<metric>(\d+))$',
+        p15=r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
+             ' +msecs$',
+        p16=r'^Minimum +hold +time +between +two +consecutive'
+             ' +SPFs +(?P<time>(\S+)) +msecs$',
+        p17=r'^Maximum +wait +time +between +two +consecutive'
+             ' +SPFs +(?P<time>(\S+)) +msecs$',
+        p18=r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
+             ' +msecs$',
+        p19=r'^Minimum +hold +time +for +LSA +throttle'
+             ' +(?P<time>(\S+)) +msecs$',
+        p20=r'^Maximum +wait +time +for +LSA +throttle'
+             ' +(?P<time>(\S+)) +msecs$',
+        p21=r'^Minimum +LSA +arrival'
+             ' +(?P<arrival>(\S+)) +msecs$',
+        p22=r'^Incremental-SPF +(?P<incr>(disabled|enabled))$',
+        p23=r'LSA +group +pacing +timer'
+             ' +(?P<pacing>(\d+)) +secs$',
+        p24=r'Interface +flood +pacing +timer'
+             ' +(?P<interface>(\d+)) +msecs$',
+        p25=r'Retransmission +pacing +timer'
+             ' +(?P<retransmission>(\d+)) +msecs$',
+        p26=r'EXCHANGE/LOADING +adjacency +limit: +initial'
+             ' +(?P<initial>(\S+)), +process +maximum'
+             ' +(?P<maximum>(\d+))$',
+        p27=r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
+             ' +Checksum +Sum +(?P<checksum>(\S+))$',
+        p28=r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
+             ' +Checksum +Sum +(?P<checksum>(\S+))$',
+        p29=r'^Number +of +DCbitless +external +and +opaque'
+             ' +AS +LSA +(?P<num>(\d+))$',
+        p30=r'^Number +of +DoNotAge +external +and +opaque'
+             ' +AS +LSA +(?P<num>(\d+))$',
+        p31=r'^Number +of +areas +in +this +router +is'
+             ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
+             ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
+             ' +nssa$',
+        p32=r'Number +of +areas +transit +capable +is'
+             ' +(?P<num>(\d+))$',
+        p33=r'^Maximum +number +of +non +self-generated +LSA'
+             ' +allowed +(?P<max_lsa>(\d+))(?: +\((?P<warn>(warning-only))\))?',
+        p33_1=r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$',
+        p33_2=r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$',
+        p33_3=r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
+               ' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$',
+        p33_4=r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
+               ' +current ignore\-count +(?P<max_lsa_current_count>\d+)$',
+        p33_5=r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$',
+        p34=r'^External +flood +list +length +(?P<num>(\d+))$',
+        p35=r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
+             ' +(?P<enable>(enabled|disabled))$',
+        p36=r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
+             ' +(?P<gr_helper>(enabled|disabled))$',
+        p36_1=r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$',
+        p37=r'^Reference +bandwidth +unit +is'
+             ' +(?P<bd>(\d+)) +(?P<unit>(mbps))$',
+        p38=r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$',
+        p39_1=r'^It +is +a +(?P<area_type>(\S+)) +area'
+               '(?:, +(?P<summary>(no +summary +LSA +in +this'
+               ' +area)))?$',
+        p39_2=r'^generates +stub +default +route +with +cost'
+               ' +(?P<default_cost>(\d+))$',
+        p40_1=r'^Area ranges are$',
+        p40_2=r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
+               '(?:\((?P<cost>(\d+)) +\- +configured\))?'
+               ' +(?P<advertise>(Advertise|DoNotAdvertise))$',
+        p41=r'^Number +of +interfaces +in +this +area +is'
+             ' +(?P<num_intf>(\d+))(?:'
+             ' *\((?P<loopback>(\d+)) +loopback\))?$',
+        p42=r'^Area +has +RRR +enabled$',
+        p43=r'^SPF +algorithm +executed +(?P<count>(\d+))'
+             ' +times$',
+        p44=r'^SPF +algorithm +last +executed'
+             ' +(?P<last_exec>(\S+)) +ago$',
+        p45=r'^Area +has +no +authentication$',
+        p46=r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
+             ' +Checksum +Sum +(?P<checksum_sum>(\S+))$',
+        p47=r'^Number +of opaque +link +LSA'
+             ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
+             ' +(?P<checksum_sum>(\S+))$',
+        p48=r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$',
+        p49=r'^Number +of +indication +LSA +(?P<count>(\d+))$',
+        p50=r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$',
+        p51=r'^Flood +list +length +(?P<len>(\d+))$',
+        p52=r'^Non-Stop +Routing +(?P<nsr>(enabled))$',
+        p53_1=r'^BFD +is +enabled +in +strict +mode$',
+        p53_2=r'^BFD +is +enabled$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -348,222 +490,19 @@ class ShowIpOspf(ShowIpOspfSchema):
         redist_max_prefix = False
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'(?:^VRF +(?P<vrf>(\S+)) +in +)?Routing +Process'
-                            ' +\"(?:ospf)? +(?P<instance>([a-zA-Z0-9\s]+))\"'
-                            ' +with +ID +(?P<router_id>(\S+))$')
-
-        p1_1 = re.compile(r'^Routing +Process +is +shutdown$')
-
-        p2 = re.compile(r'^Domain +ID +type +(?P<domain_id>(\S+)), +value'
-                            ' +(?P<value>(\S+))$')
-
-        p3 = re.compile(r'^Start +time: +(?P<start>([0-9\:\.]+)), +Time'
-                            ' +elapsed: +(?P<elapsed>(\S+))$')
-
-        p4 = re.compile(r'^Supports +only +single +TOS(TOS0) routes$')
-
-        p5 = re.compile(r'^Supports +opaque +LSA$')
-
-        p6 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
-
-        p7 = re.compile(r'^Supports +area +transit +capability$')
-
-        p8 = re.compile(r'^Supports +NSSA +\(compatible +with +RFC +3101\)$')
-
-        p9 = re.compile(r'^Supports +Database +Exchange +Summary +List'
-                            ' +Optimization +\(RFC +5243\)$')
-
-        p10 = re.compile(r'^Event-log +(?P<event_log>(enabled|disabled)),'
-                            '(?: +Maximum +number +of +events:'
-                            ' +(?P<max_events>(\d+)),'
-                            ' +Mode: +(?P<mode>(\S+)))?$')
-
-        p11 = re.compile(r'^It +is +an'
-                            '(?: +(?P<abr>(area border)))?'
-                            '(?: +and)?'
-                            '(?: +(?P<asbr>(autonomous system boundary)))?'
-                            ' +router$')
-
-        p12_1 = re.compile(r'^Redistributing +External +Routes +from,$')
-
-        p12_2 = re.compile(r'^(?P<type>(connected|static))(?: +with +metric'
-                            ' +mapped +to +(?P<metric>(\d+)))?$')
-
-        p12_2_1 = re.compile(r'^(?P<type>(connected|static|isis))'
-                                ', +includes +(?P<redist>(subnets)) +in +redistribution')
-
-        p12_3 = re.compile(r'^(?P<prot>(bgp|isis)) +(?P<pid>(\d+))'
-                            '(?: +with +metric +mapped +to +(?P<metric>(\d+)))?'
-                            '(?:, +includes +(?P<redist>(subnets)) +in +redistribution)?'
-                            '(?:, +(?P<nssa>(nssa areas only)))?$')
-
-        p12_4 = re.compile(r'^Maximum +limit +of +redistributed +prefixes'
-                            ' +(?P<num_prefix>(\d+))'
-                            '(?: +\((?P<warn>(warning-only))\))?')
-
-        p12_5 = re.compile(r'^Threshold +for +warning +message'
-                            ' +(?P<thld>(\d+))\%$')
-
-        p13 = re.compile(r'^Router +is +not +originating +router-LSAs'
-                            ' +with +maximum +metric$')
-
-        p14_1 = re.compile(r'^Originating +router-LSAs +with +maximum'
-                            ' +metric$')
+        p = ShowIpOspf.patterns
 
         p14_2 = re.compile(r'^Condition:'
                             ' +(?P<condition>(always|on \S+))'
                             '(?: +for +(?P<seconds>(\d+)) +seconds,)?'
                             ' +State: +(?P<state>(\S+))$')
 
-        p14_3 = re.compile(r'^Advertise +stub +links +with +maximum +metric'
-                            ' +in +router\-LSAs$')
-
-        p14_4 = re.compile(r'^Advertise +summary\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
-
-        p14_5 = re.compile(r'^^Advertise +external\-LSAs +with +metric'
-                            ' +(?P<metric>(\d+))$')
-
-        p15 = re.compile(r'^Initial +SPF +schedule +delay +(?P<time>(\S+))'
-                            ' +msecs$')
-
-        p16 = re.compile(r'^Minimum +hold +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
-
-        p17 = re.compile(r'^Maximum +wait +time +between +two +consecutive'
-                            ' +SPFs +(?P<time>(\S+)) +msecs$')
-
-        p18 = re.compile(r'^Initial +LSA +throttle +delay +(?P<time>(\S+))'
-                            ' +msecs$')
-
-        p19 = re.compile(r'^Minimum +hold +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
-
-        p20 = re.compile(r'^Maximum +wait +time +for +LSA +throttle'
-                            ' +(?P<time>(\S+)) +msecs$')
-
-        p21 = re.compile(r'^Minimum +LSA +arrival'
-                            ' +(?P<arrival>(\S+)) +msecs$')
-
-        p22 = re.compile(r'^Incremental-SPF +(?P<incr>(disabled|enabled))$')
-
-        p23 = re.compile(r'LSA +group +pacing +timer'
-                            ' +(?P<pacing>(\d+)) +secs$')
-
-        p24 = re.compile(r'Interface +flood +pacing +timer'
-                            ' +(?P<interface>(\d+)) +msecs$')
-
-        p25 = re.compile(r'Retransmission +pacing +timer'
-                            ' +(?P<retransmission>(\d+)) +msecs$')
-
-        p26 = re.compile(r'EXCHANGE/LOADING +adjacency +limit: +initial'
-                            ' +(?P<initial>(\S+)), +process +maximum'
-                            ' +(?P<maximum>(\d+))$')
-
-        p27 = re.compile(r'^Number +of +external +LSA +(?P<ext>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
-
-        p28 = re.compile(r'^Number +of +opaque +AS +LSA +(?P<opq>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum>(\S+))$')
-
-        p29 = re.compile(r'^Number +of +DCbitless +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
-
-        p30 = re.compile(r'^Number +of +DoNotAge +external +and +opaque'
-                            ' +AS +LSA +(?P<num>(\d+))$')
-
-        p31 = re.compile(r'^Number +of +areas +in +this +router +is'
-                            ' +(?P<total_areas>(\d+))\. +(?P<normal>(\d+))'
-                            ' +normal +(?P<stub>(\d+)) +stub +(?P<nssa>(\d+))'
-                            ' +nssa$')
-
-        p32 = re.compile(r'Number +of +areas +transit +capable +is'
-                            ' +(?P<num>(\d+))$')
-
-        p33 = re.compile(r'^Maximum +number +of +non +self-generated +LSA'
-                            ' +allowed +(?P<max_lsa>(\d+))(?: +\((?P<warn>(warning-only))\))?')
-
-        p33_1 = re.compile(r'^Current +number +of +non +self\-generated +LSA +(?P<max_lsa_current>\d+)$')
-
-        p33_2 = re.compile(r'^Threshold +for +warning +message +(?P<max_lsa_threshold_value>\d+)\%$')
-
-        p33_3 = re.compile(r'^Ignore\-time +(?P<max_lsa_ignore_time>\d+) +minutes,'
-                            ' +reset\-time +(?P<max_lsa_reset_time>\d+) +minutes$')
-
-        p33_4 = re.compile(r'^Ignore\-count +allowed +(?P<max_lsa_ignore_count>\d+),'
-                            ' +current ignore\-count +(?P<max_lsa_current_count>\d+)$')
-
-        p33_5 = re.compile(r'^Maximum +limit +of +redistributed +prefixes +(?P<max_lsa_limit>\d+) +\(warning\-only\)$')
-
-        p34 = re.compile(r'^External +flood +list +length +(?P<num>(\d+))$')
-
-        p35 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +Non-Stop +Forwarding'
-                            ' +(?P<enable>(enabled|disabled))$')
-
-        p36 = re.compile(r'^(?P<gr_type>(IETF|Cisco)) +NSF +helper +support'
-                            ' +(?P<gr_helper>(enabled|disabled))$')
-
-        p36_1 = re.compile(r'^restart-interval +limit *: +(?P<num>(\d+)) +sec$')
-
-        p37 = re.compile(r'^Reference +bandwidth +unit +is'
-                            ' +(?P<bd>(\d+)) +(?P<unit>(mbps))$')
-
-        p38 = re.compile(r'^Area +(?P<area>(\S+))(?: *\((I|i)nactive\))?$')
-
-        p39_1 = re.compile(r'^It +is +a +(?P<area_type>(\S+)) +area'
-                            '(?:, +(?P<summary>(no +summary +LSA +in +this'
-                            ' +area)))?$')
-
-        p39_2 = re.compile(r'^generates +stub +default +route +with +cost'
-                            ' +(?P<default_cost>(\d+))$')
-
-        p40_1 = re.compile(r'^Area ranges are$')
-
-        p40_2 = re.compile(r'^(?P<prefix>([0-9\.\/]+)) +(Passive|Active)'
-                            '(?:\((?P<cost>(\d+)) +\- +configured\))?'
-                            ' +(?P<advertise>(Advertise|DoNotAdvertise))$')
-
-        p41 = re.compile(r'^Number +of +interfaces +in +this +area +is'
-                            ' +(?P<num_intf>(\d+))(?:'
-                            ' *\((?P<loopback>(\d+)) +loopback\))?$')
-
-        p42 = re.compile(r'^Area +has +RRR +enabled$')
-
-        p43 = re.compile(r'^SPF +algorithm +executed +(?P<count>(\d+))'
-                            ' +times$')
-
-        p44 = re.compile(r'^SPF +algorithm +last +executed'
-                            ' +(?P<last_exec>(\S+)) +ago$')
-
-        p45 = re.compile(r'^Area +has +no +authentication$')
-
-        p46 = re.compile(r'^Number +of +LSA +(?P<lsa_count>(\d+))\.'
-                            ' +Checksum +Sum +(?P<checksum_sum>(\S+))$')
-
-        p47 = re.compile(r'^Number +of opaque +link +LSA'
-                            ' +(?P<opaque_count>(\d+))\. +Checksum +Sum'
-                            ' +(?P<checksum_sum>(\S+))$')
-
-        p48 = re.compile(r'^Number +of +DCbitless +LSA +(?P<count>(\d+))$')
-
-        p49 = re.compile(r'^Number +of +indication +LSA +(?P<count>(\d+))$')
-
-        p50 = re.compile(r'^Number +of +DoNotAge +LSA +(?P<count>(\d+))$')
-
-        p51 = re.compile(r'^Flood +list +length +(?P<len>(\d+))$')
-
-        p52 = re.compile(r'^Non-Stop +Routing +(?P<nsr>(enabled))$')
-
-        p53_1 = re.compile(r'^BFD +is +enabled +in +strict +mode$')
-
-        p53_2 = re.compile(r'^BFD +is +enabled$')
-
         for line in out.splitlines():
             line = line.strip()
 
             # Routing Process "ospf 1" with ID 10.36.3.3
             # VRF VRF1 in Routing Process "ospf 1" with ID 10.36.3.3
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = str(m.groupdict()['instance'])
                 router_id = str(m.groupdict()['router_id'])
@@ -603,64 +542,64 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Routing Process is shutdown
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 sub_dict['enable'] = False
                 continue
 
             # Domain ID type 0x0005, value 0.0.0.2
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 sub_dict['domain_id_type'] = str(m.groupdict()['domain_id'])
                 sub_dict['domain_id_value'] = str(m.groupdict()['value'])
                 continue
 
             # Start time: 00:23:49.050, Time elapsed: 1d01h
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 sub_dict['start_time'] = str(m.groupdict()['start'])
                 sub_dict['elapsed_time'] = str(m.groupdict()['elapsed'])
                 continue
 
             # Supports only single TOS(TOS0) routes
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 sub_dict['single_tos_route'] = True
                 continue
 
             # Supports opaque LSA
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 sub_dict['opqaue_lsa'] = True
                 continue
 
             # Supports Link-local Signaling (LLS)
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 sub_dict['lls'] = True
                 continue
 
             # Supports area transit capability
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 sub_dict['area_transit'] = True
                 continue
 
             # Supports NSSA (compatible with RFC 3101)
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['nssa'] = True
                 continue
 
             # Supports Database Exchange Summary List Optimization (RFC 5243)
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['db_exchange_summary_list_optimization'] = True
                 continue
 
             # Event-log disabled
             # Event-log enabled, Maximum number of events: 1000, Mode: cyclic
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 if 'event_log' not in sub_dict:
                     sub_dict['event_log'] = {}
@@ -678,7 +617,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # It is an area border router
             # It is an autonomous system boundary router
             # It is an area border and autonomous system boundary router
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 if 'flags' not in sub_dict:
                     sub_dict['flags'] = {}
@@ -689,7 +628,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Redistributing External Routes from,
-            m = p12_1.match(line)
+            m = p.p12_1.match(line)
             if m:
                 if 'redistribution' not in sub_dict:
                     sub_dict['redistribution'] = {}
@@ -699,7 +638,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # connected with metric mapped to 10
             # static
             # static with metric mapped to 10
-            m = p12_2.match(line)
+            m = p.p12_2.match(line)
             if m:
                 the_type = str(m.groupdict()['type'])
                 if the_type not in sub_dict['redistribution']:
@@ -713,7 +652,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # connected, includes subnets in redistribution
             # static, includes subnets in redistribution
             # isis, includes subnets in redistribution
-            m = p12_2_1.match(line)
+            m = p.p12_2_1.match(line)
             if m:
                 the_type = str(m.groupdict()['type'])
                 if the_type not in sub_dict['redistribution']:
@@ -726,7 +665,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # isis 10 with metric mapped to 3333
             # bgp 100 with metric mapped to 100, includes subnets in redistribution, nssa areas only
             # bgp 100, includes subnets in redistribution
-            m = p12_3.match(line)
+            m = p.p12_3.match(line)
             if m:
                 prot = str(m.groupdict()['prot'])
                 if prot not in sub_dict['redistribution']:
@@ -751,7 +690,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Maximum number of redistributed prefixes 4000
             # Maximum number of redistributed prefixes 3000 (warning-only)
-            m = p12_4.match(line)
+            m = p.p12_4.match(line)
             if m:
                 redist_max_prefix = True
                 if 'max_prefix' not in sub_dict['redistribution']:
@@ -765,7 +704,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                     continue
 
             # Threshold for warning message 70%
-            m = p12_5.match(line)
+            m = p.p12_5.match(line)
             if m and redist_max_prefix:
                 redist_max_prefix = False
                 if 'max_prefix' not in sub_dict['redistribution']:
@@ -775,7 +714,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Router is not originating router-LSAs with maximum metric
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 if 'stub_router' not in sub_dict:
                     sub_dict['stub_router'] = {}
@@ -789,7 +728,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Originating router-LSAs with maximum metric
-            m = p14_1.match(line)
+            m = p.p14_1.match(line)
             if m:
                 if 'stub_router' not in sub_dict:
                     sub_dict['stub_router'] = {}
@@ -822,13 +761,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Advertise stub links with maximum metric in router-LSAs
-            m = p14_3.match(line)
+            m = p.p14_3.match(line)
             if m:
                 sub_dict['stub_router'][condition]['include_stub'] = True
                 continue
 
             # Advertise summary-LSAs with metric 16711680
-            m = p14_4.match(line)
+            m = p.p14_4.match(line)
             if m:
                 sub_dict['stub_router'][condition]['summary_lsa'] = True
                 sub_dict['stub_router'][condition]['summary_lsa_metric'] = \
@@ -836,7 +775,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Advertise external-LSAs with metric 16711680
-            m = p14_5.match(line)
+            m = p.p14_5.match(line)
             if m:
                 sub_dict['stub_router'][condition]['external_lsa'] = True
                 sub_dict['stub_router'][condition]['external_lsa_metric'] = \
@@ -844,7 +783,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Initial SPF schedule delay 50 msecs
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -857,7 +796,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Minimum hold time between two consecutive SPFs 200 msecs
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -870,7 +809,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum wait time between two consecutive SPFs 5000 msecs
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -883,7 +822,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Initial LSA throttle delay 50 msecs
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 start = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -896,7 +835,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Minimum hold time for LSA throttle 200 msecs
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 hold = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -909,7 +848,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum wait time for LSA throttle 5000 msecs
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 maximum = int(float(m.groupdict()['time']))
                 if 'spf_control' not in sub_dict:
@@ -923,7 +862,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Minimum LSA interval 200 msecs. Minimum LSA arrival 100 msecs
             # Minimum LSA arrival 100 msecs
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 if 'lsa' not in sub_dict['spf_control']['throttle']:
                     sub_dict['spf_control']['throttle']['lsa'] = {}
@@ -932,7 +871,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Incremental-SPF disabled
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 if 'spf_control' not in sub_dict:
                     sub_dict['spf_control'] = {}
@@ -943,28 +882,28 @@ class ShowIpOspf(ShowIpOspfSchema):
                     continue
 
             # LSA group pacing timer 240 secs
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 sub_dict['lsa_group_pacing_timer'] = \
                     int(float(m.groupdict()['pacing']))
                 continue
 
             # Interface flood pacing timer 33 msecs
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 sub_dict['interface_flood_pacing_timer'] = \
                     int(float(m.groupdict()['interface']))
                 continue
 
             # Retransmission pacing timer 66 msecs
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 sub_dict['retransmission_pacing_timer'] = \
                     int(float(m.groupdict()['retransmission']))
                 continue
 
             # EXCHANGE/LOADING adjacency limit: initial 300, process maximum 300
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 if 'adjacency_stagger' not in sub_dict:
                     sub_dict['adjacency_stagger'] = {}
@@ -978,7 +917,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of external LSA 1. Checksum Sum 0x00607f
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -988,7 +927,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of opaque AS LSA 0. Checksum Sum 00000000
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -998,7 +937,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DCbitless external and opaque AS LSA 0
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1006,7 +945,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DoNotAge external and opaque AS LSA 0
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 if 'numbers' not in sub_dict:
                     sub_dict['numbers'] = {}
@@ -1014,7 +953,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of areas in this router is 1. 1 normal 0 stub 0 nssa
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 sub_dict['total_areas'] = int(m.groupdict()['total_areas'])
                 sub_dict['total_normal_areas'] = int(m.groupdict()['normal'])
@@ -1023,14 +962,14 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of areas transit capable is 0
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 sub_dict['total_areas_transit_capable'] = int(m.groupdict()['num'])
                 continue
 
             # Maximum number of non self-generated LSA allowed 123
             # Maximum number of non self-generated LSA allowed 123 warning-only
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 max_lsa = True
                 if 'database_control' not in sub_dict:
@@ -1042,7 +981,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Current number of non self-generated LSA 0
-            m = p33_1.match(line)
+            m = p.p33_1.match(line)
             if m and max_lsa:
                 max_lsa = False
                 if 'database_control' not in sub_dict:
@@ -1052,7 +991,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Threshold for warning message 75%
-            m = p33_2.match(line)
+            m = p.p33_2.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1061,7 +1000,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Ignore-time 5 minutes, reset-time 10 minutes
-            m = p33_3.match(line)
+            m = p.p33_3.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1072,7 +1011,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Ignore-count allowed 5, current ignore-count 0
-            m = p33_4.match(line)
+            m = p.p33_4.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1083,7 +1022,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Maximum limit of redistributed prefixes 5000 (warning-only)
-            m = p33_5.match(line)
+            m = p.p33_5.match(line)
             if m:
                 if 'database_control' not in sub_dict:
                     sub_dict['database_control'] = {}
@@ -1092,14 +1031,14 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # External flood list length 0
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 sub_dict['external_flood_list_length'] = int(m.groupdict()['num'])
                 continue
 
             # Non-Stop Forwarding enabled
             # IETF Non-Stop Forwarding enabled
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'enabled' in m.groupdict()['enable']:
@@ -1116,7 +1055,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # IETF NSF helper support enabled
             # Cisco NSF helper support enabled
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'enabled' in m.groupdict()['gr_helper']:
@@ -1135,7 +1074,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # restart-interval limit: 11 sec
-            m = p36_1.match(line)
+            m = p.p36_1.match(line)
             if m:
                 sub_dict['graceful_restart'][gr_type]['restart_interval'] = \
                     int(m.groupdict()['num'])
@@ -1143,7 +1082,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Reference bandwidth unit is 100 mbps
             # Reference bandwidth unit is 4294967 mbps
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 bd = int(m.groupdict()['bd'])
                 if 'auto_cost' not in sub_dict:
@@ -1160,7 +1099,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # Area BACKBONE(0)
             # Area BACKBONE(0.0.0.0) (Inactive)
             # Area 1
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 parsed_area = str(m.groupdict()['area'])
                 n = re.match('BACKBONE\((?P<area_num>(\S+))\)', parsed_area)
@@ -1183,7 +1122,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # It is a stub area
             # It is a stub area, no summary LSA in this area
             # It is a NSSA area
-            m = p39_1.match(line)
+            m = p.p39_1.match(line)
             if m:
                 area_type = str(m.groupdict()['area_type']).lower()
                 sub_dict['areas'][area]['area_type'] = area_type
@@ -1196,14 +1135,14 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # generates stub default route with cost 111
             # generates stub default route with cost 222
-            m = p39_2.match(line)
+            m = p.p39_2.match(line)
             if m:
                 sub_dict['areas'][area]['default_cost'] = \
                     int(m.groupdict()['default_cost'])
                 continue
 
             # Area ranges are
-            m = p40_1.match(line)
+            m = p.p40_1.match(line)
             if m:
                 if 'ranges' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['ranges'] = {}
@@ -1212,7 +1151,7 @@ class ShowIpOspf(ShowIpOspfSchema):
             # 10.4.1.0/24 Passive Advertise
             # 10.4.0.0/16 Passive DoNotAdvertise 
             # 10.4.0.0/16 Active(10 - configured) Advertise
-            m = p40_2.match(line)
+            m = p.p40_2.match(line)
             if m:
                 prefix = str(m.groupdict()['prefix'])
                 if 'ranges' not in sub_dict['areas'][area]:
@@ -1231,7 +1170,7 @@ class ShowIpOspf(ShowIpOspfSchema):
 
             # Number of interfaces in this area is 3
             # Number of interfaces in this area is 3 (1 loopback)
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 if 'areas' not in sub_dict:
                     sub_dict['areas'] = {}
@@ -1247,13 +1186,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Area has RRR enabled
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 sub_dict['areas'][area]['rrr_enabled'] = True
                 continue
 
             # SPF algorithm executed 26 times
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1262,7 +1201,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # SPF algorithm last executed 00:19:54.849 ago
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1271,12 +1210,12 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Area has no authentication
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 continue
 
             # Number of LSA 19.  Checksum Sum 0x0a2fb5
-            m = p46.match(line)
+            m = p.p46.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1288,7 +1227,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of opaque link LSA 0.  Checksum Sum 00000000
-            m = p47.match(line)
+            m = p.p47.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1301,7 +1240,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DCbitless LSA 5
-            m = p48.match(line)
+            m = p.p48.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1310,7 +1249,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of indication LSA 0
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1319,7 +1258,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Number of DoNotAge LSA 0
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1328,7 +1267,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # Flood list length 0
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 if 'statistics' not in sub_dict['areas'][area]:
                     sub_dict['areas'][area]['statistics'] = {}
@@ -1337,13 +1276,13 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
         
             # Non-Stop Routing enabled
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 sub_dict['nsr']['enable'] = True
                 continue
 
             # BFD is enabled in strict mode
-            m = p53_1.match(line)
+            m = p.p53_1.match(line)
             if m:
                 if 'bfd' not in sub_dict:
                     sub_dict['bfd'] = {}
@@ -1352,7 +1291,7 @@ class ShowIpOspf(ShowIpOspfSchema):
                 continue
 
             # BFD is enabled
-            m = p53_2.match(line)
+            m = p.p53_2.match(line)
             if m:
                 if 'bfd' not in sub_dict:
                     sub_dict['bfd'] = {}
@@ -1396,6 +1335,12 @@ class ShowIpOspfInterfaceBrief(ShowIpOspfInterfaceBriefSchema):
 
     cli_command = 'show ip ospf interface brief'
 
+    patterns = Patterns(
+        p1=r'^(?P<interface>\S+) +(?P<instance>\S+) +(?P<area>\S+) +'
+            '(?P<address>\S+) +(?P<cost>\d+) +(?P<state>\S+) +(?P<nbrs_full>\d+)'
+            '\/(?P<nbrs_count>\d+)$$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -1405,13 +1350,11 @@ class ShowIpOspfInterfaceBrief(ShowIpOspfInterfaceBriefSchema):
         # Init vars
         ret_dict = {}
         
-        p1 = re.compile(r'^(?P<interface>\S+) +(?P<instance>\S+) +(?P<area>\S+) +'
-            '(?P<address>\S+) +(?P<cost>\d+) +(?P<state>\S+) +(?P<nbrs_full>\d+)'
-            '\/(?P<nbrs_count>\d+)$$')
+        p = ShowIpOspfInterfaceBrief.patterns
 
         for line in out.splitlines():
             line = line.strip()
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 interface = Common.convert_intf_name(
@@ -1770,6 +1713,116 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         'max_flood_scan_length', 'max_flood_scan_time_msec', 'state']
 
 
+    patterns = Patterns(
+        p1=r'^(?P<interface>(\S+)) +is( +administratively)?'
+            ' +(?P<enable>(unknown|up|down)), +line +protocol'
+            ' +is +(?P<line_protocol>(up|down))'
+            '(?: +\(\S+\))?$',
+
+        # Internet Address 0.0.0.1/30|Interface is unnumbered, Interface ID 55, Area 0
+        p2=r'^(Internet +Address|Interface +is) +(?P<address>(\S+)),'
+            '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
+            ' +Area +(?P<area>(\S+))(?:, +Attached +via'
+            ' +(?P<attach>(.*)))?$',
+        p2_1=r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$',
+        p3=r'^Process +ID +(?P<pid>(\S+)),'
+            '(?: +VRF +(?P<vrf>(\S+)))?'
+            ' +Router +ID +(?P<router_id>(\S+)),'
+            ' +Network +Type +(?P<interface_type>(\S+)),'
+            ' +Cost: +(?P<cost>(\d+))$',
+        p5=r'^Configured as demand circuit$',
+        p6=r'^Run as demand circuit$',
+        p7=r'^DoNotAge +LSA +not +allowed +\(Number +of'
+            ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$',
+        p8=r'^Enabled +by +interface +config, +including'
+            ' +secondary +ip +addresses$',
+        p9=r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
+            ' +State +(?P<state>(\S+))'
+            '(?:, +Priority +(?P<priority>(\d+)))?'
+            '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$',
+        p10=r'^Designated +(R|r)outer +\(ID\)'
+             ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
+             ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$',
+        p11=r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
+             ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
+             ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$',
+        p12=r'^Timer +intervals +configured,'
+             ' +Hello +(?P<hello>(\d+)),'
+             ' +Dead +(?P<dead>(\d+)),'
+             ' +Wait +(?P<wait>(\d+)),'
+             ' +Retransmit +(?P<retransmit>(\d+))$',
+        p12_1=r'^oob-resync +timeout +(?P<oob>(\d+))$',
+        p12_2=r'^Hello +due +in +(?P<hello_timer>(\S+))$',
+        p13=r'^Supports +Link-local +Signaling +\(LLS\)$',
+        p14=r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
+             ' +(?P<helper>(enabled|disabled))$',
+        p15=r'^Index +(?P<index>(\S+)),'
+             ' +flood +queue +length +(?P<length>(\d+))$',
+        p16=r'^Next +(?P<next>(\S+))$',
+        p17=r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
+             ' +maximum +is +(?P<max>(\d+))$',
+        p18=r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
+             ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$',
+        p19=r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
+             ' +Adjacent +neighbor +count +is'
+             ' +(?P<adj_nbr_count>(\d+))$',
+        p20_1=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+               ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$',
+        p20_2=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+               ' +\((D|d)esignated +(R|r)outer\)$',
+        p20_3=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+               ' +\(Hello suppressed\)$',
+        p21=r'^Suppress +hello +for +(?P<sup>(\d+))'
+             ' +neighbor\(s\)$',
+        p22=r'^Loopback +interface +is +treated +as +a +stub'
+             ' +Host$',
+        p23=r'^Can +be +protected +by per-+prefix +Loop-Free'
+             ' +FastReroute$',
+        p24=r'^Can +be +used +for +per-prefix +Loop-Free'
+             ' +FastReroute +repair +paths$',
+        p25=r'^Not +Protected +by +per-prefix +TI-LFA$',
+        p26=r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$',
+        p27=r'^Strict +TTL +checking'
+             ' +(?P<strict_ttl>(enabled|disabled))'
+             '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$',
+        p28_1=r'^Simple +password +authentication +enabled$',
+        p28_2=r'^Cryptographic +authentication +enabled$',
+        p28_3=r'^Youngest +key +id +is +(?P<id>(\d+))$',
+        p28_4=r'^Rollover +in +progress, +(?P<num>(\d+))'
+               ' +neighbor(s) +using +the +old +key(s):$',
+        p28_5=r'^key +id +1 +algorithm +MD5$',
+
+        # Segment Routing enabled for MPLS forwarding
+        p29=r'^Segment +Routing +enabled +for +MPLS +forwarding$',
+
+        # TEAPP:
+        p30=r'^TEAPP:$',
+
+        # Topology Id:0x0
+        p30_1=r'^Topology +Id: *(?P<topology_id>[\w]+)$',
+
+        # TEAPP:SRTE
+        p30_2=r'^TEAPP: *(?P<teapp>[\w]+)$',
+
+        # Affinity: length 32, bits 0x00000010
+        p30_3=r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$',
+
+        # Extended affinity: length 32, bits 0x00000010
+        p30_4=r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$',
+
+        # SR Policy Manager:
+        p31=r'^SR +Policy +Manager:$',
+
+        # TE Opaque LSA: Source of link information OSPF
+        p31_1=r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$',
+
+        # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
+        #             0       1          no          no               Base
+        p4=r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+            ' +(?P<topo_name>(\S+))$',
+    )
+
     def cli(self, interface=None, output=None):
         if output is None:
             if interface:
@@ -1790,140 +1843,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
         bool_dict = {'up': True, 'down': False, 'unknown': False}
 
         
-        p1 = re.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
-                            ' +(?P<enable>(unknown|up|down)), +line +protocol'
-                            ' +is +(?P<line_protocol>(up|down))'
-                            '(?: +\(\S+\))?$')
-        # Internet Address 0.0.0.1/30|Interface is unnumbered, Interface ID 55, Area 0
-        p2 = re.compile(r'^(Internet +Address|Interface +is) +(?P<address>(\S+)),'
-                            '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
-                            ' +Area +(?P<area>(\S+))(?:, +Attached +via'
-                            ' +(?P<attach>(.*)))?$')
- 
-        p2_1 = re.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
- 
-        p3 = re.compile(r'^Process +ID +(?P<pid>(\S+)),'
-                            '(?: +VRF +(?P<vrf>(\S+)))?'
-                            ' +Router +ID +(?P<router_id>(\S+)),'
-                            ' +Network +Type +(?P<interface_type>(\S+)),'
-                            ' +Cost: +(?P<cost>(\d+))$')
-
-        p5 = re.compile(r'^Configured as demand circuit$')
- 
-        p6 = re.compile(r'^Run as demand circuit$')
- 
-        p7 = re.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
-                            ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
- 
-        p8 = re.compile(r'^Enabled +by +interface +config, +including'
-                            ' +secondary +ip +addresses$')
- 
-        p9 = re.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
-                            ' +State +(?P<state>(\S+))'
-                            '(?:, +Priority +(?P<priority>(\d+)))?'
-                            '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
- 
-        p10 = re.compile(r'^Designated +(R|r)outer +\(ID\)'
-                            ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
- 
-        p11 = re.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
-                            ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
- 
-        p12 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            ' +Retransmit +(?P<retransmit>(\d+))$')
- 
-        p12_1 = re.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
- 
-        p12_2 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
- 
-        p13 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
- 
-        p14 = re.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
-                            ' +(?P<helper>(enabled|disabled))$')
- 
-        p15 = re.compile(r'^Index +(?P<index>(\S+)),'
-                            ' +flood +queue +length +(?P<length>(\d+))$')
- 
-        p16 = re.compile(r'^Next +(?P<next>(\S+))$')
- 
-        p17 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
-                            ' +maximum +is +(?P<max>(\d+))$')
- 
-        p18 = re.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
-                            ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
- 
-        p19 = re.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
-                            ' +Adjacent +neighbor +count +is'
-                            ' +(?P<adj_nbr_count>(\d+))$')
- 
-        p20_1 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
- 
-        p20_2 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((D|d)esignated +(R|r)outer\)$')
- 
-        p20_3 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\(Hello suppressed\)$')
- 
-        p21 = re.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
-                            ' +neighbor\(s\)$')
- 
-        p22 = re.compile(r'^Loopback +interface +is +treated +as +a +stub'
-                            ' +Host$')
- 
-        p23 = re.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
-                            ' +FastReroute$')
- 
-        p24 = re.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
-                            ' +FastReroute +repair +paths$')
- 
-        p25 = re.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
- 
-        p26 = re.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
- 
-        p27 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
- 
-        p28_1 = re.compile(r'^Simple +password +authentication +enabled$')
- 
-        p28_2 = re.compile(r'^Cryptographic +authentication +enabled$')
- 
-        p28_3 = re.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
- 
-        p28_4 = re.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
-                            ' +neighbor(s) +using +the +old +key(s):$')
- 
-        p28_5 = re.compile(r'^key +id +1 +algorithm +MD5$')
-
-        # Segment Routing enabled for MPLS forwarding
-        p29 = re.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
-
-        # TEAPP:
-        p30 = re.compile(r'^TEAPP:$')
-
-        # Topology Id:0x0
-        p30_1 = re.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
-
-        # TEAPP:SRTE
-        p30_2 = re.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
-
-        # Affinity: length 32, bits 0x00000010
-        p30_3 = re.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
-
-        # Extended affinity: length 32, bits 0x00000010
-        p30_4 = re.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
-
-        # SR Policy Manager:
-        p31 = re.compile(r'^SR +Policy +Manager:$')
-
-        # TE Opaque LSA: Source of link information OSPF
-        p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
+        patterns = ShowIpOspfInterface.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -1937,7 +1857,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
             # TenGigabitEthernet1/8 is down, line protocol is down (notconnect)
             # TenGigabitEthernet2/6.3052 is administratively down, line protocol is down (disabled)
             # TenGigabitEthernet1/15 is down, line protocol is down (err-disabled)
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 interface = str(m.groupdict()['interface'])
                 enable = str(m.groupdict()['enable'])
@@ -1962,7 +1882,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
             # Internet Address 10.4.1.1/32, Interface ID 11, Area 0
             # Internet Address 0.0.0.0/0, Area 0, Attached via Not Attached
             # Internet Address 10.229.4.4/24, Area 1, Attached via Interface Enable
-            m = p2.match(line)
+            m = patterns.p2.match(line)
             if m:
                 ip_address = str(m.groupdict()['address'])
                 area = str(IPAddress(str(m.groupdict()['area'])))
@@ -1973,7 +1893,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Attached via Interface Enable
-            m = p2_1.match(line)
+            m = patterns.p2_1.match(line)
             if m:
                 attached = str(m.groupdict()['attached']).lower()
                 continue
@@ -1981,7 +1901,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
             # Process ID 1, Router ID 10.64.4.4, Network Type VIRTUAL_LINK, Cost: 1
             # Process ID 2, Router ID 10.229.11.11, Network Type SHAM_LINK, Cost: 111
             # Process ID 1, Router ID 10.4.1.1, Network Type BROADCAST, Cost: 1
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 instance = str(m.groupdict()['pid'])
                 router_id = str(m.groupdict()['router_id'])
@@ -2182,12 +2102,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     pass
                 continue
 
-            # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
-            #             0       1          no          no               Base
-            p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                             ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                             ' +(?P<topo_name>(\S+))$')
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
                 if 'topology' not in sub_dict:
@@ -2207,26 +2122,26 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     continue
 
             # Configured as demand circuit
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 sub_dict['demand_circuit'] = True
                 continue
 
             # Run as demand circuit
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m:
                 sub_dict['demand_circuit'] = True
                 continue
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1).
-            m = p7.match(line)
+            m = patterns.p7.match(line)
             if m:
                 sub_dict['donotage_lsa'] = False
                 sub_dict['total_dcbitless_lsa'] = int(m.groupdict()['num'])
                 continue
 
             # Enabled by interface config, including secondary ip addresses
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 sub_dict['if_cfg'] = True
                 continue
@@ -2234,7 +2149,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
             # Transmit Delay is 1 sec, State POINT_TO_POINT
             # Transmit Delay is 1 sec, State DR, Priority 1
             # Transmit Delay is 1 sec, State DR, Priority 111, BFD enabled
-            m = p9.match(line)
+            m = patterns.p9.match(line)
             if m:
                 sub_dict['transmit_delay'] = int(m.groupdict()['delay'])
                 state = str(m.groupdict()['state']).lower()
@@ -2252,21 +2167,21 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                         continue
 
             # Designated Router (ID) 10.36.3.3, Interface address 10.2.3.3
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 sub_dict['dr_router_id'] = str(m.groupdict()['dr_router_id'])
                 sub_dict['dr_ip_addr'] = str(m.groupdict()['dr_ip_addr'])
                 continue
 
             # Backup Designated router (ID) 10.16.2.2, Interface address 10.2.3.2
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 sub_dict['bdr_router_id'] = str(m.groupdict()['bdr_router_id'])
                 sub_dict['bdr_ip_addr'] = str(m.groupdict()['bdr_ip_addr'])
                 continue
 
             # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-            m = p12.match(line)
+            m = patterns.p12.match(line)
             if m:
                 sub_dict['hello_interval'] = int(m.groupdict()['hello'])
                 sub_dict['dead_interval'] = int(m.groupdict()['dead'])
@@ -2275,27 +2190,27 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             #  oob-resync timeout 40
-            m = p12_1.match(line)
+            m = patterns.p12_1.match(line)
             if m:
                 sub_dict['oob_resync_timeout'] = int(m.groupdict()['oob'])
                 continue
             
             # Hello due in 00:00:00
-            m = p12_2.match(line)
+            m = patterns.p12_2.match(line)
             if m:
                 sub_dict['passive'] = False
                 sub_dict['hello_timer'] = str(m.groupdict()['hello_timer'])
                 continue
 
             # Supports Link-local Signaling (LLS)
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m:
                 sub_dict['lls'] = True
                 continue
             
             # Cisco NSF helper support enabled
             # IETF NSF helper support enabled
-            m = p14.match(line)
+            m = patterns.p14.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'graceful_restart' not in sub_dict:
@@ -2310,27 +2225,27 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Index 2/2, flood queue length 0
-            m = p15.match(line)
+            m = patterns.p15.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 sub_dict['flood_queue_length'] = int(m.groupdict()['length'])
                 continue
 
             # Next 0(0)/0(0)
-            m = p16.match(line)
+            m = patterns.p16.match(line)
             if m:
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last flood scan length is 0, maximum is 11
-            m = p17.match(line)
+            m = patterns.p17.match(line)
             if m:
                 sub_dict['last_flood_scan_length'] = int(m.groupdict()['num'])
                 sub_dict['max_flood_scan_length'] = int(m.groupdict()['max'])
                 continue
 
             # Last flood scan time is 0 msec, maximum is 1 msec
-            m = p18.match(line)
+            m = patterns.p18.match(line)
             if m:
                 sub_dict['last_flood_scan_time_msec'] = \
                     int(m.groupdict()['time1'])
@@ -2339,7 +2254,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Neighbor Count is 1, Adjacent neighbor count is 1
-            m = p19.match(line)
+            m = patterns.p19.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -2350,7 +2265,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Adjacent with neighbor 10.16.2.2 (Backup Designated Router)
-            m = p20_1.match(line)
+            m = patterns.p20_1.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -2361,7 +2276,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Adjacent with neighbor 10.36.3.3 (Designated Router)
-            m = p20_2.match(line)
+            m = patterns.p20_2.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -2372,7 +2287,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Adjacent with neighbor 10.64.4.4 (Hello suppressed)
-            m = p20_3.match(line)
+            m = patterns.p20_3.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -2382,7 +2297,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Suppress hello for 0 neighbor(s)
-            m = p21.match(line)
+            m = patterns.p21.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -2391,31 +2306,31 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Loopback interface is treated as a stub Host
-            m = p22.match(line)
+            m = patterns.p22.match(line)
             if m:
                 sub_dict['stub_host'] = True
                 continue
 
             # Can be protected by per-prefix Loop-Free FastReroute
-            m = p23.match(line)
+            m = patterns.p23.match(line)
             if m:
                 sub_dict['ipfrr_protected'] = True
                 continue
 
             # Can be used for per-prefix Loop-Free FastReroute repair paths
-            m = p24.match(line)
+            m = patterns.p24.match(line)
             if m:
                 sub_dict['ipfrr_candidate'] = True
                 continue
 
             # Not Protected by per-prefix TI-LFA
-            m = p25.match(line)
+            m = patterns.p25.match(line)
             if m:
                 sub_dict['ti_lfa_protected'] = False
                 continue
 
             # Prefix-suppression is enabled
-            m = p26.match(line)
+            m = patterns.p26.match(line)
             if m:
                 if 'enabled' in m.groupdict()['ps']:
                     sub_dict['prefix_suppression'] = True
@@ -2423,7 +2338,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     sub_dict['prefix_suppression'] = False
 
             # Strict TTL checking enabled, up to 3 hops allowed
-            m = p27.match(line)
+            m = patterns.p27.match(line)
             if m:
                 if 'ttl_security' not in sub_dict:
                     sub_dict['ttl_security'] = {}
@@ -2436,7 +2351,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                     continue
 
             # Simple password authentication enabled
-            m = p28_1.match(line)
+            m = patterns.p28_1.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -2447,7 +2362,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Cryptographic authentication enabled
-            m = p28_2.match(line)
+            m = patterns.p28_2.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -2458,7 +2373,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Youngest key id is 2
-            m = p28_3.match(line)
+            m = patterns.p28_3.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -2469,12 +2384,12 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
             
             # Rollover in progress, 1 neighbor(s) using the old key(s):
-            m = p28_4.match(line)
+            m = patterns.p28_4.match(line)
             if m:
                 continue
 
             # key id 1 algorithm MD5
-            m = p28_5.match(line)
+            m = patterns.p28_5.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -2485,19 +2400,19 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Segment Routing enabled for MPLS forwarding
-            m = p29.match(line)
+            m = patterns.p29.match(line)
             if m:
                 sub_dict.update({'sr_mpls_enabled': True})
                 continue
 
             # TEAPP:
-            m = p30.match(line)
+            m = patterns.p30.match(line)
             if m:
                 teapp_dict = sub_dict.setdefault('teapp', {})
                 continue
 
             # Topology Id:0x0
-            m = p30_1.match(line)
+            m = patterns.p30_1.match(line)
             if m:
                 topology_id = m.groupdict()['topology_id']
                 teapp_dict = sub_dict.setdefault('teapp', {})
@@ -2505,7 +2420,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # TEAPP:SRTE
-            m = p30_2.match(line)
+            m = patterns.p30_2.match(line)
             if m:
                 teapp = m.groupdict()['teapp']
                 teapp_dict = sub_dict.setdefault('teapp', {})
@@ -2513,7 +2428,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Affinity: length 32, bits 0x00000010
-            m = p30_3.match(line)
+            m = patterns.p30_3.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 bits = m.groupdict()['bits']
@@ -2523,7 +2438,7 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
 
             # Extended affinity: length 32, bits 0x00000010
-            m = p30_4.match(line)
+            m = patterns.p30_4.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 bits = m.groupdict()['bits']
@@ -2533,13 +2448,13 @@ class ShowIpOspfInterface(ShowIpOspfInterfaceSchema):
                 continue
             
             # SR Policy Manager:
-            m = p31.match(line)
+            m = patterns.p31.match(line)
             if m:
                 mgn_dict = sub_dict.setdefault('sr_policy_manager', {})
                 continue
 
             # TE Opaque LSA: Source of link information OSPF
-            m = p31_1.match(line)
+            m = patterns.p31_1.match(line)
             if m:
                 mgn_dict.update({'te_opaque_lsa': m.groupdict()['te_opaque_lsa']})
 
@@ -2861,154 +2776,131 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
 
     cli_command = 'show ip ospf interface__'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4' # this is ospf - always ipv4
-
-        # Mapping dict
-        bool_dict = {'up': True, 'down': False, 'unknown': False}
+    patterns = Patterns(
+        p1=r'^(?P<interface>(\S+)) +is( +administratively)?'
+            ' +(?P<enable>(unknown|up|down)), +line +protocol'
+            ' +is +(?P<line_protocol>(up|down))'
+            '(?: +\(\S+\))?$',
 
-        
-        p1 = re.compile(r'^(?P<interface>(\S+)) +is( +administratively)?'
-                            ' +(?P<enable>(unknown|up|down)), +line +protocol'
-                            ' +is +(?P<line_protocol>(up|down))'
-                            '(?: +\(\S+\))?$')
         # Internet Address 0.0.0.1/30|Interface is unnumbered, Interface ID 55, Area 0
-        p2 = re.compile(r'^(Internet +Address|Interface +is) +(?P<address>(\S+)),'
-                            '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
-                            ' +Area +(?P<area>(\S+))(?:, +Attached +via'
-                            ' +(?P<attach>(.*)))?$')
- 
-        p2_1 = re.compile(r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$')
- 
-        p3 = re.compile(r'^Process +ID +(?P<pid>(\S+)),'
-                            '(?: +VRF +(?P<vrf>(\S+)))?'
-                            ' +Router +ID +(?P<router_id>(\S+)),'
-                            ' +Network +Type +(?P<interface_type>(\S+)),'
-                            ' +Cost: +(?P<cost>(\d+))$')
-
-        p5 = re.compile(r'^Configured as demand circuit$')
- 
-        p6 = re.compile(r'^Run as demand circuit$')
- 
-        p7 = re.compile(r'^DoNotAge +LSA +not +allowed +\(Number +of'
-                            ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$')
- 
-        p8 = re.compile(r'^Enabled +by +interface +config, +including'
-                            ' +secondary +ip +addresses$')
- 
-        p9 = re.compile(r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
-                            ' +State +(?P<state>(\S+))'
-                            '(?:, +Priority +(?P<priority>(\d+)))?'
-                            '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$')
- 
-        p10 = re.compile(r'^Designated +(R|r)outer +\(ID\)'
-                            ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$')
- 
-        p11 = re.compile(r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
-                            ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
-                            ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$')
- 
-        p12 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            ' +Retransmit +(?P<retransmit>(\d+))$')
- 
-        p12_1 = re.compile(r'^oob-resync +timeout +(?P<oob>(\d+))$')
- 
-        p12_2 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
- 
-        p13 = re.compile(r'^Supports +Link-local +Signaling +\(LLS\)$')
- 
-        p14 = re.compile(r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
-                            ' +(?P<helper>(enabled|disabled))$')
- 
-        p15 = re.compile(r'^Index +(?P<index>(\S+)),'
-                            ' +flood +queue +length +(?P<length>(\d+))$')
- 
-        p16 = re.compile(r'^Next +(?P<next>(\S+))$')
- 
-        p17 = re.compile(r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
-                            ' +maximum +is +(?P<max>(\d+))$')
- 
-        p18 = re.compile(r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
-                            ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$')
- 
-        p19 = re.compile(r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
-                            ' +Adjacent +neighbor +count +is'
-                            ' +(?P<adj_nbr_count>(\d+))$')
- 
-        p20_1 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$')
- 
-        p20_2 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\((D|d)esignated +(R|r)outer\)$')
- 
-        p20_3 = re.compile(r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
-                            ' +\(Hello suppressed\)$')
- 
-        p21 = re.compile(r'^Suppress +hello +for +(?P<sup>(\d+))'
-                            ' +neighbor\(s\)$')
- 
-        p22 = re.compile(r'^Loopback +interface +is +treated +as +a +stub'
-                            ' +Host$')
- 
-        p23 = re.compile(r'^Can +be +protected +by per-+prefix +Loop-Free'
-                            ' +FastReroute$')
- 
-        p24 = re.compile(r'^Can +be +used +for +per-prefix +Loop-Free'
-                            ' +FastReroute +repair +paths$')
- 
-        p25 = re.compile(r'^Not +Protected +by +per-prefix +TI-LFA$')
- 
-        p26 = re.compile(r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$')
- 
-        p27 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
- 
-        p28_1 = re.compile(r'^Simple +password +authentication +enabled$')
- 
-        p28_2 = re.compile(r'^Cryptographic +authentication +enabled$')
- 
-        p28_3 = re.compile(r'^Youngest +key +id +is +(?P<id>(\d+))$')
- 
-        p28_4 = re.compile(r'^Rollover +in +progress, +(?P<num>(\d+))'
-                            ' +neighbor(s) +using +the +old +key(s):$')
- 
-        p28_5 = re.compile(r'^key +id +1 +algorithm +MD5$')
+        p2=r'^(Internet +Address|Interface +is) +(?P<address>(\S+)),'
+            '(?: +Interface +ID +(?P<intf_id>(\d+)),)?'
+            ' +Area +(?P<area>(\S+))(?:, +Attached +via'
+            ' +(?P<attach>(.*)))?$',
+        p2_1=r'^Attached +via +(?P<attached>([a-zA-Z0-9\s]+))$',
+        p3=r'^Process +ID +(?P<pid>(\S+)),'
+            '(?: +VRF +(?P<vrf>(\S+)))?'
+            ' +Router +ID +(?P<router_id>(\S+)),'
+            ' +Network +Type +(?P<interface_type>(\S+)),'
+            ' +Cost: +(?P<cost>(\d+))$',
+        p5=r'^Configured as demand circuit$',
+        p6=r'^Run as demand circuit$',
+        p7=r'^DoNotAge +LSA +not +allowed +\(Number +of'
+            ' +DCbitless +LSA +is +(?P<num>(\d+))\)\.$',
+        p8=r'^Enabled +by +interface +config, +including'
+            ' +secondary +ip +addresses$',
+        p9=r'^Transmit +Delay is +(?P<delay>(\d+)) +sec,'
+            ' +State +(?P<state>(\S+))'
+            '(?:, +Priority +(?P<priority>(\d+)))?'
+            '(?:, +BFD +(?P<bfd>(enabled|disabled)))?$',
+        p10=r'^Designated +(R|r)outer +\(ID\)'
+             ' +(?P<dr_router_id>(\S+)), +(I|i)nterface'
+             ' +(A|a)ddress +(?P<dr_ip_addr>(\S+))$',
+        p11=r'^Backup +(D|d)esignated +(R|r)outer +\(ID\)'
+             ' +(?P<bdr_router_id>(\S+)), +(I|i)nterface'
+             ' +(A|a)ddress +(?P<bdr_ip_addr>(\S+))$',
+        p12=r'^Timer +intervals +configured,'
+             ' +Hello +(?P<hello>(\d+)),'
+             ' +Dead +(?P<dead>(\d+)),'
+             ' +Wait +(?P<wait>(\d+)),'
+             ' +Retransmit +(?P<retransmit>(\d+))$',
+        p12_1=r'^oob-resync +timeout +(?P<oob>(\d+))$',
+        p12_2=r'^Hello +due +in +(?P<hello_timer>(\S+))$',
+        p13=r'^Supports +Link-local +Signaling +\(LLS\)$',
+        p14=r'^(?P<gr_type>(Cisco|IETF)) +NSF +helper +support'
+             ' +(?P<helper>(enabled|disabled))$',
+        p15=r'^Index +(?P<index>(\S+)),'
+             ' +flood +queue +length +(?P<length>(\d+))$',
+        p16=r'^Next +(?P<next>(\S+))$',
+        p17=r'^Last +flood +scan +length +is +(?P<num>(\d+)),'
+             ' +maximum +is +(?P<max>(\d+))$',
+        p18=r'^Last +flood +scan +time +is +(?P<time1>(\d+))'
+             ' +msec, +maximum +is +(?P<time2>(\d+)) +msec$',
+        p19=r'^Neighbor +Count +is +(?P<nbr_count>(\d+)),'
+             ' +Adjacent +neighbor +count +is'
+             ' +(?P<adj_nbr_count>(\d+))$',
+        p20_1=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+               ' +\((B|b)ackup +(D|d)esignated +(R|r)outer\)$',
+        p20_2=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+               ' +\((D|d)esignated +(R|r)outer\)$',
+        p20_3=r'^Adjacent +with +neighbor +(?P<nbr>(\S+))'
+               ' +\(Hello suppressed\)$',
+        p21=r'^Suppress +hello +for +(?P<sup>(\d+))'
+             ' +neighbor\(s\)$',
+        p22=r'^Loopback +interface +is +treated +as +a +stub'
+             ' +Host$',
+        p23=r'^Can +be +protected +by per-+prefix +Loop-Free'
+             ' +FastReroute$',
+        p24=r'^Can +be +used +for +per-prefix +Loop-Free'
+             ' +FastReroute +repair +paths$',
+        p25=r'^Not +Protected +by +per-prefix +TI-LFA$',
+        p26=r'^Prefix-suppression +is +(?P<ps>(enabled|disabled))$',
+        p27=r'^Strict +TTL +checking'
+             ' +(?P<strict_ttl>(enabled|disabled))'
+             '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$',
+        p28_1=r'^Simple +password +authentication +enabled$',
+        p28_2=r'^Cryptographic +authentication +enabled$',
+        p28_3=r'^Youngest +key +id +is +(?P<id>(\d+))$',
+        p28_4=r'^Rollover +in +progress, +(?P<num>(\d+))'
+               ' +neighbor(s) +using +the +old +key(s):$',
+        p28_5=r'^key +id +1 +algorithm +MD5$',
 
         # Segment Routing enabled for MPLS forwarding
-        p29 = re.compile(r'^Segment +Routing +enabled +for +MPLS +forwarding$')
+        p29=r'^Segment +Routing +enabled +for +MPLS +forwarding$',
 
         # TEAPP:
-        p30 = re.compile(r'^TEAPP:$')
+        p30=r'^TEAPP:$',
 
         # Topology Id:0x0
-        p30_1 = re.compile(r'^Topology +Id: *(?P<topology_id>[\w]+)$')
+        p30_1=r'^Topology +Id: *(?P<topology_id>[\w]+)$',
 
         # TEAPP:SRTE
-        p30_2 = re.compile(r'^TEAPP: *(?P<teapp>[\w]+)$')
+        p30_2=r'^TEAPP: *(?P<teapp>[\w]+)$',
 
         # Affinity: length 32, bits 0x00000010
-        p30_3 = re.compile(r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_3=r'^Affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$',
 
         # Extended affinity: length 32, bits 0x00000010
-        p30_4 = re.compile(r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$')
+        p30_4=r'^Extended +affinity: *length +(?P<length>\d+), +bits +(?P<bits>\w+)$',
 
         # SR Policy Manager:
-        p31 = re.compile(r'^SR +Policy +Manager:$')
+        p31=r'^SR +Policy +Manager:$',
 
         # TE Opaque LSA: Source of link information OSPF
-        p31_1 = re.compile(r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$')
+        p31_1=r'^TE +Opaque +LSA: +(?P<te_opaque_lsa>[\S\s]+)$',
+
+        # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
+        #             0       1          no          no               Base
+        p4=r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+            ' +(?P<topo_name>(\S+))$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4' # this is ospf - always ipv4
+
+        # Mapping dict
+        bool_dict = {'up': True, 'down': False, 'unknown': False}
+
+        
+        p = ShowIpOspfInterface2.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -3022,7 +2914,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
             # TenGigabitEthernet1/8 is down, line protocol is down (notconnect)
             # TenGigabitEthernet2/6.3052 is administratively down, line protocol is down (disabled)
             # TenGigabitEthernet1/15 is down, line protocol is down (err-disabled)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = str(m.groupdict()['interface'])
                 enable = str(m.groupdict()['enable'])
@@ -3047,7 +2939,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
             # Internet Address 10.4.1.1/32, Interface ID 11, Area 0
             # Internet Address 0.0.0.0/0, Area 0, Attached via Not Attached
             # Internet Address 10.229.4.4/24, Area 1, Attached via Interface Enable
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ip_address = str(m.groupdict()['address'])
                 area = str(IPAddress(str(m.groupdict()['area'])))
@@ -3058,7 +2950,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Attached via Interface Enable
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 attached = str(m.groupdict()['attached']).lower()
                 continue
@@ -3066,7 +2958,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
             # Process ID 1, Router ID 10.64.4.4, Network Type VIRTUAL_LINK, Cost: 1
             # Process ID 2, Router ID 10.229.11.11, Network Type SHAM_LINK, Cost: 111
             # Process ID 1, Router ID 10.4.1.1, Network Type BROADCAST, Cost: 1
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 instance = str(m.groupdict()['pid'])
                 router_id = str(m.groupdict()['router_id'])
@@ -3155,12 +3047,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                     pass
                 continue
 
-            # Topology-MTID    Cost    Disabled    Shutdown      Topology Name
-            #             0       1          no          no               Base
-            p4 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                             ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                             ' +(?P<topo_name>(\S+))$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
                 if 'topology' not in sub_dict:
@@ -3180,26 +3067,26 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                     continue
 
             # Configured as demand circuit
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 sub_dict['demand_circuit'] = True
                 continue
 
             # Run as demand circuit
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 sub_dict['demand_circuit'] = True
                 continue
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1).
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 sub_dict['donotage_lsa'] = False
                 sub_dict['total_dcbitless_lsa'] = int(m.groupdict()['num'])
                 continue
 
             # Enabled by interface config, including secondary ip addresses
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['if_cfg'] = True
                 continue
@@ -3207,7 +3094,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
             # Transmit Delay is 1 sec, State POINT_TO_POINT
             # Transmit Delay is 1 sec, State DR, Priority 1
             # Transmit Delay is 1 sec, State DR, Priority 111, BFD enabled
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['transmit_delay'] = int(m.groupdict()['delay'])
                 state = str(m.groupdict()['state']).lower()
@@ -3225,21 +3112,21 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                         continue
 
             # Designated Router (ID) 10.36.3.3, Interface address 10.2.3.3
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 sub_dict['dr_router_id'] = str(m.groupdict()['dr_router_id'])
                 sub_dict['dr_ip_addr'] = str(m.groupdict()['dr_ip_addr'])
                 continue
 
             # Backup Designated router (ID) 10.16.2.2, Interface address 10.2.3.2
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 sub_dict['bdr_router_id'] = str(m.groupdict()['bdr_router_id'])
                 sub_dict['bdr_ip_addr'] = str(m.groupdict()['bdr_ip_addr'])
                 continue
 
             # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 sub_dict['hello_interval'] = int(m.groupdict()['hello'])
                 sub_dict['dead_interval'] = int(m.groupdict()['dead'])
@@ -3248,27 +3135,27 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             #  oob-resync timeout 40
-            m = p12_1.match(line)
+            m = p.p12_1.match(line)
             if m:
                 sub_dict['oob_resync_timeout'] = int(m.groupdict()['oob'])
                 continue
             
             # Hello due in 00:00:00
-            m = p12_2.match(line)
+            m = p.p12_2.match(line)
             if m:
                 sub_dict['passive'] = False
                 sub_dict['hello_timer'] = str(m.groupdict()['hello_timer'])
                 continue
 
             # Supports Link-local Signaling (LLS)
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 sub_dict['lls'] = True
                 continue
             
             # Cisco NSF helper support enabled
             # IETF NSF helper support enabled
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 gr_type = str(m.groupdict()['gr_type']).lower()
                 if 'graceful_restart' not in sub_dict:
@@ -3283,27 +3170,27 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Index 2/2, flood queue length 0
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 sub_dict['flood_queue_length'] = int(m.groupdict()['length'])
                 continue
 
             # Next 0(0)/0(0)
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last flood scan length is 0, maximum is 11
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 sub_dict['last_flood_scan_length'] = int(m.groupdict()['num'])
                 sub_dict['max_flood_scan_length'] = int(m.groupdict()['max'])
                 continue
 
             # Last flood scan time is 0 msec, maximum is 1 msec
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 sub_dict['last_flood_scan_time_msec'] = \
                     int(m.groupdict()['time1'])
@@ -3312,7 +3199,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Neighbor Count is 1, Adjacent neighbor count is 1
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -3323,7 +3210,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Adjacent with neighbor 10.16.2.2 (Backup Designated Router)
-            m = p20_1.match(line)
+            m = p.p20_1.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -3334,7 +3221,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Adjacent with neighbor 10.36.3.3 (Designated Router)
-            m = p20_2.match(line)
+            m = p.p20_2.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -3345,7 +3232,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Adjacent with neighbor 10.64.4.4 (Hello suppressed)
-            m = p20_3.match(line)
+            m = p.p20_3.match(line)
             if m:
                 neighbor = str(m.groupdict()['nbr'])
                 if 'neighbors' not in sub_dict:
@@ -3355,7 +3242,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Suppress hello for 0 neighbor(s)
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -3364,31 +3251,31 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Loopback interface is treated as a stub Host
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 sub_dict['stub_host'] = True
                 continue
 
             # Can be protected by per-prefix Loop-Free FastReroute
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 sub_dict['ipfrr_protected'] = True
                 continue
 
             # Can be used for per-prefix Loop-Free FastReroute repair paths
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 sub_dict['ipfrr_candidate'] = True
                 continue
 
             # Not Protected by per-prefix TI-LFA
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 sub_dict['ti_lfa_protected'] = False
                 continue
 
             # Prefix-suppression is enabled
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 if 'enabled' in m.groupdict()['ps']:
                     sub_dict['prefix_suppression'] = True
@@ -3396,7 +3283,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                     sub_dict['prefix_suppression'] = False
 
             # Strict TTL checking enabled, up to 3 hops allowed
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'ttl_security' not in sub_dict:
                     sub_dict['ttl_security'] = {}
@@ -3409,7 +3296,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                     continue
 
             # Simple password authentication enabled
-            m = p28_1.match(line)
+            m = p.p28_1.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -3420,7 +3307,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Cryptographic authentication enabled
-            m = p28_2.match(line)
+            m = p.p28_2.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -3431,7 +3318,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Youngest key id is 2
-            m = p28_3.match(line)
+            m = p.p28_3.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -3442,12 +3329,12 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
             
             # Rollover in progress, 1 neighbor(s) using the old key(s):
-            m = p28_4.match(line)
+            m = p.p28_4.match(line)
             if m:
                 continue
 
             # key id 1 algorithm MD5
-            m = p28_5.match(line)
+            m = p.p28_5.match(line)
             if m:
                 if 'authentication' not in sub_dict:
                     sub_dict['authentication'] = {}
@@ -3458,19 +3345,19 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Segment Routing enabled for MPLS forwarding
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 sub_dict.update({'sr_mpls_enabled': True})
                 continue
 
             # TEAPP:
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 teapp_dict = sub_dict.setdefault('teapp', {})
                 continue
 
             # Topology Id:0x0
-            m = p30_1.match(line)
+            m = p.p30_1.match(line)
             if m:
                 topology_id = m.groupdict()['topology_id']
                 teapp_dict = sub_dict.setdefault('teapp', {})
@@ -3478,7 +3365,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # TEAPP:SRTE
-            m = p30_2.match(line)
+            m = p.p30_2.match(line)
             if m:
                 teapp = m.groupdict()['teapp']
                 teapp_dict = sub_dict.setdefault('teapp', {})
@@ -3486,7 +3373,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Affinity: length 32, bits 0x00000010
-            m = p30_3.match(line)
+            m = p.p30_3.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 bits = m.groupdict()['bits']
@@ -3496,7 +3383,7 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
 
             # Extended affinity: length 32, bits 0x00000010
-            m = p30_4.match(line)
+            m = p.p30_4.match(line)
             if m:
                 length = int(m.groupdict()['length'])
                 bits = m.groupdict()['bits']
@@ -3506,13 +3393,13 @@ class ShowIpOspfInterface2(ShowIpOspfInterface2Schema):
                 continue
             
             # SR Policy Manager:
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 mgn_dict = sub_dict.setdefault('sr_policy_manager', {})
                 continue
 
             # TE Opaque LSA: Source of link information OSPF
-            m = p31_1.match(line)
+            m = p.p31_1.match(line)
             if m:
                 mgn_dict.update({'te_opaque_lsa': m.groupdict()['te_opaque_lsa']})
 
@@ -3530,6 +3417,45 @@ class ShowIpOspfLinksParser(MetaParser):
         * 'show ip ospf sham-links'
     '''
 
+    patterns = Patterns(
+        p1=r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
+            ' +(address|router) +(?P<address>(\S+)) +is'
+            ' +(?P<link_state>(up|down))$',
+        p2=r'^Area +(?P<area>(\S+)),? +source +address'
+            ' +(?P<source_address>(\S+))$',
+        p3=r'^Run +as +demand +circuit$',
+        p4=r'^DoNotAge +LSA +not +allowed'
+            ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
+            '(?: +Cost +of +using +(?P<cost>(\d+)))?'
+            '(?: State +(?P<state>(\S+)))?$',
+        p5=r'^Transit +area +(?P<area>(\S+)),'
+            '(?: +via +interface +(?P<intf>(\S+)))?$',
+        p6=r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+            ' +(?P<topo_name>(\S+))$',
+        p7=r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
+            ' +sec, +State +(?P<state>(\S+)),?$',
+        p8=r'^Timer +intervals +configured,'
+            ' +Hello +(?P<hello>(\d+)),'
+            ' +Dead +(?P<dead>(\d+)),'
+            ' +Wait +(?P<wait>(\d+)),'
+            '(?: +Retransmit +(?P<retransmit>(\d+)))?$',
+        p9=r'^Strict +TTL +checking'
+            ' +(?P<strict_ttl>(enabled|disabled))'
+            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$',
+        p10=r'^Hello +due +in +(?P<hello_timer>(\S+))$',
+        p11=r'^Adjacency +State +(?P<adj_state>(\S+))$',
+        p12=r'^Index +(?P<index>(\S+)), +retransmission +queue'
+             ' +length +(?P<length>(\d+)), +number +of'
+             ' +retransmission +(?P<retrans>(\d+))$',
+        p13=r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$',
+        p14=r'^Last +retransmission +scan +length +is'
+             ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$',
+        p15=r'^Last +retransmission +scan +time +is'
+             ' +(?P<time>(\d+)) +msec, +maximum +is'
+             ' +(?P<max>(\d+)) +msec$',
+    )
+
     def cli(self, cmd, link_type,output=None):
 
         assert link_type in ['virtual_links', 'sham_links']
@@ -3547,63 +3473,14 @@ class ShowIpOspfLinksParser(MetaParser):
         crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
 
 
-        p1 = re.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
-                            ' +(address|router) +(?P<address>(\S+)) +is'
-                            ' +(?P<link_state>(up|down))$')
-
-        p2 = re.compile(r'^Area +(?P<area>(\S+)),? +source +address'
-                            ' +(?P<source_address>(\S+))$')
-
-        p3 = re.compile(r'^Run +as +demand +circuit$')
-
-        p4 = re.compile(r'^DoNotAge +LSA +not +allowed'
-                            ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
-                            '(?: +Cost +of +using +(?P<cost>(\d+)))?'
-                            '(?: State +(?P<state>(\S+)))?$')
-
-        p5 = re.compile(r'^Transit +area +(?P<area>(\S+)),'
-                            '(?: +via +interface +(?P<intf>(\S+)))?$')
-
-        p6 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                            ' +(?P<topo_name>(\S+))$')
-
-        p7 = re.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
-                            ' +sec, +State +(?P<state>(\S+)),?$')
-
-        p8 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            '(?: +Retransmit +(?P<retransmit>(\d+)))?$')
-
-        p9 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
-
-        p10 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
-
-        p11 = re.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
-
-        p12 = re.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
-                            ' +length +(?P<length>(\d+)), +number +of'
-                            ' +retransmission +(?P<retrans>(\d+))$')
-
-        p13 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
-
-        p14 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
-
-        p15 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<time>(\d+)) +msec, +maximum +is'
-                            ' +(?P<max>(\d+)) +msec$')
+        patterns = ShowIpOspfLinksParser.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Sham Link OSPF_SL0 to address 10.151.22.22 is up
             # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 address = str(m.groupdict()['address'])
                 sl_remote_id = vl_router_id = address
@@ -3677,7 +3554,7 @@ class ShowIpOspfLinksParser(MetaParser):
 
             # Area 1, source address 10.21.33.33
             # Area 1 source address 10.229.11.11
-            m = p2.match(line)
+            m = patterns.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 source_address = str(m.groupdict()['source_address'])
@@ -3723,7 +3600,7 @@ class ShowIpOspfLinksParser(MetaParser):
                 continue
 
             # Run as demand circuit
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 if link_type == 'sham_links':
                     sub_dict['demand_circuit'] = True
@@ -3733,7 +3610,7 @@ class ShowIpOspfLinksParser(MetaParser):
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 7).
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1). Cost of using 111 State POINT_TO_POINT,
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 dcbitless_lsa_count = int(m.groupdict()['dcbitless'])
                 donotage_lsa = 'not allowed'
@@ -3754,7 +3631,7 @@ class ShowIpOspfLinksParser(MetaParser):
 
             # Transit area 1
             # Transit area 1, via interface GigabitEthernet0/1
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
 
@@ -3819,7 +3696,7 @@ class ShowIpOspfLinksParser(MetaParser):
 
             # Topology-MTID    Cost    Disabled     Shutdown      Topology Name
             #             0       1          no           no               Base
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
                 if 'topology' not in sub_dict:
@@ -3839,7 +3716,7 @@ class ShowIpOspfLinksParser(MetaParser):
                     continue
             
             # Transmit Delay is 1 sec, State POINT_TO_POINT,
-            m = p7.match(line)
+            m = patterns.p7.match(line)
             if m:
                 sub_dict['transmit_delay'] = int(m.groupdict()['transmit_delay'])
                 state = str(m.groupdict()['state']).lower()
@@ -3850,7 +3727,7 @@ class ShowIpOspfLinksParser(MetaParser):
             # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
             # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
             # Timer intervals configured, Hello 10, Dead 40, Wait 40,
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 if m.groupdict()['hello']:
                     sub_dict['hello_interval'] = int(m.groupdict()['hello'])
@@ -3863,7 +3740,7 @@ class ShowIpOspfLinksParser(MetaParser):
                 continue
 
             # Strict TTL checking enabled, up to 3 hops allowed
-            m = p9.match(line)
+            m = patterns.p9.match(line)
             if m:
                 if 'ttl_security' not in sub_dict:
                     sub_dict['ttl_security'] = {}
@@ -3876,19 +3753,19 @@ class ShowIpOspfLinksParser(MetaParser):
                     continue
 
             # Hello due in 00:00:03:179
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 sub_dict['hello_timer'] = str(m.groupdict()['hello_timer'])
                 continue          
           
             # Adjacency State FULL
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 sub_dict['adjacency_state'] = str(m.groupdict()['adj_state']).lower()
                 continue
 
             # Index 1/2/2, retransmission queue length 0, number of retransmission 2
-            m = p12.match(line)
+            m = patterns.p12.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 sub_dict['retrans_qlen'] = int(m.groupdict()['length'])
@@ -3896,14 +3773,14 @@ class ShowIpOspfLinksParser(MetaParser):
                 continue
 
             # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m:
                 sub_dict['first'] = str(m.groupdict()['first'])
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last retransmission scan length is 1, maximum is 1
-            m = p14.match(line)
+            m = patterns.p14.match(line)
             if m:
                 sub_dict['last_retransmission_scan_length'] = \
                     int(m.groupdict()['len'])
@@ -3912,7 +3789,7 @@ class ShowIpOspfLinksParser(MetaParser):
                 continue
 
             # Last retransmission scan time is 0 msec, maximum is 0 msec
-            m = p15.match(line)
+            m = patterns.p15.match(line)
             if m:
                 sub_dict['last_retransmission_scan_time'] = \
                     int(m.groupdict()['time'])
@@ -4244,6 +4121,36 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         'uptime', 'last_retrans_scan_length', 'last_retrans_scan_time_msec']
 
 
+    patterns = Patterns(
+        p1=r'^Neighbor +(?P<neighbor>(\S+)), +interface'
+            ' +address +(?P<address>(\S+))'
+            '(?:, +interface-id +(?P<intf_id>(\S+)))?$',
+        p2=r'^In +the +area +(?P<area>(\S+)) +via +interface'
+            ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$',
+        p3=r'^Neighbor +priority +is +(?P<priority>(\d+)),'
+            ' +State +is +(?P<state>(\S+)),'
+            ' +(?P<num>(\d+)) +state +changes$',
+        p4=r'^DR +is +(?P<dr_ip_addr>(\S+))'
+            ' +BDR +is +(?P<bdr_ip_addr>(\S+))$',
+        p5=r'^Options +is +(?P<options>(\S+)) +in +Hello'
+            ' +\(E-bit\)$',
+        p6=r'^Options +is +(?P<options>(\S+)) +in +DBD'
+            ' +\(E-bit, O-bit\)$',
+        p7=r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$',
+        p8=r'^Neighbor +is +up +for +(?P<uptime>(\S+))$',
+        p9=r'^Index +(?P<index>(\S+)) +retransmission +queue'
+            ' +length +(?P<ql>(\d+)), +number +of'
+            ' +retransmission +(?P<num_retrans>(\d+))$',
+        p10=r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$',
+        p11=r'^Last +retransmission +scan +length +is'
+             ' +(?P<num1>(\d+)), +maximum +is'
+             ' +(?P<num2>(\d+))$',
+        p12=r'^Last +retransmission +scan +time +is'
+             ' +(?P<num1>(\d+)) +msec, +maximum +is'
+             ' +(?P<num2>(\d+)) +msec$',
+        p13=r'^SR +adj +label +(?P<sr_adj_label>\d+)$',
+    )
+
     def cli(self, neighbor='', output=None):
 
         if output is None:
@@ -4259,53 +4166,15 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
-                            ' +address +(?P<address>(\S+))'
-                            '(?:, +interface-id +(?P<intf_id>(\S+)))?$')
-        
-        p2 = re.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
-                            ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
-        
-        p3 = re.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
-                            ' +State +is +(?P<state>(\S+)),'
-                            ' +(?P<num>(\d+)) +state +changes$')
-        
-        p4 = re.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
-                            ' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
-        
-        p5 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
-                            ' +\(E-bit\)$')
-        
-        p6 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
-                            ' +\(E-bit, O-bit\)$')
-        
-        p7 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
-        
-        p8 = re.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
-        
-        p9 = re.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
-                            ' +length +(?P<ql>(\d+)), +number +of'
-                            ' +retransmission +(?P<num_retrans>(\d+))$')
-        
-        p10 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
-        
-        p11 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<num1>(\d+)), +maximum +is'
-                            ' +(?P<num2>(\d+))$')
-        
-        p12 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<num1>(\d+)) +msec, +maximum +is'
-                            ' +(?P<num2>(\d+)) +msec$')
-        
-        p13 = re.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
-        
+        patterns = ShowIpOspfNeighborDetail.patterns
+
         for line in out.splitlines():
             line = line.strip()
 
             # Neighbor 10.16.2.2, interface address 10.1.2.2
             # Neighbor 192.168.111.1, interface address 192.168.70.1, interface-id 192
             # Neighbor 192.168.255.9, interface address 10.0.109.9, interface-id unknown
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 address = str(m.groupdict()['address'])
@@ -4315,7 +4184,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
 
             # In the area 0 via interface GigabitEthernet2
             # In the area 0 via interface TenGigabitEthernet3/1/1, BFD enabled
-            m = p2.match(line)
+            m = patterns.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 interface = str(m.groupdict()['interface'])
@@ -4521,7 +4390,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
 
             # Neighbor priority is 1, State is FULL, 6 state changes
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 sub_dict['priority'] = int(m.groupdict()['priority'])
                 state = str(m.groupdict()['state']).lower()
@@ -4534,39 +4403,39 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
 
             # DR is 10.2.3.3 BDR is 10.2.3.2
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 sub_dict['dr_ip_addr'] = str(m.groupdict()['dr_ip_addr'])
                 sub_dict['bdr_ip_addr'] = str(m.groupdict()['bdr_ip_addr'])
                 continue
 
             # Options is 0x2 in Hello (E-bit)
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 sub_dict['hello_options'] = str(m.groupdict()['options'])
                 continue
 
             # Options is 0x42 in DBD (E-bit, O-bit)
             # Options is 0x42 in DBD (E-bit, O-bit)
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m:
                 sub_dict['dbd_options'] = str(m.groupdict()['options'])
                 continue
 
             # Dead timer due in 00:00:38
-            m = p7.match(line)
+            m = patterns.p7.match(line)
             if m:
                 sub_dict['dead_timer'] = str(m.groupdict()['dead_timer'])
                 continue
 
             # Neighbor is up for 08:22:07
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 sub_dict['uptime'] = str(m.groupdict()['uptime'])
                 continue
 
             # Index 1/2/2, retransmission queue length 0, number of retransmission 0
-            m = p9.match(line)
+            m = patterns.p9.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 if 'statistics' not in sub_dict:
@@ -4578,14 +4447,14 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
 
             # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 sub_dict['first'] = str(m.groupdict()['first'])
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last retransmission scan length is 0, maximum is 0
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -4596,7 +4465,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
 
             # Last retransmission scan time is 0 msec, maximum is 0 msec
-            m = p12.match(line)
+            m = patterns.p12.match(line)
             if m:
                 if 'statistics' not in sub_dict:
                     sub_dict['statistics'] = {}
@@ -4607,7 +4476,7 @@ class ShowIpOspfNeighborDetail(ShowIpOspfNeighborDetailSchema):
                 continue
             
             # SR adj label 10
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m:
                 sub_dict['sr_adj_label'] = str(m.groupdict()['sr_adj_label'])
                 continue
@@ -4683,6 +4552,36 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
 
     cli_command = 'show ip ospf neighbor detail__'
 
+    patterns = Patterns(
+        p1=r'^Neighbor +(?P<neighbor>(\S+)), +interface'
+            ' +address +(?P<address>(\S+))'
+            '(?:, +interface-id +(?P<intf_id>(\S+)))?$',
+        p2=r'^In +the +area +(?P<area>(\S+)) +via +interface'
+            ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$',
+        p3=r'^Neighbor +priority +is +(?P<priority>(\d+)),'
+            ' +State +is +(?P<state>(\S+)),'
+            ' +(?P<num>(\d+)) +state +changes$',
+        p4=r'^DR +is +(?P<dr_ip_addr>(\S+))'
+            ' +BDR +is +(?P<bdr_ip_addr>(\S+))$',
+        p5=r'^Options +is +(?P<options>(\S+)) +in +Hello'
+            ' +\(E-bit\)$',
+        p6=r'^Options +is +(?P<options>(\S+)) +in +DBD'
+            ' +\(E-bit, O-bit\)$',
+        p7=r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$',
+        p8=r'^Neighbor +is +up +for +(?P<uptime>(\S+))$',
+        p9=r'^Index +(?P<index>(\S+)) +retransmission +queue'
+            ' +length +(?P<ql>(\d+)), +number +of'
+            ' +retransmission +(?P<num_retrans>(\d+))$',
+        p10=r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$',
+        p11=r'^Last +retransmission +scan +length +is'
+             ' +(?P<num1>(\d+)), +maximum +is'
+             ' +(?P<num2>(\d+))$',
+        p12=r'^Last +retransmission +scan +time +is'
+             ' +(?P<num1>(\d+)) +msec, +maximum +is'
+             ' +(?P<num2>(\d+)) +msec$',
+        p13=r'^SR +adj +label +(?P<sr_adj_label>\d+)$',
+    )
+
     def cli(self, output=None):
 
         if output is None:
@@ -4694,54 +4593,15 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^Neighbor +(?P<neighbor>(\S+)), +interface'
-                            ' +address +(?P<address>(\S+))'
-                            '(?:, +interface-id +(?P<intf_id>(\S+)))?$')
-        
-        p2 = re.compile(r'^In +the +area +(?P<area>(\S+)) +via +interface'
-                            ' +(?P<interface>(\S+))(, +BFD +(?P<bfd_state>\S+))?$')
-        
-        p3 = re.compile(r'^Neighbor +priority +is +(?P<priority>(\d+)),'
-                            ' +State +is +(?P<state>(\S+)),'
-                            ' +(?P<num>(\d+)) +state +changes$')
-        
-        p4 = re.compile(r'^DR +is +(?P<dr_ip_addr>(\S+))'
-                            ' +BDR +is +(?P<bdr_ip_addr>(\S+))$')
-        
-        p5 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +Hello'
-                            ' +\(E-bit\)$')
-        
-        p6 = re.compile(r'^Options +is +(?P<options>(\S+)) +in +DBD'
-                            ' +\(E-bit, O-bit\)$')
-        
-        p7 = re.compile(r'^Dead +timer +due +in +(?P<dead_timer>(\S+))$')
-        
-        p8 = re.compile(r'^Neighbor +is +up +for +(?P<uptime>(\S+))$')
-        
-        p9 = re.compile(r'^Index +(?P<index>(\S+)) +retransmission +queue'
-                            ' +length +(?P<ql>(\d+)), +number +of'
-                            ' +retransmission +(?P<num_retrans>(\d+))$')
-        
-        p10 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
-        
-        p11 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<num1>(\d+)), +maximum +is'
-                            ' +(?P<num2>(\d+))$')
-        
-        p12 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<num1>(\d+)) +msec, +maximum +is'
-                            ' +(?P<num2>(\d+)) +msec$')
-        
-        p13 = re.compile(r'^SR +adj +label +(?P<sr_adj_label>\d+)$')
-        
-        
+        p = ShowIpOspfNeighborDetail2.patterns
+
         for line in out.splitlines():
             line = line.strip()
 
             # Neighbor 10.16.2.2, interface address 10.1.2.2
             # Neighbor 192.168.111.1, interface address 192.168.70.1, interface-id 192
             # Neighbor 192.168.255.9, interface address 10.0.109.9, interface-id unknown
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 address = str(m.groupdict()['address'])
@@ -4750,7 +4610,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
 
             # In the area 0 via interface GigabitEthernet2
             # In the area 0 via interface TenGigabitEthernet3/1/1, BFD enabled
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 interface = str(m.groupdict()['interface'])
@@ -4785,7 +4645,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # Neighbor priority is 1, State is FULL
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 neighbor_dict['priority'] = int(m.groupdict()['priority'])
                 state = str(m.groupdict()['state']).lower()
@@ -4797,39 +4657,39 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # DR is 10.2.3.3 BDR is 10.2.3.2
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 neighbor_dict['dr_ip_addr'] = str(m.groupdict()['dr_ip_addr'])
                 neighbor_dict['bdr_ip_addr'] = str(m.groupdict()['bdr_ip_addr'])
                 continue
 
             # Options is 0x2 in Hello (E-bit)
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 neighbor_dict['hello_options'] = str(m.groupdict()['options'])
                 continue
 
             # Options is 0x42 in DBD (E-bit, O-bit)
             # Options is 0x42 in DBD (E-bit, O-bit)
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 neighbor_dict['dbd_options'] = str(m.groupdict()['options'])
                 continue
 
             # Dead timer due in 00:00:38
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 neighbor_dict['dead_timer'] = str(m.groupdict()['dead_timer'])
                 continue
 
             # Neighbor is up for 08:22:07
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 neighbor_dict['uptime'] = str(m.groupdict()['uptime'])
                 continue
 
             # Index 1/2/2, retransmission queue length 0, number of retransmission 0
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 neighbor_dict['index'] = str(m.groupdict()['index'])
                 statistics_dict = neighbor_dict.setdefault('statistics', {})
@@ -4840,14 +4700,14 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 neighbor_dict['first'] = str(m.groupdict()['first'])
                 neighbor_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last retransmission scan length is 0, maximum is 0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 statistics_dict = neighbor_dict.setdefault('statistics', {})
                 statistics_dict['last_retrans_scan_length'] = \
@@ -4857,7 +4717,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # Last retransmission scan time is 0 msec, maximum is 0 msec
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 statistics_dict = neighbor_dict.setdefault('statistics', {})
                 statistics_dict['last_retrans_scan_time_msec'] = \
@@ -4867,7 +4727,7 @@ class ShowIpOspfNeighborDetail2(ShowIpOspfNeighborDetail2Schema):
                 continue
 
             # SR adj label 10
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 neighbor_dict['sr_adj_label'] = str(m.groupdict()['sr_adj_label'])
                 continue
@@ -4937,6 +4797,27 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
 
     cli_command = ['show ip ospf mpls ldp interface', 'show ip ospf mpls ldp interface {interface}']
 
+    patterns = Patterns(
+        p1=r'^(?P<interface>(Lo.*|.*Gig.*|.*(SL|VL).*|'
+            'Cellular.*|FastEthernet.*|LISP.*|Po.*|Tunnel.*|'
+            'VirtualPortGroup.*|Vlan.*))$',
+        p2=r'^Process +ID +(?P<instance>(\S+)),'
+            '(?: +VRF +(?P<vrf>(\S+)),)?'
+            ' +Area +(?P<area>(\S+))$',
+        p3=r'^LDP +is'
+            ' +(?P<auto_config>(not configured|configured))'
+            ' +through +LDP +autoconfig$',
+        p5=r'^Holddown +timer +is (?P<val>([a-zA-Z\s]+))$',
+
+        # Interface is down and pending LDP
+        p6=r'^Interface +is (?P<state>(up|down))( +and +(?P<state_info>[\w\s]*))?$',
+
+        # LDP-IGP Synchronization : Not required
+        # LDP-IGP Synchronization : Required
+        p4=r'^LDP-IGP +Synchronization *:'
+            ' +(?P<igp_sync>(Not required|Required))$',
+    )
+
     def cli(self, interface='', output=None):
 
         if output is None:
@@ -4952,22 +4833,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^(?P<interface>(Lo.*|.*Gig.*|.*(SL|VL).*|'
-                            'Cellular.*|FastEthernet.*|LISP.*|Po.*|Tunnel.*|'
-                            'VirtualPortGroup.*|Vlan.*))$')
-
-        p2 = re.compile(r'^Process +ID +(?P<instance>(\S+)),'
-                            '(?: +VRF +(?P<vrf>(\S+)),)?'
-                            ' +Area +(?P<area>(\S+))$')
-
-        p3 = re.compile(r'^LDP +is'
-                            ' +(?P<auto_config>(not configured|configured))'
-                            ' +through +LDP +autoconfig$')
-
-        p5 = re.compile(r'^Holddown +timer +is (?P<val>([a-zA-Z\s]+))$')
-        # Interface is down and pending LDP
-        p6 = re.compile(r'^Interface +is (?P<state>(up|down))( +and +(?P<state_info>[\w\s]*))?$')
-
+        p = ShowIpOspfMplsLdpInterface.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -4990,7 +4856,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
             # Tunnel
             # VirtualPortGroup
             # Vlan
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 interface = str(m.groupdict()['interface'])
                 continue
@@ -4998,7 +4864,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
             # Process ID 1, Area 0
             # Process ID 100, Area 0.0.0.0
             # Process ID 2, VRF VRF1, Area 1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 instance = str(m.groupdict()['instance'])
                 try:
@@ -5077,7 +4943,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
 
             # LDP is not configured through LDP autoconfig
             # LDP is configured through LDP autoconfig
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 if m.groupdict()['auto_config'] == 'configured':
                     intf_dict['autoconfig'] = True
@@ -5087,11 +4953,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
                     mpls_ldp_dict['autoconfig'] = False
                     continue
             
-            # LDP-IGP Synchronization : Not required
-            # LDP-IGP Synchronization : Required
-            p4 = re.compile(r'^LDP-IGP +Synchronization *:'
-                              ' +(?P<igp_sync>(Not required|Required))$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 if m.groupdict()['igp_sync'] == 'Required':
                     intf_dict['igp_sync'] = True
@@ -5100,7 +4962,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
                     continue
 
             # Holddown timer is disabled
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 if 'enabled' in m.groupdict()['val']:
                     intf_dict['holddown_timer'] = True
@@ -5109,7 +4971,7 @@ class ShowIpOspfMplsLdpInterface(ShowIpOspfMplsLdpInterfaceSchema):
                     continue
 
             # Interface is up 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 state_info = m.groupdict()['state_info']
                 intf_dict['state'] = str(m.groupdict()['state'])
@@ -5197,6 +5059,32 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
 
     cli_command = 'show ip ospf mpls traffic-eng link'
 
+    patterns = Patterns(
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+            ' +\(Process +ID +(?P<instance>(\S+))\)$',
+        p2=r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
+            ' +MPLS +TE +links. +Area +instance +is'
+            ' +(?P<area_instance>(\d+))\.$',
+        p3=r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$',
+        p4=r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$',
+        p5=r'^Link +is +associated +with +fragment'
+            ' +(?P<fragment>(\d+))\. +Link +instance +is'
+            ' +(?P<link_instance>(\d+))$',
+        p6=r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$',
+        p7=r'^Link +ID *: +(?P<link_id>(\S+))$',
+        p8=r'^Interface +Address *: +(?P<addr>(\S+))$',
+        p9=r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
+            ' +(?P<igp>(\d+))$',
+        p14=r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$',
+        p10=r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+             ' +(?P<res_band>(\d+))$',
+        p11=r'^Affinity +Bit *: +(?P<admin_group>(\S+))$',
+        p12=r'^Number +of +Priority +: +(?P<priority>(\d+))$',
+        p13=r'^Priority +(?P<num1>(\d+)) *:'
+             ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+             ' *: +(?P<band2>(\d+)))?$',
+    )
+
     def cli(self, output=None):
 
         if output is None:
@@ -5209,49 +5097,13 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\S+))\)$')
-
-        p2 = re.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
-                            ' +MPLS +TE +links. +Area +instance +is'
-                            ' +(?P<area_instance>(\d+))\.$')
-
-        p3 = re.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
-
-        p4 = re.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
-
-        p5 = re.compile(r'^Link +is +associated +with +fragment'
-                            ' +(?P<fragment>(\d+))\. +Link +instance +is'
-                            ' +(?P<link_instance>(\d+))$')
-
-        p6 = re.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
-
-        p7 = re.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
-
-        p8 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
-
-        p9 = re.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
-                            ' +(?P<igp>(\d+))$')
-
-        p14 = re.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
-
-        p10 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            ' +(?P<res_band>(\d+))$')
-
-        p11 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
-
-        p12 = re.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
-
-        p13 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
-
+        patterns = ShowIpOspfMplsTrafficEngLink.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 1)
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 instance = str(m.groupdict()['instance'])
@@ -5307,7 +5159,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 continue
 
             # Area 0 has 2 MPLS TE links. Area instance is 2.
-            m = p2.match(line)
+            m = patterns.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 total_links = int(m.groupdict()['links'])
@@ -5342,7 +5194,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
 
             # Area 1 MPLS TE not initialized
             # Area 0.0.0.0 MPLS TE not initialized
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 try:
                     int(m.groupdict()['area'])
@@ -5372,7 +5224,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 continue
 
             # Links in hash bucket 8.
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 link_hash_bucket = int(m.groupdict()['hash'])
                 if 'link_hash_bucket' not in ret_dict['vrf'][vrf]\
@@ -5393,7 +5245,7 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 continue
 
             # Link is associated with fragment 2. Link instance is 2
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 link_fragment = int(m.groupdict()['fragment'])
                 if 'link_fragments' not in link_dict:
@@ -5405,57 +5257,57 @@ class ShowIpOspfMplsTrafficEngLink(ShowIpOspfMplsTrafficEngLinkSchema):
                 continue
 
             # Link connected to Broadcast network
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m:
                 sub_dict['network_type'] = str(m.groupdict()['type']).lower()
                 continue
 
             # Link ID : 10.1.2.1
-            m = p7.match(line)
+            m = patterns.p7.match(line)
             if m:
                 sub_dict['link_id'] = str(m.groupdict()['link_id'])
                 continue
 
             # Interface Address : 10.1.2.1
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 sub_dict['interface_address'] = str(m.groupdict()['addr'])
                 continue
 
             # Admin Metric te: 1 igp: 1
-            m = p9.match(line)
+            m = patterns.p9.match(line)
             if m:
                 sub_dict['te_admin_metric'] = int(m.groupdict()['te'])
                 sub_dict['igp_admin_metric'] = int(m.groupdict()['igp'])
                 continue
 
             # Maximum bandwidth : 125000000
-            m = p14.match(line) #Modified from p9 to p14
+            m = patterns.p14.match(line) #Modified from p9 to p14
             if m:
                 sub_dict['max_bandwidth'] = int(m.groupdict()['mband'])
                 continue
 
             # Maximum reservable bandwidth : 93750000
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 sub_dict['max_reservable_bandwidth'] = \
                     int(m.groupdict()['res_band'])
                 continue
 
             # Affinity Bit : 0x0
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 sub_dict['affinity_bit'] = str(m.groupdict()['admin_group'])
                 continue
 
             # Number of Priority : 8
-            m = p12.match(line)
+            m = patterns.p12.match(line)
             if m:
                 sub_dict['total_priority'] = int(m.groupdict()['priority'])
                 continue
 
             # Priority 0 : 93750000     Priority 1 : 93750000
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m:
                 value1 = '{} {}'.format(str(m.groupdict()['num1']), str(m.groupdict()['band1']))
                 value2 = '{} {}'.format(str(m.groupdict()['num2']), str(m.groupdict()['band2']))
@@ -5550,6 +5402,32 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
 
     cli_command = 'show ip ospf mpls traffic-eng link__'
 
+    patterns = Patterns(
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+            ' +\(Process +ID +(?P<instance>(\S+))\)$',
+        p2=r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
+            ' +MPLS +TE +links. +Area +instance +is'
+            ' +(?P<area_instance>(\d+))\.$',
+        p3=r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$',
+        p4=r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$',
+        p5=r'^Link +is +associated +with +fragment'
+            ' +(?P<fragment>(\d+))\. +Link +instance +is'
+            ' +(?P<link_instance>(\d+))$',
+        p6=r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$',
+        p7=r'^Link +ID *: +(?P<link_id>(\S+))$',
+        p8=r'^Interface +Address *: +(?P<addr>(\S+))$',
+        p9=r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
+            ' +(?P<igp>(\d+))$',
+        p14=r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$',
+        p10=r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
+             ' +(?P<res_band>(\d+))$',
+        p11=r'^Affinity +Bit *: +(?P<admin_group>(\S+))$',
+        p12=r'^Number +of +Priority +: +(?P<priority>(\d+))$',
+        p13=r'^Priority +(?P<num1>(\d+)) *:'
+             ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
+             ' *: +(?P<band2>(\d+)))?$',
+    )
+
     def cli(self, output=None):
 
         if output is None:
@@ -5562,49 +5440,13 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
         ret_dict = {}
         af = 'ipv4' # this is ospf - always ipv4
 
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                            ' +\(Process +ID +(?P<instance>(\S+))\)$')
-
-        p2 = re.compile(r'^Area +(?P<area>(\d+)) +has +(?P<links>(\d+))'
-                            ' +MPLS +TE +links. +Area +instance +is'
-                            ' +(?P<area_instance>(\d+))\.$')
-
-        p3 = re.compile(r'^Area +(?P<area>(\S+)) +MPLS +TE +not +initialized$')
-
-        p4 = re.compile(r'^Links +in +hash +bucket +(?P<hash>(\d+))\.$')
-
-        p5 = re.compile(r'^Link +is +associated +with +fragment'
-                            ' +(?P<fragment>(\d+))\. +Link +instance +is'
-                            ' +(?P<link_instance>(\d+))$')
-
-        p6 = re.compile(r'^Link +connected +to +(?P<type>([a-zA-Z\s]+))$')
-
-        p7 = re.compile(r'^Link +ID *: +(?P<link_id>(\S+))$')
-
-        p8 = re.compile(r'^Interface +Address *: +(?P<addr>(\S+))$')
-
-        p9 = re.compile(r'^Admin +Metric +te: +(?P<te>(\d+)) +igp:'
-                            ' +(?P<igp>(\d+))$')
-
-        p14 = re.compile(r'^Maximum +(B|b)andwidth *: +(?P<mband>(\d+))$')
-
-        p10 = re.compile(r'^Maximum +(R|r)eservable +(B|b)andwidth *:'
-                            ' +(?P<res_band>(\d+))$')
-
-        p11 = re.compile(r'^Affinity +Bit *: +(?P<admin_group>(\S+))$')
-
-        p12 = re.compile(r'^Number +of +Priority +: +(?P<priority>(\d+))$')
-
-        p13 = re.compile(r'^Priority +(?P<num1>(\d+)) *:'
-                            ' +(?P<band1>(\d+))(?: +Priority +(?P<num2>(\d+))'
-                            ' *: +(?P<band2>(\d+)))?$')
-
+        p = ShowIpOspfMplsTrafficEngLink2.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 1)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 instance = str(m.groupdict()['instance'])
@@ -5621,7 +5463,7 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
                 continue
 
             # Area 0 has 2 MPLS TE links. Area instance is 2.
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 total_links = int(m.groupdict()['links'])
@@ -5638,7 +5480,7 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
 
             # Area 1 MPLS TE not initialized
             # Area 0.0.0.0 MPLS TE not initialized
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 try:
                     int(m.groupdict()['area'])
@@ -5655,7 +5497,7 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
                 continue
 
             # Links in hash bucket 8.
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 link_hash_bucket = int(m.groupdict()['hash'])
                 link_dict = area_dict.setdefault('link_hash_bucket', {}).\
@@ -5663,7 +5505,7 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
                 continue
 
             # Link is associated with fragment 2. Link instance is 2
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 link_fragment = int(m.groupdict()['fragment'])
                 sub_dict = link_dict.setdefault('link_fragments', {}).\
@@ -5672,57 +5514,57 @@ class ShowIpOspfMplsTrafficEngLink2(ShowIpOspfMplsTrafficEngLink2Schema):
                 continue
 
             # Link connected to Broadcast network
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 sub_dict['network_type'] = str(m.groupdict()['type']).lower()
                 continue
 
             # Link ID : 10.1.2.1
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 sub_dict['link_id'] = str(m.groupdict()['link_id'])
                 continue
 
             # Interface Address : 10.1.2.1
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['interface_address'] = str(m.groupdict()['addr'])
                 continue
 
             # Admin Metric te: 1 igp: 1
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['te_admin_metric'] = int(m.groupdict()['te'])
                 sub_dict['igp_admin_metric'] = int(m.groupdict()['igp'])
                 continue
 
             # Maximum bandwidth : 125000000
-            m = p14.match(line) #Modified from p9 to p14
+            m = p.p14.match(line) #Modified from p9 to p14
             if m:
                 sub_dict['max_bandwidth'] = int(m.groupdict()['mband'])
                 continue
 
             # Maximum reservable bandwidth : 93750000
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 sub_dict['max_reservable_bandwidth'] = \
                     int(m.groupdict()['res_band'])
                 continue
 
             # Affinity Bit : 0x0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 sub_dict['affinity_bit'] = str(m.groupdict()['admin_group'])
                 continue
 
             # Number of Priority : 8
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 sub_dict['total_priority'] = int(m.groupdict()['priority'])
                 continue
 
             # Priority 0 : 93750000     Priority 1 : 93750000
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 value1 = '{} {}'.format(str(m.groupdict()['num1']), str(m.groupdict()['band1']))
                 value2 = '{} {}'.format(str(m.groupdict()['num2']), str(m.groupdict()['band2']))
@@ -5801,62 +5643,66 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
 
     cli_command = 'show ip ospf max-metric'
 
-    def cli(self, output=None):
-
-        if output is None:
-            # Execute command on device
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # Init vars
-        ret_dict = {}
-        address_family = 'ipv4'
-
-        # Load for five secs: 71%/0%; one minute: 11%; five minutes: 9%
-        # Time source is NTP, 20:29:26.348 EST Fri Nov 11 2016
-
+    patterns = Patterns(
         # OSPF Router with ID (172.16.1.214) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<instance>(\d+))'
-                         '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+            ' +\(Process +ID +(?P<instance>(\d+))'
+            '(?:, +VRF +(?P<vrf>(\S+)))?\)$',
 
         # Base Topology (MTID 0)
-        p2 = re.compile(r'^Base +Topology +\(MTID +(?P<mtid>(\d+))\)$')
+        p2=r'^Base +Topology +\(MTID +(?P<mtid>(\d+))\)$',
 
         # Start time: 00:01:58.314, Time elapsed: 00:54:43.858
-        p3 = re.compile(r'^Start +time: +(?P<start_time>(\S+)), +Time +elapsed:'
-                         ' +(?P<time_elapsed>(\S+))$')
+        p3=r'^Start +time: +(?P<start_time>(\S+)), +Time +elapsed:'
+            ' +(?P<time_elapsed>(\S+))$',
 
         # Originating router-LSAs with maximum metric
         # Originating router-LSAs with maximum metric, Time remaining: 00:03:55
-        p4_1 = re.compile(r'^Originating +router-LSAs +with +maximum +metric(, +Time +remaining: +(?P<time_remaining>([\d\:]+)))?$')
+        p4_1=r'^Originating +router-LSAs +with +maximum +metric(, +Time +remaining: +(?P<time_remaining>([\d\:]+)))?$',
 
         # Router is not originating router-LSAs with maximum metric
-        p4_2 = re.compile(r'^Router +is +not +originating +router-LSAs +with'
-                           ' +maximum +metric$')
+        p4_2=r'^Router +is +not +originating +router-LSAs +with'
+              ' +maximum +metric$',
 
         # Condition: on startup for 5 seconds, State: inactive
-        p5 = re.compile(r'^Condition: +(?P<condition>(.*)), +State:'
-                          ' +(?P<state>([a-zA-Z\s]+))$')
+        p5=r'^Condition: +(?P<condition>(.*)), +State:'
+            ' +(?P<state>([a-zA-Z\s]+))$',
 
         # Advertise summary-LSAs with metric 16711680
-        p6 = re.compile(r'^Advertise +summary-LSAs +with +metric'
-                         ' +(?P<metric>(\d+))$')
+        p6=r'^Advertise +summary-LSAs +with +metric'
+            ' +(?P<metric>(\d+))$',
 
         # Unset reason: timer expired, Originated for 5 seconds
-        p7 = re.compile(r'^Unset +reason: (?P<reason>(.*))$')
+        p7=r'^Unset +reason: (?P<reason>(.*))$',
 
         # Unset time: 00:02:03.314, Time elapsed: 00:54:38.858
-        p8 = re.compile(r'^Unset +time: +(?P<time>(\S+)), +Time +elapsed:'
-                         ' +(?P<elapsed>(\S+))$')
+        p8=r'^Unset +time: +(?P<time>(\S+)), +Time +elapsed:'
+            ' +(?P<elapsed>(\S+))$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            # Execute command on device
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        address_family = 'ipv4'
+
+        # Load for five secs: 71%/0%; one minute: 11%; five minutes: 9%
+        # Time source is NTP, 20:29:26.348 EST Fri Nov 11 2016
+
+        p = ShowIpOspfMaxMetric.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = str(group['router_id'])
@@ -5876,7 +5722,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Base Topology (MTID 0)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 mtid = m.groupdict()['mtid']
                 mtid_dict = ospf_dict.setdefault('base_topology_mtid', {}).\
@@ -5884,7 +5730,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Start time: 00:01:58.314, Time elapsed: 00:54:43.858
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 mtid_dict['start_time'] = group['start_time']
@@ -5893,7 +5739,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
 
             # Originating router-LSAs with maximum metric
             # Originating router-LSAs with maximum metric, Time remaining: 00:03:55
-            m = p4_1.match(line)
+            m = p.p4_1.match(line)
             if m:
                 rtr_lsa_dict = mtid_dict.\
                                     setdefault('router_lsa_max_metric', {}).\
@@ -5903,7 +5749,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Router is not originating router-LSAs with maximum metric
-            m = p4_2.match(line)
+            m = p.p4_2.match(line)
             if m:
                 rtr_lsa_dict = mtid_dict.\
                                     setdefault('router_lsa_max_metric', {}).\
@@ -5911,7 +5757,7 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Condition: on startup for 5 seconds, State: inactive
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 rtr_lsa_dict['condition'] = group['condition']
@@ -5919,18 +5765,18 @@ class ShowIpOspfMaxMetric(ShowIpOspfMaxMetricSchema):
                 continue
 
             # Advertise summary-LSAs with metric 16711680
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 rtr_lsa_dict['advertise_lsa_metric'] = int(m.groupdict()['metric'])
 
             # Unset reason: timer expired, Originated for 5 seconds
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 rtr_lsa_dict['unset_reason'] = m.groupdict()['reason']
                 continue
 
             # Unset time: 00:02:03.314, Time elapsed: 00:54:38.858
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 rtr_lsa_dict['unset_time'] = group['time']
@@ -6174,86 +6020,70 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
 
     cli_command = 'show ip ospf traffic'
 
-    def cli(self, output=None):
-
-        if output is None:
-            # Execute command on device
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # Init vars
-        ret_dict = {}
-        address_family = 'ipv4'
-        vrf = 'default'
-        received = False ; sent = False
-        interface_stats = False ; summary_stats = False
-        max_size_stats = False ; current_size_stats = False
-
+    patterns = Patterns(
         # OSPF statistics:
-        p1 = re.compile(r'^OSPF +statistics:$')
+        p1=r'^OSPF +statistics:$',
 
         # Last clearing of OSPF traffic counters never
         # Last clearing of interface traffic counters never
-        p2 = re.compile(r'^Last +clearing +of +(?P<type>(OSPF|interface)) +traffic'
-                         ' +counters +(?P<last_clear>([a-zA-Z0-9\:\s]+))$')
+        p2=r'^Last +clearing +of +(?P<type>(OSPF|interface)) +traffic'
+            ' +counters +(?P<last_clear>([a-zA-Z0-9\:\s]+))$',
 
         # Rcvd: 2112690 total, 0 checksum errors
-        p3 = re.compile(r'^Rcvd: +(?P<total>(\d+)) total, +(?P<csum_errors>(\d+))'
-                         ' +checksum +errors$')
+        p3=r'^Rcvd: +(?P<total>(\d+)) total, +(?P<csum_errors>(\d+))'
+            ' +checksum +errors$',
 
         # 2024732 hello, 938 database desc, 323 link state req
         # 2381794 hello, 1176 database desc, 43 link state req
-        p4 = re.compile(r'^(?P<hello>(\d+)) +hello, +(?P<db_desc>(\d+))'
-                         ' +database +desc, +(?P<link_state_req>(\d+))'
-                         ' +link +state +req$')
+        p4=r'^(?P<hello>(\d+)) +hello, +(?P<db_desc>(\d+))'
+            ' +database +desc, +(?P<link_state_req>(\d+))'
+            ' +link +state +req$',
 
         # 11030 link state updates, 75666 link state acks
         # 92224 link state updates, 8893 link state acks
-        p5 = re.compile(r'^(?P<link_state_updates>(\d+)) +link +state +updates,'
-                         ' +(?P<link_state_acks>(\d+)) +link +state +acks$')
+        p5=r'^(?P<link_state_updates>(\d+)) +link +state +updates,'
+            ' +(?P<link_state_acks>(\d+)) +link +state +acks$',
 
         # Sent: 2509472 total
-        p6 = re.compile(r'^Sent: +(?P<total>(\d+)) +total$')
-
+        p6=r'^Sent: +(?P<total>(\d+)) +total$',
 
         # OSPF Router with ID (10.169.197.252) (Process ID 65109)
         # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-        p7 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
-                         ' +\(Process +ID +(?P<instance>(\d+))'
-                         '(?:, +VRF +(?P<vrf>(\S+)))?\)$')
+        p7=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\)'
+            ' +\(Process +ID +(?P<instance>(\d+))'
+            '(?:, +VRF +(?P<vrf>(\S+)))?\)$',
 
         # OSPF queue statistics for process ID 65109:
-        p8 = re.compile(r'^OSPF +queue +statistics +for +process +ID +(?P<pid>(\d+)):$')
+        p8=r'^OSPF +queue +statistics +for +process +ID +(?P<pid>(\d+)):$',
 
         #                   InputQ   UpdateQ      OutputQ
         # Limit             0        200          0
         # Drops             0          0          0
         # Max delay [msec] 49          2          2
-        p9_1 = re.compile(r'^(?P<item>(Limit|Drops|Max delay \[msec\])) +'
-                        '(?P<inputq>(\d+)) +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
-        
+        p9_1=r'^(?P<item>(Limit|Drops|Max delay \[msec\])) +'
+              '(?P<inputq>(\d+)) +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$',
+
         # Invalid           0          0          0
         # Hello             0          0          0
         # DB des            0          0          0
         # LS req            0          0          0
         # LS upd            0          0          0
         # LS ack           14         14          6
-        p9_2 = re.compile(r'^(?P<item>(Invalid|Hello|DB des|LS '
-                        'req|LS upd|LS ack)) +(?P<inputq>(\d+)) '
-                        '+(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
+        p9_2=r'^(?P<item>(Invalid|Hello|DB des|LS '
+              'req|LS upd|LS ack)) +(?P<inputq>(\d+)) '
+              '+(?P<updateq>(\d+)) +(?P<outputq>(\d+))$',
 
         #                   InputQ   UpdateQ      OutputQ
         # Max size         14         14          6
         # Current size      0          0          0
-        p9_3 = re.compile(r'^(?P<item>(Max size|Current size)) +(?P<inputq>(\d+))'
-                           ' +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$')
+        p9_3=r'^(?P<item>(Max size|Current size)) +(?P<inputq>(\d+))'
+              ' +(?P<updateq>(\d+)) +(?P<outputq>(\d+))$',
 
         # Interface statistics:
-        p10 = re.compile(r'^Interface +statistics:$')
+        p10=r'^Interface +statistics:$',
 
         # Interface GigabitEthernet0/0/6
-        p11 = re.compile(r'^Interface +(?P<intf>(\S+))$')
+        p11=r'^Interface +(?P<intf>(\S+))$',
 
         # OSPF packets received/sent
         # Type          Packets              Bytes
@@ -6271,74 +6101,93 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
         # TX LS upd     12539                12553264
         # TX LS ack     899                  63396
         # TX Total      182893               26212884
-        p12 = re.compile(r'^(?P<type>([a-zA-Z\s]+)) +(?P<packets>(\d+))'
-                          ' +(?P<bytes>(\d+))$')
+        p12=r'^(?P<type>([a-zA-Z\s]+)) +(?P<packets>(\d+))'
+             ' +(?P<bytes>(\d+))$',
 
         # OSPF header errors
-        p13 = re.compile(r'^OSPF +header +errors$')
+        p13=r'^OSPF +header +errors$',
 
         # Length 0, Instance ID 0, Checksum 0, Auth Type 0,
-        p14 = re.compile(r'^Length +(?P<len>(\d+)), +Instance +ID'
-                          ' +(?P<iid>(\d+)), +Checksum +(?P<csum>(\d+)),'
-                          ' +Auth +Type +(?P<auth>(\d+)),?$')
+        p14=r'^Length +(?P<len>(\d+)), +Instance +ID'
+             ' +(?P<iid>(\d+)), +Checksum +(?P<csum>(\d+)),'
+             ' +Auth +Type +(?P<auth>(\d+)),?$',
 
         # Version 0, Bad Source 0, No Virtual Link 0,
-        p15 = re.compile(r'^Version +(?P<version>(\d+)), +Bad +Source'
-                          ' +(?P<bad_source>(\d+)), +No +Virtual +Link'
-                          ' +(?P<no_virtual_link>(\d+)),?$')
+        p15=r'^Version +(?P<version>(\d+)), +Bad +Source'
+             ' +(?P<bad_source>(\d+)), +No +Virtual +Link'
+             ' +(?P<no_virtual_link>(\d+)),?$',
 
         # Area Mismatch 0, No Sham Link 0, Self Originated 0,
-        p16 = re.compile(r'^Area +Mismatch +(?P<area_mismatch>(\d+)),'
-                          ' +No +Sham +Link +(?P<no_sham_link>(\d+)),'
-                          ' +Self +Originated +(?P<self_originated>(\d+)),?$')
+        p16=r'^Area +Mismatch +(?P<area_mismatch>(\d+)),'
+             ' +No +Sham +Link +(?P<no_sham_link>(\d+)),'
+             ' +Self +Originated +(?P<self_originated>(\d+)),?$',
 
         # Duplicate ID 0, Hello 0, MTU Mismatch 0,
-        p17 = re.compile(r'^Duplicate +ID +(?P<duplicate_id>(\d+)),'
-                          ' +Hello +(?P<hello>(\d+)), +MTU +Mismatch'
-                          ' +(?P<mtu_mismatch>(\d+)),$')
+        p17=r'^Duplicate +ID +(?P<duplicate_id>(\d+)),'
+             ' +Hello +(?P<hello>(\d+)), +MTU +Mismatch'
+             ' +(?P<mtu_mismatch>(\d+)),$',
 
         # Nbr Ignored 0, LLS 0, Unknown Neighbor 0,
-        p18 = re.compile(r'^Nbr +Ignored +(?P<nbr_ignored>(\d+)), +LLS'
-                          ' +(?P<lls>(\d+)), +Unknown +Neighbor'
-                          ' +(?P<unknown_neighbor>(\d+)),?$')
+        p18=r'^Nbr +Ignored +(?P<nbr_ignored>(\d+)), +LLS'
+             ' +(?P<lls>(\d+)), +Unknown +Neighbor'
+             ' +(?P<unknown_neighbor>(\d+)),?$',
 
         # Authentication 0, TTL Check Fail 0, Adjacency Throttle 0,
-        p19 = re.compile(r'^Authentication +(?P<authentication>(\d+)), +TTL'
-                          ' +Check +Fail +(?P<ttl_check_fail>(\d+)), +Adjacency'
-                          ' +Throttle +(?P<adjacency_throttle>(\d+)),?$')
+        p19=r'^Authentication +(?P<authentication>(\d+)), +TTL'
+             ' +Check +Fail +(?P<ttl_check_fail>(\d+)), +Adjacency'
+             ' +Throttle +(?P<adjacency_throttle>(\d+)),?$',
 
         # Authentication 0, TTL Check Fail 0, Test discard 0
-        p19_1 = re.compile(r'^Authentication +(?P<authentication>\d+), +TTL'
-                          ' +Check +Fail +(?P<ttl_check_fail>\d+), +Test discard'
-                          ' +(?P<test_discard>\d+),?$')
+        p19_1=r'^Authentication +(?P<authentication>\d+), +TTL'
+               ' +Check +Fail +(?P<ttl_check_fail>\d+), +Test discard'
+               ' +(?P<test_discard>\d+),?$',
 
         # BFD 0, Test discard 0
-        p20 = re.compile(r'^BFD +(?P<bfd>(\d+)), +Test +discard'
-                          ' +(?P<test_discard>(\d+))$')
+        p20=r'^BFD +(?P<bfd>(\d+)), +Test +discard'
+             ' +(?P<test_discard>(\d+))$',
 
         # OSPF LSA errors
-        p21 = re.compile(r'^OSPF +LSA +errors$')
+        p21=r'^OSPF +LSA +errors$',
 
         # Type 0, Length 0, Data 0, Checksum 0
-        p22 = re.compile(r'^Type +(?P<type>(\d+)), +Length +(?P<len>(\d+)),'
-                          ' +Data +(?P<data>(\d+)), +Checksum +(?P<csum>(\d+))$')
+        p22=r'^Type +(?P<type>(\d+)), +Length +(?P<len>(\d+)),'
+             ' +Data +(?P<data>(\d+)), +Checksum +(?P<csum>(\d+))$',
 
         # Summary traffic statistics for process ID 65109:
-        p23 = re.compile(r'^Summary +traffic +statistics +for +process +ID'
-                          ' +(?P<pid>(\d+)):$')
+        p23=r'^Summary +traffic +statistics +for +process +ID'
+             ' +(?P<pid>(\d+)):$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            # Execute command on device
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        address_family = 'ipv4'
+        vrf = 'default'
+        received = False ; sent = False
+        interface_stats = False ; summary_stats = False
+        max_size_stats = False ; current_size_stats = False
+
+        p = ShowIpOspfTraffic.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # OSPF statistics:
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ospf_stats_dict = ret_dict.setdefault('ospf_statistics', {})
                 continue
 
             # Last clearing of OSPF traffic counters never
             # Last clearing of interface traffic counters never
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if m.groupdict()['type'] == 'OSPF':
                     ospf_stats_dict['last_clear_traffic_counters'] = \
@@ -6349,7 +6198,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Rcvd: 2112690 total, 0 checksum errors
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 rcvd_dict = ospf_stats_dict.setdefault('rcvd', {})
@@ -6360,7 +6209,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
 
             # 2024732 hello, 938 database desc, 323 link state req
             # 2381794 hello, 1176 database desc, 43 link state req
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 if received:
@@ -6376,7 +6225,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
 
             # 11030 link state updates, 75666 link state acks
             # 92224 link state updates, 8893 link state acks
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 if received:
@@ -6390,7 +6239,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Sent: 2509472 total
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 sent_dict = ospf_stats_dict.setdefault('sent', {})
@@ -6400,7 +6249,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
 
             # OSPF Router with ID (10.169.197.252) (Process ID 65109)
             # OSPF Router with ID (10.36.3.3) (Process ID 1, VRF VRF1)
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 router_id = str(group['router_id'])
@@ -6420,7 +6269,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # OSPF queue statistics for process ID 65109:
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 queue_stats_dict = ospf_dict.setdefault('ospf_queue_statistics', {})
                 continue
@@ -6429,7 +6278,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
             # Limit             0        200          0
             # Drops             0          0          0
             # Max delay [msec] 49          2          2
-            m = p9_1.match(line)
+            m = p.p9_1.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].strip().lower().replace(" ", "_").\
@@ -6446,7 +6295,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
             # LS req            0          0          0
             # LS upd            0          0          0
             # LS ack           14         14          6
-            m = p9_2.match(line)
+            m = p.p9_2.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].strip().lower().replace(" ", "_").\
@@ -6466,7 +6315,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
             #                   InputQ   UpdateQ      OutputQ
             # Max size         14         14          6
             # Current size      0          0          0
-            m = p9_3.match(line)
+            m = p.p9_3.match(line)
             if m:
                 group = m.groupdict()
                 item = group['item'].strip().lower().replace(" ", "_")
@@ -6485,13 +6334,13 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Interface statistics:
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 intf_stats_dict = ospf_dict.setdefault('interface_statistics', {})
                 continue
 
             # Interface GigabitEthernet0/0/6
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 intf = m.groupdict()['intf']
                 intf_dict = intf_stats_dict.setdefault('interfaces', {}).\
@@ -6514,7 +6363,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
             # TX LS upd     12539                12553264
             # TX LS ack     899                  63396
             # TX Total      182893               26212884
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 if interface_stats:
@@ -6531,7 +6380,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # OSPF header errors
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 if interface_stats:
@@ -6544,7 +6393,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Length 0, Instance ID 0, Checksum 0, Auth Type 0,
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['length'] = int(group['len'])
@@ -6554,7 +6403,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Version 0, Bad Source 0, No Virtual Link 0,
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['version'] = int(group['version'])
@@ -6563,7 +6412,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Area Mismatch 0, No Sham Link 0, Self Originated 0,
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['area_mismatch'] = int(group['area_mismatch'])
@@ -6572,7 +6421,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Duplicate ID 0, Hello 0, MTU Mismatch 0,
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['duplicate_id'] = int(group['duplicate_id'])
@@ -6581,7 +6430,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Nbr Ignored 0, LLS 0, Unknown Neighbor 0,
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['nbr_ignored'] = int(group['nbr_ignored'])
@@ -6590,7 +6439,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Authentication 0, TTL Check Fail 0, Adjacency Throttle 0,
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['authentication'] = int(group['authentication'])
@@ -6599,7 +6448,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Authentication 0, TTL Check Fail 0, Test discard 0
-            m = p19_1.match(line)
+            m = p.p19_1.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['authentication'] = int(group['authentication'])
@@ -6608,7 +6457,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # BFD 0, Test discard 0
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 ospf_header_errors_dict['bfd'] = int(group['bfd'])
@@ -6616,7 +6465,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # OSPF LSA errors
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 if interface_stats:
                     sdict = intf_dict
@@ -6628,7 +6477,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Type 0, Length 0, Data 0, Checksum 0
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 group = m.groupdict()
                 ospf_lsa_errors_dict['type'] = int(group['type'])
@@ -6638,7 +6487,7 @@ class ShowIpOspfTraffic(ShowIpOspfTrafficSchema):
                 continue
 
             # Summary traffic statistics for process ID 65109:
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 pid = m.groupdict()['pid']
                 ospf_dict = ret_dict.setdefault('vrf', {}).\
@@ -6711,6 +6560,14 @@ class ShowIpOspfNeighbor(ShowIpOspfNeighborSchema):
         'show ip ospf {process_id} neighbor {interface}']
     exclude = ['dead_time']
 
+    patterns = Patterns(
+        # Neighbor ID     Pri   State           Dead Time   Address         Interface
+        # 172.16.197.253 128   FULL/DR         00:00:30    172.16.165.49  GigabitEthernet0/0/1
+        # 10.169.197.252   0   FULL/  -        00:00:36    10.169.197.93  GigabitEthernet2
+        p1=r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
+            ' +(?P<dead_time>\S+) +(?P<address>\S+) +(?P<interface>\S+)$',
+    )
+
     def cli(self, interface='', output=None, process_id=''):
 
         if output is None:
@@ -6731,17 +6588,12 @@ class ShowIpOspfNeighbor(ShowIpOspfNeighborSchema):
         # Init vars
         ret_dict = {}
 
-        # Neighbor ID     Pri   State           Dead Time   Address         Interface
-        # 172.16.197.253 128   FULL/DR         00:00:30    172.16.165.49  GigabitEthernet0/0/1
-        # 10.169.197.252   0   FULL/  -        00:00:36    10.169.197.93  GigabitEthernet2
-        
-        p1=re.compile(r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
-                       ' +(?P<dead_time>\S+) +(?P<address>\S+) +(?P<interface>\S+)$')
+        p = ShowIpOspfNeighbor.patterns
 
         for line in out.splitlines():
 
             line = line.strip()
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 neighbor = m.groupdict()['neighbor']
                 interface = m.groupdict()['interface']
@@ -6794,6 +6646,19 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
         'show ip ospf segment-routing adjacency-sid',
     ]
 
+    patterns = Patterns(
+        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
+        r1=r'OSPF\s+Router\s+with\s+ID\s+\((?P<router_id>\S+)\)\s+'
+            '\(Process\s+ID\s+(?P<process_id>\d+)\)',
+
+        # 16       10.16.2.2         Gi0/1/2            192.168.154.2       D U
+        # 17       10.16.2.2         Gi0/1/1            192.168.4.2       D U
+        r2=r'(?P<adj_sid>\d+)\s+(?P<neighbor_id>\S+)\s+'
+            '(?P<interface>\S+)\s+(?P<neighbor_address>\S+)\s+'
+            '(?P<flags>[SDPUGL\s]+)\s*(?:(?P<backup_nexthop>\S+))?'
+            '\s*(?:(?P<backup_interface>\S+))?',
+    )
+
     def cli(self, process_id=None, output=None):
 
         if output is None:
@@ -6806,16 +6671,7 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
         else:
             out = output
 
-        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        r1 = re.compile(r'OSPF\s+Router\s+with\s+ID\s+\((?P<router_id>\S+)\)\s+'
-                         '\(Process\s+ID\s+(?P<process_id>\d+)\)')
-
-        # 16       10.16.2.2         Gi0/1/2            192.168.154.2       D U   
-        # 17       10.16.2.2         Gi0/1/1            192.168.4.2       D U   
-        r2 = re.compile(r'(?P<adj_sid>\d+)\s+(?P<neighbor_id>\S+)\s+'
-                         '(?P<interface>\S+)\s+(?P<neighbor_address>\S+)\s+'
-                         '(?P<flags>[SDPUGL\s]+)\s*(?:(?P<backup_nexthop>\S+))?'
-                         '\s*(?:(?P<backup_interface>\S+))?')
+        p = ShowIpOspfSegmentRoutingAdjacencySid.patterns
 
         parsed_output = {}
 
@@ -6823,7 +6679,7 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            result = r1.match(line)
+            result = p.r1.match(line)
             if result:
                 group = result.groupdict()
 
@@ -6839,7 +6695,7 @@ class ShowIpOspfSegmentRoutingAdjacencySid(ShowIpOspfSegmentRoutingAdjacencySidS
 
             # 16       10.16.2.2         Gi0/1/2            192.168.154.2       D U
             # 17       10.16.2.2         Gi0/1/1            192.168.4.2       D U
-            result = r2.match(line)
+            result = p.r2.match(line)
             if result:
 
                 group = result.groupdict()
@@ -6902,24 +6758,28 @@ class ShowIpOspfFastRerouteTiLfa(ShowIpOspfFastRerouteTiLfaSchema):
 
     cli_command = 'show ip ospf fast-reroute ti-lfa'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
+    patterns = Patterns(
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)'
-            '\) +\(Process +ID +(?P<process_id>\d+)\)')
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>\S+)'
+            '\) +\(Process +ID +(?P<process_id>\d+)\)',
 
         # Process ID (65109)       no       yes      no          no
         # Area 8                  no       yes      no          no
         # Loopback0               no       no       no          no
         # GigabitEthernet0/1/2    no       yes      no          no
-        p2 = re.compile(r'^(?P<ospf_object>[\S\s]+) +(?P<ipfrr_enabled>(yes|no)'
-                         '( +\(inactive\))?) +(?P<sr_enabled>(yes|no)( +\(inactive\))?) '
-                         '+(?P<ti_lfa_configured>(yes|no)( +\(inactive\))?) +'
-                         '(?P<ti_lfa_enabled>(yes|no)( +\(inactive\))?)$')
+        p2=r'^(?P<ospf_object>[\S\s]+) +(?P<ipfrr_enabled>(yes|no)'
+            '( +\(inactive\))?) +(?P<sr_enabled>(yes|no)( +\(inactive\))?) '
+            '+(?P<ti_lfa_configured>(yes|no)( +\(inactive\))?) +'
+            '(?P<ti_lfa_enabled>(yes|no)( +\(inactive\))?)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        p = ShowIpOspfFastRerouteTiLfa.patterns
 
         # initial variables
         ret_dict = {}
@@ -6928,7 +6788,7 @@ class ShowIpOspfFastRerouteTiLfa(ShowIpOspfFastRerouteTiLfaSchema):
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = group['router_id']
@@ -6943,7 +6803,7 @@ class ShowIpOspfFastRerouteTiLfa(ShowIpOspfFastRerouteTiLfaSchema):
             # Area 8                  no       yes      no          no
             # Loopback0               no       no       no          no
             # GigabitEthernet0/1/2    no       yes      no          no
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ospf_object = group['ospf_object'].strip()
@@ -7007,23 +6867,26 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
 
     cli_command = 'show ip ospf segment-routing protected-adjacencies'
 
+    patterns = Patterns(
+        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
+        p1=r'OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
+            'Process +ID +(?P<process_id>\d+)\)',
+
+        # Area with ID (8)
+        p2=r'^Area +with +ID \((?P<area_id>\d+)\)$',
+
+        # 10.234.30.22     Gi10                192.168.10.2       17           192.168.10.3       Gi14
+        p3=r'^(?P<neighbor_id>\S+) +(?P<interface>\S+) +(?P<address>\S+) +('
+           r'?P<adj_sid>\d+)( +(?P<backup_nexthop>\S+))?( +(?P<backup_interface>\S+))?$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
-                         'Process +ID +(?P<process_id>\d+)\)')
-
-        # Area with ID (8)
-        p2 = re.compile(r'^Area +with +ID \((?P<area_id>\d+)\)$')
-
-        # 10.234.30.22     Gi10                192.168.10.2       17           192.168.10.3       Gi14
-        p3 = re.compile(
-            r'^(?P<neighbor_id>\S+) +(?P<interface>\S+) +(?P<address>\S+) +('
-            r'?P<adj_sid>\d+)( +(?P<backup_nexthop>\S+))?( +(?P<backup_interface>\S+))?$')
+        p = ShowIpOspfSegmentRoutingProtectedAdjacencies.patterns
 
         # initial variables
         ret_dict = {}
@@ -7032,7 +6895,7 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = group['router_id']
@@ -7043,7 +6906,7 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
                 continue
 
             # Area with ID (8)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 area_id = str(IPAddress(str(group['area_id'])))
@@ -7052,7 +6915,7 @@ class ShowIpOspfSegmentRoutingProtectedAdjacencies(ShowIpOspfSegmentRoutingProte
                 continue
 
             # 10.234.30.22     Gi10                192.168.10.2       17           192.168.10.3       Gi14
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_id = group['neighbor_id']
@@ -7113,25 +6976,29 @@ class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSch
 
     cli_command = ['show ip ospf segment-routing sid-database']
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command[0])
-        else:
-            out = output
-
+    patterns = Patterns(
         # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
-                        '\(Process +ID +(?P<pid>\d+)\)$')
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
+            '\(Process +ID +(?P<pid>\d+)\)$',
 
         # 1       (L)     10.4.1.1/32          10.4.1.1          8        Intra     0
         # 2               10.16.2.2/32          10.16.2.2          8        Intra     0
         #                 10.16.2.3/32          10.16.2.2          8        Intra     0
         # 3       (M)     10.16.2.3/32                                    Unknown   0
         #                 10.36.3.3/32               10.16.2.10         0
-        p2 = re.compile(r'(?:(?P<sid>\d+) +)?(?:\((?P<codes>[LNM,]+)\) +)?(?P<prefix>[\d\.\/]+)'
-                        r'( +(?P<adv_rtr_id>[\d\.]+))?( +(?P<area_id>\d+))?(?: +(?P<type>\w+))?'
-                        r'(?: +(?P<algo>\d+))?')
+        p2=r'(?:(?P<sid>\d+) +)?(?:\((?P<codes>[LNM,]+)\) +)?(?P<prefix>[\d\.\/]+)'
+           r'( +(?P<adv_rtr_id>[\d\.]+))?( +(?P<area_id>\d+))?(?: +(?P<type>\w+))?'
+           r'(?: +(?P<algo>\d+))?',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        p = ShowIpOspfSegmentRoutingSidDatabase.patterns
 
         ret_dict = {}
         sid_entries = 0
@@ -7140,7 +7007,7 @@ class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSch
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
 
@@ -7153,7 +7020,7 @@ class ShowIpOspfSegmentRoutingSidDatabase(ShowIpOspfSegmentRoutingSidDatabaseSch
             #                 10.16.2.3/32          10.16.2.2          8        Intra     0
             # 3       (M)     10.16.2.3/32                                    Unknown   0
             #                 10.36.3.3/32               10.16.2.10         0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 sid_entries += 1
@@ -7224,6 +7091,23 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
     cli_command = ['show ip ospf segment-routing global-block',
                    'show ip ospf {process_id} segment-routing global-block']
 
+    patterns = Patterns(
+        # OSPF Router with ID (10.4.1.1) (Process ID 1234)
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
+            '\(Process +ID +(?P<pid>\d+)\)$',
+
+        # OSPF Segment Routing Global Blocks in Area 3
+        p2=r'^OSPF +Segment +Routing +Global +Blocks +in +Area (?P<area>\d+)$',
+
+        # *10.4.1.1         Yes         SPF,StrictSPF 16000      8000         Label
+        # 10.16.2.2         Yes         SPF,StrictSPF 16000      8000         Label
+        # *10.4.1.1         No
+        # 10.16.2.2         No
+        p3=r'^\*?(?P<router_id>[\d\.]+) +(?P<sr_capable>\w+)'
+            '(?: +(?P<sr_algorithm>[\w,]+) +(?P<srgb_base>\d+) +'
+            '(?P<srgb_range>\d+) +(?P<sid_label>\w+))?$',
+    )
+
     def cli(self, process_id=None, output=None):
 
         if not output:
@@ -7236,20 +7120,7 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
         else:
             out = output
 
-        # OSPF Router with ID (10.4.1.1) (Process ID 1234)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>[\d+\.]+)\) +'
-                         '\(Process +ID +(?P<pid>\d+)\)$')
-
-        # OSPF Segment Routing Global Blocks in Area 3
-        p2 = re.compile(r'^OSPF +Segment +Routing +Global +Blocks +in +Area (?P<area>\d+)$')
-
-        # *10.4.1.1         Yes         SPF,StrictSPF 16000      8000         Label
-        # 10.16.2.2         Yes         SPF,StrictSPF 16000      8000         Label
-        # *10.4.1.1         No
-        # 10.16.2.2         No
-        p3 = re.compile(r'^\*?(?P<router_id>[\d\.]+) +(?P<sr_capable>\w+)'
-                         '(?: +(?P<sr_algorithm>[\w,]+) +(?P<srgb_base>\d+) +'
-                         '(?P<srgb_range>\d+) +(?P<sid_label>\w+))?$')
+        p = ShowIpOspfSegmentRoutingGlobalBlock.patterns
 
         ret_dict = {}
 
@@ -7257,7 +7128,7 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 1234)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
 
@@ -7266,7 +7137,7 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
                 continue
 
             # OSPF Segment Routing Global Blocks in Area 3
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
 
@@ -7275,7 +7146,7 @@ class ShowIpOspfSegmentRoutingGlobalBlock(ShowIpOspfSegmentRoutingGlobalBlockSch
 
             # *10.4.1.1         Yes         SPF,StrictSPF 16000      8000         Label
             # 10.16.2.2         Yes         SPF,StrictSPF 16000      8000         Label
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
 
@@ -7383,86 +7254,90 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
 
     cli_command = 'show ip ospf segment-routing'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-        
+    patterns = Patterns(
         # OSPF Router with ID (10.16.2.2) (Process ID 65109)
-        p1 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
-                         'Process +ID +(?P<process_id>\d+)\)$')
+        p1=r'^OSPF +Router +with +ID +\((?P<router_id>\S+)\) +\('
+            'Process +ID +(?P<process_id>\d+)\)$',
 
         # Global segment-routing state: Enabled
-        p2 = re.compile(r'^Global +segment\-routing +state: +'
-                         '(?P<global_segment_routing_state>\S+)$')
-        
+        p2=r'^Global +segment\-routing +state: +'
+            '(?P<global_segment_routing_state>\S+)$',
+
         # Prefer non-SR (LDP) Labels
-        p3 = re.compile(r'^Prefer +non\-SR +\(LDP\) +Labels$')
+        p3=r'^Prefer +non\-SR +\(LDP\) +Labels$',
 
         # Do not advertise Explicit Null
-        p4 = re.compile(r'^Do +not +advertise +Explicit +Null$')
+        p4=r'^Do +not +advertise +Explicit +Null$',
 
         # Global Block (SRGB):
-        p5 = re.compile(r'^Global +Block +\(SRGB\):$')
+        p5=r'^Global +Block +\(SRGB\):$',
 
         # Range: 16000 - 23999
-        p6 = re.compile(r'^Range: +(?P<start>\d+) +\- +(?P<end>\d+)$')
+        p6=r'^Range: +(?P<start>\d+) +\- +(?P<end>\d+)$',
 
         # State: Created
-        p7 = re.compile(r'^State: +(?P<state>\S+)$')
+        p7=r'^State: +(?P<state>\S+)$',
 
         # Local Block (SRLB):
-        p8 = re.compile(r'^Local +Block +\(SRLB\):$')
+        p8=r'^Local +Block +\(SRLB\):$',
 
         # Registered with SR App, client handle: 2
-        p9 = re.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +'
-                         'client +handle: +(?P<client_handle>\d+)$')
+        p9=r'^Registered +with +(?P<app_name>[\S\s]+), +'
+            'client +handle: +(?P<client_handle>\d+)$',
 
         # SR algo 0 Connected map notifications active (handle 0x0), bitmask 0x1
-        p10 = re.compile(r'^SR +algo +(?P<algo>\d+) +(?P<notifications>[\S\s]+) +\('
-                          'handle +(?P<handle>\w+)\), +bitmask +(?P<bitmask>\w+)$')
+        p10=r'^SR +algo +(?P<algo>\d+) +(?P<notifications>[\S\s]+) +\('
+             'handle +(?P<handle>\w+)\), +bitmask +(?P<bitmask>\w+)$',
 
         # Registered with MPLS, client-id: 100
-        p12 = re.compile(r'^Registered +with +(?P<app_name>[\S\s]+), +client\-id: +'
-                          '(?P<client_id>\d+)$')
+        p12=r'^Registered +with +(?P<app_name>[\S\s]+), +client\-id: +'
+             '(?P<client_id>\d+)$',
 
         # Max labels: platform 16, available 13
-        p13 = re.compile(r'^Max +labels: +platform +(?P<platform>\d+), available +(?P<available>\d+)$')
+        p13=r'^Max +labels: +platform +(?P<platform>\d+), available +(?P<available>\d+)$',
 
         # Max labels pushed by OSPF: uloop tunnels 10, TI-LFA tunnels 10
-        p14 = re.compile(r'^Max +labels +pushed +by +OSPF: +uloop +tunnels +(?P<uloop_tunnels>\d+)'
-                          ', +TI\-LFA +tunnels +(?P<ti_lfa_tunnels>\d+)$')
+        p14=r'^Max +labels +pushed +by +OSPF: +uloop +tunnels +(?P<uloop_tunnels>\d+)'
+             ', +TI\-LFA +tunnels +(?P<ti_lfa_tunnels>\d+)$',
 
         # mfi label reservation ack not pending
-        p15 = re.compile(r'^mfi +label +reservation +ack +not +pending$')
+        p15=r'^mfi +label +reservation +ack +not +pending$',
 
         # Bind Retry timer not running
-        p16 = re.compile(r'^Bind +Retry +timer +not +running$')
-        
+        p16=r'^Bind +Retry +timer +not +running$',
+
         # Bind Retry timer running, left ???
-        p16_1 = re.compile(r'^Bind +Retry +timer +running, +left +(?P<bind_retry_timer_left>\S+)$')
+        p16_1=r'^Bind +Retry +timer +running, +left +(?P<bind_retry_timer_left>\S+)$',
 
         # Adj Label Bind Retry timer not running
-        p17 = re.compile(r'^Adj +Label +Bind +Retry +timer +not +running$')
+        p17=r'^Adj +Label +Bind +Retry +timer +not +running$',
 
         # Adj Label Bind Retry timer running, left ???
-        p17_1 = re.compile(r'^Adj +Label +Bind +Retry +timer +running, +left +(?P<adj_label_bind_retry_timer_left>\S+)$')
+        p17_1=r'^Adj +Label +Bind +Retry +timer +running, +left +(?P<adj_label_bind_retry_timer_left>\S+)$',
 
         # sr-app locks requested: srgb 0, srlb 0
-        p18 = re.compile(r'^sr\-app +locks +requested: +srgb +(?P<srgb>\d+), +srlb +(?P<srlb>\d+)$')
+        p18=r'^sr\-app +locks +requested: +srgb +(?P<srgb>\d+), +srlb +(?P<srlb>\d+)$',
 
         # TE Router ID 10.16.2.2
-        p19 = re.compile(r'^TE +Router +ID +(?P<te_router_id>\S+)$')
+        p19=r'^TE +Router +ID +(?P<te_router_id>\S+)$',
 
         # Area Topology name Forwarding Strict SPF
-        p20 = re.compile(r'^Area +Topology +name +Forwarding +Strict +SPF$')
+        p20=r'^Area +Topology +name +Forwarding +Strict +SPF$',
 
         # 8    Base             MPLS          Capable
         # AS external    Base             MPLS          Not applicable
-        p21 = re.compile(r'^(?P<area>(\d+|(\w+ +\w+))) +(?P<topology_name>\w+)'
-                         ' +(?P<forwarding>\w+) +(?P<strict_spf>\w+( +\w+)?)$')
+        p21=r'^(?P<area>(\d+|(\w+ +\w+))) +(?P<topology_name>\w+)'
+             ' +(?P<forwarding>\w+) +(?P<strict_spf>\w+( +\w+)?)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
         
+        p = ShowIpOspfSegmentRouting.patterns
+
         # initial variables
         ret_dict = {}
 
@@ -7470,7 +7345,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
             line = line.strip()
 
             # OSPF Router with ID (10.16.2.2) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = group['router_id']
@@ -7487,7 +7362,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Global segment-routing state: Enabled
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 global_segment_routing_state = group['global_segment_routing_state']
@@ -7495,7 +7370,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Prefer non-SR (LDP) Labels
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 sr_attributes_dict = process_id_dict.setdefault('sr_attributes', {})
@@ -7503,7 +7378,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Do not advertise Explicit Null
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 sr_attributes_dict = process_id_dict.setdefault('sr_attributes', {})
@@ -7511,14 +7386,14 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Global Block (SRGB):
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 block_dict = process_id_dict.setdefault('global_block_srgb', {})
                 continue
             
             # Range: 16000 - 23999
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 range_dict = block_dict.setdefault('range', {})
@@ -7527,7 +7402,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # State: Created
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 state = group['state']
@@ -7535,14 +7410,14 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Local Block (SRLB):
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 block_dict = process_id_dict.setdefault('local_block_srlb', {})
                 continue
             
             # Registered with SR App, client handle: 2
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 app_name = group['app_name']
@@ -7554,7 +7429,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
             
             # SR algo 0 Connected map notifications active (handle 0x0), bitmask 0x1
             # SR algo 0 Active policy map notifications active (handle 0x2), bitmask 0xC
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 algo = int(group['algo'])
@@ -7571,7 +7446,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Registered with MPLS, client-id: 100
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 app_name = group['app_name']
@@ -7582,7 +7457,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Max labels: platform 16, available 13
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 platform = int(group['platform'])
@@ -7593,7 +7468,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # Max labels pushed by OSPF: uloop tunnels 10, TI-LFA tunnels 10
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 uloop_tunnels = int(group['uloop_tunnels'])
@@ -7605,19 +7480,19 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
 
             # mfi label reservation ack not pending
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 process_id_dict.update({'mfi_label_reservation_ack_pending': False})
                 continue
 
             # Bind Retry timer not running
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 process_id_dict.update({'bind_retry_timer_running': False})
                 continue
             
             # Bind Retry timer running, left ???
-            m = p16_1.match(line)
+            m = p.p16_1.match(line)
             if m:
                 group = m.groupdict()
                 bind_retry_timer_left = group['bind_retry_timer_left']
@@ -7625,13 +7500,13 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
 
             # Adj Label Bind Retry timer not running
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 process_id_dict.update({'adj_label_bind_retry_timer_running': False})
                 continue
             
             # adj_label_bind_retry_timer_left
-            m = p17_1.match(line)
+            m = p.p17_1.match(line)
             if m:
                 group = m.groupdict()
                 adj_label_bind_retry_timer_left = group['adj_label_bind_retry_timer_left']
@@ -7639,7 +7514,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
 
             # sr-app locks requested: srgb 0, srlb 0
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 srgb = int(group['srgb'])
@@ -7650,7 +7525,7 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
             
             # TE Router ID 10.16.2.2
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 te_router_id = group['te_router_id']
@@ -7659,14 +7534,14 @@ class ShowIpOspfSegmentRouting(ShowIpOspfSegmentRoutingSchema):
                 continue
 
             # Area Topology name Forwarding Strict SPF
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 segment_routing_enabled_dict = process_id_dict.setdefault('segment_routing_enabled', {})
                 continue
 
             # 8    Base             MPLS          Capable
             # AS external    Base             MPLS          Not applicable
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 group = m.groupdict()
                 area = group['area']
@@ -7698,101 +7573,105 @@ class ShowIpOspfLinksParser2(MetaParser):
         * 'show ip ospf sham-links __'
     '''
 
-    def cli(self, cmd, link_type,output=None):
-
-        assert link_type in ['virtual_links', 'sham_links']
-
-        if output is None:
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # Init vars
-        ret_dict = {}
-        af = 'ipv4'
-
-        # crypo_algorithm dict
-        crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
-
+    patterns = Patterns(
         # Sham Link OSPF_SL0 to address 10.151.22.22 is up
         # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-        p1 = re.compile(r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
-                            ' +(address|router) +(?P<address>(\S+)) +is'
-                            ' +(?P<link_state>(up|down))$')
+        p1=r'^(Virtual|Sham) +Link +(?P<interface>(\S+)) +to'
+            ' +(address|router) +(?P<address>(\S+)) +is'
+            ' +(?P<link_state>(up|down))$',
 
         # Area 1, source address 10.21.33.33
         # Area 1 source address 10.229.11.11
-        p2 = re.compile(r'^Area +(?P<area>(\S+)),? +source +address'
-                            ' +(?P<source_address>(\S+))$')
-        
+        p2=r'^Area +(?P<area>(\S+)),? +source +address'
+            ' +(?P<source_address>(\S+))$',
+
         # Run as demand circuit
-        p3 = re.compile(r'^Run +as +demand +circuit$')
+        p3=r'^Run +as +demand +circuit$',
 
         # DoNotAge LSA not allowed (Number of DCbitless LSA is 7).
         # DoNotAge LSA not allowed (Number of DCbitless LSA is 1). Cost of using 111 State POINT_TO_POINT,
-        p4 = re.compile(r'^DoNotAge +LSA +not +allowed'
-                            ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
-                            '(?: +Cost +of +using +(?P<cost>(\d+)))?'
-                            '(?: State +(?P<state>(\S+)))?$')
+        p4=r'^DoNotAge +LSA +not +allowed'
+            ' +\(Number +of +DCbitless +LSA +is +(?P<dcbitless>(\d+))\).'
+            '(?: +Cost +of +using +(?P<cost>(\d+)))?'
+            '(?: State +(?P<state>(\S+)))?$',
 
         # Transit area 1
         # Transit area 1, via interface GigabitEthernet0/1
-        p5 = re.compile(r'^Transit +area +(?P<area>(\S+)),'
-                            '(?: +via +interface +(?P<intf>(\S+)))?$')
+        p5=r'^Transit +area +(?P<area>(\S+)),'
+            '(?: +via +interface +(?P<intf>(\S+)))?$',
 
         # Topology-MTID    Cost    Disabled     Shutdown      Topology Name
         #             0       1          no           no               Base
-        p6 = re.compile(r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
-                            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
-                            ' +(?P<topo_name>(\S+))$')
+        p6=r'^(?P<mtid>(\d+)) +(?P<topo_cost>(\d+))'
+            ' +(?P<disabled>(yes|no)) +(?P<shutdown>(yes|no))'
+            ' +(?P<topo_name>(\S+))$',
 
         # Transmit Delay is 1 sec, State POINT_TO_POINT,
-        p7 = re.compile(r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
-                            ' +sec, +State +(?P<state>(\S+)),?$')
+        p7=r'^Transmit +Delay +is +(?P<transmit_delay>(\d+))'
+            ' +sec, +State +(?P<state>(\S+)),?$',
 
         # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
         # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
         # Timer intervals configured, Hello 10, Dead 40, Wait 40,
-        p8 = re.compile(r'^Timer +intervals +configured,'
-                            ' +Hello +(?P<hello>(\d+)),'
-                            ' +Dead +(?P<dead>(\d+)),'
-                            ' +Wait +(?P<wait>(\d+)),'
-                            '(?: +Retransmit +(?P<retransmit>(\d+)))?$')
+        p8=r'^Timer +intervals +configured,'
+            ' +Hello +(?P<hello>(\d+)),'
+            ' +Dead +(?P<dead>(\d+)),'
+            ' +Wait +(?P<wait>(\d+)),'
+            '(?: +Retransmit +(?P<retransmit>(\d+)))?$',
 
         # Strict TTL checking enabled, up to 3 hops allowed
-        p9 = re.compile(r'^Strict +TTL +checking'
-                            ' +(?P<strict_ttl>(enabled|disabled))'
-                            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$')
+        p9=r'^Strict +TTL +checking'
+            ' +(?P<strict_ttl>(enabled|disabled))'
+            '(?:, +up +to +(?P<hops>(\d+)) +hops +allowed)?$',
 
         # Hello due in 00:00:03:179
-        p10 = re.compile(r'^Hello +due +in +(?P<hello_timer>(\S+))$')
+        p10=r'^Hello +due +in +(?P<hello_timer>(\S+))$',
 
         # Adjacency State FULL
-        p11 = re.compile(r'^Adjacency +State +(?P<adj_state>(\S+))$')
+        p11=r'^Adjacency +State +(?P<adj_state>(\S+))$',
 
         # Index 1/2/2, retransmission queue length 0, number of retransmission 2
-        p12 = re.compile(r'^Index +(?P<index>(\S+)), +retransmission +queue'
-                            ' +length +(?P<length>(\d+)), +number +of'
-                            ' +retransmission +(?P<retrans>(\d+))$')
-        
+        p12=r'^Index +(?P<index>(\S+)), +retransmission +queue'
+             ' +length +(?P<length>(\d+)), +number +of'
+             ' +retransmission +(?P<retrans>(\d+))$',
+
         # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-        p13 = re.compile(r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$')
+        p13=r'^First +(?P<first>(\S+)) +Next +(?P<next>(\S+))$',
 
         # Last retransmission scan length is 1, maximum is 1
-        p14 = re.compile(r'^Last +retransmission +scan +length +is'
-                            ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$')
+        p14=r'^Last +retransmission +scan +length +is'
+             ' +(?P<len>(\d+)), +maximum +is +(?P<max>(\d+))$',
 
         # Last retransmission scan time is 0 msec, maximum is 0 msec
-        p15 = re.compile(r'^Last +retransmission +scan +time +is'
-                            ' +(?P<time>(\d+)) +msec, +maximum +is'
-                            ' +(?P<max>(\d+)) +msec$')
+        p15=r'^Last +retransmission +scan +time +is'
+             ' +(?P<time>(\d+)) +msec, +maximum +is'
+             ' +(?P<max>(\d+)) +msec$',
+    )
+
+    def cli(self, cmd, link_type,output=None):
+
+        assert link_type in ['virtual_links', 'sham_links']
+
+        if output is None:
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        af = 'ipv4'
+
+        # crypo_algorithm dict
+        crypto_dict = {'cryptographic': 'md5', 'simple password': 'simple'}
+
+        p = ShowIpOspfLinksParser2.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Sham Link OSPF_SL0 to address 10.151.22.22 is up
             # Virtual Link OSPF_VL0 to router 10.64.4.4 is up
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 address = str(m.groupdict()['address'])
                 sl_remote_id = vl_router_id = address
@@ -7814,7 +7693,7 @@ class ShowIpOspfLinksParser2(MetaParser):
 
             # Area 1, source address 10.21.33.33
             # Area 1 source address 10.229.11.11
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
                 source_address = str(m.groupdict()['source_address'])
@@ -7851,7 +7730,7 @@ class ShowIpOspfLinksParser2(MetaParser):
                 continue
 
             # Run as demand circuit
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 if link_type == 'sham_links':
                     sub_dict['demand_circuit'] = True
@@ -7861,7 +7740,7 @@ class ShowIpOspfLinksParser2(MetaParser):
 
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 7).
             # DoNotAge LSA not allowed (Number of DCbitless LSA is 1). Cost of using 111 State POINT_TO_POINT,
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 dcbitless_lsa_count = int(m.groupdict()['dcbitless'])
                 donotage_lsa = 'not allowed'
@@ -7882,7 +7761,7 @@ class ShowIpOspfLinksParser2(MetaParser):
 
             # Transit area 1
             # Transit area 1, via interface GigabitEthernet0/1
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 area = str(IPAddress(str(m.groupdict()['area'])))
 
@@ -7938,7 +7817,7 @@ class ShowIpOspfLinksParser2(MetaParser):
 
             # Topology-MTID    Cost    Disabled     Shutdown      Topology Name
             #             0       1          no           no               Base
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 mtid = int(m.groupdict()['mtid'])
                 if 'topology' not in sub_dict:
@@ -7958,7 +7837,7 @@ class ShowIpOspfLinksParser2(MetaParser):
                     continue
             
             # Transmit Delay is 1 sec, State POINT_TO_POINT,
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 sub_dict['transmit_delay'] = int(m.groupdict()['transmit_delay'])
                 state = str(m.groupdict()['state']).lower()
@@ -7969,7 +7848,7 @@ class ShowIpOspfLinksParser2(MetaParser):
             # Timer intervals configured, Hello 3, Dead 13, Wait 13, Retransmit 5
             # Timer intervals configured, Hello 4, Dead 16, Wait 16, Retransmit 44
             # Timer intervals configured, Hello 10, Dead 40, Wait 40,
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 if m.groupdict()['hello']:
                     sub_dict['hello_interval'] = int(m.groupdict()['hello'])
@@ -7982,7 +7861,7 @@ class ShowIpOspfLinksParser2(MetaParser):
                 continue
 
             # Strict TTL checking enabled, up to 3 hops allowed
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 if 'ttl_security' not in sub_dict:
                     sub_dict['ttl_security'] = {}
@@ -7995,19 +7874,19 @@ class ShowIpOspfLinksParser2(MetaParser):
                     continue
 
             # Hello due in 00:00:03:179
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 sub_dict['hello_timer'] = str(m.groupdict()['hello_timer'])
                 continue          
           
             # Adjacency State FULL
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 sub_dict['adjacency_state'] = str(m.groupdict()['adj_state']).lower()
                 continue
 
             # Index 1/2/2, retransmission queue length 0, number of retransmission 2
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 sub_dict['index'] = str(m.groupdict()['index'])
                 sub_dict['retrans_qlen'] = int(m.groupdict()['length'])
@@ -8015,14 +7894,14 @@ class ShowIpOspfLinksParser2(MetaParser):
                 continue
 
             # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 sub_dict['first'] = str(m.groupdict()['first'])
                 sub_dict['next'] = str(m.groupdict()['next'])
                 continue
 
             # Last retransmission scan length is 1, maximum is 1
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 sub_dict['last_retransmission_scan_length'] = \
                     int(m.groupdict()['len'])
@@ -8031,7 +7910,7 @@ class ShowIpOspfLinksParser2(MetaParser):
                 continue
 
             # Last retransmission scan time is 0 msec, maximum is 0 msec
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 sub_dict['last_retransmission_scan_time'] = \
                     int(m.groupdict()['time'])
@@ -8241,6 +8120,14 @@ class ShowIpv6OspfNeighbor(ShowIpv6OspfNeighborSchema):
         'show ipv6 ospf neighbor']
     exclude = ['dead_time']
 
+    patterns = Patterns(
+        # Neighbor ID     Pri   State           Dead Time   Interface ID   Interface
+        # 172.16.197.253 128   FULL/DR         00:00:30          21       GigabitEthernet0/0/1
+        # 10.169.197.252   0   FULL/  -        00:00:36          23       GigabitEthernet2
+        p1=r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
+            ' +(?P<dead_time>\S+) +(?P<interface_id>\S+) +(?P<interface>\S+)$',
+    )
+
     def cli(self, interface='', output=None):
 
         if output is None:
@@ -8253,17 +8140,12 @@ class ShowIpv6OspfNeighbor(ShowIpv6OspfNeighborSchema):
         # Init vars
         ret_dict = {}
 
-        # Neighbor ID     Pri   State           Dead Time   Interface ID   Interface
-        # 172.16.197.253 128   FULL/DR         00:00:30          21       GigabitEthernet0/0/1
-        # 10.169.197.252   0   FULL/  -        00:00:36          23       GigabitEthernet2
-
-        p1 = re.compile(r'^(?P<neighbor>\S+) +(?P<pri>\d+) +(?P<state>\S+(?:\s+\S+)?)'
-                        ' +(?P<dead_time>\S+) +(?P<interface_id>\S+) +(?P<interface>\S+)$')
+        p = ShowIpv6OspfNeighbor.patterns
 
         for line in output.splitlines():
 
             line = line.strip()
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 neighbor = m.groupdict()['neighbor']
                 interface = m.groupdict()['interface']
@@ -8304,30 +8186,34 @@ class ShowIpOspfNsr(ShowIpOspfNsrSchema):
 
     cli_command = 'show ip ospf nsr'
 
-    def cli(self, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
-
+    patterns = Patterns(
         # Redundancy state: ACTIVE
-        p1 = re.compile(r"^Redundancy\s+state:\s+(?P<redundancy_state>\w+)$")
-        
+        p1=r"^Redundancy\s+state:\s+(?P<redundancy_state>\w+)$",
+
         # Peer redundancy state: STANDBY HOT
-        p2 = re.compile(r"^Peer\s+redundancy\s+state:\s+(?P<peer_redundancy_state>\S+\s+\S+)$")
-        
+        p2=r"^Peer\s+redundancy\s+state:\s+(?P<peer_redundancy_state>\S+\s+\S+)$",
+
         # Routing Process "ospf 50" with ID 2.200.1.2
-        p3 = re.compile(r"^Routing\s+Process\s+\"ospf\s+(?P<ospf_num>\d+)\"\s+with\s+ID\s+(?P<ospf_id>(\d{1,3}\.){3}\d{1,3})$")
-        
+        p3=r"^Routing\s+Process\s+\"ospf\s+(?P<ospf_num>\d+)\"\s+with\s+ID\s+(?P<ospf_id>(\d{1,3}\.){3}\d{1,3})$",
+
         # Checkpoint message sequence number: 12358
-        p4 = re.compile(r"^Checkpoint\s+message\s+sequence\s+number:\s+(?P<sequence_num>\d+)$")
-        
+        p4=r"^Checkpoint\s+message\s+sequence\s+number:\s+(?P<sequence_num>\d+)$",
+
         # Bulk sync operations:  1
-        p5 = re.compile(r"^Bulk\s+sync\s+operations:\s+(?P<sync_operations>\d+)$")
-        
+        p5=r"^Bulk\s+sync\s+operations:\s+(?P<sync_operations>\d+)$",
+
         # Next sync check time:  20:29:44.061 IST Thu Oct 6 2022
-        p6 = re.compile(r"^Next\s+sync\s+check\s+time:\s+(?P<check_time>\S+)\s+(?P<check_date>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$")
-        
+        p6=r"^Next\s+sync\s+check\s+time:\s+(?P<check_time>\S+)\s+(?P<check_date>\S+\s+\S+\s+\S+\s+\S+\s+\S+)$",
+
         # LSA Count: 60, Checksum Sum 0x001DF372
-        p7 = re.compile(r"^LSA\s+Count:\s+(?P<lsa_count>\d+),\s+Checksum\s+Sum\s+(?P<checksum>\S+)$")
+        p7=r"^LSA\s+Count:\s+(?P<lsa_count>\d+),\s+Checksum\s+Sum\s+(?P<checksum>\S+)$",
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        p = ShowIpOspfNsr.patterns
 
         ret_dict = {}
 
@@ -8335,21 +8221,21 @@ class ShowIpOspfNsr(ShowIpOspfNsrSchema):
             line = line.strip()
 
             # Redundancy state: ACTIVE
-            match_obj = p1.match(line)
+            match_obj = p.p1.match(line)
             if match_obj:
                 dict_val = match_obj.groupdict()
                 ret_dict['redundancy_state'] = dict_val['redundancy_state']
                 continue
 
             # Peer redundancy state: STANDBY HOT
-            match_obj = p2.match(line)
+            match_obj = p.p2.match(line)
             if match_obj:
                 dict_val = match_obj.groupdict()
                 ret_dict['peer_redundancy_state'] = dict_val['peer_redundancy_state']
                 continue
 
             # Routing Process "ospf 50" with ID 2.200.1.2
-            match_obj = p3.match(line)
+            match_obj = p.p3.match(line)
             if match_obj:
                 dict_val = match_obj.groupdict()
                 ret_dict['ospf_num'] = int(dict_val['ospf_num'])
@@ -8357,21 +8243,21 @@ class ShowIpOspfNsr(ShowIpOspfNsrSchema):
                 continue
 
             # Checkpoint message sequence number: 12358
-            match_obj = p4.match(line)
+            match_obj = p.p4.match(line)
             if match_obj:
                 dict_val = match_obj.groupdict()
                 ret_dict['sequence_num'] = int(dict_val['sequence_num'])
                 continue
             
             # Bulk sync operations:  1
-            match_obj = p5.match(line)
+            match_obj = p.p5.match(line)
             if match_obj:
                 dict_val = match_obj.groupdict()
                 ret_dict['sync_operations'] = int(dict_val['sync_operations'])
                 continue
 
             # Next sync check time:  20:29:44.061 IST Thu Oct 6 2022
-            match_obj = p6.match(line)
+            match_obj = p.p6.match(line)
             if match_obj:
                 dict_val = match_obj.groupdict()
                 ret_dict['check_time'] = dict_val['check_time']
@@ -8379,7 +8265,7 @@ class ShowIpOspfNsr(ShowIpOspfNsrSchema):
                 continue
 
             # LSA Count: 60, Checksum Sum 0x001DF372
-            match_obj = p7.match(line)
+            match_obj = p.p7.match(line)
             if match_obj:
                 dict_val = match_obj.groupdict()
                 ret_dict['lsa_count'] = int(dict_val['lsa_count'])
@@ -8423,22 +8309,26 @@ class ShowIpOspfRibRedistribution(ShowIpOspfRibRedistributionSchema):
     """
     cli_command = 'show ip ospf rib redistribution'
     
-    def cli(self, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
-
+    patterns = Patterns(
         # OSPF Router with ID (10.4.1.1) (Process ID 100)
-        p1 = re.compile(r'OSPF+ Router +with +ID +\((?P<router_id>\S+)\)+\s+\(Process +ID +(?P<instance>\d+)\)')
+        p1=r'OSPF+ Router +with +ID +\((?P<router_id>\S+)\)+\s+\(Process +ID +(?P<instance>\d+)\)',
 
         # Base Topology (MTID 0)
-        p2 = re.compile(r'Base +Topology +\(MTID (?P<mtid>\d+)\)$')
+        p2=r'Base +Topology +\(MTID (?P<mtid>\d+)\)$',
 
         # 40.0.0.1/32, type 2, metric 20, tag 0, from IS-IS Router
-        p3 = re.compile(r'(?P<network>\S+), type (?P<type>\d+), metric (?P<metric>\d+), tag (?P<tag>\d+), from (?P<from>.*)$')
-        
+        p3=r'(?P<network>\S+), type (?P<type>\d+), metric (?P<metric>\d+), tag (?P<tag>\d+), from (?P<from>.*)$',
+
         # via 40.60.1.40, Ethernet0/2
         # via Null0
-        p4 = re.compile(r'via ((?P<via_network>\S+),)?\s*(?P<interface>\S+)')
+        p4=r'via ((?P<via_network>\S+),)?\s*(?P<interface>\S+)',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        p = ShowIpOspfRibRedistribution.patterns
 
         # initial variables
         ret_dict = {}
@@ -8446,7 +8336,7 @@ class ShowIpOspfRibRedistribution(ShowIpOspfRibRedistributionSchema):
             line = line.strip()
 
             # OSPF Router with ID (10.4.1.1) (Process ID 65109)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 router_id = str(IPAddress(group['router_id']))
@@ -8459,7 +8349,7 @@ class ShowIpOspfRibRedistribution(ShowIpOspfRibRedistributionSchema):
                 continue
 
             #         Base Topology (MTID 0)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 mtid = group['mtid']
@@ -8467,7 +8357,7 @@ class ShowIpOspfRibRedistribution(ShowIpOspfRibRedistributionSchema):
                 continue
 
             # 40.0.0.1/32, type 2, metric 20, tag 0, from IS-IS Router
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 network = group['network']
@@ -8480,7 +8370,7 @@ class ShowIpOspfRibRedistribution(ShowIpOspfRibRedistributionSchema):
                 continue
 
             #  via 40.60.1.40, Ethernet0/2
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 via_network = group['via_network']
@@ -8560,64 +8450,68 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
 
     cli_command = 'show ipv6 ospf interface {interface}'
 
-    def cli(self, interface, output=None):
-        if output is None:
-            cmd = self.cli_command.format(interface=interface)
-        
-        output = self.device.execute(cmd)
-
+    patterns = Patterns(
         # TwentyFiveGigE1/0/3 is up, line protocol is up (connected)
-        p1 = re.compile(r'^(?P<interface>[\S]+) is (?P<interface_status>[\S]+), line protocol is (?P<line_status>[\S]+)\s+\((?P<connect_status>[\S]+)\)$')
+        p1=r'^(?P<interface>[\S]+) is (?P<interface_status>[\S]+), line protocol is (?P<line_status>[\S]+)\s+\((?P<connect_status>[\S]+)\)$',
 
         # Link Local Address FE80::2A7:42FF:FED7:4CFF, Interface ID 5 (snmp-if-index)
-        p2 = re.compile(r'^Link Local Address (?P<link_local_address>[\S]+), Interface ID (?P<interface_id>[\d]+)\s+\((?P<if_index>[\S]+)\)$')
+        p2=r'^Link Local Address (?P<link_local_address>[\S]+), Interface ID (?P<interface_id>[\d]+)\s+\((?P<if_index>[\S]+)\)$',
 
         # Area 0, Process ID 1, Instance ID 0, Router ID 109.0.0.1
-        p3 = re.compile(r'^Area (?P<area>[\d]+), Process ID (?P<process_id>[\d]+), Instance ID (?P<instance_id>[\d]+), Router ID (?P<router_id>[\S]+)$')
+        p3=r'^Area (?P<area>[\d]+), Process ID (?P<process_id>[\d]+), Instance ID (?P<instance_id>[\d]+), Router ID (?P<router_id>[\S]+)$',
 
         # Network Type POINT_TO_POINT, Cost: 1
-        p4 = re.compile(r'^Network Type (?P<network_type>[\S]+), Cost: (?P<cost>[\d]+)$')
-        
+        p4=r'^Network Type (?P<network_type>[\S]+), Cost: (?P<cost>[\d]+)$',
+
         # Transmit Delay is 1 sec, State POINT_TO_POINT
-        p5 = re.compile(r'^Transmit Delay is (?P<transmit_delay>[\d\s\w]+), State (?P<state>[\S]+)$')
+        p5=r'^Transmit Delay is (?P<transmit_delay>[\d\s\w]+), State (?P<state>[\S]+)$',
 
         # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-        p6 = re.compile(r'^Timer intervals configured, Hello (?P<hello>[\d]+), Dead (?P<dead>[\d]+), Wait (?P<wait>[\d]+), Retransmit (?P<retransmit>[\d]+)$')
+        p6=r'^Timer intervals configured, Hello (?P<hello>[\d]+), Dead (?P<dead>[\d]+), Wait (?P<wait>[\d]+), Retransmit (?P<retransmit>[\d]+)$',
 
         # Hello due in 00:00:08
-        p6_1 = re.compile(r'^Hello due in (?P<hello_due>\S+)$')
-        
+        p6_1=r'^Hello due in (?P<hello_due>\S+)$',
+
         # Graceful restart helper support enabled
-        p7 = re.compile(r'^Graceful restart helper support (?P<graceful_restart_helper_support>[\S]+)$')
+        p7=r'^Graceful restart helper support (?P<graceful_restart_helper_support>[\S]+)$',
 
         # Index 1/4/4, flood queue length 0
-        p8 = re.compile(r'^Index (?P<index>\S+), flood queue length (?P<flood_queue_length>\d+)$')
+        p8=r'^Index (?P<index>\S+), flood queue length (?P<flood_queue_length>\d+)$',
 
         # Next 0x0(0)/0x0(0)/0x0(0)
-        p9 = re.compile(r'^Next (?P<next>\S+)$')
+        p9=r'^Next (?P<next>\S+)$',
 
         # Last flood scan length is 3, maximum is 3
-        p10 = re.compile(r'^Last flood scan length is (?P<scan_length>\d+), maximum is (?P<scan_length_maximum>\d+)$')
+        p10=r'^Last flood scan length is (?P<scan_length>\d+), maximum is (?P<scan_length_maximum>\d+)$',
 
         # Last flood scan time is 0 msec, maximum is 0 msec
-        p11 = re.compile(r'^Last flood scan time is (?P<scan_time_msec>\d+) msec, maximum is (?P<scan_time_maximum_msec>\d+) msec$')
+        p11=r'^Last flood scan time is (?P<scan_time_msec>\d+) msec, maximum is (?P<scan_time_maximum_msec>\d+) msec$',
 
         # Neighbor Count is 1, Adjacent neighbor count is 1
-        p12 = re.compile(r'^Neighbor Count is (?P<neighbor_count>[\d]+), Adjacent neighbor count is (?P<adjacent_neighbor_count>[\d]+)$')
+        p12=r'^Neighbor Count is (?P<neighbor_count>[\d]+), Adjacent neighbor count is (?P<adjacent_neighbor_count>[\d]+)$',
 
         # Adjacent with neighbor 109.0.0.5
-        p13 = re.compile(r'^Adjacent with neighbor (?P<adjacent_neighbor_address>[\S]+)$')
+        p13=r'^Adjacent with neighbor (?P<adjacent_neighbor_address>[\S]+)$',
 
         # Suppress hello for 0 neighbor(s)
-        p14 = re.compile(r'^Suppress hello for (?P<suppressed_hello_neighbor_count>\d+) neighbor\(s\)$')
+        p14=r'^Suppress hello for (?P<suppressed_hello_neighbor_count>\d+) neighbor\(s\)$',
+    )
+
+    def cli(self, interface, output=None):
+        if output is None:
+            cmd = self.cli_command.format(interface=interface)
         
+        output = self.device.execute(cmd)
+
+        p = ShowIpv6OspfInterface.patterns
+
         ret_dict ={}
 
         for line in output.splitlines():
             line = line.strip()
 
             # TwentyFiveGigE1/0/3 is up, line protocol is up (connected)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 int_dict = ret_dict.setdefault('interface', {}).setdefault(Common.convert_intf_name(dict_val['interface']), {})
@@ -8627,7 +8521,7 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
                 continue
 
             # Link Local Address FE80::2A7:42FF:FED7:4CFF, Interface ID 5 (snmp-if-index)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 dict_val = m.groupdict()
                 int_dict['link_local_address'] = dict_val['link_local_address']
@@ -8636,7 +8530,7 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
                 continue
             
             # Area 0, Process ID 1, Instance ID 0, Router ID 109.0.0.1
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 dict_val = m.groupdict()
                 int_dict['area'] = int(dict_val['area'])
@@ -8646,7 +8540,7 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
                 continue
             
             # Network Type POINT_TO_POINT, Cost: 1
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 dict_val = m.groupdict()
                 int_dict['network_type'] = dict_val['network_type']
@@ -8654,7 +8548,7 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
                 continue
 
             # Transmit Delay is 1 sec, State POINT_TO_POINT
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 dict_val = m.groupdict()
                 int_dict['transmit_delay'] = dict_val['transmit_delay']
@@ -8662,7 +8556,7 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
                 continue
             
             # Timer intervals configured, Hello 10, Dead 40, Wait 40, Retransmit 5
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 dict_val = m.groupdict()
                 timer_intervals_dict = int_dict.setdefault('timer_intervals', {})
@@ -8673,19 +8567,19 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
                 continue
 
             # Hello due in 00:00:08
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 int_dict.setdefault('timer_intervals', {}).setdefault('hello_due', m.groupdict()['hello_due'])
                 continue
 
             # Graceful restart helper support enabled
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 int_dict['graceful_restart_helper_support'] = m.groupdict()['graceful_restart_helper_support']
                 continue
             
             # Index 1/4/4, flood queue length 0
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 flood_dict = int_dict.setdefault('flood_list', {})
                 flood_dict['index'] = m.groupdict()['index']
@@ -8693,13 +8587,13 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
                 continue
 
             # Next 0x0(0)/0x0(0)/0x0(0)
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 flood_dict['next'] = m.groupdict()['next']
                 continue
 
             # Last flood scan length is 3, maximum is 3
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 last_flood_scan_dict = flood_dict.setdefault('last_flood_scan', {})
                 last_flood_scan_dict['scan_length'] = int(m.groupdict()['scan_length'])
@@ -8707,14 +8601,14 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
                 continue
 
             # Last flood scan time is 0 msec, maximum is 0 msec
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 last_flood_scan_dict['scan_time_msec'] = int(m.groupdict()['scan_time_msec'])
                 last_flood_scan_dict['scan_time_maximum_msec'] = int(m.groupdict()['scan_time_maximum_msec'])
                 continue
 
             # Neighbor Count is 1, Adjacent neighbor count is 1
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 dict_val = m.groupdict()
                 int_dict['neighbor_count'] = int(dict_val['neighbor_count'])
@@ -8722,14 +8616,14 @@ class ShowIpv6OspfInterface(ShowIpv6OspfInterfaceSchema):
                 continue
             
             # Adjacent with neighbor 109.0.0.5
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 dict_val = m.groupdict()
                 int_dict['adjacent_neighbor_address'] = dict_val['adjacent_neighbor_address']
                 continue
 
             # Suppress hello for 0 neighbor(s)
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 int_dict['suppressed_hello_neighbor_count'] = int(m.groupdict()['suppressed_hello_neighbor_count'])
                 continue
@@ -8792,50 +8686,54 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
 
     cli_command = 'show ipv6 ospf neighbor detail'
 
-    def cli(self, output=None):
-        if output is None:
-            cmd = self.cli_command
-        
-        output = self.device.execute(cmd)
-
+    patterns = Patterns(
         # OSPFv3 Router with ID (109.0.0.5) (Process ID 1)
-        p1 = re.compile(r'^OSPFv3 Router with ID \((?P<router_id>[\S]+)\)\s+\(Process ID (?P<process_id>[\d]+)\)$')
+        p1=r'^OSPFv3 Router with ID \((?P<router_id>[\S]+)\)\s+\(Process ID (?P<process_id>[\d]+)\)$',
 
         # Neighbor 109.0.0.1
-        p2 = re.compile(r'^Neighbor (?P<neighbor>[\S]+)$')
+        p2=r'^Neighbor (?P<neighbor>[\S]+)$',
 
         # In the area 0 via interface HundredGigE1/0/7
-        p3 = re.compile(r'^In the area (?P<area>[\d]+)\s+via interface (?P<interface>[\S]+)$')
+        p3=r'^In the area (?P<area>[\d]+)\s+via interface (?P<interface>[\S]+)$',
 
         # Neighbor: interface-id 5, link-local address FE80::2A7:42FF:FED7:4CFF
-        p4 = re.compile(r'^Neighbor: interface-id (?P<interface_id>[\d]+),\s+link-local address (?P<link_local_address>[\S]+)$')
+        p4=r'^Neighbor: interface-id (?P<interface_id>[\d]+),\s+link-local address (?P<link_local_address>[\S]+)$',
 
         # Neighbor priority is 0, State is FULL, 6 state changes
-        p5 = re.compile(r'^Neighbor priority is (?P<priority>[\d]+), State is (?P<state>[\S]+), (?P<state_changes>[\d]+) state changes$')
+        p5=r'^Neighbor priority is (?P<priority>[\d]+), State is (?P<state>[\S]+), (?P<state_changes>[\d]+) state changes$',
 
         # Options is 0x000013 in Hello (V6-Bit, E-Bit, R-Bit)
-        p6 = re.compile(r'^Options is (?P<hello_options>[\S]+) in Hello \((?P<hello_bits>[\S\s]+)\)$')
+        p6=r'^Options is (?P<hello_options>[\S]+) in Hello \((?P<hello_bits>[\S\s]+)\)$',
 
         # Options is 0x000013 in DBD (V6-Bit, E-Bit, R-Bit)
-        p7 = re.compile(r'^Options is (?P<dbd_options>[\S]+) in DBD \((?P<dbd_bits>[\S\s]+)\)$')
+        p7=r'^Options is (?P<dbd_options>[\S]+) in DBD \((?P<dbd_bits>[\S\s]+)\)$',
 
         # Dead timer due in 00:00:39
-        p8 = re.compile(r'^Dead timer due in (?P<dead_timer>\S+)$')
-        
+        p8=r'^Dead timer due in (?P<dead_timer>\S+)$',
+
         # Neighbor is up for 17:54:26
-        p9 = re.compile(r'^Neighbor is up for (?P<neighbor_up_time>\S+)$')
-        
+        p9=r'^Neighbor is up for (?P<neighbor_up_time>\S+)$',
+
         # Index 1/2/2, retransmission queue length 0, number of retransmission 0
-        p10 = re.compile(r'^Index (?P<index>\S+)\, retransmission queue length (?P<retransmission_length>\d+)\, number of retransmission (?P<number_of_transmission>\d+)$')
-        
+        p10=r'^Index (?P<index>\S+)\, retransmission queue length (?P<retransmission_length>\d+)\, number of retransmission (?P<number_of_transmission>\d+)$',
+
         # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-        p11 = re.compile(r'^First (?P<first>\S+) Next (?P<next>\S+)$')
+        p11=r'^First (?P<first>\S+) Next (?P<next>\S+)$',
 
         # Last retransmission scan length is 0, maximum is 0
-        p12 = re.compile(r'^Last retransmission scan length is (?P<last_retransmission_length>\d+)\, maximum is (?P<retransmission_length_maximum>\d+)$')
+        p12=r'^Last retransmission scan length is (?P<last_retransmission_length>\d+)\, maximum is (?P<retransmission_length_maximum>\d+)$',
 
         # Last retransmission scan time is 0 msec, maximum is 0 msec
-        p13 = re.compile(r'^Last retransmission scan time is (?P<last_retransmission_time>\d+) msec\, maximum is (?P<retransmission_time_maximum>\d+) msec$')
+        p13=r'^Last retransmission scan time is (?P<last_retransmission_time>\d+) msec\, maximum is (?P<retransmission_time_maximum>\d+) msec$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            cmd = self.cli_command
+        
+        output = self.device.execute(cmd)
+
+        p = ShowIpv6OspfNeighborDetail.patterns
 
         ret_dict = {}
 
@@ -8843,7 +8741,7 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
             line = line.strip()
 
             # OSPFv3 Router with ID (109.0.0.5) (Process ID 1)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 process_dict = ret_dict.setdefault('router_id', {}).setdefault(dict_val['router_id'], {})
@@ -8851,14 +8749,14 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
                 continue
 
             # Neighbor 109.0.0.1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 dict_val = m.groupdict()
                 sub_dict = neighbor_dict.setdefault('neighbor', {}).setdefault(dict_val['neighbor'], {})
                 continue
 
             # In the area 0 via interface HundredGigE1/0/7
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 dict_val = m.groupdict()
                 sub_dict['area'] = int(dict_val['area'])
@@ -8866,7 +8764,7 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
                 continue
             
             # Neighbor: interface-id 5, link-local address FE80::2A7:42FF:FED7:4CFF
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 dict_val = m.groupdict()
                 sub_dict['interface_id'] = dict_val['interface_id']
@@ -8874,7 +8772,7 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
                 continue
 
             # Neighbor priority is 0, State is FULL, 6 state changes
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 dict_val = m.groupdict()
                 sub_dict['priority'] = int(dict_val['priority'])
@@ -8883,7 +8781,7 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
                 continue
 
             # Options is 0x000013 in Hello (V6-Bit, E-Bit, R-Bit)
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 dict_val = m.groupdict()
                 sub_dict['hello_options'] = dict_val['hello_options']
@@ -8891,7 +8789,7 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
                 continue
 
             # Options is 0x000013 in DBD (V6-Bit, E-Bit, R-Bit)
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 dict_val = m.groupdict()
                 sub_dict['dbd_options'] = dict_val['dbd_options']
@@ -8899,19 +8797,19 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
                 continue
 
             # Dead timer due in 00:00:39
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['dead_timer'] = m.groupdict()['dead_timer']
                 continue
             
             # Neighbor is up for 17:54:26
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['neighbor_up_time'] = m.groupdict()['neighbor_up_time']
                 continue
 
             # Index 1/2/2, retransmission queue length 0, number of retransmission 0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 dict_val = m.groupdict()
                 sub_dict['index'] = dict_val['index']
@@ -8920,19 +8818,19 @@ class ShowIpv6OspfNeighborDetail(ShowIpv6OspfNeighborDetailSchema):
                 continue
 
             # First 0x0(0)/0x0(0)/0x0(0) Next 0x0(0)/0x0(0)/0x0(0)
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 sub_dict['first'] = m.groupdict()['first']
                 sub_dict['next'] = m.groupdict()['first']
 
             # Last retransmission scan length is 0, maximum is 0
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 sub_dict['last_retransmission_length'] = int(m.groupdict()['last_retransmission_length'])
                 sub_dict['retransmission_length_maximum'] = int(m.groupdict()['retransmission_length_maximum'])
 
             # Last retransmission scan time is 0 msec, maximum is 0 msec
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 sub_dict['last_retransmission_time'] = int(m.groupdict()['last_retransmission_time'])
                 sub_dict['retransmission_time_maximum'] = int(m.groupdict()['retransmission_time_maximum'])
@@ -9002,32 +8900,37 @@ class ShowIpOspfRibRoute(ShowIpOspfRibRouteSchema):
  
     cli_command = ['show ip ospf rib {route}', 'show ip ospf {process_id} rib {route}']
  
-    def cli(self, process_id=None, route=None, output=None):
- 
-        if not output:
-            if process_id:
-                output = self.device.execute(self.cli_command[1].format(process_id=process_id, route=route))
-            else:
-                output = self.device.execute(self.cli_command[0].format(route=route))
+    patterns = Patterns(
         # OSPF Router with ID (10.36.3.3) (Process ID 1)
         # OSPF Router with ID (20.3.5.6) (Process ID 2, VRF VRF1)
-        p0 = re.compile(r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<instance>(\d+))'
-                        r'(?:, +VRF +(?P<vrf>(\S+)))?\)$')
-  
+        p0=r'^OSPF +Router +with +ID +\((?P<router_id>(\S+))\) +\(Process +ID +(?P<instance>(\d+))'
+           r'(?:, +VRF +(?P<vrf>(\S+)))?\)$',
+
         # 20.20.20.0/24, Intra, cost 10, area 0
-        p1 = re.compile(r'^\*\>?\s+(?P<network>\S+),\s+(?P<route_type>\S+),\s+cost\s+(?P<cost>\d+),\s+area\s+(?P<area>\d+)*$')
-        
+        p1=r'^\*\>?\s+(?P<network>\S+),\s+(?P<route_type>\S+),\s+cost\s+(?P<cost>\d+),\s+area\s+(?P<area>\d+)*$',
+
         # via 40.60.1.40, Ethernet0/2
         # via 40.60.1.40, Ethernet0/2, label 16001, strict label 17001
         # via 40.60.1.40, Ethernet0/2, label 16001, strict label 17001, cost 100
         # via Null0
-        p2 = re.compile(r'via ((?P<nexthop_ip>\S+),)?\s*(?P<interface>[A-Za-z0-9./-]+)(,\s+label\s+(?P<label>\d+))?(,\s+strict\s+label\s+(?P<strict_label>\d+))?(,\s+cost\s+(?P<cost>\d+))?')
+        p2=r'via ((?P<nexthop_ip>\S+),)?\s*(?P<interface>[A-Za-z0-9./-]+)(,\s+label\s+(?P<label>\d+))?(,\s+strict\s+label\s+(?P<strict_label>\d+))?(,\s+cost\s+(?P<cost>\d+))?',
 
         # Flags: RIB, MFI
-        p3 = re.compile(r'Flags: (?P<flags>[\S\s]+)')
-        
+        p3=r'Flags: (?P<flags>[\S\s]+)',
+
         # repair path via 40.60.1.40, Ethernet0/2, label 16001, strict label 17001, cost 100
-        p4 = re.compile(r'.*repair path via (?P<nexthop_ip>\S+),\s*(?P<interface>[A-Za-z0-9./-]+)(,\s+label\s+(?P<label>\d+))?(,\s+strict\s+label\s+(?P<strict_label>\d+))?(,\s+cost\s+(?P<cost>\d+))?')
+        p4=r'.*repair path via (?P<nexthop_ip>\S+),\s*(?P<interface>[A-Za-z0-9./-]+)(,\s+label\s+(?P<label>\d+))?(,\s+strict\s+label\s+(?P<strict_label>\d+))?(,\s+cost\s+(?P<cost>\d+))?',
+    )
+
+    def cli(self, process_id=None, route=None, output=None):
+ 
+        if not output:
+            if process_id:
+                output = self.device.execute(self.cli_command[1].format(process_id=process_id, route=route))
+            else:
+                output = self.device.execute(self.cli_command[0].format(route=route))
+
+        p = ShowIpOspfRibRoute.patterns
 
         # initial variables
         ret_dict = {}
@@ -9041,7 +8944,7 @@ class ShowIpOspfRibRoute(ShowIpOspfRibRouteSchema):
             line = line.strip()
             # OSPF Router with ID (10.36.3.3) (Process ID 1)
             # OSPF Router with ID (20.3.5.6) (Process ID 2, VRF VRF1)
-            m = p0.match(line)
+            m = p.p0.match(line)
             if m:
                 group = m.groupdict()
                 instance = str(group['instance'])
@@ -9052,7 +8955,7 @@ class ShowIpOspfRibRoute(ShowIpOspfRibRouteSchema):
                 ospf_dict = ret_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('instance', {}).setdefault(instance, {})
                 continue
             # 20.20.20.0/24, Intra, cost 10, area 0
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 network = group['network']
@@ -9066,7 +8969,7 @@ class ShowIpOspfRibRoute(ShowIpOspfRibRouteSchema):
                 network_dict.update(total_paths = 0)
                 continue
             #  via 40.60.1.40, Ethernet0/2, label 16001, strict label 17001, cost 100
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 primary_path = True
                 repair_path = False
@@ -9089,7 +8992,7 @@ class ShowIpOspfRibRoute(ShowIpOspfRibRouteSchema):
                 network_dict['total_paths'] = network_dict['total_paths'] + 1
                 continue
             # Flags: RIB, MFI
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 if (primary_path):
                     group = m.groupdict()
@@ -9101,7 +9004,7 @@ class ShowIpOspfRibRoute(ShowIpOspfRibRouteSchema):
                     repair_dict['flags'] = flags.replace(" ", "").split(",")
                 continue
             # repair path via 40.60.1.40, Ethernet0/2, label 16001, strict label 17001, cost 100
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 repair_path = True
                 primary_path = False
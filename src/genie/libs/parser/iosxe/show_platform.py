@@ -49,6 +49,7 @@ from xml.dom import minidom
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional, Use, And
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
 from genie.parsergen import oper_fill_tabular
 # genie.parsergen
 try:
@@ -89,56 +90,60 @@ class ShowBootvar(ShowBootvarSchema):
 
     cli_command = 'show bootvar'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        boot_dict = {}
-        boot_variable = None
-
+    patterns = Patterns(
         # BOOT variable = bootflash:/asr1000rpx.bin,12;
         # BOOT variable = flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150907_031219.bin;flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
         # BOOT variable = tftp:/auto/tftp-best/genie_images/genie_clean/asr1000-genie-image 255.255.255.255,12;
         # BOOT variable = tftp:/auto/tftp-best/genie_images/genie_clean/asr1000-genie-image 255.255.255.255,12;harddisk:/asr1000-genie-image_asr-MIB-1,12;
-        p1 = re.compile(r'^BOOT +variable +=( *(?P<var>.+);?)?$')
+        p1=r'^BOOT +variable +=( *(?P<var>.+);?)?$',
 
         # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-        p2 = re.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
+        p2=r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$',
 
         # Configuration register is 0x2002
         # Configuration register is 0x2 (will be 0x2102 at next reload)
         # Configuration Register is 0x102
-        p3 = re.compile(r'Configuration +[R|r]egister +is +(?P<var1>(\S+))'
-                        r'(?: +\(will +be +(?P<var2>(\S+)) +at +next +reload\))?$')
+        p3=r'Configuration +[R|r]egister +is +(?P<var1>(\S+))'
+           r'(?: +\(will +be +(?P<var2>(\S+)) +at +next +reload\))?$',
 
         # Standby Configuration register is 0x2002
         # Standby Configuration register is 0x1  (will be 0x2102 at next reload)
-        p4 = re.compile(r'^Standby +Configuration +register +is +(?P<var>\w+)'
-                        r'(?: +\(will +be +(?P<var2>\S+) +at +next +reload\))?$')
+        p4=r'^Standby +Configuration +register +is +(?P<var>\w+)'
+           r'(?: +\(will +be +(?P<var2>\S+) +at +next +reload\))?$',
 
         # CONFIG_FILE variable =
-        p5 = re.compile(r'^CONFIG_FILE +variable += +(?P<var>\S+)$')
+        p5=r'^CONFIG_FILE +variable += +(?P<var>\S+)$',
 
         # BOOTLDR variable =
-        p6 = re.compile(r'^BOOTLDR +variable += +(?P<var>\S+)$')
-
-        # BOOTLDR variable does not exist
-        # not parsing
+        p6=r'^BOOTLDR +variable += +(?P<var>\S+)$',
 
         # Standby not ready to show bootvar
         # not parsing
         # MANUAL_BOOT variable = no
-        p7 = re.compile(r'(^MANUAL_BOOT\s*variable)\s*=\s*(?P<manual_boot>\w+)$')
+        p7=r'(^MANUAL_BOOT\s*variable)\s*=\s*(?P<manual_boot>\w+)$',
 
         # Standby MANUAL_BOOT variable = no
-        p8 = re.compile(r'(^Standby\s*MANUAL_BOOT\s*variable)\s*=\s*(?P<standby_manual_boot>\w+)$')
+        p8=r'(^Standby\s*MANUAL_BOOT\s*variable)\s*=\s*(?P<standby_manual_boot>\w+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        boot_dict = {}
+        boot_variable = None
+
+        p = ShowBootvar.patterns
+
+        # BOOTLDR variable does not exist
+        # not parsing
 
         for line in out.splitlines():
             line = line.strip()
             # BOOT variable = disk0:s72033-adventerprisek9-mz.122-33.SRE0a-ssr-nxos-76k-1,12;
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 boot = m.groupdict()['var']
                 if boot:
@@ -147,7 +152,7 @@ class ShowBootvar(ShowBootvarSchema):
                 continue
 
             # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 boot = m.groupdict()['var']
                 if boot:
@@ -155,7 +160,7 @@ class ShowBootvar(ShowBootvarSchema):
                 continue
 
             # Configuration register is 0x2002
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 boot_dict.setdefault('active', {})['configuration_register'] = m.groupdict()['var1']
                 if m.groupdict()['var2']:
@@ -163,7 +168,7 @@ class ShowBootvar(ShowBootvarSchema):
                 continue
 
             # Standby Configuration register is 0x2002
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 boot_dict.setdefault('standby', {})['configuration_register'] = m.groupdict()['var']
                 if m.groupdict()['var2']:
@@ -171,21 +176,21 @@ class ShowBootvar(ShowBootvarSchema):
                 continue
 
             # CONFIG_FILE variable =
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 if m.groupdict()['var']:
                     boot_dict.update({'config_file': m.groupdict()['var']})
                 continue
 
             # BOOTLDR variable =
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 if m.groupdict()['var']:
                     boot_dict.setdefault('standby', {})['bootldr'] = m.groupdict()['var']
                 continue
 
             # MANUAL_BOOT variable = no
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 if m.groupdict()['manual_boot'].lower() == 'yes':
                     boot_dict.setdefault('active', {})['manual_boot'] = True
@@ -194,7 +199,7 @@ class ShowBootvar(ShowBootvarSchema):
                 continue
 
             # Standby MANUAL_BOOT variable = yes
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 if m.groupdict()['standby_manual_boot'].lower() == 'yes':
                     boot_dict.setdefault(
@@ -357,44 +362,26 @@ class ShowVersion(ShowVersionSchema):
     cli_command = 'show version'
     exclude = ['system_restarted_at', 'uptime_this_cp', 'uptime']
 
-    def cli(self, output=None):
-        """parsing mechanism: cli
-
-        Function cli() defines the cli type output parsing mechanism which
-        typically contains 3 steps: exe
-        cuting, transforming, returning
-        """
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        version_dict = {}
-        active_dict = {}
-        rtr_type = ''
-        suite_flag = False
-        license_flag = False
-
+    patterns = Patterns(
         # Cisco IOS XE Software, Version BLD_POLARIS_DEV_LATEST_20200702_122021_V17_4_0_67_2
-        p0 = re.compile(
-            r'^Cisco +([\S\s]+) +Software, +Version +(?P<xe_version>.*)$')
+        p0=r'^Cisco +([\S\s]+) +Software, +Version +(?P<xe_version>.*)$',
 
         # version
         # Cisco IOS Software [Everest], ISR Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.6.5, RELEASE SOFTWARE (fc3)
         # Cisco IOS Software, IOS-XE Software, Catalyst 4500 L3 Switch Software (cat4500e-UNIVERSALK9-M), Version 03.03.02.SG RELEASE SOFTWARE (fc1)
-        p1 = re.compile(r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
-                        r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
-                        r'+(?P<version>\S+) +.*$')
+        p1=r'^[Cc]isco +IOS +[Ss]oftware\, +(?P<os>([\S]+)) +Software\, '
+           r'+(?P<platform>.+) Software +\((?P<image_id>.+)\).+[Vv]ersion '
+           r'+(?P<version>\S+) +.*$',
 
         # IOS (tm) Catalyst 4000 L3 Switch Software (cat4000-I9S-M), Version 12.2(18)EW5, RELEASE SOFTWARE (fc1)
         # IOS (tm) s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
         # IOS (tm) C2600 Software (C2600-I-M), Version 12.2(2)XA1, EARLY DEPLOYMENT RELEASE SOFTWARE (fc1)
-        p1_1 = re.compile(r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
-                          r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
-                          r' +(?P<version>\S+), +(EARLY DEPLOYMENT )?RELEASE SOFTWARE .*$')
+        p1_1=r'^(?P<os>[A-Z]+) +\(.*\) +(?P<platform>.+) +Software'
+             r' +\((?P<image_id>.+)\).+( +Experimental)? +[Vv]ersion'
+             r' +(?P<version>\S+), +(EARLY DEPLOYMENT )?RELEASE SOFTWARE .*$',
 
         # 16.6.5
-        p2 = re.compile(r'^(?P<ver_short>\d+\.\d+).*')
+        p2=r'^(?P<ver_short>\d+\.\d+).*',
 
         # Cisco IOS Software [Fuji], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Version 16.7.1prd4, RELEASE SOFTWARE (fc1)
         # Cisco IOS Software [Fuji], Catalyst L3 Switch Software (CAT3K_CAA-UNIVERSALK9-M), Experimental Version 16.8.20170924:182909 [polaris_dev-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20170924_191550 132]
@@ -402,82 +389,82 @@ class ShowVersion(ShowVersionSchema):
         # Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.4.20200702:124009 [S2C-build-polaris_dev-116872-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20200702_122021 243]
         # Cisco IOS Software [Denali], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 16.3.20170410:103306 [v163_mr_throttle-BLD-BLD_V163_MR_THROTTLE_LATEST_20170410_093453 118]
         # Cisco IOS Software [IOSXE], Virtual XE Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 17.15.20240326:010319 [BLD_POLARIS_DEV_LATEST_20240326_003112:/nobackup/mcpre/s2c-build-ws 101]
-        p3 = re.compile(r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware\s*\[?(?P<location>\w*)?\]?\, '
-                        r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
-                        r'+Experimental)? +[Vv]ersion '
-                        r'+(?P<version>[\w.:()]+) *,? *'
-                        r'(?P<label>(\[.*?(?P<build_label>BLD_\w+)([-:]\S+)? \d+\])|.*)$')
+        p3=r'^[Cc]isco +(?P<os>[A-Z]+) +[Ss]oftware\s*\[?(?P<location>\w*)?\]?\, '
+           r'+(?P<platform>.+) +Software +\((?P<image_id>.+)\).+( '
+           r'+Experimental)? +[Vv]ersion '
+           r'+(?P<version>[\w.:()]+) *,? *'
+           r'(?P<label>(\[.*?(?P<build_label>BLD_\w+)([-:]\S+)? \d+\])|.*)$',
 
         # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-        p4 = re.compile(r'^Copyright +\(c\) +(?P<copyright_years>\d+-\d+).*$')
+        p4=r'^Copyright +\(c\) +(?P<copyright_years>\d+-\d+).*$',
 
         # Technical Support: http://www.cisco.com/techsupport
-        p5 = re.compile(r'^Technical +Support: +http\:\/\/www'
-                        r'\.cisco\.com\/techsupport')
+        p5=r'^Technical +Support: +http\:\/\/www'
+           r'\.cisco\.com\/techsupport',
 
         # rom
         # ROM: IOS-XE ROMMONBOOTLDR: System Bootstrap, Version 17.6.1r[FC2], DEVELOPMENT SOFTWARE
-        p6 = re.compile(r'^ROM\: +(?P<rom>.+?)(?:BOOTLDR\: +(?P<bootldr>.+))?$')
+        p6=r'^ROM\: +(?P<rom>.+?)(?:BOOTLDR\: +(?P<bootldr>.+))?$',
 
         # ROM: Bootstrap program is IOSv
-        p7 = re.compile(r'^Bootstrap +program +is +(?P<os>.+)$')
+        p7=r'^Bootstrap +program +is +(?P<os>.+)$',
 
         # bootldr
-        p8 = re.compile(r'^BOOTLDR\: +(?P<bootldr>.+)$')
+        p8=r'^BOOTLDR\: +(?P<bootldr>.+)$',
 
         # hostname & uptime
-        p9 = re.compile(r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$')
+        p9=r'^(?P<hostname>.+) +uptime +is +(?P<uptime>.+)$',
 
         # uptime_this_cp
-        p10 = re.compile(r'^[Uu]ptime +for +this +control +processor '
-                         r'+is +(?P<uptime_this_cp>.+)$')
+        p10=r'^[Uu]ptime +for +this +control +processor '
+            r'+is +(?P<uptime_this_cp>.+)$',
 
         # system_restarted_at
-        p11 = re.compile(r'^[Ss]ystem +restarted +at '
-                         r'+(?P<system_restarted_at>.+)$')
+        p11=r'^[Ss]ystem +restarted +at '
+            r'+(?P<system_restarted_at>.+)$',
 
         # system_image
         # System image file is "tftp://10.1.6.241//auto/genie-ftp/Edison/cat3k_caa-universalk9.BLD__20170410_174845.SSA.bin"
         # System image file is "harddisk:test-image-PE1-13113029"
-        p12 = re.compile(r'^[Ss]ystem +image +file +is '
-                         r'+\"(?P<system_image>.+)\"')
+        p12=r'^[Ss]ystem +image +file +is '
+            r'+\"(?P<system_image>.+)\"',
 
         # last_reload_reason
-        p13 = re.compile(r'^[Ll]ast +reload +reason\: '
-                         r'+(?P<last_reload_reason>.+)$')
+        p13=r'^[Ll]ast +reload +reason\: '
+            r'+(?P<last_reload_reason>.+)$',
 
         # last_reload_reason
         # Last reset from power-on
-        p14 = re.compile(r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$')
+        p14=r'^[Ll]ast +reset +from +(?P<last_reload_reason>.+)$',
 
         # license_type
-        p15 = re.compile(r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$')
+        p15=r'^[Ll]icense +[Tt]ype\: +(?P<license_type>.+)$',
 
         # license_level
-        p16 = re.compile(r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$')
+        p16=r'^\s*[Ll]icense +[Ll]evel\: +(?P<license_level>.+)$',
 
         # entservices   Type: Permanent
-        p16_1 = re.compile(r'(?P<license_level>\S+) +Type\: +(?P<license_type>.+)$')
+        p16_1=r'(?P<license_level>\S+) +Type\: +(?P<license_type>.+)$',
 
         # AIR License Level: AIR DNA Advantage
-        p16_2 = re.compile(r'^\s*AIR [Ll]icense +[Ll]evel\: +(?P<air_license_level>.+)$')
+        p16_2=r'^\s*AIR [Ll]icense +[Ll]evel\: +(?P<air_license_level>.+)$',
 
         ## Technology Package License Information:
         ## Technology-package                                     Technology-package
         # Current                        Type                       Next reboot
-        p16_3 = re.compile(r'^Current  +Type  +Next reboot')
+        p16_3=r'^Current  +Type  +Next reboot',
 
         # network-advantage     Smart License                    network-advantage
         # dna-advantage         Subscription Smart License       dna-advantage
-        p16_4 = re.compile(r'^(?P<license_package>[\w-]+)(?:\s{2,})(?P<package_license_type>(\w+ )+)(?:\s{2,})(?P<next_reload_license_level>\S+)\s*$')
+        p16_4=r'^(?P<license_package>[\w-]+)(?:\s{2,})(?P<package_license_type>(\w+ )+)(?:\s{2,})(?P<next_reload_license_level>\S+)\s*$',
 
         # next_reload_license_level
-        p17 = re.compile(r'^[Nn]ext +(reload|reboot) +license +Level\: '
-                         r'+(?P<next_reload_license_level>.+)$')
+        p17=r'^[Nn]ext +(reload|reboot) +license +Level\: '
+            r'+(?P<next_reload_license_level>.+)$',
 
         # Next reload AIR license Level: AIR DNA Advantage
-        p17_1 = re.compile(r'^[Nn]ext +(reload|reboot) +AIR license +Level\: '
-                           r'+(?P<next_reload_air_license_level>.+)$')
+        p17_1=r'^[Nn]ext +(reload|reboot) +AIR license +Level\: '
+              r'+(?P<next_reload_air_license_level>.+)$',
 
         # chassis, processor_type, main_mem and rtr_type
         # cisco WS-C3650-24PD (MIPS) processor (revision H0) with 829481K/6147K bytes of memory.
@@ -488,204 +475,224 @@ class ShowVersion(ShowVersionSchema):
         # cisco ISR4451-X/K9 (2RU) processor with 1795979K/6147K bytes of memory.
         # cisco WS-C4507R+E (MPC8572) processor (revision 10) with 2097152K/20480K bytes of memory.
         # Cisco CISCO1941/K9 (revision 1.0) with 491520K/32768K bytes of memory.
-        p18 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
-                         r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
-                         r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18=r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
+            r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
+            r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?',
 
         # Cisco CISCO3945-CHASSIS (revision 1.0) with C3900-SPE150/K9 with 1835264K/261888K bytes of memory.
-        p18_2 = re.compile(r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
-                           r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18_2=r'^(C|c)isco +(?P<chassis>[a-zA-Z0-9\-\/\+]+) +.* '
+              r'+with +(?P<processor_type>.+) +with +(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?',
 
         # Allen-Bradley 1783-CMS10DP (ARM) processor (revision V00) with 634958K/6147K bytes of memory.
-        p18_3 = re.compile(r'^(A|a)llen-Bradley +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
-                         r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
-                         r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?')
+        p18_3=r'^(A|a)llen-Bradley +(?P<chassis>[a-zA-Z0-9\-\/\+]+) '
+              r'+\((?P<processor_type>[^)]*)\) +(.*?)with '
+              r'+(?P<main_mem>[0-9]+)[kK](\/[0-9]+[kK])?',
 
         # chassis_sn
-        p19 = re.compile(r'^[pP]rocessor +board +ID '
-                         r'+(?P<chassis_sn>[a-zA-Z0-9]+)')
+        p19=r'^[pP]rocessor +board +ID '
+            r'+(?P<chassis_sn>[a-zA-Z0-9]+)',
 
         # number_of_intfs
-        p20 = re.compile(r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
-                         r'+(interface(?:s)?|line|port(?:s)?)$')
+        p20=r'^(?P<number_of_ports>\d+) +(?P<interface>.+) '
+            r'+(interface(?:s)?|line|port(?:s)?)$',
 
         # mem_size
-        p21 = re.compile(r'^(?P<mem_size>\d+)K +bytes +of '
-                         r'+(?P<memories>.+) +[Mm]emory\.')
+        p21=r'^(?P<mem_size>\d+)K +bytes +of '
+            r'+(?P<memories>.+) +[Mm]emory\.',
 
         # disks, disk_size and type_of_disk
-        p22 = re.compile(r'^(?P<disk_size>\d+)K bytes of '
-                         r'(?P<type_of_disk>.*) at (?P<disks>.+)$')
+        p22=r'^(?P<disk_size>\d+)K bytes of '
+            r'(?P<type_of_disk>.*) at (?P<disks>.+)$',
 
         # os
         # Cisco IOS Software,
-        p23 = re.compile(r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
-                         r'+[Ss]oftware\,')
+        p23=r'^[Cc]isco +(?P<os>[a-zA-Z\-]+) '
+            r'+[Ss]oftware\,',
 
         # curr_config_register
-        p24 = re.compile(r'^[Cc]onfiguration +register +is '
-                         r'+(?P<curr_config_register>[a-zA-Z0-9]+)')
+        p24=r'^[Cc]onfiguration +register +is '
+            r'+(?P<curr_config_register>[a-zA-Z0-9]+)',
 
         # next_config_register
-        p25 = re.compile(r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
-                         r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
-                         r'at next reload\)')
+        p25=r'^[Cc]onfiguration +register +is +[a-zA-Z0-9]+ '
+            r'+\(will be (?P<next_config_register>[a-zA-Z0-9]+) '
+            r'at next reload\)',
 
         # switch_number
-        p26 = re.compile(r'^[Ss]witch +0(?P<switch_number>\d+)$')
+        p26=r'^[Ss]witch +0(?P<switch_number>\d+)$',
 
         # uptime
-        p27 = re.compile(r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$')
+        p27=r'^[Ss]witch +[Uu]ptime +\: +(?P<uptime>.+)$',
 
         # mac_address
-        p28 = re.compile(r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
-                         r'+\: +(?P<mac_address>.+)$')
+        p28=r'^[Bb]ase +[Ee]thernet +MAC +[Aa]ddress '
+            r'+\: +(?P<mac_address>.+)$',
 
         # mb_assembly_num
-        p29 = re.compile(r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
-                         r'+(?P<mb_assembly_num>.+)$')
+        p29=r'^[Mm]otherboard +[Aa]ssembly +[Nn]umber +\: '
+            r'+(?P<mb_assembly_num>.+)$',
 
         # mb_sn
-        p30 = re.compile(r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
-                         r'+(?P<mb_sn>.+)$')
+        p30=r'^[Mm]otherboard +[Ss]erial +[Nn]umber +\: '
+            r'+(?P<mb_sn>.+)$',
 
         # model_rev_num
-        p31 = re.compile(r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<model_rev_num>.+)$')
+        p31=r'^[Mm]odel +[Rr]evision +[Nn]umber +\: '
+            r'+(?P<model_rev_num>.+)$',
 
         # mb_rev_num
-        p32 = re.compile(r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
-                         r'+(?P<mb_rev_num>.+)$')
+        p32=r'^[Mm]otherboard +[Rr]evision +[Nn]umber +\: '
+            r'+(?P<mb_rev_num>.+)$',
 
         # model_num
-        p33 = re.compile(r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$')
+        p33=r'^[Mm]odel +[Nn]umber +\: +(?P<model_num>.+)$',
 
         # system_sn
-        p34 = re.compile(r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$')
+        p34=r'^[Ss]ystem +[Ss]erial +[Nn]umber +\: +(?P<system_sn>.+)$',
 
         # Compiled Mon 10-Apr-17 04:35 by mcpre
         # Compiled Mon 19-Mar-18 16:39 by prod_rel_team
-        p36 = re.compile(r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
-                         r'+(?P<compiled_by>\w+)$')
+        p36=r'^Compiled +(?P<compiled_date>[\S\s]+) +by '
+            r'+(?P<compiled_by>\w+)$',
 
         # System returned to ROM by reload at 15:57:52 CDT Mon Sep 24 2018
         # System returned to ROM by Reload Command at 07:15:43 UTC Fri Feb 1 2019
         # System returned to ROM by reload
         # System returned to ROM by power cycle at 23:31:24 PDT Thu Sep 27 2007 (SP by power on)
         # System returned to ROM by power-on
-        p37 = re.compile(r'^System +returned +to +ROM +by '
-                         r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
-                         r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
-                         r'+(?P<sp_by>[\S\s\-]+)\))?$')
+        p37=r'^System +returned +to +ROM +by '
+            r'+(?P<returned_to_rom_by>[\w\s\-]+)(?: +at '
+            r'+(?P<returned_to_rom_at>[\w\s\:]+))?(?: +\(SP +by '
+            r'+(?P<sp_by>[\S\s\-]+)\))?$',
 
         # Last reload type: Normal Reload
-        p38 = re.compile(
-            r'^Last +reload +type\: +(?P<last_reload_type>[\S ]+)$')
+        p38=r'^Last +reload +type\: +(?P<last_reload_type>[\S ]+)$',
 
         # P2020 CPU at 800MHz, E500v2 core, 512KB L2 Cache
-        p39 = re.compile(r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
-                         r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
-                         r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
-                         r'+(?P<supervisor>\S+)))$')
+        p39=r'^(?P<cpu_name>\S+) +(CPU|cpu|Cpu) +at '
+            r'+(?P<speed>\S+)\,(( +(?P<core>\S+) +core\, '
+            r'+(?P<l2_cache>\S+) +L2 +[Cc]ache)|( +Supervisor '
+            r'+(?P<supervisor>\S+)))$',
 
         # 98304K bytes of processor board System flash (Read/Write)
-        p40 = re.compile(r'^(?P<processor_board_flash>\S+) +bytes .+$')
+        p40=r'^(?P<processor_board_flash>\S+) +bytes .+$',
 
         # Running default software
-        p41 = re.compile(r'^Running +(?P<running_default_software>\S+) +software$')
+        p41=r'^Running +(?P<running_default_software>\S+) +software$',
 
         # Jawa Revision 7, Snowtrooper Revision 0x0.0x1C
-        p42 = re.compile(r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
-                         r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$')
+        p42=r'^Jawa +Revision +(?P<jawa_revision>\S+)\, '
+            r'+Snowtrooper +Revision +(?P<snowtrooper_rev>\S+)$',
 
         # ipbase           ipbasek9         Smart License    ipbasek9
         # securityk9       securityk9       RightToUse       securityk9
-        p43 = re.compile(r'^(?P<technology>\w[\w\-]+)(?: {2,}'
-                         r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
-                         r'+\w+)?) {2,}(?P<next_boot>\w+))?$')
+        p43=r'^(?P<technology>\w[\w\-]+)(?: {2,}'
+            r'(?P<license_level>\w+) {2,}(?P<license_type>\w+(?: '
+            r'+\w+)?) {2,}(?P<next_boot>\w+))?$',
 
         # Suite                 Suite Current         Type           Suite Next reboot
         # Technology    Technology-package           Technology-package
-        p44 = re.compile(r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
-                         r'(Technology\-package))')
+        p44=r'^(?P<aname>Suite|Technology) +((Suite +Current)|'
+            r'(Technology\-package))',
 
         # Suite License Information for Module:'esg'
-        p45 = re.compile(r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
-                         r'+[Mm]odule\:\'(?P<module>\S+)\'$')
+        p45=r'^[Ss]uite +[Ll]icense +[Ii]nformation +for '
+            r'+[Mm]odule\:\'(?P<module>\S+)\'$',
 
         # License UDI:
-        p46_0 = re.compile(r'^License UDI:$')
+        p46_0=r'^License UDI:$',
 
         #     *0        C3900-SPE150/K9       FOC16050QP6
-        p46 = re.compile(r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$')
+        p46=r'^(?P<device_num>[*\d]+) +(?P<pid>[\S]+) +(?P<sn>[A-Z\d]+)$',
 
         # Image text-base: 0x40101040, data-base: 0x42D98000
-        p47 = re.compile(r'^Image text-base: +(?P<text_base>\S+), '
-                         r'data-base: +(?P<data_base>\S+)$')
+        p47=r'^Image text-base: +(?P<text_base>\S+), '
+            r'data-base: +(?P<data_base>\S+)$',
 
         # 1 Virtual Ethernet/IEEE 802.3 interface(s)
         # 50 Gigabit Ethernet/IEEE 802.3 interface(s)
-        p48 = re.compile(r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
-                         r'/IEEE 802\.3 +interface\(s\)$')
+        p48=r'^(?P<interface>\d+) +(?P<ethernet_type>Virtual Ethernet|Gigabit Ethernet|FastEthernet)'
+            r'/IEEE 802\.3 +interface\(s\)$',
 
         # Dagobah Revision 95, Swamp Revision 6
-        p50 = re.compile(r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
-                         r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$')
+        p50=r'^(?P<group1>\S+)\s+Revision\s+(?P<group1_int>\d+),'
+            r'\s+(?P<group2>\S+)\s+Revision\s+(?P<group2_int>\d+)$',
 
         # power_supply_part_nr
         # Power supply part number: 444-8888-00
-        p51 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$')
+        p51=r'^[Pp]ower\s+[Ss]upply\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<power_supply_part_nr>.+)$',
 
         # power_supply_sn
         # Power supply serial number: CCC4466B6LL
-        p52 = re.compile(r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$')
+        p52=r'^[Pp]ower\s+[Ss]upply\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<power_supply_sn>.+)$',
 
         # Daughterboard assembly number   : 73-11111-00
         # db_assembly_num
-        p53 = re.compile(r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$')
+        p53=r'^[Dd]aughterboard\s+[Aa]ssembly\s+[Nn]umber\s+\:\s+(?P<db_assembly_num>.+)$',
 
         # Daughterboard serial number     : FOC87654CWW
         # db_sn
-        p54 = re.compile(r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$')
+        p54=r'^[Dd]aughterboard\s+[Ss]erial\s+[Nn]umber\s+\:\s+(?P<db_sn>.+)$',
 
         # top_assembly_part_num
         # Top Assembly Part Number        : 800-55555-11
-        p55 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$')
+        p55=r'^[Tt]op\s+[Aa]ssembly\s+[Pp]art\s+[Nn]umber\s+\:\s+(?P<top_assembly_part_num>.+)$',
 
         # top_assembly_rev_num
         # Top Assembly Revision Number    : C0
-        p56 = re.compile(r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$')
+        p56=r'^[Tt]op\s+[Aa]ssembly\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<top_assembly_rev_num>.+)$',
 
         # version_id
         # Version ID                      : V02
-        p57 = re.compile(r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$')
+        p57=r'^[Vv]ersion\s+ID\s+\:\s+(?P<version_id>.+)$',
 
         # clei_code_num
         # CLEI Code Number                : AAALJ00ERT
-        p58 = re.compile(r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$')
+        p58=r'^CLEI\s+[Cc]ode\s+[Nn]umber\s+\:\s+(?P<clei_code_num>.+)$',
 
         # Daughterboard revision number   : A0
         # db_rev_num
-        p59 = re.compile(r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$')
+        p59=r'^[Dd]aughterboard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<db_rev_num>.+)$',
 
         # Hardware Board Revision Number  : 0x12
         # hb_rev_num
-        p60 = re.compile(r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$')
+        p60=r'^[Hh]ardware\s+[Bb]oard\s+[Rr]evision\s+[Nn]umber\s+\:\s+(?P<hb_rev_num>.+)$',
 
         # Router operating mode: Controller-Managed
-        p61 = re.compile(r'^Router operating mode: (?P<router_operating_mode>.+)$')
+        p61=r'^Router operating mode: (?P<router_operating_mode>.+)$',
 
         # Installation mode is BUNDLE
-        p62 = re.compile(r'^Installation\s+mode\s+is\s+(?P<installation_mode>.+)$')
+        p62=r'^Installation\s+mode\s+is\s+(?P<installation_mode>.+)$',
 
         #System FPGA version                : 0.2.11
-        p63 = re.compile('^System FPGA version\s+:\s+(?P<system_fpga_version>(\d+\.?)+)')
+        p63='^System FPGA version\s+:\s+(?P<system_fpga_version>(\d+\.?)+)',
+    )
+
+    def cli(self, output=None):
+        """parsing mechanism: cli
+
+        Function cli() defines the cli type output parsing mechanism which
+        typically contains 3 steps: exe
+        cuting, transforming, returning
+        """
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        version_dict = {}
+        active_dict = {}
+        rtr_type = ''
+        suite_flag = False
+        license_flag = False
+
+        patterns = ShowVersion.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Cisco IOS XE Software, Version BLD_POLARIS_DEV_LATEST_20200702_122021_V17_4_0_67_2
-            m = p0.match(line)
+            m = patterns.p0.match(line)
             if m:
                 if 'version' not in version_dict:
                     version_dict['version'] = {}
@@ -699,11 +706,11 @@ class ShowVersion(ShowVersionSchema):
             # IOS (tm) Catalyst 4000 L3 Switch Software (cat4000-I9S-M), Version 12.2(18)EW5, RELEASE SOFTWARE (fc1)
             # IOS (tm) s72033_rp Software (s72033_rp-ADVENTERPRISEK9_WAN-M), Version 12.2(18)SXF7, RELEASE SOFTWARE (fc1)
             # IOS (tm) C2600 Software (C2600-I-M), Version 12.2(2)XA1, EARLY DEPLOYMENT RELEASE SOFTWARE (fc1)
-            m = p1.match(line) or p1_1.match(line)
+            m = patterns.p1.match(line) or patterns.p1_1.match(line)
             if m:
                 version = m.groupdict()['version']
                 # 16.6.5
-                m2 = p2.match(version)
+                m2 = patterns.p2.match(version)
                 if m2:
                     if 'version' not in version_dict:
                         version_dict['version'] = {}
@@ -723,12 +730,12 @@ class ShowVersion(ShowVersionSchema):
             # Cisco IOS Software, 901 Software (ASR901-UNIVERSALK9-M), Version 15.6(2)SP4, RELEASE SOFTWARE (fc3)
             # Cisco IOS Software [Amsterdam], Catalyst L3 Switch Software (CAT9K_IOSXE), Experimental Version 17.4.20200702:124009 [S2C-build-polaris_dev-116872-/nobackup/mcpre/BLD-BLD_POLARIS_DEV_LATEST_20200702_122021 243]
             # Cisco IOS Software [Denali], ASR1000 Software (X86_64_LINUX_IOSD-UNIVERSALK9-M), Experimental Version 16.3.20170410:103306 [v163_mr_throttle-BLD-BLD_V163_MR_THROTTLE_LATEST_20170410_093453 118]
-            m = p3.match(line)
+            m = patterns.p3.match(line)
             if m:
                 version = m.groupdict()['version']
                 # 16.6.5
 
-                m2 = p2.match(version)
+                m2 = patterns.p2.match(version)
 
                 if m2:
                     if 'version' not in version_dict:
@@ -754,20 +761,20 @@ class ShowVersion(ShowVersionSchema):
                     continue
 
             # Copyright (c) 1986-2016 by Cisco Systems, Inc.
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 version_dict.setdefault('version', {}).setdefault('image_type', 'developer image')
                 version_dict.setdefault('version', {}).setdefault('copyright_years', m.groupdict()['copyright_years'])
                 continue
 
             # Technical Support: http://www.cisco.com/techsupport
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 version_dict.setdefault('version', {}).setdefault('image_type', 'production image')
                 continue
 
             # rom
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m:
                 rom = m.groupdict()['rom']
                 version_dict['version']['rom'] = rom
@@ -776,7 +783,7 @@ class ShowVersion(ShowVersionSchema):
                     version_dict['version']['bootldr'] = bootldr
 
                 # ROM: Bootstrap program is IOSv
-                m = p7.match(rom)
+                m = patterns.p7.match(rom)
                 if m:
                     if 'os' not in version_dict['version']:
                         version_dict['version']['os'] = \
@@ -784,14 +791,14 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # bootldr
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 version_dict['version']['bootldr'] = \
                     m.groupdict()['bootldr']
                 continue
 
             # hostname & uptime
-            m = p9.match(line)
+            m = patterns.p9.match(line)
             if m:
                 version_dict['version']['hostname'] = \
                     m.groupdict()['hostname']
@@ -800,7 +807,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # uptime_this_cp
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 version_dict['version']['uptime_this_cp'] = \
                     m.groupdict()['uptime_this_cp']
@@ -808,7 +815,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # system_restarted_at
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 version_dict['version']['system_restarted_at'] = \
                     m.groupdict()['system_restarted_at']
@@ -817,14 +824,14 @@ class ShowVersion(ShowVersionSchema):
             # system_image
             # System image file is "tftp://10.1.6.241//auto/tftp-ssr/Edison/cat3k_caa-universalk9.BLD_V164_THROTTLE_LATEST_20170410_174845.SSA.bin"
             # System image file is "harddisk:test-image-PE1-13113029"
-            m = p12.match(line)
+            m = patterns.p12.match(line)
             if m:
                 version_dict['version']['system_image'] = \
                     m.groupdict()['system_image']
                 continue
 
             # last_reload_reason
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m:
                 version_dict['version']['last_reload_reason'] = \
                     m.groupdict()['last_reload_reason']
@@ -832,14 +839,14 @@ class ShowVersion(ShowVersionSchema):
 
             # last_reload_reason
             # Last reset from power-on
-            m = p14.match(line)
+            m = patterns.p14.match(line)
             if m:
                 version_dict['version']['last_reload_reason'] = \
                     m.groupdict()['last_reload_reason']
                 continue
 
             # license_type
-            m = p15.match(line)
+            m = patterns.p15.match(line)
             if m:
                 version_dict['version']['license_type'] = \
                     m.groupdict()['license_type']
@@ -848,12 +855,12 @@ class ShowVersion(ShowVersionSchema):
             # license_level
             # License Level: entservices   Type: Permanent
             # License Level: AdvancedMetroIPAccess
-            m = p16.match(line)
+            m = patterns.p16.match(line)
             if m:
                 group = m.groupdict()
                 if 'Type:' in group['license_level']:
                     lic_type = group['license_level'].strip()
-                    m_1 = p16_1.match(lic_type)
+                    m_1 = patterns.p16_1.match(lic_type)
                     if m_1:
                         lic_group = m_1.groupdict()
                         version_dict['version']['license_type'] = lic_group['license_type']
@@ -863,20 +870,20 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # AIR License Level: AIR DNA Advantage
-            m = p16_2.match(line)
+            m = patterns.p16_2.match(line)
             if m:
                 version_dict['version']['air_license_level'] = m.groupdict()['air_license_level']
                 continue
 
             # Current                        Type                       Next reboot
-            m = p16_3.match(line)
+            m = patterns.p16_3.match(line)
             if m:
                 version_dict['version'].setdefault('license_package', {})
                 continue
 
             # network-advantage     Smart License                    network-advantage
             # dna-advantage         Subscription Smart License       dna-advantage
-            m = p16_4.match(line)
+            m = patterns.p16_4.match(line)
             if m:
                 group = m.groupdict()
                 license_package = group['license_package']
@@ -891,14 +898,14 @@ class ShowVersion(ShowVersionSchema):
             # next_reload_license_level
             # Next reboot license Level: entservices
             # Next reload license Level: advipservices
-            m = p17.match(line)
+            m = patterns.p17.match(line)
             if m:
                 version_dict['version']['next_reload_license_level'] = \
                     m.groupdict()['next_reload_license_level']
                 continue
 
             # Next reload AIR license Level: AIR DNA Advantage
-            m = p17_1.match(line)
+            m = patterns.p17_1.match(line)
             if m:
                 version_dict['version']['next_reload_air_license_level'] = \
                     m.groupdict()['next_reload_air_license_level']
@@ -910,12 +917,12 @@ class ShowVersion(ShowVersionSchema):
             # Cisco IOSv (revision 1.0) with  with 435457K/87040K bytes of memory.
             # cisco WS-C3750X-24P (PowerPC405) processor (revision W0) with 262144K bytes of memory.
             # cisco ISR4451-X/K9 (2RU) processor with 1795979K/6147K bytes of memory.
-            m = p18.match(line)
+            m = patterns.p18.match(line)
 
             # Cisco CISCO3945-CHASSIS (revision 1.0) with C3900-SPE150/K9 with 1835264K/261888K bytes of memory.
-            m2 = p18_2.match(line)
+            m2 = patterns.p18_2.match(line)
 
-            m3 = p18_3.match(line)
+            m3 = patterns.p18_3.match(line)
 
             if m or m2 or m3:
                 if m:
@@ -943,19 +950,19 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Router operating mode: Controller-Managed
-            m = p61.match(line)
+            m = patterns.p61.match(line)
             if m:
                 version_dict['version']['router_operating_mode'] = m.groupdict()['router_operating_mode']
                 continue
 
             # Installation mode is BUNDLE
-            m = p62.match(line)
+            m = patterns.p62.match(line)
             if m:
                 version_dict['version']['installation_mode'] = m.groupdict()['installation_mode']
                 continue
 
             # chassis_sn
-            m = p19.match(line)
+            m = patterns.p19.match(line)
             if m:
                 version_dict['version']['chassis_sn'] \
                     = m.groupdict()['chassis_sn']
@@ -968,7 +975,7 @@ class ShowVersion(ShowVersionSchema):
             # 2 Ten Gigabit Ethernet interfaces
             # 1 terminal line
             # 8 Channelized T1 ports
-            m = p20.match(line)
+            m = patterns.p20.match(line)
             if m:
                 interface = m.groupdict()['interface']
                 if 'number_of_intfs' not in version_dict['version']:
@@ -978,7 +985,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mem_size
-            m = p21.match(line)
+            m = patterns.p21.match(line)
             if m:
                 memories = m.groupdict()['memories']
                 if 'mem_size' not in version_dict['version']:
@@ -988,7 +995,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # disks, disk_size and type_of_disk
-            m = p22.match(line)
+            m = patterns.p22.match(line)
             if m:
                 disks = m.groupdict()['disks']
                 if 'disks' not in version_dict['version']:
@@ -1002,27 +1009,27 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # os
-            m = p23.match(line)
+            m = patterns.p23.match(line)
             if m:
                 version_dict['version']['os'] = m.groupdict()['os']
 
                 continue
 
             # curr_config_register
-            m = p24.match(line)
+            m = patterns.p24.match(line)
             if m:
                 version_dict['version']['curr_config_register'] \
                     = m.groupdict()['curr_config_register']
 
             # next_config_register
-            m = p25.match(line)
+            m = patterns.p25.match(line)
             if m:
                 version_dict['version']['next_config_register'] \
                     = m.groupdict()['next_config_register']
                 continue
 
             # switch_number
-            m = p26.match(line)
+            m = patterns.p26.match(line)
             if m:
                 switch_number = m.groupdict()['switch_number']
 
@@ -1034,7 +1041,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # uptime
-            m = p27.match(line)
+            m = patterns.p27.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     continue
@@ -1042,7 +1049,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mac_address
-            m = p28.match(line)
+            m = patterns.p28.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mac_address', m.groupdict()['mac_address'])
@@ -1051,7 +1058,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mb_assembly_num
-            m = p29.match(line)
+            m = patterns.p29.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mb_assembly_num', m.groupdict()['mb_assembly_num'])
@@ -1060,7 +1067,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mb_sn
-            m = p30.match(line)
+            m = patterns.p30.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mb_sn', m.groupdict()['mb_sn'])
@@ -1069,7 +1076,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # model_rev_num
-            m = p31.match(line)
+            m = patterns.p31.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('model_rev_num', m.groupdict()['model_rev_num'])
@@ -1078,7 +1085,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # mb_rev_num
-            m = p32.match(line)
+            m = patterns.p32.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('mb_rev_num', m.groupdict()['mb_rev_num'])
@@ -1087,7 +1094,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # model_num
-            m = p33.match(line)
+            m = patterns.p33.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('model_num', m.groupdict()['model_num'])
@@ -1096,7 +1103,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # system_sn
-            m = p34.match(line)
+            m = patterns.p34.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('system_sn', m.groupdict()['system_sn'])
@@ -1105,7 +1112,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # power_supply_part_nr
-            m = p51.match(line)
+            m = patterns.p51.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('power_supply_part_nr', m.groupdict()['power_supply_part_nr'])
@@ -1114,7 +1121,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # power_supply_sn
-            m = p52.match(line)
+            m = patterns.p52.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('power_supply_sn', m.groupdict()['power_supply_sn'])
@@ -1123,7 +1130,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # db_assembly_num
-            m = p53.match(line)
+            m = patterns.p53.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('db_assembly_num', m.groupdict()['db_assembly_num'])
@@ -1132,7 +1139,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # db_sn
-            m = p54.match(line)
+            m = patterns.p54.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('db_sn', m.groupdict()['db_sn'])
@@ -1141,7 +1148,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # top_assembly_part_num
-            m = p55.match(line)
+            m = patterns.p55.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('top_assembly_part_num', m.groupdict()['top_assembly_part_num'])
@@ -1150,7 +1157,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # top_assembly_rev_num
-            m = p56.match(line)
+            m = patterns.p56.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('top_assembly_rev_num', m.groupdict()['top_assembly_rev_num'])
@@ -1159,7 +1166,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # version_id
-            m = p57.match(line)
+            m = patterns.p57.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('version_id', m.groupdict()['version_id'])
@@ -1168,7 +1175,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # clei_code_num
-            m = p58.match(line)
+            m = patterns.p58.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('clei_code_num', m.groupdict()['clei_code_num'])
@@ -1177,7 +1184,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # db_rev_num
-            m = p59.match(line)
+            m = patterns.p59.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('db_rev_num', m.groupdict()['db_rev_num'])
@@ -1186,7 +1193,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # hb_rev_num
-            m = p60.match(line)
+            m = patterns.p60.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('hb_rev_num', m.groupdict()['hb_rev_num'])
@@ -1196,7 +1203,7 @@ class ShowVersion(ShowVersionSchema):
 
             # Compiled Mon 10-Apr-17 04:35 by mcpre
             # Compiled Mon 19-Mar-18 16:39 by prod_rel_team
-            m36 = p36.match(line)
+            m36 = patterns.p36.match(line)
             if m36:
                 group = m36.groupdict()
                 version_dict['version']['compiled_date'] = group['compiled_date']
@@ -1209,7 +1216,7 @@ class ShowVersion(ShowVersionSchema):
             # System returned to ROM by reload
             # System returned to ROM by power cycle at 23:31:24 PDT Thu Sep 27 2007 (SP by power on)
             # System returned to ROM by power-on
-            m37 = p37.match(line)
+            m37 = patterns.p37.match(line)
             if m37:
                 group = m37.groupdict()
 
@@ -1225,7 +1232,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Last reload type: Normal Reload
-            m38 = p38.match(line)
+            m38 = patterns.p38.match(line)
             if m38:
                 version_dict['version']['last_reload_type'] = m38.groupdict()['last_reload_type']
 
@@ -1233,7 +1240,7 @@ class ShowVersion(ShowVersionSchema):
 
             # P2020 CPU at 800MHz, E500v2 core, 512KB L2 Cache
             # MPC8572 CPU at 1.5GHz, Supervisor 7
-            m39 = p39.match(line)
+            m39 = patterns.p39.match(line)
             if m39:
                 group = m39.groupdict()
                 cpu_dict = version_dict['version'].setdefault('processor', {})
@@ -1250,7 +1257,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # 98304K bytes of processor board System flash (Read/Write)
-            m40 = p40.match(line)
+            m40 = patterns.p40.match(line)
             if m40:
                 flash_dict = version_dict['version']
                 in_kb = m40.groupdict()['processor_board_flash']
@@ -1259,14 +1266,14 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Running default software
-            m41 = p41.match(line)
+            m41 = patterns.p41.match(line)
             if m41:
                 version_dict['version']['running_default_software'] = True
 
                 continue
 
             # Jawa Revision 7, Snowtrooper Revision 0x0.0x1C
-            m42 = p42.match(line)
+            m42 = patterns.p42.match(line)
             if m42:
                 version_dict['version']['jawa_revision'] = m42.groupdict()['jawa_revision']
                 version_dict['version']['snowtrooper_revision'] = m42.groupdict()['snowtrooper_rev']
@@ -1275,7 +1282,7 @@ class ShowVersion(ShowVersionSchema):
 
             # ipbase           ipbasek9         Smart License    ipbasek9
             # securityk9       securityk9       RightToUse       securityk9
-            m43 = p43.match(line)
+            m43 = patterns.p43.match(line)
             if m43:
                 group = m43.groupdict()
 
@@ -1308,7 +1315,7 @@ class ShowVersion(ShowVersionSchema):
 
             # Suite                 Suite Current         Type           Suite Next reboot
             # Technology    Technology-package           Technology-package
-            m44 = p44.match(line)
+            m44 = patterns.p44.match(line)
             if m44:
                 if 'Suite' in m44.groupdict()['aname']:
                     suite_flag = True
@@ -1320,7 +1327,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Suite License Information for Module:'esg'
-            m45 = p45.match(line)
+            m45 = patterns.p45.match(line)
             if m45:
                 module_dict = version_dict['version'].setdefault('module', {})
                 suite_dict = module_dict.setdefault(m45.groupdict()['module'], {})
@@ -1328,14 +1335,14 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # License UDI:
-            m46_0 = p46_0.match(line)
+            m46_0 = patterns.p46_0.match(line)
             if m46_0:
                 if 'license_udi' not in version_dict:
                     license_udi_dict = version_dict['version'].setdefault('license_udi', {})
                 continue
 
             # *0        C3900-SPE150/K9       FOC16050QP6
-            m46 = p46.match(line)
+            m46 = patterns.p46.match(line)
             if m46:
                 group = m46.groupdict()
                 license_udi_sub = license_udi_dict.setdefault('device_num', {}).\
@@ -1345,7 +1352,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Image text-base: 0x40101040, data-base: 0x42D98000
-            m = p47.match(line)
+            m = patterns.p47.match(line)
             if m:
                 version_dict['version']['image'] = {}
                 version_dict['version']['image']['text_base'] = m.groupdict()['text_base']
@@ -1354,7 +1361,7 @@ class ShowVersion(ShowVersionSchema):
 
             # 1 Virtual Ethernet/IEEE 802.3 interface(s)
             # 50 Gigabit Ethernet/IEEE 802.3 interface(s)
-            m = p48.match(line)
+            m = patterns.p48.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_type = '_'.join(group['ethernet_type'].lower().split())
@@ -1366,7 +1373,7 @@ class ShowVersion(ShowVersionSchema):
                 continue
 
             # Dagobah Revision 95, Swamp Revision 6
-            m = p50.match(line)
+            m = patterns.p50.match(line)
             if m:
                 groupdict = m.groupdict()
                 version_dict['version']['revision'] = {}
@@ -1374,7 +1381,7 @@ class ShowVersion(ShowVersionSchema):
                 version_dict['version']['revision'][groupdict['group2']] = int(groupdict['group2_int'])
                 continue
 
-            m = p63.match(line)
+            m = patterns.p63.match(line)
             if m:
                 if 'switch_num' not in version_dict['version']:
                     active_dict.setdefault('system_fpga_version', m.groupdict()['system_fpga_version'])
@@ -1506,6 +1513,17 @@ class Dir(DirSchema):
     cli_command = ['dir', 'dir {directory}']
     exclude = ['last_modified_date', 'bytes_free', 'files']
 
+    patterns = Patterns(
+        # dir
+        p1=r'^\s*[Dd]irectory +of +(?P<dir>.+)$',
+
+        # filename, index, permissions, size and last_modified_date
+        p2=r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) +(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) +(?P<filename>.+)$',
+
+        # bytes_total and bytes_free
+        p3=r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)',
+    )
+
     def cli(self, directory='', output=None):
         """parsing mechanism: cli
 
@@ -1523,13 +1541,13 @@ class Dir(DirSchema):
             out = output
 
         dir_dict = {}
+
+        p = Dir.patterns
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # dir
-            p1 = re.compile(
-                r'^\s*[Dd]irectory +of +(?P<dir>.+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dir1 = m.groupdict()['dir']
                 if 'dir' not in dir_dict:
@@ -1539,10 +1557,7 @@ class Dir(DirSchema):
                     dir_dict['dir']['dir'] = dir1
                 continue
 
-            # filename, index, permissions, size and last_modified_date
-            p2 = re.compile(
-                r'\s*(?P<index>\d+) +(?P<permissions>\S+) +(?P<size>\d+) +(?P<last_modified_date>\S+ +\d+ +\d+ +\d+\:\d+\:\d+ +\S+) +(?P<filename>.+)$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 filename = m.groupdict()['filename']
                 if 'files' not in dir_dict['dir'][dir1]:
@@ -1555,9 +1570,7 @@ class Dir(DirSchema):
                 dir_dict['dir'][dir1]['files'][filename]['last_modified_date'] = m.groupdict()['last_modified_date']
                 continue
 
-            # bytes_total and bytes_free
-            p3 = re.compile(r'\s*(?P<bytes_total>\d+) +bytes +total +\((?P<bytes_free>\d+) +bytes +free\)')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 dir_dict['dir'][dir1]['bytes_total'] = m.groupdict()['bytes_total']
                 dir_dict['dir'][dir1]['bytes_free'] = m.groupdict()['bytes_free']
@@ -1609,6 +1622,50 @@ class ShowRedundancy(ShowRedundancySchema):
     cli_command = 'show redundancy'
     exclude = ['available_system_uptime', 'uptime_in_curr_state']
 
+    patterns = Patterns(
+        # available_system_uptime
+        p1=r'\s*[Aa]vailable +[Ss]ystem +[Uu]ptime +\= +(?P<available_system_uptime>.+)$',
+
+        # switchovers_system_experienced
+        p2=r'\s*[Ss]witchovers +system +experienced +\= +(?P<switchovers_system_experienced>\d+)$',
+
+        # standby_failures
+        p3=r'\s*[Ss]tandby +failures +\= +(?P<standby_failures>\d+)$',
+
+        # last_switchover_reason
+        p4=r'^\s*[Ll]ast +[Ss]witchover +[Rr]eason +\= +(?P<last_switchover_reason>.+)$',
+
+        # hw_mode
+        p5=r'\s*[Hh]ardware +[Mm]ode +\= +(?P<hw_mode>\S+)$',
+
+        # conf_red_mode
+        p6=r'\s*[Cc]onfigured +[Rr]edundancy +[Mm]ode +\= +(?P<conf_red_mode>[\s\S]+)$',
+
+        # slot number
+        p9=r'^\s*\S+ +[Ll]ocation +\= +(?P<slot>.+)$',
+
+        # curr_sw_state
+        p10=r'^\s*[Cc]urrent +[Ss]oftware +[Ss]tate +\= +(?P<curr_sw_state>.+)$',
+
+        # uptime_in_curr_state
+        p11=r'^\s*[Uu]ptime +[Ii]n +[Cc]urrent +[Ss]tate +\= +(?P<uptime_in_curr_state>.+)$',
+
+        # image_ver
+        p12=r'^\s*[Ii]mage +[Vv]ersion +\= +(?P<image_ver>.+)$',
+
+        # boot
+        p13=r'^\s*BOOT +\= +(?P<boot>.+)$',
+
+        # config_file
+        p14=r'\s*CONFIG_FILE +\= +(?P<config_file>.?)$',
+
+        # bootldr
+        p15=r'\s*BOOTLDR +\= +(?P<bootldr>.?)$',
+
+        # config_register
+        p16=r'^\s*[Cc]onfiguration +[Rr]egister = (?P<config_register>.+)$',
+    )
+
     def cli(self, output=None):
         """parsing mechanism: cli
 
@@ -1622,53 +1679,44 @@ class ShowRedundancy(ShowRedundancySchema):
             out = output
 
         redundancy_dict = {}
+
+        p = ShowRedundancy.patterns
+
         for line in out.splitlines():
             line = line.rstrip()
 
-            # available_system_uptime
-            p1 = re.compile(r'\s*[Aa]vailable +[Ss]ystem +[Uu]ptime +\= +(?P<available_system_uptime>.+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 redundancy_dict.setdefault('red_sys_info', {})
                 redundancy_dict['red_sys_info']['available_system_uptime'] = \
                     m.groupdict()['available_system_uptime']
                 continue
 
-            # switchovers_system_experienced
-            p2 = re.compile(r'\s*[Ss]witchovers +system +experienced +\= +(?P<switchovers_system_experienced>\d+)$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 redundancy_dict['red_sys_info']['switchovers_system_experienced'] = \
                     m.groupdict()['switchovers_system_experienced']
                 continue
 
-            # standby_failures
-            p3 = re.compile(r'\s*[Ss]tandby +failures +\= +(?P<standby_failures>\d+)$')
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 redundancy_dict['red_sys_info']['standby_failures'] = \
                     m.groupdict()['standby_failures']
                 continue
 
-            # last_switchover_reason
-            p4 = re.compile(r'^\s*[Ll]ast +[Ss]witchover +[Rr]eason +\= +(?P<last_switchover_reason>.+)$')
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 redundancy_dict['red_sys_info']['last_switchover_reason'] = \
                     m.groupdict()['last_switchover_reason']
                 continue
 
-            # hw_mode
-            p5 = re.compile(r'\s*[Hh]ardware +[Mm]ode +\= +(?P<hw_mode>\S+)$')
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 redundancy_dict['red_sys_info']['hw_mode'] = \
                     m.groupdict()['hw_mode']
                 continue
 
-            # conf_red_mode
-            p6 = re.compile(r'\s*[Cc]onfigured +[Rr]edundancy +[Mm]ode +\= +(?P<conf_red_mode>[\s\S]+)$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 redundancy_dict['red_sys_info']['conf_red_mode'] = \
                     m.groupdict()['conf_red_mode']
@@ -1707,9 +1755,7 @@ class ShowRedundancy(ShowRedundancySchema):
                     m.groupdict()['communications_reason']
                 continue
 
-            # slot number
-            p9 = re.compile(r'^\s*\S+ +[Ll]ocation +\= +(?P<slot>.+)$')
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 slot = m.groupdict()['slot']
                 if 'slot' not in redundancy_dict:
@@ -1718,63 +1764,49 @@ class ShowRedundancy(ShowRedundancySchema):
                     redundancy_dict['slot'][slot] = {}
                 continue
 
-            # curr_sw_state
-            p10 = re.compile(r'^\s*[Cc]urrent +[Ss]oftware +[Ss]tate +\= +(?P<curr_sw_state>.+)$')
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 if 'slot' in redundancy_dict:
                     redundancy_dict['slot'][slot]['curr_sw_state'] = \
                         m.groupdict()['curr_sw_state']
                 continue
 
-            # uptime_in_curr_state
-            p11 = re.compile(r'^\s*[Uu]ptime +[Ii]n +[Cc]urrent +[Ss]tate +\= +(?P<uptime_in_curr_state>.+)$')
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 if 'slot' in redundancy_dict:
                     redundancy_dict['slot'][slot]['uptime_in_curr_state'] = \
                         m.groupdict()['uptime_in_curr_state']
                 continue
 
-            # image_ver
-            p12 = re.compile(r'^\s*[Ii]mage +[Vv]ersion +\= +(?P<image_ver>.+)$')
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 if 'slot' in redundancy_dict:
                     redundancy_dict['slot'][slot]['image_ver'] = \
                         m.groupdict()['image_ver']
                 continue
 
-            # boot
-            p13 = re.compile(r'^\s*BOOT +\= +(?P<boot>.+)$')
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 if 'slot' in redundancy_dict:
                     redundancy_dict['slot'][slot]['boot'] = \
                         m.groupdict()['boot']
                 continue
 
-            # config_file
-            p14 = re.compile(r'\s*CONFIG_FILE +\= +(?P<config_file>.?)$')
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 if 'slot' in redundancy_dict:
                     redundancy_dict['slot'][slot]['config_file'] = \
                         m.groupdict()['config_file']
                 continue
 
-            # bootldr
-            p15 = re.compile(r'\s*BOOTLDR +\= +(?P<bootldr>.?)$')
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 if 'slot' in redundancy_dict:
                     redundancy_dict['slot'][slot]['bootldr'] = \
                         m.groupdict()['bootldr']
                 continue
 
-            # config_register
-            p16 = re.compile(r'^\s*[Cc]onfiguration +[Rr]egister = (?P<config_register>.+)$')
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 if 'slot' in redundancy_dict:
                     redundancy_dict['slot'][slot]['config_register'] = \
@@ -1811,63 +1843,67 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
 
     cli_command = 'show redundancy states'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # initial variables
-        ret_dict = {}
-
+    patterns = Patterns(
         # my state = 13 -ACTIVE
-        p1 = re.compile(r'^my +state += +(?P<my_state>[\s\S]+)$')
+        p1=r'^my +state += +(?P<my_state>[\s\S]+)$',
 
         # peer state = 8  -STANDBY HOT
-        p2 = re.compile(r'^peer +state += +(?P<peer_state>[\s\S]+)$')
+        p2=r'^peer +state += +(?P<peer_state>[\s\S]+)$',
 
         # Mode = Duplex
-        p3 = re.compile(r'^Mode += +(?P<mode>[\w]+)$')
+        p3=r'^Mode += +(?P<mode>[\w]+)$',
 
         # Unit = Primary
-        p4 = re.compile(r'^Unit += +(?P<unit>[\w]+)$')
+        p4=r'^Unit += +(?P<unit>[\w]+)$',
 
         # Unit ID = 48
-        p5 = re.compile(r'^Unit +ID += +(?P<unit_id>[\d]+)$')
+        p5=r'^Unit +ID += +(?P<unit_id>[\d]+)$',
 
         # Redundancy Mode (Operational) = sso
-        p6 = re.compile(r'^Redundancy +Mode +\(Operational\) += +'
-                        '(?P<redundancy_mode_operational>[\s\S]+)$')
+        p6=r'^Redundancy +Mode +\(Operational\) += +'
+            '(?P<redundancy_mode_operational>[\s\S]+)$',
 
         # Redundancy Mode (Configured)  = sso
-        p7 = re.compile(r'^Redundancy +Mode +\(Configured\) += +'
-                        '(?P<redundancy_mode_configured>[\s\S]+)$')
+        p7=r'^Redundancy +Mode +\(Configured\) += +'
+            '(?P<redundancy_mode_configured>[\s\S]+)$',
 
         # Redundancy State              = sso
-        p8 = re.compile(r'^Redundancy +State += +(?P<redundancy_state>[\s\S]+)$')
+        p8=r'^Redundancy +State += +(?P<redundancy_state>[\s\S]+)$',
 
         # Maintenance Mode = Disabled
-        p9 = re.compile(r'^Maintenance +Mode += +(?P<maintenance_mode>[\w]+)$')
+        p9=r'^Maintenance +Mode += +(?P<maintenance_mode>[\w]+)$',
 
         # Manual Swact = enabled
         # Manual Swact = disabled (system is simplex (no peer unit))
-        p10 = re.compile(r'^Manual +Swact += +(?P<manual_swact>[\w]+)'
-                         '( +\((?P<manual_swact_reason>.*)\))?$')
+        p10=r'^Manual +Swact += +(?P<manual_swact>[\w]+)'
+             '( +\((?P<manual_swact_reason>.*)\))?$',
 
         # Communications = Up
         # Communications = Down      Reason: Simplex mode
-        p11 = re.compile(r'^Communications += +(?P<communications>[\w]+)'
-                         '( +Reason: +(?P<communications_reason>[\s\S]+))?$')
+        p11=r'^Communications += +(?P<communications>[\w]+)'
+             '( +Reason: +(?P<communications_reason>[\s\S]+))?$',
 
         # client count = 76
-        p12 = re.compile(r'^client +count += +(?P<client_count>[\d]+)$')
+        p12=r'^client +count += +(?P<client_count>[\d]+)$',
 
         # client_notification_TMR = 30000 milliseconds
-        p13 = re.compile(r'^client_notification_TMR += +'
-                         '(?P<client_notification_tmr_msec>[\d]+) +milliseconds$')
+        p13=r'^client_notification_TMR += +'
+             '(?P<client_notification_tmr_msec>[\d]+) +milliseconds$',
 
         # RF debug mask = 0x0
-        p14 = re.compile(r'^RF +debug +mask += +(?P<rf_debug_mask>[\w]+)$')
+        p14=r'^RF +debug +mask += +(?P<rf_debug_mask>[\w]+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # initial variables
+        ret_dict = {}
+
+        p = ShowRedundancyStates.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -1875,65 +1911,65 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
                 continue
 
             # my state = 13 -ACTIVE
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict['my_state'] = m.groupdict()['my_state']
                 continue
 
             # peer state = 1  -DISABLED
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['peer_state'] = m.groupdict()['peer_state']
                 continue
 
             # Mode = Simplex
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict['mode'] = m.groupdict()['mode']
                 continue
 
             # Unit = Primary
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ret_dict['unit'] = m.groupdict()['unit']
                 continue
 
             # Unit ID = 48
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ret_dict['unit_id'] = int(m.groupdict()['unit_id'])
                 continue
 
             # Redundancy Mode (Operational) = Non-redundant
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ret_dict['redundancy_mode_operational'] = \
                     m.groupdict()['redundancy_mode_operational']
                 continue
 
             # Redundancy Mode (Configured)  = Non-redundant
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 ret_dict['redundancy_mode_configured'] = \
                     m.groupdict()['redundancy_mode_configured']
                 continue
 
             # Redundancy State              = sso
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 ret_dict['redundancy_state'] = m.groupdict()[
                     'redundancy_state']
                 continue
 
             # Maintenance Mode = Disabled
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 ret_dict['maintenance_mode'] = m.groupdict()[
                     'maintenance_mode']
                 continue
 
             # Manual Swact = enabled
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 ret_dict['manual_swact'] = m.groupdict()['manual_swact']
                 reason = m.groupdict()['manual_swact_reason']
@@ -1942,7 +1978,7 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
                 continue
 
             # Communications = Up
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 ret_dict['communications'] = m.groupdict()['communications']
                 reason = m.groupdict()['communications_reason']
@@ -1951,20 +1987,20 @@ class ShowRedundancyStates(ShowRedundancyStatesSchema):
                 continue
 
             # client count = 76
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 ret_dict['client_count'] = int(m.groupdict()['client_count'])
                 continue
 
             # client_notification_TMR = 30000 milliseconds
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 ret_dict['client_notification_tmr_msec'] = int(
                     m.groupdict()['client_notification_tmr_msec'])
                 continue
 
             # RF debug mask = 0x0
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 ret_dict['rf_debug_mask'] = m.groupdict()['rf_debug_mask']
                 continue
@@ -2080,21 +2116,7 @@ class ShowInventory(ShowInventorySchema):
 
     cli_command = ['show inventory']
 
-    def cli(self, output=None):
-
-        if output is None:
-            # Build command
-            cmd = self.cli_command[0]
-            # Execute command
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        # Init vars
-        ret_dict = {}
-        name = descr = slot = subslot = pid = ''
-        asr900_rp = False
-
+    patterns = Patterns(
         # NAME: "Switch 1", DESCR: "WS-C3850-24P-E"
         # NAME: "StackPort5/2", DESCR: "StackPort5/2"
         # NAME: "Switch 5 - Power Supply A", DESCR: "Switch 5 - Power Supply A"
@@ -2102,38 +2124,33 @@ class ShowInventory(ShowInventorySchema):
         # NAME: "NIM subslot 0/0", DESCR: "Front Panel 3 ports Gigabitethernet Module"
         # NAME: "Modem 0 on Cellular0/2/0", DESCR: "Sierra Wireless EM7455/EM7430"
         # NAME: "1", DESCR: "WS-C3560CX-12PC-S"
-        p1 = re.compile(r'^NAME: +\"(?P<name>.*)\",'
-                        r' +DESCR: +\"(?P<descr>.*)\"$')
+        p1=r'^NAME: +\"(?P<name>.*)\",'
+           r' +DESCR: +\"(?P<descr>.*)\"$',
 
         # Switch 1
         # module 0
-        p1_1 = re.compile(r'^(Switch|[Mm]odule) +(?P<slot>(\S+))')
+        p1_1=r'^(Switch|[Mm]odule) +(?P<slot>(\S+))',
 
         # Power Supply Module 0
         # Power Supply Module 1
-        p1_2 = re.compile(r'Power Supply Module')
+        p1_2=r'Power Supply Module',
 
         # SPA subslot 0/0
         # IM subslot 0/1
         # NIM subslot 0/0
-        p1_3 = re.compile(r'^(SPA|IM|NIM|PVDM) +subslot +(?P<slot>(\d+))/(?P<subslot>(\d+))')
+        p1_3=r'^(SPA|IM|NIM|PVDM) +subslot +(?P<slot>(\d+))/(?P<subslot>(\d+))',
 
         # subslot 0/0 transceiver 0
-        p1_4 = re.compile(r'^subslot +(?P<slot>(\d+))\/(?P<subslot>(.*))')
+        p1_4=r'^subslot +(?P<slot>(\d+))\/(?P<subslot>(.*))',
 
         # StackPort1/1
-        p1_5 = re.compile(r'^StackPort(?P<slot>(\d+))/(?P<subslot>(\d+))$')
+        p1_5=r'^StackPort(?P<slot>(\d+))/(?P<subslot>(\d+))$',
 
         # Fan Tray
-        p1_6 = re.compile(r'^Fan +Tray|\d+$')
+        p1_6=r'^Fan +Tray|\d+$',
 
         # Modem 0 on Cellular0/2/0
-        p1_7 = re.compile(r'^Modem +(?P<modem>\S+) +on +Cellular(?P<slot>\d+)\/(?P<subslot>.*)$')
-
-        # Slot 2 Linecard
-        # Slot 3 Supervisor
-        p1_8 = re.compile(r'^Slot \d Linecard|Slot \d Supervisor|Slot \d Router$')
-        p1_8 = re.compile(r'^Slot \d Linecard|Slot \d Supervisor|Slot \d Router$')
+        p1_7=r'^Modem +(?P<modem>\S+) +on +Cellular(?P<slot>\d+)\/(?P<subslot>.*)$',
 
         # PID: ASR-920-24SZ-IM   , VID: V01  , SN: CAT1902V19M
         # PID: SFP-10G-LR        , VID: CSCO , SN: CD180456291
@@ -2144,8 +2161,32 @@ class ShowInventory(ShowInventorySchema):
         # PID: ISR4331/K9        , VID:      , SN:
         # PID: , VID: 1.0  , SN: 1162722191
         # PID: WS-C3560CX-12PC-S , VID: V03  , SN: FOC2419L9KY
-        p2 = re.compile(r'^PID: +(?P<pid>[\S\s]+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
-                        r' +SN:(?: +(?P<sn>(\S+)))?$')
+        p2=r'^PID: +(?P<pid>[\S\s]+)? *, +VID:(?: +(?P<vid>(\S+)))? *,'
+           r' +SN:(?: +(?P<sn>(\S+)))?$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            # Build command
+            cmd = self.cli_command[0]
+            # Execute command
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        # Init vars
+        ret_dict = {}
+        name = descr = slot = subslot = pid = ''
+        asr900_rp = False
+
+        p = ShowInventory.patterns
+
+        # Slot 2 Linecard
+        # Slot 3 Supervisor
+        p1_8 = re.compile(r'^Slot \d Linecard|Slot \d Supervisor|Slot \d Router$')
+        p1_8 = re.compile(r'^Slot \d Linecard|Slot \d Supervisor|Slot \d Router$')
+
         for line in out.splitlines():
             line = line.strip()
 
@@ -2156,7 +2197,7 @@ class ShowInventory(ShowInventorySchema):
             # NAME: "NIM subslot 0/0", DESCR: "Front Panel 3 ports Gigabitethernet Module"
             # NAME: "Modem 0 on Cellular0/2/0", DESCR: "Sierra Wireless EM7455/EM7430"
             # NAME: "1", DESCR: "WS-C3560CX-12PC-S"
-            m = p1.match(line)
+            m = p.p1.match(line)
 
             if m:
                 group = m.groupdict()
@@ -2169,14 +2210,14 @@ class ShowInventory(ShowInventorySchema):
 
                 # Switch 1
                 # module 0
-                m1_1 = p1_1.match(name)
+                m1_1 = p.p1_1.match(name)
                 if m1_1:
                     slot = m1_1.groupdict()['slot']
                     # Creat slot_dict
                     slot_dict = ret_dict.setdefault('slot', {}).setdefault(slot, {})
 
                 # Power Supply Module 0
-                m1_2 = p1_2.match(name)
+                m1_2 = p.p1_2.match(name)
                 if m1_2:
                     slot = name.replace('Power Supply Module ', 'P')
                     # Creat slot_dict
@@ -2192,7 +2233,7 @@ class ShowInventory(ShowInventorySchema):
                 # subslot 0/0 transceiver 0
                 # StackPort1/1
                 # Modem 0 on Cellular0/2/0
-                m = p1_3.match(name) or p1_4.match(name) or p1_5.match(name) or p1_7.match(name)
+                m = p.p1_3.match(name) or p.p1_4.match(name) or p.p1_5.match(name) or p.p1_7.match(name)
                 if m:
                     group = m.groupdict()
                     slot = group['slot']
@@ -2201,7 +2242,7 @@ class ShowInventory(ShowInventorySchema):
                     slot_dict = ret_dict.setdefault('slot', {}).setdefault(slot, {})
 
                 # Fan Tray
-                m1_6 = p1_6.match(name)
+                m1_6 = p.p1_6.match(name)
                 if m1_6:
                     slot = name.replace(' ', '_')
                     # Create slot_dict
@@ -2227,7 +2268,7 @@ class ShowInventory(ShowInventorySchema):
             # PID: ISR4331/K9        , VID:      , SN:
             # PID: EM7455/EM7430     , VID: 1.0  , SN: 355813070074072
             # PID: WS-C3560CX-12PC-S , VID: V03  , SN: FOC2419L9KY
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 if group.get('pid'):
@@ -2495,51 +2536,35 @@ class ShowPlatform(ShowPlatformSchema):
     cli_command = 'show platform'
     exclude = ['insert_time']
 
-    def cli(self, output=None):
-        """parsing mechanism: cli
-
-        Function cli() defines the cli type output parsing mechanism which
-        typically contains 3 steps: exe
-        cuting, transforming, returning
-        """
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        platform_dict = {}
-        sub_dict = {}
-
-        # ----------      C3850    -------------
-
+    patterns = Patterns(
         # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-        p1 = re.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
-                        r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
+        p1=r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
+           r'(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$',
 
         # Mac persistency wait time: Indefinite
-        p2 = re.compile(r'^[Mm]ac +persistency +wait +time\: +(?P<mac_persistency_wait_time>[\w\.\:]+)$')
+        p2=r'^[Mm]ac +persistency +wait +time\: +(?P<mac_persistency_wait_time>[\w\.\:]+)$',
 
         # Switch  Ports    Model                Serial No.   MAC address     Hw Ver.       Sw Ver.
         # ------  -----   ---------             -----------  --------------  -------       --------
         #  1       32     WS-C3850-24P-E        FCW1947C0HH  0057.d2ff.e71b  V07           16.6.1
         #  1       32     C9200-24P             JAD2310213C  dc8c.37ff.ad21  V01           17.05.01
         #  1       32     C9200-24P             JAD2310213C  dc8c.37ff.ad21  V01           2021-03-03_18.
-        p3 = re.compile(r'^(?P<switch>\d+) +(?P<ports>\d+) +'
-                        r'(?P<model>[\w\-]+) +(?P<serial_no>\w+) +'
-                        r'(?P<mac_address>[\w\.\:]+) +'
-                        r'(?P<hw_ver>\w+) +(?P<sw_ver>[\s\S]+)$')
+        p3=r'^(?P<switch>\d+) +(?P<ports>\d+) +'
+           r'(?P<model>[\w\-]+) +(?P<serial_no>\w+) +'
+           r'(?P<mac_address>[\w\.\:]+) +'
+           r'(?P<hw_ver>\w+) +(?P<sw_ver>[\s\S]+)$',
 
         #                                     Current
         # Switch#   Role        Priority      State
         # -------------------------------------------
         # *1       Active          3          Ready
-        p4 = re.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
-                        r'(?P<priority>\d+) +(?P<state>[\w\s]+)$')
+        p4=r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
+           r'(?P<priority>\d+) +(?P<state>[\w\s]+)$',
 
         # ----------      ASR1K    -------------
         # Chassis type: ASR1006
         # Chassis type: ASR-903
-        p5 = re.compile(r'^[Cc]hassis +type: +(?P<chassis>\S+)$')
+        p5=r'^[Cc]hassis +type: +(?P<chassis>\S+)$',
 
         # Slot      Type                State                 Insert time (ago)
         # --------- ------------------- --------------------- -----------------
@@ -2549,24 +2574,44 @@ class ShowPlatform(ShowPlatformSchema):
         # P1        Unknown             N/A                   never
         # 1/0       SM-X-E2-20UXF       admin down            00:00:03
         # F0        C8500-20X6C         init, active          00:01:37
-        p6 = re.compile(r'^(?P<slot>[\w]+)(\/)?(?P<subslot>\d+)?\s*(?P<name>[\w\-_+\/]+)?\s*'\
-                        r'(?P<state>(ok|unknown|admin down|ok, active|N\/A|ok, standby|init, active'\
-                        r'|ps, fail|empty|incompatible|inserted|fail|disabled|booting|init, standby))\s*'\
-                        r'(?P<insert_time>[\w\.\:]+)$')
+        p6=r'^(?P<slot>[\w]+)(\/)?(?P<subslot>\d+)?\s*(?P<name>[\w\-_+\/]+)?\s*'\
+           r'(?P<state>(ok|unknown|admin down|ok, active|N\/A|ok, standby|init, active'\
+           r'|ps, fail|empty|incompatible|inserted|fail|disabled|booting|init, standby))\s*'\
+           r'(?P<insert_time>[\w\.\:]+)$',
 
         # 4                             unknown               2d00h
-        p6_1 = re.compile(r'^(?P<slot>\w+) +(?P<state>\w+(\, \w+)?) +(?P<insert_time>[\w\.\:]+)$')
+        p6_1=r'^(?P<slot>\w+) +(?P<state>\w+(\, \w+)?) +(?P<insert_time>[\w\.\:]+)$',
 
         # Slot      CPLD Version        Firmware Version
         # --------- ------------------- ---------------------------------------
         # 0         00200800            16.2(1r)
-        p7 = re.compile(r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +(?P<fireware_ver>[\w\.\(\)\/]+)$')
+        p7=r'^(?P<slot>\w+) +(?P<cpld_version>\d+|N\/A) +(?P<fireware_ver>[\w\.\(\)\/]+)$',
+    )
+
+    def cli(self, output=None):
+        """parsing mechanism: cli
+
+        Function cli() defines the cli type output parsing mechanism which
+        typically contains 3 steps: exe
+        cuting, transforming, returning
+        """
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        platform_dict = {}
+        sub_dict = {}
+
+        # ----------      C3850    -------------
+
+        p = ShowPlatform.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 if 'main' not in platform_dict:
                     platform_dict['main'] = {}
@@ -2575,7 +2620,7 @@ class ShowPlatform(ShowPlatformSchema):
                 continue
 
             # Mac persistency wait time: Indefinite
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if 'main' not in platform_dict:
                     platform_dict['main'] = {}
@@ -2587,7 +2632,7 @@ class ShowPlatform(ShowPlatformSchema):
             #  1       32     WS-C3850-24P-E        FCW1947C0HH  0057.d2ff.e71b  V07           16.6.1
             #  1       32     C9200-24P             JAD2310213C  dc8c.37ff.ad21  V01           17.05.01
             #  1       32     C9200-24P             JAD2310213C  dc8c.37ff.ad21  V01           2021-03-03_18.
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 slot = m.groupdict()['switch']
                 model = m.groupdict()['model']
@@ -2620,7 +2665,7 @@ class ShowPlatform(ShowPlatformSchema):
             # Switch#   Role        Priority      State
             # -------------------------------------------
             # *1       Active          3          Ready
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 slot = m.groupdict()['switch']
                 if 'slot' not in platform_dict:
@@ -2637,7 +2682,7 @@ class ShowPlatform(ShowPlatformSchema):
 
             # Chassis type: ASR1006
             # Chassis type: ASR-903
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 if 'main' not in platform_dict:
                     platform_dict['main'] = {}
@@ -2649,7 +2694,7 @@ class ShowPlatform(ShowPlatformSchema):
             # 0         ASR1000-SIP40       ok                    00:33:53
             #  0/0      SPA-1XCHSTM1/OC3    ok                    2d00h
             # 0         C8200-1N-4T         ok                    00:32:26
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 slot = m.groupdict()['slot']
                 subslot = m.groupdict()['subslot']
@@ -2755,7 +2800,7 @@ class ShowPlatform(ShowPlatformSchema):
             # Slot      CPLD Version        Firmware Version
             # --------- ------------------- ---------------------------------------
             # 0         00200800            16.2(1r)
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 fw_ver = m.groupdict()['fireware_ver']
                 cpld_ver = m.groupdict()['cpld_version']
@@ -2773,7 +2818,7 @@ class ShowPlatform(ShowPlatformSchema):
                 continue
 
             # 4                             unknown               2d00h
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 slot = m.groupdict()['slot']
                 if 'slot' not in platform_dict:
@@ -2876,63 +2921,53 @@ class ShowBoot(ShowBootSchema):
 
     cli_command = 'show boot'
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        boot_dict = {}
-        boot_variable = None
-        switch_number = 0
-
+    patterns = Patterns(
         # Current Boot Variables:
-        p1 = re.compile(r'Current +Boot +Variables:$')
+        p1=r'Current +Boot +Variables:$',
 
         # Boot Variables on next reload:
-        p1_2 = re.compile(r'Boot +Variables +on +next +reload:$')
+        p1_2=r'Boot +Variables +on +next +reload:$',
 
         # BOOT variable = bootflash:/asr1000rpx.bin,12;
         # BOOT variable = flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150907_031219.bin;
         #                 flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
         # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200427_012602.SSA.bin
         # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200428_021754.SSA.bin;bootflash:/cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20200429_051305.SSA_starfleet-1.bin;
-        p1_1 = re.compile(r'^BOOT +variable +=( *(?P<var>\S+);?)?$')
+        p1_1=r'^BOOT +variable +=( *(?P<var>\S+);?)?$',
 
         # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-        p2 = re.compile(r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$')
+        p2=r'^Standby +BOOT +variable +=( *(?P<var>\S+);)?$',
 
         # Configuration register is 0x2002
         # Configuration Register is 0x102
-        p3 = re.compile(r'^Configuration +[r|R]egister +is +(?P<var>\w+)$')
+        p3=r'^Configuration +[r|R]egister +is +(?P<var>\w+)$',
 
         # Standby Configuration register is 0x2002
-        p4 = re.compile(r'^Standby +Configuration +register'
-                        ' +is +(?P<var>\w+)$')
+        p4=r'^Standby +Configuration +register'
+            ' +is +(?P<var>\w+)$',
 
         # Manual Boot = yes
-        p5 = re.compile(r'^Manual +Boot += +(?P<var>\w+)$')
+        p5=r'^Manual +Boot += +(?P<var>\w+)$',
 
         # MANUAL_BOOT variable = no
-        p5_1 = re.compile(r'(^MANUAL_BOOT +variable) += +(?P<var>\w+)$')
+        p5_1=r'(^MANUAL_BOOT +variable) += +(?P<var>\w+)$',
 
         # Standby MANUAL_BOOT variable = no
-        p5_2 = re.compile(r'(^Standby +MANUAL_BOOT +variable) += +(?P<var>\w+)$')
+        p5_2=r'(^Standby +MANUAL_BOOT +variable) += +(?P<var>\w+)$',
 
         # Enable Break = yes
-        p6 = re.compile(r'^Enable +Break += +(?P<var>\w+)$')
+        p6=r'^Enable +Break += +(?P<var>\w+)$',
 
         # Boot Mode = DEVICE
-        p7 = re.compile(r'^Boot +Mode += +(?P<var>\S+)$')
+        p7=r'^Boot +Mode += +(?P<var>\S+)$',
 
         # iPXE Timeout = 0
-        p8 = re.compile(r'^iPXE +Timeout +=? +(?P<var>\w+)$')
+        p8=r'^iPXE +Timeout +=? +(?P<var>\w+)$',
 
         # BOOT path-list{      : flash:/c2960x-universalk9-mz.152-4.E8.bin
         # HELPER path-list    :
-        p9 = re.compile(r'^(?P<key>BOOT|HELPER) +path\-list +\:(?: '
-                        r'+(?P<value>[\w\:\/\-\.]+)?)$')
+        p9=r'^(?P<key>BOOT|HELPER) +path\-list +\:(?: '
+           r'+(?P<value>[\w\:\/\-\.]+)?)$',
 
         # Config file         : flash:/config.text
         # Private Config file : flash:/private-config.text
@@ -2941,36 +2976,50 @@ class ShowBoot(ShowBootSchema):
         # Allow Dev Key         : yes
         # Auto upgrade        : no
         # Auto upgrade path   :
-        p10 = re.compile(r'^(?P<key>[\w\s]+) +\: +(?P<value>[\w\:\/\-\.]+)$')
+        p10=r'^(?P<key>[\w\s]+) +\: +(?P<value>[\w\:\/\-\.]+)$',
 
         # buffer size:   524288
-        p11 = re.compile(r'buffer +size\: +(?P<value>\d+)$')
+        p11=r'buffer +size\: +(?P<value>\d+)$',
 
         # Download:    0 seconds
-        p12 = re.compile(r'Download\: +(?P<value>\d+ +\w+)$')
+        p12=r'Download\: +(?P<value>\d+ +\w+)$',
 
         # via DHCP:       disabled (next boot: disabled)
-        p13 = re.compile(r'via +DHCP\: +(?P<value>\w+) +\(next +boot\: '
-                            r'+(?P<next_boot>\w+)\)$')
+        p13=r'via +DHCP\: +(?P<value>\w+) +\(next +boot\: '
+            r'+(?P<next_boot>\w+)\)$',
 
         # Switch 2
         # switch 3
-        p14 = re.compile(r'^[Ss]witch +(?P<switch_number>\d+)$')
+        p14=r'^[Ss]witch +(?P<switch_number>\d+)$',
 
         # BOOT path-list      :
-        p15 = re.compile(r'^(?P<key>BOOT) +path\-list +\:$')
+        p15=r'^(?P<key>BOOT) +path\-list +\:$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        boot_dict = {}
+        boot_variable = None
+        switch_number = 0
+
+        p = ShowBoot.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Current Boot Variables:
-            m1 = p1.match(line)
+            m1 = p.p1.match(line)
             if m1:
                 boot_variable = 'current'
                 continue
 
             # Boot Variables on next reload:
-            m1_2 = p1_2.match(line)
+            m1_2 = p.p1_2.match(line)
             if m1_2:
                 boot_variable = 'next'
                 continue
@@ -2980,7 +3029,7 @@ class ShowBoot(ShowBootSchema):
             #                 flash:cat3k_caa-universalk9.BLD_POLARIS_DEV_LATEST_20150828_174328.SSA.bin;flash:ISSUCleanGolden;
             # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200427_012602.SSA.bin
             # BOOT variable = tftp://10.1.144.25//auto/tftptest-blr/latest//cat9k_iosxe.BLD_V173_THROTTLE_LATEST_20200428_021754.SSA.bin;bootflash:/cat9k_iosxe.BLD_POLARIS_DEV_LATEST_20200429_051305.SSA_starfleet-1.bin;
-            m1_1 = p1_1.match(line)
+            m1_1 = p.p1_1.match(line)
             if m1_1:
                 boot = m1_1.groupdict()['var']
                 if boot:
@@ -2995,7 +3044,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Standby BOOT variable = bootflash:/asr1000rpx.bin,12;
-            m2 = p2.match(line)
+            m2 = p.p2.match(line)
             if m2:
                 if m2.groupdict()['var']:
                     if 'standby' not in boot_dict:
@@ -3005,7 +3054,7 @@ class ShowBoot(ShowBootSchema):
 
             # Configuration register is 0x2002
             # Configuration Register is 0x102
-            m3 = p3.match(line)
+            m3 = p.p3.match(line)
             if m3:
                 if 'active' not in boot_dict:
                     boot_dict['active'] = {}
@@ -3013,7 +3062,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Standby Configuration register is 0x2002
-            m4 = p4.match(line)
+            m4 = p.p4.match(line)
             if m4:
                 if 'standby' not in boot_dict:
                     boot_dict['standby'] = {}
@@ -3021,7 +3070,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Manual Boot = yes
-            m5 = p5.match(line)
+            m5 = p.p5.match(line)
             if m5:
                 boot_dict['manual_boot'] = True if \
                     m5.groupdict()['var'].lower() == 'yes' else\
@@ -3029,7 +3078,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # MANUAL_BOOT variable = no
-            m5_1 = p5_1.match(line)
+            m5_1 = p.p5_1.match(line)
             if m5_1:
                 if 'active' not in boot_dict:
                     boot_dict['active'] = {}
@@ -3039,7 +3088,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Standby MANUAL_BOOT variable = no
-            m5_2 = p5_2.match(line)
+            m5_2 = p.p5_2.match(line)
             if m5_2:
                 if 'standby' not in boot_dict:
                     boot_dict['standby'] = {}
@@ -3049,7 +3098,7 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Enable Break = yes
-            m6 = p6.match(line)
+            m6 = p.p6.match(line)
             if m6:
                 boot_dict['enable_break'] = True if \
                     m6.groupdict()['var'].lower() == 'yes' else\
@@ -3057,20 +3106,20 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # Boot Mode = DEVICE
-            m7 = p7.match(line)
+            m7 = p.p7.match(line)
             if m7:
                 boot_dict['boot_mode'] = m7.groupdict()['var'].lower()
                 continue
 
             # iPXE Timeout = 0
-            m8 = p8.match(line)
+            m8 = p.p8.match(line)
             if m8:
                 boot_dict['ipxe_timeout'] = int(m8.groupdict()['var'])
                 continue
 
             # BOOT path-list      : flash:/c2960x-universalk9-mz.152-4.E8.bin
             # HELPER path-list    :
-            m9 = p9.match(line)
+            m9 = p.p9.match(line)
             if m9:
                 group = m9.groupdict()
                 if 'BOOT' in group['key']:
@@ -3096,7 +3145,7 @@ class ShowBoot(ShowBootSchema):
             # Allow Dev Key         : yes
             # Auto upgrade        : no
             # Auto upgrade path   :
-            m10 = p10.match(line)
+            m10 = p.p10.match(line)
             if m10:
                 group = m10.groupdict()
 
@@ -3111,21 +3160,21 @@ class ShowBoot(ShowBootSchema):
                 continue
 
             # buffer size:   524288
-            m11 = p11.match(line)
+            m11 = p.p11.match(line)
             if m11:
                 index_dict.update({'nvram_buffer_size': int(m11.groupdict()['value'])})
 
                 continue
 
             # Download:    0 seconds
-            m12 = p12.match(line)
+            m12 = p.p12.match(line)
             if m12:
                 index_dict.update({'timeout_config_download': m12.groupdict()['value']})
 
                 continue
 
             # via DHCP:       disabled (next boot: disabled)
-            m13 = p13.match(line)
+            m13 = p.p13.match(line)
             if m13:
                 group = m13.groupdict()
                 value = self.TRUE_FALSE.get(group['value'])
@@ -3137,14 +3186,14 @@ class ShowBoot(ShowBootSchema):
 
             # Switch 2
             # switch 3
-            m14 = p14.match(line)
+            m14 = p.p14.match(line)
             if m14:
                 switch_number = int(m14.groupdict()['switch_number'])
 
                 continue
 
             # BOOT path-list      :
-            m15 = p15.match(line)
+            m15 = p.p15.match(line)
             if m15:
                 sw_dict = boot_dict
                 index_dict = sw_dict
@@ -3185,29 +3234,14 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
     cli_command = 'show switch detail'
     STACK_PORT_RANGE = ('1', '2')
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = {}
-
-        # return empty when no output
-        if not out:
-            return ret_dict
-
-        # initial regexp pattern
-
+    patterns = Patterns(
         # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-        p1 = re.compile(r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
-                        '(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$')
+        p1=r'^[Ss]witch\/[Ss]tack +[Mm]ac +[Aa]ddress +\: +'
+            '(?P<switch_mac_address>[\w\.]+) *(?P<local>[\w\s\-]+)?$',
 
         # Mac persistency wait time: Indefinite
-        p2 = re.compile(r'^[Mm]ac +persistency +wait +time\: +'
-                        '(?P<mac_persistency_wait_time>[\w\.\:]+)$')
+        p2=r'^[Mm]ac +persistency +wait +time\: +'
+            '(?P<mac_persistency_wait_time>[\w\.\:]+)$',
 
         #                                              H/W   Current
         # Switch#   Role    Mac Address     Priority Version  State
@@ -3215,24 +3249,41 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
         # *1       Active   689c.e2ff.b9d9     3      V04     Ready
         #  2       Standby  689c.e2ff.b9d9     14             Ready
         #  3       Member   bbcc.fcff.7b00     15     0       V-Mismatch
-        p3_0 = re.compile(r'^Switch#\s+Role\s+Mac\sAddress\s+Priority\s+Version\s+State$')
-
-        p3_1 = re.compile(r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
-                           '(?P<mac_address>[\w\.]+) +'
-                           '(?P<priority>\d+) +'
-                           '(?P<hw_ver>\w+)? +'
-                           '(?P<state>[\w\s-]+)$')
+        p3_0=r'^Switch#\s+Role\s+Mac\sAddress\s+Priority\s+Version\s+State$',
+        p3_1=r'^\*?(?P<switch>\d+) +(?P<role>\w+) +'
+              '(?P<mac_address>[\w\.]+) +'
+              '(?P<priority>\d+) +'
+              '(?P<hw_ver>\w+)? +'
+              '(?P<state>[\w\s-]+)$',
 
         #          Stack Port Status             Neighbors
         # Switch#  Port 1     Port 2           Port 1   Port 2
         #   1         OK         OK               3        2
         #   1       DOWN       DOWN             None     None
-        p4_0 = re.compile(r'^Switch#\s+Port\s1\s+Port\s2\s+Port\s1\s+Port\s2$')
+        p4_0=r'^Switch#\s+Port\s1\s+Port\s2\s+Port\s1\s+Port\s2$',
+        p4_1=r'^(?P<switch>\d+) +(?P<status1>\w+) +'
+              '(?P<status2>\w+) +'
+              '(?P<nbr_num_1>\w+) +'
+              '(?P<nbr_num_2>\w+)$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # initial return dictionary
+        ret_dict = {}
+
+        # return empty when no output
+        if not out:
+            return ret_dict
+
+        # initial regexp pattern
 
-        p4_1 = re.compile(r'^(?P<switch>\d+) +(?P<status1>\w+) +'
-                           '(?P<status2>\w+) +'
-                           '(?P<nbr_num_1>\w+) +'
-                           '(?P<nbr_num_2>\w+)$')
+        p = ShowSwitchDetail.patterns
 
         active_table = 0
 
@@ -3240,25 +3291,25 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
             line = line.strip()
 
             # Switch/Stack Mac Address : 0057.d2ff.e71b - Local Mac Address
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict['mac_address'] = m.groupdict()['switch_mac_address']
                 continue
 
             # Mac persistency wait time: Indefinite
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['mac_persistency_wait_time'] = m.groupdict()['mac_persistency_wait_time'].lower()
                 continue
 
             # In order to know which regex (p3_1 or p4_1) should be used, we use p3_0 and p4_0 to determine which table
             # is currently parsed.
-            m = p3_0.match(line)
+            m = p.p3_0.match(line)
             if m:
                 active_table = 1
                 continue
 
-            m = p4_0.match(line)
+            m = p.p4_0.match(line)
             if m:
                 active_table = 2
                 continue
@@ -3268,7 +3319,7 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
             # -----------------------------------------------------------
             # *1       Active   689c.e2ff.b9d9     3      V04     Ready
             #  2       Standby  689c.e2ff.b9d9     14             Ready
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m and active_table == 1:
                 group = m.groupdict()
                 stack = group['switch']
@@ -3282,7 +3333,7 @@ class ShowSwitchDetail(ShowSwitchDetailSchema):
             # --------------------------------------------------------
             #   1         OK         OK               3        2
             #   1       DOWN       DOWN             None     None
-            m = p4_1.match(line)
+            m = p.p4_1.match(line)
             if m and active_table == 2:
                 group = m.groupdict()
                 stack = group['switch']
@@ -3430,88 +3481,83 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
     """Parser for show environment all"""
     PS_MAPPING = {'A': '1', 'B': '2'}
 
-    def cli(self, output):
-
-        # initial return dictionary
-        ret_dict = {}
-
+    patterns = Patterns(
         # SWITCH: 1
-        p0 = re.compile(r'^SWITCH: +(?P<switch>\d+)$')
+        p0=r'^SWITCH: +(?P<switch>\d+)$',
 
         # Switch 1 FAN 1 is OK
-        p1 = re.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN\s+(?P<fan>\d+)\s+is\s+(?P<state>\S+)$')
+        p1=r'^Switch\s+(?P<switch>\d+)\s+FAN\s+(?P<fan>\d+)\s+is\s+(?P<state>\S+)$',
 
         # Switch 1 FAN 1 direction is Front to Back
-        p1_1 = re.compile(r'^Switch\s+(?P<switch>\d+)\s+FAN +(?P<fan>\d+)\s+direction\s+is\s+(?P<direction>[\w\s]+)$')
+        p1_1=r'^Switch\s+(?P<switch>\d+)\s+FAN +(?P<fan>\d+)\s+direction\s+is\s+(?P<direction>[\w\s]+)$',
 
         # Switch   FAN   Speed   State
         # ---------------------------------------------------
         # 1     1 35840     OK
-        p1_2 = re.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)$')
+        p1_2=r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)$',
 
         # Switch     FAN     Speed   State   Airflow direction
         # ---------------------------------------------------
         # 2           1       5600    OK     Front to Back
-        p1_3 = re.compile(r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)\s+(?P<direction>[\w\s]+)$')
+        p1_3=r'^(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)\s+(?P<direction>[\w\s]+)$',
 
         # FAN PS-1 is NOT PRESENT
         # FAN PS-2 is OK
-        p2 = re.compile(r'^FAN\s+PS\-(?P<ps>\d+)\s+is\s+(?P<state>[\w\s]+)$')
+        p2=r'^FAN\s+PS\-(?P<ps>\d+)\s+is\s+(?P<state>[\w\s]+)$',
 
         # Switch 1: SYSTEM TEMPERATURE is OK
         # SYSTEM TEMPERATURE is OK
-        p3 = re.compile(r'^(Switch\s+(?P<switch>\d+):\s+)?SYSTEM\s+TEMPERATURE\s+is\s+(?P<state>[\w\s]+)$')
+        p3=r'^(Switch\s+(?P<switch>\d+):\s+)?SYSTEM\s+TEMPERATURE\s+is\s+(?P<state>[\w\s]+)$',
 
         # Inlet Temperature Value: 34 Degree Celsius
         # Hotspot Temperature Value: 45 Degree Celsius
         # ASIC Temperature Value: 36 Degree Celsius
         # System Temperature Value: 41 Degree Celsius
         # Temperature Value: 28 Degree Celsius
-        p4 = re.compile(r'^((?P<type>\w+)\s+)?Temperature\s+Value:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
+        p4=r'^((?P<type>\w+)\s+)?Temperature\s+Value:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$',
 
         # System Temperature State: GREEN
         # Temperature State: GREEN
-        p5 = re.compile(r'^(System\s+)?Temperature\s+State:\s+(?P<state>\w+)$')
-
+        p5=r'^(System\s+)?Temperature\s+State:\s+(?P<state>\w+)$',
 
         # Yellow Threshold : 66 Degree Celsius
         # Red Threshold    : 76 Degree Celsius
-        p6 = re.compile(r'^(?P<color>\w+)\s+Threshold\s*:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$')
+        p6=r'^(?P<color>\w+)\s+Threshold\s*:\s+(?P<temperature>\d+)\s+Degree\s+Celsius$',
 
         # POWER SUPPLY 1A TEMPERATURE: OK
         # POWER SUPPLY 1B TEMPERATURE: Not Present
-        p7 = re.compile(r'^POWER\s+SUPPLY\s+(?P<switch>\d+)(?P<power_supply>A|B)\s+'
-                        r'TEMPERATURE:\s+(?P<temperature>[\w\s]+)$')
+        p7=r'^POWER\s+SUPPLY\s+(?P<switch>\d+)(?P<power_supply>A|B)\s+'
+           r'TEMPERATURE:\s+(?P<temperature>[\w\s]+)$',
 
         # 1A  PWR-C1-715WAC       DCB1844G1ZY  OK              Good     Good     715
         # 1A  PWR-C2-1025WAC      DCB1636C003  OK              Good     Good     250/775
         # 1B  Not Present
-        p8 = re.compile(r'^(?P<sw>\d+)(?P<ps>\w+)\s*'
-                        r'((?P<pid>[\w\-]+)\s+'
-                        r'(?P<serial_number>\w+)\s+)?'
-                        r'(?P<status>(\w+|Not\sPresent|No\s+Input\s+Power))\s*'
-                        r'((?P<system_power>\w+)\s+'
-                        r'(?P<poe_power>[\w\/]+)\s+'
-                        r'(?P<watts>[\w\/]+))?$')
+        p8=r'^(?P<sw>\d+)(?P<ps>\w+)\s*'
+           r'((?P<pid>[\w\-]+)\s+'
+           r'(?P<serial_number>\w+)\s+)?'
+           r'(?P<status>(\w+|Not\sPresent|No\s+Input\s+Power))\s*'
+           r'((?P<system_power>\w+)\s+'
+           r'(?P<poe_power>[\w\/]+)\s+'
+           r'(?P<watts>[\w\/]+))?$',
 
         # 1   Not Present     <>
-        p9 = re.compile(r'^(?P<switch>\d+)\s+(?P<status>\w+|Not\s+Present)\s+'
-                         r'(?P<rps_name>\w+|<>)(\s+(?P<rps_serial_num>\w+)\s+'
-                         r'(?P<rps_port_num>\w+))?$')
+        p9=r'^(?P<switch>\d+)\s+(?P<status>\w+|Not\s+Present)\s+'
+           r'(?P<rps_name>\w+|<>)(\s+(?P<rps_serial_num>\w+)\s+'
+           r'(?P<rps_port_num>\w+))?$',
 
         #Gi1/1/1        Type3          60(w)     Available
-        p10 = re.compile(r'^(?P<power_source>[\w./]+)\s+(?P<type>\w+)\s+(?P<watts>\S+)\(w\)\s+(?P<mode>\S+)')
+        p10=r'^(?P<power_source>[\w./]+)\s+(?P<type>\w+)\s+(?P<watts>\S+)\(w\)\s+(?P<mode>\S+)',
 
         #A.C. Input     Auxilliary     150(w)    Available
-        p11 = re.compile(r'^(?P<power_source>A.C. Input|\S+)\s+(?P<type>\w+)\s+(?P<watts>\S+)\(w\)\s+(?P<mode>\S+)')
+        p11=r'^(?P<power_source>A.C. Input|\S+)\s+(?P<type>\w+)\s+(?P<watts>\S+)\(w\)\s+(?P<mode>\S+)',
 
         #Built-In                      310(w)
-        p12 = re.compile(r'^(?P<power_source>A.C. Input|\S+)\s+(?P<watts>\S+)\(w\)')
+        p12=r'^(?P<power_source>A.C. Input|\S+)\s+(?P<watts>\S+)\(w\)',
 
         # Switch   FAN     Speed   State   Airflow direction
         # ---------------------------------------------------
         #     1       1     5160      OK     Front to Back
-        p13 = re.compile(r'^\s*(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)\s+(?P<direction>\S+\s+\S+\s+\S+)$')
+        p13=r'^\s*(?P<switch>\d+)\s+(?P<fan>\d+)\s+(?P<speed>\d+)\s+(?P<state>\w+)\s+(?P<direction>\S+\s+\S+\s+\S+)$',
 
         #Sensor          Location        State               Reading       Range(min-max)
         # PS1 Vout        1               GOOD               12000 mV          na
@@ -3519,12 +3565,21 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
         # PS1 Powout      1               GOOD              300000 mW          na
         # PS1 Hotspot     1               GOOD                  24 Celsius     na
         # PS1 Fan Status  1               GOOD               43008 rpm         na
-        p14 = re.compile(r"^\s*(?P<sensor>PS\d+\s+\S+(?:\s+\S+)?)\s+(?P<location>\d+)\s+(?P<state>\S+)\s+(?P<reading>\d+)\s+(?P<unit>\S+)\s+\S+")
+        p14=r"^\s*(?P<sensor>PS\d+\s+\S+(?:\s+\S+)?)\s+(?P<location>\d+)\s+(?P<state>\S+)\s+(?P<reading>\d+)\s+(?P<unit>\S+)\s+\S+",
 
         # SYSTEM INLET    1               GREEN                 23 Celsius   0 - 56
         # SYSTEM OUTLET   1               GREEN                 28 Celsius   0 - 125
         # SYSTEM HOTSPOT  1               GREEN                 38 Celsius   0 - 125
-        p15 = re.compile(r"^\s*(?P<sensor>SYSTEM+\s+\S+(?:\s+\S+)?)\s+(?P<location>\d+)\s+(?P<state>\S+)\s+(?P<reading>\d+)\s+(?P<unit>\S+)\s+(?P<range>\d+\s*-\s*\d+)$")
+        p15=r"^\s*(?P<sensor>SYSTEM+\s+\S+(?:\s+\S+)?)\s+(?P<location>\d+)\s+(?P<state>\S+)\s+(?P<reading>\d+)\s+(?P<unit>\S+)\s+(?P<range>\d+\s*-\s*\d+)$",
+    )
+
+    def cli(self, output):
+
+        # initial return dictionary
+        ret_dict = {}
+
+        p = ShowEnvironmentSuperParser.patterns
+
         # set default value for switch
         switch = 1
 
@@ -3532,14 +3587,14 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
             line = line.strip()
 
             # SWITCH: 1
-            m = p0.match(line)
+            m = p.p0.match(line)
             if m:
                 switch = m.groupdict()['switch']
                 root_dict = ret_dict.setdefault('switch', {}).setdefault(switch, {})
                 continue
 
             # Switch 1 FAN 1 is OK
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3549,7 +3604,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
                 continue
 
             # Switch 1 FAN 1 direction is Front to Back
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3562,7 +3617,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
             # Switch   FAN   Speed   State
             # ---------------------------------------------------
             # 1     1 35840     OK
-            m = p1_2.match(line)
+            m = p.p1_2.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3574,7 +3629,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
             # Switch     FAN     Speed   State   Airflow direction
             # ---------------------------------------------------
             # 2           1       5600    OK     Front to Back
-            m = p1_3.match(line)
+            m = p.p1_3.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3588,7 +3643,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
 
             # FAN PS-1 is OK
             # FAN PS-1 is NOT PRESENT
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ps = group['ps']
@@ -3598,7 +3653,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
 
             # Switch 1: SYSTEM TEMPERATURE is OK
             # SYSTEM TEMPERATURE is OK
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 if group['switch']:
@@ -3612,7 +3667,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
             # ASIC Temperature Value: 36 Degree Celsius
             # System Temperature Value: 41 Degree Celsius
             # Temperature Value: 28 Degree Celsius
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 if group['type']:
@@ -3625,7 +3680,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
                 continue
 
             # Temperature State: GREEN
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 try:
                     temp_dict['state'] = m.groupdict()['state'].lower()
@@ -3637,7 +3692,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
 
             # Yellow Threshold : 46 Degree Celsius
             # Red Threshold    : 56 Degree Celsius
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 color_type = group['color'].lower() + '_threshold'
@@ -3646,7 +3701,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
 
             # POWER SUPPLY 1A TEMPERATURE: OK
             # POWER SUPPLY 1B TEMPERATURE: Not Present
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 switch = m.groupdict()['switch']
                 power_supply = self.PS_MAPPING[m.groupdict()['power_supply']]
@@ -3661,7 +3716,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
             # 1A  PWR-C1-715WAC       DCB1844G1ZY  OK              Good     Good     715
             # 1A  PWR-C2-1025WAC      DCB1636C003  OK              Good     Good     250/775
             # 1B  Not Present
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 switch = group.pop('sw')
@@ -3676,7 +3731,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
             # SW  Status          RPS Name          RPS Serial#  RPS Port#
             # --  -------------   ----------------  -----------  ---------
             # 1   Not Present     <>
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3691,7 +3746,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
                 continue
 
             #Gi1/1/1        Type3          60(w)     Available
-            m = p10.match(line)
+            m = p.p10.match(line)
 
             if m:
                 group = m.groupdict()
@@ -3703,7 +3758,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
                 continue
 
             #A.C. Input     Auxilliary     150(w)    Available
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 root_dict = ret_dict.setdefault('switch', {}).setdefault(switch, {})
@@ -3712,7 +3767,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
                 continue
 
             #Built-In                      310(w)
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 root_dict = ret_dict.setdefault('switch', {}).setdefault(switch, {})
@@ -3723,7 +3778,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
             # Switch   FAN     Speed   State   Airflow direction
             # ---------------------------------------------------
             # 1       1     5160      OK     Front to Back
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -3743,7 +3798,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
             # PS1 Powout      1               GOOD              300000 mW          na
             # PS1 Hotspot     1               GOOD                  24 Celsius     na
             # PS1 Fan Status  1               GOOD               43008 rpm         na
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 location = group['location']
@@ -3762,7 +3817,7 @@ class ShowEnvironmentSuperParser(ShowEnvironmentSchema):
             # SYSTEM INLET    1               GREEN                 23 Celsius   0 - 56
             # SYSTEM OUTLET   1               GREEN                 28 Celsius   0 - 125
             # SYSTEM HOTSPOT  1               GREEN                 38 Celsius   0 - 125
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 location = group['location']
@@ -3995,52 +4050,52 @@ class ShowModule(ShowModuleSchema):
 
     cli_command = 'show module'
 
-    def cli(self, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
-
-        # initial return dictionary
-        ret_dict = {}
-        switch_flag = False
-
+    patterns = Patterns(
         # initial regexp pattern
-        p1 = re.compile(r'^(?P<switch>\d+) *'
-                        '(?P<port>\w+) +'
-                        '(?P<model>[\w\-]+) +'
-                        '(?P<serial_number>\w+) +'
-                        '(?P<mac_address>[\w\.]+) +'
-                        '(?P<hw_ver>\w+) +'
-                        '(?P<sw_ver>[\w\.]+)$')
-
-        # Chassis Type: C9500X-28C8D
+        p1=r'^(?P<switch>\d+) *'
+            '(?P<port>\w+) +'
+            '(?P<model>[\w\-]+) +'
+            '(?P<serial_number>\w+) +'
+            '(?P<mac_address>[\w\.]+) +'
+            '(?P<hw_ver>\w+) +'
+            '(?P<sw_ver>[\w\.]+)$',
 
         # Mod Ports Card Type                                   Model          Serial No.
         # ---+-----+--------------------------------------+--------------+--------------
         # 1   38   Cisco Catalyst 9500X-28C8D Switch           C9500X-28C8D     FDO25030SLN
-
-        p2=re.compile(r'^(?P<mod>\d+) +(?P<ports>\d+) +(?P<card_type>[\w\/()\-\+]+(?: [\w\/()\-\+]+)*) +(?P<model>\S+)(\s+)?(?P<serial>\S+)?$')
+        p2=r'^(?P<mod>\d+) +(?P<ports>\d+) +(?P<card_type>[\w\/()\-\+]+(?: [\w\/()\-\+]+)*) +(?P<model>\S+)(\s+)?(?P<serial>\S+)?$',
 
         # Mod MAC addresses                    Hw   Fw           Sw                 Status
         # ---+--------------------------------+----+------------+------------------+--------
         # 1   F87A.4125.1400 to F87A.4125.147D 0.2  17.7.0.41     BLD_POLARIS_DEV_LA ok
-
-        p3=re.compile(r'^(?P<mod>\d+) +(?P<mac_address>([\w\.]+ +to +[\w\.]+)|unknown) +(?P<hw>\S+) +(?P<fw>\S+) +(?P<sw>\S+) +(?P<status>\S+)$')
+        p3=r'^(?P<mod>\d+) +(?P<mac_address>([\w\.]+ +to +[\w\.]+)|unknown) +(?P<hw>\S+) +(?P<fw>\S+) +(?P<sw>\S+) +(?P<status>\S+)$',
 
         # Mod Redundancy Role     Operating Redundancy Mode Configured Redundancy Mode
         # ---+-------------------+-------------------------+---------------------------
         # 1   Active              non-redundant             Non-redundant
-
-        p4=re.compile(r'^(?P<mod>\d+) *(?P<redundancy_role>\S+) *(?P<operating_redundancy_mode>\S+) *(?P<configured_redundancy_mode>\S+)$')
+        p4=r'^(?P<mod>\d+) *(?P<redundancy_role>\S+) *(?P<operating_redundancy_mode>\S+) *(?P<configured_redundancy_mode>\S+)$',
 
         # Chassis MAC address range: 512 addresses from f87a.4125.1400 to f87a.4125.15ff
-        p5=re.compile(r'^Chassis MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
+        p5=r'^Chassis MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$',
 
         # Switch Number 1
-        p6 = re.compile(r'^Switch\s+Number\s+(?P<switch_number>\d+)$')
+        p6=r'^Switch\s+Number\s+(?P<switch_number>\d+)$',
 
         # Chassis 1 MAC address range: 512 addresses from 40b5.c1ff.ee00 to 40b5.c1ff.efff
-        p7=re.compile(r'^Chassis\s*(?P<chassis>\d+)\s*MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$')
+        p7=r'^Chassis\s*(?P<chassis>\d+)\s*MAC address range: (?P<number_of_mac_address>\d+) addresses from (?P<chassis_mac_address_lower_range>.*) to (?P<chassis_mac_address_upper_range>.*)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # initial return dictionary
+        ret_dict = {}
+        switch_flag = False
 
+        p = ShowModule.patterns
+
+        # Chassis Type: C9500X-28C8D
 
         for line in output.splitlines():
             line = line.strip()
@@ -4048,7 +4103,7 @@ class ShowModule(ShowModuleSchema):
             # Switch  Ports    Model                Serial No.   MAC address     Hw Ver.       Sw Ver.
             # ------  -----   ---------             -----------  --------------  -------       --------
             #  1       56     WS-C3850-48P-E        FOC1902X062  689c.e2ff.b9d9  V04           16.9.1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 switch = group.pop('switch')
@@ -4057,7 +4112,7 @@ class ShowModule(ShowModuleSchema):
                 continue
 
             # Switch Number 1
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 s_dict = ret_dict.setdefault('switches', {}).setdefault(int(group['switch_number']), {})
@@ -4069,7 +4124,7 @@ class ShowModule(ShowModuleSchema):
             # Mod Ports Card Type                                   Model          Serial No.
             # ---+-----+--------------------------------------+--------------+--------------
             # 1   38   Cisco Catalyst 9500X-28C8D Switch           C9500X-28C8D     FDO25030SLN
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 switch = group.pop('mod')
@@ -4087,7 +4142,7 @@ class ShowModule(ShowModuleSchema):
             # ---+--------------------------------+----+------------+------------------+--------
             # 1   F87A.4125.1400 to F87A.4125.147D 0.2  17.7.0.41     BLD_POLARIS_DEV_LA ok
 
-            m=p3.match(line)
+            m=p.p3.match(line)
             if m:
                 group = m.groupdict()
                 switch = group.pop('mod')
@@ -4101,7 +4156,7 @@ class ShowModule(ShowModuleSchema):
             # Mod Redundancy Role     Operating Redundancy Mode Configured Redundancy Mode
             # ---+-------------------+-------------------------+---------------------------
             # 1   Active              non-redundant             Non-redundant
-            m=p4.match(line)
+            m=p.p4.match(line)
             if m:
                 group = m.groupdict()
                 switch = group.pop('mod')
@@ -4113,7 +4168,7 @@ class ShowModule(ShowModuleSchema):
                 continue
 
             #Chassis MAC address range: 512 addresses from f87a.4125.1400 to f87a.4125.15ff
-            m=p5.match(line)
+            m=p.p5.match(line)
             if m:
                 group=m.groupdict()
                 ret_dict.update({k: v.lower().strip() for k, v in group.items()})
@@ -4121,7 +4176,7 @@ class ShowModule(ShowModuleSchema):
                 continue
 
             # Chassis MAC address range: 512 addresses from f87a.4125.1400 to f87a.4125.15ff
-            m=p7.match(line)
+            m=p.p7.match(line)
             if m:
                 group=m.groupdict()
                 if switch_flag:
@@ -4209,6 +4264,20 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
     exclude = ['five_min_cpu', 'five_sec_cpu_total', 'nonzero_cpu_processes', 'zero_cpu_processes',
                'five_sec_cpu', 'invoked', 'one_min_cpu', 'runtime', 'usecs', 'pid', 'process', ]
 
+    patterns = Patterns(
+        # initial regexp pattern
+        #Core 0 : CPU utilization for five seconds: 5%/1%; one minute: 6%; five minutes: 6%
+        p1=r'^(Core\s+(?P<core>[\w\s]+): +)?CPU +utilization +for +five +seconds: '
+           r'+(?P<five_sec_cpu_total>\d+)\%(\/(?P<five_sec_cpu_interrupts>\d+)\%)?; +one +minute: '
+           r'+(?P<one_min_cpu>\d+)\%; +five +minutes: +(?P<five_min_cpu>\d+)\%$',
+
+        #PID    Runtime(ms) Invoked  uSecs  5Sec     1Min     5Min     TTY   Process
+        # 5782   2045595     13521147 208    4.52     6.10     5.85     0     iosd
+        # 22     1520051     62763660 24     0.02     0.02     0.02     0     sirq-net-rx/1
+        p2=r'^(?P<pid>\d+) +(?P<runtime>\d+) +(?P<invoked>\d+) +(?P<usecs>\d+) +(?P<five_sec_cpu>[\d\.]+)(\%)? +'
+           r'(?P<one_min_cpu>[\d\.]+)(\%)? +(?P<five_min_cpu>[\d\.]+)(\%)? +(?P<tty>\d+) +(?P<process>.+)$',
+    )
+
     def cli(self, sort_time='', key_word='', exclude='', cmd='', output=None):
 
         assert sort_time in ['1min', '5min', '5sec', ''], "Not one from 1min 5min 5sec"
@@ -4237,24 +4306,14 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
         nonzero_cpu_processes = []
         index = 0
 
-        # initial regexp pattern
-        #Core 0 : CPU utilization for five seconds: 5%/1%; one minute: 6%; five minutes: 6%
-        p1 = re.compile(r'^(Core\s+(?P<core>[\w\s]+): +)?CPU +utilization +for +five +seconds: '
-                        r'+(?P<five_sec_cpu_total>\d+)\%(\/(?P<five_sec_cpu_interrupts>\d+)\%)?; +one +minute: '
-                        r'+(?P<one_min_cpu>\d+)\%; +five +minutes: +(?P<five_min_cpu>\d+)\%$')
-
-        #PID    Runtime(ms) Invoked  uSecs  5Sec     1Min     5Min     TTY   Process
-        # 5782   2045595     13521147 208    4.52     6.10     5.85     0     iosd
-        # 22     1520051     62763660 24     0.02     0.02     0.02     0     sirq-net-rx/1
-        p2 = re.compile(r'^(?P<pid>\d+) +(?P<runtime>\d+) +(?P<invoked>\d+) +(?P<usecs>\d+) +(?P<five_sec_cpu>[\d\.]+)(\%)? +'
-                        r'(?P<one_min_cpu>[\d\.]+)(\%)? +(?P<five_min_cpu>[\d\.]+)(\%)? +(?P<tty>\d+) +(?P<process>.+)$')
+        p = ShowProcessesCpuSorted.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # CPU utilization for five seconds: 5%/1%; one minute: 6%; five minutes: 6%
             #Core 0 : CPU utilization for five seconds: 5%/1%; one minute: 6%; five minutes: 6%
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 if group['core'] is None:
@@ -4271,7 +4330,7 @@ class ShowProcessesCpuSorted(ShowProcessesCpuSortedSchema):
             # PID    Runtime(ms) Invoked  uSecs  5Sec     1Min     5Min     TTY   Process
             # 5782   2045595     13521147 208    4.52     6.10     5.85     0     iosd
             # 22     1520051     62763660 24     0.02     0.02     0.02     0     sirq-net-rx/1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 index += 1
@@ -4332,6 +4391,25 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
     exclude = ['five_min_cpu', 'nonzero_cpu_processes', 'zero_cpu_processes', 'invoked',
                'runtime', 'usecs', 'five_sec_cpu', 'one_min_cpu']
 
+    patterns = Patterns(
+        # CPU utilization for five seconds: 43%, one minute: 44%, five minutes: 44%
+        p1=r'^CPU +utilization +for +five +seconds: +(?P<cpu_util_five_secs>[\d\%]+),'
+            ' +one +minute: +(?P<cpu_util_one_min>[\d\%]+),'
+            ' +five +minutes: +(?P<cpu_util_five_min>[\d\%]+)$',
+
+        # Core 0: CPU utilization for five seconds:  6%, one minute: 11%, five minutes: 11%
+        p2=r'^(?P<core>[\w\s]+): +CPU +utilization +for'
+            ' +five +seconds: +(?P<core_cpu_util_five_secs>\d+\%+),'
+            ' +one +minute: +(?P<core_cpu_util_one_min>[\d+\%]+),'
+            ' +five +minutes: +(?P<core_cpu_util_five_min>[\d+\%]+)$',
+
+        # 21188   21176    599%    600%    599%  R           478632  ucode_pkt_PPE0
+        p3=r'^(?P<pid>\d+) +(?P<ppid>\d+)'
+            ' +(?P<five_sec>[\d\%]+) +(?P<one_min>[\d\%]+)'
+            ' +(?P<five_min>[\d\%]+) +(?P<status>[\w]+)'
+            ' +(?P<size>\d+) +(?P<name>.*)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -4343,28 +4421,13 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
 
         # initial regexp pattern
 
-        # CPU utilization for five seconds: 43%, one minute: 44%, five minutes: 44%
-        p1 = re.compile(r'^CPU +utilization +for +five +seconds: +(?P<cpu_util_five_secs>[\d\%]+),'
-                        ' +one +minute: +(?P<cpu_util_one_min>[\d\%]+),'
-                        ' +five +minutes: +(?P<cpu_util_five_min>[\d\%]+)$')
-
-        # Core 0: CPU utilization for five seconds:  6%, one minute: 11%, five minutes: 11%
-        p2 = re.compile(r'^(?P<core>[\w\s]+): +CPU +utilization +for'
-                        ' +five +seconds: +(?P<core_cpu_util_five_secs>\d+\%+),'
-                        ' +one +minute: +(?P<core_cpu_util_one_min>[\d+\%]+),'
-                        ' +five +minutes: +(?P<core_cpu_util_five_min>[\d+\%]+)$')
-
-        # 21188   21176    599%    600%    599%  R           478632  ucode_pkt_PPE0
-        p3 = re.compile(r'^(?P<pid>\d+) +(?P<ppid>\d+)'
-                        ' +(?P<five_sec>[\d\%]+) +(?P<one_min>[\d\%]+)'
-                        ' +(?P<five_min>[\d\%]+) +(?P<status>[\w]+)'
-                        ' +(?P<size>\d+) +(?P<name>.*)$')
+        p = ShowProcessesCpuPlatform.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # CPU utilization for five seconds:  2%, one minute:  5%, five minutes: 22%
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.setdefault('cpu_utilization', {})
@@ -4372,7 +4435,7 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
                 continue
 
             # Core 0: CPU utilization for five seconds:  2%, one minute:  8%, five minutes: 18%
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 core = group.pop('core')
@@ -4387,7 +4450,7 @@ class ShowProcessesCpuPlatform(ShowProcessesCpuPlatformSchema):
             #      1       0      0%      0%      0%  S          1863680  init
             #      2       0      0%      0%      0%  S                0  kthreadd
             #      3       2      0%      0%      0%  S                0  migration/0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 pid = group['pid']
@@ -4438,6 +4501,21 @@ class ShowEnvironment(ShowEnvironmentSchema):
 
     cli_command = ['show environment', 'show environment | include {include}']
 
+    patterns = Patterns(
+        # Number of Critical alarms:  0
+        p1=r'^Number +of +Critical +alarms: +(?P<critic_larams>\d+)$',
+
+        # Number of Major alarms:     0
+        p2=r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$',
+
+        # Number of Minor alarms:     0
+        p3=r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$',
+
+        #R0 Temp: Inlet Critical 47 Celsius (na ,na ,47 ,na )(Celsius)
+        #R0 Temp: Internal Normal 47 Celsius (na ,na ,na ,na )(Celsius)
+        p4=r'^(?P<slot>\S+) +(?P<sensor_name>.+?)\s+(?P<state>Normal|Critical|Warning|Fan +Speed +\d+%)\s+(?P<reading>\d+\s*\S+\s*?\S*?)(\s*?(?P<threshold>na|\([\d|na,\s]+\)(\(Celsius\))?))?$',
+    )
+
     def cli(self, include='', output=None):
         if output is None:
             if include:
@@ -4451,14 +4529,7 @@ class ShowEnvironment(ShowEnvironmentSchema):
         # initial return dictionary
         ret_dict = {}
 
-        # Number of Critical alarms:  0
-        p1 = re.compile(r'^Number +of +Critical +alarms: +(?P<critic_larams>\d+)$')
-
-        # Number of Major alarms:     0
-        p2 = re.compile(r'^Number +of +Major +alarms: +(?P<maj_alarms>\d+)$')
-
-        # Number of Minor alarms:     0
-        p3 = re.compile(r'^Number +of +Minor +alarms: +(?P<min_alarms>\d+)$')
+        p = ShowEnvironment.patterns
 
         # Slot    Sensor       Current State       Reading          Threshold(Minor,Major,Critical,Shutdown)
         # ----    ------       -------------       -------          ---------------------------------------
@@ -4473,28 +4544,24 @@ class ShowEnvironment(ShowEnvironmentSchema):
         #  R0          Temp: Outlet_A  Normal          34   Celsius       (55 ,60 ,65 ,75 )(Celsius)
         #  R0          Temp: UADP_0_4  Normal          45   Celsius       (105,110,120,124)(Celsius)
 
-        #R0 Temp: Inlet Critical 47 Celsius (na ,na ,47 ,na )(Celsius)
-        #R0 Temp: Internal Normal 47 Celsius (na ,na ,na ,na )(Celsius)
-        p4 = re.compile(r'^(?P<slot>\S+) +(?P<sensor_name>.+?)\s+(?P<state>Normal|Critical|Warning|Fan +Speed +\d+%)\s+(?P<reading>\d+\s*\S+\s*?\S*?)(\s*?(?P<threshold>na|\([\d|na,\s]+\)(\(Celsius\))?))?$')
-
         for line in out.splitlines():
             line = line.strip()
             # Number of Critical alarms:  0
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['critical_larams'] = int(group['critic_larams'])
                 continue
 
             # Number of Major alarms:     0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['major_alarms'] = int(group['maj_alarms'])
                 continue
 
             # Number of Minor alarms:     0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['minor_alarms'] = int(group['min_alarms'])
@@ -4512,7 +4579,7 @@ class ShowEnvironment(ShowEnvironmentSchema):
             #  R0          3570MB2_0: VOU  Normal          1000 mV            na
             #  R0          Temp: Outlet_A  Normal          34   Celsius       (55 ,60 ,65 ,75 )(Celsius)
             #  R0          Temp: UADP_0_4  Normal          45   Celsius       (105,110,120,124)(Celsius)
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 sensor_name = group.pop('sensor_name')
@@ -4603,6 +4670,27 @@ class ShowVersionRp(ShowVersionRpSchema):
     cli_command = ['show version RP {rp} {status}']
     exclude = ['total_enqs_bytes', 'total_enqs_packets']
 
+    patterns = Patterns(
+        # Package: rpbase, version: 03.16.04a.S.155-3.S4a-ext, status: active
+        # Package: Provisioning File, version: n/a, status: active
+        p1=r'^Package: +(?P<package_name>[\w\d\s]+),'
+            ' +version: +(?P<version>[\w\d\.\-\/]+),'
+            ' +status: +(?P<status>[\w\/]+)$',
+
+        #   File: consolidated:asr1000rp2-rpbase.03.16.04a.S.155-3.S4a-ext.pkg, on: RP0
+        p2=r'^File: +consolidated:(?P<file>[\w\d\-\.]+),'
+            ' +on: +(?P<rp_slot>[\w\d\/]+)$',
+
+        # Built: 2016-10-04_12.28, by: mcpre
+        # Built: n/a, by: n/a
+        p3=r'^Built: +(?P<built_time>[\w\d\:\.\_\/\-]+),'
+            ' +by: +(?P<built_by>[\w\d\/]+)$',
+
+        #   File SHA1 checksum: 79e234871520fd480dc1128058160b4e2acee9f7
+        p4=r'^File +SHA1 +checksum:'
+            ' +(?P<file_sha1_checksum>[\w\d]+)$',
+    )
+
     def cli(self, rp='active', status='running', output=None):
 
         if output is None:
@@ -4617,29 +4705,12 @@ class ShowVersionRp(ShowVersionRpSchema):
         rp_slot = ''
         built_time = ''
 
-        # Package: rpbase, version: 03.16.04a.S.155-3.S4a-ext, status: active
-        # Package: Provisioning File, version: n/a, status: active
-        p1 = re.compile(r'^Package: +(?P<package_name>[\w\d\s]+),'
-                        ' +version: +(?P<version>[\w\d\.\-\/]+),'
-                        ' +status: +(?P<status>[\w\/]+)$')
-
-        #   File: consolidated:asr1000rp2-rpbase.03.16.04a.S.155-3.S4a-ext.pkg, on: RP0
-        p2 = re.compile(r'^File: +consolidated:(?P<file>[\w\d\-\.]+),'
-                        ' +on: +(?P<rp_slot>[\w\d\/]+)$')
-
-        # Built: 2016-10-04_12.28, by: mcpre
-        # Built: n/a, by: n/a
-        p3 = re.compile(r'^Built: +(?P<built_time>[\w\d\:\.\_\/\-]+),'
-                        ' +by: +(?P<built_by>[\w\d\/]+)$')
-
-        #   File SHA1 checksum: 79e234871520fd480dc1128058160b4e2acee9f7
-        p4 = re.compile(r'^File +SHA1 +checksum:'
-                        ' +(?P<file_sha1_checksum>[\w\d]+)$')
+        p = ShowVersionRp.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 package_name = group['package_name']
@@ -4647,7 +4718,7 @@ class ShowVersionRp(ShowVersionRpSchema):
                 status = group['status']
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 file = group['file']
@@ -4674,7 +4745,7 @@ class ShowVersionRp(ShowVersionRpSchema):
                 ret_dict['rp'][rp]['slot'][rp_slot]['package'][package_name]['file'] = file
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 # Safer, return empty dictionary instead of an error
                 if not package_name or not rp_slot:
@@ -4687,7 +4758,7 @@ class ShowVersionRp(ShowVersionRpSchema):
                 ret_dict['rp'][rp]['slot'][rp_slot]['package'][package_name]['built_by'] = group['built_by']
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 # Safer, return empty dictionary instead of an error
                 if not package_name or not rp_slot:
@@ -4730,76 +4801,80 @@ class ShowPlatformPower(ShowPlatformPowerSchema):
     """Parser for show platform power"""
     cli_command = 'show platform power'
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        ret_dict = {}
-
+    patterns = Patterns(
         # Chassis type: ASR1006-X
-        p1 = re.compile(r'^\s*Chassis +type\: +(?P<chassis>[\w\-]+)')
+        p1=r'^\s*Chassis +type\: +(?P<chassis>[\w\-]+)',
 
         # Power Redundancy Mode: nplus1
-        p2 = re.compile(r'^\s*Power +Redundancy +Mode\: +(?P<redundancy_mode>[\w]+)')
+        p2=r'^\s*Power +Redundancy +Mode\: +(?P<redundancy_mode>[\w]+)',
 
         # Power Allocation Status: Sufficient
-        p3 = re.compile(r'^\s*Power +Allocation +Status\: +(?P<allocation_status>[\w]+)')
+        p3=r'^\s*Power +Allocation +Status\: +(?P<allocation_status>[\w]+)',
 
         # Slot      Type                State                 Allocation(W)
         # 0         ASR1000-SIP40       ok                    64
         #  0/0      SPA-8X1GE-V2        inserted              14
         #  0/1      SPA-1X10GE-L-V2     inserted              17.40
-        p4 = re.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w-]+) '
-                        '+(?P<state>\w+(?:\, \w+)?) +(?P<allocation>[\d.]+)$')
+        p4=r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w-]+) '
+            '+(?P<state>\w+(?:\, \w+)?) +(?P<allocation>[\d.]+)$',
 
         # Slot      Type                State                 Capacity (W) Load (W)
         # P0        ASR1000X-AC-1100W   ok                    1100         132
-        p5 = re.compile(r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w\-]+) '
-                        '+(?P<state>\w+(?:\, \w+)?) +(?P<capacity>[\d.]+) +(?P<load>[\d.]+)')
+        p5=r'^\s*(?P<slot>[\w\/]+) +(?P<type>[\w\-]+) '
+            '+(?P<state>\w+(?:\, \w+)?) +(?P<capacity>[\d.]+) +(?P<load>[\d.]+)',
 
         # Total load: 696 W, total capacity: 4400 W. Load / Capacity is 15%
-        p6 = re.compile(r'^\s*Total +load\: +(?P<total_load>\d+) +W\, +total +capacity\: +(?P<total_capacity>\d+) +W\.'
-                        ' +Load +\/ +Capacity +is +(?P<load_capacity_percent>\d+)\%$')
+        p6=r'^\s*Total +load\: +(?P<total_load>\d+) +W\, +total +capacity\: +(?P<total_capacity>\d+) +W\.'
+            ' +Load +\/ +Capacity +is +(?P<load_capacity_percent>\d+)\%$',
 
         # Power capacity:       4400 W
-        p7 = re.compile(r'^\s*Power +capacity\: +(?P<power_capacity>\d+) +W$')
+        p7=r'^\s*Power +capacity\: +(?P<power_capacity>\d+) +W$',
 
         # Redundant allocation: 0 W
-        p8 = re.compile(r'^\s*Redundant +allocation\: +(?P<redundant_alc>\d+) +W$')
+        p8=r'^\s*Redundant +allocation\: +(?P<redundant_alc>\d+) +W$',
 
         # Fan allocation:       250 W
-        p9 = re.compile(r'^\s*Fan +allocation\: +(?P<fan_alc>\d+) +W$')
+        p9=r'^\s*Fan +allocation\: +(?P<fan_alc>\d+) +W$',
 
         # FRU allocation:       949 W
-        p10 = re.compile(r'^\s*FRU +allocation\: +(?P<fru_alc>\d+) +W$')
+        p10=r'^\s*FRU +allocation\: +(?P<fru_alc>\d+) +W$',
 
         # Excess Power in Reserve:   3201 W
-        p11 = re.compile(r'^\s*Excess +Power +in +Reserve\: +(?P<excess_power>\d+) +W$')
+        p11=r'^\s*Excess +Power +in +Reserve\: +(?P<excess_power>\d+) +W$',
 
         # Excess / (Capacity - Redundant) is 72%
-        p12 = re.compile(r'^\s*Excess +\/ +\(Capacity - Redundant\) +is +(?P<excess_capacity_percent>\d+)\%$')
+        p12=r'^\s*Excess +\/ +\(Capacity - Redundant\) +is +(?P<excess_capacity_percent>\d+)\%$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        ret_dict = {}
+
+        p = ShowPlatformPower.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict['chassis'] = m.groupdict()['chassis']
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['redundancy_mode'] = m.groupdict()['redundancy_mode']
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict['allocation_status'] = m.groupdict()['allocation_status']
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 slot = m.groupdict()['slot']
                 t = m.groupdict()['type']
@@ -4811,7 +4886,7 @@ class ShowPlatformPower(ShowPlatformPowerSchema):
                 slot_dict.update({"allocation": allocation})
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 slot = m.groupdict()['slot']
                 t = m.groupdict()['type']
@@ -4825,39 +4900,39 @@ class ShowPlatformPower(ShowPlatformPowerSchema):
                 slot_dict.update({"load": load})
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ret_dict['total_load'] = int(m.groupdict()['total_load'])
                 ret_dict['total_capacity'] = int(m.groupdict()['total_capacity'])
                 ret_dict['load_capacity_percent'] = int(m.groupdict()['load_capacity_percent'])
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 ret_dict['power_capacity'] = int(m.groupdict()['power_capacity'])
                 continue
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 ret_dict['redundant_alc'] = int(m.groupdict()['redundant_alc'])
                 continue
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 ret_dict['fan_alc'] = int(m.groupdict()['fan_alc'])
                 continue
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 ret_dict['fru_alc'] = int(m.groupdict()['fru_alc'])
                 continue
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 ret_dict['excess_power'] = int(m.groupdict()['excess_power'])
                 continue
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 ret_dict['excess_capacity_percent'] = int(m.groupdict()['excess_capacity_percent'])
                 continue
@@ -4896,26 +4971,30 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
     cli_command = 'show processes cpu history'
     exclude = ['maximum', 'average']
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
+    patterns = Patterns(
         #           888886666611111                    11111
         # 7777755555996510966664444466666333335555544444666667777777777
-        p1 = re.compile(r'^ *\d+( +\d+)* *$')
+        p1=r'^ *\d+( +\d+)* *$',
 
         #          0    5    0    5    0    5    0    5    0    5    0
-        p2 = re.compile(r'^ *0( +5 +0){5,6} *$')
+        p2=r'^ *0( +5 +0){5,6} *$',
 
         # 80     * **#*#**   * *       *
         # 70  *  * **#*#**   * *       *           *
-        p3 = re.compile(r'^ *(?P<num>[\d]+)(?P<line>.*#.*$)')
+        p3=r'^ *(?P<num>[\d]+)(?P<line>.*#.*$)',
 
         # CPU% per second (last 60 seconds)
-        p4 = re.compile(r'^ *CPU%.*$')
+        p4=r'^ *CPU%.*$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        p = ShowProcessesCpuHistory.patterns
 
         # initialize max list & average list & return dictionary
         max_list = []
@@ -4924,13 +5003,13 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
 
         for line in out.splitlines():
             strip_line = line[6:]
-            m = p1.match(strip_line)
+            m = p.p1.match(strip_line)
             if m:
                 max_list.append(strip_line)
                 continue
 
-            m1 = p3.match(line)
-            m2 = p4.match(line)
+            m1 = p.p3.match(line)
+            m2 = p.p4.match(line)
             if m1 or m2:
                 average_list.append(line)
                 continue
@@ -4939,7 +5018,7 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
         tmp = [''] * 72
         count = 0
         for line in max_list:
-            m = p2.match(line)
+            m = p.p2.match(line)
             if not m:
                 for i, v in enumerate(line):
                     if v == ' ':
@@ -4967,7 +5046,7 @@ class ShowProcessesCpuHistory(ShowProcessesCpuHistorySchema):
         # parser average value
         count = 0
         for line in average_list:
-            m = p3.match(line)
+            m = p.p3.match(line)
             if count == 0:
                 sub_dict = ret_dict.setdefault('60s', {})
             elif count == 1:
@@ -5038,6 +5117,26 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
         'show processes memory | section {section}'
     ]
 
+    patterns = Patterns(
+        # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
+        p1=r'^Processor +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # reserve P Pool Total:     102404 Used:         88 Free:     102316
+        p2=r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
+        p3=r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # 0   0  678985440  347855496  304892096        428    2134314 *Init*
+        # 1   0    3415536     879912    2565568          0          0 Chunk Manager
+        p4=r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
+           r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
+           r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$',
+    )
+
     def cli(self, include=None, exclude=None, section=None, output=None):
 
         ret_dict = {}
@@ -5056,29 +5155,13 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
         else:
             out = output
 
-        # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-        p1 = re.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # reserve P Pool Total:     102404 Used:         88 Free:     102316
-        p2 = re.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-        p3 = re.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # 0   0  678985440  347855496  304892096        428    2134314 *Init*
-        # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-        p4 = re.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
-                        r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
-                        r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
+        p = ShowProcessesMemory.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('processor_pool', {})
@@ -5086,7 +5169,7 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
                 continue
 
             # reserve P Pool Total:     102404 Used:         88 Free:     102316
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('reserve_p_pool', {})
@@ -5094,7 +5177,7 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
                 continue
 
             # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('lsmi_io_pool', {})
@@ -5103,7 +5186,7 @@ class ShowProcessesMemory(ShowProcessesMemorySchema):
 
             # 0   0  678985440  347855496  304892096        428    2134314 *Init*
             # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 pid = int(group['pid'])
@@ -5152,6 +5235,26 @@ class ShowProcessesMemorySortedSchema(MetaParser):
 class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
     cli_command = 'show processes memory sorted'
 
+    patterns = Patterns(
+        # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
+        p1=r'^Processor +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # reserve P Pool Total:     102404 Used:         88 Free:     102316
+        p2=r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
+        p3=r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
+           r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$',
+
+        # 0   0  678985440  347855496  304892096        428    2134314 *Init*
+        # 1   0    3415536     879912    2565568          0          0 Chunk Manager
+        p4=r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
+           r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
+           r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$',
+    )
+
     def cli(self, include=None, sorted=None, output=None):
 
         ret_dict = {}
@@ -5165,28 +5268,12 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
         if out:
             per_process_memory_dict = ret_dict.setdefault('per_process_memory', OrderedDict())
 
-        # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-        p1 = re.compile(r'^Processor +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # reserve P Pool Total:     102404 Used:         88 Free:     102316
-        p2 = re.compile(r'^reserve +P +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-        p3 = re.compile(r'^lsmpi_io +Pool +Total: +(?P<total>\d+) +'
-                        r'Used: +(?P<used>\d+) +Free: +(?P<free>\d+)$')
-
-        # 0   0  678985440  347855496  304892096        428    2134314 *Init*
-        # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-        p4 = re.compile(r'^(?P<pid>\d+) +(?P<tty>\d+) +(?P<allocated>\d+) +'
-                        r'(?P<freed>\d+) +(?P<holding>\d+) +(?P<getbufs>\d+) +'
-                        r'(?P<retbufs>\d+) +(?P<process>[\S ]+)$')
+        p = ShowProcessesMemorySorted.patterns
 
         for line in out.splitlines():
             line = line.strip()
             # Processor Pool Total: 10147887840 Used:  485435960 Free: 9662451880
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('processor_pool', {})
@@ -5194,7 +5281,7 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
                 continue
 
             # reserve P Pool Total:     102404 Used:         88 Free:     102316
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('reserve_p_pool', {})
@@ -5202,7 +5289,7 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
                 continue
 
             # lsmpi_io Pool Total:    6295128 Used:    6294296 Free:        832
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 processor_pool_dict = ret_dict.setdefault('lsmi_io_pool', {})
@@ -5211,7 +5298,7 @@ class ShowProcessesMemorySorted(ShowProcessesMemorySortedSchema):
 
             # 0   0  678985440  347855496  304892096        428    2134314 *Init*
             # 1   0    3415536     879912    2565568          0          0 Chunk Manager
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 process_name = str(group['process'])
@@ -5256,54 +5343,69 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
         'show platform integrity {signature}'
     ]
 
-    def cli(self, signature=None, nonce=None, output=None):
-        if not output:
-            if nonce:
-                output = self.device.execute(self.cli_command[1].format(nonce=nonce))
-            elif signature:
-                output = self.device.execute(self.cli_command[2].format(signature=signature))
-            else:
-                output = self.device.execute(self.cli_command[0])
-
-        ret_dict = {}
-
+    patterns = Patterns(
         # Platform: C9300-24U
-        p1 = re.compile(r'^Platform: +(?P<platform>\S+)$')
+        p1=r'^Platform: +(?P<platform>\S+)$',
+
         # Boot 0 Version: F01144R16.216e68ad62019-02-13
-        p2 = re.compile(r'^Boot +(?P<boot>\d+) +Version: +(?P<version>\S+)$')
+        p2=r'^Boot +(?P<boot>\d+) +Version: +(?P<version>\S+)$',
+
         # Boot 0 Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-        p3 = re.compile(r'^Boot +(?P<boot>\d+) +Hash: +(?P<hash>\S+)$')
+        p3=r'^Boot +(?P<boot>\d+) +Hash: +(?P<hash>\S+)$',
+
         # Boot Loader Version: System Bootstrap, Version 16.10.1r[FC2], DEVELOPMENT SOFTWARE
-        p4 = re.compile(r'^Boot +Loader +Version: +(?P<boot_loader_version>[\S ]+)$')
+        p4=r'^Boot +Loader +Version: +(?P<boot_loader_version>[\S ]+)$',
+
         # Boot Loader Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-        p5 = re.compile(r'^Boot +Loader +Hash: *(?P<hash>\S+)$')
+        p5=r'^Boot +Loader +Hash: *(?P<hash>\S+)$',
+
         # 51CE6FB9AE606330810EBFFE99D71D56640FD48F780EDE0C19FB5A75E31EF2192A58A196D18B244ADF67D18BF6B3AA6A16229C66DCC03D8A900753760B252C57
-        p6 = re.compile(r'^(?P<hash>\S+)$')
+        p6=r'^(?P<hash>\S+)$',
+
         # OS Version: 2019-07-11_16.25_mzafar
-        p7 = re.compile(r'^OS +Version: +(?P<os_version>\S+)$')
+        p7=r'^OS +Version: +(?P<os_version>\S+)$',
+
         # OS Hashes:
-        p8 = re.compile(r'^OS +Hashes:$')
+        p8=r'^OS +Hashes:$',
+
         # PCR0: BB33E3FE338B82635B1BD3F1401CF442ACC9BB12A405A424FBE0A5776569884E
-        p9 = re.compile(r'^(?P<hash_key>\S+): +(?P<hash_val>\S+)$')
+        p9=r'^(?P<hash_key>\S+): +(?P<hash_val>\S+)$',
+
         # cat9k_iosxe.2019-07-11_16.25_mzafar.SSA.bin:
-        p10 = re.compile(r'^(?P<os_hash>\S+):$')
+        p10=r'^(?P<os_hash>\S+):$',
+
         # Signature version: 1
-        p11 = re.compile(r'^Signature version: +(?P<signature_version>\S+)$')
+        p11=r'^Signature version: +(?P<signature_version>\S+)$',
+
         # Signature:
-        p12 = re.compile(r'^Signature:$')
+        p12=r'^Signature:$',
+    )
+
+    def cli(self, signature=None, nonce=None, output=None):
+        if not output:
+            if nonce:
+                output = self.device.execute(self.cli_command[1].format(nonce=nonce))
+            elif signature:
+                output = self.device.execute(self.cli_command[2].format(signature=signature))
+            else:
+                output = self.device.execute(self.cli_command[0])
+
+        ret_dict = {}
+
+        p = ShowPlatformIntegrity.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # Platform: C9300-24U
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.update({'platform': group['platform']})
                 continue
 
             # Boot 0 Version: F01144R16.216e68ad62019-02-13
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 boot = int(group['boot'])
@@ -5314,7 +5416,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # Boot 0 Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 boot = int(group['boot'])
@@ -5325,7 +5427,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # Boot Loader Version: System Bootstrap, Version 16.10.1r[FC2], DEVELOPMENT SOFTWARE
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 boot_loader_dict = ret_dict.setdefault('boot', {}). \
@@ -5335,7 +5437,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # Boot Loader Hash: 523DD459C650AF0F5AB5396060605E412C1BE99AF51F4FA88AD26049612921FF
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 hash_val = group['hash']
@@ -5348,7 +5450,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # OS Version: 2019-07-11_16.25_mzafar
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 os_version = group['os_version']
@@ -5356,19 +5458,19 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # OS Hashes:
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 hash_type = 'os_hashes'
                 continue
 
             # Signature:
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 hash_type = 'signature'
                 continue
 
             # PCR0: BB33E3FE338B82635B1BD3F1401CF442ACC9BB12A405A424FBE0A5776569884E
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 hash_type = 'os_hashes'
@@ -5380,7 +5482,7 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # cat9k_iosxe.2019-07-11_16.25_mzafar.SSA.bin:
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 hash_type = 'os_hashes'
                 group = m.groupdict()
@@ -5390,14 +5492,14 @@ class ShowPlatformIntegrity(ShowPlatformIntegritySchema):
                 continue
 
             # Signature version: 1
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict.update({'signature_version': int(group['signature_version'])})
                 continue
 
             # 51CE6FB9AE606330810EBFFE99D71D56640FD48F780EDE0C19FB5A75E31EF2192A58A196D18B244ADF67D18BF6B3AA6A16229C66DCC03D8A900753760B252C57
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 hash_val = group['hash']
@@ -5507,6 +5609,20 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
                    'show platform hardware fed active fwd-asic resource tcam utilization',
                    'show platform hardware fed switch {mode} fwd-asic resource tcam utilization']
 
+    patterns = Patterns(
+        # initial regexp pattern
+        # CAM Utilization for ASIC  [0]
+        p1=r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$',
+
+        #CTS Cell Matrix/VPN
+        #Label                  EM           O       16384        0    0.00%        0        0        0        0
+        #CTS Cell Matrix/VPN
+        #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
+        # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
+        # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
+        p2=r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$',
+    )
+
     def cli(self, output=None, switch='', mode=None):
         if output is None:
             if switch and mode:
@@ -5520,24 +5636,13 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
         # initial return dictionary
         ret_dict = {}
 
-        # initial regexp pattern
-        # CAM Utilization for ASIC  [0]
-        p1 = re.compile(r'CAM +Utilization +for +ASIC  +\[+(?P<asic>(\d+))\]$')
-
-        #CTS Cell Matrix/VPN
-        #Label                  EM           O       16384        0    0.00%        0        0        0        0
-        #CTS Cell Matrix/VPN
-        #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
-        # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
-        # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
-        p2 = re.compile(r'(?P<table>.*(\S+)) +(?P<subtype>\S+) +(?P<dir>\S+) +(?P<max>\d+) +(?P<used>\d+) +(?P<used_percent>\S+\%) +(?P<v4>\d+) +(?P<v6>\d+) +(?P<mpls>\d+) +(?P<other>\d+)$')
-
+        p = ShowPlatformTcamUtilization.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # CAM Utilization for ASIC  [0]
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 asic = group['asic']
@@ -5550,7 +5655,7 @@ class ShowPlatformTcamUtilization(ShowPlatformTcamUtilizationSchema):
             #Label                  TCAM         O        1024        1    0.10%        0        0        0        1
             # Mac Address Table      EM           I       16384       44    0.27%        0        0        0       44
             # Mac Address Table      TCAM         I        1024       21    2.05%        0        0        0       21
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 table_ = group.pop('table')
@@ -5727,37 +5832,40 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
     cli_command = ['show platform resources']
 
 
-    def cli(self, output=None):
-
-        # if the user does not provide output to the parser
-        # we need to get it from the device
-        if not output:
-            output = self.device.execute(self.cli_command[0])
-
-
+    patterns = Patterns(
         #RP0 (ok, active)                                                                               H
         #RP1 (ok, standby)                                                                               H
         #ESP0(ok, active)                                                                               H
         #ESP1(ok, standby)                                                                               H
-        p1 = re.compile(r'^(?P<type>RP|ESP)(?P<key>[0-9]) ?\((?P<status>\S+)\, +(?P<role>\S+)\) +(?P<state>\S)$')
+        p1=r'^(?P<type>RP|ESP)(?P<key>[0-9]) ?\((?P<status>\S+)\, +(?P<role>\S+)\) +(?P<state>\S)$',
 
         #SIP0                                                                                           H
-        p2 = re.compile(r'^SIP(?P<key>[0-9]) +(?P<state>\S)$')
+        p2=r'^SIP(?P<key>[0-9]) +(?P<state>\S)$',
 
         # Control Processor       0.51%                 100%            80%             90%             H
-        p3 = re.compile(r'^Control Processor +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p3=r'^Control Processor +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$',
 
         #QFP                                                                                           H
-        p4 = re.compile(r'^QFP +(?P<state>\S)$')
+        p4=r'^QFP +(?P<state>\S)$',
 
         #CPU Utilization        0.00%                 100%            90%             95%             H
-        p5 = re.compile(r'^(?P<resource>[\S\s]+\S) +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p5=r'^(?P<resource>[\S\s]+\S) +(?P<usage>(\d*\.?\d+))\S+ +(?P<max>\d+)\S+ +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$',
 
         # TCAM                   16cells(0%)           1048576cells    65%             85%             H
         # DRAM                   238906KB(5%)          4194304KB       85%             95%             H
         # IRAM                   13014KB(9%)           131072KB        85%             95%             H
-        p6 = re.compile(r'^(?P<resource>[\s\S]+\S) +(?P<use_val>(\d*\.?\d+))(?P<type>\S+)\((?P<val>\d+)\%\) +(?P<max>\d+)(?P<max_type>\S+) +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$')
+        p6=r'^(?P<resource>[\s\S]+\S) +(?P<use_val>(\d*\.?\d+))(?P<type>\S+)\((?P<val>\d+)\%\) +(?P<max>\d+)(?P<max_type>\S+) +(?P<warning>\d+)\S+ +(?P<critical>\d+)\S+ +(?P<state>\S)$',
+    )
 
+    def cli(self, output=None):
+
+        # if the user does not provide output to the parser
+        # we need to get it from the device
+        if not output:
+            output = self.device.execute(self.cli_command[0])
+
+
+        p = ShowPlatformResources.patterns
 
         ret_dict = {}
         feature_dict = ret_dict
@@ -5766,7 +5874,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
 
             #RP1 (ok, standby)                                                                               H
             #ESP0 (ok, active)                                                                               H
-            m = p1.match(line)
+            m = p.p1.match(line)
 
             if m:
                 groups = m.groupdict()
@@ -5781,7 +5889,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
                 continue
 
             #SIP0                                                                                           H
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = ret_dict.setdefault('sip', {}).setdefault(groups['key'], {})
@@ -5790,7 +5898,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
                 continue
 
             # Control Processor       0.51%                 100%            80%             90%             H
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = feature_dict.setdefault('control_processer', {})
@@ -5803,7 +5911,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
                 continue
 
             #QFP                                                                                           H
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = last_dict_ptr1
@@ -5813,7 +5921,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
                 continue
 
             #CPU Utilization        0.00%                 100%            90%             95%             H
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = last_dict_ptr
@@ -5830,7 +5938,7 @@ class ShowPlatformResources(ShowPlatformResourcesSchema):
             #TCAM                   16cells(0%)           1048576cells    65%             85%             H
             # DRAM                   238906KB(5%)          4194304KB       85%             95%             H
             # IRAM                   13014KB(9%)           131072KB        85%             95%             H
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 groups = m.groupdict()
                 feature_dict = last_dict_ptr
@@ -5862,6 +5970,26 @@ class ShowPlatformSudiCertificateNonce(ShowPlatformSudiCertificateNonceSchema):
 
     cli_command = ['show platform sudi certificate sign nonce {signature}','show platform sudi certificate']
 
+    patterns = Patterns(
+        # -----BEGIN CERTIFICATE-----
+        p1='^\-+BEGIN CERTIFICATE\-+$',
+
+        # -----END CERTIFICATE-----
+        p2='^\-+END CERTIFICATE\-+$',
+
+        # Signature version: 1
+        p3='^Signature version:\s+(?P<signature>\d+)$',
+
+        # Signature:
+        p4='^Signature:$',
+
+        # A59DA741EA66C2AFC006E1766B3B11493A79E67408388C40160C2729F88281E9
+        p5='^(?P<signatur>[A-Z\d]+)$',
+
+        # o4IBBDCCAQAwDgYDVR0PAQH/BAQDAgXgMAwGA1UdEwEB/wQCMAAwHwYDVR0jBBgw
+        p6='([a-zA-Z0-9/+=]+)',
+    )
+
     def cli(self,signature='', output=None):
         if output is None:
             # Build the command
@@ -5875,36 +6003,20 @@ class ShowPlatformSudiCertificateNonce(ShowPlatformSudiCertificateNonceSchema):
         sig_check =False
         ret_dict = {}
 
-        # -----BEGIN CERTIFICATE-----
-        p1=re.compile('^\-+BEGIN CERTIFICATE\-+$')
-
-        # -----END CERTIFICATE-----
-        p2=re.compile('^\-+END CERTIFICATE\-+$')
-
-        # Signature version: 1
-        p3=re.compile('^Signature version:\s+(?P<signature>\d+)$')
-
-        # Signature:
-        p4=re.compile('^Signature:$')
-
-        # A59DA741EA66C2AFC006E1766B3B11493A79E67408388C40160C2729F88281E9
-        p5=re.compile('^(?P<signatur>[A-Z\d]+)$')
-
-        # o4IBBDCCAQAwDgYDVR0PAQH/BAQDAgXgMAwGA1UdEwEB/wQCMAAwHwYDVR0jBBgw
-        p6 =re.compile('([a-zA-Z0-9/+=]+)')
+        p = ShowPlatformSudiCertificateNonce.patterns
 
         for line in output.splitlines():
             line=line.strip()
 
             # -----BEGIN CERTIFICATE-----
-            m=p1.match(line)
+            m=p.p1.match(line)
             if m:
                 begin_certf=True
                 certificate_num = certificate_num + 1
                 continue
 
             # -----END CERTIFICATE-----
-            m=p2.match(line)
+            m=p.p2.match(line)
             if m:
                 root_dict=ret_dict.setdefault('certificates',{})
                 #certificate_list.append(certficate)
@@ -5913,27 +6025,27 @@ class ShowPlatformSudiCertificateNonce(ShowPlatformSudiCertificateNonceSchema):
                 continue
 
             # Signature version: 1
-            m=p3.match(line)
+            m=p.p3.match(line)
             if m:
                 group=m.groupdict()
                 ret_dict.setdefault('signature_version',int(group['signature']))
                 continue
 
             # Signature:
-            m=p4.match(line)
+            m=p.p4.match(line)
             if m:
                 sig_check=True
                 continue
 
             # 7E873A87E287B685E823F7BC66CF13D43EC238D40DA7CBEA06F6926C04C8C5AFC21BA4C
-            m=p5.match(line)
+            m=p.p5.match(line)
             if m and sig_check:
                 group=m.groupdict()
                 ret_dict.setdefault('signature', group['signatur'])
                 continue
 
             # o4IBBDCCAQAwDgYDVR0PAQH/BAQDAgXgMAwGA1UdEwEB/wQCMAAwHwYDVR0jBBgw
-            m=p6.match(line)
+            m=p.p6.match(line)
             if m:
                 certficate = certficate + m.group()
                 continue
@@ -5995,43 +6107,47 @@ class ShowEnvironmentStatus(ShowEnvironmentStatusSchema):
 
     cli_command = 'show environment status'
 
-    def cli(self,output=None):
-        if output is None:
-            # excute command to get output
-            output = self.device.execute(self.cli_command)
-
-        # initial variables
-        ret_dict  = switch_id_dict = {}
-
+    patterns = Patterns(
         # Switch:1
-        p1 = re.compile(r'^Switch:(?P<switch>\S+)$')
+        p1=r'^Switch:(?P<switch>\S+)$',
 
         # PS1     C9K-PWR-1500WAC-R     ac    n.a.      standby    good  good
         # PS0     C9K-PWR-650WAC-R      AC    650 W     ok         good  N/A
-        p2 = re.compile(r'^(?P<power_supply>\S+) +'
-                        r'(?P<model_num>\S+) +'
-                        r'(?P<type>\S+) +'
-                        r'(?P<capacity>\S+) +W?\s*'
-                        r'(?P<status>\S+) +'
-                        r'(?P<fan_state0>\S+) +'
-                        r'(?P<fan_state1>\S+)$')
+        p2=r'^(?P<power_supply>\S+) +'
+           r'(?P<model_num>\S+) +'
+           r'(?P<type>\S+) +'
+           r'(?P<capacity>\S+) +W?\s*'
+           r'(?P<status>\S+) +'
+           r'(?P<fan_state0>\S+) +'
+           r'(?P<fan_state1>\S+)$',
 
         # FM6     active      good  good
-        p3= re.compile('^(?P<fan_tray>\w+\d+)\s+(?P<status>\w+)\s+(?P<fan_state0>\w+)\s+(?P<fan_state1>\w+)$')
+        p3='^(?P<fan_tray>\w+\d+)\s+(?P<status>\w+)\s+(?P<fan_state0>\w+)\s+(?P<fan_state1>\w+)$',
 
         # FM0     ok          good  good  good  good
-        p4= re.compile(r'^(?P<fan_tray>\w+\d+) +'
-                        r'(?P<status>\w+) +'
-                        r'(?P<fan_state0>\S+) +'
-                        r'(?P<fan_state1>\S+) +'
-                        r'(?P<fan_state2>\S+) +'
-                        r'(?P<fan_state3>\S+)$')
+        p4=r'^(?P<fan_tray>\w+\d+) +'
+           r'(?P<status>\w+) +'
+           r'(?P<fan_state0>\S+) +'
+           r'(?P<fan_state1>\S+) +'
+           r'(?P<fan_state2>\S+) +'
+           r'(?P<fan_state3>\S+)$',
+    )
+
+    def cli(self,output=None):
+        if output is None:
+            # excute command to get output
+            output = self.device.execute(self.cli_command)
+
+        # initial variables
+        ret_dict  = switch_id_dict = {}
+
+        p = ShowEnvironmentStatus.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             #Switch:1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 switch = group['switch']
@@ -6040,7 +6156,7 @@ class ShowEnvironmentStatus(ShowEnvironmentStatusSchema):
                 continue
 
             # PS1     C9K-PWR-1500WAC-R     ac    n.a.      standby    good  good
-            m=p2.match(line)
+            m=p.p2.match(line)
             if m:
                 group= m.groupdict()
                 root_dict=switch_id_dict.setdefault('power_supply',{}).setdefault(group['power_supply'],{})
@@ -6054,7 +6170,7 @@ class ShowEnvironmentStatus(ShowEnvironmentStatusSchema):
                 continue
 
             # FM6     active      good  good
-            m=p3.match(line)
+            m=p.p3.match(line)
             if m:
                 group=m.groupdict()
                 root_dict = switch_id_dict.setdefault('fan_tray', {}).setdefault(group['fan_tray'],{})
@@ -6065,7 +6181,7 @@ class ShowEnvironmentStatus(ShowEnvironmentStatusSchema):
                 continue
 
             # FM0     ok          good  good  good  good
-            m=p4.match(line)
+            m=p.p4.match(line)
             if m:
                 group=m.groupdict()
                 root_dict = switch_id_dict.setdefault('fan_tray', {}).setdefault(group['fan_tray'],{})
@@ -6103,6 +6219,10 @@ class ShowPlatformSudiPki(ShowPlatformSudiPkiSchema):
 
     cli_command = 'show platform sudi pki'
 
+    patterns = Patterns(
+        p1='((Cisco.+|\'Cisco.+:)\s+(?P<Valid>(((Enabled\s\(.*\))|Enabled)|((Disabled\s\(.*\))|Disabled)|Valid|Not Supported|Invalid|Init Failure)))',
+    )
+
     def cli(self, output=None):
         if output is None:
             output = self.device.execute(self.cli_command)
@@ -6116,7 +6236,7 @@ class ShowPlatformSudiPki(ShowPlatformSudiPkiSchema):
 
         ret_dict = {}
 
-        p1=re.compile('((Cisco.+|\'Cisco.+:)\s+(?P<Valid>(((Enabled\s\(.*\))|Enabled)|((Disabled\s\(.*\))|Disabled)|Valid|Not Supported|Invalid|Init Failure)))')
+        p = ShowPlatformSudiPki.patterns
 
         for line in output.splitlines():
             line1=[]
@@ -6126,7 +6246,7 @@ class ShowPlatformSudiPki(ShowPlatformSudiPkiSchema):
             else:
                 line1 = line.split('  ')
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict[line1[0]] = group['Valid']
@@ -6169,6 +6289,23 @@ class ShowPlatformTcamPbr(ShowPlatformTcamPbrSchema):
                    'show platform hardware fed active fwd-asic resource tcam table pbr record 0 format 0 | begin {nat_region}',
                    'show platform hardware fed switch {switch_type} fwd-asic resource tcam table pbr record 0 format 0 | begin {nat_region}']
 
+    patterns = Patterns(
+        # Printing entries for region NAT_1 (387) type 6 asic 0
+        p00=r'^Printing entries for region\s(?P<nat_r>\w+)\s\(\d+\)\stype\s\d+\sasic\s\d$',
+
+        #TAQ-1 Index-352 (A:0,C:0) Valid StartF-1 StartA-1 SkipF-0 SkipA-0
+        p0=r'^TAQ-\d+\sIndex-(?P<index>\d+)\s\([A-Z]\:\d,[A-Z]\:\d\)\sValid\sStart[A-Z]-\d\sStart[A-Z]-\d\sSkip[A-Z]-\d\sSkip[A-Z]-\d$',
+
+        # Mask1 00ffff00:00000000:00000000:00000000:00000000:00000000:00000000:00000000
+        p1=r'^Mask(?P<mask_name>\d+) +(?P<mask_id>\S+)$',
+
+        # Key1  00800400:00000000:00000000:00000000:00000000:00000000:00000000:00000000
+        p2=r'^Key(?P<key_name>\d+) +(?P<key_id>\S+)$',
+
+        # AD 10082000:00000001
+        p3=r'^AD +(?P<ad>[\da-f:]+)$',
+    )
+
     def cli(self, nat_region, switch="", switch_type="", output=None):
 
         if output is None:
@@ -6185,26 +6322,13 @@ class ShowPlatformTcamPbr(ShowPlatformTcamPbrSchema):
         # initial variables
         ret_dict = {}
 
-        # Printing entries for region NAT_1 (387) type 6 asic 0
-        p00 = re.compile(r'^Printing entries for region\s(?P<nat_r>\w+)\s\(\d+\)\stype\s\d+\sasic\s\d$')
-
-        #TAQ-1 Index-352 (A:0,C:0) Valid StartF-1 StartA-1 SkipF-0 SkipA-0
-        p0 = re.compile(r'^TAQ-\d+\sIndex-(?P<index>\d+)\s\([A-Z]\:\d,[A-Z]\:\d\)\sValid\sStart[A-Z]-\d\sStart[A-Z]-\d\sSkip[A-Z]-\d\sSkip[A-Z]-\d$')
-
-        # Mask1 00ffff00:00000000:00000000:00000000:00000000:00000000:00000000:00000000
-        p1 = re.compile(r'^Mask(?P<mask_name>\d+) +(?P<mask_id>\S+)$')
-
-        # Key1  00800400:00000000:00000000:00000000:00000000:00000000:00000000:00000000
-        p2 = re.compile(r'^Key(?P<key_name>\d+) +(?P<key_id>\S+)$')
-
-        # AD 10082000:00000001
-        p3 = re.compile(r'^AD +(?P<ad>[\da-f:]+)$')
+        p = ShowPlatformTcamPbr.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # Printing entries for region NAT_1 (387) type 6 asic 0
-            m = p00.match(line)
+            m = p.p00.match(line)
             if m:
                 group = m.groupdict()
                 nat_r = group['nat_r']
@@ -6212,7 +6336,7 @@ class ShowPlatformTcamPbr(ShowPlatformTcamPbrSchema):
                 continue
 
             #TAQ-1 Index-352 (A:0,C:0) Valid StartF-1 StartA-1 SkipF-0 SkipA-0
-            m = p0.match(line)
+            m = p.p0.match(line)
             if m:
                 group = m.groupdict()
                 index = group['index']
@@ -6221,21 +6345,21 @@ class ShowPlatformTcamPbr(ShowPlatformTcamPbrSchema):
                 key_dict = index_dict.setdefault('key',{})
 
             # Mask1 3300f000:0f030000:00000000:00000000:00000000:00000000:00000000:ffffffff
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 mask_name = group['mask_name']
                 mask_dict[mask_name] = group['mask_id']
 
             # Key1  11009000:01020000:00000000:00000000:00000000:00000000:00000000:c0000002
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 key_name = group['key_name']
                 key_dict[key_name] = group['key_id']
 
             # AD 10087000:000000b6:00000000
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 index_dict['ad'] = group['ad']
@@ -6268,77 +6392,81 @@ class ShowPlatformNatTranslationsStatistics(ShowPlatformNatTranslationsStatistic
 
     cli_command = 'show platform nat translations active statistics'
 
-    def cli(self, output=None):
-
-        if output is None:
-
-           output = self.device.execute(self.cli_command)
-
-        # initial variables
-        ret_dict = {}
-
+    patterns = Patterns(
         # NAT Type                : Static
-        p0 = re.compile(r'^NAT Type +: +(?P<nat_type>-+|Static|Dynamic)$')
+        p0=r'^NAT Type +: +(?P<nat_type>-+|Static|Dynamic)$',
 
         # Netflow Type            : NA
-        p1 = re.compile(r'^Netflow Type +: +(?P<netflow_type>\S+)$')
+        p1=r'^Netflow Type +: +(?P<netflow_type>\S+)$',
 
         # Flow Record             : Disabled
-        p2 = re.compile(r'^Flow Record  +: +(?P<flow_record>-+|Disabled|Enabled)$')
+        p2=r'^Flow Record  +: +(?P<flow_record>-+|Disabled|Enabled)$',
 
         # Dynamic NAT entries     : 0 entries
-        p3 = re.compile(r'^Dynamic NAT entries  +: +(?P<dynamic_nat_entries>\d+ entries)$')
+        p3=r'^Dynamic NAT entries  +: +(?P<dynamic_nat_entries>\d+ entries)$',
 
         # Static NAT entries      : 0 entries
-        p4 = re.compile(r'^Static NAT entries +: +(?P<static_nat_entries>\d+ entries)$')
+        p4=r'^Static NAT entries +: +(?P<static_nat_entries>\d+ entries)$',
 
         # Total NAT entries       : 0 entries
-        p5 = re.compile(r'^Total NAT entries +: +(?P<total_nat_entries>\d+ entries)$')
+        p5=r'^Total NAT entries +: +(?P<total_nat_entries>\d+ entries)$',
 
         # Total HW Resource (TCAM): 26 of 27648 /0 .09% utilization
-        p6 = re.compile(r'^Total HW Resource \(TCAM\)+: +(?P<total_hw_resource_tcam>\d+ of \d+ /\d+ \.\d+% utilization)$')
+        p6=r'^Total HW Resource \(TCAM\)+: +(?P<total_hw_resource_tcam>\d+ of \d+ /\d+ \.\d+% utilization)$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+
+           output = self.device.execute(self.cli_command)
+
+        # initial variables
+        ret_dict = {}
+
+        p = ShowPlatformNatTranslationsStatistics.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # NAT Type                : Static
-            m = p0.match(line)
+            m = p.p0.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict["nat_type"] = group["nat_type"]
 
             # Netflow Type            : NA
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict["netflow_type"] = group["netflow_type"]
 
             # Flow Record             : Disabled
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict["flow_record"] = group["flow_record"]
 
             # Dynamic NAT entries     : 0 entries
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict["dynamic_nat_entries"] = group["dynamic_nat_entries"]
 
             # Static NAT entries      : 0 entries
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict["static_nat_entries"] = group["static_nat_entries"]
 
             # Total NAT entries       : 0 entries
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict["total_nat_entries"] = group["total_nat_entries"]
 
             # Total HW Resource (TCAM): 26 of 27648 /0 .09% utilization
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict["total_hw_resource_tcam"] = group["total_hw_resource_tcam"]
@@ -6373,6 +6501,16 @@ class ShowPlatformNatTranslations(ShowPlatformNatTranslationsSchema):
 
     cli_command = 'show platform nat translations active'
 
+    patterns = Patterns(
+        # Pro Inside global Inside local Outside local Outside global
+        # TCP 135.0.0.2:0   192.0.0.2:0  193.0.0.2:0   193.0.0.2:0
+        p1=r'^(?P<protocol>-+|UDP|TCP) +'
+           r'(?P<inside_global>[\d.]+:+\d+) +'
+           r'(?P<inside_local>[\d.]+:+\d+) +'
+           r'(?P<outside_local>[\d.]+:+\d+) +'
+           r'(?P<outside_global>[\d.]+:+\d+)$',
+    )
+
     def cli(self, output=None):
 
         if output is None:
@@ -6383,20 +6521,14 @@ class ShowPlatformNatTranslations(ShowPlatformNatTranslationsSchema):
         index_dict = {}
         index = 1
 
-        # Pro Inside global Inside local Outside local Outside global
-        # TCP 135.0.0.2:0   192.0.0.2:0  193.0.0.2:0   193.0.0.2:0
-        p1 = re.compile(r'^(?P<protocol>-+|UDP|TCP) +'
-                        r'(?P<inside_global>[\d.]+:+\d+) +'
-                        r'(?P<inside_local>[\d.]+:+\d+) +'
-                        r'(?P<outside_local>[\d.]+:+\d+) +'
-                        r'(?P<outside_global>[\d.]+:+\d+)$')
+        p = ShowPlatformNatTranslations.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # Pro Inside global Inside local Outside local Outside global
             # TCP 135.0.0.2:0   192.0.0.2:0  193.0.0.2:0   193.0.0.2:0
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 index_dict = ret_dict.setdefault('index', {}).setdefault(index,{})
@@ -6451,6 +6583,31 @@ class ShowPlatformTcamAcl(ShowPlatformTcamAclSchema):
 
     cli_command = 'show platform hardware fed switch active fwd-asic resource tcam table acl | begin {INPUT_NAT}'
 
+    patterns = Patterns(
+        # Index-1152
+        p0=r'Index-+(?P<index>\d+)$',
+
+        # Labels vcuResults l3Len l3Pro l3Tos SrcAddr  DstAddr  mtrid vrfid  SH Mvid  l3Err
+        # M:  00000000   0000  00    00  00000000 00000000  00   0000   0000 000   00
+        # V:  00000000   0000  00    00  00000000 00000000  00   0000   0000 000   00
+        p1=r'^(?P<labels>\S+) +'
+           r'(?P<vcu_results>\d+) +'
+           r'(?P<l3len>\d+) +'
+           r'(?P<l3pro>\d+) +'
+           r'(?P<l3tos>\d+) +'
+           r'(?P<srcaddr>\d+) +'
+           r'(?P<dstaddr>\d+) +'
+           r'(?P<mtrid>\d+) +'
+           r'(?P<vrfid>\d+) +'
+           r'(?P<sh>\d+) +'
+           r'(?P<mvid>\d+) +'
+           r'(?P<l3err>\d+)$',
+
+        # natResultRm    natStaticRule     natDynamicRule
+        # 1                1                  0
+        p2=r'^(?P<nat_result_rm>\d+) +(?P<nat_static_rule>\d+) +(?P<nat_dynamic_rule>\d+)$',
+    )
+
     def cli(self, INPUT_NAT, output=None):
 
         cmd = self.cli_command.format(INPUT_NAT=INPUT_NAT)
@@ -6461,34 +6618,13 @@ class ShowPlatformTcamAcl(ShowPlatformTcamAclSchema):
         # initial variables
         ret_dict = {}
 
-        # Index-1152
-        p0 = re.compile(r'Index-+(?P<index>\d+)$')
-
-        # Labels vcuResults l3Len l3Pro l3Tos SrcAddr  DstAddr  mtrid vrfid  SH Mvid  l3Err
-        # M:  00000000   0000  00    00  00000000 00000000  00   0000   0000 000   00
-        # V:  00000000   0000  00    00  00000000 00000000  00   0000   0000 000   00
-        p1 = re.compile(r'^(?P<labels>\S+) +'
-                        r'(?P<vcu_results>\d+) +'
-                        r'(?P<l3len>\d+) +'
-                        r'(?P<l3pro>\d+) +'
-                        r'(?P<l3tos>\d+) +'
-                        r'(?P<srcaddr>\d+) +'
-                        r'(?P<dstaddr>\d+) +'
-                        r'(?P<mtrid>\d+) +'
-                        r'(?P<vrfid>\d+) +'
-                        r'(?P<sh>\d+) +'
-                        r'(?P<mvid>\d+) +'
-                        r'(?P<l3err>\d+)$')
-
-        # natResultRm    natStaticRule     natDynamicRule
-        # 1                1                  0
-        p2 = re.compile(r'^(?P<nat_result_rm>\d+) +(?P<nat_static_rule>\d+) +(?P<nat_dynamic_rule>\d+)$')
+        p = ShowPlatformTcamAcl.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # Index-1152
-            m = p0.match(line)
+            m = p.p0.match(line)
             if m:
                 group = m.groupdict()
                 index = group['index']
@@ -6497,7 +6633,7 @@ class ShowPlatformTcamAcl(ShowPlatformTcamAclSchema):
             # Labels vcuResults l3Len l3Pro l3Tos SrcAddr  DstAddr  mtrid vrfid  SH Mvid  l3Err
             # M:  00000000   0000  00    00  00000000 00000000  00   0000   0000 000   00
             # V:  00000000   0000  00    00  00000000 00000000  00   0000   0000 000   00
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 labels = group['labels']
@@ -6516,7 +6652,7 @@ class ShowPlatformTcamAcl(ShowPlatformTcamAclSchema):
 
             # natResultRm    natStaticRule     natDynamicRule
             # 1                1                  0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 index_dict ['nat_result_rm'] = int(group['nat_result_rm'])
@@ -6550,36 +6686,40 @@ class ShowVersionRunning(ShowVersionRunningSchema):
 
     cli_command = ["show version running"]
 
-    def cli(self, output=None):
-        if output is None:
-            # get output from device
-            output = self.device.execute(self.cli_command[0])
-
-        # initial return dictionary
-        ret_dict = {}
-        index = 0
-
+    patterns = Patterns(
         # initial regexp pattern
         # Package: Provisioning File, version: n/a, status: active
-        p1 = re.compile(r'^Package: +(?P<package>[\w+\s+\w]+)+, +version: (?P<version>\S+)+, status: (?P<status>\S+)$')
+        p1=r'^Package: +(?P<package>[\w+\s+\w]+)+, +version: (?P<version>\S+)+, status: (?P<status>\S+)$',
 
         # Role: provisioning file
-        p2 = re.compile(r'^Role: +(?P<role>[\w+\s+\w]+)$')
+        p2=r'^Role: +(?P<role>[\w+\s+\w]+)$',
 
         # File: bootflash:cat9k-rpbase.BLD_POLARIS_DEV_LATEST_20211115_013205.SSA.pkg, on: RP0
-        p3 = re.compile(r'^File: +(?P<file>\S+)+, on: (?P<on>\S+)$')
+        p3=r'^File: +(?P<file>\S+)+, on: (?P<on>\S+)$',
 
         # Built: 2021-11-14_18.31, by: mcpre
-        p4 = re.compile(r'^Built: +(?P<built>\S+)+, by: (?P<by>\S+)$')
+        p4=r'^Built: +(?P<built>\S+)+, by: (?P<by>\S+)$',
 
         # File SHA1 checksum: 69c0fe122c9f0885021f874875caeba46a2c6d07
-        p5 = re.compile(r'^File SHA1 checksum: +(?P<file_sha_checksum>\S+)$')
+        p5=r'^File SHA1 checksum: +(?P<file_sha_checksum>\S+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            # get output from device
+            output = self.device.execute(self.cli_command[0])
+
+        # initial return dictionary
+        ret_dict = {}
+        index = 0
+
+        p = ShowVersionRunning.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # Last configuration file parsed
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 index += 1
@@ -6589,27 +6729,27 @@ class ShowVersionRunning(ShowVersionRunningSchema):
                 ver.update({'status': group['status']})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ver.update({'role': group['role']})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 ver.update({'file': group['file']})
                 ver.update({'on': group['on']})
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 ver.update({'built': group['built']})
                 ver.update({'by': group['by']})
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 ver.update({'file_sha_checksum': group['file_sha_checksum']})
@@ -6675,73 +6815,79 @@ class ShowCallAdmissionStatistics(ShowCallAdmissionStatisticsSchema):
     """
     cli_command = ['show call admission statistics']
 
-    def cli(self, output=None):
-        cmd = self.cli_command[0]
-
-        if output is None:
-            output = self.device.execute(self.cli_command[0])
-
-        res_dict = {}
+    patterns = Patterns(
         # CAC New Model (SRSM) is ACTIVE
-        p1 = re.compile(r'^CAC New Model \(SRSM\) is (?P<state>\w+)$')
+        p1=r'^CAC New Model \(SRSM\) is (?P<state>\w+)$',
 
         # CAC statistics duration:  2(seconds)
-        p2 = re.compile(r'^CAC statistics duration:  (?P<duration>\d+)'
-                        r'\(seconds\)$')
+        p2=r'^CAC statistics duration:  (?P<duration>\d+)'
+           r'\(seconds\)$',
 
         # Total calls rejected 0, accepted 0
-        p3 = re.compile(r'^Total calls rejected (?P<rejected>\d+), '
-                        r'accepted (?P<accepted>\d+)$')
+        p3=r'^Total calls rejected (?P<rejected>\d+), '
+           r'accepted (?P<accepted>\d+)$',
 
         # Current hardware CAC status is: Not Dropping
-        p4 = re.compile(r'^Current hardware CAC status is: '
-                        r'(?P<status>\w+\s?\w+)$')
+        p4=r'^Current hardware CAC status is: '
+           r'(?P<status>\w+\s?\w+)$',
 
         # Total call Session charges: 0, limit 350
-        p5 = re.compile(r'^Total call Session charges: (?P<total_call_session_charges>'
-                        r'\d+), limit (?P<call_limit>\d+)$')
+        p5=r'^Total call Session charges: (?P<total_call_session_charges>'
+           r'\d+), limit (?P<call_limit>\d+)$',
 
         # CPU utilization: Five Sec Average CPU Load, Current actual CPU: 3%, Limit: 80%
-        p6 = re.compile(r'^CPU utilization: Five Sec Average CPU Load, Current actual '
-                        r'CPU: (?P<current_actual_cpu>\d+)%, Limit: (?P<cpu_limit>\d+)%$')
+        p6=r'^CPU utilization: Five Sec Average CPU Load, Current actual '
+           r'CPU: (?P<current_actual_cpu>\d+)%, Limit: (?P<cpu_limit>\d+)%$',
 
         # CPU-limit:              3354                116                  33541234
-        p7 = re.compile(r'^CPU-limit:\s+(?P<times_of_activation>\d+)\s+'
-                        r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
+        p7=r'^CPU-limit:\s+(?P<times_of_activation>\d+)\s+'
+           r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$',
 
         # SessionCharges:          27                  0                    27
-        p8 = re.compile(r'^SessionCharges:\s+(?P<times_of_activation>\d+)\s+'
-                        r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
+        p8=r'^SessionCharges:\s+(?P<times_of_activation>\d+)\s+'
+           r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$',
 
         # LowPlatformResource:     0                   0                     0
-        p9 = re.compile(r'^LowPlatformResource:\s+(?P<times_of_activation>\d+)\s+'
-                        r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
+        p9=r'^LowPlatformResource:\s+(?P<times_of_activation>\d+)\s+'
+           r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$',
 
         # Session Limit:         9876543               0                     0
-        p10 = re.compile(r'^Session Limit:\s+(?P<times_of_activation>\d+)\s+'
-                         r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$')
+        p10=r'^Session Limit:\s+(?P<times_of_activation>\d+)\s+'
+            r'(?P<duration_of_activation>\d+)\s+(?P<rejected_calls>\d+)$',
 
         # Total dropped FSOL packets at data plane: 0
-        p11 = re.compile(r'^Total dropped FSOL packets at data plane: (?P<fsol_drop>\d+)$')
+        p11=r'^Total dropped FSOL packets at data plane: (?P<fsol_drop>\d+)$',
+    )
+
+    def cli(self, output=None):
+        cmd = self.cli_command[0]
+
+        if output is None:
+            output = self.device.execute(self.cli_command[0])
+
+        res_dict = {}
+
+        p = ShowCallAdmissionStatistics.patterns
+
         for line in output.splitlines():
             line = line.strip()
 
             # CAC New Model (SRSM) is ACTIVE
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 groups = m.groupdict()
                 res_dict['cac_state'] = groups['state']
                 continue
 
             # CAC statistics duration:  2(seconds)
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 groups = m.groupdict()
                 res_dict['cac_duration'] = int(groups['duration'])
                 continue
 
             # Total calls rejected 0, accepted 0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 groups = m.groupdict()
                 res_dict['calls_rejected'] = int(groups['rejected'])
@@ -6749,14 +6895,14 @@ class ShowCallAdmissionStatistics(ShowCallAdmissionStatisticsSchema):
                 continue
 
             # Total calls rejected 0, accepted 0
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 groups = m.groupdict()
                 res_dict['cac_status'] = groups['status']
                 continue
 
             # Total call Session charges: 0, limit 350
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 groups = m.groupdict()
                 res_dict['total_call_session_charges'] = int(groups['total_call_session_charges'])
@@ -6764,7 +6910,7 @@ class ShowCallAdmissionStatistics(ShowCallAdmissionStatisticsSchema):
                 continue
 
             # CPU utilization: Five Sec Average CPU Load, Current actual CPU: 3%, Limit: 80%
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 groups = m.groupdict()
                 res_dict['current_actual_cpu'] = int(groups['current_actual_cpu'])
@@ -6772,7 +6918,7 @@ class ShowCallAdmissionStatistics(ShowCallAdmissionStatisticsSchema):
                 continue
 
             # CPU-limit:         3354            116                3354
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 res_dict.setdefault('cac_events', {})
                 res_dict['cac_events'].setdefault('reject_reason', {})
@@ -6786,7 +6932,7 @@ class ShowCallAdmissionStatistics(ShowCallAdmissionStatisticsSchema):
                     ['rejected_calls'] = int(groups['rejected_calls'])
 
             # SessionCharges:                  27                     0                          27
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 res_dict.setdefault('cac_events', {})
                 res_dict['cac_events'].setdefault('reject_reason', {})
@@ -6800,7 +6946,7 @@ class ShowCallAdmissionStatistics(ShowCallAdmissionStatisticsSchema):
                     ['rejected_calls'] = int(groups['rejected_calls'])
 
             # LowPlatformResource:             0                      0                          0
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 res_dict.setdefault('cac_events', {})
                 res_dict['cac_events'].setdefault('reject_reason', {})
@@ -6814,7 +6960,7 @@ class ShowCallAdmissionStatistics(ShowCallAdmissionStatisticsSchema):
                     ['rejected_calls'] = int(groups['rejected_calls'])
 
             # Session Limit:                   0                      0                          0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 res_dict.setdefault('cac_events', {})
                 res_dict['cac_events'].setdefault('reject_reason', {})
@@ -6828,7 +6974,7 @@ class ShowCallAdmissionStatistics(ShowCallAdmissionStatisticsSchema):
                     ['rejected_calls'] = int(groups['rejected_calls'])
 
             # Total dropped FSOL packets at data plane: 0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 groups = m.groupdict()
                 res_dict['fsol_packet_drop'] = int(groups['fsol_drop'])
@@ -6876,6 +7022,12 @@ class ShowRepTopologySegment(ShowRepTopologySegmentSchema):
 
     cli_command = 'show rep topology segment {no}'
 
+    patterns = Patterns(
+        # fr1                              Tw2/0/3    Pri* Alt
+        # fr1                              Gi1/0/3    Sec* Open
+        p1=r'(?P<bridge>\S+)\s+(?P<interface>[a-z|A-Z]+\d+\/\d+\/\d+)\s+(?P<edge>\S+)\s+(?P<role>\S+)',
+    )
+
     def cli(self, no, output=None):
 
         if output is None:
@@ -6883,9 +7035,7 @@ class ShowRepTopologySegment(ShowRepTopologySegmentSchema):
 
         ret_dict = {}
 
-        # fr1                              Tw2/0/3    Pri* Alt
-        # fr1                              Gi1/0/3    Sec* Open
-        p1 = re.compile(r'(?P<bridge>\S+)\s+(?P<interface>[a-z|A-Z]+\d+\/\d+\/\d+)\s+(?P<edge>\S+)\s+(?P<role>\S+)')
+        p = ShowRepTopologySegment.patterns
 
         for line in output.splitlines():
 
@@ -6893,7 +7043,7 @@ class ShowRepTopologySegment(ShowRepTopologySegmentSchema):
 
             # fr1                              Tw2/0/3    Pri* Alt
             # fr1                              Gi1/0/3    Sec* Open
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 intf = Common.convert_intf_name(group.pop('interface'))
@@ -6935,38 +7085,43 @@ class ShowPlatformPacketStats(ShowPlatformPktTraceStatsSchema):
     """
     cli_command = ['show platform packet-trace statistics']
 
-    def cli(self, output=None):
-        if output is None:
-            cmd = self.cli_command[0]
-            output = self.device.execute(cmd)
-
-        ret_dict = {}
-
+    patterns = Patterns(
         # Packets Summary
         #   Matched  1
-        p1 = re.compile(r'\s+Matched\s+(?P<count>\d+)')
+        p1=r'\s+Matched\s+(?P<count>\d+)',
+
         # Packets Traced: 5
         #    or (different version)
         #   Traced   11
-        p2 = re.compile(r'.*Traced:?\s+(?P<count>\d+)')
+        p2=r'.*Traced:?\s+(?P<count>\d+)',
 
         # Packets Received
         #   Ingress  12
         #   Inject   13
-        p3 = re.compile(r'^\s+(?P<pkt_type>(Ingress|Inject))\s+(?P<count>\d+)$')
+        p3=r'^\s+(?P<pkt_type>(Ingress|Inject))\s+(?P<count>\d+)$',
 
         # Packets Processed
         #   Forward  14
         #   Punt     15
         #   Drop     16
         #   Consume  17
-        p4 = re.compile(r'^\s+(?P<pkt_type>(Forward|Punt|Drop|Consume))\s+(?P<count>\d+)$')
+        p4=r'^\s+(?P<pkt_type>(Forward|Punt|Drop|Consume))\s+(?P<count>\d+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            cmd = self.cli_command[0]
+            output = self.device.execute(cmd)
+
+        ret_dict = {}
+
+        p = ShowPlatformPacketStats.patterns
 
         for line in output.splitlines():
 
             # Packets Summary
             #   Matched  1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 groups = m.groupdict()
                 ret_dict.setdefault('packets_summary', {})['matched'] = int(groups['count'])
@@ -6974,7 +7129,7 @@ class ShowPlatformPacketStats(ShowPlatformPktTraceStatsSchema):
             # Packets Traced: 5
             #    or (different version)
             #   Traced   11
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 groups = m.groupdict()
                 ret_dict.setdefault('packets_summary', {})['traced'] = int(groups['count'])
@@ -6983,7 +7138,7 @@ class ShowPlatformPacketStats(ShowPlatformPktTraceStatsSchema):
             # Packets Received
             #   Ingress  12
             #   Inject   13
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 groups = m.groupdict()
                 key = groups['pkt_type'].lower()
@@ -6995,7 +7150,7 @@ class ShowPlatformPacketStats(ShowPlatformPktTraceStatsSchema):
             #   Punt     15
             #   Drop     16
             #   Consume  17
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 groups = m.groupdict()
                 key = groups['pkt_type'].lower()
@@ -7231,40 +7386,47 @@ class ShowPlatformPacketTracePacket(ShowPlatformPacketTracePacketSchema):
         name = re.sub(r'_{2,}', '_', name).strip('_')
         return name
 
-    def cli(self, output=None, packet_id=None):
-        if output is None:
-            if packet_id is None:
-                cmd = self.cli_command[0]
-            else:
-                cmd = self.cli_command[0].format(packet_id=packet_id)
-            output = self.device.execute(cmd)
-
+    patterns = Patterns(
         # Packet: 0           CBUG ID: 104
-        p_packet_start = re.compile(r'Packet:\s+(?P<packet_id>\d+)\s+CBUG\s+ID:\s(?P<cbug_id>\d+)')
+        p_packet_start=r'Packet:\s+(?P<packet_id>\d+)\s+CBUG\s+ID:\s(?P<cbug_id>\d+)',
+
         # Summary
-        p_summary_start = re.compile(r'Summary$')
+        p_summary_start=r'Summary$',
+
         #  Timestamp
         #   Start   : 19591546248064016 ns (07/27/2021 09:34:28.261898 UTC)
         #   Stop    : 19591546248087028 ns (07/27/2021 09:34:28.261921 UTC)
-        p_timestamp = re.compile(
-            r'\s+(?P<field>(Start)|(Stop))\s+:\s(?P<time_ns>\d+)\s+ns\s+'
-            r'\((?P<date_str>\d+/\d+/\d+\s+\d+:\d+:\d+\.\d+)\s+\w+\)')
+        p_timestamp=r'\s+(?P<field>(Start)|(Stop))\s+:\s(?P<time_ns>\d+)\s+ns\s+'
+                    r'\((?P<date_str>\d+/\d+/\d+\s+\d+:\d+:\d+\.\d+)\s+\w+\)',
+
         #   Feature: IPV4(Output)
-        p_feature_start = re.compile(r'\s+Feature:\s(?P<feature_name>[\w\\()]+)')
+        p_feature_start=r'\s+Feature:\s(?P<feature_name>[\w\\()]+)',
+
         # Path Trace
-        p_path_trace_start = re.compile(r'Path\s+Trace$')
+        p_path_trace_start=r'Path\s+Trace$',
+
         # IOSd Path Flow: Packet: 1    CBUG ID: 105
-        p_iosd_flow_start = re.compile(r'IOSd\sPath\sFlow:\sPacket:')
+        p_iosd_flow_start=r'IOSd\sPath\sFlow:\sPacket:',
+        p_from_plane=r'\s+Packet\s+Rcvd\s+From\s+(?P<from_plane>\w+)',
+        p_layer=r'\s+Packet\s+Enqueued\s+in\s+(?P<layer>.*)',
+    )
+
+    def cli(self, output=None, packet_id=None):
+        if output is None:
+            if packet_id is None:
+                cmd = self.cli_command[0]
+            else:
+                cmd = self.cli_command[0].format(packet_id=packet_id)
+            output = self.device.execute(cmd)
 
-        p_from_plane = re.compile(r'\s+Packet\s+Rcvd\s+From\s+(?P<from_plane>\w+)')
-        p_layer = re.compile(r'\s+Packet\s+Enqueued\s+in\s+(?P<layer>.*)')
+        p = ShowPlatformPacketTracePacket.patterns
 
         ret_dict = {}
 
         for line in output.splitlines():
             # start a with new packet
             # Packet: 0           CBUG ID: 104
-            m = p_packet_start.match(line)
+            m = p.p_packet_start.match(line)
             if m:
                 groups = m.groupdict()
                 packet_id = int(groups['packet_id'])
@@ -7273,24 +7435,24 @@ class ShowPlatformPacketTracePacket(ShowPlatformPacketTracePacketSchema):
                 continue
 
             # Summary
-            m = p_summary_start.match(line)
+            m = p.p_summary_start.match(line)
             if m:
                 current_dict = packet_dict.setdefault('summary', {})
                 continue
 
             # Path Trace
-            m = p_path_trace_start.match(line)
+            m = p.p_path_trace_start.match(line)
             if m:
                 current_features_key = 'path_trace'
                 continue
             # IOSd Path Flow: Packet: 1    CBUG ID: 105
-            m = p_iosd_flow_start.match(line)
+            m = p.p_iosd_flow_start.match(line)
             if m:
                 current_features_key = 'iosd_flow'
                 continue
 
             #   Feature: IPV4(Output)
-            m = p_feature_start.match(line)
+            m = p.p_feature_start.match(line)
             if m:
                 groups = m.groupdict()
                 current_feature = self._field_name_normalize(groups['feature_name'])
@@ -7300,7 +7462,7 @@ class ShowPlatformPacketTracePacket(ShowPlatformPacketTracePacketSchema):
             #  Timestamp
             #   Start   : 19591546248064016 ns (07/27/2021 09:34:28.261898 UTC)
             #   Stop    : 19591546248087028 ns (07/27/2021 09:34:28.261921 UTC)
-            m = p_timestamp.match(line)
+            m = p.p_timestamp.match(line)
             if m:
                 groups = m.groupdict()
                 current_dict.update({
@@ -7310,14 +7472,14 @@ class ShowPlatformPacketTracePacket(ShowPlatformPacketTracePacketSchema):
                 continue
 
             #     Packet Rcvd From DATAPLANE
-            m = p_from_plane.match(line)
+            m = p.p_from_plane.match(line)
             if m:
                 groups = m.groupdict()
                 current_dict['packet_rcvd_from'] = groups['from_plane']
                 continue
 
             #     Packet Enqueued in IP layer
-            m = p_layer.match(line)
+            m = p.p_layer.match(line)
             if m:
                 groups = m.groupdict()
                 current_dict['packet_enqueued_in'] = groups['layer']
@@ -7365,6 +7527,11 @@ class ShowSystemMtu(ShowSystemMtuSchema):
 
     cli_command = 'show system mtu'
 
+    patterns = Patterns(
+        # Global Ethernet MTU is 1500 bytes
+        p1=r'^Global\s+Ethernet\s+MTU\s+is\s+(?P<mtu_in_bytes>\d+)\s+bytes\.$',
+    )
+
     def cli(self, output=None):
         if output is None:
             output = self.device.execute(self.cli_command)
@@ -7372,15 +7539,13 @@ class ShowSystemMtu(ShowSystemMtuSchema):
         # initial variables
         ret_dict = {}
 
-        # Global Ethernet MTU is 1500 bytes
-        p1 = re.compile(r'^Global\s+Ethernet\s+MTU\s+is\s+(?P<mtu_in_bytes>\d+)\s+bytes\.$')
-
+        p = ShowSystemMtu.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # Global Ethernet MTU is 1500 bytes
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['mtu_in_bytes'] =int(group['mtu_in_bytes'])
@@ -7424,6 +7589,14 @@ class ShowFileSystems(ShowFileSystemsSchema):
 
     cli_command = 'show file systems'
 
+    patterns = Patterns(
+        #*  11353194496    7130390528      disk     rw   flash-3:
+        p0=r'^\*\s*(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\w+)\s*(?P<flags>\w+)\s*(?P<prefixes>[\S\s]+)$',
+
+        #8162746368    8019398656      disk     ro   webui:
+        p1=r'^(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\S*)\s*(?P<flags>\S*)\s*(?P<prefixes>[\S\s]+)$',
+    )
+
     def cli(self, output=None):
 
         if output is None:
@@ -7431,19 +7604,17 @@ class ShowFileSystems(ShowFileSystemsSchema):
         # initialze return dictionary
         ret_dict = {}
         index = 0
-        #*  11353194496    7130390528      disk     rw   flash-3:
-        p0 = re.compile(r'^\*\s*(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\w+)\s*(?P<flags>\w+)\s*(?P<prefixes>[\S\s]+)$')
-        #8162746368    8019398656      disk     ro   webui:
-        p1 = re.compile(r'^(?P<total_size>\d+)\s*(?P<free_size>\d+)\s*(?P<type>\S*)\s*(?P<flags>\S*)\s*(?P<prefixes>[\S\s]+)$')
+
+        p = ShowFileSystems.patterns
 
         for line in output.splitlines():
             line = line.strip()
             #*  11353194496    7130390528      disk     rw   flash-3:
-            if p0.match(line):
-                m = p0.match(line)
+            if p.p0.match(line):
+                m = p.p0.match(line)
             else:
             #8162746368    8019398656      disk     ro   webui:
-                m = p1.match(line)
+                m = p.p1.match(line)
 
             if m:
                 group = m.groupdict()
@@ -7473,15 +7644,19 @@ class ShowRedundancyConfigSyncFailuresMcl(ShowRedundancyConfigSyncFailuresMclSch
 
     cli_command = 'show redundancy config-sync failures mcl'
 
+    patterns = Patterns(
+        # The list is Empty
+        p1=r"^The\s+list\s+is\s+Empty$",
+
+        # 00:06:31: Config Sync: Starting lines from MCL file:
+        p2=r"^\S+\s+Config Sync: Starting lines from MCL file:$",
+    )
+
     def cli(self, output=None):
         if output is None:
             output = self.device.execute(self.cli_command)
 
-        # The list is Empty
-        p1 = re.compile(r"^The\s+list\s+is\s+Empty$")
-
-        # 00:06:31: Config Sync: Starting lines from MCL file:
-        p2 = re.compile(r"^\S+\s+Config Sync: Starting lines from MCL file:$")
+        p = ShowRedundancyConfigSyncFailuresMcl.patterns
 
         ret_dict = {}
         err_flag = False
@@ -7490,13 +7665,13 @@ class ShowRedundancyConfigSyncFailuresMcl(ShowRedundancyConfigSyncFailuresMclSch
             line = line.strip()
 
             # The list is Empty
-            match_obj = p1.match(line)
+            match_obj = p.p1.match(line)
             if match_obj:
                 ret_dict.setdefault("err_list", [])
                 break
 
             # 00:06:31: Config Sync: Starting lines from MCL file:
-            match_obj = p2.match(line)
+            match_obj = p.p2.match(line)
             if match_obj:
                 err_flag = True
                 ret_dict.setdefault('err_list', []).append(line)
@@ -7567,49 +7742,68 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
 
     cli_command = 'show platform authentication sbinfo interface {interface}'
 
-    def cli(self, interface, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command.format(interface=interface))
-
+    patterns = Patterns(
         # SB Access Vlan: 1
-        p1 = re.compile(r"^\s+SB\s+Access\s+Vlan:\s+(?P<sb_access_vlan>\d+)$")
+        p1=r"^\s+SB\s+Access\s+Vlan:\s+(?P<sb_access_vlan>\d+)$",
+
         # SB Voice Vlan: 100
-        p1_1 = re.compile(r"^\s+SB\s+Voice\s+Vlan:\s+(?P<sb_voice_vlan>\d+)$")
+        p1_1=r"^\s+SB\s+Voice\s+Vlan:\s+(?P<sb_voice_vlan>\d+)$",
+
         # Conf Access Vlan: 1
-        p1_2 = re.compile(r"^\s+Conf\s+Access\s+Vlan:\s+(?P<conf_access_vlan>\d+)$")
+        p1_2=r"^\s+Conf\s+Access\s+Vlan:\s+(?P<conf_access_vlan>\d+)$",
+
         # Conf Voice Vlan: 100
-        p1_3 = re.compile(r"^\s+Conf\s+Voice\s+Vlan:\s+(?P<conf_voice_vlan>\d+)$")
+        p1_3=r"^\s+Conf\s+Voice\s+Vlan:\s+(?P<conf_voice_vlan>\d+)$",
+
         # Oper Access Vlan: 1
-        p1_4 = re.compile(r"^\s+Oper\s+Access\s+Vlan:\s+(?P<oper_access_vlan>\d+)$")
+        p1_4=r"^\s+Oper\s+Access\s+Vlan:\s+(?P<oper_access_vlan>\d+)$",
+
         # Oper Voice Vlan: 100
-        p1_5 = re.compile(r"^\s+Oper\s+Voice\s+Vlan:\s+(?P<oper_voice_vlan>\d+)$")
+        p1_5=r"^\s+Oper\s+Voice\s+Vlan:\s+(?P<oper_voice_vlan>\d+)$",
+
         # Default Host Access: 1
-        p1_6 = re.compile(r"^\s+Default\s+Host\s+Access:\s+(?P<def_host_access>\d+)$")
+        p1_6=r"^\s+Default\s+Host\s+Access:\s+(?P<def_host_access>\d+)$",
+
         # Auth In VP: True
-        p1_7 = re.compile(r"^\s+Auth\s+In\s+VP:\s+(?P<auth_in_vp>\w+)$")
+        p1_7=r"^\s+Auth\s+In\s+VP:\s+(?P<auth_in_vp>\w+)$",
+
         # Client Count : 1
-        p1_8 = re.compile(r"^\s+Client\s+Count\s+:\s+(?P<client_count>\d+)$")
+        p1_8=r"^\s+Client\s+Count\s+:\s+(?P<client_count>\d+)$",
+
         # Vlan Count : 2
-        p1_9 = re.compile(r"^\s+Vlan\s+Count\s+:\s+(?P<vlan_count>\d+)$")
+        p1_9=r"^\s+Vlan\s+Count\s+:\s+(?P<vlan_count>\d+)$",
+
         # Port-Control Auto Enabled : TRUE
-        p1_10 = re.compile(r"^Port-Control\s+Auto\s+Enabled\s+:\s+(?P<port_ctrl_enable>\w+)$")
+        p1_10=r"^Port-Control\s+Auto\s+Enabled\s+:\s+(?P<port_ctrl_enable>\w+)$",
+
         # CDP Bypass Enabled : FALSE
-        p1_11 = re.compile(r"^\s+CDP\s+Bypass\s+Enabled\s+:\s+(?P<cdp_bypass_enable>\w+)$")
+        p1_11=r"^\s+CDP\s+Bypass\s+Enabled\s+:\s+(?P<cdp_bypass_enable>\w+)$",
+
         # Port Mode : CLOSED
-        p1_12 = re.compile(r"^\s+Port\s+Mode\s+:\s+(?P<port_mode>\w+)$")
+        p1_12=r"^\s+Port\s+Mode\s+:\s+(?P<port_mode>\w+)$",
+
         # Control Direction : BOTH
-        p1_13 = re.compile(r"^\s+Control\s+Direction\s+:\s+(?P<ctrl_dir>\w+)$")
+        p1_13=r"^\s+Control\s+Direction\s+:\s+(?P<ctrl_dir>\w+)$",
+
         # Gi1/0/24  001b.0c18.918d    VOICE    100  0x94000008  0x0002  None
-        p2 = re.compile(r"^\s+(?P<int>\S+)\s+(?P<mac>\S+)\s+(?P<domain>\w+)\s+(?P<vlan>\d+)\s+(?P<clent_handle>\S+)\s+(?P<port_open>\S+)\s+(?P<flags>\w+)$")
+        p2=r"^\s+(?P<int>\S+)\s+(?P<mac>\S+)\s+(?P<domain>\w+)\s+(?P<vlan>\d+)\s+(?P<clent_handle>\S+)\s+(?P<port_open>\S+)\s+(?P<flags>\w+)$",
+
         # Gi1/0/24  1       DATA    1     0     0       2     None
-        p3 = re.compile(r"^\s+(?P<int>\S+)\s+(?P<vlan>\d+)\s+(?P<domain>\w+)\s+(?P<user_count>\d+)\s+(?P<fwd_count>\d+)\s+(?P<client_count>\d+)\s+(?P<vp_state>\S+\s+)\s+(?P<flags>\w+)$")
+        p3=r"^\s+(?P<int>\S+)\s+(?P<vlan>\d+)\s+(?P<domain>\w+)\s+(?P<user_count>\d+)\s+(?P<fwd_count>\d+)\s+(?P<client_count>\d+)\s+(?P<vp_state>\S+\s+)\s+(?P<flags>\w+)$",
+    )
+
+    def cli(self, interface, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(interface=interface))
+
+        p = ShowPlatformAuthenticationSbinfoInterface.patterns
 
         ret_dict = {}
 
         for line in output.splitlines():
 
             # SB Access Vlan: 1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7618,7 +7812,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # SB Voice Vlan: 100
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7627,7 +7821,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Conf Access Vlan: 1
-            m = p1_2.match(line)
+            m = p.p1_2.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7636,7 +7830,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Conf Voice Vlan: 100
-            m = p1_3.match(line)
+            m = p.p1_3.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7645,7 +7839,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Oper Access Vlan: 1
-            m = p1_4.match(line)
+            m = p.p1_4.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7654,7 +7848,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Oper Voice Vlan: 100
-            m = p1_5.match(line)
+            m = p.p1_5.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7663,7 +7857,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Default Host Access: 1
-            m = p1_6.match(line)
+            m = p.p1_6.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7672,7 +7866,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Auth In VP: True
-            m = p1_7.match(line)
+            m = p.p1_7.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7681,7 +7875,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Client Count : 1
-            m = p1_8.match(line)
+            m = p.p1_8.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7690,7 +7884,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Vlan Count : 2
-            m = p1_9.match(line)
+            m = p.p1_9.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7699,7 +7893,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Port-Control Auto Enabled : TRUE
-            m = p1_10.match(line)
+            m = p.p1_10.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7708,7 +7902,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # CDP Bypass Enabled : FALSE
-            m = p1_11.match(line)
+            m = p.p1_11.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7717,7 +7911,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Port Mode : CLOSED
-            m = p1_12.match(line)
+            m = p.p1_12.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7726,7 +7920,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Control Direction : BOTH
-            m = p1_13.match(line)
+            m = p.p1_13.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'sb_info' not in ret_dict:
@@ -7735,7 +7929,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Gi1/0/24  001b.0c18.918d    VOICE    100  0x94000008  0x0002  None
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 dict_val = m.groupdict()
                 int_var = dict_val['int']
@@ -7753,7 +7947,7 @@ class ShowPlatformAuthenticationSbinfoInterface(ShowPlatformAuthenticationSbinfo
                 continue
 
             # Gi1/0/24  1       DATA    1     0     0       2     None
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 dict_val = m.groupdict()
                 vlan_var = dict_val['vlan']
@@ -7801,17 +7995,23 @@ class ShowPlatformHostAccessTableIntf(ShowPlatformHostAccessTableIntfSchema):
 
     cli_command = 'show platform host-access-table {intf}'
 
+    patterns = Patterns(
+        # 001b.0c18.918d       100         permit         dot1x        dynamic
+        p1=r"^(?P<src_address>\S+)\s+(?P<vlan_id>\d+)\s+(?P<access_mode>\w+)\s+(?P<feature>\S+)\s+(?P<type>\w+)$",
+
+        # Current feature:  dot1x
+        p1_1=r"^Current\s+feature:\s+(?P<current_feature>\S+)$",
+
+        # Default            ask
+        p1_2=r"^Default\s+(?P<default>\w+)$",
+    )
+
     def cli(self, intf=None, output=None):
         if output is None:
             cmd = self.cli_command.format(intf=intf)
             output = self.device.execute(cmd)
 
-        # 001b.0c18.918d       100         permit         dot1x        dynamic
-        p1 = re.compile(r"^(?P<src_address>\S+)\s+(?P<vlan_id>\d+)\s+(?P<access_mode>\w+)\s+(?P<feature>\S+)\s+(?P<type>\w+)$")
-        # Current feature:  dot1x
-        p1_1 = re.compile(r"^Current\s+feature:\s+(?P<current_feature>\S+)$")
-        # Default            ask
-        p1_2 = re.compile(r"^Default\s+(?P<default>\w+)$")
+        p = ShowPlatformHostAccessTableIntf.patterns
 
         ret_dict = {}
 
@@ -7819,7 +8019,7 @@ class ShowPlatformHostAccessTableIntf(ShowPlatformHostAccessTableIntfSchema):
             line = line.strip()
 
             # 001b.0c18.918d       100         permit         dot1x        dynamic
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 vlan_id_var = dict_val['vlan_id']
@@ -7835,7 +8035,7 @@ class ShowPlatformHostAccessTableIntf(ShowPlatformHostAccessTableIntfSchema):
                 continue
 
             # Current feature:  dot1x
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'host_access' not in ret_dict:
@@ -7844,7 +8044,7 @@ class ShowPlatformHostAccessTableIntf(ShowPlatformHostAccessTableIntfSchema):
                 continue
 
             # Default            ask
-            m = p1_2.match(line)
+            m = p.p1_2.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'host_access' not in ret_dict:
@@ -7892,37 +8092,48 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
 
     cli_command = 'show platform pm port-data {interface}'
 
-    def cli(self, interface=None, output=None):
-        if output is None:
-            cmd = self.cli_command.format(interface=interface)
-            output = self.device.execute(cmd)
-
+    patterns = Patterns(
         #   Access Mode               Multi-Static         Multi-Static
-        p1 = re.compile(r"^\s+(?P<field>(\w+|\w+\s+\w+|\w+\s+\w+\s+\w+)?)\s+(?P<admin_field>(\S+|\s+)?)\s+(?P<oper_field>(\S+|s+)?)$")
+        p1=r"^\s+(?P<field>(\w+|\w+\s+\w+|\w+\s+\w+\s+\w+)?)\s+(?P<admin_field>(\S+|\s+)?)\s+(?P<oper_field>(\S+|s+)?)$",
 
         #   Forwarding Vlans : 100
-        p2 = re.compile(r"^\s+Forwarding\s+Vlans\s+:\s+(?P<forwarding_vlans>\d+)$")
+        p2=r"^\s+Forwarding\s+Vlans\s+:\s+(?P<forwarding_vlans>\d+)$",
+
         #   Current Pruned Vlans : none
-        p2_1 = re.compile(r"^\s+Current\s+Pruned\s+Vlans\s+:\s+(?P<current_pruned_vlans>\w+)$")
+        p2_1=r"^\s+Current\s+Pruned\s+Vlans\s+:\s+(?P<current_pruned_vlans>\w+)$",
+
         #   Previous Pruned Vlans : none
-        p2_2 = re.compile(r"^\s+Previous\s+Pruned\s+Vlans\s+:\s+(?P<previous_pruned_vlans>\w+)$")
+        p2_2=r"^\s+Previous\s+Pruned\s+Vlans\s+:\s+(?P<previous_pruned_vlans>\w+)$",
+
         #   Sw LinkNeg State : LinkStateUp
-        p2_3 = re.compile(r"^\s+Sw\s+LinkNeg\s+State\s+:\s+(?P<sw_linkneg_state>\w+)$")
+        p2_3=r"^\s+Sw\s+LinkNeg\s+State\s+:\s+(?P<sw_linkneg_state>\w+)$",
+
         #   No.of LinkDownEvents :    3
-        p2_4 = re.compile(r"^\s+No\.of\s+LinkDownEvents\s+:\s+(?P<no_link_down_events>\d+)\s+$")
+        p2_4=r"^\s+No\.of\s+LinkDownEvents\s+:\s+(?P<no_link_down_events>\d+)\s+$",
+
         #   Time Stamp Last Link Flapped(U) : Sep 13 20:14:35.714
-        p2_5 = re.compile(r"^\s+Time\s+Stamp\s+Last\s+Link\s+Flapped\(U\)\s+:\s+(?P<time_stamp_last_link_flapped>\S+\s+\S+\s+\S+)$")
+        p2_5=r"^\s+Time\s+Stamp\s+Last\s+Link\s+Flapped\(U\)\s+:\s+(?P<time_stamp_last_link_flapped>\S+\s+\S+\s+\S+)$",
+
         #   LastLinkDownDuration(sec) 2
-        p2_6 = re.compile(r"^\s+LastLinkDownDuration\(sec\)\s+(?P<last_link_down_duration_secs>\d+)\s+$")
+        p2_6=r"^\s+LastLinkDownDuration\(sec\)\s+(?P<last_link_down_duration_secs>\d+)\s+$",
+
         #   LastLinkUpDuration(sec):  1355054
-        p2_7 = re.compile(r"^\s+LastLinkUpDuration\(sec\):\s+(?P<last_link_up_duration_secs>\d+)\s+$")
+        p2_7=r"^\s+LastLinkUpDuration\(sec\):\s+(?P<last_link_up_duration_secs>\d+)\s+$",
+    )
+
+    def cli(self, interface=None, output=None):
+        if output is None:
+            cmd = self.cli_command.format(interface=interface)
+            output = self.device.execute(cmd)
+
+        p = ShowPlatformPmPortDataInt.patterns
 
         ret_dict = {}
 
         for line in output.splitlines():
 
             #   Access Mode               Multi-Static         Multi-Static
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 field_var = dict_val['field']
@@ -7937,7 +8148,7 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
 
 
             #   Forwarding Vlans : 100
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
@@ -7946,7 +8157,7 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
                 continue
 
             #   Current Pruned Vlans : none
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
@@ -7955,7 +8166,7 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
                 continue
 
             #   Previous Pruned Vlans : none
-            m = p2_2.match(line)
+            m = p.p2_2.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
@@ -7964,7 +8175,7 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
                 continue
 
             #   Sw LinkNeg State : LinkStateUp
-            m = p2_3.match(line)
+            m = p.p2_3.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
@@ -7973,7 +8184,7 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
                 continue
 
             #   No.of LinkDownEvents :    3
-            m = p2_4.match(line)
+            m = p.p2_4.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
@@ -7982,7 +8193,7 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
                 continue
 
             #   Time Stamp Last Link Flapped(U) : Sep 13 20:14:35.714
-            m = p2_5.match(line)
+            m = p.p2_5.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
@@ -7992,7 +8203,7 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
 
             #   LastLinkDownDuration(sec) 2
 
-            m = p2_6.match(line)
+            m = p.p2_6.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
@@ -8001,7 +8212,7 @@ class ShowPlatformPmPortDataInt(ShowPlatformPmPortDataIntSchema):
                 continue
 
             #   LastLinkUpDuration(sec):  1355054
-            m = p2_7.match(line)
+            m = p.p2_7.match(line)
             if m:
                 dict_val = m.groupdict()
                 if 'pm_port_info' not in ret_dict:
@@ -8034,6 +8245,18 @@ class ShowPlatformRewriteUtilization(ShowPlatformRewriteUtilizationSchema):
 
     cli_command = ['show platform hardware fed {switch} active fwd-asic resource rewrite utilization','show platform hardware fed active fwd-asic resource rewrite utilization']
 
+    patterns = Patterns(
+        # initial regexp pattern
+        # Resource Info for ASIC Instance: 0
+        p1=r'Resource +Info +for +ASIC +Instance: +(?P<asic>(\d+))$',
+
+        #Rewrite Data                        Allocated     Free
+        #-------------------------------------------------------
+        #PHF_EGRESS_destMacAddress             75001       23303
+        #UDP_ENCAP_SRC_PORT                        0         256
+        p2=r'(?P<rewritedata>\S+) +(?P<allocated>\S+) +(?P<free>\S+)$',
+    )
+
     def cli(self, output=None, switch=''):
         if output is None:
             if switch:
@@ -8044,20 +8267,14 @@ class ShowPlatformRewriteUtilization(ShowPlatformRewriteUtilizationSchema):
 
         # initial return dictionary
         ret_dict = {}
-        # initial regexp pattern
-        # Resource Info for ASIC Instance: 0
-        p1 = re.compile(r'Resource +Info +for +ASIC +Instance: +(?P<asic>(\d+))$')
 
-        #Rewrite Data                        Allocated     Free
-        #-------------------------------------------------------
-        #PHF_EGRESS_destMacAddress             75001       23303
-        #UDP_ENCAP_SRC_PORT                        0         256
-        p2 = re.compile(r'(?P<rewritedata>\S+) +(?P<allocated>\S+) +(?P<free>\S+)$')
+        p = ShowPlatformRewriteUtilization.patterns
+
         for line in output.splitlines():
             line = line.strip()
 
             # Resource Info for ASIC Instance: 0
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 asic = group['asic']
@@ -8067,7 +8284,7 @@ class ShowPlatformRewriteUtilization(ShowPlatformRewriteUtilizationSchema):
             #PHF_EGRESS_destMacAddress             75001       23303
             #UDP_ENCAP_SRC_PORT                        0         256
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 groups = m.groupdict()
                 rewritedata = (groups['rewritedata'])
@@ -8157,36 +8374,40 @@ class ShowPlatformMatmMacTable(ShowPlatformMatmMacTableSchema):
 
     cli_command = 'show platform hardware fed switch active matm macTable'
 
-    def cli(self, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
-
+    patterns = Patterns(
         # HEAD: MAC address 0012.7fae.9662 in VLAN 1
-        p1 = re.compile(r'^HEAD:\s+MAC\s+address\s+(?P<mac_address>[\d\.a-f]+)\s+in\s+VLAN\s+(?P<vlan>\d+)$')
+        p1=r'^HEAD:\s+MAC\s+address\s+(?P<mac_address>[\d\.a-f]+)\s+in\s+VLAN\s+(?P<vlan>\d+)$',
 
         # KEY: vlan 4, mac 0x127fae9662, l3_if 0, gpn 24, epoch 0, static 0, flood_en 0, vlan_lead_wless_flood_en 0,
         # client_home_asic 0, learning_peerid 0, learning_peerid_valid 0
-        p2 = re.compile(r'^(?P<key_mask>(KEY|MASK)):\s+vlan\s+(?P<vlan>\d+),\s+mac\s+(?P<mac>\S+),\s+l3_if\s+(?P<l3_if>\d+),\s+gpn\s+(?P<gpn>\d+),'
-        r'\s+epoch\s+(?P<epoch>\d+),\s+static\s+(?P<static>\d+),\s+flood_en\s+(?P<flood_en>\d+),\s+vlan_lead_wless_flood_en'
-        r'\s+(?P<vlan_lead_wless_flood_en>\d+),\s+client_home_asic\s+(?P<client_home_asic>\d+),*\s+learning_peerid\s+(?P<learning_peerid>\d+),'
-        r'\s+learning_peerid_valid\s+(?P<learning_peerid_valid>\d+)$')
+        p2=r'^(?P<key_mask>(KEY|MASK)):\s+vlan\s+(?P<vlan>\d+),\s+mac\s+(?P<mac>\S+),\s+l3_if\s+(?P<l3_if>\d+),\s+gpn\s+(?P<gpn>\d+),'
+           r'\s+epoch\s+(?P<epoch>\d+),\s+static\s+(?P<static>\d+),\s+flood_en\s+(?P<flood_en>\d+),\s+vlan_lead_wless_flood_en'
+           r'\s+(?P<vlan_lead_wless_flood_en>\d+),\s+client_home_asic\s+(?P<client_home_asic>\d+),*\s+learning_peerid\s+(?P<learning_peerid>\d+),'
+           r'\s+learning_peerid_valid\s+(?P<learning_peerid_valid>\d+)$',
 
         # SRC_AD: need_to_learn 0, lrn_v 0, catchall 0, static_mac 0, chain_ptr_v 0, chain_ptr 0, static_entry_v 0,
         # auth_state 0, auth_mode 0, traf_mode 0, is_src_ce 0
-        p3 = re.compile(r'^SRC_AD:\s+need_to_learn\s+(?P<need_to_learn>\d+),\s+lrn_v\s+(?P<lrn_v>\d+),\s+catchall\s+(?P<catchall>\d+),'
-        r'\s+static_mac\s+(?P<static_mac>\d+),\s+chain_ptr_v\s+(?P<chain_ptr_v>\d+),\s+chain_ptr\s+(?P<chain_ptr>\d+),\s+static_entry_v'
-        r'\s+(?P<static_entry_v>\d+),\s+auth_state\s+(?P<auth_state>\d+),\s+auth_mode\s+(?P<auth_mode>\d+),\s+traf_mode\s+(?P<traf_mode>\d+),'
-        r'\s+is_src_ce\s+(?P<is_src_ce>\d+)$')
+        p3=r'^SRC_AD:\s+need_to_learn\s+(?P<need_to_learn>\d+),\s+lrn_v\s+(?P<lrn_v>\d+),\s+catchall\s+(?P<catchall>\d+),'
+           r'\s+static_mac\s+(?P<static_mac>\d+),\s+chain_ptr_v\s+(?P<chain_ptr_v>\d+),\s+chain_ptr\s+(?P<chain_ptr>\d+),\s+static_entry_v'
+           r'\s+(?P<static_entry_v>\d+),\s+auth_state\s+(?P<auth_state>\d+),\s+auth_mode\s+(?P<auth_mode>\d+),\s+traf_mode\s+(?P<traf_mode>\d+),'
+           r'\s+is_src_ce\s+(?P<is_src_ce>\d+)$',
 
         # DST_AD: si 0xb1, bridge 0, replicate 0, blk_fwd_o 0, v4_mac 0, v6_mac 0, catchall 0, ign_src_lrn 0, port_mask_o 0,
         # afd_cli_f 0, afd_lbl 0, priority 3, dest_mod_idx 0, destined_to_us 0, pv_trunk 0
-        p4 = re.compile(r'^DST_AD:\s+si\s+(?P<si>\S+),\s+bridge\s+(?P<bridge>\d+),\s+replicate\s+(?P<replicate>\d+),\s+blk_fwd_o\s+(?P<blk_fwd_o>\d+),'
-        r'\s+v4_mac\s+(?P<v4_mac>\d+),\s+v6_mac\s+(?P<v6_mac>\d+),\s+catchall\s+(?P<catchall>\d+),\s+ign_src_lrn\s+(?P<ign_src_lrn>\d+),\s+port_mask_o'
-        r'\s+(?P<port_mask_o>\d+),\s+afd_cli_f\s+(?P<afd_cli_f>\d+),\s+afd_lbl\s+(?P<afd_lbl>\d+),\s+priority\s+(?P<priority>\d+),\s+'
-        r'dest_mod_idx\s+(?P<dest_mod_idx>\d+),\s+destined_to_us\s+(?P<destined_to_us>\d+),\s+pv_trunk\s+(?P<pv_trunk>\d+)$')
+        p4=r'^DST_AD:\s+si\s+(?P<si>\S+),\s+bridge\s+(?P<bridge>\d+),\s+replicate\s+(?P<replicate>\d+),\s+blk_fwd_o\s+(?P<blk_fwd_o>\d+),'
+           r'\s+v4_mac\s+(?P<v4_mac>\d+),\s+v6_mac\s+(?P<v6_mac>\d+),\s+catchall\s+(?P<catchall>\d+),\s+ign_src_lrn\s+(?P<ign_src_lrn>\d+),\s+port_mask_o'
+           r'\s+(?P<port_mask_o>\d+),\s+afd_cli_f\s+(?P<afd_cli_f>\d+),\s+afd_lbl\s+(?P<afd_lbl>\d+),\s+priority\s+(?P<priority>\d+),\s+'
+           r'dest_mod_idx\s+(?P<dest_mod_idx>\d+),\s+destined_to_us\s+(?P<destined_to_us>\d+),\s+pv_trunk\s+(?P<pv_trunk>\d+)$',
 
         # Total Mac number of addresses:: 6
-        p5 = re.compile(r'^Total\s+Mac\s+number\s+of\s+addresses::\s+(?P<total_mac_address>\d+)$')
+        p5=r'^Total\s+Mac\s+number\s+of\s+addresses::\s+(?P<total_mac_address>\d+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        p = ShowPlatformMatmMacTable.patterns
 
         ret_dict = dict()
 
@@ -8194,7 +8415,7 @@ class ShowPlatformMatmMacTable(ShowPlatformMatmMacTableSchema):
             line = line.strip()
 
             # HEAD: MAC address 0012.7fae.9662 in VLAN 1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 mac_dict = ret_dict.setdefault('mac_address', {}).setdefault(m.groupdict()['mac_address'], {})
                 mac_dict.setdefault('head', {}).setdefault('vlan', int(m.groupdict()['vlan']))
@@ -8202,7 +8423,7 @@ class ShowPlatformMatmMacTable(ShowPlatformMatmMacTableSchema):
 
             # KEY: vlan 4, mac 0x127fae9662, l3_if 0, gpn 24, epoch 0, static 0, flood_en 0, vlan_lead_wless_flood_en 0,
             # client_home_asic 0, learning_peerid 0, learning_peerid_valid 0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 grp_dict = m.groupdict()
                 tmp_dict = mac_dict.setdefault('key' if grp_dict['key_mask'] == 'KEY' else 'mask', {})
@@ -8221,7 +8442,7 @@ class ShowPlatformMatmMacTable(ShowPlatformMatmMacTableSchema):
 
             # SRC_AD: need_to_learn 0, lrn_v 0, catchall 0, static_mac 0, chain_ptr_v 0, chain_ptr 0, static_entry_v 0,
             # auth_state 0, auth_mode 0, traf_mode 0, is_src_ce 0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 grp_dict = m.groupdict()
                 src_dict = mac_dict.setdefault('src_ad', {})
@@ -8240,7 +8461,7 @@ class ShowPlatformMatmMacTable(ShowPlatformMatmMacTableSchema):
 
             # DST_AD: si 0xb1, bridge 0, replicate 0, blk_fwd_o 0, v4_mac 0, v6_mac 0, catchall 0, ign_src_lrn 0, port_mask_o 0,
             # afd_cli_f 0, afd_lbl 0, priority 3, dest_mod_idx 0, destined_to_us 0, pv_trunk 0
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 grp_dict = m.groupdict()
                 dst_dict = mac_dict.setdefault('dst_ad', {})
@@ -8262,7 +8483,7 @@ class ShowPlatformMatmMacTable(ShowPlatformMatmMacTableSchema):
                 continue
 
             # Total Mac number of addresses:: 6
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ret_dict['total_mac_address'] = int(m.groupdict()['total_mac_address'])
                 continue
@@ -8284,35 +8505,39 @@ class ShowSwitchStackRingSpeed(ShowSwitchStackRingSpeedSchema):
 
     cli_command = 'show switch stack-ring speed'
 
-    def cli(self, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
-
+    patterns = Patterns(
         # Stack Ring Speed        : 240G
-        p1 = re.compile(r'^Stack\s+Ring\s+Speed\s+:\s+(?P<speed>\w+)$')
+        p1=r'^Stack\s+Ring\s+Speed\s+:\s+(?P<speed>\w+)$',
 
         # Stack Ring Configuration: Half
-        p2 = re.compile(r'^Stack\s+Ring\s+Configuration:\s+(?P<configuration>\w+)$')
+        p2=r'^Stack\s+Ring\s+Configuration:\s+(?P<configuration>\w+)$',
 
         # Stack Ring Protocol     : StackWise
-        p3 = re.compile(r'^Stack\s+Ring\s+Protocol\s+:\s+(?P<protocol>\w+)$')
+        p3=r'^Stack\s+Ring\s+Protocol\s+:\s+(?P<protocol>\w+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        p = ShowSwitchStackRingSpeed.patterns
 
         ret_dict = dict()
 
         for line in output.splitlines():
             line = line.strip()
 
-            match = p1.match(line)
+            match = p.p1.match(line)
             if match:
                 ret_dict.update(match.groupdict())
                 continue
 
-            match = p2.match(line)
+            match = p.p2.match(line)
             if match:
                 ret_dict.update(match.groupdict())
                 continue
 
-            match = p3.match(line)
+            match = p.p3.match(line)
             if match:
                 ret_dict.update(match.groupdict())
                 continue
@@ -8331,12 +8556,16 @@ class ShowPlatformUsbStatus(ShowPlatformUsbStatusSchema):
 
     cli_command = 'show platform usb status'
 
+    patterns = Patterns(
+        # USB enabled
+        p1=r'^USB\s+(?P<status>\S+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             output = self.device.execute(self.cli_command)
 
-        # USB enabled
-        p1 = re.compile(r'^USB\s+(?P<status>\S+)$')
+        p = ShowPlatformUsbStatus.patterns
 
         ret_dict = dict()
 
@@ -8344,7 +8573,7 @@ class ShowPlatformUsbStatus(ShowPlatformUsbStatusSchema):
             line = line.strip()
 
             # USB enabled
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict.update(m.groupdict())
                 continue
@@ -8379,18 +8608,22 @@ class ShowPlatformPmInterfaceNumbers(ShowPlatformPmInterfaceNumbersSchema):
     """Parser for show platform pm interface-numbers"""
 
     cli_command = 'show platform pm interface-numbers'
+    patterns = Patterns(
+        # Gi1/0/1       9  1    1    1    1    0x7F2C5B930F40 0x10040    0x20001B   0x4        9
+        p1=r"^(?P<interface>\S+)\s+(?P<iif_id>\d+)\s+(?P<gid>\d+)\s+(?P<slot>\d+)\s+(?P<unit>\d+)\s+(?P<slun>\d+)\s+(?P<hwidb_ptr>\S+)\s+(?P<status>\S+)\s+(?P<status2>\S+)\s+(?P<state>\S+)\s+(?P<snmp_if_index>\d+)$",
+    )
+
     def cli(self, output=None):
         if output is None:
             output = self.device.execute(self.cli_command)
 
-        # Gi1/0/1       9  1    1    1    1    0x7F2C5B930F40 0x10040    0x20001B   0x4        9
+        p = ShowPlatformPmInterfaceNumbers.patterns
 
-        p1 = re.compile(r"^(?P<interface>\S+)\s+(?P<iif_id>\d+)\s+(?P<gid>\d+)\s+(?P<slot>\d+)\s+(?P<unit>\d+)\s+(?P<slun>\d+)\s+(?P<hwidb_ptr>\S+)\s+(?P<status>\S+)\s+(?P<status2>\S+)\s+(?P<state>\S+)\s+(?P<snmp_if_index>\d+)$")
         ret_dict = {}
         for line in output.splitlines():
             line = line.strip()
             # Gi1/0/1       9  1    1    1    1    0x7F2C5B930F40 0x10040    0x20001B   0x4        9
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 interface_var = dict_val['interface']
@@ -8469,36 +8702,39 @@ class ShowProcessesPid(ShowProcessesPidSchema):
 
     cli_command = 'show processes {processid}'
 
-    # Define a function to run the cli_command
-    def cli(self, processid=None, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command.format(processid=processid))
-
-        parsed_dict = {}
-
-        # Define RegExes for each possible kind of line
-
+    patterns = Patterns(
         # Process ID 3 [Network Synchronization Selection Control Process], TTY 0
-        p1 = re.compile(r'^Process +ID +(?P<pid>(\S+)) +\[ *(?P<process_name>([ a-zA-Z0-9]+)) *\], TTY +(?P<tty>(\S+))$')
+        p1=r'^Process +ID +(?P<pid>(\S+)) +\[ *(?P<process_name>([ a-zA-Z0-9]+)) *\], TTY +(?P<tty>(\S+))$',
 
         #   Holding: 41960, Maximum: 0, Allocated: 0, Freed: 0
-        p2 = re.compile(r'^Holding: +(?P<holding>(\d+)), +Maximum: +(?P<maximum>(\d+)), +Allocated: +(?P<allocated>(\d+)), +Freed: +(?P<freed>(\d+))$')
+        p2=r'^Holding: +(?P<holding>(\d+)), +Maximum: +(?P<maximum>(\d+)), +Allocated: +(?P<allocated>(\d+)), +Freed: +(?P<freed>(\d+))$',
 
         #   Getbufs: 0, Retbufs: 0, Stack: 34240/36000
-        p3 = re.compile(r'^Getbufs: +(?P<getbufs>(\d+)), +Retbufs: +(?P<retbufs>(\d+)), Stack: +(?P<stack>(\S+))$')
+        p3=r'^Getbufs: +(?P<getbufs>(\d+)), +Retbufs: +(?P<retbufs>(\d+)), Stack: +(?P<stack>(\S+))$',
 
         #   PC: 64448F4868F5, Invoked: 1, Giveups: 0, uSec: 0
-        p4 = re.compile(r'^PC: +(?P<pc>(\S+)), +Invoked: +(?P<invoked>(\d+)), Giveups: +(?P<giveups>(\d+)), uSec: (?P<u_sec>(\d+))$')
+        p4=r'^PC: +(?P<pc>(\S+)), +Invoked: +(?P<invoked>(\d+)), Giveups: +(?P<giveups>(\d+)), uSec: (?P<u_sec>(\d+))$',
 
         #   5Sec: 0.00%, 1Min: 0.00%, 5Min: 0.00%, Average: 0.00%
-        p5 = re.compile(r'^5Sec: +(?P<five_sec_percent>(\S+))%, +1Min: +(?P<one_min_percent>(\S+))%, +5Min: +(?P<five_min_percent>(\S+))%, +Average: +(?P<average>(\S+))%$')
+        p5=r'^5Sec: +(?P<five_sec_percent>(\S+))%, +1Min: +(?P<one_min_percent>(\S+))%, +5Min: +(?P<five_min_percent>(\S+))%, +Average: +(?P<average>(\S+))%$',
 
         #   Age: 511941589 msec, Runtime: 0 msec
-        p6 = re.compile(r'^Age: +(?P<age>(\S+)) msec, +Runtime: +(?P<runtime>(\d+)) msec$')
+        p6=r'^Age: +(?P<age>(\S+)) msec, +Runtime: +(?P<runtime>(\d+)) msec$',
 
         #   State: Waiting for Event, Priority: Critical
-        p7 = re.compile(r'^State: +(?P<state>([ a-zA-Z0-9]+)), +Priority: +(?P<priority>(\S+))$')
+        p7=r'^State: +(?P<state>([ a-zA-Z0-9]+)), +Priority: +(?P<priority>(\S+))$',
+    )
+
+    # Define a function to run the cli_command
+    def cli(self, processid=None, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(processid=processid))
+
+        parsed_dict = {}
 
+        # Define RegExes for each possible kind of line
+
+        p = ShowProcessesPid.patterns
 
         # Iterate over output lines to check which pattern is matched
 
@@ -8507,7 +8743,7 @@ class ShowProcessesPid(ShowProcessesPidSchema):
 
             # Try matching pattern 1
             # Process ID 3 [Network Synchronization Selection Control Process], TTY 0
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 parsed_dict.setdefault('pid',int(group["pid"]))
@@ -8518,7 +8754,7 @@ class ShowProcessesPid(ShowProcessesPidSchema):
 
             # Try matching pattern 2
             #   Holding: 41960, Maximum: 0, Allocated: 0, Freed: 0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 memory_usage_dict = parsed_dict.setdefault('memory_usage',{})
@@ -8532,7 +8768,7 @@ class ShowProcessesPid(ShowProcessesPidSchema):
 
             # Try matching pattern 3
             #   Getbufs: 0, Retbufs: 0, Stack: 34240/36000
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 memory_usage_dict = parsed_dict.setdefault('memory_usage',{})
@@ -8545,7 +8781,7 @@ class ShowProcessesPid(ShowProcessesPidSchema):
 
             # Try matching pattern 4
             #   PC: 64448F4868F5, Invoked: 1, Giveups: 0, uSec: 0
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 cpu_usage_dict = parsed_dict.setdefault("cpu_usage",{})
@@ -8559,7 +8795,7 @@ class ShowProcessesPid(ShowProcessesPidSchema):
 
             # Try matching pattern 5
             #   5Sec: 0.00%, 1Min: 0.00%, 5Min: 0.00%, Average: 0.00%
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 cpu_usage_dict = parsed_dict.setdefault("cpu_usage",{})
@@ -8573,7 +8809,7 @@ class ShowProcessesPid(ShowProcessesPidSchema):
 
             # Try matching pattern 6
             #   Age: 511941589 msec, Runtime: 0 msec
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 cpu_usage_dict = parsed_dict.setdefault("cpu_usage",{})
@@ -8585,7 +8821,7 @@ class ShowProcessesPid(ShowProcessesPidSchema):
 
             # Try matching pattern 7
             #   State: Waiting for Event, Priority: Critical
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 cpu_usage_dict = parsed_dict.setdefault("cpu_usage",{})
@@ -8635,16 +8871,16 @@ class ShowXfsuEligibility(ShowXfsuEligibilitySchema):
     """
     cli_command = 'show xfsu eligibility'
 
-    def cli(self, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
-
+    patterns = Patterns(
         #Reload fast supported: Yes
-        p1 = re.compile(r'^Reload fast supported: (?P<reload_fast_supported>\w+)$')
+        p1=r'^Reload fast supported: (?P<reload_fast_supported>\w+)$',
+
         #Reload Fast PLATFORM Status: Not started yet
-        p2 = re.compile(r'^Reload Fast PLATFORM Status: (?P<platform_status>[\w\s]+)$')
+        p2=r'^Reload Fast PLATFORM Status: (?P<platform_status>[\w\s]+)$',
+
         #Stack Configuration: Yes
-        p3 = re.compile(r'^Stack Configuration: (?P<stack_configuration>\w+)$')
+        p3=r'^Stack Configuration: (?P<stack_configuration>\w+)$',
+
         #Eligibility Check         Status
         #=================         ======
         #Autoboot Enabled          Yes
@@ -8652,27 +8888,36 @@ class ShowXfsuEligibility(ShowXfsuEligibilitySchema):
         #Network Advantage License Yes
         #Full ring stack           Yes
         #Check macsec eligibility  Eligible
-        p4 = re.compile(r'^(?P<eligibility_check>[\w+ ]+) +(?P<status>Yes|No|Eligible|Ineligible)$')
+        p4=r'^(?P<eligibility_check>[\w+ ]+) +(?P<status>Yes|No|Eligible|Ineligible)$',
+
         #Spanning Tree             Ineligible:Root Switch with forwarding link:VLAN0069
-        p5 = re.compile(r'^Spanning Tree\s+(?P<spanning_tree>\w+):(?P<status>[\w ]+):(?P<forwarding_link>\S+)$')
+        p5=r'^Spanning Tree\s+(?P<spanning_tree>\w+):(?P<status>[\w ]+):(?P<forwarding_link>\S+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        p = ShowXfsuEligibility.patterns
+
         ret_dict = {}
         for line in output.splitlines():
             line = line.strip()
             #Reload fast supported: Yes
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['reload_fast_supported'] = group['reload_fast_supported']
                 continue
 
             #Reload Fast PLATFORM Status: Not started yet
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['reload_fast_platform_stauts'] = group['platform_status']
                 continue
             #Stack Configuration: Yes
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 ret_dict['stack_configuration'] = group['stack_configuration']
@@ -8684,7 +8929,7 @@ class ShowXfsuEligibility(ShowXfsuEligibilitySchema):
             #Network Advantage License Yes
             #Full ring stack           Yes
             #Check macsec eligibility  Eligible
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 root_dict = ret_dict.setdefault('eligibility_check',{})
@@ -8694,7 +8939,7 @@ class ShowXfsuEligibility(ShowXfsuEligibilitySchema):
                         check_dict['status'] = group['status']
                 continue
             #Spanning Tree             Ineligible:Root Switch with forwarding link:VLAN0069
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 root_dict = ret_dict.setdefault('eligibility_check',{})
@@ -8752,53 +8997,57 @@ class ShowSwitchStackPortsDetail(ShowSwitchStackPortsDetailSchema):
     """
     cli_command = 'show switch stack-ports detail'
 
-    def cli(self, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
-
-        # initializing dictionary
-        ret_dict = {}
-
+    patterns = Patterns(
         # 1/1 is DOWN Loopback No
-        p1 = re.compile(r'^(?P<switch_port_id>\S+) is (?P<status>\S+) Loopback (?P<loopback>\S+)$')
+        p1=r'^(?P<switch_port_id>\S+) is (?P<status>\S+) Loopback (?P<loopback>\S+)$',
 
         # Cable Length 50cm     Neighbor NONE
-        p2 = re.compile(r'^Cable Length (?P<cable_length>\S+)\s+Neighbor (?P<neighbor>\S+)$')
+        p2=r'^Cable Length (?P<cable_length>\S+)\s+Neighbor (?P<neighbor>\S+)$',
 
         # Link Ok Yes Sync Ok Yes Link Active No
-        p3 = re.compile(r'^Link Ok (?P<link_ok>\S+) Sync Ok (?P<sync_ok>\S+) Link Active (?P<link_active>\S+)$')
+        p3=r'^Link Ok (?P<link_ok>\S+) Sync Ok (?P<sync_ok>\S+) Link Active (?P<link_active>\S+)$',
 
         # Changes to LinkOK 0
-        p4 = re.compile(r'^Changes to LinkOK (?P<changes_to_link_ok>\d+)$')
+        p4=r'^Changes to LinkOK (?P<changes_to_link_ok>\d+)$',
 
         # Five minute input rate  0 bytes/sec
-        p5 = re.compile(r'^Five minute input rate\s+(?P<five_minute_input_rate>[\S\s]+)$')
+        p5=r'^Five minute input rate\s+(?P<five_minute_input_rate>[\S\s]+)$',
 
         # Five minute output rate 0 bytes/sec
-        p6 = re.compile(r'^Five minute output rate\s+(?P<five_minute_output_rate>[\S\s]+)$')
+        p6=r'^Five minute output rate\s+(?P<five_minute_output_rate>[\S\s]+)$',
 
         # 0 bytes input
-        p7 = re.compile(r'^(?P<input_bytes>\d+) bytes input$')
+        p7=r'^(?P<input_bytes>\d+) bytes input$',
 
         # 0 bytes output
-        p8 = re.compile(r'^(?P<output_bytes>\d+) bytes output$')
+        p8=r'^(?P<output_bytes>\d+) bytes output$',
 
         # Data CRC 0
-        p9 = re.compile(r'^Data CRC\s+(?P<data_crc>\d+)$')
+        p9=r'^Data CRC\s+(?P<data_crc>\d+)$',
 
         # Ringword CRC 0
-        p10 = re.compile(r'^Ringword CRC\s+(?P<ringword_crc>\d+)$')
+        p10=r'^Ringword CRC\s+(?P<ringword_crc>\d+)$',
 
         # InvRingWord  0
-        p11 = re.compile(r'^InvRingWord\s+(?P<inv_ringword>\d+)$')
+        p11=r'^InvRingWord\s+(?P<inv_ringword>\d+)$',
 
         # PcsCodeWord 0
-        p12 = re.compile(r'^PcsCodeWord\s+(?P<pcs_codeword>\d+)$')
+        p12=r'^PcsCodeWord\s+(?P<pcs_codeword>\d+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        # initializing dictionary
+        ret_dict = {}
+
+        p = ShowSwitchStackPortsDetail.patterns
 
         for line in output.splitlines():
             line = line.strip()
             # 1/1 is DOWN Loopback No
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 port_dict = ret_dict.setdefault('stackports',{}).setdefault(group['switch_port_id'],{})
@@ -8808,7 +9057,7 @@ class ShowSwitchStackPortsDetail(ShowSwitchStackPortsDetailSchema):
                 continue
 
             # Cable Length 50cm     Neighbor NONE
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 port_dict['cable_length'] = group['cable_length']
@@ -8816,7 +9065,7 @@ class ShowSwitchStackPortsDetail(ShowSwitchStackPortsDetailSchema):
                 continue
 
             # Link Ok Yes Sync Ok Yes Link Active No
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 port_dict['link_ok'] = group['link_ok']
@@ -8825,42 +9074,42 @@ class ShowSwitchStackPortsDetail(ShowSwitchStackPortsDetailSchema):
                 continue
 
             # Changes to LinkOK 0
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 port_dict['changes_to_link_ok'] = int(group['changes_to_link_ok'])
                 continue
 
             # Five minute input rate  0 bytes/sec
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 port_dict['five_minute_input_rate'] = group['five_minute_input_rate']
                 continue
 
             # Five minute output rate 0 bytes/sec
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 port_dict['five_minute_output_rate'] = group['five_minute_output_rate']
                 continue
 
             # 0 bytes input
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 port_dict['input_bytes'] = int(group['input_bytes'])
                 continue
 
             # 0 bytes output
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 port_dict['output_bytes'] = int(group['output_bytes'])
                 continue
 
             # Data CRC 0
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 error_dict = port_dict.setdefault('crc_errors',{})
@@ -8868,21 +9117,21 @@ class ShowSwitchStackPortsDetail(ShowSwitchStackPortsDetailSchema):
                 continue
 
             # Ringword CRC 0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 error_dict['ringword_crc'] = int(group['ringword_crc'])
                 continue
 
             # InvRingWord  0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 error_dict['inv_ringword'] = int(group['inv_ringword'])
                 continue
 
             # PcsCodeWord 0
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 error_dict['pcs_codeword'] = int(group['pcs_codeword'])
@@ -8914,41 +9163,47 @@ class ShowXfsuStatus(ShowXfsuStatusSchema):
     """
     cli_command = 'show xfsu status'
 
-    def cli(self, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
+    patterns = Patterns(
         # Reload Fast PLATFORM Status: Not started yet
-        p1 = re.compile(r'^Reload Fast PLATFORM Status: (?P<reload_fast_platform_status>.+)$')
+        p1=r'^Reload Fast PLATFORM Status: (?P<reload_fast_platform_status>.+)$',
 
         # Graceful Reload Infra Status: Started in stacking mode, not running
-        p2 = re.compile(r'^Graceful Reload Infra Status: (?P<graceful_reload_infra_status>.+)$')
+        p2=r'^Graceful Reload Infra Status: (?P<graceful_reload_infra_status>.+)$',
 
         # Minimum required system uptime before fast reload can be supported is 5 seconds
-        p3 = re.compile(r'^Minimum required system uptime before fast reload can be supported is (?P<uptime_before_fast_reload>\d+) seconds$')
+        p3=r'^Minimum required system uptime before fast reload can be supported is (?P<uptime_before_fast_reload>\d+) seconds$',
+
         # Client OSPFV3                          : (0x10203004) Status: GR stack none: Up
         # Client OSPF                            : (0x10203003) Status: GR stack none: Up
         # Client IS-IS                           : (0x10203002) Status: GR stack none: Up
         # Client GR_CLIENT_FIB                   : (0x10203001) Status: GR stack none: Up
         # Client GR_CLIENT_RIB                   : (0x10203000) Status: GR stack none: Up
-        p4 = re.compile(r'^Client (?P<client>\S+)\s+: \((?P<id>\S+)\) Status: (?P<status>.+)$')
+        p4=r'^Client (?P<client>\S+)\s+: \((?P<id>\S+)\) Status: (?P<status>.+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        p = ShowXfsuStatus.patterns
 
         ret_dict = {}
         for line in output.splitlines():
             line = line.strip()
 
             # Reload Fast PLATFORM Status: Not started yet
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict['reload_fast_platform_status'] = m.groupdict()['reload_fast_platform_status']
                 continue
             # Graceful Reload Infra Status: Started in stacking mode, not running
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['graceful_reload_infra_status'] = m.groupdict()['graceful_reload_infra_status']
                 continue
 
             # Minimum required system uptime before fast reload can be supported is 5 seconds
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict['uptime_before_fast_reload'] = int(m.groupdict()['uptime_before_fast_reload'])
                 continue
@@ -8958,7 +9213,7 @@ class ShowXfsuStatus(ShowXfsuStatusSchema):
             # Client IS-IS                           : (0x10203002) Status: GR stack none: Up
             # Client GR_CLIENT_FIB                   : (0x10203001) Status: GR stack none: Up
             # Client GR_CLIENT_RIB                   : (0x10203000) Status: GR stack none: Up
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 output_dict = m.groupdict()
                 client_dict = ret_dict.setdefault('client', {}).setdefault(output_dict['client'].lower().replace('-', '_'), {})
@@ -8997,15 +9252,19 @@ class ShowFileSys(ShowFileSysSchema):
 
     cli_command = 'show {filesystem} filesys'
 
-    def cli(self, filesystem, output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command)
-
+    patterns = Patterns(
         # Filesystem: usbflash0
         # Filesystem Path: /mnt/usb0
         # Filesystem Type: vfat
         # Mounted: Read/Write
-        p1 = re.compile(r'^(?P<key>Filesystem|Filesystem Path|Filesystem Type|Mounted):\s+(?P<value>.+)$')
+        p1=r'^(?P<key>Filesystem|Filesystem Path|Filesystem Type|Mounted):\s+(?P<value>.+)$',
+    )
+
+    def cli(self, filesystem, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        p = ShowFileSys.patterns
 
         ret_dict = {}
         for line in output.splitlines():
@@ -9015,7 +9274,7 @@ class ShowFileSys(ShowFileSysSchema):
             # Filesystem Path: /mnt/usb0
             # Filesystem Type: vfat
             # Mounted: Read/Write
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict[m.groupdict()['key'].lower().replace(' ', '_')] = m.groupdict()['value']
                 continue
@@ -9040,6 +9299,11 @@ class ShowFileInformation(ShowFileInformationSchema):
 
     cli_command = 'show file information {file}'
 
+    patterns = Patterns(
+        #type is IOSXE_PACKAGE []
+        p1=r'^type\s+is\s+(?P<file_type>\S+).*$',
+    )
+
     def cli(self, file, output=None):
 
         if output is None:
@@ -9048,12 +9312,12 @@ class ShowFileInformation(ShowFileInformationSchema):
 
         # initialze return dictionary
         ret_dict = {}
-        #type is IOSXE_PACKAGE []
-        p1 = re.compile(r'^type\s+is\s+(?P<file_type>\S+).*$')
+
+        p = ShowFileInformation.patterns
 
         for line in output.splitlines():
             line = line.strip()
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 file_system_dict = ret_dict.setdefault('file_system', {})
@@ -9085,6 +9349,14 @@ class ShowFileDescriptorsDetail(ShowFileDescriptorsDetailSchema):
 
     cli_command = 'show file descriptors detail'
 
+    patterns = Patterns(
+        # 0         0  0000  699  revrcsf:-
+        p1=r'^(?P<file_id>\d+) +(?P<position_id>\d+) +(?P<open_id>\d+) +(?P<pid>\d+) +(?P<path>\w+\:\-)$',
+
+        # Filename: usb0:GD_run_config Fd: 4
+        p2=r'^Filename\: +(?P<file_system>\w+)\:(\/)?(?P<file_name>\w+(\.)?(\w+)?).*$',
+    )
+
     def cli(self, output=None):
 
         if output is None:
@@ -9092,17 +9364,13 @@ class ShowFileDescriptorsDetail(ShowFileDescriptorsDetailSchema):
 
         ret_dict = {}
 
-        # 0         0  0000  699  revrcsf:-
-        p1 = re.compile(r'^(?P<file_id>\d+) +(?P<position_id>\d+) +(?P<open_id>\d+) +(?P<pid>\d+) +(?P<path>\w+\:\-)$')
-
-        # Filename: usb0:GD_run_config Fd: 4
-        p2 = re.compile(r'^Filename\: +(?P<file_system>\w+)\:(\/)?(?P<file_name>\w+(\.)?(\w+)?).*$')
+        p = ShowFileDescriptorsDetail.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # 0         0  0000  699  revrcsf:-
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 file_desc = ret_dict.setdefault('File descriptors', {})
@@ -9115,7 +9383,7 @@ class ShowFileDescriptorsDetail(ShowFileDescriptorsDetailSchema):
                 })
 
             # Filename: usb0:GD_run_config Fd: 4
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 file_dict['file_system'] = group['file_system']
@@ -9145,23 +9413,29 @@ class ShowTimeRange(ShowTimeRangeSchema):
 
     cli_command = 'show time-range {time_range_name}'
 
+    patterns = Patterns(
+        # time-range entry: time1 (active)
+        p1=r"^time-range\s+entry:\s+(?P<time_range_entry>\S+)\s+\((?P<status>\w+)\)$",
+
+        #    periodic daily 22:40 to 22:41
+        p2=r"^\s+periodic\s+(?P<periodicity>\w+)\s+(?P<start_time>\S+)\s+to\s+(?P<end_time>\S+)$",
+
+        #    used in: IPv6 ACL entry
+        p3=r"^\s+used\s+in:\s+(?P<used_in>\S+\s+\S+\s+\S+)$",
+    )
+
     def cli(self, time_range_name, output=None):
         if output is None:
             output = self.device.execute(self.cli_command.format(time_range_name=time_range_name))
 
-        # time-range entry: time1 (active)
-        p1 = re.compile(r"^time-range\s+entry:\s+(?P<time_range_entry>\S+)\s+\((?P<status>\w+)\)$")
-        #    periodic daily 22:40 to 22:41
-        p2 = re.compile(r"^\s+periodic\s+(?P<periodicity>\w+)\s+(?P<start_time>\S+)\s+to\s+(?P<end_time>\S+)$")
-        #    used in: IPv6 ACL entry
-        p3 = re.compile(r"^\s+used\s+in:\s+(?P<used_in>\S+\s+\S+\s+\S+)$")
+        p = ShowTimeRange.patterns
 
         ret_dict = {}
 
         for line in output.splitlines():
 
             # time-range entry: time1 (active)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 dict_val = m.groupdict()
                 ret_dict['time_range_entry'] = dict_val['time_range_entry']
@@ -9169,7 +9443,7 @@ class ShowTimeRange(ShowTimeRangeSchema):
                 continue
 
             #    periodic daily 22:40 to 22:41
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 dict_val = m.groupdict()
                 ret_dict['periodicity'] = dict_val['periodicity']
@@ -9178,7 +9452,7 @@ class ShowTimeRange(ShowTimeRangeSchema):
                 continue
 
             #    used in: IPv6 ACL entry
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 dict_val = m.groupdict()
                 ret_dict['used_in'] = dict_val['used_in']
@@ -9216,21 +9490,25 @@ class ShowPlatformPmEtherchannelGroupMask(ShowPlatformPmEtherchannelGroupMaskSch
 
     cli_command = 'show platform pm etherchannel {ec_channel_group_id} group-mask'
 
-    def cli(self, ec_channel_group_id="", output=None):
-        if output is None:
-            output = self.device.execute(self.cli_command.format(ec_channel_group_id=ec_channel_group_id))
-
+    patterns = Patterns(
         # EC Channel-Group               : 10
-        p1 = re.compile(r"^EC Channel-Group\s+: (?P<ec_channel_group_id>\S+)$")
+        p1=r"^EC Channel-Group\s+: (?P<ec_channel_group_id>\S+)$",
 
         # EC Channel-Group Mac           : 0077.8d99.410e
-        p2 = re.compile(r"^EC Channel-Group Mac\s+: (?P<ec_channel_group_mac>\S+)$")
+        p2=r"^EC Channel-Group Mac\s+: (?P<ec_channel_group_mac>\S+)$",
 
         # # Of Active Ports              : 2
-        p3 = re.compile(r"^# Of Active Ports\s+: (?P<of_active_ports>\S+)$")
+        p3=r"^# Of Active Ports\s+: (?P<of_active_ports>\S+)$",
 
         # If Name                                  If Id                  EC Index
-        p4 = re.compile(r"^(?P<interface_name>\S+) +(?P<interface_id>[\w\s]+)\s+(?P<ec_index>[\d]+)$")
+        p4=r"^(?P<interface_name>\S+) +(?P<interface_id>[\w\s]+)\s+(?P<ec_index>[\d]+)$",
+    )
+
+    def cli(self, ec_channel_group_id="", output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command.format(ec_channel_group_id=ec_channel_group_id))
+
+        p = ShowPlatformPmEtherchannelGroupMask.patterns
 
         ret_dict = {}
 
@@ -9238,7 +9516,7 @@ class ShowPlatformPmEtherchannelGroupMask(ShowPlatformPmEtherchannelGroupMaskSch
             line = line.strip()
 
             # EC Channel-Group               : 10
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 ether_dict = ret_dict.setdefault('etherchannel',{}).setdefault(int(group['ec_channel_group_id']),{})
@@ -9246,21 +9524,21 @@ class ShowPlatformPmEtherchannelGroupMask(ShowPlatformPmEtherchannelGroupMaskSch
                 continue
 
             # EC Channel-Group Mac           : 0077.8d99.410e
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 dict_val = m.groupdict()
                 ether_dict['ec_channel_group_mac'] = dict_val['ec_channel_group_mac']
                 continue
 
             # # Of Active Ports              : 2
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 dict_val = m.groupdict()
                 ether_dict['active_ports'] = int(dict_val['of_active_ports'])
                 continue
 
             # If Name                                  If Id                  EC Index
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 name = m.groupdict()
                 key_chain_dict = ether_dict.setdefault('interface', {}).setdefault(Common.convert_intf_name(name['interface_name']), {})
@@ -9288,6 +9566,14 @@ class TestPlatformSoftwareDatabase(TestPlatformSoftwareDatabaseSchema):
 
     cli_command = 'test platform software database get-n all ios_oper/{component}'
 
+    patterns = Patterns(
+        # Table Record Index 0 = {
+        p1=r"^Table\s+Record\s+Index\s+(?P<index>\d+)\s+=\s+{$",
+
+        # [0] cname = Fan1/1
+        p2=r"^\s*\[(?P<index>\d+)\]\s+(?P<key>\S+)\s+=\s+(?P<value>.*)$",
+    )
+
     def cli(self, component, output=None):
         if output is None:
             # execute command to get output
@@ -9296,11 +9582,7 @@ class TestPlatformSoftwareDatabase(TestPlatformSoftwareDatabaseSchema):
         # Initialize the ret_dict
         ret_dict = {}
 
-        # Table Record Index 0 = {
-        p1 = re.compile(r"^Table\s+Record\s+Index\s+(?P<index>\d+)\s+=\s+{$")
-
-        # [0] cname = Fan1/1
-        p2 = re.compile(r"^\s*\[(?P<index>\d+)\]\s+(?P<key>\S+)\s+=\s+(?P<value>.*)$")
+        p = TestPlatformSoftwareDatabase.patterns
 
         # Initialize variables to hold temporary values
         index = None
@@ -9311,14 +9593,14 @@ class TestPlatformSoftwareDatabase(TestPlatformSoftwareDatabaseSchema):
             line = line.strip()
 
             # Table Record Index 0 = {
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 index = m.group("index")
                 table_record[index] = {}
                 continue
 
             # [0] cname = Fan1/1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m and index is not None:
                 key = m.group("key")
                 value_str = m.group("value")
@@ -8,6 +8,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+# Parser utils
+from genie.libs.parser.utils.streaming import iter_lines, iter_records
+
 
 # ====================================================
 #  distributor class for show ip route
@@ -205,6 +208,27 @@ class ShowIpRoute(ShowIpRouteSchema):
         else:
             out = output
 
+        result_dict = {}
+        for _ in self._iter_routes(out.splitlines(), result_dict, vrf=vrf):
+            pass
+
+        return result_dict
+
+    def parse_iter(self, output, vrf=None):
+        """ Parse the output route by route, without building the whole
+            structure. The output can be a string, a file object or any
+            iterable of lines.
+
+            Yields ((vrf, address_family, route), route_dict) of each
+            route, route_dict being the dict of the route in the
+            structure returned by cli()
+        """
+        return iter_records(self._iter_routes(iter_lines(output), {}, vrf=vrf))
+
+    def _iter_routes(self, lines, result_dict, vrf=None):
+        """ Parse the lines into result_dict, yields (keys, routes dict,
+            route dict) each time a route is updated
+        """
         af = self.IP_VER
         route = ""
         if not vrf:
@@ -231,8 +255,6 @@ class ShowIpRoute(ShowIpRouteSchema):
         source_protocol_dict['omp'] = ['m']
         source_protocol_dict['nat_dia'] = ['n', 'Nd']
 
-        result_dict = {}
-
         # initial regexp pattern
         p100 = re.compile(r'^Routing +entry +for +'
                         '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
@@ -343,7 +365,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                         r'( +(?P<interface>[\w\.\/\-\_]+[\w\:\.\%]+),?)?,?( +receive)?'
                         r'( +directly connected)?( +indirectly connected)?$')
         
-        for line in out.splitlines():
+        for line in lines:
             if line:
                 line = line.strip()
             else:
@@ -431,9 +453,11 @@ class ShowIpRoute(ShowIpRouteSchema):
                 updated = group.get('date', None)
                 nh_vrf = group.get('nh_vrf', None)
 
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                routes_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                         .setdefault('address_family', {}).setdefault(af, {})\
+                                         .setdefault('routes', {})
+                route_dict = routes_dict.setdefault(route, {})
+                yield (vrf, af, route), routes_dict, route_dict
 
                 route_dict['route'] = route
                 route_dict['active'] = active
@@ -532,9 +556,11 @@ class ShowIpRoute(ShowIpRouteSchema):
                     #'vrf': 'vrf-blue:ipv6'
                     if m.groupdict()['nh_vrf']:
                         nh_vrf = m.groupdict()['nh_vrf']
-                    route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                            .setdefault('address_family', {}).setdefault(af, {})\
-                                            .setdefault('routes', {}).setdefault(route, {})
+                    routes_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                             .setdefault('address_family', {}).setdefault(af, {})\
+                                             .setdefault('routes', {})
+                    route_dict = routes_dict.setdefault(route, {})
+                    yield (vrf, af, route), routes_dict, route_dict
 
                     # 'route': '192.168.1.20/32',
                     route_dict['route'] = route
@@ -627,9 +653,11 @@ class ShowIpRoute(ShowIpRouteSchema):
                     if m.groupdict()['nh_vrf']:
                         nh_vrf = m.groupdict()['nh_vrf']
 
-                    route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                            .setdefault('address_family', {}).setdefault(af, {})\
-                                            .setdefault('routes', {}).setdefault(route, {})
+                    routes_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                             .setdefault('address_family', {}).setdefault(af, {})\
+                                             .setdefault('routes', {})
+                    route_dict = routes_dict.setdefault(route, {})
+                    yield (vrf, af, route), routes_dict, route_dict
 
                     # 'route': '192.168.1.20/32',
                     route_dict['route'] = route
@@ -683,9 +711,11 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if m.groupdict()['date']:
                     updated = m.groupdict()['date']
 
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                routes_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                         .setdefault('address_family', {}).setdefault(af, {})\
+                                         .setdefault('routes', {})
+                route_dict = routes_dict.setdefault(route, {})
+                yield (vrf, af, route), routes_dict, route_dict
 
                 route_dict['route'] = route
                 route_dict['active'] = active
@@ -734,9 +764,11 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if m.groupdict()['date']:
                     updated = m.groupdict()['date']
 
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                routes_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                         .setdefault('address_family', {}).setdefault(af, {})\
+                                         .setdefault('routes', {})
+                route_dict = routes_dict.setdefault(route, {})
+                yield (vrf, af, route), routes_dict, route_dict
 
                 route_dict['route'] = route
 
@@ -784,9 +816,11 @@ class ShowIpRoute(ShowIpRouteSchema):
                     interface = m.groupdict()['interface']
 
                 index += 1
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
+                routes_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+                                         .setdefault('address_family', {}).setdefault(af, {})\
+                                         .setdefault('routes', {})
+                route_dict = routes_dict.setdefault(route, {})
+                yield (vrf, af, route), routes_dict, route_dict
 
                 route_dict['route'] = route
                 route_dict['active'] = active
@@ -825,7 +859,9 @@ class ShowIpRoute(ShowIpRouteSchema):
                 group = m.groupdict()
                 entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
                                                                                               {}).setdefault(af, {})
-                route_dict = entry_dict.setdefault('routes', {}).setdefault(route, {})
+                routes_dict = entry_dict.setdefault('routes', {})
+                route_dict = routes_dict.setdefault(route, {})
+                yield (vrf, af, route), routes_dict, route_dict
                 route_dict.update({'route': group['ip']})
                 route_dict.update({'mask': group['mask']})
                 route_dict.update({'active': True})
@@ -900,8 +936,6 @@ class ShowIpRoute(ShowIpRouteSchema):
                 path_dict.update({k: v for k, v in group.items() if v})
                 continue
 
-        return result_dict
-
 class ShowIpv6Route(ShowIpRoute):
     """Parser for:
         show ipv6 route
@@ -72,6 +72,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.streaming import iter_lines, iter_records
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -115,21 +117,14 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
     cli_command = ['show bgp egress-engineering']
     
 
-    def cli (self, output=None):
-        if output is None:
-            out=self.device.execute(self.cli_command[0])
-        else:
-            out = output
-
-        ret_dict = {}
-
+    patterns = Patterns(
         #  Egress Engineering Peer Set: 192.168.1.2/32 (10b87210)
-        p1 = re.compile(r'Egress +Engineering +Peer +Set: +(?P<prefix>[\d\/\.]+) '
-        '+(?P<peer_set_id>\S+)')
+        p1=r'Egress +Engineering +Peer +Set: +(?P<prefix>[\d\/\.]+) '
+            '+(?P<peer_set_id>\S+)',
 
         #   Version: 2, rn_version: 2
-        p2 = re.compile(r'(?P<key_1>[\w\s]+): +(?P<value_1>[\S\s]+), +(?P<key_2>[\w\s]+): '
-        '+(?P<value_2>\d+)')
+        p2=r'(?P<key_1>[\w\s]+): +(?P<value_1>[\S\s]+), +(?P<key_2>[\w\s]+): '
+            '+(?P<value_2>\d+)',
 
         #    Local ASN: 1
         #     Remote ASN: 2
@@ -137,13 +132,24 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
         #     Remote RID: 10.4.1.4
         #     First Hop: 192.168.1.2
         #         NHID: 3
-        p3 = re.compile(r'(?P<key>[\w\s]+): (?P<value>[\S\s]+)')
+        p3=r'(?P<key>[\w\s]+): (?P<value>[\S\s]+)',
+    )
+
+    def cli (self, output=None):
+        if output is None:
+            out=self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        ret_dict = {}
+
+        p = ShowBgpEgressEngineering.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             #  Egress Engineering Peer Set: 192.168.1.2/32 (10b87210)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 peer_dict = ret_dict.setdefault( 'peer_set',{}).\
@@ -153,7 +159,7 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
                 continue
 
             # Version: 2, rn_version: 2
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 values = list(group.values())
@@ -171,7 +177,7 @@ class ShowBgpEgressEngineering(ShowBgpEgressEngineeringSchema):
             #  First Hop: 10.121.88.1, 10.1.0.1, 10.204.0.1
             #   NHID: 9, 10, 11
             #   IFH: 0x110, 0x130, 0x150
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 if group['key'].strip().lower().replace(' ','_') == 'first_hop'\
@@ -220,20 +226,23 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
 
     cli_command = 'show bgp instances'
 
+    patterns = Patterns(
+        p1=r'^(?P<instance_id>\d+) +(?P<placed_grp>[\w\_|\-]+) '
+           r'+(?P<instance>[\w\-]+) +(?P<bgp_id>[\d\.]+) '
+           r'+(?P<num_vrfs>\d+)? +(?P<address_family>[\w\s\,\-]+)$',
+        p1_1=r'(ID +Placed-Grp +Name +AS +VRFs +Address +Families)|(\-)+',
+        p2=r'^(?P<address_family>[(IPv|VPNv)\d Unicast\,]+)$',
+        p3=r'^Number +of +BGP +instances\: '
+           r'+(?P<number_of_bgp_instances>\d+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        p1 = re.compile(r'^(?P<instance_id>\d+) +(?P<placed_grp>[\w\_|\-]+) '
-                        r'+(?P<instance>[\w\-]+) +(?P<bgp_id>[\d\.]+) '
-                        r'+(?P<num_vrfs>\d+)? +(?P<address_family>[\w\s\,\-]+)$')
-
-        p1_1 = re.compile(r'(ID +Placed-Grp +Name +AS +VRFs +Address +Families)|(\-)+')
-        p2 = re.compile(r'^(?P<address_family>[(IPv|VPNv)\d Unicast\,]+)$')
-        p3 = re.compile(r'^Number +of +BGP +instances\: '
-                        r'+(?P<number_of_bgp_instances>\d+)$')
+        p = ShowBgpInstances.patterns
 
         ret_dict = {}
 
@@ -247,7 +256,7 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
             # 2   bgp3_1      test2             333       0       none
             # 3   bgp4_1      default           100       2       IPv4 Unicast, VPNv4 Unicast,
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance_id = m.groupdict()['instance_id']
                 placed_grp = m.groupdict()['placed_grp']
@@ -283,12 +292,12 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
 
             # ID  Placed-Grp  Name              AS        VRFs    Address Families
             # --------------------------------------------------------------------------------
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 continue
 
             #                                                     IPv6 Unicast, VPNv6 Unicast
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 address_family_extra_line = m.groupdict()['address_family'].lower()
                 if address_family_extra_line and address_family_extra_line != 'none':
@@ -298,7 +307,7 @@ class ShowBgpInstances(ShowBgpInstancesSchema):
                     ret_dict['instance'][instance]['address_families'] = address_family_lst
 
             # Number of BGP instances: 1
-            m3 = p3.match(line)
+            m3 = p.p3.match(line)
             if m3:
                 num = int(m3.groupdict()['number_of_bgp_instances'])
                 ret_dict['number_of_bgp_instances'] = num
@@ -338,6 +347,17 @@ class ShowPlacementProgramAll(ShowPlacementProgramAllSchema):
 
     cli_command = 'show placement program all'
 
+    patterns = Patterns(
+        p1=r'^\s*(?P<program>[a-zA_Z0-9\_\-]+)'
+            '(?:\((?P<instance>\S+)\))?'
+            ' +(?P<group>\S+)'
+            ' +(?P<jid>\S+)'
+            ' +(?P<active_rp>\S+)'
+            ' +(?P<active_state>\S+)'
+            ' +(?P<standby_rp>\S+)'
+            ' +(?P<standby_state>\S+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -345,14 +365,8 @@ class ShowPlacementProgramAll(ShowPlacementProgramAllSchema):
             out = output
 
         ret_dict = {}
-        p1 = re.compile(r'^\s*(?P<program>[a-zA_Z0-9\_\-]+)'
-                        '(?:\((?P<instance>\S+)\))?'
-                        ' +(?P<group>\S+)'
-                        ' +(?P<jid>\S+)'
-                        ' +(?P<active_rp>\S+)'
-                        ' +(?P<active_state>\S+)'
-                        ' +(?P<standby_rp>\S+)'
-                        ' +(?P<standby_state>\S+)$')
+
+        p = ShowPlacementProgramAll.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -361,7 +375,7 @@ class ShowPlacementProgramAll(ShowPlacementProgramAllSchema):
             # rcp_fs                                  central-services    1168 0/0/CPU0       RUNNING                  NONE           NOT_SPAWNED
             # bgp(test)                               Group_10_bgp2       1052 0/RSP1/CPU0    RUNNING                  0/RSP0/CPU0    RUNNING
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 program = str(m.groupdict()['program'])
                 instance = m.groupdict()['instance'] or 'default'
@@ -448,6 +462,40 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
 
     cli_command = 'show run formal | i af-group'
 
+    patterns = Patterns(
+        pp1=r'\s*router +bgp +(?P<bgp_id>\d+)'
+             '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
+             ' +af-group +(?P<pp_name>[a-zA-Z0-9\-\_]+)',
+        p1=r'^af\-group +(?P<pp>[\w\-\.\:]+) +'
+            'address\-family +(?P<af>[\w\s]+)$',
+        p2=r'^default\-originate *(policy)? *'
+            '(?P<policy>[\w\-\.\:\s]+)? +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p3=r'^maximum\-prefix +'
+            '(?P<no>[\d]+)? +(?P<th>[\d]+)? +(?P<re>[\d]+)? +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p4=r'^next\-hop\-self +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p5=r'^policy +(?P<map>[\w]+) +in +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p6=r'^policy +(?P<map>[\w]+) +out +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p7=r'^route\-reflector\-client +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p8=r'^send\-community\-ebgp +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p9=r'^send\-extended\-community\-ebgp +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p10=r'^site\-of\-origin +(?P<soo>[\w\:]+) +'
+             '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p11=r'^soft\-reconfiguration +(?P<soft>[\w\s]+) +'
+             '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p12=r'^allowas\-in +(?P<al>\d+)? *'
+             '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p13=r'^as\-override *'
+             '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -455,37 +503,8 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
             out = output
 
         ret_dict = {}
-        pp1 = re.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
-                         '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
-                         ' +af-group +(?P<pp_name>[a-zA-Z0-9\-\_]+)')
-        p1 = re.compile(r'^af\-group +(?P<pp>[\w\-\.\:]+) +'
-                        'address\-family +(?P<af>[\w\s]+)$')
-        p2 = re.compile(r'^default\-originate *(policy)? *'
-                        '(?P<policy>[\w\-\.\:\s]+)? +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p3 = re.compile(r'^maximum\-prefix +'
-                        '(?P<no>[\d]+)? +(?P<th>[\d]+)? +(?P<re>[\d]+)? +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p4 = re.compile(r'^next\-hop\-self +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p5 = re.compile(r'^policy +(?P<map>[\w]+) +in +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p6 = re.compile(r'^policy +(?P<map>[\w]+) +out +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p7 = re.compile(r'^route\-reflector\-client +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p8 = re.compile(r'^send\-community\-ebgp +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p9 = re.compile(r'^send\-extended\-community\-ebgp +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p10 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+) +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p11 = re.compile(r'^soft\-reconfiguration +(?P<soft>[\w\s]+) +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p12 = re.compile(r'^allowas\-in +(?P<al>\d+)? *'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p13 = re.compile(r'^as\-override *'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+
+        p = ShowBgpInstanceAfGroupConfiguration.patterns
 
         cmd = ''
 
@@ -494,7 +513,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
 
             # router bgp 100 af-group af_group address-family ipv4 unicast
 
-            mm1 = pp1.match(line1)
+            mm1 = p.pp1.match(line1)
             if mm1:
                 pp_name = mm1.groupdict()['pp_name']
                 if mm1.groupdict()['instance_name'] is not None:
@@ -524,7 +543,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
                     line = line.strip()
                     # af_group address-family IPv4 Unicast
 
-                    m = p1.match(line)
+                    m = p.p1.match(line)
                     if m:
                         af = m.groupdict()['af'].lower()
                         if af:
@@ -534,7 +553,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # default-originate policy allpass            []
 
-                    m = p2.match(line)
+                    m = p.p2.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['default_originate'] = True
@@ -551,7 +570,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # maximum-prefix 429 75 35                    []
 
-                    m = p3.match(line)
+                    m = p.p3.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['maximum_prefix_max_prefix_no'] = int(m.groupdict()['no'])
@@ -571,7 +590,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # next-hop-self                               []
 
-                    m = p4.match(line)
+                    m = p.p4.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['next_hop_self'] = True
@@ -583,7 +602,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # policy allpass in                           []
 
-                    m = p5.match(line)
+                    m = p.p5.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['route_map_name_in'] = m.groupdict()['map']
@@ -595,7 +614,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # policy allpass out                          []
 
-                    m = p6.match(line)
+                    m = p.p6.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['route_map_name_out'] = m.groupdict()['map']
@@ -607,7 +626,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # route-reflector-client                      []
 
-                    m = p7.match(line)
+                    m = p.p7.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['route_reflector_client'] = True
@@ -619,7 +638,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # send-community-ebgp                         []
 
-                    m = p8.match(line)
+                    m = p.p8.match(line)
                     if m:
                         send_community.append('standard')
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
@@ -632,7 +651,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # send-extended-community-ebgp                []
 
-                    m = p9.match(line)
+                    m = p.p9.match(line)
                     if m:
                         send_community.append('extended')
         
@@ -655,7 +674,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # site-of-origin 100:1                        []
 
-                    m = p10.match(line)
+                    m = p.p10.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['soo'] = m.groupdict()['soo']
@@ -667,7 +686,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # soft-reconfiguration inbound always         []
 
-                    m = p11.match(line)
+                    m = p.p11.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['soft_reconfiguration'] = m.groupdict()['soft'].strip()
@@ -680,7 +699,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # allowas-in 10                               []
 
-                    m = p12.match(line)
+                    m = p.p12.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['allowas_in'] = True
@@ -696,7 +715,7 @@ class ShowBgpInstanceAfGroupConfiguration(ShowBgpInstanceAfGroupConfigurationSch
         
                     # as-override                                 []
 
-                    m = p13.match(line)
+                    m = p.p13.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['pp_name'][pp_name]\
                             ['as_override'] = True
@@ -766,6 +785,39 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
     cli_command = 'show run formal | i session-group'
 
+    patterns = Patterns(
+        pp1=r'\s*router +bgp +(?P<bgp_id>\d+)'
+             '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
+             '(?: +neighbor +(?P<neighbor_id>[0-9\.\:]+) +use)?'
+             ' +session-group +(?P<ps_name>[a-zA-Z0-9\-\_]+)',
+        p2=r'^remote\-as +(?P<as>\d+)? +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p3=r'^description +(?P<descr>[\w\,\.\:\-\s]+) +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p4=r'^ebgp\-multihop +(?P<num>\d+)? *'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p5=r'^local\-as +(?P<as>\d+) +(?P<v1>no\-prepend)? +'
+            '(?P<v2>replace\-as)? *(?P<v3>dual\-as)? *'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p6=r'^password +encrypted +(?P<psw>\w+) +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p7=r'^shutdown +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p8=r'^timers +(?P<keep>\d+) +'
+            '(?P<hold>\d+) +(?P<mim>\d+)? *'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p9=r'^update\-source +(?P<intf>[\w\.\/]+) +'
+            '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p10=r'^suppress\-4byteas +'
+             '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p11=r'^session\-open\-mode +(?P<mode>[\w\-]+) +'
+             '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p12=r'^bfd fast-detect +'
+             '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+        p13=r'^ignore\-connected *'
+             '\[(?P<inherit>[\w\-\.\:\s]+)?\]$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -775,36 +827,8 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
         ret_dict = {}
 
         cmd = ''
-        pp1 = re.compile(r'\s*router +bgp +(?P<bgp_id>\d+)'
-                         '(?: +instance +(?P<instance_name>[a-zA-Z0-9]+))?'
-                         '(?: +neighbor +(?P<neighbor_id>[0-9\.\:]+) +use)?'
-                         ' +session-group +(?P<ps_name>[a-zA-Z0-9\-\_]+)')
-        p2 = re.compile(r'^remote\-as +(?P<as>\d+)? +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p3 = re.compile(r'^description +(?P<descr>[\w\,\.\:\-\s]+) +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p4 = re.compile(r'^ebgp\-multihop +(?P<num>\d+)? *'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p5 = re.compile(r'^local\-as +(?P<as>\d+) +(?P<v1>no\-prepend)? +'
-                        '(?P<v2>replace\-as)? *(?P<v3>dual\-as)? *'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p6 = re.compile(r'^password +encrypted +(?P<psw>\w+) +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p7 = re.compile(r'^shutdown +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p8 = re.compile(r'^timers +(?P<keep>\d+) +'
-                        '(?P<hold>\d+) +(?P<mim>\d+)? *'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p9 = re.compile(r'^update\-source +(?P<intf>[\w\.\/]+) +'
-                        '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p10 = re.compile(r'^suppress\-4byteas +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p11 = re.compile(r'^session\-open\-mode +(?P<mode>[\w\-]+) +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p12 = re.compile(r'^bfd fast-detect +'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
-        p13 = re.compile(r'^ignore\-connected *'
-                         '\[(?P<inherit>[\w\-\.\:\s]+)?\]$')
+
+        p = ShowBgpInstanceSessionGroupConfiguration.patterns
 
         for line1 in out.splitlines():
             line1 = line1.strip()
@@ -813,7 +837,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
             # router bgp 333 instance test session-group abcd
             # router bgp 333 instance test neighbor 10.4.1.1 use session-group LALALALLA
 
-            mm1 = pp1.match(line1)
+            mm1 = p.pp1.match(line1)
             if mm1:
                 ps_name = str(mm1.groupdict()['ps_name'])
                 if mm1.groupdict()['instance_name'] is not None:
@@ -845,7 +869,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # remote-as 333                              []
 
-                    m = p2.match(line)
+                    m = p.p2.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['remote_as'] = int(m.groupdict()['as'])
@@ -857,7 +881,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # description SG_group                       []
 
-                    m = p3.match(line)
+                    m = p.p3.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['description'] = m.groupdict()['descr'].strip()
@@ -869,7 +893,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # ebgp-multihop 254                         []
 
-                    m = p4.match(line)
+                    m = p.p4.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['ebgp_multihop_enable'] = True
@@ -885,7 +909,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # local-as 200 no-prepend replace-as dual-as []
 
-                    m = p5.match(line)
+                    m = p.p5.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['local_as_as_no'] = int(m.groupdict()['as'])
@@ -907,7 +931,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # password encrypted 094F471A1A0A464058      []
 
-                    m = p6.match(line)
+                    m = p.p6.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['password_text'] = m.groupdict()['psw']
@@ -919,7 +943,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # shutdown                                   []
 
-                    m = p7.match(line)
+                    m = p.p7.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['shutdown'] = True
@@ -931,7 +955,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # timers 10 30 3                             []
 
-                    m = p8.match(line)
+                    m = p.p8.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['keepalive_interval'] = int(m.groupdict()['keep'])
@@ -950,7 +974,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # update-source Loopback0                    []
 
-                    m = p9.match(line)
+                    m = p.p9.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['update_source'] = m.groupdict()['intf'].lower()
@@ -961,7 +985,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # suppress-4byteas                        []
 
-                    m = p10.match(line)
+                    m = p.p10.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['suppress_four_byte_as_capability'] = True
@@ -972,7 +996,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # session-open-mode active-only              []
 
-                    m = p11.match(line)
+                    m = p.p11.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['transport_connection_mode'] = m.groupdict()['mode']
@@ -983,7 +1007,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # bfd fast-detect                            []
 
-                    m = p12.match(line)
+                    m = p.p12.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['fall_over_bfd'] = True
@@ -994,7 +1018,7 @@ class ShowBgpInstanceSessionGroupConfiguration(ShowBgpInstanceSessionGroupConfig
 
                     # ignore-connected                           []
 
-                    m = p13.match(line)
+                    m = p.p13.match(line)
                     if m:
                         ret_dict['instance'][instance_name]['peer_session'][ps_name]\
                             ['disable_connected_check'] = True
@@ -1187,6 +1211,112 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                'allocated', 'freed', 'received_updates', 'num_of_scan_segments', 'state',
                'restart_count', 'memory_used', 'number']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$',
+        p1_1=r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$',
+        p1_1_1=r'^BGP +Process +Information: +VRF +(?P<vrf>[\S]+)$',
+        p1_2=r'^\s*BGP *Route *Distinguisher:'
+              ' *(?P<route_distinguisher>\S+)$',
+        p2=r'BGP *is *operating *in *'
+            '(?P<operation_mode>\w+) *mode$',
+        p3=r'^Autonomous *System *number *format: *'
+            '(?P<as_format>[a-zA-Z]+)$',
+
+        #Autonomous System: 65108.65108
+        p4=r'^Autonomous *System: *(?P<as_number>[0-9\.]+)$',
+        p5=r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
+            '(\([\w\s]+\))?$',
+        p6_1=r'^Default *Cluster *ID: *'
+              '(?P<default_cluster_id>[\w\.\:]+) *'
+              '(\([\w\s\:\.\,]+\))?$',
+        p6_2=r'^Active *Cluster *IDs: *'
+              '(?P<active_cluster_id>[\w\.\:]+)$',
+        p7_1=r'^Always compare MED is enabled$',
+        p7_2=r'^Comparing router ID for eBGP paths$',
+        p7_4=r'^Treating missing MED as worst$',
+        p8=r'^Fast +external +fallover +enabled$',
+        p9=r'^Platform *RLIMIT *max: *'
+            '(?P<platform_rlimit_max>[0-9\,]+) *bytes$',
+        p10=r'^Maximum +limit +for +BMP +buffer +size: *'
+             '(?P<size>[a-zA-Z0-9]+) *MB$',
+        p11=r'^Default *value *for *BMP *buffer *size: *'
+             '(?P<size>[a-zA-Z0-9]+) *MB$',
+        p12=r'^Current *limit *for *BMP *buffer *size: *'
+             '(?P<size>[a-zA-Z0-9]+) *MB$',
+        p13=r'^Current *utilization *of *BMP *buffer *'
+             'limit: *(?P<limit>[a-zA-Z0-9]+) *B$',
+        p14=r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$',
+        p15=r'^Enforce +first +AS +(?P<as_enabled>\w+)$',
+        p16=r'^Default *local *preference: *'
+             '(?P<preference>[0-9]+)$',
+        p17=r'^Default *keepalive: *(?P<keepalive>[0-9]+)$',
+        p18=r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$',
+        p19=r'^Update *delay: *(?P<update_delay>[0-9]+)$',
+        p20=r'^Generic *scan *interval: *'
+             '(?P<scan_interval>[0-9]+)$',
+        p21=r'^BGP *Speaker *process: *'
+             '(?P<speaker>\w+), +Node: +(?P<node>\w+)$',
+        p22=r'^Restart *count: *(?P<restart_count>[0-9]+)$',
+        p23=r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
+             '(?P<total>[0-9]+) +'
+             '(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$',
+        p24_1=r'^Updates:'
+               ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$',
+        p24_2=r'^Notifications:'
+               ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$',
+        p26=r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
+             '(?P<free>\d+)$',
+        p25=r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
+             '(?P<memory_used>[0-9]+)$',
+        p29=r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$',
+        p29_1=r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
+               ' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
+               '(?: +\(Table +(?P<table_state>[a-z]+)\))?$',
+        p30=r'^Dampening +is +(?P<dampening>[\w\s]+)$',
+        p31=r'^Client +reflection +is +enabled +in +global +config$',
+        p31_1=r'^Client +reflection +is +not +enabled +in +global +config$',
+        p32=r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$',
+        p33=r'^Dynamic *MED *interval *: *'
+             '(?P<interval>[a-zA-Z0-9\s]+)$',
+        p34=r'^Dynamic *MED *Timer *: *'
+             '(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$',
+        p35=r'^Dynamic *MED *Periodic *Timer *: *'
+             '(?P<timer>[a-zA-Z0-9\s]+)$',
+        p36=r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$',
+        p37=r'^Total *prefixes *scanned: *'
+             '(?P<scan>[a-zA-Z0-9\s]+)$',
+        p38=r'^Prefixes *scanned *per *segment: *'
+             '(?P<prefix_scan>[a-zA-Z0-9\s]+)$',
+        p39=r'^Number *of *scan *segments: *'
+             '(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$',
+        p40=r'^Nexthop *resolution *minimum *prefix\-length: *'
+             '(?P<length>[\w\s\(\)]+)$',
+        p41=r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$',
+        p42=r'^Table *version *synced *to *RIB: *'
+             '(?P<rib>[a-zA-Z0-9\s]+)$',
+        p43=r'^Table *version *acked *by *RIB: *'
+             '(?P<rib>[a-zA-Z0-9\s]+)$',
+        p44=r'^RIB *has *not *converged: *'
+             '(?P<rib>[a-zA-Z0-9\s]+)$',
+        p54=r'^RIB *table *prefix\-limit *reached +\? *'
+             '\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$',
+        p45=r'^Permanent +Network +(?P<status>\w+)$',
+        p46=r'^State: *(?P<state>[a-zA-Z\s]+).$',
+        p47=r'^BGP *Table *Version: *(?P<tab_ver>\w+)$',
+        p48=r'^Attribute *download: *(?P<attr>[\w\s]+)$',
+        p49=r'^Label *retention *timer *value *'
+             '(?P<timer>[a-zA-Z0-9\s]+)$',
+        p50=r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$',
+        p51=r'^Table *bit\-field *size *: *'
+             '(?P<size>[0-9\s]+) *Chunk *element *size *: *'
+             '(?P<elememt_size>\d+)$',
+        p52=r'^(?P<thread>\w+\s\w+) *'
+             '(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
+             '(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$',
+        p53=r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
+             '(?P<v2>[0-9]+)$',
+    )
+
     def cli(self, vrf_type='all', instance='all', vrf='all', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
@@ -1208,109 +1338,9 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                                                    vrf=vrf))
         else:
             out = output
-        p1 = re.compile(r'^\s*BGP +instance +(?P<num>\S+): +\'(?P<instance>\S+)\'$')
-        p1_1 = re.compile(r'^\s*VRF: +(?P<vrf>[a-zA-Z0-9\_]+)$')
-        p1_1_1 = re.compile(r'^BGP +Process +Information: +VRF +(?P<vrf>[\S]+)$')
-        p1_2 = re.compile(r'^\s*BGP *Route *Distinguisher:'
-                          ' *(?P<route_distinguisher>\S+)$')
-        p2 = re.compile(r'BGP *is *operating *in *'
-                        '(?P<operation_mode>\w+) *mode$')
-        p3 = re.compile(r'^Autonomous *System *number *format: *'
-                        '(?P<as_format>[a-zA-Z]+)$')
 
-        #Autonomous System: 65108.65108
-        p4 = re.compile(r'^Autonomous *System: *(?P<as_number>[0-9\.]+)$')
-        p5 = re.compile(r'^Router *ID: *(?P<router_id>[\w\.\:]+) *'
-                        '(\([\w\s]+\))?$')
-        p6_1 = re.compile(r'^Default *Cluster *ID: *'
-                          '(?P<default_cluster_id>[\w\.\:]+) *'
-                          '(\([\w\s\:\.\,]+\))?$')
-        p6_2 = re.compile(r'^Active *Cluster *IDs: *'
-                          '(?P<active_cluster_id>[\w\.\:]+)$')
-        p7_1 = re.compile(r'^Always compare MED is enabled$')
-        p7_2 = re.compile(r'^Comparing router ID for eBGP paths$')
-        p7_4 = re.compile(r'^Treating missing MED as worst$')
-        p8 = re.compile(r'^Fast +external +fallover +enabled$')
-        p9 = re.compile(r'^Platform *RLIMIT *max: *'
-                        '(?P<platform_rlimit_max>[0-9\,]+) *bytes$')
-        p10 = re.compile(r'^Maximum +limit +for +BMP +buffer +size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p11 = re.compile(r'^Default *value *for *BMP *buffer *size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p12 = re.compile(r'^Current *limit *for *BMP *buffer *size: *'
-                         '(?P<size>[a-zA-Z0-9]+) *MB$')
-        p13 = re.compile(r'^Current *utilization *of *BMP *buffer *'
-                         'limit: *(?P<limit>[a-zA-Z0-9]+) *B$')
-        p14 = re.compile(r'^Neighbor *logging *is *(?P<nbr_logging>\w+)$')
-        p15 = re.compile(r'^Enforce +first +AS +(?P<as_enabled>\w+)$')
-        p16 = re.compile(r'^Default *local *preference: *'
-                         '(?P<preference>[0-9]+)$')
-        p17 = re.compile(r'^Default *keepalive: *(?P<keepalive>[0-9]+)$')
-        p18 = re.compile(r'^Non\-stop *routing *is +(?P<status>[a-zA-Z]+)$')
-        p19 = re.compile(r'^Update *delay: *(?P<update_delay>[0-9]+)$')
-        p20 = re.compile(r'^Generic *scan *interval: *'
-                         '(?P<scan_interval>[0-9]+)$')
-        p21 = re.compile(r'^BGP *Speaker *process: *'
-                         '(?P<speaker>\w+), +Node: +(?P<node>\w+)$')
-        p22 = re.compile(r'^Restart *count: *(?P<restart_count>[0-9]+)$')
-        p23 = re.compile(r'^(?P<vrf_info>[\w\-]+) +VRFs: +'
-                         '(?P<total>[0-9]+) +'
-                         '(?P<nbrs_estab>[0-9]+)/(?P<cfg>[0-9]+)$')
-        p24_1 = re.compile(r'^Updates:'
-                           ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p24_2 = re.compile(r'^Notifications:'
-                           ' *(?P<sent>[0-9]+) *(?P<received>[0-9]+)$')
-        p26 = re.compile(r'^Pool +(?P<pool>\w+): +(?P<alloc>\d+) +'
-                         '(?P<free>\d+)$')
-        p25 = re.compile(r'^(?P<att>[\w\s]+): +(?P<number>[0-9]+) +'
-                         '(?P<memory_used>[0-9]+)$')
-        p29 = re.compile(r'^Address *family: *(?P<af>[a-zA-Z0-9\s\-\_]+)$')
-        p29_1 = re.compile(r'^VRF +(?P<current_vrf>(\S+)) +Address +family:'
-                           ' +(?P<af>[a-zA-Z0-9\s\-\_]+)'
-                           '(?: +\(Table +(?P<table_state>[a-z]+)\))?$')
-        p30 = re.compile(r'^Dampening +is +(?P<dampening>[\w\s]+)$')
-        p31 = re.compile(r'^Client +reflection +is +enabled +in +global +config$')
-        p31_1 = re.compile(r'^Client +reflection +is +not +enabled +in +global +config$')
-        p32 = re.compile(r'^Dynamic *MED *is *(?P<dynamic_med>\w+)$')
-        p33 = re.compile(r'^Dynamic *MED *interval *: *'
-                         '(?P<interval>[a-zA-Z0-9\s]+)$')
-        p34 = re.compile(r'^Dynamic *MED *Timer *: *'
-                         '(?P<dynamic_med_timer>[a-zA-Z0-9\s]+)$')
-        p35 = re.compile(r'^Dynamic *MED *Periodic *Timer *: *'
-                         '(?P<timer>[a-zA-Z0-9\s]+)$')
-        p36 = re.compile(r'^Scan *interval: *(?P<scan_interval>[\w\s]+)$')
-        p37 = re.compile(r'^Total *prefixes *scanned: *'
-                         '(?P<scan>[a-zA-Z0-9\s]+)$')
-        p38 = re.compile(r'^Prefixes *scanned *per *segment: *'
-                         '(?P<prefix_scan>[a-zA-Z0-9\s]+)$')
-        p39 = re.compile(r'^Number *of *scan *segments: *'
-                         '(?P<num_of_scan_segments>[a-zA-Z0-9\s]+)$')
-        p40 = re.compile(r'^Nexthop *resolution *minimum *prefix\-length: *'
-                         '(?P<length>[\w\s\(\)]+)$')
-        p41 = re.compile(r'^Main *Table *Version: *(?P<main_tab_ver>[\w\s]+)$')
-        p42 = re.compile(r'^Table *version *synced *to *RIB: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p43 = re.compile(r'^Table *version *acked *by *RIB: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p44 = re.compile(r'^RIB *has *not *converged: *'
-                         '(?P<rib>[a-zA-Z0-9\s]+)$')
-        p54 = re.compile(r'^RIB *table *prefix\-limit *reached +\? *'
-                         '\[(?P<rib>\w+)\], +version +(?P<ver>\d+)$')
-        p45 = re.compile(r'^Permanent +Network +(?P<status>\w+)$')
-        p46 = re.compile(r'^State: *(?P<state>[a-zA-Z\s]+).$')
-        p47 = re.compile(r'^BGP *Table *Version: *(?P<tab_ver>\w+)$')
-        p48 = re.compile(r'^Attribute *download: *(?P<attr>[\w\s]+)$')
-        p49 = re.compile(r'^Label *retention *timer *value *'
-                         '(?P<timer>[a-zA-Z0-9\s]+)$')
-        p50 = re.compile(r'^Soft *Reconfig *Entries: *(?P<ent>\d+)$')
-        p51 = re.compile(r'^Table *bit\-field *size *: *'
-                         '(?P<size>[0-9\s]+) *Chunk *element *size *: *'
-                         '(?P<elememt_size>\d+)$')
-        p52 = re.compile(r'^(?P<thread>\w+\s\w+) *'
-                         '(?P<trigger>\w+\s\d+\s[\d\:\.]+) +(?P<ver>[0-9]+) +'
-                         '(?P<tbl_ver>[0-9]+) +(?P<trig_tid>[0-9]+)$')
-        p53 = re.compile(r'^(?P<remote>[\w\s\-]+): *(?P<v1>\d+) *'
-                         '(?P<v2>[0-9]+)$')
+        p = ShowBgpInstanceProcessDetail.patterns
+
         # Init dict
         ret_dict = {}
 
@@ -1325,7 +1355,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = m.groupdict()['instance']
 
@@ -1344,7 +1374,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # VRF: VRF1
 
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 ret_dict.setdefault('instance', {}).setdefault(instance, {})
                 vrf = str(m.groupdict()['vrf'])
@@ -1371,7 +1401,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                 continue
             # BGP Process Information: VRF VRF1
 
-            m = p1_1_1.match(line)
+            m = p.p1_1_1.match(line)
             if m:
                 vrf = str(m.groupdict()['vrf'])
                 ret_dict.setdefault('instance', {}).setdefault(instance, {}).setdefault(
@@ -1396,7 +1426,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP Route Distinguisher: 100:1
 
-            m = p1_2.match(line)
+            m = p.p1_2.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
 
@@ -1406,7 +1436,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP is operating in STANDALONE mode
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 operation_mode = m.groupdict()['operation_mode'].lower()
                 ret_dict.setdefault('instance', {}).setdefault(instance, {}).setdefault(
@@ -1417,7 +1447,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Autonomous System number format: ASPLAIN
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 as_format = m.groupdict()['as_format']
 
@@ -1427,7 +1457,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Autonomous System: 100
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 as_number = "NA"
                 try:
@@ -1442,7 +1472,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Router ID: 10.4.1.1 (manually configured)
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 router_id = m.groupdict()['router_id']
 
@@ -1453,7 +1483,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Default Cluster ID: 10.4.1.1
             # Default Cluster ID: 10 (manually configured)
 
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 default_cluster_id = m.groupdict()['default_cluster_id']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1462,7 +1492,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Active Cluster IDs:  10.4.1.1
 
-            m = p6_2.match(line)
+            m = p.p6_2.match(line)
             if m:
                 active_cluster_id = m.groupdict()['active_cluster_id']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1471,7 +1501,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Always compare MED is enabled
 
-            m = p7_1.match(line)
+            m = p.p7_1.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['always_compare_med'] = True
@@ -1479,7 +1509,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Comparing router ID for eBGP paths
 
-            m = p7_2.match(line)
+            m = p.p7_2.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['bestpath_compare_routerid'] = True
@@ -1487,7 +1517,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Treating missing MED as worst
 
-            m = p7_4.match(line)
+            m = p.p7_4.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['bestpath_med_missing_at_worst'] = True
@@ -1495,7 +1525,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Fast external fallover enabled
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['fast_external_fallover'] = True
@@ -1503,7 +1533,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Platform RLIMIT max: 2147483648 bytes
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 platform_rlimit_max = int(m.groupdict()['platform_rlimit_max'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1512,7 +1542,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Maximum limit for BMP buffer size: 409 MB
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 size = int(m.groupdict()['size'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1521,7 +1551,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Default value for BMP buffer size: 307 MB
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 size = int(m.groupdict()['size'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1530,7 +1560,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Current limit for BMP buffer size: 307 MB
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 size = int(m.groupdict()['size'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1539,7 +1569,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Current utilization of BMP buffer limit: 0 B
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 limit = int(m.groupdict()['limit'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1548,7 +1578,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Neighbor logging is enabled
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 nbr_logging = m.groupdict()['nbr_logging']
                 if nbr_logging == 'enabled':
@@ -1561,7 +1591,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Enforce first AS enabled
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 as_enabled = m.groupdict()['as_enabled']
                 if as_enabled == 'enabled':
@@ -1574,7 +1604,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Default local preference: 100
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 default_local_preference = int(m.groupdict()['preference'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1583,7 +1613,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Default keepalive: 60
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 default_keepalive = int(m.groupdict()['keepalive'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1592,7 +1622,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Non-stop routing is enabled
 
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 status = m.groupdict()['status']
                 if status == 'enabled':
@@ -1605,7 +1635,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Update delay: 120
 
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 update_delay = int(m.groupdict()['update_delay'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1614,7 +1644,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Generic scan interval: 60
 
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 scan_interval = int(m.groupdict()['scan_interval'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1623,7 +1653,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP Speaker process: 0, Node: node0_0_CPU0
 
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 speaker = int(m.groupdict()['speaker'])
                 node = m.groupdict()['node']
@@ -1635,7 +1665,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Restart count: 1
 
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 restart_count = int(m.groupdict()['restart_count'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1646,7 +1676,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Default vrfs:              1               2/2
             # Non-Default vrfs:          2               4/4
 
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 if 'vrf_info' not in ret_dict['instance'][instance]['vrf'][vrf] \
                         :
@@ -1684,7 +1714,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             if re.compile(r'BMP +pool +summary:').match(line):
                 flag = 'bmp'
 
-            m = p26.match(line)
+            m = p.p26.match(line)
 
             if m and flag == 'message':
                 if 'message_logging_pool_summary' not in ret_dict['instance'] \
@@ -1751,7 +1781,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Updates:                   14              24
             # Notifications:             1               0
 
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['sent_updates'] = int(m.groupdict()['sent'])
@@ -1763,7 +1793,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Updates:                   14              24
             # Notifications:             1               0
 
-            m = p24_2.match(line)
+            m = p.p24_2.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['sent_notifications'] = int(m.groupdict()['sent'])
@@ -1785,7 +1815,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # Nexthop Entries:           32              12800
 
 
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m and not flag:
                 if 'att' not in ret_dict['instance'][instance]['vrf'][vrf] \
                         :
@@ -1810,7 +1840,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Address family: VPNv4 Unicast
 
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 af = str(m.groupdict()['af']).lower()
                 af.strip()
@@ -1826,7 +1856,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             # VRF VRF1 Address family: IPv6 Unicast
             # VRF a Address family: IPv4 Unicast (Table inactive)
 
-            m = p29_1.match(line)
+            m = p.p29_1.match(line)
             if m:
                 af = str(m.groupdict()['af']).lower()
                 af.strip()
@@ -1849,7 +1879,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dampening is not enabled
 
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 dampening = m.groupdict()['dampening'].lower()
                 if 'not enabled' in dampening:
@@ -1862,7 +1892,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Client reflection is enabled in global config
 
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['address_family'][af]['client_to_client_reflection'] = True
@@ -1870,7 +1900,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Client reflection is not enabled in global config
 
-            m = p31_1.match(line)
+            m = p.p31_1.match(line)
             if m:
                 ret_dict['instance'][instance]['vrf'][vrf] \
                     ['address_family'][af]['client_to_client_reflection'] = False
@@ -1878,7 +1908,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED is Disabled
 
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 dynamic_med = m.groupdict()['dynamic_med'].lower()
                 if status == 'enabled':
@@ -1891,7 +1921,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED interval : 10 minutes
 
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 interval = m.groupdict()['interval']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1900,7 +1930,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED Timer : Not Running
 
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 timer = m.groupdict()['dynamic_med_timer']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1909,7 +1939,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Dynamic MED Periodic Timer : Not Running
 
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 timer = m.groupdict()['timer']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1918,7 +1948,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Scan interval: 60
 
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 scan_interval = m.groupdict()['scan_interval']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1927,7 +1957,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Total prefixes scanned: 40
 
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 scan = m.groupdict()['scan']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1936,7 +1966,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Prefixes scanned per segment: 100000
 
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 prefix_scan = m.groupdict()['prefix_scan']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1945,7 +1975,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Number of scan segments: 1
 
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 ret = m.groupdict()['num_of_scan_segments']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1954,7 +1984,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Nexthop resolution minimum prefix-length: 0 (not configured)
 
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 length = m.groupdict()['length']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1964,7 +1994,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Main Table Version: 43
 
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 main_tab_ver = m.groupdict()['main_tab_ver']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1973,7 +2003,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Table version synced to RIB: 43
 
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 rib = m.groupdict()['rib']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1982,7 +2012,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Table version acked by RIB: 0
 
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 rib = m.groupdict()['rib']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -1991,7 +2021,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # RIB has not converged: version 0
 
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 rib = m.groupdict()['rib']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2000,7 +2030,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # RIB table prefix-limit reached ?  [No], version 0
 
-            m = p54.match(line)
+            m = p.p54.match(line)
             if m:
                 rib = m.groupdict()['rib'].lower()
                 ver = m.groupdict()['ver']
@@ -2012,7 +2042,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Permanent Network Unconfigured
 
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 status = m.groupdict()['status'].lower()
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2021,7 +2051,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # State: Normal mode.
 
-            m = p46.match(line)
+            m = p.p46.match(line)
             if m:
                 state = m.groupdict()['state'].lower()
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2030,7 +2060,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # BGP Table Version: 43
 
-            m = p47.match(line)
+            m = p.p47.match(line)
             if m:
                 tab_ver = m.groupdict()['tab_ver']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2039,7 +2069,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Attribute download: Disabled
 
-            m = p48.match(line)
+            m = p.p48.match(line)
             if m:
                 attr = str(m.groupdict()['attr'])
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2048,7 +2078,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Label retention timer value 5 mins
 
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 timer = m.groupdict()['timer']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2057,7 +2087,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Soft Reconfig Entries: 0
 
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 ent = m.groupdict()['ent']
                 ret_dict['instance'][instance]['vrf'][vrf] \
@@ -2066,7 +2096,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
 
             # Table bit-field size : 1 Chunk element size : 3
 
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 table_bit_field_size = m.groupdict()['size']
                 chunk_elememt_size = m.groupdict()['elememt_size']
@@ -2089,7 +2119,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
             #                    Total triggers: 17
 
 
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 if 'thread' not in ret_dict['instance'][instance]['vrf'][vrf] \
                         ['address_family'][af]:
@@ -2141,7 +2171,7 @@ class ShowBgpInstanceProcessDetail(ShowBgpInstanceProcessDetailSchema):
                 flag = 'number'
 
 
-            m = p53.match(line)
+            m = p.p53.match(line)
             if m and flag == 'allocated':
                 try:
                     af
@@ -2506,6 +2536,112 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
         , 'cummulative_no_no_policy', 'route_refresh_request_sent']
 
         
+    patterns = Patterns(
+        p1=r'^BGP +instance +(?P<instance_number>[0-9]+): +'
+            '(?P<instance>[a-zA-Z0-9\-\_\']+)$',
+        p2=r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$',
+        p2_1=r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>\S+)$',
+        p3=r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS +(?P<local_as_as_no>[0-9]+)(?:, +(?P<local_as_no_prepend>no-prepend))?(?:, +(?P<local_as_replace_as>replace-as))?(?:, +(?P<local_as_dual_as>dual-as))?(?:, +(?P<link_state>[a-zA-Z\s]+))?$',
+        p4=r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$',
+        p5=r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
+            '(?:, +up +for +(?P<up_time>[\w\:]+))?$',
+        p5_1=r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))',
+        p6=r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$',
+        p7=r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$',
+        p8=r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
+            ' +interval +is +(?P<keepalive_interval>[0-9]+)'
+            ' +seconds$',
+        p9=r'^Configured +hold +time:'
+            ' +(?P<holdtime>[0-9]+), +keepalive:'
+            ' +(?P<keepalive_interval>[0-9]+), +min'
+            ' +acceptable +hold +time:'
+            ' +(?P<min_acceptable_hold_time>[0-9]+)$',
+        p10=r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$',
+        p11=r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$',
+        p12=r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$',
+        p13=r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$',
+        p14=r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$',
+        p15=r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$',
+        p15_1=r'^Socket *(?P<socket_status>[a-z\s\,])$',
+        p16=r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$',
+        p17=r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$',
+        p18=r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$',
+        p19=r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$',
+        p20=r'^Precedence: *(?P<precedence>[a-z]+)$',
+        p21=r'^Non-stop +routing +is +enabled$',
+        p22=r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$',
+        p23=r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$',
+        p24=r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$',
+        p25=r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$',
+        p26=r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$',
+        p27=r'^Neighbor +capabilities:?:( +Adv +Rcvd)?$',
+        p27_1=r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+)(?: +\(GR Awareness\))?: *(?:(?P<adv>(Y|y)es|(N|n)o|advertised+)'
+              r'(?: \(old \+ new\))?)?(?:( +and))? *(?:(?P<rcvd>(Y|y)es|(N|n)o|received+)(?: \(old \+ new\))?)$',
+        p28=r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$',
+        p29=r'^(?P<name>[a-zA-Z\s]+) *: *'
+             '(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
+             '(?P<sent>[0-9]+) *'
+             '(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
+             '(?P<received>[0-9]+)$',
+        p29_1=r'^(?P<name>[a-zA-Z\s]+) *: *'
+               '(?P<last_sent>[\-]+) *'
+               '(?P<sent>[0-9]+) *'
+               '(?P<last_received>[\-]+) *'
+               '(?P<received>[0-9]+)$',
+        p30=r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$',
+        p31=r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$',
+        p32=r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$',
+        p33=r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$',
+        p34=r'^BGP +neighbor +version'
+             ' +(?P<neighbor_version>[0-9]+)$',
+        p35=r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$',
+        p36=r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$',
+        p37=r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$',
+        p38=r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$',
+        p39=r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$',
+        p40=r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$',
+        p41=r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$',
+        p42=r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$',
+        p43=r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$',
+        p44=r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$',
+        p45=r'^Maximum +prefixes +allowed'
+             ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)$',
+        p46=r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$',
+        p47=r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$',
+        p48=r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$',
+        p49=r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$',
+        p50=r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$',
+        p50_1=r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$',
+        p50_2=r'^Send +Multicast +Attributes$',
+        p51=r'^Connections *(?P<bgp_state>\w+) *'
+             '(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$',
+        p52=r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$',
+        p53=r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$',
+        p54=r'^Last *reset *(?P<last_reset>[0-9\:]+)$',
+        p55=r'^Capability +4-byte-as +suppress +is +configured$',
+        p56=r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$',
+        p57=r'^Private +AS +number +removed +from +updates +to +this +neighbor$',
+        p58=r'^Administratively +shut +down$',
+        p59=r'^External +BGP +neighbor +may +be +up +to +'
+             '(?P<hop>\d+) +hops +away$',
+        p60=r'^TCP +open +mode: +(?P<mode>[\w\s]+)$',
+        p61=r'^My +AS +number +is +allowed +(?P<num>\d+) +'
+             'times +in +received +updates$',
+        p62=r'^Route\-Reflector +Client$',
+        p63=r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$',
+        p64=r'^Inbound +soft +reconfiguration +allowed$',
+        p65=r'^AS +override +is +set$',
+        p66=r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$',
+        p67=r'^site\-of\-origin +(?P<soo>[\w\:]+)$',
+        p68=r'^TTL\s+security\s+is\s+(?P<ttl_security>\w+)$',
+        p69=r'^External\s+BGP\s+neighbor\s+may\s+be\s+up\s+to\s+(?P<external_bgp_neighbor_hop_count>\d+)\s+hops\s+away\.$',
+        p70=r'^BFD\s+(?P<bfd_status>\w+)\s+\(session\s+(?P<session_status>\w+)\):\s+mininterval:\s+(?P<mininterval>\d+)\s+multiplier:\s+(?P<multiplier>\d+)$',
+        p71=r'^Graceful\s+restart\s+is\s+(?P<graceful_restart>[a-zA-Z]+)$',
+        p72=r'^Restart\s+time\s+is\s+(?P<graceful_restart_restart_time>\d+)\s+seconds$',
+        p73=r'^Stale\s+path\s+timeout\s+time\s+is\s+(?P<graceful_restart_stalepath_time>\d+)\s+seconds$',
+        p74=r'^(?P<messages_type>[Received|Sent]+)\s+(?P<messages_count>\d+)\s+messages,\s+(?P<notifications>\d+)\s+notifications,\s+(?P<queue>\d+)\s+in\s+queue$',
+    )
+
     def cli(self, vrf_type='all', vrf='all', instance='all', neighbor='', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
@@ -2544,116 +2680,15 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             out = output
         # Init variables
         ret_dict = {}
-        p1 = re.compile(r'^BGP +instance +(?P<instance_number>[0-9]+): +'
-                            '(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p2 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p2_1 =  re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[a-zA-Z0-9\.\:]+), +vrf +(?P<vrf>\S+)$')
-        p3 = re.compile(r'^Remote +AS +(?P<remote_as>[0-9]+), +local +AS +(?P<local_as_as_no>[0-9]+)(?:, +(?P<local_as_no_prepend>no-prepend))?(?:, +(?P<local_as_replace_as>replace-as))?(?:, +(?P<local_as_dual_as>dual-as))?(?:, +(?P<link_state>[a-zA-Z\s]+))?$')
-        p4 = re.compile(r'^Remote *router *ID *(?P<router_id>[a-zA-Z0-9\.\:]+)$')
-        p5 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)'
-                            '(?:, +up +for +(?P<up_time>[\w\:]+))?$')
-        p5_1 = re.compile(r'^\s*BGP +state += +(?P<session_state>[a-zA-Z0-9]+)(?:(?P<reason>.*))')
-        p6 = re.compile(r'^NSR *State: *(?P<nsr_state>[a-zA-Z]+)$')
-        p7 = re.compile(r'^Last *read *(?P<last_read>[0-9\:]+), *Last *read *before *reset *(?P<last_read_before_reset>[0-9\:]+)$')
-        p8 = re.compile(r'^Hold +time +is +(?P<holdtime>[0-9]+), +keepalive'
-                            ' +interval +is +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
-        p9 = re.compile(r'^Configured +hold +time:'
-                            ' +(?P<holdtime>[0-9]+), +keepalive:'
-                            ' +(?P<keepalive_interval>[0-9]+), +min'
-                            ' +acceptable +hold +time:'
-                            ' +(?P<min_acceptable_hold_time>[0-9]+)$')
-        p10 = re.compile(r'^Last *write *(?P<last_write>[0-9\:]+), *attempted *(?P<attempted>[0-9]+), *written *(?P<written>[0-9]+)$')
-        p11 = re.compile(r'^Second *last *write *(?P<second_last_write>[0-9\:]+), *attempted *(?P<second_attempted>[0-9]+), *written *(?P<second_written>[0-9]+)$')
-        p12 = re.compile(r'^Last *write *before *reset *(?P<last_write_before_reset>[0-9\:]+), *attempted *(?P<last_write_attempted>[0-9]+), *written *(?P<last_write_written>[0-9]+)$')
-        p13 = re.compile(r'^Second *last *write *before *reset *(?P<second_last_write_before_reset>[0-9\:]+), *attempted *(?P<second_last_write_before_attempted>[0-9]+), written *(?P<second_last_write_before_written>[0-9]+)$')
-        p14 =  re.compile(r'^Last *write *pulse *rcvd *(?P<last_write_pulse_rcvd>[a-zA-Z0-9\:\.\s]+) *last *full *not *set *pulse *count *(?P<last_full_not_set_pulse_count>[0-9]+)$')
-        p15 = re.compile(r'^Last +write +pulse +rcvd +before +reset +(?P<last_write_pulse_rcvd_before_reset>[0-9\:]+)$')
-        p15_1 = re.compile(r'^Socket *(?P<socket_status>[a-z\s\,])$')
-        p16 =  re.compile(r'^Last *write *thread *event *before *reset *(?P<last_write_thread_event_before_reset>[0-9\:]+), *second *last *(?P<last_write_thread_event_second_last>[0-9\:]+)$')
-        p17 = re.compile(r'^Last *KA *expiry *before *reset *(?P<last_ka_expiry_before_reset>[0-9\:]+), *second *last *(?P<last_ka_expiry_before_second_last>[0-9\:]+)$')
-        p18 = re.compile(r'^Last *KA *error *before *reset *(?P<last_ka_error_before_reset>[0-9\:]+), *KA *not *sent *(?P<last_ka_error_ka_not_sent>[0-9\:]+)$')
-        p19 =  re.compile(r'^Last *KA *start *before *reset *(?P<last_ka_start_before_reset>[0-9\:]+), *second *last *(?P<last_ka_start_before_second_last>[0-9\:]+)$')
-        p20 =  re.compile(r'^Precedence: *(?P<precedence>[a-z]+)$')
-        p21 =  re.compile(r'^Non-stop +routing +is +enabled$')
-        p22 =  re.compile(r'^TCP *Initial *Sync :(?: *(?P<tcp_initial_sync>[a-zA-Z0-9\-\s]+))?$')
-        p23 = re.compile(r'^TCP *Initial *Sync *phase *Two :(?: *(?P<tcp_initial_sync_phase_two>[a-zA-Z0-9\-\s]+))?$')
-        p24 = re.compile(r'^TCP *Initial *Sync *Done :(?: *(?P<tcp_initial_sync_done>[a-zA-Z0-9\-\s]+))?$')
-        p25 = re.compile(r'^Enforcing *first *AS is *(?P<enforcing_first_as>[a-z]+)$')
-        p26 =  re.compile(r'^Multi-protocol *capability *(?P<multiprotocol_capability>[a-zA-Z\s]+)$')
-        p27 = re.compile(r'^Neighbor +capabilities:?:( +Adv +Rcvd)?$')
-        p27_1= re.compile(r'^(Address +family +)?(?P<name>[a-zA-Z0-9\s\-]+)(?: +\(GR Awareness\))?: *(?:(?P<adv>(Y|y)es|(N|n)o|advertised+)'
-                          r'(?: \(old \+ new\))?)?(?:( +and))? *(?:(?P<rcvd>(Y|y)es|(N|n)o|received+)(?: \(old \+ new\))?)$')
-        p28 = re.compile(r'^InQ *depth: *(?P<message_stats_input_queue>[0-9]+), *OutQ *depth: *(?P<message_stats_output_queue>[0-9]+)$')
-        p29 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            '(?P<last_sent>\w+ *\d+ *[\d\:\.]+) *'
-                            '(?P<sent>[0-9]+) *'
-                            '(?P<last_received>\w+ *\d+ *[\d\:\.\-]+) *'
-                            '(?P<received>[0-9]+)$')
-        p29_1 = re.compile(r'^(?P<name>[a-zA-Z\s]+) *: *'
-                            '(?P<last_sent>[\-]+) *'
-                            '(?P<sent>[0-9]+) *'
-                            '(?P<last_received>[\-]+) *'
-                            '(?P<received>[0-9]+)$')
-        p30 = re.compile(r'^Minimum *time *between *advertisement *runs *is *(?P<minimum_time_between_adv_runs>[0-9]+) *secs$')
-        p31 = re.compile(r'^Inbound *message *logging *enabled, *(?P<inbound_message>[0-9]+) *messages *buffered$')
-        p32 = re.compile(r'^Outbound *message *logging *enabled, *(?P<outbound_message>[0-9]+) *messages *buffered$')
-        p33 = re.compile(r'^For +Address +Family *: +(?P<address_family>[\S\s]+)$')
-        p34 = re.compile(r'^BGP +neighbor +version'
-                            ' +(?P<neighbor_version>[0-9]+)$')
-        p35 = re.compile(r'^Update +group: +(?P<update_group>[0-9\.]+) +Filter-group: +(?P<filter_group>[0-9\.]+) +(?P<refresh_request_status>[a-zA-Z\s]+)$')
-        p36 = re.compile(r'^Route *refresh *request: *received *(?P<route_refresh_request_received>[0-9]+), *sent *(?P<route_refresh_request_sent>[0-9]+)$')
-        p37 = re.compile(r'^Policy *for *incoming *advertisements *is *(?P<route_map_name_in>[\w\-\_]+)$')
-        p38 = re.compile(r'^Policy *for *outgoing *advertisements *is *(?P<route_map_name_out>[\w\-\_]+)$')
-        p39 = re.compile(r'^(?P<accepted_prefixes>[0-9]+) *accepted *prefixes, *(?P<best_paths>[0-9]+) *are *bestpaths$')
-        p40 = re.compile(r'^Exact *no\. *of *prefixes *denied *: *(?P<exact_no_prefixes_denied>[0-9]+)\.$')
-        p41 = re.compile(r'^Cumulative *no\. *of *prefixes *denied: *(?P<cummulative_no_prefixes_denied>[0-9]+)\.$')
-        p42 = re.compile(r'^No *policy: *(?P<cummulative_no_no_policy>[0-9]+), *Failed *RT *match: *(?P<cummulative_no_failed_rt_match>[0-9]+)$')
-        p43 = re.compile(r'^By *ORF *policy: *(?P<cummulative_no_by_orf_policy>[0-9]+), *By *policy: *(?P<cummulative_no_by_policy>[0-9]+)$')
-        p44 = re.compile(r'^Prefix +advertised +(?P<prefix_advertised>[0-9]+), +suppressed +(?P<prefix_suppressed>[0-9]+), +withdrawn +(?P<prefix_withdrawn>[0-9]+)$')
-        p45 = re.compile(r'^Maximum +prefixes +allowed'
-                        ' +(?P<maximum_prefix_max_prefix_no>[0-9]+)$')
-        p46 = re.compile(r'^Threshold +for +(?P<warn>warning)? *message +(?P<threshold_warning_message>[0-9\%]+), +restart +interval +(?P<threshold_restart_interval>[0-9]+) +min$')
-        p47 = re.compile(r'^An *EoR *(?P<eor_status>[a-z\-\s]+)$')
-        p48 = re.compile(r'^Last *ack *version *(?P<last_ack_version>[0-9]+), *Last *synced *ack *version *(?P<last_synced_ack_version>[0-9]+)$')
-        p49 = re.compile(r'^Outstanding +version +objects: +current +(?P<outstanding_version_objects_current>[0-9]+), +max +(?P<outstanding_version_objects_max>[0-9]+)$')
-        p50 = re.compile(r'^Additional-paths +operation: +(?P<additional_paths_operation>[a-zA-Z]+)$')
-        p50_1 = re.compile(r'^Advertise +routes +with +local-label +via +(?P<additional_routes_local_label>[a-zA-Z\s]+)$')
-        p50_2 = re.compile(r'^Send +Multicast +Attributes$')
-        p51 = re.compile(r'^Connections *(?P<bgp_state>\w+) *'
-                            '(?P<num>[0-9]+)\; *dropped *(?P<connections_dropped>[0-9]+)$')
-        p52 = re.compile(r'^Local *host: *(?P<local_host>[\w\.\:]+), *Local *port: *(?P<local_port>[0-9]+), *IF *Handle: *(?P<if_handle>[a-z0-9]+)$')
-        p53 = re.compile(r'^Foreign *host: *(?P<foreign_host>[\w\.\:]+), *Foreign *port: *(?P<foreign_port>[0-9]+)$')
-        p54 = re.compile(r'^Last *reset *(?P<last_reset>[0-9\:]+)$')
-        p55 = re.compile(r'^Capability +4-byte-as +suppress +is +configured$')
-        p56 = re.compile(r'^Description: +(?P<description>[\w\s\,\.\:\-]+)$')
-        p57 = re.compile(r'^Private +AS +number +removed +from +updates +to +this +neighbor$')
-        p58 = re.compile(r'^Administratively +shut +down$')
-        p59 = re.compile(r'^External +BGP +neighbor +may +be +up +to +'
-                            '(?P<hop>\d+) +hops +away$')
-        p60 = re.compile(r'^TCP +open +mode: +(?P<mode>[\w\s]+)$')
-        p61 = re.compile(r'^My +AS +number +is +allowed +(?P<num>\d+) +'
-                            'times +in +received +updates$')
-        p62 = re.compile(r'^Route\-Reflector +Client$')
-        p63 = re.compile(r'^(?P<send_com>\w+) +community +attribute +sent +to +this +neighbor$')
-        p64 = re.compile(r'^Inbound +soft +reconfiguration +allowed$')
-        p65 = re.compile(r'^AS +override +is +set$')
-        p66 = re.compile(r'^Default +information +originate: +(?P<route_map>[\w\s\-]:)$')
-        p67 = re.compile(r'^site\-of\-origin +(?P<soo>[\w\:]+)$')
-        p68 = re.compile(r'^TTL\s+security\s+is\s+(?P<ttl_security>\w+)$')
-        p69 = re.compile(r'^External\s+BGP\s+neighbor\s+may\s+be\s+up\s+to\s+(?P<external_bgp_neighbor_hop_count>\d+)\s+hops\s+away\.$')
-        p70 = re.compile(r'^BFD\s+(?P<bfd_status>\w+)\s+\(session\s+(?P<session_status>\w+)\):\s+mininterval:\s+(?P<mininterval>\d+)\s+multiplier:\s+(?P<multiplier>\d+)$')
-        p71 = re.compile(r'^Graceful\s+restart\s+is\s+(?P<graceful_restart>[a-zA-Z]+)$')
-        p72 = re.compile(r'^Restart\s+time\s+is\s+(?P<graceful_restart_restart_time>\d+)\s+seconds$')
-        p73 = re.compile(r'^Stale\s+path\s+timeout\s+time\s+is\s+(?P<graceful_restart_stalepath_time>\d+)\s+seconds$')
-        p74 = re.compile(r'^(?P<messages_type>[Received|Sent]+)\s+(?P<messages_count>\d+)\s+messages,\s+(?P<notifications>\d+)\s+notifications,\s+(?P<queue>\d+)\s+in\s+queue$')
+
+        p = ShowBgpInstanceNeighborsDetail.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = str(m.groupdict()['instance'])
                 instance_number = int(m.groupdict()['instance_number'])
@@ -2664,7 +2699,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP neighbor is 10.16.2.2
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 vrf = 'default'
@@ -2684,7 +2719,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP neighbor is 10.1.5.5, vrf VRF1
 
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 vrf = str(m.groupdict()['vrf'])
@@ -2709,7 +2744,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Remote AS 200, local AS 100, external link
             # Remote AS 200, local AS 100, no-prepend, replace-as, dual-as, external link
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 sub_dict['remote_as'] = int(m.groupdict()['remote_as'])
                 if m.groupdict()['link_state']:
@@ -2732,7 +2767,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Remote router ID 10.1.5.5
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
 
@@ -2741,7 +2776,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP state = Established, up for 00:53:54
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 session_state = str(m.groupdict()['session_state']).lower()
 
@@ -2752,7 +2787,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BGP state = Idle (No route to multi-hop neighbor)
 
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 session_state = str(m.groupdict()['session_state']).lower()
                 sub_dict['session_state'] = session_state
@@ -2762,7 +2797,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # NSR State: None
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 nsr_state = str(m.groupdict()['nsr_state'])
 
@@ -2771,7 +2806,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last read 00:00:51, Last read before reset 00:00:00
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 last_read = str(m.groupdict()['last_read'])
                 last_read_before_reset = str(m.groupdict()['last_read_before_reset'])
@@ -2782,7 +2817,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Hold time is 180, keepalive interval is 60 seconds
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['holdtime'] = int(m.groupdict()['holdtime'])
                 sub_dict['keepalive_interval'] = \
@@ -2791,7 +2826,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Configured hold time: 180, keepalive: 60, min acceptable hold time: 3
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['configured_holdtime'] = int(m.groupdict()['holdtime'])
                 sub_dict['configured_keepalive_interval'] = \
@@ -2802,7 +2837,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write 00:00:38, attempted 19, written 19
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 last_write = str(m.groupdict()['last_write'])
                 attempted = int(m.groupdict()['attempted'])
@@ -2815,7 +2850,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Second last write 00:01:38, attempted 19, written 19
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 second_last_write = str(m.groupdict()['second_last_write'])
                 second_attempted = int(m.groupdict()['second_attempted'])
@@ -2828,7 +2863,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write before reset 00:00:00, attempted 0, written 0
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 last_write_before_reset = str(m.groupdict()['last_write_before_reset'])
                 last_write_attempted = int(m.groupdict()['last_write_attempted'])
@@ -2841,7 +2876,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Second last write before reset 00:00:00, attempted 0, written 0
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 second_last_write_before_reset =  str(m.groupdict()['second_last_write_before_reset'])
                 second_last_write_before_attempted = int(m.groupdict()['second_last_write_before_attempted'])
@@ -2854,7 +2889,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write pulse rcvd  Jun 28 19:17:44.716 last full not set pulse count 113
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 last_write_pulse_rcvd = str(m.groupdict()['last_write_pulse_rcvd'])
                 last_full_not_set_pulse_count = int(m.groupdict()['last_full_not_set_pulse_count'])
@@ -2865,7 +2900,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write pulse rcvd before reset 00:00:00
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 last_write_pulse_rcvd_before_reset = str(m.groupdict()['last_write_pulse_rcvd_before_reset'])
 
@@ -2874,7 +2909,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Socket not armed for io, armed for read, armed for write
 
-            m = p15_1.match(line)
+            m = p.p15_1.match(line)
             if m:
                 socket_status = str(m.groupdict()['socket_status'])
 
@@ -2883,7 +2918,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last write thread event before reset 00:00:00, second last 00:00:00
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 last_write_thread_event_before_reset = str(m.groupdict()['last_write_thread_event_before_reset'])
                 last_write_thread_event_second_last = str(m.groupdict()['last_write_thread_event_second_last'])
@@ -2894,7 +2929,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last KA expiry before reset 00:00:00, second last 00:00:00
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 last_ka_expiry_before_reset =  str(m.groupdict()['last_ka_expiry_before_reset'])
                 last_ka_expiry_before_second_last = str(m.groupdict()['last_ka_expiry_before_second_last'])
@@ -2905,7 +2940,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last KA error before reset 00:00:00, KA not sent 00:00:00
 
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 last_ka_error_before_reset = str(m.groupdict()['last_ka_error_before_reset'])
                 last_ka_error_ka_not_sent = str(m.groupdict()['last_ka_error_ka_not_sent'])
@@ -2916,7 +2951,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Last KA start before reset 00:00:00, second last 00:00:00
 
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 last_ka_start_before_reset = str(m.groupdict()['last_ka_start_before_reset'])
                 last_ka_start_before_second_last = str(m.groupdict()['last_ka_start_before_second_last'])
@@ -2926,7 +2961,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # Precedence: internet
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 precedence = str(m.groupdict()['precedence'])
 
@@ -2935,14 +2970,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Non-stop routing is enabled
 
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 sub_dict['non_stop_routing'] = True
                 continue
 
             # TCP Initial Sync :              ---                   
 
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 tcp_initial_sync = str(m.groupdict()['tcp_initial_sync'])
 
@@ -2951,7 +2986,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # TCP Initial Sync Phase Two :    ---
 
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 tcp_initial_sync_phase_two = str(m.groupdict()['tcp_initial_sync_phase_two'])
 
@@ -2959,7 +2994,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # TCP Initial Sync Done :         ---
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 tcp_initial_sync_done = str(m.groupdict()['tcp_initial_sync_done']) 
 
@@ -2968,7 +3003,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Enforcing first AS is enabled
 
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 enforcing_first_as = str(m.groupdict()['enforcing_first_as'])
 
@@ -2977,7 +3012,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Multi-protocol capability not received
 
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 multiprotocol_capability = str(m.groupdict()['multiprotocol_capability'])
 
@@ -2987,7 +3022,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             # Neighbor capabilities:            Adv         Rcvd
             # Neighbor capabilities:
 
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 if 'bgp_negotiated_capabilities' not in sub_dict:
                     sub_dict['bgp_negotiated_capabilities'] = {}
@@ -3000,7 +3035,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #    4-byte AS: advertised and received
             #    Address family IPv4 Unicast: advertised and received
 
-            m = p27_1.match(line)
+            m = p.p27_1.match(line)
             if m:
                 adv = ''
                 rcvd = ''
@@ -3029,7 +3064,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #  Message stats:
             #    InQ depth: 0, OutQ depth: 0
 
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 message_stats_output_queue = int(m.groupdict()['message_stats_output_queue'])
                 message_stats_input_queue = int(m.groupdict()['message_stats_input_queue'])
@@ -3047,10 +3082,10 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             #    Route_Refresh:  ---                        0  ---                        0
             #    Total:                                    58                            56
 
-            m = p29.match(line)
+            m = p.p29.match(line)
 
 
-            m1 = p29_1.match(line)
+            m1 = p.p29_1.match(line)
             if m or m1:
                 if 'bgp_neighbor_counters' not in sub_dict:
                     sub_dict['bgp_neighbor_counters'] = {}
@@ -3072,7 +3107,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Minimum time between advertisement runs is 0 secs
 
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 minimum_time_between_adv_runs = int(m.groupdict()['minimum_time_between_adv_runs'])
 
@@ -3081,7 +3116,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Inbound message logging enabled, 3 messages buffered
 
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 inbound_message = str(m.groupdict()['inbound_message'])
 
@@ -3090,7 +3125,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Outbound message logging enabled, 3 messages buffered
 
-            m =p32.match(line)
+            m =p.p32.match(line)
             if m:
                 outbound_message = str(m.groupdict()['outbound_message'])
 
@@ -3099,7 +3134,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # For Address Family: IPv4 Unicast
 
-            m = p33.match(line)            
+            m = p.p33.match(line)            
             if m:
                 address_family = str(m.groupdict()['address_family']).lower()
                 address_family.strip()
@@ -3112,7 +3147,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # BGP neighbor version 43
 
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 sub_dict['address_family'][address_family]['neighbor_version'] =\
                     int(m.groupdict()['neighbor_version'])
@@ -3120,7 +3155,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Update group: 0.2 Filter-group: 0.2  No Refresh request being processed
 
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 update_group = str(m.groupdict()['update_group'])
                 filter_group = str(m.groupdict()['filter_group'])
@@ -3133,7 +3168,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Route refresh request: received 0, sent 0
 
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 route_refresh_request_received = int(m.groupdict()['route_refresh_request_received'])
                 route_refresh_request_sent = int(m.groupdict()['route_refresh_request_sent'])
@@ -3144,7 +3179,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Policy for incoming advertisements is all-pass
 
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 route_map_name_in = m.groupdict()['route_map_name_in']
 
@@ -3153,7 +3188,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Policy for outgoing advertisements is all-pass
 
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 route_map_name_out = m.groupdict()['route_map_name_out']
 
@@ -3162,7 +3197,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # 0 accepted prefixes, 0 are bestpaths
 
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 accepted_prefixes = int(m.groupdict()['accepted_prefixes'])
                 best_paths = int(m.groupdict()['best_paths'])
@@ -3173,7 +3208,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Exact no. of prefixes denied : 0.
 
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 exact_no_prefixes_denied = int(m.groupdict()['exact_no_prefixes_denied'])
 
@@ -3182,7 +3217,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Cumulative no. of prefixes denied: 5.
 
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 cummulative_no_prefixes_denied = int(m.groupdict()['cummulative_no_prefixes_denied'])
 
@@ -3191,7 +3226,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # No policy: 5, Failed RT match: 0
 
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 cummulative_no_no_policy = int(m.groupdict()['cummulative_no_no_policy'])
                 cummulative_no_failed_rt_match = int(m.groupdict()['cummulative_no_failed_rt_match'])
@@ -3202,7 +3237,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # By ORF policy: 0, By policy: 0
 
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 cummulative_no_by_orf_policy = int(m.groupdict()['cummulative_no_by_orf_policy'])
                 cummulative_no_by_policy = int(m.groupdict()['cummulative_no_by_policy'])
@@ -3213,7 +3248,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Prefix advertised 10, suppressed 0, withdrawn 0
 
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 prefix_advertised = int(m.groupdict()['prefix_advertised'])
                 prefix_suppressed = int(m.groupdict()['prefix_suppressed'])
@@ -3226,7 +3261,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Maximum prefixes allowed 1048576
 
-            m = p45.match(line)
+            m = p.p45.match(line)
             if m:
                 sub_dict['address_family'][address_family]\
                     ['maximum_prefix_max_prefix_no'] = \
@@ -3235,7 +3270,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Threshold for warning message 75%, restart interval 0 min
 
-            m = p46.match(line)
+            m = p.p46.match(line)
             if m:
                 threshold_warning_message = m.groupdict()['threshold_warning_message']
                 threshold_restart_interval = int(m.groupdict()['threshold_restart_interval'])
@@ -3247,7 +3282,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # An EoR was not received during read-only mode
 
-            m = p47.match(line)
+            m = p.p47.match(line)
             if m:
                 eor_status = str(m.groupdict()['eor_status'])
 
@@ -3256,7 +3291,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last ack version 43, Last synced ack version 0
 
-            m = p48.match(line)
+            m = p.p48.match(line)
             if m:
                 last_synced_ack_version = int(m.groupdict()['last_synced_ack_version'])
                 last_ack_version = int(m.groupdict()['last_ack_version'])
@@ -3267,7 +3302,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             
             # Outstanding version objects: current 0, max 1
 
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 outstanding_version_objects_current = int(m.groupdict()['outstanding_version_objects_current'])
                 outstanding_version_objects_max = int(m.groupdict()['outstanding_version_objects_max'])
@@ -3278,7 +3313,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Additional-paths operation: None
 
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 additional_paths_operation = str(m.groupdict()['additional_paths_operation'])
 
@@ -3287,7 +3322,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Advertise routes with local-label via Unicast SAFI
 
-            m = p50_1.match(line)
+            m = p.p50_1.match(line)
             if m:
                 additional_routes_local_label = str(m.groupdict()['additional_routes_local_label'])
 
@@ -3295,14 +3330,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
                 continue
 
             # Send Multicast Attributes
-            m = p50_2.match(line)
+            m = p.p50_2.match(line)
             if m:
                 sub_dict['address_family'][address_family]['send_multicast_attributes'] = True
                 continue
 
             # Connections established 1; dropped 0
 
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3321,7 +3356,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Local host: 10.1.5.1, Local port: 179, IF Handle: 0x00000060
 
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3339,7 +3374,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Foreign host: 10.1.5.5, Foreign port: 11052
 
-            m = p53.match(line)
+            m = p.p53.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3355,7 +3390,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Last reset 00:00:00
 
-            m = p54.match(line)
+            m = p.p54.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3375,34 +3410,34 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Capability 4-byte-as suppress is configured
 
-            m = p55.match(line)
+            m = p.p55.match(line)
             if m:
                 sub_dict['suppress_four_byte_as_capability'] = True
                 continue
 
             # Description: PEER
 
-            m = p56.match(line)
+            m = p.p56.match(line)
             if m:
                 sub_dict['description'] = m.groupdict()['description']
                 
             # Private AS number removed from updates to this neighbor
 
-            m = p57.match(line)
+            m = p.p57.match(line)
             if m:
                 sub_dict['remove_private_as'] = True
                 continue
                 
             # Administratively shut down
 
-            m = p58.match(line)
+            m = p.p58.match(line)
             if m:
                 sub_dict['shutdown'] = True
                 continue
                 
             # External BGP neighbor may be up to 222 hops away
 
-            m = p59.match(line)
+            m = p.p59.match(line)
             if m:
                 sub_dict['ebgp_multihop'] = True
                 sub_dict['ebgp_multihop_max_hop'] = int(m.groupdict()['hop'])
@@ -3410,7 +3445,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # TCP open mode: passive only
 
-            m = p60.match(line)
+            m = p.p60.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3426,7 +3461,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # My AS number is allowed 3 times in received updates
 
-            m = p61.match(line)
+            m = p.p61.match(line)
             if m:
                 sub_dict['address_family'][address_family]['allowas_in'] = True
                 sub_dict['address_family'][address_family]['allowas_in_as_number'] = \
@@ -3435,14 +3470,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Route-Reflector Client
 
-            m = p62.match(line)
+            m = p.p62.match(line)
             if m:
                 sub_dict['address_family'][address_family]['route_reflector_client'] = True
                 continue
 
             # Extended community attribute sent to this neighbor
 
-            m = p63.match(line)
+            m = p.p63.match(line)
             if m:
                 sub_dict['address_family'][address_family]['send_community'] = \
                     m.groupdict()['send_com'].lower()
@@ -3450,21 +3485,21 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Inbound soft reconfiguration allowed
 
-            m = p64.match(line)
+            m = p.p64.match(line)
             if m:
                 sub_dict['address_family'][address_family]['soft_configuration'] = True
                 continue
 
             # AS override is set
 
-            m = p65.match(line)
+            m = p.p65.match(line)
             if m:
                 sub_dict['address_family'][address_family]['as_override'] = True
                 continue
 
             # Default information originate: default sent
 
-            m = p66.match(line)
+            m = p.p66.match(line)
             if m:
                 sub_dict['address_family'][address_family]['default_originate'] = True
                 sub_dict['address_family'][address_family]['default_originate_route_map'] = \
@@ -3473,14 +3508,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # site-of-origin 100:100
 
-            m = p67.match(line)
+            m = p.p67.match(line)
             if m:
                 sub_dict['address_family'][address_family]['soo'] = m.groupdict()['soo']
                 continue
 
             # TTL security is configured
 
-            m = p68.match(line)
+            m = p.p68.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3495,7 +3530,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # External BGP neighbor may be up to 100 hops away.
 
-            m = p69.match(line)
+            m = p.p69.match(line)
             if m:
                 if 'bgp_session_transport' not in sub_dict:
                     sub_dict['bgp_session_transport'] = {}
@@ -3509,7 +3544,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # BFD enabled (session up): mininterval: 150 multiplier: 3
 
-            m = p70.match(line)
+            m = p.p70.match(line)
             if m:
                 sub_dict['bfd'] = {}
                 sub_dict['bfd']['bfd_status'] = m.groupdict()['bfd_status']
@@ -3520,7 +3555,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Graceful restart is enabled
 
-            m = p71.match(line)
+            m = p.p71.match(line)
             if m:
                 if m.groupdict()['graceful_restart'] == 'enabled':
                     graceful_restart = True
@@ -3529,14 +3564,14 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
 
             # Restart time is 120 seconds
 
-            m = p72.match(line)
+            m = p.p72.match(line)
             if m:
                 sub_dict['graceful_restart_restart_time'] = int(m.groupdict()['graceful_restart_restart_time'])
                 continue
 
             # Stale path timeout time is 360 seconds
 
-            m = p73.match(line)
+            m = p.p73.match(line)
             if m:
                 sub_dict['graceful_restart_stalepath_time'] = int(m.groupdict()['graceful_restart_stalepath_time'])
                 continue
@@ -3544,7 +3579,7 @@ class ShowBgpInstanceNeighborsDetail(ShowBgpInstanceNeighborsDetailSchema):
             # Received 86 messages, 0 notifications, 0 in queue
             # Sent 86 messages, 0 notifications, 0 in queue
 
-            m = p74.match(line)
+            m = p.p74.match(line)
             if m:
                 messages_type = m.groupdict()['messages_type'].lower()
                 if 'messages' not in sub_dict:
@@ -3681,6 +3716,41 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
                    'show bgp instance {instance} {vrf_type} {vrf} {address_family} neighbors {neighbor} {route_type}',
                    'show bgp instance {instance} {vrf_type} {vrf} neighbors {neighbor} {route_type}']
 
+    patterns = Patterns(
+        p1=r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>[a-zA-Z0-9\-\_\']+)$',
+        p15=r'^BGP *VRF *(?P<vrf>[a-zA-Z0-9]+), *'
+             'state: *(?P<state>[a-zA-Z]+)$',
+        p15_1=r'^BGP Route Distinguisher: *(?P<route_distinguisher>\S+)',
+        p16=r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$',
+        p2=r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$',
+        p3=r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *'
+           r'local *AS *number *(?P<local_as>[0-9\.]+)$',
+        p4=r'^BGP *generic *scan *interval *(?P<generic_scan_interval>[0-9]+) +secs$',
+        p5=r'^(?P<non_stop_routing>(Non-stop routing is enabled))$',
+        p6=r'^BGP *table *state: *(?P<table_state>[a-zA-Z]+)$',
+        p7=r'^Table *ID: *(?P<table_id>[a-z0-9]+) *RD *version: *(?P<rd_version>[0-9]+)$',
+        p8=r'^BGP *main *routing *table *version *(?P<bgp_table_version>[0-9]+)$',
+        p9=r'^BGP *NSR *Initial *initsync *version *(?P<nsr_initial_initsync_version>[0-9]+) *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
+        p10=r'^BGP *NSR/ISSU *Sync-Group *versions *(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$',
+        p11=r'^BGP *scan *interval *(?P<scan_interval>[0-9\S]+) *secs$',
+        p12=r'^Route +Distinguisher: *(?P<route_distinguisher>\S+) *'
+             '(\(default +for +vrf +(?P<default_vrf>[a-zA-Z0-9]+)\))?$',
+        p13=r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)? *'
+             '(?P<prefix>(?P<ip>[\w\.\:\/\[\]]+)\/(?P<mask>\d+))?( +'
+             '(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\.\s\{\}]+)?'
+             '(?: *(?P<origin_codes>(i|e|\?)))?)?$',
+        p13_1=r'(?P<path>[\d\.\s]+)'
+               ' *(?P<origin_codes>(i|e|\?))?$',
+        p14=r'^Processed *(?P<processed_prefixes>[0-9]+) *'
+             'prefixes, *(?P<processed_paths>[0-9]+) *paths$',
+
+        #    Network            Next Hop            Metric LocPrf Weight Path
+        #                       10.4.1.1                    100      0    i
+        p17=r'^(?P<next_hop>[\w\.\:]+) +((?P<metric>[0-9]+))? +'
+             '(?P<locprf>[0-9]+) +(?P<weight>[0-9]+) '
+             '*(?P<path>[\S]+)$',
+    )
+
     def cli(self, vrf_type='all', neighbor='', vrf='all', instance='all', address_family='', route_type='received routes', output=None):
 
         assert vrf_type in ['all', 'vrf']
@@ -3710,8 +3780,32 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
         else:
             out = output
 
-        # Init vars
         ret_dict = {}
+        for _ in self._iter_routes(out.splitlines(), ret_dict,
+                                   vrf_type=vrf_type, route_type=route_type):
+            pass
+
+        return ret_dict
+
+    def parse_iter(self, output, vrf_type='all', route_type='received routes'):
+        """ Parse the output prefix by prefix, without building the whole
+            structure. The output can be a string, a file object or any
+            iterable of lines.
+
+            Yields ((instance, vrf, address_family, prefix), prefix_dict) of
+            each prefix, prefix_dict being the dict of the prefix with the
+            'index' of its paths in the structure returned by cli()
+        """
+        return iter_records(self._iter_routes(iter_lines(output), {},
+                                              vrf_type=vrf_type,
+                                              route_type=route_type))
+
+    def _iter_routes(self, lines, ret_dict, vrf_type='all',
+                     route_type='received routes'):
+        """ Parse the lines into ret_dict, yields (keys, routes dict,
+            prefix dict) each time a path is added
+        """
+        # Init vars
         instance = None
         address_family = None
 
@@ -3727,41 +3821,10 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
         # handle route table name
         routes = 'received' if 'received' in route_type else 'routes'
-        p1 = re.compile(r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p15 = re.compile(r'^BGP *VRF *(?P<vrf>[a-zA-Z0-9]+), *'
-                            'state: *(?P<state>[a-zA-Z]+)$')
-        p15_1 = re.compile(r'^BGP Route Distinguisher: *(?P<route_distinguisher>\S+)')
-        p16 = re.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
-        p2 = re.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
-        p3 = re.compile(r'^BGP *router *identifier *(?P<router_identifier>[0-9\.]+), *'
-                        r'local *AS *number *(?P<local_as>[0-9\.]+)$')
-        p4 = re.compile(r'^BGP *generic *scan *interval *(?P<generic_scan_interval>[0-9]+) +secs$')
-        p5 = re.compile(r'^(?P<non_stop_routing>(Non-stop routing is enabled))$')
-        p6 = re.compile(r'^BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
-        p7 = re.compile(r'^Table *ID: *(?P<table_id>[a-z0-9]+) *RD *version: *(?P<rd_version>[0-9]+)$')
-        p8 = re.compile(r'^BGP *main *routing *table *version *(?P<bgp_table_version>[0-9]+)$')
-        p9 = re.compile(r'^BGP *NSR *Initial *initsync *version *(?P<nsr_initial_initsync_version>[0-9]+) *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p10 = re.compile(r'^BGP *NSR/ISSU *Sync-Group *versions *(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-        p11 = re.compile(r'^BGP *scan *interval *(?P<scan_interval>[0-9\S]+) *secs$')
-        p12 = re.compile(r'^Route +Distinguisher: *(?P<route_distinguisher>\S+) *'
-                            '(\(default +for +vrf +(?P<default_vrf>[a-zA-Z0-9]+)\))?$')
-        p13 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)? *'
-                            '(?P<prefix>(?P<ip>[\w\.\:\/\[\]]+)\/(?P<mask>\d+))?( +'
-                            '(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\.\s\{\}]+)?'
-                            '(?: *(?P<origin_codes>(i|e|\?)))?)?$')      
-        p13_1 = re.compile(r'(?P<path>[\d\.\s]+)'
-                        ' *(?P<origin_codes>(i|e|\?))?$')
-
-        p14 = re.compile(r'^Processed *(?P<processed_prefixes>[0-9]+) *'
-                            'prefixes, *(?P<processed_paths>[0-9]+) *paths$')
 
-        #    Network            Next Hop            Metric LocPrf Weight Path
-        #                       10.4.1.1                    100      0    i
-        p17 = re.compile(r'^(?P<next_hop>[\w\.\:]+) +((?P<metric>[0-9]+))? +'
-                            '(?P<locprf>[0-9]+) +(?P<weight>[0-9]+) '
-                            '*(?P<path>[\S]+)$')
+        p = ShowBgpInstanceNeighborsReceivedRoutes.patterns
 
-        for line in out.splitlines():
+        for line in lines:
             line = line.strip()
 
             if not line:
@@ -3769,7 +3832,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = m.groupdict()['instance']
                 instance = instance.replace("'","")
@@ -3783,7 +3846,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             #BGP VRF VRF2, state: Active
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 state = m.groupdict()['state'].lower()
@@ -3796,14 +3859,14 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP Route Distinguisher: 200:2
 
-            m = p15_1.match(line)
+            m = p.p15_1.match(line)
             if m:
                 route_distinguisher = m.groupdict()['route_distinguisher']
                 continue
 
             # VRF ID: 0x60000002
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 vrf_id = m.groupdict()['vrf_id']
                 continue
@@ -3811,7 +3874,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
             # Network            Next Hop            Metric LocPrf Weight Path
             #                    10.4.1.1                    300      1    i
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if m.groupdict()['metric']:
                     sub_dict[routes][prefix]['index'][index]['metric'] = \
@@ -3829,7 +3892,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # Address Family: VPNv4 Unicast
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 if 'vrf' not in ret_dict['instance'][instance]:
@@ -3841,7 +3904,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP router identifier 10.4.1.1, local AS number 100
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 router_identifier = m.groupdict()['router_identifier']
                 try:
@@ -3852,7 +3915,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP generic scan interval 60 secs
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 generic_scan_interval = int(m.groupdict()['generic_scan_interval'])
                 # sub_dict['generic_scan_interval'] = generic_scan_interval
@@ -3860,21 +3923,21 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # Non-stop routing is enabled
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 non_stop_routing = True
                 continue
 
             # BGP table state: Active
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 table_state = str(m.groupdict()['table_state']).lower()
                 continue
 
             # Table ID: 0x0   RD version: 0
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 table_id = m.groupdict()['table_id']
                 rd_version = int(m.groupdict()['rd_version'])
@@ -3882,14 +3945,14 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP main routing table version 43
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 continue
 
             # BGP NSR Initial initsync version 11 (Reached)
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 nsr_initial_initsync_version = m.groupdict()['nsr_initial_initsync_version']
                 nsr_initial_init_ver_status = str(m.groupdict()['nsr_initial_init_ver_status']).lower()
@@ -3897,21 +3960,21 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # BGP NSR/ISSU Sync-Group versions 0/0
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 nsr_issu_sync_group_versions = m.groupdict()['nsr_issu_sync_group_versions']
                 continue
 
             # BGP scan interval 60 secs
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                scan_interval = int(m.groupdict()['scan_interval'])
                continue
 
             # Route Distinguisher: 200:1 (default for vrf VRF1)
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 rd = m.groupdict()['route_distinguisher']
                 addr = (address_family or af) + ' RD ' + rd
@@ -4000,7 +4063,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
             # *> 2001:db8:cdc9:121::/64     2001:db8:20:1:5::5
             # *>i[T][L15][L1x1][N[c12365][b10.4.1.1][s10.16.2.2]][P[p10.4.1.1/32]]/800
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 try:
                     sub_dict
@@ -4107,6 +4170,8 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
                 if index not in sub_dict[routes][prefix]['index']:
                     sub_dict[routes][prefix]['index'][index] = {}
+                yield (instance, vrf, addr, prefix), sub_dict[routes], \
+                    sub_dict[routes][prefix]
 
                 sub_dict[routes][prefix]['index'][index]['next_hop'] = next_hop
                 sub_dict[routes][prefix]['index'][index]['status_codes'] = status_codes
@@ -4172,7 +4237,7 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # 4518 29612 22247 10519 16562 61158 60788 61783 20566 5674
 
-            m = p13_1.match(line)
+            m = p.p13_1.match(line)
             if m:
                 if 'path' in sub_dict[routes][prefix]['index'][index]:
                     sub_dict[routes][prefix]['index'][index]['path'] += \
@@ -4184,15 +4249,13 @@ class ShowBgpInstanceNeighborsReceivedRoutes(ShowBgpInstanceNeighborsReceivedRou
 
             # Processed 5 prefixes, 5 paths
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 processed_prefixes = int(m.groupdict()['processed_prefixes'])
                 processed_paths = int(m.groupdict()['processed_paths'])
                 sub_dict['processed_prefixes'] = processed_prefixes
                 sub_dict['processed_paths'] = processed_paths                    
                 continue
-    
-        return ret_dict 
 
 
 # ===============================================================================
@@ -4265,6 +4328,23 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                    'show bgp instance {instance} {vrf_type} {vrf} {address_family} neighbors {neighbor} advertised-routes',
                    'show bgp instance {instance} {vrf_type} {vrf} neighbors {neighbor} advertised-routes']
 
+    patterns = Patterns(
+        # p0 is for instances where the line has been wrapped around due to the network name being too long
+        # [5][0][64][2002:60:60:60::]/176
+        p0=r'^[\d\:\[\]\.]+/\d+$',
+        p1=r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>['
+           r'a-zA-Z0-9\-\_\']+)$',
+        p2=r'^VRF: *(?P<vrf>[a-zA-Z0-9\_]+)$',
+        p7=r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$',
+        p3=r'^Route *Distinguisher: *(?P<route_distinguisher>\S+) *'
+            '(\(default *for *vrf (?P<default_vrf>[0-9A-Z]+)\))?$',
+        p4=r'^(?P<prefix>(?P<ip>[\w\.\:\[\]]+)/(?P<mask>\d+)) *(?P<next_hop>[\w\.\:]+) *('
+           r'?P<froms>[\w\.\:]+) *'
+           r'(?P<path>[\d\.\{\}\s]+)?(?P<origin_code>[e|i\?])?$',
+        p5_1=r'(?P<path>[\d\.\{\}\s]+)(?P<origin_code>e|i)?$',
+        p6=r'^Processed *(?P<processed_prefixes>[0-9]+) *prefixes, *(?P<processed_paths>[0-9]+) *paths$',
+    )
+
     def cli(self, vrf_type='all', neighbor='', vrf='all', instance='all', address_family='', output=None):
         assert vrf_type in ['all', 'vrf']
         assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
@@ -4300,31 +4380,14 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
                 af = 'vpnv4 unicast'
         address_family = None
 
-        # p0 is for instances where the line has been wrapped around due to the network name being too long
-        # [5][0][64][2002:60:60:60::]/176
-        p0 = re.compile(r'^[\d\:\[\]\.]+/\d+$')
-
-        p1 = re.compile(
-            r'^BGP *instance *(?P<instance_number>[0-9]+): *(?P<instance>['
-            r'a-zA-Z0-9\-\_\']+)$')
-        p2 = re.compile(r'^VRF: *(?P<vrf>[a-zA-Z0-9\_]+)$')
-        p7 = re.compile(r'^Address *Family: *(?P<address_family>[a-zA-Z0-9\s]+)$')
-        p3 = re.compile(r'^Route *Distinguisher: *(?P<route_distinguisher>\S+) *'
-                        '(\(default *for *vrf (?P<default_vrf>[0-9A-Z]+)\))?$')
-        p4 = re.compile(
-            r'^(?P<prefix>(?P<ip>[\w\.\:\[\]]+)/(?P<mask>\d+)) *(?P<next_hop>[\w\.\:]+) *('
-            r'?P<froms>[\w\.\:]+) *'
-            r'(?P<path>[\d\.\{\}\s]+)?(?P<origin_code>[e|i\?])?$')
-        p5_1 = re.compile(r'(?P<path>[\d\.\{\}\s]+)(?P<origin_code>e|i)?$')
-        p6 = re.compile(
-            r'^Processed *(?P<processed_prefixes>[0-9]+) *prefixes, *(?P<processed_paths>[0-9]+) *paths$')
+        p = ShowBgpInstanceNeighborsAdvertisedRoutes.patterns
 
         line_iterator = iter(out.splitlines())
         for line in line_iterator:
             line = line.strip()
 
             # [5][0][64][2002:60:60:60::]/176
-            m = p0.match(line)
+            m = p.p0.match(line)
             if m:
                 # Long network name has split the line, so combine the network
                 # name with the next line it goes with
@@ -4333,7 +4396,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             # BGP instance 0: 'default'
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = m.groupdict()['instance']
                 instance = instance.replace("'","")
@@ -4346,7 +4409,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             # VRF: VRF2
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict.setdefault('instance', {}).setdefault(instance, {})
                 vrf = m.groupdict()['vrf']
@@ -4358,7 +4421,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             # Address Family: VPNv4 Unicast
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m and vrf == 'default':
                 address_family = m.groupdict()['address_family'].lower()
                 if vrf_type == 'all' and vrf == 'default':
@@ -4370,7 +4433,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             # Route Distinguisher: 200:2 (default for vrf VRF2)
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 rd = m.groupdict()['route_distinguisher']
                 addr = (address_family or af) + ' RD ' + rd
@@ -4392,7 +4455,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
             # 10.4.1.1/32         10.4.1.1         Local           ?
             # 10.8.8.8/32        10.10.10.108    Local           65108.65108?
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 try:
                     sub_dict
@@ -4437,7 +4500,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
             #                                                    200 33299 51178 47751 {27017}e
             #                                                    200 33299 51178 65000.47751 {27017}e
 
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 path = m.groupdict()['path']
                 origin_code = m.groupdict()['origin_code']
@@ -4449,7 +4512,7 @@ class ShowBgpInstanceNeighborsAdvertisedRoutes(ShowBgpInstanceNeighborsAdvertise
 
             # Processed 5 prefixes, l5 paths
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 processed_prefixes = str(m.groupdict()['processed_prefixes'])
                 processed_paths = str(m.groupdict()['processed_paths'])
@@ -4484,6 +4547,11 @@ class ShowBgpNeighborsAdvertisedCount(ShowBgpNeighborsAdvertisedCountSchema):
     """
     cli_command = ['show bgp {address_family} neighbors {neighbor} advertised-count']
 
+    patterns = Patterns(
+        # No of prefixes Advertised: 673
+        p0=r'^No of prefixes Advertised: (?P<prefixes_advertised>\d+)$',
+    )
+
     def cli(self, address_family='', neighbor='', output=None):
         if output is None:
             out = self.device.execute(self.cli_command[0].format(address_family=address_family,
@@ -4493,13 +4561,12 @@ class ShowBgpNeighborsAdvertisedCount(ShowBgpNeighborsAdvertisedCountSchema):
 
         ret_dict = {}
 
-        # No of prefixes Advertised: 673
-        p0 = re.compile(r'^No of prefixes Advertised: (?P<prefixes_advertised>\d+)$')
+        p = ShowBgpNeighborsAdvertisedCount.patterns
 
         line_iterator = iter(out.splitlines())
         for line in line_iterator:
             line = line.strip()
-            m = p0.match(line)
+            m = p.p0.match(line)
             if m:
                 prefixes_advertised = m.groupdict()['prefixes_advertised']
                 ret_dict['prefixes_advertised'] = int(prefixes_advertised)
@@ -4689,6 +4756,55 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
         'nsr_initial_initsync_version', 'nsr_initial_init_ver_status',
         'nsr_issu_sync_group_versions', 'standbyver']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP *instance *(?P<instance_number>[0-9]+):'
+            ' *(?P<instance>[a-zA-Z0-9\-\_\']+)$',
+        p2=r'^\s*VRF: *(?P<vrf>[\S]+)$',
+        p3=r'^\s*Address *Family:'
+            ' *(?P<address_family>[\S\s]+)$',
+        p4=r'^\s*BGP *VRF *(?P<bgp_vrf>[a-zA-Z0-9]+), *state:'
+            ' *(?P<vrf_state>[a-zA-Z]+)$',
+        p5=r'^\s*BGP *Route *Distinguisher:'
+            ' *(?P<route_distinguisher>\S+)$',
+        p6=r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$',
+        p7=r'^\s*BGP *router *identifier'
+            ' *(?P<router_id>[0-9\.]+)\, *local *AS *number'
+            ' *(?P<local_as>[0-9\.]+)$',
+        p8=r'^\s*BGP *generic *scan *interval'
+            ' *(?P<generic_scan_interval>[0-9]+) *secs$',
+        p9=r'^\s*Non-stop *routing *is'
+            ' *(?P<non_stop_routing>[A-Za-z]+)$',
+        p10=r'^\s*BGP *table *state:'
+             ' *(?P<table_state>[a-zA-Z]+)$',
+        p11=r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+             '(?: *RD *version: (?P<rd_version>[0-9]+))?$',
+        p12=r'^\s*BGP *main *routing *table *version'
+             ' *(?P<bgp_table_version>[0-9]+)$',
+        p13=r'^\s*BGP *NSR *Initial *initsync *version'
+             ' *(?P<nsr_initial_initsync_version>[0-9]+)'
+             ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
+        p14=r'^\s*BGP *NSR/ISSU *Sync-Group *versions'
+             ' *(?P<nsr_issu_sync_group_versions>[0-9\/]+)$',
+        p15=r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9]+) *secs$',
+        p16=r'^\s*BGP *is *operating *in *(?P<operation_mode>[a-zA-Z]+) *mode.$',
+        p17=r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+             ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+             ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+             ' *(?P<standbyver>[0-9]+)$',
+        p17_1=r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$',
+        p17_2=r'^\s*(?P<spk>[0-9]+)\s+(?P<remote_as>[0-9\.]+)'
+               '\s+(?P<msg_rcvd>[0-9]+)\s+(?P<msg_sent>[0-9]+)'
+               '\s+(?P<tbl_ver>[0-9]+)\s+(?P<input_queue>[0-9]+)'
+               '\s+(?P<output_queue>[0-9]+)\s+(?P<up_down>[a-z0-9\:]+)'
+               '\s+(?P<state_pfxrcd>.+)$',
+        p17_3=r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+               ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+               ' +(?P<msg_sent>[0-9]+)'
+               ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+               ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+               ' +(?P<state_pfxrcd>.+)$',
+    )
+
     def cli(self, instance='all', vrf_type='all', vrf='all', address_family='', output=None):
 
         assert vrf_type in ['all', 'vrf']
@@ -4709,54 +4825,8 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
                                                                      vrf=vrf))
         else:
             out = output
-        p1 = re.compile(r'^\s*BGP *instance *(?P<instance_number>[0-9]+):'
-                        ' *(?P<instance>[a-zA-Z0-9\-\_\']+)$')
-        p2 = re.compile(r'^\s*VRF: *(?P<vrf>[\S]+)$')
-        p3 = re.compile(r'^\s*Address *Family:'
-                        ' *(?P<address_family>[\S\s]+)$')
-        p4 = re.compile(r'^\s*BGP *VRF *(?P<bgp_vrf>[a-zA-Z0-9]+), *state:'
-                        ' *(?P<vrf_state>[a-zA-Z]+)$')
-        p5 = re.compile(r'^\s*BGP *Route *Distinguisher:'
-                        ' *(?P<route_distinguisher>\S+)$')
-        p6 = re.compile(r'^\s*VRF *ID: *(?P<vrf_id>[a-z0-9]+)$')
-        p7 = re.compile(r'^\s*BGP *router *identifier'
-                        ' *(?P<router_id>[0-9\.]+)\, *local *AS *number'
-                        ' *(?P<local_as>[0-9\.]+)$')
-        p8 = re.compile(r'^\s*BGP *generic *scan *interval'
-                        ' *(?P<generic_scan_interval>[0-9]+) *secs$')
-        p9 = re.compile(r'^\s*Non-stop *routing *is'
-                        ' *(?P<non_stop_routing>[A-Za-z]+)$')
-        p10 = re.compile(r'^\s*BGP *table *state:'
-                         ' *(?P<table_state>[a-zA-Z]+)$')
-        p11 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         '(?: *RD *version: (?P<rd_version>[0-9]+))?$')
-        p12 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         ' *(?P<bgp_table_version>[0-9]+)$')
-        p13 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version'
-                         ' *(?P<nsr_initial_initsync_version>[0-9]+)'
-                         ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p14 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions'
-                         ' *(?P<nsr_issu_sync_group_versions>[0-9\/]+)$')
-        p15 = re.compile(
-            r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9]+) *secs$')
-        p16 = re.compile(
-            r'^\s*BGP *is *operating *in *(?P<operation_mode>[a-zA-Z]+) *mode.$')
-        p17 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
-                         ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
-                         ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
-                         ' *(?P<standbyver>[0-9]+)$')
-        p17_1 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+)$')
-        p17_2 = re.compile(r'^\s*(?P<spk>[0-9]+)\s+(?P<remote_as>[0-9\.]+)'
-                           '\s+(?P<msg_rcvd>[0-9]+)\s+(?P<msg_sent>[0-9]+)'
-                           '\s+(?P<tbl_ver>[0-9]+)\s+(?P<input_queue>[0-9]+)'
-                           '\s+(?P<output_queue>[0-9]+)\s+(?P<up_down>[a-z0-9\:]+)'
-                           '\s+(?P<state_pfxrcd>.+)$')
-        p17_3 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
-                           ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
-                           ' +(?P<msg_sent>[0-9]+)'
-                           ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           ' +(?P<state_pfxrcd>.+)$')
+
+        p = ShowBgpInstanceSummary.patterns
 
         # Init vars
         bgp_instance_summary_dict = {}
@@ -4782,7 +4852,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP instance 0: 'default' 
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 instance = m.groupdict()['instance']
                 instance = instance.replace("'","")
@@ -4801,7 +4871,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # VRF: VRF1
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 if 'vrf' not in bgp_instance_summary_dict['instance'][instance]:
@@ -4820,7 +4890,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             
             # Address Family: VPNv4 Unicast
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 if 'address_family' not in bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]:
@@ -4832,7 +4902,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             # BGP VRF VRF1, state: Active
             # BGP VRF vrf1, state: Active
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 if not vrf:
                     vrf_dict = bgp_instance_summary_dict.setdefault('instance', {}).setdefault(instance, {}).setdefault('vrf', {}).setdefault(input_vrf,{})
@@ -4850,7 +4920,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP Route Distinguisher: 200:1
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 route_distinguisher = str(m.groupdict()['route_distinguisher'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['route_distinguisher'] = route_distinguisher
@@ -4858,7 +4928,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             
             # VRF ID: 0x60000001
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 vrf_id = str(m.groupdict()['vrf_id'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['vrf_id'] = vrf_id
@@ -4866,7 +4936,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP router identifier 10.229.11.11, local AS number 100
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 router_id = str(m.groupdict()['router_id'])
                 try:
@@ -4882,7 +4952,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP generic scan interval 60 secs
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 generic_scan_interval = int(m.groupdict()['generic_scan_interval'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['generic_scan_interval'] = generic_scan_interval
@@ -4890,7 +4960,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # Non-stop routing is enabled
 
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 non_stop_routing = str(m.groupdict()['non_stop_routing'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['non_stop_routing'] = non_stop_routing
@@ -4898,7 +4968,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP table state: Active
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 table_state = str(m.groupdict()['table_state']).lower()
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['table_state'] = table_state
@@ -4906,7 +4976,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # Table ID: 0x0   RD version: 0
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['table_id'] = table_id
@@ -4917,7 +4987,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP main routing table version 63
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['bgp_table_version'] =  bgp_table_version       
@@ -4925,7 +4995,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP NSR Initial initsync version 11 (Reached)
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 nsr_initial_initsync_version = int(m.groupdict()['nsr_initial_initsync_version'])
                 nsr_initial_init_ver_status = str(m.groupdict()['nsr_initial_init_ver_status']).lower()
@@ -4935,7 +5005,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP NSR/ISSU Sync-Group versions 0/0
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 nsr_issu_sync_group_versions = str(m.groupdict()['nsr_issu_sync_group_versions'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['nsr_issu_sync_group_versions'] = nsr_issu_sync_group_versions
@@ -4943,7 +5013,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP scan interval 60 secs
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 scan_interval = int(m.groupdict()['scan_interval'])
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['scan_interval'] = scan_interval
@@ -4951,7 +5021,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
 
             # BGP is operating in STANDALONE mode.
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 operation_mode = str(m.groupdict()['operation_mode']).lower()
                 bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]['operation_mode'] = operation_mode
@@ -4960,7 +5030,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
             # Speaker              63         63         63         63          63           0
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 process = str(m.groupdict()['process'])
                 if 'process' not in bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['address_family'][address_family]:
@@ -4978,7 +5048,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             # Neighbor        Spk    AS MsgRcvd MsgSent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
             # 2001:db8:20:1:5::5
 
-            m = p17_1.match(line)
+            m = p.p17_1.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 data_on_nextline = True
@@ -4993,7 +5063,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             #                   0   200             0       0        0    0    0 00:00:00 Idle (Admin)!
             #                   0   60000.60001     0       0        0    0    0 00:00:00 Idle (Admin)!
 
-            m = p17_2.match(line)
+            m = p.p17_2.match(line)
             if m and data_on_nextline:
                 data_on_nextline = False
                 if 'address_family' not in bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]['neighbor'][neighbor]:
@@ -5023,7 +5093,7 @@ class ShowBgpInstanceSummary(ShowBgpInstanceSummarySchema):
             # 10.16.2.2           0   100       0       0        0    0    0 00:00:00 Idle
             # 10.0.0.35         0   200       0       0        0    0    0 00:00:00 Idle (Admin)!
 
-            m = p17_3.match(line)
+            m = p.p17_3.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 if 'neighbor' not in bgp_instance_summary_dict['instance'][instance]['vrf'][vrf]:
@@ -5149,130 +5219,87 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
     exclude = ['bgp_table_version', 'rd_version', 'nsr_initial_init_ver_status', 'nsr_initial_initsync_version']
 
-    def cli(self, vrf_type='all', address_family='', instance='all', vrf='all', output=None):
-
-        # Verify vrf_type and address_family
-        assert vrf_type in ['all', 'vrf']
-        assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
-
-        # Execute command
-        if output is None:
-            if vrf_type == 'all':
-                output = self.device.execute(self.cli_command[0].\
-                                             format(instance=instance))
-            else:
-                if address_family:
-                    output = self.device.execute(self.cli_command[2].\
-                                                 format(instance=instance,
-                                                 address_family=address_family,
-                                                 vrf_type=vrf_type,
-                                                 vrf=vrf))
-                else:
-                    output = self.device.execute(self.cli_command[1].\
-                                                 format(instance=instance,
-                                                        vrf_type=vrf_type,
-                                                        vrf=vrf))
-        # Init
-        parsed_dict = {}
-        last_prefix = None
-
-        # Determind VRF and AF
-        if vrf_type == 'all':
-            vrf = 'default'
-            af_default = None
-        elif vrf_type == 'vrf':
-            if vrf != 'all':
-                input_vrf = vrf
-            # Reset vrf
-            vrf = None
-            if address_family == 'ipv6 unicast':
-                af_default = 'vpnv6 unicast'
-            else:
-                af_default = 'vpnv4 unicast'
-
+    patterns = Patterns(
         # BGP instance 0: 'default'
-        p1 = re.compile(r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
-                        r' +(?P<instance>(\S+))$')
+        p1=r'^\s*BGP +instance +(?P<instance_number>[0-9]+):'
+           r' +(?P<instance>(\S+))$',
 
         # VRF: VRF1
-        p2 = re.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
+        p2=r'^\s*VRF: +(?P<vrf>(\S+))$',
 
         # Address Family: VPNv6 Unicast
-        p3 = re.compile(r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$')
+        p3=r'^\s*Address +Family: +(?P<address_family>[\S\s]+)$',
 
         # BGP VRF VRF1, state: Active
-        p4 = re.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
-                        r' +(?P<vrf_state>(\S+))$')
-
-        # BGP Route Distinguisher: 200:1
-        # BGP Route Distinguisher: 172.16.2.90:1
+        p4=r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
+           r' +(?P<vrf_state>(\S+))$',
 
         # VRF ID: 0x60000001
-        p5 = re.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
+        p5=r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$',
 
         # BGP router identifier 10.4.1.1, local AS number 100
         # BGP router identifier 10.10.10.108, local AS number 65108.65108
-        p6 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
+        p6=r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+           r' +local +AS +number +(?P<local_as>([\d\.]+))$',
 
         # BGP generic scan interval 60 secs
-        p7 =  re.compile(r'^\s*BGP +generic +scan +interval'
-                         r' +(?P<interval>(\d+)) +secs$')
+        p7=r'^\s*BGP +generic +scan +interval'
+           r' +(?P<interval>(\d+)) +secs$',
 
         # Non-stop routing is enabled
-        p8 = re.compile(r'^\s*Non-stop +routing is enabled$')
+        p8=r'^\s*Non-stop +routing is enabled$',
 
         # BGP table state: Active
-        p9 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+        p9=r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$',
 
         # Table ID: 0xe0000010   RD version: 43
-        p10 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
-                         r' +(?P<rd_version>[0-9]+)$')
+        p10=r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+            r' +(?P<rd_version>[0-9]+)$',
 
         # BGP main routing table version 43
-        p11 = re.compile(r'^\s*BGP +main +routing +table +version'
-                         r' +(?P<bgp_table_version>[0-9]+)$')
+        p11=r'^\s*BGP +main +routing +table +version'
+            r' +(?P<bgp_table_version>[0-9]+)$',
 
         # BGP NSR Initial initsync version 11 (Reached)
-        p12 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
-                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p12=r'^\s*BGP +NSR +Initial +initsync +version'
+            r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+            r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
 
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p13 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
-                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p13=r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+            r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$',
 
-        # BGP scan interval 60 secs 
-        p14 = re.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
-                         r' +secs$')
+        # BGP scan interval 60 secs
+        p14=r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
+            r' +secs$',
 
         # Route Distinguisher: 200:1 (default for vrf VRF1)
         # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
         # Route Distinguisher: 172.16.2.88:1000
-        p15 = re.compile(r'^\s*Route +Distinguisher:'
-                         r' +(?P<route_distinguisher>\S+)'
-                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+        p15=r'^\s*Route +Distinguisher:'
+            r' +(?P<route_distinguisher>\S+)'
+            r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$',
 
         # *> 2001:db8:cdc9:190::/64   2001:db8:20:1:5::5
         # *>i[2][0][48][0014.01ff.0001][32][10.249.249.10]/136
         # *> [1][10.4.1.1:1][1234.bcff.5d7f.3e11.0505][12564523]/111
-        p16_1 = re.compile(r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                           r' *(?P<prefix>(?P<ip>[a-z0-9\.\:\[\]]+)\/(?P<mask>\d+))'
-                           r'(?: +(?P<next_hop>\S+))?$')
+        p16_1=r'^\s*(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+              r' *(?P<prefix>(?P<ip>[a-z0-9\.\:\[\]]+)\/(?P<mask>\d+))'
+              r'(?: +(?P<next_hop>\S+))?$',
 
         # 2219             0 200 33299 51178 47751 {27016} e
         # 2219             0 200 33299 51178 47751 {27016} 65107.65107 e
-        p16_2 = re.compile(r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
-                           r' +(?P<path>[0-9\.\{\}\s]+) '
-                           r'+(?P<origin_codes>(i|e|\?))$')
+        p16_2=r'^\s*(?P<metric>[0-9]+) +(?P<weight>[0-9]+)'
+              r' +(?P<path>[0-9\.\{\}\s]+) '
+              r'+(?P<origin_codes>(i|e|\?))$',
 
         # Network            Next Hop   Metric LocPrf Weight Path
         # 172.16.2.88                        0    100      0 ?
         # 172.16.2.88                             100      0 i
         # 0.0.0.0                                          0 i
-        p16_3 = re.compile(r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
-                           r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
-                           r' +(?P<origin_codes>(\?|i|e))$')
+        p16_3=r'^\s*(?P<next_hop>(\S+))(?: +(?P<metric>(\d+)))?'
+              r'(?: +(?P<locprf>(\d+)))? +(?P<weight>(\d+))'
+              r' +(?P<origin_codes>(\?|i|e))$',
 
         # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
         # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
@@ -5280,24 +5307,71 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
         # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
         # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
         # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
-        p16 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)\/(?P<mask>\d+))?'
-                         r' +(?P<next_hop>\S+) +(?P<number>[\d\.\s\{\}]+)'
-                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+        p16=r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+            r' *(?P<prefix>(?P<ip>[0-9\.\:\[\]]+)\/(?P<mask>\d+))?'
+            r' +(?P<next_hop>\S+) +(?P<number>[\d\.\s\{\}]+)'
+            r'(?: *(?P<origin_codes>(i|e|\?)))?$',
 
         #                                                                 65107.65107 ?
-        p17 = re.compile(r'(?P<path>[\d\.\s]+)'
-                         r' *(?P<origin_codes>(i|e|\?))?$')
+        p17=r'(?P<path>[\d\.\s]+)'
+            r' *(?P<origin_codes>(i|e|\?))?$',
 
         # Processed 40 prefixes, 50 paths
-        p18 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
-                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+        p18=r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+            r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$',
+    )
+
+    def cli(self, vrf_type='all', address_family='', instance='all', vrf='all', output=None):
+
+        # Verify vrf_type and address_family
+        assert vrf_type in ['all', 'vrf']
+        assert address_family in ['', 'ipv4 unicast', 'ipv6 unicast']
+
+        # Execute command
+        if output is None:
+            if vrf_type == 'all':
+                output = self.device.execute(self.cli_command[0].\
+                                             format(instance=instance))
+            else:
+                if address_family:
+                    output = self.device.execute(self.cli_command[2].\
+                                                 format(instance=instance,
+                                                 address_family=address_family,
+                                                 vrf_type=vrf_type,
+                                                 vrf=vrf))
+                else:
+                    output = self.device.execute(self.cli_command[1].\
+                                                 format(instance=instance,
+                                                        vrf_type=vrf_type,
+                                                        vrf=vrf))
+        # Init
+        parsed_dict = {}
+        last_prefix = None
+
+        # Determind VRF and AF
+        if vrf_type == 'all':
+            vrf = 'default'
+            af_default = None
+        elif vrf_type == 'vrf':
+            if vrf != 'all':
+                input_vrf = vrf
+            # Reset vrf
+            vrf = None
+            if address_family == 'ipv6 unicast':
+                af_default = 'vpnv6 unicast'
+            else:
+                af_default = 'vpnv4 unicast'
+
+        p = ShowBgpInstanceAllAll.patterns
+
+        # BGP Route Distinguisher: 200:1
+        # BGP Route Distinguisher: 172.16.2.90:1
 
         for line in output.splitlines():
             line = line.rstrip()
 
             # BGP instance 0: 'default'
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = group['instance'].replace("'","")
@@ -5311,7 +5385,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # VRF: VRF1
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 vrf_dict = inst_dict.setdefault('vrf', {}).setdefault(vrf, {})
@@ -5325,7 +5399,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
             # Address Family: VPNv4 Unicast
             # Address family: IPv6 Labeled-unicast
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 original_address_family = address_family
@@ -5335,7 +5409,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP VRF VRF1, state: Active
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 # if no vrf key, set it to be the user input
@@ -5353,7 +5427,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # VRF ID: 0x60000001
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 vrf_id = m.groupdict()['vrf_id']
                 af_dict['vrf_id'] = vrf_id
@@ -5361,7 +5435,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
             # BGP router identifier 10.4.1.1, local AS number 100
             # BGP router identifier 10.10.10.108, local AS number 65108.65108
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['router_identifier'] = group['router_identifier']
@@ -5373,25 +5447,25 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue 
 
             # BGP generic scan interval 60 secs 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 af_dict['generic_scan_interval'] = m.groupdict()['interval']
                 continue          
 
             # Non-stop routing is enabled
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 af_dict['non_stop_routing'] = True
                 continue
 
             # BGP table state: Active
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 af_dict['table_state'] = m.groupdict()['table_state'].lower()
                 continue
 
             # Table ID: 0x0   RD version: 0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['table_id'] = group['table_id']
@@ -5399,13 +5473,13 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP main routing table version 43
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 af_dict['bgp_table_version'] = int(m.groupdict()['bgp_table_version'])
                 continue
 
             # BGP NSR Initial initsync version 11 (Reached)
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['nsr_initial_initsync_version'] = group['nsr_initial_initsync_version']
@@ -5413,20 +5487,20 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # BGP NSR/ISSU Sync-Group versions 0/0
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 af_dict['nsr_issu_sync_group_versions'] = \
                                 m.groupdict()['nsr_issu_sync_group_versions']
                 continue
 
             # BGP scan interval 60 secs
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                af_dict['scan_interval'] = int(m.groupdict()['scan_interval'])
                continue
 
             # Route Distinguisher: 200:1 (default for vrf VRF1)
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 rd = group['route_distinguisher']
@@ -5443,7 +5517,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
             # *> 2001:db8:cdc9:190::/64   2001:db8:20:1:5::5
             # *>i[2][0][48][0014.01ff.0001][32][10.249.249.10]/136
-            m = p16_1.match(line)
+            m = p.p16_1.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -5463,7 +5537,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
 
             # 2219             0 200 33299 51178 47751 {27016} e
             # 2219             0 200 33299 51178 47751 {27016} 65107.65107 e
-            m = p16_2.match(line)
+            m = p.p16_2.match(line)
             if m:
                 group = m.groupdict()
                 pfx_dict['metric'] = group['metric']
@@ -5475,7 +5549,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # Network            Next Hop   Metric LocPrf Weight Path
             # 172.16.2.88                        0    100      0 ?
             # 172.16.2.88                             100      0 i
-            m = p16_3.match(line)
+            m = p.p16_3.match(line)
             if m:
                 group = m.groupdict()
                 pfx_dict['next_hop'] = group['next_hop']
@@ -5493,7 +5567,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
             # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
             # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -5539,7 +5613,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             #                                                                 65107.65107 ?
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 if 'path' in pfx_dict:
@@ -5549,7 +5623,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 continue
 
             # Processed 40 prefixes, 50 paths
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['processed_prefix'] = int(group['processed_prefix'])
@@ -5593,33 +5667,37 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
     # TODO schema
     cli_command = 'show bgp sessions'
-    def cli(self, output=None):
-        
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-        
-        ret_dict = {}
-        instance = 'default'
-
+    patterns = Patterns(
         # 10.36.3.3         default                 0 65000     0     0  Established  None
         # 2001:1:1:1::1   default                 0 65000     0     0  Established  None
         # 10.1.7.212     default                 0 10396     0     0  Established  NSR Ready
-        p1 = re.compile(r'^(?P<neighbor>\S+) +(?P<vrf>\S+) +(?P<spk>\d+) +'
+        p1=r'^(?P<neighbor>\S+) +(?P<vrf>\S+) +(?P<spk>\d+) +'
             '(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
-            '(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
+            '(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$',
 
         # 2001:db8:4401:4453::6f9
-        p1_1 = re.compile(r'^(?P<neighbor>[\w\d:]+)$')
+        p1_1=r'^(?P<neighbor>[\w\d:]+)$',
 
         # default 0 65000 0 0 Established NSR Ready
-        p1_2 = re.compile(r'^(?P<vrf>\S+) +(?P<spk>\d+) +'
-                          r'(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
-                          r'(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$')
+        p1_2=r'^(?P<vrf>\S+) +(?P<spk>\d+) +'
+             r'(?P<as_number>\d+) +(?P<in_q>\d+) +(?P<out_q>\d+) +'
+             r'(?P<nbr_state>\w+) +(?P<nsr_state>[\w\s]+)$',
 
         # BGP instance 0: 'default'
-        p2 = re.compile(r'^BGP +instance +\d+: +\'(?P<instance>\S+)\'$')
+        p2=r'^BGP +instance +\d+: +\'(?P<instance>\S+)\'$',
+    )
+
+    def cli(self, output=None):
+        
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+        
+        ret_dict = {}
+        instance = 'default'
+
+        p = ShowBgpSessions.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -5627,7 +5705,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
             # 10.36.3.3         default                 0 65000     0     0  Established  None
             # 2001:1:1:1::1   default                 0 65000     0     0  Established  None
             # 10.1.7.212     default                 0 10396     0     0  Established  NSR Ready
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 vrf = group['vrf']
@@ -5655,13 +5733,13 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # 2001:db8:4401:4453::6f9
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 neighbor = m.groupdict()['neighbor']
                 continue
 
             # default 0 65000 0 0 Established NSR Ready
-            m = p1_2.match(line)
+            m = p.p1_2.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict = ret_dict.setdefault('instance', {}). \
@@ -5680,7 +5758,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # BGP instance 0: 'default'
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 instance = group['instance']
@@ -5745,19 +5823,9 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
 
     cli_command = 'show bgp vrf-db vrf all'
 
-    def cli(self, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # Init
-        parsed_dict = {}
-        vrf_dict = {}
-
+    patterns = Patterns(
         # VRF                              ID          RD                REF AFs
-        # default                          0x60000000  0:0:0             8   v4u, Vv4u, v6u, 
+        # default                          0x60000000  0:0:0             8   v4u, Vv4u, v6u,
         # NOVI-TST                         0x60000001  172.16.2.88:0     4   v4u
         # test_ipv6_overlay                0x0         0:0:0             2   v4u, v6u
         # BTV-nPVR-MULTICAST-IAAS          0x60000004  172.16.2.88:1     4   v4u
@@ -5766,11 +5834,25 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
         # VPWS:2078                        -           172.16.2.88:2078  2   L2evpn
         # VPWS:10293                       -           172.16.2.88:10293 2   L2evpn
         # EVPN-Multicast-BTV               -           172.16.2.88:1000  2   L2evpn
-        p1 = re.compile(r'^(?P<vrf>(\S+)) +(?P<id>([x0-9\-]+)) +(?P<rd>(\S+))'
-                         ' +(?P<ref>(\d+)) +(?P<afs>(.*))$')
+        p1=r'^(?P<vrf>(\S+)) +(?P<id>([x0-9\-]+)) +(?P<rd>(\S+))'
+            ' +(?P<ref>(\d+)) +(?P<afs>(.*))$',
 
         #                                                                  Vv6u, L2evpn
-        p2 = re.compile(r'^(?P<item>([a-zA-Z0-9\,\s]+))$')
+        p2=r'^(?P<item>([a-zA-Z0-9\,\s]+))$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # Init
+        parsed_dict = {}
+        vrf_dict = {}
+
+        p = ShowBgpVrfDbVrfAll.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -5785,7 +5867,7 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
             # VPWS:2078                        -           172.16.2.88:2078  2   L2evpn
             # VPWS:10293                       -           172.16.2.88:10293 2   L2evpn
             # EVPN-Multicast-BTV               -           172.16.2.88:1000  2   L2evpn
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 vrf_dict = parsed_dict.setdefault('vrf', {}).\
@@ -5797,7 +5879,7 @@ class ShowBgpVrfDbVrfAll(ShowBgpVrfDbVrfAllSchema):
                 continue
 
             #                                                                  Vv6u, L2evpn
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if vrf_dict:
                     afs = m.groupdict()['item'].strip().replace(",", "").split()
@@ -5886,6 +5968,80 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
       'path_type',
       'weight']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +routing +table +information +for +VRF'
+            ' +(?P<vrf_name>\S+), +address +family'
+            ' +(?P<address_family>[\w\s\-\_]+)$',
+        p2=r'^\s*BGP +table +version +is'
+            ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
+            ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$',
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+              '(?P<path_type>(i|e|c|l|a|r|I))?'
+              '(?P<prefix>[\w\.\:\/\[\]\,]{3,})'
+              '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$',
+        p3_1_1=r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
+                '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) '
+                '+(?P<next_hop>[\w\.\/]+) +'
+                '(?P<metric>\d+) +(?P<localprf>\d+) '
+                '+(?P<weight>\d+) +(?P<path>[\d ]+) +'
+                '(?P<origin_codes>(i|e|\?|\||&))$',
+        p3_1_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+                ' (?P<path_type>(i|e|c|l|a|r|I)) '
+                '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$',
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+              '(?P<path_type>(i|e|c|l|a|r|I))'
+              '(?P<prefix>[\w\.\:\/\[\]\,]+)'
+              ' +(?P<next_hop>[\w\.\:]+)'
+              ' +(?P<numbers>[\w\s\(\)\{\}]+)'
+              ' +(?P<origin_codes>(i|e|\?|\&|\|))$',
+        p3_2_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                '(?P<path_type>(i|e|c|l|a|r|I))?'
+                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                '(?P<prefix>[\w\.\:\/\[\]\,]+)'
+                ' +(?P<next_hop>[\w\.\:]+)'
+                ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$',
+        p3_3=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+              '(?P<path_type>(i|e|c|l|a|r|I))?'
+              ' *(?P<next_hop>[\w\.\:]{8,})'
+              '(?: +(?P<numbers>[\w\s\(\)\{\}]+))?'
+              ' +(?P<origin_codes>(i|e|\?|\|))$',
+        p3_3_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+                '(?P<path_type>(i|e|c|l|a|r|I))?'
+                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+                ' +(?P<next_hop>[\w\.\:]+)'
+                ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$',
+        p3_3_2=r'^\s*(?P<numbers>[0-9\s\(\)\{\}]+)? +'
+                '(?P<origin_codes>(i|e|\?|\|))$',
+        p3_4=r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$',
+        p4=r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>(\S+))'
+            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)'
+            '|(default +for +vrf +(?P<default_vrf2>\S+))))\))?$',
+        p5=r'^\s*BGP *router *identifier *(?P<router_identifier>[0-9\.]+)'
+            ', *local *AS *number *(?P<local_as>[0-9]+)$',
+        p6=r'^\s*BGP *generic *scan *interval *'
+            '(?P<generic_scan_interval>[0-9]+) *secs$',
+        p7=r'^\s*Non-stop *routing *is'
+            ' *(?P<non_stop_routing>[A-Za-z]+)$',
+        p8=r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$',
+        p9=r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+            ' *RD *version: (?P<rd_version>[0-9]+)$',
+        p10=r'^\s*BGP *main *routing *table *version'
+             ' *(?P<bgp_table_version>[0-9]+)$',
+        p11=r'^\s*BGP *NSR *Initial *initsync *version *'
+             '(?P<nsr_initial_initsync_version>[0-9]+)'
+             ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
+        p12=r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
+             '(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$',
+        p13=r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$',
+        p14=r'^(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+             '(?P<path_type>(i|e|c|l|a|r|I))? *(?P<prefix>[\w\.\/\[\]\,]+)$',
+        p15=r'^(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
+             '(?: *(?P<origin_codes>(i|e|\?)))$',
+        p16=r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +'
+             '(?P<processed_paths>[0-9]+) +paths$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -5907,78 +6063,8 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
         prefix = ''
 
         p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<address_family>[\w\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
-                            ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[\w\.\:\/\[\]\,]{3,})'
-                            '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
-        p3_1_1 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
-                            '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) '
-                            '+(?P<next_hop>[\w\.\/]+) +'
-                            '(?P<metric>\d+) +(?P<localprf>\d+) '
-                            '+(?P<weight>\d+) +(?P<path>[\d ]+) +'
-                            '(?P<origin_codes>(i|e|\?|\||&))$')
-        p3_1_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            ' (?P<path_type>(i|e|c|l|a|r|I)) '
-                            '(?: *(?P<next_hop>[\w\.\:\/\[\]\,]+))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[\w\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[\w\.\:]+)'
-                            ' +(?P<numbers>[\w\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            '(?P<prefix>[\w\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[\w\.\:]+)'
-                            ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[\w\.\:]{8,})'
-                            '(?: +(?P<numbers>[\w\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                            ' +(?P<next_hop>[\w\.\:]+)'
-                            ' +(?P<numbers>[\w\s\(\)\{\}\?]+)$')
-        p3_3_2 = re.compile(r'^\s*(?P<numbers>[0-9\s\(\)\{\}]+)? +'
-                            '(?P<origin_codes>(i|e|\?|\|))$')
-        p3_4 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *: +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)'
-                            '|(default +for +vrf +(?P<default_vrf2>\S+))))\))?$')
-        
-        p5 = re.compile(r'^\s*BGP *router *identifier *(?P<router_identifier>[0-9\.]+)'
-                         ', *local *AS *number *(?P<local_as>[0-9]+)$')
-        p6 =  re.compile(r'^\s*BGP *generic *scan *interval *'
-                            '(?P<generic_scan_interval>[0-9]+) *secs$')
-        p7 = re.compile(r'^\s*Non-stop *routing *is'
-                        ' *(?P<non_stop_routing>[A-Za-z]+)$')
-        p8 = re.compile(r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
-        p9 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         ' *RD *version: (?P<rd_version>[0-9]+)$')
-        p10 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         ' *(?P<bgp_table_version>[0-9]+)$')
-        p11 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version *'
-                            '(?P<nsr_initial_initsync_version>[0-9]+)'
-                          ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        p12 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
-                            '(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-        p13 = re.compile(r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$')
-        p14 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))? *(?P<prefix>[\w\.\/\[\]\,]+)$')
-        p15 = re.compile(r'^(?P<next_hop>[\w\.\:]+) *(?P<number>[\d\s\{\}]+)?'
-                            '(?: *(?P<origin_codes>(i|e|\?)))$')
-        p16 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+) +prefixes, +'
-                            '(?P<processed_paths>[0-9]+) +paths$')
+
+        patterns = ShowBgpL2vpnEvpn.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -5989,7 +6075,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
 
             # BGP routing table information for VRF VRF1, address family IPv4 Unicast
-            m = p1.match(line)
+            m = patterns.p1.match(line)
             if m:
                 # Get values
                 vrf_name = m.groupdict()['vrf_name']
@@ -6003,7 +6089,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
 
             # BGP table version is 35, local router ID is 10.229.11.11
             # BGP table version is 381, Local Router ID is 10.4.1.2
-            m = p2.match(line)
+            m = patterns.p2.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 local_router_id = m.groupdict()['local_router_id']
@@ -6012,7 +6098,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
 
             #                     2001:db8:400:13b1:21a:1ff:feff:161/128
-            m = p3_4.match(line)
+            m = patterns.p3_4.match(line)
             if m:
                 # Get keys
                 if 'njected' not in line and 'next_hop' in m.groupdict():
@@ -6032,7 +6118,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
 
             # * i                   2001:db8:400:a2bb:0:abcd:5678:3
-            m = p3_1_2.match(line)
+            m = patterns.p3_1_2.match(line)
             if m:
                 # Get keys
                 if 'njected' not in line and 'next_hop' in m.groupdict():
@@ -6053,7 +6139,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
             
             # *> [3][0][32][192.168.19.35]/70
-            m = p14.match(line)
+            m = patterns.p14.match(line)
             if m:
                 group = m.groupdict()
                 status_codes = group['status_codes'].strip()
@@ -6079,10 +6165,10 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
-            m = p3_1.match(line)
+            m = patterns.p3_1.match(line)
             # *>i10.111.8.3/32     10.84.66.66           2000        100          0 200 i
             # *>i10.111.8.4/32     10.84.66.66           2000        100          0 200 i
-            m1 = p3_1_1.match(line)
+            m1 = patterns.p3_1_1.match(line)
 
             m = m if m else m1
             if m:
@@ -6133,11 +6219,11 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             #                     0.0.0.0               100      32768 i
             #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
             # *>i                 10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_3.match(line)
+            m = patterns.p3_3.match(line)
 
             # * e                   10.70.2.2                                      0 100 300 ?
             # *>e                   10.70.1.2                                      0 100 300 ?
-            m1 = p3_3_1.match(line)
+            m1 = patterns.p3_3_1.match(line)
             m = m if m else m1
             if m and not prefix_dict:
                 # Get keys
@@ -6215,7 +6301,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
 
             # 100      33445 i
-            m = p3_3_2.match(line)
+            m = patterns.p3_3_2.match(line)
             if m:
                 # Parse numbers
                 numbers = m.groupdict()['numbers']
@@ -6269,7 +6355,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             # Route Distinguisher: 2:100    (VRF vpn2)
             # Route Distinguisher: 10.49.1.0:3    (L3VNI 9100)
             # Route Distinguisher: 172.16.2.88:1000 (default for vrf EVPN-Multicast-BTV)
-            m = p4.match(line)
+            m = patterns.p4.match(line)
             if m:
                 route_distinguisher = m.groupdict()['route_distinguisher']
                 new_address_family = original_address_family + ' RD ' + route_distinguisher
@@ -6305,10 +6391,10 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             # *>r10.16.2.0/24        0.0.0.0                4444        100      32768 ?
             # *>i10.49.0.0/16     10.106.101.1                            100          0 10 20 30 40 50 60 70 80 90 i
             # *>i10.4.2.0/24     10.106.102.4                            100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_2.match(line)
+            m = patterns.p3_2.match(line)
 
             # *&i10.145.1.0/24        192.168.151.2                0        100          0 ?
-            m1 = p3_2_1.match(line)
+            m1 = patterns.p3_2_1.match(line)
             m = m if m else m1
             if m:
                 # New prefix, reset index count
@@ -6390,7 +6476,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
                 # BGP router identifier 10.4.1.1, local AS number 100
 
-            m = p5.match(line)
+            m = patterns.p5.match(line)
             if m:
                 router_identifier = m.groupdict()['router_identifier']
                 local_as = int(m.groupdict()['local_as'])
@@ -6403,7 +6489,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP generic scan interval 60 secs 
 
-            m = p6.match(line)
+            m = patterns.p6.match(line)
             if m:
                 generic_scan_interval = m.groupdict()['generic_scan_interval']
                 # Set af_dict
@@ -6414,7 +6500,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # Non-stop routing is enabled
 
-            m = p7.match(line)
+            m = patterns.p7.match(line)
             if m:
                 non_stop_routing = str(m.groupdict()['non_stop_routing'])
                 # Set af_dict
@@ -6425,7 +6511,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP table state: Active
 
-            m = p8.match(line)
+            m = patterns.p8.match(line)
             if m:
                 table_state = m.groupdict()['table_state'].lower()
                 # Set af_dict
@@ -6436,7 +6522,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # Table ID: 0x0   RD version: 0
 
-            m = p9.match(line)
+            m = patterns.p9.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
                 rd_version = int(m.groupdict()['rd_version'])
@@ -6449,7 +6535,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP main routing table version 43
 
-            m = p10.match(line)
+            m = patterns.p10.match(line)
             if m:
                 bgp_table_version = int(m.groupdict()['bgp_table_version'])
                 # Set af_dict
@@ -6460,7 +6546,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP NSR Initial initsync version 11 (Reached)
 
-            m = p11.match(line)
+            m = patterns.p11.match(line)
             if m:
                 nsr_initial_initsync_version = m.groupdict()['nsr_initial_initsync_version']
                 nsr_initial_init_ver_status = str(m.groupdict()['nsr_initial_init_ver_status']).lower()
@@ -6473,7 +6559,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP NSR/ISSU Sync-Group versions 0/0
 
-            m = p12.match(line)
+            m = patterns.p12.match(line)
             if m:
                 nsr_issu_sync_group_versions = m.groupdict()['nsr_issu_sync_group_versions']
                 # Set af_dict
@@ -6484,7 +6570,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
             
             # BGP scan interval 60 secs
 
-            m = p13.match(line)
+            m = patterns.p13.match(line)
             if m:
                scan_interval = int(m.groupdict()['scan_interval'])
                # Set af_dict
@@ -6494,7 +6580,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                continue
             
             # 0.0.0.0                                0 i
-            m = p15.match(line)
+            m = patterns.p15.match(line)
             if m:
                 group = m.groupdict()
                 
@@ -6559,7 +6645,7 @@ class ShowBgpL2vpnEvpn(ShowBgpL2vpnEvpnSchema):
                 continue
             
             # Processed 40 prefixes, 50 paths
-            m = p16.match(line)
+            m = patterns.p16.match(line)
             if m:
                 processed_prefix = int(m.groupdict()['processed_prefix'])
                 processed_paths = int(m.groupdict()['processed_paths'])
@@ -6628,76 +6714,80 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
 
     cli_command = 'show bgp l2vpn evpn advertised'
 
-    def cli(self, output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-
-        # Init
-        parsed_dict = {}
-        index = 1
-
+    patterns = Patterns(
         # Route Distinguisher: 10.196.7.7:3
-        p1 = re.compile(r'^Route +Distinguisher: +(?P<rd>(\S+))$')
+        p1=r'^Route +Distinguisher: +(?P<rd>(\S+))$',
 
         # [2][0][48][7777.77ff.7779][0]/104 is advertised to 10.55.0.10
         # [1][0009.08ff.0d0c.0403.0201][0]/120 is advertised to 10.100.5.5
-        p2 = re.compile(r'^(?P<prefix>\[[^/]+\])/(?P<prefix_length>(\d+)) +is'
-                         ' +advertised +to +(?P<neighbor>(\S+))$')
+        p2=r'^(?P<prefix>\[[^/]+\])/(?P<prefix_length>(\d+)) +is'
+            ' +advertised +to +(?P<neighbor>(\S+))$',
 
         #  Path info:
-        p3 = re.compile(r'^Path info:$')
+        p3=r'^Path info:$',
 
         #    neighbor: Local           neighbor router id: 10.1.8.8
         #    neighbor: Local           neighbor router id: 10.196.7.7
-        p4 = re.compile(r'^neighbor: +(?P<neighbor>(\S+)) +neighbor +router'
-                         ' +id: +(?P<neighbor_router_id>(\S+))$')
+        p4=r'^neighbor: +(?P<neighbor>(\S+)) +neighbor +router'
+            ' +id: +(?P<neighbor_router_id>(\S+))$',
 
         #    valid  redistributed  best  import-candidate
-        p5 = re.compile(r'^(?P<flags>(valid.*))$')
+        p5=r'^(?P<flags>(valid.*))$',
 
         #    Received Path ID 0, Local Path ID 0, version 12
-        p6 = re.compile(r'^Received +Path +ID +(?P<rx_path_id>(\d+)), +Local'
-                         ' +Path +ID +(?P<local_path_id>(\d+)), +version'
-                         ' (?P<version>(\d+))$')
+        p6=r'^Received +Path +ID +(?P<rx_path_id>(\d+)), +Local'
+            ' +Path +ID +(?P<local_path_id>(\d+)), +version'
+            ' (?P<version>(\d+))$',
 
         #  Attributes after inbound policy was applied:
         #  Attributes after outbound policy was applied:
-        p7 = re.compile(r'^Attributes +after +(?P<type>(outbound|inbound))'
-                         ' +policy +was +applied:$')
+        p7=r'^Attributes +after +(?P<type>(outbound|inbound))'
+            ' +policy +was +applied:$',
 
         #    next hop: 10.1.8.8
-        p8 = re.compile(r'^next +hop:(?: +(?P<nexthop>(\S+)))?$')
+        p8=r'^next +hop:(?: +(?P<nexthop>(\S+)))?$',
 
         #    EXTCOMM
         #    ORG AS EXTCOMM
-        p9 = re.compile(r'^(?P<community_attributes>(EXTCOMM|ORG AS EXTCOMM))$')
+        p9=r'^(?P<community_attributes>(EXTCOMM|ORG AS EXTCOMM))$',
 
-        #    origin: IGP  
-        p10 = re.compile(r'^origin:(?: +(?P<origin>.*))?$')
+        #    origin: IGP
+        p10=r'^origin:(?: +(?P<origin>.*))?$',
 
-        #    aspath: 
-        p11 = re.compile(r'^aspath:(?: +(?P<aspath>.*))?$')
+        #    aspath:
+        p11=r'^aspath:(?: +(?P<aspath>.*))?$',
 
         #    community: no-export
-        p12 = re.compile(r'^community:(?: +(?P<community>.*))?$')
+        p12=r'^community:(?: +(?P<community>.*))?$',
 
         #    extended community: SoO:0.0.0.0:0 RT:100:7
-        p13 = re.compile(r'^extended +community:(?: +(?P<extended_community>.*))?$')
+        p13=r'^extended +community:(?: +(?P<extended_community>.*))?$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+
+        # Init
+        parsed_dict = {}
+        index = 1
+
+        p = ShowBgpL2vpnEvpnAdvertised.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Route Distinguisher: 10.196.7.7:3
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 af = 'l2vpn evpn RD ' + m.groupdict()['rd']
                 continue
 
             # [2][0][48][7777.77ff.7779][0]/104 is advertised to 10.55.0.10
             # [1][0009.08ff.0d0c.0403.0201][0]/120 is advertised to 10.100.5.5
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 adv = group['prefix'] + "/" + group['prefix_length']
@@ -6713,13 +6803,13 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
                 continue
 
             #  Path info:
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 continue
 
             #    neighbor: Local           neighbor router id: 10.1.8.8
             #    neighbor: Local           neighbor router id: 10.196.7.7
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 adv_dict['neighbor'] = group['neighbor']
@@ -6727,13 +6817,13 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
                 continue
 
             #    valid  redistributed  best  import-candidate
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 adv_dict['flags'] = m.groupdict()['flags'].split()
                 continue
 
             # Received Path ID 0, Local Path ID 0, version 193217
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 for key, value in group.items():
@@ -6742,7 +6832,7 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
 
             #  Attributes after inbound policy was applied:
             #  Attributes after outbound policy was applied:
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 attr_dict = adv_dict.\
                             setdefault(m.groupdict()['type']+"_attributes", {})
@@ -6750,7 +6840,7 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
                 continue
 
             #    next hop: 10.1.8.8
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 value = m.groupdict()['nexthop']
                 attr_dict['nexthop'] = value if value != None else ""
@@ -6758,34 +6848,34 @@ class ShowBgpL2vpnEvpnAdvertised(ShowBgpL2vpnEvpnAdvertisedSchema):
 
             #    EXTCOMM
             #    ORG AS EXTCOMM
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 attr_dict['community_attributes'] = m.groupdict()['community_attributes']
                 continue
 
             #    origin: IGP
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 value = m.groupdict()['origin']
                 attr_dict['origin'] = value if value != None else ""
                 continue
 
             #    aspath:
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 value = m.groupdict()['aspath']
                 attr_dict['aspath'] = value if value != None else ""
                 continue
 
             #    community: no-export
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 value = m.groupdict()['community']
                 attr_dict['community'] = value.split() if value != None else []
                 continue
 
             #    extended community: SoO:0.0.0.0:0 RT:100:7
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 value = m.groupdict()['extended_community']
                 attr_dict['extended_community'] = value.split() if value != None else []
@@ -6972,95 +7062,99 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
 
     cli_command = ['show bgp nexthops {ipaddress}']
 
-    def cli(self, ipaddress, output=None):
-
-        if output is None:
-            if ipaddress:
-                out = self.device.execute(self.cli_command[0].format(ipaddress=ipaddress))
-        else:
-            out = output
-
-        # Initialize dictionaries
-        ret_dict = {}
-        ipaddress_dict = {}
-        nexthop_address_dict = {}
-        nexthop_dict = {}        
-
-
+    patterns = Patterns(
         # VRF: default
-        p1 = re.compile(r'^VRF:\s+(?P<vrf>([\w]+))$')
+        p1=r'^VRF:\s+(?P<vrf>([\w]+))$',
 
         # Nexthop ID: 0x6000074, Version: 0x0
-        p2 = re.compile(r'^Nexthop ID:\s+(?P<nexthop_id>([\w]+)),\s+Version:\s+((?P<version>[\w]+))$')
+        p2=r'^Nexthop ID:\s+(?P<nexthop_id>([\w]+)),\s+Version:\s+((?P<version>[\w]+))$',
 
         # Nexthop Flags: 0x00000000
-        p3 = re.compile(r'^Nexthop Flags:\s+((?P<nexthop_flags>[\w]+))$')
+        p3=r'^Nexthop Flags:\s+((?P<nexthop_flags>[\w]+))$',
 
         # Nexthop Handle: 0x7fba00aafccc
-        p4 = re.compile(r'^Nexthop Handle:\s+((?P<nexthop_handle>[\w]+))$')
+        p4=r'^Nexthop Handle:\s+((?P<nexthop_handle>[\w]+))$',
 
         # Firsthop interface handle 0x0c001cc0
-        p5 = re.compile(r'^Firsthop interface handle\s+((?P<first_interface_handle>[\w]+))$')
+        p5=r'^Firsthop interface handle\s+((?P<first_interface_handle>[\w]+))$',
 
         # Gateway TBL Id: 0xe0000000    Gateway Flags: 0x00000080
-        p6 = re.compile(r'^Gateway TBL Id:\s+((?P<gateway_tbl_id>[\w]+)\s+)Gateway Flags:\s+((?P<gateway_flags>[\w]+))$')
+        p6=r'^Gateway TBL Id:\s+((?P<gateway_tbl_id>[\w]+)\s+)Gateway Flags:\s+((?P<gateway_flags>[\w]+))$',
 
         # Gateway Handle: 0x7fba14059ce0
-        p7 = re.compile(r'^Gateway Handle:\s+((?P<gateway_handle>[\w]+))$')
+        p7=r'^Gateway Handle:\s+((?P<gateway_handle>[\w]+))$',
 
         # Gateway: reachable, non-Connected route, prefix length 32
-        p8 = re.compile(r'^Gateway:\s+((?P<gateway>[\s\S]+))$')
+        p8=r'^Gateway:\s+((?P<gateway>[\s\S]+))$',
 
         # Resolving Route: 10.4.16.16/32 (static)
-        p9 = re.compile(r'^Resolving Route:\s+((?P<resolving_route>[\s\S]+))$')        
+        p9=r'^Resolving Route:\s+((?P<resolving_route>[\s\S]+))$',
 
         # Paths: 0
-        p10 = re.compile(r'^Paths:\s+((?P<paths>[\d]+)\s*)$')
+        p10=r'^Paths:\s+((?P<paths>[\d]+)\s*)$',
 
         # RIB Nexhop ID: 0x0
-        p11 = re.compile(r'^RIB Nexhop ID:\s+((?P<rib_nexthop_id>[\w]+))$')
+        p11=r'^RIB Nexhop ID:\s+((?P<rib_nexthop_id>[\w]+))$',
 
         # Status: [Reachable][Not Connected][Not Local]
-        p12 = re.compile(r'^Status:\s+((?P<status>[\s\S]+))$')
+        p12=r'^Status:\s+((?P<status>[\s\S]+))$',
 
         # Metric: 0
-        p13 = re.compile(r'^Metric:\s+((?P<metric>[\d]+))$')
+        p13=r'^Metric:\s+((?P<metric>[\d]+))$',
 
         # Registration: Asynchronous, Completed: 00:02:15
-        p14 = re.compile(r'^Registration:\s+(?P<registration>[\w]+),\s+Completed:\s+((?P<completed>[\w\:]+))$')
+        p14=r'^Registration:\s+(?P<registration>[\w]+),\s+Completed:\s+((?P<completed>[\w\:]+))$',
 
         # Events: Critical (1)/Non-critical (0)
-        p15 = re.compile(r'^Events:\s+((?P<events>[\s\S]+))$')
+        p15=r'^Events:\s+((?P<events>[\s\S]+))$',
 
         # Last Received: 00:02:14 (Critical)
-        p16 = re.compile(r'^Last Received:\s+((?P<last_received>[\s\S]+))$')
+        p16=r'^Last Received:\s+((?P<last_received>[\s\S]+))$',
 
         # Last gw update: (Crit-notif) 00:02:14(rib)
-        p17 = re.compile(r'^Last gw update:\s+((?P<last_gw_update>[\s\S]+))$')
+        p17=r'^Last gw update:\s+((?P<last_gw_update>[\s\S]+))$',
 
         # Reference Count: 1
-        p18 = re.compile(r'^Reference Count:\s+((?P<reference_count>[\d]+))$')
+        p18=r'^Reference Count:\s+((?P<reference_count>[\d]+))$',
 
         # Active Tables: [IPv4 Unicast]
-        p19 = re.compile(r'^Active Tables:\s+((?P<active_tables>[\s\S]+))$')
+        p19=r'^Active Tables:\s+((?P<active_tables>[\s\S]+))$',
 
         # Metrices: [0x0]
-        p20 = re.compile(r'^Metrices:\s+((?P<metrics>[\s\S]+))$')
+        p20=r'^Metrices:\s+((?P<metrics>[\s\S]+))$',
 
         # Reference Counts: [1]
-        p21 = re.compile(r'^Reference Counts:\s+(\[(?P<reference_counts>[\d]+)\])$')
+        p21=r'^Reference Counts:\s+(\[(?P<reference_counts>[\d]+)\])$',
 
         # Interface Handle: 0x0
-        p22 = re.compile(r'^Interface Handle:\s+((?P<interface_handle>[\w]+))$')                        
+        p22=r'^Interface Handle:\s+((?P<interface_handle>[\w]+))$',
 
         # Attr ref-count: 4
-        p23 = re.compile(r'^Attr ref-count:\s+((?P<attr_ref_count>[\d]+))$')
-        
+        p23=r'^Attr ref-count:\s+((?P<attr_ref_count>[\d]+))$',
+    )
+
+    def cli(self, ipaddress, output=None):
+
+        if output is None:
+            if ipaddress:
+                out = self.device.execute(self.cli_command[0].format(ipaddress=ipaddress))
+        else:
+            out = output
+
+        # Initialize dictionaries
+        ret_dict = {}
+        ipaddress_dict = {}
+        nexthop_address_dict = {}
+        nexthop_dict = {}        
+
+
+        p = ShowBgpNexthops.patterns
+
         for line in out.splitlines():
             line = line.strip()
                 
             # VRF: default
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 vrf = group['vrf']
@@ -7076,7 +7170,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue
             
             # Nexthop ID: 0x6000074, Version: 0x0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 #update nexthop_address_dict               
@@ -7085,7 +7179,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue
 
             # Nexthop Flags: 0x00000000
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 #update nexthop_address_dict
@@ -7093,7 +7187,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue
 
             # Nexthop Handle: 0x7fba00aafccc
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 nexthop_address_dict.update({'nexthop_handle': group['nexthop_handle']})  
@@ -7101,7 +7195,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue
 
             # Firsthop interface handle 0x0c001cc0
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 #set first_interface_handle_dict
@@ -7111,7 +7205,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue            
 
             # Gateway TBL Id: 0xe0000000    Gateway Flags: 0x00000080
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7120,7 +7214,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue
             
             # Gateway Handle: 0x7fba14059ce0
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7128,7 +7222,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue 
             
             # Gateway: reachable, non-Connected route, prefix length 32
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7136,7 +7230,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue         
             
             # Resolving Route: 10.4.16.16/32 (static)
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7144,7 +7238,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue 
 
             # Paths: 0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7152,7 +7246,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue       
 
             # RIB Nexhop ID: 0x0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7160,7 +7254,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue 
             
             # Status: [Reachable][Not Connected][Not Local]
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7168,7 +7262,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue         
             
             # Metric: 0
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7176,7 +7270,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue                      
 
             # Registration: Asynchronous, Completed: 00:02:15
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7185,7 +7279,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue   
 
             # Events: Critical (1)/Non-critical (0)
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7193,7 +7287,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue   
 
             # Last Received: 00:02:14 (Critical)
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7201,7 +7295,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue   
 
             # Last gw update: (Crit-notif) 00:02:14(rib)
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7209,7 +7303,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue                                      
 
             # Reference Count: 1
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 #update first_interface_handle_dict
@@ -7217,7 +7311,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue      
 
             # Active Tables: [IPv4 Unicast]
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 #set prefix_related_dict
@@ -7238,7 +7332,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue  
 
             # Metrices: [0x0]
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 metrics = group['metrics'].replace('[','').replace(']','')
@@ -7247,7 +7341,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue 
 
             # Reference Counts: [1]
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 group = m.groupdict()
                 #update prefix_related_dict
@@ -7255,7 +7349,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue   
 
             # Interface Handle: 0x0
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 group = m.groupdict()
                 #update nexthop_address_dict
@@ -7263,7 +7357,7 @@ class ShowBgpNexthops(ShowBgpNexthopsSchema):
                 continue   
 
             # Attr ref-count: 4
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 group = m.groupdict()
                 #update nexthop_address_dict
@@ -7337,87 +7431,91 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
 
     cli_command = ['show bgp all all nexthops']
 
-    def cli(self, output=None):
+    patterns = Patterns(
+        # Address Family: VPNv4 Unicast
+        p1=r'^Address +Family: +(?P<address_family>[\S\s]+)$',
 
-        if output is None:
-            out = self.device.execute(self.cli_command[0])
-        else:
-            out = output
+        # Total Nexthop Processing
+        p2=r'^Total +Nexthop +Processing$',
 
-        # Initialize dictionaries
-        ret_dict = {}
-
-        # reference dict
-        ref_dict = {}
-
-        # Address Family: VPNv4 Unicast
-        p1 =  re.compile(r'^Address +Family: +(?P<address_family>[\S\s]+)$')
-
-        # Total Nexthop Processing
-        p2 = re.compile(r'^Total +Nexthop +Processing$')
-
-        # Maximum Nexthop Processing
-        p3 = re.compile(r'^Maximum +Nexthop +Processing$')
+        # Maximum Nexthop Processing
+        p3=r'^Maximum +Nexthop +Processing$',
 
         # Last Notification Processing
-        p4 = re.compile(r'^Last +Notification +Processing$')
+        p4=r'^Last +Notification +Processing$',
 
         # Time Spent: 0.000 secs
-        p5 = re.compile(r'^Time +Spent: +(?P<time_spent_secs>[\d\.]+) secs$')
+        p5=r'^Time +Spent: +(?P<time_spent_secs>[\d\.]+) secs$',
 
         # Received: 00:00:00
-        p6 = re.compile(r'^Received: +(?P<received>.+)$')
+        p6=r'^Received: +(?P<received>.+)$',
 
         # Bestpaths Deleted: 0
-        p7 = re.compile(r'^Bestpaths +Deleted: +(?P<best_paths_deleted>[\S\s]+)$')
+        p7=r'^Bestpaths +Deleted: +(?P<best_paths_deleted>[\S\s]+)$',
 
         # Bestpaths Changed: 0
-        p8 = re.compile(r'^Bestpaths +Changed: +(?P<best_paths_changed>[\S\s]+)$')
+        p8=r'^Bestpaths +Changed: +(?P<best_paths_changed>[\S\s]+)$',
 
         # Gateway Address Family: IPv4 Unicast
-        p9 = re.compile(r'^Gateway +Address +Family: +(?P<gateway_address_family>[\S\s]+)$')
+        p9=r'^Gateway +Address +Family: +(?P<gateway_address_family>[\S\s]+)$',
 
         # Table ID: 0xe0000000
-        p10 = re.compile(r'^Table +ID: +(?P<table_id>[\S\s]+)$')
+        p10=r'^Table +ID: +(?P<table_id>[\S\s]+)$',
 
         # Nexthop Count: 2
-        p11 = re.compile(r'^Nexthop +Count: +(?P<next_hop_count>[\S\s]+)$')
+        p11=r'^Nexthop +Count: +(?P<next_hop_count>[\S\s]+)$',
 
         # Critical Trigger Delay: 0msec
-        p12 = re.compile(r'^Critical +Trigger +Delay: +(?P<critical_trigger_delay>[\S\s]+)$')
+        p12=r'^Critical +Trigger +Delay: +(?P<critical_trigger_delay>[\S\s]+)$',
 
         # Non-critical Trigger Delay: 10000msec
-        p13 = re.compile(r'^Non-critical +Trigger +Delay: +(?P<non_critical_trigger_delay>[\S\s]+)$')
+        p13=r'^Non-critical +Trigger +Delay: +(?P<non_critical_trigger_delay>[\S\s]+)$',
 
         # Nexthop Version: 1, RIB version: 1
-        p14 = re.compile(r'^Nexthop +Version: +(?P<next_hop_version>[\d]+), +RIB +version:'
-                         r' +(?P<rib_version>\d+)$')
+        p14=r'^Nexthop +Version: +(?P<next_hop_version>[\d]+), +RIB +version:'
+            r' +(?P<rib_version>\d+)$',
 
         # EPE Table Version: 1, EPE Label version: 1
-        p15 = re.compile(r'^EPE +Table +Version: +(?P<epe_table_version>[\d]+), +EPE +Label '
-                         r'+version: +(?P<epe_label_version>[\d]+)$')
+        p15=r'^EPE +Table +Version: +(?P<epe_table_version>[\d]+), +EPE +Label '
+            r'+version: +(?P<epe_label_version>[\d]+)$',
 
         # EPE Downloaded Version: 1, EPE Standby Version: 1
-        p16 = re.compile(r'^EPE +Downloaded +Version: +(?P<epe_downloaded_version>[\d]+), '
-                         r'+EPE +Standby +Version: +(?P<epe_standby_version>[\d]+)$')
+        p16=r'^EPE +Downloaded +Version: +(?P<epe_downloaded_version>[\d]+), '
+            r'+EPE +Standby +Version: +(?P<epe_standby_version>[\d]+)$',
 
         # 108.10.10.1     [R][NC][NL]          2   e0000000   1/0    00:13:49 (Cri)        1/4
-        p17 = re.compile('^(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<status>[\S]+)\s+'
-                         '(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+(?P<last_rib_event>\S+'
-                         '\s\(\w+\))\s+(?P<ref_count>\S+)$')
+        p17='^(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+(?P<status>[\S]+)\s+'
+            '(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+(?P<last_rib_event>\S+'
+            '\s\(\w+\))\s+(?P<ref_count>\S+)$',
 
         # 2000:108:10:10::1
-        p18 = re.compile(r'^(?P<next_hop_ipv6>[a-fA-F\d\:]+)$')
+        p18=r'^(?P<next_hop_ipv6>[a-fA-F\d\:]+)$',
 
         # [R][NC][NL]          1   e0800000   1/0    00:12:06 (Cri)        0/3
-        p19 = re.compile(r'^(?P<status>[\S]+)\s+(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+'
-                         r'(?P<last_rib_event>\S+\s\(\w+\))\s+(?P<ref_count>\S+)$')
+        p19=r'^(?P<status>[\S]+)\s+(?P<metric>\d+)\s+(?P<tbl_id>\S+)\s+(?P<notf>\S+)\s+'
+            r'(?P<last_rib_event>\S+\s\(\w+\))\s+(?P<ref_count>\S+)$',
+    )
+
+    def cli(self, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+
+        # Initialize dictionaries
+        ret_dict = {}
+
+        # reference dict
+        ref_dict = {}
+
+        p = ShowBgpAllAllNexthops.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Address Family: VPNv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 address_family = group['address_family']
@@ -7434,22 +7532,22 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Total Nexthop Processing
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ref_dict = af_dict.setdefault('total_next_hop', {})
 
             # Maximum Nexthop Processing
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ref_dict = af_dict.setdefault('maximum_next_hop', {})
 
             # Last Notification Processing
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ref_dict = af_dict.setdefault('last_notification', {})
 
             # Time Spent: 0.000 secs
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 time_spent_secs = float(group['time_spent_secs'])
@@ -7457,7 +7555,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Received: 00:00:00
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 received = group['received']
@@ -7465,7 +7563,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Bestpaths Deleted: 0
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 best_path_deleted = int(group['best_paths_deleted'])
@@ -7473,7 +7571,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Bestpaths Changed: 0
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 best_path_changed = int(group['best_paths_changed'])
@@ -7481,7 +7579,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Gateway Address Family: IPv4 Unicast
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 gateway_address_family = group['gateway_address_family']
@@ -7489,7 +7587,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Table ID: 0xe0000000
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 table_id = group['table_id']
@@ -7497,7 +7595,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Nexthop Count: 2
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 next_hop_count = int(group['next_hop_count'])
@@ -7505,7 +7603,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Critical Trigger Delay: 0msec
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 critical_trigger_delay = group['critical_trigger_delay']
@@ -7513,7 +7611,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Non-critical Trigger Delay: 10000msec
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 non_critical_trigger_delay = group['non_critical_trigger_delay']
@@ -7521,7 +7619,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # Nexthop Version: 1, RIB version: 1
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 next_hop_version = int(group['next_hop_version'])
@@ -7533,7 +7631,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # EPE Table Version: 1, EPE Label version: 1
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 epe_table_version = int(group['epe_table_version'])
@@ -7545,7 +7643,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # EPE Downloaded Version: 1, EPE Standby Version: 1
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 epe_downloaded_version = int(group['epe_downloaded_version'])
@@ -7557,7 +7655,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # 108.10.10.1     [R][NC][NL]          2   e0000000   1/0    00:13:49 (Cri)        1/4
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 next_hop = group['next_hop']
@@ -7573,7 +7671,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # 2000:108:10:10::1
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 next_hop_ipv6 = group['next_hop_ipv6']
@@ -7581,7 +7679,7 @@ class ShowBgpAllAllNexthops(ShowBgpAllAllNexthopsSchema):
                 continue
 
             # [R][NC][NL]          1   e0800000   1/0    00:12:06 (Cri)        0/3
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 status_dict.update({
@@ -7638,6 +7736,14 @@ class ShowBgpBrief(ShowBgpBriefSchema):
 
     cli_command = ['show bgp {address_family} {ip_address} brief']
 
+    patterns = Patterns(
+        # *> 111.111.111.111/32 108.10.0.2               0           100 65401 i
+        # *                     108.11.0.2               0             0 65401 i
+        p1='^.*\s(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
+           '(?P<metric>\d+)\s+(?P<locprf>\d+)\s+(?P<weight>\d+)\s+'
+           '(?P<path>\D)$',
+    )
+
     def cli(self, address_family, ip_address, output=None):
 
         if output is None:
@@ -7650,18 +7756,14 @@ class ShowBgpBrief(ShowBgpBriefSchema):
         # Initialize dictionaries
         ret_dict = {}
 
-        # *> 111.111.111.111/32 108.10.0.2               0           100 65401 i
-        # *                     108.11.0.2               0             0 65401 i
-        p1 = re.compile('^.*\s(?P<next_hop>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})\s+'
-                        '(?P<metric>\d+)\s+(?P<locprf>\d+)\s+(?P<weight>\d+)\s+'
-                        '(?P<path>\D)$')
+        p = ShowBgpBrief.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # *> 111.111.111.111/32 108.10.0.2               0           100 65401 i
             # *                     108.11.0.2               0             0 65401 i
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # define vrf_dict dictionary and set to 'vrf'
                 vrf_dict = ret_dict.setdefault('vrf', {})
@@ -7757,66 +7859,70 @@ class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
 
     cli_command = ['show bgp {address_family} {ip_address} bestpath-compare']
 
-    def cli(self, address_family, ip_address, output=None):
-
-        if output is None:
-            out = self.device.execute(self.cli_command[0].\
-                                      format(address_family=address_family,\
-                                             ip_address=ip_address))
-        else:
-            out = output
-
-        # Initialize dictionary
-        ret_dict = {}
-        next_line_update_group = False
-
+    patterns = Patterns(
         # Speaker                  5           5
-        p1 = re.compile('^(?P<process>\w+)\s+(?P<brib_rib>\d+)\s+(?P<send_tbl_ver>\d+)$')
+        p1='^(?P<process>\w+)\s+(?P<brib_rib>\d+)\s+(?P<send_tbl_ver>\d+)$',
 
         # Last Modified: Mar  9 02:23:41.504 for 00:00:35
-        p2 = re.compile('^Last +Modified: (?P<last_modified>.*)$')
+        p2='^Last +Modified: (?P<last_modified>.*)$',
 
         # Paths: (2 available, best #1)
-        p3 = re.compile('^Paths: +\((?P<available_paths>\d+) +available\, '
-                        '+best +\#(?P<best_path>\d+)\)$')
+        p3='^Paths: +\((?P<available_paths>\d+) +available\, '
+           '+best +\#(?P<best_path>\d+)\)$',
 
         # Path #1: Received by speaker 0
-        p4 = re.compile('^Path+ #(?P<path_num>\d+).*$')
+        p4='^Path+ #(?P<path_num>\d+).*$',
 
         # Advertised IPv4 Unicast paths to update-groups (with more than one peer):
-        p5 = re.compile('^.*(?P<group2>update-groups).*$')
+        p5='^.*(?P<group2>update-groups).*$',
 
         # Not advertised to any peer
-        p6 = re.compile(r'^Not +advertised +to +any +peer$')
+        p6=r'^Not +advertised +to +any +peer$',
 
         # 0.1 0.3
-        p7 = re.compile('^(?P<group1>[\d\.]+)(?: +(?P<group2>[\d\.]+))$')
+        p7='^(?P<group1>[\d\.]+)(?: +(?P<group2>[\d\.]+))$',
 
         # 108.10.0.2 from 108.10.0.2 (192.68.33.108)
-        p8 = re.compile('^((?P<next_hop>[0-9\.]+)+ from +(?P<gateway>[0-9\.]+) '
-                        '+\((?P<originator>[0-9\.]+)\))$')
+        p8='^((?P<next_hop>[0-9\.]+)+ from +(?P<gateway>[0-9\.]+) '
+           '+\((?P<originator>[0-9\.]+)\))$',
 
         # Origin IGP, metric 0, localpref 100, weight 100, valid, external, best, group-best
-        p9 = re.compile('^Origin +(?P<origin>[a-zA-Z]+),(?: '
-                        '+metric (?P<metric>[0-9]+),?)?(?: '
-                        '+localpref (?P<localpref>[0-9]+),?)?(?: '
-                        '+weight (?P<weight>[0-9]+),?)?(?: '
-                        '+(?P<valid>valid?,))?(?: '
-                        '+(?P<state>(internal|external|local)\,?))?(\,)?(?: '
-                        '(?P<best>best))?(\,)?(?: (?P<group_best>group-best))?$')
+        p9='^Origin +(?P<origin>[a-zA-Z]+),(?: '
+           '+metric (?P<metric>[0-9]+),?)?(?: '
+           '+localpref (?P<localpref>[0-9]+),?)?(?: '
+           '+weight (?P<weight>[0-9]+),?)?(?: '
+           '+(?P<valid>valid?,))?(?: '
+           '+(?P<state>(internal|external|local)\,?))?(\,)?(?: '
+           '(?P<best>best))?(\,)?(?: (?P<group_best>group-best))?$',
 
         #  Received Path ID 0, Local Path ID 0, version 0
-        p10 = re.compile('^Received Path ID (?P<received_path_id>(\d+)), Local Path ID '
-                        '(?P<local_path_id>(\d+)), version (?P<version>(\d+))$')
+        p10='^Received Path ID (?P<received_path_id>(\d+)), Local Path ID '
+            '(?P<local_path_id>(\d+)), version (?P<version>(\d+))$',
 
         # Origin-AS validity: (disabled)
-        p11 = re.compile('^Origin-AS validity: \((?P<origin_as_validity>\w+)\)$')
+        p11='^Origin-AS validity: \((?P<origin_as_validity>\w+)\)$',
+    )
+
+    def cli(self, address_family, ip_address, output=None):
+
+        if output is None:
+            out = self.device.execute(self.cli_command[0].\
+                                      format(address_family=address_family,\
+                                             ip_address=ip_address))
+        else:
+            out = output
+
+        # Initialize dictionary
+        ret_dict = {}
+        next_line_update_group = False
+
+        p = ShowBgpBestpathCompare.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             #  Speaker                  5           5
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # define vrf_dict dictionary and set to 'vrf'
                 vrf_dict = ret_dict.setdefault('vrf', {})
@@ -7849,14 +7955,14 @@ class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
                 continue
 
             # Last Modified: Mar  9 02:23:41.504 for 00:00:35
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 net_dict.update({'last_modified': group['last_modified']})
                 continue
 
             # Paths: (2 available, best #1)
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 net_dict.update({
@@ -7868,7 +7974,7 @@ class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
                 continue
 
             # Path #1: Received by speaker 0
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 path = int(group['path_num'])
@@ -7876,19 +7982,19 @@ class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
                 continue
 
             #  Advertised IPv4 Unicast paths to update-groups (with more than one peer):
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 next_line_update_group = True
                 continue
 
             # Not advertised to any peer
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 next_line_update_group = False
                 continue
 
             # 0.1 0.3
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m and next_line_update_group:
                 group = m.group()
                 update_group = group.split(" ")
@@ -7902,7 +8008,7 @@ class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
                 continue
 
             #  108.10.0.2 from 108.10.0.2 (192.68.33.108)
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 each_path_dict.update({
@@ -7914,7 +8020,7 @@ class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
 
             # Origin IGP, metric 0, localpref 100, valid, external
             # Origin IGP, metric 0, localpref 100, weight 100, valid, external, best, group-best
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 status_codes = ''
@@ -7947,7 +8053,7 @@ class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
                 continue
 
             # Received Path ID 0, Local Path ID 0, version 0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 each_path_dict.update({
@@ -7958,7 +8064,7 @@ class ShowBgpBestpathCompare(ShowBgpBestpathCompareSchema):
                 continue
 
             # Origin-AS validity: (disabled)
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 each_path_dict.update({
@@ -8080,132 +8186,137 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                    'show bgp {address_family} rd {route_rd} detail',
                    'show bgp {address_family} {route} detail']
 
-    def cli(self, vrf_name=None, address_family=None, prefix=None, route=None, route_rd=None, output=None):
-
-        if output is None:
-            if route_rd:
-                out = self.device.execute(self.cli_command[2].\
-                                      format(address_family=address_family,\
-                                             route_rd=route_rd))
-            elif route:
-                out = self.device.execute(self.cli_command[3].\
-                                      format(address_family=address_family,\
-                                             route=route))
-            elif address_family == 'ipv4' or address_family == 'ipv6':
-                out = self.device.execute(self.cli_command[0].\
-                                      format(vrf_name=vrf_name,\
-                                             address_family=address_family,\
-                                             prefix=prefix))
-            else:
-                out = self.device.execute(self.cli_command[1].\
-                                      format(vrf_name=vrf_name,\
-                                             address_family=address_family,\
-                                             prefix=prefix))
-        else:
-            out = output
-        
+    patterns = Patterns(
         # BGP routing table entry for 2000:71:1:1::1/128, Route Distinguisher: 50.1.1.4:2
         # BGP routing table entry for [1][0000.0000.0000.0001.0500][10001]/120, Route Distinguisher: 10.0.0.1:1001
         # BGP routing table entry for fc00:a000:1000:101::2/128
-        p1 = re.compile(r'^BGP\s+routing\s+table\s+entry\s+for\s+(?P<prefix>(?P<ip>[a-z0-9.:\/\[\]]+)\/(?P<mask>\d+))'
-                        r'(?:,\s+Route\s+Distinguisher:\s+(?P<rd>[\d.:]+))?$')
-        
+        p1=r'^BGP\s+routing\s+table\s+entry\s+for\s+(?P<prefix>(?P<ip>[a-z0-9.:\/\[\]]+)\/(?P<mask>\d+))'
+           r'(?:,\s+Route\s+Distinguisher:\s+(?P<rd>[\d.:]+))?$',
+
         # SRv6-VPN SID: fc00:c000:1002:e008::/64
-        p1_1 = re.compile(r'^SRv6-VPN\s+SID:\s+(?P<vpn_sid>\S+)')
+        p1_1=r'^SRv6-VPN\s+SID:\s+(?P<vpn_sid>\S+)',
 
         # Last Modified: Mar 27 02:45:20.105 for 1d15h
-        p2 = re.compile(r'^Last +Modified: (?P<last_modified>.*)$')
+        p2=r'^Last +Modified: (?P<last_modified>.*)$',
 
         # Paths: (1 available, best #1)
-        p3 = re.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
+        p3=r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$',
 
         # Not advertised to any peer
-        p4 = re.compile(r'^Not\s+advertised\s+to\s+any\s+peer$')
+        p4=r'^Not\s+advertised\s+to\s+any\s+peer$',
 
         # Advertised to PE peers (in unique update groups):
         # Advertised to CE peers (in unique update groups):
-        p5 = re.compile(r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$')
+        p5=r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$',
 
         # Path #1: Received by speaker 0
-        p6 = re.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
+        p6=r'^Path\s+#(?P<path_num>\d+):.*$',
 
         # 50.1.1.8
         # 2000:90:11:1::2
         # fd00:ffff:100:11::2
-        p7 = re.compile(r'^(?P<advertised_peer>[a-f0-9.:]+)$') # ^(?P<advertised_peer>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$
+        # ^(?P<advertised_peer>\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})$
+        p7=r'^(?P<advertised_peer>[a-f0-9.:]+)$',
 
         # 7000
         # Local
-        p8 = re.compile(r'^(?P<as_path>[a-zA-Z0-9]+)$')
+        p8=r'^(?P<as_path>[a-zA-Z0-9]+)$',
 
         # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
         # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
         # :: from :: (50.1.1.4)
         # fc00:a000:1000::1 (metric 30) from fc00:a000:2000::14 (10.0.0.1), if-handle 0x00000000
-        p9 = re.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
-                        r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?'
-                        r'(?:,\s+if-handle\s+(?P<if_handle>[\w]+))?')
+        p9=r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
+           r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?'
+           r'(?:,\s+if-handle\s+(?P<if_handle>[\w]+))?',
 
         # Local Label: 24023
         # Received Label 24000
         # Received Label 0xe0030
-        p10 = re.compile(r'^(?P<label_name>\w+)\s+Label:*\s+(?P<label_value>\w+)$')
+        p10=r'^(?P<label_name>\w+)\s+Label:*\s+(?P<label_value>\w+)$',
 
         # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best, import-candidate, imported
         # Origin IGP, metric 0, localpref 100, valid, external, best, group-best, import-candidate
         # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
         # Origin incomplete, metric 0, localpref 100, valid, internal, backup, add-path, import-candidate, imported
         # Origin IGP, localpref 100, valid, internal, best, group-best, import-candidate, not-in-vrf
-        p11 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
-                         r'(?: +metric (?P<metric>[0-9]+),?)?'
-                         r'(?: +localpref (?P<localpref>[0-9]+),?)?'
-                         r'(?: +weight (?P<weight>[0-9]+),?)?'
-                         r'(?: +(?P<valid>valid?),)?'
-                         r'(?: (?P<redistributed>redistributed?),)?'
-                         r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
-                         r'(?: (?P<best>best))?(\,*)?'
-                         r'(?: (?P<group_best>group-best?),*)?'
-                         r'(?: (?P<backup>backup),*)?'
-                         r'(?: (?P<add_path>add-path),*)?'
-                         r'(?: (?P<import_candidate>import-candidate?),*)?'
-                         r'(?: (?P<imported>imported?),*)?'
-                         r'(?:\s+(?P<not_in_vrf>not-in-vrf))?')
+        p11=r'^Origin +(?P<origin>[a-zA-Z]+),'
+            r'(?: +metric (?P<metric>[0-9]+),?)?'
+            r'(?: +localpref (?P<localpref>[0-9]+),?)?'
+            r'(?: +weight (?P<weight>[0-9]+),?)?'
+            r'(?: +(?P<valid>valid?),)?'
+            r'(?: (?P<redistributed>redistributed?),)?'
+            r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
+            r'(?: (?P<best>best))?(\,*)?'
+            r'(?: (?P<group_best>group-best?),*)?'
+            r'(?: (?P<backup>backup),*)?'
+            r'(?: (?P<add_path>add-path),*)?'
+            r'(?: (?P<import_candidate>import-candidate?),*)?'
+            r'(?: (?P<imported>imported?),*)?'
+            r'(?:\s+(?P<not_in_vrf>not-in-vrf))?',
 
         #  Received Path ID 0, Local Path ID 0, version 715
-        p12 = re.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
-                         r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
-                         r'version\s+(?P<version>(\d+))$')
+        p12=r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
+            r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
+            r'version\s+(?P<version>(\d+))$',
 
         # Extended community: RT:100:1001
-        p13 = re.compile(r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$')
+        p13=r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$',
 
         # Originator: 50.1.1.1, Cluster list: 50.1.1.8
         # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
-        p14 = re.compile(r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$')
+        p14=r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$',
 
         # Source AFI: VPNv6 Unicast, Source VRF: default, Source Route Distinguisher: 50.1.1.1:0
         # Source AFI: VPNv6 Unicast, Source VRF: SRV6_L3VPN_BE, Source Route Distinguisher: 100:1
-        p15 = re.compile(r'^Source\s+AFI:\s+(?P<source_afi>[a-zA-Z0-9 ]+),\s+Source\s+VRF:\s+(?P<source_vrf>[a-zA-Z0-9_]+)'
-                         r',\s+Source\s+Route\s+Distinguisher:\s+(?P<source_rd>[\d.:]+)$')
-        
+        p15=r'^Source\s+AFI:\s+(?P<source_afi>[a-zA-Z0-9 ]+),\s+Source\s+VRF:\s+(?P<source_vrf>[a-zA-Z0-9_]+)'
+            r',\s+Source\s+Route\s+Distinguisher:\s+(?P<source_rd>[\d.:]+)$',
+
         # PSID-Type:L3, SubTLV Count:1, R:0x00,
-        p16 = re.compile(r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)(?:(,\s+R:(?P<r_value>\w+),))?$')
+        p16=r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)(?:(,\s+R:(?P<r_value>\w+),))?$',
 
         # SubTLV:
         # SubSubTLV:
-        p17 = re.compile(r'^(?P<tlv_name>SubTLV|SubSubTLV):$')
+        p17=r'^(?P<tlv_name>SubTLV|SubSubTLV):$',
 
         # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
-        p18 = re.compile(r'^T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+'
-                         r'F:(?P<f_value>\w+),\s+R2:(?P<r2_value>\w+),\s+Behavior:(?P<behaviour>\d+),\s+'
-                         r'R3:(?P<r3_value>\w+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$')
-        
+        p18=r'^T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+'
+            r'F:(?P<f_value>\w+),\s+R2:(?P<r2_value>\w+),\s+Behavior:(?P<behaviour>\d+),\s+'
+            r'R3:(?P<r3_value>\w+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$',
+
         # T:1(Sid structure):
-        p19 = re.compile(r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$')
+        p19=r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$',
 
         # Length [Loc-blk,Loc-node,Func,Arg]:[32,16,16,0], Tpose-len:16, Tpose-offset:48
-        p20 = re.compile(r'^Length\s+\[Loc-blk,Loc-node,Func,Arg\]:\[(?P<loc_blk>\d+),(?P<loc_node>\d+),'
-                         r'(?P<func>\d+),(?P<arg>\d+)\],\s+Tpose-len:(?P<tpose_len>\d+),\s+Tpose-offset:(?P<tpose_offset>\d+)$')
+        p20=r'^Length\s+\[Loc-blk,Loc-node,Func,Arg\]:\[(?P<loc_blk>\d+),(?P<loc_node>\d+),'
+            r'(?P<func>\d+),(?P<arg>\d+)\],\s+Tpose-len:(?P<tpose_len>\d+),\s+Tpose-offset:(?P<tpose_offset>\d+)$',
+    )
+
+    def cli(self, vrf_name=None, address_family=None, prefix=None, route=None, route_rd=None, output=None):
+
+        if output is None:
+            if route_rd:
+                out = self.device.execute(self.cli_command[2].\
+                                      format(address_family=address_family,\
+                                             route_rd=route_rd))
+            elif route:
+                out = self.device.execute(self.cli_command[3].\
+                                      format(address_family=address_family,\
+                                             route=route))
+            elif address_family == 'ipv4' or address_family == 'ipv6':
+                out = self.device.execute(self.cli_command[0].\
+                                      format(vrf_name=vrf_name,\
+                                             address_family=address_family,\
+                                             prefix=prefix))
+            else:
+                out = self.device.execute(self.cli_command[1].\
+                                      format(vrf_name=vrf_name,\
+                                             address_family=address_family,\
+                                             prefix=prefix))
+        else:
+            out = output
+        
+        p = ShowBgpVrfAfPrefix.patterns
 
         # Initialize dictionary
         ret_dict = {}
@@ -8224,7 +8335,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
             # BGP routing table entry for 2000:71:1:1::1/128, Route Distinguisher: 50.1.1.4:2
             # BGP routing table entry for [1][0000.0000.0000.0001.0500][10001]/120, Route Distinguisher: 10.0.0.1:1001
             # BGP routing table entry for fc00:a000:1000:101::2/128
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 address_family = address_family.replace(' ','_')
@@ -8239,21 +8350,21 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                 continue
             
             # SRv6-VPN SID: fc00:c000:1002:e008::/64
-            m = p1_1.match(line)
+            m = p.p1_1.match(line)
             if m:
                 group = m.groupdict()
                 vrf_dict['srv6_vpn_sid'] = group['vpn_sid']
                 continue
 
             # Last Modified: Mar 27 02:45:20.105 for 1d15h
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 vrf_dict['last_modified'] = group['last_modified']
                 continue
 
             # Paths: (1 available, best #1)
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 paths_dict = vrf_dict.setdefault('paths', {})
@@ -8262,14 +8373,14 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                 continue
 
             # Not advertised to any peer
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 next_line_update_group = False
                 continue
 
             # Advertised to PE peers (in unique update groups):
             # Advertised to CE peers (in unique update groups):
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 peer_name = group['peer_name']
@@ -8277,7 +8388,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                 continue
 
             # Path #1: Received by speaker 0
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 path = group['path_num']
@@ -8287,7 +8398,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
             # 50.1.1.8
             # 2000:90:11:1::2
             # fd00:ffff:100:11::2
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m and next_line_update_group:
                 group = m.groupdict()
                 advertised_peer = group['advertised_peer']
@@ -8303,7 +8414,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
 
             # 7000
             # Local
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 as_path = group['as_path']
@@ -8314,7 +8425,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
             # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
             # :: from :: (50.1.1.4)
             # fc00:a000:1000::1 (metric 30) from fc00:a000:2000::14 (10.0.0.1), if-handle 0x00000000
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 bgp_peer_neighbor_ip = group['bgp_peer_neighbor_ip']
@@ -8331,7 +8442,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
             # Local Label: 24023
             # Received Label 24000
             # Received Label 0xe0030
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 label_name = group['label_name']
@@ -8347,7 +8458,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
             # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
             # Origin incomplete, metric 0, localpref 100, valid, internal, backup, add-path, import-candidate, imported
             # Origin IGP, localpref 100, valid, internal, best, group-best, import-candidate, not-in-vrf
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 status_codes = ''
@@ -8395,7 +8506,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                 continue
 
             # Received Path ID 0, Local Path ID 0, version 715
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 next_hop_dict['received_path_id'] = int(group['received_path_id'])
@@ -8404,7 +8515,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                 continue
 
             # Extended community: RT:100:1001
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 value = group['extended_community']
@@ -8413,7 +8524,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
 
             # Originator: 50.1.1.1, Cluster list: 50.1.1.8
             # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 next_hop_dict['originator'] = group['originator']
@@ -8422,7 +8533,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
 
             # Source AFI: VPNv6 Unicast, Source VRF: default, Source Route Distinguisher: 50.1.1.1:0
             # Source AFI: VPNv6 Unicast, Source VRF: SRV6_L3VPN_BE, Source Route Distinguisher: 100:1
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 next_hop_dict['source_afi'] = group['source_afi']
@@ -8431,7 +8542,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                 continue
 
             # PSID-Type:L3, SubTLV Count:1, R:0x00,
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 psid_type = group['psid_type']
@@ -8445,7 +8556,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
 
             # SubTLV:
             # SubSubTLV:
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 tlv_name = group['tlv_name'].lower()
@@ -8456,7 +8567,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                 continue
 
             # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 subtlv_dict['t_value'] = group['t_value']
@@ -8469,7 +8580,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                 continue
 
             # T:1(Sid structure):
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 t_value = group['t_value']
@@ -8478,7 +8589,7 @@ class ShowBgpVrfAfPrefix(ShowBgpVrfAfPrefixSchema):
                 continue
 
             # Length [Loc-blk,Loc-node,Func,Arg]:[32,16,16,0], Tpose-len:16, Tpose-offset:48
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 t_dict['loc_blk'] = group['loc_blk']
@@ -8623,83 +8734,56 @@ class ShowBgpVrf(ShowBgpVrfSchema):
                    'show bgp vrf {vrf} {address_family} summary',
                    'show bgp vrf {vrf} {address_family} {value}']
 
-    def cli(self, vrf=None, address_family=None, summary=None, value=None, output=None):
-
-        # Execute command
-        if output is None:
-            if value:
-                command = self.cli_command[3].format(vrf=vrf,address_family=address_family,value=value)
-            elif vrf and address_family:
-                command = self.cli_command[2].format(vrf=vrf,address_family=address_family)
-            elif vrf and summary:
-                command = self.cli_command[1].format(vrf=vrf,summary=summary)
-            else:
-                command = self.cli_command[0].format(vrf=vrf)
-            output = self.device.execute(command)
-
-        # initial return dictionary
-        ret_dict = {}
-        last_prefix = None
-        pfx_dict = None
-
-        if address_family == None:
-            address_family = 'ipv4 unicast'
-
-        if address_family:
-            if value != None and 'ipv4' in address_family:
-                address_family = 'ipv4 unicast'
-            elif value != None and 'ipv6' in address_family:
-                address_family = 'ipv6 unicast'
-
+    patterns = Patterns(
         # VRF: VRF1
-        p1 = re.compile(r'^\s*VRF: +(?P<vrf>(\S+))$')
+        p1=r'^\s*VRF: +(?P<vrf>(\S+))$',
 
         # BGP VRF VRF1, state: Active
-        p2 = re.compile(r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
-                        r' +(?P<vrf_state>(\S+))$')
+        p2=r'^\s*BGP +VRF +(?P<bgp_vrf>(\S+)), +state:'
+           r' +(?P<vrf_state>(\S+))$',
 
         # BGP Route Distinguisher: 1.100.1.1:0
         # BGP Route Distinguisher: 200:1
         # BGP Route Distinguisher: 172.16.2.90:1
-        p3 = re.compile(r'^BGP\s+Route\s+Distinguisher:\s+(?P<route_distinguisher>\S+)$')
+        p3=r'^BGP\s+Route\s+Distinguisher:\s+(?P<route_distinguisher>\S+)$',
 
         # VRF ID: 0x60000001
-        p4 = re.compile(r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$')
+        p4=r'^\s*VRF +ID: +(?P<vrf_id>(\S+))$',
 
         # BGP router identifier 10.4.1.1, local AS number 100
         # BGP router identifier 10.10.10.108, local AS number 65108.65108
-        p5 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
+        p5=r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+           r' +local +AS +number +(?P<local_as>([\d\.]+))$',
 
         # Non-stop routing is enabled
-        p6 = re.compile(r'^\s*Non-stop +routing is enabled$')
+        p6=r'^\s*Non-stop +routing is enabled$',
 
         # BGP table state: Active
-        p7 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+        p7=r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$',
 
         # Table ID: 0xe0000010   RD version: 43
-        p8 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
-                         r' +(?P<rd_version>[0-9]+)$')
+        p8=r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+           r' +(?P<rd_version>[0-9]+)$',
 
         # BGP main routing table version 43
-        p9 = re.compile(r'^\s*BGP +main +routing +table +version'
-                         r' +(?P<bgp_table_version>[0-9]+)$')
+        p9=r'^\s*BGP +main +routing +table +version'
+           r' +(?P<bgp_table_version>[0-9]+)$',
 
         # BGP NSR Initial initsync version 11 (Reached)
-        p10 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
-                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p10=r'^\s*BGP +NSR +Initial +initsync +version'
+            r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+            r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
 
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p11 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
-                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p11=r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+            r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$',
 
         # Route Distinguisher: 200:1 (default for vrf VRF1)
         # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
         # Route Distinguisher: 172.16.2.88:1000
-        p12 = re.compile(r'^\s*Route +Distinguisher:'
-                         r' +(?P<route_distinguisher>\S+)'
-                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+        p12=r'^\s*Route +Distinguisher:'
+            r' +(?P<route_distinguisher>\S+)'
+            r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$',
 
         # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
         # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
@@ -8714,58 +8798,89 @@ class ShowBgpVrf(ShowBgpVrfSchema):
         #                       10.2.8.1                 0    100      0 i
         # s i                   10.2.8.1                 0    100      0 i
         # s>i2001:718::2:116/128
-        p13 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9a-f\.\:\[\]]+)\/(?P<mask>\d+))?[\n\r]*'
-                         r' +(?P<next_hop>\S+)[\n\r]* +(?P<number>[\d\.\s\{\}]+)'
-                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+        p13=r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+            r' *(?P<prefix>(?P<ip>[0-9a-f\.\:\[\]]+)\/(?P<mask>\d+))?[\n\r]*'
+            r' +(?P<next_hop>\S+)[\n\r]* +(?P<number>[\d\.\s\{\}]+)'
+            r'(?: *(?P<origin_codes>(i|e|\?)))?$',
 
         # Processed 40 prefixes, 50 paths
-        p14 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
-                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+        p14=r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+            r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$',
 
         # BGP is operating in STANDALONE mode.
-        p15 = re.compile(r'BGP *is *operating *in *'
-                        '(?P<operation_mode>\w+) *mode$')
+        p15=r'BGP *is *operating *in *'
+             '(?P<operation_mode>\w+) *mode$',
 
         # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
         #Speaker              19         19         19         19          19           0
-        p16 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
-                         ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
-                         ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
-                         ' *(?P<standbyver>[0-9]+)$')
+        p16=r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+             ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+             ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+             ' *(?P<standbyver>[0-9]+)$',
 
         # Neighbor        Spk    AS MsgRcvd MsgSent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
         # 192.168.2.2       0   200     353     353       19    0    0 05:49:05          3
-        p17 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
-                           ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
-                           ' +(?P<msg_sent>[0-9]+)'
-                           ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           ' +(?P<state_pfxrcd>.+)$')
+        p17=r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+             ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+             ' +(?P<msg_sent>[0-9]+)'
+             ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+             ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+             ' +(?P<state_pfxrcd>.+)$',
 
         # *> 1.1.1.1/32         fc00:c000:1001:e000::                       per-vrf      MAIN
         # *>i3.3.3.3/32         NO SRv6 Sid                                 -            -
         # * i                   NO SRv6 Sid                                 -            -
-        p18 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
-                         '(?P<prefix>(?P<ip>[.0-9a-fA-F:]+)\/(?P<mask>\d+))?\s+'
-                         '(?P<local_sid>[ \w:]+)\s+(?P<alloc_mode>[\w-]+)\s+'
-                         '(?P<locator>[\w-]+)$')
+        p18=r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
+             '(?P<prefix>(?P<ip>[.0-9a-fA-F:]+)\/(?P<mask>\d+))?\s+'
+             '(?P<local_sid>[ \w:]+)\s+(?P<alloc_mode>[\w-]+)\s+'
+             '(?P<locator>[\w-]+)$',
 
         # *>ifc00:a000:2000:200::3/128
         # *> fd00:ffff:100:11::/64
-        p19 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
-                         '(?P<prefix>(?P<ip>[\w:]+)\/(?P<mask>\d+))$')
+        p19=r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)\s*'
+             '(?P<prefix>(?P<ip>[\w:]+)\/(?P<mask>\d+))$',
 
         # fc00:c000:1001:e001::                       per-vrf      MAIN
         # NO SRv6 Sid                                 -            -
-        p20 = re.compile(r'^(?P<local_sid>[\da-fA-F:|NO SRv6 Sid]+)\s+(?P<alloc_mode>[\w-]+)'
-                         '\s+(?P<locator>[\w-]+)$')
+        p20=r'^(?P<local_sid>[\da-fA-F:|NO SRv6 Sid]+)\s+(?P<alloc_mode>[\w-]+)'
+             '\s+(?P<locator>[\w-]+)$',
+    )
+
+    def cli(self, vrf=None, address_family=None, summary=None, value=None, output=None):
+
+        # Execute command
+        if output is None:
+            if value:
+                command = self.cli_command[3].format(vrf=vrf,address_family=address_family,value=value)
+            elif vrf and address_family:
+                command = self.cli_command[2].format(vrf=vrf,address_family=address_family)
+            elif vrf and summary:
+                command = self.cli_command[1].format(vrf=vrf,summary=summary)
+            else:
+                command = self.cli_command[0].format(vrf=vrf)
+            output = self.device.execute(command)
+
+        # initial return dictionary
+        ret_dict = {}
+        last_prefix = None
+        pfx_dict = None
+
+        if address_family == None:
+            address_family = 'ipv4 unicast'
+
+        if address_family:
+            if value != None and 'ipv4' in address_family:
+                address_family = 'ipv4 unicast'
+            elif value != None and 'ipv6' in address_family:
+                address_family = 'ipv6 unicast'
+
+        p = ShowBgpVrf.patterns
 
         for line in output.splitlines():
             line = line.strip()
 
             # VRF: VRF1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf'].lower()
                 vrf_dict = ret_dict.setdefault('vrf', {}).setdefault(vrf, {})
@@ -8775,7 +8890,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
                 continue
 
             # BGP VRF VRF1, state: Active
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 bgp_vrf = group['bgp_vrf'].lower()
@@ -8796,14 +8911,14 @@ class ShowBgpVrf(ShowBgpVrfSchema):
             # BGP Route Distinguisher: 1.100.1.1:0
             # BGP Route Distinguisher: 200:1
             # BGP Route Distinguisher: 172.16.2.90:1
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['bgp_route_distinguisher'] = group['route_distinguisher']
                 continue
 
             # VRF ID: 0x60000001
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 vrf_id = m.groupdict()['vrf_id']
                 af_dict['vrf_id'] = vrf_id
@@ -8811,7 +8926,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
 
             # BGP router identifier 10.4.1.1, local AS number 100
             # BGP router identifier 10.10.10.108, local AS number 65108.65108
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['router_identifier'] = group['router_identifier']
@@ -8823,19 +8938,19 @@ class ShowBgpVrf(ShowBgpVrfSchema):
                 continue 
 
             # Non-stop routing is enabled
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 af_dict['non_stop_routing'] = True
                 continue
 
             # BGP table state: Active
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 af_dict['table_state'] = m.groupdict()['table_state'].lower()
                 continue
 
             # Table ID: 0x0   RD version: 0
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['table_id'] = group['table_id']
@@ -8843,13 +8958,13 @@ class ShowBgpVrf(ShowBgpVrfSchema):
                 continue
 
             # BGP main routing table version 43
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 af_dict['bgp_table_version'] = int(m.groupdict()['bgp_table_version'])
                 continue
 
             # BGP NSR Initial initsync version 11 (Reached)
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['nsr_initial_initsync_version'] = group['nsr_initial_initsync_version']
@@ -8857,14 +8972,14 @@ class ShowBgpVrf(ShowBgpVrfSchema):
                 continue
 
             # BGP NSR/ISSU Sync-Group versions 0/0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 af_dict['nsr_issu_sync_group_versions'] = \
                                 m.groupdict()['nsr_issu_sync_group_versions']
                 continue
 
             # Route Distinguisher: 200:1 (default for vrf VRF1)
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 rd = group['route_distinguisher']
@@ -8880,7 +8995,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
             # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
             # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
             # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -8926,7 +9041,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
                 continue
 
             # Processed 40 prefixes, 50 paths
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['processed_prefix'] = int(group['processed_prefix'])
@@ -8934,7 +9049,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
                 continue
 
             # BGP is operating in STANDALONE mode.
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 operation_mode = m.groupdict()['operation_mode'].lower()
                 af_dict['operation_mode'] = operation_mode
@@ -8942,7 +9057,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
 
             # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
             # Speaker              63         63         63         63          63           0
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 process = str(m.groupdict()['process'])
                 if 'process' not in af_dict:
@@ -8961,7 +9076,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
             # 10.1.5.5          0   200      60      62       63    0    0 00:57:32          0
             # 10.16.2.2           0   100       0       0        0    0    0 00:00:00 Idle
             # 10.0.0.35         0   200       0       0        0    0    0 00:00:00 Idle (Admin)!
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 neighbor = str(m.groupdict()['neighbor'])
                 if 'neighbor' not in af_dict:
@@ -8987,7 +9102,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
             # *> 1.1.1.1/32         fc00:c000:1001:e000::                       per-vrf      MAIN
             # *>i3.3.3.3/32         NO SRv6 Sid                                 -            -
             # * i                   NO SRv6 Sid                                 -            -
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -9008,7 +9123,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
 
             # *>ifc00:a000:2000:200::3/128
             # *> fd00:ffff:100:11::/64
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -9026,7 +9141,7 @@ class ShowBgpVrf(ShowBgpVrfSchema):
 
             # fc00:c000:1001:e001::                       per-vrf      MAIN
             # NO SRv6 Sid                                 -            -
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 pfx_dict['local_sid'] = group['local_sid'].strip()
@@ -9149,68 +9264,49 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
         'show bgp {address_family} community {community}',
         'show bgp {address_family} community {community} {exact_match}',]
 
-    def cli(self, address_family=None, community=None, exact_match=None, output=None):
-        # Execute command
-        if output is None:
-            if address_family and community and exact_match:
-                command = self.cli_command[3].format(address_family=address_family, community=community, exact_match=exact_match)
-            elif address_family and community:
-                command = self.cli_command[2].format(address_family=address_family, community=community)
-            elif address_family:
-                command = self.cli_command[1].format(address_family=address_family)
-            else:
-                command = self.cli_command[0]
-            output = self.device.execute(command)
-
-        # initial return dictionary
-        ret_dict = {}
-        last_prefix = None
-        rd = None
-        if not address_family:
-            address_family = 'ipv4 unicast'
-
+    patterns = Patterns(
         # BGP router identifier 10.4.1.1, local AS number 100
         # BGP router identifier 10.10.10.108, local AS number 65108.65108
-        p1 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
+        p1=r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+           r' +local +AS +number +(?P<local_as>([\d\.]+))$',
 
         # BGP generic scan interval 60 secs
-        p2 =  re.compile(r'^\s*BGP +generic +scan +interval'
-                         r' +(?P<interval>(\d+)) +secs$')
+        p2=r'^\s*BGP +generic +scan +interval'
+           r' +(?P<interval>(\d+)) +secs$',
 
         # Non-stop routing is enabled
-        p3 = re.compile(r'^\s*Non-stop +routing is enabled$')
+        p3=r'^\s*Non-stop +routing is enabled$',
 
         # BGP table state: Active
-        p4 = re.compile(r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$')
+        p4=r'^\s*BGP +table +state: +(?P<table_state>[a-zA-Z]+)$',
 
         # Table ID: 0xe0000010   RD version: 43
-        p5 = re.compile(r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
-                         r' +(?P<rd_version>[0-9]+)$')
+        p5=r'^\s*Table +ID: +(?P<table_id>[a-z0-9]+) +RD +version:'
+           r' +(?P<rd_version>[0-9]+)$',
 
         # BGP main routing table version 43
-        p6 = re.compile(r'^\s*BGP +main +routing +table +version'
-                         r' +(?P<bgp_table_version>[0-9]+)$')
+        p6=r'^\s*BGP +main +routing +table +version'
+           r' +(?P<bgp_table_version>[0-9]+)$',
 
         # BGP NSR Initial initsync version 11 (Reached)
-        p7 = re.compile(r'^\s*BGP +NSR +Initial +initsync +version'
-                         r' +(?P<nsr_initial_initsync_version>[0-9]+)'
-                         r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
+        p7=r'^\s*BGP +NSR +Initial +initsync +version'
+           r' +(?P<nsr_initial_initsync_version>[0-9]+)'
+           r' +\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
 
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p8 = re.compile(r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
-                         r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
+        p8=r'^\s*BGP +NSR/ISSU +Sync-Group +versions'
+           r' +(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$',
 
-        # BGP scan interval 60 secs 
-        p9 = re.compile(r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
-                         r' +secs$')
+        # BGP scan interval 60 secs
+        p9=r'^\s*BGP +scan +interval +(?P<scan_interval>[0-9]+)'
+           r' +secs$',
 
         # Route Distinguisher: 200:1 (default for vrf VRF1)
         # Route Distinguisher: 172.16.2.90:1000 (default for vrf EVPN-Multicast-BTV)
         # Route Distinguisher: 172.16.2.88:1000
-        p10 = re.compile(r'^\s*Route +Distinguisher:'
-                         r' +(?P<route_distinguisher>\S+)'
-                         r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$')
+        p10=r'^\s*Route +Distinguisher:'
+            r' +(?P<route_distinguisher>\S+)'
+            r'(?: +\(default +for +vrf +(?P<default_vrf>\S+)\))?$',
 
         # *> 10.1.1.0/24        10.186.5.5              2219             0 200 33299 51178 47751 {27016} e
         # * i                   10.64.4.4               2219    100      0 400 33299 51178 47751 {27016} e
@@ -9225,45 +9321,68 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
         #                       10.2.8.1                 0    100      0 i
         # s i                   10.2.8.1                 0    100      0 i
         # s>i2001:718::2:116/128
-        p11 = re.compile(r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
-                         r' *(?P<prefix>(?P<ip>[0-9a-f\.\:\[\]]+)\/(?P<mask>\d+))?[\n\r]*'
-                         r' +(?P<next_hop>\S+)[\n\r]* +(?P<number>[\d\.\s\{\}]+)'
-                         r'(?: *(?P<origin_codes>(i|e|\?)))?$')
+        p11=r'^(?P<status_codes>(i|s|x|S|d|h|\*|\>|\s)+)'
+            r' *(?P<prefix>(?P<ip>[0-9a-f\.\:\[\]]+)\/(?P<mask>\d+))?[\n\r]*'
+            r' +(?P<next_hop>\S+)[\n\r]* +(?P<number>[\d\.\s\{\}]+)'
+            r'(?: *(?P<origin_codes>(i|e|\?)))?$',
 
         # Processed 40 prefixes, 50 paths
-        p12 = re.compile(r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
-                         r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$')
+        p12=r'^\s*Processed +(?P<processed_prefix>[0-9]+)'
+            r' +prefixes, +(?P<processed_paths>[0-9]+) +paths$',
 
         # BGP is operating in STANDALONE mode.
-        p13 = re.compile(r'BGP *is *operating *in *'
-                        '(?P<operation_mode>\w+) *mode.$')
+        p13=r'BGP *is *operating *in *'
+             '(?P<operation_mode>\w+) *mode.$',
 
         # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
         #Speaker              19         19         19         19          19           0
-        p14 = re.compile(r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
-                         ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
-                         ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
-                         ' *(?P<standbyver>[0-9]+)$')
+        p14=r'^\s*(?P<process>[a-zA-Z]+) *(?P<rcvtblver>[0-9]+)'
+             ' *(?P<brib_rib>[0-9]+) *(?P<labelver>[0-9]+)'
+             ' *(?P<importver>[0-9]+) *(?P<sendtblver>[0-9]+)'
+             ' *(?P<standbyver>[0-9]+)$',
 
         # Neighbor        Spk    AS MsgRcvd MsgSent   TblVer  InQ OutQ  Up/Down  St/PfxRcd
         # 192.168.2.2       0   200     353     353       19    0    0 05:49:05          3
-        p15 = re.compile(r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
-                           ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
-                           ' +(?P<msg_sent>[0-9]+)'
-                           ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
-                           ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
-                           ' +(?P<state_pfxrcd>.+)$')
-        
+        p15=r'^\s*(?P<neighbor>[a-zA-Z0-9\.\:]+) +(?P<spk>[0-9]+)'
+             ' +(?P<remote_as>[0-9\.]+) +(?P<msg_rcvd>[0-9]+)'
+             ' +(?P<msg_sent>[0-9]+)'
+             ' +(?P<tbl_ver>[0-9]+) +(?P<input_queue>[0-9]+)'
+             ' +(?P<output_queue>[0-9]+) +(?P<up_down>[a-z0-9\:]+)'
+             ' +(?P<state_pfxrcd>.+)$',
+
         # Dampening is not enabled
         # Dampening enabled
-        p16 = re.compile(r'^Dampening +(?:(is +))?(?P<dampening_status>[\w\s]+)$')
+        p16=r'^Dampening +(?:(is +))?(?P<dampening_status>[\w\s]+)$',
+    )
+
+    def cli(self, address_family=None, community=None, exact_match=None, output=None):
+        # Execute command
+        if output is None:
+            if address_family and community and exact_match:
+                command = self.cli_command[3].format(address_family=address_family, community=community, exact_match=exact_match)
+            elif address_family and community:
+                command = self.cli_command[2].format(address_family=address_family, community=community)
+            elif address_family:
+                command = self.cli_command[1].format(address_family=address_family)
+            else:
+                command = self.cli_command[0]
+            output = self.device.execute(command)
+
+        # initial return dictionary
+        ret_dict = {}
+        last_prefix = None
+        rd = None
+        if not address_family:
+            address_family = 'ipv4 unicast'
+
+        p = ShowBgpAddressFamily.patterns
 
         for line in output.splitlines():
             line = line.rstrip()
 
             # BGP router identifier 10.4.1.1, local AS number 100
             # BGP router identifier 10.10.10.108, local AS number 65108.65108
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 address_family = address_family.replace(" ", "_").lower()
@@ -9277,25 +9396,25 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
                 continue 
 
             # BGP generic scan interval 60 secs
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 af_dict['generic_scan_interval'] = int(m.groupdict()['interval'])
                 continue          
 
             # Non-stop routing is enabled
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 af_dict['non_stop_routing'] = True
                 continue
 
             # BGP table state: Active
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 af_dict['table_state'] = m.groupdict()['table_state'].lower()
                 continue
 
             # Table ID: 0x0   RD version: 0
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['table_id'] = group['table_id']
@@ -9303,13 +9422,13 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
                 continue
 
             # BGP main routing table version 43
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 af_dict['bgp_table_version'] = int(m.groupdict()['bgp_table_version'])
                 continue
 
             # BGP NSR Initial initsync version 11 (Reached)
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['nsr_initial_initsync_version'] = group['nsr_initial_initsync_version']
@@ -9317,20 +9436,20 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
                 continue
 
             # BGP NSR/ISSU Sync-Group versions 0/0
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 af_dict['nsr_issu_sync_group_versions'] = \
                                 m.groupdict()['nsr_issu_sync_group_versions']
                 continue
 
             # BGP scan interval 60 secs
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                af_dict['scan_interval'] = int(m.groupdict()['scan_interval'])
                continue
 
             # Route Distinguisher: 200:1 (default for vrf VRF1)
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 rd = group['route_distinguisher']
@@ -9349,7 +9468,7 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
             # *>i10.169.1.0/24      10.64.4.4               2219    100      0 300 33299 51178 47751 {27016} e
             # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
             # *> 10.7.7.7/32        10.10.10.107             0             0 65107.65107 ?
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 prefix = group['prefix']
@@ -9399,7 +9518,7 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
                 continue
 
             # Processed 40 prefixes, 50 paths
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['processed_prefix'] = int(group['processed_prefix'])
@@ -9407,7 +9526,7 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
                 continue
 
             # BGP is operating in STANDALONE mode.
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 operation_mode = m.groupdict()['operation_mode'].lower()
                 af_dict['operation_mode'] = operation_mode
@@ -9416,7 +9535,7 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
             # Process       RcvTblVer   bRIB/RIB   LabelVer  ImportVer  SendTblVer  StandbyVer
             # Speaker              63         63         63         63          63           0
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 process = groupdict.pop('process')
@@ -9428,7 +9547,7 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
             # 10.1.5.5          0   200      60      62       63    0    0 00:57:32          0
             # 10.16.2.2           0   100       0       0        0    0    0 00:00:00 Idle
             # 10.0.0.35         0   200       0       0        0    0    0 00:00:00 Idle (Admin)!
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 neighbor = groupdict.pop('neighbor')
@@ -9438,7 +9557,7 @@ class ShowBgpAddressFamily(ShowBgpAddressFamilySchema):
 
             # Dampening is not enabled
             # Dampening enabled
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 af_dict['dampening_status'] = group['dampening_status']
@@ -9527,87 +9646,91 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
 
     cli_command = ['show bgp {address_family} {bgp_prefix}']
 
-    def cli(self, address_family='', bgp_prefix='', output=None):
-        
-        ret_dict = {}
-        
-        if output is None:
-            out = self.device.execute(self.cli_command[0].format(address_family=address_family, bgp_prefix=bgp_prefix))
-        else:
-            out = output
-        
-        # BGP routing table entry for fc00:a000:1000:101::1/128    
-        p1 = re.compile(r'^BGP +routing +table +entry +for +(?P<prefix>[a-z0-9+.:]+.[0-9]+)')
-        
+    patterns = Patterns(
+        # BGP routing table entry for fc00:a000:1000:101::1/128
+        p1=r'^BGP +routing +table +entry +for +(?P<prefix>[a-z0-9+.:]+.[0-9]+)',
+
         # Last Modified: Nov  2 09:48:44.893 for 05:33:53
-        p2 = re.compile(r'^Last +Modified: (?P<last_modified>.*)$')
-        
+        p2=r'^Last +Modified: (?P<last_modified>.*)$',
+
         # Paths: (2 available, best #1)
-        p3 = re.compile(r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$')
-        
+        p3=r'^Paths:\s+\((?P<total_available_paths>\d+)\s+available,\s+best\s+#(?P<best_path>\d+)\)$',
+
         # Not advertised to any peer
-        p4 = re.compile(r'^Not\s+advertised\s+to\s+any\s+peer$')
+        p4=r'^Not\s+advertised\s+to\s+any\s+peer$',
 
         # Advertised to PE peers (in unique update groups):
         # Advertised to CE peers (in unique update groups):
-        p5 = re.compile(r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$')
-        
+        p5=r'^Advertised\s+to\s+(?P<peer_name>[a-zA-Z0-9]+)\s+peers\s+\(in\s+unique\s+update\s+groups\):$',
+
         # Path #1: Received by speaker 0
-        p6 = re.compile(r'^Path\s+#(?P<path_num>\d+):.*$')
-        
+        p6=r'^Path\s+#(?P<path_num>\d+):.*$',
+
         # 7000
         # Local
-        p7 = re.compile(r'^(?P<as_path>[a-zA-Z0-9]+)$')
+        p7=r'^(?P<as_path>[a-zA-Z0-9]+)$',
 
         # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
         # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
         # :: from :: (50.1.1.4)
-        p8 = re.compile(r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
-                        r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?')
-        
+        p8=r'^(?P<bgp_peer_neighbor_ip>[\w.:]+)\s+(?:\(metric\s+(?P<metric>\d+)\)\s+)?'
+           r'from\s+(?P<origin_neighbors_ip>[\w.:]+)\s*(?:\((?P<origin_router_id>[\w.:]+)\))?',
+
         # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best, import-candidate, imported
         # Origin IGP, metric 0, localpref 100, valid, external, best, group-best, import-candidate
         # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
         # Origin incomplete, metric 0, localpref 100, valid, internal, backup, add-path, import-candidate, imported
-        p9 = re.compile(r'^Origin +(?P<origin>[a-zA-Z]+),'
-                         r'(?: +metric (?P<metric>[0-9]+),?)?'
-                         r'(?: +localpref (?P<localpref>[0-9]+),?)?'
-                         r'(?: +weight (?P<weight>[0-9]+),?)?'
-                         r'(?: +(?P<valid>valid?),)?'
-                         r'(?: (?P<redistributed>redistributed?),)?'
-                         r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
-                         r'(?: (?P<best>best))?(\,*)?'
-                         r'(?: (?P<group_best>group-best?),*)?'
-                         r'(?: (?P<backup>backup),*)?'
-                         r'(?: (?P<add_path>add-path),*)?'
-                         r'(?: (?P<import_candidate>import-candidate?),*)?'
-                         r'(?: (?P<imported>imported?),*)?')
-                         
-         #  Received Path ID 0, Local Path ID 0, version 715
-        p10 = re.compile(r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
-                         r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
-                         r'version\s+(?P<version>(\d+))$')
-                         
+        p9=r'^Origin +(?P<origin>[a-zA-Z]+),'
+           r'(?: +metric (?P<metric>[0-9]+),?)?'
+           r'(?: +localpref (?P<localpref>[0-9]+),?)?'
+           r'(?: +weight (?P<weight>[0-9]+),?)?'
+           r'(?: +(?P<valid>valid?),)?'
+           r'(?: (?P<redistributed>redistributed?),)?'
+           r'(?: +(?P<state>(internal|external|local)?),)?(\,*)?'
+           r'(?: (?P<best>best))?(\,*)?'
+           r'(?: (?P<group_best>group-best?),*)?'
+           r'(?: (?P<backup>backup),*)?'
+           r'(?: (?P<add_path>add-path),*)?'
+           r'(?: (?P<import_candidate>import-candidate?),*)?'
+           r'(?: (?P<imported>imported?),*)?',
+
+        #  Received Path ID 0, Local Path ID 0, version 715
+        p10=r'^Received\s+Path\s+ID\s+(?P<received_path_id>(\d+)),\s+'
+            r'Local\s+Path\s+ID\s+(?P<local_path_id>(\d+)),\s+'
+            r'version\s+(?P<version>(\d+))$',
+
         # Extended community: RT:100:1001
-        p11 = re.compile(r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$')
-        
+        p11=r'^Extended\s+community:(?:\s+(?P<extended_community>.*))?$',
+
         # Originator: 50.1.1.1, Cluster list: 50.1.1.8
         # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
-        p12 = re.compile(r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$')
-        
+        p12=r'^Originator:\s+(?P<originator>[\d.]+),\s+Cluster\s+list:\s+(?P<cluster_list>[\d., ]+)$',
+
         # PSID-Type:L3, SubTLV Count:1, R:0x00,
-        p13 = re.compile(r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)$')
-        
-         # SubTLV:
+        p13=r'^PSID-Type:(?P<psid_type>\w+),\s+SubTLV\s+Count:(?P<subtlv_count>\d+)$',
+
+        # SubTLV:
         # SubSubTLV:
-        p14 = re.compile(r'^(?P<tlv_name>SubTLV|SubSubTLV):$')
-        
+        p14=r'^(?P<tlv_name>SubTLV|SubSubTLV):$',
+
         # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
-        p15 = re.compile(r'T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+Behavior:(?P<behaviour>\d+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$')
-        
+        p15=r'T:(?P<t_value>\d+)\(Sid\s+information\),\s+Sid:(?P<sid_value>[a-f0-9.:]+),\s+Behavior:(?P<behaviour>\d+),\s+SS-TLV\s+Count:(?P<sstlv_count>\d+)$',
+
         # T:1(Sid structure):
-        p16 = re.compile(r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$')
+        p16=r'^T:(?P<t_value>\d+)\(Sid\s+structure\):$',
+    )
+
+    def cli(self, address_family='', bgp_prefix='', output=None):
+        
+        ret_dict = {}
         
+        if output is None:
+            out = self.device.execute(self.cli_command[0].format(address_family=address_family, bgp_prefix=bgp_prefix))
+        else:
+            out = output
+        
+        p = ShowBgpAddressfamilyPrefix.patterns
+
         # Initialize dictionary
        
         next_line_update_group = False
@@ -9621,7 +9744,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
             line = line.strip()
 
             # BGP routing table entry for 101.0.0.1/32
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 address_family = address_family.replace(' ','_')
@@ -9631,14 +9754,14 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
                 continue
             
             # Last Modified: Mar 27 02:45:20.105 for 1d15h
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 vrf_dict['last_modified'] = group['last_modified']
                 continue
             
             # Paths: (1 available, best #1)
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 paths_dict = vrf_dict.setdefault('paths', {})
@@ -9647,14 +9770,14 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
                 continue
             
             # Not advertised to any peer
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 next_line_update_group = False
                 continue
 
             # Advertised to PE peers (in unique update groups):
             # Advertised to CE peers (in unique update groups):
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 peer_name = group['peer_name']
@@ -9662,7 +9785,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
                 continue
             
             # Path #1: Received by speaker 0
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 path = int(group['path_num'])
@@ -9671,7 +9794,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
             
             # 7000
             # Local
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 as_path = group['as_path']
@@ -9681,7 +9804,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
             # 50.1.1.1 (metric 4) from 50.1.1.8 (50.1.1.1)
             # 2000:90:33:1::2 from 2000:90:33:1::2 (70.3.3.3)
             # :: from :: (50.1.1.4)
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 bgp_peer_neighbor_ip = group['bgp_peer_neighbor_ip']
@@ -9696,7 +9819,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
             # Origin incomplete, metric 0, localpref 100, valid, internal, best, group-best, import-candidate, imported
             # Origin IGP, metric 0, localpref 100, valid, external, best, group-best, import-candidate
             # Origin incomplete, metric 0, localpref 100, weight 32768, valid, redistributed, best, group-best, import-candidate
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 status_codes = ''
@@ -9729,7 +9852,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
                 continue
             
             # Received Path ID 0, Local Path ID 0, version 715
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 next_hop_dict['received_path_id'] = int(group['received_path_id'])
@@ -9738,7 +9861,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
                 continue
             
             # Extended community: RT:100:1001
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 value = group['extended_community']
@@ -9747,7 +9870,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
             
             # Originator: 50.1.1.1, Cluster list: 50.1.1.8
             # Originator: 10.0.0.3, Cluster list: 10.0.0.11, 10.0.0.13
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 next_hop_dict['originator'] = group['originator']
@@ -9758,7 +9881,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
                 continue
             
             #  PSID-Type:L3, SubTLV Count:1
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 psid_type = group['psid_type']
@@ -9768,13 +9891,13 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
                 psid_dict['subtlv_count'] = int(group['subtlv_count'])
                 continue
             # SubTLV:    
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 subtlv_dict = psid_dict.setdefault('subtlv',{})
             
             # T:1(Sid information), Sid:fc00:c000:2003::, F:0x00, R2:0x00, Behavior:62, R3:0x00, SS-TLV Count:1
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 subtlv_dict['t_value'] = int(group['t_value'])
@@ -9784,7 +9907,7 @@ class ShowBgpAddressfamilyPrefix(ShowBgpAddressfamilyPrefixSchema):
                 continue
             
             # T:1(Sid structure):
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 group = m.groupdict()
                 t_dict = subtlv_dict.setdefault('subsubtlv' , {})
@@ -9842,61 +9965,65 @@ class ShowBgpDampedPaths(ShowBgpDampedPathsSchema):
 
     cli_command = ['show bgp dampened-paths']
 
-    def cli(self, output=None):
-
+    patterns = Patterns(
+        # BGP router identifier 50.1.1.1, local AS number 100
+        p1=r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
+           r' +local +AS +number +(?P<local_as>([\d\.]+))$',
 
-        if output is None:
-            output = self.device.execute(self.cli_command[0])
-            
-        ret_dict = {}
-        
-        # BGP router identifier 50.1.1.1, local AS number 100    
-        p1 = re.compile(r'^\s*BGP +router +identifier +(?P<router_identifier>(\S+)),'
-                        r' +local +AS +number +(?P<local_as>([\d\.]+))$')
-        
         # BGP generic scan interval 60 secs
-        p2 =  re.compile(r'^\s*BGP *generic *scan *interval *'
-                            '(?P<generic_scan_interval>[0-9]+) *secs$')
-        
+        p2=r'^\s*BGP *generic *scan *interval *'
+            '(?P<generic_scan_interval>[0-9]+) *secs$',
+
         # Non-stop routing is enabled
-        p3 = re.compile(r'^\s*Non-stop *routing *is'
-                        ' *(?P<non_stop_routing>[A-Za-z]+)$')
-        
+        p3=r'^\s*Non-stop *routing *is'
+            ' *(?P<non_stop_routing>[A-Za-z]+)$',
+
         # BGP table state: Active
-        p4 = re.compile(r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$')
-        
+        p4=r'^\s*BGP *table *state: *(?P<table_state>[a-zA-Z]+)$',
+
         # Table ID: 0xe0000000   RD version: 177
-        p5 = re.compile(r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
-                         ' *RD *version: (?P<rd_version>[0-9]+)$')
-        
+        p5=r'^\s*Table *ID: *(?P<table_id>[a-z0-9]+)'
+            ' *RD *version: (?P<rd_version>[0-9]+)$',
+
         # BGP main routing table version 177
-        p6 = re.compile(r'^\s*BGP *main *routing *table *version'
-                         ' *(?P<bgp_table_version>[0-9]+)$')
-        
+        p6=r'^\s*BGP *main *routing *table *version'
+            ' *(?P<bgp_table_version>[0-9]+)$',
+
         # BGP NSR Initial initsync version 38 (Reached)
-        p7 = re.compile(r'^\s*BGP *NSR *Initial *initsync *version *'
-                            '(?P<nsr_initial_initsync_version>[0-9]+)'
-                          ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$')
-        
+        p7=r'^\s*BGP *NSR *Initial *initsync *version *'
+            '(?P<nsr_initial_initsync_version>[0-9]+)'
+            ' *\((?P<nsr_initial_init_ver_status>[a-zA-Z]+)\)$',
+
         # BGP NSR/ISSU Sync-Group versions 0/0
-        p8 = re.compile(r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
-                            '(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$')
-        
+        p8=r'^\s*BGP *NSR/ISSU *Sync-Group *versions *'
+            '(?P<nsr_issu_sync_group_versions>[0-9\/\s]+)$',
+
         # BGP scan interval 60 secs
-        p9 = re.compile(r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$')
-        
+        p9=r'^\s*BGP *scan *interval *(?P<scan_interval>[0-9\s]+) *secs$',
+
         # BGP scan interval 60 secs
-        p10 = re.compile(r'^Dampening +(?:(is +))?(?P<dampening_status>[\w\s]+)$')
-        
+        p10=r'^Dampening +(?:(is +))?(?P<dampening_status>[\w\s]+)$',
+
         # Network            From            Reuse    Path
         # *d 80.21.1.0/30       80.11.10.2      00:07:40 5000 ?
-        p11 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)\s+(?P<network>[\w\.\/]+)\s+(?P<from>[\w\.]+)\s+(?P<reuse>\d+:\d+\d+:\d+)\s+(?P<path>\d+)')
-                        
+        p11=r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)\s+(?P<network>[\w\.\/]+)\s+(?P<from>[\w\.]+)\s+(?P<reuse>\d+:\d+\d+:\d+)\s+(?P<path>\d+)',
+    )
+
+    def cli(self, output=None):
+
+
+        if output is None:
+            output = self.device.execute(self.cli_command[0])
+            
+        ret_dict = {}
+        
+        p = ShowBgpDampedPaths.patterns
+
         for line in output.splitlines():
             line = line.strip()
             
             # BGP router identifier 50.1.1.1, local AS number 100 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 routes = group['router_identifier']
@@ -9906,28 +10033,28 @@ class ShowBgpDampedPaths(ShowBgpDampedPathsSchema):
                 continue
             
             # BGP generic scan interval 60 secs
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 route_dict['generic_scan_interval'] = int(group['generic_scan_interval'])
                 continue
             
             # Non-stop routing is enabled
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 route_dict['non_stop_routing'] = True
                 continue
             
             # BGP table state: Active
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 route_dict['table_state'] = group['table_state']
                 continue
             
             # Table ID: 0xe0000000   RD version: 177
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
                 route_dict['table_id'] = group['table_id']
@@ -9935,14 +10062,14 @@ class ShowBgpDampedPaths(ShowBgpDampedPathsSchema):
                 continue
             
             # BGP main routing table version 177
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 route_dict['bgp_table_version'] = int(group['bgp_table_version'])
                 continue
             
             # BGP NSR Initial initsync version 38 (Reached)
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 route_dict['nsr_initial_initsync_version'] = int(group['nsr_initial_initsync_version'])
@@ -9950,21 +10077,21 @@ class ShowBgpDampedPaths(ShowBgpDampedPathsSchema):
                 continue
             
             # BGP NSR/ISSU Sync-Group versions 0/0
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 group = m.groupdict()
                 route_dict['nsr_issu_sync_group_versions'] = group['nsr_issu_sync_group_versions']
                 continue
             
             # BGP scan interval 60 secs
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 route_dict['scan_interval'] = int(group['scan_interval'])
                 continue
             
             # BGP scan interval 60 secs
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 route_dict['dampening_status'] = group['dampening_status']
@@ -9972,7 +10099,7 @@ class ShowBgpDampedPaths(ShowBgpDampedPathsSchema):
             
             # Network            From            Reuse    Path
              # *d 80.21.1.0/30       80.11.10.2      00:07:40 5000 ?
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 network = group['network']
@@ -20,6 +20,10 @@ from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use, Schema, ListOf)
 
+# Parser utils
+from genie.libs.parser.utils.junos_display import DisplayMixin
+from genie.libs.parser.utils.json_table import is_json
+
 
 class ShowBgpGroupBriefSchema(MetaParser):
     """ Schema for:
@@ -161,7 +165,7 @@ class ShowBgpGroupBriefSchema(MetaParser):
     }
 
 
-class ShowBgpGroupBrief(ShowBgpGroupBriefSchema):
+class ShowBgpGroupBrief(DisplayMixin, ShowBgpGroupBriefSchema):
     """ Parser for:
             * show bgp group brief
     """
@@ -170,6 +174,9 @@ class ShowBgpGroupBrief(ShowBgpGroupBriefSchema):
     exclude = ['peer-address']
 
     def cli(self, output=None):
+        # the output of the command with | display json
+        if output and is_json(output):
+            return self.json(output=output)
 
         if not output:
             out = self.device.execute(self.cli_command)
@@ -843,7 +850,7 @@ class ShowBgpSummarySchema(MetaParser):
     }
 
 
-class ShowBgpSummary(ShowBgpSummarySchema):
+class ShowBgpSummary(DisplayMixin, ShowBgpSummarySchema):
     """
     Parser for:
         * show bgp summary
@@ -851,6 +858,9 @@ class ShowBgpSummary(ShowBgpSummarySchema):
     cli_command = 'show bgp summary'
 
     def cli(self, output=None):
+        # the output of the command with | display json
+        if output and is_json(output):
+            return self.json(output=output)
 
         if not output:
             out = self.device.execute(self.cli_command)
@@ -1204,7 +1214,7 @@ class ShowBgpNeighborSchema(MetaParser):
         }
 
 
-class ShowBgpNeighbor(ShowBgpNeighborSchema):
+class ShowBgpNeighbor(DisplayMixin, ShowBgpNeighborSchema):
     """ Parser for:
             * show bgp neighbor
             * show bgp neighbor {neighbor_address}
@@ -1213,6 +1223,9 @@ class ShowBgpNeighbor(ShowBgpNeighborSchema):
         'show bgp neighbor {neighbor_address}']
 
     def cli(self, neighbor_address=None, output=None):
+        # the output of the command with | display json
+        if output and is_json(output):
+            return self.json(output=output)
         if not output:
             if neighbor_address:
                 out = self.device.execute(self.cli_command[1].format(
@@ -27,6 +27,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or, L
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.junos_display import DisplayMixin
+from genie.libs.parser.utils.json_table import is_json
 
 
 # =======================================================
@@ -1022,10 +1024,13 @@ class ShowInterfacesSchema(MetaParser):
         }
     }
 
-class ShowInterfaces(ShowInterfacesSchema):
+class ShowInterfaces(DisplayMixin, ShowInterfacesSchema):
     cli_command = ['show interfaces', 'show interfaces {interface}']
 
     def cli(self, interface=None, output=None):
+        # the output of the command with | display json
+        if output and is_json(output):
+            return self.json(output=output)
 
         if not output:
             if interface:
@@ -42,6 +42,10 @@ from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import (Any, Optional, Use,
                                                 Schema, Or, ListOf)
 
+# Parser utils
+from genie.libs.parser.utils.junos_display import DisplayMixin
+from genie.libs.parser.utils.json_table import is_json
+
 
 class ShowOspfInterfaceBriefSchema(MetaParser):
     """ Schema for:
@@ -433,10 +437,13 @@ Parser for:
 '''
 
 
-class ShowOspfNeighbor(ShowOspfNeighborSchema):
+class ShowOspfNeighbor(DisplayMixin, ShowOspfNeighborSchema):
     cli_command = ['show ospf neighbor', 'show ospf neighbor instance {name}']
 
     def cli(self, name=None, output=None):
+        # the output of the command with | display json
+        if output and is_json(output):
+            return self.json(output=output)
         if not output:
             if name:
                 out = self.device.execute(self.cli_command[1].format(name=name))
@@ -651,10 +658,13 @@ Parser for:
 '''
 
 
-class ShowOspfDatabase(ShowOspfDatabaseSchema):
+class ShowOspfDatabase(DisplayMixin, ShowOspfDatabaseSchema):
     cli_command = 'show ospf database'
 
     def cli(self, output=None):
+        # the output of the command with | display json
+        if output and is_json(output):
+            return self.json(output=output)
         if not output:
             out = self.device.execute(self.cli_command)
         else:
@@ -2399,7 +2409,7 @@ class ShowOspfDatabaseExtensiveSchema(MetaParser):
     }
 
 
-class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema):
+class ShowOspfDatabaseExtensive(DisplayMixin, ShowOspfDatabaseExtensiveSchema):
     """ Parser for:
             * show ospf database extensive
             * show ospf database {data_type} extensive
@@ -2410,6 +2420,9 @@ class ShowOspfDatabaseExtensive(ShowOspfDatabaseExtensiveSchema):
         ]
 
     def cli(self, data_type=None, output=None):
+        # the output of the command with | display json
+        if output and is_json(output):
+            return self.json(output=output)
         if not output:
             if data_type:
                 out = self.device.execute(self.cli_command[1].format(
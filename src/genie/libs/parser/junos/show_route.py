@@ -29,6 +29,14 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema, ListOf, Or
+
+# Parser utils
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.dispatcher import LineDispatcher
+from genie.libs.parser.utils.streaming import iter_lines, iter_records
+from genie.libs.parser.utils.junos_display import DisplayMixin
+from genie.libs.parser.utils.json_table import is_json
+
 '''
 Schema for:
     * show route table {table}
@@ -345,7 +353,7 @@ class ShowRouteSchema(MetaParser):
         }
     }
 
-class ShowRoute(ShowRouteSchema):
+class ShowRoute(DisplayMixin, ShowRouteSchema):
     """ Parser for:
             * show route
             * show route {ip_address}
@@ -361,6 +369,9 @@ class ShowRoute(ShowRouteSchema):
                     'show route protocol {protocol} table {table}']
 
     def cli(self, protocol=None, ip_address=None, table=None, output=None):
+        # the output of the command with | display json
+        if output and is_json(output):
+            return self.json(output=output)
         if not output:
             if protocol and table:
                 cmd = self.cli_command[4].format(
@@ -803,7 +814,7 @@ class ShowRouteProtocolExtensiveSchema(MetaParser):
     }
 
 
-class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
+class ShowRouteProtocolExtensive(DisplayMixin, ShowRouteProtocolExtensiveSchema):
     """ Parser for:
             * show route protocol {protocol} extensive
             * show route protocol {protocol} table {table} extensive
@@ -820,169 +831,132 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                     'show route extensive',
                     'show route extensive {destination}',
                     'show route protocol {protocol} {destination} extensive']
-    def cli(self, protocol=None, table=None, 
-            destination=None, route=None, 
-            output=None):
-        if not output:
-            if protocol and table and destination:
-                cmd = self.cli_command[2].format(
-                    protocol=protocol,
-                    table=table,
-                    destination=destination)
-            elif protocol and destination:
-                cmd = self.cli_command[6].format(
-                    protocol=protocol,
-                    destination=destination)
-            elif table and protocol:
-                cmd = self.cli_command[1].format(
-                    protocol=protocol,
-                    table=table)
-            elif protocol:
-                cmd = self.cli_command[0].format(
-                    protocol=protocol)
-            elif route:
-                cmd = self.cli_command[3].format(
-                    route=route)
-            elif destination:
-                cmd = self.cli_command[5].format(
-                    destination=destination)
-            else:
-                cmd = self.cli_command[4]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        ret_dict = {}
-        state_type = None
-        forwarding_nh_count = None
-        protocol_nh_found = None
-        originating_rib_found = None
-
+    patterns = Patterns(
         # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-        p1 = re.compile(r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
-                        r'destinations, +(?P<total_route_count>\d+) +routes +'
-                        r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
-                        r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$')
+        p1=r'^(?P<table_name>\S+): +(?P<destination_count>\d+) +'
+           r'destinations, +(?P<total_route_count>\d+) +routes +'
+           r'\((?P<active_route_count>\d+) +active, +(?P<holddown_route_count>\d+) +'
+           r'holddown, +(?P<hidden_route_count>\d+) +hidden\)$',
 
         # 0.0.0.0/0 (1 entry, 1 announced)
         # 10.1.0.0/24 (2 entries, 1 announced)
         # 0.0.0.0 (1 entry, 1 announced)
-        p2 = re.compile(r'^(?P<rt_destination>\S+)(\/(?P<rt_prefix_length>\d+))? +'
-                        r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<announced>\d+) +announced\)$')
+        p2=r'^(?P<rt_destination>\S+)(\/(?P<rt_prefix_length>\d+))? +'
+           r'\((?P<format>(?P<text>\d+) +(entry|entries)), +(?P<announced>\d+) +announced\)$',
 
         # State: <FlashAll>
         # State: <Active Int Ext>
-        p3 = re.compile(r'State: +\<(?P<rt_state>[\S\s]+)\>$')
+        p3=r'State: +\<(?P<rt_state>[\S\s]+)\>$',
 
         # *OSPF   Preference: 150/10
         # *BGP    Preference: 170/-121
-        p4 = re.compile(r'^(?P<active_tag>\*)?(?P<protocol>\S+)\s+'
-                        r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$')
+        p4=r'^(?P<active_tag>\*)?(?P<protocol>\S+)\s+'
+           r'Preference:\s+(?P<preference>\d+)(\/(\-)?(?P<preference2>\d+))?$',
 
         # Next hop type: Router, Next hop index: 613
-        p5 = re.compile(r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
-                        r'index: +(?P<nh_index>\d+)$')
+        p5=r'^Next +hop type: +(?P<nh_type>\S+), +Next +hop +'
+           r'index: +(?P<nh_index>\d+)$',
 
         # Address: 0xdfa7934
-        p6 = re.compile(r'^Address: +(?P<nh_address>\S+)$')
+        p6=r'^Address: +(?P<nh_address>\S+)$',
 
         # Next-hop reference count: 458
-        p7 = re.compile(r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$')
+        p7=r'^Next-hop +reference +count: +(?P<nh_reference_count>\d+)$',
 
         # Source: 10.16.2.2
-        p7_1 = re.compile(r'^Source: +(?P<gateway>\S+)$')
+        p7_1=r'^Source: +(?P<gateway>\S+)$',
 
         # Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
         # Nexthop: 10.169.14.121 via ge-0/0/1.0
-        p8 = re.compile(r'^(?P<nh_string>Next *hop):( +(?P<to>\S+))? +via +(?P<via>\S+)'
-                        r'( +weight +(?P<weight>\w+))?(, +(?P<selected_next_hop>\w+))?$')
+        p8=r'^(?P<nh_string>Next *hop):( +(?P<to>\S+))? +via +(?P<via>\S+)'
+           r'( +weight +(?P<weight>\w+))?(, +(?P<selected_next_hop>\w+))?$',
 
         # Protocol next hop: 10.169.14.240
-        p8_1 = re.compile(r'^Protocol +next +hop: +(?P<to>\S+)( +Metric: +(?P<metric>\d+))?$')
+        p8_1=r'^Protocol +next +hop: +(?P<to>\S+)( +Metric: +(?P<metric>\d+))?$',
 
         # Session Id: 0x141
-        p9 = re.compile(r'^Session +Id: +\d+[a-z]+(?P<session_id>\w+)$')
+        p9=r'^Session +Id: +\d+[a-z]+(?P<session_id>\w+)$',
 
-        # Local AS: 65171 
+        # Local AS: 65171
         # Local AS: 65171 Peer AS: 65171
         # Local AS:     1 Peer AS:     3
-        p10 = re.compile(r'^Local +AS: +(?P<local_as>\d+)( +Peer +AS: +(?P<peer_as>\d+))?$')
+        p10=r'^Local +AS: +(?P<local_as>\d+)( +Peer +AS: +(?P<peer_as>\d+))?$',
 
-        # Age: 3w2d 4:43:35   Metric: 101 
+        # Age: 3w2d 4:43:35   Metric: 101
         # Age: 3:07:25    Metric: 200
         # Age: 29w6d 21:42:46
-        p11 = re.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric:\s+(?P<metric>\d+))?$')
+        p11=r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric:\s+(?P<metric>\d+))?$',
 
         # Age: 12 Metric2: 50
-        p11_2 = re.compile(r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric2:\s+(?P<metric2>\d+))?$')
+        p11_2=r'^Age:\s+(?P<age>(\w+(\s+\S+)?)|[\d:]+)(\s+Metric2:\s+(?P<metric2>\d+))?$',
 
-        # Validation State: unverified 
-        p12 = re.compile(r'^Validation +State: +(?P<validation_state>\S+)$')
+        # Validation State: unverified
+        p12=r'^Validation +State: +(?P<validation_state>\S+)$',
+
+        # Tag: 0
+        p13=r'^Tag: +(?P<rt_tag>\d+)$',
 
-        # Tag: 0 
-        p13 = re.compile(r'^Tag: +(?P<rt_tag>\d+)$')
-        
         # Task: OSPF
-        p14 = re.compile(r'^Task: +(?P<task>\S+)$')
+        p14=r'^Task: +(?P<task>\S+)$',
 
-        # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3 
-        p15 = re.compile(r'^Announcement +bits +\((?P<announce_bits>\d+)\): +'
-                         r'(?P<announce_tasks>[\S\s]+)$')
+        # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3
+        p15=r'^Announcement +bits +\((?P<announce_bits>\d+)\): +'
+            r'(?P<announce_tasks>[\S\s]+)$',
 
-        # AS path: I 
+        # AS path: I
         # AS path: 30000 4 103 104 105 106 107 108 109 I
         # AS path: I (Originator) Cluster list:  0.0.0.1 0.0.0.2 0.0.0.4
-        p16 = re.compile(r'^(?P<aspath_effective_string>AS +path:) '
-                         r'+((?P<attr_value>[\S\s]+) +Cluster +list: '
-                         r'(?P<cluster_list>[\d\.\s]+)|(?P<attr_value2>[\S\s]+))$')
+        p16=r'^(?P<aspath_effective_string>AS +path:) '
+            r'+((?P<attr_value>[\S\s]+) +Cluster +list: '
+            r'(?P<cluster_list>[\d\.\s]+)|(?P<attr_value2>[\S\s]+))$',
 
         # Accepted Multipath
-        p16_1 = re.compile(r'^Accepted +(?P<accepted>\S+)$')
+        p16_1=r'^Accepted +(?P<accepted>\S+)$',
 
         # KRT in-kernel 0.0.0.0/0 -> {10.169.14.121}
-        p17 = re.compile(r'^(?P<text>KRT +in-kernel+[\S\s]+)$')
+        p17=r'^(?P<text>KRT +in-kernel+[\S\s]+)$',
 
         # Inactive reason: Route Preference
-        p18 = re.compile(r'^Inactive\s+reason: +(?P<inactive_reason>[\S\s]+)$')
+        p18=r'^Inactive\s+reason: +(?P<inactive_reason>[\S\s]+)$',
 
         # Area: 0.0.0.8
-        p19 = re.compile(r'^Area: +(?P<rt_ospf_area>\S+)$')
+        p19=r'^Area: +(?P<rt_ospf_area>\S+)$',
 
         # Label operation: Push 17000
         # Label operation: Push 17000, Push 1650, Push 1913(top)
-        p20 = re.compile(r'^Label +operation: +(?P<mpls_label>[\S\s]+)$')
+        p20=r'^Label +operation: +(?P<mpls_label>[\S\s]+)$',
 
         # Label TTL action: no-prop-ttl
         # Label TTL action: no-prop-ttl, no-prop-ttl, no-prop-ttl(top)
-        p21 = re.compile(r'^Label +TTL +action: +(?P<label_ttl_action>[\S\s]+)$')
+        p21=r'^Label +TTL +action: +(?P<label_ttl_action>[\S\s]+)$',
 
         # Load balance label: Label 17000: None; Label 1650: None; Label 1913: None;
-        p22 = re.compile(r'^Load +balance +label: +(?P<load_balance_label>[\S\s]+)$')
+        p22=r'^Load +balance +label: +(?P<load_balance_label>[\S\s]+)$',
 
         # Label element ptr: 0xc5f6ec0
-        p23 = re.compile(r'^Label +element +ptr: +(?P<label_element>\S+)$')
+        p23=r'^Label +element +ptr: +(?P<label_element>\S+)$',
 
         # Label parent element ptr: 0x0
-        p24 = re.compile(r'^Label +parent +element +ptr: +(?P<label_element_parent>\S+)$')
-        
+        p24=r'^Label +parent +element +ptr: +(?P<label_element_parent>\S+)$',
+
         # Label element references: 2
-        p25 = re.compile(r'^Label +element +references: +(?P<label_element_refcount>\d+)$')
+        p25=r'^Label +element +references: +(?P<label_element_refcount>\d+)$',
 
         # Label element child references: 1
-        p26 = re.compile(r'^Label +element +child +references: +(?P<label_element_childcount>\d+)$')
+        p26=r'^Label +element +child +references: +(?P<label_element_childcount>\d+)$',
 
         # Label element lsp id: 0
-        p27 = re.compile(r'^Label +element +lsp +id: +(?P<label_element_lspid>\d+)$')
+        p27=r'^Label +element +lsp +id: +(?P<label_element_lspid>\d+)$',
 
         # Task: OSPF3 I/O./var/run/ppmd_control
-        p28 = re.compile(r'^Task: +(?P<task_name>[\S\s]+)$')
+        p28=r'^Task: +(?P<task_name>[\S\s]+)$',
 
         # OSPF3 realm ipv6-unicast area : 0.0.0.0, LSA ID : 0.0.0.1, LSA type : Extern
-        p29 = re.compile(r'^OSPF3\s+realm\s+ipv6-unicast\s+area\s:[\S\s]+$')
+        p29=r'^OSPF3\s+realm\s+ipv6-unicast\s+area\s:[\S\s]+$',
 
         # Page 0 idx 1, (group hktGCS002 type Internal) Type 1 val 0x10c0b9b0 (adv_entry)
-        p30 = re.compile(r'^Page +\d+ +idx +\d+[\S\s]+$')
-        
+        p30=r'^Page +\d+ +idx +\d+[\S\s]+$',
+
         # Advertised metrics:
         #     Flags: Nexthop Change
         #     Nexthop: Self
@@ -993,35 +967,98 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
         # Path 10.220.0.0
         # from 10.169.14.240
         # Vector len 4.  Val: 1
-        p31 = re.compile(r'^(Advertised +metrics:)|'
-                         r'(Flags: +)|(Nexthop: +)|(MED: +)|'
-                         r'(Localpref: +)|(AS +path:)|(Communities:)|'
-                         r'(Path +\S+)|(from +\S+)|(Vector +len)')
-        
+        p31=r'^(Advertised +metrics:)|'
+            r'(Flags: +)|(Nexthop: +)|(MED: +)|'
+            r'(Localpref: +)|(AS +path:)|(Communities:)|'
+            r'(Path +\S+)|(from +\S+)|(Vector +len)',
+
         # Indirect next hop: 0xc285884 1048574 INH Session ID: 0x1ac
-        p32 = re.compile(r'^Indirect +next +hop: +(?P<indirect_nh>[\S\s]+)$')
+        p32=r'^Indirect +next +hop: +(?P<indirect_nh>[\S\s]+)$',
 
         # Indirect next hops: 1
-        p33 = re.compile(r'^Indirect +next +hops: +(?P<forwarding_nh_count>\d+)$')
+        p33=r'^Indirect +next +hops: +(?P<forwarding_nh_count>\d+)$',
 
         # 10.169.14.240/32 Originating RIB: inet.0
-        p34 = re.compile(r'^\S+ +Originating +RIB: +[\S\s]+$')
+        p34=r'^\S+ +Originating +RIB: +[\S\s]+$',
 
         # Node path count: 1
         # Forwarding nexthops: 1
-        p35 = re.compile(r'^(Node +path +count: +)|(Forwarding +nexthops: +)[\S\s]+$')
+        p35=r'^(Node +path +count: +)|(Forwarding +nexthops: +)[\S\s]+$',
 
         # Cluster list:  10.16.2.2 10.64.4.4
-        p36 = re.compile(r'^Cluster +list: +(?P<cluster_list>[\S\s]+)$')
+        p36=r'^Cluster +list: +(?P<cluster_list>[\S\s]+)$',
 
         # Router ID: 10.16.2.2
-        p37 = re.compile(r'^Router +ID: +(?P<peer_id>\S+)$')
+        p37=r'^Router +ID: +(?P<peer_id>\S+)$',
+    )
+    dispatcher = LineDispatcher(patterns)
 
-        for line in out.splitlines():
+    def cli(self, protocol=None, table=None, 
+            destination=None, route=None, 
+            output=None):
+        # the output of the command with | display json
+        if output and is_json(output):
+            return self.json(output=output)
+        if not output:
+            if protocol and table and destination:
+                cmd = self.cli_command[2].format(
+                    protocol=protocol,
+                    table=table,
+                    destination=destination)
+            elif protocol and destination:
+                cmd = self.cli_command[6].format(
+                    protocol=protocol,
+                    destination=destination)
+            elif table and protocol:
+                cmd = self.cli_command[1].format(
+                    protocol=protocol,
+                    table=table)
+            elif protocol:
+                cmd = self.cli_command[0].format(
+                    protocol=protocol)
+            elif route:
+                cmd = self.cli_command[3].format(
+                    route=route)
+            elif destination:
+                cmd = self.cli_command[5].format(
+                    destination=destination)
+            else:
+                cmd = self.cli_command[4]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        ret_dict = {}
+        for _ in self._iter_routes(out.splitlines(), ret_dict):
+            pass
+
+        return ret_dict
+
+    def parse_iter(self, output):
+        """ Parse the output route by route, without building the whole
+            structure. The output can be a string, a file object or any
+            iterable of lines.
+
+            Yields ((table-name, rt-destination), rt_dict) of each route,
+            rt_dict being the dict of the route in the 'rt' list of its
+            table in the structure returned by cli()
+        """
+        return iter_records(self._iter_routes(iter_lines(output), {}))
+
+    def _iter_routes(self, lines, ret_dict):
+        """ Parse the lines into ret_dict, yields (keys, rt list, rt dict)
+            of each route
+        """
+        state_type = None
+        forwarding_nh_count = None
+        protocol_nh_found = None
+        originating_rib_found = None
+
+        for line in lines:
             line = line.strip()
+            name, m = ShowRouteProtocolExtensive.dispatcher.match(line)
             # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
-            m = p1.match(line)
-            if m:
+            if name == 'p1':
                 group = m.groupdict()
                 route_table = ret_dict.setdefault('route-information', {}). \
                     setdefault('route-table', [])
@@ -1032,8 +1069,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # 0.0.0.0/0 (1 entry, 1 announced)
             # 10.1.0.0/24 (2 entries, 1 announced)
-            m = p2.match(line)
-            if m:
+            if name == 'p2':
                 group = m.groupdict()
                 state_type = 'route_table'
                 rt_prefix_length = group['rt_prefix_length']
@@ -1059,12 +1095,13 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 rt_entry_count_dict.update({'@junos:format': rt_format})
                 
                 rt_list.append(rt_dict)
+                yield (route_table_dict['table-name'], rt_destination), \
+                    rt_list, rt_dict
                 continue
 
             # State: <FlashAll>
             # State: <Active Int Ext>
-            m = p3.match(line)
-            if m:
+            if name == 'p3':
                 group = m.groupdict()
                 if state_type == 'route_table':
                     rt_dict.update({'rt-state': group['rt_state']})
@@ -1073,8 +1110,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # *OSPF   Preference: 150/10
-            m = p4.match(line)
-            if m:
+            if name == 'p4':
                 group = m.groupdict()
                 state_type = 'protocol'
                 protocol_nh_found = None
@@ -1106,8 +1142,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Next hop type: Router, Next hop index: 613
-            m = p5.match(line)
-            if m:
+            if name == 'p5':
                 group = m.groupdict()
                 nh_type = group['nh_type']
                 nh_index = group['nh_index']
@@ -1116,29 +1151,25 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Address: 0xdfa7934
-            m = p6.match(line)
-            if m:
+            if name == 'p6':
                 group = m.groupdict()
                 rt_entry_dict.update({'nh-address': group['nh_address']})
                 continue
 
             # Next-hop reference count: 458
-            m = p7.match(line)
-            if m:
+            if name == 'p7':
                 group = m.groupdict()
                 rt_entry_dict.update({'nh-reference-count': group['nh_reference_count']})
                 continue
 
             # Source: 10.16.2.2
-            m = p7_1.match(line)
-            if m:
+            if name == 'p7_1':
                 group = m.groupdict()
                 rt_entry_dict.update({'gateway': group['gateway']})
                 continue
                 
             # Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
-            m = p8.match(line)
-            if m:
+            if name == 'p8':
                 group = m.groupdict()
                 if originating_rib_found:
                     proto_output = protocol_nh_dict.get('output', '')
@@ -1165,8 +1196,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Protocol Next hop: 10.169.14.121 via ge-0/0/1.0 weight 0x1, selected
-            m = p8_1.match(line)
-            if m:
+            if name == 'p8_1':
                 group = m.groupdict()
                 protocol_nh_found = True
                 protocol_nh_list = rt_entry_dict.setdefault('protocol-nh', [])
@@ -1179,8 +1209,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Session Id: 0x141
-            m = p9.match(line)
-            if m:
+            if name == 'p9':
                 group = m.groupdict()
                 if originating_rib_found:
                     proto_output = protocol_nh_dict.get('output', '')
@@ -1195,8 +1224,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
             # Local AS: 65171 
             # Local AS: 65171 Peer AS: 65171
             # Local AS:     1 Peer AS:     3
-            m = p10.match(line)
-            if m:
+            if name == 'p10':
                 group = m.groupdict()
                 rt_entry_dict.update({'local-as': group['local_as']})
                 if group.get('peer_as'):
@@ -1204,8 +1232,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Age: 3w2d 4:43:35   Metric: 101 
-            m = p11.match(line)
-            if m:
+            if name == 'p11':
                 group = m.groupdict()
                 age_dict = rt_entry_dict.setdefault('age', {})
                 age_dict.update({'#text': group['age']})
@@ -1215,8 +1242,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Age: 12 Metric2: 50
-            m = p11_2.match(line)
-            if m:
+            if name == 'p11_2':
                 group = m.groupdict()
                 age_dict = rt_entry_dict.setdefault('age', {})
                 age_dict.update({'#text': group['age']})
@@ -1226,29 +1252,25 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue            
 
             # Validation State: unverified 
-            m = p12.match(line)
-            if m:
+            if name == 'p12':
                 group = m.groupdict()
                 rt_entry_dict.update({'validation-state': group['validation_state']})
                 continue
 
             # Tag: 0 
-            m = p13.match(line)
-            if m:
+            if name == 'p13':
                 group = m.groupdict()
                 rt_entry_dict.update({'rt-tag': group['rt_tag']})
                 continue
             
             # Task: OSPF
-            m = p14.match(line)
-            if m:
+            if name == 'p14':
                 group = m.groupdict()
                 rt_entry_dict.update({'task-name': group['task']})
                 continue
 
             # Announcement bits (3): 0-KRT 5-LDP 7-Resolve tree 3 
-            m = p15.match(line)
-            if m:
+            if name == 'p15':
                 group = m.groupdict()
                 rt_entry_dict.update({'announce-bits': group['announce_bits']})
                 rt_entry_dict.update({'announce-tasks': group['announce_tasks']})
@@ -1256,8 +1278,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # AS path: I 
             # AS path: I (Originator) Cluster list:  0.0.0.1 0.0.0.2 0.0.0.4
-            m = p16.match(line)
-            if m:
+            if name == 'p16':
                 rt_entry_exist = rt_dict.get('rt-entry', None)
                 if rt_entry_exist:
                     group = m.groupdict()
@@ -1271,40 +1292,38 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                         group['aspath_effective_string']})
                     attr_as_path_dict.update({'attr-value': group['attr_value']})
                     continue
+                # not a route entry, let the next patterns match the line
+                name, m = ShowRouteProtocolExtensive.dispatcher.match(
+                    line, after='p16')
 
             # Accepted Multipath
-            m = p16_1.match(line)
-            if m:
+            if name == 'p16_1':
                 group = m.groupdict()
                 rt_entry_dict.update({'accepted': group['accepted']})
                 continue
 
             # KRT in-kernel 0.0.0.0/0 -> {10.169.14.121}
-            m = p17.match(line)
-            if m:
+            if name == 'p17':
                 group = m.groupdict()
                 tsi_dict = rt_dict.setdefault('tsi', {})
                 tsi_dict.update({'#text': group['text']})
                 continue
             
             # Inactive reason: Route Preference
-            m = p18.match(line)
-            if m:
+            if name == 'p18':
                 group = m.groupdict()
                 rt_entry_dict.update({'inactive-reason': group['inactive_reason']})
                 continue
             
             # Area: 0.0.0.8
-            m = p19.match(line)
-            if m:
+            if name == 'p19':
                 group = m.groupdict()
                 rt_entry_dict.update({'rt-ospf-area': group['rt_ospf_area']})
                 continue
 
             # Label operation: Push 17000
             # Label operation: Push 17000, Push 1650, Push 1913(top)
-            m = p20.match(line)
-            if m:
+            if name == 'p20':
                 group = m.groupdict()
                 if protocol_nh_found:
                     protocol_nh_dict.update({k.replace('_', '-'):
@@ -1316,8 +1335,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # Label TTL action: no-prop-ttl
             # Label TTL action: no-prop-ttl, no-prop-ttl, no-prop-ttl(top)
-            m = p21.match(line)
-            if m:
+            if name == 'p21':
                 group = m.groupdict()
                 if protocol_nh_found:
                     protocol_nh_dict.update({k.replace('_', '-'):
@@ -1328,8 +1346,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Load balance label: Label 17000: None; Label 1650: None; Label 1913: None;
-            m = p22.match(line)
-            if m:
+            if name == 'p22':
                 group = m.groupdict()
                 if protocol_nh_found:
                     protocol_nh_dict.update({k.replace('_', '-'):
@@ -1340,8 +1357,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label element ptr: 0xc5f6ec0
-            m = p23.match(line)
-            if m:
+            if name == 'p23':
                 group = m.groupdict()
                 if protocol_nh_found:
                     protocol_nh_dict.update({k.replace('_', '-'):
@@ -1352,48 +1368,42 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Label parent element ptr: 0x0
-            m = p24.match(line)
-            if m:
+            if name == 'p24':
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
                     v for k, v in group.items() if v is not None})
                 continue
             
             # Label element references: 2
-            m = p25.match(line)
-            if m:
+            if name == 'p25':
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Label element child references: 1
-            m = p26.match(line)
-            if m:
+            if name == 'p26':
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Label element lsp id: 0
-            m = p27.match(line)
-            if m:
+            if name == 'p27':
                 group = m.groupdict()
                 nh_dict.update({k.replace('_', '-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Task: OSPF3 I/O./var/run/ppmd_control
-            m = p28.match(line)
-            if m:
+            if name == 'p28':
                 group = m.groupdict()
                 rt_entry_dict.update({k.replace('_', '-'):
                     v for k, v in group.items() if v is not None})
                 continue
             
             # OSPF3 realm ipv6-unicast area : 0.0.0.0, LSA ID : 0.0.0.1, LSA type : Extern
-            m = p29.match(line)
-            if m:
+            if name == 'p29':
                 group = m.groupdict()
                 tsi_dict = rt_dict.setdefault('tsi', {})
                 text = tsi_dict.get('#text', '')
@@ -1401,8 +1411,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
             
             # Page 0 idx 1, (group hktGCS002 type Internal) Type 1 val 0x10c0b9b0 (adv_entry)
-            m = p30.match(line)
-            if m:
+            if name == 'p30':
                 tsi_dict = rt_dict.setdefault('tsi', {})
                 group = m.groupdict()
                 text = tsi_dict.get('#text', '')
@@ -1419,8 +1428,7 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
             # Path 10.220.0.0
             # from 10.169.14.240
             # Vector len 4.  Val: 1
-            m = p31.match(line)
-            if m:
+            if name == 'p31':
                 group = m.groupdict()
                 tsi_dict = rt_dict.setdefault('tsi', {})
                 text = tsi_dict.get('#text', '')
@@ -1428,24 +1436,21 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
                 continue
 
             # Indirect next hop: 0xc285884 1048574 INH Session ID: 0x1ac
-            m = p32.match(line)
-            if m:
+            if name == 'p32':
                 group = m.groupdict()
                 protocol_nh_dict.update({k.replace('_', '-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
             # Indirect next hops: 1
-            m = p33.match(line)
-            if m:
+            if name == 'p33':
                 group = m.groupdict()
                 protocol_nh_found = True
                 forwarding_nh_count = group['forwarding_nh_count']
                 continue
 
             # 10.169.14.240/32 Originating RIB: inet.0
-            m = p34.match(line)
-            if m:
+            if name == 'p34':
                 originating_rib_found = True
                 proto_output = protocol_nh_dict.get('output', '')
                 proto_output = '{}{}\n'.format(proto_output, line)
@@ -1454,30 +1459,25 @@ class ShowRouteProtocolExtensive(ShowRouteProtocolExtensiveSchema):
 
             # Node path count: 1
             # Forwarding nexthops: 1
-            m = p35.match(line)
-            if m:
+            if name == 'p35':
                 proto_output = protocol_nh_dict.get('output', '')
                 proto_output = '{}{}\n'.format(proto_output, line)
                 protocol_nh_dict.update({'output': proto_output})
                 continue
 
             # Cluster list:  10.16.2.2 10.64.4.4
-            m = p36.match(line)
-            if m:
+            if name == 'p36':
                 group = m.groupdict()
                 if rt_dict.get('rt-entry', None):
                     rt_entry_dict.update({'cluster-list': group['cluster_list']})
                 continue
             
             # Router ID: 10.16.2.2 
-            m = p37.match(line)
-            if m:
+            if name == 'p37':
                 group = m.groupdict()
                 rt_entry_dict.update({'peer-id': group['peer_id']})
                 continue
 
-        return ret_dict
-    
 class ShowRouteForwardingTableSummarySchema(MetaParser):
     """ Schema for:
             * show route forwarding-table summary
@@ -36,7 +36,6 @@ NXOS parsers for the following show commands:
 # Python
 import re
 from copy import deepcopy
-import xml.etree.ElementTree as ET
 
 # Metaparser
 from genie.metaparser import MetaParser
@@ -49,6 +48,9 @@ from genie.libs.parser.nxos.show_bgp_vrf import *
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.json_table import Table, Field, is_json, loads
+from genie.libs.parser.utils.xml_stream import iter_rows
 
 
 # =====================================
@@ -176,6 +178,112 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
       'paths',
       'routes']
 
+    patterns = Patterns(
+        p1=r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$',
+        p2=r'^\s*BGP Protocol Started, +reason: *:'
+            ' +(?P<reason>[a-zA-Z\s]+)$',
+        p2_1=r'^\s*BGP +Performance +Mode: *:'
+              ' +(?P<performance_mode>[a-zA-Z\s]+)$',
+        p3=r'^\s*BGP +Protocol +Tag *:'
+            ' +(?P<bgp_tag>[a-zA-Z0-9]+)$',
+        p4=r'^\s*BGP +Protocol +State *:'
+            ' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$',
+        p4_1=r'^\s*BGP +Isolate +Mode *:'
+              ' +(?P<isolate_mode>[a-zA-Z\s]+)$',
+        p4_3=r'^\s*BGP +MMODE *:'
+              ' +(?P<mmode>[a-zA-Z\s]+)$',
+        p5=r'^\s*BGP +Memory +State *:'
+            ' +(?P<memory_state>[\w\s]+)$',
+        p5_1=r'^\s*BGP +asformat *:'
+              ' +(?P<asformat>[a-zA-Z\s]+)$',
+        p5_2=r'^\s*Segment +Routing +Global +Block *:'
+              ' +(?P<segment>[0-9\-]+)$',
+        p6=r'^\s*Number +of +attribute +entries *:'
+            ' +(?P<num_attr_entries>[0-9]+)$',
+        p7=r'^\s*HWM +of +attribute +entries *:'
+            ' +(?P<hwm_attr_entries>[0-9]+)$',
+        p8=r'^\s*Bytes +used +by +entries *:'
+            ' +(?P<bytes_used>[0-9]+)$',
+        p9=r'^\s*Entries +pending +delete *:'
+            ' +(?P<entries_pending_delete>[0-9]+)$',
+        p10=r'^\s*HWM +of +entries +pending +delete *:'
+             ' +(?P<hwm_entries_pending_delete>[0-9]+)$',
+        p11=r'^\s*BGP +paths +per +attribute +HWM *:'
+             ' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$',
+        p12=r'^\s*BGP +AS +path +entries *:'
+             ' +(?P<bgp_as_path_entries>[0-9]+)$',
+        p13=r'^\s*Bytes +used +by +AS +path +entries *:'
+             ' +(?P<bytes_used_as_path_entries>[0-9]+)$',
+        p14=r'^\s*BGP +Information +for +VRF'
+             ' +(?P<vrf_name>(\S+))$',
+        p15=r'^\s*VRF +Id *:'
+             ' +(?P<vrf_id>[a-zA-Z0-9]+)$',
+        p16=r'^\s*VRF +state *:'
+             ' +(?P<vrf_state>[a-zA-Z]+)$',
+        p16_1=r'^\s*VNID *:'
+               ' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$',
+        p16_2=r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$',
+        p16_3=r'^\s*Encap +type *: +(?P<etype>(\S+))$',
+        p16_4=r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$',
+        p16_5=r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$',
+        p16_6=r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$',
+        p16_7=r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$',
+        p16_8=r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$',
+        p17=r'^\s*Router-ID *:'
+             ' +(?P<router_id>[0-9\.]+)$',
+        p18=r'^\s*Configured +Router-ID *:'
+             ' +(?P<conf_router_id>[0-9\.]+)$',
+        p19=r'^\s*Confed-ID *:'
+             ' +(?P<confed_id>[0-9]+)$',
+        p20=r'^\s*Cluster-ID *:'
+             ' +(?P<cluster_id>[0-9\.]+)$',
+        p21=r'^\s*No. +of +configured +peers *:'
+             ' +(?P<num_conf_peers>[0-9]+)$',
+        p22=r'^\s*No. +of +pending +config +peers *:'
+             ' +(?P<num_pending_conf_peers>[0-9]+)$',
+        p23=r'^\s*No. +of +established +peers *:'
+             ' +(?P<num_established_peers>[0-9]+)$',
+        p24=r'^\s*VRF +RD *:'
+             ' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$',
+        p24_1=r'^\s*VRF +EVPN +RD *:'
+               ' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$',
+        p25=r'^\s*Information +for +address +family'
+             ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
+             ' +in +VRF +(?P<vrf>(\S+))$',
+        p26=r'^\s*Table +Id *: +(?P<table_id>(\S+))$',
+        p27=r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$',
+        p28=r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
+             ' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
+             ' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$',
+        p29=r'^\s*(?P<name>[a-zA-Z]+),'
+             ' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$',
+        p30=r'^\s*(?P<type>(Export|Import|EVPN Export|'
+             'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
+             ' *:(?: +(?P<rt_list>[0-9\:]+))?$',
+        p31=r'^\s*(?P<rt_list>((\w+)\:(\d+))(\s+(\w+)\:(\d+))?)$',
+        p32=r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$',
+        p32_1=r'^\s*Is +a +Route\-reflector$',
+        p33=r'^\s*Aggregate +label *:'
+             ' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$',
+        p33_1=r'^\s*Allocate-index *:'
+               ' +(?P<allocate_index>[a-zA-Z0-9\-]+)$',
+        p34=r'^\s*Import +default +limit *:'
+             ' +(?P<import_default_prefix_limit>[0-9]+)$',
+        p35=r'^\s*Import +default +prefix +count *:'
+             ' +(?P<import_default_prefix_count>[0-9]+)$',
+        p36=r'^\s*Import +default +map *:'
+             ' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$',
+        p37=r'^\s*Export +default +limit *:'
+             ' +(?P<export_default_prefix_limit>[0-9]+)$',
+        p38=r'^\s*Export +default +prefix +count *:'
+             ' +(?P<export_default_prefix_count>[0-9]+)$',
+        p39=r'^\s*Export +default +map *:'
+             ' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$',
+        p40=r'^\s*Nexthop +trigger-delay$',
+        p41=r'^\s*critical +(?P<critical>[0-9]+) +ms$',
+        p42=r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$',
+    )
+
     def cli(self, vrf='', output=None):
         if vrf:
             cmd = self.cli_command[1].format(vrf=vrf)
@@ -189,177 +297,74 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
         # Init vars
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*BGP +Process +ID *: +(?P<bgp_pid>[0-9]+)$')
-        p2 = re.compile(r'^\s*BGP Protocol Started, +reason: *:'
-                            ' +(?P<reason>[a-zA-Z\s]+)$')
-        p2_1 = re.compile(r'^\s*BGP +Performance +Mode: *:'
-                            ' +(?P<performance_mode>[a-zA-Z\s]+)$')
-        p3 = re.compile(r'^\s*BGP +Protocol +Tag *:'
-                            ' +(?P<bgp_tag>[a-zA-Z0-9]+)$')
-        p4 = re.compile(r'^\s*BGP +Protocol +State *:'
-                            ' +(?P<protocol_state>[a-zA-Z\(\)\s]+)$')
-        p4_1 = re.compile(r'^\s*BGP +Isolate +Mode *:'
-                            ' +(?P<isolate_mode>[a-zA-Z\s]+)$')
-        p4_3 = re.compile(r'^\s*BGP +MMODE *:'
-                            ' +(?P<mmode>[a-zA-Z\s]+)$')
-        p5 = re.compile(r'^\s*BGP +Memory +State *:'
-                            ' +(?P<memory_state>[\w\s]+)$')
-        p5_1 = re.compile(r'^\s*BGP +asformat *:'
-                            ' +(?P<asformat>[a-zA-Z\s]+)$')
-        p5_2 = re.compile(r'^\s*Segment +Routing +Global +Block *:'
-                            ' +(?P<segment>[0-9\-]+)$')
-        p6 = re.compile(r'^\s*Number +of +attribute +entries *:'
-                            ' +(?P<num_attr_entries>[0-9]+)$')
-        p7 = re.compile(r'^\s*HWM +of +attribute +entries *:'
-                            ' +(?P<hwm_attr_entries>[0-9]+)$')
-        p8 = re.compile(r'^\s*Bytes +used +by +entries *:'
-                            ' +(?P<bytes_used>[0-9]+)$')
-        p9 = re.compile(r'^\s*Entries +pending +delete *:'
-                            ' +(?P<entries_pending_delete>[0-9]+)$')
-        p10 = re.compile(r'^\s*HWM +of +entries +pending +delete *:'
-                            ' +(?P<hwm_entries_pending_delete>[0-9]+)$')
-        p11 = re.compile(r'^\s*BGP +paths +per +attribute +HWM *:'
-                            ' +(?P<bgp_paths_per_hwm_attr>[0-9]+)$')
-        p12 = re.compile(r'^\s*BGP +AS +path +entries *:'
-                            ' +(?P<bgp_as_path_entries>[0-9]+)$')
-        p13 = re.compile(r'^\s*Bytes +used +by +AS +path +entries *:'
-                            ' +(?P<bytes_used_as_path_entries>[0-9]+)$')
-        p14 = re.compile(r'^\s*BGP +Information +for +VRF'
-                            ' +(?P<vrf_name>(\S+))$')
-        p15 = re.compile(r'^\s*VRF +Id *:'
-                            ' +(?P<vrf_id>[a-zA-Z0-9]+)$')
-        p16 = re.compile(r'^\s*VRF +state *:'
-                            ' +(?P<vrf_state>[a-zA-Z]+)$')
-        p16_1 = re.compile(r'^\s*VNID *:'
-                            ' +(?P<vnid>[a-zA-Z0-9]+)(?: +\((\S+)\))?$')
-        p16_2 = re.compile(r'^\s*Topo +Id *: +(?P<topo_id>(\d+))$')
-        p16_3 = re.compile(r'^\s*Encap +type *: +(?P<etype>(\S+))$')
-        p16_4 = re.compile(r'^\s*VTEP +IP *: +(?P<vtep_ip>(\S+))$')
-        p16_5 = re.compile(r'^\s*VTEP +Virtual +IP *: +(?P<vtep_vip>(\S+))$')
-        p16_6 = re.compile(r'^\s*VTEP +VIP-R *: +(?P<vipr>(\S+))$')
-        p16_7 = re.compile(r'^\s*Router-MAC *: +(?P<router_mac>(\S+))$')
-        p16_8 = re.compile(r'^\s*VIP +Derived +MAC *: +(?P<vipd_mac>(\S+))$')
-        p17 = re.compile(r'^\s*Router-ID *:'
-                            ' +(?P<router_id>[0-9\.]+)$')
-        p18 = re.compile(r'^\s*Configured +Router-ID *:'
-                            ' +(?P<conf_router_id>[0-9\.]+)$')
-        p19 = re.compile(r'^\s*Confed-ID *:'
-                            ' +(?P<confed_id>[0-9]+)$')
-        p20 = re.compile(r'^\s*Cluster-ID *:'
-                            ' +(?P<cluster_id>[0-9\.]+)$')
-        p21 = re.compile(r'^\s*No. +of +configured +peers *:'
-                            ' +(?P<num_conf_peers>[0-9]+)$')
-        p22 = re.compile(r'^\s*No. +of +pending +config +peers *:'
-                            ' +(?P<num_pending_conf_peers>[0-9]+)$')
-        p23 = re.compile(r'^\s*No. +of +established +peers *:'
-                            ' +(?P<num_established_peers>[0-9]+)$')
-        p24 = re.compile(r'^\s*VRF +RD *:'
-                            ' +(?P<vrf_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p24_1 = re.compile(r'^\s*VRF +EVPN +RD *:'
-                            ' +(?P<vrf_evpn_rd>[a-zA-Z0-9\:\.\s]+)$')
-        p25 = re.compile(r'^\s*Information +for +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)'
-                            ' +in +VRF +(?P<vrf>(\S+))$')
-        p26 = re.compile(r'^\s*Table +Id *: +(?P<table_id>(\S+))$')
-        p27 = re.compile(r'^\s*Table +state *: +(?P<table_state>[a-zA-Z]+)$')
-        p28 = re.compile(r'^\s*(?P<peers>[0-9]+) +(?P<active_peers>[0-9]+)'
-                            ' +(?P<routes>[0-9]+) +(?P<paths>[0-9]+)'
-                            ' +(?P<networks>[0-9]+) +(?P<aggregates>[0-9]+)$')
-        p29 = re.compile(r'^\s*(?P<name>[a-zA-Z]+),'
-                            ' +route-map +(?P<route_map>[a-zA-Z0-9\-\_]+)$')
-        p30 = re.compile(r'^\s*(?P<type>(Export|Import|EVPN Export|'
-                            'EVPN Import|MVPN Export|MVPN Import)) +RT +list'
-                            ' *:(?: +(?P<rt_list>[0-9\:]+))?$')
-        p31 = re.compile(r'^\s*(?P<rt_list>((\w+)\:(\d+))(\s+(\w+)\:(\d+))?)$')
-        p32 = re.compile(r'^\s*Label +mode *: +(?P<label_mode>[a-zA-Z\-]+)$')
-        p32_1 = re.compile(r'^\s*Is +a +Route\-reflector$')
-        p33 = re.compile(r'^\s*Aggregate +label *:'
-                            ' +(?P<aggregate_label>[a-zA-Z0-9\-]+)$')
-        p33_1 = re.compile(r'^\s*Allocate-index *:'
-                           ' +(?P<allocate_index>[a-zA-Z0-9\-]+)$')
-        p34 = re.compile(r'^\s*Import +default +limit *:'
-                            ' +(?P<import_default_prefix_limit>[0-9]+)$')
-        p35 = re.compile(r'^\s*Import +default +prefix +count *:'
-                            ' +(?P<import_default_prefix_count>[0-9]+)$')
-        p36 = re.compile(r'^\s*Import +default +map *:'
-                            ' +(?P<import_default_map>[a-zA-Z0-9\_\-]+)$')
-        p37 = re.compile(r'^\s*Export +default +limit *:'
-                            ' +(?P<export_default_prefix_limit>[0-9]+)$')
-        p38 = re.compile(r'^\s*Export +default +prefix +count *:'
-                            ' +(?P<export_default_prefix_count>[0-9]+)$')
-        p39 = re.compile(r'^\s*Export +default +map *:'
-                            ' +(?P<export_default_map>[a-zA-Z0-9\_\-]+)$')
-        p40 = re.compile(r'^\s*Nexthop +trigger-delay$')
-        p41 = re.compile(r'^\s*critical +(?P<critical>[0-9]+) +ms$')
-        p42 = re.compile(r'^\s*non-critical +(?P<non_critical>[0-9]+) +ms$')
-
+        p = ShowBgpProcessVrfAll.patterns
 
         for line in out.splitlines():
             line = line.replace('\t', '    ')
             line = line.rstrip()
 
             # BGP Process ID                 : 29474
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 parsed_dict['bgp_pid'] = int(m.groupdict()['bgp_pid'])
                 continue
 
             # BGP Protocol Started, reason:  : configuration
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 parsed_dict['bgp_protocol_started_reason'] = \
                     str(m.groupdict()['reason']).lower()
                 continue
 
             # BGP Performance Mode:          : No
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 parsed_dict['bgp_performance_mode'] = \
                     str(m.groupdict()['performance_mode'])
                 continue
 
             # BGP Protocol Tag               : 100
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 parsed_dict['bgp_tag'] = str(m.groupdict()['bgp_tag']).lower()
                 continue
 
             # BGP Protocol State             : Running
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 parsed_dict['bgp_protocol_state'] = \
                     str(m.groupdict()['protocol_state']).lower()
                 continue
 
             # BGP Isolate Mode               : No
-            m = p4_1.match(line)
+            m = p.p4_1.match(line)
             if m:
                 parsed_dict['bgp_isolate_mode'] = \
                     str(m.groupdict()['isolate_mode'])
                 continue
 
             # BGP MMODE                      : Initialized
-            m = p4_3.match(line)
+            m = p.p4_3.match(line)
             if m:
                 parsed_dict['bgp_mmode'] = str(m.groupdict()['mmode'])
                 continue
 
             # BGP Memory State               : OK
             # BGP Memory State               : Severe Alert
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 parsed_dict['bgp_memory_state'] = \
                     str(m.groupdict()['memory_state']).lower()
                 continue
 
             # BGP asformat                   : asplain
-            m = p5_1.match(line)
+            m = p.p5_1.match(line)
             if m:
                 parsed_dict['bgp_asformat'] = str(m.groupdict()['asformat'])
                 continue
 
             # Segment Routing Global Block   : 10000-25000
-            m = p5_2.match(line)
+            m = p.p5_2.match(line)
             if m:
                 parsed_dict['segment_routing_global_block'] = \
                     str(m.groupdict()['segment'])
@@ -367,62 +372,62 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             # BGP attributes information
             # Number of attribute entries    : 4
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 parsed_dict['num_attr_entries'] = \
                     int(m.groupdict()['num_attr_entries'])
                 continue
 
             # HWM of attribute entries       : 5
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 parsed_dict['hwm_attr_entries'] = \
                     int(m.groupdict()['hwm_attr_entries'])
                 continue
 
             # Bytes used by entries          : 368
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 parsed_dict['bytes_used'] = int(m.groupdict()['bytes_used'])
                 continue
 
             # Entries pending delete         : 0
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 parsed_dict['entries_pending_delete'] = \
                     int(m.groupdict()['entries_pending_delete'])
                 continue
 
             # HWM of entries pending delete  : 0
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 parsed_dict['hwm_entries_pending_delete'] = \
                     int(m.groupdict()['hwm_entries_pending_delete'])
                 continue
 
             # BGP paths per attribute HWM    : 1
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 parsed_dict['bgp_paths_per_hwm_attr'] = \
                     int(m.groupdict()['bgp_paths_per_hwm_attr'])
                 continue
 
             # BGP AS path entries            : 0
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 parsed_dict['bgp_as_path_entries'] = \
                     int(m.groupdict()['bgp_as_path_entries'])
                 continue
 
             # Bytes used by AS path entries  : 0
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 parsed_dict['bytes_used_as_path_entries'] = \
                     int(m.groupdict()['bytes_used_as_path_entries'])
                 continue
 
             # BGP Information for VRF VRF1
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 if 'vrf' not in parsed_dict:
                     parsed_dict['vrf'] = {}
@@ -432,118 +437,118 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                     continue
 
             # VRF Id                         : 3
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_id'] = \
                     str(m.groupdict()['vrf_id'])
                 continue
 
             # VRF state                      : UP
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_state'] = \
                     str(m.groupdict()['vrf_state']).lower()
                 continue
 
             # VNID                           : 9105 (valid)
-            m = p16_1.match(line)
+            m = p.p16_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vnid'] = m.groupdict()['vnid']
                 continue
 
             # Topo Id                        : 1005
-            m = p16_2.match(line)
+            m = p.p16_2.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['topo_id'] = \
                     m.groupdict()['topo_id']
                 continue
 
             # Encap type                     : VXLAN
-            m = p16_3.match(line)
+            m = p.p16_3.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['encap_type'] = \
                     m.groupdict()['etype']
                 continue
 
             # VTEP IP                        : 10.49.1.1
-            m = p16_4.match(line)
+            m = p.p16_4.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vtep_ip'] = \
                     m.groupdict()['vtep_ip']
                 continue
 
             # VTEP Virtual IP                : 10.49.2.1
-            m = p16_5.match(line)
+            m = p.p16_5.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vtep_virtual_ip'] = \
                     m.groupdict()['vtep_vip']
                 continue
 
             # VTEP VIP-R                     : 10.49.2.1
-            m = p16_6.match(line)
+            m = p.p16_6.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vtep_vip_r'] = \
                     m.groupdict()['vipr']
                 continue
 
             # Router-MAC                     : 000c.29ff.a329
-            m = p16_7.match(line)
+            m = p.p16_7.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['router_mac'] = \
                     m.groupdict()['router_mac']
                 continue
 
             # VIP Derived MAC                : 000c.29ff.a329
-            m = p16_8.match(line)
+            m = p.p16_8.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vip_derived_mac'] = \
                     m.groupdict()['vipd_mac']
                 continue
 
             # Router-ID                      : 10.229.11.11
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['router_id'] = \
                     str(m.groupdict()['router_id'])
                 continue
 
             # Configured Router-ID           : 0.0.0.0
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['conf_router_id'] = \
                     str(m.groupdict()['conf_router_id'])
                 continue
 
             # Confed-ID                      : 0
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['confed_id'] = \
                     int(m.groupdict()['confed_id'])
                 continue
 
             # Cluster-ID                     : 0.0.0.0
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['cluster_id'] = \
                     str(m.groupdict()['cluster_id'])
                 continue
 
             # No. of configured peers        : 1
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['num_conf_peers'] = \
                     int(m.groupdict()['num_conf_peers'])
                 continue
             
             # No. of pending config peers    : 0
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['num_pending_conf_peers'] = \
                     int(m.groupdict()['num_pending_conf_peers'])
                 continue
             
             # No. of established peers       : 0
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['num_established_peers'] = \
                     int(m.groupdict()['num_established_peers'])
@@ -551,7 +556,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             
             # VRF RD                         : 100:100
             # VRF RD                         : 10.49.1.0:4
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_rd'] = \
                     str(m.groupdict()['vrf_rd']).lower()
@@ -559,14 +564,14 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             # VRF EVPN RD                    : 100:100
             # VRF EVPN RD                    : 10.49.1.0:4
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['vrf_evpn_rd'] = \
                     str(m.groupdict()['vrf_evpn_rd']).lower()
                 continue
 
             #     Information for address family IPv4 Unicast in VRF VRF1
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 if 'address_family' not in parsed_dict['vrf'][vrf_name]:
                     parsed_dict['vrf'][vrf_name]['address_family'] = {}
@@ -586,7 +591,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             #     Table Id                   : 10
             #     Table Id                   : 0x80000001
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 table_id = str(m.groupdict()['table_id'])
                 if '0x' in table_id:
@@ -598,7 +603,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                 continue
             
             #     Table state                : UP
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['table_state'] = str(m.groupdict()['table_state']).lower()
@@ -606,7 +611,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
             #     Peers      Active-peers    Routes     Paths      Networks   Aggregates
             #     1          0               5          5          1          2      
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 if 'peers' not in parsed_dict['vrf'][vrf_name]\
                     ['address_family'][address_family]:
@@ -640,7 +645,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             #         direct, route-map genie_redistribution
             #         static, route-map genie_redistribution
             #         eigrp, route-map test-map
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 if 'redistribution' not in parsed_dict['vrf'][vrf_name]\
                     ['address_family'][address_family]:
@@ -666,7 +671,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             # MVPN Import RT list:
             # Export RT list: 100:1
             # Import RT list: 100:1
-            m = p30.match(line)
+            m = p.p30.match(line)
             if m:
                 rt_list_type = str(m.groupdict()['type']).lower()
                 rt_list_type = rt_list_type.replace(' ', '_')
@@ -682,7 +687,7 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             # 400:400
             # ASnumber:100 ASnumber:91100
             # ASnumber:91100
-            m = p31.match(line)
+            m = p.p31.match(line)
             if m:
                 values = values + ' ' + m.groupdict()['rt_list']
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
@@ -690,35 +695,35 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                 continue
 
             #     Label mode: per-prefix
-            m = p32.match(line)
+            m = p.p32.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['label_mode'] = str(m.groupdict()['label_mode'])
                 continue
 
             #     Is a Route-reflector
-            m = p32_1.match(line)
+            m = p.p32_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['route_reflector'] = True
                 continue
 
             #     Aggregate label: 492287
-            m = p33.match(line)
+            m = p.p33.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['aggregate_label'] = str(m.groupdict()['aggregate_label'])
                 continue
 
             #     Allocate-index:
-            m = p33_1.match(line)
+            m = p.p33_1.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family] \
                     ['allocate_index'] = str(m.groupdict()['allocate_index'])
                 continue
 
             # Import default limit       : 1000
-            m = p34.match(line)
+            m = p.p34.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['import_default_prefix_limit'] = \
@@ -726,42 +731,42 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                 continue
 
             # Import default prefix count : 3
-            m = p35.match(line)
+            m = p.p35.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['import_default_prefix_count'] = \
                         int(m.groupdict()['import_default_prefix_count'])
 
             # Import default map         : PERMIT_ALL_RM
-            m = p36.match(line)
+            m = p.p36.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['import_default_map'] = \
                         str(m.groupdict()['import_default_map'])
 
             # Export default limit       : 1000
-            m = p37.match(line)
+            m = p.p37.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['export_default_prefix_limit'] = \
                         int(m.groupdict()['export_default_prefix_limit'])
 
             # Export default prefix count : 2
-            m = p38.match(line)
+            m = p.p38.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['export_default_prefix_count'] = \
                         int(m.groupdict()['export_default_prefix_count'])
 
             # Export default map         : PERMIT_ALL_RM
-            m = p39.match(line)
+            m = p.p39.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family'][address_family]\
                     ['export_default_map'] = \
                         str(m.groupdict()['export_default_map'])
 
             # Nexthop trigger-delay
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 if 'next_hop_trigger_delay' not in parsed_dict['vrf'][vrf_name]\
                     ['address_family'][address_family]:
@@ -769,14 +774,14 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
                         [address_family]['next_hop_trigger_delay'] = {}
 
             # critical 3000 ms
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family']\
                     [address_family]['next_hop_trigger_delay']['critical'] = \
                     int(m.groupdict()['critical'])
 
             # non-critical 3000 ms
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 parsed_dict['vrf'][vrf_name]['address_family']\
                     [address_family]['next_hop_trigger_delay']['non_critical'] = \
@@ -784,6 +789,49 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
 
         return parsed_dict
 
+    # (tag, key, conversion) of the fields of 'show bgp process | xml'
+    xml_process_keys = [
+        ('processid', 'bgp_pid', int),
+        ('protocolstartedreason', 'bgp_protocol_started_reason', str),
+        ('protocoltag', 'bgp_tag', str),
+        ('protocolstate', 'bgp_protocol_state', str.lower),
+        ('isolatemode', 'bgp_isolate_mode', str),
+        ('mmode', 'bgp_mmode', str),
+        ('memorystate', 'bgp_memory_state', str.lower),
+        ('asformat', 'bgp_asformat', str),
+        ('attributeentries', 'num_attr_entries', int),
+        ('hwmattributeentries', 'hwm_attr_entries', int),
+        ('bytesused', 'bytes_used', int),
+        ('entriespendingdelete', 'entries_pending_delete', int),
+        ('hwmentriespendingdelete', 'hwm_entries_pending_delete', int),
+        ('pathsperattribute', 'bgp_paths_per_hwm_attr', int),
+        ('aspathentries', 'bgp_as_path_entries', int),
+        ('aspathbytes', 'bytes_used_as_path_entries', int),
+    ]
+    xml_vrf_keys = [
+        ('vrf-id', 'vrf_id', str),
+        ('vrf-state', 'vrf_state', str.lower),
+        ('vrf-router-id', 'router_id', str),
+        ('vrf-cfgd-id', 'conf_router_id', str),
+        ('vrf-confed-id', 'confed_id', int),
+        ('vrf-cluster-id', 'cluster_id', str),
+        ('vrf-peers', 'num_conf_peers', int),
+        ('vrf-pending-peers', 'num_pending_conf_peers', int),
+        ('vrf-est-peers', 'num_established_peers', int),
+        ('vrf-rd', 'vrf_rd', str),
+    ]
+    xml_af_keys = [
+        ('af-state', 'table_state', str.lower),
+        ('af-aggregate-label', 'aggregate_label', str),
+        ('af-label-mode', 'label_mode', str),
+        ('importdefault_map', 'import_default_map', str),
+        ('importdefault_prefixlimit', 'import_default_prefix_limit', int),
+        ('importdefault_prefixcount', 'import_default_prefix_count', int),
+        ('exportdefault_map', 'export_default_map', str),
+        ('exportdefault_prefixlimit', 'export_default_prefix_limit', int),
+        ('exportdefault_prefixcount', 'export_default_prefix_count', int),
+    ]
+
     def xml(self, vrf='', output=None):
         if output is None:
             if vrf:
@@ -794,268 +842,96 @@ class ShowBgpProcessVrfAll(ShowBgpProcessVrfAllSchema):
             out = output
 
         etree_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        xml_output = ET.fromstring(out)
-
-        for item in xml_output:
-            for data in item:
-                for show in data:
-                    for bgp in show:
-                        for __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf in bgp:
-                            for process in __XML__OPT_Cmd_show_ip_bgp_session_cmd_vrf:
-                                for __XML__OPT_Cmd_show_bgp_process_cmd_vrf in process:
-                                    for __XML__OPT_Cmd_show_bgp_process_cmd___readonly__ in __XML__OPT_Cmd_show_bgp_process_cmd_vrf:
-                                        for key in __XML__OPT_Cmd_show_bgp_process_cmd___readonly__:
-                                            # Get key text
-                                            text = key.tag[key.tag.find('}')+1:]
-                                            # bgp_pid
-                                            if text == 'processid':
-                                                etree_dict['bgp_pid'] = int(key.text)
-                                            # bgp_protocol_started_reason
-                                            if text == 'protocolstartedreason':
-                                                etree_dict['bgp_protocol_started_reason'] = key.text
-                                            # bgp_tag
-                                            if text == 'protocoltag':
-                                                etree_dict['bgp_tag'] = key.text
-                                            # bgp_protocol_state
-                                            if text == 'protocolstate':
-                                                etree_dict['bgp_protocol_state'] = str(key.text).lower()
-                                            # bgp_isolate_mode
-                                            if text == 'isolatemode':
-                                                etree_dict['bgp_isolate_mode'] = key.text
-                                            # bgp_mmode
-                                            if text == 'mmode':
-                                                etree_dict['bgp_mmode'] = key.text
-                                            # bgp_memory_state
-                                            if text == 'memorystate':
-                                                etree_dict['bgp_memory_state'] = str(key.text).lower()
-                                            # bgp_performance_mode
-                                            if text == 'forwardingstatesaved':
-                                                if key.text == 'false':
-                                                    etree_dict['bgp_performance_mode'] = 'No'
-                                                else:
-                                                    etree_dict['bgp_performance_mode'] = 'Yes'
-                                            # bgp_asformat
-                                            if text == 'asformat':
-                                                etree_dict['bgp_asformat'] = key.text
-                                            if text == 'srgbmin':
-                                                srgbin = key.text
-                                            if text == 'srgbmax':
-                                                srgmax = key.text
-                                                try:
-                                                    etree_dict['segment_routing_global_block'] = srgbin + '-' + srgmax
-                                                except Exception:
-                                                    pass
-                                            # num_attr_entries
-                                            if text == 'attributeentries':
-                                                etree_dict['num_attr_entries'] = int(key.text)
-                                            # hwm_attr_entries
-                                            if text == 'hwmattributeentries':
-                                                etree_dict['hwm_attr_entries'] = int(key.text)
-                                            # bytes_used
-                                            if text == 'bytesused':
-                                                etree_dict['bytes_used'] = int(key.text)
-                                            # entries_pending_delete
-                                            if text == 'entriespendingdelete':
-                                                etree_dict['entries_pending_delete'] = int(key.text)
-                                            # hwm_entries_pending_delete
-                                            if text == 'hwmentriespendingdelete':
-                                                etree_dict['hwm_entries_pending_delete'] = int(key.text)
-                                            # bgp_paths_per_hwm_attr
-                                            if text == 'pathsperattribute':
-                                                etree_dict['bgp_paths_per_hwm_attr'] = int(key.text)
-                                            # bgp_as_path_entries
-                                            if text == 'aspathentries':
-                                                etree_dict['bgp_as_path_entries'] = int(key.text)
-                                            # bytes_used_as_path_entries
-                                            if text == 'aspathbytes':
-                                                etree_dict['bytes_used_as_path_entries'] = int(key.text)
-                                            
-                                            if text == 'TABLE_vrf':
-                                                for table_vrf in key:
-                                                    for row_vrf in table_vrf:
-                                                        vrf_tag = row_vrf.tag[row_vrf.tag.find('}')+1:]
-
-                                                        # vrf
-                                                        #   vrf_name
-                                                        if vrf_tag == 'vrf-name-out':
-                                                            vrf_name = row_vrf.text
-                                                            if 'vrf' not in etree_dict:
-                                                                etree_dict['vrf'] = {}
-                                                            if vrf_name not in etree_dict['vrf']:
-                                                                etree_dict['vrf'][vrf_name] = {}
-                                                                vrf_dict = etree_dict['vrf'][vrf_name]
-                                                        # vrf_id
-                                                        if vrf_tag == 'vrf-id':
-                                                            vrf_dict['vrf_id'] = row_vrf.text
-                                                        # vrf_state
-                                                        if vrf_tag == 'vrf-state':
-                                                            vrf_dict['vrf_state'] = str(row_vrf.text).lower()
-                                                        # router_id
-                                                        if vrf_tag == 'vrf-router-id':
-                                                            vrf_dict['router_id'] = row_vrf.text
-                                                        # conf_router_id
-                                                        if vrf_tag == 'vrf-cfgd-id':
-                                                            vrf_dict['conf_router_id'] = row_vrf.text
-                                                        # confed_id
-                                                        if vrf_tag == 'vrf-confed-id':
-                                                            vrf_dict['confed_id'] = int(row_vrf.text)
-                                                        # cluster_id
-                                                        if vrf_tag == 'vrf-cluster-id':
-                                                           vrf_dict['cluster_id'] = row_vrf.text
-                                                        # num_conf_peers
-                                                        if vrf_tag == 'vrf-peers':
-                                                            vrf_dict['num_conf_peers'] = int(row_vrf.text)
-                                                        # num_pending_conf_peers
-                                                        if vrf_tag == 'vrf-pending-peers':
-                                                            vrf_dict['num_pending_conf_peers'] = int(row_vrf.text)
-                                                        # num_established_peers
-                                                        if vrf_tag == 'vrf-est-peers':
-                                                            vrf_dict['num_established_peers'] = int(row_vrf.text)
-                                                            vrf_dict['vrf_rd'] = 'not configured'
-                                                        # vrf_rd
-                                                        if vrf_tag == 'vrf-rd':
-                                                            vrf_dict['vrf_rd'] = row_vrf.text
-
-                                                        if vrf_tag == 'TABLE_af':
-                                                            for table_af in row_vrf:
-                                                                for row_af in table_af:
-                                                                    af_tag = row_af.tag[row_af.tag.find('}')+1:]
-
-                                                                    # address_family
-                                                                    #   address_family_name
-                                                                    if af_tag == 'af-name':
-                                                                        address_family_name = str(row_af.text).lower()
-                                                                        if 'address_family' not in etree_dict['vrf'][vrf_name]:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'] = {}
-                                                                        if address_family_name not in etree_dict['vrf'][vrf_name]['address_family']:
-                                                                            etree_dict['vrf'][vrf_name]['address_family'][address_family_name] = {}
-                                                                            af_dict = etree_dict['vrf'][vrf_name]['address_family'][address_family_name]
-                                                                        # Initialize empty lists
-                                                                        export_rt_list = ''
-                                                                        import_rt_list = ''
-                                                                    # table_id
-                                                                    if af_tag == 'af-table-id':
-                                                                        table_id = str(row_af.text)
-                                                                        if '0x' in table_id:
-                                                                            af_dict['table_id'] = table_id
-                                                                        else:
-                                                                            af_dict['table_id'] = '0x' + table_id
-                                                                    # table_state
-                                                                    if af_tag == 'af-state':
-                                                                        af_dict['table_state'] = str(row_af.text).lower()
-                                                                    # peers
-                                                                    if af_tag == 'af-num-peers':
-                                                                        peers = int(row_af.text)
-                                                                        if 'peers' not in af_dict:
-                                                                            af_dict['peers'] = {}
-                                                                        if peers not in af_dict['peers']:
-                                                                            af_dict['peers'][peers] = {}
-                                                                    # active_peers
-                                                                    if af_tag == 'af-num-active-peers':
-                                                                        af_dict['peers'][peers]['active_peers'] = int(row_af.text)
-                                                                    # routes
-                                                                    if af_tag == 'af-peer-routes':
-                                                                        af_dict['peers'][peers]['routes'] = int(row_af.text)
-                                                                    # paths
-                                                                    if af_tag == 'af-peer-paths':
-                                                                        af_dict['peers'][peers]['paths'] = int(row_af.text)
-                                                                    # networks
-                                                                    if af_tag == 'af-peer-networks':
-                                                                        af_dict['peers'][peers]['networks'] = int(row_af.text)
-                                                                    # aggregates
-                                                                    if af_tag == 'af-peer-aggregates':
-                                                                        af_dict['peers'][peers]['aggregates'] = int(row_af.text)
-                                                                    # route_reflector
-                                                                    if af_tag == 'af-rr':
-                                                                        if row_af.text == 'true':
-                                                                            af_dict['route_reflector'] = True
-                                                                    # next_hop_trigger_delay
-                                                                    #   critical
-                                                                    if af_tag == 'nexthop-trigger-delay-critical':
-                                                                        if 'next_hop_trigger_delay' not in af_dict:
-                                                                            af_dict['next_hop_trigger_delay'] = {}
-                                                                        af_dict['next_hop_trigger_delay']['critical'] = int(row_af.text)
-                                                                    # next_hop_trigger_delay
-                                                                    #   non_critical
-                                                                    if af_tag == 'nexthop-trigger-delay-non-critical':
-                                                                        af_dict['next_hop_trigger_delay']['non_critical'] = int(row_af.text)
-                                                                    # aggregate_label
-                                                                    if af_tag == 'af-aggregate-label':
-                                                                        af_dict['aggregate_label'] = row_af.text
-                                                                    # label_mode
-                                                                    if af_tag == 'af-label-mode':
-                                                                        af_dict['label_mode'] = row_af.text
-                                                                    # import_default_map
-                                                                    if af_tag == 'importdefault_map':
-                                                                        af_dict['import_default_map'] = row_af.text
-                                                                    # import_default_prefix_limit
-                                                                    if af_tag == 'importdefault_prefixlimit':
-                                                                        af_dict['import_default_prefix_limit'] = int(row_af.text)
-                                                                    # import_default_prefix_count
-                                                                    if af_tag == 'importdefault_prefixcount':
-                                                                        af_dict['import_default_prefix_count'] = int(row_af.text)
-                                                                    # export_default_map
-                                                                    if af_tag == 'exportdefault_map':
-                                                                        af_dict['export_default_map'] = row_af.text
-                                                                    # export_default_prefix_limit
-                                                                    if af_tag == 'exportdefault_prefixlimit':
-                                                                        af_dict['export_default_prefix_limit'] = int(row_af.text)
-                                                                    # export_default_prefix_count
-                                                                    if af_tag == 'exportdefault_prefixcount':
-                                                                        af_dict['export_default_prefix_count'] = int(row_af.text)
-
-                                                                    # TABLE_redist
-                                                                    #   ROW_redist
-                                                                    if af_tag == 'TABLE_redist':
-                                                                        for table_redist in row_af:
-                                                                            for row_redist in table_redist:
-                                                                                row_redist_tag = row_redist.tag[row_redist.tag.find('}')+1:]
-                                                                                # protocol
-                                                                                if row_redist_tag == 'protocol':
-                                                                                    protocol = row_redist.text
-                                                                                    if 'redistribution' not in af_dict:
-                                                                                        af_dict['redistribution'] = {}
-                                                                                    if protocol not in af_dict['redistribution']:
-                                                                                        af_dict['redistribution'][protocol] = {}
-                                                                                # route_map
-                                                                                if row_redist_tag == 'route-map':
-                                                                                    af_dict['redistribution'][protocol]['route_map'] = row_redist.text
-
-                                                                    # TABLE_evpn_export_rt
-                                                                    #   ROW_evpn_export_rt
-                                                                    if af_tag == 'TABLE_evpn_export_rt':
-                                                                        for table_evpn_export in row_af:
-                                                                            for row_export in table_evpn_export:
-                                                                                row_export_tag = row_export.tag[row_export.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_export_tag == 'evpn-export-rt':
-                                                                                    export_rt_list = str(export_rt_list + ' ' + row_export.text).strip()
-                                                                                    af_dict['export_rt_list'] = export_rt_list
-                                                                    # TABLE_evpn_import_rt
-                                                                    #   ROW_evpn_import_rt
-                                                                    if af_tag == 'TABLE_evpn_import_rt':
-                                                                        for table_evpn_import in row_af:
-                                                                            for row_import in table_evpn_import:
-                                                                                row_import_tag = row_import.tag[row_import.tag.find('}')+1:]
-                                                                                # export_rt_list
-                                                                                if row_import_tag == 'evpn-import-rt':
-                                                                                    import_rt_list = str(import_rt_list + ' ' + row_import.text).strip()
-                                                                                    af_dict['import_rt_list'] = import_rt_list
-
-                                                                    # parsed all tags
-                                                                    continue
-                                                                                    
+
+        for row in iter_rows(out, ['__readonly__',
+                                   'TABLE_vrf/ROW_vrf',
+                                   'TABLE_af/ROW_af',
+                                   'TABLE_redist/ROW_redist',
+                                   'TABLE_evpn_export_rt/ROW_evpn_export_rt',
+                                   'TABLE_evpn_import_rt/ROW_evpn_import_rt']):
+            if row.path == '__readonly__':
+                for tag, key, convert in self.xml_process_keys:
+                    if row.get(tag) is not None:
+                        etree_dict[key] = convert(row[tag])
+                if 'forwardingstatesaved' in row:
+                    etree_dict['bgp_performance_mode'] = \
+                        'No' if row['forwardingstatesaved'] == 'false' else 'Yes'
+                if row.get('srgbmin') and row.get('srgbmax'):
+                    etree_dict['segment_routing_global_block'] = \
+                        row['srgbmin'] + '-' + row['srgbmax']
+                continue
+
+            if row.path == 'TABLE_vrf/ROW_vrf':
+                vrf_dict = self._xml_vrf(etree_dict, row)
+                for tag, key, convert in self.xml_vrf_keys:
+                    if row.get(tag) is not None:
+                        vrf_dict[key] = convert(row[tag])
+                if 'vrf-est-peers' in row and 'vrf-rd' not in row:
+                    vrf_dict['vrf_rd'] = 'not configured'
+                continue
+
+            if row.path == 'TABLE_af/ROW_af':
+                af_dict = self._xml_af(etree_dict, row)
+                for tag, key, convert in self.xml_af_keys:
+                    if row.get(tag) is not None:
+                        af_dict[key] = convert(row[tag])
+                if row.get('af-table-id') is not None:
+                    table_id = row['af-table-id']
+                    af_dict['table_id'] = table_id if '0x' in table_id \
+                        else '0x' + table_id
+                if 'af-num-peers' in row:
+                    peers_dict = af_dict.setdefault('peers', {}).setdefault(
+                        int(row['af-num-peers']), {})
+                    for tag, key in (('af-num-active-peers', 'active_peers'),
+                                     ('af-peer-routes', 'routes'),
+                                     ('af-peer-paths', 'paths'),
+                                     ('af-peer-networks', 'networks'),
+                                     ('af-peer-aggregates', 'aggregates')):
+                        if tag in row:
+                            peers_dict[key] = int(row[tag])
+                if row.get('af-rr') == 'true':
+                    af_dict['route_reflector'] = True
+                if 'nexthop-trigger-delay-critical' in row:
+                    delay_dict = af_dict.setdefault('next_hop_trigger_delay', {})
+                    delay_dict['critical'] = \
+                        int(row['nexthop-trigger-delay-critical'])
+                    if 'nexthop-trigger-delay-non-critical' in row:
+                        delay_dict['non_critical'] = \
+                            int(row['nexthop-trigger-delay-non-critical'])
+                continue
+
+            af_dict = self._xml_af(etree_dict, row.parent)
+            if row.path == 'TABLE_redist/ROW_redist':
+                protocol_dict = af_dict.setdefault('redistribution', {})\
+                    .setdefault(row.get('protocol'), {})
+                if 'route-map' in row:
+                    protocol_dict['route_map'] = row['route-map']
+            elif row.path == 'TABLE_evpn_export_rt/ROW_evpn_export_rt':
+                af_dict['export_rt_list'] = ' '.join(filter(None, [
+                    af_dict.get('export_rt_list'), row.get('evpn-export-rt')]))
+            else:
+                af_dict['import_rt_list'] = ' '.join(filter(None, [
+                    af_dict.get('import_rt_list'), row.get('evpn-import-rt')]))
+
         return etree_dict
 
-    def yang(self, vrf=''):
+    @staticmethod
+    def _xml_vrf(etree_dict, vrf_row):
+        return etree_dict.setdefault('vrf', {}).setdefault(
+            vrf_row['vrf-name-out'], {})
+
+    def _xml_af(self, etree_dict, af_row):
+        return self._xml_vrf(etree_dict, af_row.parent)\
+            .setdefault('address_family', {})\
+            .setdefault(str(af_row.get('af-name')).lower(), {})
+
+    def yang(self, vrf='', output=None):
         # Initialize empty dictionary
         map_dict = {}
 
         # Execute YANG 'get' operational state RPC and parse the XML
         bgpOC = BgpOpenconfigYang(self.device)
-        yang_dict = bgpOC.yang()
+        yang_dict = bgpOC.yang(output=output)
 
         # Map keys from yang_dict to map_dict
 
@@ -1128,6 +1004,30 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
     """
     cli_command = 'show running-config | inc peer-session'
 
+    patterns = Patterns(
+        p1=r'^\s*template +peer-session '
+            '+(?P<session_name>[a-zA-Z\-\_0-9]+)$',
+        r1=r'^\s*Shutdown$',
+        r2=r'^\s*Update +Source +-'
+            ' +(?P<update_source>[a-zA-Z0-9\:\s]+)$',
+        r3=r'^\s*Description +- +description *:'
+            ' +(?P<desc>[a-zA-Z\-]+)$',
+        r4=r'^\s*Password$',
+        r5=r'^\s*EBGP +Multihop +- +hop +limit *:'
+            ' +(?P<ebgp_multihop_limit>[0-9]+)$',
+        r6=r'^\s*Disable +Connectivity +Check$',
+        r7=r'^\s*Suppress +Capabilities$',
+        r8=r'^\s*Passive Only$',
+        r9=r'^\s*Timers +- +hold +time *:'
+            ' +(?P<holdtime>[0-9]+), keepalive *:'
+            ' +(?P<keepalive>[0-9]+)$',
+        r10=r'^\s*Remote AS$',
+        r11=r'^\s*Local AS$',
+        r12=r'^\s*Enable Bfd$',
+        r13=r'^\s*VRF +default *:'
+             ' +(?P<vrf_default>[0-9\.]+)$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -1138,34 +1038,14 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
         peer_sessions = []
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*template +peer-session '
-                    '+(?P<session_name>[a-zA-Z\-\_0-9]+)$')
-        r1 = re.compile(r'^\s*Shutdown$')
-        r2 = re.compile(r'^\s*Update +Source +-'
-                    ' +(?P<update_source>[a-zA-Z0-9\:\s]+)$')
-        r3 = re.compile(r'^\s*Description +- +description *:'
-                    ' +(?P<desc>[a-zA-Z\-]+)$')
-        r4 = re.compile(r'^\s*Password$')
-        r5 = re.compile(r'^\s*EBGP +Multihop +- +hop +limit *:'
-                    ' +(?P<ebgp_multihop_limit>[0-9]+)$')
-        r6 = re.compile(r'^\s*Disable +Connectivity +Check$')
-        r7 = re.compile(r'^\s*Suppress +Capabilities$')
-        r8 = re.compile(r'^\s*Passive Only$')
-        r9 = re.compile(r'^\s*Timers +- +hold +time *:'
-                    ' +(?P<holdtime>[0-9]+), keepalive *:'
-                    ' +(?P<keepalive>[0-9]+)$')
-        r10 = re.compile(r'^\s*Remote AS$')
-        r11 = re.compile(r'^\s*Local AS$')
-        r12 = re.compile(r'^\s*Enable Bfd$')
-        r13 = re.compile(r'^\s*VRF +default *:'
-                    ' +(?P<vrf_default>[0-9\.]+)$')
+        p = ShowBgpPeerSession.patterns
 
         for line in out.splitlines():
             line = line.rstrip()
 
             # template peer-session PEER-SESSION
             # template peer-session PS-1
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # Create top level key
                 if 'peer_session' not in parsed_dict:
@@ -1192,33 +1072,33 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
 
                     # Commands configured in this template:
                     # Shutdown
-                    m = r1.match(line)
+                    m = p.r1.match(line)
                     if m:
                         sub_dict['shutdown'] = True
                         continue
                   
                     # Update Source - interface: loopback0
-                    m = r2.match(line)
+                    m = p.r2.match(line)
                     if m:
                         sub_dict['update_source'] = \
                             str(m.groupdict()['update_source']).lower()
                         continue
                   
                     # Description - description: PEER-SESSION
-                    m = r3.match(line)
+                    m = p.r3.match(line)
                     if m:
                         sub_dict['description'] = \
                             str(m.groupdict()['desc'])
                         continue
                   
                     # Password
-                    m = r4.match(line)
+                    m = p.r4.match(line)
                     if m:
                         sub_dict['password'] = True
                         continue
                   
                     # EBGP Multihop - hop limit: 255
-                    m = r5.match(line)
+                    m = p.r5.match(line)
                     if m:
                         sub_dict['ebgp_multihop_enable'] = True
                         sub_dict['ebgp_multihop_limit'] = \
@@ -1226,44 +1106,44 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
                         continue
                   
                     # Disable Connectivity Check
-                    m = r6.match(line)
+                    m = p.r6.match(line)
                     if m:
                         sub_dict['disable_connectivity_check'] = True
                         continue
                     
                     # Suppress Capabilities
-                    m = r7.match(line)
+                    m = p.r7.match(line)
                     if m:
                         sub_dict['suppress_capabilities'] = True
                         continue
                   
                     # Passive Only
-                    m = r8.match(line)
+                    m = p.r8.match(line)
                     if m:
                         sub_dict['transport_connection_mode'] = 'Passive'
                         continue
                   
                     # Timers - hold time: 111, keepalive: 222
-                    m = r9.match(line)
+                    m = p.r9.match(line)
                     if m:
                         sub_dict['holdtime'] = int(m.groupdict()['holdtime'])
                         sub_dict['keepalive'] = int(m.groupdict()['keepalive'])
                         continue
                     
                     # Remote AS
-                    m = r10.match(line)
+                    m = p.r10.match(line)
                     if m:
                         sub_dict['remote_as'] = True
                         continue
                   
                     # Local AS
-                    m = r11.match(line)
+                    m = p.r11.match(line)
                     if m:
                         sub_dict['local_as'] = True
                         continue
                   
                     # Enable Bfd
-                    m = r12.match(line)
+                    m = p.r12.match(line)
                     if m:
                         sub_dict['bfd'] = True
                         continue
@@ -1271,7 +1151,7 @@ class ShowBgpPeerSession(ShowBgpPeerSessionSchema):
                     # Inherited commands:
                     # Inherited by the following peers:
                     # VRF default: 10.16.2.5
-                    m = r13.match(line)
+                    m = p.r13.match(line)
                     if m:
                         sub_dict['inherited_vrf_default'] = \
                             str(m.groupdict()['vrf_default'])
@@ -1319,6 +1199,29 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
     """
     cli_command = 'show running-config | inc peer-policy'
 
+    patterns = Patterns(
+        p1=r'^\s*template +peer-policy'
+            ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$',
+        r1=r'^\s*Send +Community$',
+        r2=r'^\s*Send +Ext-community$',
+        r3=r'^\s*Route +Reflector +Client$',
+        r4=r'^\s*Route-map +Inbound +- +policy-name *:'
+            ' +(?P<inbound_name>[a-zA-Z\-]+)$',
+        r5=r'^\s*Route-map +Outbound +- +policy-name *:'
+            ' +(?P<outbound_name>[a-zA-Z\-]+)$',
+        r6=r'^\s*Maximum +Prefixes +- +prefix +limit *:'
+            ' +(?P<max_prefix_no>[0-9]+)$',
+        r7=r'^\s*Default +Originate(?: +- +route-map *:'
+            ' +(?P<route_map>[a-zA-Z]+))?$',
+        r8=r'^\s*Soft-Reconfig$',
+        r9=r'^\s*Site-of-origin$',
+        r10=r'^\s*Allowas-in$',
+        r11=r'^\s*AS-override$',
+        r12=r'^\s*VRF +default *:'
+             ' +(?P<vrf_default>[0-9\.]+)$',
+        r13=r'^\s*Nexthop +Self$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -1329,32 +1232,13 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
         policy_names = []
         parsed_dict = {}
 
-        p1 = re.compile(r'^\s*template +peer-policy'
-                    ' +(?P<policy_name>[a-zA-Z0-9\-\_]+)$')
-        r1 = re.compile(r'^\s*Send +Community$')
-        r2 = re.compile(r'^\s*Send +Ext-community$')
-        r3 = re.compile(r'^\s*Route +Reflector +Client$')
-        r4 = re.compile(r'^\s*Route-map +Inbound +- +policy-name *:'
-                            ' +(?P<inbound_name>[a-zA-Z\-]+)$')
-        r5 = re.compile(r'^\s*Route-map +Outbound +- +policy-name *:'
-                            ' +(?P<outbound_name>[a-zA-Z\-]+)$')
-        r6 = re.compile(r'^\s*Maximum +Prefixes +- +prefix +limit *:'
-                            ' +(?P<max_prefix_no>[0-9]+)$')
-        r7 = re.compile(r'^\s*Default +Originate(?: +- +route-map *:'
-                            ' +(?P<route_map>[a-zA-Z]+))?$')
-        r8 = re.compile(r'^\s*Soft-Reconfig$')
-        r9 = re.compile(r'^\s*Site-of-origin$')
-        r10 = re.compile(r'^\s*Allowas-in$')
-        r11 = re.compile(r'^\s*AS-override$')
-        r12 = re.compile(r'^\s*VRF +default *:'
-                            ' +(?P<vrf_default>[0-9\.]+)$')
-        r13 = re.compile(r'^\s*Nexthop +Self$')
+        p = ShowBgpPeerPolicy.patterns
 
         for line in out.splitlines():
             line = line.rstrip()
 
             # template peer-policy PEER-POLICY
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # Get session name and save it for later
                 policy_names.append(str(m.groupdict()['policy_name']))
@@ -1384,45 +1268,45 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
 
                     # Commands configured in this template:
                     # Send Community
-                    m = r1.match(line)
+                    m = p.r1.match(line)
                     if m:
                         sub_dict['send_community'] = True
                         continue
                   
                     # Send Ext-community
-                    m = r2.match(line)
+                    m = p.r2.match(line)
                     if m:
                         sub_dict['send_ext_community'] = True
                         continue
                   
                     # Route Reflector Client
-                    m = r3.match(line)
+                    m = p.r3.match(line)
                     if m:
                         sub_dict['route_reflector_client'] = True
                         continue
                   
                     # Route-map Inbound - policy-name: test-map
-                    m = r4.match(line)
+                    m = p.r4.match(line)
                     if m:
                         sub_dict['route_map_name_in'] = \
                             str(m.groupdict()['inbound_name'])
                         continue
                   
                     # Route-map Outbound - policy-name: test-map
-                    m = r5.match(line)
+                    m = p.r5.match(line)
                     if m:
                         sub_dict['route_map_name_out'] = \
                             str(m.groupdict()['outbound_name'])
                   
                     # Maximum Prefixes - prefix limit: 300
-                    m = r6.match(line)
+                    m = p.r6.match(line)
                     if m:
                         sub_dict['maximum_prefix_max_prefix_no'] = \
                             int(m.groupdict()['max_prefix_no'])
                         continue
                     
                     # Default Originate - route-map: test
-                    m = r7.match(line)
+                    m = p.r7.match(line)
                     if m:
                         sub_dict['default_originate'] =  True
                         sub_dict['default_originate_route_map'] = \
@@ -1430,25 +1314,25 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
                         continue
                   
                     # Soft-Reconfig
-                    m = r8.match(line)
+                    m = p.r8.match(line)
                     if m:
                         sub_dict['soft_reconfiguration'] = True
                         continue
                   
                     # Site-of-origin
-                    m = r9.match(line)
+                    m = p.r9.match(line)
                     if m:
                         sub_dict['site_of_origin'] = True
                         continue
                     
                     # Allowas-in
-                    m = r10.match(line)
+                    m = p.r10.match(line)
                     if m:
                         sub_dict['allowas_in'] = True
                         continue
                   
                     # AS-override
-                    m = r11.match(line)
+                    m = p.r11.match(line)
                     if m:
                         sub_dict['as_override'] = True
                         continue
@@ -1456,14 +1340,14 @@ class ShowBgpPeerPolicy(ShowBgpPeerPolicySchema):
                     # Inherited commands:
                     # Inherited by the following peers:
                     # VRF default: 10.16.2.5
-                    m = r12.match(line)
+                    m = p.r12.match(line)
                     if m:
                         sub_dict['inherited_vrf_default'] = \
                             str(m.groupdict()['vrf_default'])
                         continue
 
                     # Nexthop Self
-                    m = r13.match(line)
+                    m = p.r13.match(line)
                     if m:
                         sub_dict['next_hop_self'] = True
                         continue
@@ -1509,39 +1393,43 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
     '''
     cli_command = 'show running-config | inc peer'
 
+    patterns = Patterns(
+        p0=r'^\s*template +peer'
+            ' +(?P<peer_template>[a-zA-Z0-9\-\_]+)$',
+        p1=r'^\s*Remote +AS +(?P<remote_as>[0-9]+)$',
+        p2=r'^\s*Inherits +session +configuration'
+            ' +from session-template'
+            ' +(?P<inherit_template>(\S+))$',
+        p3=r'^\s*Description *: +(?P<desc>(\S+))$',
+        p4=r'^\s*Using +(?P<update_source>(\S+)) +as'
+            ' +update +source +for +this +peer$',
+        p5=r'^\s*Connected check is disabled$',
+        p6=r'^\s*BFD live-detection +is +configured$',
+        p7=r'^\s*External +BGP +peer +might +be +upto'
+            ' +(?P<num_hops_bgp_peer>[0-9]+) +hops'
+            ' +away$',
+        p8=r'^\s*TCP +MD5 +authentication +is'
+            ' +(?P<tcp_md5_auth>(\S+))$',
+        p9=r'^\s*Only +passive +connection +setup'
+            ' +allowed$',
+        p10=r'^\s*Neighbor +local-as +command'
+             ' +(?P<nbr_local_as_cmd>(\S+))$',
+        p11=r'^\s*Private +AS +numbers +removed +from'
+             ' +updates +sent +to +this +neighbor$',
+        p12=r'^\s*Hold +time += +(?P<holdtime>[0-9]+),'
+             ' +keepalive +interval +is'
+             ' +(?P<keepalive_interval>[0-9]+)'
+             ' +seconds$',
+    )
+
     def cli(self, output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        p0 = re.compile(r'^\s*template +peer'
-                        ' +(?P<peer_template>[a-zA-Z0-9\-\_]+)$')
-        p1 = re.compile(r'^\s*Remote +AS +(?P<remote_as>[0-9]+)$')
-        p2 = re.compile(r'^\s*Inherits +session +configuration'
-                            ' +from session-template'
-                            ' +(?P<inherit_template>(\S+))$')
-        p3 = re.compile(r'^\s*Description *: +(?P<desc>(\S+))$')
-        p4 = re.compile(r'^\s*Using +(?P<update_source>(\S+)) +as'
-                            ' +update +source +for +this +peer$')
-        p5 = re.compile(r'^\s*Connected check is disabled$')
-        p6 = re.compile(r'^\s*BFD live-detection +is +configured$')
-        p7 = re.compile(r'^\s*External +BGP +peer +might +be +upto'
-                            ' +(?P<num_hops_bgp_peer>[0-9]+) +hops'
-                            ' +away$')
-        p8 = re.compile(r'^\s*TCP +MD5 +authentication +is'
-                            ' +(?P<tcp_md5_auth>(\S+))$')
-        p9 = re.compile(r'^\s*Only +passive +connection +setup'
-                            ' +allowed$')
-        p10 = re.compile(r'^\s*Neighbor +local-as +command'
-                            ' +(?P<nbr_local_as_cmd>(\S+))$')
-        p11 = re.compile(r'^\s*Private +AS +numbers +removed +from'
-                            ' +updates +sent +to +this +neighbor$')
-        p12 = re.compile(r'^\s*Hold +time += +(?P<holdtime>[0-9]+),'
-                            ' +keepalive +interval +is'
-                            ' +(?P<keepalive_interval>[0-9]+)'
-                            ' +seconds$')
-                                    
+        p = ShowBgpPeerTemplate.patterns
+
         # Init vars
         peer_templates = []
         parsed_dict = {}
@@ -1550,7 +1438,7 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
             line = line.rstrip()
 
             # template peer PEER
-            m = p0.match(line)
+            m = p.p0.match(line)
             if m:
                 # Get session name and save it for later
                 peer_templates.append(str(m.groupdict()['peer_template']))
@@ -1579,78 +1467,78 @@ class ShowBgpPeerTemplate(ShowBgpPeerTemplateSchema):
 
                     # BGP peer-template is PEER
                     # Remote AS 500
-                    m = p1.match(line)
+                    m = p.p1.match(line)
                     if m:
                         sub_dict['remote_as'] = int(m.groupdict()['remote_as'])
                         continue
 
                     # Inherits session configuration from session-template PEER-SESSION
-                    m = p2.match(line)
+                    m = p.p2.match(line)
                     if m:
                         sub_dict['inherit_template'] = \
                             str(m.groupdict()['inherit_template'])
                         continue
 
                     # Description: DESC
-                    m = p3.match(line)
+                    m = p.p3.match(line)
                     if m:
                         sub_dict['description'] = str(m.groupdict()['desc'])
                         continue
 
                     # Using loopback1 as update source for this peer
-                    m = p4.match(line)
+                    m = p.p4.match(line)
                     if m:
                         sub_dict['update_source'] = \
                             str(m.groupdict()['update_source'])
                         continue
 
                     # Connected check is disabled
-                    m = p5.match(line)
+                    m = p.p5.match(line)
                     if m:
                         sub_dict['disable_connected_check'] = True
                         continue
 
                     # BFD live-detection is configured
-                    m = p6.match(line)
+                    m = p.p6.match(line)
                     if m:
                         sub_dict['bfd_live_detection'] = True
                         continue
 
                     # External BGP peer might be upto 255 hops away
-                    m = p7.match(line)
+                    m = p.p7.match(line)
                     if m:
                         sub_dict['num_hops_bgp_peer'] = \
                             int(m.groupdict()['num_hops_bgp_peer'])
                         continue
 
                     # TCP MD5 authentication is enabled
-                    m = p8.match(line)
+                    m = p.p8.match(line)
                     if m:
                         sub_dict['tcp_md5_auth'] = \
                             str(m.groupdict()['tcp_md5_auth'])
                         continue
 
                     # Only passive connection setup allowed
-                    m = p9.match(line)
+                    m = p.p9.match(line)
                     if m:
                         sub_dict['nbr_transport_connection_mode'] = 'Passive'
                         continue
 
                     # Neighbor local-as command not active
-                    m = p10.match(line)
+                    m = p.p10.match(line)
                     if m:
                         sub_dict['nbr_local_as_cmd'] = \
                             str(m.groupdict()['nbr_local_as_cmd'])
                         continue
 
                     # Private AS numbers removed from updates sent to this neighbor
-                    m = p11.match(line)
+                    m = p.p11.match(line)
                     if m:
                         sub_dict['private_as_updates'] = False
                         continue
 
                     # Hold time = 26, keepalive interval is 13 seconds
-                    m = p12.match(line)
+                    m = p.p12.match(line)
                     if m:
                         sub_dict['holdtime'] = \
                             int(m.groupdict()['holdtime'])
@@ -1914,131 +1802,136 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
     cli_command = 'show running-config bgp'
 
+    patterns = Patterns(
+        p1=r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$',
+        p2=r'^\s*shutdown$',
+        p2_1=r'^\s*evpn$',
+        p2_2=r'^\s*vni +(?P<evpn_vni>\d+) +l2$',
+        p2_3=r'^\s*rd +(?P<rd>[\w]+)$',
+        p2_4=r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$',
+        p3=r'^\s*vrf +(?P<vrf>[\w\-]+)$',
+        p3_1=r'^\s*rd +(?P<rd>[\w]+)$',
+        p4=r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$',
+        p5=r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$',
+        p6=r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$',
+        p7=r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$',
+        p8=r'^\s*no graceful-restart$',
+        p9=r'^\s*graceful-restart'
+            ' +(?P<graceful_restart_type>[a-z\-]+)'
+            ' +(?P<time>[0-9]+)$',
+        p10=r'^\s*log-neighbor-changes$',
+        p11=r'^\s*router-id +(?P<router_id>[0-9\.]+)$',
+        p12=r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
+             ' +(?P<holdtime>[0-9]+)$',
+        p13=r'^\s*no enforce-first-as$',
+        p14=r'^\s*no fast-external-fallover$',
+        p15=r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$',
+        p16=r'^\s*flush-routes$',
+        p17=r'^\s*isolate$',
+        p18=r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$',
+        p19=r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$',
+        p20=r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$',
+        p21_1=r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$',
+        p21=r'^\s*dampening '
+             '+(?P<af_dampening_half_life_time>[0-9]+) '
+             '+(?P<af_dampening_reuse_time>[0-9]+) '
+             '+(?P<af_dampening_suppress_time>[0-9]+) '
+             '+(?P<af_dampening_max_suppress_time>[0-9]+)$',
+        p22=r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$',
+        p23=r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$',
+        p24=r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$',
+        p25=r'^\s*no nexthop trigger-delay$',
+        p26=r'^\s*no client-to-client reflection$',
+        p27=r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$',
+        p28=r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$',
+        p28_1=r'additional-paths send',
+        p28_2=r'additional-paths receive',
+        p28_3=r'default-information originate',
+        p29=r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$',
+        p30=r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$',
+        p31=r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$',
+        p32=r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$',
+        p33=r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$',
+        p34=r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$',
+        p35=r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$',
+        p36=r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$',
+        p37=r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$',
+        p38=r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$',
+        p39=r'^\s*allocate-label all$',
+        p40=r'^\s*retain route-target all$',
+        p41=r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$',
+        p103=r'^\s*advertise-pip$',
+        p42=r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$',
+        p43=r'^\s*bfd$',
+        p44=r'^\s*capability suppress 4-byte-as$',
+        p45=r'^\s*description +(?P<nbr_description>.+)$',
+        p46=r'^\s*disable-connected-check$',
+        p47=r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$',
+        p48=r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$',
+        p49=r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$',
+        p50=r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$',
+        p51=r'^\s*remove-private-as$',
+        p52=r'^\s*shutdown$',
+        p53=r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$',
+        p54=r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$',
+        p55=r'^\s*password +(?P<nbr_password_text>.*)$',
+        p56=r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$',
+        p101=r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$',
+        p104=r'^\s*inherit peer +(?P<nbr_inherit_peer>\S+)$',
+        p57=r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$',
+        p58=r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$',
+        p59=r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$',
+        p60=r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$',
+        p61=r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$',
+        p62=r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_in>.*) in$',
+        p63=r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_out>.*) out$',
+        p64=r'^\s*route-reflector-client$',
+        p65=r'^\s*send-community$',
+        p66=r'^\s*send-community +extended$',
+        p100=r'^\s*rewrite-evpn-rt-asn$',
+        p67=r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$',
+        p68=r'^\s*next-hop-self$',
+        p69=r'^\s*as-override$',
+        p70=r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$',
+        p71=r'^\s*soo +(?P<nbr_af_soo>.*)$',
+        p72=r'^\s*template peer-session +(?P<ps_name>.*)$',
+        p73=r'^\s*bfd$',
+        p74=r'^\s*bfd$',
+        p75=r'^\s*description +(?P<ps_description>.*)$',
+        p76=r'^\s*disable-connected-check$',
+        p77=r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$',
+        p78=r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$',
+        p79=r'^\s*password +(?P<ps_password_text>.*)$',
+        p80=r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$',
+        p81=r'^\s*shutdown$',
+        p82=r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$',
+        p83=r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$',
+        p84=r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$',
+        p85=r'^\s*template peer-policy +(?P<pp_name>.*)$',
+        p86=r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$',
+        p87=r'^\s*as-override$',
+        p88=r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$',
+        p89=r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$',
+        p90=r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$',
+        p91=r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$',
+        p92=r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$',
+        p93=r'^\s*next-hop-self$',
+        p94=r'^\s*route-reflector-client$',
+        p95=r'^\s*send-community$',
+        p96=r'^\s*send-community +extended$',
+        p97=r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$',
+        p98=r'^\s*soo +(?P<pp_soo>.*)$',
+        peer_1=r'template peer +(?P<peer_name>\S+)',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
         else:
             out = output
 
-        p1 = re.compile(r'^\s*router +bgp +(?P<bgp_id>[0-9]+)$')
-        p2 = re.compile(r'^\s*shutdown$')
-        p2_1 = re.compile(r'^\s*evpn$')
-        p2_2 = re.compile(r'^\s*vni +(?P<evpn_vni>\d+) +l2$')
-        p2_3 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p2_4 = re.compile(r'^\s*route-target +(?P<evpn_vni_rt_type>[\w]+) +(?P<evpn_vni_rt>[\w\s]+)$')
-        p3 = re.compile(r'^\s*vrf +(?P<vrf>[\w\-]+)$')
-        p3_1 = re.compile(r'^\s*rd +(?P<rd>[\w]+)$')
-        p4 = re.compile(r'^\s*bestpath +(?P<best_path>[a-z\-\s]+)$')
-        p5 = re.compile(r'^\s*cluster-id +(?P<cluster_id>[0-9\.]+)$')
-        p6 = re.compile(r'^\s*confederation +identifier +(?P<confederation_identifier>[0-9]+)$')
-        p7 = re.compile(r'^\s*confederation +peers +(?P<confederation_peers_as>[0-9]+)$')
-        p8 = re.compile(r'^\s*no graceful-restart$')
-        p9 = re.compile(r'^\s*graceful-restart'
-                    ' +(?P<graceful_restart_type>[a-z\-]+)'
-                    ' +(?P<time>[0-9]+)$')
-        p10 = re.compile(r'^\s*log-neighbor-changes$')
-        p11 = re.compile(r'^\s*router-id +(?P<router_id>[0-9\.]+)$')
-        p12 = re.compile(r'^\s*timers +bgp +(?P<keepalive_interval>[0-9]+)'
-                    ' +(?P<holdtime>[0-9]+)$')
-        p13 = re.compile(r'^\s*no enforce-first-as$')
-        p14 = re.compile(r'^\s*no fast-external-fallover$')
-        p15 = re.compile(r'^\s*dynamic-med-interval +(?P<dynamic_med_interval>[0-9]+)$')
-        p16 = re.compile(r'^\s*flush-routes$')
-        p17 = re.compile(r'^\s*isolate$')
-        p18 = re.compile(r'^\s*disable-policy-batching ipv4 prefix-list +(?P<disable_policy_batching_ipv4>[a-zA-Z0-9]+)$')
-        p19 = re.compile(r'^\s*disable-policy-batching ipv6 prefix-list +(?P<disable_policy_batching_ipv6>[a-zA-Z0-9]+)$')
-        p20 = re.compile(r'^\s*address-family +(?P<af_name>[a-z0-9\-\s]+)$')
-        p21_1 = re.compile(r'^\s*route-target +(?P<af_evpn_vni_rt_type>[\w]+) +(?P<af_evpn_vni_rt>[\w\s]+)$')
-        p21 = re.compile(r'^\s*dampening '
-                        '+(?P<af_dampening_half_life_time>[0-9]+) '
-                        '+(?P<af_dampening_reuse_time>[0-9]+) '
-                        '+(?P<af_dampening_suppress_time>[0-9]+) '
-                        '+(?P<af_dampening_max_suppress_time>[0-9]+)$')
-        p22 = re.compile(r'^\s*dampening +route-map +(?P<af_dampening_route_map>[A-Z0-9\-\_]+)$')
-        p23 = re.compile(r'^\s*nexthop +route-map +(?P<af_nexthop_route_map>[A-Za-z0-9\-\_]+)$')
-        p24 = re.compile(r'^\s*nexthop +trigger-delay +critical +(?P<af_nexthop_trigger_delay_critical>[0-9]+) +non-critical +(?P<af_nexthop_trigger_delay_non_critical>[0-9]+)$')
-        p25 = re.compile(r'^\s*no nexthop trigger-delay$')
-        p26 = re.compile(r'^\s*no client-to-client reflection$')
-        p27 = re.compile(r'^\s*distance +(?P<af_distance_extern_as>[0-9]+) +(?P<af_distance_internal_as>[0-9]+) +(?P<af_distance_local>[0-9]+)$')
-        p28 = re.compile(r'^\s*maximum-paths( +(?P<af_maximum_paths_type>[a-z]+))? +(?P<af_maximum_paths_value>[0-9]+)$')
-        p28_1 = re.compile(r'additional-paths send')
-        p28_2 = re.compile(r'additional-paths receive')
-        p28_3 = re.compile(r'default-information originate')
-        p29 = re.compile(r'^\s*maximum-paths +eibgp +(?P<af_maximum_paths_eibgp>[0-9]+)$')
-        p30 = re.compile(r'^\s*aggregate-address +(?P<af_aggregate_address_address>[a-z0-9\.\:]+)(\/(?P<af_aggregate_address_ipv4_mask>[0-9]+))?( +(?P<extra_line>[a-z\-\s]+))?$')
-        p31 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.\:]+)( +mask +(?P<af_network_mask>[0-9\.]+))?( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p32 = re.compile(r'^\s*network +(?P<af_network_number>[0-9\.]+)\/(?P<af_network_mask>[0-9]+)( +route-map +(?P<af_network_route_map>[A-Za-z0-9\-\_]+))?$')
-        p33 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p34 = re.compile(r'^\s*redistribute +isis +(?P<af_redist_isis>[0-9]+) +route-map +(?P<af_redist_isis_route_policy>[A-Za-z0-9\-\_]+)$')
-        p35 = re.compile(r'^\s*redistribute +(ospf|ospfv3) +(?P<af_redist_ospf>[0-9]+) +route-map +(?P<af_redist_ospf_route_policy>[A-Za-z0-9\-\_]+)$')
-        p36 = re.compile(r'^\s*redistribute +rip +(?P<af_redist_rip>[0-9]+) +route-map +(?P<af_redist_rip_route_policy>[A-Za-z0-9\-\_]+)$')
-        p37 = re.compile(r'^\s*redistribute +static +route-map +(?P<af_redist_static_route_policy>[A-Za-z0-9\-\_]+)$')
-        p38 = re.compile(r'^\s*redistribute +direct +route-map +(?P<af_redist_connected_route_policy>[A-Za-z0-9\-\_]+)$')
-        p39 = re.compile(r'^\s*allocate-label all$')
-        p40 = re.compile(r'^\s*retain route-target all$')
-        p41 = re.compile(r'^\s*label-allocation-mode +(?P<per_vrf>[A-Za-z0-9]+)$')
-        p103 = re.compile(r'^\s*advertise-pip$')
-        p42 = re.compile(r'^\s*neighbor +(?P<neighbor_id>[a-z0-9\.\:]+)$')
-        p43 = re.compile(r'^\s*bfd$')
-        p44 = re.compile(r'^\s*capability suppress 4-byte-as$')
-        p45 = re.compile(r'^\s*description +(?P<nbr_description>.+)$')
-        p46 = re.compile(r'^\s*disable-connected-check$')
-        p47 = re.compile(r'^\s*ebgp-multihop +(?P<nbr_ebgp_multihop_max_hop>[0-9]+)$')
-        p48 = re.compile(r'^\s*inherit peer-session +(?P<nbr_inherit_peer_session>[A-Za-z0-9\-]+)$')
-        p49 = re.compile(r'^\s*local-as +(?P<nbr_local_as_as_no>[0-9\.]+)( +(?P<no_prepend>no-prepend)( +(?P<replace_as>replace-as)( +(?P<dual_as>dual-as))?)?)?$')
-        p50 = re.compile(r'^\s*remote-as +(?P<nbr_remote_as>[0-9]+)$')
-        p51 = re.compile(r'^\s*remove-private-as$')
-        p52 = re.compile(r'^\s*shutdown$')
-        p53 = re.compile(r'^\s*timers +(?P<nbr_keepalive_interval>[0-9]+) +(?P<nbr_holdtime>[0-9]+)$')
-        p54 = re.compile(r'^\s*update-source +(?P<nbr_update_source>[A-Za-z0-9\/\.]+)$')
-        p55 = re.compile(r'^\s*password +(?P<nbr_password_text>.*)$')
-        p56 = re.compile(r'^\s*transport connection-mode +(?P<nbr_transport_connection_mode>[a-z]+)$')
-        p101 = re.compile(r'^\s*peer-type +(?P<nbr_peer_type>[\w\-]+)$')
-        p104 = re.compile(r'^\s*inherit peer +(?P<nbr_inherit_peer>\S+)$')
-        p57 = re.compile(r'^\s*address-family +(?P<nbr_af_name>[A-Za-z0-9\s\-]+)$')
-        p58 = re.compile(r'^\s*allowas-in( +(?P<nbr_af_allowas_in_as_number>[0-9]+))?$')
-        p59 = re.compile(r'^\s*inherit peer-policy +(?P<nbr_af_inherit_peer_policy>[A-Za-z0-9\-]+) +(?P<nbr_af_inherit_peer_seq>[0-9]+)$')
-        p60 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p61 = re.compile(r'^\s*maximum-prefix +(?P<nbr_af_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?( +(?P<nbr_af_maximum_prefix_warning_only>warning-only))?$')
-        p62 = re.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_in>.*) in$')
-        p63 = re.compile(r'^\s*(?:no )?route-map +(?P<nbr_af_route_map_name_out>.*) out$')
-        p64 = re.compile(r'^\s*route-reflector-client$')
-        p65 = re.compile(r'^\s*send-community$')
-        p66 = re.compile(r'^\s*send-community +extended$')
-        p100 = re.compile(r'^\s*rewrite-evpn-rt-asn$')
-        p67 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p68 = re.compile(r'^\s*next-hop-self$')
-        p69 = re.compile(r'^\s*as-override$')
-        p70 = re.compile(r'^\s*default-originate( +route-map +(?P<nbr_af_default_originate_route_map>.*))?$')
-        p71 = re.compile(r'^\s*soo +(?P<nbr_af_soo>.*)$')
-        p72 = re.compile(r'^\s*template peer-session +(?P<ps_name>.*)$')
-        p73 = re.compile(r'^\s*bfd$')
-        p74 = re.compile(r'^\s*bfd$')
-        p75 = re.compile(r'^\s*description +(?P<ps_description>.*)$')
-        p76 = re.compile(r'^\s*disable-connected-check$')
-        p77 = re.compile(r'^\s*ebgp-multihop +(?P<ps_ebgp_multihop_max_hop>[0-9]+)$$')
-        p78 = re.compile(r'^\s*local-as +(?P<ps_local_as_as_no>[0-9\.]+)( +no-prepend( +replace-as( +dual-as)?)?)?$')
-        p79 = re.compile(r'^\s*password +(?P<ps_password_text>.*)$')
-        p80 = re.compile(r'^\s*remote-as +(?P<ps_remote_as>[0-9]+)$')
-        p81 = re.compile(r'^\s*shutdown$')
-        p82 = re.compile(r'^\s*timers +(?P<ps_keepalive_interval>[0-9]+) +(?P<ps_hodltime>[0-9]+)$')
-        p83 = re.compile(r'^\s*transport connection-mode +(?P<ps_transport_connection_mode>[a-z]+)$')
-        p84 = re.compile(r'^\s*update-source +(?P<ps_update_source>[A-Za-z0-9\/\.]+)$')
-        p85 = re.compile(r'^\s*template peer-policy +(?P<pp_name>.*)$')
-        p86 = re.compile(r'^\s*allowas-in( +(?P<pp_allowas_in_as_number>[0-9]+))?$')
-        p87 = re.compile(r'^\s*as-override$')
-        p88 = re.compile(r'^\s*default-originate( +route-map +(?P<pp_default_originate_route_map>.*))?$')
-        p89 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_in>.*) in$')
-        p90 = re.compile(r'^\s*route-map +(?P<pp_route_map_name_out>.*) out$')
-        p91 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<nbr_af_maximum_prefix_threshold>[0-9]+))?(restart +(?P<nbr_af_maximum_prefix_restart>[0-9]+))?$')
-        p92 = re.compile(r'^\s*maximum-prefix +(?P<pp_maximum_prefix_max_prefix_no>[0-9]+)( +(?P<pp_maximum_prefix_threshold>[0-9]+))?( +(?P<pp_maximum_prefix_warning_only>warning-only))?$')
-        p93 = re.compile(r'^\s*next-hop-self$')
-        p94 = re.compile(r'^\s*route-reflector-client$')
-        p95 = re.compile(r'^\s*send-community$')
-        p96 = re.compile(r'^\s*send-community +extended$')
-        p97 = re.compile(r'^\s*soft-reconfiguration inbound( +(?P<nbr_af_soft_reconfiguration_extra>.*))?$')
-        p98 = re.compile(r'^\s*soo +(?P<pp_soo>.*)$')
-        peer_1 = re.compile(r'template peer +(?P<peer_name>\S+)')
+        p = ShowRunningConfigBgp.patterns
+
         # Init vars
         bgp_dict = {}
         bgp_id = ''
@@ -2056,7 +1949,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
         for line in out.splitlines():
             line = line.strip()
             # router bgp 333
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 # Coversion to BGP ASN 4260036636(AS-PLAIN) from 65003.28(AS-COLON)
                 bgp_id = m.groupdict()['bgp_id']
@@ -2085,13 +1978,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
             if bgp_id:
                 #   shutdown
-                m = p2.match(line)
+                m = p.p2.match(line)
                 if m:
                     bgp_dict['bgp']['instance']['default']['protocol_shutdown'] = True
                     continue
 
                 # evpn
-                m = p2_1.match(line)
+                m = p.p2_1.match(line)
                 if m:
                     if 'vxlan' not in bgp_dict:
                         bgp_dict['vxlan'] = {}
@@ -2100,7 +1993,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     continue
 
                 # vni 5001 l2
-                m = p2_2.match(line)
+                m = p.p2_2.match(line)
                 if m:
                     vni_flag = True
                     if 'evpn_vni' not in bgp_dict['vxlan']['evpn']:
@@ -2113,14 +2006,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if vni_flag:
                     # rd auto
-                    m = p2_3.match(line)
+                    m = p.p2_3.match(line)
                     if m:
                         bgp_dict['vxlan']['evpn']['evpn_vni'][evpn_vni]['evpn_vni_rd'] = m.groupdict()['rd']
                         continue
 
                     # route-target import auto
                     # route-target export auto
-                    m = p2_4.match(line)
+                    m = p.p2_4.match(line)
                     if m:
                         evpn_vni_rt = m.groupdict()['evpn_vni_rt']
                         if 'evpn_vni_rt' not in bgp_dict['vxlan']['evpn']['evpn_vni'][evpn_vni]:
@@ -2135,7 +2028,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                 # vrf VRF1
-                m = p3.match(line)
+                m = p.p3.match(line)
                 if m:
                     # Get keys
                     vrf = str(m.groupdict()['vrf'])
@@ -2159,7 +2052,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict = bgp_vrf_nondefault_dict
 
                     # rd auto
-                    m = p3_1.match(line)
+                    m = p.p3_1.match(line)
                     if m:
                         bgp_vrf_dict['rd'] = m.groupdict()['rd']
                         continue
@@ -2168,7 +2061,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     #   bestpath compare-routerid
                     #   bestpath med missing-as-worst
                     #   bestpath always-compare-med
-                    m = p4.match(line)
+                    m = p.p4.match(line)
                     if m:
                         # Get keys
                         best_path = str(m.groupdict()['best_path'])
@@ -2188,27 +2081,27 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   cluster-id <cluster_id>
-                    m = p5.match(line)
+                    m = p.p5.match(line)
                     if m:
                         bgp_vrf_dict['cluster_id'] = str(m.groupdict()['cluster_id'])
                         continue
 
                     #   confederation identifier <confederation_identifier>
-                    m = p6.match(line)
+                    m = p.p6.match(line)
                     if m:
                         bgp_vrf_dict['confederation_identifier'] = \
                             int(m.groupdict()['confederation_identifier'])
                         continue
 
                     #   confederation peers <confederation_peers_as>
-                    m = p7.match(line)
+                    m = p.p7.match(line)
                     if m:
                         bgp_vrf_dict['confederation_peers_as'] = \
                             str(m.groupdict()['confederation_peers_as'])
                         continue
 
                     #   no graceful-restart
-                    m = p8.match(line)
+                    m = p.p8.match(line)
                     if m:
                         bgp_vrf_dict['graceful_restart'] = False
                         continue
@@ -2217,7 +2110,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                     #   graceful-restart restart-time 121
                     #   graceful-restart stalepath-time 301
-                    m = p9.match(line)
+                    m = p.p9.match(line)
                     if m:
                         graceful_restart_type = str(m.groupdict()['graceful_restart_type'])
                         if graceful_restart_type == 'restart-time':
@@ -2229,7 +2122,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   log-neighbor-changes
-                    m = p10.match(line)
+                    m = p.p10.match(line)
                     if m:
                         bgp_vrf_dict['log_neighbor_changes'] = True
                         continue
@@ -2237,20 +2130,20 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['log_neighbor_changes'] = False
 
                     #   router-id <router-id>
-                    m = p11.match(line)
+                    m = p.p11.match(line)
                     if m:
                         bgp_vrf_dict['router_id'] = str(m.groupdict()['router_id'])
                         continue
 
                     #   timers bgp <keepalive-interval> <holdtime>
-                    m = p12.match(line)
+                    m = p.p12.match(line)
                     if m:
                         bgp_vrf_dict['keepalive_interval'] = int(m.groupdict()['keepalive_interval'])
                         bgp_vrf_dict['holdtime'] = int(m.groupdict()['holdtime'])
                         continue
 
                     #   no enforce-first-as
-                    m = p13.match(line)
+                    m = p.p13.match(line)
                     if m:
                         bgp_vrf_dict['enforce_first_as'] = False
                         continue
@@ -2258,7 +2151,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['enforce_first_as'] = True
 
                     #   no fast-external-fallover
-                    m = p14.match(line)
+                    m = p.p14.match(line)
                     if m:
                         bgp_vrf_dict['fast_external_fallover'] = False
                         continue
@@ -2266,14 +2159,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['fast_external_fallover'] = True
 
                     #   dynamic-med-interval 70
-                    m = p15.match(line)
+                    m = p.p15.match(line)
                     if m:
                         bgp_vrf_dict['dynamic_med_interval'] = \
                             int(m.groupdict()['dynamic_med_interval'])
                         continue
 
                     #   flush-routes
-                    m = p16.match(line)
+                    m = p.p16.match(line)
                     if m:
                         bgp_vrf_dict['flush_routes'] = True
                         continue
@@ -2281,7 +2174,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['flush_routes'] = False
 
                     #   isolate
-                    m = p17.match(line)
+                    m = p.p17.match(line)
                     if m:
                         bgp_vrf_dict['isolate'] = True
                         continue
@@ -2289,14 +2182,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_vrf_dict['isolate'] = False
 
                     #   disable-policy-batching ipv4 prefix-list <WORD>
-                    m = p18.match(line)
+                    m = p.p18.match(line)
                     if m:
                         bgp_vrf_dict['disable_policy_batching_ipv4'] = \
                             str(m.groupdict()['disable_policy_batching_ipv4'])
                         continue
 
                     #   disable-policy-batching ipv4 prefix-list <WORD>
-                    m = p19.match(line)
+                    m = p.p19.match(line)
                     if m:
                         bgp_vrf_dict['disable_policy_batching_ipv6'] = \
                             str(m.groupdict()['disable_policy_batching_ipv6'])
@@ -2305,7 +2198,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     if neighbor_id == '' and peer_name == '' or \
                             'af_name' not in bgp_dict['bgp']['instance']['default']['vrf'][vrf]:
                         #   address-family ipv4 multicast
-                        m = p20.match(line)
+                        m = p.p20.match(line)
                         if m:
                             # Get keys
                             af_name = str(m.groupdict()['af_name'])
@@ -2319,7 +2212,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     if af_name:
                         # route-target both auto
                         # route-target both auto evpn
-                        m = p21_1.match(line)
+                        m = p.p21_1.match(line)
                         if m:
                             bgp_af_dict['af_evpn_vni_rt_type'] = m.groupdict()['af_evpn_vni_rt_type']
                             bgp_af_dict['af_evpn_vni_rt'] = m.groupdict()['af_evpn_vni_rt']
@@ -2328,7 +2221,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         #    <af_dampening_resuse_time> <af_dampening_suppress_time>
                         #    <af_dampening_max_suppress_time> } |
                         #    { route-map <af_dampening_route_map> } ]
-                        m = p21.match(line)
+                        m = p.p21.match(line)
                         if m:
                             bgp_af_dict['af_dampening'] = True
                             bgp_af_dict['af_dampening_half_life_time'] = \
@@ -2342,14 +2235,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    dampening [ { route-map <af_dampening_route_map> } ]
-                        m = p22.match(line)
+                        m = p.p22.match(line)
                         if m:
                             bgp_af_dict['af_dampening'] = True
                             bgp_af_dict['af_dampening_route_map'] = str(m.groupdict()['af_dampening_route_map'])
                             continue
 
                         #    nexthop route-map <af_nexthop_route_map>
-                        m = p23.match(line)
+                        m = p.p23.match(line)
                         if m:
                             bgp_af_dict['af_nexthop_route_map'] = str(m.groupdict()['af_nexthop_route_map'])
                             continue
@@ -2358,7 +2251,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         #     <af_nexthop_trigger_delay_critical> non-critical
                         #     <af_nexthop_trigger_delay_non_critical> } |
                         #     { no nexthop trigger-delay }
-                        m = p24.match(line)
+                        m = p.p24.match(line)
                         if m:
                             bgp_af_dict['af_nexthop_trigger_enable'] = True
                             bgp_af_dict['af_nexthop_trigger_delay_critical'] = \
@@ -2368,13 +2261,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #     {no nexthop trigger-delay }
-                        m = p25.match(line)
+                        m = p.p25.match(line)
                         if m:
                             bgp_af_dict['af_nexthop_trigger_enable'] = False
                             continue
 
                         #     {no client-to-client reflection }
-                        m = p26.match(line)
+                        m = p.p26.match(line)
                         if m:
                             bgp_af_dict['af_client_to_client_reflection'] = False
                             continue
@@ -2382,7 +2275,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_af_dict['af_client_to_client_reflection'] = True
 
                         #    distance <af_distance_extern_as> <af_distance_internal_as> <af_distance_local> | no distance [ <af_distance_extern_as> <af_distance_internal_as> <af_distance_local> ]
-                        m = p27.match(line)
+                        m = p.p27.match(line)
                         if m:
                             bgp_af_dict['af_distance_extern_as'] = int(m.groupdict()['af_distance_extern_as'])
                             bgp_af_dict['af_distance_internal_as'] = int(m.groupdict()['af_distance_internal_as'])
@@ -2391,7 +2284,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    maximum-paths <af_maximum_paths_ebgp>
                         #    maximum-paths ibgp <af_maximum_paths_ibgp>
-                        m = p28.match(line)
+                        m = p.p28.match(line)
                         if m:
                             if m.groupdict()['af_maximum_paths_type']:
                                 bgp_af_dict['af_maximum_paths_ibgp'] = int(m.groupdict()['af_maximum_paths_value'])
@@ -2400,32 +2293,32 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #   additional-paths send
-                        m = p28_1.match(line)
+                        m = p.p28_1.match(line)
                         if m:
                             bgp_af_dict['af_additional_paths_send'] = True
                             continue
 
                         #   additional-paths receive
-                        m = p28_2.match(line)
+                        m = p.p28_2.match(line)
                         if m:
                             bgp_af_dict['af_additional_paths_receive'] = True
                             continue
 
                         # default-information originate
-                        m = p28_3.match(line)
+                        m = p.p28_3.match(line)
                         if m:
                             bgp_af_dict['af_default_originate'] = True
                             continue
 
                         #    maximum-paths eibgp <af_maximum_paths_eibgp>
-                        m = p29.match(line)
+                        m = p.p29.match(line)
                         if m:
                             bgp_af_dict['af_maximum_paths_eibgp'] = int(m.groupdict()['af_maximum_paths_eibgp'])
                             continue
 
                         #    aggregate-address <af_aggregate_address_ipv4_address>/<af_aggregate_address_ipv4_mask> [ as-set | summary-only ] +
                         #    aggregate-address <af_v6_aggregate_address_ipv6_address> [ as-set | summary-only ] +
-                        m = p30.match(line)
+                        m = p.p30.match(line)
                         if m:
                             ip_address = str(m.groupdict()['af_aggregate_address_address'])
                             if '::' not in ip_address:
@@ -2454,7 +2347,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    network { <af_network_number> mask <af_network_mask> } [ route-map <rmap-name> ] +
                         #    network <af_v6_network_number> [ route-map <af_v6_network_route_map> ] +
-                        m = p31.match(line)
+                        m = p.p31.match(line)
                         if m:
                             if m.groupdict()['af_network_mask']:
                                 bgp_af_dict['af_network_number'] = str(m.groupdict()['af_network_number'])
@@ -2468,7 +2361,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    network { <af_network_number>/<ip-prefix> } [ route-map <rmap-name> ] +
-                        m = p32.match(line)
+                        m = p.p32.match(line)
                         if m:
                             group = m.groupdict()
                             if 'af_network_number' in bgp_af_dict:
@@ -2490,7 +2383,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute isis <Isis.pid> route-map <route_policy>
-                        m = p33.match(line)
+                        m = p.p33.match(line)
                         if m:
                             bgp_af_dict['af_redist_isis'] = str(m.groupdict()['af_redist_isis'])
                             bgp_af_dict['af_redist_isis_route_policy'] = \
@@ -2498,7 +2391,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute isis <Isis.pid> route-map <route_policy>
-                        m = p34.match(line)
+                        m = p.p34.match(line)
                         if m:
                             bgp_af_dict['af_redist_isis'] = str(m.groupdict()['af_redist_isis'])
                             bgp_af_dict['af_redist_isis_route_policy'] = \
@@ -2507,7 +2400,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         #    redistribute ospf <Ospf.pid> route-map <route_policy>
                         #    redistribute ospfv3 <Ospf.pid> route-map <route_policy>
-                        m = p35.match(line)
+                        m = p.p35.match(line)
                         if m:
                             bgp_af_dict['af_redist_ospf'] = str(m.groupdict()['af_redist_ospf'])
                             bgp_af_dict['af_redist_ospf_route_policy'] = \
@@ -2515,7 +2408,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    Redistribute rip <Rip.pid> route-map <route_policy>
-                        m = p36.match(line)
+                        m = p.p36.match(line)
                         if m:
                             bgp_af_dict['af_redist_rip'] = str(m.groupdict()['af_redist_rip'])
                             bgp_af_dict['af_redist_rip_route_policy'] = \
@@ -2523,7 +2416,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute static route-map <route_policy>
-                        m = p37.match(line)
+                        m = p.p37.match(line)
                         if m:
                             bgp_af_dict['af_redist_static'] = True
                             bgp_af_dict['af_redist_static_route_policy'] = \
@@ -2531,7 +2424,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    redistribute direct route-map <route_policy>
-                        m = p38.match(line)
+                        m = p.p38.match(line)
                         if m:
                             bgp_af_dict['af_redist_connected'] = True
                             bgp_af_dict['af_redist_connected_route_policy'] = \
@@ -2539,30 +2432,30 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #    allocate-label all
-                        m = p39.match(line)
+                        m = p.p39.match(line)
                         if m:
                             bgp_af_dict['af_v6_allocate_label_all'] = True
                             continue
 
                         #    retain route-target all
-                        m = p40.match(line)
+                        m = p.p40.match(line)
                         if m:
                             bgp_af_dict['af_retain_rt_all'] = True
                             continue
 
                         #    label-allocation-mode per-vrf
-                        m = p41.match(line)
+                        m = p.p41.match(line)
                         if m:
                             bgp_af_dict['af_label_allocation_mode'] = str(m.groupdict()['per_vrf'])
                             continue
 
                         #    advertise-pip
-                        m = p103.match(line)
+                        m = p.p103.match(line)
                         if m:
                             bgp_af_dict['af_advertise_pip'] = True
                             continue
                     #   neighbor <neighbor_id>
-                    m = p42.match(line)
+                    m = p.p42.match(line)
                     if m:
                         # Get keys
                         neighbor_id = str(m.groupdict()['neighbor_id'])
@@ -2577,7 +2470,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     #   Same line of configuration can be configured under the peer session section
                     if neighbor_id:
                         #   bfd
-                        m = p43.match(line)
+                        m = p.p43.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_fall_over_bfd'] = True
                             continue
@@ -2585,7 +2478,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_fall_over_bfd'] = False
 
                         #   capability suppress 4-byte-as
-                        m = p44.match(line)
+                        m = p.p44.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_suppress_four_byte_as_capability'] = True
                             continue
@@ -2593,14 +2486,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_suppress_four_byte_as_capability'] = False
 
                         #   description <nbr_description>
-                        m = p45.match(line)
+                        m = p.p45.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_description'] = \
                                 str(m.groupdict()['nbr_description'])
                             continue
 
                         #   disable-connected-check
-                        m = p46.match(line)
+                        m = p.p46.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_disable_connected_check'] = True
                             continue
@@ -2608,7 +2501,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_disable_connected_check'] = False
 
                         #   ebgp-multihop <nbr_ebgp_multihop_max_hop>
-                        m = p47.match(line)
+                        m = p.p47.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_ebgp_multihop'] = True
                             bgp_vrf_neighbor_dict['nbr_ebgp_multihop_max_hop'] = \
@@ -2618,14 +2511,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_ebgp_multihop'] = False
 
                         #   inherit peer-session <nbr_inherit_peer_session>
-                        m = p48.match(line)
+                        m = p.p48.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_inherit_peer_session'] = \
                                 str(m.groupdict()['nbr_inherit_peer_session'])
                             continue
 
                         #    { local-as <nbr_local_as_as_no> [ no-prepend [ replace-as [ dual-as ] ] ] }
-                        m = p49.match(line)
+                        m = p.p49.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_local_as_as_no'] = \
                                 int(m.groupdict()['nbr_local_as_as_no'])
@@ -2640,14 +2533,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_local_as_dual_as'] = False
 
                         #   { remote-as <nbr_remote_as> }
-                        m = p50.match(line)
+                        m = p.p50.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_remote_as'] = \
                                 int(m.groupdict()['nbr_remote_as'])
                             continue
 
                         #   remove-private-as
-                        m = p51.match(line)
+                        m = p.p51.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_remove_private_as'] = True
                             continue
@@ -2655,7 +2548,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_remove_private_as'] = False
 
                         #   shutdown
-                        m = p52.match(line)
+                        m = p.p52.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_shutdown'] = True
                             continue
@@ -2663,7 +2556,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             bgp_vrf_neighbor_dict['nbr_shutdown'] = False
 
                         #   timers <nbr_keepalive_interval> <nbr_holdtime>
-                        m = p53.match(line)
+                        m = p.p53.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_keepalive_interval'] = \
                                 int(m.groupdict()['nbr_keepalive_interval'])
@@ -2672,42 +2565,42 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #   update-source <nbr_update_source>
-                        m = p54.match(line)
+                        m = p.p54.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_update_source'] = \
                                 str(m.groupdict()['nbr_update_source'])
                             continue
 
                         #   password <nbr_password_text>
-                        m = p55.match(line)
+                        m = p.p55.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_password_text'] = \
                                 str(m.groupdict()['nbr_password_text'])
                             continue
 
                         #   transport connection-mode <nbr_transport_connection_mode>
-                        m = p56.match(line)
+                        m = p.p56.match(line)
                         if m:
                             bgp_vrf_neighbor_dict['nbr_transport_connection_mode'] = \
                                 str(m.groupdict()['nbr_transport_connection_mode'])
                             continue
 
                         # peer-type fabric-external
-                        m = p101.match(line)
+                        m = p.p101.match(line)
                         if m:
                             bgp_vrf_neighbor_dict\
                                 ['nbr_peer_type'] = m.groupdict()['nbr_peer_type']
                             continue
 
                         # inherit peer GENIE-NEXUS-EBGP
-                        m = p104.match(line)
+                        m = p.p104.match(line)
                         if m:
                             bgp_vrf_neighbor_dict\
                                 ['nbr_inherit_peer'] = m.groupdict()['nbr_inherit_peer']
                             continue
 
                         #   address-family <nbr_af_name>
-                        m = p57.match(line)
+                        m = p.p57.match(line)
                         if m:
                             nbr_af_name = str(m.groupdict()['nbr_af_name'])
                             if 'nbr_af_name' not in bgp_vrf_neighbor_dict:
@@ -2719,7 +2612,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                         if 'nbr_af_name' in bgp_vrf_neighbor_dict:
                             #   allowas-in [ <allowas-in-cnt> ]
-                            m = p58.match(line)
+                            m = p.p58.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_allowas_in'] = True
                                 if m.groupdict()['nbr_af_allowas_in_as_number']:
@@ -2730,7 +2623,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_allowas_in'] = False
 
                             #   inherit peer-policy <nbr_af_inherit_peer_policy> <nbr_af_inherit_peer_seq>
-                            m = p59.match(line)
+                            m = p.p59.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_inherit_peer_policy'] = \
                                     str(m.groupdict()['nbr_af_inherit_peer_policy'])
@@ -2739,7 +2632,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   maximum-prefix <nbr_af_maximum_prefix_max_prefix_no> [ <nbr_af_maximum_prefix_threshold> ] [ restart <nbr_af_maximum_prefix_restart> ]
-                            m = p60.match(line)
+                            m = p.p60.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_maximum_prefix_max_prefix_no'] = \
                                     int(m.groupdict()['nbr_af_maximum_prefix_max_prefix_no'])
@@ -2752,7 +2645,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   maximum-prefix <nbr_af_maximum_prefix_max_prefix_no> [ <nbr_af_maximum_prefix_threshold> ] [ warning-only ]
-                            m = p61.match(line)
+                            m = p.p61.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_maximum_prefix_max_prefix_no'] = \
                                     int(m.groupdict()['nbr_af_maximum_prefix_max_prefix_no'])
@@ -2765,7 +2658,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   route-map <nbr_af_route_map_name_in> in
-                            m = p62.match(line)
+                            m = p.p62.match(line)
                             if m:
                                 if 'no' in line:
                                     bgp_vrf_af_dict['no_nbr_af_route_map_name_in'] = \
@@ -2776,7 +2669,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   route-map <nbr_af_route_map_name_out> out
-                            m = p63.match(line)
+                            m = p.p63.match(line)
                             if m:
                                 if 'no' in line:
                                     bgp_vrf_af_dict['no_nbr_af_route_map_name_out'] = \
@@ -2787,7 +2680,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             #   route-reflector-client
-                            m = p64.match(line)
+                            m = p.p64.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_route_reflector_client'] = True
                                 continue
@@ -2795,14 +2688,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_route_reflector_client'] = False
 
                             #   send-community
-                            m = p65.match(line)
+                            m = p.p65.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_send_community'] = 'standard'
                                 send_community_standard_match = 'True'
                                 continue
 
                             #   send-community extended
-                            m = p66.match(line)
+                            m = p.p66.match(line)
                             if m:
                                 if send_community_standard_match:
                                     bgp_vrf_af_dict['nbr_af_send_community'] = 'both'
@@ -2811,13 +2704,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 continue
 
                             # rewrite-evpn-rt-asn
-                            m = p100.match(line)
+                            m = p.p100.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_rewrite_evpn_rt_asn'] = True
                                 continue
 
                             #   route-reflector-client
-                            m = p67.match(line)
+                            m = p.p67.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_soft_reconfiguration'] = True
                                 continue
@@ -2825,7 +2718,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_soft_reconfiguration'] = False
 
                             #   next-hop-self
-                            m = p68.match(line)
+                            m = p.p68.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_next_hop_self'] = True
                                 continue
@@ -2833,7 +2726,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_next_hop_self'] = False
 
                             #   as-override
-                            m = p69.match(line)
+                            m = p.p69.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_as_override'] = True
                                 continue
@@ -2841,7 +2734,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_as_override'] = False
 
                             #   default-originate [ route-map <nbr_af_default_originate_route_map> ]
-                            m = p70.match(line)
+                            m = p.p70.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_default_originate'] = True
                                 if m.groupdict()['nbr_af_default_originate_route_map']:
@@ -2852,13 +2745,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                                 bgp_vrf_af_dict['nbr_af_default_originate'] = False
 
                             #   soo <nbr_af_soo>
-                            m = p71.match(line)
+                            m = p.p71.match(line)
                             if m:
                                 bgp_vrf_af_dict['nbr_af_soo'] = str(m.groupdict()['nbr_af_soo'])
                                 continue
 
                 #   template peer-session PEER-SESSION
-                m = p72.match(line)
+                m = p.p72.match(line)
                 if m:
                     # Get keys
                     ps_name = str(m.groupdict()['ps_name'])
@@ -2871,7 +2764,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if ps_name:
                     #   bfd
-                    m = p73.match(line)
+                    m = p.p73.match(line)
                     if m:
                         # Get keys
                         bgp_ps_dict['ps_fall_over_bfd'] = True
@@ -2880,7 +2773,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_fall_over_bfd'] = False
 
                     #   capability suppress 4-byte-as
-                    m = p74.match(line)
+                    m = p.p74.match(line)
                     if m:
                         bgp_ps_dict['ps_suppress_four_byte_as_capability'] = True
                         continue
@@ -2888,14 +2781,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_suppress_four_byte_as_capability'] = False
 
                     #   description <ps_description>
-                    m = p75.match(line)
+                    m = p.p75.match(line)
                     if m:
                         # Get keys
                         bgp_ps_dict['ps_description'] = str(m.groupdict()['ps_description'])
                         continue
 
                     #   disable-connected-check
-                    m = p76.match(line)
+                    m = p.p76.match(line)
                     if m:
                         bgp_ps_dict['ps_disable_connected_check'] = True
                         continue
@@ -2903,7 +2796,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_disable_connected_check'] = False
 
                     #   ebgp-multihop <ps_ebgp_multihop_max_hop>
-                    m = p77.match(line)
+                    m = p.p77.match(line)
                     if m:
                         bgp_ps_dict['ps_ebgp_multihop'] = True
                         bgp_ps_dict['ps_ebgp_multihop_max_hop'] = int(m.groupdict()['ps_ebgp_multihop_max_hop'])
@@ -2912,7 +2805,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_ebgp_multihop'] = False
 
                     #    { local-as <ps_local_as_as_no> [ no-prepend [ replace-as [ dual-as ] ] ] }
-                    m = p78.match(line)
+                    m = p.p78.match(line)
                     if m:
                         bgp_ps_dict['ps_local_as_as_no'] = str(m.groupdict()['ps_local_as_as_no'])
                         bgp_ps_dict['ps_local_as_no_prepend'] = True
@@ -2925,19 +2818,19 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_local_as_dual_as'] = False
 
                     #   password <ps_password_text>
-                    m = p79.match(line)
+                    m = p.p79.match(line)
                     if m:
                         bgp_ps_dict['ps_password_text'] = str(m.groupdict()['ps_password_text'])
                         continue
 
                     #   { remote-as <ps_remote_as> }
-                    m = p80.match(line)
+                    m = p.p80.match(line)
                     if m:
                         bgp_ps_dict['ps_remote_as'] = int(m.groupdict()['ps_remote_as'])
                         continue
 
                     #   shutdown
-                    m = p81.match(line)
+                    m = p.p81.match(line)
                     if m:
                         bgp_ps_dict['ps_shutdown'] = True
                         continue
@@ -2945,14 +2838,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_ps_dict['ps_shutdown'] = False
 
                     #   timers <ps_keepalive_interval> <ps_hodltime>
-                    m = p82.match(line)
+                    m = p.p82.match(line)
                     if m:
                         bgp_ps_dict['ps_keepalive_interval'] = int(m.groupdict()['ps_keepalive_interval'])
                         bgp_ps_dict['ps_hodltime'] = int(m.groupdict()['ps_hodltime'])
                         continue
 
                     #   transport connection-mode <ps_transport_connection_mode>
-                    m = p83.match(line)
+                    m = p.p83.match(line)
                     if m:
                         bgp_ps_dict['ps_transport_connection_mode'] = \
                             str(m.groupdict()['ps_transport_connection_mode'])
@@ -2964,7 +2857,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                 #   template peer-policy <pp_name>
-                m = p85.match(line)
+                m = p.p85.match(line)
                 if m:
                     # Get keys
                     pp_name = str(m.groupdict()['pp_name'])
@@ -2977,7 +2870,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if pp_name:
                     #   allowas-in [ <allowas-in-cnt> ]
-                    m = p86.match(line)
+                    m = p.p86.match(line)
                     if m:
                         bgp_pp_dict['pp_allowas_in'] = True
                         if m.groupdict()['pp_allowas_in_as_number']:
@@ -2988,7 +2881,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_allowas_in'] = False
 
                     #   as-override
-                    m = p87.match(line)
+                    m = p.p87.match(line)
                     if m:
                         bgp_pp_dict['pp_as_override'] = True
                         continue
@@ -2996,7 +2889,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_as_override'] = False
 
                     #   default-originate [ route-map <pp_default_originate_route_map> ]
-                    m = p88.match(line)
+                    m = p.p88.match(line)
                     if m:
                         bgp_pp_dict['pp_default_originate'] = True
                         if m.groupdict()['pp_default_originate_route_map']:
@@ -3007,21 +2900,21 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_default_originate'] = False
 
                     #   route-map <pp_route_map_name_in> in
-                    m = p89.match(line)
+                    m = p.p89.match(line)
                     if m:
                         bgp_pp_dict['pp_route_map_name_in'] = \
                             str(m.groupdict()['pp_route_map_name_in'])
                         continue
 
                     #   route-map <nbr_af_route_map_name_out> out
-                    m = p90.match(line)
+                    m = p.p90.match(line)
                     if m:
                         bgp_pp_dict['pp_route_map_name_out'] = \
                             str(m.groupdict()['pp_route_map_name_out'])
                         continue
 
                     #    maximum-prefix <pp_maximum_prefix_max_prefix_no> [ <pp_maximum_prefix_threshold> ] [ restart <pp_maximum_prefix_restart> ]
-                    m = p91.match(line)
+                    m = p.p91.match(line)
                     if m:
                         bgp_pp_dict['pp_maximum_prefix_max_prefix_no'] = \
                             int(m.groupdict()['pp_maximum_prefix_max_prefix_no'])
@@ -3032,7 +2925,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   maximum-prefix <pp_maximum_prefix_max_prefix_no> [ <pp_maximum_prefix_threshold> ] [ warning-only ]
-                    m = p92.match(line)
+                    m = p.p92.match(line)
                     if m:
                         bgp_pp_dict['pp_maximum_prefix_max_prefix_no'] = \
                             int(m.groupdict()['pp_maximum_prefix_max_prefix_no'])
@@ -3048,7 +2941,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   next-hop-self
-                    m = p93.match(line)
+                    m = p.p93.match(line)
                     if m:
                         bgp_pp_dict['pp_next_hop_self'] = True
                         continue
@@ -3056,7 +2949,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_next_hop_self'] = False
 
                     #   route-reflector-client
-                    m = p94.match(line)
+                    m = p.p94.match(line)
                     if m:
                         bgp_pp_dict['pp_route_reflector_client'] = True
                         continue
@@ -3064,14 +2957,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_route_reflector_client'] = False
 
                     #   send-community
-                    m = p95.match(line)
+                    m = p.p95.match(line)
                     if m:
                         bgp_pp_dict['pp_send_community'] = 'standard'
                         peer_policy_send_community_standard_match = 'True'
                         continue
 
                     #   send-community extended
-                    m = p96.match(line)
+                    m = p.p96.match(line)
                     if m:
                         if peer_policy_send_community_standard_match:
                             bgp_pp_dict['pp_send_community'] = 'both'
@@ -3080,7 +2973,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   route-reflector-client
-                    m = p97.match(line)
+                    m = p.p97.match(line)
                     if m:
                         bgp_pp_dict['pp_soft_reconfiguration'] = True
                         continue
@@ -3088,13 +2981,13 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         bgp_pp_dict['pp_soft_reconfiguration'] = False
 
                     #   soo <pp_soo>
-                    m = p98.match(line)
+                    m = p.p98.match(line)
                     if m:
                         bgp_pp_dict['pp_soo'] = str(m.groupdict()['pp_soo'])
                         continue
 
                 # template peer PEER
-                m = peer_1.match(line)
+                m = p.peer_1.match(line)
                 if m:
                     peer_name = m.groupdict()['peer_name']
                     if 'peer_name' not in bgp_dict['bgp']['instance']['default']:
@@ -3106,7 +2999,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
 
                 if peer_name != '':
                     #   bfd
-                    m = p73.match(line)
+                    m = p.p73.match(line)
                     if m:
                         # Get keys
                         bgp_peer_dict['peer_fall_over_bfd'] = True
@@ -3116,19 +3009,19 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                         continue
 
                     #   { remote-as <remote_as> }
-                    m = p80.match(line)
+                    m = p.p80.match(line)
                     if m:
                         bgp_peer_dict['peer_remote_as'] = int(m.groupdict()['ps_remote_as'])
                         continue
 
                     #   password <password_text>
-                    m = p79.match(line)
+                    m = p.p79.match(line)
                     if m:
                         bgp_peer_dict['peer_password_text'] = str(m.groupdict()['ps_password_text'])
                         continue
 
                     #   address-family <af_name>
-                    m = p57.match(line)
+                    m = p.p57.match(line)
                     if m:
                         peer_af_name = str(m.groupdict()['nbr_af_name'])
                         if 'peer_af_name' not in bgp_peer_dict:
@@ -3141,14 +3034,14 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                     if 'peer_af_name' in bgp_peer_dict:
 
                         #   send-community
-                        m = p65.match(line)
+                        m = p.p65.match(line)
                         if m:
                             bgp_peer_af_dict['peer_af_send_community'] = 'standard'
                             send_community_standard_match = 'True'
                             continue
 
                         #   maximum-prefix <pp_maximum_prefix_max_prefix_no> [ <pp_maximum_prefix_threshold> ] [ warning-only ]
-                        m = p92.match(line)
+                        m = p.p92.match(line)
                         if m:
                             bgp_peer_af_dict['peer_maximum_prefix_max_prefix_no'] = \
                                 int(m.groupdict()['pp_maximum_prefix_max_prefix_no'])
@@ -3164,7 +3057,7 @@ class ShowRunningConfigBgp(ShowRunningConfigBgpSchema):
                             continue
 
                         #   next-hop-self
-                        m = p68.match(line)
+                        m = p.p68.match(line)
                         if m:
                             bgp_peer_af_dict['peer_next_hop_self'] = True
                             continue
@@ -3242,6 +3135,40 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
     xml_command = 'show bgp all dampening flap-statistics | xml'
     exclude = ['duration']
 
+    patterns = Patterns(
+        p1=r'^Flap +Statistics +for +VRF +'
+            '(?P<vrf_name>[\w\-]+), +address +family +'
+            '(?P<address_family>[\w\s\-]+):$',
+        p2=r'^Dampening +configured, +'
+            '(?P<history_paths>\d+) +history +paths, +'
+            '(?P<dampened_paths>\d+) +dampened +paths$',
+        p2_1=r'^Dampening +not +configured, +'
+              '(?P<history_paths>\d+) +history +paths, +'
+              '(?P<dampened_paths>\d+) +dampened +paths$',
+        p3=r'^Route +Distinguisher: +'
+            '(?P<route_identifier>[\w\.\:]+)$',
+        p4=r'^(?P<status>[\*|d|s|h|\s])?'
+            '(?P<best>[\>|\s])?'
+            '(?P<pathtype>[e|i])?'
+            ' +(?P<network>\S+)'
+            ' +(?P<peer>[\w\/\.\:]+)'
+            ' +(?P<flaps>\d+)'
+            ' +(?P<duration>[\w\:\.]+)'
+            '(?: +(?P<reuse_time>[\w\:\.]+))?'
+            ' +(?P<current_penalty>\d+)\/'
+            '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$',
+        p4_1=r'^(?P<status>[\*|d|s|h|\s])?'
+              '(?P<best>[\>|\s])?'
+              '(?P<pathtype>[e|i|\s])?'
+              ' +(?P<network>\S+\/\d{1,3})'
+              '(?P<peer>[1|2][\d\.\:]+)'
+              ' +(?P<flaps>\d+)'
+              ' +(?P<duration>[\w\:\.]+)'
+              '(?: +(?P<reuse_time>[\w\:\.]+))?'
+              ' +(?P<current_penalty>\d+)\/'
+              '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -3253,37 +3180,8 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
         sub_dict = {}
         history_paths = None
         dampened_paths = None
-        p1 = re.compile(r'^Flap +Statistics +for +VRF +'
-                            '(?P<vrf_name>[\w\-]+), +address +family +'
-                            '(?P<address_family>[\w\s\-]+):$')
-        p2 = re.compile(r'^Dampening +configured, +'
-                            '(?P<history_paths>\d+) +history +paths, +'
-                            '(?P<dampened_paths>\d+) +dampened +paths$')
-        p2_1 = re.compile(r'^Dampening +not +configured, +'
-                            '(?P<history_paths>\d+) +history +paths, +'
-                            '(?P<dampened_paths>\d+) +dampened +paths$')
-        p3 = re.compile(r'^Route +Distinguisher: +'
-                            '(?P<route_identifier>[\w\.\:]+)$')
-        p4 = re.compile(r'^(?P<status>[\*|d|s|h|\s])?'
-                            '(?P<best>[\>|\s])?'
-                            '(?P<pathtype>[e|i])?'
-                            ' +(?P<network>\S+)'
-                            ' +(?P<peer>[\w\/\.\:]+)'
-                            ' +(?P<flaps>\d+)'
-                            ' +(?P<duration>[\w\:\.]+)'
-                            '(?: +(?P<reuse_time>[\w\:\.]+))?'
-                            ' +(?P<current_penalty>\d+)\/'
-                            '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
-        p4_1 = re.compile(r'^(?P<status>[\*|d|s|h|\s])?'
-                            '(?P<best>[\>|\s])?'
-                            '(?P<pathtype>[e|i|\s])?'
-                            ' +(?P<network>\S+\/\d{1,3})'
-                            '(?P<peer>[1|2][\d\.\:]+)'
-                            ' +(?P<flaps>\d+)'
-                            ' +(?P<duration>[\w\:\.]+)'
-                            '(?: +(?P<reuse_time>[\w\:\.]+))?'
-                            ' +(?P<current_penalty>\d+)\/'
-                            '(?P<suppress_limit>\d+)\/(?P<reuse_limit>\d+)$')
+
+        p = ShowBgpAllDampeningFlapStatistics.patterns
 
         for line in out.splitlines():
             line = line.strip()
@@ -3298,7 +3196,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
                 sub_dict['history_paths'] = history_paths
 
             # Flap Statistics for VRF default, address family IPv4 Unicast:
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 address_family = m.groupdict()['address_family'].lower()
                 vrf = m.groupdict()['vrf_name']
@@ -3322,7 +3220,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
                 continue
 
             # Dampening configured, 0 history paths, 2 dampened paths
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 history_paths = int(m.groupdict()['history_paths'])
                 dampened_paths = int(m.groupdict()['dampened_paths'])
@@ -3330,7 +3228,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
                 continue
 
             # Dampening not configured, 0 history paths, 0 dampened paths
-            m = p2_1.match(line)
+            m = p.p2_1.match(line)
             if m:
                 history_paths = int(m.groupdict()['history_paths'])
                 dampened_paths = int(m.groupdict()['dampened_paths'])
@@ -3338,7 +3236,7 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
                 continue
 
             # Route Distinguisher: 0:0
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 route_identifier = m.groupdict()['route_identifier']
                 if 'route_identifier' not in ret_dict['vrf'][vrf]\
@@ -3357,10 +3255,10 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
 
             # d e 10.25.1.0/24       10.106.102.3                38   00:09:36 00:01:40  35/30/10
             # *>e 10.4.0.0/24       192.168.64.1                 1   00:20:56          570/1500/1000
-            m = p4.match(line)
+            m = p.p4.match(line)
 
             # d e [2]:[77][7,0][10.219.39.39,2,656877351][10.70.1.1,22][10.106.102.3,10.246.1.31]/61610.106.102.3                38   00:09:36 00:01:40 34/30/10
-            m1 = p4_1.match(line)
+            m1 = p.p4_1.match(line)
             m = m if m else m1
             if m:
                 network = m.groupdict()['network']
@@ -3390,224 +3288,81 @@ class ShowBgpAllDampeningFlapStatistics(ShowBgpAllDampeningFlapStatisticsSchema)
         return ret_dict
 
 
-    def xml(self):
-        out = self.device.execute(self.xml_command)
+    def xml(self, output=None):
+        if output is None:
+            output = self.device.execute(self.xml_command)
 
         etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-        if not vrf_root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_afi'.format(namespace))
-
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_afi'.format(namespace)):
-
-                # address_family
-                row_safi = af_root.find('{}TABLE_safi'.format(namespace))
-                row_safi = row_safi.find('{}ROW_safi'.format(namespace))
 
-                try:
-                    af = row_safi.find('{}af-name'.format(namespace)).text.lower()
-                except Exception:
+        for row in iter_rows(output, ['TABLE_vrf/ROW_vrf',
+                                      'TABLE_safi/ROW_safi',
+                                      'TABLE_rd/ROW_rd',
+                                      'TABLE_prefix/ROW_prefix'],
+                             command=self.cli_command):
+            if row.path == 'TABLE_rd/ROW_rd':
+                dicts = self._xml_rd(etree_dict, row)
+                if dicts is None:
                     continue
-
-                # rd table
-                rd = row_safi.find('{}TABLE_rd'.format(namespace))
-                if not rd:
-                    continue
-                else:
-                    if 'vrf' not in etree_dict:
-                        etree_dict['vrf'] = {}
-                    if vrf not in etree_dict['vrf']:
-                        etree_dict['vrf'][vrf] = {}
-
-                    if 'address_family' not in etree_dict['vrf'][vrf]:
-                        etree_dict['vrf'][vrf]['address_family'] = {}
-                    if af not in etree_dict['vrf'][vrf]['address_family']:
-                        etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                # -----   loop rd  -----
-                for rd_root in rd.findall('{}ROW_rd'.format(namespace)):
-                    # rd
-                    try:
-                        rd = rd_root.find('{}rd_val'.format(namespace)).text
-                    except Exception:
-                        rd = None
-
-                    # <dampeningenabled>true</dampeningenabled>
-                    try:
-                        dampeningenabled = rd_root.find('{}dampeningenabled'
-                                                        .format(namespace)).text
-                    except Exception:
-                        # <dampening>true</dampening>
-                        try:
-                            dampeningenabled = rd_root.find('{}dampening'
-                                                            .format(namespace)).text
-                        except Exception:
-                            pass
-                            
-                    # <historypaths>0</historypaths>
-                    historypaths = int(rd_root.find('{}historypaths'
-                                                    .format(namespace)).text)
-                    # <dampenedpaths>2</dampenedpaths>
-                    dampenedpaths = int(rd_root.find('{}dampenedpaths'
-                                                     .format(namespace)).text)
-
-                    if rd:
-                        # set default attributes under address family 
-                        # <dampeningenabled>true</dampeningenabled>
-                        if dampeningenabled == 'true':
-                            etree_dict['vrf'][vrf]['address_family'][af]['dampening_enabled'] = True
-
-                        # <historypaths>0</historypaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['history_paths'] = historypaths
-                        
-                        # <dampenedpaths>2</dampenedpaths>
-                        etree_dict['vrf'][vrf]['address_family'][af]['dampened_paths'] = dampenedpaths
-
-                        if 'route_identifier' not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'] = {}
-
-                        if rd not in etree_dict['vrf'][vrf]\
-                            ['address_family'][af]['route_identifier']:
-                            etree_dict['vrf'][vrf]['address_family'][af]\
-                                ['route_identifier'][rd] = {}
-
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['route_identifier'][rd]
-                    else:
-                        sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
-
-                    # <dampeningenabled>true</dampeningenabled>
-                    if dampeningenabled == 'true':
+                # <dampeningenabled>true</dampeningenabled>
+                # <dampening>true</dampening>
+                enabled = row.get('dampeningenabled', row.get('dampening'))
+                # set under the route identifier and the address family
+                for sub_dict in dicts:
+                    if enabled == 'true':
                         sub_dict['dampening_enabled'] = True
-
                     # <historypaths>0</historypaths>
-                    sub_dict['history_paths'] = historypaths
-
+                    sub_dict['history_paths'] = int(row['historypaths'])
                     # <dampenedpaths>2</dampenedpaths>
-                    sub_dict['dampened_paths'] = dampenedpaths
-
-                    # prefix table
-                    prefix = rd_root.find('{}TABLE_prefix'.format(namespace))
-                    if not prefix:
-                        continue
-
-                    # -----   loop prefix  -----
-                    for prefix_root in prefix.findall('{}ROW_prefix'.format(namespace)):
-
-                        # <ipprefix>10.25.1.0/24</ipprefix>
-                        try:
-                            network = prefix_root.find('{}ipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # ipv6prefix>2001::/112</ipv6prefix>
-                        try:
-                            network = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <nonipprefix>[2]:[0]:[0]:[48]:[0201.02ff.0302]:[32]:[10.81.1.1]/248</nonipprefix>
-                        try:
-                            network = prefix_root.find('{}nonipprefix'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'network' not in sub_dict:
-                            sub_dict['network'] = {}
-
-                        if network not in sub_dict['network']:
-                            sub_dict['network'][network] = {}
-
-                        # <status>d</status>
-                        sub_dict['network'][network]['status'] = \
-                            prefix_root.find('{}status'.format(namespace)).text
-
-                        # <pathtype>e</pathtype>
-                        sub_dict['network'][network]['pathtype'] = \
-                            prefix_root.find('{}pathtype'.format(namespace)).text
-
-                        # <peer>10.106.102.3</peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}peer'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <ipv6peer>2001:db8:8d82::2002</ipv6peer>
-                        try:
-                            sub_dict['network'][network]['peer'] = \
-                                prefix_root.find('{}ipv6peer'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <flapcount>39</flapcount>
-                        sub_dict['network'][network]['flaps'] = \
-                            int(prefix_root.find('{}flapcount'.format(namespace)).text)
-                            
-                        # <duration>00:09:53</duration>
-                        sub_dict['network'][network]['duration'] = \
-                            prefix_root.find('{}duration'.format(namespace)).text
-                            
-                        # <reuse>00:01:40</reuse>
-                        reuse = prefix_root.find('{}reuse'.format(namespace)).text
-                        if reuse:
-                            sub_dict['network'][network]['reuse_time'] = reuse
-                            
-                            
-                        # <penalty>34</penalty>
-                        penalty = prefix_root.find('{}penalty'.format(namespace)).text
-                        if penalty:
-                            sub_dict['network'][network]['current_penalty'] = int(penalty)
-                            
-                        # <suppresslimit>30</suppresslimit>
-                        sub_dict['network'][network]['suppress_limit'] = \
-                            int(prefix_root.find('{}suppresslimit'.format(namespace)).text)
-
-                       # <reuselimit>10</reuselimit>
-                        sub_dict['network'][network]['reuse_limit'] = \
-                            int(prefix_root.find('{}reuselimit'.format(namespace)).text)
+                    sub_dict['dampened_paths'] = int(row['dampenedpaths'])
+
+            elif row.path == 'TABLE_prefix/ROW_prefix':
+                dicts = self._xml_rd(etree_dict, row.parent)
+                # <ipprefix>10.25.1.0/24</ipprefix>
+                # <ipv6prefix>2001::/112</ipv6prefix>
+                # <nonipprefix>[2]:[0]:[0]:[48]:[0201.02ff.0302]:[32]:[10.81.1.1]/248</nonipprefix>
+                network = row.get('nonipprefix') or row.get('ipv6prefix') or \
+                    row.get('ipprefix')
+                if dicts is None or network is None:
+                    continue
+                network_dict = dicts[-1].setdefault('network', {})\
+                    .setdefault(network, {})
+
+                network_dict['status'] = row['status']
+                network_dict['pathtype'] = row['pathtype']
+                # <peer>10.106.102.3</peer>
+                # <ipv6peer>2001:db8:8d82::2002</ipv6peer>
+                peer = row.get('ipv6peer') or row.get('peer')
+                if peer:
+                    network_dict['peer'] = peer
+                network_dict['flaps'] = int(row['flapcount'])
+                network_dict['duration'] = row['duration']
+                if row.get('reuse'):
+                    network_dict['reuse_time'] = row['reuse']
+                if row.get('penalty'):
+                    network_dict['current_penalty'] = int(row['penalty'])
+                network_dict['suppress_limit'] = int(row['suppresslimit'])
+                network_dict['reuse_limit'] = int(row['reuselimit'])
+                network_dict['best'] = row['best'] != 'false'
 
-                       # <best>false</best>
-                        if prefix_root.find('{}best'.format(namespace)).text == 'false':
-                            sub_dict['network'][network]['best'] = False
-                        else:
-                            sub_dict['network'][network]['best'] = True                                                                                    
         return etree_dict
 
+    @staticmethod
+    def _xml_rd(etree_dict, rd_row):
+        '''dicts of the address family and of the route identifier of
+        rd_row, or the address family only without route identifier'''
+        safi_row = rd_row.parent
+        vrf = safi_row.parent.get('vrf-name-out')
+        af = safi_row.get('af-name')
+        if vrf is None or af is None:
+            return None
+        af_dict = etree_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+            .setdefault('address_family', {}).setdefault(af.lower(), {})
+        rd = rd_row.get('rd_val')
+        if not rd:
+            return [af_dict]
+        return [af_dict, af_dict.setdefault('route_identifier', {})
+                                .setdefault(rd, {})]
+
 
 # ==========================================
 # Parser for 'show bgp all nexthop-database'
@@ -3632,232 +3387,99 @@ class ShowBgpAllNexthopDatabase(ShowBgpVrfAllAllNextHopDatabase):
     def cli(self,output=None):
         return super().cli(cmd=self.cli_command,output=output)
 
-    def xml(self):
-        out = self.device.execute(self.xml_command)
+    def xml(self, output=None):
+        if output is None:
+            output = self.device.execute(self.xml_command)
 
         etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        vrf_root = Common.retrieve_xml_child(root=root, key='TABLE_nhvrf')
-        if not vrf_root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in vrf_root.findall('{}ROW_nhvrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}nhvrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
-
-            # address_family table
-            afi = vrf_tree.find('{}TABLE_nhafi'.format(namespace))
-
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_nhafi'.format(namespace)):
-
-                # address_family
-                row_safi = af_root.find('{}TABLE_nhsafi'.format(namespace))
-                af_root = row_safi.find('{}ROW_nhsafi'.format(namespace))
-                try:
-                    af = af_root.find('{}af-name'.format(namespace)).text.lower()
-                except Exception:
-                    continue
-
-                if 'address_family' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['address_family'] = {}
-                if af not in etree_dict['vrf'][vrf]['address_family']:
-                    etree_dict['vrf'][vrf]['address_family'][af] = {}
-
-                # af_nexthop_trigger_enable
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['af_nexthop_trigger_enable'] = True
 
+        for row in iter_rows(output, ['TABLE_nhvrf/ROW_nhvrf',
+                                      'TABLE_nhsafi/ROW_nhsafi',
+                                      'TABLE_nexthop/ROW_nexthop',
+                                      'TABLE_attachedhops/ROW_attachedhops'],
+                             command=self.cli_command):
+            if row.path == 'TABLE_nhvrf/ROW_nhvrf':
+                # <nhvrf-name-out>default</nhvrf-name-out>
+                if row.get('nhvrf-name-out') is not None:
+                    etree_dict.setdefault('vrf', {}).setdefault(
+                        row['nhvrf-name-out'], {})
+
+            elif row.path == 'TABLE_nhsafi/ROW_nhsafi':
+                af_dict = self._xml_af(etree_dict, row)
+                if af_dict is None:
+                    continue
+                af_dict['af_nexthop_trigger_enable'] = True
                 # <nhnoncriticaldelay>10000</nhnoncriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_non_critical'] = int(af_root.find('{}nhnoncriticaldelay'
-                                                             .format(namespace)).text)
+                af_dict['nexthop_trigger_delay_non_critical'] = \
+                    int(row['nhnoncriticaldelay'])
                 # <nhcriticaldelay>3000</nhcriticaldelay>
-                etree_dict['vrf'][vrf]['address_family'][af]\
-                    ['nexthop_trigger_delay_critical'] = int(af_root.find('{}nhcriticaldelay'
-                                                             .format(namespace)).text)
+                af_dict['nexthop_trigger_delay_critical'] = \
+                    int(row['nhcriticaldelay'])
 
-                # nexthop table
-                next_hop = af_root.find('{}TABLE_nexthop'.format(namespace))
-                if not next_hop:
+            elif row.path == 'TABLE_nexthop/ROW_nexthop':
+                sub_dict = self._xml_nexthop(etree_dict, row)
+                if sub_dict is None:
                     continue
+                sub_dict['refcount'] = int(row['refcount'])
+                sub_dict['igp_cost'] = int(row['igpmetric'])
+                # <multipath>false</multipath>
+                if row.get('multipath') is not None:
+                    sub_dict['multipath'] = \
+                        'No' if row['multipath'] == 'false' else 'Yes'
+                sub_dict['igp_route_type'] = int(row['igptype'])
+                sub_dict['igp_preference'] = int(row['igppref'])
+                # <attached>false</attached>
+                for tag, key in (('attached', 'attached'),
+                                 ('local', 'local'),
+                                 ('reachable', 'reachable'),
+                                 ('labeled', 'labeled'),
+                                 ('filtered', 'filtered'),
+                                 ('pendingupdate', 'pending_update')):
+                    sub_dict[key] = row[tag] != 'false'
+                sub_dict['resolve_time'] = row['resolvetime']
+                # <ribroute>192.168.154.1/32</ribroute>
+                # <ipv6ribroute>0::/0</ipv6ribroute>
+                rib_route = row.get('ipv6ribroute', row.get('ribroute'))
+                if rib_route is not None:
+                    sub_dict['rib_route'] = rib_route
+                sub_dict['metric_next_advertise'] = \
+                    row['nextadvertise'].lower()
+                sub_dict['rnh_epoch'] = int(row['rnhepoch'])
 
-                # -----   loop nexthop  -----
-                for nexthop_root in next_hop.findall('{}ROW_nexthop'.format(namespace)):
-                    # nexthop
-                    # <ipnexthop-out>192.168.154.1</ipnexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipnexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    # <ipv6nexthop-out>2001:db8:400::3:1</ipv6nexthop-out>
-                    try:
-                        nexthop = nexthop_root.find('{}ipv6nexthop-out'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    if 'next_hop' not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'] = {}
-
-                    if nexthop not in etree_dict['vrf'][vrf]\
-                        ['address_family'][af]['next_hop']:
-                        etree_dict['vrf'][vrf]['address_family'][af]\
-                            ['next_hop'][nexthop] = {}
-
-                    sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                        ['next_hop'][nexthop]
-
-                    # <refcount>1</refcount>
-                    sub_dict['refcount'] = int(nexthop_root.find(
-                                                '{}refcount'.format(namespace)).text)
-
-                    # <igpmetric>3</igpmetric>
-                    sub_dict['igp_cost'] = \
-                        int(nexthop_root.find('{}igpmetric'.format(namespace)).text)
-
-                    # <multipath>false</multipath>
-                    try:
-                        if nexthop_root.find('{}multipath'.format(namespace)).text == 'false':
-                            sub_dict['multipath'] = 'No'
-                        else:
-                            sub_dict['multipath'] = 'Yes'
-                    except Exception:
-                        pass
-
-                    # <igptype>0</igptype>
-                    sub_dict['igp_route_type'] = \
-                        int(nexthop_root.find('{}igptype'.format(namespace)).text)
-
-                    # <igppref>110</igppref>
-                    sub_dict['igp_preference'] = \
-                        int(nexthop_root.find('{}igppref'.format(namespace)).text)
-
-                    # <attached>false</attached>
-                    if nexthop_root.find('{}attached'.format(namespace)).text == 'false':
-                        sub_dict['attached'] = False
-                    else:
-                        sub_dict['attached'] = True
-
-
-                    # <local>false</local>
-                    if nexthop_root.find('{}local'.format(namespace)).text == 'false':
-                        sub_dict['local'] = False
-                    else:
-                        sub_dict['local'] = True
-
-                    # <reachable>true</reachable>
-                    if nexthop_root.find('{}reachable'.format(namespace)).text == 'false':
-                        sub_dict['reachable'] = False
-                    else:
-                        sub_dict['reachable'] = True
-
-                    # <labeled>true</labeled>
-                    if nexthop_root.find('{}labeled'.format(namespace)).text == 'false':
-                        sub_dict['labeled'] = False
-                    else:
-                        sub_dict['labeled'] = True
-
-                    # <filtered>false</filtered>
-                    if nexthop_root.find('{}filtered'.format(namespace)).text == 'false':
-                        sub_dict['filtered'] = False
-                    else:
-                        sub_dict['filtered'] = True
-
-                    # <pendingupdate>false</pendingupdate>
-                    if nexthop_root.find('{}pendingupdate'.format(namespace)).text == 'false':
-                        sub_dict['pending_update'] = False
-                    else:
-                        sub_dict['pending_update'] = True
-
-                    # <resolvetime>18:38:21</resolvetime>
-                    sub_dict['resolve_time'] = \
-                        nexthop_root.find('{}resolvetime'.format(namespace)).text
-
-                    # <ribroute>192.168.154.1/32</ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ribroute'.format(namespace)).text
-                    except Exception:
-                        pass                    
-
-                    # <ipv6ribroute>0::/0</ipv6ribroute>
-                    try:
-                        sub_dict['rib_route'] = \
-                            nexthop_root.find('{}ipv6ribroute'.format(namespace)).text
-                    except Exception:
-                        pass
-
-                    # <nextadvertise>Never</nextadvertise>
-                    sub_dict['metric_next_advertise'] = \
-                        nexthop_root.find('{}nextadvertise'.format(namespace)).text.lower()
-
-                    # <rnhepoch>1</rnhepoch>
-                    sub_dict['rnh_epoch'] = \
-                        int(nexthop_root.find('{}rnhepoch'.format(namespace)).text)
-
-
-                    # attachedhops table
-                    attached = nexthop_root.find('{}TABLE_attachedhops'.format(namespace))
-                    if not attached:
-                        continue
+            else:
+                sub_dict = self._xml_nexthop(etree_dict, row.parent)
+                # <attachedhop>192.168.66.2</attachedhop>
+                # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
+                att_hop = row.get('ipv6attachedhop', row.get('attachedhop'))
+                if sub_dict is None or att_hop is None:
+                    continue
+                # <interface>port-channel2.100</interface>
+                sub_dict.setdefault('attached_nexthop', {}).setdefault(
+                    att_hop, {})['attached_nexthop_interface'] = \
+                    row['interface']
 
-                    # -----   loop attachedhops  -----
-                    for attach_root in attached.findall('{}ROW_attachedhops'.format(namespace)):
-
-                        # <attachedhop>192.168.66.2</attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                        # <ipv6attachedhop>fe80::6e9c:edff:fe4d:ff41</ipv6attachedhop>
-                        try:
-                            att_hop = attach_root.find('{}ipv6attachedhop'.format(namespace)).text
-                        except Exception:
-                            pass
-                           
-                        if 'attached_nexthop' not in sub_dict:
-                            sub_dict['attached_nexthop'] = {}
-
-                        if att_hop not in sub_dict['attached_nexthop']:
-                            sub_dict['attached_nexthop'][att_hop] = {}
-
-                        # <interface>port-channel2.100</interface>
-                        sub_dict['attached_nexthop'][att_hop]['attached_nexthop_interface'] = \
-                            attach_root.find('{}interface'.format(namespace)).text                                                                                                          
         return etree_dict
 
+    @staticmethod
+    def _xml_af(etree_dict, safi_row):
+        # the vrf row holds TABLE_nhafi/ROW_nhafi, holding the safi row
+        vrf = safi_row.parent.get('nhvrf-name-out')
+        af = safi_row.get('af-name')
+        if vrf is None or af is None:
+            return None
+        return etree_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+            .setdefault('address_family', {}).setdefault(af.lower(), {})
+
+    def _xml_nexthop(self, etree_dict, nexthop_row):
+        # <ipnexthop-out>192.168.154.1</ipnexthop-out>
+        # <ipv6nexthop-out>2001:db8:400::3:1</ipv6nexthop-out>
+        nexthop = nexthop_row.get('ipv6nexthop-out',
+                                  nexthop_row.get('ipnexthop-out'))
+        af_dict = self._xml_af(etree_dict, nexthop_row.parent)
+        if af_dict is None or nexthop is None:
+            return None
+        return af_dict.setdefault('next_hop', {}).setdefault(nexthop, {})
+
 
 # ===================================
 # Schema for 'show bgp peer-template'
@@ -3933,6 +3555,45 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
     cli_command = 'show bgp peer-template'
     xml_command = 'show bgp peer-template | xml'
 
+    patterns = Patterns(
+        p1=r'^BGP +peer\-template +is +'
+            '(?P<template>[\w\-]+)$',
+        p2=r'^Using +(?P<intf>[\w\-\/\.]+) +as'
+            ' +update +source +for +this +peer$',
+        p3=r'^Peer +is +low\-memory +exempt$',
+        p4=r'^Disable +logging +neighbor +events$',
+        p5=r'^External +BGP +peer +might +be +up +to'
+            ' +(?P<hops>\d+) +hops +away$',
+        p6=r'^Only +passive +connection +setup +allowed$',
+        p23=r'^Neighbor +local\-as +command +not +active$',
+        p7=r'^For +address +family: +(?P<af>[\w\s\-]+)$',
+        p8=r'^Condition\-map +(?P<con_map>[\w\-]+), +'
+            'Advertise\-map +(?P<adv_map>[\w\-]+), +'
+            'Status +(?P<status>[\w\-]+)$',
+        p25=r'^Inbound +soft +reconfiguration +allowed(?: *\(always\))?$',
+        p9=r'^Community +attribute +sent +to +this +neighbor$',
+        p10=r'^Extended +community +attribute +sent +'
+             'to +this +neighbor$',
+        p11=r'^Nexthop(?: +always)? +set +to +local +'
+             'peering +address, +(?P<local_nexthop>[\w\.\:]+)$',
+        p12=r'^Third\-party +Nexthop +will +not +be +computed.$',
+        p13=r'^Maximum +prefixes +allowed +(?P<max_pfx>\d+)$',
+        p14=r'^SOO +Extcommunity: +(?P<soo>[\w\:\.]+)$',
+        p15=r'^Weight: +(?P<weight>\d+)$',
+        p16=r'^Allow +my +ASN +(?P<asn>\d+) +times$',
+        p17=r'^ASN +override +is +(?P<status>\w+)$',
+        p24=r'^Peer +ASN +check +is +disabled$',
+        p18=r'^Inbound +(?P<type>[\w\-\s]+) +configured'
+             ' +is +(?P<name>[\w\-]+)$',
+        p19=r'^Outbound +(?P<type>[\w\-\s]+) +configured'
+             ' +is +(?P<name>[\w\-]+)$',
+        p20=r'^Default +information +originate(, +'
+             'route-map +(?P<map>[\w\-]+))? +(?P<dummy>.*)$',
+        p21=r'^Unsuppress\-map +(?P<map>[\w\-]+) +configured$',
+        p22=r'^Members +of +peer\-template +(?P<peer>[\w\-]+):$',
+        p22_1=r'^(?P<vrf>[\w\-]+): +(?P<neighbor>[\w\:\.]+)$',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -3944,48 +3605,13 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
         sub_dict = {}
         tem_peer = None
 
-        p1 = re.compile(r'^BGP +peer\-template +is +'
-                            '(?P<template>[\w\-]+)$')
-        p2 = re.compile(r'^Using +(?P<intf>[\w\-\/\.]+) +as'
-                            ' +update +source +for +this +peer$')
-        p3 = re.compile(r'^Peer +is +low\-memory +exempt$')
-        p4 = re.compile(r'^Disable +logging +neighbor +events$')
-        p5 = re.compile(r'^External +BGP +peer +might +be +up +to'
-                            ' +(?P<hops>\d+) +hops +away$')
-        p6 = re.compile(r'^Only +passive +connection +setup +allowed$')
-        p23 = re.compile(r'^Neighbor +local\-as +command +not +active$')
-        p7 = re.compile(r'^For +address +family: +(?P<af>[\w\s\-]+)$')
-        p8 = re.compile(r'^Condition\-map +(?P<con_map>[\w\-]+), +'
-                            'Advertise\-map +(?P<adv_map>[\w\-]+), +'
-                            'Status +(?P<status>[\w\-]+)$')
-        p25 = re.compile(r'^Inbound +soft +reconfiguration +allowed(?: *\(always\))?$')
-        p9 = re.compile(r'^Community +attribute +sent +to +this +neighbor$')
-        p10 = re.compile(r'^Extended +community +attribute +sent +'
-                            'to +this +neighbor$')
-        p11 = re.compile(r'^Nexthop(?: +always)? +set +to +local +'
-                            'peering +address, +(?P<local_nexthop>[\w\.\:]+)$')
-        p12 = re.compile(r'^Third\-party +Nexthop +will +not +be +computed.$')
-        p13 = re.compile(r'^Maximum +prefixes +allowed +(?P<max_pfx>\d+)$')
-        p14 = re.compile(r'^SOO +Extcommunity: +(?P<soo>[\w\:\.]+)$')
-        p15 = re.compile(r'^Weight: +(?P<weight>\d+)$')
-        p16 = re.compile(r'^Allow +my +ASN +(?P<asn>\d+) +times$')
-        p17 = re.compile(r'^ASN +override +is +(?P<status>\w+)$')
-        p24 = re.compile(r'^Peer +ASN +check +is +disabled$')
-        p18 = re.compile(r'^Inbound +(?P<type>[\w\-\s]+) +configured'
-                            ' +is +(?P<name>[\w\-]+)$')
-        p19 = re.compile(r'^Outbound +(?P<type>[\w\-\s]+) +configured'
-                            ' +is +(?P<name>[\w\-]+)$')
-        p20 = re.compile(r'^Default +information +originate(, +'
-                            'route-map +(?P<map>[\w\-]+))? +(?P<dummy>.*)$')
-        p21 = re.compile(r'^Unsuppress\-map +(?P<map>[\w\-]+) +configured$')
-        p22 = re.compile(r'^Members +of +peer\-template +(?P<peer>[\w\-]+):$')
-        p22_1 = re.compile(r'^(?P<vrf>[\w\-]+): +(?P<neighbor>[\w\:\.]+)$')
+        p = ShowBgpPeerTemplateCmd.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # BGP peer-template is PEER2
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 template = m.groupdict()['template']
 
@@ -4004,45 +3630,45 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 continue
 
             # Using loopback1 as update source for this peer
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['template'][template]['source_interface'] = \
                     m.groupdict()['intf']
                 continue
 
             # Peer is low-memory exempt
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 ret_dict['template'][template]['low_mem_exempt'] = True
                 continue
 
             # Disable logging neighbor events
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ret_dict['template'][template]['logging_neighbor_events'] = False
                 continue
 
             # External BGP peer might be up to 100 hops away
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 ret_dict['template'][template]['external_bgp_peer_hops_limit'] = \
                     int(m.groupdict()['hops'])
                 continue
 
             # Only passive connection setup allowed
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ret_dict['template'][template]['passive_only'] = True
                 continue
 
             # Neighbor local-as command not active
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
                 ret_dict['template'][template]['local_as_inactive'] = True
                 continue
 
             # For address family: IPv4 Unicast
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 af = m.groupdict()['af'].lower()
 
@@ -4064,7 +3690,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 continue
 
             # Condition-map DENY_ALL_RM, Advertise-map BLOCK-ALL, Status Advertise
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 sub_dict['condition_map'] = m.groupdict()['con_map']
                 sub_dict['advertise_map'] = m.groupdict()['adv_map']
@@ -4072,63 +3698,63 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 continue
 
             # Inbound soft reconfiguration allowed(always)
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 sub_dict['in_soft_reconfig_allowed'] = True
                 continue
 
             # Community attribute sent to this neighbor
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 sub_dict['send_community'] = True
                 continue
 
             # Extended community attribute sent to this neighbor
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 sub_dict['send_ext_community'] = True
                 continue
 
             # Nexthop always set to local peering address, 0.0.0.0
             # Nexthop set to local peering address, 0.0.0.0
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 sub_dict['local_nexthop'] = m.groupdict()['local_nexthop']
                 continue
 
             # Third-party Nexthop will not be computed.
             # will enhance this when output for third_party_nexthop is enabled
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 sub_dict['third_party_nexthop'] = False
                 continue
 
             # Maximum prefixes allowed 888888888
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 sub_dict['max_pfx'] = int(m.groupdict()['max_pfx'])
                 continue
 
             # SOO Extcommunity: SOO:10.4.1.1:100
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 sub_dict['soo'] = m.groupdict()['soo']
                 continue
 
             # Weight: 9999
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 sub_dict['weight'] = int(m.groupdict()['weight'])
                 continue
 
             # Allow my ASN 10 times
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
                 sub_dict['allow_as_in'] = int(m.groupdict()['asn'])
                 continue
 
             # ASN override is enabled
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 if m.groupdict()['status'] == 'enabled':
                     sub_dict['as_override'] = True
@@ -4137,14 +3763,14 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
                 continue
 
             # Peer ASN check is disabled
-            m = p24.match(line)
+            m = p.p24.match(line)
             if m:
                 sub_dict['peer_as_check_disabled'] = True
                 continue
 
             # Inbound ip prefix-list configured is LIST123
             # Inbound route-map configured is PERMIT_ROUTE_IPV4_RM
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 name = m.groupdict()['name']
                 policy_type = m.groupdict()['type']
@@ -4161,7 +3787,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
             # Outbound ip prefix-list configured is LIST456
             # Outbound route-map configured is PERMIT_IPV6_RM
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 name = m.groupdict()['name']
                 policy_type = m.groupdict()['type']
@@ -4178,7 +3804,7 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
 
             # Default information originate, route-map PASS-ALL  Last End-of-RIB sent 0.000000 after session start
             # Default information originate  Last End-of-RIB sent 0.000000 after session start
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 sub_dict['default_originate'] = True
                 if m.groupdict()['map']:
@@ -4188,19 +3814,19 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
             # First convergence 0.000000 after session start with 0 routes sent
 
             # Unsuppress-map ORIGINATE_IPV6 configured
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 sub_dict['unsuppress_map'] = m.groupdict()['map']
                 continue
 
             # Members of peer-template PEER1:
             # default: 10.186.201.1
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 tem_peer = m.groupdict()['peer']
                 continue
 
-            m = p22_1.match(line)
+            m = p.p22_1.match(line)
             if m and tem_peer:
                 if 'vrf' not in ret_dict['template'][tem_peer]:
                     ret_dict['template'][tem_peer]['vrf'] = {}
@@ -4229,348 +3855,128 @@ class ShowBgpPeerTemplateCmd(ShowBgpPeerTemplateCmdSchema):
         return ret_dict
 
 
-    def xml(self):
-        out = self.device.execute(self.xml_command)
+    # (tag, key) of the fields of 'show bgp peer-template | xml'
+    xml_template_bools = [
+        ('lowmemexempt', 'low_mem_exempt'),
+        ('ttlsecurity', 'logging_neighbor_events'),
+        ('passiveonly', 'passive_only'),
+        ('localas-inactive', 'local_as_inactive'),
+        ('remove-privateas', 'remove_private_as'),
+    ]
+    xml_af_bools = [
+        ('insoftreconfigallowed', 'in_soft_reconfig_allowed'),
+        ('sendcommunity', 'send_community'),
+        ('sendextcommunity', 'send_ext_community'),
+        ('thirdpartynexthop', 'third_party_nexthop'),
+        ('asoverride', 'as_override'),
+        ('peerascheckdisabled', 'peer_as_check_disabled'),
+        ('rrconfigured', 'rr_configured'),
+        ('defaultoriginate', 'default_originate'),
+    ]
+    # (tag, key, conversion)
+    xml_af_keys = [
+        ('conditionmap', 'condition_map', str),
+        ('advertisemap', 'advertise_map', str),
+        ('advertisemapstatus', 'advertise_map_status', str.lower),
+        ('localnexthop', 'local_nexthop', str),
+        ('maxpfx', 'max_pfx', int),
+        ('soo', 'soo', str),
+        ('weight', 'weight', int),
+        ('allowasin', 'allow_as_in', int),
+        ('defaultoriginatermap', 'default_originate_route_map', str),
+        ('unsuppress-map', 'unsuppress_map', str),
+    ]
+
+    def xml(self, output=None):
+        if output is None:
+            output = self.device.execute(self.xml_command)
 
         etree_dict = {}
-        sub_dict = {}
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                expect_command=self.cli_command)
-
-        # top table root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_neighbor')
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for peer_tree in root.findall('{}ROW_neighbor'.format(namespace)):
-            # vrf
-            try:
-                template = peer_tree.find('{}templatepeer'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'template' not in etree_dict:
-                etree_dict['template'] = {}
-            if template not in etree_dict['template']:
-                etree_dict['template'][template] = {}
-
-            # <sourceif>loopback1</sourceif>
-            try:
-                etree_dict['template'][template]['source_interface'] = \
-                    peer_tree.find('{}sourceif'.format(namespace)).text
-            except Exception:
-                pass
-
-            # <lowmemexempt>true</lowmemexempt>
-            try:
-                if peer_tree.find('{}lowmemexempt'.format(namespace)).text == 'true':
-                    etree_dict['template'][template]['low_mem_exempt'] = True
-                else:
-                    etree_dict['template'][template]['low_mem_exempt'] = False
-            except Exception:
-                pass
 
-            # <ttlsecurity>false</ttlsecurity>
-            if peer_tree.find('{}ttlsecurity'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['logging_neighbor_events'] = True
-            else:
-                etree_dict['template'][template]['logging_neighbor_events'] = False
-
-            # <passiveonly>true</passiveonly>
-            if peer_tree.find('{}passiveonly'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['passive_only'] = True
-            else:
-                etree_dict['template'][template]['passive_only'] = False
-
-            # <localas-inactive>false</localas-inactive>
-            if peer_tree.find('{}localas-inactive'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['local_as_inactive'] = True
-            else:
-                etree_dict['template'][template]['local_as_inactive'] = False
-
-            # <remove-privateas>false</remove-privateas>
-            if peer_tree.find('{}remove-privateas'.format(namespace)).text == 'true':
-                etree_dict['template'][template]['remove_private_as'] = True
-            else:
-                etree_dict['template'][template]['remove_private_as'] = False
-
-            # <ttllimit>100</ttllimit>
-            try:
-                etree_dict['template'][template]['external_bgp_peer_hops_limit'] = \
-                    int(peer_tree.find('{}ttllimit'.format(namespace)).text)
-            except Exception:
-                pass
-
-             # vrf table
-            vrf_tree = peer_tree.find('{}TABLE_vrf'.format(namespace))
-            if vrf_tree:
-                # -----   loop vrf  -----
-                for vrf_root in vrf_tree.findall('{}ROW_vrf'.format(namespace)):
-                    # <vrf-name>default</vrf-name>
-                    try:
-                        vrf = vrf_root.find('{}vrf-name'.format(namespace)).text.lower()
-                    except Exception:
-                        continue
-
-                    # inheritingpeer table
-                    inherit_tree = vrf_root.find('{}TABLE_inheritingpeer'.format(namespace))
-                    if not inherit_tree:
-                        continue
-
-                    # -----   loop inheritingpeer  -----
-                    for inherit_root in inherit_tree.findall('{}ROW_inheritingpeer'
-                                                             .format(namespace)):
-
-                        # <inheritingpeer>10.186.201.1</inheritingpeer>
-                        try:
-                            inherit_peer = inherit_root.find('{}inheritingpeer'
-                                                             .format(namespace)).text.lower()
-                        except Exception:
-                            continue
-                        if 'vrf' not in etree_dict['template'][template]:
-                            etree_dict['template'][template]['vrf'] = {}
-                        if vrf not in etree_dict['template'][template]['vrf']:
-                            etree_dict['template'][template]['vrf'][vrf] = {}
-
-                        if 'inheriting_peer' not in etree_dict['template']\
-                            [template]['vrf'][vrf]:
-                            etree_dict['template'][template]['vrf'][vrf]\
-                                ['inheriting_peer'] = {}
-                            
-                        if inherit_peer not in etree_dict['template']\
-                            [template]['vrf'][vrf]['inheriting_peer']:
-                            etree_dict['template'][template]['vrf'][vrf]\
-                                ['inheriting_peer'][inherit_peer] = {}
-
-                        etree_dict['template'][template]['vrf'][vrf]\
-                                ['inheriting_peer'][inherit_peer]['inheriting_peer'] = inherit_peer
-
-
-            # address_family table
-            afi = peer_tree.find('{}TABLE_peraf'.format(namespace))
-
-            # -----   loop address_family  -----
-            for af_root in afi.findall('{}ROW_peraf'.format(namespace)):
-
-                try:
-                    # address_family
-                    row_safi = af_root.find('{}TABLE_persaf'.format(namespace))
-                    af_root = row_safi.find('{}ROW_persaf'.format(namespace))
-                    af = af_root.find('{}per-af-name'.format(namespace)).text.lower()
-                except Exception:
+        for row in iter_rows(output, ['TABLE_neighbor/ROW_neighbor',
+                                      'TABLE_vrf/ROW_vrf',
+                                      'TABLE_inheritingpeer/ROW_inheritingpeer',
+                                      'TABLE_persaf/ROW_persaf',
+                                      'TABLE_inpolicy/ROW_inpolicy',
+                                      'TABLE_outpolicy/ROW_outpolicy'],
+                             command=self.cli_command):
+            if row.path == 'TABLE_neighbor/ROW_neighbor':
+                template_dict = self._xml_template(etree_dict, row)
+                if template_dict is None:
                     continue
-
-                if 'address_family' not in etree_dict['template'][template]:
-                    etree_dict['template'][template]['address_family'] = {}
-                if af not in etree_dict['template'][template]['address_family']:
-                    etree_dict['template'][template]['address_family'][af] = {}
-
-                sub_dict = etree_dict['template'][template]['address_family'][af]
-
+                # <sourceif>loopback1</sourceif>
+                if row.get('sourceif') is not None:
+                    template_dict['source_interface'] = row['sourceif']
+                # <lowmemexempt>true</lowmemexempt>
+                for tag, key in self.xml_template_bools:
+                    if tag in row:
+                        template_dict[key] = row[tag] == 'true'
+                # <ttllimit>100</ttllimit>
+                if row.get('ttllimit') is not None:
+                    template_dict['external_bgp_peer_hops_limit'] = \
+                        int(row['ttllimit'])
+
+            elif row.path == 'TABLE_inheritingpeer/ROW_inheritingpeer':
+                vrf_row = row.parent
+                template_dict = self._xml_template(etree_dict, vrf_row.parent)
+                # <vrf-name>default</vrf-name>
+                # <inheritingpeer>10.186.201.1</inheritingpeer>
+                if template_dict is None or \
+                   vrf_row.get('vrf-name') is None or \
+                   row.get('inheritingpeer') is None:
+                    continue
+                inherit_peer = row['inheritingpeer'].lower()
+                template_dict.setdefault('vrf', {})\
+                    .setdefault(vrf_row['vrf-name'].lower(), {})\
+                    .setdefault('inheriting_peer', {})\
+                    .setdefault(inherit_peer, {})['inheriting_peer'] = \
+                    inherit_peer
+
+            elif row.path == 'TABLE_persaf/ROW_persaf':
+                sub_dict = self._xml_af(etree_dict, row)
+                if sub_dict is None:
+                    continue
+                # <insoftreconfigallowed>false</insoftreconfigallowed>
+                for tag, key in self.xml_af_bools:
+                    if tag in row:
+                        sub_dict[key] = row[tag] == 'true'
                 # <conditionmap>DENY_ALL_RM</conditionmap>
-                try:
-                    sub_dict['condition_map'] = \
-                        af_root.find('{}conditionmap'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <advertisemap>BLOCK-ALL</advertisemap>
-                try:
-                    sub_dict['advertise_map'] = \
-                        af_root.find('{}advertisemap'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <advertisemapstatus>Advertise</advertisemapstatus>
-                try:
-                    sub_dict['advertise_map_status'] = \
-                        af_root.find('{}advertisemapstatus'.format(namespace)).text.lower()
-                except Exception:
-                    pass
-
-                try:
-                    # <insoftreconfigallowed>false</insoftreconfigallowed>
-                    if af_root.find('{}insoftreconfigallowed'.format(namespace)).text == 'true':
-                        sub_dict['in_soft_reconfig_allowed'] = True
-                    else:
-                        sub_dict['in_soft_reconfig_allowed'] = False
-                except Exception:
-                    pass
-
-                # <sendcommunity>true</sendcommunity>
-                try:
-                    if af_root.find('{}sendcommunity'.format(namespace)).text == 'true':
-                        sub_dict['send_community'] = True
-                    else:
-                        sub_dict['send_community'] = False
-                except Exception:
-                    pass
-
-                # <sendextcommunity>true</sendextcommunity>
-                try:
-                    if af_root.find('{}sendextcommunity'.format(namespace)).text == 'true':
-                        sub_dict['send_ext_community'] = True
-                    else:
-                        sub_dict['send_ext_community'] = False
-                except Exception:
-                    pass
-
-                # <thirdpartynexthop>false</thirdpartynexthop>
-                try:
-                    if af_root.find('{}thirdpartynexthop'.format(namespace)).text == 'true':
-                        sub_dict['third_party_nexthop'] = True
-                    else:
-                        sub_dict['third_party_nexthop'] = False
-                except Exception:
-                    pass
-
-                # <asoverride>true</asoverride>
-                try:
-                    if af_root.find('{}asoverride'.format(namespace)).text == 'true':
-                        sub_dict['as_override'] = True
-                    else:
-                        sub_dict['as_override'] = False
-                except Exception:
-                    pass
-
-                # <peerascheckdisabled>false</peerascheckdisabled>
-                try:
-                    if af_root.find('{}peerascheckdisabled'.format(namespace)).text == 'true':
-                        sub_dict['peer_as_check_disabled'] = True
-                    else:
-                        sub_dict['peer_as_check_disabled'] = False
-                except Exception:
-                    pass
-
-                # <rrconfigured>false</rrconfigured>
-                try:
-                    if af_root.find('{}rrconfigured'.format(namespace)).text == 'true':
-                        sub_dict['rr_configured'] = True
-                    else:
-                        sub_dict['rr_configured'] = False
-                except:
-                    Exception
-
-                # <localnexthop>0.0.0.0</localnexthop>
-                try:
-                    sub_dict['local_nexthop'] = \
-                        af_root.find('{}localnexthop'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <maxpfx>888888888</maxpfx>
-                try:
-                    sub_dict['max_pfx'] = \
-                        int(af_root.find('{}maxpfx'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <soo>SOO:10.4.1.1:100</soo>
-                try:
-                    sub_dict['soo'] = \
-                        af_root.find('{}soo'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <weight>9999</weight>
-                try:
-                    sub_dict['weight'] = \
-                        int(af_root.find('{}weight'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <allowasin>10</allowasin>
-                try:
-                    sub_dict['allow_as_in'] = \
-                        int(af_root.find('{}allowasin'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <defaultoriginate>true</defaultoriginate>
-                try:
-                    if af_root.find('{}defaultoriginate'.format(namespace)).text == 'true':
-                        sub_dict['default_originate'] = True
-                    else:
-                        sub_dict['default_originate'] = False
-                except Exception:
-                    pass
-
-                # <defaultoriginatermap>PASS-ALL</defaultoriginatermap>
-                try:
-                    sub_dict['default_originate_route_map'] = \
-                        af_root.find('{}defaultoriginatermap'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <unsuppress-map>ORIGINATE_IPV6</unsuppress-map>
-                try:
-                    sub_dict['unsuppress_map'] = \
-                        af_root.find('{}unsuppress-map'.format(namespace)).text
-                except Exception:
-                    pass
-                
-
-                # TABLE_inpolicy table
-                policy = af_root.find('{}TABLE_inpolicy'.format(namespace))
-
-                if policy:
-                    # -----   loop in policy  -----
-                    for policy_root in policy.findall('{}ROW_inpolicy'.format(namespace)):
-                        try:
-                            policy = policy_root.find('{}inpolicyname'.format(namespace)).text
-                        except Exception:
-                            continue
-
-                        if 'in_policy' not in sub_dict:
-                            sub_dict['in_policy'] = {}
-                        if policy not in sub_dict['in_policy']:
-                            sub_dict['in_policy'][policy] = {}
-
-                        sub_dict['in_policy'][policy]['name'] = policy
-
-                        # <inpolicytype>route-map</inpolicytype>
-                        sub_dict['in_policy'][policy]['type'] = \
-                            policy_root.find('{}inpolicytype'.format(namespace)).text
-
-                # TABLE_outpolicy table
-                policy = af_root.find('{}TABLE_outpolicy'.format(namespace))
-
-                if policy:
-                    # -----   loop in policy  -----
-                    for policy_root in policy.findall('{}ROW_outpolicy'.format(namespace)):
-                        try:
-                            policy = policy_root.find('{}outpolicyname'.format(namespace)).text
-                        except Exception:
-                            continue
-                        if 'out_policy' not in sub_dict:
-                            sub_dict['out_policy'] = {}
-                        if policy not in sub_dict['out_policy']:
-                            sub_dict['out_policy'][policy] = {}
+                for tag, key, convert in self.xml_af_keys:
+                    if row.get(tag) is not None:
+                        sub_dict[key] = convert(row[tag])
+
+            elif row.path != 'TABLE_vrf/ROW_vrf':
+                # <inpolicyname>PASS-ALL</inpolicyname>
+                # <inpolicytype>route-map</inpolicytype>
+                direction = 'in' if row.path == 'TABLE_inpolicy/ROW_inpolicy' \
+                    else 'out'
+                sub_dict = self._xml_af(etree_dict, row.parent)
+                policy = row.get(direction + 'policyname')
+                if sub_dict is None or policy is None:
+                    continue
+                policy_dict = sub_dict.setdefault(direction + '_policy', {})\
+                    .setdefault(policy, {})
+                policy_dict['name'] = policy
+                policy_dict['type'] = row[direction + 'policytype']
 
-                        sub_dict['out_policy'][policy]['name'] = policy
+        return etree_dict
 
-                        # <outpolicytype>route-map</outpolicytype>
-                        sub_dict['out_policy'][policy]['type'] = \
-                            policy_root.find('{}outpolicytype'.format(namespace)).text
+    @staticmethod
+    def _xml_template(etree_dict, neighbor_row):
+        # <templatepeer>PEER1</templatepeer>
+        template = neighbor_row.get('templatepeer')
+        if template is None:
+            return None
+        return etree_dict.setdefault('template', {}).setdefault(template, {})
 
-                                                                                                                         
-        return etree_dict
+    def _xml_af(self, etree_dict, persaf_row):
+        # the neighbor row holds TABLE_peraf/ROW_peraf, holding the safi row
+        template_dict = self._xml_template(etree_dict, persaf_row.parent)
+        af = persaf_row.get('per-af-name')
+        if template_dict is None or af is None:
+            return None
+        return template_dict.setdefault('address_family', {})\
+            .setdefault(af.lower(), {})
 
 
 # ==============================================================================
@@ -4622,6 +4028,23 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
         show bgp [vrf <vrf>] <address_family>  policy statistics neighbor <neighbor>
         parser class implements detail parsing mechanisms for cli,xml output"""
     
+    patterns = Patterns(
+        p1=r'^Details +for +VRF +'
+            '(?P<vrf>[\w\-]+)$',
+        p2=r'^Total +count +for +(?P<type>\w+) +rpm +handles: +'
+            '(?P<handles>\d+)$',
+        p3=r'^BGP +policy +statistics +not +available$',
+        p4=r'^route\-map +(?P<name>\S+) +'
+            '(?P<action>\w+) +(?P<seqnum>\d+)$',
+        p5=r'^(?P<command>[\w\s\-\>]+) +'
+            'C: +(?P<compare_count>\d+) +'
+            'M: +(?P<match_count>\d+)$',
+        p6=r'^Total +accept +count +for +policy: +'
+            '(?P<total_accept_count>\d+)$',
+        p7=r'^Total +reject +count +for +policy: +'
+            '(?P<total_reject_count>\d+)$',
+    )
+
     def cli(self, cmd,output=None):
         if output is None:
             out = self.device.execute(cmd)
@@ -4641,26 +4064,14 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
                 vrf = ''
         else:
             vrf = 'default'
-        p1 = re.compile(r'^Details +for +VRF +'
-                            '(?P<vrf>[\w\-]+)$')
-        p2 = re.compile(r'^Total +count +for +(?P<type>\w+) +rpm +handles: +'
-                            '(?P<handles>\d+)$')
-        p3 = re.compile(r'^BGP +policy +statistics +not +available$')
-        p4 = re.compile(r'^route\-map +(?P<name>\S+) +'
-                            '(?P<action>\w+) +(?P<seqnum>\d+)$')
-        p5 = re.compile(r'^(?P<command>[\w\s\-\>]+) +'
-                            'C: +(?P<compare_count>\d+) +'
-                            'M: +(?P<match_count>\d+)$')
-        p6 = re.compile(r'^Total +accept +count +for +policy: +'
-                            '(?P<total_accept_count>\d+)$')
-        p7 = re.compile(r'^Total +reject +count +for +policy: +'
-                            '(?P<total_reject_count>\d+)$')
+
+        p = ShowBgpPolicyStatisticsParser.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Details for VRF default
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 nei_flag = True
@@ -4673,10 +4084,10 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
             # Total count for redistribute rpm handles: 1
             # Total count for neighbor rpm handles: 1
             # Total count for dampening rpm handles: 1
-            m = p2.match(line)
+            m = p.p2.match(line)
 
             # BGP policy statistics not available
-            m1 = p3.match(line)
+            m1 = p.p3.match(line)
 
             if m or m1:
                 if 'vrf' not in ret_dict:
@@ -4694,7 +4105,7 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
             # route-map Filter-pip deny 10
             # route-map ADD_RT_400_400 permit 10
             # route-map RMAP_DIRECT->BGP_IPV4 permit 10
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 name = m.groupdict()['name']
 
@@ -4725,7 +4136,7 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
 
             #   match ip address prefix-list pip-prefix                    C: 0      M: 0 
             #   match ip address prefix-list DIRECT->BGP_IPV4              C: 16     M: 0 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 command = m.groupdict()['command'].strip()
 
@@ -4743,14 +4154,14 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
                 continue
 
             # Total accept count for policy: 0
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 ret_dict['vrf'][vrf]['route_map'][name][index]['total_accept_count'] = \
                     int(m.groupdict()['total_accept_count'])
                 continue
 
             # Total reject count for policy: 0
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 ret_dict['vrf'][vrf]['route_map'][name][index]['total_reject_count'] = \
                     int(m.groupdict()['total_reject_count'])
@@ -4759,163 +4170,78 @@ class ShowBgpPolicyStatisticsParser(ShowBgpPolicyStatisticsSchema):
         return ret_dict
 
 
-    def xml(self, cmd):
-        out = self.device.execute('{cmd} | xml'.format(cmd=cmd))
+    def xml(self, cmd, output=None):
+        if output is None:
+            output = self.device.execute('{cmd} | xml'.format(cmd=cmd))
 
         etree_dict = {}
-        neighbor = None
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cmd)
-
-        # get neighbor
-        nei = Common.retrieve_xml_child(root=root, key='__XML__PARAM__neighbor-id')
-
-        if hasattr(nei, 'tag'):
-            for item in list(nei):
-                if '__XML__value' in item.tag:
-                    neighbor = item.text
-                    continue
-
-                # cover the senario that __readonly__ may be mssing when
-                # there are values in the output
-                if '__readonly__' in item.tag:
-                    root = list(item)[0]
-                else:
-                    root = item
-        else:
-            # top table rootl
-            root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-polstats'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
-
-            # <rpm-handle-count>1</rpm-handle-count>
-            etree_dict['vrf'][vrf]['rpm_handle_count'] = \
-                int(vrf_tree.find('{}rpm-handle-count'.format(namespace)).text)
-
-             # route_map table
-            rpm_tree = vrf_tree.find('{}TABLE_rmap'.format(namespace))
-            if not rpm_tree:
-                continue
-
-            # -----   loop route_map  -----
-            for rmp_root in rpm_tree.findall('{}ROW_rmap'.format(namespace)):
-                # route map
-                try:
-                    name = rmp_root.find('{}name'.format(namespace)).text
-                    name = name.replace('&gt;', '>')
-                except Exception:
+        # command of the route map being read, its rows end before it
+        command_dict = None
+
+        # the rows of TABLE_vrf are under __XML__PARAM__neighbor-id for
+        # 'policy statistics neighbor', with or without __readonly__
+        for row in iter_rows(output, ['TABLE_vrf/ROW_vrf',
+                                      'TABLE_rmap/ROW_rmap',
+                                      'TABLE_cmd/ROW_cmd'],
+                             command=cmd):
+            if row.path == 'TABLE_cmd/ROW_cmd':
+                # <command>match ip address prefix-list LOOPBACK0</command>
+                if row.get('command') is None:
                     continue
+                command_dict = {'command': row['command'].strip()
+                                                         .replace('&gt;', '>')}
+                # <comparecount>2</comparecount>
+                # <matchcount>0</matchcount>
+                for tag, key in (('comparecount', 'compare_count'),
+                                 ('matchcount', 'match_count')):
+                    if row.get(tag) is not None:
+                        command_dict[key] = int(row[tag])
+
+            elif row.path == 'TABLE_rmap/ROW_rmap':
+                sub_dict = self._xml_entry(etree_dict, row)
+                if sub_dict is not None:
+                    # <action>deny</action>
+                    if row.get('action') is not None:
+                        sub_dict['action'] = row['action']
+                    # <seqnum>10</seqnum>
+                    for tag, key in (('seqnum', 'seq_num'),
+                                     ('totalacceptcount', 'total_accept_count'),
+                                     ('totalrejectcount', 'total_reject_count')):
+                        if row.get(tag) is not None:
+                            sub_dict[key] = int(row[tag])
+                    if command_dict is not None:
+                        sub_dict['command'] = command_dict
+                command_dict = None
 
-                if 'route_map' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['route_map'] = {}
-
-                if name not in etree_dict['vrf'][vrf]['route_map']:
-                    etree_dict['vrf'][vrf]['route_map'][name] = {}
-                    # initial index
-                    index = 1
-                else:
-                    index += 1
-                    
-                if index not in etree_dict['vrf'][vrf]['route_map'][name]:
-                    etree_dict['vrf'][vrf]['route_map'][name][index] = {}
-
-
-                # <action>deny</action>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['action'] = \
-                        rmp_root.find('{}action'.format(namespace)).text
-                except Exception:
-                    pass
-
-                # <seqnum>10</seqnum>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['seq_num'] = \
-                        int(rmp_root.find('{}seqnum'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <totalacceptcount>0</totalacceptcount>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['total_accept_count'] = \
-                        int(rmp_root.find('{}totalacceptcount'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <totalrejectcount>2</totalrejectcount>
-                try:
-                    etree_dict['vrf'][vrf]['route_map'][name][index]['total_reject_count'] = \
-                        int(rmp_root.find('{}totalrejectcount'.format(namespace)).text)
-                except Exception:
-                    pass
-
-
-                # TABLE_cmd table
-                command = rmp_root.find('{}TABLE_cmd'.format(namespace))
-
-                if not command:
-                    continue
-
-                # -----   loop command  -----
-                for command_root in command.findall('{}ROW_cmd'.format(namespace)):
-                    try:
-                        cmd_str = command_root.find('{}command'.format(namespace)).text.strip()
-                        cmd_str = cmd_str.replace('&gt;', '>')
-                    except Exception:
-                        continue
-
-                    if 'command' not in etree_dict['vrf'][vrf]['route_map'][name][index]:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]['command'] = {}
-
-                    # command
-                    etree_dict['vrf'][vrf]['route_map'][name][index]\
-                        ['command']['command'] = cmd_str
+            else:
+                vrf_dict = self._xml_vrf(etree_dict, row)
+                # <rpm-handle-count>1</rpm-handle-count>
+                if vrf_dict is not None:
+                    vrf_dict['rpm_handle_count'] = \
+                        int(row['rpm-handle-count'])
 
-                    # <comparecount>2</comparecount>
-                    try:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]\
-                            ['command']['compare_count'] = \
-                                int(command_root.find('{}comparecount'.format(namespace)).text)
-                    except Exception:
-                        pass
-                    
-                    # <matchcount>0</matchcount>
-                    try:
-                        etree_dict['vrf'][vrf]['route_map'][name][index]\
-                            ['command']['match_count'] = \
-                                int(command_root.find('{}matchcount'.format(namespace)).text)
-                    except Exception:
-                        pass
         return etree_dict
 
+    @staticmethod
+    def _xml_vrf(etree_dict, vrf_row):
+        # <vrf-name-polstats>default</vrf-name-polstats>
+        vrf = vrf_row.get('vrf-name-polstats')
+        if vrf is None:
+            return None
+        return etree_dict.setdefault('vrf', {}).setdefault(vrf, {})
+
+    def _xml_entry(self, etree_dict, rmap_row):
+        '''dict of the next entry of the route map of rmap_row, the entries
+        of a route map are numbered from 1 in the order of the output'''
+        vrf_dict = self._xml_vrf(etree_dict, rmap_row.parent)
+        # <name>ADD_RT_400_400</name>
+        name = rmap_row.get('name')
+        if vrf_dict is None or name is None:
+            return None
+        name_dict = vrf_dict.setdefault('route_map', {})\
+            .setdefault(name.replace('&gt;', '>'), {})
+        return name_dict.setdefault(len(name_dict) + 1, {})
+
 # ===============================================================================
 # Parser for 'show bgp vrf <vrf> <address_family> policy statistics redistribute'
 # ===============================================================================
@@ -4945,7 +4271,7 @@ class ShowBgpPolicyStatisticsRedistribute(ShowBgpPolicyStatisticsParser):
 
         return super().cli(cmd=cmd, output=output)
 
-    def xml(self, address_family, vrf=''):
+    def xml(self, address_family, vrf='', output=None):
 
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf, address_family=address_family)
@@ -4953,7 +4279,7 @@ class ShowBgpPolicyStatisticsRedistribute(ShowBgpPolicyStatisticsParser):
             cmd = self.xml_command[1].format(address_family=address_family)
 
 
-        return super().xml(cmd=cmd)
+        return super().xml(cmd=cmd, output=output)
 
 # ==================================================================================
 # Parser for 'show bgp vrf <vrf> <address_family> policy statistics neighbor <WORD>'
@@ -4978,13 +4304,13 @@ class ShowBgpPolicyStatisticsNeighbor(ShowBgpPolicyStatisticsParser):
 
         return super().cli(cmd=cmd,output=output)
 
-    def xml(self, address_family, neighbor, vrf=''):
+    def xml(self, address_family, neighbor, vrf='', output=None):
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf, address_family=address_family, neighbor=neighbor)
         else:
             cmd = self.xml_command[1].format(address_family=address_family, neighbor=neighbor)
 
-        return super().xml(cmd=cmd)
+        return super().xml(cmd=cmd, output=output)
 
 # ============================================================================
 # Parser for 'show bgp vrf <vrf> <address_family> policy statistics dampening'
@@ -5006,14 +4332,14 @@ class ShowBgpPolicyStatisticsDampening(ShowBgpPolicyStatisticsParser):
             cmd = ""
         return super().cli(cmd=cmd,output=output)
 
-    def xml(self, address_family, vrf=''):
+    def xml(self, address_family, vrf='', output=None):
 
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf, address_family=address_family)
         else:
             cmd = self.xml_command[1].format(vrf=vrf, address_family=address_family)
 
-        return super().xml(cmd=cmd)
+        return super().xml(cmd=cmd, output=output)
 
 
 # =========================================
@@ -5054,6 +4380,13 @@ class ShowBgpSessionsSchema(MetaParser):
         }
     }
 
+
+def _session_time(value):
+    # PT1H4M41S, as converted by ShowBgpSessions.xml()
+    value = Common.convert_xml_time(value)
+    return 'never' if 'P' in value else value
+
+
 # =========================================
 # Parser for 'show bgp sessions vrf <WORD>'
 # =========================================
@@ -5063,9 +4396,112 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
     cli_command = ['show bgp sessions vrf {vrf}','show bgp sessions']
     xml_command = ['show bgp sessions vrf {vrf} | xml','show bgp sessions | xml']
+    json_command = ['show bgp sessions vrf {vrf} | json',
+                    'show bgp sessions | json']
+    json_table = Table(None, fields={
+        'total_peers': Field('totalpeers', int),
+        'total_established_peers': Field('totalestablishedpeers', int),
+        'local_as': Field('localas', int),
+    }, tables=[
+        Table('vrf', key='vrf-name-out', into='vrf', fields={
+            'local_as': Field('local-as', int),
+            'vrf_peers': Field('vrfpeers', int),
+            'vrf_established_peers': Field('vrfestablishedpeers', int),
+            'router_id': 'router-id',
+        }, tables=[
+            # fe80::7e21:eff:fe2e:cc58%Ethernet1/2
+            Table('neighbor', into='neighbor',
+                  key=Field(lambda row: row.get('neighbor-id', '').split('%')[0]
+                            or None),
+                  fields={
+                      'connections_dropped': Field('connectionsdropped', int),
+                      'remote_as': Field('remoteas', int),
+                      'last_flap': Field('lastflap', _session_time,
+                                         default='never'),
+                      'last_read': Field('lastread', _session_time,
+                                         default='never'),
+                      'last_write': Field('lastwrite', _session_time,
+                                         default='never'),
+                      'state': Field('state', str.lower),
+                      'local_port': Field('localport', int),
+                      'remote_port': Field('remoteport', int),
+                      'notifications_sent': Field('notificationssent', int),
+                      'notifications_received': Field(
+                          'notificationsreceived', int),
+                      'linklocal_interfaceport': Field(
+                          lambda row: row.get('neighbor-id', '').partition('%')[2],
+                          skip=('',)),
+                  }),
+        ]),
+    ])
     exclude = ['last_read', 'last_write']
 
+    patterns = Patterns(
+        # Total peers 4, established peers 3
+        p1=r'^Total +peers +(?P<total>\d+), +'
+            'established +peers +(?P<established>\d+)$',
+
+        # ASN 100
+        p2=r'^ASN +(?P<asn>\d+)$',
+
+        # VRF default, local ASN 100
+        p3=r'^VRF +(?P<vrf>\S+), +'
+            'local +ASN +(?P<asn>\d+)$',
+
+        # peers 4, established peers 3, local router-id 10.1.1.1
+        p4=r'^peers +(?P<peer>\d+), +'
+            'established +peers +(?P<established>\d+), +'
+            'local +router\-id +(?P<id>[\w\.\:]+)$',
+
+        # 10.51.1.101        300 2     00:30:01|never   |never    I   0/0          2/0
+        p5=r'^(?P<nei>[\w\.\:]+) +'
+            '(?P<asn>\d+) +'
+            '(?P<dropped>\d+) +'
+            '(?P<last_flap>[\w\.\:]+) *\|'
+            '(?P<last_read>[\w\.\:]+) *\|'
+            '(?P<last_write>[\w\.\:]+) +'
+            '(?P<state>[a-zA-Z]) +'
+            '(?P<local_port>\d+)\/'
+            '(?P<remote_port>\d+) +'
+            '(?P<notifications_sent>\d+)\/'
+            '(?P<notifications_received>\d+)$',
+
+        # fe80::7e21:eff:fe2e:cc58%Ethernet1/2
+        p6_1=r'^(?P<nei>[a-zA-Z0-9\.\:\/\[\]\,]+)%'
+              '(?P<linklocal_interfaceport>[a-zA-Z0-9\.\:\/\[\]\,]+)$',
+
+        #                     1 0     00:00:18|00:00:17|00:00:17 E   20230/179        0/0
+        p6_2=r'^(?P<asn>\d+) +'
+              '(?P<dropped>\d+) +'
+              '(?P<last_flap>[\w\.\:]+) *\|'
+              '(?P<last_read>[\w\.\:]+) *\|'
+              '(?P<last_write>[\w\.\:]+) +'
+              '(?P<state>[a-zA-Z]) +'
+              '(?P<local_port>\d+)\/'
+              '(?P<remote_port>\d+) +'
+              '(?P<notifications_sent>\d+)\/'
+              '(?P<notifications_received>\d+)$',
+
+        # 4.4.4.1         4258745628
+        p7_1=r'^(?P<nei>[\da-f.\:]+) +'
+              '(?P<asn>\d+)$',
+
+        #                     0     00:01:39|00:00:11|00:00:20 E   179/21890      0/0
+        p7_2=r'^(?P<dropped>\d+) +'
+              '(?P<last_flap>[\w\.\:]+) *\|'
+              '(?P<last_read>[\w\.\:]+) *\|'
+              '(?P<last_write>[\w\.\:]+) +'
+              '(?P<state>[a-zA-Z]) +'
+              '(?P<local_port>\d+)\/'
+              '(?P<remote_port>\d+) +'
+              '(?P<notifications_sent>\d+)\/'
+              '(?P<notifications_received>\d+)$',
+    )
+
     def cli(self, vrf='',output=None):
+        # the output of the command with | json
+        if output is not None and is_json(output):
+            return self.json(vrf=vrf, output=output)
         if output is None:
             if vrf:
                 cmd = self.cli_command[0].format(vrf=vrf)
@@ -5083,63 +4519,14 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                       'E': 'established',
                       'C': 'closing',
                       'S': 'shutdown'}
-        # Total peers 4, established peers 3
-        p1 = re.compile(r'^Total +peers +(?P<total>\d+), +'
-                            'established +peers +(?P<established>\d+)$')
-        # ASN 100
-        p2 = re.compile(r'^ASN +(?P<asn>\d+)$')
-        # VRF default, local ASN 100
-        p3 = re.compile(r'^VRF +(?P<vrf>\S+), +'
-                            'local +ASN +(?P<asn>\d+)$')
-        # peers 4, established peers 3, local router-id 10.1.1.1
-        p4 = re.compile(r'^peers +(?P<peer>\d+), +'
-                            'established +peers +(?P<established>\d+), +'
-                            'local +router\-id +(?P<id>[\w\.\:]+)$')
-        # 10.51.1.101        300 2     00:30:01|never   |never    I   0/0          2/0
-        p5 = re.compile(r'^(?P<nei>[\w\.\:]+) +'
-                            '(?P<asn>\d+) +'
-                            '(?P<dropped>\d+) +'
-                            '(?P<last_flap>[\w\.\:]+) *\|'
-                            '(?P<last_read>[\w\.\:]+) *\|'
-                            '(?P<last_write>[\w\.\:]+) +'
-                            '(?P<state>[a-zA-Z]) +'
-                            '(?P<local_port>\d+)\/'
-                            '(?P<remote_port>\d+) +'
-                            '(?P<notifications_sent>\d+)\/'
-                            '(?P<notifications_received>\d+)$')
-        # fe80::7e21:eff:fe2e:cc58%Ethernet1/2
-        p6_1 = re.compile(r'^(?P<nei>[a-zA-Z0-9\.\:\/\[\]\,]+)%'
-                           '(?P<linklocal_interfaceport>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
-        #                     1 0     00:00:18|00:00:17|00:00:17 E   20230/179        0/0
-        p6_2 = re.compile(r'^(?P<asn>\d+) +'
-                            '(?P<dropped>\d+) +'
-                            '(?P<last_flap>[\w\.\:]+) *\|'
-                            '(?P<last_read>[\w\.\:]+) *\|'
-                            '(?P<last_write>[\w\.\:]+) +'
-                            '(?P<state>[a-zA-Z]) +'
-                            '(?P<local_port>\d+)\/'
-                            '(?P<remote_port>\d+) +'
-                            '(?P<notifications_sent>\d+)\/'
-                            '(?P<notifications_received>\d+)$')
-        # 4.4.4.1         4258745628
-        p7_1 = re.compile(r'^(?P<nei>[\da-f.\:]+) +'
-                            '(?P<asn>\d+)$')
-        #                     0     00:01:39|00:00:11|00:00:20 E   179/21890      0/0
-        p7_2 = re.compile(r'^(?P<dropped>\d+) +'
-                            '(?P<last_flap>[\w\.\:]+) *\|'
-                            '(?P<last_read>[\w\.\:]+) *\|'
-                            '(?P<last_write>[\w\.\:]+) +'
-                            '(?P<state>[a-zA-Z]) +'
-                            '(?P<local_port>\d+)\/'
-                            '(?P<remote_port>\d+) +'
-                            '(?P<notifications_sent>\d+)\/'
-                            '(?P<notifications_received>\d+)$')
+
+        p = ShowBgpSessions.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # Total peers 4, established peers 3
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 ret_dict['total_peers'] = int(m.groupdict()['total'])
                 ret_dict['total_established_peers'] = \
@@ -5147,14 +4534,14 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # ASN 100
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 ret_dict['local_as'] = int(m.groupdict()['asn'])
                 continue
 
 
             # VRF default, local ASN 100
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 if 'vrf' not in ret_dict:
@@ -5166,7 +4553,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # peers 4, established peers 3, local router-id 10.1.1.1
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 ret_dict['vrf'][vrf]['vrf_peers'] = \
                     int(m.groupdict()['peer'])
@@ -5179,7 +4566,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # 10.51.1.101        300 2     00:30:01|never   |never    I   0/0          2/0
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 group = m.groupdict()
 
@@ -5222,7 +4609,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
             # fe80::7e21:eff:fe2e:cc58%Ethernet1/2
             #linklocal_interfaceport
-            m = p6_1.match(line)
+            m = p.p6_1.match(line)
             if m:
                 group = m.groupdict()
                 nei = group['nei']
@@ -5235,7 +4622,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             #                     1 0     00:00:18|00:00:17|00:00:17 E   20230/179        0/0
-            m = p6_2.match(line)
+            m = p.p6_2.match(line)
             if m:
                 group = m.groupdict()
 
@@ -5271,7 +4658,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                 continue
 
             # 4.4.4.1         4258745628
-            m = p7_1.match(line)
+            m = p.p7_1.match(line)
             if m:
                 group = m.groupdict()
 
@@ -5285,7 +4672,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
                     int(group['asn'])
                 continue
 
-            m = p7_2.match(line)
+            m = p.p7_2.match(line)
             if m:
                 group = m.groupdict()
 
@@ -5319,7 +4706,7 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
 
         return ret_dict
 
-    def xml(self, vrf=''):
+    def xml(self, vrf='', output=None):
         if vrf:
             cmd = self.xml_command[0].format(vrf=vrf)
             cli_cmd = self.cli_command[0].format(vrf=vrf)
@@ -5327,191 +4714,85 @@ class ShowBgpSessions(ShowBgpSessionsSchema):
             cmd = self.xml_command[1]
             cli_cmd = self.cli_command[1]
 
-        out = self.device.execute(cmd)
+        if output is None:
+            output = self.device.execute(cmd)
 
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
-
-        ret = Common.retrieve_xml_child(
-                root=root,
-                key='__readonly__')
-
-        if hasattr(ret, 'tag'):
-            # get total_peers                
-            try:
-                total_peers = ret.find('{}totalpeers'.format(namespace)).text
-                etree_dict['total_peers'] = int(total_peers)
-            except Exception:
-                pass
-
-            # get total_established_peers            
-            try:
-                total_established_peers = ret.find(
-                    '{}totalestablishedpeers'.format(namespace)).text
-                etree_dict['total_established_peers'] = int(total_established_peers)
-            except Exception:
-                pass
-
-            # get local_as               
-            try:
-                local_as = ret.find('{}localas'.format(namespace)).text
-                etree_dict['local_as'] = int(local_as)
-            except Exception:
-                pass
-
-        else:
-            # output is empty
-            return etree_dict
-
-        # find Vrf root
-        root = ret.find('{}TABLE_vrf'.format(namespace))
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            if 'vrf' not in etree_dict:
-                etree_dict['vrf'] = {}
-            if vrf not in etree_dict['vrf']:
-                etree_dict['vrf'][vrf] = {}
-
-            # <local-as>333</local-as>
-            etree_dict['vrf'][vrf]['local_as'] = \
-                int(vrf_tree.find('{}local-as'.format(namespace)).text)
-
-            # <vrfpeers>3</vrfpeers>
-            etree_dict['vrf'][vrf]['vrf_peers'] = \
-                int(vrf_tree.find('{}vrfpeers'.format(namespace)).text)
-
-            # <vrfestablishedpeers>2</vrfestablishedpeers>
-            etree_dict['vrf'][vrf]['vrf_established_peers'] = \
-                int(vrf_tree.find('{}vrfestablishedpeers'.format(namespace)).text)
-                
-            # <router-id>10.106.0.6</router-id>
-            etree_dict['vrf'][vrf]['router_id'] = \
-                vrf_tree.find('{}router-id'.format(namespace)).text
-                
-             # Neighbor table
-            nei_tree = vrf_tree.find('{}TABLE_neighbor'.format(namespace))
-            if not nei_tree:
-                continue
-
-            # -----   loop neighbors  -----
-            for nei_root in nei_tree.findall('{}ROW_neighbor'.format(namespace)):
-                # neighbor
-                try:
-                    nei = nei_root.find('{}neighbor-id'.format(namespace)).text
-                except Exception:
+        for row in iter_rows(output, ['__readonly__',
+                                      'TABLE_vrf/ROW_vrf',
+                                      'TABLE_neighbor/ROW_neighbor'],
+                             command=cli_cmd):
+            if row.path == '__readonly__':
+                # <totalpeers>3</totalpeers>
+                for tag, key in (('totalpeers', 'total_peers'),
+                                 ('totalestablishedpeers',
+                                  'total_established_peers'),
+                                 ('localas', 'local_as')):
+                    if row.get(tag) is not None:
+                        etree_dict[key] = int(row[tag])
+
+            elif row.path == 'TABLE_vrf/ROW_vrf':
+                vrf_dict = self._xml_vrf(etree_dict, row)
+                if vrf_dict is None:
                     continue
+                # <local-as>333</local-as>
+                vrf_dict['local_as'] = int(row['local-as'])
+                # <vrfpeers>3</vrfpeers>
+                vrf_dict['vrf_peers'] = int(row['vrfpeers'])
+                # <vrfestablishedpeers>2</vrfestablishedpeers>
+                vrf_dict['vrf_established_peers'] = \
+                    int(row['vrfestablishedpeers'])
+                # <router-id>10.106.0.6</router-id>
+                vrf_dict['router_id'] = row['router-id']
 
-                if 'neighbor' not in etree_dict['vrf'][vrf]:
-                    etree_dict['vrf'][vrf]['neighbor'] = {}
-
-                if nei not in etree_dict['vrf'][vrf]['neighbor']:
-                    etree_dict['vrf'][vrf]['neighbor'][nei] = {}
-
-                # <connectionsdropped>0</connectionsdropped>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['connections_dropped'] = \
-                        int(nei_root.find('{}connectionsdropped'.format(namespace)).text)
-                except Exception:
-                    pass
-
-                # <remoteas>333</remoteas>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_as'] = \
-                        int(nei_root.find('{}remoteas'.format(namespace)).text)
-                except Exception:
-                    pass
-
+            else:
+                vrf_dict = self._xml_vrf(etree_dict, row.parent)
+                # <neighbor-id>10.106.102.4</neighbor-id>
+                if vrf_dict is None or row.get('neighbor-id') is None:
+                    continue
+                nei_dict = vrf_dict.setdefault('neighbor', {})\
+                    .setdefault(row['neighbor-id'], {})
+                for tag, key in (('connectionsdropped', 'connections_dropped'),
+                                 ('remoteas', 'remote_as'),
+                                 ('localport', 'local_port'),
+                                 ('remoteport', 'remote_port'),
+                                 ('notificationssent', 'notifications_sent'),
+                                 ('notificationsreceived',
+                                  'notifications_received')):
+                    if row.get(tag) is not None:
+                        nei_dict[key] = int(row[tag])
                 # <lastflap>PT1H4M41S</lastflap>
-                try:
-                    ret = nei_root.find('{}lastflap'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_flap'] = 'never'
-                    
-                # <lastread>PT47S</lastread>
-                try:
-                    ret = nei_root.find('{}lastread'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_read'] = 'never'
-                    
-                # <lastwrite>PT15S</lastwrite>
-                try:
-                    ret = nei_root.find('{}lastwrite'.format(namespace)).text
-                    ret = Common.convert_xml_time(ret)
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = \
-                        'never' if 'P' in ret else ret
-                except Exception:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['last_write'] = 'never'
-                    
+                for tag, key in (('lastflap', 'last_flap'),
+                                 ('lastread', 'last_read'),
+                                 ('lastwrite', 'last_write')):
+                    value = Common.convert_xml_time(row[tag]) \
+                        if row.get(tag) else 'never'
+                    nei_dict[key] = 'never' if 'P' in value else value
                 # <state>Established</state>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['state'] = \
-                        nei_root.find('{}state'.format(namespace)).text.lower()
-                except Exception:
-                    pass
-                    
-                # <localport>179</localport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['local_port'] = \
-                        int(nei_root.find('{}localport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <remoteport>48392</remoteport>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['remote_port'] = \
-                        int(nei_root.find('{}remoteport'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationssent>0</notificationssent>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_sent'] = \
-                        int(nei_root.find('{}notificationssent'.format(namespace)).text)
-                except Exception:
-                    pass
-                    
-                # <notificationsreceived>0</notificationsreceived>
-                try:
-                    etree_dict['vrf'][vrf]['neighbor'][nei]['notifications_received'] = \
-                        int(nei_root.find('{}notificationsreceived'.format(namespace)).text)
-                except Exception:
-                    pass                    
+                if row.get('state') is not None:
+                    nei_dict['state'] = row['state'].lower()
 
         return etree_dict
 
+    @staticmethod
+    def _xml_vrf(etree_dict, vrf_row):
+        # <vrf-name-out>default</vrf-name-out>
+        vrf = vrf_row.get('vrf-name-out')
+        if vrf is None:
+            return None
+        return etree_dict.setdefault('vrf', {}).setdefault(vrf, {})
+
+    def json(self, vrf='', output=None):
+        if output is None:
+            if vrf:
+                cmd = self.json_command[0].format(vrf=vrf)
+            else:
+                cmd = self.json_command[1]
+            output = self.device.execute(cmd)
+
+        return self.json_table.apply(loads(output))
+
 
 # ========================================================
 # Schema for 'show bgp <address_family> labels vrf <WORD>'
@@ -5590,6 +4871,24 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
     exclude = [
       'table_version']
 
+    patterns = Patterns(
+        p1=r'^BGP +routing +table +information +for +VRF +(?P<vrf>\S+), +'
+            'address +family +(?P<af>[\w\s]+)$',
+        p2=r'^BGP +table +version +is +(?P<ver>\d+), +'
+            '(L|l)ocal +(R|r)outer +ID +is +(?P<router_id>[\w\.\:]+)$',
+        p4=r'^Route +Distinguisher: +(?P<rd>[\w\.\:]+) +'
+            '\(VRF +(?P<vrf>\S+)\)$',
+        p3=r'^(?P<status>s|S|x|d|h|\*)?'
+            '(?P<best>\>)?'
+            ' *(?P<type_code>i|e|c|l|a|r|I)'
+            '(?P<prefix>[\w\/\.\:]+)?'
+            ' +(?P<next_hop>[\w\/\.\:]+)'
+            '(?: +(?P<in_label>\w+)\/(?P<out_label>\w+))?'
+            '(?: +\((?P<vpn>(\S+))\))?$',
+        p3_1=r'^(?P<in_label>\w+)\/(?P<out_label>\w+)'
+              '(?: +\((?P<vpn>(\S+))\))?$',
+    )
+
     def cli(self, address_family, vrf='',output=None):
         assert address_family in ['ipv4 unicast', 'ipv4 multicast',
                                   'ipv6 unicast', 'ipv6 multicast',
@@ -5621,27 +4920,14 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
                          'r': 'redist',
                          'a': 'aggregate',
                          'I': 'injected'}
-        p1 = re.compile(r'^BGP +routing +table +information +for +VRF +(?P<vrf>\S+), +'
-                            'address +family +(?P<af>[\w\s]+)$')
-        p2 = re.compile(r'^BGP +table +version +is +(?P<ver>\d+), +'
-                            '(L|l)ocal +(R|r)outer +ID +is +(?P<router_id>[\w\.\:]+)$')
-        p4 = re.compile(r'^Route +Distinguisher: +(?P<rd>[\w\.\:]+) +'
-                            '\(VRF +(?P<vrf>\S+)\)$')
-        p3 = re.compile(r'^(?P<status>s|S|x|d|h|\*)?'
-                            '(?P<best>\>)?'
-                            ' *(?P<type_code>i|e|c|l|a|r|I)'
-                            '(?P<prefix>[\w\/\.\:]+)?'
-                            ' +(?P<next_hop>[\w\/\.\:]+)'
-                            '(?: +(?P<in_label>\w+)\/(?P<out_label>\w+))?'
-                            '(?: +\((?P<vpn>(\S+))\))?$')
-        p3_1 = re.compile(r'^(?P<in_label>\w+)\/(?P<out_label>\w+)'
-                            '(?: +\((?P<vpn>(\S+))\))?$')
+
+        p = ShowBgpLabels.patterns
 
         for line in out.splitlines():
             line = line.strip()
 
             # BGP routing table information for VRF default, address family IPv4 Unicast
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 vrf = m.groupdict()['vrf']
                 address_family = m.groupdict()['af'].lower()
@@ -5649,7 +4935,7 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
             # BGP table version is 7, Local Router ID is 10.106.0.6
             # BGP table version is 3, local router ID is 10.234.1.0
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 if 'vrf' not in ret_dict:
                     ret_dict['vrf'] = {}
@@ -5667,7 +4953,7 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
                 continue
 
             # Route Distinguisher: 10.234.1.0:3    (VRF vrf-9100)
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 rd = m.groupdict()['rd']
                 if 'vrf' not in ret_dict:
@@ -5700,7 +4986,7 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
             # a10.4.0.0/16        0.0.0.0             nolabel/nolabel
             # *>e10.85.0.0/24        10.76.1.101          492288/nolabel (VRF1)
             # *>2001:db8:2913::/112           ::ffff:10.51.1.101
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 prefix_cur = m.groupdict()['prefix']
                 if prefix_cur:
@@ -5755,7 +5041,7 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
             #                                           nolabel/16
             #                                           22/17 (VRF1)
-            m = p3_1.match(line)
+            m = p.p3_1.match(line)
             if m:
                 in_label = m.groupdict()['in_label']
                 out_label = m.groupdict()['out_label']
@@ -5770,240 +5056,122 @@ class ShowBgpLabels(ShowBgpLabelsSchema):
 
         return ret_dict
 
-    def xml(self, address_family, vrf=''):
+    def xml(self, address_family, vrf='', output=None):
         assert address_family in ['ipv4 unicast', 'ipv4 multicast',
                                   'ipv6 unicast', 'ipv6 multicast',
                                   'vpnv4 unicast', 'vpnv6 unicast']
 
-
         if vrf:
             cmd = self.xml_command[0].format(address_family=address_family, vrf=vrf)
             cli_cmd = self.cli_command[0].format(address_family=address_family, vrf=vrf)
         else:
             cmd = self.xml_command[1].format(address_family=address_family)
-            cli_cmd = self.cli_command[0].format(address_family=address_family)
+            cli_cmd = self.cli_command[1].format(address_family=address_family)
 
-        out = self.device.execute(cmd)
+        if output is None:
+            output = self.device.execute(cmd)
 
         etree_dict = {}
 
-        # Remove junk characters returned by the device
-        out = out.replace("]]>]]>", "")
-        root = ET.fromstring(out)
-
-        # top table root
-        show_root = Common.retrieve_xml_child(root=root, key='show')
-        # get xml namespace
-        # {http://www.cisco.com/nxos:7.0.3.I7.1.:bgp}
-        try:
-            m = re.compile(r'(?P<name>\{[\S]+\})').match(show_root.tag)
-            namespace = m.groupdict()['name']
-        except Exception:
-            return etree_dict
-
-        # compare cli command
-        Common.compose_compare_command(root=root, namespace=namespace,
-                                       expect_command=cli_cmd)
-
-        # find Vrf root
-        root = Common.retrieve_xml_child(root=root, key='TABLE_vrf')
-
-        if not root:
-            return etree_dict
-
-        # -----   loop vrf  -----
-        for vrf_tree in root.findall('{}ROW_vrf'.format(namespace)):
-            # vrf
-            try:
-                vrf = vrf_tree.find('{}vrf-name-out'.format(namespace)).text
-            except Exception:
-                break
-
-            # Address family table
-            af_tree = vrf_tree.find('{}TABLE_afi'.format(namespace))
-            if not af_tree:
-                continue
-            for af_root in af_tree.findall('{}ROW_afi'.format(namespace)):
-                # Address family table
-                saf_tree = af_root.find('{}TABLE_safi'.format(namespace))
-                if not saf_tree:
+        for row in iter_rows(output, ['TABLE_vrf/ROW_vrf',
+                                      'TABLE_safi/ROW_safi',
+                                      'TABLE_rd/ROW_rd',
+                                      'TABLE_prefix/ROW_prefix',
+                                      'TABLE_path/ROW_path'],
+                             command=cli_cmd):
+            if row.path == 'TABLE_safi/ROW_safi':
+                af_dict = self._xml_af(etree_dict, row)
+                if af_dict is None:
                     continue
-                # -----   loop address_family  -----
-                for saf_root in saf_tree.findall('{}ROW_safi'.format(namespace)):
-                    # neighbor
-                    try:
-                        af = saf_root.find('{}af-name'.format(namespace)).text
-                        af = af.lower()
-                    except Exception:
-                        continue
-
-                    # <table-version>7</table-version>
-                    try:
-                        table_version = \
-                            int(saf_root.find('{}table-version'.format(namespace)).text)
-                    except Exception:
-                        table_version = None
-
-                    # <router-id>10.106.0.6</router-id>
-                    try:
-                        router_id = \
-                            saf_root.find('{}router-id'.format(namespace)).text
-                    except Exception:
-                        router_id = None
-
-                    if table_version or router_id:
-                        if 'vrf' not in etree_dict:
-                            etree_dict['vrf'] = {}
-                        if vrf not in etree_dict['vrf']:
-                            etree_dict['vrf'][vrf] = {}
-
-                        if 'address_family' not in etree_dict['vrf'][vrf]:
-                            etree_dict['vrf'][vrf]['address_family'] = {}
-
-                        if af not in etree_dict['vrf'][vrf]['address_family']:
-                            etree_dict['vrf'][vrf]['address_family'][af] = {}
-                        if table_version:
-                            etree_dict['vrf'][vrf]['address_family'][af]['table_version'] = table_version
-                        if router_id:
-                            etree_dict['vrf'][vrf]['address_family'][af]['router_id'] = router_id
-
-                     # RD table
-                    rd_tree = saf_root.find('{}TABLE_rd'.format(namespace))
-                    if not rd_tree:
-                        continue
-
-                    # -----   loop rd  -----
-                    for rd_root in rd_tree.findall('{}ROW_rd'.format(namespace)):
-                        # neighbor
-                        try:
-                            rd = rd_root.find('{}rd_val'.format(namespace)).text
-                        except Exception:
-                            rd = None
-
-                        if rd:
-                            if 'route_distinguisher' not in etree_dict['vrf'][vrf]:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'] = {}
-
-                            if rd not in etree_dict['vrf'][vrf]['address_family']:
-                                etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd] = {}
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]\
-                                    ['route_distinguisher'][rd]
-                        else:
-                            sub_dict = etree_dict['vrf'][vrf]['address_family'][af]
-
-                        # <rd_vrf>vrf-9100</rd_vrf>
-                        try:
-                            sub_dict['rd_vrf'] = rd_root.find('{}rd_vrf'.format(namespace)).text
-                        except Exception:
-                            pass
-
-                         # prefix table
-                        prefix_tree = rd_root.find('{}TABLE_prefix'.format(namespace))
-                        if not prefix_tree:
-                            continue
+                # <table-version>7</table-version>
+                if row.get('table-version'):
+                    af_dict['table_version'] = int(row['table-version'])
+                # <router-id>10.106.0.6</router-id>
+                if row.get('router-id'):
+                    af_dict['router_id'] = row['router-id']
+
+            elif row.path == 'TABLE_rd/ROW_rd':
+                sub_dict = self._xml_rd(etree_dict, row)
+                # <rd_vrf>vrf-9100</rd_vrf>
+                if sub_dict is not None and row.get('rd_vrf') is not None:
+                    sub_dict['rd_vrf'] = row['rd_vrf']
+
+            elif row.path == 'TABLE_path/ROW_path':
+                prefix_row = row.parent
+                sub_dict = self._xml_rd(etree_dict, prefix_row.parent)
+                # <ipprefix>10.1.1.1</ipprefix>
+                # <ipv6prefix>2001:db8:4309::/112</ipv6prefix>
+                prefix = prefix_row.get('ipprefix', prefix_row.get('ipv6prefix'))
+                # <pathnr>0</pathnr>
+                if sub_dict is None or prefix is None or \
+                   row.get('pathnr') is None:
+                    continue
+                index_dict = sub_dict.setdefault('prefix', {})\
+                    .setdefault(prefix, {}).setdefault('index', {})\
+                    .setdefault(int(row['pathnr']), {})
+
+                # <status>valid</status>
+                index_dict['status'] = row['status']
+                # <best>bestpath</best>
+                index_dict['best_path'] = 'none' not in row['best']
+                # <type>internal</type>
+                index_dict['type'] = row['type']
+                # <statuscode>*</statuscode>
+                if row.get('statuscode') and row['statuscode'].strip():
+                    index_dict.setdefault('status_code', row['statuscode'])
+                # <bestcode>&gt;</bestcode>
+                if row.get('bestcode') and row['bestcode'].strip():
+                    index_dict['best_code'] = row['bestcode'].strip()
+                # <typecode>i</typecode>
+                if row.get('typecode') is not None:
+                    index_dict['type_code'] = row['typecode']
+                # <ipnexthop>10.106.101.1</ipnexthop>
+                # <ipv6nexthop>2001:db8:1900:1::1:101</ipv6nexthop>
+                nexthop = row.get('ipnexthop', row.get('ipv6nexthop'))
+                if nexthop is not None:
+                    index_dict['nexthop'] = nexthop
+                # <inlabel>nolabel</inlabel>
+                index_dict['in_label'] = row['inlabel']
+                # <outlabel>nolabel</outlabel>
+                index_dict['out_label'] = row['outlabel']
+                # <vpn></vpn>
+                if row.get('vpn'):
+                    index_dict['vpn'] = row['vpn']
+                # <hold_down></hold_down>
+                if row.get('hold_down'):
+                    index_dict['hold_down'] = row['hold_down']
+
+            elif row.path == 'TABLE_prefix/ROW_prefix':
+                # a prefix without path
+                sub_dict = self._xml_rd(etree_dict, row.parent)
+                prefix = row.get('ipprefix', row.get('ipv6prefix'))
+                if sub_dict is not None and prefix is not None:
+                    sub_dict.setdefault('prefix', {}).setdefault(prefix, {})
 
-                        # -----   loop prefix  -----
-                        for prefix_root in prefix_tree.findall('{}ROW_prefix'.format(namespace)):
-                            # <ipprefix>10.1.1.1</ipprefix>
-                            try:
-                                prefix = prefix_root.find('{}ipprefix'.format(namespace)).text
-                            except Exception:
-                                # <ipv6prefix>2001:db8:4309::/112</ipv6prefix>
-                                try:
-                                    prefix = prefix_root.find('{}ipv6prefix'.format(namespace)).text
-                                except Exception:
-                                    continue 
-
-                            if 'prefix' not in sub_dict:
-                                sub_dict['prefix'] = {}
-
-                            if prefix not in sub_dict['prefix']:
-                                sub_dict['prefix'][prefix] = {}
-
-                             # path table
-                            index_tree = prefix_root.find('{}TABLE_path'.format(namespace))
-                            if not index_tree:
-                                continue
+        return etree_dict
 
-                            # -----   loop path  -----
-                            for index_root in index_tree.findall('{}ROW_path'.format(namespace)):
-                                # neighbor
-                                try:
-                                    index = int(index_root.find('{}pathnr'.format(namespace)).text)
-                                except Exception:
-                                    continue
-
-                                if 'index' not in sub_dict['prefix'][prefix]:
-                                    sub_dict['prefix'][prefix]['index'] = {}
-
-                                if index not in sub_dict['prefix'][prefix]['index']:
-                                    sub_dict['prefix'][prefix]['index'][index] = {}
-
-                                # <status>valid</status>
-                                sub_dict['prefix'][prefix]['index'][index]['status'] = \
-                                    index_root.find('{}status'.format(namespace)).text
-
-                                # <best>bestpath</best>
-                                sub_dict['prefix'][prefix]['index'][index]['best_path'] = \
-                                    False if 'none' in index_root.find('{}best'.format(namespace)).text \
-                                    else True
-
-                                # <type>internal</type>
-                                sub_dict['prefix'][prefix]['index'][index]['type'] = \
-                                    index_root.find('{}type'.format(namespace)).text
-
-                                try:
-                                    # <statuscode>*</statuscode>
-                                    status_code = index_root.find('{}statuscode'.format(namespace)).text
-                                    sub_dict['prefix'][prefix]['index'][index]\
-                                        .setdefault('status_code', status_code) if status_code.strip() else None                                        
-
-                                    # <bestcode>&gt;</bestcode>
-                                    best_code = index_root.find('{}bestcode'.format(namespace)).text
-                                    best_code = '>' if '&gt;' in best_code else best_code.strip()
-                                    if best_code:
-                                        sub_dict['prefix'][prefix]['index'][index]['best_code'] = best_code
-                                       
-                                    # <typecode>i</typecode>
-                                    sub_dict['prefix'][prefix]['index'][index]['type_code'] = \
-                                        index_root.find('{}typecode'.format(namespace)).text
-                                except Exception:
-                                    pass
-
-                                # <ipnexthop>10.106.101.1</ipnexthop>
-                                try:
-                                    sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                        index_root.find('{}ipnexthop'.format(namespace)).text
-                                except Exception:
-                                    # <ipv6nexthop>2001:db8:1900:1::1:101</ipv6nexthop>
-                                    try:
-                                        sub_dict['prefix'][prefix]['index'][index]['nexthop'] = \
-                                            index_root.find('{}ipv6nexthop'.format(namespace)).text
-                                    except Exception:
-                                        pass
-
-                                # <inlabel>nolabel</inlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['in_label'] = \
-                                    index_root.find('{}inlabel'.format(namespace)).text
-
-                                # <outlabel>nolabel</outlabel>
-                                sub_dict['prefix'][prefix]['index'][index]['out_label'] = \
-                                    index_root.find('{}outlabel'.format(namespace)).text
-
-                                # <vpn></vpn>
-                                vpn = index_root.find('{}vpn'.format(namespace)).text
-                                if vpn:
-                                    sub_dict['prefix'][prefix]['index'][index]['vpn'] = vpn
-                                    
-
-                                # <hold_down></hold_down>
-                                hold_down = index_root.find('{}hold_down'.format(namespace)).text
-                                if hold_down:
-                                    sub_dict['prefix'][prefix]['index'][index]['hold_down'] = hold_down
+    @staticmethod
+    def _xml_af(etree_dict, safi_row):
+        # the vrf row holds TABLE_afi/ROW_afi, holding the safi row
+        # <vrf-name-out>default</vrf-name-out>
+        # <af-name>IPv4 Unicast</af-name>
+        vrf = safi_row.parent.get('vrf-name-out')
+        af = safi_row.get('af-name')
+        if vrf is None or af is None:
+            return None
+        return etree_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+            .setdefault('address_family', {}).setdefault(af.lower(), {})
+
+    def _xml_rd(self, etree_dict, rd_row):
+        '''dict of the route distinguisher of rd_row, or of its address
+        family without route distinguisher'''
+        af_dict = self._xml_af(etree_dict, rd_row.parent)
+        # <rd_val>100:100</rd_val>
+        if af_dict is None or not rd_row.get('rd_val'):
+            return af_dict
+        return af_dict.setdefault('route_distinguisher', {})\
+            .setdefault(rd_row['rd_val'], {})
 
-        return etree_dict
 
 # ====================================================
 #  schema for show bgp l2vpn evpn summary
@@ -6084,6 +5252,33 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
       'prefixreceived',
       'capablepeers']
 
+    patterns = Patterns(
+        # Neighbor        V    AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
+        # 1.1.1.1   4 4444444444
+        #                         121842  120925     5549    0    0    11w6d 142
+        # 1.1.1.2   4 4444444444
+        #                         118316  117369     5549    0    0     3w4d 142
+        p1=r'^\s*BGP +summary +information +for +VRF +(?P<vrf_name_out>[\w]+),'
+            ' +address +family +(?P<af_name>[\w\s]+)$',
+        p2=r'^\s*BGP +router +identifier +(?P<vrf_router_id>[\d\.]+), +local +AS +number +(?P<vrf_local_as>[\d]+)$',
+        p3=r'^\s*BGP +table +version +is +(?P<tableversion>[\d]+), +(?P<af_name>[\w\s]+)'
+            ' +config +peers +(?P<configuredpeers>[\d]+),'
+            ' +capable +peers +(?P<capablepeers>[\d]+)$',
+        p4=r'^\s*(?P<totalnetworks>[\d]+) +network +entries +and +(?P<totalpaths>[\d]+) +paths +using'
+            ' +(?P<memoryused>[\d]+) +bytes +of +memory$',
+        p5=r'^\s*BGP +attribute +entries +\[(?P<numberattrs>[\d]+)\/(?P<bytesattrs>[\d]+)\],'
+            ' +BGP +AS +path +entries +\[(?P<numberpaths>[\d]+)\/(?P<bytespaths>[\d]+)\]$',
+        p6=r'^\s*BGP +community +entries +\[(?P<numbercommunities>[\d]+)\/(?P<bytescommunities>[\d]+)\],'
+            ' +BGP +clusterlist +entries +\[(?P<numberclusterlist>[\d]+)\/(?P<bytesclusterlist>[\d]+)\]$',
+        p7=r'^\s*(?P<neighborid>[\w\.\:]+) +(?P<neighborversion>[\d]+) +(?P<neighboras>[\d]+) +(?P<msgrecvd>[\d]+)'
+            ' +(?P<msgsent>[\d]+) +(?P<neighbortableversion>[\d]+) +(?P<inq>[\d]+) +(?P<outq>[\d]+)'
+            ' +(?P<time>[\w\:]+) +(?P<prefixreceived>[\w\s\)\(]+)$',
+        p8a=r'^\s*(?P<neighborid>[\w\.\:]+) +(?P<neighborversion>[\d]+) +((?P<neighboras>[\d]+)[\n]*)$',
+        p8b=r'^\s*((?P<msgrecvd>[\d]+)'
+             ' +(?P<msgsent>[\d]+) +(?P<neighbortableversion>[\d]+) +(?P<inq>[\d]+) +(?P<outq>[\d]+)'
+             ' +(?P<time>[\w\:]+) +(?P<prefixreceived>[\w\s\)\(]+))$',
+    )
+
     def cli(self,output=None):
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -6102,40 +5297,7 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
         # 172.16.205.8    4   200     130     139      155    0    0 02:05:01 0
         # 90:90:90::3     4   500     200     300      400    0    0 03:52:17 0
 
-        # Neighbor        V    AS MsgRcvd MsgSent   TblVer  InQ OutQ Up/Down  State/PfxRcd
-        # 1.1.1.1   4 4444444444
-        #                         121842  120925     5549    0    0    11w6d 142       
-        # 1.1.1.2   4 4444444444
-        #                         118316  117369     5549    0    0     3w4d 142  
-
-        p1 = re.compile(r'^\s*BGP +summary +information +for +VRF +(?P<vrf_name_out>[\w]+),'
-                        ' +address +family +(?P<af_name>[\w\s]+)$')
-        p2 = re.compile(
-            r'^\s*BGP +router +identifier +(?P<vrf_router_id>[\d\.]+), +local +AS +number +(?P<vrf_local_as>[\d]+)$')
-        p3 = re.compile(r'^\s*BGP +table +version +is +(?P<tableversion>[\d]+), +(?P<af_name>[\w\s]+)'
-                        ' +config +peers +(?P<configuredpeers>[\d]+),'
-                        ' +capable +peers +(?P<capablepeers>[\d]+)$')
-        p4 = re.compile(
-            r'^\s*(?P<totalnetworks>[\d]+) +network +entries +and +(?P<totalpaths>[\d]+) +paths +using'
-            ' +(?P<memoryused>[\d]+) +bytes +of +memory$')
-        p5 = re.compile(r'^\s*BGP +attribute +entries +\[(?P<numberattrs>[\d]+)\/(?P<bytesattrs>[\d]+)\],'
-                        ' +BGP +AS +path +entries +\[(?P<numberpaths>[\d]+)\/(?P<bytespaths>[\d]+)\]$')
-
-        p6 = re.compile(r'^\s*BGP +community +entries +\[(?P<numbercommunities>[\d]+)\/(?P<bytescommunities>[\d]+)\],'
-                        ' +BGP +clusterlist +entries +\[(?P<numberclusterlist>[\d]+)\/(?P<bytesclusterlist>[\d]+)\]$')
-
-        p7 = re.compile(
-            r'^\s*(?P<neighborid>[\w\.\:]+) +(?P<neighborversion>[\d]+) +(?P<neighboras>[\d]+) +(?P<msgrecvd>[\d]+)'
-            ' +(?P<msgsent>[\d]+) +(?P<neighbortableversion>[\d]+) +(?P<inq>[\d]+) +(?P<outq>[\d]+)'
-            ' +(?P<time>[\w\:]+) +(?P<prefixreceived>[\w\s\)\(]+)$')
-        
-        p8a = re.compile(
-            r'^\s*(?P<neighborid>[\w\.\:]+) +(?P<neighborversion>[\d]+) +((?P<neighboras>[\d]+)[\n]*)$')
-        
-        p8b = re.compile(
-            r'^\s*((?P<msgrecvd>[\d]+)'
-            ' +(?P<msgsent>[\d]+) +(?P<neighbortableversion>[\d]+) +(?P<inq>[\d]+) +(?P<outq>[\d]+)'
-            ' +(?P<time>[\w\:]+) +(?P<prefixreceived>[\w\s\)\(]+))$')
+        p = ShowBgpL2vpnEvpnSummary.patterns
 
         for line in out.splitlines():
             if line:
@@ -6143,7 +5305,7 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = 'default'
@@ -6155,14 +5317,14 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
                 af_dict = bgp_dict.setdefault('address_family',{}).setdefault(af_name,{})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 bgp_dict.update({'vrf_router_id': group.pop('vrf_router_id')})
                 bgp_dict.update({'vrf_local_as': int(group.pop('vrf_local_as'))})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 af_dict.update({'tableversion':int(group.pop('tableversion'))})
@@ -6171,12 +5333,12 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
                 continue
 
             m1 = ""
-            if p4.match(line):
-                m1 = p4.match(line)
-            if p5.match(line):
-                m1 = p5.match(line)
-            if p6.match(line):
-                m1 = p6.match(line)
+            if p.p4.match(line):
+                m1 = p.p4.match(line)
+            if p.p5.match(line):
+                m1 = p.p5.match(line)
+            if p.p6.match(line):
+                m1 = p.p6.match(line)
             if m1:
                 group = m1.groupdict()
                 try:
@@ -6186,7 +5348,7 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
                 af_dict.update({'dampening':'disabled'})
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 neighborid = group.pop('neighborid')
@@ -6209,7 +5371,7 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
                     neighbor_dict.update({'state': prefixreceived.lower()})
                 continue
 
-            m = p8a.match(line)
+            m = p.p8a.match(line)
             if m:
                 group = m.groupdict()
                 neighborid = group.pop('neighborid')
@@ -6220,7 +5382,7 @@ class ShowBgpL2vpnEvpnSummary(ShowBgpL2vpnEvpnSummarySchema):
                 neighbor_dict.update({'version': int(group.pop('neighborversion'))})
                 continue
 
-            m = p8b.match(line)
+            m = p.p8b.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'msgrecvd': int(group.pop('msgrecvd'))})
@@ -6336,19 +5498,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
       'Extcommunity',
       'prefixversion']
 
-    def cli(self,route_type,vrf='',output=None):
-        if not route_type:
-            out = ""
-        if output is None:
-            if vrf:
-                out = self.device.execute(self.cli_command[1].format(route_type=route_type,vrf=vrf))
-            else:
-                out = self.device.execute(self.cli_command[0].format(route_type=route_type))
-        else:
-            out = output
-
-        result_dict = {}
-
+    patterns = Patterns(
         # BGP routing table information for VRF default, address family L2VPN EVPN
         # Route Distinguisher: 10.121.0.55:27001   (ES [0300.00ff.0001.2c00.0309 0])
         # BGP routing table entry for [4]:[0300.00ff.0001.2c00.0309]:[32]:[192.168.111.55]/136, version 13144
@@ -6367,38 +5517,58 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
         #   Path-id 1 advertised to peers:
         #     10.121.0.11          10.121.0.22          10.121.0.33          10.121.0.44
         #     10.196.0.11
+        p1=r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>[\w]+),'
+            ' +address +family +(?P<af_name>[\w\s]+)$',
+        p2=r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)( +\(ES +(?P<es>[\w\s\[\]\.]+)\))?( +\((?P<rd_vrf>[\w]+)VNI +(?P<rd_vniid>[\d]+)\))?$',
+        p3=r'^\s*BGP routing table entry for +(?P<nonipprefix>[\w\[\]\:\.\/]+), +version +(?P<prefixversion>[\d]+)$',
+        p4=r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available, +best +#(?P<bestpathnr>[\d]+)\)$',
+        p5=r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list(, +(?P<flags_attr>[\w\s\/\,]+))?$',
+        p6=r'^\s*Multipath: +(?P<multipath>[\w]+)$',
+        p7=r'^\s*Advertised path-id +(?P<path_id>[\d]+)$',
+        p8=r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+), +(?P<pathtypes>[\S\s\,\:\/]+)?$',
 
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>[\w]+),'
-                        ' +address +family +(?P<af_name>[\w\s]+)$')
-        p2 = re.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)( +\(ES +(?P<es>[\w\s\[\]\.]+)\))?( +\((?P<rd_vrf>[\w]+)VNI +(?P<rd_vniid>[\d]+)\))?$')
-        p3 = re.compile(r'^\s*BGP routing table entry for +(?P<nonipprefix>[\w\[\]\:\.\/]+), +version +(?P<prefixversion>[\d]+)$')
-        p4 = re.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available, +best +#(?P<bestpathnr>[\d]+)\)$')
-        p5 = re.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list(, +(?P<flags_attr>[\w\s\/\,]+))?$')
-        p6 = re.compile(r'^\s*Multipath: +(?P<multipath>[\w]+)$')
-        p7 = re.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
-        p8 = re.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+), +(?P<pathtypes>[\S\s\,\:\/]+)?$')
         #          Imported from 99.99.99.99:10:[5]:[0]:[0]:[32]:[100.4.1.2]/224
-        p9 = re.compile(r'^\s*Imported from +(?P<imported_from>[\w\.\:\/\[\]\,]+)$')
+        p9=r'^\s*Imported from +(?P<imported_from>[\w\.\:\/\[\]\,]+)$',
+
         #   Gateway IP: 0.0.0.0
-        p10 = re.compile(r'^\s*Gateway IP: +(?P<gateway_ip>[a-zA-Z0-9\.\:]+)$')
+        p10=r'^\s*Gateway IP: +(?P<gateway_ip>[a-zA-Z0-9\.\:]+)$',
+
         #   AS-Path: 4 1 10 33299 51178 47751 {27016} , path sourced external to AS
-        p11 = re.compile(r'^\s*AS-Path: +(?P<as_path>[\d\s\{\}]+|[\w]+)(, +path locally originated)?(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
-        p12 = re.compile(r'^\s*(?P<ipnexthop>[\d\.]+) +\((?:(?P<inaccessible>(inaccessible)), +)?metric +(?P<nexthopmetric>[\d]+)\) +from +(?P<neighbor>[\d\.]+)'
-                         ' +\((?P<neighborid>[\d\.]+)\)$')
-        p13 = re.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)? +localpref +(?P<localpref>[\d]+),'
-                         ' +weight +(?P<weight>[\d]+)$')
-        p14 = re.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
-        p15 = re.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+) +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
-        p16 = re.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
-        p17 = re.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
-        p18 = re.compile(r'^\s*Received +label +(?P<inlabel>[\d]+)$')
+        p11=r'^\s*AS-Path: +(?P<as_path>[\d\s\{\}]+|[\w]+)(, +path locally originated)?(, +path sourced +(?P<internal_external>[\w]+) to AS)?$',
+        p12=r'^\s*(?P<ipnexthop>[\d\.]+) +\((?:(?P<inaccessible>(inaccessible)), +)?metric +(?P<nexthopmetric>[\d]+)\) +from +(?P<neighbor>[\d\.]+)'
+             ' +\((?P<neighborid>[\d\.]+)\)$',
+        p13=r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)? +localpref +(?P<localpref>[\d]+),'
+             ' +weight +(?P<weight>[\d]+)$',
+        p14=r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$',
+        p15=r'^\s*Originator: +(?P<originatorid>[\d\.]+) +Cluster +list: +(?P<clusterlist>[\d\.]+)$',
+        p16=r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$',
+        p17=r'^\s*(?P<advertisedto>[\d\s\.]+)$',
+        p18=r'^\s*Received +label +(?P<inlabel>[\d]+)$',
 
         # PMSI Tunnel Attribute:
-        p19 = re.compile(r'^\s*(?P<attribute>[\w]+) +Tunnel +Attribute:$')
+        p19=r'^\s*(?P<attribute>[\w]+) +Tunnel +Attribute:$',
+
         #         flags: 0x00, Tunnel type: Ingress Replication
-        p20 = re.compile(r'^\s*flags: +(?P<flags>[\w]+), +Tunnel type: +(?P<tunnel_type>[\w\s]+)$')
+        p20=r'^\s*flags: +(?P<flags>[\w]+), +Tunnel type: +(?P<tunnel_type>[\w\s]+)$',
+
         #         Label: 10101, Tunnel Id: 10.196.7.7
-        p21 = re.compile(r'^\s*Label: +(?P<label>[\d]+), +Tunnel +Id: +(?P<tunnel_id>[\d\.]+)$')
+        p21=r'^\s*Label: +(?P<label>[\d]+), +Tunnel +Id: +(?P<tunnel_id>[\d\.]+)$',
+    )
+
+    def cli(self,route_type,vrf='',output=None):
+        if not route_type:
+            out = ""
+        if output is None:
+            if vrf:
+                out = self.device.execute(self.cli_command[1].format(route_type=route_type,vrf=vrf))
+            else:
+                out = self.device.execute(self.cli_command[0].format(route_type=route_type))
+        else:
+            out = output
+
+        result_dict = {}
+
+        p = ShowBgpL2vpnEvpnRouteType.patterns
 
         for line in out.splitlines():
             if line:
@@ -6406,7 +5576,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = 'default'
@@ -6414,7 +5584,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 af_name = group.get('af_name').lower()
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 bgp_dict = result_dict.setdefault('instance', {}).setdefault(instance, {}).\
@@ -6428,7 +5598,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                     rd_dict.update({'rd_vniid': int(group.pop('rd_vniid'))})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 nonipprefix = group.pop('nonipprefix').strip()
@@ -6438,18 +5608,18 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 index = 0
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 prefix_dict.update({k:int(v) for k,v in group.items()})
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 prefix_dict.update({'on_xmitlist':True})
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 group = m.groupdict()
                 mpath  = group.pop('multipath').lower()
@@ -6457,13 +5627,13 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 continue
 
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 path_temp_dict = prefix_dict.setdefault('path',{})
                 continue
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 index += 1
                 path_temp_dict = prefix_dict.setdefault('path', {})
@@ -6488,26 +5658,26 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                     path_dict.update({'pathnolabeledrnh': False})
                 continue
             
-            m = p9.match(line)
+            m = p.p9.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'imported_from': group.get('imported_from')})
                 continue
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'gateway_ip': group.get('gateway_ip')})
                 continue
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 as_path = group.get('as_path').strip().lower()
                 path_dict.update({'as_path': as_path})	
                 continue
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 path_dict['ipnexthop'] = group['ipnexthop']
@@ -6518,7 +5688,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                     path_dict['inaccessible'] = True
                 continue
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'origin': group.pop('origin').lower()})
@@ -6526,13 +5696,13 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 path_dict.update({'weight': int(group.pop('weight'))})
                 continue
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: v.split( ) for k, v in group.items()})
                 continue
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'originatorid': group.pop('originatorid')})
@@ -6540,7 +5710,7 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                 continue
 
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 for k, v in group.items():
@@ -6550,25 +5720,25 @@ class ShowBgpL2vpnEvpnRouteType(ShowBgpL2vpnEvpnRouteTypeSchema):
                         path_dict.update({k:v.split()})
                 continue
 
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'inlabel': int(group.pop('inlabel'))})
                 continue
 
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 tunnel_dict = path_dict.setdefault('pmsi_tunnel_attribute',{})
                 continue
 
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 group = m.groupdict()
                 tunnel_dict.update({k:v for k, v in group.items()})
                 continue
 
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 group = m.groupdict()
                 tunnel_dict.update({k: v for k, v in group.items()})
@@ -6811,13 +5981,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
       'rtrefreshrecvd',
       'retry']
 
-    def cli(self,output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command)
-        else:
-            out = output
-        result_dict = {}
-        recieve_flag = gr_adv_flag = gr_recv_flag = gr_fwd_flag = gr_flag = False
+    patterns = Patterns(
         # BGP neighbor is 172.16.205.8, remote AS 200, ebgp link, Peer index 3
         # BGP version 4, remote router ID 192.168.144.33
         # BGP state = Idle, down for 4w6d, retry in 0.000000
@@ -6881,122 +6045,131 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
         # Local host: 172.16.205.6, Local port: 179
         # Foreign host: 172.16.205.8, Foreign port: 52715
         # fd = 84
-
-        p1 = re.compile(r'^\s*BGP +neighbor +is +(?P<neighbor>[\d\.]+), remote AS +(?P<remoteas>[\d]+), +(?P<link>[\w]+) +link,'
-                        ' +Peer index +(?P<index>[\d]+)$')
-        p2 = re.compile(r'^\s*BGP version +(?P<version>[\d]+), remote router ID +(?P<remote_id>[\d\.]+)$')
-        p3 = re.compile(r'^\s*BGP +state += +(?P<state>[\w\s\(\)]+), +(?P<up>[\w]+) +for'
-                        ' +(?P<elapsedtime>[\w\:]+)(, +retry in +(?P<retry>[\w\:]+))?$')
-        p4 = re.compile(r'^\s*Peer is directly attached, interface +(?P<connectedif>[\w\/]+)$')
-        p5 = re.compile(r'^\s*BFD live-detection is configured and enabled, state is +(?P<bfd_state>[\w]+)?$')
-        p6 = re.compile(r'^\s*TCP MD5 authentication is set \(enabled\)$')
-        p7 = re.compile(r'^\s*Last read +(?P<lastread>[\w\:\.]+), hold time = +(?P<holdtime>[\d]+),'
-                            ' +keepalive interval is +(?P<keepalivetime>[\d]+) +seconds$')
-        p8 = re.compile(r'^\s*Last written +(?P<lastwrite>[\w\:\.]+), keepalive timer expiry due +(?P<keepalive>[\w\:]+)$')
-        p9 = re.compile(r'^\s*Received +(?P<msgrecvd>[\d]+) +messages, +(?P<notificationsrcvd>[\d]+) +notifications,'
-                        ' +(?P<recvbufbytes>[\d]+)+ bytes in queue$')
-        p10 = re.compile(r'^\s*Sent +(?P<msgsent>[\d]+) messages,'
-                          ' +(?P<notificationssent>[\d]+)'
-                          ' +notifications, +(?P<sentbytesoutstanding>[\d]+)'
-                          '(?:\((?P<totalbytessent>[\d]+)\))? +bytes in queue$')
-        p11 = re.compile(r'^\s*Connections established +(?P<connsestablished>[\d]+), +dropped +(?P<connsdropped>[\d]+)$')
-        p12 = re.compile(r'^\s*Last reset by us +(?P<resettime>[\w]+), +due to +(?P<resetreason>[\w\s]+)$')
-        p13 = re.compile(r'^\s*Last reset by peer +(?P<peerresettime>[\w]+), due to +(?P<peerresetreason>[\w\s]+)$')
-        p14 = re.compile(r'^\s*Dynamic capability: advertised +\(+(?P<cap_advertised>[\w\,\s]+)\) +received +\(+(?P<cap_received>[\w\,\s]+)\)$')
-        p15 = re.compile(r'^\s*Dynamic capability \(old\): +(?P<capolddynamicadvertised>[\w]+)( +(?P<capolddynamicrecvd>[\w\s]+))?$')
-        p16 = re.compile(r'^\s*Route refresh capability \(new\): +(?P<caprradvertised>[\w]+)( +(?P<caprrrecvd>[\w]+))?$')
-        p17 = re.compile(r'^\s*Route refresh capability \(old\): +(?P<capoldrradvertised>[\w]+)( +(?P<capoldrrrecvd>[\w]+))?$')
-        p18 = re.compile(r'^\s*4-Byte AS capability: +(?P<capas4advertised>[\w]+)( +(?P<capas4recvd>[\w]+))?$')
-        p19 = re.compile(r'^\s*Address family +(?P<af_name>[\w\s]+): +(?P<af_advertised>[a][\w]+)( +(?P<af_recvd>[r][\w]+))?$')
-        p20 = re.compile(r'^\s*Graceful Restart capability: +(?P<capgradvertised>[\w]+)( +(?P<capgrrecvd>[\w]+))?$')
-        p20_1 = re.compile(r'^\s*Graceful Restart Parameters:$')
-        p21 = re.compile(r'^\s*Address families advertised to peer:$')
-        p22 = re.compile(r'^(?P<space>\s{4})((?P<gr_af_name>(?!Sent)[\w].*)+)$')
-        p23 = re.compile(r'^\s*Address families received from peer:$')
-        p24_1 = re.compile(r'^\s*Forwarding state preserved by peer for:$')
-        p25 = re.compile(r'^\s*Restart time advertised to peer: +(?P<grrestarttime>[\d]+) +seconds$')
-        p26 = re.compile(r'^\s*Stale time for routes advertised by peer: +(?P<grstaletiem>[\d]+) +seconds$')
-        p27 = re.compile(r'^\s*Restart time advertised by peer: +(?P<grrecvdrestarttime>[\d]+) +seconds$')
-        p28 = re.compile(r'^\s*Extended Next Hop Encoding Capability: +(?P<capextendednhadvertised>[\w]+)( +(?P<capextendednhrecvd>[\w]+))?$')
-        p29 = re.compile(r'^\s*Receive IPv6 next hop encoding Capability for AF:$')
-        p30 = re.compile(r'^\s*(?P<space>\s{4})(?P<capextendednh_af_name>[\w\s]+)$')
-        p31 = re.compile(r'^\s*Opens: +(?P<openssent>[\d]+) +(?P<opensrecvd>[\d]+)$')
-        p32 = re.compile(r'^\s*Notifications: +(?P<notificationssent>[\d]+) +(?P<notificationsrcvd>[\d]+)$')
-        p33 = re.compile(r'^\s*Updates: +(?P<updatessent>[\d]+) +(?P<updatesrecvd>[\d]+)$')
-        p34 = re.compile(r'^\s*Keepalives: +(?P<keepalivesent>[\d]+) +(?P<keepaliverecvd>[\d]+)$')
-        p35 = re.compile(r'^\s*Route Refresh: +(?P<rtrefreshsent>[\d]+) +(?P<rtrefreshrecvd>[\d]+)$')
-        p36 = re.compile(r'^\s*Capability: +(?P<capabilitiessent>[\d]+) +(?P<capabilitiesrecvd>[\d]+)$')
-        p38 = re.compile(r'^\s*Total bytes: +(?P<bytessent>[\d]+) +(?P<bytesrecvd>[\d]+)$')
-        p39 = re.compile(r'^\s*Bytes in queue: +(?P<bytesinqueuesent>[\d]+) +(?P<bytesinqueuerecvd>[\d]+)$')
-        p40 = re.compile(r'^\s*For address family: +(?P<per_af_name>[\w\ ]+)$')
-        p41 = re.compile(r'^\s*BGP table version +(?P<tableversion>[\d]+), neighbor version +(?P<neighbortableversion>[\d]+)$')
-        p42 = re.compile(r'^\s*(?P<pfxrecvd>[\d]+) +accepted paths consume +(?P<pfxbytes>[\d]+) +bytes of memory$')
-        p43 = re.compile(r'^\s*Community attribute sent to this neighbor$')
-        p44 = re.compile(r'^\s*Extended community attribute sent to this neighbor$')
-        p46 = re.compile(r'^\s*Last End-of-RIB received +(?P<lastendribreceived>[\w\:]+) +after session start$')
-        p47 = re.compile(r'^\s*Last End-of-RIB sent +(?P<lastendribsent>[\w\:]+) +after session start$')
-        p48 = re.compile(r'^\s*First convergence +(?P<rrconfigured>[\w\:]+)'
-                         ' +after session start with +(?P<pfxbytes>[\d]+) +routes sent$')
-        p49 = re.compile(r'^\s*Local host: +(?P<localaddr>[\d\.]+), Local port: +(?P<localport>[\d\.]+)$')
-        p50 = re.compile(r'^\s*Foreign host: +(?P<remoteaddr>[\d\.]+), Foreign port: +(?P<remoteport>[\d]+)$')
-        p51 = re.compile(r'^\s*fd = +(?P<fd>[\d]+)$')
+        p1=r'^\s*BGP +neighbor +is +(?P<neighbor>[\d\.]+), remote AS +(?P<remoteas>[\d]+), +(?P<link>[\w]+) +link,'
+            ' +Peer index +(?P<index>[\d]+)$',
+        p2=r'^\s*BGP version +(?P<version>[\d]+), remote router ID +(?P<remote_id>[\d\.]+)$',
+        p3=r'^\s*BGP +state += +(?P<state>[\w\s\(\)]+), +(?P<up>[\w]+) +for'
+            ' +(?P<elapsedtime>[\w\:]+)(, +retry in +(?P<retry>[\w\:]+))?$',
+        p4=r'^\s*Peer is directly attached, interface +(?P<connectedif>[\w\/]+)$',
+        p5=r'^\s*BFD live-detection is configured and enabled, state is +(?P<bfd_state>[\w]+)?$',
+        p6=r'^\s*TCP MD5 authentication is set \(enabled\)$',
+        p7=r'^\s*Last read +(?P<lastread>[\w\:\.]+), hold time = +(?P<holdtime>[\d]+),'
+            ' +keepalive interval is +(?P<keepalivetime>[\d]+) +seconds$',
+        p8=r'^\s*Last written +(?P<lastwrite>[\w\:\.]+), keepalive timer expiry due +(?P<keepalive>[\w\:]+)$',
+        p9=r'^\s*Received +(?P<msgrecvd>[\d]+) +messages, +(?P<notificationsrcvd>[\d]+) +notifications,'
+            ' +(?P<recvbufbytes>[\d]+)+ bytes in queue$',
+        p10=r'^\s*Sent +(?P<msgsent>[\d]+) messages,'
+             ' +(?P<notificationssent>[\d]+)'
+             ' +notifications, +(?P<sentbytesoutstanding>[\d]+)'
+             '(?:\((?P<totalbytessent>[\d]+)\))? +bytes in queue$',
+        p11=r'^\s*Connections established +(?P<connsestablished>[\d]+), +dropped +(?P<connsdropped>[\d]+)$',
+        p12=r'^\s*Last reset by us +(?P<resettime>[\w]+), +due to +(?P<resetreason>[\w\s]+)$',
+        p13=r'^\s*Last reset by peer +(?P<peerresettime>[\w]+), due to +(?P<peerresetreason>[\w\s]+)$',
+        p14=r'^\s*Dynamic capability: advertised +\(+(?P<cap_advertised>[\w\,\s]+)\) +received +\(+(?P<cap_received>[\w\,\s]+)\)$',
+        p15=r'^\s*Dynamic capability \(old\): +(?P<capolddynamicadvertised>[\w]+)( +(?P<capolddynamicrecvd>[\w\s]+))?$',
+        p16=r'^\s*Route refresh capability \(new\): +(?P<caprradvertised>[\w]+)( +(?P<caprrrecvd>[\w]+))?$',
+        p17=r'^\s*Route refresh capability \(old\): +(?P<capoldrradvertised>[\w]+)( +(?P<capoldrrrecvd>[\w]+))?$',
+        p18=r'^\s*4-Byte AS capability: +(?P<capas4advertised>[\w]+)( +(?P<capas4recvd>[\w]+))?$',
+        p19=r'^\s*Address family +(?P<af_name>[\w\s]+): +(?P<af_advertised>[a][\w]+)( +(?P<af_recvd>[r][\w]+))?$',
+        p20=r'^\s*Graceful Restart capability: +(?P<capgradvertised>[\w]+)( +(?P<capgrrecvd>[\w]+))?$',
+        p20_1=r'^\s*Graceful Restart Parameters:$',
+        p21=r'^\s*Address families advertised to peer:$',
+        p22=r'^(?P<space>\s{4})((?P<gr_af_name>(?!Sent)[\w].*)+)$',
+        p23=r'^\s*Address families received from peer:$',
+        p24_1=r'^\s*Forwarding state preserved by peer for:$',
+        p25=r'^\s*Restart time advertised to peer: +(?P<grrestarttime>[\d]+) +seconds$',
+        p26=r'^\s*Stale time for routes advertised by peer: +(?P<grstaletiem>[\d]+) +seconds$',
+        p27=r'^\s*Restart time advertised by peer: +(?P<grrecvdrestarttime>[\d]+) +seconds$',
+        p28=r'^\s*Extended Next Hop Encoding Capability: +(?P<capextendednhadvertised>[\w]+)( +(?P<capextendednhrecvd>[\w]+))?$',
+        p29=r'^\s*Receive IPv6 next hop encoding Capability for AF:$',
+        p30=r'^\s*(?P<space>\s{4})(?P<capextendednh_af_name>[\w\s]+)$',
+        p31=r'^\s*Opens: +(?P<openssent>[\d]+) +(?P<opensrecvd>[\d]+)$',
+        p32=r'^\s*Notifications: +(?P<notificationssent>[\d]+) +(?P<notificationsrcvd>[\d]+)$',
+        p33=r'^\s*Updates: +(?P<updatessent>[\d]+) +(?P<updatesrecvd>[\d]+)$',
+        p34=r'^\s*Keepalives: +(?P<keepalivesent>[\d]+) +(?P<keepaliverecvd>[\d]+)$',
+        p35=r'^\s*Route Refresh: +(?P<rtrefreshsent>[\d]+) +(?P<rtrefreshrecvd>[\d]+)$',
+        p36=r'^\s*Capability: +(?P<capabilitiessent>[\d]+) +(?P<capabilitiesrecvd>[\d]+)$',
+        p38=r'^\s*Total bytes: +(?P<bytessent>[\d]+) +(?P<bytesrecvd>[\d]+)$',
+        p39=r'^\s*Bytes in queue: +(?P<bytesinqueuesent>[\d]+) +(?P<bytesinqueuerecvd>[\d]+)$',
+        p40=r'^\s*For address family: +(?P<per_af_name>[\w\ ]+)$',
+        p41=r'^\s*BGP table version +(?P<tableversion>[\d]+), neighbor version +(?P<neighbortableversion>[\d]+)$',
+        p42=r'^\s*(?P<pfxrecvd>[\d]+) +accepted paths consume +(?P<pfxbytes>[\d]+) +bytes of memory$',
+        p43=r'^\s*Community attribute sent to this neighbor$',
+        p44=r'^\s*Extended community attribute sent to this neighbor$',
+        p46=r'^\s*Last End-of-RIB received +(?P<lastendribreceived>[\w\:]+) +after session start$',
+        p47=r'^\s*Last End-of-RIB sent +(?P<lastendribsent>[\w\:]+) +after session start$',
+        p48=r'^\s*First convergence +(?P<rrconfigured>[\w\:]+)'
+             ' +after session start with +(?P<pfxbytes>[\d]+) +routes sent$',
+        p49=r'^\s*Local host: +(?P<localaddr>[\d\.]+), Local port: +(?P<localport>[\d\.]+)$',
+        p50=r'^\s*Foreign host: +(?P<remoteaddr>[\d\.]+), Foreign port: +(?P<remoteport>[\d]+)$',
+        p51=r'^\s*fd = +(?P<fd>[\d]+)$',
 
         # Enhanced error processing: On
-        p52 = re.compile(r'\s*Enhanced error processing\: +(?P<error_processing>\w+)$')
+        p52=r'\s*Enhanced error processing\: +(?P<error_processing>\w+)$',
 
         # 0 discarded attributes
-        p53 = re.compile(r'\s*(?P<discarded_attr>\d) +discarded +attributes$')
-        
-        # Last error length received: 0 
-        p54 = re.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_sent>\d+)$')
-        
+        p53=r'\s*(?P<discarded_attr>\d) +discarded +attributes$',
+
+        # Last error length received: 0
+        p54=r'\s*Last +error +length +received\: +(?P<last_error_length_sent>\d+)$',
+
         # Reset error value sent: 0
-        p55 = re.compile(r'\s*Reset +error +value +received(\:)? +(?P<reset_error_value_sent>\d+)$')
+        p55=r'\s*Reset +error +value +received(\:)? +(?P<reset_error_value_sent>\d+)$',
 
         # Reset error sent major: 0 minor: 0
-        p56 = re.compile(r'\s*Reset +error +sent +major\: '
-                        r'+(?P<reset_error_sent_major>\d+) +minor\: '
-                        r'+(?P<reset_error_sent_minor>\d+)$')
-        
+        p56=r'\s*Reset +error +sent +major\: '
+            r'+(?P<reset_error_sent_major>\d+) +minor\: '
+            r'+(?P<reset_error_sent_minor>\d+)$',
+
         # Last error length received: 0
-        p57 = re.compile(r'\s*Last +error +length +received\: +(?P<last_error_length_received>\d+)$')
+        p57=r'\s*Last +error +length +received\: +(?P<last_error_length_received>\d+)$',
 
         # Reset error value received 0
-        p58 = re.compile(r'\s*Reset error value received(\:)? +(?P<reset_error_value_received>\d+)$')
+        p58=r'\s*Reset error value received(\:)? +(?P<reset_error_value_received>\d+)$',
 
         # Reset error received major: 0 minor: 0
-        p59 = re.compile(r'\s*Reset error received major\: '
-                        r'+(?P<reset_error_received_major>\d+) +minor\:'
-                        r' +(?P<reset_error_received_minor>\d+)$')
+        p59=r'\s*Reset error received major\: '
+            r'+(?P<reset_error_received_major>\d+) +minor\:'
+            r' +(?P<reset_error_received_minor>\d+)$',
 
         # 10 accepted prefixes (10 paths), consuming 2360 bytes of memory
-        p60 = re.compile(r'\s*(?P<accepted_prefixes>\d+) +accepted prefixes'
-                        r' +\(\d+ +paths\)\, +consuming '
-                        r'+(?P<memory_consumed_in_bytes>\d+) +bytes +of +memory$')
+        p60=r'\s*(?P<accepted_prefixes>\d+) +accepted prefixes'
+            r' +\(\d+ +paths\)\, +consuming '
+            r'+(?P<memory_consumed_in_bytes>\d+) +bytes +of +memory$',
 
         # 0 received prefixes treated as withdrawn
-        p61 = re.compile(r'\s*(?P<received_prefixes>\d+) +received '
-                        r'+prefixes +treated +as +withdrawn$')
-        
+        p61=r'\s*(?P<received_prefixes>\d+) +received '
+            r'+prefixes +treated +as +withdrawn$',
+
         # 40541 sent prefixes (40541 paths)
-        p62 = re.compile(r'\s*(?P<sent_prefixes>\d+) +sent prefixes +\(\d+ paths\)$')
+        p62=r'\s*(?P<sent_prefixes>\d+) +sent prefixes +\(\d+ paths\)$',
 
         # Advertise GW IP is enabled
-        p63 = re.compile(r'\s*Advertise +GW +IP +is +(?P<advertise_gw_ip>\w+)$')
+        p63=r'\s*Advertise +GW +IP +is +(?P<advertise_gw_ip>\w+)$',
 
         # Outbound route-map configured is GENIE_TEST, handle obtained
-        p64 = re.compile(r'\s*Outbound +route\-map +configured +is '
-                        r'+(?P<outbound_route_map>\w+)\, +handle +obtained$')
+        p64=r'\s*Outbound +route\-map +configured +is '
+            r'+(?P<outbound_route_map>\w+)\, +handle +obtained$',
 
         # Last End-of-RIB received 00:00:11 after session start
         # Last End-of-RIB sent 00:00:06 after session start
-        p65 = re.compile(r'\s*Last +End\-of\-RIB +(?P<action>received|sent) '
-                        r'+(?P<time>[\w:]+) +after +session +start$')
+        p65=r'\s*Last +End\-of\-RIB +(?P<action>received|sent) '
+            r'+(?P<time>[\w:]+) +after +session +start$',
 
         # First convergence 00:00:06 after session start with 18810 routes sent
-        p66 = re.compile(r'\s*First +convergence +(?P<first_convergence>[\w:]+) '
-                        r'+after +session +start +with '
-                        r'+(?P<convergence_routes_sent>\d+) +routes +sent$')
+        p66=r'\s*First +convergence +(?P<first_convergence>[\w:]+) '
+            r'+after +session +start +with '
+            r'+(?P<convergence_routes_sent>\d+) +routes +sent$',
+    )
+
+    def cli(self,output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command)
+        else:
+            out = output
+        result_dict = {}
+        recieve_flag = gr_adv_flag = gr_recv_flag = gr_fwd_flag = gr_flag = False
+        p = ShowBgpL2vpnEvpnNeighbors.patterns
 
         for line in out.splitlines():
             if line:
@@ -7004,7 +6177,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = 'default'
@@ -7024,27 +6197,27 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
 
             m2 = ""
 
-            if p2.match(line):
-                m2 = p2.match(line)
-            if p4.match(line):
-                m2 = p4.match(line)
-
-            if p6.match(line):
-                m2 = p6.match(line)
-            if p7.match(line):
-                m2 = p7.match(line)
-            if p8.match(line):
-                m2 = p8.match(line)
-            if p9.match(line):
-                m2 = p9.match(line)
-            if p10.match(line):
-                m2 = p10.match(line)
-            if p11.match(line):
-                m2 = p11.match(line)
-            if p12.match(line):
-                m2 = p12.match(line)
-            if p13.match(line):
-                m2 = p13.match(line)
+            if p.p2.match(line):
+                m2 = p.p2.match(line)
+            if p.p4.match(line):
+                m2 = p.p4.match(line)
+
+            if p.p6.match(line):
+                m2 = p.p6.match(line)
+            if p.p7.match(line):
+                m2 = p.p7.match(line)
+            if p.p8.match(line):
+                m2 = p.p8.match(line)
+            if p.p9.match(line):
+                m2 = p.p9.match(line)
+            if p.p10.match(line):
+                m2 = p.p10.match(line)
+            if p.p11.match(line):
+                m2 = p.p11.match(line)
+            if p.p12.match(line):
+                m2 = p.p12.match(line)
+            if p.p13.match(line):
+                m2 = p.p13.match(line)
             if m2:
                 group = m2.groupdict()
                 for k, v in group.items():
@@ -7054,7 +6227,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                         else:
                             neighbor_dict.update({k:v.lower()})
                 continue
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 if group.pop('up') == 'up':
@@ -7070,12 +6243,12 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                             neighbor_dict.update({k:v.lower()})
                 continue
 
-            m= p5.match(line)
+            m= p.p5.match(line)
             if m:
                 neighbor_dict.update({'bfd':True})
                 continue
 
-            m = p14.match(line)
+            m = p.p14.match(line)
             if m:
                 group = m.groupdict()
                 mp_ref_gr = group.pop('cap_advertised')
@@ -7095,34 +6268,34 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                     neighbor_dict.update({'capgrdynamicrecvd': True})
                 continue
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 neighbor_dict.update({'capolddynamicadvertised': True})
                 neighbor_dict.update({'capolddynamicrecvd':True})
                 continue
 
-            m = p16.match(line)
+            m = p.p16.match(line)
             if m:
 
                 neighbor_dict.update({'caprradvertised': True})
                 neighbor_dict.update({'caprrrecvd': True})
                 continue
 
-            m = p17.match(line)
+            m = p.p17.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'capoldrradvertised': True})
                 neighbor_dict.update({'capoldrrrecvd': True})
                 continue
 
-            m = p18.match(line)
+            m = p.p18.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'capas4advertised': True})
                 neighbor_dict.update({'capas4recvd': True})
                 continue
 
-            m = p19.match(line)
+            m = p.p19.match(line)
             if m:
                 group = m.groupdict()
                 af = group.pop('af_name').lower()
@@ -7140,23 +6313,23 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
 
-            m = p20.match(line)
+            m = p.p20.match(line)
             if m:
                 neighbor_dict.update({'capgradvertised':True})
                 neighbor_dict.update({'capgrrecvd':True})
                 continue
 
-            m = p20_1.match(line)
+            m = p.p20_1.match(line)
             if m:
                 gr_flag = True
                 continue
 
-            m = p21.match(line)
+            m = p.p21.match(line)
             if m:
                 gr_adv_flag = True
                 continue
 
-            m = p22.match(line)
+            m = p.p22.match(line)
             if m:
                 if gr_flag:
                     group = m.groupdict()
@@ -7181,36 +6354,36 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 recieve_flag = gr_recv_flag = gr_adv_flag = gr_fwd_flag = False
                 continue
 
-            m = p23.match(line)
+            m = p.p23.match(line)
             if m:
 
                 gr_recv_flag = True
                 continue
 
-            m = p24_1.match(line)
+            m = p.p24_1.match(line)
             if m:
                 gr_fwd_flag = True
                 continue
 
-            m = p25.match(line)
+            m = p.p25.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'grrestarttime': int(group.pop('grrestarttime'))})
                 continue
 
-            m = p26.match(line)
+            m = p.p26.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'grstaletiem': int(group.pop('grstaletiem'))})
                 continue
 
-            m = p27.match(line)
+            m = p.p27.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'grrecvdrestarttime': int(group.pop('grrecvdrestarttime'))})
                 continue
 
-            m = p28.match(line)
+            m = p.p28.match(line)
             if m:
                 group = m.groupdict()
                 capextendednhadvertised = group.pop('capextendednhadvertised')
@@ -7221,21 +6394,21 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                     neighbor_dict.update({'capextendednhrecvd': True})
                 continue
 
-            m = p29.match(line)
+            m = p.p29.match(line)
             if m:
                 gr_recv_flag = gr_adv_flag = gr_fwd_flag = False
                 recieve_flag = True
                 continue
 
             m3 = ""
-            if p31.match(line):  m3 =  p31.match(line)
-            if p32.match(line):  m3 =  p32.match(line)
-            if p33.match(line):  m3 =  p33.match(line)
-            if p34.match(line):  m3 =  p34.match(line)
-            if p35.match(line) : m3 =  p35.match(line)
-            if p36.match(line) : m3 =  p36.match(line)
+            if p.p31.match(line):  m3 =  p.p31.match(line)
+            if p.p32.match(line):  m3 =  p.p32.match(line)
+            if p.p33.match(line):  m3 =  p.p33.match(line)
+            if p.p34.match(line):  m3 =  p.p34.match(line)
+            if p.p35.match(line) : m3 =  p.p35.match(line)
+            if p.p36.match(line) : m3 =  p.p36.match(line)
 
-            if p38.match(line) : m3 =  p38.match(line)
+            if p.p38.match(line) : m3 =  p.p38.match(line)
 
 
             if m3:
@@ -7243,7 +6416,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 neighbor_dict.update({k:int(v) for k,v in group.items()})
                 continue
 
-            m = p40.match(line)
+            m = p.p40.match(line)
             if m:
                 group = m.groupdict()
                 per_af_name = group.pop('per_af_name').lower()
@@ -7251,50 +6424,50 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 peraf_dict.update({'per_af_name': per_af_name})
                 continue
 
-            m = p41.match(line)
+            m = p.p41.match(line)
             if m:
                 group = m.groupdict()
                 peraf_dict.update({k:int(v) for k,v in group.items()})
                 continue
 
-            m = p42.match(line)
+            m = p.p42.match(line)
             if m:
                 group = m.groupdict()
                 peraf_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
-            m = p43.match(line)
+            m = p.p43.match(line)
             if m:
                 peraf_dict.update({'sendcommunity': True})
                 continue
 
-            m = p44.match(line)
+            m = p.p44.match(line)
             if m:
                 peraf_dict.update({'sendextcommunity': True})
                 continue
 
 
-            m = p49.match(line)
+            m = p.p49.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'localaddr': group.pop('localaddr')})
                 neighbor_dict.update({'localport': int(group.pop('localport'))})
                 continue
-            m = p50.match(line)
+            m = p.p50.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'remoteaddr':group.pop('remoteaddr')})
                 neighbor_dict.update({'remoteport':int(group.pop('remoteport'))})
                 continue
 
-            m = p51.match(line)
+            m = p.p51.match(line)
             if m:
                 group = m.groupdict()
                 neighbor_dict.update({'fd':int(group.pop('fd'))})
                 continue
 
             # Enhanced error processing: On                
-            m = p52.match(line)
+            m = p.p52.match(line)
             if m:
                 group = m.groupdict()['error_processing']
 
@@ -7308,7 +6481,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
                     
             # 0 discarded attributes
-            m = p53.match(line)
+            m = p.p53.match(line)
             if m:
                 group = m.groupdict()
                 processing_dict = neighbor_dict.setdefault\
@@ -7320,7 +6493,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Last error length received: 0 
-            m = p54.match(line)
+            m = p.p54.match(line)
             if m:
                 neighbor_dict.update({'last_error_length_sent': \
                         int(m.groupdict().pop('last_error_length_sent'))})
@@ -7328,7 +6501,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Reset error value sent: 0
-            m = p55.match(line)
+            m = p.p55.match(line)
             if m:
                 neighbor_dict.update({'reset_error_value_sent': \
                         int(m.groupdict().pop('reset_error_value_sent'))})
@@ -7336,7 +6509,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Reset error sent major: 0 minor: 0
-            m = p56.match(line)
+            m = p.p56.match(line)
             if m:
                 neighbor_dict.update({'reset_error_sent_major': \
                     int(m.groupdict().pop('reset_error_sent_major'))})
@@ -7347,14 +6520,14 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Last error length received: 0
-            m = p57.match(line)
+            m = p.p57.match(line)
             if m:
                 neighbor_dict.update({'last_error_length_received': \
                     int(m.groupdict().pop('last_error_length_received'))})
                 continue
 
             # Reset error value received 0
-            m = p58.match(line)
+            m = p.p58.match(line)
             if m:
                 neighbor_dict.update({'reset_error_value_received': \
                     int(m.groupdict().pop('reset_error_value_received'))})
@@ -7362,7 +6535,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Reset error received major: 0 minor: 0
-            m = p59.match(line)
+            m = p.p59.match(line)
             if m:
                 neighbor_dict.update({'reset_error_received_major': \
                     int(m.groupdict().pop('reset_error_received_major'))})
@@ -7373,7 +6546,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # 10 accepted prefixes (10 paths), consuming 2360 bytes of memory
-            m = p60.match(line)
+            m = p.p60.match(line)
             if m:
                 neighbor_dict.update({'accepted_prefixes': \
                     int(m.groupdict().pop('accepted_prefixes'))})
@@ -7384,7 +6557,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # 0 received prefixes treated as withdrawn
-            m = p61.match(line)
+            m = p.p61.match(line)
             if m:
                 neighbor_dict.update({'received_prefixes': \
                     int(m.groupdict().pop('received_prefixes'))})
@@ -7392,7 +6565,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # 40541 sent prefixes (40541 paths)
-            m = p62.match(line)
+            m = p.p62.match(line)
             if m:
                 neighbor_dict.update({'sent_prefixes': \
                     int(m.groupdict().pop('sent_prefixes'))})
@@ -7400,7 +6573,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Advertise GW IP is enabled
-            m = p63.match(line)
+            m = p.p63.match(line)
             if m:
                 if 'enabled' in m.groupdict('advertise_gw_ip'):
                     neighbor_dict.update({'advertise_gw_ip': \
@@ -7409,7 +6582,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # Outbound route-map configured is GENIE_TEST, handle obtained
-            m = p64.match(line)
+            m = p.p64.match(line)
             if m:
                 neighbor_dict.update({'outbound_route_map': \
                     m.groupdict().pop('outbound_route_map')})
@@ -7418,7 +6591,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
 
             # Last End-of-RIB received 00:00:11 after session start
             # Last End-of-RIB sent 00:00:06 after session start
-            m = p65.match(line)
+            m = p.p65.match(line)
             if m:
                 group = m.groupdict()
                 if 'received' in group['action']:
@@ -7432,7 +6605,7 @@ class ShowBgpL2vpnEvpnNeighbors(ShowBgpL2vpnEvpnNeighborsSchema):
                 continue
 
             # First convergence 00:00:06 after session start with 18810 routes sent
-            m = p66.match(line)
+            m = p.p66.match(line)
             if m:
                 neighbor_dict.update({'first_convergence': \
                     m.groupdict().pop('first_convergence')})
@@ -7465,6 +6638,11 @@ class ShowBgpL2vpnEvpnWord(ShowBgpL2vpnEvpnWordSchema):
 
     cli_command = ['show bgp l2vpn evpn {mac} | grep -b {count1} -a {count2} "best path"','show bgp l2vpn evpn {mac} | be "best path, in rib" n {count2}']
 
+    patterns = Patterns(
+        p1=r'^(?P<next_hop>[0-9\.]+) +\(metric +(?P<metric>[0-9]+)\).*$',
+        p2=r'^Received label +(?P<received_label>[0-9]+).*$',
+    )
+
     def cli(self, mac, count1, count2=None,output=None):
         if output is None:
             if mac and count1:
@@ -7480,13 +6658,13 @@ class ShowBgpL2vpnEvpnWord(ShowBgpL2vpnEvpnWordSchema):
 
         ret_dict = {}
 
-        p1 = re.compile(r'^(?P<next_hop>[0-9\.]+) +\(metric +(?P<metric>[0-9]+)\).*$')
-        p2 = re.compile(r'^Received label +(?P<received_label>[0-9]+).*$')
+        p = ShowBgpL2vpnEvpnWord.patterns
+
         for line in out.splitlines():
             line = line.strip()
 
             # 10.9.0.101 (metric 9) from 10.4.0.66 (10.4.0.66)
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 if 'mac_address' not in ret_dict:
                     ret_dict['mac_address'] = {}
@@ -7498,7 +6676,7 @@ class ShowBgpL2vpnEvpnWord(ShowBgpL2vpnEvpnWordSchema):
                 continue
 
             # Received label 2001001
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
 
                 if 'mac_address' not in ret_dict:
@@ -7583,37 +6761,24 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
       'path'
       'table_version']
 
-    def cli(self, route_type="",vrf="",cmd="",output=None):
-        if output is None:
-            if not cmd:
-                if vrf and route_type:
-                    cmd = self.cli_command[0].format(route_type=route_type,vrf=vrf)
-                if route_type and not vrf:
-                    vrf = 'default'
-                    cmd = self.cli_command[1].format(route_type=route_type)
-                if not route_type and not vrf:
-                    cmd = self.cli_command[2]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-        result_dict = {}
+    patterns = Patterns(
         # BGP routing table information for VRF default, address family IPv4 MVPN
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf>\S+),'
-                ' +address +family +(?P<af>[\w\s]+)$')
+        p1=r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf>\S+),'
+            ' +address +family +(?P<af>[\w\s]+)$',
 
         # BGP table version is 390, Local Router ID is 10.16.2.2
-        p2 = re.compile(r'^\s*BGP +table +version +is +(?P<table_version>[\d]+),'
-                        ' +Local +Router +ID +is +(?P<router_id>[\d\.]+)$')
+        p2=r'^\s*BGP +table +version +is +(?P<table_version>[\d]+),'
+            ' +Local +Router +ID +is +(?P<router_id>[\d\.]+)$',
 
         #    Network            Next Hop            Metric     LocPrf     Weight Path
         # Route Distinguisher: 10.16.2.2:3    (L3VNI 10100)
-        p3 = re.compile(r'^\s*Route +Distinguisher: +(?P<rd>[\d\.\:]+)'
-                        '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
+        p3=r'^\s*Route +Distinguisher: +(?P<rd>[\d\.\:]+)'
+            '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$',
 
         # *>l[5][10.111.1.3][238.8.4.101]/64
-        p4 = re.compile(r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?'
-                            '(?P<typecode>(i|e|c|l|a|r|I)+)?'
-                            '(?P<prefix>[\w\]\/\:\.\]\[]+)$')
+        p4=r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?'
+            '(?P<typecode>(i|e|c|l|a|r|I)+)?'
+            '(?P<prefix>[\w\]\/\:\.\]\[]+)$',
 
         #                       Next Hop            Metric     LocPrf     Weight Path
         #                       10.196.7.7                           100          0 i
@@ -7621,10 +6786,27 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
         #                       10.64.4.4                                        0 200 100 i
         #                       0.0.0.0                  0        100      32768 ?
         #                       10.64.4.4              219        0 10 3277 32768 36640 {27016} e
-        p6 = re.compile(
-            r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?(?P<typecode>('
-            r'i|e|c|l|a|r|I)+)?\s+(?P<ipnexthop>[\d\.]+)?(?P<space1>\s+)?(?P<metric>['
-            r'\d]+)?\s+(?P<localpref>[\d]+)\s+?(?P<weight>[\d]+)( +(?P<path>[0-9\{\}\s]+))? +(?P<origin>[i|e|c|l|a|I|?]+)$')
+        p6=r'^\s*(?P<statuscode>[s|S|x|d|h|>|s|*\s]+)?(?P<typecode>('
+           r'i|e|c|l|a|r|I)+)?\s+(?P<ipnexthop>[\d\.]+)?(?P<space1>\s+)?(?P<metric>['
+           r'\d]+)?\s+(?P<localpref>[\d]+)\s+?(?P<weight>[\d]+)( +(?P<path>[0-9\{\}\s]+))? +(?P<origin>[i|e|c|l|a|I|?]+)$',
+    )
+
+    def cli(self, route_type="",vrf="",cmd="",output=None):
+        if output is None:
+            if not cmd:
+                if vrf and route_type:
+                    cmd = self.cli_command[0].format(route_type=route_type,vrf=vrf)
+                if route_type and not vrf:
+                    vrf = 'default'
+                    cmd = self.cli_command[1].format(route_type=route_type)
+                if not route_type and not vrf:
+                    cmd = self.cli_command[2]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+        result_dict = {}
+
+        p = ShowBgpIpMvpnRouteType.patterns
 
         for line in out.splitlines():
             if line:
@@ -7632,7 +6814,7 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 vrf = group['vrf']
@@ -7647,14 +6829,14 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
                 af_dict.update({'af_name': af})
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 af_dict.update({'table_version': group['table_version']})
                 af_dict.update({'router_id': group['router_id']})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 rd = group['rd']
@@ -7664,7 +6846,7 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
                     rd_dict.update({'rd_vrf': group['rd_vrf']})
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 index = 0
                 group = m.groupdict()
@@ -7690,7 +6872,7 @@ class ShowBgpIpMvpnRouteType(ShowBgpIpMvpnRouteTypeSchema):
                     typecode = group['typecode']
                 continue
 
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
                 index +=1
                 group = m.groupdict()
@@ -7822,78 +7004,78 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
       'prefixversion', 
       'bestpathnr']
 
-    def cli(self,vrf="",output=None):
-        if output is None:
-            if vrf:
-                cmd = self.cli_command[0].format(vrf=vrf)
-            else:
-                cmd = self.cli_command[1]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        result_dict = {}
-
+    patterns = Patterns(
         # BGP routing table information for VRF default, address family IPv4 MVPN
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>\S+),'
-                        ' +address +family +(?P<af_name>[\w\s]+)$')
+        p1=r'^\s*BGP +routing +table +information +for +VRF +(?P<vrf_name_out>\S+),'
+            ' +address +family +(?P<af_name>[\w\s]+)$',
 
         # Route Distinguisher: 10.16.2.2:3    (L3VNI 10100)
-        p2 = re.compile(r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)'
-                        '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$')
+        p2=r'^\s*Route Distinguisher: +(?P<rd>[\w\.\:]+)'
+            '( +\((L[2|3]VNI|Local VNI:) +(?P<rd_vrf>[\d]+)\))?$',
 
         # BGP routing table entry for [5][10.111.1.3][238.8.4.s101]/64, version 388
-        p3 = re.compile(
-            r'^\s*BGP +routing +table +entry +for +(?P<nonipprefix>[\d\[\]\:\.\/]+),'
-            ' +version +(?P<prefixversion>[\d]+)$')
+        p3=r'^\s*BGP +routing +table +entry +for +(?P<nonipprefix>[\d\[\]\:\.\/]+),'
+            ' +version +(?P<prefixversion>[\d]+)$',
 
         # Paths: (1 available, best #1)
-        p4 = re.compile(r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available,'
-                        ' +best +#(?P<bestpathnr>[\d]+)\)$')
+        p4=r'^\s*Paths: +\((?P<totalpaths>[\d]+) +available,'
+            ' +best +#(?P<bestpathnr>[\d]+)\)$',
 
         # Flags: (0x000002)(high32 00000000) on xmit-list, is not in mvpn
         # Flags: (0x000002)(high32 00000000) on xmit-list, is not in mvpn, is not in HW
-        p5 = re.compile(r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list'
-            '(, +(?P<flags_attr>[\w\s\/\,]+))?$')
+        p5=r'^\s*Flags: (?P<flag_xmit>[\S\s]+) +on +xmit-list'
+            '(, +(?P<flags_attr>[\w\s\/\,]+))?$',
 
         #   Advertised path-id 1
-        p7 = re.compile(r'^\s*Advertised path-id +(?P<path_id>[\d]+)$')
+        p7=r'^\s*Advertised path-id +(?P<path_id>[\d]+)$',
 
         # Path type: local, path is valid, is best path, no labeled nexthop
         # Path type: internal, path is invalid(rnh not resolved),
         #        not best reason: Neighbor Address, no labeled nexthop
-        p8 = re.compile(r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+),'
-                        ' +(?P<pathtypes>[\S\s\,\:\/\(\)]+)?$')
+        p8=r'^\s*Path type: +(?P<path_type>[\w\s\(\)]+),'
+            ' +(?P<pathtypes>[\S\s\,\:\/\(\)]+)?$',
 
         #   AS-Path: NONE, path locally originated
-        p9 = re.compile(
-            r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?'
-                '(, +path sourced +(?P<internal_external>[\w]+) to AS)?$')
+        p9=r'^\s*AS-Path: +(?P<as_path>[\w]+)(, +path locally originated)?'
+            '(, +path sourced +(?P<internal_external>[\w]+) to AS)?$',
 
         #     0.0.0.0 (metric 0) from 0.0.0.0 (10.16.2.2)
         #     10.144.6.6 (inaccessible, metric 4294967295) from 10.64.4.4 (10.64.4.4)
-        p10 = re.compile(
-            r'^\s*(?P<ipnexthop>[\d\.]+) +\(((?P<nexthop_status>[\w]+), )?metric +(?P<nexthopmetric>[\d]+)\)'
-            ' +from +(?P<neighbor>[\d\.]+)'
-            ' +\((?P<neighborid>[\d\.]+)\)$')
+        p10=r'^\s*(?P<ipnexthop>[\d\.]+) +\(((?P<nexthop_status>[\w]+), )?metric +(?P<nexthopmetric>[\d]+)\)'
+             ' +from +(?P<neighbor>[\d\.]+)'
+             ' +\((?P<neighborid>[\d\.]+)\)$',
 
         #       Origin IGP, MED not set, localpref 100, weight 32768
-        p11 = re.compile(r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)?'
-                         ' +localpref +(?P<localpref>[\d]+),'
-                         ' +weight +(?P<weight>[\d]+)$')
+        p11=r'^\s*Origin +(?P<origin>[\w]+), +(MED +(?P<med>[\w\s]+),)?'
+             ' +localpref +(?P<localpref>[\d]+),'
+             ' +weight +(?P<weight>[\d]+)$',
 
         #       Extcommunity: RT:100:10100
-        p12 = re.compile(r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$')
+        p12=r'^\s*Extcommunity: +(?P<extcommunity>[\w\s\:\.]+)$',
 
-        # Originator: 10.144.6.6 Cluster list: 10.100.5.5 
-        p13 = re.compile(r'^\s*Originator: +(?P<originatorid>[\d\.]+)'
-                         ' +Cluster +list: +(?P<clusterlist>[\d\.]+)$')
+        # Originator: 10.144.6.6 Cluster list: 10.100.5.5
+        p13=r'^\s*Originator: +(?P<originatorid>[\d\.]+)'
+             ' +Cluster +list: +(?P<clusterlist>[\d\.]+)$',
 
         #   Path-id 1 advertised to peers:
-        #     10.64.4.4            10.100.5.5        
-        p14 = re.compile(r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$')
-        p15 = re.compile(r'^\s*(?P<advertisedto>[\d\s\.]+)$')
+        #     10.64.4.4            10.100.5.5
+        p14=r'^\s*Path-id +(?P<path_id>[\d]+) +advertised to peers:$',
+        p15=r'^\s*(?P<advertisedto>[\d\s\.]+)$',
+    )
+
+    def cli(self,vrf="",output=None):
+        if output is None:
+            if vrf:
+                cmd = self.cli_command[0].format(vrf=vrf)
+            else:
+                cmd = self.cli_command[1]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        result_dict = {}
 
+        p = ShowBgpIpMvpnSaadDetail.patterns
 
         for line in out.splitlines():
             if line:
@@ -7901,7 +7083,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
             else:
                 continue
 
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
                 group = m.groupdict()
                 instance = 'default'
@@ -7909,7 +7091,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                 af_name = group['af_name'].lower()
                 continue
 
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 group = m.groupdict()
                 bgp_dict = result_dict.setdefault('instance', {}).setdefault(instance, {}).\
@@ -7924,7 +7106,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                     rd_dict.update({'rd_vrf': group['rd_vrf'].lower()})
                 continue
 
-            m = p3.match(line)
+            m = p.p3.match(line)
             if m:
                 group = m.groupdict()
                 nonipprefix = group['nonipprefix'].strip()
@@ -7934,24 +7116,24 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                 index = 0
                 continue
 
-            m = p4.match(line)
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
                 prefix_dict.update({k:int(v) for k,v in group.items()})
                 continue
 
-            m = p5.match(line)
+            m = p.p5.match(line)
             if m:
                 prefix_dict.update({'on_xmitlist':True})
                 continue
 
-            m = p7.match(line)
+            m = p.p7.match(line)
             if m:
                 group = m.groupdict()
                 path_temp_dict = prefix_dict.setdefault('path',{})
                 continue
 
-            m = p8.match(line)
+            m = p.p8.match(line)
             if m:
                 index += 1
                 path_temp_dict = prefix_dict.setdefault('path', {})
@@ -7977,7 +7159,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                     path_dict.update({'pathnolabeledrnh': False})
                 continue
 
-            m = p10.match(line)
+            m = p.p10.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k:v for k,v in group.items()})
@@ -7986,7 +7168,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                     path_dict.pop('nexthop_status')
                 continue
 
-            m = p11.match(line)
+            m = p.p11.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'origin': group['origin'].lower()})
@@ -7994,13 +7176,13 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                 path_dict.update({'weight': int(group['weight'])})
                 continue
 
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({k: sorted(v.split( )) for k, v in group.items()})
                 continue
 
-            m = p13.match(line)
+            m = p.p13.match(line)
             if m:
                 group = m.groupdict()
                 path_dict.update({'originatorid': group['originatorid']})
@@ -8008,7 +7190,7 @@ class ShowBgpIpMvpnSaadDetail(ShowBgpIpMvpnSaadDetailSchema):
                 continue
 
 
-            m = p15.match(line)
+            m = p.p15.match(line)
             if m:
                 group = m.groupdict()
                 for k, v in group.items():
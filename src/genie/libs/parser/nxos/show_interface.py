@@ -49,6 +49,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, ListOf
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.json_table import Table, Field, is_json, loads
 
 
 # ===========================
@@ -3556,6 +3557,14 @@ class ShowIpInterfaceBriefVrfAll(ShowIpInterfaceBriefVrfAllSchema):
     # parsing mechanisms (cli(), yang(), xml()).
 
     cli_command = ['show ip interface brief vrf all | include {ip}', 'show ip interface brief vrf all']
+    json_command = 'show ip interface brief vrf all | json'
+    json_table = Table('intf', key='intf-name', into='interface', fields={
+        'vrf': 'vrf-name-out',
+        'ip_address': 'prefix',
+        'interface_status': Field(
+            lambda row: 'protocol-{}/link-{}/admin-{}'.format(
+                row.get('proto-state'), row.get('link-state'),
+                row.get('admin-state')))})
 
     def cli(self, ip='', output=None):
         ''' parsing mechanism: cli
@@ -3564,6 +3573,9 @@ class ShowIpInterfaceBriefVrfAll(ShowIpInterfaceBriefVrfAllSchema):
         typically contains 3 steps: exe
         cuting, transforming, returning
         '''
+        # the output of the command with | json
+        if output is not None and is_json(output):
+            return self.json(ip=ip, output=output)
         if output is None:
             if ip:
                 cmd = self.cli_command[0].format(ip=ip)
@@ -3606,6 +3618,21 @@ class ShowIpInterfaceBriefVrfAll(ShowIpInterfaceBriefVrfAllSchema):
 
         return ret_dict
 
+    def json(self, ip='', output=None):
+        if output is None:
+            output = self.device.execute(self.json_command)
+
+        ret_dict = self.json_table.apply(loads(output))
+
+        if ip:
+            # keep the interfaces with the address, as with | include
+            interfaces = {intf: intf_dict for intf, intf_dict in
+                          ret_dict.get('interface', {}).items()
+                          if ip in intf_dict.get('ip_address', '')}
+            ret_dict = {'interface': interfaces} if interfaces else {}
+
+        return ret_dict
+
 
 #############################################################################
 # Schema For show interface Description
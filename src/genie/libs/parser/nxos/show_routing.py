@@ -51,6 +51,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.json_table import (Table, Field, is_json, loads,
+                                                rows, boolean, uptime)
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -531,6 +533,71 @@ class ShowIpRouteSchema(MetaParser):
     }
 
 
+def _next_hop_vrf(path):
+    # 169.254.1.1%LegacyLAN:{101}, as split by ShowIpRoute.cli()
+    vrf, _, af = path.get('nhvrfname', '').partition(':')
+    return vrf, af.lower()
+
+
+# fields of a path of a route, 'ipnexthop' onwards
+_json_path_table = Table(None, fields={
+    'next_hop': 'ipnexthop',
+    'source_protocol': Field('clientname', lambda value: value.split('-')[0]),
+    'source_protocol_status': 'type',
+    'best_ucast_nexthop': Field('ubest', boolean, skip=(False,)),
+    'best_mcast_nexthop': Field('mbest', boolean, skip=(False,)),
+    'updated': Field('uptime', uptime),
+    'outgoing_interface': Field('ifname', Common.convert_intf_name),
+    'next_hop_vrf': Field(lambda path: _next_hop_vrf(path)[0], skip=('',)),
+    'next_hop_af': Field(lambda path: _next_hop_vrf(path)[1], skip=('',)),
+    'route_preference': Field('pref', int),
+    'metric': Field('metric', int),
+    'segid': Field('segid', int),
+    'asymmetric': Field('asymmetric', boolean, skip=(False,)),
+    'tunnelid': 'tunnelid',
+    'encap': Field('encap', str.lower),
+    'mpls_vpn': Field('mpls-vpn', boolean, skip=(False,)),
+    'mpls': Field('mpls', boolean, skip=(False,)),
+    'evpn': Field('evpn', boolean, skip=(False,)),
+    'stale': Field('stale', boolean, skip=(False,)),
+})
+
+
+def _json_route_paths(row, route_dict):
+    # the paths of a route, and what the route takes from them
+    for index, path in enumerate(rows(row, 'path'), 1):
+        next_hop_dict = route_dict.setdefault('next_hop', {})
+        best = boolean(path.get('ubest', False)) or \
+            boolean(path.get('mbest', False))
+
+        if not path.get('ipnexthop'):
+            interface = Common.convert_intf_name(path.get('ifname', ''))
+            interface_dict = next_hop_dict.setdefault(
+                'outgoing_interface', {}).setdefault(interface, {})
+            if interface:
+                interface_dict['outgoing_interface'] = interface
+            if path.get('uptime'):
+                interface_dict['updated'] = uptime(path['uptime'])
+        else:
+            index_dict = next_hop_dict.setdefault(
+                'next_hop_list', {}).setdefault(index, {'index': index})
+            _json_path_table.apply(path, index_dict)
+            for key in ('source_protocol', 'source_protocol_status'):
+                if key in index_dict:
+                    route_dict[key] = index_dict[key]
+
+        if boolean(path.get('hidden', False)):
+            route_dict['hidden'] = True
+        if best and path.get('metric') is not None:
+            route_dict['metric'] = int(path['metric'])
+        if best and path.get('pref') is not None:
+            route_dict['route_preference'] = int(path['pref'])
+        if '-' in path.get('clientname', ''):
+            route_dict['process_id'] = path['clientname'].split('-', 1)[1]
+        if path.get('tag') is not None:
+            route_dict['tag'] = int(path['tag'])
+
+
 # ====================================================
 # Parser for:
 # show ip route {route} {protocol} interface {interface} vrf {vrf}
@@ -589,6 +656,20 @@ class ShowIpRoute(ShowIpRouteSchema):
                     'show ip route vrf {vrf}',
                     'show ip route vrf all',
                     'show ip route']
+    json_command = [cmd + ' | json' for cmd in cli_command]
+    json_table = Table('vrf', key='vrf-name-out', into='vrf', tables=[
+        Table('addrf', key='addrf', into='address_family', tables=[
+            Table('prefix', key='ipprefix', into='routes', fields={
+                'route': 'ipprefix',
+                'active': Field(lambda row: True),
+                'ubest': Field('ucast-nhops', int),
+                'mbest': Field('mcast-nhops', int),
+                'attached': Field('attached', boolean, skip=(False,)),
+                'direct': Field('direct', boolean, skip=(False,)),
+                'pervasive': Field('pervasive', boolean, skip=(False,)),
+            }, post=_json_route_paths),
+        ]),
+    ])
     exclude = [
         'updated']
 
@@ -608,6 +689,10 @@ class ShowIpRoute(ShowIpRouteSchema):
                     self.sort_next_hop_list(value)
 
     def cli(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
+        # the output of the command with | json
+        if output is not None and is_json(output):
+            return self.json(route=route, protocol=protocol, vrf=vrf,
+                             interface=interface, output=output)
 
         # execute command to get output
         if output is None:
@@ -1012,6 +1097,22 @@ class ShowIpRoute(ShowIpRouteSchema):
         self.sort_next_hop_list(result_dict)
         return result_dict
 
+    def json(self, route=None, protocol=None, vrf=None, interface=None,
+             output=None):
+        if output is None:
+            # the command of the arguments given, as with cli()
+            kwargs = {key: value for key, value in (
+                ('route', route), ('protocol', protocol), ('vrf', vrf),
+                ('interface', interface)) if value}
+            for cmd in self.json_command:
+                if set(re.findall(r'\{(\w+)\}', cmd)) == set(kwargs):
+                    break
+            output = self.device.execute(cmd.format(**kwargs))
+
+        result_dict = self.json_table.apply(loads(output))
+        self.sort_next_hop_list(result_dict)
+        return result_dict
+
 
 # ====================================================
 #  parser for:
@@ -1071,6 +1172,7 @@ class ShowIpv6Route(ShowIpRoute):
                     'show ipv6 route vrf {vrf}',
                     'show ipv6 route vrf all',
                     'show ipv6 route']
+    json_command = [cmd + ' | json' for cmd in cli_command]
 
     exclude = [
         'updated',
@@ -1173,6 +1275,7 @@ class ShowRouting(ShowIpRoute):
         Parser for show routing
         show routing <ip>"""
     cli_command = ['show routing', 'show routing {protocol}']
+    json_command = ['show routing | json', 'show routing {protocol} | json']
 
     def cli(self, protocol=None, route=None, vrf=None, interface=None, output=None, cmd=None):
 
@@ -1189,5 +1292,9 @@ class ShowRouting(ShowIpRoute):
 
         return super().cli(protocol=protocol, route=route, vrf=vrf, interface=interface, output=out, cmd=cmd)
 
+    def json(self, protocol=None, route=None, vrf=None, interface=None,
+             output=None):
+        return super().json(protocol=protocol, output=output)
+
 
 
@@ -15,6 +15,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.json_table import Table, Field, is_json, loads
 
 # =====================
 # Parser for 'show vrf'
@@ -36,8 +37,16 @@ class ShowVrf(ShowVrfSchema):
     """Parser for show vrf"""
 
     cli_command = ['show vrf', 'show vrf {vrf}']
+    json_command = ['show vrf | json', 'show vrf {vrf} | json']
+    json_table = Table('vrf', key='vrf_name', into='vrfs', fields={
+        'vrf_id': Field('vrf_id', int),
+        'vrf_state': 'vrf_state',
+        'reason': 'vrf_reason'})
 
     def cli(self, vrf='', output=None):
+        # the output of the command with | json
+        if output is not None and is_json(output):
+            return self.json(vrf=vrf, output=output)
         if output is None:
             if vrf:
                 out = self.device.execute(self.cli_command[1].format(vrf=vrf))
@@ -74,6 +83,16 @@ class ShowVrf(ShowVrfSchema):
 
         return vrf_dict
 
+    def json(self, vrf='', output=None):
+        if output is None:
+            if vrf:
+                cmd = self.json_command[1].format(vrf=vrf)
+            else:
+                cmd = self.json_command[0]
+            output = self.device.execute(cmd)
+
+        return self.json_table.apply(loads(output))
+
 class ShowVrfInterfaceSchema(MetaParser):
     """Schema for show vrf interface"""
 
@@ -90,10 +109,18 @@ class ShowVrfInterface(ShowVrfInterfaceSchema):
     """Parser for show vrf Interface"""
 
     cli_command = 'show vrf interface'
+    json_command = 'show vrf interface | json'
+    json_table = Table('if', key='if_name', into='vrf_interface', fields={
+        'vrf_name': 'vrf_name',
+        'vrf_id': Field('vrf_id', str),
+        'site_of_origin': 'soo'})
     exclude = [
         '(Null.*)']
 
     def cli(self, output=None):
+        # the output of the command with | json
+        if output is not None and is_json(output):
+            return self.json(output=output)
 
         if output is None:
             out = self.device.execute(self.cli_command)
@@ -131,6 +158,12 @@ class ShowVrfInterface(ShowVrfInterfaceSchema):
 
         return vrf_interface_dict
 
+    def json(self, output=None):
+        if output is None:
+            output = self.device.execute(self.json_command)
+
+        return self.json_table.apply(loads(output))
+
 
 class ShowVrfDetailSchema(MetaParser):
     """Schema for show vrf <vrf> detail"""
@@ -0,0 +1,135 @@
+expected_output = {
+    'vrf': {
+        'VRF1': {
+            'address_family': {
+                'vpnv4 unicast': {
+                    'dampened_paths': 1,
+                    'dampening_enabled': True,
+                    'history_paths': 0,
+                    'route_identifier': {
+                        '100:100': {
+                            'dampened_paths': 1,
+                            'dampening_enabled': True,
+                            'history_paths': 0,
+                            'network': {
+                                '10.9.1.0/24': {
+                                    'best': False,
+                                    'current_penalty': 41,
+                                    'duration': '00:03:11',
+                                    'flaps': 10,
+                                    'pathtype': 'e',
+                                    'peer': '10.186.0.2',
+                                    'reuse_limit': 10,
+                                    'reuse_time': '00:00:50',
+                                    'status': 'd',
+                                    'suppress_limit': 30,
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+        'default': {
+            'address_family': {
+                'ipv4 unicast': {
+                    'dampened_paths': 2,
+                    'dampening_enabled': True,
+                    'history_paths': 0,
+                    'network': {
+                        '10.25.1.0/24': {
+                            'best': False,
+                            'current_penalty': 34,
+                            'duration': '00:09:53',
+                            'flaps': 39,
+                            'pathtype': 'e',
+                            'peer': '10.106.102.3',
+                            'reuse_limit': 10,
+                            'reuse_time': '00:01:40',
+                            'status': 'd',
+                            'suppress_limit': 30,
+                        },
+                        '10.25.2.0/24': {
+                            'best': True,
+                            'current_penalty': 35,
+                            'duration': '00:09:53',
+                            'flaps': 39,
+                            'pathtype': 'e',
+                            'peer': '10.106.102.3',
+                            'reuse_limit': 10,
+                            'status': 'd',
+                            'suppress_limit': 30,
+                        },
+                    },
+                },
+                'ipv6 multicast': {
+                    'dampened_paths': 1,
+                    'dampening_enabled': True,
+                    'history_paths': 0,
+                    'network': {
+                        '2001:db8:961::/112': {
+                            'best': False,
+                            'current_penalty': 34,
+                            'duration': '00:21:00',
+                            'flaps': 84,
+                            'pathtype': 'e',
+                            'peer': '2001:db8:8d82::2002',
+                            'reuse_limit': 10,
+                            'reuse_time': '00:01:40',
+                            'status': 'd',
+                            'suppress_limit': 30,
+                        },
+                    },
+                },
+                'l2vpn evpn': {
+                    'dampened_paths': 2,
+                    'dampening_enabled': True,
+                    'history_paths': 0,
+                    'route_identifier': {
+                        '10.16.2.101:1002': {
+                            'dampened_paths': 4,
+                            'dampening_enabled': True,
+                            'history_paths': 0,
+                        },
+                        '101:1000': {
+                            'dampened_paths': 4,
+                            'dampening_enabled': True,
+                            'history_paths': 0,
+                        },
+                        '201:2000': {
+                            'dampened_paths': 2,
+                            'dampening_enabled': True,
+                            'history_paths': 0,
+                            'network': {
+                                '[2]:[0]:[0]:[48]:[0201.02ff.0303]:[32]:[10.81.1.2]/248': {
+                                    'best': False,
+                                    'current_penalty': 35,
+                                    'duration': '00:20:58',
+                                    'flaps': 84,
+                                    'pathtype': 'e',
+                                    'peer': '10.106.102.3',
+                                    'reuse_limit': 10,
+                                    'reuse_time': '00:01:50',
+                                    'status': 'd',
+                                    'suppress_limit': 30,
+                                },
+                                '[5]:[0]:[0]:[24]:[10.100.1.0]:[0.0.0.0]/224': {
+                                    'best': False,
+                                    'current_penalty': 35,
+                                    'duration': '00:20:58',
+                                    'flaps': 84,
+                                    'pathtype': 'e',
+                                    'peer': '10.106.102.3',
+                                    'reuse_limit': 10,
+                                    'reuse_time': '00:01:50',
+                                    'status': 'd',
+                                    'suppress_limit': 30,
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
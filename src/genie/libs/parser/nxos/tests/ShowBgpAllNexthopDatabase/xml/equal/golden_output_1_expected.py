@@ -0,0 +1,142 @@
+expected_output = {
+    'vrf': {
+        'VRF1': {
+            'address_family': {
+                'ipv4 unicast': {
+                    'af_nexthop_trigger_enable': True,
+                    'next_hop': {
+                        '10.1.1.1': {
+                            'attached': True,
+                            'filtered': False,
+                            'igp_cost': 0,
+                            'igp_preference': 0,
+                            'igp_route_type': 0,
+                            'labeled': False,
+                            'local': False,
+                            'metric_next_advertise': 'never',
+                            'multipath': 'No',
+                            'pending_update': False,
+                            'reachable': True,
+                            'refcount': 1,
+                            'resolve_time': '00:12:01',
+                            'rib_route': '10.1.1.0/24',
+                            'rnh_epoch': 1,
+                        },
+                    },
+                    'nexthop_trigger_delay_critical': 3000,
+                    'nexthop_trigger_delay_non_critical': 10000,
+                },
+            },
+        },
+        'default': {
+            'address_family': {
+                'ipv4 mdt': {
+                    'af_nexthop_trigger_enable': True,
+                    'next_hop': {
+                        '0.0.0.0': {
+                            'attached': False,
+                            'filtered': False,
+                            'igp_cost': 0,
+                            'igp_preference': 0,
+                            'igp_route_type': 0,
+                            'labeled': False,
+                            'local': True,
+                            'metric_next_advertise': 'never',
+                            'multipath': 'Yes',
+                            'pending_update': False,
+                            'reachable': False,
+                            'refcount': 1,
+                            'resolve_time': 'never',
+                            'rib_route': '0.0.0.0/0',
+                            'rnh_epoch': 0,
+                        },
+                    },
+                    'nexthop_trigger_delay_critical': 3000,
+                    'nexthop_trigger_delay_non_critical': 10000,
+                },
+                'ipv4 unicast': {
+                    'af_nexthop_trigger_enable': True,
+                    'next_hop': {
+                        '0.0.0.0': {
+                            'attached': False,
+                            'filtered': False,
+                            'igp_cost': 0,
+                            'igp_preference': 0,
+                            'igp_route_type': 0,
+                            'labeled': False,
+                            'local': True,
+                            'metric_next_advertise': 'never',
+                            'pending_update': False,
+                            'reachable': False,
+                            'refcount': 1,
+                            'resolve_time': 'never',
+                            'rib_route': '0.0.0.0/0',
+                            'rnh_epoch': 0,
+                        },
+                        '192.168.154.1': {
+                            'attached': False,
+                            'attached_nexthop': {
+                                '192.168.196.2': {
+                                    'attached_nexthop_interface': 'port-channel2.100',
+                                },
+                                '192.168.66.2': {
+                                    'attached_nexthop_interface': 'port-channel2.107',
+                                },
+                            },
+                            'filtered': False,
+                            'igp_cost': 3,
+                            'igp_preference': 110,
+                            'igp_route_type': 0,
+                            'labeled': False,
+                            'local': False,
+                            'metric_next_advertise': 'never',
+                            'multipath': 'No',
+                            'pending_update': False,
+                            'reachable': True,
+                            'refcount': 1,
+                            'resolve_time': '18:37:36',
+                            'rib_route': '192.168.154.1/32',
+                            'rnh_epoch': 1,
+                        },
+                    },
+                    'nexthop_trigger_delay_critical': 3000,
+                    'nexthop_trigger_delay_non_critical': 10000,
+                },
+                'ipv6 unicast': {
+                    'af_nexthop_trigger_enable': True,
+                    'next_hop': {
+                        '2001:db8:400::3:1': {
+                            'attached': False,
+                            'attached_nexthop': {
+                                'fe80::6e9c:edff:fe4d:ff41': {
+                                    'attached_nexthop_interface': 'port-channel2.100',
+                                },
+                            },
+                            'filtered': False,
+                            'igp_cost': 51,
+                            'igp_preference': 110,
+                            'igp_route_type': 0,
+                            'labeled': True,
+                            'local': False,
+                            'metric_next_advertise': 'never',
+                            'multipath': 'No',
+                            'pending_update': True,
+                            'reachable': True,
+                            'refcount': 2,
+                            'resolve_time': '18:37:36',
+                            'rib_route': '2001:db8:400::3:0/112',
+                            'rnh_epoch': 2,
+                        },
+                    },
+                    'nexthop_trigger_delay_critical': 3000,
+                    'nexthop_trigger_delay_non_critical': 10000,
+                },
+                'vpnv4 unicast': {
+                    'af_nexthop_trigger_enable': True,
+                    'nexthop_trigger_delay_critical': 3000,
+                    'nexthop_trigger_delay_non_critical': 10000,
+                },
+            },
+        },
+    },
+}
@@ -0,0 +1,229 @@
+expected_output = {
+    'vrf': {
+        'VRF1': {
+            'address_family': {
+                'ipv6 unicast': {
+                    'prefix': {
+                        '2001:db8:4519::/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '492287',
+                                    'nexthop': '2001:db8:1c39:1::1:101',
+                                    'out_label': 'nolabel',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                        '2001:db8:4519::1:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '492287',
+                                    'nexthop': '2001:db8:1c39:1::1:101',
+                                    'out_label': 'nolabel',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                        '2001:db8:4519::2:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '492287',
+                                    'nexthop': '2001:db8:1c39:1::1:101',
+                                    'out_label': 'nolabel',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                        '2001:db8:4519::3:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '492287',
+                                    'nexthop': '2001:db8:1c39:1::1:101',
+                                    'out_label': 'nolabel',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                        '2001:db8:4519::4:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '492287',
+                                    'nexthop': '2001:db8:1c39:1::1:101',
+                                    'out_label': 'nolabel',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                        '2001:db8:4840::/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '21',
+                                    'nexthop': '::ffff:10.51.1.101',
+                                    'out_label': '16',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                        '2001:db8:4840::1:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '22',
+                                    'nexthop': '::ffff:10.51.1.101',
+                                    'out_label': '17',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                        '2001:db8:4840::2:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '23',
+                                    'nexthop': '::ffff:10.51.1.101',
+                                    'out_label': '18',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                        '2001:db8:4840::3:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '24',
+                                    'nexthop': '::ffff:10.51.1.101',
+                                    'out_label': '19',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                        '2001:db8:4840::4:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': '25',
+                                    'nexthop': '::ffff:10.51.1.101',
+                                    'out_label': '20',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                    'vpn': 'VRF1',
+                                },
+                            },
+                        },
+                    },
+                    'router_id': '10.81.1.1',
+                    'table_version': 18,
+                },
+            },
+        },
+        'default': {
+            'address_family': {
+                'ipv6 unicast': {
+                    'prefix': {
+                        '2001:db8:4410::/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': 'nolabel',
+                                    'nexthop': '2001:db8:1900:1::1:101',
+                                    'out_label': 'nolabel',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                },
+                            },
+                        },
+                        '2001:db8:4410::1:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': 'nolabel',
+                                    'nexthop': '2001:db8:1900:1::1:101',
+                                    'out_label': 'nolabel',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                },
+                            },
+                        },
+                        '2001:db8:4410::2:0/112': {
+                            'index': {
+                                0: {
+                                    'best_code': '>',
+                                    'best_path': True,
+                                    'in_label': 'nolabel',
+                                    'nexthop': '2001:db8:1900:1::1:101',
+                                    'out_label': 'nolabel',
+                                    'status': 'valid',
+                                    'status_code': '*',
+                                    'type': 'external',
+                                    'type_code': 'e',
+                                },
+                            },
+                        },
+                    },
+                    'router_id': '10.1.1.1',
+                    'table_version': 11,
+                },
+            },
+        },
+    },
+}
@@ -0,0 +1,66 @@
+expected_output = {
+    'vrf': {
+        'default': {
+            'address_family': {
+                'vpnv4 unicast': {
+                    'route_distinguisher': {
+                        '1:100': {
+                            'prefix': {
+                                '10.16.1.0/24': {
+                                    'index': {
+                                        0: {
+                                            'best_code': '>',
+                                            'best_path': True,
+                                            'in_label': '492287',
+                                            'nexthop': '0.0.0.0',
+                                            'out_label': 'nolabel',
+                                            'status': 'valid',
+                                            'status_code': '*',
+                                            'type': 'local',
+                                            'type_code': 'l',
+                                            'vpn': 'VRF1',
+                                        },
+                                    },
+                                },
+                            },
+                            'rd_vrf': 'VRF1',
+                        },
+                        '2:100': {
+                            'prefix': {
+                                '10.16.2.0/24': {
+                                    'index': {
+                                        0: {
+                                            'best_code': '>',
+                                            'best_path': True,
+                                            'in_label': 'nolabel',
+                                            'nexthop': '10.4.2.2',
+                                            'out_label': '492288',
+                                            'status': 'valid',
+                                            'status_code': '*',
+                                            'type': 'internal',
+                                            'type_code': 'i',
+                                        },
+                                        1: {
+                                            'best_path': False,
+                                            'hold_down': '00:01:10',
+                                            'in_label': 'nolabel',
+                                            'nexthop': '10.4.3.3',
+                                            'out_label': '492290',
+                                            'status': 'valid',
+                                            'status_code': '*',
+                                            'type': 'internal',
+                                            'type_code': 'i',
+                                        },
+                                    },
+                                },
+                            },
+                            'rd_vrf': 'VRF2',
+                        },
+                    },
+                    'router_id': '10.4.1.1',
+                    'table_version': 9,
+                },
+            },
+        },
+    },
+}
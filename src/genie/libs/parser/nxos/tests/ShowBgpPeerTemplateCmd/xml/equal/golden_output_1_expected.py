@@ -0,0 +1,128 @@
+expected_output = {
+    'template': {
+        'PEER1': {
+            'address_family': {
+                'ipv6 multicast': {
+                    'advertise_map': 'PASS-ALL',
+                    'advertise_map_status': 'advertise',
+                    'allow_as_in': 4,
+                    'as_override': True,
+                    'condition_map': 'PERMIT_ALL_RM',
+                    'default_originate': True,
+                    'default_originate_route_map': 'PASS-ALL',
+                    'in_policy': {
+                        'PASS-ALL': {
+                            'name': 'PASS-ALL',
+                            'type': 'route-map',
+                        },
+                    },
+                    'in_soft_reconfig_allowed': True,
+                    'local_nexthop': '0.0.0.0',
+                    'max_pfx': 1000000,
+                    'out_policy': {
+                        'PASS-ALL': {
+                            'name': 'PASS-ALL',
+                            'type': 'route-map',
+                        },
+                    },
+                    'peer_as_check_disabled': True,
+                    'rr_configured': False,
+                    'send_community': True,
+                    'send_ext_community': True,
+                    'soo': 'SOO:10.4.1.1:88',
+                    'third_party_nexthop': False,
+                    'unsuppress_map': 'PERMIT_ALL_RM',
+                    'weight': 222,
+                },
+                'link-state': {
+                    'allow_as_in': 4,
+                    'as_override': False,
+                    'default_originate': False,
+                    'in_soft_reconfig_allowed': False,
+                    'max_pfx': 1000000,
+                    'peer_as_check_disabled': False,
+                    'rr_configured': False,
+                    'send_community': True,
+                    'send_ext_community': True,
+                    'third_party_nexthop': False,
+                },
+                'vpnv4 unicast': {
+                    'allow_as_in': 4,
+                    'as_override': False,
+                    'default_originate': False,
+                    'in_policy': {
+                        'DENY-ALL': {
+                            'name': 'DENY-ALL',
+                            'type': 'prefix-list',
+                        },
+                        'PASS-ALL': {
+                            'name': 'PASS-ALL',
+                            'type': 'route-map',
+                        },
+                    },
+                    'in_soft_reconfig_allowed': False,
+                    'local_nexthop': '0.0.0.0',
+                    'max_pfx': 1000000,
+                    'out_policy': {
+                        'PASS-ALL': {
+                            'name': 'PASS-ALL',
+                            'type': 'route-map',
+                        },
+                    },
+                    'peer_as_check_disabled': False,
+                    'rr_configured': False,
+                    'send_community': True,
+                    'send_ext_community': True,
+                    'third_party_nexthop': False,
+                    'weight': 222,
+                },
+            },
+            'external_bgp_peer_hops_limit': 100,
+            'local_as_inactive': True,
+            'logging_neighbor_events': False,
+            'low_mem_exempt': True,
+            'passive_only': False,
+            'remove_private_as': False,
+            'source_interface': 'loopback1',
+            'vrf': {
+                'default': {
+                    'inheriting_peer': {
+                        '10.106.200.200': {
+                            'inheriting_peer': '10.106.200.200',
+                        },
+                    },
+                },
+                'vrf1': {
+                    'inheriting_peer': {
+                        '10.16.2.2': {
+                            'inheriting_peer': '10.16.2.2',
+                        },
+                        '2001:db8:1::1': {
+                            'inheriting_peer': '2001:db8:1::1',
+                        },
+                    },
+                },
+            },
+        },
+        'PEER2': {
+            'address_family': {
+                'ipv4 unicast': {
+                    'allow_as_in': 4,
+                    'as_override': False,
+                    'default_originate': False,
+                    'in_soft_reconfig_allowed': False,
+                    'max_pfx': 1000000,
+                    'peer_as_check_disabled': False,
+                    'rr_configured': False,
+                    'send_community': True,
+                    'send_ext_community': True,
+                    'third_party_nexthop': False,
+                },
+            },
+            'local_as_inactive': False,
+            'logging_neighbor_events': True,
+            'passive_only': True,
+            'remove_private_as': True,
+        },
+    },
+}
@@ -0,0 +1,7 @@
+expected_output = {
+    'vrf': {
+        'default': {
+            'rpm_handle_count': 0,
+        },
+    },
+}
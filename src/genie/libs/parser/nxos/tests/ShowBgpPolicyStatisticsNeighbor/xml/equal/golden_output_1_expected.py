@@ -0,0 +1,22 @@
+expected_output = {
+    'vrf': {
+        'default': {
+            'route_map': {
+                'PERMIT_ALL_RM': {
+                    1: {
+                        'action': 'permit',
+                        'command': {
+                            'command': 'match ip address prefix-list ALL',
+                            'compare_count': 6,
+                            'match_count': 4,
+                        },
+                        'seq_num': 20,
+                        'total_accept_count': 4,
+                        'total_reject_count': 0,
+                    },
+                },
+            },
+            'rpm_handle_count': 2,
+        },
+    },
+}
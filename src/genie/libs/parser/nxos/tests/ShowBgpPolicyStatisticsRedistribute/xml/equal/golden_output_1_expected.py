@@ -0,0 +1,41 @@
+expected_output = {
+    'vrf': {
+        'VRF1': {
+            'route_map': {
+                'ADD_RT_400_400': {
+                    1: {
+                        'action': 'permit',
+                        'command': {
+                            'command': 'set extcommunity rt 400:400',
+                            'compare_count': 2,
+                            'match_count': 0,
+                        },
+                        'seq_num': 10,
+                        'total_accept_count': 0,
+                        'total_reject_count': 0,
+                    },
+                    2: {
+                        'action': 'deny',
+                        'seq_num': 20,
+                        'total_accept_count': 0,
+                        'total_reject_count': 0,
+                    },
+                },
+                'DENY_NEXT': {
+                    1: {
+                        'action': 'deny',
+                        'command': {
+                            'command': 'match as-path AS>100',
+                            'compare_count': 4,
+                            'match_count': 4,
+                        },
+                        'seq_num': 10,
+                        'total_accept_count': 0,
+                        'total_reject_count': 4,
+                    },
+                },
+            },
+            'rpm_handle_count': 1,
+        },
+    },
+}
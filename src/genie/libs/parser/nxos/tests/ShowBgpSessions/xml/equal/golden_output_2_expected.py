@@ -0,0 +1,57 @@
+expected_output = {
+    'local_as': 333,
+    'total_established_peers': 2,
+    'total_peers': 3,
+    'vrf': {
+        'default': {
+            'local_as': 333,
+            'neighbor': {
+                '10.106.101.1': {
+                    'connections_dropped': 0,
+                    'last_flap': '01:03:35',
+                    'last_read': '00:00:41',
+                    'last_write': '00:00:09',
+                    'local_port': 179,
+                    'notifications_received': 0,
+                    'notifications_sent': 0,
+                    'remote_as': 333,
+                    'remote_port': 48392,
+                    'state': 'established',
+                },
+                '10.106.102.3': {
+                    'connections_dropped': 0,
+                    'last_flap': '01:03:39',
+                    'last_read': 'never',
+                    'last_write': 'never',
+                    'local_port': 0,
+                    'notifications_received': 0,
+                    'notifications_sent': 0,
+                    'remote_as': 888,
+                    'remote_port': 0,
+                    'state': 'idle',
+                },
+                '10.106.102.4': {
+                    'connections_dropped': 0,
+                    'last_flap': '01:03:35',
+                    'last_read': '00:00:41',
+                    'last_write': '00:00:09',
+                    'local_port': 179,
+                    'notifications_received': 0,
+                    'notifications_sent': 0,
+                    'remote_as': 333,
+                    'remote_port': 36462,
+                    'state': 'established',
+                },
+            },
+            'router_id': '10.106.0.6',
+            'vrf_established_peers': 2,
+            'vrf_peers': 3,
+        },
+        'vpn1': {
+            'local_as': 333,
+            'router_id': '10.229.11.11',
+            'vrf_established_peers': 0,
+            'vrf_peers': 0,
+        },
+    },
+}
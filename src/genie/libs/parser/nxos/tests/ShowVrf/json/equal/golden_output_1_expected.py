@@ -0,0 +1,24 @@
+expected_output = {
+   'vrfs':{
+      'coke':{
+         'vrf_id':4,
+         'vrf_state':'Up',
+         'reason':'--'
+      },
+      'default':{
+         'vrf_id':1,
+         'vrf_state':'Up',
+         'reason':'--'
+      },
+      'management':{
+         'vrf_id':2,
+         'vrf_state':'Up',
+         'reason':'--'
+      },
+      'test-vrf':{
+         'vrf_id':3,
+         'vrf_state':'Up',
+         'reason':'--'
+      }
+   }
+}
@@ -0,0 +1,9 @@
+expected_output = {
+   'vrfs':{
+      'management':{
+         'vrf_id':2,
+         'vrf_state':'Up',
+         'reason':'--'
+      }
+   }
+}
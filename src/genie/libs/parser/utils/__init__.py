@@ -1,2 +1,3 @@
-from .common import get_parser, get_parser_exclude, get_parser_commands
+from .common import get_parser, get_parser_exclude, get_parser_commands, \
+                    parser_cache
 
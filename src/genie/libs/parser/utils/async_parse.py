@@ -0,0 +1,230 @@
+'''Asyncio parse of the parsers, with an async execute
+
+The `cli()` of the parsers calls the blocking `self.device.execute()`, so
+collecting from thousands of devices at once needs thousands of threads.
+`aparse()` runs a parser on an event loop instead, awaiting the coroutine
+`execute()` of the connection layer:
+
+    result = await aparse(ShowBgpAllNeighbors(device=device))
+
+The parsers are not changed: `aparse()` runs `parse()` with a device giving
+the outputs fetched so far. Each command executed which was not fetched yet
+gets an empty `PendingOutput`, the parser keeps going and may execute more
+commands, such as one for each VRF or instance found in another output.
+All the commands of such a pass are then awaited concurrently, and the
+parser is run again, until it goes through without a missing output. That
+last run only saw real outputs, its result is the one of a blocking
+parse(). The commands depending on each other are fetched in consecutive
+passes, the parser is rerun once for each of them.
+
+`aparse_many()` and `iter_aparse()` run many parsers with at most `limit`
+of them in flight, so a single event loop collects from many devices with
+bounded memory:
+
+    jobs = ((ShowVersion(device=device), {}) for device in devices)
+    async for index, result in iter_aparse(jobs, limit=500):
+        ...
+
+`FakeAsyncDevice` stands in for a device, with recorded outputs and a
+latency, to test a collection.
+'''
+
+# python
+import asyncio
+import inspect
+import itertools
+
+# Parser utils
+from genie.libs.parser.utils.parse_hooks import DeviceProxy, PendingOutput
+
+# passes after which a parser still missing outputs is given up on
+MAX_PASSES = 1000
+
+
+class _Pending(BaseException):
+    '''aborts a pass at the first missing output, not caught by the
+    `except Exception` of the parsers'''
+
+
+async def aparse(parser, execute=None, fanout=True, limit=None, **kwargs):
+    '''parse with an async execute
+
+        Args:
+            parser (`MetaParser`): parser, with the device to execute the
+                commands with
+            execute (`coroutine function`): called with the arguments of each
+                device.execute() of the parser, the execute() of the device by
+                default
+            fanout (`bool`): keep going after a missing output, to fetch every
+                command of a pass concurrently. Otherwise a pass stops at the
+                first missing output, and the commands are fetched one by one
+            limit (`int`): number of commands of a pass fetched at once, all
+                of them by default
+            **kwargs: arguments of parse()
+
+        Returns:
+            the parsed output
+
+        Raises:
+            The exception raised by the parser, or by execute
+    '''
+    device = getattr(parser, 'device', None)
+    if execute is None:
+        if device is None:
+            return parser.parse(**kwargs)
+        execute = device.execute
+    semaphore = asyncio.Semaphore(limit) if limit else None
+
+    async def fetch(args, kw):
+        if semaphore is None:
+            return await _call(execute, args, kw)
+        async with semaphore:
+            return await _call(execute, args, kw)
+
+    outputs = {}
+    for _ in range(MAX_PASSES):
+        replay = _ReplayDevice(device, outputs, fanout)
+        parser.device = replay
+        error = None
+        try:
+            result = parser.parse(**kwargs)
+        except (Exception, _Pending) as e:
+            error = e
+        finally:
+            parser.device = device
+
+        missing = replay._missing
+        if not missing:
+            if error is not None:
+                raise error
+            return result
+
+        fetched = await asyncio.gather(*(fetch(args, kw)
+                                         for args, kw in missing.values()))
+        outputs.update(zip(missing, fetched))
+
+    raise RuntimeError('{} still misses outputs after {} passes'.format(
+        type(parser).__name__, MAX_PASSES))
+
+
+async def _call(execute, args, kwargs):
+    # a blocking execute is called as is, it blocks the loop
+    output = execute(*args, **kwargs)
+    if inspect.isawaitable(output):
+        output = await output
+    return output
+
+
+async def iter_aparse(jobs, limit=100, fanout=True):
+    '''run the parsers of jobs concurrently, yielding their results as they
+    complete
+
+        Args:
+            jobs (`iterable`): (parser, arguments of parse()) of each parser,
+                only read as parsers complete
+            limit (`int`): number of parsers in flight
+            fanout (`bool`): see aparse()
+
+        Yields:
+            (index of the job, parsed output or exception raised)
+    '''
+    jobs = iter(enumerate(jobs))
+    in_flight = {}
+
+    def start():
+        for index, (parser, kwargs) in itertools.islice(
+                jobs, limit - len(in_flight)):
+            task = asyncio.ensure_future(aparse(parser, fanout=fanout,
+                                                **kwargs))
+            in_flight[task] = index
+
+    start()
+    try:
+        while in_flight:
+            done, _ = await asyncio.wait(in_flight,
+                                         return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = in_flight.pop(task)
+                yield index, task.exception() or task.result()
+            start()
+    finally:
+        # the caller stopped early
+        for task in in_flight:
+            task.cancel()
+
+
+async def aparse_many(jobs, limit=100, fanout=True, return_exceptions=False):
+    '''run the parsers of jobs concurrently
+
+        Returns:
+            list of the parsed outputs, in the order of jobs, with the
+            exception raised in place of the output when return_exceptions
+            is set
+
+        Raises:
+            The first exception raised, unless return_exceptions is set
+    '''
+    results = {}
+    async for index, result in iter_aparse(jobs, limit=limit, fanout=fanout):
+        if isinstance(result, BaseException) and not return_exceptions:
+            raise result
+        results[index] = result
+    return [results[index] for index in range(len(results))]
+
+
+class _ReplayDevice(DeviceProxy):
+    '''device of a parser during a pass, giving the outputs fetched so far
+    and noting the missing ones'''
+
+    def __init__(self, device, outputs, fanout):
+        super().__init__(device)
+        object.__setattr__(self, '_outputs', outputs)
+        object.__setattr__(self, '_fanout', fanout)
+        object.__setattr__(self, '_missing', {})
+
+    def execute(self, *args, **kwargs):
+        key = (repr(args), repr(sorted(kwargs.items())))
+        try:
+            return self._outputs[key]
+        except KeyError:
+            pass
+        self._missing.setdefault(key, (args, kwargs))
+        if not self._fanout:
+            raise _Pending()
+        return PendingOutput()
+
+
+class FakeAsyncDevice(object):
+    '''FakeAsyncDevice
+
+    Device with an async execute() returning recorded outputs
+
+        Args:
+            outputs (`dict`): output of each command, the commands missing
+                from it return an empty output
+            latency (`float`): seconds each command takes
+            **attributes: attributes of the device, such as os
+
+        Attributes:
+            executed (`list`): commands executed, in order
+            max_in_flight (`int`): most commands executed at the same time
+    '''
+
+    def __init__(self, outputs, latency=0.0, **attributes):
+        self.outputs = outputs
+        self.latency = latency
+        self.executed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        for name, value in attributes.items():
+            setattr(self, name, value)
+
+    async def execute(self, command, **kwargs):
+        self.executed.append(command)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        return self.outputs.get(command, '')
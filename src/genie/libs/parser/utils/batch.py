@@ -0,0 +1,137 @@
+'''Batch parsing of many outputs of the same command
+
+Post-processing archived outputs usually means parsing thousands of outputs
+with the same parser, e.g. `show version` of every device of a fleet.
+Instead of creating a parser for each output:
+
+    results = [ShowVersion(device=device).parse(output=output)
+               for output in outputs]
+
+`parse_many()` creates the parser once, compiles its `Patterns` tables up
+front and parses every output with it. The outputs can also be spread over
+a pool of worker processes, each of them holding its own parser:
+
+    results = parse_many(ShowVersion, outputs, processes=8)
+
+`iter_parse_many()` yields the results in the order of the outputs as they
+are parsed, the outputs are only read as the results are consumed, so an
+archive larger than the memory can be parsed:
+
+    for result in iter_parse_many(ShowVersion, read_archive(), processes=8):
+        ...
+'''
+
+# python
+import itertools
+import collections
+import concurrent.futures
+
+# Parser utils
+from genie.libs.parser.utils.patterns import Patterns
+
+# parser of a worker process, see _init_worker
+_worker = None
+
+
+def parse_many(parser_cls, outputs, device=None, processes=None,
+               chunksize=16, return_exceptions=False, **kwargs):
+    '''parse many outputs of the same command with one parser, see
+    iter_parse_many()
+
+        Returns:
+            list of the parsed outputs, in the order of outputs
+    '''
+    return list(iter_parse_many(parser_cls, outputs, device=device,
+                                processes=processes, chunksize=chunksize,
+                                return_exceptions=return_exceptions,
+                                **kwargs))
+
+
+def iter_parse_many(parser_cls, outputs, device=None, processes=None,
+                    chunksize=16, return_exceptions=False, **kwargs):
+    '''parse many outputs of the same command with one parser, yielding
+    the results as they are parsed
+
+        Args:
+            parser_cls (`class`): parser class
+            outputs (`iterable`): outputs to parse, a list or any iterable
+            device (`Device`): device given to the parser, only used to
+                parse in this process
+            processes (`int`): number of worker processes to parse the
+                outputs with, parsed in this process by default
+            chunksize (`int`): number of outputs sent to a worker at once,
+                two chunks for each worker are in flight at most
+            return_exceptions (`bool`): put the exception raised by an output
+                in place of its result, instead of raising it
+            **kwargs: arguments given to parse() with each output
+
+        Yields:
+            the parsed outputs, in the order of outputs
+
+        Raises:
+            The exception raised by the first output which fails to parse,
+            unless return_exceptions is set
+    '''
+    if not processes:
+        parser = _new_parser(parser_cls, device)
+        for output in outputs:
+            yield _parse(parser, output, return_exceptions, kwargs)
+        return
+
+    outputs = iter(outputs)
+    # chunks sent to the workers, in the order of the outputs
+    in_flight = collections.deque()
+
+    # the parser class and its arguments are pickled once for each worker,
+    # the parser is created by the worker
+    with concurrent.futures.ProcessPoolExecutor(
+            max_workers=processes, initializer=_init_worker,
+            initargs=(parser_cls, return_exceptions, kwargs)) as executor:
+
+        def submit():
+            chunk = list(itertools.islice(outputs, chunksize))
+            if chunk:
+                in_flight.append(executor.submit(_parse_chunk, chunk))
+            return bool(chunk)
+
+        while len(in_flight) < 2 * processes and submit():
+            pass
+        try:
+            while in_flight:
+                results = in_flight.popleft().result()
+                submit()
+                yield from results
+        finally:
+            # the caller stopped early, or an output failed to parse
+            for future in in_flight:
+                future.cancel()
+
+
+def _new_parser(parser_cls, device=None):
+    '''create a parser and compile the patterns of its classes'''
+    parser = parser_cls(device=device)
+    for cls in parser_cls.__mro__:
+        for value in vars(cls).values():
+            if isinstance(value, Patterns):
+                value.compile_all()
+    return parser
+
+
+def _parse(parser, output, return_exceptions, kwargs):
+    try:
+        return parser.parse(output=output, **kwargs)
+    except Exception as e:
+        if return_exceptions:
+            return e
+        raise
+
+
+def _init_worker(parser_cls, return_exceptions, kwargs):
+    global _worker
+    _worker = (_new_parser(parser_cls), return_exceptions, kwargs)
+
+
+def _parse_chunk(chunk):
+    parser, return_exceptions, kwargs = _worker
+    return [_parse(parser, output, return_exceptions, kwargs)
+            for output in chunk]
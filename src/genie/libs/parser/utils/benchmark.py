@@ -0,0 +1,312 @@
+'''Performance benchmark of the parsers over the golden tests
+
+Times parse() of each parser with the outputs and arguments of its golden
+tests, found the same way as unittests.py finds them, and reports the
+throughput in lines and bytes per second and the peak allocation of each
+golden test. The results can be saved as a baseline, and compared with a
+previous baseline, failing when a parser got slower or allocates more than
+the threshold allows:
+
+    python -m genie.libs.parser.utils.benchmark -o iosxe --save baseline.json
+    python -m genie.libs.parser.utils.benchmark -o iosxe --baseline baseline.json
+'''
+
+# python
+import os
+import re
+import gc
+import sys
+import glob
+import json
+import time
+import pathlib
+import argparse
+import platform
+import statistics
+import tracemalloc
+from unittest.mock import Mock
+
+# Parser utils
+from genie.libs.parser.utils.unittests import (get_parsers, reset_glo_values,
+                                               read_from_file, read_json_file)
+
+# bumped when the layout of the baseline changes
+BASELINE_VERSION = 1
+
+# differences below these are noise, whatever the threshold
+MIN_SECONDS = 0.001
+MIN_BYTES = 64 * 1024
+
+
+def iter_goldens(parsers, names=None):
+    '''yield (name, parser class, output, arguments) of each golden test
+
+        Args:
+            parsers (`dict`): parsers of each operating system, from
+                get_parsers()
+            names (`set`): names of the golden tests yielded, all of them
+                by default
+    '''
+    for operating_system, parsers_list in sorted(parsers.items()):
+        for data in parsers_list:
+            local_class = data['local_class']
+            # same classes as the ones the unittests loop over
+            if not re.match(r'{}_\S+'.format(operating_system),
+                            local_class.__module__):
+                continue
+            folder_root = data['folder_root_equal']
+            for path in sorted(glob.glob(f"{folder_root}/*_output.txt")):
+                user_test = os.path.basename(path[:-len("_output.txt")])
+                arguments = {}
+                if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
+                    arguments = read_json_file(
+                        f"{folder_root}/{user_test}_arguments.json")
+                name = '.'.join([data['module_name'], local_class.__name__,
+                                 user_test])
+                if names is not None and name not in names:
+                    continue
+                yield name, local_class, read_from_file(path), arguments
+
+
+def measure(local_class, output, arguments=None, warmup=1, repeat=10,
+            memory=True):
+    '''time parse() of a parser with an output
+
+        Args:
+            local_class (`class`): parser class
+            output (`str`): device output
+            arguments (`dict`): arguments of parse()
+            warmup (`int`): number of runs before the timed ones
+            repeat (`int`): number of timed runs, their fastest one and
+                median are kept
+            memory (`bool`): measure the peak allocation, in one more run
+
+        Returns:
+            dict of the seconds, median seconds, lines, bytes, lines and bytes
+            per second and peak bytes allocated, or of the error raised by
+            parse()
+    '''
+    arguments = arguments or {}
+    device = Mock(**{"execute.return_value": output,
+                     "expect.return_value": output})
+
+    def run():
+        local_class(device=device).parse(**arguments)
+
+    try:
+        for _ in range(warmup):
+            run()
+    except Exception as e:
+        return {'error': '{}: {}'.format(type(e).__name__, e)}
+
+    times = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    seconds = min(times) or 1e-9
+    lines = len(output.splitlines())
+    size = len(output.encode())
+    result = {
+        'seconds': seconds,
+        'median_seconds': statistics.median(times),
+        'lines': lines,
+        'bytes': size,
+        'lines_per_second': lines / seconds,
+        'bytes_per_second': size / seconds,
+    }
+
+    if memory:
+        tracemalloc.start()
+        try:
+            run()
+            result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_benchmark(parsers, warmup=1, repeat=10, memory=True, names=None):
+    '''return the results of measure() of each golden test, by name'''
+    return {
+        name: measure(local_class, output, arguments, warmup=warmup,
+                      repeat=repeat, memory=memory)
+        for name, local_class, output, arguments in iter_goldens(parsers,
+                                                                 names)
+    }
+
+
+def confirm(parsers, results, baseline, threshold=0.25, rounds=2, **kwargs):
+    '''return the regressions of compare() which last when the golden tests
+    are measured again
+
+    The runs of a golden test follow each other, so a busy machine slows
+    all of them down at once. The regressed golden tests are measured again
+    up to rounds times, keeping their fastest median in results.
+
+        Args:
+            parsers (`dict`): parsers of each operating system
+            results (`dict`): results of run_benchmark(), updated
+            baseline (`dict`): results of the baseline
+            threshold (`float`): as with compare()
+            rounds (`int`): number of times the golden tests are measured
+                again at most
+            **kwargs: arguments of run_benchmark()
+    '''
+    regressions = compare(results, baseline, threshold=threshold)
+    for _ in range(rounds):
+        if not regressions:
+            break
+        names = {name for name, _, _, _ in regressions}
+        for name, result in run_benchmark(parsers, names=names,
+                                          **kwargs).items():
+            if result.get('median_seconds', 0) < \
+                    results[name].get('median_seconds', 0):
+                results[name] = result
+        regressions = compare(results, baseline, threshold=threshold)
+    return regressions
+
+
+def compare(results, baseline, threshold=0.25):
+    '''return the regressions of the results from a baseline
+
+    A golden test regressed when the median of its runs takes, or it
+    allocates, more than (1 + threshold) times its baseline, and the
+    difference is above the noise (MIN_SECONDS and MIN_BYTES). The median
+    is compared rather than the fastest run, which a single lucky run of
+    the baseline skews. Golden tests missing from either side are not
+    compared.
+
+        Returns:
+            list of (name, metric, baseline value, value), the largest
+            regressions first
+    '''
+    regressions = []
+    for name, result in results.items():
+        old = baseline.get(name)
+        if not old or 'error' in result or 'error' in old:
+            continue
+        for metric, noise in (('median_seconds', MIN_SECONDS),
+                              ('peak_bytes', MIN_BYTES)):
+            if metric not in result or metric not in old:
+                continue
+            if (result[metric] > old[metric] * (1 + threshold)
+                    and result[metric] - old[metric] > noise):
+                regressions.append((name, metric, old[metric],
+                                    result[metric]))
+    return sorted(regressions, key=lambda r: r[3] / (r[2] or 1e-9),
+                  reverse=True)
+
+
+def load_baseline(path):
+    with open(path) as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError('{} is not a version {} baseline'.format(
+            path, BASELINE_VERSION))
+    return baseline['results']
+
+
+def save_baseline(path, results):
+    with open(path, 'w') as f:
+        json.dump({'version': BASELINE_VERSION,
+                   'python': platform.python_version(),
+                   'results': results}, f, indent=1, sort_keys=True)
+
+
+def format_report(results, regressions=(), top=20):
+    '''return the report of the slowest golden tests, the totals and the
+    regressions'''
+    timed = {name: result for name, result in results.items()
+             if 'error' not in result}
+    row = '{:<70}{:>10}{:>12}{:>10}{:>10}'
+    lines = [row.format('golden test', 'ms', 'lines/s', 'MB/s', 'peak MB'),
+             '-' * 112]
+    for name, result in sorted(timed.items(), key=lambda r: r[1]['seconds'],
+                               reverse=True)[:top]:
+        lines.append(row.format(
+            name[-69:], '{:.2f}'.format(result['seconds'] * 1000),
+            '{:.0f}'.format(result['lines_per_second']),
+            '{:.2f}'.format(result['bytes_per_second'] / 2 ** 20),
+            '{:.2f}'.format(result.get('peak_bytes', 0) / 2 ** 20)))
+
+    seconds = sum(result['seconds'] for result in timed.values()) or 1e-9
+    lines.append('-' * 112)
+    lines.append(row.format(
+        'total ({} golden tests, {} errored)'.format(
+            len(timed), len(results) - len(timed)),
+        '{:.2f}'.format(seconds * 1000),
+        '{:.0f}'.format(sum(r['lines'] for r in timed.values()) / seconds),
+        '{:.2f}'.format(sum(r['bytes'] for r in timed.values()) / seconds
+                        / 2 ** 20), ''))
+
+    if regressions:
+        lines.append('')
+        lines.append('{} regressions:'.format(len(regressions)))
+        for name, metric, old, new in regressions:
+            lines.append('  {} {}: {:.6g} -> {:.6g} ({:+.0%})'.format(
+                name, metric, old, new, new / (old or 1e-9) - 1))
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    my_parser = argparse.ArgumentParser(
+        description='Benchmark the parsers with their golden tests')
+    my_parser.add_argument('-o', '--operating_system',
+                           help='The OS you wish to filter on')
+    my_parser.add_argument('-c', '--class_name',
+                           help='The Class you wish to filter on')
+    my_parser.add_argument('-t', '--token',
+                           help="The Token associated with the class, such as 'asr1k'")
+    my_parser.add_argument('-e', '--external-folder', type=pathlib.Path,
+                           help='An external parser folder to work with')
+    my_parser.add_argument('--warmup', type=int, default=1,
+                           help='Number of runs before the timed ones')
+    my_parser.add_argument('--repeat', type=int, default=10,
+                           help='Number of timed runs, the fastest one is '
+                                'reported, the median is compared')
+    my_parser.add_argument('--no-memory', action='store_true',
+                           help='Do not measure the peak allocation')
+    my_parser.add_argument('--save',
+                           help='Save the results as a baseline to this file')
+    my_parser.add_argument('--baseline',
+                           help='Compare the results with this baseline')
+    my_parser.add_argument('--threshold', type=float, default=0.25,
+                           help='Allowed slowdown from the baseline, 0.25 '
+                                'fails golden tests more than 25%% slower')
+    my_parser.add_argument('--confirm', type=int, default=2,
+                           help='Number of times the regressed golden tests '
+                                'are measured again before failing')
+    my_parser.add_argument('--top', type=int, default=20,
+                           help='Number of the slowest golden tests reported')
+    args = my_parser.parse_args(args)
+
+    reset_glo_values()
+    parsers = get_parsers(_os=args.operating_system, _class=args.class_name,
+                          _token=args.token,
+                          _external_folder=args.external_folder)
+    kwargs = dict(warmup=args.warmup, repeat=args.repeat,
+                  memory=not args.no_memory)
+    results = run_benchmark(parsers, **kwargs)
+
+    regressions = []
+    if args.baseline:
+        regressions = confirm(parsers, results, load_baseline(args.baseline),
+                              threshold=args.threshold, rounds=args.confirm,
+                              **kwargs)
+    if args.save:
+        save_baseline(args.save, results)
+
+    print(format_report(results, regressions, top=args.top))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
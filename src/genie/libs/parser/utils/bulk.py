@@ -0,0 +1,295 @@
+'''Offline bulk parsing of captured outputs
+
+Parses outputs captured from devices, stored in a directory or a tarball,
+with a pool of worker processes. A manifest gives the operating system,
+platform and command of each file, either as a CSV file with a header:
+
+    file,os,platform,command
+    R1/show_version.txt,iosxe,cat9k,show version
+    R2/show_ip_route.txt,nxos,,show ip route vrf all
+
+or as JSON Lines, one object with the same keys per line. The platform is
+optional. The result of each file is written as one JSON line, with either
+its `parsed` output or the `error` raised while parsing it, and a report of
+the throughput and failures of each command is printed at the end:
+
+    genieparser-bulk captures.tar.gz -m manifest.csv -w 16 -o parsed.jsonl
+'''
+
+# python
+import os
+import sys
+import csv
+import json
+import time
+import tarfile
+import argparse
+import itertools
+import collections
+import multiprocessing
+
+# pyATS
+from pyats.topology import Device
+
+# Parser utils
+from genie.libs.parser.utils.common import get_parser
+
+# keys each entry of the manifest must have, platform is optional
+MANIFEST_KEYS = ('file', 'os', 'command')
+
+# devices of a worker process, per (os, platform)
+_devices = {}
+
+
+def read_manifest(path):
+    '''read a manifest, CSV if its name ends with .csv, JSON Lines otherwise
+
+        Args:
+            path (`str`): path of the manifest
+
+        Returns:
+            list of dicts with the file, os, platform and command of each
+            output
+
+        Raises:
+            ValueError: an entry misses one of the keys
+    '''
+    with open(path, newline='') as f:
+        if path.endswith('.csv'):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    entries = []
+    for number, row in enumerate(rows, 1):
+        missing = [key for key in MANIFEST_KEYS if not row.get(key)]
+        if missing:
+            raise ValueError('{}: entry {} has no {}'.format(
+                path, number, ', '.join(missing)))
+        entries.append({'file': os.path.normpath(row['file']),
+                        'os': row['os'],
+                        'platform': row.get('platform') or None,
+                        'command': row['command']})
+    return entries
+
+
+def iter_outputs(source, entries):
+    '''yield (entry, output) of each entry of the manifest
+
+    A tarball is read in a single pass, in the order of its members, and
+    its members which are not in the manifest are skipped. Each entry is
+    given, as from a directory, including the entries of the same file.
+    The output is None when the file of an entry cannot be found.
+
+        Args:
+            source (`str`): directory or tarball of the outputs
+            entries (`list`): entries of the manifest
+    '''
+    if os.path.isdir(source):
+        for entry in entries:
+            try:
+                with open(os.path.join(source, entry['file']),
+                          errors='replace') as f:
+                    output = f.read()
+            except OSError:
+                output = None
+            yield entry, output
+        return
+
+    # entries of each file, several entries can have the same file
+    remaining = {}
+    for entry in entries:
+        remaining.setdefault(entry['file'], []).append(entry)
+    with tarfile.open(source, 'r|*') as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            file_entries = remaining.pop(os.path.normpath(member.name), None)
+            if file_entries is None:
+                continue
+            output = tar.extractfile(member).read().decode(errors='replace')
+            for entry in file_entries:
+                yield entry, output
+
+    for file_entries in remaining.values():
+        for entry in file_entries:
+            yield entry, None
+
+
+def parse_output(item):
+    '''parse one output, done by the worker processes
+
+        Args:
+            item (`tuple`): (entry, output) from iter_outputs()
+
+        Returns:
+            (command, JSON line of the result, True if parsed, size of the
+            output, seconds spent)
+    '''
+    entry, output = item
+    start = time.perf_counter()
+    result = dict(entry)
+    try:
+        if output is None:
+            raise FileNotFoundError('{} not found'.format(entry['file']))
+        device = _get_device(entry['os'], entry['platform'])
+        parser_cls, kwargs = get_parser(entry['command'], device)
+        result['parser'] = '{}.{}'.format(parser_cls.__module__,
+                                          parser_cls.__name__)
+        result['parsed'] = parser_cls(device=device).parse(output=output,
+                                                           **kwargs)
+    except Exception as e:
+        result['error'] = '{}: {}'.format(type(e).__name__, e)
+
+    line = json.dumps(result, default=str)
+    return (entry['command'], line, 'error' not in result,
+            len(output or ''), time.perf_counter() - start)
+
+
+def _get_device(os_name, platform):
+    key = (os_name, platform)
+    if key not in _devices:
+        kwargs = {'os': os_name}
+        if platform:
+            kwargs['platform'] = platform
+        _devices[key] = Device('bulk-{}'.format(os_name), **kwargs)
+    return _devices[key]
+
+
+def bulk_parse(source, manifest, output, workers=None, chunksize=8):
+    '''parse every output of the manifest and write the results
+
+        Args:
+            source (`str`): directory or tarball of the outputs
+            manifest (`str`): path of the manifest
+            output (`file`): file the JSON lines are written to
+            workers (`int`): number of worker processes, one per CPU by
+                default, parsed in this process with 1
+            chunksize (`int`): number of outputs sent to a worker at once,
+                two chunks for each worker are in flight at most
+
+        Returns:
+            dict of the stats of each command: number of outputs, failures,
+            bytes and seconds spent parsing
+    '''
+    entries = read_manifest(manifest)
+    items = iter_outputs(source, entries)
+    stats = {}
+
+    pool = None
+    if workers == 1:
+        results = map(parse_output, items)
+    else:
+        pool = multiprocessing.Pool(workers)
+        results = _imap_window(pool, items, workers or os.cpu_count(),
+                               chunksize)
+
+    try:
+        for command, line, parsed, size, seconds in results:
+            output.write(line + '\n')
+            command_stats = stats.setdefault(command, {
+                'outputs': 0, 'failures': 0, 'bytes': 0, 'seconds': 0.0})
+            command_stats['outputs'] += 1
+            command_stats['failures'] += not parsed
+            command_stats['bytes'] += size
+            command_stats['seconds'] += seconds
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    return stats
+
+
+def _imap_window(pool, items, workers, chunksize):
+    '''yield the results of parse_output() of items from the pool, with at
+    most two chunks for each worker in flight, so that the outputs are only
+    read from the source as the results are written'''
+    # chunks sent to the workers, in the order of the outputs
+    in_flight = collections.deque()
+
+    def submit():
+        chunk = list(itertools.islice(items, chunksize))
+        if chunk:
+            in_flight.append(pool.apply_async(_parse_chunk, (chunk,)))
+        return bool(chunk)
+
+    while len(in_flight) < 2 * workers and submit():
+        pass
+    while in_flight:
+        results = in_flight.popleft().get()
+        submit()
+        yield from results
+
+
+def _parse_chunk(chunk):
+    return [parse_output(item) for item in chunk]
+
+
+def format_report(stats, elapsed):
+    '''return the report of the stats of bulk_parse()
+
+    The throughput of each command is per worker, from the time spent
+    parsing its outputs, the total is from the elapsed time.
+    '''
+    row = '{:<50}{:>9}{:>9}{:>12}{:>12}'
+    lines = [row.format('command', 'outputs', 'failed', 'outputs/s', 'MB/s'),
+             '-' * 92]
+    for command, command_stats in sorted(stats.items()):
+        seconds = command_stats['seconds'] or 1e-9
+        lines.append(row.format(
+            command[:49], command_stats['outputs'], command_stats['failures'],
+            '{:.1f}'.format(command_stats['outputs'] / seconds),
+            '{:.2f}'.format(command_stats['bytes'] / seconds / 2 ** 20)))
+
+    outputs = sum(s['outputs'] for s in stats.values())
+    elapsed = elapsed or 1e-9
+    lines.append('-' * 92)
+    lines.append(row.format(
+        'total ({:.1f}s)'.format(elapsed), outputs,
+        sum(s['failures'] for s in stats.values()),
+        '{:.1f}'.format(outputs / elapsed),
+        '{:.2f}'.format(sum(s['bytes'] for s in stats.values())
+                        / elapsed / 2 ** 20)))
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    my_parser = argparse.ArgumentParser(
+        description='Parse captured outputs in bulk, '
+                    'the results are written as JSON Lines')
+    my_parser.add_argument('source',
+                           help='Directory or tarball of the outputs')
+    my_parser.add_argument('-m', '--manifest', required=True,
+                           help='CSV or JSON Lines file with the file, os, '
+                                'platform and command of each output')
+    my_parser.add_argument('-w', '--workers', type=int,
+                           default=os.cpu_count(),
+                           help='Number of worker processes')
+    my_parser.add_argument('-o', '--output', default='-',
+                           help='File the results are written to, '
+                                'stdout by default')
+    my_parser.add_argument('--chunksize', type=int, default=8,
+                           help='Number of outputs sent to a worker at once')
+    args = my_parser.parse_args(args)
+
+    if not os.path.isdir(args.source) and not (
+            os.path.isfile(args.source) and tarfile.is_tarfile(args.source)):
+        my_parser.error('{} is not a directory or a tarball'.format(
+            args.source))
+
+    start = time.perf_counter()
+    if args.output == '-':
+        stats = bulk_parse(args.source, args.manifest, sys.stdout,
+                           workers=args.workers, chunksize=args.chunksize)
+    else:
+        with open(args.output, 'w') as f:
+            stats = bulk_parse(args.source, args.manifest, f,
+                               workers=args.workers,
+                               chunksize=args.chunksize)
+
+    print(format_report(stats, time.perf_counter() - start), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,8 +8,11 @@ import json
 import math
 import logging
 import warnings
+import bisect
+import threading
 import importlib
 import pkg_resources
+from collections import OrderedDict
 from packaging import version
 from json.decoder import JSONDecodeError
 
@@ -19,11 +22,16 @@ from pyats.configuration import configuration as cfg
 from genie.abstract.package import AbstractTree, DEFAULT_ABSTRACT_ORDER
 from genie.abstract import Lookup
 
-from .extension import ExtendParsers
+from .extension import ExtendParsers, get_extension
+from .parser_index import load_parser_index, open_parser_index,\
+    SECTION_COMMON, SECTION_ORDER
 
 PARSER_MODULE_NAME = 'genie.libs.parser'
 ENTRY_POINT_NAME = PARSER_MODULE_NAME
 PYATS_EXT_PARSER = 'pyats.libs.external.parser'
+PARSER_CACHE_SIZE = 'genie.libs.parser.cache_size'
+PARSER_LAZY_LOAD = 'genie.libs.parser.lazy_load'
+DEFAULT_PARSER_CACHE_SIZE = 4096
 
 log = logging.getLogger(__name__)
 
@@ -34,6 +42,8 @@ except:
     INTERNAL = False
 
 parser_data = None
+command_index = None
+lazy_loader = None
 
 class ParserNotFound(Exception):
     '''raise exception if parser command is not found
@@ -49,10 +59,111 @@ class ParserNotFound(Exception):
         )
 
 
-def _load_parser_json():
-    '''get all parser data in json file'''
+class ParserCache(object):
+    '''ParserCache
+
+    Bounded LRU cache of the parser resolved by `get_parser` for a command
+    and a set of abstract tokens. Entries are dropped whenever the parser
+    data is reloaded or extended, the counters are kept so the cache can be
+    sized for a given fleet.
+
+        Args:
+            maxsize (`int`): maximum number of entries, 0 disables the cache
+    '''
+
+    def __init__(self, maxsize=DEFAULT_PARSER_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(command, tokens):
+        '''return the cache key of a command for the given abstract tokens'''
+        return (' '.join(command.split()),
+                tuple((token, tuple(value) if isinstance(value, list) else value)
+                      for token, value in tokens.items()))
+
+    def get(self, key):
+        '''return the cached entry for key, None if it is not cached'''
+        with self._lock:
+            try:
+                entry = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key, entry):
+        '''cache entry for key, evicting the least recently used entries'''
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, maxsize):
+        '''change the maximum number of entries'''
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self):
+        '''drop all the entries, the parser data has changed'''
+        with self._lock:
+            self._entries.clear()
+            self.invalidations += 1
+
+    def clear(self):
+        '''drop all the entries and reset the counters'''
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+            self.evictions = self.invalidations = 0
+
+    def info(self):
+        '''return the cache counters'''
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+        }
+
+
+parser_cache = ParserCache(int(cfg.get(PARSER_CACHE_SIZE,
+                                       DEFAULT_PARSER_CACHE_SIZE)))
+
+
+def _load_parser_json(lazy=None):
+    '''get all parser data in json file
+
+        Args:
+            lazy (`bool`): only load the parsers of an OS when it is first
+                           looked up, see `LazyParserLoader`. Defaults to the
+                           genie.libs.parser.lazy_load configuration
+    '''
 
     global parser_data
+    global lazy_loader
+
+    if lazy is None:
+        lazy = _lazy_load_enabled()
 
     try:
         mod = importlib.import_module(PARSER_MODULE_NAME)
@@ -69,17 +180,36 @@ def _load_parser_json():
                         'genie.libs.parsers. Do make json to generate '
                         'json files to use the parsers.')
 
-    # Open all the parsers in json file
-    with open(parsers) as f:
-        try:
-            json_data = json.load(f)
-        except JSONDecodeError:
-            log.error(banner("parser json file could be corrupted. "
-                                "Please try 'make json'"))
-            raise
+    index = None
+    if lazy:
+        # Start with no OS, they are loaded when looked up. Keep the order
+        # of the commands so lookups are the same as with all the parsers
+        index = open_parser_index(parsers, token_order)
+        json_data = order = None
+        if index is not None:
+            order = index.read(SECTION_ORDER)
+            json_data = index.read(SECTION_COMMON)
+        if json_data is None or order is None:
+            # without the index, the parsers of every OS are decoded
+            index = None
+            json_data = _read_parser_json(parsers, token_order)
+            order = list(json_data)
+            json_data = _filter_parser_json(json_data, include=set())
+        positions = {command: i for i, command in enumerate(order)}
+        del order
+    else:
+        json_data = _read_parser_json(parsers, token_order)
+
     parser_data = AbstractTree.from_json(json_data,
                                             package=PARSER_MODULE_NAME,
                                             feature='parser')
+    del json_data
+
+    lazy_loader = None
+    if lazy:
+        lazy_loader = LazyParserLoader(parser_data, parsers, token_order,
+                                       positions, index)
+
     if parser_data.order != token_order:
         raise KeyError('Loaded token order from json does not match '
                         'package token order\n{} != {}'.\
@@ -105,7 +235,10 @@ def _load_parser_json():
             log.warning(
                 f'{ep.name}: callable parser loading is deprecated. '
                 'Please create an abstracted package instead.')
-            _load_parser_callable(parser_package, parser_data)
+            if lazy_loader:
+                lazy_loader.callables.append(parser_package)
+            _load_parser_callable(parser_package, parser_data,
+                                  lazy_loader.loaded if lazy_loader else None)
         else:
             ext_parser_packages.append(ep.module_name)
 
@@ -115,12 +248,15 @@ def _load_parser_json():
 
     for ext_parser_package in ext_parser_packages:
         log.debug(f'Extending {ext_parser_package}')
-        ext = ExtendParsers(ext_parser_package)
-        ext.extend()
+        extend_data = get_extension(ext_parser_package)
+
+        extend_info = extend_data.pop('extend_info', None)
 
-        extend_info = ext.output.pop('extend_info', None)
+        if lazy_loader:
+            lazy_loader.extensions.append(extend_data)
+            extend_data = _filter_parser_json(extend_data, include=set())
 
-        extend_matrix = AbstractTree.from_json(ext.output,
+        extend_matrix = AbstractTree.from_json(extend_data,
                                                 package=PARSER_MODULE_NAME,
                                                 feature='parser')
         parser_data.update(extend_matrix)
@@ -130,10 +266,243 @@ def _load_parser_json():
             len(extend_info),
             json.dumps(extend_info, indent=2)))
 
+    # index the final set of commands for get_parser lookups
+    _build_command_index(parser_data)
+
     return parser_data
 
 
-def _load_parser_callable(package, parser_data):
+def _read_parser_json(parsers, token_order):
+    '''return the content of parsers.json, from its binary index when it
+       is up to date'''
+
+    json_data = load_parser_index(parsers, token_order)
+    if json_data is None:
+        log.debug('Parser index not available, loading {}'.format(parsers))
+
+        # Open all the parsers in json file
+        with open(parsers) as f:
+            try:
+                json_data = json.load(f)
+            except JSONDecodeError:
+                log.error(banner("parser json file could be corrupted. "
+                                    "Please try 'make json'"))
+                raise
+    return json_data
+
+
+def _lazy_load_enabled():
+    '''check the configuration and environment for lazy loading'''
+
+    PARSER_LAZY_LOAD_ENV_VAR = PARSER_LAZY_LOAD.upper().replace('.', '_')
+    value = os.environ.get(PARSER_LAZY_LOAD_ENV_VAR,
+                           cfg.get(PARSER_LAZY_LOAD, False))
+    if isinstance(value, str):
+        return value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return bool(value)
+
+
+def _filter_parser_json(json_data, include=None, exclude=None, common=True):
+    '''return the parser json data restricted to some OS
+
+        Args:
+            json_data (`dict`): content of parsers.json
+            include (`set`): OS to keep, None keeps all of them
+            exclude (`set`): OS to remove
+            common (`bool`): keep the parsers which are not under an OS
+
+        Returns:
+            dict: the filtered json data, commands without any parser left
+                  are removed. Entries which are not commands, such as
+                  'tokens' and 'token_order', are always kept.
+    '''
+    filtered = {}
+    for command, value in json_data.items():
+        if not isinstance(value, dict) or 'folders' not in value:
+            filtered[command] = value
+            continue
+
+        folders = {}
+        for name, folder in value['folders'].items():
+            operating_system = folder.get('tokens', {}).get('os')
+            if operating_system is None:
+                keep = common
+            else:
+                keep = (include is None or operating_system in include) and \
+                       not (exclude and operating_system in exclude)
+            if keep:
+                folders[name] = folder
+
+        if folders:
+            filtered[command] = dict(value, folders=folders)
+    return filtered
+
+
+class LazyParserLoader(object):
+    '''LazyParserLoader
+
+    With lazy loading `parser_data` starts without any OS. The parsers of an
+    OS are loaded from parsers.json the first time a command is looked up
+    for that OS, then the external parser packages are applied again for
+    that OS so they still overwrite the genie parsers. With the parser index
+    only the section of that OS is decoded, and its commands are added to
+    the command index.
+
+    Enable with the `genie.libs.parser.lazy_load` configuration or the
+    `GENIE_LIBS_PARSER_LAZY_LOAD` environment variable.
+
+        Args:
+            data (`AbstractTree`): parser data to load into
+            parsers (`str`): location of parsers.json
+            token_order (`list`): abstract token order of the package
+            positions (`dict`): position of each command in parsers.json
+            index (`ParserIndex`): index of parsers.json, None reads
+                                   parsers.json for each OS
+    '''
+
+    def __init__(self, data, parsers, token_order, positions, index=None):
+        self.data = data
+        self.parsers = parsers
+        self.token_order = token_order
+        self.positions = positions
+        self.index = index
+        self.loaded = set()
+        self.all_loaded = False
+        # json data of the external parser packages
+        self.extensions = []
+        # deprecated callable parser packages
+        self.callables = []
+        self._lock = threading.RLock()
+
+    def load(self, operating_systems=None):
+        '''load the parsers of the OS which are not loaded yet
+
+            Args:
+                operating_systems (`list`): OS to load, None loads them all
+
+            Returns:
+                bool: True if parsers were loaded
+        '''
+        with self._lock:
+            if self.all_loaded:
+                return False
+
+            missing = None
+            if operating_systems is not None:
+                missing = set(operating_systems) - self.loaded
+                if not missing:
+                    return False
+
+            log.debug('Loading parsers for {}'.format(
+                'all OS' if missing is None else ', '.join(sorted(missing))))
+
+            # genie parsers first, then the external packages on top
+            sources = self._read(missing)
+            sources.extend(_filter_parser_json(source,
+                                               include=missing,
+                                               exclude=self.loaded,
+                                               common=False)
+                           for source in self.extensions)
+            commands = []
+            for source in sources:
+                matrix = AbstractTree.from_json(source,
+                                                package=PARSER_MODULE_NAME,
+                                                feature='parser')
+                self.data.update(matrix)
+                commands.extend(source)
+            del sources
+
+            for package in self.callables:
+                _load_parser_callable(package, self.data, missing, self.loaded)
+            if self.callables:
+                # the commands of the callables are only known from the data
+                commands = list(self.data)
+
+            if missing is None:
+                self.all_loaded = True
+            else:
+                self.loaded.update(missing)
+
+            # new commands are available
+            _update_command_index(self.data, commands)
+        return True
+
+    def _read(self, missing):
+        '''return the json data of the genie parsers of the missing OS, all
+           the OS not loaded yet when missing is None'''
+        if self.index is not None:
+            if missing is None:
+                missing = self.index.operating_systems - self.loaded
+            sources = [self.index.read(name) for name in sorted(missing)]
+            if None not in sources:
+                return sources
+            # the index was replaced since it was opened
+            self.index = None
+
+        json_data = _read_parser_json(self.parsers, self.token_order)
+        return [_filter_parser_json(json_data,
+                                    include=missing,
+                                    exclude=self.loaded,
+                                    common=False)]
+
+
+def _load_parser_os(data, tokens=None):
+    '''make sure the parsers for the OS of the abstract tokens are loaded
+       when lazy loading is enabled'''
+
+    if lazy_loader is None or lazy_loader.all_loaded or \
+            lazy_loader.data is not data:
+        return
+
+    operating_systems = (tokens or {}).get('os')
+    if isinstance(operating_systems, str):
+        operating_systems = [operating_systems]
+    elif not operating_systems:
+        # without an OS, any parser could match
+        operating_systems = None
+
+    lazy_loader.load(operating_systems)
+
+
+def _build_command_index(data):
+    '''build the command index for the given parser data'''
+
+    global command_index
+
+    positions = None
+    if lazy_loader is not None and lazy_loader.data is data:
+        # commands in the order they would have with all the parsers loaded
+        positions = lazy_loader.positions
+
+    command_index = CommandIndex(data, positions=positions)
+    # parsers resolved from the previous data may not be valid anymore
+    parser_cache.invalidate()
+    return command_index
+
+
+def _update_command_index(data, commands):
+    '''add the commands newly loaded into the parser data to its command
+       index, building it if parser_data was replaced'''
+
+    if command_index is None or command_index.data is not data:
+        return _build_command_index(data)
+
+    command_index.add(commands)
+    parser_cache.invalidate()
+    return command_index
+
+
+def _get_command_index(data):
+    '''return the command index of the given parser data, building it if
+       parser_data was replaced since the index was built'''
+
+    if command_index is None or command_index.data is not data:
+        return _build_command_index(data)
+    return command_index
+
+
+def _load_parser_callable(package, parser_data, operating_systems=None,
+                          exclude=None):
     '''_load_parser_callable
 
     *** DEPRECATED This is only here for backward compatibility ***
@@ -143,11 +512,18 @@ def _load_parser_callable(package, parser_data):
     {<os>: [<parser_classes, ...], <os>: [more_parser_classes, ...]}
     These parsers are then added to the abstract matrix to be available for
     lookup.
+
+    operating_systems and exclude restrict the OS which are added, they are
+    used with lazy loading.
     '''
     if not 'os' in parser_data.order:
         warnings.warn('"os"')
 
     for os, parser_list in package().items():
+        if operating_systems is not None and os not in operating_systems:
+            continue
+        if exclude and os in exclude:
+            continue
         for parser in parser_list:
             # get list of commands which are the top-level keys of the abstract
             # matrix
@@ -175,6 +551,8 @@ def get_parser_commands(device, data=None):
         else:
             data = parser_data
 
+    _load_parser_os(data, {'os': device.os})
+
     return [
         command for command, values in data.items()
         if '{' not in command and command != 'tokens' and device.os in values
@@ -215,25 +593,39 @@ def get_parser(command, device, fuzzy=False, abstract=None):
     if abstract:
         tokens.update(abstract)
 
-    results = _fuzzy_search_command(command, fuzzy, tokens)
-    valid_results = []
+    # Only the best match is needed when not fuzzy, which can be cached for
+    # this command and set of tokens
+    cache_key = None
+    valid_results = None
+    if not fuzzy:
+        # drops the cached parsers if parser_data was replaced
+        _get_command_index(data)
+        cache_key = parser_cache.key(command, tokens)
+        valid_results = parser_cache.get(cache_key)
+
+    if valid_results is None:
+        results = _fuzzy_search_command(command, fuzzy, tokens)
+        valid_results = []
 
-    for result in results:
-        found_command, parser_cls, kwargs = result
+        for result in results:
+            found_command, parser_cls, kwargs = result
 
-        if found_command == 'tokens':
-            continue
+            if found_command == 'tokens':
+                continue
 
-        # parser_cls can be None if there is no abstract data, but a matching
-        # command is still found
-        if parser_cls is None:
-            continue
+            # parser_cls can be None if there is no abstract data, but a
+            # matching command is still found
+            if parser_cls is None:
+                continue
+
+            valid_results.append((found_command, parser_cls, kwargs))
 
-        valid_results.append((found_command, parser_cls, kwargs))
+        if not valid_results:
+            # result is not valid. raise custom ParserNotFound exception
+            raise ParserNotFound(command, tokens)
 
-    if not valid_results:
-        # result is not valid. raise custom ParserNotFound exception
-        raise ParserNotFound(command, tokens)
+        if cache_key is not None:
+            parser_cache.set(cache_key, valid_results[:1])
 
     log.debug('Parsers found for command "{}": {}'.format(command,
                                                          str(valid_results)))
@@ -257,7 +649,8 @@ def get_parser(command, device, fuzzy=False, abstract=None):
         # valid_results[0][1] is the class of the best match
         # valid_results[0][2] is a dict of parser kwargs
         parser_class = valid_results[0][1]
-        parser_kwargs = valid_results[0][2]
+        # copy, the kwargs dict is shared with the cached entry
+        parser_kwargs = dict(valid_results[0][2])
         log.debug(f'Parser class: {parser_class} arguments: {parser_kwargs}')
         return parser_class, parser_kwargs
 
@@ -285,6 +678,9 @@ def _fuzzy_search_command(search,
     else:
         data = parser_data
 
+    # Parsers for the OS must be loaded before searching
+    _load_parser_os(data, abstract)
+
     # Perfect match should return
     if search in data:
         parser_cls = None
@@ -309,11 +705,11 @@ def _fuzzy_search_command(search,
     best_score = -math.inf
     result = []
 
-    for command in data:
-        # ! This was a band-aid fix. Root cause has been resolved, but this will
-        # ! remain in-place for peace of mind
-        if command is None:
-            continue
+    # Only the commands the index says can match are scored, in the same
+    # order as they appear in the parser data
+    candidates = _get_command_index(data).candidates(tokens, fuzzy)
+
+    for command in candidates:
         # Tokens and kwargs parameter must be non reference
         match_result = _matches_fuzzy(0, 0, tokens.copy(), command, {}, fuzzy)
 
@@ -434,6 +830,154 @@ def _is_regular_token(token):
     return token_is_regular
 
 
+class _CommandNode(object):
+    '''A node of the CommandIndex trie. Edges are command tokens, split into
+       literal tokens, `{argument}` tokens and tokens with an embedded
+       argument such as `/dna/intent/api/v1/interface/{interface}`'''
+
+    __slots__ = ('literals', 'keys', 'arguments', 'embedded', 'commands',
+                 '_subtree')
+
+    def __init__(self):
+        self.literals = {}
+        self.keys = None
+        self.arguments = {}
+        self.embedded = {}
+        self.commands = []
+        self._subtree = None
+
+    def child(self, token):
+        if token.startswith('{'):
+            edges = self.arguments
+        elif '{' in token:
+            edges = self.embedded
+        else:
+            edges = self.literals
+        node = edges.get(token)
+        if node is None:
+            node = edges[token] = _CommandNode()
+            if edges is self.literals:
+                self.keys = None
+        return node
+
+    def prefixed(self, token):
+        '''return the children whose literal token starts with token'''
+        if self.keys is None:
+            self.keys = sorted(self.literals)
+        keys = self.keys
+        index = bisect.bisect_left(keys, token)
+        while index < len(keys) and keys[index].startswith(token):
+            yield self.literals[keys[index]]
+            index += 1
+
+    def subtree(self):
+        '''return all commands which start at this node'''
+        if self._subtree is None:
+            commands = list(self.commands)
+            for edges in (self.literals, self.arguments, self.embedded):
+                for node in edges.values():
+                    commands.extend(node.subtree())
+            self._subtree = commands
+        return self._subtree
+
+
+class CommandIndex(object):
+    '''CommandIndex
+
+    Prefix trie of the parser commands, keyed on the command tokens. It is
+    used by `_fuzzy_search_command` to find which commands could match a
+    search instead of running `_matches_fuzzy` against every command.
+
+    The index only narrows down the commands to score, it never decides on
+    a match itself. Every command `_matches_fuzzy` can accept is part of the
+    candidates, so the results and ambiguity errors are the same as a scan
+    over all commands.
+
+        Args:
+            data (`AbstractTree`): parser data to index
+            commands (`list`): commands of data in search order, defaults to
+                               the order of data
+            positions (`dict`): search order of the commands, the ones
+                                without a position come after them in the
+                                order they are added
+    '''
+
+    # arguments can span up to 2 search tokens, see `_matches_fuzzy`
+    MAX_ARGUMENT_TOKENS = 2
+
+    def __init__(self, data, commands=None, positions=None):
+        self.data = data
+        self.root = _CommandNode()
+        self.position = {}
+        self.positions = positions
+
+        self.add(data if commands is None else commands)
+
+    def add(self, commands):
+        '''index the commands which are not indexed yet, they come after the
+           indexed ones unless positions orders them'''
+        for command in commands:
+            # ! Same band-aid as the linear search had, for peace of mind
+            if command is None or command in self.position:
+                continue
+            position = len(self.position)
+            if self.positions is not None:
+                position = (self.positions.get(command, len(self.positions)),
+                            position)
+            self.position[command] = position
+
+            node = self.root
+            node._subtree = None
+            for token in command.split():
+                node = node.child(token)
+                node._subtree = None
+            node.commands.append(command)
+
+    def __len__(self):
+        return len(self.position)
+
+    def candidates(self, tokens, fuzzy):
+        '''return the commands which could match the search tokens
+
+            Args:
+                tokens (`list`): the search tokens
+                fuzzy (`bool`): whether or not fuzzy mode is used
+
+            Returns:
+                list: commands, in parser data order
+        '''
+        found = set()
+        self._walk(self.root, tokens, 0, fuzzy, found)
+        return sorted(found, key=self.position.__getitem__)
+
+    def _walk(self, node, tokens, i, fuzzy, found):
+        if i == len(tokens):
+            # all the search tokens are used, only commands ending here match
+            found.update(node.commands)
+            return
+
+        token = tokens[i]
+        if fuzzy and token != '*':
+            if not _is_regular_token(token):
+                # a regex is matched against the rest of the command, any
+                # command below this node is a candidate
+                found.update(node.subtree())
+                return
+            token = token.replace(r'\|', '|').replace(r'\.', '.')
+
+        for child in node.prefixed(token):
+            self._walk(child, tokens, i + 1, fuzzy, found)
+
+        # embedded arguments can only be found once the token is known
+        for child in node.embedded.values():
+            self._walk(child, tokens, i + 1, fuzzy, found)
+
+        for child in node.arguments.values():
+            end = min(i + self.MAX_ARGUMENT_TOKENS, len(tokens))
+            for index in range(i + 1, end + 1):
+                self._walk(child, tokens, index, fuzzy, found)
+
+
 def _matches_fuzzy(i,
                    j,
                    tokens,
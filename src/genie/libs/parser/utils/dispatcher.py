@@ -0,0 +1,345 @@
+'''Line dispatcher for the regex cascades of parsers
+
+The cli() of most parsers tries each of its patterns in order on every line
+of the output, until one of them matches. Most patterns can only match lines
+starting with a given keyword, so most of these calls fail.
+
+`LineDispatcher` looks at the start of each pattern once, to find the
+literal text or the characters a matching line must start with. For a line,
+it only tries the patterns which can match it, in the same order as the
+cascade, and returns the first one matching:
+
+    class ShowRoute(ShowRouteSchema):
+
+        patterns = Patterns(
+            # inet.0: 929 destinations, 1615 routes (929 active, 0 holddown, 0 hidden)
+            p1=r'^(?P<table_name>\\S+): +(?P<destination_count>\\d+) +destinations',
+
+            # State: <Active Int Ext>
+            p2=r'State: +<(?P<rt_state>[\\S\\s]+)>$',
+        )
+        dispatcher = LineDispatcher(patterns)
+
+        def cli(self, output=None):
+            ...
+            for line in out.splitlines():
+                line = line.strip()
+                name, m = ShowRoute.dispatcher.match(line)
+
+                if name == 'p1':
+                    ...
+                    continue
+
+                if name == 'p2':
+                    ...
+
+A branch of the cascade which does not `continue` lets the next patterns try
+the same line, `match(line, after=name)` resumes the cascade after the given
+pattern.
+
+Patterns compiled with IGNORECASE, or starting with anything else than
+literals, character sets, groups and repeats, are tried on every line.
+'''
+
+# python
+import re
+import weakref
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    # python < 3.11
+    import sre_parse
+    import sre_constants
+
+_BEGINNING = (sre_constants.AT_BEGINNING, sre_constants.AT_BEGINNING_STRING)
+_REPEATS = tuple(getattr(sre_constants, op) for op in
+                 ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+                 if hasattr(sre_constants, op))
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: r'\d',
+    sre_constants.CATEGORY_NOT_DIGIT: r'\D',
+    sre_constants.CATEGORY_SPACE: r'\s',
+    sre_constants.CATEGORY_NOT_SPACE: r'\S',
+    sre_constants.CATEGORY_WORD: r'\w',
+    sre_constants.CATEGORY_NOT_WORD: r'\W',
+}
+
+
+class FirstChars(object):
+    '''set of the characters a match can start with, made of single
+       characters and character classes such as [^\\d\\s]'''
+
+    def __init__(self, chars=(), classes=()):
+        self.chars = set(chars)
+        self.classes = list(classes)
+
+    def __contains__(self, char):
+        if char in self.chars:
+            return True
+        return any(cls.match(char) for cls in self.classes)
+
+    def __ior__(self, other):
+        self.chars |= other.chars
+        self.classes.extend(other.classes)
+        return self
+
+    def __repr__(self):
+        return '<FirstChars {} {}>'.format(
+            ''.join(sorted(self.chars)), [cls.pattern for cls in self.classes])
+
+
+def _first_of_sequence(items, flags):
+    '''return (chars, nullable) of a sequence of regex items. chars are the
+       FirstChars a match can start with, None when it can start with any
+       character. nullable is True when the sequence can match an empty
+       string'''
+    chars = FirstChars()
+    for op, av in items:
+        item_chars, nullable = _first_of_item(op, av, flags)
+        if item_chars is None:
+            return None, False
+        chars |= item_chars
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+def _character_class(items, flags):
+    '''compile the single character regex of a parsed [...] set'''
+    source = []
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            source.insert(0, '^')
+        elif op is sre_constants.LITERAL:
+            source.append(re.escape(chr(av)))
+        elif op is sre_constants.RANGE:
+            source.append('{}-{}'.format(re.escape(chr(av[0])),
+                                         re.escape(chr(av[1]))))
+        elif op is sre_constants.CATEGORY and av in _CATEGORIES:
+            source.append(_CATEGORIES[av])
+        else:
+            return None
+    return re.compile('[{}]'.format(''.join(source)), flags & re.ASCII)
+
+
+def _first_of_item(op, av, flags):
+    '''return (chars, nullable) of a single regex item'''
+    if op is sre_constants.LITERAL:
+        return FirstChars(chr(av)), False
+
+    if op is sre_constants.IN:
+        if all(set_op is sre_constants.LITERAL for set_op, set_av in av):
+            return FirstChars(chr(set_av) for set_op, set_av in av), False
+        cls = _character_class(av, flags)
+        if cls is None:
+            return None, False
+        return FirstChars(classes=[cls]), False
+
+    if op is sre_constants.AT:
+        if av in _BEGINNING:
+            # always true at the start of the line
+            return FirstChars(), True
+        return None, False
+
+    if op is sre_constants.SUBPATTERN:
+        group, add_flags, del_flags, items = av
+        if (add_flags | del_flags) & (re.IGNORECASE | re.ASCII | re.LOCALE):
+            return None, False
+        return _first_of_sequence(items, flags)
+
+    if _ATOMIC_GROUP is not None and op is _ATOMIC_GROUP:
+        return _first_of_sequence(av, flags)
+
+    if op in _REPEATS:
+        low, high, items = av
+        chars, nullable = _first_of_sequence(items, flags)
+        return chars, nullable or low == 0
+
+    if op is sre_constants.BRANCH:
+        chars = FirstChars()
+        nullable = False
+        for items in av[1]:
+            branch_chars, branch_nullable = _first_of_sequence(items, flags)
+            if branch_chars is None:
+                return None, False
+            chars |= branch_chars
+            nullable = nullable or branch_nullable
+        return chars, nullable
+
+    # any character, look arounds, group references
+    return None, False
+
+
+def _literal_prefix(items, prefix):
+    '''add the literal text every match starts with to prefix, return True
+       when all the items are literals'''
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            prefix.append(chr(av))
+        elif op is sre_constants.AT and av in _BEGINNING:
+            continue
+        elif op is sre_constants.SUBPATTERN and not av[1] and not av[2]:
+            if not _literal_prefix(av[3], prefix):
+                return False
+        else:
+            return False
+    return True
+
+
+def analyse(regex):
+    '''analyse
+
+    Find what a line must start with to be matched by a pattern
+
+        Args:
+            regex (`re.Pattern`): compiled pattern
+
+        Returns:
+            tuple: (prefix, chars), the literal text a matching line starts
+                   with, and the FirstChars of its possible first characters.
+                   chars is None when the line can start with anything
+    '''
+    if not isinstance(regex.pattern, str) or \
+            regex.flags & (re.IGNORECASE | re.LOCALE):
+        return '', None
+
+    items = sre_parse.parse(regex.pattern, regex.flags)
+
+    prefix = []
+    _literal_prefix(items, prefix)
+    prefix = ''.join(prefix)
+    if prefix:
+        return prefix, FirstChars(prefix[0])
+
+    chars, nullable = _first_of_sequence(items, regex.flags)
+    if nullable:
+        # can match an empty line, or start with what follows
+        return '', None
+    return '', chars
+
+
+class LineDispatcher(object):
+    '''LineDispatcher
+
+    Try the patterns of a cascade on a line, skipping the patterns which
+    cannot match it. The patterns are analysed the first time a line is
+    matched, they are kept by the dispatcher which is shared by every
+    instance of the parser.
+
+        Args:
+            patterns (`Patterns`, `dict` or `list`): the patterns, either a
+                Patterns table, or a dict or list of (name, pattern). The
+                patterns can be compiled or regex strings
+            order (`list`): names of the patterns in the order of the
+                cascade, defaults to the order of patterns
+
+        Example:
+            >>> dispatcher = LineDispatcher([('p1', r'^Version +(?P<v>\\S+)$'),
+            ...                              ('p2', r'^(?P<key>\\S+): (?P<v>.*)$')])
+            >>> name, m = dispatcher.match('Version 17.3.1')
+            >>> name, m.groupdict()
+            ('p1', {'v': '17.3.1'})
+    '''
+
+    # every dispatcher, their compiled patterns are dropped by reset_all()
+    _dispatchers = weakref.WeakSet()
+
+    def __init__(self, patterns, order=None):
+        self._patterns = patterns
+        self._order = order
+        self._entries = None
+        self._candidates = {}
+        LineDispatcher._dispatchers.add(self)
+
+    def reset(self):
+        '''drop the analysed patterns, they are loaded again on next match'''
+        self._entries = None
+        self._candidates = {}
+
+    @classmethod
+    def reset_all(cls):
+        '''drop the analysed patterns of every dispatcher'''
+        for dispatcher in list(LineDispatcher._dispatchers):
+            dispatcher.reset()
+
+    def _load(self):
+        patterns = self._patterns
+        if hasattr(patterns, 'items'):
+            patterns = patterns.items()
+        patterns = dict(patterns)
+        order = self._order or list(patterns)
+
+        entries = []
+        for index, name in enumerate(order):
+            regex = patterns[name]
+            if isinstance(regex, str):
+                regex = re.compile(regex)
+            elif isinstance(regex, tuple):
+                regex = re.compile(*regex)
+            prefix, chars = analyse(regex)
+            entries.append((index, name, regex, prefix, chars))
+        self._entries = entries
+        return entries
+
+    def candidates(self, line):
+        '''return (index, name, pattern, prefix) of the patterns which can
+           match a line, in the order of the cascade'''
+        key = line[:1]
+        try:
+            return self._candidates[key]
+        except KeyError:
+            pass
+
+        entries = self._entries or self._load()
+        candidates = tuple((index, name, regex, prefix)
+                           for index, name, regex, prefix, chars in entries
+                           if chars is None or key in chars)
+        self._candidates[key] = candidates
+        return candidates
+
+    def match(self, line, after=None):
+        '''match
+
+        Match a line with the first pattern of the cascade matching it
+
+            Args:
+                line (`str`): line to match
+                after (`str`): name of a pattern, only the patterns after it
+                               in the cascade are tried
+
+            Returns:
+                tuple: (name, match) of the first pattern matching the line,
+                       (None, None) when none of them match
+        '''
+        candidates = self.candidates(line)
+        if after is None:
+            for index, name, regex, prefix in candidates:
+                if line.startswith(prefix):
+                    m = regex.match(line)
+                    if m:
+                        return name, m
+            return None, None
+
+        start = self.index(after)
+        for index, name, regex, prefix in candidates:
+            if index > start and line.startswith(prefix):
+                m = regex.match(line)
+                if m:
+                    return name, m
+        return None, None
+
+    def index(self, name):
+        '''return the position of a pattern in the cascade'''
+        entries = self._entries or self._load()
+        for index, entry_name, regex, prefix, chars in entries:
+            if entry_name == name:
+                return index
+        raise KeyError(name)
+
+    def names(self):
+        '''return the names of the patterns, in the order of the cascade'''
+        entries = self._entries or self._load()
+        return [entry[1] for entry in entries]
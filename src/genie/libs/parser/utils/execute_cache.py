@@ -0,0 +1,181 @@
+'''Scoped cache of the commands executed and the outputs parsed by parsers
+
+Many parsers execute other commands, or call other parsers: the BGP
+summary parsers call ShowVrf, the neighbor, advertised-routes and
+received-routes parsers each execute `show bgp all neighbors | i BGP
+neighbor`, the LISP parsers execute a command for each instance. A collector
+running them back to back sends the same commands to the device again and
+again.
+
+While an `ExecuteCache` is active, the `device.execute()` calls of the
+parsers with the same arguments on the same device only execute the command
+once, and a parser called again with the same arguments on the same device
+returns a copy of its previous result:
+
+    cache = ExecuteCache(ttl=60)
+    with cache:
+        ShowBgpAllSummary(device=device).parse()
+        ShowBgpAllNeighbors(device=device).parse()
+
+The cache can be kept, as a session, and entered again later on, its
+entries are used until they are ttl seconds old. Only the parsers use it,
+the commands executed with the device outside of a parser are not cached.
+The outputs given to parse() with `output=` are parsed again.
+'''
+
+# python
+import copy
+import time
+import threading
+
+# Parser utils
+from genie.libs.parser.utils.parse_hooks import (add_parse_hook,
+                                                 remove_parse_hook,
+                                                 DeviceProxy, PendingOutput,
+                                                 unwrap_device)
+
+_lock = threading.Lock()
+# caches entered, the last one is used
+_active = []
+
+_MISS = object()
+
+
+class ExecuteCache(object):
+    '''ExecuteCache
+
+    Cache of the outputs of the commands executed by the parsers, and of the
+    results of the parsers, of each device
+
+        Args:
+            ttl (`float`): seconds an entry is used for, forever by default
+            parse (`bool`): cache the results of the parsers too, not only the
+                outputs of the commands
+
+        Attributes:
+            stats (`dict`): hits and misses of the executed commands and of
+                the parsers
+    '''
+
+    def __init__(self, ttl=None, parse=True):
+        self.ttl = ttl
+        self.parse = parse
+        self.stats = dict.fromkeys(('execute_hits', 'execute_misses',
+                                    'parse_hits', 'parse_misses'), 0)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with _lock:
+            if not _active:
+                add_parse_hook(_parse_hook)
+            _active.append(self)
+        return self
+
+    def __exit__(self, *exc_info):
+        with _lock:
+            _active.remove(self)
+            if not _active:
+                remove_parse_hook(_parse_hook)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        '''drop every entry'''
+        with self._lock:
+            self._entries.clear()
+
+    def invalidate(self, device):
+        '''drop the entries of a device, once its state changed'''
+        device = unwrap_device(device)
+        with self._lock:
+            for key in [key for key, entry in self._entries.items()
+                        if entry[2] is device]:
+                del self._entries[key]
+
+    def get(self, device, key):
+        '''return the entry of a device, _MISS when there is none or it
+        expired'''
+        with self._lock:
+            entry = self._entries.get((id(device), key))
+            if entry is None:
+                return _MISS
+            expires, value, _ = entry
+            if expires is not None and time.monotonic() >= expires:
+                del self._entries[id(device), key]
+                return _MISS
+            return value
+
+    def put(self, device, key, value):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            # the device is kept so that its id is not reused
+            self._entries[id(device), key] = (expires, value, device)
+
+    def _parse(self, parser, parse, kwargs):
+        device = getattr(parser, 'device', None)
+        if device is None:
+            return parse(**kwargs)
+        target = unwrap_device(device)
+
+        key = None
+        if self.parse and 'output' not in kwargs:
+            key = _parse_key(parser, kwargs)
+            result = self.get(target, key)
+            if result is not _MISS:
+                self.stats['parse_hits'] += 1
+                return copy.deepcopy(result)
+            self.stats['parse_misses'] += 1
+
+        # the nested parsers share the proxy of the outermost one
+        proxy = device
+        if not (isinstance(device, _CachingDevice) and device._cache is self):
+            proxy = parser.device = _CachingDevice(device, self, target)
+        try:
+            result = parse(**kwargs)
+        finally:
+            parser.device = device
+        if key is not None and not proxy._pending:
+            # the caller may change the result
+            self.put(target, key, copy.deepcopy(result))
+        return result
+
+
+class _CachingDevice(DeviceProxy):
+    '''device of a parser, executing each command once'''
+
+    def __init__(self, device, cache, target):
+        super().__init__(device)
+        object.__setattr__(self, '_cache', cache)
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_pending', False)
+
+    def execute(self, *args, **kwargs):
+        key = ('execute', repr(args), repr(sorted(kwargs.items())))
+        output = self._cache.get(self._target, key)
+        if output is not _MISS:
+            self._cache.stats['execute_hits'] += 1
+            return output
+        self._cache.stats['execute_misses'] += 1
+        output = self._device.execute(*args, **kwargs)
+        if isinstance(output, PendingOutput):
+            # the results parsed from it are not cached either
+            object.__setattr__(self, '_pending', True)
+        else:
+            self._cache.put(self._target, key, output)
+        return output
+
+
+def _parse_hook(parser, parse, kwargs):
+    cache = _active[-1] if _active else None
+    if cache is None:
+        return parse(**kwargs)
+    return cache._parse(parser, parse, kwargs)
+
+
+def _parse_key(parser, kwargs):
+    cls = type(parser)
+    context = getattr(parser, 'context', None)
+    return ('parse', cls.__module__, cls.__qualname__, repr(context),
+            repr(sorted(kwargs.items())))
@@ -1,13 +1,24 @@
+import os
+import sys
+import json
 import logging
 import pathlib
+import hashlib
 import inspect
+import argparse
 import itertools
 import importlib
+import importlib.util
 from genie.metaparser import MetaParser
 from genie.json.make_json import MakeParsers
+from pyats.configuration import configuration as cfg
 
 log = logging.getLogger(__name__)
 
+PARSER_MODULE_NAME = 'genie.libs.parser'
+EXTENSION_CACHE = 'genie.libs.parser.extension_cache'
+EXTENSION_CACHE_FORMAT = 1
+
 class ExtendParsers(MakeParsers):
     # Files and directories to ignore while walking package
     IGNORE_DIR = ['.git', '__pycache__', 'template', 'tests']
@@ -34,3 +45,244 @@ class ExtendParsers(MakeParsers):
         # Walk all files in the given package and find all parsers
         log.debug(f'Parser module: {self.module_loc}')
         self._recursive_find(pathlib.Path(self.module_loc))
+
+
+class ExtensionCache(object):
+    '''ExtensionCache
+
+    On disk cache of the parsers found by ExtendParsers in an external parser
+    package. Walking the package imports every module of it, which is done
+    again by every process loading the parser data.
+
+    A cache entry is only used when the genie.libs.parser version, python
+    version and the size and modification time of every python file of the
+    package are the same as when the entry was made. Finding these only
+    needs a stat of the files, none of the modules are imported.
+
+    The location is the `genie.libs.parser.extension_cache` configuration or
+    the `GENIE_LIBS_PARSER_EXTENSION_CACHE` environment variable, it defaults
+    to ~/.cache/genie/parser_extensions. Set it to `false` to disable the
+    cache.
+
+        Args:
+            location (`str`): directory of the cache
+    '''
+
+    # Same directories ExtendParsers does not walk
+    IGNORE_DIR = ExtendParsers.IGNORE_DIR
+
+    def __init__(self, location=None):
+        self.location = location or self.default_location()
+
+    @staticmethod
+    def default_location():
+        env_var = EXTENSION_CACHE.upper().replace('.', '_')
+        location = os.environ.get(env_var, cfg.get(EXTENSION_CACHE))
+        if location is None:
+            cache_home = os.environ.get('XDG_CACHE_HOME',
+                                        os.path.expanduser('~/.cache'))
+            location = os.path.join(cache_home, 'genie', 'parser_extensions')
+        return location
+
+    @property
+    def enabled(self):
+        return str(self.location).lower() not in ('', '0', 'false', 'no',
+                                                  'off')
+
+    def path(self, package):
+        '''return the location of the cache entry of a package'''
+        return os.path.join(self.location, '{}.json'.format(package))
+
+    @staticmethod
+    def package_location(package):
+        '''return the folder of a package without importing its modules'''
+        spec = importlib.util.find_spec(package)
+        if spec is None or not spec.submodule_search_locations:
+            raise ImportError(f'{package} is not a package')
+        return list(spec.submodule_search_locations)[0]
+
+    @classmethod
+    def fingerprint(cls, location):
+        '''return a hash of the size and modification time of the python
+           files ExtendParsers would walk in location'''
+        sha = hashlib.sha1()
+        for root, dirs, files in os.walk(location):
+            dirs[:] = sorted(d for d in dirs if d not in cls.IGNORE_DIR)
+            for name in sorted(files):
+                if not name.endswith('.py'):
+                    continue
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                sha.update('{}:{}:{}\n'.format(
+                    os.path.relpath(path, location), stat.st_size,
+                    stat.st_mtime_ns).encode())
+        return sha.hexdigest()
+
+    @staticmethod
+    def _environment():
+        return {
+            'format': EXTENSION_CACHE_FORMAT,
+            'version': importlib.import_module(PARSER_MODULE_NAME).__version__,
+            'python': '{}.{}'.format(*sys.version_info[:2]),
+        }
+
+    def read(self, package):
+        '''return the cache entry of a package, None if there is none'''
+        try:
+            with open(self.path(package)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.debug(f'Could not read parser extension cache of '
+                      f'{package}: {e}')
+            return None
+
+    def load(self, package):
+        '''return the cached ExtendParsers output of a package, None if the
+           cache entry is missing or stale'''
+        entry = self.read(package)
+        if not entry:
+            return None
+
+        for key, value in self._environment().items():
+            if entry.get(key) != value:
+                log.debug(f'Parser extension cache of {package} is stale, '
+                          f'{key}: {entry.get(key)} != {value}')
+                return None
+
+        location = self.package_location(package)
+        if entry.get('location') != location or \
+                entry.get('fingerprint') != self.fingerprint(location):
+            log.debug(f'Parser extension cache of {package} is stale, '
+                      f'files changed in {location}')
+            return None
+
+        return entry['output']
+
+    def save(self, package, output):
+        '''write the ExtendParsers output of a package to the cache'''
+        location = self.package_location(package)
+        entry = dict(self._environment(),
+                     package=package,
+                     location=location,
+                     fingerprint=self.fingerprint(location),
+                     output=output)
+
+        os.makedirs(self.location, exist_ok=True)
+        # write to a temporary file first, a worker could be reading it
+        path = self.path(package)
+        tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+        with open(tmp_path, 'w') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+        log.debug(f'Parser extension cache of {package} written to {path}')
+
+    def remove(self, package):
+        '''remove the cache entry of a package'''
+        try:
+            os.remove(self.path(package))
+        except FileNotFoundError:
+            pass
+
+    def packages(self):
+        '''return the packages which have a cache entry'''
+        try:
+            names = sorted(os.listdir(self.location))
+        except FileNotFoundError:
+            return []
+        return [name[:-len('.json')] for name in names
+                if name.endswith('.json')]
+
+
+def get_extension(package, cache=None, rebuild=False):
+    '''get_extension
+
+    Find the parsers of an external parser package, from the extension cache
+    when it is up to date
+
+        Args:
+            package (`str`): external parser package
+            cache (`ExtensionCache`): cache to use, defaults to the
+                                      configured location
+            rebuild (`bool`): ignore the cache entry and walk the package
+
+        Returns:
+            dict: the ExtendParsers output, with its 'extend_info'
+    '''
+    cache = cache or ExtensionCache()
+
+    if cache.enabled and not rebuild:
+        try:
+            output = cache.load(package)
+        except Exception as e:
+            log.debug(f'Could not load parser extension cache of '
+                      f'{package}: {e}')
+            output = None
+        if output is not None:
+            log.debug(f'Using parser extension cache of {package}')
+            return output
+
+    ext = ExtendParsers(package)
+    ext.extend()
+
+    if cache.enabled:
+        try:
+            cache.save(package, ext.output)
+        except Exception as e:
+            log.warning(f'Could not write parser extension cache of '
+                        f'{package}: {e}')
+    return ext.output
+
+
+def main():
+    my_parser = argparse.ArgumentParser(
+        description='Inspect or rebuild the cache of external parser '
+                    'packages')
+    my_parser.add_argument('packages',
+                           nargs='*',
+                           help='External parser packages, defaults to the '
+                                'packages in the cache')
+    my_parser.add_argument('--rebuild',
+                           action='store_true',
+                           help='Walk the packages again and update the cache')
+    my_parser.add_argument('--clear',
+                           action='store_true',
+                           help='Remove the cache of the packages')
+    my_parser.add_argument('--cache',
+                           type=str,
+                           help='Location of the cache',
+                           default=None)
+    args = my_parser.parse_args()
+
+    cache = ExtensionCache(args.cache)
+    packages = args.packages or cache.packages()
+    print(f'Parser extension cache: {cache.location}')
+
+    for package in packages:
+        if args.clear:
+            cache.remove(package)
+            print(f'{package}: removed')
+            continue
+
+        if args.rebuild:
+            get_extension(package, cache, rebuild=True)
+
+        entry = cache.read(package)
+        if entry is None:
+            print(f'{package}: not cached')
+            continue
+
+        status = 'up to date'
+        try:
+            if cache.load(package) is None:
+                status = 'stale'
+        except ImportError:
+            status = 'package not found'
+        print('{}: {}, {} parsers, genie.libs.parser {}'.format(
+            package, status, len(entry['output'].get('extend_info', [])),
+            entry.get('version')))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+'''Loader of the expected outputs of the golden tests
+
+The `*_expected.py` files of the golden tests only hold a literal assigned
+to `expected_output`. `load_expected_output()` reads that literal with
+`ast.literal_eval` instead of executing the file, and keeps it marshalled in
+the `__pycache__` folder next to the file, so following runs read it back
+without parsing the Python source again, as long as the file is unchanged.
+'''
+
+# python
+import os
+import ast
+import sys
+import marshal
+
+# name of the variable holding the expected output
+EXPECTED_OUTPUT = 'expected_output'
+
+# bumped when the layout of the cached files changes
+CACHE_VERSION = 1
+
+
+def load_expected_output(file_path, name=EXPECTED_OUTPUT, cache=True):
+    '''return the literal assigned to `name` in a Python file, without
+    executing it
+
+        Args:
+            file_path (`str`): path of the `*_expected.py` file
+            name (`str`): name of the variable, expected_output by default
+            cache (`bool`): read and write the cached literal next to the file
+
+        Returns:
+            the literal, usually a dict
+
+        Raises:
+            AttributeError: nothing is assigned to `name` in the file
+            ValueError: the value is not a literal
+    '''
+    stat = os.stat(file_path)
+    key = (CACHE_VERSION, name, stat.st_mtime_ns, stat.st_size)
+    cache_path = _cache_path(file_path, name)
+
+    if cache:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_key, value = marshal.load(f)
+            if tuple(cached_key) == key:
+                return value
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+
+    with open(file_path, 'rb') as f:
+        tree = ast.parse(f.read(), file_path)
+    value = literal_assignment(tree, name, file_path)
+
+    if cache:
+        _write_cache(cache_path, key, value)
+    return value
+
+
+def literal_assignment(tree, name, file_path='<unknown>'):
+    '''return the literal last assigned to `name` at the top level of a
+    module tree'''
+    node = None
+    for statement in tree.body:
+        if isinstance(statement, ast.Assign):
+            targets = statement.targets
+        elif isinstance(statement, ast.AnnAssign) and statement.value:
+            targets = [statement.target]
+        else:
+            continue
+        if any(isinstance(target, ast.Name) and target.id == name
+               for target in targets):
+            node = statement.value
+
+    if node is None:
+        raise AttributeError('{} has no {}'.format(file_path, name))
+    try:
+        return ast.literal_eval(node)
+    except ValueError as e:
+        raise ValueError('{}: {} is not a literal, {}'.format(
+            file_path, name, e)) from None
+
+
+def _cache_path(file_path, name):
+    folder, filename = os.path.split(file_path)
+    stem = os.path.splitext(filename)[0]
+    if name != EXPECTED_OUTPUT:
+        stem = '{}.{}'.format(stem, name)
+    return os.path.join(folder, '__pycache__', '{}.{}.literal'.format(
+        stem, sys.implementation.cache_tag))
+
+
+def _write_cache(cache_path, key, value):
+    # the cache is best effort, the tree may be read-only
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temporary = '{}.{}'.format(cache_path, os.getpid())
+        with open(temporary, 'wb') as f:
+            marshal.dump((key, value), f)
+        os.replace(temporary, cache_path)
+    except (OSError, ValueError):
+        pass
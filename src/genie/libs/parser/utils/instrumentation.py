@@ -0,0 +1,490 @@
+'''Opt-in instrumentation of the parsers
+
+When a sweep gets slower, the time of each parser and of each of its
+regexes tells which one is responsible. Once enabled, every `parse()` makes
+a `ParserRecord` with:
+
+* the wall time of parse(), and the part of it spent validating the schema
+* the lines and bytes of the outputs parsed, given with `output=` or
+  returned by the device
+* the attempts and hits of each regex, compiled by the parser while parsing,
+  from a `Patterns` table or given to `re.match()`, `re.search()` and
+  `re.fullmatch()`
+
+The records are given to sinks, which log them, write them to a JSON lines
+file or add them up in memory:
+
+    from genie.libs.parser.utils.instrumentation import instrument, MemorySink
+
+    sink = MemorySink()
+    with instrument(sink):
+        device.parse('show interfaces')
+    print(sink.report())
+
+Nothing is patched until instrumentation is enabled, and everything is
+restored when it is disabled, so it costs nothing otherwise. The records of
+the parsers called by a super parser are made too, the time, lines and
+bytes of the super parser include theirs. The regexes compiled when their
+module is imported are not counted.
+'''
+
+# python
+import re
+import sys
+import json
+import time
+import logging
+import threading
+import contextlib
+
+# Parser utils
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.dispatcher import LineDispatcher
+from genie.libs.parser.utils.parse_hooks import (add_parse_hook,
+                                                 remove_parse_hook,
+                                                 DeviceProxy)
+
+log = logging.getLogger(__name__)
+
+# only the regexes of the modules of these packages are counted
+PARSER_PACKAGES = ('genie.libs.parser',)
+
+# functions of the re module replaced while enabled, the counting ones
+# first, the others only unwrap the counted patterns given to them
+COUNTED_FUNCTIONS = ('match', 'search', 'fullmatch')
+UNWRAPPED_FUNCTIONS = ('sub', 'subn', 'split', 'findall', 'finditer')
+
+_lock = threading.RLock()
+_local = threading.local()
+# sinks of each nested instrument(), the last ones are used
+_sinks = []
+# original functions and methods replaced while enabled
+_originals = {}
+
+
+class ParserRecord(object):
+    '''ParserRecord
+
+    Measures of one parse() call
+
+        Attributes:
+            parser (`str`): module and class of the parser
+            command (`str`): cli_command of the parser
+            context (`str`): cli, xml, yang or rest
+            seconds (`float`): wall time of parse()
+            schema_seconds (`float`): time spent validating the schema
+            lines (`int`): lines of the outputs parsed
+            bytes (`int`): bytes of the outputs parsed
+            regexes (`dict`): [attempts, hits] of each regex
+            error (`str`): name of the exception raised by parse(), if any
+    '''
+
+    __slots__ = ('parser', 'command', 'context', 'seconds', 'schema_seconds',
+                 'lines', 'bytes', 'regexes', 'error', '_schema_depth')
+
+    def __init__(self, parser, command=None, context=None):
+        self.parser = parser
+        self.command = command
+        self.context = context
+        self.seconds = 0.0
+        self.schema_seconds = 0.0
+        self.lines = 0
+        self.bytes = 0
+        self.regexes = {}
+        self.error = None
+        self._schema_depth = 0
+
+    def add_output(self, output):
+        if isinstance(output, str):
+            self.lines += len(output.splitlines())
+            self.bytes += len(output.encode(errors='replace'))
+
+    def count(self, pattern, hit):
+        counts = self.regexes.get(pattern)
+        if counts is None:
+            counts = self.regexes[pattern] = [0, 0]
+        counts[0] += 1
+        if hit:
+            counts[1] += 1
+
+    def as_dict(self):
+        return {
+            'parser': self.parser,
+            'command': self.command,
+            'context': self.context,
+            'seconds': self.seconds,
+            'schema_seconds': self.schema_seconds,
+            'lines': self.lines,
+            'bytes': self.bytes,
+            'regexes': {pattern: list(counts)
+                        for pattern, counts in self.regexes.items()},
+            'error': self.error,
+        }
+
+    def __repr__(self):
+        return '<{} {} {:.3f}ms>'.format(type(self).__name__, self.parser,
+                                         self.seconds * 1000)
+
+
+#===========================================================================
+#                            Sinks
+#===========================================================================
+class Sink(object):
+    '''Sink
+
+    Receives the record of each parse() while instrumentation is enabled
+    '''
+
+    def emit(self, record):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class LoggingSink(Sink):
+    '''Sink logging one line for each parse()
+
+        Args:
+            logger (`Logger`): logger, the one of this module by default
+            level (`int`): level of the records
+    '''
+
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or log
+        self.level = level
+
+    def emit(self, record):
+        if not self.logger.isEnabledFor(self.level):
+            return
+        attempts = sum(counts[0] for counts in record.regexes.values())
+        hits = sum(counts[1] for counts in record.regexes.values())
+        self.logger.log(
+            self.level, '%s: %.3fms, schema %.3fms, %d lines, %d bytes, '
+            '%d regexes, %d attempts, %d hits%s', record.parser,
+            record.seconds * 1000, record.schema_seconds * 1000,
+            record.lines, record.bytes, len(record.regexes), attempts, hits,
+            ', raised {}'.format(record.error) if record.error else '')
+
+
+class JsonFileSink(Sink):
+    '''Sink appending each record to a JSON lines file
+
+        Args:
+            path (`str`): path of the file
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'a')
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        line = json.dumps(record.as_dict())
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class MemorySink(Sink):
+    '''Sink adding up the records of each parser in memory
+
+        Attributes:
+            stats (`dict`): calls, errors, seconds, schema_seconds, lines,
+                bytes and [attempts, hits] of each regex, of each parser
+    '''
+
+    def __init__(self):
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        with self._lock:
+            stats = self.stats.get(record.parser)
+            if stats is None:
+                stats = self.stats[record.parser] = {
+                    'calls': 0, 'errors': 0, 'seconds': 0.0,
+                    'schema_seconds': 0.0, 'lines': 0, 'bytes': 0,
+                    'regexes': {}}
+            stats['calls'] += 1
+            stats['errors'] += record.error is not None
+            stats['seconds'] += record.seconds
+            stats['schema_seconds'] += record.schema_seconds
+            stats['lines'] += record.lines
+            stats['bytes'] += record.bytes
+            for pattern, (attempts, hits) in record.regexes.items():
+                counts = stats['regexes'].setdefault(pattern, [0, 0])
+                counts[0] += attempts
+                counts[1] += hits
+
+    def clear(self):
+        with self._lock:
+            self.stats.clear()
+
+    def report(self, top=20, regexes=5):
+        '''return the parsers taking the most time, with their most
+        attempted regexes'''
+        row = '{:<60}{:>7}{:>11}{:>11}{:>9}{:>11}'
+        lines = [row.format('parser', 'calls', 'ms', 'schema ms', 'lines',
+                            'attempts')]
+        with self._lock:
+            ranked = sorted(self.stats.items(), key=lambda s: s[1]['seconds'],
+                            reverse=True)[:top]
+            for parser, stats in ranked:
+                lines.append(row.format(
+                    parser[-59:], stats['calls'],
+                    '{:.2f}'.format(stats['seconds'] * 1000),
+                    '{:.2f}'.format(stats['schema_seconds'] * 1000),
+                    stats['lines'],
+                    sum(c[0] for c in stats['regexes'].values())))
+                for pattern, (attempts, hits) in sorted(
+                        stats['regexes'].items(), key=lambda r: r[1][0],
+                        reverse=True)[:regexes]:
+                    lines.append('    {:>8} attempts {:>7} hits  {}'.format(
+                        attempts, hits, pattern if len(pattern) < 70
+                        else pattern[:67] + '...'))
+        return '\n'.join(lines)
+
+
+#===========================================================================
+#                            Enabling
+#===========================================================================
+def enable(*sinks):
+    '''enable the instrumentation, giving the records to sinks
+
+    The sinks replace the ones of a previous enable(), until disable().
+    '''
+    with _lock:
+        if not _originals:
+            _install()
+        _sinks.append(list(sinks))
+
+
+def disable():
+    '''restore the sinks of the previous enable(), and disable the
+    instrumentation when there are none'''
+    with _lock:
+        if _sinks:
+            _sinks.pop()
+        if not _sinks and _originals:
+            _uninstall()
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+@contextlib.contextmanager
+def instrument(*sinks):
+    '''enable the instrumentation within a with block
+
+    The sinks are closed at the end of the block.
+    '''
+    enable(*sinks)
+    try:
+        yield
+    finally:
+        disable()
+        for sink in sinks:
+            sink.close()
+
+
+def _install():
+    from genie.metaparser.util.schemaengine import Schema
+
+    add_parse_hook(_parse_hook)
+    _originals[Schema, 'validate'] = Schema.__dict__['validate']
+    Schema.validate = _instrumented_validate(Schema.__dict__['validate'])
+
+    for name in COUNTED_FUNCTIONS:
+        _originals[re, name] = getattr(re, name)
+        setattr(re, name, _counted_function(getattr(re, name)))
+    for name in UNWRAPPED_FUNCTIONS:
+        _originals[re, name] = getattr(re, name)
+        setattr(re, name, _unwrapping_function(getattr(re, name)))
+    _originals[re, 'compile'] = re.compile
+    re.compile = _compile
+
+    # compiled again, and counted, the next time they are used
+    Patterns.clear_all()
+    LineDispatcher.reset_all()
+
+
+def _uninstall():
+    remove_parse_hook(_parse_hook)
+    for (owner, name), original in _originals.items():
+        setattr(owner, name, original)
+    _originals.clear()
+
+    # drops the counted patterns
+    Patterns.clear_all()
+    LineDispatcher.reset_all()
+
+
+def _current():
+    '''the record of the innermost parse() of this thread'''
+    stack = getattr(_local, 'stack', None)
+    return stack[-1] if stack else None
+
+
+def _emit(record):
+    sinks = _sinks[-1] if _sinks else ()
+    for sink in sinks:
+        try:
+            sink.emit(record)
+        except Exception:
+            log.exception('Instrumentation sink %r failed', sink)
+
+
+#===========================================================================
+#                            Hooks
+#===========================================================================
+def _parse_hook(parser, parse, kwargs):
+    cls = type(parser)
+    context = getattr(parser, 'context', None)
+    record = ParserRecord('{}.{}'.format(cls.__module__, cls.__name__),
+                          getattr(parser, 'cli_command', None),
+                          context if isinstance(context, str) else None)
+    record.add_output(kwargs.get('output'))
+
+    device = getattr(parser, 'device', None)
+    if device is not None:
+        parser.device = _CountingDevice(device, record)
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+    stack.append(record)
+    start = time.perf_counter()
+    try:
+        return parse(**kwargs)
+    except Exception as e:
+        record.error = type(e).__name__
+        raise
+    finally:
+        record.seconds = time.perf_counter() - start
+        stack.pop()
+        if device is not None:
+            parser.device = device
+        _emit(record)
+
+
+def _instrumented_validate(validate):
+
+    def instrumented_validate(self, *args, **kwargs):
+        record = _current()
+        # nested schemas are timed by the outermost validate()
+        if record is None or record._schema_depth:
+            return validate(self, *args, **kwargs)
+        record._schema_depth += 1
+        start = time.perf_counter()
+        try:
+            return validate(self, *args, **kwargs)
+        finally:
+            record.schema_seconds += time.perf_counter() - start
+            record._schema_depth -= 1
+
+    instrumented_validate.__wrapped__ = validate
+    instrumented_validate.__doc__ = validate.__doc__
+    return instrumented_validate
+
+
+class _CountingDevice(DeviceProxy):
+    '''device of a parser, counting the outputs it returns'''
+
+    def __init__(self, device, record):
+        super().__init__(device)
+        object.__setattr__(self, '_record', record)
+
+    def execute(self, *args, **kwargs):
+        output = self._device.execute(*args, **kwargs)
+        self._record.add_output(output)
+        return output
+
+
+class _CountedPattern(object):
+    '''compiled pattern counting its attempts and hits in the record of
+    the parser using it'''
+
+    __slots__ = ('_pattern',)
+
+    def __init__(self, pattern):
+        self._pattern = pattern
+
+    def match(self, *args, **kwargs):
+        m = self._pattern.match(*args, **kwargs)
+        _count(self._pattern.pattern, m)
+        return m
+
+    def search(self, *args, **kwargs):
+        m = self._pattern.search(*args, **kwargs)
+        _count(self._pattern.pattern, m)
+        return m
+
+    def fullmatch(self, *args, **kwargs):
+        m = self._pattern.fullmatch(*args, **kwargs)
+        _count(self._pattern.pattern, m)
+        return m
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def __eq__(self, other):
+        return self._pattern == _unwrap(other)
+
+    def __hash__(self):
+        return hash(self._pattern)
+
+    def __repr__(self):
+        return repr(self._pattern)
+
+
+def _count(pattern, m):
+    record = _current()
+    if record is not None:
+        record.count(pattern if isinstance(pattern, str)
+                     else repr(pattern), m is not None)
+
+
+def _unwrap(pattern):
+    if isinstance(pattern, _CountedPattern):
+        return pattern._pattern
+    return pattern
+
+
+def _from_parser(frame):
+    return frame.f_globals.get('__name__', '').startswith(PARSER_PACKAGES)
+
+
+def _compile(pattern, flags=0):
+    compiled = _originals[re, 'compile'](_unwrap(pattern), flags)
+    if _current() is not None and _from_parser(sys._getframe(1)):
+        return _CountedPattern(compiled)
+    return compiled
+
+
+def _counted_function(function):
+
+    def counted(pattern, string, flags=0):
+        pattern = _unwrap(pattern)
+        m = function(pattern, string, flags)
+        if _current() is not None and _from_parser(sys._getframe(1)):
+            _count(getattr(pattern, 'pattern', pattern), m)
+        return m
+
+    counted.__wrapped__ = function
+    counted.__doc__ = function.__doc__
+    return counted
+
+
+def _unwrapping_function(function):
+
+    def unwrapping(pattern, *args, **kwargs):
+        return function(_unwrap(pattern), *args, **kwargs)
+
+    unwrapping.__wrapped__ = function
+    unwrapping.__doc__ = function.__doc__
+    return unwrapping
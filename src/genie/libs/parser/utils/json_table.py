@@ -0,0 +1,262 @@
+'''Mapping of the NX-OS json outputs onto the schemas of the parsers
+
+NX-OS gives almost every show command as json with `| json`, with the
+tables of its `| xml` output: each `TABLE_<name>` holds `ROW_<name>` rows, a
+dict for a single row and a list otherwise. Instead of matching each line
+with regexes, a parser describes how the tables map onto its schema:
+
+    json_command = 'show vrf | json'
+    json_table = Table('vrf', key='vrf_name', into='vrfs', fields={
+        'vrf_id': Field('vrf_id', int),
+        'vrf_state': 'vrf_state',
+        'reason': 'vrf_reason'})
+
+    def json(self, output=None):
+        if output is None:
+            output = self.device.execute(self.json_command)
+        return self.json_table.apply(loads(output))
+
+and cli() decodes the json output with json() when it is given one:
+
+    def cli(self, vrf='', output=None):
+        if output is not None and is_json(output):
+            return self.json(vrf=vrf, output=output)
+        ...
+
+    ShowVrf(device=device).parse(output=device.execute('show vrf | json'))
+
+The output is decoded in one pass, the schema is the same as with cli().
+'''
+
+# python
+import re
+import json
+
+# value of a field to leave out
+_MISSING = object()
+
+
+def loads(output):
+    '''decode the json output of a command
+
+        Args:
+            output (`str`): output of the command, the command echoed before
+                it and the prompt after it are dropped
+
+        Returns:
+            the decoded output, {} for an empty output
+
+        Raises:
+            ValueError: the output is not json, such as an error of the
+                command
+    '''
+    # Remove junk characters returned by the device
+    output = output.replace(']]>]]>', '').strip()
+    if not output:
+        return {}
+    start = output.find('{')
+    end = output.rfind('}')
+    if start < 0 or end < start:
+        raise ValueError('output is not json: {!r}'.format(output[:80]))
+    return json.loads(output[start:end + 1])
+
+
+def is_json(output):
+    '''whether output is the output of a command with `| json`, rather than
+    the text the cli() of the parser reads
+
+        Args:
+            output (`str`): output of the command, the command echoed before
+                it is allowed
+
+        Returns:
+            bool
+    '''
+    if not isinstance(output, str):
+        return False
+    output = output.replace(']]>]]>', '').lstrip()
+    if output.startswith('{'):
+        return True
+    line, _, rest = output.partition('\n')
+    return line.rstrip().endswith('json') and rest.lstrip().startswith('{')
+
+
+def rows(data, name):
+    '''rows of the TABLE_<name> of data
+
+        Args:
+            data (`dict`): decoded output, or a row holding the table
+            name (`str`): name of the table, without TABLE_
+
+        Returns:
+            list of the rows, whether the table has one row or more
+    '''
+    if not isinstance(data, dict):
+        return []
+    tables = data.get('TABLE_' + name)
+    if tables is None:
+        return []
+    # some commands give a list of tables of a single row
+    if not isinstance(tables, list):
+        tables = [tables]
+
+    ret_list = []
+    for table in tables:
+        row = table.get('ROW_' + name) if isinstance(table, dict) else None
+        if isinstance(row, list):
+            ret_list.extend(row)
+        elif row is not None:
+            ret_list.append(row)
+    return ret_list
+
+
+def boolean(value):
+    '''convert the 'true' and 'false' of a field to a bool'''
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('true', 'yes', 'enabled')
+
+
+def uptime(value):
+    '''convert a duration "P1DT2H3M4S" to the uptime of the cli, as
+    "1w2d", "1d02h" or "01:02:03"'''
+    m = re.match(r'^P(?:(?P<week>\d+)W)?(?:(?P<day>\d+)D)?'
+                 r'(?:T(?:(?P<hour>\d+)H)?(?:(?P<minute>\d+)M)?'
+                 r'(?:(?P<second>\d+)S)?)?$', str(value))
+    if not m:
+        # as is, such as never or a duration in months
+        return value
+    group = {k: int(v or 0) for k, v in m.groupdict().items()}
+    days = group['week'] * 7 + group['day']
+    if days >= 7:
+        return '{}w{}d'.format(days // 7, days % 7)
+    if days:
+        return '{}d{:02d}h'.format(days, group['hour'])
+    return '{hour:02d}:{minute:02d}:{second:02d}'.format(**group)
+
+
+class Field(object):
+    '''Field
+
+    Field of the rows of a table, mapped onto a key of the schema
+
+        Args:
+            name (`str`): name of the field, or a callable returning the value
+                from the row
+            convert (`callable`): converts the value, kept as is by default
+            skip (`tuple`): converted values for which the key is not set
+            default: value of the rows without the field, the key is not set
+                for them by default
+    '''
+
+    def __init__(self, name, convert=None, skip=(), default=None):
+        self.name = name
+        self.convert = convert
+        self.skip = skip
+        self.default = default
+
+    def get(self, row):
+        '''value of the field in row, _MISSING when the key is not set'''
+        if callable(self.name):
+            value = self.name(row)
+        else:
+            value = row.get(self.name)
+        if value is None:
+            value = self.default
+        if value is None:
+            return _MISSING
+        if self.convert is not None:
+            value = self.convert(value)
+        if value is None or value in self.skip:
+            return _MISSING
+        return value
+
+
+class Table(object):
+    '''Table
+
+    Mapping of the rows of a TABLE_<name> onto a dict of the schema
+
+        Args:
+            name (`str`): name of the table, without TABLE_. None maps the
+                fields of the data itself, as the top of an output
+            key (`str`): field whose value is the key of the dict of each row,
+                or a `Field`. Without it, every row is mapped onto the same
+                dict
+            into (`str`): dotted keys of the dict holding the rows, within
+                the dict of the parent row
+            fields (`dict`): field of each key of the dict of a row, a name or
+                a `Field`. The dotted keys are set in nested dicts
+            tables (`list`): tables within each row, mapped onto its dict
+            post (`callable`): called with each row and its dict, to set what
+                the fields cannot describe
+
+        Example:
+
+            Table('vrf', key='vrf-name-out', into='vrf', tables=[
+                Table('neighbor', key='neighbor-id', into='neighbor',
+                      fields={'remote_as': Field('remoteas', int)})])
+    '''
+
+    def __init__(self, name, key=None, into=None, fields=None, tables=(),
+                 post=None):
+        self.name = name
+        self.key = _field(key) if key is not None else None
+        self.into = _path(into)
+        self.fields = [(_path(path), _field(field))
+                       for path, field in (fields or {}).items()]
+        self.tables = list(tables)
+        self.post = post
+
+    def apply(self, data, ret_dict=None):
+        '''map the rows of the table in data
+
+            Args:
+                data (`dict`): decoded output, or the row holding the table
+                ret_dict (`dict`): dict the rows are mapped onto, a new one
+                    by default
+
+            Returns:
+                ret_dict
+        '''
+        if ret_dict is None:
+            ret_dict = {}
+        table_rows = [data] if self.name is None else rows(data, self.name)
+
+        for row in table_rows:
+            if self.key is not None:
+                key = self.key.get(row)
+                if key is _MISSING:
+                    continue
+            entry = ret_dict
+            for k in self.into:
+                entry = entry.setdefault(k, {})
+            if self.key is not None:
+                entry = entry.setdefault(key, {})
+
+            for path, field in self.fields:
+                value = field.get(row)
+                if value is _MISSING:
+                    continue
+                sub_dict = entry
+                for k in path[:-1]:
+                    sub_dict = sub_dict.setdefault(k, {})
+                sub_dict[path[-1]] = value
+
+            for table in self.tables:
+                table.apply(row, entry)
+            if self.post is not None:
+                self.post(row, entry)
+        return ret_dict
+
+
+def _field(field):
+    return field if isinstance(field, Field) else Field(field)
+
+
+def _path(path):
+    if not path:
+        return ()
+    if isinstance(path, str):
+        return tuple(path.split('.'))
+    return tuple(path)
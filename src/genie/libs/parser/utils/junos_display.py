@@ -0,0 +1,417 @@
+'''Junos structured outputs decoded onto the schemas of the parsers
+
+Junos gives every show command as the XML of its RPC reply with
+`| display xml`, or as json with `| display json`. The schemas of the Junos
+parsers follow that reply: the tags are the keys, the attributes are the
+`@` keys and the text of an element with attributes is `#text`, as
+xmltodict gives them:
+
+    'route-information': {
+        'route-table': ListOf({
+            'table-name': str,
+            'rt': ListOf({
+                'rt-destination': str,
+                'rt-entry': {'age': {'#text': str,
+                                     Optional('@junos:seconds'): str},
+                ...
+
+So the structured output is decoded onto the schema itself, instead of
+matching each line of the text output with regexes. The schema tells
+whether an element is a dict, a list of them or a value, and the elements
+and attributes it does not have are left out. The XML is read as a stream:
+each element is dropped once mapped, the whole tree is never built.
+
+A parser gets the `xml` context and json() with `DisplayMixin`, its cli()
+decodes the output of `| display json` with json() when it is given one:
+
+    class ShowRoute(DisplayMixin, ShowRouteSchema):
+
+        def cli(self, protocol=None, ip_address=None, table=None,
+                output=None):
+            if output and is_json(output):
+                return self.json(output=output)
+            ...
+
+    ShowRoute(device=device, context='xml').parse(protocol='bgp')
+    ShowRoute(device=device).parse(
+        output=device.execute('show route protocol bgp | display json'))
+'''
+
+# python
+import re
+import json
+from xml.etree import ElementTree as ET
+
+# Metaparser
+from genie.metaparser.util.schemaengine import (Schema, Any, Optional,
+                                                ListOf, Or)
+
+# size of the pieces of XML given to the parser
+CHUNK_SIZE = 64 * 1024
+
+_MISSING = object()
+
+
+def select_command(commands, **kwargs):
+    '''command of commands taking exactly the arguments given
+
+        Args:
+            commands (`list`): commands of the parser, as cli_command
+            **kwargs: arguments of the command, those which are None or
+                empty are not given
+
+        Returns:
+            the command formatted with the arguments
+    '''
+    if isinstance(commands, str):
+        commands = [commands]
+    kwargs = {key: value for key, value in kwargs.items() if value}
+    for command in commands:
+        if set(re.findall(r'\{(\w+)\}', command)) == set(kwargs):
+            return command.format(**kwargs)
+    raise ValueError('No command of {} takes the arguments {}'.format(
+        commands, sorted(kwargs)))
+
+
+def from_xml(output, schema):
+    '''decode the output of `| display xml` onto schema
+
+        Args:
+            output (`str`): output of the command
+            schema (`dict`): schema of the parser
+
+        Returns:
+            dict of the output, {} for an empty output
+    '''
+    start = output.find('<')
+    # the '>' of the prompt after the reply is not part of it
+    close = output.rfind('</')
+    end = output.find('>', close) if close >= 0 else output.rfind('/>') + 1
+    if start < 0 or end < start:
+        return {}
+
+    parser = ET.XMLPullParser(events=('start', 'end', 'start-ns'))
+    builder = _XmlBuilder(schema)
+    for index in range(start, end + 1, CHUNK_SIZE):
+        parser.feed(output[index:min(index + CHUNK_SIZE, end + 1)])
+        builder.consume(parser.read_events())
+    parser.close()
+    builder.consume(parser.read_events())
+    return builder.ret_dict
+
+
+def from_json(output, schema):
+    '''decode the output of `| display json` onto schema
+
+        Args:
+            output (`str`): output of the command
+            schema (`dict`): schema of the parser
+
+        Returns:
+            dict of the output, {} for an empty output
+    '''
+    start = output.find('{')
+    end = output.rfind('}')
+    if start < 0 or end < start:
+        return {}
+    data = json.loads(output[start:end + 1])
+    # {"rpc-reply": {...}} with some releases
+    if 'rpc-reply' in data and _child_schema(schema, 'rpc-reply') is _MISSING:
+        data = data['rpc-reply']
+        if isinstance(data, list):
+            data = data[0]
+    return _json_dict(data, schema)
+
+
+class DisplayMixin(object):
+    '''DisplayMixin
+
+    xml() and json() of a Junos parser whose schema follows the RPC reply,
+    executing the command of cli_command taking the arguments given
+    '''
+
+    def xml(self, output=None, **kwargs):
+        if output is None:
+            output = self.device.execute(
+                select_command(self.cli_command, **kwargs) + ' | display xml')
+        return from_xml(output, self.schema)
+
+    def json(self, output=None, **kwargs):
+        if output is None:
+            output = self.device.execute(
+                select_command(self.cli_command, **kwargs) + ' | display json')
+        return from_json(output, self.schema)
+
+
+# ---------------------------------------------------------------------------
+# schema
+# ---------------------------------------------------------------------------
+
+# keys of each dict of a schema: ({name: schema}, schema of Any())
+_keys_cache = {}
+
+
+def _keys(schema):
+    entry = _keys_cache.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        names = {}
+        any_schema = _MISSING
+        for key, value in schema.items():
+            if isinstance(key, Any):
+                any_schema = value
+            elif isinstance(key, Optional):
+                names[key.schema] = value
+            else:
+                names[key] = value
+        # the schema is kept, so that its id is not reused
+        entry = _keys_cache[id(schema)] = (schema, names, any_schema)
+    return entry[1], entry[2]
+
+
+def _child_schema(schema, name):
+    if not isinstance(schema, dict):
+        return _MISSING
+    names, any_schema = _keys(schema)
+    return names.get(name, any_schema)
+
+
+def _alternatives(schema):
+    return schema.schemas
+
+
+def _unwrap(schema):
+    # Schema({...}), as the schemas shared by several keys
+    while type(schema) is Schema:
+        schema = schema.schema
+    return schema
+
+
+def _is_list(schema):
+    return isinstance(schema, (ListOf, list)) or schema is list
+
+
+def _shape(schema):
+    '''how the elements of schema are kept:
+
+        ('list', schema of an item): always a list
+        ('one_or_list', schema of an item): one item, a list of several
+        ('one', schema): one item
+    '''
+    schema = _unwrap(schema)
+    if isinstance(schema, ListOf):
+        return 'list', _unwrap(schema.schema)
+    if isinstance(schema, list):
+        return 'list', _unwrap(schema[0]) if schema else str
+    if schema is list:
+        return 'list', str
+    if isinstance(schema, Or):
+        single = many = _MISSING
+        for alternative in _alternatives(schema):
+            if _is_list(alternative):
+                many = _shape(alternative)[1]
+            elif single is _MISSING:
+                single = _unwrap(alternative)
+        if many is not _MISSING:
+            return 'one_or_list', single if single is not _MISSING else many
+    return 'one', schema
+
+
+def _is_dict(schema):
+    if isinstance(schema, dict):
+        return True
+    if isinstance(schema, Or):
+        return any(isinstance(_unwrap(a), dict)
+                   for a in _alternatives(schema))
+    return False
+
+
+def _dict_schema(schema):
+    if isinstance(schema, Or):
+        return next(_unwrap(a) for a in _alternatives(schema)
+                    if isinstance(_unwrap(a), dict))
+    return schema
+
+
+def _leaf(schema, text):
+    '''value of an element without children'''
+    if schema is bool:
+        # <ifff-user-mtu/>
+        return True
+    if isinstance(schema, Or) and None in _alternatives(schema) and not text:
+        return None
+    if schema is int:
+        return int(text)
+    return text or ''
+
+
+def _add(ret_dict, name, value, shape):
+    if shape == 'list':
+        ret_dict.setdefault(name, []).append(value)
+    elif shape == 'one_or_list' and name in ret_dict:
+        previous = ret_dict[name]
+        if isinstance(previous, list):
+            previous.append(value)
+        else:
+            ret_dict[name] = [previous, value]
+    else:
+        ret_dict[name] = value
+
+
+# ---------------------------------------------------------------------------
+# xml
+# ---------------------------------------------------------------------------
+
+class _Frame(object):
+    __slots__ = ('name', 'schema', 'shape', 'value')
+
+    def __init__(self, name, schema, shape, value):
+        self.name = name
+        self.schema = schema
+        self.shape = shape
+        self.value = value
+
+
+class _XmlBuilder(object):
+    '''builds the dict of the schema from the events of a pull parser,
+    dropping each element once mapped'''
+
+    def __init__(self, schema):
+        self.schema = schema
+        self.ret_dict = {}
+        self.prefixes = {}
+        # namespaces declared by the next element
+        self.namespaces = []
+        # frame of each open element, None for the elements left out
+        self.stack = []
+        self.elements = []
+
+    def consume(self, events):
+        for event, item in events:
+            if event == 'start':
+                self.start(item)
+            elif event == 'end':
+                self.end(item)
+            else:
+                prefix, uri = item
+                self.prefixes[uri] = prefix
+                self.namespaces.append(item)
+
+    def start(self, element):
+        name = self.local(element.tag)
+        namespaces, self.namespaces = self.namespaces, []
+        if not self.stack:
+            # <rpc-reply> holds the keys of the schema, unless the output
+            # starts with one of them
+            root = _Frame(None, self.schema, 'one', self.ret_dict)
+            if _child_schema(self.schema, name) is _MISSING:
+                self.stack.append(root)
+                self.elements.append(element)
+                return
+            self.stack.append(root)
+            self.elements.append(None)
+
+        parent = self.stack[-1]
+        schema = _MISSING if parent is None else \
+            _child_schema(parent.schema, name)
+        self.elements.append(element)
+        if schema is _MISSING:
+            self.stack.append(None)
+            return
+
+        shape, schema = _shape(schema)
+        value = None
+        if _is_dict(schema):
+            schema = _dict_schema(schema)
+            value = self.attributes(element, schema, namespaces)
+        self.stack.append(_Frame(name, schema, shape, value))
+
+    def end(self, element):
+        frame = self.stack.pop()
+        self.elements.pop()
+        if frame is not None and frame.name is not None:
+            text = (element.text or '').strip()
+            if frame.value is None:
+                value = _leaf(frame.schema, text)
+            else:
+                value = frame.value
+                if text and '#text' in _keys(frame.schema)[0]:
+                    value['#text'] = text
+            _add(self.stack[-1].value, frame.name, value, frame.shape)
+
+        # drop the element, its parent only holds the one being read
+        element.clear()
+        if self.elements and self.elements[-1] is not None:
+            parent = self.elements[-1]
+            if len(parent) and parent[-1] is element:
+                del parent[-1]
+
+    def attributes(self, element, schema, namespaces):
+        ret_dict = {}
+        if not element.attrib and not namespaces:
+            return ret_dict
+        names = _keys(schema)[0]
+        # xmlns="..." and xmlns:junos="..." as xmltodict gives them
+        for prefix, uri in namespaces:
+            name = '@xmlns:' + prefix if prefix else '@xmlns'
+            if name in names:
+                ret_dict[name] = uri
+        for key, value in element.attrib.items():
+            name = '@' + self.local(key, attribute=True)
+            if name in names:
+                ret_dict[name] = value
+        return ret_dict
+
+    def local(self, tag, attribute=False):
+        if tag[0] != '{':
+            return tag
+        uri, _, name = tag[1:].partition('}')
+        if attribute:
+            prefix = self.prefixes.get(uri)
+            if prefix:
+                return '{}:{}'.format(prefix, name)
+        return name
+
+
+# ---------------------------------------------------------------------------
+# json
+# ---------------------------------------------------------------------------
+
+def _json_dict(data, schema):
+    ret_dict = {}
+    for key, value in (data.get('attributes') or {}).items():
+        name = '@' + key
+        if _child_schema(schema, name) is not _MISSING:
+            ret_dict[name] = value
+
+    for name, items in data.items():
+        if name == 'attributes':
+            continue
+        child = _child_schema(schema, name)
+        if child is _MISSING:
+            continue
+        shape, child = _shape(child)
+        if not isinstance(items, list):
+            items = [items]
+        for item in items:
+            _add(ret_dict, name, _json_value(item, child), shape)
+
+    if 'data' in data and '#text' in _keys(schema)[0]:
+        text = _json_text(data['data'])
+        if text:
+            ret_dict['#text'] = text
+    return ret_dict
+
+
+def _json_value(item, schema):
+    if _is_dict(schema):
+        return _json_dict(item if isinstance(item, dict) else {},
+                          _dict_schema(schema))
+    text = _json_text(item.get('data')) if isinstance(item, dict) else item
+    return _leaf(schema, text)
+
+
+def _json_text(data):
+    # "data": [null] for an element without text
+    if isinstance(data, list):
+        data = data[0] if data else None
+    return '' if data is None else str(data).strip()
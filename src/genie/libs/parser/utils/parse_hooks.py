@@ -0,0 +1,123 @@
+'''Hooks around the parse() of every parser
+
+The utilities measuring or caching the parsers, such as the instrumentation
+and the execute cache, need to run around `MetaParser.parse()`. Instead of
+each of them replacing it, they add a hook, and `MetaParser.parse()` is only
+replaced while there is at least one hook:
+
+    def hook(parser, parse, kwargs):
+        # before parse()
+        result = parse(**kwargs)
+        # after parse()
+        return result
+
+    add_parse_hook(hook)
+    ...
+    remove_parse_hook(hook)
+
+The hooks are chained in the order they were added, the first one calling
+the second one through `parse`, and the last one calling the original
+`MetaParser.parse()`. They can be added and removed in any order.
+'''
+
+# python
+import threading
+
+_lock = threading.Lock()
+# hooks, in the order they are called
+_hooks = ()
+# original MetaParser.parse while it is replaced
+_original = None
+
+
+def add_parse_hook(hook):
+    '''add a hook called around every parse()
+
+        Args:
+            hook (`callable`): called with the parser, the parse function to
+                call and the arguments of parse(), returns the parsed output
+    '''
+    global _hooks
+    with _lock:
+        if not _hooks:
+            _install()
+        _hooks = _hooks + (hook,)
+
+
+def remove_parse_hook(hook):
+    '''remove a hook, MetaParser.parse is restored after the last one'''
+    global _hooks
+    with _lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = tuple(hooks)
+        if not _hooks:
+            _uninstall()
+
+
+def _install():
+    global _original
+    from genie.metaparser import MetaParser
+    _original = MetaParser.__dict__['parse']
+    MetaParser.parse = _hooked_parse
+    _hooked_parse.__wrapped__ = _original
+    _hooked_parse.__doc__ = _original.__doc__
+
+
+def _uninstall():
+    global _original
+    from genie.metaparser import MetaParser
+    MetaParser.parse = _original
+    _original = None
+
+
+def _hooked_parse(self, **kwargs):
+    # the hooks and the original of this call, even when they change
+    hooks, original = _hooks, _original
+
+    def call(index, kwargs):
+        if index == len(hooks):
+            return original(self, **kwargs)
+        return hooks[index](self, lambda **kw: call(index + 1, kw), kwargs)
+
+    return call(0, kwargs)
+
+
+class DeviceProxy(object):
+    '''DeviceProxy
+
+    Device given to a parser while a hook runs, forwarding everything to the
+    device. Subclasses override execute().
+
+        Args:
+            device (`Device`): device of the parser
+    '''
+
+    def __init__(self, device):
+        object.__setattr__(self, '_device', device)
+
+    def execute(self, *args, **kwargs):
+        return self._device.execute(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._device, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._device, name, value)
+
+    def __repr__(self):
+        return repr(self._device)
+
+
+class PendingOutput(str):
+    '''output returned in place of the one of a command not executed yet,
+    the parsers running with it are run again, the hooks do not keep what
+    they got from it'''
+
+
+def unwrap_device(device):
+    '''return the device behind the proxies of the hooks'''
+    while isinstance(device, DeviceProxy):
+        device = device._device
+    return device
+
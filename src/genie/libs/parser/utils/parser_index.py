@@ -0,0 +1,319 @@
+'''Binary index of parsers.json
+
+`parsers.json` is loaded by every process using `get_parser`, decoding it
+with the json module is most of the cold start cost. The parser index holds
+the same data in marshal format, which is much faster to load.
+
+The index starts with a header which is checked before the data is loaded.
+The index is only used when it was built for the same package version,
+python version, token order and parsers.json content, otherwise
+`load_parser_index` returns None and parsers.json is used instead.
+
+After the header the data is stored in sections, each marshalled on its own
+and found with the offset table of the header: the whole data, the parsers
+which are not under an OS, the order of the commands, and the parsers of
+each OS. `open_parser_index` gives access to the sections, so lazy loading
+only decodes the parsers of the OS it loads.
+
+Build the index after `make json` with:
+
+    python -m genie.libs.parser.utils.parser_index
+'''
+
+# python
+import os
+import sys
+import json
+import marshal
+import hashlib
+import logging
+import argparse
+import importlib
+
+log = logging.getLogger(__name__)
+
+PARSER_MODULE_NAME = 'genie.libs.parser'
+INDEX_FORMAT = 2
+INDEX_NAME = 'parsers.idx'
+
+# sections of the index which are not an OS
+SECTION_ALL = '__all__'
+SECTION_COMMON = '__common__'
+SECTION_ORDER = '__order__'
+
+
+def _python_version():
+    return '{}.{}'.format(*sys.version_info[:2])
+
+
+def _package_version():
+    return importlib.import_module(PARSER_MODULE_NAME).__version__
+
+
+def _file_hash(path):
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _source_info(path, with_hash=True):
+    stat = os.stat(path)
+    info = {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+    if with_hash:
+        info['sha1'] = _file_hash(path)
+    return info
+
+
+def get_index_path(json_path):
+    '''return the location of the index for the given parsers.json'''
+    return os.path.join(os.path.dirname(os.path.abspath(json_path)),
+                        INDEX_NAME)
+
+
+def make_parser_index(json_path, index_path=None, token_order=None):
+    '''make_parser_index
+
+    Build the binary index of a parsers.json file
+
+        Args:
+            json_path (`str`): location of parsers.json
+            index_path (`str`): location of the index, defaults to
+                                parsers.idx next to parsers.json
+            token_order (`list`): abstract token order of the package,
+                                  defaults to the one in parsers.json
+
+        Returns:
+            str: location of the index
+    '''
+    index_path = index_path or get_index_path(json_path)
+
+    with open(json_path) as f:
+        json_data = json.load(f)
+
+    if token_order is None:
+        token_order = json_data.get('token_order')
+
+    # offset of each section from the end of the header
+    blobs = []
+    sections = {}
+    offset = 0
+    for name, data in _split_parser_json(json_data).items():
+        blob = marshal.dumps(data)
+        sections[name] = (offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = {
+        'format': INDEX_FORMAT,
+        'version': _package_version(),
+        'python': _python_version(),
+        'marshal': marshal.version,
+        'token_order': list(token_order or []),
+        'source': _source_info(json_path),
+        'sections': sections,
+    }
+
+    # write to a temporary file first, a worker could be reading the index
+    tmp_path = '{}.{}.tmp'.format(index_path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        marshal.dump(header, f)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, index_path)
+
+    log.debug(f'Parser index written to {index_path}')
+    return index_path
+
+
+def _split_parser_json(json_data):
+    '''return the sections of the index for the content of parsers.json'''
+    common = {}
+    operating_systems = {}
+    for command, value in json_data.items():
+        if not isinstance(value, dict) or 'folders' not in value:
+            common[command] = value
+            continue
+
+        for name, folder in value['folders'].items():
+            operating_system = folder.get('tokens', {}).get('os')
+            if operating_system is None:
+                section = common
+            else:
+                section = operating_systems.setdefault(operating_system, {})
+            if command not in section:
+                section[command] = dict(value, folders={})
+            section[command]['folders'][name] = folder
+
+    sections = {
+        SECTION_ALL: json_data,
+        SECTION_COMMON: common,
+        SECTION_ORDER: list(json_data),
+    }
+    sections.update(operating_systems)
+    return sections
+
+
+class ParserIndex(object):
+    '''ParserIndex
+
+    Sections of a valid parser index, each one is only read and decoded when
+    asked for
+
+        Args:
+            index_path (`str`): location of the index
+            header (`dict`): header of the index, already checked
+    '''
+
+    def __init__(self, index_path, header):
+        self.index_path = index_path
+        self.header = header
+
+    @property
+    def operating_systems(self):
+        '''the OS which have parsers in the index'''
+        return {name for name in self.header['sections']
+                if name not in (SECTION_ALL, SECTION_COMMON, SECTION_ORDER)}
+
+    def read(self, name):
+        '''read
+
+        Load a section of the index
+
+            Args:
+                name (`str`): an OS, or SECTION_ALL, SECTION_COMMON or
+                              SECTION_ORDER
+
+            Returns:
+                the data of the section, an OS without parsers is empty
+                None: the index was replaced since it was opened
+        '''
+        if name not in self.header['sections']:
+            return {}
+        offset, size = self.header['sections'][name]
+
+        try:
+            with open(self.index_path, 'rb') as f:
+                if marshal.load(f) != self.header:
+                    log.debug(f'Parser index {self.index_path} was replaced')
+                    return None
+                f.seek(offset, os.SEEK_CUR)
+                # loads from bytes is much faster than load from the file
+                return marshal.loads(f.read(size))
+        except Exception as e:
+            log.debug(f'Could not load parser index {self.index_path}: {e}')
+            return None
+
+
+def open_parser_index(json_path, token_order, index_path=None):
+    '''open_parser_index
+
+    Check the header of the index of a parsers.json file
+
+        Args:
+            json_path (`str`): location of parsers.json
+            token_order (`list`): abstract token order of the package
+            index_path (`str`): location of the index, defaults to
+                                parsers.idx next to parsers.json
+
+        Returns:
+            ParserIndex: to read the sections of the index
+            None: there is no index, or it is stale
+    '''
+    index_path = index_path or get_index_path(json_path)
+
+    try:
+        with open(index_path, 'rb') as f:
+            header = marshal.load(f)
+        if not _is_valid(header, json_path, token_order):
+            return None
+        return ParserIndex(index_path, header)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.debug(f'Could not load parser index {index_path}: {e}')
+        return None
+
+
+def load_parser_index(json_path, token_order, index_path=None):
+    '''load_parser_index
+
+    Load the parser data from the index of a parsers.json file
+
+        Args:
+            json_path (`str`): location of parsers.json
+            token_order (`list`): abstract token order of the package
+            index_path (`str`): location of the index, defaults to
+                                parsers.idx next to parsers.json
+
+        Returns:
+            dict: same content as parsers.json
+            None: there is no index, or it is stale
+    '''
+    index = open_parser_index(json_path, token_order, index_path)
+    if index is None:
+        return None
+    return index.read(SECTION_ALL)
+
+
+def _is_valid(header, json_path, token_order):
+    '''check the index header against the current environment'''
+    if not isinstance(header, dict):
+        return False
+
+    expected = {
+        'format': INDEX_FORMAT,
+        'version': _package_version(),
+        'python': _python_version(),
+        'marshal': marshal.version,
+        'token_order': list(token_order),
+    }
+    for key, value in expected.items():
+        if header.get(key) != value:
+            log.debug(f'Parser index is stale, {key}: '
+                      f'{header.get(key)} != {value}')
+            return False
+
+    # size and mtime are enough when the files were not copied, else fall
+    # back to the content hash which is still cheaper than decoding json
+    source = header.get('source', {})
+    current = _source_info(json_path, with_hash=False)
+    if current['size'] != source.get('size'):
+        log.debug('Parser index is stale, parsers.json size changed')
+        return False
+    if current['mtime'] != source.get('mtime') and \
+            _file_hash(json_path) != source.get('sha1'):
+        log.debug('Parser index is stale, parsers.json content changed')
+        return False
+
+    return True
+
+
+def main():
+    my_parser = argparse.ArgumentParser(
+        description='Build the binary index of parsers.json')
+    my_parser.add_argument('--json',
+                           type=str,
+                           help='parsers.json to index, defaults to the one '
+                                'of {}'.format(PARSER_MODULE_NAME),
+                           default=None)
+    my_parser.add_argument('--output',
+                           type=str,
+                           help='Location of the index, defaults to {} next '
+                                'to parsers.json'.format(INDEX_NAME),
+                           default=None)
+    args = my_parser.parse_args()
+
+    from genie.abstract.package import DEFAULT_ABSTRACT_ORDER
+
+    mod = importlib.import_module(PARSER_MODULE_NAME)
+    token_order = getattr(getattr(mod, '__abstract_pkg'), 'order',
+                          DEFAULT_ABSTRACT_ORDER)
+    json_path = args.json or os.path.join(mod.__path__[0], 'parsers.json')
+
+    print(make_parser_index(json_path, args.output, token_order))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+'''Class level regex tables for parsers
+
+Most parsers compile their regexes at the start of `cli()`, which is done
+again on every call. The `re` module only caches 512 patterns, a process
+using a few large parser modules goes over it and the patterns are compiled
+again and again.
+
+A `Patterns` table is declared once in the class of the parser and compiles
+each pattern the first time it is used. The compiled pattern is kept by the
+table, so it is shared by every instance of the parser:
+
+    class ShowVersion(ShowVersionSchema):
+
+        cli_command = 'show version'
+
+        patterns = Patterns(
+            # Cisco IOS XE Software, Version 17.3.1
+            p1=r'^Cisco +IOS +XE +Software, +Version +(?P<version>\\S+)$',
+
+            # uptime is 1 week, 2 days
+            p2=(r'^.* +uptime +is +(?P<uptime>.+)$', re.IGNORECASE),
+        )
+
+        def cli(self, output=None):
+            ...
+            p = ShowVersion.patterns
+
+            for line in out.splitlines():
+                m = p.p1.match(line.strip())
+
+The table is read from the class which declares it and not from `self`, so
+a super parser keeps its own patterns when a subclass declares a table too.
+'''
+
+# python
+import re
+import weakref
+
+
+class Patterns(object):
+    '''Patterns
+
+    Table of the regexes of a parser. Each keyword argument is the name of
+    a pattern and either its regex or a tuple of its regex and flags. The
+    patterns are compiled when they are first used and are then attributes
+    of the table.
+
+        Args:
+            **patterns: regex or (regex, flags) of each pattern
+
+        Example:
+            >>> patterns = Patterns(p1=r'^Version +(?P<version>\\S+)$')
+            >>> patterns.p1.match('Version 17.3.1').groupdict()
+            {'version': '17.3.1'}
+    '''
+
+    # every table, their compiled patterns are dropped by clear_all()
+    _tables = weakref.WeakSet()
+
+    def __init__(self, **patterns):
+        for name in patterns:
+            if name.startswith('_') or hasattr(Patterns, name):
+                raise ValueError(f'{name!r} cannot be used as a pattern name')
+        self._patterns = patterns
+        Patterns._tables.add(self)
+
+    def __getattr__(self, name):
+        # only called when the pattern was not compiled yet
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            pattern = self._patterns[name]
+        except KeyError:
+            raise AttributeError(f'No pattern {name!r} in {self!r}') from None
+
+        if isinstance(pattern, tuple):
+            compiled = re.compile(*pattern)
+        else:
+            compiled = re.compile(pattern)
+
+        # cached as an attribute, next lookups do not go through __getattr__
+        setattr(self, name, compiled)
+        return compiled
+
+    def __contains__(self, name):
+        return name in self._patterns
+
+    def __iter__(self):
+        return iter(self._patterns)
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def __repr__(self):
+        return '<{} {}>'.format(type(self).__name__, ', '.join(self._patterns))
+
+    def get(self, name):
+        '''return the compiled pattern, None if there is no such pattern'''
+        if name not in self._patterns:
+            return None
+        return getattr(self, name)
+
+    def items(self):
+        '''return (name, compiled pattern) of every pattern, in the order
+           they were declared'''
+        return [(name, getattr(self, name)) for name in self._patterns]
+
+    def compile_all(self):
+        '''compile every pattern of the table now, instead of on first use'''
+        self.items()
+        return self
+
+    def clear(self):
+        '''drop the compiled patterns, they are compiled again on next use'''
+        for name in self._patterns:
+            self.__dict__.pop(name, None)
+
+    @classmethod
+    def clear_all(cls):
+        '''drop the compiled patterns of every table'''
+        for table in list(Patterns._tables):
+            table.clear()
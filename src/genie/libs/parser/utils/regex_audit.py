@@ -0,0 +1,607 @@
+'''Static audit of the parser regexes for catastrophic backtracking
+
+Every regex literal given to `re.compile()` or declared in a `Patterns`
+table of the parser modules is extracted from their AST, without importing
+them, and analysed on the tree of the `re` parser:
+
+* exponential: a quantified group whose body can match the same text in
+  more than one way, such as `(\\S+\\s*)+` or `(\\d+|\\w+)+`
+* polynomial: a run of unbounded quantifiers sharing a character, such as
+  `.*\\s+.*\\s+.*`, the degree being the length of the run
+
+The flagged patterns are then fuzzed with adversarial lines, a prefix
+reaching the quantifier, the overlapping character pumped n times and a
+character failing the match, n growing until a single match takes longer
+than the budget. The report ranks them by the length of line which goes
+over the budget, then by their slowest match:
+
+    python -m genie.libs.parser.utils.regex_audit -o iosxe --top 30
+
+The exponential patterns and the polynomial ones of degree
+DANGEROUS_DEGREE and above are dangerous. The known ones are listed in
+tests/regex_audit_baseline.json, and the unittests fail on new ones, the
+baseline is updated with --update-baseline once a pattern is reviewed.
+'''
+
+# python
+import os
+import re
+import ast
+import sys
+import json
+import time
+import argparse
+import warnings
+from collections import namedtuple
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Parser utils
+from genie.libs import parser as _parser
+
+PARSER_FOLDER = os.path.dirname(_parser.__file__)
+BASELINE = os.path.join(os.path.dirname(__file__), 'tests',
+                        'regex_audit_baseline.json')
+
+# polynomial runs of this degree and above are dangerous
+DANGEROUS_DEGREE = 4
+
+# characters of the lines of a device output
+ALPHABET = frozenset(chr(c) for c in range(32, 127)) | {'\t'}
+DIGITS = frozenset('0123456789')
+SPACES = frozenset(' \t')
+WORDS = frozenset(c for c in ALPHABET if c.isalnum() or c == '_')
+CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: DIGITS,
+    sre_constants.CATEGORY_NOT_DIGIT: ALPHABET - DIGITS,
+    sre_constants.CATEGORY_SPACE: SPACES,
+    sre_constants.CATEGORY_NOT_SPACE: ALPHABET - SPACES,
+    sre_constants.CATEGORY_WORD: WORDS,
+    sre_constants.CATEGORY_NOT_WORD: ALPHABET - WORDS,
+}
+SINGLE = (sre_constants.LITERAL, sre_constants.NOT_LITERAL,
+          sre_constants.ANY, sre_constants.IN)
+REPEATS = (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT)
+# with the possessive ones, which do not backtrack (python >= 3.11)
+ALL_REPEATS = tuple(getattr(sre_constants, op) for op in
+                    ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT')
+                    if hasattr(sre_constants, op))
+_ATOMIC_GROUP = getattr(sre_constants, 'ATOMIC_GROUP', None)
+# above this, a bounded quantifier backtracks like an unbounded one
+LARGE_REPEAT = 32
+
+# characters tried to fail the match after the pumped ones
+FAILING = ('\x00', '!', '\n', ' ', 'a', '0')
+
+# line lengths of the fuzzing, slowly at first for exponential patterns
+LENGTHS = (list(range(8, 33, 2))
+           + [48, 64, 96, 128, 192, 256, 384, 512, 768, 1024])
+
+RegexLiteral = namedtuple('RegexLiteral', 'path line name pattern flags')
+Finding = namedtuple('Finding', 'kind degree prefix pump')
+
+
+#===========================================================================
+#                            Extraction
+#===========================================================================
+def iter_parser_files(folder=PARSER_FOLDER, operating_system=None):
+    '''yield the parser modules, without the tests and utils'''
+    for root, dirs, files in os.walk(folder):
+        relative = os.path.relpath(root, folder)
+        top = relative.split(os.sep)[0]
+        dirs[:] = sorted(d for d in dirs
+                         if d not in ('tests', 'utils', '__pycache__'))
+        if operating_system and top not in (operating_system, '.'):
+            continue
+        if relative == '.' and operating_system:
+            continue
+        for name in sorted(files):
+            if name.endswith('.py') and not name.startswith('_'):
+                yield os.path.join(root, name)
+
+
+def extract_regexes(path):
+    '''return the regex literals of a module
+
+    The literals of re.compile() calls and of the keyword arguments of
+    Patterns(), the flags being re attributes combined with |. Regexes built
+    at runtime, such as f-strings, are skipped.
+    '''
+    with open(path, encoding='utf-8', errors='replace') as f:
+        tree = ast.parse(f.read(), path)
+
+    # name of the variable or attribute the regex is assigned to
+    names = {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            target = node.targets[0]
+            if isinstance(target, ast.Name):
+                names[id(node.value)] = target.id
+            elif isinstance(target, ast.Attribute):
+                names[id(node.value)] = target.attr
+
+    literals = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Call):
+            continue
+        func = node.func
+        if (isinstance(func, ast.Attribute) and func.attr == 'compile'
+                and isinstance(func.value, ast.Name)
+                and func.value.id == 're' and node.args):
+            flags = node.args[1] if len(node.args) > 1 else next(
+                (k.value for k in node.keywords if k.arg == 'flags'), None)
+            _add_literal(literals, path, node, names.get(id(node)),
+                         node.args[0], flags)
+        elif isinstance(func, ast.Name) and func.id == 'Patterns':
+            for keyword in node.keywords:
+                value, flags = keyword.value, None
+                if isinstance(value, ast.Tuple) and value.elts:
+                    value, flags = value.elts[0], (
+                        value.elts[1] if len(value.elts) > 1 else None)
+                _add_literal(literals, path, keyword.value, keyword.arg,
+                             value, flags)
+    return literals
+
+
+def _add_literal(literals, path, node, name, value, flags):
+    pattern = _string(value)
+    if pattern is None:
+        return
+    literals.append(RegexLiteral(path, node.lineno, name, pattern,
+                                 _flags(flags)))
+
+
+def _string(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        left, right = _string(node.left), _string(node.right)
+        if left is not None and right is not None:
+            return left + right
+    return None
+
+
+def _flags(node):
+    if node is None:
+        return 0
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        return _flags(node.left) | _flags(node.right)
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) \
+            and node.value.id == 're':
+        return getattr(re, node.attr, 0)
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    return 0
+
+
+#===========================================================================
+#                            Analysis
+#===========================================================================
+def analyse(pattern, flags=0):
+    '''return the findings of a regex, an empty list when it is safe
+
+        Raises:
+            re.error: the regex does not compile
+    '''
+    with warnings.catch_warnings():
+        # such as the possible nested sets, reported by the linters already
+        warnings.simplefilter('ignore')
+        tree = sre_parse.parse(pattern, flags)
+    findings = []
+    _walk(list(tree), bool(flags & re.IGNORECASE), '', findings)
+    return findings
+
+
+def is_dangerous(findings):
+    return any(f.kind == 'exponential' or f.degree >= DANGEROUS_DEGREE
+               for f in findings)
+
+
+def _walk(items, ignorecase, prefix, findings):
+    '''find the ambiguous quantifiers of a sequence and of its children'''
+    _polynomial(items, ignorecase, prefix, findings)
+    for index, (op, av) in enumerate(items):
+        before = prefix + _sample(items[:index], ignorecase)
+        if op in REPEATS:
+            body = list(av[2])
+            if _unbounded(av):
+                _exponential(body, ignorecase, before, findings)
+            _walk(body, ignorecase, before, findings)
+        elif op == sre_constants.SUBPATTERN:
+            _walk(list(av[3]), _ignorecase(av, ignorecase), before, findings)
+        elif op == sre_constants.BRANCH:
+            for branch in av[1]:
+                _walk(list(branch), ignorecase, before, findings)
+        elif op == sre_constants.GROUPREF_EXISTS:
+            for branch in av[1:]:
+                if branch:
+                    _walk(list(branch), ignorecase, before, findings)
+
+
+def _exponential(body, ignorecase, prefix, findings):
+    '''a repeated body is ambiguous when it ends with an unbounded quantifier
+    whose characters can also start the next repetition, or when it is an
+    alternation whose branches start with the same characters'''
+    first, nullable = _first(body, ignorecase)
+    if nullable:
+        # the engine stops empty repetitions
+        return
+    for chars in _trailing(body, ignorecase):
+        overlap = chars & first
+        if overlap:
+            findings.append(Finding('exponential', 0, prefix,
+                                    _pick(overlap)))
+            return
+    for op, av in body:
+        if op == sre_constants.SUBPATTERN:
+            return _exponential(list(av[3]), _ignorecase(av, ignorecase),
+                                prefix, findings)
+        if op == sre_constants.BRANCH:
+            firsts = [_first(list(b), ignorecase)[0] for b in av[1]]
+            for i, one in enumerate(firsts):
+                for other in firsts[i + 1:]:
+                    if one & other:
+                        findings.append(Finding('exponential', 0, prefix,
+                                                _pick(one & other)))
+                        return
+        break
+
+
+def _trailing(items, ignorecase):
+    '''characters of the unbounded quantifiers which can end a sequence'''
+    trailing = []
+    for op, av in reversed(items):
+        if op in REPEATS and _unbounded(av):
+            trailing.append(_chars(list(av[2]), ignorecase))
+        elif op == sre_constants.SUBPATTERN:
+            trailing.extend(_trailing(list(av[3]),
+                                      _ignorecase(av, ignorecase)))
+        elif op == sre_constants.BRANCH:
+            for branch in av[1]:
+                trailing.extend(_trailing(list(branch), ignorecase))
+        if not _first([(op, av)], ignorecase)[1]:
+            break
+    return trailing
+
+
+def _polynomial(items, ignorecase, prefix, findings):
+    '''the longest run of unbounded quantifiers sharing a character with
+    the mandatory items between them, that character being pumped'''
+    best, best_common, best_start = 1, None, 0
+    run, common, start = 0, ALPHABET, 0
+    flat = _flatten(items, ignorecase)
+    for index, (kind, chars) in enumerate(flat):
+        if kind == 'repeat':
+            if run and chars & common:
+                run, common = run + 1, common & chars
+            else:
+                run, common, start = 1, chars, index
+            if run > best:
+                best, best_common, best_start = run, common, start
+        elif kind == 'mandatory' and run:
+            if chars & common:
+                common &= chars
+            else:
+                run, common = 0, ALPHABET
+    if best_common:
+        findings.append(Finding('polynomial', best, prefix + ''.join(
+            _pick(chars) for kind, chars in flat[:best_start]
+            if kind == 'mandatory'), _pick(best_common)))
+
+
+def _flatten(items, ignorecase):
+    '''(kind, characters) of the items of a sequence, the plain groups being
+    inlined: repeat for the unbounded quantifiers of single characters,
+    mandatory or optional for the others'''
+    flat = []
+    for op, av in items:
+        if op == sre_constants.SUBPATTERN:
+            flat.extend(_flatten(list(av[3]), _ignorecase(av, ignorecase)))
+        elif op in REPEATS and _unbounded(av) and len(av[2]) == 1 \
+                and av[2][0][0] in SINGLE:
+            flat.append(('repeat', _chars(list(av[2]), ignorecase)))
+        else:
+            first, nullable = _first([(op, av)], ignorecase)
+            if first or not nullable:
+                flat.append(('optional' if nullable else 'mandatory',
+                             _chars([(op, av)], ignorecase)))
+    return flat
+
+
+def _first(items, ignorecase):
+    '''(characters which can start a sequence, True if it can be empty)'''
+    first = frozenset()
+    for op, av in items:
+        if op in SINGLE:
+            return first | _single(op, av, ignorecase), False
+        if op in ALL_REPEATS:
+            chars, nullable = _first(list(av[2]), ignorecase)
+            first |= chars
+            if av[0] > 0 and not nullable:
+                return first, False
+        elif op == sre_constants.SUBPATTERN:
+            chars, nullable = _first(list(av[3]),
+                                     _ignorecase(av, ignorecase))
+            first |= chars
+            if not nullable:
+                return first, False
+        elif _ATOMIC_GROUP is not None and op is _ATOMIC_GROUP:
+            chars, nullable = _first(list(av), ignorecase)
+            first |= chars
+            if not nullable:
+                return first, False
+        elif op in (sre_constants.BRANCH, sre_constants.GROUPREF_EXISTS):
+            branches = av[1] if op == sre_constants.BRANCH else av[1:]
+            nullable = False
+            for branch in branches:
+                chars, empty = _first(list(branch or []), ignorecase)
+                first |= chars
+                nullable = nullable or empty
+            if not nullable:
+                return first, False
+        elif op == sre_constants.GROUPREF:
+            first |= ALPHABET
+    return first, True
+
+
+def _chars(items, ignorecase):
+    '''characters a sequence can match anywhere'''
+    chars = frozenset()
+    for op, av in items:
+        if op in SINGLE:
+            chars |= _single(op, av, ignorecase)
+        elif op in ALL_REPEATS:
+            chars |= _chars(list(av[2]), ignorecase)
+        elif op == sre_constants.SUBPATTERN:
+            chars |= _chars(list(av[3]), _ignorecase(av, ignorecase))
+        elif _ATOMIC_GROUP is not None and op is _ATOMIC_GROUP:
+            chars |= _chars(list(av), ignorecase)
+        elif op == sre_constants.BRANCH:
+            for branch in av[1]:
+                chars |= _chars(list(branch), ignorecase)
+        elif op == sre_constants.GROUPREF_EXISTS:
+            for branch in av[1:]:
+                chars |= _chars(list(branch or []), ignorecase)
+        elif op == sre_constants.GROUPREF:
+            chars |= ALPHABET
+    return chars
+
+
+def _single(op, av, ignorecase):
+    if op == sre_constants.ANY:
+        return ALPHABET
+    if op in (sre_constants.LITERAL, sre_constants.NOT_LITERAL):
+        chars = {chr(av)}
+        if ignorecase:
+            chars |= {chr(av).swapcase()}
+        return (ALPHABET - chars if op == sre_constants.NOT_LITERAL
+                else frozenset(chars) & ALPHABET)
+    chars, negate = set(), False
+    for item_op, item_av in av:
+        if item_op == sre_constants.NEGATE:
+            negate = True
+        elif item_op == sre_constants.LITERAL:
+            chars.add(chr(item_av))
+        elif item_op == sre_constants.RANGE:
+            chars.update(chr(c) for c in range(item_av[0], item_av[1] + 1)
+                         if chr(c) in ALPHABET)
+        elif item_op == sre_constants.CATEGORY:
+            chars.update(CATEGORIES.get(item_av, ()))
+    if ignorecase:
+        chars |= {c.swapcase() for c in chars}
+    chars = frozenset(chars) & ALPHABET
+    return ALPHABET - chars if negate else chars
+
+
+def _sample(items, ignorecase):
+    '''a short text matched by a sequence, to reach the quantifiers after it'''
+    text = []
+    for op, av in items:
+        if op in SINGLE:
+            text.append(_pick(_single(op, av, ignorecase)))
+        elif op in ALL_REPEATS:
+            text.append(_sample(list(av[2]), ignorecase) * av[0])
+        elif op == sre_constants.SUBPATTERN:
+            text.append(_sample(list(av[3]), _ignorecase(av, ignorecase)))
+        elif _ATOMIC_GROUP is not None and op is _ATOMIC_GROUP:
+            text.append(_sample(list(av), ignorecase))
+        elif op == sre_constants.BRANCH:
+            text.append(_sample(list(av[1][0]), ignorecase))
+    return ''.join(text)
+
+
+def _pick(chars):
+    '''a readable character of a set'''
+    for preferred in ('a', '1', ' ', 'A', '.', ':'):
+        if preferred in chars:
+            return preferred
+    return min(chars) if chars else ''
+
+
+def _unbounded(av):
+    return av[1] == sre_constants.MAXREPEAT or av[1] > LARGE_REPEAT
+
+
+def _ignorecase(av, ignorecase):
+    if av[1] & sre_constants.SRE_FLAG_IGNORECASE:
+        return True
+    if av[2] & sre_constants.SRE_FLAG_IGNORECASE:
+        return False
+    return ignorecase
+
+
+#===========================================================================
+#                            Fuzzing
+#===========================================================================
+def fuzz(pattern, flags, findings, budget=0.05):
+    '''match adversarial lines built from the findings of a regex
+
+        Args:
+            pattern (`str`): the regex
+            flags (`int`): its flags
+            findings (`list`): from analyse()
+            budget (`float`): seconds a single match may take, the lines get
+                longer until one goes over it
+
+        Returns:
+            (length of the line which went over the budget or None, seconds
+            of the slowest match, the slowest line)
+    '''
+    compiled = re.compile(pattern, flags)
+    over, slowest, slowest_line = None, 0.0, ''
+    for finding in findings:
+        if not finding.pump:
+            continue
+        for failing in FAILING:
+            for length in LENGTHS:
+                line = finding.prefix + finding.pump * length + failing
+                start = time.perf_counter()
+                compiled.match(line)
+                seconds = time.perf_counter() - start
+                if seconds > slowest:
+                    slowest, slowest_line = seconds, line
+                if seconds > budget:
+                    if over is None or len(line) < over:
+                        over = len(line)
+                    break
+    return over, slowest, slowest_line
+
+
+#===========================================================================
+#                            Report
+#===========================================================================
+def audit(folder=PARSER_FOLDER, operating_system=None, run_fuzz=True,
+          budget=0.05):
+    '''analyse, and fuzz, the regexes of the parser modules
+
+        Returns:
+            list of dicts of the flagged regexes, the most dangerous first
+    '''
+    results = []
+    for path in iter_parser_files(folder, operating_system):
+        try:
+            literals = extract_regexes(path)
+        except SyntaxError:
+            continue
+        for literal in literals:
+            try:
+                findings = analyse(literal.pattern, literal.flags)
+            except (re.error, OverflowError, RecursionError):
+                continue
+            if not findings:
+                continue
+            kind = ('exponential' if any(f.kind == 'exponential'
+                                         for f in findings) else 'polynomial')
+            result = {
+                'module': os.path.relpath(path, folder),
+                'line': literal.line,
+                'name': literal.name,
+                'pattern': literal.pattern,
+                'kind': kind,
+                'degree': max(f.degree for f in findings),
+                'dangerous': is_dangerous(findings),
+            }
+            if run_fuzz and result['dangerous']:
+                over, slowest, line = fuzz(literal.pattern, literal.flags,
+                                           findings, budget)
+                result.update(over_budget_at=over, slowest=slowest,
+                              slowest_line=line)
+            results.append(result)
+    return sorted(results, key=_rank)
+
+
+def _rank(result):
+    over = result.get('over_budget_at')
+    return (not result['dangerous'], over is None, over or 0,
+            -result.get('slowest', 0.0), result['kind'] != 'exponential',
+            -result['degree'])
+
+
+def baseline_key(result):
+    return '{}:{}'.format(result['module'], result['pattern'])
+
+
+def load_baseline(path=BASELINE):
+    try:
+        with open(path) as f:
+            return set(json.load(f))
+    except FileNotFoundError:
+        return set()
+
+
+def save_baseline(results, path=BASELINE):
+    with open(path, 'w') as f:
+        json.dump(sorted(baseline_key(r) for r in results if r['dangerous']),
+                  f, indent=1)
+        f.write('\n')
+
+
+def new_dangerous(results, baseline):
+    '''the dangerous regexes which are not in the baseline'''
+    return [r for r in results
+            if r['dangerous'] and baseline_key(r) not in baseline]
+
+
+def format_report(results, baseline=(), top=50):
+    row = '{:<50}{:>6}{:>13}{:>8}{:>10}{:>10}  {}'
+    lines = [row.format('module:line', 'new', 'kind', 'degree', 'over at',
+                        'slowest', 'pattern'), '-' * 140]
+    for r in [r for r in results if r['dangerous']][:top]:
+        slowest = r.get('slowest')
+        lines.append(row.format(
+            '{}:{}'.format(r['module'], r['line'])[-49:],
+            '' if baseline_key(r) in baseline else 'NEW', r['kind'],
+            r['degree'] or '', r.get('over_budget_at') or '',
+            '{:.1f}ms'.format(slowest * 1000) if slowest is not None else '',
+            r['pattern'] if len(r['pattern']) < 60
+            else r['pattern'][:57] + '...'))
+    dangerous = sum(1 for r in results if r['dangerous'])
+    lines.append('-' * 140)
+    lines.append('{} flagged regexes, {} dangerous, {} new'.format(
+        len(results), dangerous, len(new_dangerous(results, baseline))))
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    my_parser = argparse.ArgumentParser(
+        description='Find the parser regexes prone to catastrophic '
+                    'backtracking')
+    my_parser.add_argument('-o', '--operating_system',
+                           help='The OS you wish to filter on')
+    my_parser.add_argument('--no-fuzz', action='store_true',
+                           help='Only run the static analysis')
+    my_parser.add_argument('--budget', type=float, default=0.05,
+                           help='Seconds a single match of a fuzzed line '
+                                'may take')
+    my_parser.add_argument('--top', type=int, default=50,
+                           help='Number of regexes reported')
+    my_parser.add_argument('--json',
+                           help='Write every flagged regex to this file')
+    my_parser.add_argument('--update-baseline', action='store_true',
+                           help='Accept the current dangerous regexes in '
+                                '{}'.format(BASELINE))
+    args = my_parser.parse_args(args)
+
+    results = audit(operating_system=args.operating_system,
+                    run_fuzz=not args.no_fuzz, budget=args.budget)
+    baseline = load_baseline()
+    print(format_report(results, baseline, top=args.top))
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=1)
+    if args.update_baseline:
+        if args.operating_system:
+            my_parser.error('--update-baseline needs every operating system')
+        save_baseline(results)
+        return 0
+    return 1 if new_dangerous(results, baseline) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
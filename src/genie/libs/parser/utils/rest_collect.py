@@ -0,0 +1,405 @@
+'''Bulk collection of the REST parsers
+
+The REST parsers, as the F5 resources of bigip and the DNA Center
+Interface, execute a blocking `self.device.get(path).json()`. Collecting
+hundreds of them one after the other waits for each round trip, with a new
+connection each time. The parsers are not changed, they are given a
+`RestDevice` instead, whose `get()` goes through a `RestSession`:
+
+    from genie.libs.parser.bigip import resources
+    from genie.libs.parser.bigip.resources import RESOURCES
+
+    with RestSession('https://f5.example.com', auth=('admin', 'secret'),
+                     verify=False, pool_size=8) as session:
+        device = RestDevice(session, page_size=500)
+        jobs = ((getattr(resources, name)(device=device, context='rest'), {})
+                for name, path in RESOURCES.items()
+                if path.startswith('/mgmt/tm/ltm/'))
+        for index, result in iter_collect(jobs, max_workers=8):
+            ...
+
+The session keeps a pool of persistent connections, reused by the requests
+of every parser. `iter_collect()` runs the parsers with a pool of threads,
+the parsers in flight are bounded so the jobs are only read as they
+complete.
+
+A collection is read page by page: with a page size, `$top` and `$skip` are
+given and increased until a page is not full, and the `nextLink` of a page
+is followed when there is one. The items of the pages are given to the
+parser as one response, as without paging.
+'''
+
+# python
+import ssl
+import json
+import queue
+import base64
+import logging
+import itertools
+import threading
+import http.client
+import urllib.parse
+import concurrent.futures
+
+log = logging.getLogger(__name__)
+
+# paging parameters
+TOP = '$top'
+SKIP = '$skip'
+
+# pages read of a collection at most
+MAX_PAGES = 10000
+
+# keys of the items of a collection: F5, DNA Center
+ITEM_KEYS = ('items', 'response')
+
+# keys only describing a page, dropped from the collection
+PAGE_KEYS = ('nextLink', 'previousLink', 'currentItemCount', 'itemsPerPage',
+             'pageIndex', 'startIndex', 'totalPages')
+
+
+class RestError(Exception):
+    '''a request did not succeed'''
+
+    def __init__(self, response):
+        super().__init__('GET {} failed: {} {}'.format(
+            response.url, response.status_code, response.reason))
+        self.response = response
+
+
+class RestResponse(object):
+    '''RestResponse
+
+    Response of a request, with the attributes of the responses the parsers
+    use
+
+        Attributes:
+            url (`str`): path and query of the request
+            status_code (`int`): status of the response
+            reason (`str`): reason of the status
+            headers (`dict`): headers of the response
+            content (`bytes`): body of the response
+    '''
+
+    def __init__(self, url, status_code, reason, headers, content):
+        self.url = url
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.content = content
+        self._json = None
+
+    @property
+    def ok(self):
+        return 200 <= self.status_code < 300
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        '''the body decoded, decoded once'''
+        if self._json is None:
+            self._json = json.loads(self.content) if self.content else {}
+        return self._json
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise RestError(self)
+
+
+class RestSession(object):
+    '''RestSession
+
+    Requests to a REST server, with a pool of persistent connections shared
+    by the threads
+
+        Args:
+            base_url (`str`): scheme, host and port of the server, and the
+                path the paths of the requests are under
+            headers (`dict`): headers of every request, as an X-Auth-Token
+            auth (`tuple`): username and password of basic authentication
+            verify (`bool`): verify the certificate of the server
+            pool_size (`int`): number of connections, the requests wait for
+                one to be free
+            timeout (`float`): timeout of the connections, in seconds
+    '''
+
+    def __init__(self, base_url, headers=None, auth=None, verify=True,
+                 pool_size=8, timeout=30):
+        url = urllib.parse.urlsplit(base_url)
+        if url.scheme not in ('http', 'https') or not url.hostname:
+            raise ValueError('{} is not an http(s) url'.format(base_url))
+        self.scheme = url.scheme
+        self.host = url.hostname
+        self.port = url.port
+        self.prefix = url.path.rstrip('/')
+        self.timeout = timeout
+
+        self.headers = {'Accept': 'application/json'}
+        if auth:
+            token = base64.b64encode('{}:{}'.format(*auth).encode()).decode()
+            self.headers['Authorization'] = 'Basic ' + token
+        self.headers.update(headers or {})
+
+        self.ssl_context = None
+        if self.scheme == 'https':
+            self.ssl_context = ssl.create_default_context()
+            if not verify:
+                self.ssl_context.check_hostname = False
+                self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        # connections not in use, the last used first
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def url(self, path, params=None):
+        '''path and query of a request'''
+        url = self.prefix + path
+        if params:
+            url += ('&' if '?' in url else '?') + urllib.parse.urlencode(
+                params, safe='$')
+        return url
+
+    def relative(self, link):
+        '''path of a link given by the server, as a nextLink, to request it
+        with the session. Its host is not used, F5 gives localhost'''
+        link = urllib.parse.urlsplit(link)
+        path = link.path
+        if self.prefix and path.startswith(self.prefix + '/'):
+            path = path[len(self.prefix):]
+        return path + ('?' + link.query if link.query else '')
+
+    def get(self, path, params=None):
+        '''GET path
+
+            Args:
+                path (`str`): path under the base url, with or without a
+                    query
+                params (`dict`): parameters added to the query
+
+            Returns:
+                `RestResponse`, whatever its status
+        '''
+        url = self.url(path, params)
+        with self._slots:
+            while True:
+                connection, reused = self._connection()
+                try:
+                    connection.request('GET', url, headers=self.headers)
+                    response = connection.getresponse()
+                    content = response.read()
+                except ConnectionError:
+                    connection.close()
+                    # closed by the server while idle
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    connection.close()
+                    raise
+                break
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._idle.put(connection)
+
+        return RestResponse(url, response.status, response.reason,
+                            dict(response.getheaders()), content)
+
+    def close(self):
+        '''close the idle connections'''
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _connection(self):
+        try:
+            return self._idle.get_nowait(), True
+        except queue.Empty:
+            pass
+        if self.scheme == 'https':
+            connection = http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout,
+                context=self.ssl_context)
+        else:
+            connection = http.client.HTTPConnection(
+                self.host, self.port, timeout=self.timeout)
+        return connection, False
+
+
+def iter_pages(session, path, page_size=None):
+    '''yield the response of each page of path, as it is read
+
+        Args:
+            session (`RestSession`): session of the requests
+            path (`str`): path of the collection
+            page_size (`int`): number of items of each page, with $top and
+                $skip. The collection is read in one request without it,
+                unless the server gives a nextLink. The reading stops at a
+                page with the same items as the previous one, or after
+                MAX_PAGES pages
+
+        Returns:
+            generator of `RestResponse`
+
+        Raises:
+            RestError: a page did not succeed
+    '''
+    params = {TOP: page_size, SKIP: 0} if page_size else None
+    skip = 0
+    links = set()
+    previous = None
+
+    for _ in range(MAX_PAGES):
+        response = session.get(path, params)
+        response.raise_for_status()
+        data = response.json()
+        items = _items(data)
+        # a server ignoring $skip gives the same page again
+        if items and items == previous:
+            return
+        yield response
+
+        if not items:
+            return
+        previous = items
+        skip += len(items)
+
+        link = data.get('nextLink')
+        if link:
+            path, params = session.relative(link), None
+            # a server giving the same page again
+            if path in links:
+                return
+            links.add(path)
+        elif page_size and len(items) == page_size and \
+                skip < data.get('totalItems', skip + 1):
+            params = {TOP: page_size, SKIP: skip}
+        else:
+            # the last page, or more items than asked for: the server does
+            # not page the path
+            return
+
+    log.warning('{} has more than {} pages, the next ones are not '
+                'read'.format(path, MAX_PAGES))
+
+
+class RestDevice(object):
+    '''RestDevice
+
+    Device of the REST parsers, getting each path with a `RestSession`.
+    The items of all the pages of a collection are in the response of its
+    path
+
+        Args:
+            session (`RestSession`): session of the requests
+            page_size (`int`): see iter_pages()
+            name (`str`): name of the device
+            os (`str`): operating system of the device
+    '''
+
+    def __init__(self, session, page_size=None, name=None, os=None):
+        self.session = session
+        self.page_size = page_size
+        self.name = name
+        self.os = os
+
+    def get(self, path):
+        pages = iter_pages(self.session, path, page_size=self.page_size)
+        response = next(pages)
+        data = response.json()
+        key = _items_key(data)
+        if key is None:
+            return response
+
+        for page in pages:
+            data[key].extend(_items(page.json()))
+        if self.page_size or 'nextLink' in data:
+            # the keys of the first page
+            for name in PAGE_KEYS:
+                data.pop(name, None)
+        return response
+
+
+def _items_key(data):
+    if isinstance(data, dict):
+        for key in ITEM_KEYS:
+            if isinstance(data.get(key), list):
+                return key
+    return None
+
+
+def _items(data):
+    key = _items_key(data)
+    return None if key is None else data[key]
+
+
+def iter_collect(jobs, max_workers=8):
+    '''run the parsers of jobs with a pool of threads, yielding their
+    results as they complete
+
+        Args:
+            jobs (`iterable`): (parser, arguments of parse()) of each parser,
+                only read as parsers complete
+            max_workers (`int`): number of threads, twice as many parsers
+                are in flight
+
+        Yields:
+            (index of the job, parsed output or exception raised)
+    '''
+    jobs = iter(enumerate(jobs))
+    in_flight = {}
+    limit = 2 * max_workers
+
+    with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='rest_collect') as executor:
+
+        def start():
+            for index, (parser, kwargs) in itertools.islice(
+                    jobs, limit - len(in_flight)):
+                in_flight[executor.submit(parser.parse, **kwargs)] = index
+
+        start()
+        try:
+            while in_flight:
+                done, _ = concurrent.futures.wait(
+                    in_flight,
+                    return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    index = in_flight.pop(future)
+                    yield index, future.exception() or future.result()
+                start()
+        finally:
+            # the caller stopped early
+            for future in in_flight:
+                future.cancel()
+
+
+def collect(jobs, max_workers=8, return_exceptions=False):
+    '''run the parsers of jobs with a pool of threads
+
+        Returns:
+            list of the parsed outputs, in the order of jobs, with the
+            exception raised in place of the output when return_exceptions
+            is set
+
+        Raises:
+            The first exception raised, unless return_exceptions is set
+    '''
+    results = {}
+    for index, result in iter_collect(jobs, max_workers=max_workers):
+        if isinstance(result, BaseException) and not return_exceptions:
+            raise result
+        results[index] = result
+    return [results[index] for index in range(len(results))]
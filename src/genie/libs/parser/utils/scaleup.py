@@ -0,0 +1,318 @@
+'''Scale-up of the golden outputs to find superlinear parsers
+
+The golden outputs hold a handful of interfaces, routes or MAC addresses,
+when devices return thousands of them. `scale_output()` replicates the
+records of a golden output, everything after its header, N times. Each copy
+gets unique keys: its IPv4 and MAC addresses are mapped to unused ones and
+the last number of its interface names is shifted, consistently within the
+copy. The parser is then timed at 1x, 10x, 100x and 1000x, and flagged when
+its time or its peak allocation grows faster than the number of lines:
+
+    python -m genie.libs.parser.utils.scaleup
+    python -m genie.libs.parser.utils.scaleup ShowIpRoute --factors 1,10,100
+    python -m genie.libs.parser.utils.scaleup nxos.show_routing.ShowIpRoute \\
+        --golden golden_output_output.txt --record '^\\S'
+'''
+
+# python
+import os
+import re
+import sys
+import json
+import math
+import argparse
+import importlib
+
+# Parser utils
+from genie.libs.parser.utils.benchmark import measure
+
+# parsers scaled by default: (module, class, golden test, start of the records)
+SCALE_TARGETS = {
+    'ShowInterfaces': (
+        'iosxe.show_interface', 'ShowInterfaces', 'golden_output_1',
+        r'^\s*\S+ is (up|down|administratively down|deleted)'),
+    'ShowMacAddressTableDynamic': (
+        'iosxe.show_mac_address', 'ShowMacAddressTableDynamic',
+        'golden_output_2', r'^\s*\d+\s+[0-9a-fA-F]{4}\.'),
+    'ShowIpRoute': (
+        'iosxe.show_routing', 'ShowIpRoute', 'golden_output1',
+        r'^(\s*\d+\.\d+\.\d+\.\d+|[A-Za-z*+%]{1,3}\s+\S)'),
+    'ShowBgpAllDetail': (
+        'iosxe.show_bgp', 'ShowBgpAllDetail', 'golden_output1',
+        r'^\s*(For address family|BGP routing table entry)'),
+}
+
+DEFAULT_FACTORS = (1, 10, 100, 1000)
+
+# growth exponent above which a parser is flagged, 1 is linear
+DEFAULT_TOLERANCE = 0.2
+
+IPV4 = re.compile(r'(?<![\d.])(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})(?![\d.])')
+MAC = re.compile(r'\b([0-9a-fA-F]{4})\.([0-9a-fA-F]{4})\.([0-9a-fA-F]{4})\b')
+INTERFACE = re.compile(
+    r'\b(?P<name>(?:TwentyFiveGigE|HundredGigE|FortyGigabitEthernet|'
+    r'TenGigabitEthernet|AppGigabitEthernet|GigabitEthernet|FastEthernet|'
+    r'Ethernet|Port-channel|Bundle-Ether|Virtual-Access|Virtual-Template|'
+    r'Multilink|Loopback|Cellular|Dialer|Serial|Tunnel|Vlan|Null|BDI|Twe|Hu|'
+    r'Fo|Te|Gi|Fa|Et|Po|Lo|Tu|Vl|Nu|Se)(?:\d+/)*)(?P<number>\d+)\b')
+
+
+def split_records(output, record):
+    '''split an output into its header and its records
+
+        Args:
+            output (`str`): device output
+            record (`str`): regex matching the first line of a record
+
+        Returns:
+            (header, records), the records being everything from the first
+            line matching record
+    '''
+    lines = output.splitlines(keepends=True)
+    pattern = re.compile(record)
+    for index, line in enumerate(lines):
+        if pattern.match(line):
+            return ''.join(lines[:index]), ''.join(lines[index:])
+    raise ValueError('no line matches {!r}'.format(record))
+
+
+def scale_output(output, factor, record):
+    '''return an output with its records replicated factor times
+
+    The first copy is the original records, the others get unique IPv4
+    addresses, MAC addresses and interface numbers.
+    '''
+    header, records = split_records(output, record)
+    if not records.endswith('\n'):
+        records += '\n'
+    rewriter = _Rewriter(output)
+    return header + ''.join(rewriter.copy(records, index)
+                            for index in range(factor))
+
+
+class _Rewriter(object):
+    '''maps the keys of each copy of the records to unused ones'''
+
+    def __init__(self, output):
+        self.used_ipv4 = {_ipv4(m) for m in IPV4.finditer(output)}
+        self.used_mac = {_mac(m) for m in MAC.finditer(output)}
+        self.next_ipv4 = 0
+        self.next_mac = 0
+        numbers = [int(m.group('number')) for m in INTERFACE.finditer(output)]
+        self.interface_step = 10 ** len(str(max(numbers, default=0)))
+
+    def copy(self, records, index):
+        if not index:
+            return records
+        ipv4 = {}
+        mac = {}
+        records = IPV4.sub(lambda m: self._ipv4(m, ipv4), records)
+        records = MAC.sub(lambda m: self._mac(m, mac), records)
+        return INTERFACE.sub(lambda m: '{}{}'.format(
+            m.group('name'),
+            int(m.group('number')) + index * self.interface_step), records)
+
+    def _ipv4(self, match, mapping):
+        octets = [int(octet) for octet in match.groups()]
+        # masks, wildcards and unspecified addresses are kept
+        if max(octets) > 255 or octets[0] in (0, 255):
+            return match.group(0)
+        value = _ipv4(match)
+        if value not in mapping:
+            # keeps the first and last octets, the prefix lengths still fit
+            while True:
+                self.next_ipv4 += 1
+                first = (octets[0] + (self.next_ipv4 >> 16) - 1) % 223 + 1
+                new = (first << 24 | (self.next_ipv4 & 0xffff) << 8
+                       | octets[3])
+                if new not in self.used_ipv4:
+                    break
+            self.used_ipv4.add(new)
+            mapping[value] = new
+        new = mapping[value]
+        return '.'.join(str(new >> shift & 0xff) for shift in (24, 16, 8, 0))
+
+    def _mac(self, match, mapping):
+        value = _mac(match)
+        if value not in mapping:
+            while True:
+                self.next_mac += 1
+                # locally administered addresses
+                new = 0x020000000000 | self.next_mac
+                if new not in self.used_mac:
+                    break
+            self.used_mac.add(new)
+            mapping[value] = new
+        new = '{:012x}'.format(mapping[value])
+        return '.'.join((new[:4], new[4:8], new[8:]))
+
+
+def _ipv4(match):
+    value = 0
+    for octet in match.groups():
+        value = value << 8 | int(octet) & 0xff
+    return value
+
+
+def _mac(match):
+    return int(''.join(match.groups()), 16)
+
+
+def growth(points):
+    '''return the growth exponents between consecutive points
+
+        Args:
+            points (`list`): (lines, value) sorted by lines
+
+        Returns:
+            list of the exponents, log(value ratio) / log(lines ratio), 1
+            being linear
+    '''
+    exponents = []
+    for (lines1, value1), (lines2, value2) in zip(points, points[1:]):
+        if lines2 <= lines1 or value1 <= 0 or value2 <= 0:
+            exponents.append(None)
+            continue
+        exponents.append(math.log(value2 / value1) / math.log(lines2 / lines1))
+    return exponents
+
+
+def scale_up(local_class, output, record, arguments=None,
+             factors=DEFAULT_FACTORS, repeat=3, memory=True):
+    '''measure a parser with its output scaled by each factor
+
+        Returns:
+            dict of the measure() of each factor, plus the time and memory
+            growth exponents between consecutive factors
+    '''
+    results = {}
+    for factor in factors:
+        scaled = scale_output(output, factor, record)
+        results[factor] = measure(local_class, scaled, arguments, warmup=1,
+                                  repeat=repeat, memory=memory)
+        if 'error' in results[factor]:
+            break
+
+    timed = [(results[f]['lines'], results[f]) for f in factors
+             if f in results and 'error' not in results[f]]
+    return {
+        'factors': results,
+        'time_growth': growth([(lines, r['seconds']) for lines, r in timed]),
+        'memory_growth': growth([(lines, r['peak_bytes'])
+                                 for lines, r in timed if 'peak_bytes' in r]),
+    }
+
+
+def is_superlinear(result, tolerance=DEFAULT_TOLERANCE):
+    '''True when the last growth exponent of time or memory is above
+    1 + tolerance, the smaller factors are dominated by constant costs'''
+    for key in ('time_growth', 'memory_growth'):
+        exponents = [e for e in result[key] if e is not None]
+        if exponents and exponents[-1] > 1 + tolerance:
+            return True
+    return False
+
+
+def format_report(name, result, tolerance=DEFAULT_TOLERANCE):
+    row = '{:>8}{:>10}{:>12}{:>14}{:>12}'
+    lines = ['{} {}'.format(name, 'SUPERLINEAR' if is_superlinear(
+                 result, tolerance) else 'linear'),
+             row.format('factor', 'lines', 'ms', 'us/line', 'peak MB')]
+    for factor, r in result['factors'].items():
+        if 'error' in r:
+            lines.append('{:>8}  {}'.format(factor, r['error']))
+            continue
+        lines.append(row.format(
+            factor, r['lines'], '{:.2f}'.format(r['seconds'] * 1000),
+            '{:.2f}'.format(r['seconds'] / max(r['lines'], 1) * 10 ** 6),
+            '{:.2f}'.format(r.get('peak_bytes', 0) / 2 ** 20)))
+    for key in ('time_growth', 'memory_growth'):
+        lines.append('{}: {}'.format(key, ', '.join(
+            '-' if e is None else '{:.2f}'.format(e) for e in result[key])))
+    return '\n'.join(lines)
+
+
+def load_target(name, golden=None, record=None):
+    '''return (parser class, output, arguments, record) of a parser
+
+        Args:
+            name (`str`): key of SCALE_TARGETS, or module.Class under
+                genie.libs.parser, such as nxos.show_routing.ShowIpRoute
+            golden (`str`): golden test or path of an output, overrides the
+                one of SCALE_TARGETS
+            record (`str`): regex of the first line of a record, overrides
+                the one of SCALE_TARGETS
+    '''
+    if name in SCALE_TARGETS:
+        module_name, class_name, default_golden, default_record = \
+            SCALE_TARGETS[name]
+    else:
+        module_name, _, class_name = name.rpartition('.')
+        default_golden = default_record = None
+    golden = golden or default_golden
+    record = record or default_record
+    if not golden or not record:
+        raise ValueError('{} needs a golden output and a record regex'.format(
+            name))
+
+    module = importlib.import_module('genie.libs.parser.' + module_name)
+    local_class = getattr(module, class_name)
+
+    if os.path.exists(golden):
+        path = golden
+    else:
+        path = os.path.join(os.path.dirname(module.__file__), 'tests',
+                            class_name, 'cli', 'equal',
+                            '{}_output.txt'.format(golden))
+    arguments = {}
+    arguments_path = path.replace('_output.txt', '_arguments.json')
+    if arguments_path != path and os.path.exists(arguments_path):
+        with open(arguments_path) as f:
+            arguments = json.load(f)
+    with open(path) as f:
+        return local_class, f.read(), arguments, record
+
+
+def main(args=None):
+    my_parser = argparse.ArgumentParser(
+        description='Find parsers whose cost grows faster than their output')
+    my_parser.add_argument('parsers', nargs='*',
+                           help='Parsers to scale, {} by default, or '
+                                'module.Class with --golden and --record'
+                                .format(', '.join(SCALE_TARGETS)))
+    my_parser.add_argument('--golden',
+                           help='Golden test, or path of an output, to scale')
+    my_parser.add_argument('--record',
+                           help='Regex matching the first line of a record')
+    my_parser.add_argument('--factors', default=','.join(
+                               str(f) for f in DEFAULT_FACTORS),
+                           help='Comma separated scale factors')
+    my_parser.add_argument('--repeat', type=int, default=3,
+                           help='Number of timed runs, the fastest one is kept')
+    my_parser.add_argument('--tolerance', type=float,
+                           default=DEFAULT_TOLERANCE,
+                           help='Growth exponent above 1 + tolerance is '
+                                'flagged as superlinear')
+    my_parser.add_argument('--no-memory', action='store_true',
+                           help='Do not measure the peak allocation')
+    args = my_parser.parse_args(args)
+
+    factors = sorted(int(f) for f in args.factors.split(','))
+    superlinear = []
+    for name in args.parsers or SCALE_TARGETS:
+        local_class, output, arguments, record = load_target(
+            name, args.golden, args.record)
+        result = scale_up(local_class, output, record, arguments,
+                          factors=factors, repeat=args.repeat,
+                          memory=not args.no_memory)
+        print(format_report(name, result, args.tolerance) + '\n')
+        if is_superlinear(result, args.tolerance):
+            superlinear.append(name)
+
+    if superlinear:
+        print('Superlinear parsers: {}'.format(', '.join(superlinear)))
+    return 1 if superlinear else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
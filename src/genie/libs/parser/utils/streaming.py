@@ -0,0 +1,82 @@
+'''Streaming parse mode for parsers of large tables
+
+The `cli()` of a parser returns one structure holding every entry of the
+output. For a full routing table this structure, and the output string it
+was parsed from, take several GB. Parsers which support it also provide
+`parse_iter()`, which reads the output line by line and yields each entry
+(a route, a prefix with its paths) as soon as the parser moved past it:
+
+    with open('show_ip_route.txt') as f:
+        for (vrf, af, route), route_dict in ShowIpRoute(device=None).parse_iter(f):
+            ...
+
+A parser supporting it moves the loop of its `cli()` to a generator. The
+generator keeps building the structure like before, and yields a
+`(keys, container, record)` entry each time it adds a record, or updates
+it: `record` is the leaf dict of the schema, `container` the dict or list
+holding it and `keys` the keys which locate it in the structure. `cli()`
+runs the generator to the end and returns the structure, while
+`parse_iter()` passes it to `iter_records()` which yields each record once
+the next one is started, and removes it from the structure so the memory
+used stays flat.
+'''
+
+
+def iter_lines(output):
+    '''return an iterator over the lines of an output
+
+        Args:
+            output (`str`, `file`, `iterable`): the output as a string, a
+                file object opened in text mode or any iterable of lines
+
+        Returns:
+            iterator of the lines, without their line terminator
+    '''
+    if isinstance(output, str):
+        return iter(output.splitlines())
+    return (line.rstrip('\r\n') for line in output)
+
+
+def iter_records(entries):
+    '''yield the records of a parser generator once they are complete
+
+    A record is complete when the generator starts another one, or is
+    exhausted. It is then removed from its container, so the structure
+    built by the generator never holds more than a couple of records.
+
+        Args:
+            entries (`iterable`): (keys, container, record) of each record
+                the parser adds or updates
+
+        Returns:
+            generator of (keys, record)
+    '''
+    previous = None
+    for entry in entries:
+        if previous is not None:
+            if entry[2] is previous[2]:
+                # still the same record
+                continue
+            _release(previous[1], previous[2])
+            yield previous[0], previous[2]
+        previous = entry
+
+    if previous is not None:
+        _release(previous[1], previous[2])
+        yield previous[0], previous[2]
+
+
+def _release(container, record):
+    '''remove a record from its container'''
+
+    # compared by identity, an equal record may be another entry
+    if isinstance(container, list):
+        for index, item in enumerate(container):
+            if item is record:
+                del container[index]
+                return
+    else:
+        for key, item in container.items():
+            if item is record:
+                del container[key]
+                return
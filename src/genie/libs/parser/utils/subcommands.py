@@ -0,0 +1,79 @@
+'''Independent sub-commands of a parser, executed concurrently
+
+Some parsers execute several commands which do not depend on each other,
+such as their command and `show bgp all neighbors | i BGP neighbor` to find
+the VRF of a neighbor, and stitch the outputs together. Executed one after
+the other, each of them waits for the previous one. A parser declares them
+with `execute_many()` instead:
+
+    show_output, vrf_output = execute_many(self.device, [
+        cmd, 'show bgp all neighbors | i BGP neighbor'])
+
+The outputs are returned in the order of the commands, whatever the order
+they complete in, so the parser merges them the same way every time.
+
+By default the commands are executed one after the other, like before, as
+a CLI connection runs one command at a time. Within `concurrent_execute()`
+they are executed by a pool of threads, for devices connected with a pool
+of connections or a transport taking concurrent commands:
+
+    device.connect(pool_size=4)
+    with concurrent_execute(max_workers=4):
+        device.parse('show bgp all neighbors 10.4.6.6 advertised-routes')
+
+With `aparse()` the commands of `execute_many()` are all missing from the
+same pass, and are awaited concurrently.
+'''
+
+# python
+import threading
+import contextlib
+import concurrent.futures
+
+_lock = threading.Lock()
+# executors of each nested concurrent_execute(), the last one is used
+_executors = []
+
+
+def execute_many(device, commands, **kwargs):
+    '''execute independent commands with a device
+
+        Args:
+            device (`Device`): device of the parser
+            commands (`list`): commands to execute, the same command is
+                executed once
+            **kwargs: arguments of device.execute()
+
+        Returns:
+            list of the outputs, in the order of commands
+    '''
+    commands = list(commands)
+    unique = list(dict.fromkeys(commands))
+    executor = _executors[-1] if _executors else None
+
+    if executor is None or len(unique) < 2:
+        outputs = {command: device.execute(command, **kwargs)
+                   for command in unique}
+    else:
+        futures = {command: executor.submit(device.execute, command, **kwargs)
+                   for command in unique}
+        # the first exception in the order of the commands is raised
+        outputs = {command: future.result()
+                   for command, future in futures.items()}
+    return [outputs[command] for command in commands]
+
+
+@contextlib.contextmanager
+def concurrent_execute(max_workers=4):
+    '''execute the commands of execute_many() concurrently, with a pool of
+    max_workers threads, within a with block'''
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='execute_many')
+    with _lock:
+        _executors.append(executor)
+    try:
+        yield executor
+    finally:
+        with _lock:
+            _executors.remove(executor)
+        executor.shutdown(wait=True)
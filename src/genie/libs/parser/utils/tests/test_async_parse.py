@@ -0,0 +1,141 @@
+import os
+import asyncio
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils.execute_cache import ExecuteCache
+from genie.libs.parser.utils.async_parse import (aparse, aparse_many,
+                                                 iter_aparse, FakeAsyncDevice)
+from genie.libs.parser.iosxe import show_interface
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+OUTPUTS = {
+    'show vrf': 'red\nblue\ngreen\n',
+    'show ip route vrf red': '10.1.0.0/16\n',
+    'show ip route vrf blue': '10.2.0.0/16\n10.3.0.0/16\n',
+    'show ip route vrf green': '',
+}
+
+
+class ShowRoutes(MetaParser):
+    '''executes a command for each VRF of show vrf'''
+
+    cli_command = 'show vrf'
+
+    def cli(self, output=None):
+        vrfs = self.device.execute(self.cli_command).split()
+        ret_dict = {}
+        for vrf in vrfs:
+            out = self.device.execute('show ip route vrf {}'.format(vrf))
+            ret_dict[vrf] = out.split()
+        if not ret_dict:
+            raise ValueError('no vrf')
+        return ret_dict
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestAparse(unittest.TestCase):
+
+    def test_fanout(self):
+        device = FakeAsyncDevice(OUTPUTS, latency=0.01)
+        result = run(aparse(ShowRoutes(device=device)))
+        self.assertEqual(result, {'red': ['10.1.0.0/16'],
+                                  'blue': ['10.2.0.0/16', '10.3.0.0/16'],
+                                  'green': []})
+        self.assertEqual(device.executed[0], 'show vrf')
+        self.assertEqual(sorted(device.executed[1:]),
+                         ['show ip route vrf blue', 'show ip route vrf green',
+                          'show ip route vrf red'])
+        # the commands of each vrf are executed concurrently
+        self.assertEqual(device.max_in_flight, 3)
+
+    def test_sequential(self):
+        device = FakeAsyncDevice(OUTPUTS)
+        result = run(aparse(ShowRoutes(device=device), fanout=False))
+        self.assertEqual(result['blue'], ['10.2.0.0/16', '10.3.0.0/16'])
+        self.assertEqual(device.executed, [
+            'show vrf', 'show ip route vrf red', 'show ip route vrf blue',
+            'show ip route vrf green'])
+        self.assertEqual(device.max_in_flight, 1)
+
+    def test_limit(self):
+        device = FakeAsyncDevice(OUTPUTS, latency=0.01)
+        run(aparse(ShowRoutes(device=device), limit=2))
+        self.assertEqual(device.max_in_flight, 2)
+
+    def test_errors(self):
+        device = FakeAsyncDevice({})
+        with self.assertRaises(ValueError):
+            run(aparse(ShowRoutes(device=device)))
+
+        async def execute(command):
+            raise ConnectionError(command)
+
+        with self.assertRaises(ConnectionError):
+            run(aparse(ShowRoutes(device=device), execute=execute))
+
+    def test_same_as_parse(self):
+        folder = os.path.join(os.path.dirname(show_interface.__file__),
+                              'tests', 'ShowInterfaces', 'cli', 'equal')
+        with open(os.path.join(folder, 'golden_output_1_output.txt')) as f:
+            output = f.read()
+        expected = ShowInterfaces(device=Mock(**{
+            'execute.return_value': output})).parse()
+        device = FakeAsyncDevice({'show interfaces': output})
+        self.assertEqual(run(aparse(ShowInterfaces(device=device))),
+                         expected)
+
+    def test_execute_cache(self):
+        device = FakeAsyncDevice(OUTPUTS)
+        with ExecuteCache():
+            run(aparse(ShowRoutes(device=device)))
+            result = run(aparse(ShowRoutes(device=device)))
+        self.assertEqual(len(device.executed), 4)
+        self.assertEqual(result['red'], ['10.1.0.0/16'])
+
+
+class TestAparseMany(unittest.TestCase):
+
+    def test_many_devices(self):
+        devices = [FakeAsyncDevice(OUTPUTS, latency=0.01) for _ in range(20)]
+        jobs = ((ShowRoutes(device=device), {}) for device in devices)
+        results = run(aparse_many(jobs, limit=5))
+        self.assertEqual(len(results), 20)
+        self.assertTrue(all(r['red'] == ['10.1.0.0/16'] for r in results))
+
+    def test_exceptions(self):
+        devices = [FakeAsyncDevice(OUTPUTS), FakeAsyncDevice({})]
+        jobs = [(ShowRoutes(device=device), {}) for device in devices]
+        results = run(aparse_many(jobs, return_exceptions=True))
+        self.assertEqual(results[0]['green'], [])
+        self.assertIsInstance(results[1], ValueError)
+
+        with self.assertRaises(ValueError):
+            run(aparse_many(jobs))
+
+    def test_in_flight(self):
+        in_flight = []
+
+        class Device(FakeAsyncDevice):
+            async def execute(self, command, **kwargs):
+                in_flight.append(sum(d.in_flight for d in devices) + 1)
+                return await super().execute(command, **kwargs)
+
+        devices = [Device(OUTPUTS, latency=0.01) for _ in range(10)]
+
+        async def collect():
+            jobs = ((ShowRoutes(device=device), {}) for device in devices)
+            return [index async for index, _ in iter_aparse(jobs, limit=2)]
+
+        self.assertEqual(sorted(run(collect())), list(range(10)))
+        # 2 parsers in flight, of 3 commands at most
+        self.assertLessEqual(max(in_flight), 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import os
+import glob
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.batch import parse_many, iter_parse_many
+from genie.libs.parser.iosxe import show_interface
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+
+class TestParseMany(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        folder = os.path.join(os.path.dirname(show_interface.__file__),
+                              'tests', 'ShowInterfaces', 'cli', 'equal')
+        cls.outputs = []
+        for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+            if os.path.exists(path.replace('_output.txt', '_arguments.json')):
+                continue
+            with open(path) as f:
+                cls.outputs.append(f.read())
+        cls.expected = [ShowInterfaces(device=Mock()).parse(output=output)
+                        for output in cls.outputs]
+
+    def test_in_order(self):
+        results = parse_many(ShowInterfaces, self.outputs, device=Mock())
+        self.assertEqual(results, self.expected)
+
+    def test_iterator(self):
+        results = parse_many(ShowInterfaces, iter(self.outputs))
+        self.assertEqual(results, self.expected)
+
+    def test_raise(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            parse_many(ShowInterfaces, [self.outputs[0], ''])
+
+    def test_return_exceptions(self):
+        results = parse_many(ShowInterfaces, ['', self.outputs[0]],
+                             return_exceptions=True)
+        self.assertIsInstance(results[0], SchemaEmptyParserError)
+        self.assertEqual(results[1], self.expected[0])
+
+    def test_processes(self):
+        results = parse_many(ShowInterfaces, self.outputs * 2, processes=2,
+                             chunksize=3)
+        self.assertEqual(results, self.expected * 2)
+
+    def test_window(self):
+        read = []
+
+        def outputs():
+            for index in range(40):
+                read.append(index)
+                yield self.outputs[index % len(self.outputs)]
+
+        results = iter_parse_many(ShowInterfaces, outputs(), processes=2,
+                                  chunksize=2)
+        self.assertEqual(next(results), self.expected[0])
+        # two chunks for each worker, and the one sent after the first
+        self.assertLessEqual(len(read), 2 * 2 * 2 + 2)
+        self.assertEqual(len(list(results)), 39)
+        self.assertEqual(len(read), 40)
+
+    def test_iter_serial(self):
+        read = []
+
+        def outputs():
+            for output in self.outputs:
+                read.append(output)
+                yield output
+
+        results = iter_parse_many(ShowInterfaces, outputs())
+        self.assertEqual(next(results), self.expected[0])
+        self.assertEqual(len(read), 1)
+        self.assertEqual([self.expected[0]] + list(results), self.expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import patch
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils import benchmark
+
+
+class ShowLines(MetaParser):
+
+    def cli(self, output=None):
+        out = self.device.execute('show lines')
+        return {'lines': len(out.splitlines())}
+
+
+class ShowNothingSchema(MetaParser):
+    schema = {'lines': int}
+
+
+class ShowNothing(ShowNothingSchema):
+
+    def cli(self, output=None):
+        return {}
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def test_measure(self):
+        result = benchmark.measure(ShowLines, 'a\nb\nc\n', warmup=1,
+                                   repeat=3)
+        self.assertEqual(result['lines'], 3)
+        self.assertEqual(result['bytes'], 6)
+        self.assertGreater(result['lines_per_second'], 0)
+        self.assertLessEqual(result['seconds'], result['median_seconds'])
+        self.assertIn('peak_bytes', result)
+
+        result = benchmark.measure(ShowLines, 'a\n', memory=False)
+        self.assertNotIn('peak_bytes', result)
+
+    def test_measure_error(self):
+        result = benchmark.measure(ShowNothing, 'a\n')
+        self.assertTrue(result['error'].startswith('SchemaEmptyParserError'))
+
+    def test_compare(self):
+        baseline = {
+            'slower': {'seconds': 0.009, 'median_seconds': 0.010,
+                       'peak_bytes': 10 ** 6},
+            'noise': {'seconds': 0.0019, 'median_seconds': 0.002,
+                      'peak_bytes': 10 ** 3},
+            # one lucky run of the baseline
+            'fastest': {'seconds': 0.001, 'median_seconds': 0.010},
+            'errored': {'error': 'ValueError: '},
+        }
+        results = {
+            'slower': {'seconds': 0.019, 'median_seconds': 0.020,
+                       'peak_bytes': 10 ** 6},
+            'noise': {'seconds': 0.0026, 'median_seconds': 0.0027,
+                      'peak_bytes': 10 ** 4},
+            'fastest': {'seconds': 0.009, 'median_seconds': 0.010},
+            'errored': {'seconds': 1.0, 'median_seconds': 1.0},
+            'new': {'seconds': 1.0, 'median_seconds': 1.0},
+        }
+        self.assertEqual(benchmark.compare(results, baseline),
+                         [('slower', 'median_seconds', 0.010, 0.020)])
+        self.assertEqual(benchmark.compare(results, baseline, threshold=1.5),
+                         [])
+
+        report = benchmark.format_report(
+            {'slower': dict(results['slower'], lines=10, bytes=100,
+                            lines_per_second=500, bytes_per_second=5000),
+             'errored': {'error': 'ValueError: '}},
+            benchmark.compare(results, baseline))
+        self.assertIn('1 golden tests, 1 errored', report)
+        self.assertIn('slower median_seconds: 0.01 -> 0.02 (+100%)', report)
+
+    def test_confirm(self):
+        baseline = {'busy': {'median_seconds': 0.002},
+                    'slower': {'median_seconds': 0.002}}
+        results = {'busy': {'median_seconds': 0.004},
+                   'slower': {'median_seconds': 0.004}}
+        measured = {'busy': {'median_seconds': 0.002},
+                    'slower': {'median_seconds': 0.005}}
+
+        def run_benchmark(parsers, names=None, **kwargs):
+            return {name: measured[name] for name in names}
+
+        with patch.object(benchmark, 'run_benchmark',
+                          side_effect=run_benchmark) as run:
+            self.assertEqual(
+                benchmark.confirm({}, results, baseline, repeat=3),
+                [('slower', 'median_seconds', 0.002, 0.004)])
+        self.assertEqual(run.call_count, 2)
+        self.assertEqual(run.call_args[1], {'names': {'slower'}, 'repeat': 3})
+        # the fastest median is kept
+        self.assertEqual(results['busy'], {'median_seconds': 0.002})
+        self.assertEqual(results['slower'], {'median_seconds': 0.004})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import inspect
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.bigip import resources
+from genie.libs.parser.bigip.resources import RESOURCES, RestResource
+
+
+class TestResources(unittest.TestCase):
+
+    def test_table(self):
+        self.assertEqual(len(RESOURCES), 739)
+        # one parser for each path
+        self.assertEqual(len(set(RESOURCES.values())), len(RESOURCES))
+        for path in RESOURCES.values():
+            self.assertTrue(path.startswith('/mgmt/tm/'), path)
+
+    def test_make_json(self):
+        from genie.json.make_json import MakeParsers
+
+        # the json files are built from the source of the classes
+        maker = MakeParsers({'root_directories': {'bigip': {
+            'root': 'genie.libs.parser.bigip',
+            'mod_name': 'bigip',
+            'url': {'link': 'https://github.com/CiscoTestAutomation/'
+                            'genieparser/tree/{branch}/',
+                    'branch': 'master',
+                    'style': 'github'}}}})
+        maker.make()
+        for name, path in RESOURCES.items():
+            folder = maker.output[path]['folders']['bigip']
+            self.assertEqual(folder['class'], name)
+            self.assertEqual(folder['doc'],
+                             'To F5 resource for {}'.format(path))
+
+        _, line = inspect.getsourcelines(resources.NetWccp)
+        self.assertTrue(maker.output['/mgmt/tm/net/wccp']['folders']['bigip'][
+            'url'].endswith('bigip/resources.py#L{}'.format(line)))
+
+    def test_class(self):
+        from genie.libs.parser.bigip.resources import NetWccp
+        self.assertTrue(issubclass(NetWccp, RestResource))
+        self.assertEqual(NetWccp.cli_command, '/mgmt/tm/net/wccp')
+        self.assertEqual(NetWccp.__module__, resources.__name__)
+        self.assertEqual(NetWccp.__qualname__, 'NetWccp')
+        self.assertEqual(NetWccp.__doc__,
+                         'To F5 resource for /mgmt/tm/net/wccp')
+        # names which do not follow the path
+        self.assertEqual(resources.Live_updateBotsignatures.cli_command,
+                         '/mgmt/tm/live-update/bot-signatures')
+
+    def test_unknown(self):
+        with self.assertRaises(AttributeError):
+            resources.NetWccpp
+        with self.assertRaises(ImportError):
+            from genie.libs.parser.bigip.resources import NetWccpp
+
+    def test_found(self):
+        # the classes found walking the module, as the json files are built
+        parsers = {name: cls for name, cls in inspect.getmembers(resources)
+                   if inspect.isclass(cls) and hasattr(cls, 'cli_command')
+                   and cls.__module__ == resources.__name__}
+        self.assertEqual(set(parsers), set(RESOURCES))
+        self.assertEqual({cls.cli_command for cls in parsers.values()},
+                         set(RESOURCES.values()))
+
+    def test_rest(self):
+        device = Mock()
+        device.get.return_value.json.return_value = {'kind': 'tm:sys:folder'}
+        self.assertEqual(resources.SysFolder(device=device).rest(),
+                         {'kind': 'tm:sys:folder'})
+        device.get.assert_called_once_with('/mgmt/tm/sys/folder')
+
+        device.get.return_value.json.return_value = None
+        self.assertEqual(resources.SysFolder(device=device).rest(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
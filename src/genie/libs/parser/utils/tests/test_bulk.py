@@ -0,0 +1,148 @@
+import io
+import os
+import json
+import tarfile
+import tempfile
+import unittest
+from unittest.mock import patch
+from multiprocessing.pool import ThreadPool
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils import bulk
+
+
+class ShowLinesSchema(MetaParser):
+    schema = {'lines': int}
+
+
+class ShowLines(ShowLinesSchema):
+
+    def cli(self, output=None):
+        lines = [line for line in output.splitlines() if line.strip()]
+        if not lines:
+            return {}
+        return {'lines': len(lines)}
+
+
+def get_parser(command, device):
+    return ShowLines, {}
+
+
+class TestBulkParse(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.outputs = os.path.join(self.folder.name, 'outputs')
+        os.makedirs(os.path.join(self.outputs, 'R1'))
+        with open(os.path.join(self.outputs, 'R1', 'version.txt'), 'w') as f:
+            f.write('Cisco IOS XE Software\nuptime is 1 day\n')
+        with open(os.path.join(self.outputs, 'R1', 'empty.txt'), 'w') as f:
+            f.write('\n')
+
+        self.manifest = os.path.join(self.folder.name, 'manifest.csv')
+        with open(self.manifest, 'w') as f:
+            f.write('file,os,platform,command\n'
+                    'R1/version.txt,iosxe,cat9k,show version\n'
+                    'R1/empty.txt,iosxe,,show version\n'
+                    'R2/missing.txt,nxos,,show version\n')
+
+    def test_read_manifest(self):
+        entries = bulk.read_manifest(self.manifest)
+        self.assertEqual(entries[0], {'file': 'R1/version.txt', 'os': 'iosxe',
+                                      'platform': 'cat9k',
+                                      'command': 'show version'})
+        self.assertIsNone(entries[1]['platform'])
+
+    def test_read_manifest_json_lines(self):
+        manifest = os.path.join(self.folder.name, 'manifest.jsonl')
+        with open(manifest, 'w') as f:
+            f.write(json.dumps({'file': './R1/version.txt', 'os': 'iosxe',
+                                'command': 'show version'}) + '\n\n')
+        self.assertEqual(bulk.read_manifest(manifest),
+                         [{'file': 'R1/version.txt', 'os': 'iosxe',
+                           'platform': None, 'command': 'show version'}])
+
+        with open(manifest, 'w') as f:
+            f.write(json.dumps({'file': 'R1/version.txt', 'os': 'iosxe'}))
+        with self.assertRaisesRegex(ValueError, 'entry 1 has no command'):
+            bulk.read_manifest(manifest)
+
+    def test_iter_outputs_tarball(self):
+        tarball = os.path.join(self.folder.name, 'outputs.tar.gz')
+        with tarfile.open(tarball, 'w:gz') as tar:
+            tar.add(self.outputs, arcname='.')
+
+        entries = bulk.read_manifest(self.manifest)
+        outputs = {entry['file']: output
+                   for entry, output in bulk.iter_outputs(tarball, entries)}
+        self.assertEqual(outputs['R1/version.txt'],
+                         'Cisco IOS XE Software\nuptime is 1 day\n')
+        self.assertEqual(outputs['R1/empty.txt'], '\n')
+        self.assertIsNone(outputs['R2/missing.txt'])
+
+    def test_iter_outputs_duplicates(self):
+        tarball = os.path.join(self.folder.name, 'outputs.tar')
+        with tarfile.open(tarball, 'w') as tar:
+            tar.add(self.outputs, arcname='.')
+
+        entries = bulk.read_manifest(self.manifest)
+        # the same files parsed again, with another command
+        entries += [dict(entry, command='show version | i uptime')
+                    for entry in entries]
+        for source in (self.outputs, tarball):
+            outputs = sorted((entry['file'], entry['command'], output)
+                             for entry, output in bulk.iter_outputs(source,
+                                                                    entries))
+            self.assertEqual(len(outputs), 6, source)
+            self.assertEqual(outputs[2:4], [
+                ('R1/version.txt', 'show version',
+                 'Cisco IOS XE Software\nuptime is 1 day\n'),
+                ('R1/version.txt', 'show version | i uptime',
+                 'Cisco IOS XE Software\nuptime is 1 day\n')])
+            self.assertIsNone(outputs[5][2])
+
+    @patch.object(bulk, 'get_parser', get_parser)
+    def test_bulk_parse(self):
+        output = io.StringIO()
+        stats = bulk.bulk_parse(self.outputs, self.manifest, output, workers=1)
+
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0]['parsed'], {'lines': 2})
+        self.assertTrue(results[0]['parser'].endswith('.ShowLines'))
+        self.assertTrue(results[1]['error'].startswith(
+            'SchemaEmptyParserError'))
+        self.assertTrue(results[2]['error'].startswith('FileNotFoundError'))
+
+        self.assertEqual(stats['show version']['outputs'], 3)
+        self.assertEqual(stats['show version']['failures'], 2)
+        self.assertIn('show version', bulk.format_report(stats, 1.0))
+
+    @patch.object(bulk, 'get_parser', get_parser)
+    def test_window(self):
+        read = []
+
+        def items():
+            for number in range(1000):
+                read.append(number)
+                yield ({'file': '{}.txt'.format(number), 'os': 'iosxe',
+                        'platform': None, 'command': 'show version'},
+                       'line {}\n'.format(number))
+
+        with ThreadPool(2) as pool:
+            results = bulk._imap_window(pool, items(), 2, 4)
+            first = next(results)
+            # two chunks for each worker, and the chunk sent after the first
+            self.assertLessEqual(len(read), 5 * 4)
+            results = [first] + list(results)
+        self.assertEqual(len(read), 1000)
+        self.assertEqual([json.loads(line)['file']
+                          for _, line, _, _, _ in results[:3]],
+                         ['0.txt', '1.txt', '2.txt'])
+        self.assertTrue(all(parsed for _, _, parsed, _, _ in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
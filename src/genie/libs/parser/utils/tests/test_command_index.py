@@ -0,0 +1,80 @@
+import re
+import unittest
+
+from genie.libs.parser.utils import common
+
+
+class TestCommandIndex(unittest.TestCase):
+
+    def setUp(self):
+        common.parser_data = None
+        common.command_index = None
+
+    def _linear_search(self, tokens, fuzzy):
+        return [command for command in common.parser_data
+                if common._matches_fuzzy(0, 0, tokens.copy(), command, {},
+                                         fuzzy)]
+
+    def test_index_built_on_load(self):
+        data = common._load_parser_json()
+        self.assertIs(common.command_index.data, data)
+        self.assertIn('show version', common.command_index.position)
+
+    def test_index_rebuilt_on_new_data(self):
+        common._load_parser_json()
+        index = common.command_index
+        common.parser_data = {'show version': None}
+        common._fuzzy_search_command('sh ver', False)
+        self.assertIsNot(common.command_index, index)
+        self.assertEqual(len(common.command_index), 1)
+
+    def test_candidates_simple(self):
+        index = common.CommandIndex(['show version', 'show vrf',
+                                     'show vrf {vrf}', 'ps -ef'])
+        self.assertEqual(index.candidates('sh v'.split(), False),
+                         ['show version', 'show vrf'])
+        self.assertEqual(index.candidates('sh vr red'.split(), False),
+                         ['show vrf {vrf}'])
+        self.assertEqual(index.candidates('sh .*'.split(), True),
+                         ['show version', 'show vrf', 'show vrf {vrf}'])
+        self.assertEqual(index.candidates('p -ef'.split(), False), ['ps -ef'])
+        self.assertEqual(index.candidates('show clock'.split(), False), [])
+
+    def test_candidates_embedded_argument(self):
+        index = common.CommandIndex(['/dna/intent/api/v1/interface',
+                                     '/dna/intent/api/v1/interface/{interface}'])
+        self.assertEqual(
+            index.candidates(['/dna/intent/api/v1/interface/argument'], False),
+            ['/dna/intent/api/v1/interface/{interface}'])
+
+    def test_add(self):
+        positions = {'show vrf': 0, 'show version': 1, 'show vrf {vrf}': 2}
+        index = common.CommandIndex(['show version'], positions=positions)
+        self.assertEqual(index.candidates('sh .*'.split(), True),
+                         ['show version'])
+        self.assertEqual(index.candidates('sh vr'.split(), False), [])
+
+        # the caches of the nodes are dropped for the new commands
+        index.add(['show vrf {vrf}', 'show clock', 'show vrf'])
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.candidates('sh .*'.split(), True),
+                         ['show vrf', 'show version', 'show vrf {vrf}',
+                          'show clock'])
+        self.assertEqual(index.candidates('sh v'.split(), False),
+                         ['show vrf', 'show version'])
+
+    def test_candidates_include_all_matches(self):
+        common._load_parser_json()
+        index = common.command_index
+
+        # every command matching a search must be a candidate for it
+        for command in list(common.parser_data)[::50]:
+            search = re.sub('{.*?}', 'argument', command).split()
+            for fuzzy in (False, True):
+                candidates = index.candidates(search, fuzzy)
+                for match in self._linear_search(search, fuzzy):
+                    self.assertIn(match, candidates, search)
+
+
+if __name__ == '__main__':
+    unittest.main()
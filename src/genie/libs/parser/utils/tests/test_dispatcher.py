@@ -0,0 +1,172 @@
+import os
+import re
+import glob
+import unittest
+import importlib
+
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.dispatcher import LineDispatcher, analyse
+
+
+def cascade(patterns, line):
+    '''first match of the patterns tried one after the other'''
+    for name, regex in patterns:
+        m = regex.match(line)
+        if m:
+            return name, m
+    return None, None
+
+
+class TestAnalyse(unittest.TestCase):
+
+    def test_literal_prefix(self):
+        prefix, chars = analyse(re.compile(r'^Next +hop +type: +(?P<t>\S+)'))
+        self.assertEqual(prefix, 'Next')
+        self.assertIn('N', chars)
+        self.assertNotIn('n', chars)
+
+    def test_prefix_in_group(self):
+        prefix, _ = analyse(re.compile(r'^(?P<nh_string>Next *hop):'))
+        self.assertEqual(prefix, 'Next')
+
+    def test_first_chars(self):
+        prefix, chars = analyse(re.compile(r'^(?P<in_pkts>[0-9]+) +packets'))
+        self.assertEqual(prefix, '')
+        self.assertIn('7', chars)
+        self.assertNotIn('I', chars)
+
+    def test_branch(self):
+        _, chars = analyse(re.compile(r'^(Node +path|Forwarding +nexthops)'))
+        self.assertIn('N', chars)
+        self.assertIn('F', chars)
+        self.assertNotIn('P', chars)
+
+    def test_character_class(self):
+        _, chars = analyse(re.compile(r'^\s*Neighbor +(?P<n>\S+)$'))
+        self.assertIn(' ', chars)
+        self.assertIn('N', chars)
+        self.assertNotIn('A', chars)
+
+        _, chars = analyse(re.compile(r'^[^\s\d]+ +is +up'))
+        self.assertIn('G', chars)
+        self.assertNotIn('1', chars)
+
+    def test_any_start(self):
+        self.assertEqual(analyse(re.compile(r'^.*uptime')), ('', None))
+        self.assertEqual(analyse(re.compile(r'^\b(?P<w>\w+)')), ('', None))
+        # can match an empty line
+        self.assertEqual(analyse(re.compile(r'^(?P<a>\S+)?$')), ('', None))
+
+    def test_ignorecase(self):
+        self.assertEqual(analyse(re.compile(r'^Version', re.IGNORECASE)),
+                         ('', None))
+        self.assertEqual(analyse(re.compile(r'^(?i:Version)')), ('', None))
+
+
+class TestLineDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.patterns = Patterns(
+            p1=r'^(?P<table>\S+): +(?P<count>\d+) +destinations',
+            p2=r'^Task: +(?P<task>\S+)$',
+            p3=r'^Task: +(?P<task_name>[\S\s]+)$',
+            p4=r'^Age: +(?P<age>\S+)$',
+            p5=r'^(?P<number>\d+) +packets +input$',
+            p6=(r'^description: +(?P<text>.*)$', re.IGNORECASE),
+            p7=r'State: +<(?P<state>[\S\s]+)>$',
+        )
+        self.lines = ['inet.0: 929 destinations', 'Task: OSPF',
+                      'Task: OSPF3 I/O./var/run/ppmd_control', 'Age: 3w2d',
+                      '100 packets input', 'DESCRIPTION: uplink',
+                      'State: <Active Int>', 'Age:', '', 'unknown line']
+
+    def test_first_match(self):
+        dispatcher = LineDispatcher(self.patterns)
+        for line in self.lines:
+            name, m = dispatcher.match(line)
+            expected_name, expected = cascade(self.patterns.items(), line)
+            self.assertEqual(name, expected_name, line)
+            if expected:
+                self.assertEqual(m.groupdict(), expected.groupdict())
+
+    def test_order(self):
+        dispatcher = LineDispatcher(self.patterns, order=['p3', 'p2'])
+        self.assertEqual(dispatcher.match('Task: OSPF')[0], 'p3')
+        self.assertEqual(dispatcher.match('Age: 3w2d'), (None, None))
+        self.assertEqual(dispatcher.names(), ['p3', 'p2'])
+
+    def test_after(self):
+        dispatcher = LineDispatcher(self.patterns)
+        self.assertEqual(dispatcher.match('Task: OSPF')[0], 'p2')
+        self.assertEqual(dispatcher.match('Task: OSPF', after='p2')[0], 'p3')
+        self.assertEqual(dispatcher.match('Task: OSPF', after='p3'),
+                         (None, None))
+        with self.assertRaises(KeyError):
+            dispatcher.match('Task: OSPF', after='p9')
+
+    def test_candidates(self):
+        dispatcher = LineDispatcher(self.patterns)
+        names = [name for _, name, _, _ in dispatcher.candidates('Task: BGP')]
+        # p1 can start with any non space character, p6 is IGNORECASE
+        self.assertEqual(names, ['p1', 'p2', 'p3', 'p6'])
+        names = [name for _, name, _, _ in dispatcher.candidates('')]
+        self.assertEqual(names, ['p6'])
+
+    def test_list_of_patterns(self):
+        dispatcher = LineDispatcher([('a', r'^Task: +(?P<task>\S+)$'),
+                                     ('b', re.compile(r'^Age: +(?P<age>\S+)$'))])
+        self.assertEqual(dispatcher.match('Age: 1d')[0], 'b')
+
+    def test_shared_by_instances(self):
+        class Parser(object):
+            patterns = self.patterns
+            dispatcher = LineDispatcher(patterns)
+
+        Parser().dispatcher.match('Task: OSPF')
+        self.assertIs(Parser().dispatcher.candidates('Task: OSPF'),
+                      Parser.dispatcher.candidates('Task: BGP'))
+
+
+class TestParserDispatchers(unittest.TestCase):
+
+    # parsers using a dispatcher, and a parser with golden outputs for it
+    parsers = [
+        ('iosxe.show_interface', 'ShowInterfaces', 'ShowInterfaces'),
+        ('iosxe.show_interface', 'ShowPmPortInterface', 'ShowPmPortInterface'),
+        ('iosxe.show_bgp', 'ShowBgpNeighborSuperParser', 'ShowBgpAllNeighbors'),
+        ('iosxe.show_bgp', 'ShowBgpDetailSuperParser', 'ShowBgpAllDetail'),
+        ('junos.show_route', 'ShowRouteProtocolExtensive',
+         'ShowRouteProtocolExtensive'),
+    ]
+
+    def _golden_lines(self, module, name):
+        folder = os.path.join(os.path.dirname(module.__file__), 'tests', name,
+                              'cli', 'equal')
+        lines = set()
+        for path in glob.glob(os.path.join(folder, '*_output.txt')):
+            with open(path) as f:
+                lines.update(line.strip() for line in f.read().splitlines())
+        return sorted(lines)
+
+    def test_same_as_cascade(self):
+        for module_name, cls_name, golden in self.parsers:
+            module = importlib.import_module('genie.libs.parser.' + module_name)
+            dispatcher = getattr(module, cls_name).dispatcher
+            patterns = [(name, getattr(module, cls_name).patterns.get(name))
+                        for name in dispatcher.names()]
+
+            lines = self._golden_lines(module, golden)
+            self.assertTrue(lines, golden)
+            for line in lines:
+                name, m = dispatcher.match(line)
+                expected_name, expected = cascade(patterns, line)
+                self.assertEqual(name, expected_name, (cls_name, line))
+                for after in dispatcher.names()[:5]:
+                    index = dispatcher.index(after)
+                    self.assertEqual(
+                        dispatcher.match(line, after=after)[0],
+                        cascade(patterns[index + 1:], line)[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
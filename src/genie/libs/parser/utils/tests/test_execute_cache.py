@@ -0,0 +1,138 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils import execute_cache
+from genie.libs.parser.utils.execute_cache import ExecuteCache
+from genie.libs.parser.utils.instrumentation import enable, disable, MemorySink
+
+OUTPUTS = {
+    'show vrf': 'red 65000:1 ipv4\n',
+    'show bgp all neighbors | i BGP neighbor':
+        'BGP neighbor is 10.16.2.2,  vrf red,  remote AS 100\n',
+}
+
+
+class ShowVrf(MetaParser):
+
+    cli_command = 'show vrf'
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+        return {'vrf': {line.split()[0]: {'rd': line.split()[1]}
+                        for line in output.splitlines()}}
+
+
+class ShowBgpNeighbors(MetaParser):
+
+    cli_command = 'show bgp all neighbors'
+
+    def cli(self, neighbor='', output=None):
+        vrfs = ShowVrf(device=self.device).parse()
+        out = self.device.execute('show bgp all neighbors | i BGP neighbor')
+        ret_dict = {'vrf': {}}
+        for vrf in vrfs['vrf']:
+            ret_dict['vrf'][vrf] = {'neighbors': out.split()[3].strip(',')}
+        return ret_dict
+
+
+def new_device():
+    return Mock(**{'execute.side_effect': OUTPUTS.get})
+
+
+class TestExecuteCache(unittest.TestCase):
+
+    def test_nested_parsers(self):
+        device = new_device()
+        with ExecuteCache() as cache:
+            first = ShowBgpNeighbors(device=device).parse()
+            ShowVrf(device=device).parse()
+            first['vrf']['red'] = 'changed'
+            second = ShowBgpNeighbors(device=device).parse()
+
+        self.assertEqual(device.execute.call_count, 2)
+        self.assertEqual(second, {'vrf': {'red': {'neighbors': '10.16.2.2'}}})
+        self.assertEqual(cache.stats['parse_hits'], 2)
+
+        # inactive
+        ShowVrf(device=device).parse()
+        self.assertEqual(device.execute.call_count, 3)
+
+    def test_devices(self):
+        devices = new_device(), new_device()
+        with ExecuteCache():
+            for device in devices + devices:
+                ShowVrf(device=device).parse()
+        for device in devices:
+            device.execute.assert_called_once_with('show vrf')
+
+    def test_parse_arguments(self):
+        device = new_device()
+        with ExecuteCache() as cache:
+            ShowBgpNeighbors(device=device).parse(neighbor='10.16.2.2')
+            ShowBgpNeighbors(device=device).parse(neighbor='10.16.2.3')
+            ShowVrf(device=device).parse(output='blue 65000:2 ipv4')
+        # the nested ShowVrf is cached, output= is parsed again
+        self.assertEqual(cache.stats, {'execute_hits': 1, 'execute_misses': 2,
+                                       'parse_hits': 1, 'parse_misses': 3})
+        self.assertEqual(device.execute.call_count, 2)
+
+    def test_execute_only(self):
+        device = new_device()
+        with ExecuteCache(parse=False) as cache:
+            ShowBgpNeighbors(device=device).parse()
+            ShowBgpNeighbors(device=device).parse()
+        self.assertEqual(device.execute.call_count, 2)
+        self.assertEqual(cache.stats['parse_hits'], 0)
+        self.assertEqual(cache.stats['execute_hits'], 2)
+
+    def test_ttl(self):
+        device = new_device()
+        cache = ExecuteCache(ttl=10)
+        with patch.object(execute_cache.time, 'monotonic') as monotonic:
+            monotonic.return_value = 100
+            with cache:
+                ShowVrf(device=device).parse()
+            monotonic.return_value = 109
+            with cache:
+                ShowVrf(device=device).parse()
+            self.assertEqual(device.execute.call_count, 1)
+            monotonic.return_value = 110
+            with cache:
+                ShowVrf(device=device).parse()
+            self.assertEqual(device.execute.call_count, 2)
+
+        cache.invalidate(device)
+        self.assertEqual(len(cache), 0)
+
+    def test_errors_not_cached(self):
+        device = Mock(**{'execute.side_effect': [ConnectionError,
+                                                 'red 65000:1 ipv4']})
+        with ExecuteCache():
+            with self.assertRaises(ConnectionError):
+                ShowVrf(device=device).parse()
+            self.assertEqual(ShowVrf(device=device).parse(),
+                             {'vrf': {'red': {'rd': '65000:1'}}})
+
+    def test_hooks_restored(self):
+        parse = MetaParser.parse
+        sink = MemorySink()
+        cache = ExecuteCache()
+        device = new_device()
+
+        enable(sink)
+        cache.__enter__()
+        ShowVrf(device=device).parse()
+        disable()
+        ShowVrf(device=device).parse()
+        cache.__exit__(None, None, None)
+
+        self.assertIs(MetaParser.parse, parse)
+        self.assertEqual(device.execute.call_count, 1)
+        self.assertEqual(sum(s['calls'] for s in sink.stats.values()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import extension
+from genie.libs.parser.utils.extension import ExtendParsers, ExtensionCache,\
+                                              get_extension
+
+PACKAGE = 'genie.libs.parser.utils.tests.dummy_parser'
+
+
+class TestExtensionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.cache = ExtensionCache(self.location)
+
+    def tearDown(self):
+        shutil.rmtree(self.location)
+
+    def _extend(self):
+        ext = ExtendParsers(PACKAGE)
+        ext.extend()
+        return ext.output
+
+    def test_cache_written(self):
+        output = get_extension(PACKAGE, self.cache)
+        self.assertEqual(output, self._extend())
+        self.assertTrue(os.path.isfile(self.cache.path(PACKAGE)))
+        self.assertEqual(self.cache.packages(), [PACKAGE])
+
+    def test_cache_used(self):
+        output = get_extension(PACKAGE, self.cache)
+        with patch.object(extension, 'ExtendParsers') as mock_extend:
+            self.assertEqual(get_extension(PACKAGE, self.cache), output)
+            mock_extend.assert_not_called()
+
+    def test_cache_stale_on_file_change(self):
+        get_extension(PACKAGE, self.cache)
+        location = ExtensionCache.package_location(PACKAGE)
+        path = os.path.join(location, 'iosxe', 'show_clock.py')
+        stat = os.stat(path)
+        try:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            self.assertIsNone(self.cache.load(PACKAGE))
+        finally:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertIsNotNone(self.cache.load(PACKAGE))
+
+    def test_cache_disabled(self):
+        cache = ExtensionCache('false')
+        self.assertFalse(cache.enabled)
+        get_extension(PACKAGE, cache)
+        self.assertFalse(os.path.exists('false'))
+
+    def test_cache_remove(self):
+        get_extension(PACKAGE, self.cache)
+        self.cache.remove(PACKAGE)
+        self.assertIsNone(self.cache.load(PACKAGE))
+        self.assertEqual(self.cache.packages(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
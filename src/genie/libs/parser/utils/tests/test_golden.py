@@ -0,0 +1,82 @@
+import os
+import glob
+import marshal
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import golden
+from genie.libs.parser.utils.golden import load_expected_output
+
+
+class TestLoadExpectedOutput(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.addCleanup(self.folder.cleanup)
+        self.path = os.path.join(self.folder.name,
+                                 'golden_output_expected.py')
+        self.write("import pprint\n\n"
+                   "expected_output = {\n"
+                   "    'vrf': {'default': {'up': True, 'mtu': -1,\n"
+                   "                        'peers': ['10.0.0.1', None],\n"
+                   "                        'range': (1, 2.5)}},\n"
+                   "}\n")
+
+    def write(self, source):
+        with open(self.path, 'w') as f:
+            f.write(source)
+        # distinct mtime from the previous version of the file
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns,
+                                stat.st_mtime_ns + 10 ** 9))
+
+    def test_literal(self):
+        self.assertEqual(load_expected_output(self.path), {
+            'vrf': {'default': {'up': True, 'mtu': -1,
+                                'peers': ['10.0.0.1', None],
+                                'range': (1, 2.5)}}})
+
+    def test_cache(self):
+        expected = load_expected_output(self.path)
+        cache_files = glob.glob(os.path.join(self.folder.name, '__pycache__',
+                                              '*.literal'))
+        self.assertEqual(len(cache_files), 1)
+
+        # read back from the cache without parsing the file
+        with open(cache_files[0], 'rb') as f:
+            key, value = marshal.load(f)
+        with open(cache_files[0], 'wb') as f:
+            marshal.dump((key, {'cached': True}), f)
+        self.assertEqual(load_expected_output(self.path), {'cached': True})
+        self.assertEqual(load_expected_output(self.path, cache=False),
+                         expected)
+
+        # stale once the file changes
+        self.write("expected_output = {'changed': 1}\n")
+        self.assertEqual(load_expected_output(self.path), {'changed': 1})
+
+    def test_not_executed(self):
+        self.write("import os\n"
+                   "os.remove(__file__)\n"
+                   "expected_output = {}\n")
+        self.assertEqual(load_expected_output(self.path), {})
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_not_literal(self):
+        self.write("expected_output = {'a': false}\n")
+        with self.assertRaisesRegex(ValueError, 'is not a literal'):
+            load_expected_output(self.path)
+
+        self.write("expected_ouptut = {}\n")
+        with self.assertRaises(AttributeError):
+            load_expected_output(self.path)
+
+    def test_read_only_folder(self):
+        with patch.object(golden.os, 'makedirs',
+                          side_effect=PermissionError):
+            self.assertIn('vrf', load_expected_output(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import os
+import re
+import json
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.schemaengine import Any
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils import instrumentation
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.instrumentation import (instrument, enable,
+                                                     disable, is_enabled,
+                                                     MemorySink, JsonFileSink,
+                                                     LoggingSink)
+
+OUTPUT = '''\
+GigabitEthernet1 is up
+GigabitEthernet2 is down
+Description: uplink
+'''
+
+
+class ShowDummySchema(MetaParser):
+    schema = {'interfaces': {Any(): {'status': str}}}
+
+
+class ShowDummy(ShowDummySchema):
+
+    cli_command = 'show dummy'
+
+    patterns = Patterns(
+        p1=r'^(?P<interface>\S+) +is +(?P<status>\S+)$',
+    )
+
+    def cli(self, output=None):
+        if output is None:
+            output = self.device.execute(self.cli_command)
+
+        p2 = re.compile(r'^Description: +(?P<description>.*)$')
+
+        ret_dict = {}
+        for line in output.splitlines():
+            line = line.strip()
+
+            m = ShowDummy.patterns.p1.match(line)
+            if m:
+                ret_dict.setdefault('interfaces', {})[m['interface']] = {
+                    'status': m['status']}
+                continue
+
+            if re.match(r'^Speed', line):
+                continue
+
+            m = p2.match(line)
+        return ret_dict
+
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        # the regexes of this module are counted like the ones of a parser
+        patcher = patch.object(instrumentation, 'PARSER_PACKAGES',
+                               instrumentation.PARSER_PACKAGES + (__name__,))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_memory_sink(self):
+        sink = MemorySink()
+        with instrument(sink):
+            self.assertTrue(is_enabled())
+            ShowDummy(device=Mock()).parse(output=OUTPUT)
+            ShowDummy(device=Mock()).parse(output=OUTPUT)
+
+        stats = sink.stats['{}.ShowDummy'.format(__name__)]
+        self.assertEqual(stats['calls'], 2)
+        self.assertEqual(stats['errors'], 0)
+        self.assertEqual(stats['lines'], 6)
+        self.assertEqual(stats['bytes'], 2 * len(OUTPUT))
+        self.assertGreaterEqual(stats['seconds'], stats['schema_seconds'])
+        self.assertEqual(stats['regexes'], {
+            r'^(?P<interface>\S+) +is +(?P<status>\S+)$': [6, 4],
+            r'^Speed': [2, 0],
+            r'^Description: +(?P<description>.*)$': [2, 2],
+        })
+        self.assertIn('ShowDummy', sink.report())
+
+    def test_device_output(self):
+        sink = MemorySink()
+        device = Mock(**{'execute.return_value': OUTPUT})
+        parser = ShowDummy(device=device)
+        with instrument(sink):
+            parser.parse()
+        self.assertIs(parser.device, device)
+        device.execute.assert_called_once_with('show dummy')
+        stats = sink.stats['{}.ShowDummy'.format(__name__)]
+        self.assertEqual((stats['lines'], stats['bytes']), (3, len(OUTPUT)))
+
+    def test_error(self):
+        sink = MemorySink()
+        with instrument(sink):
+            with self.assertRaises(SchemaEmptyParserError):
+                ShowDummy(device=Mock()).parse(output='')
+        stats = sink.stats['{}.ShowDummy'.format(__name__)]
+        self.assertEqual((stats['calls'], stats['errors']), (1, 1))
+
+    def test_json_file_sink(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, 'records.json')
+            with instrument(JsonFileSink(path)):
+                ShowDummy(device=Mock()).parse(output=OUTPUT)
+            with open(path) as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 1)
+        self.assertEqual(records[0]['command'], 'show dummy')
+        self.assertEqual(records[0]['lines'], 3)
+        self.assertIsNone(records[0]['error'])
+
+    def test_logging_sink(self):
+        with self.assertLogs(instrumentation.log, 'INFO') as logs:
+            with instrument(LoggingSink()):
+                ShowDummy(device=Mock()).parse(output=OUTPUT)
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('ShowDummy: ', logs.output[0])
+        self.assertIn('3 lines', logs.output[0])
+
+    def test_disabled(self):
+        parse = MetaParser.parse
+        match = re.match
+        enable(MemorySink())
+        enable(MemorySink())
+        self.assertIsNot(MetaParser.parse, parse)
+        disable()
+        self.assertTrue(is_enabled())
+        disable()
+        self.assertFalse(is_enabled())
+        self.assertIs(MetaParser.parse, parse)
+        self.assertIs(re.match, match)
+
+        # the patterns are not counted anymore
+        with instrument(MemorySink()):
+            ShowDummy(device=Mock()).parse(output=OUTPUT)
+        self.assertIsInstance(ShowDummy.patterns.p1, re.Pattern)
+
+
+if __name__ == '__main__':
+    unittest.main()
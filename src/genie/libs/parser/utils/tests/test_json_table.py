@@ -0,0 +1,162 @@
+import os
+import json
+import glob
+import unittest
+import importlib.util
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.json_table import (Table, Field, is_json, loads,
+                                                rows, boolean, uptime)
+from genie.libs.parser.nxos import show_vrf, show_interface, show_bgp, \
+                                   show_routing
+
+NXOS_TESTS = os.path.join(os.path.dirname(show_vrf.__file__), 'tests')
+MODULES = (show_vrf, show_interface, show_bgp, show_routing)
+
+
+def read_expected(path):
+    spec = importlib.util.spec_from_file_location('expected', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.expected_output
+
+
+class TestLoads(unittest.TestCase):
+
+    def test_loads(self):
+        self.assertEqual(loads('show vrf | json\n{"a": 1}\nswitch# '),
+                         {'a': 1})
+        self.assertEqual(loads('{"a": {"b": 2}}]]>]]>'), {'a': {'b': 2}})
+        self.assertEqual(loads(' \n'), {})
+        with self.assertRaises(ValueError):
+            loads('% Invalid command at \'^\' marker.')
+
+    def test_is_json(self):
+        self.assertTrue(is_json('{"TABLE_vrf": {}}'))
+        self.assertTrue(is_json('show vrf | json\n{"TABLE_vrf": {}}\n'))
+        self.assertTrue(is_json('\n  {"a": 1}]]>]]>'))
+        self.assertFalse(is_json('VRF-Name   VRF-ID State   Reason\n'))
+        self.assertFalse(is_json('show vrf\n{"a": 1}'))
+        self.assertFalse(is_json(''))
+        self.assertFalse(is_json(None))
+
+    def test_rows(self):
+        self.assertEqual(rows({'TABLE_vrf': {'ROW_vrf': {'a': 1}}}, 'vrf'),
+                         [{'a': 1}])
+        self.assertEqual(rows({'TABLE_vrf': {'ROW_vrf': [{'a': 1},
+                                                         {'a': 2}]}}, 'vrf'),
+                         [{'a': 1}, {'a': 2}])
+        self.assertEqual(rows({'TABLE_vrf': [{'ROW_vrf': {'a': 1}},
+                                             {'ROW_vrf': {'a': 2}}]}, 'vrf'),
+                         [{'a': 1}, {'a': 2}])
+        self.assertEqual(rows({}, 'vrf'), [])
+
+    def test_convert(self):
+        self.assertTrue(boolean('TRUE'))
+        self.assertFalse(boolean('false'))
+        self.assertEqual(uptime('PT1H2M3S'), '01:02:03')
+        self.assertEqual(uptime('P1DT2H'), '1d02h')
+        self.assertEqual(uptime('P38W2D'), '38w2d')
+        self.assertEqual(uptime('P9D'), '1w2d')
+        self.assertEqual(uptime('never'), 'never')
+
+
+class TestTable(unittest.TestCase):
+
+    def test_apply(self):
+        table = Table(None, fields={'total': Field('total', int)}, tables=[
+            Table('vrf', key='name', into='vrf', fields={
+                'id': Field('id', int),
+                'state.admin': Field('admin', str.lower),
+                'up': Field('up', boolean, skip=(False,)),
+                'reason': Field('reason', default='--'),
+            }, tables=[
+                Table('nbr', key='id', into='neighbor',
+                      fields={'as': Field('as', int)}),
+            ], post=lambda row, vrf_dict: vrf_dict.update(rows=1)),
+        ])
+        data = {'total': '2', 'TABLE_vrf': {'ROW_vrf': [
+            {'name': 'red', 'id': '3', 'admin': 'UP', 'up': 'true',
+             'TABLE_nbr': {'ROW_nbr': {'id': '10.1.1.1', 'as': '100'}}},
+            {'name': 'blue', 'id': '4', 'admin': 'DOWN', 'up': 'false',
+             'reason': 'admin'},
+            # rows without a key are left out
+            {'id': '5'}]}}
+        self.assertEqual(table.apply(data), {
+            'total': 2,
+            'vrf': {
+                'red': {'id': 3, 'state': {'admin': 'up'}, 'up': True,
+                        'reason': '--', 'rows': 1,
+                        'neighbor': {'10.1.1.1': {'as': 100}}},
+                'blue': {'id': 4, 'state': {'admin': 'down'},
+                         'reason': 'admin', 'rows': 1}}})
+        self.assertEqual(table.apply({}), {})
+
+
+class TestNxosJson(unittest.TestCase):
+    '''the outputs of the commands with | json in json/equal, parsed by
+    cli(), give their expected output'''
+
+    def test_goldens(self):
+        outputs = sorted(glob.glob(os.path.join(
+            NXOS_TESTS, '*', 'json', 'equal', '*_output.txt')))
+        self.assertTrue(outputs)
+
+        for path in outputs:
+            name = path.split(os.sep)[-4]
+            cls = next(getattr(module, name) for module in MODULES
+                       if hasattr(module, name))
+            prefix = path[:-len('output.txt')]
+            arguments = {}
+            if os.path.exists(prefix + 'arguments.json'):
+                with open(prefix + 'arguments.json') as f:
+                    arguments = json.load(f)
+
+            with self.subTest(path):
+                with open(path) as f:
+                    output = f.read()
+                device = Mock()
+                self.assertEqual(
+                    cls(device=device).parse(output=output, **arguments),
+                    read_expected(prefix + 'expected.py'))
+                device.execute.assert_not_called()
+
+    def test_cli(self):
+        # the text output is still parsed with the regexes
+        with open(os.path.join(NXOS_TESTS, 'ShowVrf', 'cli', 'equal',
+                               'golden_output1_output.txt')) as f:
+            output = f.read()
+        parser = show_vrf.ShowVrf(device=Mock())
+        parser.json = Mock()
+        self.assertTrue(parser.parse(output=output))
+        parser.json.assert_not_called()
+
+    def test_arguments(self):
+        device = Mock(**{'execute.return_value': ''})
+        show_routing.ShowIpRoute(device=device).json(vrf='red', route='1.1.1.1')
+        device.execute.assert_called_with(
+            'show ip route 1.1.1.1 vrf red | json')
+        show_routing.ShowIpv6Route(device=device).json()
+        device.execute.assert_called_with('show ipv6 route vrf all | json')
+        show_routing.ShowRouting(device=device).json(protocol='bgp')
+        device.execute.assert_called_with('show routing bgp | json')
+
+    def test_include(self):
+        output = json.dumps({'TABLE_intf': [
+            {'ROW_intf': {'vrf-name-out': 'default', 'intf-name': 'Lo0',
+                          'proto-state': 'up', 'link-state': 'up',
+                          'admin-state': 'up', 'prefix': '10.1.1.1'}},
+            {'ROW_intf': {'vrf-name-out': 'management',
+                          'intf-name': 'mgmt0', 'proto-state': 'up',
+                          'link-state': 'up', 'admin-state': 'up',
+                          'prefix': '10.255.5.169'}}]})
+        parser = show_interface.ShowIpInterfaceBriefVrfAll(device=Mock())
+        self.assertEqual(parser.parse(ip='10.255.5.169', output=output), {
+            'interface': {'mgmt0': {
+                'vrf': 'management', 'ip_address': '10.255.5.169',
+                'interface_status': 'protocol-up/link-up/admin-up'}}})
+        self.assertEqual(parser.json(ip='10.9.9.9', output=output), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,246 @@
+import os
+import json
+import glob
+import unittest
+import importlib.util
+from unittest.mock import Mock
+from xml.sax.saxutils import escape, quoteattr
+
+from genie.libs.parser.utils import junos_display
+from genie.libs.parser.utils.junos_display import (select_command, from_xml,
+                                                   from_json)
+from genie.libs.parser.junos import show_route, show_ospf, show_interface, \
+                                    show_bgp
+
+JUNOS_TESTS = os.path.join(os.path.dirname(show_route.__file__), 'tests')
+PARSERS = [show_route.ShowRoute, show_route.ShowRouteProtocolExtensive,
+           show_ospf.ShowOspfNeighbor, show_ospf.ShowOspfDatabase,
+           show_ospf.ShowOspfDatabaseExtensive, show_interface.ShowInterfaces,
+           show_interface.ShowInterfacesExtensive, show_bgp.ShowBgpNeighbor,
+           show_bgp.ShowBgpSummary, show_bgp.ShowBgpGroupBrief]
+
+SHOW_ROUTE_XML = '''\
+show route protocol static | display xml
+<rpc-reply xmlns:junos="http://xml.juniper.net/junos/18.2R1/junos">
+    <route-information xmlns="http://xml.juniper.net/junos/18.2R1/junos-routing">
+        <!-- keepalive -->
+        <route-table>
+            <table-name>inet.0</table-name>
+            <destination-count>3</destination-count>
+            <total-route-count>3</total-route-count>
+            <active-route-count>3</active-route-count>
+            <holddown-route-count>0</holddown-route-count>
+            <hidden-route-count>0</hidden-route-count>
+            <rt junos:style="brief">
+                <rt-destination>0.0.0.0/0</rt-destination>
+                <rt-entry>
+                    <active-tag>*</active-tag>
+                    <current-active/>
+                    <last-active/>
+                    <protocol-name>Static</protocol-name>
+                    <preference>5</preference>
+                    <age junos:seconds="1225">00:20:25</age>
+                    <nh>
+                        <selected-next-hop/>
+                        <to>10.0.0.1</to>
+                        <via>ge-0/0/0.0</via>
+                    </nh>
+                    <nh-type>Reject</nh-type>
+                </rt-entry>
+            </rt>
+        </route-table>
+    </route-information>
+    <cli>
+        <banner></banner>
+    </cli>
+</rpc-reply>
+
+user@router> '''
+
+SHOW_ROUTE = {
+    'route-information': {
+        '@xmlns': 'http://xml.juniper.net/junos/18.2R1/junos-routing',
+        'route-table': [{
+            'table-name': 'inet.0',
+            'destination-count': '3',
+            'total-route-count': '3',
+            'active-route-count': '3',
+            'holddown-route-count': '0',
+            'hidden-route-count': '0',
+            'rt': [{
+                '@junos:style': 'brief',
+                'rt-destination': '0.0.0.0/0',
+                'rt-entry': {
+                    'active-tag': '*',
+                    'current-active': '',
+                    'last-active': '',
+                    'protocol-name': 'Static',
+                    'preference': '5',
+                    'age': {'#text': '00:20:25', '@junos:seconds': '1225'},
+                    'nh': [{'selected-next-hop': '',
+                            'to': '10.0.0.1',
+                            'via': 'ge-0/0/0.0'}],
+                    'nh-type': 'Reject'}}]}]}}
+
+
+def read_expected(path):
+    spec = importlib.util.spec_from_file_location('expected', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.expected_output
+
+
+def to_xml(tag, value):
+    '''rpc-reply of the dicts of an expected output, each with an element
+    the schema does not have'''
+    if isinstance(value, list):
+        return ''.join(to_xml(tag, item) for item in value)
+    if value is True:
+        return '<{}/>'.format(tag)
+    if not isinstance(value, dict):
+        return '<{0}>{1}</{0}>'.format(tag, escape(value))
+    attributes = ''.join(' {}={}'.format(key[1:], quoteattr(item))
+                         for key, item in value.items()
+                         if key.startswith('@') and key != '@xmlns')
+    body = escape(value.get('#text', '')) + '<unknown>1</unknown>'
+    body += ''.join(to_xml(key, item) for key, item in value.items()
+                    if key[0] != '@' and key != '#text')
+    return '<{0}{1}>{2}</{0}>'.format(tag, attributes, body)
+
+
+def to_json(value):
+    '''json of an expected output, as Junos gives it'''
+    if value is True:
+        return {'data': [None]}
+    if not isinstance(value, dict):
+        return {'data': value}
+    ret_dict = {'unknown': [{'data': '1'}]}
+    attributes = {key[1:]: item for key, item in value.items()
+                  if key.startswith('@')}
+    if attributes:
+        ret_dict['attributes'] = attributes
+    for key, item in value.items():
+        if key == '#text':
+            ret_dict['data'] = item
+        elif key[0] != '@':
+            items = item if isinstance(item, list) else [item]
+            ret_dict[key] = [to_json(i) for i in items]
+    return ret_dict
+
+
+def normalize(value):
+    '''expected output as the structured output has it: the text of the
+    elements without the spaces around it, and without the empty lists'''
+    if isinstance(value, dict):
+        return {key: normalize(item) for key, item in value.items()
+                if item != []}
+    if isinstance(value, list):
+        return [normalize(item) for item in value]
+    if isinstance(value, str):
+        return value.strip()
+    return value
+
+
+class TestSelectCommand(unittest.TestCase):
+
+    def test_select(self):
+        commands = show_route.ShowRouteProtocolExtensive.cli_command
+        self.assertEqual(select_command(commands), 'show route extensive')
+        self.assertEqual(select_command(commands, protocol='bgp'),
+                         'show route protocol bgp extensive')
+        self.assertEqual(select_command(commands, destination='10.1.0.0/24',
+                                        protocol=None),
+                         'show route extensive 10.1.0.0/24')
+        self.assertEqual(select_command('show bgp summary'),
+                         'show bgp summary')
+        with self.assertRaises(ValueError):
+            select_command(commands, vrf='red')
+
+
+class TestDecode(unittest.TestCase):
+
+    def test_xml(self):
+        self.assertEqual(from_xml(SHOW_ROUTE_XML, show_route.ShowRoute.schema),
+                         SHOW_ROUTE)
+
+    def test_json(self):
+        output = json.dumps({'route-information': [
+            to_json(SHOW_ROUTE['route-information'])]})
+        self.assertEqual(from_json(output, show_route.ShowRoute.schema),
+                         SHOW_ROUTE)
+        # some releases wrap the output in the rpc-reply
+        output = json.dumps({'rpc-reply': [
+            {'route-information': [to_json(SHOW_ROUTE['route-information'])]}]})
+        self.assertEqual(from_json(output, show_route.ShowRoute.schema),
+                         SHOW_ROUTE)
+
+    def test_empty(self):
+        schema = show_route.ShowRoute.schema
+        self.assertEqual(from_xml('\nuser@router> ', schema), {})
+        self.assertEqual(from_json('', schema), {})
+        self.assertEqual(from_xml('<rpc-reply><cli/></rpc-reply>', schema), {})
+
+    def test_chunks(self):
+        original = junos_display.CHUNK_SIZE
+        junos_display.CHUNK_SIZE = 7
+        try:
+            self.assertEqual(
+                from_xml(SHOW_ROUTE_XML, show_route.ShowRoute.schema),
+                SHOW_ROUTE)
+        finally:
+            junos_display.CHUNK_SIZE = original
+
+    def test_command(self):
+        device = Mock(**{'execute.return_value': SHOW_ROUTE_XML})
+        parser = show_route.ShowRoute(device=device)
+        self.assertEqual(parser.xml(protocol='static'), SHOW_ROUTE)
+        device.execute.assert_called_with(
+            'show route protocol static | display xml')
+
+        device = Mock(**{'execute.return_value': ''})
+        show_interface.ShowInterfacesExtensive(device=device).json(
+            interface='ge-0/0/0')
+        device.execute.assert_called_with(
+            'show interfaces ge-0/0/0 extensive | display json')
+
+    def test_parse(self):
+        output = 'show route protocol static | display json\n{}'.format(
+            json.dumps({'route-information': [
+                to_json(SHOW_ROUTE['route-information'])]}))
+        device = Mock()
+        self.assertEqual(
+            show_route.ShowRoute(device=device).parse(output=output),
+            SHOW_ROUTE)
+        device.execute.assert_not_called()
+
+
+class TestSameAsCli(unittest.TestCase):
+    '''the structured outputs of the expected outputs of the golden tests
+    decode to them'''
+
+    def test_goldens(self):
+        count = 0
+        for cls in PARSERS:
+            for path in sorted(glob.glob(os.path.join(
+                    JUNOS_TESTS, cls.__name__, 'cli', 'equal',
+                    '*_expected.py'))):
+                expected = normalize(read_expected(path))
+                xml_output = '<rpc-reply xmlns:junos="junos">{}</rpc-reply>' \
+                    .format(''.join(to_xml(key, value)
+                                    for key, value in expected.items()))
+                json_output = json.dumps(to_json(expected))
+                with self.subTest(path):
+                    self.assertEqual(from_xml(xml_output, cls.schema),
+                                     expected)
+                    self.assertEqual(from_json(json_output, cls.schema),
+                                     expected)
+                    # cli() decodes the output of | display json
+                    self.assertEqual(
+                        cls(device=Mock()).parse(output=json_output),
+                        expected)
+                count += 1
+        self.assertGreater(count, 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from pyats.topology import Device
+
+from genie.libs.parser.utils import common, parser_index
+
+
+class TestLazyLoad(unittest.TestCase):
+
+    def setUp(self):
+        common.parser_data = None
+
+    def tearDown(self):
+        common.parser_data = None
+        common.lazy_loader = None
+
+    def test_lazy_load_starts_empty(self):
+        data = common._load_parser_json(lazy=True)
+        self.assertEqual(common.lazy_loader.loaded, set())
+        self.assertNotIn('show version', data)
+
+    def test_lazy_load_on_lookup(self):
+        common._load_parser_json(lazy=True)
+        parser_cls, _ = common.get_parser('show version',
+                                          Device('R1', os='nxos'))
+        self.assertEqual(common.lazy_loader.loaded, {'nxos'})
+        self.assertEqual(parser_cls.__module__,
+                         'genie.libs.parser.nxos.show_platform')
+
+        # other OS are only loaded when looked up
+        self.assertNotIn(
+            'show platform software fed switch active qos policy target brief',
+            common.parser_data)
+        common.get_parser('show version', Device('R2', os='iosxe'))
+        self.assertEqual(common.lazy_loader.loaded, {'nxos', 'iosxe'})
+
+    def test_lazy_load_same_lookup(self):
+        device = Device('R1', os='iosxe')
+        commands = ['show version', 'show ip route vrf red',
+                    'show bgp all summary', 'sh ip int brief', 'sh ver']
+
+        common._load_parser_json(lazy=False)
+        full = [common.get_parser(command, device) for command in commands]
+
+        common._load_parser_json(lazy=True)
+        lazy = [common.get_parser(command, device) for command in commands]
+        self.assertEqual(full, lazy)
+
+    def test_lazy_load_all(self):
+        common._load_parser_json(lazy=True)
+        common._fuzzy_search_command('show version', False)
+        self.assertTrue(common.lazy_loader.all_loaded)
+
+    def test_lazy_load_index(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        index_path = os.path.join(folder, parser_index.INDEX_NAME)
+        sections = []
+
+        def open_parser_index(json_path, token_order):
+            parser_index.make_parser_index(json_path, index_path, token_order)
+            index = parser_index.open_parser_index(json_path, token_order,
+                                                   index_path)
+            read = index.read
+            index.read = lambda name: sections.append(name) or read(name)
+            return index
+
+        with patch.object(common, 'open_parser_index', open_parser_index), \
+                patch.object(common, '_read_parser_json',
+                             side_effect=AssertionError):
+            common._load_parser_json(lazy=True)
+            index = common.command_index
+            common.get_parser('show version', Device('R1', os='nxos'))
+            common.get_parser('show version', Device('R2', os='iosxe'))
+
+        # only the sections of the looked up OS are decoded
+        self.assertEqual(sections, [parser_index.SECTION_ORDER,
+                                    parser_index.SECTION_COMMON,
+                                    'nxos', 'iosxe'])
+        # the commands of each OS are added to the same command index
+        self.assertIs(common.command_index, index)
+        self.assertIn('show version', index.position)
+
+    def test_filter_parser_json(self):
+        json_data = {
+            'show a': {'folders': {
+                'iosxe': {'class': 'A', 'tokens': {'os': 'iosxe'}},
+                'nxos': {'class': 'B', 'tokens': {'os': 'nxos'}}}},
+            'show b': {'folders': {
+                'nxos': {'class': 'C', 'tokens': {'os': 'nxos'}}}},
+            'tokens': {'os': ['iosxe', 'nxos']},
+        }
+        self.assertEqual(
+            common._filter_parser_json(json_data, include={'iosxe'}),
+            {'show a': {'folders': {
+                'iosxe': {'class': 'A', 'tokens': {'os': 'iosxe'}}}},
+             'tokens': {'os': ['iosxe', 'nxos']}})
+        self.assertEqual(
+            common._filter_parser_json(json_data, exclude={'iosxe'}),
+            {'show a': {'folders': {
+                'nxos': {'class': 'B', 'tokens': {'os': 'nxos'}}}},
+             'show b': {'folders': {
+                'nxos': {'class': 'C', 'tokens': {'os': 'nxos'}}}},
+             'tokens': {'os': ['iosxe', 'nxos']}})
+
+
+if __name__ == '__main__':
+    unittest.main()
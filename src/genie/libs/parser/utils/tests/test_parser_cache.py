@@ -0,0 +1,70 @@
+import unittest
+
+from pyats.topology import Device
+
+from genie.libs.parser.utils import common
+
+
+class TestParserCache(unittest.TestCase):
+
+    def setUp(self):
+        common.parser_data = None
+        common.parser_cache.clear()
+        self.device = Device('R1', os='iosxe')
+
+    def test_cache_hit(self):
+        parser_cls, kwargs = common.get_parser('show version', self.device)
+        self.assertEqual(common.parser_cache.info()['misses'], 1)
+
+        cached_cls, cached_kwargs = common.get_parser('show  version',
+                                                      self.device)
+        self.assertIs(cached_cls, parser_cls)
+        self.assertEqual(cached_kwargs, kwargs)
+        self.assertEqual(common.parser_cache.info()['hits'], 1)
+
+    def test_cache_kwargs_copy(self):
+        _, kwargs = common.get_parser('show vrf red', self.device)
+        kwargs['vrf'] = 'blue'
+        _, kwargs = common.get_parser('show vrf red', self.device)
+        self.assertEqual(kwargs, {'vrf': 'red'})
+
+    def test_cache_per_tokens(self):
+        common.get_parser('show version', self.device)
+        common.get_parser('show version', Device('R2', os='nxos'))
+        self.assertEqual(common.parser_cache.info()['misses'], 2)
+        self.assertEqual(len(common.parser_cache), 2)
+
+    def test_cache_invalidated_on_reload(self):
+        common.get_parser('show version', self.device)
+        self.assertEqual(len(common.parser_cache), 1)
+        common._load_parser_json()
+        self.assertEqual(len(common.parser_cache), 0)
+
+        common.get_parser('show version', self.device)
+        common.parser_data = None
+        common.get_parser('show version', self.device)
+        self.assertEqual(common.parser_cache.info()['hits'], 0)
+
+    def test_cache_eviction(self):
+        cache = common.ParserCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.info(), {'hits': 1,
+                                        'misses': 1,
+                                        'evictions': 1,
+                                        'invalidations': 0,
+                                        'size': 2,
+                                        'maxsize': 2})
+
+    def test_cache_disabled(self):
+        cache = common.ParserCache(maxsize=0)
+        cache.set('a', 1)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils import parser_index
+
+TOKEN_ORDER = ['origin', 'os', 'platform']
+
+
+class TestParserIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.json_path = os.path.join(self.folder, 'parsers.json')
+        self.data = {
+            'show version': {
+                'folders': {
+                    'iosxe': {
+                        'class': 'ShowVersion',
+                        'module_name': 'iosxe.show_platform',
+                        'package': 'genie.libs.parser',
+                        'tokens': {'os': 'iosxe'},
+                    }
+                }
+            },
+            'tokens': {'os': ['iosxe']},
+            'token_order': TOKEN_ORDER,
+        }
+        self._write_json(self.data)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def _write_json(self, data):
+        with open(self.json_path, 'w') as f:
+            json.dump(data, f)
+
+    def test_load_index(self):
+        index_path = parser_index.make_parser_index(self.json_path)
+        self.assertEqual(index_path,
+                         os.path.join(self.folder, parser_index.INDEX_NAME))
+        self.assertEqual(
+            parser_index.load_parser_index(self.json_path, TOKEN_ORDER),
+            self.data)
+
+    def test_sections(self):
+        self.data['show clock'] = {
+            'folders': {
+                'nxos': {
+                    'class': 'ShowClock',
+                    'module_name': 'nxos.show_clock',
+                    'package': 'genie.libs.parser',
+                    'tokens': {'os': 'nxos'},
+                },
+                'ShowClock': {
+                    'class': 'ShowClock',
+                    'module_name': 'show_clock',
+                    'package': 'genie.libs.parser',
+                    'tokens': {},
+                },
+            }
+        }
+        self._write_json(self.data)
+        parser_index.make_parser_index(self.json_path)
+
+        index = parser_index.open_parser_index(self.json_path, TOKEN_ORDER)
+        self.assertEqual(index.operating_systems, {'iosxe', 'nxos'})
+        self.assertEqual(index.read(parser_index.SECTION_ALL), self.data)
+        self.assertEqual(index.read(parser_index.SECTION_ORDER),
+                         ['show version', 'tokens', 'token_order',
+                          'show clock'])
+        self.assertEqual(
+            index.read(parser_index.SECTION_COMMON),
+            {'show clock': {'folders': {
+                'ShowClock': self.data['show clock']['folders']['ShowClock']}},
+             'tokens': {'os': ['iosxe']},
+             'token_order': TOKEN_ORDER})
+        self.assertEqual(index.read('iosxe'),
+                         {'show version': self.data['show version']})
+        self.assertEqual(
+            index.read('nxos'),
+            {'show clock': {'folders': {
+                'nxos': self.data['show clock']['folders']['nxos']}}})
+        self.assertEqual(index.read('junos'), {})
+
+    def test_replaced_index(self):
+        parser_index.make_parser_index(self.json_path)
+        index = parser_index.open_parser_index(self.json_path, TOKEN_ORDER)
+        self.data['show clock'] = {}
+        self._write_json(self.data)
+        parser_index.make_parser_index(self.json_path)
+        self.assertIsNone(index.read('iosxe'))
+
+    def test_old_format(self):
+        parser_index.make_parser_index(self.json_path)
+        with patch.object(parser_index, 'INDEX_FORMAT', 1):
+            self.assertIsNone(
+                parser_index.open_parser_index(self.json_path, TOKEN_ORDER))
+
+    def test_no_index(self):
+        self.assertIsNone(
+            parser_index.load_parser_index(self.json_path, TOKEN_ORDER))
+
+    def test_stale_json(self):
+        parser_index.make_parser_index(self.json_path)
+        self.data['show clock'] = {}
+        self._write_json(self.data)
+        self.assertIsNone(
+            parser_index.load_parser_index(self.json_path, TOKEN_ORDER))
+
+    def test_stale_token_order(self):
+        parser_index.make_parser_index(self.json_path)
+        self.assertIsNone(
+            parser_index.load_parser_index(self.json_path, ['os']))
+
+    def test_copied_json(self):
+        parser_index.make_parser_index(self.json_path)
+        # same content with a new modification time
+        stat = os.stat(self.json_path)
+        os.utime(self.json_path, ns=(stat.st_atime_ns,
+                                     stat.st_mtime_ns + 10**9))
+        self.assertEqual(
+            parser_index.load_parser_index(self.json_path, TOKEN_ORDER),
+            self.data)
+
+    def test_corrupted_index(self):
+        with open(parser_index.get_index_path(self.json_path), 'wb') as f:
+            f.write(b'not an index')
+        self.assertIsNone(
+            parser_index.load_parser_index(self.json_path, TOKEN_ORDER))
+
+
+if __name__ == '__main__':
+    unittest.main()
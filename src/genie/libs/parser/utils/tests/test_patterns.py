@@ -0,0 +1,75 @@
+import re
+import unittest
+from unittest.mock import patch
+
+from genie.libs.parser.utils.patterns import Patterns
+
+
+class TestPatterns(unittest.TestCase):
+
+    def setUp(self):
+        self.patterns = Patterns(
+            # Version 17.3.1
+            p1=r'^Version +(?P<version>\S+)$',
+            p2=(r'^uptime +is +(?P<uptime>.+)$', re.IGNORECASE),
+        )
+
+    def test_match(self):
+        m = self.patterns.p1.match('Version 17.3.1')
+        self.assertEqual(m.groupdict(), {'version': '17.3.1'})
+        m = self.patterns.p2.match('UPTIME is 1 week')
+        self.assertEqual(m.groupdict(), {'uptime': '1 week'})
+
+    def test_compiled_once(self):
+        with patch('genie.libs.parser.utils.patterns.re.compile',
+                   wraps=re.compile) as compile_:
+            first = self.patterns.p1
+            second = self.patterns.p1
+        self.assertIs(first, second)
+        self.assertEqual(compile_.call_count, 1)
+
+    def test_compiled_on_first_use(self):
+        self.assertNotIn('p1', vars(self.patterns))
+        self.patterns.p1
+        self.assertIn('p1', vars(self.patterns))
+        self.assertNotIn('p2', vars(self.patterns))
+
+    def test_shared_by_instances(self):
+        class Parser(object):
+            patterns = Patterns(p1=r'^Version +(?P<version>\S+)$')
+
+        self.assertIs(Parser().patterns.p1, Parser().patterns.p1)
+
+    def test_missing_pattern(self):
+        with self.assertRaises(AttributeError):
+            self.patterns.p3
+        self.assertIsNone(self.patterns.get('p3'))
+        self.assertNotIn('p3', self.patterns)
+
+    def test_invalid_name(self):
+        with self.assertRaises(ValueError):
+            Patterns(items=r'^items$')
+        with self.assertRaises(ValueError):
+            Patterns(_p1=r'^p1$')
+
+    def test_items_order(self):
+        self.assertEqual([name for name, _ in self.patterns.items()],
+                         ['p1', 'p2'])
+        self.assertEqual(list(self.patterns), ['p1', 'p2'])
+        self.assertEqual(len(self.patterns), 2)
+
+    def test_compile_all_and_clear(self):
+        self.patterns.compile_all()
+        self.assertIn('p2', vars(self.patterns))
+        self.patterns.clear()
+        self.assertNotIn('p2', vars(self.patterns))
+        self.assertTrue(self.patterns.p2.match('uptime is 1 day'))
+
+    def test_invalid_regex(self):
+        patterns = Patterns(p1=r'^(unbalanced$')
+        with self.assertRaises(re.error):
+            patterns.p1
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import os
+import re
+import sys
+import shutil
+import tempfile
+import unittest
+
+from genie.libs.parser.utils import regex_audit
+
+MODULE = '''\
+import re
+from genie.libs.parser.utils.patterns import Patterns
+
+p1 = re.compile(r'^(?P<name>\\S+) +(?P<status>\\S+)$')
+p2 = re.compile(r'^(\\S+\\s*)+$', re.I)
+
+patterns = Patterns(
+    p3=(r'^(?P<a>.*) +(?P<b>.*) +(?P<c>.*)$', re.M),
+)
+'''
+
+
+class TestAnalyse(unittest.TestCase):
+
+    def test_safe(self):
+        for pattern in (r'^(?P<name>\S+) +(?P<status>up|down)$',
+                        r'^(\d+\.)+\d+$',
+                        r'^Interface (?P<intf>\S+) is (?P<status>[\w ]+)$'):
+            self.assertFalse(regex_audit.is_dangerous(
+                regex_audit.analyse(pattern)), pattern)
+
+    def test_exponential(self):
+        for pattern in (r'^(a+)+$', r'^(\S+\s*)+$', r'^(\d+|\w+)+$'):
+            findings = regex_audit.analyse(pattern)
+            self.assertIn('exponential', [f.kind for f in findings], pattern)
+            self.assertTrue(regex_audit.is_dangerous(findings), pattern)
+
+    def test_polynomial(self):
+        findings = regex_audit.analyse(r'^.* +uptime +(?P<time>.*)$')
+        self.assertEqual([(f.kind, f.degree) for f in findings],
+                         [('polynomial', 2)])
+        self.assertFalse(regex_audit.is_dangerous(findings))
+
+        findings = regex_audit.analyse(r'^(?P<a>.*) +(?P<b>.*) +(?P<c>.*)$')
+        self.assertEqual(max(f.degree for f in findings), 5)
+        self.assertTrue(regex_audit.is_dangerous(findings))
+
+    def test_constants(self):
+        # the constants of python < 3.11 have no possessive repeats or
+        # atomic groups, every pattern is still analysed
+        self.assertEqual(regex_audit.ALL_REPEATS[:2], regex_audit.REPEATS)
+        if sys.version_info < (3, 11):
+            self.assertEqual(regex_audit.ALL_REPEATS, regex_audit.REPEATS)
+            self.assertIsNone(regex_audit._ATOMIC_GROUP)
+        findings = regex_audit.analyse(r'^(?:\S+)? +(?P<a>.*)(a|b)\1$')
+        self.assertFalse(regex_audit.is_dangerous(findings))
+
+    @unittest.skipIf(sys.version_info < (3, 11),
+                     'possessive repeats and atomic groups need python 3.11')
+    def test_possessive(self):
+        for pattern in (r'^(?>\S+\s*)+$', r'^(\S++\s*)+$'):
+            self.assertFalse(regex_audit.is_dangerous(
+                regex_audit.analyse(pattern)), pattern)
+
+    def test_fuzz(self):
+        pattern = r'^(a+)+$'
+        over, slowest, line = regex_audit.fuzz(
+            pattern, 0, regex_audit.analyse(pattern), budget=0.01)
+        self.assertIsNotNone(over)
+        self.assertLessEqual(over, 40)
+        self.assertTrue(line.startswith('aaaa'))
+
+        # every line matches, nothing to backtrack
+        pattern = r'^(\S+\s*)+'
+        over, _, _ = regex_audit.fuzz(
+            pattern, 0, regex_audit.analyse(pattern), budget=0.01)
+        self.assertIsNone(over)
+
+
+class TestAudit(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.folder, 'iosxe'))
+        with open(os.path.join(self.folder, 'iosxe', 'show_dummy.py'),
+                  'w') as f:
+            f.write(MODULE)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_extract_regexes(self):
+        literals = regex_audit.extract_regexes(
+            os.path.join(self.folder, 'iosxe', 'show_dummy.py'))
+        self.assertEqual([(l.line, l.name, l.flags) for l in literals],
+                         [(4, 'p1', 0), (5, 'p2', re.I), (8, 'p3', re.M)])
+
+    def test_audit(self):
+        results = regex_audit.audit(self.folder, run_fuzz=False)
+        self.assertEqual([(r['name'], r['kind'], r['dangerous'])
+                          for r in results],
+                         [('p2', 'exponential', True),
+                          ('p3', 'polynomial', True)])
+        self.assertEqual(results[0]['module'],
+                         os.path.join('iosxe', 'show_dummy.py'))
+
+        baseline = {regex_audit.baseline_key(results[0])}
+        self.assertEqual(regex_audit.new_dangerous(results, baseline),
+                         results[1:])
+
+
+class TestParserRegexes(unittest.TestCase):
+
+    def test_no_new_dangerous_regex(self):
+        results = regex_audit.audit(run_fuzz=False)
+        new = regex_audit.new_dangerous(results, regex_audit.load_baseline())
+        self.assertFalse(new, 'Regexes prone to catastrophic backtracking, '
+                              'rewrite them or run regex_audit '
+                              '--update-baseline once reviewed:\n' +
+                              '\n'.join('{}:{} {}'.format(
+                                  r['module'], r['line'], r['pattern'])
+                                  for r in new))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+import json
+import time
+import threading
+import unittest
+import urllib.parse
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from genie.libs.parser.bigip import resources
+from genie.libs.parser.dnac.interface import Interface
+from genie.libs.parser.utils import rest_collect
+from genie.libs.parser.utils.rest_collect import (RestSession, RestDevice,
+                                                  RestError, iter_pages,
+                                                  iter_collect, collect)
+
+POOLS = [{'kind': 'tm:ltm:pool:poolstate', 'name': 'pool{}'.format(i)}
+         for i in range(7)]
+
+INTERFACES = [{'portName': 'GigabitEthernet0/0/{}'.format(i),
+               'deviceId': 'f34890c0', 'adminStatus': 'UP',
+               'status': 'up', 'ifIndex': str(i + 1),
+               'interfaceType': 'Physical', 'portMode': 'routed',
+               'isisSupport': 'false', 'ospfSupport': 'false',
+               'lastUpdated': '2020-01-01 10:00:00.000',
+               'pid': 'CSR1000V', 'serialNo': '9SAGBHTUEE9',
+               'series': 'Cisco Cloud Services Router 1000V Series',
+               'vlanId': None} for i in range(3)]
+
+
+class Handler(BaseHTTPRequestHandler):
+    '''F5 and DNA Center endpoints'''
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        url = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(url.query))
+        with server.lock:
+            server.requests.append(self.path)
+            server.ports.add(self.client_address[1])
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            status, body = self.route(url.path, query)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def route(self, path, query):
+        if path == '/mgmt/tm/ltm/pool':
+            if '$top' not in query:
+                return 200, {'kind': 'tm:ltm:pool:poolcollectionstate',
+                             'items': POOLS}
+            top, skip = int(query['$top']), int(query['$skip'])
+            return 200, {'kind': 'tm:ltm:pool:poolcollectionstate',
+                         'items': POOLS[skip:skip + top],
+                         'currentItemCount': len(POOLS[skip:skip + top]),
+                         'totalItems': len(POOLS)}
+        if path == '/mgmt/tm/ltm/node':
+            # pages linked with nextLink, on localhost as F5 gives them
+            skip = int(query.get('$skip', 0))
+            body = {'kind': 'tm:ltm:node:nodecollectionstate',
+                    'items': [{'name': 'node{}'.format(i)}
+                              for i in range(skip, min(skip + 2, 5))],
+                    'pageIndex': skip // 2 + 1}
+            if skip + 2 < 5:
+                body['nextLink'] = 'https://localhost/mgmt/tm/ltm/node' \
+                                   '?$top=2&$skip={}'.format(skip + 2)
+            return 200, body
+        if path == '/mgmt/tm/ltm/virtual':
+            # $top is taken, $skip is not, no totalItems
+            return 200, {'kind': 'tm:ltm:virtual:virtualcollectionstate',
+                         'items': POOLS[:int(query.get('$top', 7))]}
+        if path == '/mgmt/tm/sys/folder':
+            return 200, {'kind': 'tm:sys:folder:foldercollectionstate',
+                         'items': []}
+        if path == '/mgmt/tm/ltm/rule':
+            return 200, {}
+        if path == '/dna/intent/api/v1/interface':
+            return 200, {'response': INTERFACES, 'version': '1.0'}
+        if path == '/dna/intent/api/v1/network-device/f34890c0':
+            return 200, {'response': {'hostname': 'csr1'}, 'version': '1.0'}
+        return 404, {'error': 'not found'}
+
+    def log_message(self, *args):
+        pass
+
+
+class TestRestCollect(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.ports = set()
+        self.server.active = self.server.max_active = 0
+        self.server.delay = 0
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+
+        self.session = RestSession('http://127.0.0.1:{}'.format(
+            self.server.server_address[1]), pool_size=4)
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_session(self):
+        for _ in range(5):
+            response = self.session.get('/mgmt/tm/ltm/pool')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.json()['items']), 7)
+        # one connection for all of them
+        self.assertEqual(len(self.server.ports), 1)
+
+        response = self.session.get('/mgmt/tm/unknown')
+        self.assertEqual(response.status_code, 404)
+        with self.assertRaises(RestError):
+            response.raise_for_status()
+
+    def test_top_skip(self):
+        pages = iter_pages(self.session, '/mgmt/tm/ltm/pool', page_size=3)
+        self.assertEqual(len(next(pages).json()['items']), 3)
+        # the next pages are requested as they are read
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual([len(page.json()['items']) for page in pages],
+                         [3, 1])
+        self.assertEqual(self.server.requests, [
+            '/mgmt/tm/ltm/pool?$top=3&$skip=0',
+            '/mgmt/tm/ltm/pool?$top=3&$skip=3',
+            '/mgmt/tm/ltm/pool?$top=3&$skip=6'])
+
+    def test_next_link(self):
+        device = RestDevice(self.session)
+        data = device.get('/mgmt/tm/ltm/node').json()
+        self.assertEqual(data, {'kind': 'tm:ltm:node:nodecollectionstate',
+                                'items': [{'name': 'node{}'.format(i)}
+                                          for i in range(5)]})
+        self.assertEqual(self.server.requests, [
+            '/mgmt/tm/ltm/node',
+            '/mgmt/tm/ltm/node?$top=2&$skip=2',
+            '/mgmt/tm/ltm/node?$top=2&$skip=4'])
+
+    def test_skip_ignored(self):
+        pages = list(iter_pages(self.session, '/mgmt/tm/ltm/virtual',
+                                page_size=3))
+        # the second page is the first one again
+        self.assertEqual(len(pages), 1)
+        self.assertEqual(self.server.requests, [
+            '/mgmt/tm/ltm/virtual?$top=3&$skip=0',
+            '/mgmt/tm/ltm/virtual?$top=3&$skip=3'])
+
+    def test_max_pages(self):
+        with patch.object(rest_collect, 'MAX_PAGES', 2):
+            with self.assertLogs(rest_collect.log, 'WARNING'):
+                pages = list(iter_pages(self.session, '/mgmt/tm/ltm/node'))
+        self.assertEqual(len(pages), 2)
+
+    def test_parsers(self):
+        device = RestDevice(self.session, page_size=2)
+        parsed = resources.LtmPool(device=device, context='rest').parse()
+        self.assertEqual(parsed, {'kind': 'tm:ltm:pool:poolcollectionstate',
+                                  'items': POOLS, 'totalItems': 7})
+
+        parsed = Interface(device=device).parse()
+        interfaces = parsed['hostname']['csr1']['interfaces']
+        self.assertEqual(sorted(interfaces), ['GigabitEthernet0/0/0',
+                                              'GigabitEthernet0/0/1',
+                                              'GigabitEthernet0/0/2'])
+        self.assertNotIn('vlanId', interfaces['GigabitEthernet0/0/0'])
+
+    def test_collect(self):
+        self.server.delay = 0.05
+        device = RestDevice(self.session)
+        names = ['LtmPool', 'LtmNode', 'LtmRule', 'SysFolder'] * 4
+        jobs = ((getattr(resources, name)(device=device, context='rest'), {})
+                for name in names)
+
+        start = time.time()
+        results = collect(jobs, max_workers=4, return_exceptions=True)
+        # 20 requests, 4 at a time
+        self.assertLess(time.time() - start, 20 * 0.05)
+        self.assertEqual(self.server.max_active, 4)
+        self.assertLessEqual(len(self.server.ports), 4)
+
+        for name, result in zip(names, results):
+            if name == 'LtmRule':
+                # the resources have no schema, the empty reply is kept
+                self.assertEqual(result, {})
+            else:
+                self.assertEqual(result['kind'].split(':')[2],
+                                 name[3:].lower())
+
+    def test_iter_collect(self):
+        device = RestDevice(self.session)
+        jobs = [(resources.LtmPool(device=device, context='rest'), {}),
+                (resources.LtmProfile(device=device, context='rest'), {})]
+        results = dict(iter_collect(jobs, max_workers=2))
+        self.assertEqual(results[0]['items'], POOLS)
+        self.assertIsInstance(results[1], RestError)
+        self.assertEqual(results[1].response.status_code, 404)
+
+        with self.assertRaises(RestError):
+            collect(jobs)
+
+
+if __name__ == '__main__':
+    unittest.main()
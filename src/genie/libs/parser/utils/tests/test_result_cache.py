@@ -0,0 +1,124 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import unittests
+from genie.libs.parser.utils.unittests import ResultCache
+
+
+class ShowTest(object):
+    pass
+
+
+class TestResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        # the empty folders are relative to the directory the tests run from
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.folder)
+        self.addCleanup(unittests.reset_glo_values)
+
+        os.makedirs('iosxe/ShowTest/cli/equal')
+        os.makedirs('iosxe/ShowTest/cli/empty')
+        self._write('iosxe/show_test.py', 'from .helpers import HELPER\n')
+        self._write('iosxe/helpers.py', 'HELPER = 1\n')
+        self._write('iosxe/ShowTest/cli/equal/golden_output_output.txt',
+                    'output\n')
+        self._write('iosxe/ShowTest/cli/equal/golden_output_expected.py',
+                    'expected_output = {"a": 1}\n')
+        self._write('iosxe/ShowTest/cli/empty/empty_output_output.txt', '')
+
+        self.data = {
+            'local_class': ShowTest,
+            'operating_system': 'iosxe',
+            'folder_root_equal': os.path.join(self.folder,
+                                              'iosxe/ShowTest/cli/equal'),
+            'tokens': [],
+            'number': None,
+            'parse_file': os.path.join(self.folder, 'iosxe/show_test.py'),
+            'module_name': 'iosxe.show_test',
+        }
+
+    def _write(self, path, content):
+        with open(path, 'w') as f:
+            f.write(content)
+
+    def _key(self):
+        return ResultCache().key(self.data)
+
+    def _save(self, passed):
+        cache = ResultCache()
+        self.data['cache_key'] = cache.key(self.data)
+        cache.update(self.data, passed)
+        cache.save()
+
+    def test_hit(self):
+        self._save(2)
+        self.assertEqual(ResultCache().get(self.data), 2)
+        self.assertTrue(os.path.isfile(unittests.CACHE_FILE))
+
+        # failed tests are not cached
+        self._save(None)
+        self.assertIsNone(ResultCache().get(self.data))
+
+    def test_golden_changed(self):
+        self._save(2)
+        self._write('iosxe/ShowTest/cli/equal/golden_output_expected.py',
+                    'expected_output = {"a": 2}\n')
+        self.data['cache_key'] = self._key()
+        self.assertIsNone(ResultCache().get(self.data))
+
+    def test_module_changed(self):
+        self._save(2)
+        self._write('iosxe/helpers.py', 'HELPER = 2\n')
+        self.data['cache_key'] = self._key()
+        self.assertIsNone(ResultCache().get(self.data))
+
+    def test_other_files(self):
+        key = self._key()
+        # written next to the goldens by earlier runs
+        os.makedirs('iosxe/ShowTest/cli/equal/__pycache__')
+        self._write('iosxe/ShowTest/cli/equal/__pycache__/'
+                    'golden_output_expected.cpython-311.pyc', 'pyc')
+        self._write('iosxe/ShowTest/cli/equal/golden_output_actual.json',
+                    '{}')
+        self.assertEqual(self._key(), key)
+
+        self._write('iosxe/ShowTest/cli/equal/golden_output_arguments.json',
+                    '{}')
+        self.assertNotEqual(self._key(), key)
+
+    def test_number(self):
+        self.data['number'] = 1
+        self.assertIsNone(self._key())
+
+    def test_no_cache(self):
+        self._save(2)
+        arguments = dict(_os='iosxe', _class=None, _token=None,
+                         _display_only_failed=False, _number=None,
+                         _external_folder=None, _show_missing_unittests=False)
+        data = dict(self.data)
+        testcase = Mock()
+        unittests.reset_glo_values()
+
+        with patch.object(unittests, 'get_parsers',
+                          return_value={'iosxe': [data]}), \
+                patch.object(unittests.aetest.loop, 'mark'):
+            unittests.SuperFileBasedTesting.setup(testcase, _no_cache=True,
+                                                  **arguments)
+            self.assertIsNone(unittests.glo_values.cache)
+            self.assertNotIn('cached', data)
+
+            unittests.SuperFileBasedTesting.setup(testcase, **arguments)
+            self.assertEqual(data['cached'], 2)
+
+        with patch('sys.argv', ['folder_parsing_job.py', '--no-cache']):
+            self.assertTrue(unittests._parse_args()['_no_cache'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+
+from genie.libs.parser.utils import scaleup
+
+OUTPUT = '''\
+Vlan    Mac Address       Type        Ports
+----    -----------       --------    -----
+10      f87a.4125.2702    DYNAMIC     Gi1/0/3
+10      f87a.4125.2703    DYNAMIC     Gi1/0/4
+Internet address is 10.1.1.1/24, mask 255.255.255.0
+'''
+
+RECORD = r'^\d+\s'
+
+
+class TestScaleOutput(unittest.TestCase):
+
+    def test_split_records(self):
+        header, records = scaleup.split_records(OUTPUT, RECORD)
+        self.assertEqual(header.count('\n'), 2)
+        self.assertTrue(records.startswith('10      f87a.4125.2702'))
+
+        with self.assertRaises(ValueError):
+            scaleup.split_records(OUTPUT, r'^nothing')
+
+    def test_scale_output(self):
+        scaled = scaleup.scale_output(OUTPUT, 3, RECORD)
+        lines = scaled.splitlines()
+        self.assertEqual(len(lines), 2 + 3 * 3)
+        # the first copy is the original
+        self.assertEqual(scaled[:len(OUTPUT)], OUTPUT)
+
+        rows = [line.split() for line in lines if line.startswith('10 ')]
+        self.assertEqual(len({row[1] for row in rows}), 6)
+        self.assertEqual(len({row[3] for row in rows}), 6)
+        self.assertEqual([row[3] for row in rows[2:4]],
+                         ['Gi1/0/13', 'Gi1/0/14'])
+
+        addresses = [line.split()[3].rstrip(',') for line in lines
+                     if line.startswith('Internet')]
+        self.assertEqual(len(set(addresses)), 3)
+        self.assertTrue(all(a.endswith('.1/24') for a in addresses))
+        # masks are kept
+        self.assertTrue(all(line.endswith('255.255.255.0')
+                            for line in lines if line.startswith('Internet')))
+
+    def test_growth(self):
+        self.assertEqual(scaleup.growth([(10, 1.0), (100, 10.0)]), [1.0])
+        self.assertAlmostEqual(
+            scaleup.growth([(10, 1.0), (100, 100.0)])[0], 2.0)
+        self.assertEqual(scaleup.growth([(10, 0.0), (100, 1.0)]), [None])
+
+        linear = {'time_growth': [0.5, 1.05], 'memory_growth': [1.0]}
+        quadratic = {'time_growth': [1.0, 1.9], 'memory_growth': [1.0]}
+        self.assertFalse(scaleup.is_superlinear(linear))
+        self.assertTrue(scaleup.is_superlinear(quadratic))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import io
+import os
+import glob
+import json
+import unittest
+import importlib
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.streaming import iter_lines, iter_records
+
+
+def golden_outputs(module, name):
+    '''(arguments, output) of the golden outputs of a parser'''
+    folder = os.path.join(os.path.dirname(module.__file__), 'tests', name,
+                          'cli', 'equal')
+    for path in sorted(glob.glob(os.path.join(folder, '*_output.txt'))):
+        arguments = {}
+        arguments_path = path.replace('_output.txt', '_arguments.json')
+        if os.path.exists(arguments_path):
+            with open(arguments_path) as f:
+                arguments = json.load(f)
+        with open(path) as f:
+            yield arguments, f.read()
+
+
+class TestIterLines(unittest.TestCase):
+
+    def test_string(self):
+        self.assertEqual(list(iter_lines('a\nb\r\n\nc')), ['a', 'b', '', 'c'])
+
+    def test_file(self):
+        f = io.StringIO('a\nb\r\n\nc')
+        self.assertEqual(list(iter_lines(f)), ['a', 'b', '', 'c'])
+
+    def test_iterable(self):
+        lines = iter_lines(line for line in ['a\n', 'b'])
+        self.assertEqual(next(lines), 'a')
+        self.assertEqual(list(lines), ['b'])
+
+
+class TestIterRecords(unittest.TestCase):
+
+    def test_released(self):
+        routes = {}
+
+        def entries():
+            for route in ['10.0.0.0/8', '10.1.0.0/16']:
+                route_dict = routes.setdefault(route, {'route': route})
+                yield (route,), routes, route_dict
+                # record updated again on the next lines
+                route_dict['active'] = True
+                yield (route,), routes, route_dict
+
+        records = iter_records(entries())
+        keys, record = next(records)
+        self.assertEqual(keys, ('10.0.0.0/8',))
+        self.assertEqual(record, {'route': '10.0.0.0/8', 'active': True})
+        self.assertEqual(list(routes), ['10.1.0.0/16'])
+
+        self.assertEqual([keys for keys, _ in records], [('10.1.0.0/16',)])
+        self.assertEqual(routes, {})
+
+    def test_list(self):
+        rt_list = []
+
+        def entries():
+            for destination in ['0.0.0.0', '10.0.0.1', '10.0.0.1']:
+                rt_dict = {'rt-destination': destination}
+                rt_list.append(rt_dict)
+                yield (destination,), rt_list, rt_dict
+
+        records = [record for _, record in iter_records(entries())]
+        self.assertEqual([record['rt-destination'] for record in records],
+                         ['0.0.0.0', '10.0.0.1', '10.0.0.1'])
+        self.assertEqual(rt_list, [])
+
+    def test_empty(self):
+        self.assertEqual(list(iter_records(iter([]))), [])
+
+
+class TestParserIter(unittest.TestCase):
+
+    def _check(self, module_name, cls_name, golden, leaf, iter_args=()):
+        module = importlib.import_module('genie.libs.parser.' + module_name)
+        parser_cls = getattr(module, cls_name)
+
+        count = 0
+        for arguments, output in golden_outputs(module, golden):
+            parsed = parser_cls(device=Mock()).cli(output=output, **arguments)
+            kwargs = {k: v for k, v in arguments.items() if k in iter_args}
+            records = parser_cls(device=Mock()).parse_iter(
+                io.StringIO(output), **kwargs)
+            for keys, record in records:
+                self.assertEqual(record, leaf(parsed, keys), keys)
+                count += 1
+        self.assertTrue(count)
+
+    def test_iosxe_show_ip_route(self):
+        def leaf(parsed, keys):
+            vrf, af, route = keys
+            return parsed['vrf'][vrf]['address_family'][af]['routes'][route]
+
+        self._check('iosxe.show_routing', 'ShowIpRoute', 'ShowIpRoute', leaf,
+                    iter_args=['vrf'])
+
+    def test_junos_show_route_protocol_extensive(self):
+        def leaf(parsed, keys):
+            table_name, destination = keys
+            for table in parsed['route-information']['route-table']:
+                if table['table-name'] == table_name:
+                    for rt in table['rt']:
+                        if rt['rt-destination'] == destination:
+                            return rt
+
+        self._check('junos.show_route', 'ShowRouteProtocolExtensive',
+                    'ShowRouteProtocolExtensive', leaf)
+
+    def test_iosxr_show_bgp_neighbors_routes(self):
+        def leaf(parsed, keys):
+            instance, vrf, af, prefix = keys
+            return parsed['instance'][instance]['vrf'][vrf][
+                'address_family'][af]['routes'][prefix]
+
+        self._check('iosxr.show_bgp', 'ShowBgpInstanceNeighborsRoutes',
+                    'ShowBgpInstanceNeighborsRoutes', leaf)
+
+    def test_flat(self):
+        from genie.libs.parser.junos.show_route import \
+            ShowRouteProtocolExtensive
+
+        module = importlib.import_module('genie.libs.parser.junos.show_route')
+        output = max((output for _, output in golden_outputs(
+            module, 'ShowRouteProtocolExtensive')), key=len)
+
+        # the structure never holds more than the record being parsed
+        ret_dict = {}
+        parser = ShowRouteProtocolExtensive(device=Mock())
+        for _ in iter_records(parser._iter_routes(iter_lines(output),
+                                                  ret_dict)):
+            for table in ret_dict['route-information']['route-table']:
+                self.assertLessEqual(len(table.get('rt', [])), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import os
+import time
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+
+from genie.libs.parser.utils.async_parse import aparse, FakeAsyncDevice
+from genie.libs.parser.utils.subcommands import (execute_many,
+                                                 concurrent_execute)
+from genie.libs.parser.iosxe import show_bgp
+from genie.libs.parser.iosxe.show_bgp import ShowBgpNeighborsAdvertisedRoutes
+
+OUTPUTS = {
+    'show vrf': 'red\nblue\n',
+    'show bgp all neighbors | i BGP neighbor':
+        'BGP neighbor is 10.16.2.2,  vrf red,  remote AS 100\n',
+    'show ip route': '10.1.0.0/16\n',
+}
+
+
+class ShowNeighbors(MetaParser):
+    '''executes independent commands, and merges their outputs'''
+
+    cli_command = 'show ip route'
+
+    def cli(self, output=None):
+        vrfs, neighbors, routes = execute_many(self.device, [
+            'show vrf', 'show bgp all neighbors | i BGP neighbor',
+            self.cli_command])
+        return {'vrfs': vrfs.split(),
+                'neighbor': neighbors.split()[3].strip(','),
+                'routes': routes.split()}
+
+
+class SlowDevice(object):
+
+    def __init__(self, outputs, latency=0.05):
+        self.outputs = outputs
+        self.latency = latency
+        self.executed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def execute(self, command, **kwargs):
+        with self._lock:
+            self.executed.append(command)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        # the first command completes last
+        time.sleep(self.latency * (3 - len(self.executed)))
+        with self._lock:
+            self.in_flight -= 1
+        return self.outputs.get(command, '')
+
+
+class TestExecuteMany(unittest.TestCase):
+
+    def test_order(self):
+        device = Mock(**{'execute.side_effect': lambda c: c.upper()})
+        self.assertEqual(execute_many(device, ['b', 'a', 'b']),
+                         ['B', 'A', 'B'])
+        # the same command is executed once
+        self.assertEqual(device.execute.call_count, 2)
+
+    def test_serial(self):
+        device = SlowDevice(OUTPUTS)
+        ShowNeighbors(device=device).parse()
+        self.assertEqual(device.max_in_flight, 1)
+        self.assertEqual(device.executed[0], 'show vrf')
+
+    def test_concurrent(self):
+        device = SlowDevice(OUTPUTS)
+        with concurrent_execute(max_workers=4):
+            result = ShowNeighbors(device=device).parse()
+        self.assertEqual(device.max_in_flight, 3)
+        self.assertEqual(result, {'vrfs': ['red', 'blue'],
+                                  'neighbor': '10.16.2.2',
+                                  'routes': ['10.1.0.0/16']})
+
+    def test_error(self):
+        def execute(command):
+            if command != 'show vrf':
+                raise ConnectionError(command)
+            return ''
+        device = Mock(**{'execute.side_effect': execute})
+        with concurrent_execute():
+            with self.assertRaisesRegex(ConnectionError, 'a'):
+                execute_many(device, ['show vrf', 'a', 'b'])
+
+    def test_aparse(self):
+        device = FakeAsyncDevice(OUTPUTS, latency=0.01)
+        result = asyncio.run(aparse(ShowNeighbors(device=device)))
+        self.assertEqual(result['neighbor'], '10.16.2.2')
+        # fetched in a single pass
+        self.assertEqual(device.max_in_flight, 3)
+
+    def test_bgp_parser(self):
+        folder = os.path.join(os.path.dirname(show_bgp.__file__), 'tests',
+                              'ShowBgpNeighborsAdvertisedRoutes', 'cli',
+                              'equal')
+        with open(os.path.join(folder, 'golden_output1_output.txt')) as f:
+            output = f.read()
+        parser = ShowBgpNeighborsAdvertisedRoutes
+        expected = parser(device=Mock(**{
+            'execute.return_value': output})).parse(neighbor='192.168.120.13')
+
+        commands = ['show bgp neighbors 192.168.120.13 advertised-routes',
+                    'show bgp all neighbors | i BGP neighbor']
+        device = FakeAsyncDevice(dict.fromkeys(commands, output),
+                                 latency=0.01)
+        result = asyncio.run(aparse(parser(device=device),
+                                    neighbor='192.168.120.13'))
+        self.assertEqual(result, expected)
+        self.assertEqual(sorted(device.executed), sorted(commands))
+        self.assertEqual(device.max_in_flight, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
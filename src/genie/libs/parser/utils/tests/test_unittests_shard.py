@@ -0,0 +1,58 @@
+import os
+import shutil
+import logging
+import tempfile
+import unittest
+
+from genie.libs.parser.utils import unittests
+from genie.libs.parser.iosxe import show_interface
+from genie.libs.parser.iosxe.show_interface import ShowInterfaces
+
+FOLDER = os.path.join(os.path.dirname(show_interface.__file__), 'tests',
+                      'ShowInterfaces', 'cli', 'equal')
+
+
+def entry(folder, display_only_failed=False):
+    return {'operating_system': 'iosxe', 'folder_root_equal': folder,
+            'display_only_failed': display_only_failed, 'tokens': [],
+            'number': None}
+
+
+class TestRunRecorded(unittest.TestCase):
+    '''the tests run by a worker process of ShardRunner'''
+
+    def setUp(self):
+        # the worker process drops the handlers of the root logger
+        handlers = logging.root.handlers[:]
+        level = logging.root.level
+        self.addCleanup(setattr, logging.root, 'handlers', handlers)
+        self.addCleanup(logging.root.setLevel, level)
+
+    def test_passed(self):
+        result = unittests._run_recorded(ShowInterfaces, entry(FOLDER, True))
+        golden, empty = result['steps']
+        self.assertEqual((golden.result, empty.result), ('passed', 'passed'))
+        total = len([name for name in os.listdir(FOLDER)
+                     if name.endswith('_output.txt')])
+        self.assertEqual(result['counters']['parserTotal'], total)
+        self.assertEqual(result['counters']['parserPassed'], total)
+
+    def test_failed(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        shutil.copy(os.path.join(FOLDER, 'golden_output_output.txt'), folder)
+        with open(os.path.join(folder, 'golden_output_expected.py'),
+                  'w') as f:
+            f.write('expected_output = {}\n')
+
+        result = unittests._run_recorded(ShowInterfaces, entry(folder))
+        step = [event[1] for event in result['steps'][0].events
+                if event[0] == 'step'][0]
+        self.assertEqual(step.result, 'failed')
+        self.assertEqual(result['counters']['parserFailed'], 1)
+        self.assertTrue(os.path.exists(os.path.join(
+            folder, 'golden_output_actual.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()
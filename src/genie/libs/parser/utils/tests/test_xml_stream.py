@@ -0,0 +1,189 @@
+import io
+import os
+import json
+import glob
+import unittest
+import importlib.util
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.xml_stream import iter_rows
+from genie.libs.parser.nxos import show_bgp
+from genie.libs.parser.yang import bgp_openconfig_yang
+
+NXOS_TESTS = os.path.join(os.path.dirname(show_bgp.__file__), 'tests')
+YANG_TESTS = os.path.join(os.path.dirname(bgp_openconfig_yang.__file__),
+                          'tests', 'BgpOpenconfigYang', 'cli', 'equal')
+
+OUTPUT = '''\
+show bgp sessions vrf all | xml
+<?xml version="1.0" encoding="ISO-8859-1"?>
+<nf:rpc-reply xmlns:nf="urn:ietf:params:xml:ns:netconf:base:1.0" xmlns="http://www.cisco.com/nxos:7.0.3.I7.1.:bgp">
+ <nf:data>
+  <show>
+   <bgp>
+    <sessions>
+     <__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+      <vrf>
+       <__XML__PARAM__vrf-name>
+        <__XML__value>all</__XML__value>
+        <__readonly__>
+         <totalpeers>2</totalpeers>
+         <TABLE_vrf>
+          <ROW_vrf>
+           <vrf-name-out>default</vrf-name-out>
+           <info><router-id>10.1.1.1</router-id></info>
+           <TABLE_neighbor>
+            <ROW_neighbor><neighbor-id>10.2.2.2</neighbor-id></ROW_neighbor>
+            <ROW_neighbor><neighbor-id>10.3.3.3</neighbor-id><state/></ROW_neighbor>
+           </TABLE_neighbor>
+           <local-as>100</local-as>
+          </ROW_vrf>
+         </TABLE_vrf>
+        </__readonly__>
+       </__XML__PARAM__vrf-name>
+      </vrf>
+     </__XML__OPT_Cmd_show_bgp_sessions_cmd_vrf>
+    </sessions>
+   </bgp>
+  </show>
+ </nf:data>
+</nf:rpc-reply>
+]]>]]>
+switch# '''
+
+PATHS = ['__readonly__', 'TABLE_vrf/ROW_vrf', 'TABLE_neighbor/ROW_neighbor']
+
+
+def read_expected(path):
+    spec = importlib.util.spec_from_file_location('expected', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.expected_output
+
+
+class ReadCount(io.StringIO):
+    '''StringIO counting the characters read'''
+
+    count = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.count += len(data)
+        return data
+
+
+class TestIterRows(unittest.TestCase):
+
+    def test_rows(self):
+        rows = list(iter_rows(OUTPUT, PATHS))
+        self.assertEqual([row.path for row in rows],
+                         ['TABLE_neighbor/ROW_neighbor',
+                          'TABLE_neighbor/ROW_neighbor',
+                          'TABLE_vrf/ROW_vrf', '__readonly__'])
+        first, second, vrf, readonly = rows
+        self.assertEqual(first, {'neighbor-id': '10.2.2.2'})
+        self.assertEqual(second, {'neighbor-id': '10.3.3.3', 'state': None})
+        # the elements of the nested rows are in the nested rows only
+        self.assertEqual(vrf, {'vrf-name-out': 'default',
+                               'info/router-id': '10.1.1.1',
+                               'local-as': '100'})
+        self.assertEqual(readonly, {'totalpeers': '2'})
+        self.assertIs(first.parent, vrf)
+        self.assertIs(vrf.parent, readonly)
+        self.assertIsNone(readonly.parent)
+
+    def test_command(self):
+        self.assertEqual(len(list(iter_rows(
+            OUTPUT, PATHS, command='show bgp sessions vrf all'))), 4)
+        with self.assertRaises(AssertionError):
+            list(iter_rows(OUTPUT, PATHS, command='show bgp sessions'))
+        # no __readonly__ for an empty output
+        output = '<rpc-reply><data><show><bgp><sessions/></bgp></show>' \
+                 '</data></rpc-reply>'
+        self.assertEqual(list(iter_rows(output, PATHS,
+                                        command='show bgp sessions')), [])
+        with self.assertRaises(AssertionError):
+            list(iter_rows(output, PATHS, command='show bgp labels'))
+
+    def test_empty(self):
+        self.assertEqual(list(iter_rows('', PATHS)), [])
+        self.assertEqual(list(iter_rows('switch# ', PATHS)), [])
+
+    def test_stream(self):
+        row = '<ROW_neighbor><neighbor-id>10.0.0.{}</neighbor-id>' \
+              '</ROW_neighbor>'
+        output = ReadCount(
+            '<rpc-reply><data><TABLE_neighbor>{}</TABLE_neighbor></data>'
+            '</rpc-reply>'.format(''.join(row.format(i % 256)
+                                          for i in range(20000))))
+        rows = iter_rows(output, PATHS)
+        self.assertEqual(next(rows), {'neighbor-id': '10.0.0.0'})
+        # the first row is given before the whole output is read
+        self.assertLess(output.count, len(output.getvalue()) // 10)
+        self.assertEqual(sum(1 for _ in rows), 19999)
+
+
+class TestNxosXml(unittest.TestCase):
+    '''the xml outputs of xml/equal parse to their expected output, which
+    the schema of the parser validates'''
+
+    def test_goldens(self):
+        outputs = sorted(glob.glob(os.path.join(
+            NXOS_TESTS, '*', 'xml', 'equal', '*_output.txt')))
+        self.assertTrue(outputs)
+
+        for path in outputs:
+            cls = getattr(show_bgp, path.split(os.sep)[-4])
+            prefix = path[:-len('output.txt')]
+            arguments = {}
+            if os.path.exists(prefix + 'arguments.json'):
+                with open(prefix + 'arguments.json') as f:
+                    arguments = json.load(f)
+
+            with self.subTest(path):
+                with open(path) as f:
+                    device = Mock(**{'execute.return_value': f.read()})
+                self.assertEqual(
+                    cls(device=device, context='xml').parse(**arguments),
+                    read_expected(prefix + 'expected.py'))
+                command = device.execute.call_args[0][0]
+                self.assertTrue(command.endswith(' | xml'), command)
+
+    def test_same_as_cli(self):
+        # built from the cli output of the same command
+        with open(os.path.join(NXOS_TESTS, 'ShowBgpLabels', 'xml', 'equal',
+                               'golden_output_1_output.txt')) as f:
+            output = f.read()
+        self.assertEqual(
+            show_bgp.ShowBgpLabels(device=None).xml(
+                address_family='ipv6 unicast', vrf='all', output=output),
+            read_expected(os.path.join(NXOS_TESTS, 'ShowBgpLabels', 'cli',
+                                       'equal', 'golden_output_3_expected.py')))
+
+
+class TestYang(unittest.TestCase):
+
+    def setUp(self):
+        with open(os.path.join(YANG_TESTS, 'golden_output_output.txt')) as f:
+            self.output = f.read()
+        self.expected = read_expected(os.path.join(
+            YANG_TESTS, 'golden_output_expected.py'))
+
+    def test_get(self):
+        device = Mock(**{'get.return_value.data_xml': self.output})
+        parser = bgp_openconfig_yang.BgpOpenconfigYang(device=device)
+        self.assertEqual(parser.yang(), self.expected)
+        self.assertEqual(device.get.call_args[0][0][0], 'subtree')
+
+    def test_output(self):
+        parser = bgp_openconfig_yang.BgpOpenconfigYang(device=None)
+        self.assertEqual(parser.yang(output=self.output), self.expected)
+
+        parsed = show_bgp.ShowBgpProcessVrfAll(device=None).yang(
+            output=self.output)
+        self.assertEqual(parsed['bgp_pid'], 100)
+        self.assertEqual(parsed['vrf']['default']['router_id'], '10.4.1.1')
+
+
+if __name__ == '__main__':
+    unittest.main()
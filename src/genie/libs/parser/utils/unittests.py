@@ -3,17 +3,19 @@
 # Python
 import os
 import re
+import ast
 import sys
 import glob
 import json
 import logging
 import inspect
+import hashlib
 import pathlib
 import argparse
 import traceback
 import importlib
+import concurrent.futures
 from unittest.mock import Mock
-import importlib.util as _importlib_util
 
 # pyATS
 from pyats import aetest
@@ -33,6 +35,7 @@ from genie.utils.diff import Diff
 from genie.libs import parser as _parser
 from genie.metaparser.util.exceptions import SchemaEmptyParserError
 from genie.libs.parser.utils.common import format_output
+from genie.libs.parser.utils.golden import load_expected_output
 
 log = logging.getLogger(__name__)
 glo_values = AttrDict
@@ -59,14 +62,11 @@ def read_json_file(file_path):
 
 
 def read_python_file(file_path):
-    """Helper function to read in a Python file, and look for expected_output."""
-    # TODO: replace with AST implementation
-    module_name = pathlib.Path(file_path).stem
-    spec = _importlib_util.spec_from_file_location(module_name, file_path)
-    module = _importlib_util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    """Helper function to read in a Python file, and look for expected_output.
 
-    return getattr(module, "expected_output")
+    The literal is read without executing the file, see load_expected_output.
+    """
+    return load_expected_output(file_path)
 
 
 def get_operating_systems(_os):
@@ -212,6 +212,10 @@ class FailedReporter(StandaloneReporter):
                 name='Total Failed Unittests', num=glo_values.parserFailed))
             log.info(' {name:<58}{num:>20} '.format(
                 name='Total Errored Unittests', num=glo_values.parserErrored))
+            if glo_values.parserCached:
+                log.info(' {name:<58}{num:>20} '.format(
+                    name='Total Cached Passing Unittests',
+                    num=glo_values.parserCached))
             log.info(' {name:<58}{num:>20} '.format(
                 name='Total Unittests', num=glo_values.parserTotal))
             log.info('-' * 80)
@@ -304,133 +308,814 @@ class ParserGenerator(object):
                                 parameters={"data": d})
 
 
+#===========================================================================
+#                            Result Cache
+#===========================================================================
+# Results of the previous runs, in the directory the tests are run from
+CACHE_FILE = '.unittests_cache.json'
+# files of the golden folders read by the tests
+GOLDEN_SUFFIXES = ('_output.txt', '_expected.py', '_arguments.json')
+
+
+class ResultCache(object):
+    """On-disk cache of the parser classes whose tests passed.
+
+    Each class is keyed by a hash of the source of its module, of the modules
+    of the package it imports, of this file and of its golden files. A class
+    whose key did not change since its tests last passed is not tested again,
+    it is reported as a cached pass. Changes outside of the package, such as
+    a new metaparser release, are not tracked, use --no-cache after those.
+    """
+    def __init__(self, path=CACHE_FILE):
+        self.path = pathlib.Path(path)
+        self.package = pathlib.Path(_parser.__file__).parent
+        self.file_hashes = {}
+        self.module_hashes = {}
+        try:
+            with open(self.path) as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    @staticmethod
+    def name(data):
+        return f"{data['module_name']}.{data['local_class'].__name__}"
+
+    def key(self, data):
+        """Returns the hash of the sources and golden files of a parser class.
+
+        None when only some of its tests are run, their results are not cached.
+        """
+        if data['number']:
+            return None
+        local_class = data['local_class']
+        tokens = data['tokens']
+        if tokens:
+            folder_root_empty = pathlib.Path(
+                f"{data['operating_system']}/{'/'.join(tokens)}/{local_class.__name__}/cli/empty")
+        else:
+            folder_root_empty = pathlib.Path(
+                f"{data['operating_system']}/{local_class.__name__}/cli/empty")
+
+        digest = hashlib.sha256()
+        digest.update(local_class.__name__.encode())
+        digest.update(self.hash_module(__file__).encode())
+        digest.update(self.hash_module(data['parse_file']).encode())
+        for folder in (data['folder_root_equal'], folder_root_empty):
+            for path in sorted(glob.glob(f"{folder}/*")):
+                # not the __pycache__ of the expected outputs, nor the
+                # _actual.json files written by failed tests
+                if not path.endswith(GOLDEN_SUFFIXES) or not os.path.isfile(path):
+                    continue
+                digest.update(os.path.basename(path).encode())
+                digest.update(self.hash_file(path).encode())
+        return digest.hexdigest()
+
+    def get(self, data):
+        """Returns the number of tests of a class which passed with the same key, or None."""
+        entry = self.entries.get(self.name(data))
+        if entry and data.get('cache_key') and entry['key'] == data['cache_key']:
+            return entry['passed']
+        return None
+
+    def update(self, data, passed):
+        """Stores the number of passed tests of a class, None if its tests did not pass."""
+        if passed is None or not data.get('cache_key'):
+            self.entries.pop(self.name(data), None)
+        else:
+            self.entries[self.name(data)] = {
+                "key": data['cache_key'],
+                "passed": passed
+            }
+
+    def save(self):
+        temporary = self.path.with_name(self.path.name + '.tmp')
+        with open(temporary, "w") as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(temporary, self.path)
+
+    def hash_file(self, path):
+        path = str(path)
+        if path not in self.file_hashes:
+            with open(path, 'rb') as f:
+                self.file_hashes[path] = hashlib.sha256(f.read()).hexdigest()
+        return self.file_hashes[path]
+
+    def hash_module(self, path):
+        """Returns the hash of a module and of the modules of the package it imports."""
+        path = str(path)
+        if path not in self.module_hashes:
+            digest = hashlib.sha256()
+            for module in sorted(self.imported_files(path)):
+                digest.update(module.encode())
+                digest.update(self.hash_file(module).encode())
+            self.module_hashes[path] = digest.hexdigest()
+        return self.module_hashes[path]
+
+    def imported_files(self, path):
+        """Returns the files of a module and of the modules of the package it imports, recursively."""
+        files = set()
+        pending = [str(path)]
+        while pending:
+            module = pending.pop()
+            if module in files:
+                continue
+            files.add(module)
+            try:
+                with open(module) as f:
+                    tree = ast.parse(f.read(), module)
+            except (OSError, SyntaxError, ValueError):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.ImportFrom):
+                    if node.level:
+                        base = pathlib.Path(module).parents[node.level - 1]
+                        parts = node.module.split('.') if node.module else []
+                    elif node.module and node.module.startswith('genie.libs.parser'):
+                        base = self.package
+                        parts = node.module.split('.')[3:]
+                    else:
+                        continue
+                    names = [alias.name for alias in node.names]
+                elif isinstance(node, ast.Import):
+                    for alias in node.names:
+                        if alias.name.startswith('genie.libs.parser.'):
+                            pending.extend(self._resolve(
+                                self.package, alias.name.split('.')[3:]))
+                    continue
+                else:
+                    continue
+                pending.extend(self._resolve(base, parts, names))
+        return files
+
+    @staticmethod
+    def _resolve(base, parts, names=()):
+        """Returns the files of the package a module path refers to."""
+        target = base.joinpath(*parts)
+        if target.with_suffix('.py').is_file():
+            return [str(target.with_suffix('.py'))]
+        files = []
+        if target.is_dir():
+            if (target / '__init__.py').is_file():
+                files.append(str(target / '__init__.py'))
+            # from package import module
+            for name in names:
+                if (target / f"{name}.py").is_file():
+                    files.append(str(target / f"{name}.py"))
+        return files
+
+
+#===========================================================================
+#                            Sharded Runs
+#===========================================================================
+# Counters of glo_values merged from the worker processes
+SHARD_COUNTERS = ('parserPassed', 'parserFailed', 'parserErrored',
+                  'parserTotal')
+
+
+class ShardRunner(object):
+    """Runs the golden and empty tests of the parser classes in worker processes.
+
+    The parser modules are sharded by operating system and module, each shard
+    being run by a worker process as soon as the run starts. The steps, logs
+    and counters of each class are recorded by the worker, and replayed by
+    ParserTest in the order of the serial run, which keeps the logs and the
+    results of the run the same whatever the number of workers.
+    """
+    def __init__(self, parsers, workers):
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_shard_worker)
+        self.futures = {}
+
+        for operating_system, data in parsers.items():
+            modules = {}
+            for d in data:
+                name = d['local_class'].__name__
+                if d.get('cached') is not None:
+                    continue
+                # Same classes as the ones ParserTest loops over
+                if not re.match(f'{operating_system}_\S+',
+                                d['local_class'].__module__):
+                    continue
+                if name in EXCLUDE_CLASSES.get(operating_system, []):
+                    continue
+                modules.setdefault((d['parse_file'], d['module_name']),
+                                   []).append({
+                    "class_name": name,
+                    "operating_system": operating_system,
+                    "folder_root_equal": d['folder_root_equal'],
+                    "display_only_failed": d['display_only_failed'],
+                    "tokens": d['tokens'],
+                    "number": d['number'],
+                })
+
+            for (parse_file, module_name), entries in modules.items():
+                future = self.executor.submit(_run_shard, parse_file,
+                                              module_name, entries)
+                for entry in entries:
+                    self.futures[(module_name, entry['class_name'])] = future
+
+    def result(self, data):
+        """Returns the recorded results of a parser class, waits for its shard."""
+        class_name = data['local_class'].__name__
+        future = self.futures.pop((data['module_name'], class_name), None)
+        if future is None:
+            return None
+        try:
+            return future.result()[class_name]
+        finally:
+            if not self.futures:
+                self.shutdown()
+
+    def shutdown(self):
+        self.futures.clear()
+        self.executor.shutdown(wait=False)
+
+
+class _StepSignal(Exception):
+    """Ends a recorded step, like the result methods of aetest steps do."""
+    def __init__(self, step, result, reason):
+        super().__init__(reason)
+        self.step = step
+        self.result = result
+        self.reason = reason
+
+
+class _RecordedStep(object):
+    """Stands in for an aetest step in a worker process, records what happens in it."""
+    def __init__(self, recorder, name):
+        self.recorder = recorder
+        self.name = name
+        self.result = 'passed'
+        self.reason = None
+        self.events = []
+
+    def __getstate__(self):
+        # the recorder stays in the worker process
+        return {key: value for key, value in self.__dict__.items()
+                if key != 'recorder'}
+
+    def start(self, name, continue_=True):
+        step = _RecordedStep(self.recorder, name)
+        self.events.append(('step', step))
+        return step
+
+    def __enter__(self):
+        self.recorder.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.recorder.stack.pop()
+        if exc_type is None:
+            return False
+        if isinstance(exc_value, _StepSignal):
+            if exc_value.step is not self:
+                return False
+            self.result, self.reason = exc_value.result, exc_value.reason
+        elif isinstance(exc_value, AssertionError):
+            self.result, self.reason = 'failed', str(exc_value)
+        elif isinstance(exc_value, Exception):
+            self.events.append(('log', log.name, logging.ERROR,
+                                traceback.format_exc(), None))
+            self.result, self.reason = 'errored', str(exc_value)
+        else:
+            return False
+        return True
+
+    def passed(self, reason=None):
+        raise _StepSignal(self, 'passed', reason)
+
+    def failed(self, reason=None):
+        raise _StepSignal(self, 'failed', reason)
+
+    def errored(self, reason=None):
+        raise _StepSignal(self, 'errored', reason)
+
+    def skipped(self, reason=None):
+        raise _StepSignal(self, 'skipped', reason)
+
+
+class _ShardRecorder(logging.Handler):
+    """Stands in for ParserTest in a worker process.
+
+    Records the logs and the screen handler calls into the current step.
+    """
+    def __init__(self, display_only_failed):
+        super().__init__()
+        self.stack = []
+        self.parameters = {'_display_only_failed': display_only_failed}
+        # with -f the screen handler starts removed, see ParserTest.__init__
+        self.screen_handler = logging.NullHandler()
+        self.temporary_screen_handler = (self.screen_handler
+                                         if display_only_failed else None)
+
+    def emit(self, record):
+        self.stack[-1].events.append(
+            ('log', record.name, record.levelno, record.getMessage(),
+             getattr(record, 'colour', None)))
+
+    def remove_logger(self):
+        if self.screen_handler in log.root.handlers:
+            log.root.handlers.remove(self.screen_handler)
+        self.stack[-1].events.append(('remove_logger', ))
+
+    def add_logger(self):
+        if self.temporary_screen_handler:
+            log.root.handlers.insert(0, self.screen_handler)
+        self.stack[-1].events.append(('add_logger', ))
+
+
+def _init_shard_worker():
+    # the logs of the workers are recorded, and only shown once replayed
+    log.root.handlers = []
+    log.root.setLevel(0)
+
+
+def _run_shard(parse_file, module_name, entries):
+    """Runs the tests of the parser classes of a module, in a worker process."""
+    _module = importlib.machinery.SourceFileLoader(module_name,
+                                                   parse_file).load_module()
+    return {
+        entry['class_name']: _run_recorded(
+            getattr(_module, entry['class_name']), entry)
+        for entry in entries
+    }
+
+
+def _run_recorded(local_class, entry):
+    operating_system = entry['operating_system']
+    name = local_class.__name__
+    for counter in SHARD_COUNTERS:
+        setattr(glo_values, counter, 0)
+
+    recorder = _ShardRecorder(entry['display_only_failed'])
+    log.root.handlers = [recorder]
+    try:
+        golden_steps = _RecordedStep(
+            recorder, f"Test Golden -> {operating_system} -> {name}")
+        with golden_steps:
+            _run_golden(recorder, golden_steps, local_class, operating_system,
+                        entry['folder_root_equal'],
+                        entry['display_only_failed'], entry['tokens'],
+                        entry['number'])
+            _release_screen(recorder)
+
+        empty_steps = _RecordedStep(
+            recorder, f"Test Empty -> {operating_system} -> {name}")
+        with empty_steps:
+            _run_empty(recorder, empty_steps, local_class, operating_system,
+                       entry['tokens'])
+            _release_screen(recorder)
+    finally:
+        log.root.handlers = []
+
+    return {
+        "steps": [golden_steps, empty_steps],
+        "counters": {
+            counter: getattr(glo_values, counter)
+            for counter in SHARD_COUNTERS
+        },
+    }
+
+
 #===========================================================================
 #                            OS Testcase
 #===========================================================================
+def reset_glo_values():
+    """Resets the counters of glo_values, before a run."""
+    glo_values.missingCount = 0
+    glo_values.parserPassed = 0
+    glo_values.parserFailed = 0
+    glo_values.parserErrored = 0
+    glo_values.parserTotal = 0
+    glo_values.missingParsers = []
+    glo_values.parserCached = 0
+    glo_values.shards = None
+    glo_values.cache = None
+
+
+def get_parsers(_os=None, _class=None, _token=None, _display_only_failed=False,
+                _number=None, _external_folder=None, _show_missing_unittests=False):
+    """Finds the parser classes with golden tests, per operating system.
+
+    Returns a dict of the list of the data of the parser classes of each
+    operating system, as given to ParserTest. Parsers missing unittests are
+    counted in glo_values.
+    """
+    # If _class is passed then check to see if it even exists
+    if _class:
+        glo_values._class_exists = False
+
+    operating_systems = get_operating_systems(_os)
+
+    parsers = {}
+
+    for operating_system in operating_systems:
+
+        parsers_list = parsers.setdefault(operating_system, list())
+
+        if _external_folder:
+            base_folder = _external_folder / operating_system
+        else:
+            base_folder = pathlib.Path(
+                f"{pathlib.Path(_parser.__file__).parent}/{operating_system}"
+            )
+
+        parse_files = list(get_files(base_folder))
+        # Get all of the root level files
+        for details in parse_files:
+            parse_file = details["parse_file"]
+            base_folder = pathlib.Path(parse_file).parent
+            tokens = details["tokens"]
+            # Load all of the classes in each of those files, and search for classes
+            # that have a `cli` method
+            _module = None
+            module_name = os.path.basename(parse_file[:-len(".py")])
+            if tokens:
+                module_name = f"{operating_system}_{'_'.join(tokens)}_{module_name}"
+            else:
+                module_name = f"{operating_system}_{module_name}"
+            _module = importlib.machinery.SourceFileLoader(
+                module_name, parse_file).load_module()
+            for name, local_class in inspect.getmembers(_module):
+                folder_root_equal = pathlib.Path(
+                    f"{base_folder}/tests/{name}/cli/equal")
+                folder_root_empty = pathlib.Path(
+                    f"{base_folder}/tests/{name}/cli/empty")
+
+                # Skip over super parsers
+                if "super" in name.lower():
+                    continue
+
+                # This is used in conjunction with the arguments that are run at command line, to skip over all tests you are
+                # not concerned with. Basically, it allows a user to not have to wait for 100s of tests to run, to run their
+                # one test.
+                if _token and _token not in tokens:
+                    continue
+                # Same as previous, however, for class
+                if _class and _class != name:
+                    continue
+                if _class:
+                    glo_values._class_exists = True
+                # Each "globals()" is checked to see if it has a cli attribute, if so, assumed to be a parser. The _osxe, is
+                # since the ios module often refers to the iosxe parser, leveraging this naming convention.
+                if hasattr(local_class,
+                           "cli") and not name.endswith("_iosxe"):
+
+                    if not folder_root_equal.exists():
+                        if _show_missing_unittests or _class:
+                            if tokens:
+                                log.warning(
+                                    f"Equal unittests for {operating_system} -> {' -> '.join(tokens)} -> {name} don\'t exist"
+                                )
+                                glo_values.missingParsers.append(
+                                    f" {operating_system} -> {' -> '.join(tokens)} -> {name}"
+                                )
+                            else:
+                                log.warning(
+                                    f'Equal unittests for {operating_system} -> {name} don\'t exist'
+                                )
+                                glo_values.missingParsers.append(
+                                    f" {operating_system} -> {name}")
+                        glo_values.missingCount += 1
+                        continue
+
+                    # skips over classes that do not contain the local variable cli_command
+                    # this works to ignore outdated classes that use tcl
+                    if not hasattr(local_class, 'cli_command') and not hasattr(local_class, 'parser_command'):
+                        if _show_missing_unittests:
+                            log.warning(
+                                f"{operating_system} {local_class.__name__} has no cli_command or parser_command defined."
+                            )
+                        continue
+
+                    parsers_list.append({
+                        "local_class":
+                        local_class,
+                        "operating_system":
+                        operating_system,
+                        "folder_root_equal":
+                        folder_root_equal,
+                        "display_only_failed":
+                        _display_only_failed,
+                        "tokens":
+                        tokens,
+                        "number":
+                        _number,
+                        "show_missing_unittests":
+                        _show_missing_unittests,
+                        "parse_file":
+                        parse_file,
+                        "module_name":
+                        module_name,
+                    })
+
+    return parsers
+
+
 class SuperFileBasedTesting(aetest.Testcase):
     """Standard pyats testcase class."""
     def __init__(self, *args, **kwargs):
         # init parent
         super().__init__(*args, **kwargs)
-        glo_values.missingCount = 0
-        glo_values.parserPassed = 0
-        glo_values.parserFailed = 0
-        glo_values.parserErrored = 0
-        glo_values.parserTotal = 0
-        glo_values.missingParsers = []
+        reset_glo_values()
 
     @aetest.setup
     def setup(self, _os, _class, _token, _display_only_failed, _number,
-              _external_folder, _show_missing_unittests):
+              _external_folder, _show_missing_unittests, _workers=None,
+              _no_cache=None):
 
-        # If _class is passed then check to see if it even exists
-        if _class:
-            glo_values._class_exists = False
+        if not _no_cache:
+            glo_values.cache = ResultCache()
 
-        operating_systems = get_operating_systems(_os)
+        self.parsers = get_parsers(_os, _class, _token, _display_only_failed,
+                                   _number, _external_folder,
+                                   _show_missing_unittests)
 
-        self.parsers = {}
+        # Classes which passed with the same sources and golden files are not
+        # tested again
+        if glo_values.cache:
+            for parsers_list in self.parsers.values():
+                for data in parsers_list:
+                    data['cache_key'] = glo_values.cache.key(data)
+                    data['cached'] = glo_values.cache.get(data)
 
-        for operating_system in operating_systems:
+        # Start running the tests in worker processes, ParserTest then
+        # collects the results in order
+        if _workers and _workers > 1:
+            glo_values.shards = ShardRunner(self.parsers, _workers)
 
-            self.parsers_list = self.parsers.setdefault(
-                operating_system, list())
+        aetest.loop.mark(ParserTest,
+                         operating_system=self.parsers.items(),
+                         generator=OSGenerator)
 
-            if _external_folder:
-                base_folder = _external_folder / operating_system
-            else:
-                base_folder = pathlib.Path(
-                    f"{pathlib.Path(_parser.__file__).parent}/{operating_system}"
+
+#===========================================================================
+#                            Golden and empty tests
+#===========================================================================
+def _release_screen(screen):
+    """Removes the screen handler again after a test, with -f."""
+    if screen.parameters['_display_only_failed'] and \
+            screen.temporary_screen_handler in log.root.handlers:
+        screen.remove_logger()
+
+
+def _run_golden(screen,
+                steps,
+                local_class,
+                operating_system,
+                folder_root_equal,
+                display_only_failed=None,
+                tokens=None,
+                number=None):
+    """Test step that finds any output named with _output.txt, and compares to similar named .py file.
+
+    screen is the ParserTest, or the _ShardRecorder of a worker process,
+    handling the screen logger with add_logger() and remove_logger().
+    """
+    folder_root = folder_root_equal
+    # if tokens:
+    #     folder_root = pathlib.Path(
+    #         f"{operating_system}/{'/'.join(tokens)}/{local_class.__name__}/cli/equal")
+    # else:
+    #     folder_root = pathlib.Path(
+    #         f"{operating_system}/{local_class.__name__}/cli/equal")
+
+    # Get list of output files to parse and sort
+    convert = lambda text: int(text) if text.isdigit() else text
+    aph_key = lambda key: [convert(c) for c in re.split("([0-9]+)", key)]
+    if number and not operating_system or not local_class:
+        output_glob = sorted(
+            glob.glob(f"{folder_root}/golden_output{number}_output.txt"),
+            key=aph_key,
+        )
+    else:
+        output_glob = sorted(glob.glob(f"{folder_root}/*_output.txt"),
+                             key=aph_key)
+
+    all_txt_glob = sorted(glob.glob(f"{folder_root}/*.txt"), key=aph_key)
+
+    unacceptable_filenames = [
+        fil for fil in all_txt_glob if fil not in output_glob
+    ]
+
+    if len(output_glob) == 0:
+        log.error(f"{folder_root}/*_output.txt")
+        steps.failed(
+            f"No files found in appropriate directory for {local_class}")
+
+    # Look for any files ending with _output.txt, presume the user defined name from that (based
+    # on truncating that _output.txt suffix) and obtaining expected results and potentially an arguments file
+
+    for user_defined in output_glob:
+        glo_values.parserTotal += 1
+        user_test = os.path.basename(user_defined[:-len("_output.txt")])
+        if tokens:
+            msg = f"Gold -> {operating_system} -> {' -> '.join(tokens)} -> {local_class.__name__} -> {user_test}"
+        else:
+            msg = f"Gold -> {operating_system} -> {local_class.__name__} -> {user_test}"
+
+        with steps.start(msg, continue_=True):
+            golden_output_str = read_from_file(
+                f"{folder_root}/{user_test}_output.txt")
+            golden_output = {
+                "execute.return_value": golden_output_str,
+                "expect.return_value": golden_output_str,
+            }
+
+            golden_parsed_output = read_python_file(
+                f"{folder_root}/{user_test}_expected.py")
+
+            # Verify that the parsed output can be serialized to JSON. If not, raise an error
+            try:
+                json.dumps(golden_parsed_output)
+            except TypeError as e:
+                raise AssertionError(
+                    f"Parsed output for {local_class} cannot be serialized to JSON. "
+                    f"Exception:\n\n{str(e)}\n\n"
                 )
 
-            parse_files = list(get_files(base_folder))
-            # Get all of the root level files
-            for details in parse_files:
-                parse_file = details["parse_file"]
-                base_folder = pathlib.Path(parse_file).parent
-                tokens = details["tokens"]
-                # Load all of the classes in each of those files, and search for classes
-                # that have a `cli` method
-                _module = None
-                module_name = os.path.basename(parse_file[:-len(".py")])
-                if tokens:
-                    module_name = f"{operating_system}_{'_'.join(tokens)}_{module_name}"
+            arguments = {}
+            if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
+                arguments = read_json_file(
+                    f"{folder_root}/{user_test}_arguments.json")
+
+            device = Mock(**golden_output)
+            obj = local_class(device=device)
+            try:
+                parsed_output = obj.parse(**arguments)
+            except Exception as e:
+                parsed_output = {}
+                screen.add_logger()
+                log.error(traceback.format_exc(), extra={'colour': 'red'})
+                screen.remove_logger()
+                glo_values.parserErrored += 1
+
+            # Use Diff method to get the difference between
+            # what is expected and the parsed output
+            dd = Diff(golden_parsed_output, parsed_output)
+            dd.findDiff()
+            if parsed_output != golden_parsed_output:
+                glo_values.parserFailed += 1
+
+                # if -f flag provided, then add the screen handler back into
+                # the root.handlers to displayed failed tests. Decorator removes
+                # screen handler from root.handlers after failed tests are displayed
+                # to stdout
+                if display_only_failed:
+                    screen.add_logger()
+                    log.info(banner(msg), extra={'colour': 'red'})
+
+                # Format expected and parsed output in a nice format
+                parsed_json_data = format_output(parsed_output)
+                golden_parsed_output_json_data = format_output(
+                    golden_parsed_output)
+
+                # Write actual output to file
+                with open(f"{folder_root}/{user_test}_actual.json", "w") as f:
+                    f.write(parsed_json_data)
+
+                # Display device output, parsed output, and golden_output of failed tests
+                log.info(banner("The following is the actual raw output"))
+                log.info(f"{golden_output['execute.return_value']}\n\n", extra={'colour': 'yellow'})
+
+                log.info(banner("The following is the expected parsed output"))
+                log.info(f"{golden_parsed_output_json_data}\n\n", extra={'colour': 'yellow'})
+
+                log.info(banner("The following is the actual parsed output"))
+                log.info(f"{parsed_json_data}\n\n", extra={'colour': 'yellow'})
+
+                log.info(banner("The following is the diff between expected and actual outputs"))
+                log.info(str(dd)+"\n\n", extra={'colour': 'yellow'})
+
+                if display_only_failed:
+                    screen.remove_logger()
+
+                raise AssertionError("Device output and expected output do not match")
+            else:
+                glo_values.parserPassed += 1
+                # If tests pass, display the device output in debug mode
+                # But first check if the screen handler is removed, if it is
+                # put it back into the root otherwise just display to stdout
+                if (screen.temporary_screen_handler in log.root.handlers
+                        or screen.temporary_screen_handler is None):
+                    logging.debug(banner(msg))
+                    logging.debug(
+                        "\nThe following is the device output for the passed parser:\n{}\n"
+                        .format(golden_output['execute.return_value']),
+                        extra={'colour': 'yellow'})
+
                 else:
-                    module_name = f"{operating_system}_{module_name}"
-                _module = importlib.machinery.SourceFileLoader(
-                    module_name, parse_file).load_module()
-                for name, local_class in inspect.getmembers(_module):
-                    folder_root_equal = pathlib.Path(
-                        f"{base_folder}/tests/{name}/cli/equal")
-                    folder_root_empty = pathlib.Path(
-                        f"{base_folder}/tests/{name}/cli/empty")
-
-                    # Skip over super parsers
-                    if "super" in name.lower():
-                        continue
+                    screen.add_logger()
+                    logging.debug(banner(msg))
+                    logging.debug(
+                        "\nThe following is the device output for the passed parser:\n{}\n"
+                        .format(golden_output['execute.return_value']),
+                        extra={'colour': 'yellow'})
+                    screen.remove_logger()
+    if unacceptable_filenames:
+        for unacc_fil in unacceptable_filenames:
+            unacc_fil_name = pathlib.Path(unacc_fil).name
+            msg = f"{unacc_fil_name} does not follow the filename schema and will not be ran..."
+            with steps.start(msg, continue_=True) as step:
+                if (screen.temporary_screen_handler in log.root.handlers
+                        or screen.temporary_screen_handler is None):
+                    log.info(
+                        f"Filename should be `{unacc_fil_name.split('.')[0]}_expected.txt`",
+                        extra={'colour': 'yellow'})
+                else:
+                    screen.add_logger()
+                    log.info(msg, extra={'colour': 'yellow'})
+                    log.info(
+                        f"Filename should be `{unacc_fil_name.split('.')[0]}_expected.txt`",
+                        extra={'colour': 'yellow'})
+                    screen.remove_logger()
+                step.failed()
+
+
+def _run_empty(screen,
+               steps,
+               local_class,
+               operating_system,
+               tokens=None,
+               display_only_failed=None):
+    """Test step that looks for empty output, see _run_golden for screen."""
+    if tokens:
+        folder_root = pathlib.Path(
+            f"{operating_system}/{'/'.join(tokens)}/{local_class.__name__}/cli/empty")
+    else:
+        folder_root = pathlib.Path(
+            f"{operating_system}/{local_class.__name__}/cli/empty")
+    output_glob = glob.glob(f"{folder_root}/*_output.txt")
 
-                    # This is used in conjunction with the arguments that are run at command line, to skip over all tests you are
-                    # not concerned with. Basically, it allows a user to not have to wait for 100s of tests to run, to run their
-                    # one test.
-                    if _token and _token not in tokens:
-                        continue
-                    # Same as previous, however, for class
-                    if _class and _class != name:
-                        continue
-                    if _class:
-                        glo_values._class_exists = True
-                    # Each "globals()" is checked to see if it has a cli attribute, if so, assumed to be a parser. The _osxe, is
-                    # since the ios module often refers to the iosxe parser, leveraging this naming convention.
-                    if hasattr(local_class,
-                               "cli") and not name.endswith("_iosxe"):
-
-                        if not folder_root_equal.exists():
-                            if _show_missing_unittests or _class:
-                                if tokens:
-                                    log.warning(
-                                        f"Equal unittests for {operating_system} -> {' -> '.join(tokens)} -> {name} don\'t exist"
-                                    )
-                                    glo_values.missingParsers.append(
-                                        f" {operating_system} -> {' -> '.join(tokens)} -> {name}"
-                                    )
-                                else:
-                                    log.warning(
-                                        f'Equal unittests for {operating_system} -> {name} don\'t exist'
-                                    )
-                                    glo_values.missingParsers.append(
-                                        f" {operating_system} -> {name}")
-                            glo_values.missingCount += 1
-                            continue
-
-                        # skips over classes that do not contain the local variable cli_command
-                        # this works to ignore outdated classes that use tcl
-                        if not hasattr(local_class, 'cli_command') and not hasattr(local_class, 'parser_command'):
-                            if _show_missing_unittests:
-                                log.warning(
-                                    f"{operating_system} {local_class.__name__} has no cli_command or parser_command defined."
-                                )
-                            continue
-
-                        self.parsers_list.append({
-                            "local_class":
-                            local_class,
-                            "operating_system":
-                            operating_system,
-                            "folder_root_equal":
-                            folder_root_equal,
-                            "display_only_failed":
-                            _display_only_failed,
-                            "tokens":
-                            tokens,
-                            "number":
-                            _number,
-                            "show_missing_unittests":
-                            _show_missing_unittests,
-                        })
+    all_txt_glob = sorted(glob.glob(f"{folder_root}/*.txt"))
 
-        aetest.loop.mark(ParserTest,
-                         operating_system=self.parsers.items(),
-                         generator=OSGenerator)
+    unacceptable_filenames = [
+        fil for fil in all_txt_glob if fil not in output_glob
+    ]
+
+    for user_defined in output_glob:
+        glo_values.parserTotal += 1
+        user_test = os.path.basename(user_defined[:-len("_output.txt")])
+        if tokens:
+            msg = f"Empty -> {operating_system} -> {' -> '.join(tokens)} -> {local_class.__name__} -> {user_test}"
+        else:
+            msg = f"Empty -> {operating_system} -> {local_class.__name__} -> {user_test}"
+        with steps.start(msg, continue_=True) as step_within:
+
+            try:
+                empty_output_str = read_from_file(
+                    f"{folder_root}/{user_test}_output.txt")
+            except Exception:
+                empty_output_str = ""
+            empty_output = {
+                "execute.return_value": empty_output_str,
+                "expect.return_value": empty_output_str,
+            }
+            arguments = {}
+            if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
+                arguments = read_json_file(
+                    f"{folder_root}/{user_test}_arguments.json")
+            device = Mock(**empty_output)
+            obj = local_class(device=device)
+            try:
+                obj.parse(**arguments)
+                # if -f flag provided, then add the screen handler back into
+                # the root.handlers to display failed tests. Decorator removes
+                # screen handler from root.handlers after failed tests are displayed
+                # to stdout
+                if display_only_failed:
+                    screen.add_logger()
+                glo_values.parserFailed += 1
+                step_within.failed(
+                    f"File parsed, when expected not to for {local_class}")
+            except SchemaEmptyParserError:
+                glo_values.parserPassed += 1
+                return True
+            except AttributeError:
+                glo_values.parserPassed += 1
+                return True
+            except Exception:
+                glo_values.parserErrored += 1
+                raise
+
+    if unacceptable_filenames:
+        for unacc_fil in unacceptable_filenames:
+            unacc_fil_name = pathlib.Path(unacc_fil).name
+            msg = f"{unacc_fil_name} does not follow the filename schema and will not be ran..."
+            with steps.start(msg, continue_=True) as step:
+                if screen.temporary_screen_handler not in log.root.handlers and screen.temporary_screen_handler != None:
+                    screen.add_logger()
+                    log.info(msg, extra={'colour': 'yellow'})
+                    log.info(
+                        f"Filename should be `{unacc_fil_name.split('.')[0]}_expected.txt`",
+                        extra={'colour': 'yellow'})
+                    screen.remove_logger()
+                else:
+                    log.info(
+                        f"Filename should be `{unacc_fil_name.split('.')[0]}_expected.txt`",
+                        extra={'colour': 'yellow'})
+                step.failed()
 
 
 #===========================================================================
@@ -453,9 +1138,7 @@ class ParserTest(aetest.Testcase):
     def screen_log_handling(func):
         def wrapper(self, *args, **kwargs):
             func(self, *args, **kwargs)
-            if self.parameters[
-                    '_display_only_failed'] and self.temporary_screen_handler in log.root.handlers:
-                self.remove_logger()
+            _release_screen(self)
 
         return wrapper
 
@@ -485,8 +1168,21 @@ class ParserTest(aetest.Testcase):
             msg = f"{operating_system} -> {' -> '.join(tokens)} -> {name}"
         else:
             msg = f"{operating_system} -> {name}"
+        passed = glo_values.parserPassed
         with steps.start(msg, continue_=True) as class_step:
-            if name not in EXCLUDE_CLASSES.get(operating_system, []):
+            shard = glo_values.shards.result(data) if glo_values.shards else None
+            if data.get('cached') is not None:
+                glo_values.parserCached += data['cached']
+                glo_values.parserPassed += data['cached']
+                glo_values.parserTotal += data['cached']
+                class_step.passed(
+                    f"Cached pass, {name} and its golden files did not change since its tests passed")
+            elif shard:
+                self.replay_steps(class_step, shard['steps'])
+                for counter, value in shard['counters'].items():
+                    setattr(glo_values, counter,
+                            getattr(glo_values, counter) + value)
+            elif name not in EXCLUDE_CLASSES.get(operating_system, []):
                 with class_step.start(
                         f"Test Golden -> {operating_system} -> {name}",
                         continue_=True,
@@ -505,6 +1201,31 @@ class ParserTest(aetest.Testcase):
                 class_step.skipped(
                     f"Parser class {name} is in EXCLUDE_CLASSES.")
 
+        if glo_values.cache and data.get('cached') is None:
+            glo_values.cache.update(
+                data,
+                glo_values.parserPassed - passed
+                if str(class_step.result) == 'passed' else None)
+
+    def replay_steps(self, steps, recorded_steps):
+        """Replays the steps and logs recorded by a worker process, see ShardRunner."""
+        for recorded in recorded_steps:
+            with steps.start(recorded.name, continue_=True) as step:
+                for event in recorded.events:
+                    if event[0] == 'step':
+                        self.replay_steps(step, [event[1]])
+                    elif event[0] == 'add_logger':
+                        self.add_logger()
+                    elif event[0] == 'remove_logger':
+                        self.remove_logger()
+                    else:
+                        _, name, level, message, colour = event
+                        logger = log.root if name == 'root' else logging.getLogger(name)
+                        logger.log(level, message,
+                                   extra={'colour': colour} if colour else None)
+                if recorded.result != 'passed':
+                    getattr(step, recorded.result)(recorded.reason)
+
     @screen_log_handling
     def test_golden(self,
                     steps,
@@ -515,164 +1236,8 @@ class ParserTest(aetest.Testcase):
                     tokens=None,
                     number=None):
         """Test step that finds any output named with _output.txt, and compares to similar named .py file."""
-        folder_root = folder_root_equal
-        # if tokens:
-        #     folder_root = pathlib.Path(
-        #         f"{operating_system}/{'/'.join(tokens)}/{local_class.__name__}/cli/equal")
-        # else:
-        #     folder_root = pathlib.Path(
-        #         f"{operating_system}/{local_class.__name__}/cli/equal")
-
-        # Get list of output files to parse and sort
-        convert = lambda text: int(text) if text.isdigit() else text
-        aph_key = lambda key: [convert(c) for c in re.split("([0-9]+)", key)]
-        if number and not operating_system or not local_class:
-            output_glob = sorted(
-                glob.glob(f"{folder_root}/golden_output{number}_output.txt"),
-                key=aph_key,
-            )
-        else:
-            output_glob = sorted(glob.glob(f"{folder_root}/*_output.txt"),
-                                 key=aph_key)
-
-        all_txt_glob = sorted(glob.glob(f"{folder_root}/*.txt"), key=aph_key)
-
-        unacceptable_filenames = [
-            fil for fil in all_txt_glob if fil not in output_glob
-        ]
-
-        if len(output_glob) == 0:
-            log.error(f"{folder_root}/*_output.txt")
-            steps.failed(
-                f"No files found in appropriate directory for {local_class}")
-
-        # Look for any files ending with _output.txt, presume the user defined name from that (based
-        # on truncating that _output.txt suffix) and obtaining expected results and potentially an arguments file
-
-        for user_defined in output_glob:
-            glo_values.parserTotal += 1
-            user_test = os.path.basename(user_defined[:-len("_output.txt")])
-            if tokens:
-                msg = f"Gold -> {operating_system} -> {' -> '.join(tokens)} -> {local_class.__name__} -> {user_test}"
-            else:
-                msg = f"Gold -> {operating_system} -> {local_class.__name__} -> {user_test}"
-
-            with steps.start(msg, continue_=True):
-                golden_output_str = read_from_file(
-                    f"{folder_root}/{user_test}_output.txt")
-                golden_output = {
-                    "execute.return_value": golden_output_str,
-                    "expect.return_value": golden_output_str,
-                }
-
-                golden_parsed_output = read_python_file(
-                    f"{folder_root}/{user_test}_expected.py")
-                
-                # Verify that the parsed output can be serialized to JSON. If not, raise an error
-                try:
-                    json.dumps(golden_parsed_output)
-                except TypeError as e:
-                    raise AssertionError(
-                        f"Parsed output for {local_class} cannot be serialized to JSON. "
-                        f"Exception:\n\n{str(e)}\n\n"
-                    )
-                
-                arguments = {}
-                if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
-                    arguments = read_json_file(
-                        f"{folder_root}/{user_test}_arguments.json")
-
-                device = Mock(**golden_output)
-                obj = local_class(device=device)
-                try:
-                    parsed_output = obj.parse(**arguments)
-                except Exception as e:
-                    parsed_output = {}
-                    self.add_logger()
-                    log.error(traceback.format_exc(), extra={'colour': 'red'})
-                    self.remove_logger()
-                    glo_values.parserErrored += 1
-
-                # Use Diff method to get the difference between
-                # what is expected and the parsed output
-                dd = Diff(golden_parsed_output, parsed_output)
-                dd.findDiff()
-                if parsed_output != golden_parsed_output:
-                    glo_values.parserFailed += 1
-
-                    # if -f flag provided, then add the screen handler back into
-                    # the root.handlers to displayed failed tests. Decorator removes
-                    # screen handler from root.handlers after failed tests are displayed
-                    # to stdout
-                    if display_only_failed:
-                        self.add_logger()
-                        log.info(banner(msg), extra={'colour': 'red'})
-
-                    # Format expected and parsed output in a nice format
-                    parsed_json_data = format_output(parsed_output)
-                    golden_parsed_output_json_data = format_output(
-                        golden_parsed_output)
-
-                    # Write actual output to file
-                    with open(f"{folder_root}/{user_test}_actual.json", "w") as f:
-                        f.write(parsed_json_data)
-
-                    # Display device output, parsed output, and golden_output of failed tests
-                    log.info(banner("The following is the actual raw output"))
-                    log.info(f"{golden_output['execute.return_value']}\n\n", extra={'colour': 'yellow'})
-
-                    log.info(banner("The following is the expected parsed output"))
-                    log.info(f"{golden_parsed_output_json_data}\n\n", extra={'colour': 'yellow'})
-
-                    log.info(banner("The following is the actual parsed output"))
-                    log.info(f"{parsed_json_data}\n\n", extra={'colour': 'yellow'})
-
-                    log.info(banner("The following is the diff between expected and actual outputs"))
-                    log.info(str(dd)+"\n\n", extra={'colour': 'yellow'})
-
-                    if display_only_failed:
-                        self.remove_logger()
-
-                    raise AssertionError("Device output and expected output do not match")
-                else:
-                    glo_values.parserPassed += 1
-                    # If tests pass, display the device output in debug mode
-                    # But first check if the screen handler is removed, if it is
-                    # put it back into the root otherwise just display to stdout
-                    if (self.temporary_screen_handler in log.root.handlers
-                            or self.temporary_screen_handler is None):
-                        logging.debug(banner(msg))
-                        logging.debug(
-                            "\nThe following is the device output for the passed parser:\n{}\n"
-                            .format(golden_output['execute.return_value']),
-                            extra={'colour': 'yellow'})
-
-                    else:
-                        self.add_logger()
-                        logging.debug(banner(msg))
-                        logging.debug(
-                            "\nThe following is the device output for the passed parser:\n{}\n"
-                            .format(golden_output['execute.return_value']),
-                            extra={'colour': 'yellow'})
-                        self.remove_logger()
-        if unacceptable_filenames:
-            for unacc_fil in unacceptable_filenames:
-                unacc_fil_name = pathlib.Path(unacc_fil).name
-                msg = f"{unacc_fil_name} does not follow the filename schema and will not be ran..."
-                with steps.start(msg, continue_=True) as step:
-                    if (self.temporary_screen_handler in log.root.handlers
-                            or self.temporary_screen_handler is None):
-                        log.info(
-                            f"Filename should be `{unacc_fil_name.split('.')[0]}_expected.txt`",
-                            extra={'colour': 'yellow'})
-                    else:
-                        self.add_logger()
-                        log.info(msg, extra={'colour': 'yellow'})
-                        log.info(
-                            f"Filename should be `{unacc_fil_name.split('.')[0]}_expected.txt`",
-                            extra={'colour': 'yellow'})
-                        self.remove_logger()
-                    step.failed()
+        _run_golden(self, steps, local_class, operating_system,
+                    folder_root_equal, display_only_failed, tokens, number)
 
     @screen_log_handling
     def test_empty(self,
@@ -682,85 +1247,13 @@ class ParserTest(aetest.Testcase):
                    tokens=None,
                    display_only_failed=None):
         """Test step that looks for empty output."""
-        if tokens:
-            folder_root = pathlib.Path(
-                f"{operating_system}/{'/'.join(tokens)}/{local_class.__name__}/cli/empty")
-        else:
-            folder_root = pathlib.Path(
-                f"{operating_system}/{local_class.__name__}/cli/empty")
-        output_glob = glob.glob(f"{folder_root}/*_output.txt")
-
-        all_txt_glob = sorted(glob.glob(f"{folder_root}/*.txt"))
-
-        unacceptable_filenames = [
-            fil for fil in all_txt_glob if fil not in output_glob
-        ]
-
-        for user_defined in output_glob:
-            glo_values.parserTotal += 1
-            user_test = os.path.basename(user_defined[:-len("_output.txt")])
-            if tokens:
-                msg = f"Empty -> {operating_system} -> {' -> '.join(tokens)} -> {local_class.__name__} -> {user_test}"
-            else:
-                msg = f"Empty -> {operating_system} -> {local_class.__name__} -> {user_test}"
-            with steps.start(msg, continue_=True) as step_within:
-
-                try:
-                    empty_output_str = read_from_file(
-                        f"{folder_root}/{user_test}_output.txt")
-                except Exception:
-                    empty_output_str = ""
-                empty_output = {
-                    "execute.return_value": empty_output_str,
-                    "expect.return_value": empty_output_str,
-                }
-                arguments = {}
-                if os.path.exists(f"{folder_root}/{user_test}_arguments.json"):
-                    arguments = read_json_file(
-                        f"{folder_root}/{user_test}_arguments.json")
-                device = Mock(**empty_output)
-                obj = local_class(device=device)
-                try:
-                    obj.parse(**arguments)
-                    # if -f flag provided, then add the screen handler back into
-                    # the root.handlers to display failed tests. Decorator removes
-                    # screen handler from root.handlers after failed tests are displayed
-                    # to stdout
-                    if display_only_failed:
-                        self.add_logger()
-                    glo_values.parserFailed += 1
-                    step_within.failed(
-                        f"File parsed, when expected not to for {local_class}")
-                except SchemaEmptyParserError:
-                    glo_values.parserPassed += 1
-                    return True
-                except AttributeError:
-                    glo_values.parserPassed += 1
-                    return True
-                except Exception:
-                    glo_values.parserErrored += 1
-                    raise
-
-        if unacceptable_filenames:
-            for unacc_fil in unacceptable_filenames:
-                unacc_fil_name = pathlib.Path(unacc_fil).name
-                msg = f"{unacc_fil_name} does not follow the filename schema and will not be ran..."
-                with steps.start(msg, continue_=True) as step:
-                    if self.temporary_screen_handler not in log.root.handlers and self.temporary_screen_handler != None:
-                        self.add_logger()
-                        log.info(msg, extra={'colour': 'yellow'})
-                        log.info(
-                            f"Filename should be `{unacc_fil_name.split('.')[0]}_expected.txt`",
-                            extra={'colour': 'yellow'})
-                        self.remove_logger()
-                    else:
-                        log.info(
-                            f"Filename should be `{unacc_fil_name.split('.')[0]}_expected.txt`",
-                            extra={'colour': 'yellow'})
-                    step.failed()
+        _run_empty(self, steps, local_class, operating_system, tokens,
+                   display_only_failed)
 
     @aetest.cleanup
     def cleanup(self, _display_only_failed=None, _show_missing_unittests=None):
+        if glo_values.cache:
+            glo_values.cache.save()
         if _display_only_failed:
             self.add_logger()
         if _show_missing_unittests and glo_values.missingCount > 0:
@@ -786,6 +1279,9 @@ def _parse_args(operating_system=None,
                 f=None,
                 n=None,
                 e=None,
+                workers=None,
+                w=None,
+                no_cache=None,
                 **kwargs):
 
     # Create the parser
@@ -829,6 +1325,16 @@ def _parse_args(operating_system=None,
                            action='store_true',
                            help="Print out parsers that are missing unittests",
                            default=None or show_missing_unittests)
+    my_parser.add_argument('-w',
+                           "--workers",
+                           type=int,
+                           help="Number of worker processes running the tests, sharded by module",
+                           default=None or workers or w or 1)
+    my_parser.add_argument("--no-cache",
+                           action='store_true',
+                           help=f"Run every test, even the ones which passed with the same sources "
+                                f"and golden files in a previous run (cached in {CACHE_FILE})",
+                           default=None or no_cache)
     args = my_parser.parse_known_args()[0]
 
     _os = args.operating_system
@@ -838,6 +1344,8 @@ def _parse_args(operating_system=None,
     _number = args.number
     _external_folder = args.external_folder
     _show_missing_unittests = args.show_missing_unittests
+    _workers = args.workers
+    _no_cache = args.no_cache
 
     return {
         "_os": _os,
@@ -847,6 +1355,8 @@ def _parse_args(operating_system=None,
         "_number": _number,
         "_external_folder": _external_folder,
         "_show_missing_unittests": _show_missing_unittests,
+        "_workers": _workers,
+        "_no_cache": _no_cache,
     }
 
 
@@ -0,0 +1,155 @@
+'''Event-driven extraction of the XML outputs
+
+The XML output of a command, or the reply of a NETCONF get, is read with
+`iterparse` instead of building the whole tree with `ET.fromstring`. A
+parser declares the paths of the rows it maps, and gets each row as soon as
+its element is read:
+
+    for row in iter_rows(output, ['TABLE_vrf/ROW_vrf',
+                                  'TABLE_neighbor/ROW_neighbor']):
+        if row.path == 'TABLE_neighbor/ROW_neighbor':
+            vrf_dict = ret_dict.setdefault('vrf', {}).setdefault(
+                row.parent['vrf-name-out'], {})
+            ...
+
+A row holds the text of the elements without children under it, by their
+path from the row, as 'config/neighbor-address'. The elements of a nested
+row are in the nested row only. The rows are given when their element ends,
+so a nested row is given before the row holding it: `row.parent` is the row
+holding it, with the elements read so far. The keys of the rows, as
+vrf-name-out, come before their nested tables in the outputs.
+
+Each element is dropped once read, so the memory used does not grow with
+the size of the output.
+'''
+
+# python
+import io
+from xml.etree import ElementTree as ET
+
+# Remove junk characters returned by the device
+JUNK = ']]>]]>'
+
+
+class Row(dict):
+    '''Row
+
+    Text of the elements under the element of a declared path
+
+        Attributes:
+            path (`str`): declared path the element matched
+            parent (`Row`): row holding this row, None at the top
+    '''
+
+    def __init__(self, path, parent):
+        super().__init__()
+        self.path = path
+        self.parent = parent
+
+
+def iter_rows(output, paths, command=None):
+    '''yield the rows of the elements at paths, as the XML is read
+
+        Args:
+            output (`str`, `file`): XML output, the junk characters and the
+                text around the XML are dropped. Or a file object
+            paths (`list`): paths of the rows without namespaces, matched
+                against the end of the path of each element, as
+                'TABLE_vrf/ROW_vrf'. The first path matching is kept
+            command (`str`): command the output is expected to be of, as
+                composed from the tags before __readonly__: the __XML__
+                tags are left out, the text of __XML__value is kept
+
+        Returns:
+            generator of `Row`, each once its element is read
+
+        Raises:
+            AssertionError: the output is not of command
+    '''
+    if isinstance(output, str):
+        output = _strip(output)
+        if not output:
+            return
+        output = io.StringIO(output)
+
+    declared = [(path, tuple(path.split('/'))) for path in paths]
+    # [tag, row of the element or None, has children]
+    stack = []
+    elements = []
+    rows = []
+    # tags of the command, until __readonly__
+    cli = None if command is None else []
+
+    for event, element in ET.iterparse(output, events=('start', 'end')):
+        if event == 'start':
+            if stack:
+                stack[-1][2] = True
+            tag = _local(element.tag)
+            stack.append([tag, None, False])
+            elements.append(element)
+
+            # under <data>
+            if cli is not None and len(stack) > 2:
+                if '__readonly__' in tag or 'TABLE' in tag:
+                    _compare(' '.join(cli), command)
+                    cli = None
+                elif '__XML__' not in tag:
+                    cli.append(tag)
+
+            tags = None
+            for path, parts in declared:
+                if len(parts) > len(stack):
+                    continue
+                if tags is None:
+                    tags = [frame[0] for frame in stack]
+                if tuple(tags[-len(parts):]) == parts:
+                    row = Row(path, rows[-1] if rows else None)
+                    stack[-1][1] = row
+                    rows.append(row)
+                    break
+            continue
+
+        tag, row, has_children = stack.pop()
+        elements.pop()
+        if row is not None:
+            rows.pop()
+            yield row
+        elif not has_children:
+            if cli is not None and tag == '__XML__value' and element.text:
+                cli.append(element.text)
+            if rows:
+                # path from the row
+                index = len(stack)
+                while stack[index - 1][1] is not rows[-1]:
+                    index -= 1
+                key = '/'.join([frame[0] for frame in stack[index:]] + [tag])
+                rows[-1][key] = element.text
+
+        # drop the element, its parent only holds the one being read
+        element.clear()
+        if elements and len(elements[-1]) and elements[-1][-1] is element:
+            del elements[-1][-1]
+
+    if cli:
+        # no __readonly__, the output is empty
+        _compare(' '.join(cli), command)
+
+
+def _strip(output):
+    output = output.replace(JUNK, '')
+    start = output.find('<')
+    close = output.rfind('</')
+    end = output.find('>', close) if close >= 0 else output.rfind('/>') + 1
+    if start < 0 or end < start:
+        return ''
+    return output[start:end + 1]
+
+
+def _local(tag):
+    return tag[tag.find('}') + 1:]
+
+
+def _compare(cli, command):
+    assert cli == command, \
+        'Cli created from XML tags does not match the actual cli:\n' \
+        'XML Tags cli: {c}\nCli command: {e}'.format(c=cli, e=command)